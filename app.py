@@ -1,39 +1,478 @@
-from flask import Flask, render_template, jsonify, request
-import pandas as pd
+from flask import Blueprint, Flask, current_app, g, render_template, jsonify, request, Response, send_file, url_for
+import numpy as np
 import os
-import glob
-
-app = Flask(__name__)
-
-# Load the Vehicles CSV file
-def load_unit_data():
-    csv_file = 'MULOutput - Vehicles.csv'
-    if os.path.exists(csv_file):
-        df = pd.read_csv(csv_file)
-        # Add regular and veteran PV columns if they don't exist
-        if 'RegPV' not in df.columns:
-            df['RegPV'] = df['PV']
-        if 'VetPV' not in df.columns:
-            df['VetPV'] = df['PV'] * 1.5  # Assuming veteran costs 50% more
-        return df.to_dict('records')
-    return []
-
-@app.route('/')
+import time
+
+from assets import AssetManifestCache, asset_digest
+from cards import CardManifestCache
+from catalog import CatalogCache, UNIT_KEY_COLUMNS, parse_skill, skill_pv_column
+from response_cache import EncodedPayload, ResponseCache, choose_encoding
+from forces import evaluate_forces
+from metrics import REGISTRY, REQUEST_LATENCY, RESPONSE_BYTES, timed
+from optimizer import OBJECTIVES, objective_values, optimize_force
+from print_sheets import MAX_FORCE_SIZE, PRINT_FORMATS, cached_render, force_cache_key
+from thumbnails import DERIVATIVE_FORMATS, ensure_derivative, snap_width
+
+bp = Blueprint('units', __name__)
+
+# Cards are addressed by content hash (?v=), so a versioned URL never changes
+CARD_MAX_AGE = 365 * 24 * 60 * 60
+# Build assets are too: a new build publishes new file names
+ASSET_MAX_AGE = CARD_MAX_AGE
+
+
+def create_app(catalog_cache=None, manifest_cache=None, asset_cache=None, static_asset_cache=None):
+    """
+    Builds the app and loads everything it serves up front. Under gunicorn with
+    preload_app (see gunicorn.conf.py) this runs once in the master, so forked
+    workers start with the catalog, card manifest and full /get_units body
+    already built and share them copy-on-write.
+
+    Args:
+        catalog_cache (CatalogCache): The unit catalog; built from the default sources if None.
+        manifest_cache (CardManifestCache): The card manifest; built from Cards/ if None.
+        asset_cache (AssetManifestCache): The build manifest; read from js/ if None.
+        static_asset_cache (AssetManifestCache): The build manifest of the page's own
+            files; read from the static folder if None.
+
+    Returns:
+        Flask: The app.
+    """
+    app = Flask(__name__)
+    # Built once at startup; each request only revalidates the CSV's mtime and size
+    app.extensions['unit_catalog'] = catalog_cache or CatalogCache()
+    # Size, mtime and hash of every card, built once instead of stat-ing per request
+    app.extensions['card_manifest'] = manifest_cache or CardManifestCache()
+    # The hashed js/ files convert_csv_to_js.py last published
+    app.extensions['build_assets'] = asset_cache or AssetManifestCache()
+    # The hashed copies of static/ it published for templates/index.html
+    app.extensions['static_assets'] = static_asset_cache or AssetManifestCache(app.static_folder)
+    # A context processor rather than a template global, so Jinja is only set up on the first render
+    app.context_processor(lambda: {'static_asset_url': static_asset_url})
+    # Serialized and compressed /get_units bodies, keyed by catalog version and query
+    app.extensions['response_cache'] = ResponseCache()
+    app.register_blueprint(bp)
+    app.before_request(start_request_timer)
+    app.after_request(cache_static_asset)
+    app.after_request(record_request_metrics)
+    # The unfiltered list is what the page loads, so serialize it before forking
+    catalog = app.extensions['unit_catalog'].get()
+    app.extensions['response_cache'].get_or_create((catalog.version, query_cache_key(None)),
+                                                    lambda: build_units_payload(catalog, None))
+    return app
+
+
+def unit_catalog():
+    return current_app.extensions['unit_catalog']
+
+
+def card_manifest():
+    return current_app.extensions['card_manifest']
+
+
+def response_cache():
+    return current_app.extensions['response_cache']
+
+
+def build_assets():
+    return current_app.extensions['build_assets']
+
+
+def static_assets():
+    return current_app.extensions['static_assets']
+
+
+def static_asset_url(filename):
+    """
+    Returns the URL of a file in the static folder, naming the hashed copy the
+    last build published when there is one.
+    """
+    published, _ = static_assets().get().resolve(filename)
+    return url_for('static', filename=published or filename)
+
+
+def cache_static_asset(response):
+    # A hashed name never changes content; anything else must be revalidated
+    if request.endpoint == 'static' and response.status_code in (200, 304):
+        _, hashed = static_assets().get().resolve(request.view_args['filename'])
+        if hashed:
+            response.headers['Cache-Control'] = f'public, max-age={ASSET_MAX_AGE}, immutable'
+        else:
+            response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+
+def record_request_metrics(response):
+    # Labelled by route pattern rather than path so unit names don't explode the series
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    if 'request_start' in g:
+        REQUEST_LATENCY.observe(time.perf_counter() - g.request_start, route, request.method, response.status_code)
+    RESPONSE_BYTES.inc(route, amount=response.content_length or 0)
+    return response
+
+
+@timed('json_payload')
+def json_payload(data, headers=None):
+    return EncodedPayload((current_app.json.dumps(data, separators=(',', ':')) + '\n').encode('utf-8'), headers=headers)
+
+
+def payload_response(payload):
+    """
+    Serves a cached payload, answering 304 if the client already has it and
+    otherwise picking the best precompressed encoding.
+    """
+    encoding = choose_encoding(request.accept_encodings)
+    if payload.matches(request.headers.get('If-None-Match')):
+        response = Response(status=304)
+    else:
+        response = Response(payload.encoded(encoding), mimetype=payload.mimetype)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+        response.headers.update(payload.headers)
+    response.headers['ETag'] = f'"{payload.etag_for(encoding)}"'
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _split_arg(args, name):
+    value = args.get(name)
+    return [item.strip() for item in value.split(',') if item.strip()] if value else None
+
+
+def _number_arg(args, name, cast=float, minimum=None):
+    value = args.get(name)
+    if value is None or value == '':
+        return None
+    try:
+        number = cast(value)
+    except ValueError:
+        raise ValueError(f'{name} must be a number')
+    if minimum is not None and number < minimum:
+        raise ValueError(f'{name} must be at least {minimum}')
+    return number
+
+
+# Every parameter /get_units understands; anything else is rejected rather than cached
+UNIT_QUERY_PARAMS = {'type', 'min_pv', 'max_pv', 'skill', 'role', 'size', 'era', 'faction', 'fields', 'offset', 'limit'}
+
+
+def query_cache_key(query):
+    """Returns a hashable key for a parsed /get_units query; () for the unfiltered list."""
+    if query is None:
+        return ()
+    return tuple(sorted((name, tuple(value) if isinstance(value, list) else value) for name, value in query.items()))
+
+
+def parse_unit_query(args, catalog):
+    """
+    Validates the /get_units query parameters.
+
+    Raises:
+        ValueError: If a parameter is malformed or names an unknown field or era.
+    """
+    pv_column = skill_pv_column(args.get('skill', 'regular'))
+    sizes = _split_arg(args, 'size')
+    try:
+        sizes = [float(size) for size in sizes] if sizes else None
+    except ValueError:
+        raise ValueError('size must be a list of numbers')
+    fields = _split_arg(args, 'fields')
+    unknown_fields = [field for field in fields or [] if field not in catalog.field_names]
+    if unknown_fields:
+        raise ValueError(f'Unknown fields: {", ".join(unknown_fields)}')
+    era = args.get('era') or None
+    if era:
+        catalog.resolve_eras(era)
+    return {
+        'unit_type': _split_arg(args, 'type'),
+        'min_pv': _number_arg(args, 'min_pv'),
+        'max_pv': _number_arg(args, 'max_pv'),
+        'pv_column': pv_column,
+        'roles': _split_arg(args, 'role'),
+        'sizes': sizes,
+        'era': era,
+        'faction': args.get('faction') or None,
+        'fields': fields,
+        'offset': _number_arg(args, 'offset', int, 0) or 0,
+        'limit': _number_arg(args, 'limit', int, 0),
+    }
+
+@bp.route('/')
 def index():
-    unit_data = load_unit_data()
-    return render_template('index.html', unit_data=unit_data)
+    return render_template('index.html')
+
+@bp.route('/metrics')
+def metrics():
+    # Each gunicorn worker keeps its own counters; scrapes see the worker that answers
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
 
-@app.route('/get_units')
+@bp.route('/get_units')
 def get_units():
-    unit_data = load_unit_data()
-    return jsonify(unit_data)
+    # Supports ?type=, min_pv/max_pv (priced at skill= regular, veteran or 0-7), role=, size=,
+    # era= (year or name prefix), faction=, fields= projection and limit/offset
+    catalog = unit_catalog().get()
+    unknown = sorted(set(request.args) - UNIT_QUERY_PARAMS)
+    if unknown:
+        return jsonify({'error': f'Unknown parameters: {", ".join(unknown)}'}), 400
+    try:
+        query = parse_unit_query(request.args, catalog) if request.args else None
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    # Keyed on the parsed query, so spellings that select the same units share one entry
+    key = (catalog.version, query_cache_key(query))
+    payload = response_cache().get_or_create(key, lambda: build_units_payload(catalog, query))
+    return payload_response(payload)
 
-@app.route('/get_card/<unit_name>')
+
+@timed('build_units_payload')
+def build_units_payload(catalog, query):
+    """
+    Serializes a /get_units response.
+
+    Args:
+        catalog (UnitCatalog): The catalog to read.
+        query (dict): A query from parse_unit_query, or None for every unit.
+
+    Returns:
+        EncodedPayload: The body.
+    """
+    if query is None:
+        return EncodedPayload(catalog.records.json_array() + b'\n')
+    query = dict(query)
+    fields, offset, limit = query.pop('fields'), query.pop('offset'), query.pop('limit')
+    row_ids = catalog.select(**query)
+    page = row_ids[offset:] if limit is None else row_ids[offset:offset + limit]
+    if fields:
+        unit_data = [catalog.records.project(row_id, fields) for row_id in page]
+        return json_payload(unit_data, {'X-Total-Count': str(len(row_ids))})
+    # Whole records are spliced from the catalog's encoded buffer without decoding
+    return EncodedPayload(catalog.records.json_array(page) + b'\n', headers={'X-Total-Count': str(len(row_ids))})
+
+@bp.route('/get_unit/<path:key>')
+def get_unit(key):
+    # ?by= restricts the lookup to one index; by default FullName, MULId, then Name
+    by = request.args.get('by')
+    if by is not None and by not in UNIT_KEY_COLUMNS:
+        return jsonify({'error': f'Cannot look up units by {by}'}), 400
+    catalog = unit_catalog().get()
+    row_id = catalog.find_row(key, (by,) if by else UNIT_KEY_COLUMNS)
+    if row_id is None:
+        return jsonify({'error': f'No unit found for {key}'}), 404
+    return Response(catalog.records.json(row_id) + b'\n', mimetype='application/json')
+
+@bp.route('/get_card/<path:unit_name>')
 def get_card(unit_name):
-    card_path = os.path.join('Cards', f'{unit_name}.gif')
-    if os.path.exists(card_path):
-        return jsonify({'exists': True, 'path': card_path})
-    return jsonify({'exists': False})
+    card = card_manifest().get().find(unit_name)
+    if card is None:
+        return jsonify({'exists': False})
+    return jsonify({
+        'exists': True,
+        'path': card.path,
+        'url': url_for('.card', unit_name=unit_name, v=card.digest),
+    })
+
+@bp.route('/card/<path:unit_name>')
+def card(unit_name):
+    # ?w= serves a resized derivative; ?format= picks webp or png, otherwise
+    # webp is used when the browser accepts it
+    entry = card_manifest().get().find(unit_name)
+    if entry is None:
+        return jsonify({'error': f'No card found for {unit_name}'}), 404
+    if request.args.get('w'):
+        try:
+            width = snap_width(int(request.args['w']))
+        except ValueError:
+            return jsonify({'error': 'w must be a number'}), 400
+        fmt = request.args.get('format') or ('webp' if request.accept_mimetypes['image/webp'] else 'png')
+        if fmt not in DERIVATIVE_FORMATS:
+            return jsonify({'error': f'Unsupported format {fmt}'}), 400
+        path = ensure_derivative(entry, width, fmt)
+        mimetype = DERIVATIVE_FORMATS[fmt]
+        etag = f'{entry.digest}-{width}-{fmt}'
+    else:
+        path = entry.path
+        mimetype = 'image/gif'
+        etag = entry.digest
+    # conditional=True handles If-None-Match and Range requests; the file is
+    # streamed through the server's file wrapper (sendfile under gunicorn)
+    response = send_file(os.path.abspath(path), mimetype=mimetype, conditional=True,
+                         etag=etag, last_modified=entry.mtime)
+    if request.args.get('w') and 'format' not in request.args:
+        response.vary.add('Accept')
+    if request.args.get('v') == entry.digest:
+        response.headers['Cache-Control'] = f'public, max-age={CARD_MAX_AGE}, immutable'
+    else:
+        response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@bp.route('/js/<path:filename>')
+def asset(filename):
+    # Serves the static site's build output. A hashed name is immutable; a
+    # logical name (js/script.js) is the current build and must be revalidated.
+    manifest = build_assets().get()
+    published, hashed = manifest.resolve(filename)
+    if published is None:
+        return jsonify({'error': f'No asset named {filename}'}), 404
+    path, encoding = manifest.encoded_file(published, request.accept_encodings)
+    # Each encoding is a different byte sequence, so it gets its own strong ETag
+    etag = asset_digest(published) if encoding == 'identity' else f'{asset_digest(published)}-{encoding}'
+    response = send_file(os.path.abspath(path), mimetype='text/javascript', conditional=True, etag=etag)
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    if hashed:
+        response.headers['Cache-Control'] = f'public, max-age={ASSET_MAX_AGE}, immutable'
+    else:
+        response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@bp.route('/force/evaluate', methods=['POST'])
+def evaluate_force():
+    # Body: {"units": [{"id": FullName or MULId, "skill": "regular", "veteran" or 0-7}], "max_points": 32}
+    # or {"forces": [{"units": [...], "max_points": ...}, ...]} to check many forces at once
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        return jsonify({'error': 'Expected a JSON object'}), 400
+    try:
+        if 'forces' in body:
+            if not isinstance(body['forces'], list):
+                return jsonify({'error': 'forces must be a list'}), 400
+            return jsonify({'forces': evaluate_forces(unit_catalog().get(), body['forces'])})
+        return jsonify(evaluate_forces(unit_catalog().get(), [body])[0])
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+@bp.route('/fits')
+def fits():
+    # ?pv= remaining budget (required), type=, skill= (regular, veteran or 0-7), sort= (an objective
+    # from /force/optimize, pv or name), limit= and fields=
+    catalog = unit_catalog().get()
+    try:
+        pv = _number_arg(request.args, 'pv')
+        if pv is None:
+            raise ValueError('pv is required')
+        limit = _number_arg(request.args, 'limit', int, 0)
+        fields = _split_arg(request.args, 'fields') or ['FullName', 'Name', 'UnitType', 'RegPV', 'VetPV']
+        unknown_fields = [field for field in fields if field not in catalog.field_names]
+        if unknown_fields:
+            raise ValueError(f'Unknown fields: {", ".join(unknown_fields)}')
+        pv_column = skill_pv_column(request.args.get('skill', 'regular'))
+        row_ids = catalog.units_within(pv, request.args.get('type'), pv_column)
+        sort = request.args.get('sort', 'pv')
+        if sort == 'name':
+            row_ids = row_ids[np.argsort(catalog.columns['NameRank'][row_ids], kind='stable')]
+        elif sort == 'pv':
+            row_ids = row_ids[::-1]  # Most expensive unit that still fits first
+        elif sort in OBJECTIVES:
+            # Stable sort on the stat; ties keep the most expensive unit first
+            row_ids = row_ids[::-1]
+            row_ids = row_ids[np.argsort(-objective_values(catalog, sort, row_ids), kind='stable')]
+        else:
+            raise ValueError(f'Unknown sort {sort}')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    row_ids = row_ids[:limit] if limit is not None else row_ids
+    return jsonify([catalog.records.project(row_id, fields) for row_id in row_ids])
+
+@bp.route('/search')
+def search():
+    # ?q= (required), limit=, type=, fields=
+    catalog = unit_catalog().get()
+    query = request.args.get('q', '')
+    if not query.strip():
+        return jsonify({'error': 'q is required'}), 400
+    try:
+        limit = _number_arg(request.args, 'limit', int, 1) or 20
+        fields = _split_arg(request.args, 'fields') or ['FullName', 'Name', 'UnitType', 'RegPV', 'VetPV']
+        unknown_fields = [field for field in fields if field not in catalog.field_names]
+        if unknown_fields:
+            raise ValueError(f'Unknown fields: {", ".join(unknown_fields)}')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    candidates = None
+    if request.args.get('type'):
+        candidates = np.zeros(len(catalog.records), dtype=bool)
+        candidates[catalog.lookup('UnitType', request.args['type'])] = True
+    results = []
+    for row_id, score in catalog.search_index.search(query, limit, candidates):
+        result = catalog.records.project(row_id, fields)
+        result['score'] = round(score, 4)
+        results.append(result)
+    return jsonify(results)
+
+@bp.route('/force/optimize')
+def optimize():
+    # ?budget= (required), objective= (durability, short/medium/long_damage, damage
+    # or count), results=, copies=, plus the /get_units type, role, size, era,
+    # faction and skill filters
+    catalog = unit_catalog().get()
+    try:
+        query = parse_unit_query(request.args, catalog)
+        for name in ('fields', 'offset', 'limit'):
+            query.pop(name)
+        budget = _number_arg(request.args, 'budget', int)
+        if budget is None:
+            raise ValueError('budget is required')
+        # An explicit 0 is an error, not a request for the default
+        results = _number_arg(request.args, 'results', int, 1)
+        copies = _number_arg(request.args, 'copies', int, 1)
+        result = optimize_force(
+            catalog, budget,
+            objective=request.args.get('objective', 'durability'),
+            results=5 if results is None else results,
+            copies=1 if copies is None else copies,
+            **query)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(result)
+
+@bp.route('/print_force', methods=['POST'])
+def print_force():
+    # Body: {"units": [{"FullName": ..., "isVeteran": true}, ...], "format": "pdf" or "png"};
+    # units may give "skill" (regular, veteran or 0-7) instead of isVeteran
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        return jsonify({'error': 'Expected a JSON object'}), 400
+    units = body.get('units')
+    fmt = body.get('format', 'pdf')
+    if not isinstance(fmt, str):
+        return jsonify({'error': 'format must be a string'}), 400
+    if not isinstance(units, list) or not units:
+        return jsonify({'error': 'units must be a non-empty list'}), 400
+    if len(units) > MAX_FORCE_SIZE:
+        return jsonify({'error': f'A force can have at most {MAX_FORCE_SIZE} units'}), 400
+    if fmt not in PRINT_FORMATS:
+        return jsonify({'error': f'Unsupported format {fmt}'}), 400
+
+    catalog = unit_catalog().get()
+    manifest = card_manifest().get()
+    force, cards, card_digests = [], [], []
+    for item in units:
+        name = str(item.get('FullName', '')) if isinstance(item, dict) else ''
+        unit = catalog.find_unit(name)
+        if unit is None:
+            return jsonify({'error': f'No unit found for {name}'}), 400
+        # PV always comes from the catalog, never from the client
+        try:
+            skill = parse_skill(item['skill']) if item.get('skill') is not None else (
+                'veteran' if item.get('isVeteran') else 'regular')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        label = skill.capitalize() if isinstance(skill, str) else f'Skill {skill}'
+        force.append((unit['FullName'], label, unit[skill_pv_column(skill)]))
+        entry = manifest.find(unit['FullName'])
+        cards.append((entry.path if entry else None, unit['FullName']))
+        card_digests.append(entry.digest if entry else None)
+
+    cache_key = force_cache_key(force, catalog.version, card_digests)
+    path = cached_render(force, cards, fmt, cache_key)
+    return send_file(os.path.abspath(path), mimetype=PRINT_FORMATS[fmt], conditional=True,
+                     etag=cache_key[:32], download_name=f'force.{"pdf" if fmt == "pdf" else "zip"}')
 
 if __name__ == '__main__':
-    app.run(debug=True) 
\ No newline at end of file
+    create_app().run(debug=True)
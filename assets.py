@@ -0,0 +1,229 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+from catalog import source_signature
+from metrics import CATALOG_LOAD
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; without it only .gz siblings are written
+    brotli = None
+
+
+ASSET_DIR = 'js'
+BUILD_MANIFEST = 'build_manifest.json'
+HASH_LENGTH = 12
+# "units/vehicle.3f9a0c1b2d4e.js": the stem, the content hash and the extension
+HASHED_NAME = re.compile(r'^(?P<stem>.+)\.(?P<hash>[0-9a-f]{%d})(?P<extension>\.[a-z]+)$' % HASH_LENGTH)
+# Precompressed siblings, by Content-Encoding
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+def hashed_name(name, content):
+    """
+    Returns the file name an asset is published under, with its content hash
+    before the extension.
+
+    Args:
+        name (str): The logical name, e.g. "units/vehicle.js".
+        content (bytes): The asset's content.
+
+    Returns:
+        str: e.g. "units/vehicle.3f9a0c1b2d4e.js".
+    """
+    stem, extension = os.path.splitext(name)
+    return f'{stem}.{hashlib.sha256(content).hexdigest()[:HASH_LENGTH]}{extension}'
+
+
+def _write_atomic(path, content):
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+def write_asset(name, content, asset_dir=ASSET_DIR):
+    """
+    Writes an asset under its hashed name with .gz (and, when brotli is
+    installed, .br) siblings, so any server can send it precompressed. The name
+    is the content, so files already published are left as they are.
+
+    Args:
+        name (str): The logical name, relative to asset_dir.
+        content (bytes): The asset's content.
+        asset_dir (str): The directory assets are published in.
+
+    Returns:
+        str: The hashed name, relative to asset_dir.
+    """
+    published = hashed_name(name, content)
+    path = os.path.join(asset_dir, published)
+    paths = [path, path + ENCODING_SUFFIXES['gzip']] + ([path + ENCODING_SUFFIXES['br']] if brotli is not None else [])
+    if all(os.path.exists(existing) for existing in paths):
+        return published
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _write_atomic(path, content)
+    # mtime=0 keeps the .gz byte-identical from build to build
+    _write_atomic(path + ENCODING_SUFFIXES['gzip'], gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _write_atomic(path + ENCODING_SUFFIXES['br'], brotli.compress(content, quality=11))
+    return published
+
+
+def prune_assets(assets, asset_dir=ASSET_DIR):
+    """
+    Deletes hashed files (and their compressed siblings) left by earlier builds.
+    Files without a content hash in their name are never touched.
+
+    Args:
+        assets (dict): The current build manifest, logical name -> hashed name.
+        asset_dir (str): The directory assets are published in.
+
+    Returns:
+        list: The deleted paths.
+    """
+    current = set(assets.values())
+    deleted = []
+    for directory, _, filenames in os.walk(asset_dir):
+        for filename in filenames:
+            path = os.path.join(directory, filename)
+            name = os.path.relpath(path, asset_dir).replace(os.sep, '/')
+            for suffix in ENCODING_SUFFIXES.values():
+                if name.endswith(suffix):
+                    name = name[:-len(suffix)]
+                    break
+            if HASHED_NAME.match(os.path.basename(name)) and name not in current:
+                os.remove(path)
+                deleted.append(path)
+    return deleted
+
+
+def write_build_manifest(assets, asset_dir=ASSET_DIR):
+    _write_atomic(os.path.join(asset_dir, BUILD_MANIFEST),
+                  (json.dumps(assets, indent=2, sort_keys=True) + '\n').encode('utf-8'))
+
+
+def rewrite_script_tags(html_path, assets, asset_dir=ASSET_DIR):
+    """
+    Points every <script src="js/..."> in a page at the current hashed file,
+    whether the tag names the logical file or an older build's hash.
+
+    Args:
+        html_path (str): The page to rewrite in place.
+        assets (dict): The build manifest, logical name -> hashed name.
+        asset_dir (str): The directory assets are published in, as the page references it.
+    """
+    def replace(match):
+        name = match.group('name')
+        hashed = HASHED_NAME.match(name)
+        logical = f"{hashed.group('stem')}{hashed.group('extension')}" if hashed else name
+        return f'src="{asset_dir}/{assets.get(logical, name)}"'
+
+    with open(html_path, encoding='utf-8') as f:
+        html = f.read()
+    rewritten = re.sub(r'src="%s/(?P<name>[^"]+)"' % re.escape(asset_dir), replace, html)
+    if rewritten != html:
+        _write_atomic(html_path, rewritten.encode('utf-8'))
+
+
+class AssetManifest:
+    """
+    The build manifest convert_csv_to_js.py writes: each logical asset name and
+    the hashed file currently published for it.
+    """
+
+    def __init__(self, asset_dir, signature, assets):
+        self.asset_dir = asset_dir
+        self.signature = signature
+        self.assets = assets
+        self.published = set(assets.values())
+
+    def is_stale(self):
+        return source_signature([os.path.join(self.asset_dir, BUILD_MANIFEST)]) != self.signature
+
+    def resolve(self, name):
+        """
+        Looks up a requested asset.
+
+        Args:
+            name (str): A logical or hashed name, relative to the asset directory.
+
+        Returns:
+            tuple: (hashed name, True if the request named the hash), or (None, False) if unknown.
+        """
+        if name in self.published:
+            return name, True
+        return self.assets.get(name), False
+
+    def encoded_file(self, published, accept_encodings):
+        """
+        Picks the precompressed sibling to send, preferring brotli over gzip.
+
+        Args:
+            published (str): A hashed name from resolve().
+            accept_encodings: The request's Accept-Encoding header (a werkzeug MIMEAccept-like object).
+
+        Returns:
+            tuple: (path, 'br', 'gzip' or 'identity').
+        """
+        path = os.path.join(self.asset_dir, published)
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            if accept_encodings[encoding] and os.path.exists(path + suffix):
+                return path + suffix, encoding
+        return path, 'identity'
+
+
+def asset_digest(published):
+    """Returns the content hash in a hashed name."""
+    return HASHED_NAME.match(os.path.basename(published)).group('hash')
+
+
+def load_asset_manifest(asset_dir=ASSET_DIR):
+    """
+    Reads the build manifest. A tree that has not been built yet has no assets.
+
+    Args:
+        asset_dir (str): The directory assets are published in.
+
+    Returns:
+        AssetManifest: The manifest.
+    """
+    path = os.path.join(asset_dir, BUILD_MANIFEST)
+    signature = source_signature([path])
+    try:
+        with open(path, encoding='utf-8') as f:
+            assets = json.load(f)
+    except FileNotFoundError:
+        assets = {}
+    return AssetManifest(asset_dir, signature, assets)
+
+
+class AssetManifestCache:
+    """Holds the current AssetManifest, rereading it when a build replaces it."""
+
+    def __init__(self, asset_dir=ASSET_DIR):
+        self.asset_dir = asset_dir
+        self._lock = threading.Lock()
+        self._manifest = self._build('initial')
+
+    def get(self):
+        manifest = self._manifest
+        if not manifest.is_stale():
+            return manifest
+        with self._lock:
+            manifest = self._manifest
+            if manifest.is_stale():
+                manifest = self._build('reload')
+                self._manifest = manifest
+        return manifest
+
+    def _build(self, reason):
+        start = time.perf_counter()
+        manifest = load_asset_manifest(self.asset_dir)
+        CATALOG_LOAD.observe(time.perf_counter() - start, 'assets', reason)
+        return manifest
@@ -0,0 +1,85 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only the offline build tools may load these; a serving process never should
+FORBIDDEN_MODULES = ['pandas']
+
+# Run in a fresh interpreter each time so nothing is already imported
+PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter() - start
+start = time.perf_counter()
+app.create_app()
+created = time.perf_counter() - start
+from metrics import resident_memory_bytes
+print(json.dumps({'import_s': imported, 'create_app_s': created, 'rss': resident_memory_bytes(),
+                  'modules': sorted(sys.modules)}))
+'''
+
+
+def probe_app(cwd):
+    """
+    Imports app.py and builds the app in a new interpreter.
+
+    Returns:
+        dict: import_s, create_app_s, rss (bytes or None) and the loaded module names.
+    """
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    result = subprocess.run([sys.executable, '-c', PROBE], cwd=cwd, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f'app failed to start:\n{result.stderr}')
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def check_imports(cwd, runs, budget):
+    """
+    Checks that the serving path stays fast to start: no forbidden module is
+    loaded, and the median time to import app.py is within the budget.
+
+    Args:
+        cwd (str): The directory the app loads its data from.
+        runs (int): Fresh interpreters to time.
+        budget (float): The allowed median import time in seconds.
+
+    Returns:
+        tuple: (list of failure messages, report lines).
+    """
+    probes = [probe_app(cwd) for _ in range(runs)]
+    import_s = statistics.median(probe['import_s'] for probe in probes)
+    create_app_s = statistics.median(probe['create_app_s'] for probe in probes)
+    rss = probes[-1]['rss']
+    report = [
+        f'import app: {import_s * 1000:.0f} ms (median of {runs}, budget {budget * 1000:.0f} ms)',
+        f'create_app(): {create_app_s * 1000:.0f} ms',
+        f'RSS after create_app(): {"n/a" if rss is None else f"{rss / 2 ** 20:.1f} MB"}',
+    ]
+    failures = []
+    loaded = {module.split('.')[0] for module in probes[-1]['modules']}
+    for module in FORBIDDEN_MODULES:
+        if module in loaded:
+            failures.append(f'{module} was imported; is units_catalog/ built? (python convert_csv_to_js.py)')
+    if import_s > budget:
+        failures.append(f'import app took {import_s * 1000:.0f} ms, over the {budget * 1000:.0f} ms budget')
+    return failures, report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Check the web app starts without pandas and within an import-time budget.')
+    parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters to time (default 5)')
+    parser.add_argument('--budget', type=float, default=0.5, help='Allowed median import time in seconds (default 0.5)')
+    parser.add_argument('--data-dir', default=REPO_ROOT, help='Directory holding units_catalog/ (default the repo root)')
+    args = parser.parse_args()
+
+    failures, report = check_imports(args.data_dir, args.runs, args.budget)
+    print('\n'.join(report))
+    for failure in failures:
+        print(f'FAIL: {failure}')
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,268 @@
+import argparse
+import http.client
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import quote
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from catalog import CATALOG_CSV, write_catalog_store  # noqa: E402
+from catalog_build import build_catalog  # noqa: E402
+from synthetic import generate_cards, generate_catalog  # noqa: E402
+
+
+def build_scenarios(full_names, carded_names):
+    """
+    Lists the requests each run drives, as (label, method, path, JSON body) tuples.
+    Unit-specific requests rotate through the synthetic units.
+    """
+    def unit_paths(prefix, names, suffix=''):
+        return [f'{prefix}{quote(name, safe="/")}{suffix}' for name in names]
+
+    sample = full_names[::max(1, len(full_names) // 100)]
+    carded = carded_names[::max(1, len(carded_names) // 100)]
+    force = {'units': [{'id': name, 'skill': 'regular'} for name in sample[:8]], 'max_points': 200}
+    return [
+        ('index', 'GET', ['/'], None),
+        ('get_units (all)', 'GET', ['/get_units'], None),
+        ('get_units (filtered)', 'GET', ['/get_units?type=vehicle&max_pv=30&fields=FullName,RegPV&limit=100'], None),
+        ('get_unit', 'GET', unit_paths('/get_unit/', sample), None),
+        ('get_card', 'GET', unit_paths('/get_card/', carded), None),
+        ('card gif', 'GET', unit_paths('/card/', carded), None),
+        ('card 350 webp', 'GET', unit_paths('/card/', carded[:10], '?w=350&format=webp'), None),
+        ('search', 'GET', ['/search?q=manticore', '/search?q=savanah', '/search?q=lrm%20carrier'], None),
+        ('fits', 'GET', ['/fits?pv=20&limit=50', '/fits?pv=35&sort=durability&limit=20'], None),
+        ('force/optimize', 'GET', ['/force/optimize?budget=100&results=3'], None),
+        ('force/evaluate', 'POST', ['/force/evaluate'], force),
+        ('metrics', 'GET', ['/metrics'], None),
+    ]
+
+
+def summarize(latencies, elapsed):
+    latencies = np.array(latencies) * 1000
+    return {
+        'requests': len(latencies),
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+        'throughput': len(latencies) / elapsed if elapsed else 0.0,
+    }
+
+
+def process_memory(pid):
+    """Returns (RSS, PSS) in bytes from /proc, or None where /proc is unavailable."""
+    fields = {}
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                name, _, value = line.partition(':')
+                if name in ('Rss', 'Pss'):
+                    fields[name] = int(value.split()[0]) * 1024
+    except OSError:
+        return None
+    return fields['Rss'], fields['Pss']
+
+
+def current_rss():
+    memory = process_memory(os.getpid())
+    return memory[0] if memory else None
+
+
+def run_test_client(scenarios, requests):
+    """
+    Drives every scenario sequentially through Flask's test client. Like the
+    gunicorn run, the app loads its default sources from the working directory.
+
+    Returns:
+        tuple: (results per scenario label, startup stats).
+    """
+    from app import create_app
+
+    rss_before = current_rss()
+    start = time.perf_counter()
+    app = create_app()
+    startup = {'create_app_s': time.perf_counter() - start, 'rss_before': rss_before, 'rss_after': current_rss()}
+    client = app.test_client()
+
+    results = {}
+    for label, method, paths, body in scenarios:
+        client.open(paths[0], method=method, json=body)  # Warm the caches
+        latencies = []
+        started = time.perf_counter()
+        for number in range(requests):
+            request_start = time.perf_counter()
+            response = client.open(paths[number % len(paths)], method=method, json=body,
+                                   headers={'Accept-Encoding': 'gzip'})
+            response.get_data()
+            latencies.append(time.perf_counter() - request_start)
+            if response.status_code >= 400:
+                raise RuntimeError(f'{label}: {paths[number % len(paths)]} returned {response.status_code}')
+        results[label] = summarize(latencies, time.perf_counter() - started)
+    startup['rss_peak'] = current_rss()
+    return results, startup
+
+
+def _http_request(port, method, path, body):
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+    try:
+        headers = {'Accept-Encoding': 'gzip'}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        connection.request(method, path, body=payload, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    finally:
+        connection.close()
+
+
+def run_gunicorn(workdir, scenarios, requests, workers, concurrency, port):
+    """
+    Starts gunicorn with the repo's config in the synthetic data directory and
+    drives every scenario from concurrent client threads.
+
+    Returns:
+        tuple: (results per scenario label, startup and memory stats).
+    """
+    env = dict(os.environ, BIND=f'127.0.0.1:{port}', WEB_CONCURRENCY=str(workers), PYTHONPATH=REPO_ROOT)
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', os.path.join(REPO_ROOT, 'gunicorn.conf.py'),
+         '--chdir', workdir, '--log-level', 'warning'],
+        env=env, cwd=workdir)
+    try:
+        while True:
+            try:
+                _http_request(port, 'GET', '/metrics', None)
+                break
+            except OSError:
+                if server.poll() is not None:
+                    raise RuntimeError('gunicorn exited during startup')
+                if time.perf_counter() - start > 300:
+                    raise RuntimeError('gunicorn did not start within 300s')
+                time.sleep(0.1)
+        startup = {'ready_s': time.perf_counter() - start}
+
+        results = {}
+        for label, method, paths, body in scenarios:
+            _http_request(port, method, paths[0], body)
+            latencies, errors = [], []
+            lock = threading.Lock()
+            counter = iter(range(requests))
+
+            def worker():
+                while True:
+                    with lock:
+                        number = next(counter, None)
+                    if number is None:
+                        return
+                    path = paths[number % len(paths)]
+                    request_start = time.perf_counter()
+                    try:
+                        status = _http_request(port, method, path, body)
+                    except OSError as e:
+                        with lock:
+                            errors.append(f'{path} failed: {e}')
+                        continue
+                    elapsed = time.perf_counter() - request_start
+                    with lock:
+                        latencies.append(elapsed)
+                        if status >= 400:
+                            errors.append(f'{path} returned {status}')
+
+            started = time.perf_counter()
+            threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            if errors:
+                raise RuntimeError(f'{label}: {errors[0]}')
+            results[label] = summarize(latencies, time.perf_counter() - started)
+
+        pids = [server.pid] + [int(pid) for pid in subprocess.run(
+            ['pgrep', '-P', str(server.pid)], capture_output=True, text=True).stdout.split()]
+        memory = [process_memory(pid) for pid in pids]
+        if all(memory):
+            startup['master_rss'] = memory[0][0]
+            startup['worker_rss'] = [rss for rss, _ in memory[1:]]
+            startup['total_pss'] = sum(pss for _, pss in memory)
+        return results, startup
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def format_mb(value):
+    return 'n/a' if value is None else f'{value / 2 ** 20:.1f} MB'
+
+
+def format_report(title, results, startup):
+    lines = [title, f'{"scenario":<24}{"requests":>10}{"p50 ms":>10}{"p99 ms":>10}{"req/s":>10}']
+    for label, stats in results.items():
+        lines.append(f'{label:<24}{stats["requests"]:>10}{stats["p50_ms"]:>10.2f}'
+                     f'{stats["p99_ms"]:>10.2f}{stats["throughput"]:>10.1f}')
+    for key, value in startup.items():
+        if key.endswith('_s'):
+            lines.append(f'{key}: {value:.2f}s')
+        elif isinstance(value, list):
+            lines.append(f'{key}: {", ".join(format_mb(item) for item in value)}')
+        else:
+            lines.append(f'{key}: {format_mb(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Load-test the Flask app against a synthetic catalog.')
+    parser.add_argument('--units', type=int, default=10000, help='Synthetic units (default 10000)')
+    parser.add_argument('--cards', type=int, default=500, help='Synthetic card GIFs (default 500)')
+    parser.add_argument('--requests', type=int, default=200, help='Requests per scenario (default 200)')
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn workers (default 2)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Client threads against gunicorn (default 8)')
+    parser.add_argument('--port', type=int, default=8765, help='Port for the gunicorn run (default 8765)')
+    parser.add_argument('--csv', action='store_true', help='Serve from the CSV instead of the binary catalog store')
+    parser.add_argument('--skip-gunicorn', action='store_true', help='Only run the test client benchmark')
+    parser.add_argument('--output', default=os.path.join(REPO_ROOT, 'bench_output.txt'),
+                        help='Where to write the report (default bench_output.txt)')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bfs-bench-')
+    try:
+        start = time.perf_counter()
+        # The synthetic data takes the default file names, and every run works in
+        # workdir so the card and print caches are written there too
+        full_names = generate_catalog(os.path.join(workdir, CATALOG_CSV), args.units,
+                                      template_csv=os.path.join(REPO_ROOT, 'MULOutput - Vehicles.csv'))
+        carded_names = full_names[:args.cards]
+        generate_cards(os.path.join(workdir, 'Cards'), carded_names)
+        os.chdir(workdir)
+        if not args.csv:
+            # What the data build ships to the app
+            write_catalog_store(build_catalog([CATALOG_CSV]))
+        print(f'Generated {args.units} units and {args.cards} cards in {time.perf_counter() - start:.1f}s')
+
+        scenarios = build_scenarios(full_names, carded_names)
+        header = f'units={args.units} cards={args.cards} requests={args.requests} source={"csv" if args.csv else "store"}'
+        report = format_report(f'Flask test client ({header})', *run_test_client(scenarios, args.requests))
+        if not args.skip_gunicorn:
+            report += '\n' + format_report(
+                f'gunicorn workers={args.workers} concurrency={args.concurrency} ({header})',
+                *run_gunicorn(workdir, scenarios, args.requests, args.workers, args.concurrency, args.port))
+    finally:
+        os.chdir(REPO_ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(report)
+    with open(args.output, 'w') as f:
+        f.write(report)
+    print(f'Report written to {args.output}')
@@ -0,0 +1,72 @@
+import csv
+import os
+import random
+
+from PIL import Image, ImageDraw
+
+
+TEMPLATE_CSV = 'MULOutput - Vehicles.csv'
+CARD_SIZE = (1050, 750)
+
+
+def generate_catalog(path, units, template_csv=TEMPLATE_CSV, seed=0):
+    """
+    Writes a synthetic MUL CSV by cycling through the rows of a real one. Every
+    row gets a unique Name, FullName and MULId and a jittered PV, so indexes and
+    PV orders behave like a larger real catalog.
+
+    Args:
+        path (str): Where to write the CSV.
+        units (int): The number of rows to generate.
+        template_csv (str): The real CSV whose columns and rows are reused.
+        seed (int): Seed for the PV jitter.
+
+    Returns:
+        list: The generated FullNames, in row order.
+    """
+    rng = random.Random(seed)
+    with open(template_csv, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = list(reader)
+    column = {name: index for index, name in reversed(list(enumerate(header)))}
+    full_names = []
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for number in range(units):
+            row = list(rows[number % len(rows)])
+            suffix = f' #{number // len(rows)}' if number >= len(rows) else ''
+            row[column['Name']] += suffix
+            row[column['FullName']] += suffix
+            row[column['MULId']] = str(1000000 + number)
+            for pv_column in ('PV', 'RegPV', 'VetPV'):
+                if row[column[pv_column]]:
+                    row[column[pv_column]] = str(max(1, int(float(row[column[pv_column]])) + rng.randint(-3, 3)))
+            full_names.append(row[column['FullName']])
+            writer.writerow(row)
+    return full_names
+
+
+def generate_cards(cards_dir, full_names, seed=0):
+    """
+    Writes one small GIF per unit, named the way the front end looks cards up.
+    Each card differs slightly so every one has its own content hash.
+
+    Args:
+        cards_dir (str): The directory to create.
+        full_names (list): The units to draw cards for.
+        seed (int): Seed for the card colors.
+
+    Returns:
+        int: The number of cards written.
+    """
+    rng = random.Random(seed)
+    os.makedirs(cards_dir, exist_ok=True)
+    for full_name in full_names:
+        image = Image.new('P', CARD_SIZE, color=rng.randrange(256))
+        draw = ImageDraw.Draw(image)
+        draw.rectangle([40, 40, CARD_SIZE[0] - 40, 160], fill=rng.randrange(256))
+        draw.text((60, 80), full_name, fill=0)
+        image.save(os.path.join(cards_dir, full_name.replace('/', '-') + '.gif'))
+    return len(full_names)
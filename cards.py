@@ -0,0 +1,146 @@
+import hashlib
+import os
+import threading
+import time
+import unicodedata
+
+from catalog import source_signature
+from metrics import CATALOG_LOAD, timed
+
+
+CARDS_DIR = 'Cards'
+
+
+def card_key(unit_name):
+    """
+    Normalizes a unit name into the key its card is stored under. Mirrors the
+    front end, which replaces '/' with '-' when building card file names.
+
+    Args:
+        unit_name (str): A unit FullName or card file stem.
+
+    Returns:
+        str: The normalized key.
+    """
+    return unicodedata.normalize('NFC', unit_name.replace('/', '-'))
+
+
+class CardEntry:
+    """The size, mtime and content hash of one card file."""
+
+    __slots__ = ('filename', 'path', 'size', 'mtime', 'digest')
+
+    def __init__(self, filename, path, size, mtime, digest):
+        self.filename = filename
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.digest = digest
+
+
+def hash_file(path, chunk_size=1 << 16):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+class CardManifest:
+    """
+    A snapshot of every GIF in the cards directory, keyed by card_key(). Some
+    cards are stored with a leading '!', so lookups fall back to that spelling.
+    """
+
+    def __init__(self, cards_dir, signature, entries):
+        self.cards_dir = cards_dir
+        self.signature = signature
+        self.entries = entries
+
+    def is_stale(self):
+        # Adding, removing or renaming a card updates the directory's mtime;
+        # overwriting one in place does not, so find() checks the entry itself
+        return source_signature([self.cards_dir]) != self.signature
+
+    @timed('CardManifest.find')
+    def find(self, unit_name):
+        """Returns the CardEntry for a unit name, or None if it has no card."""
+        key = card_key(unit_name)
+        if key not in self.entries:
+            key = '!' + key
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(entry.path)
+        except FileNotFoundError:
+            return None  # Removed since the snapshot; the next get() rebuilds it
+        if (stat.st_mtime, stat.st_size) != (entry.mtime, entry.size):
+            # Overwritten in place: rehash it so its ETag and ?v= URL change
+            entry = card_entry(entry.filename, entry.path, stat)
+            self.entries[key] = entry
+        return entry
+
+
+def card_entry(filename, path, stat, previous=None):
+    """
+    Returns the CardEntry for a stat'ed card file, reusing the digest of the
+    previous entry for the same file when its mtime and size are unchanged.
+    """
+    if previous is not None and previous.path == path and \
+            (previous.mtime, previous.size) == (stat.st_mtime, stat.st_size):
+        return previous
+    return CardEntry(filename, path, stat.st_size, stat.st_mtime, hash_file(path))
+
+
+def build_card_manifest(cards_dir=CARDS_DIR, previous=None):
+    """
+    Stats and hashes every card in the directory.
+
+    Args:
+        cards_dir (str): The directory holding the card GIFs.
+        previous (CardManifest): An earlier manifest of the directory; only
+            cards whose mtime or size changed since are hashed again.
+
+    Returns:
+        CardManifest: The new manifest.
+    """
+    signature = source_signature([cards_dir])
+    previous_entries = previous.entries if previous is not None else {}
+    entries = {}
+    if os.path.isdir(cards_dir):
+        for filename in os.listdir(cards_dir):
+            stem, extension = os.path.splitext(filename)
+            if extension.lower() != '.gif':
+                continue
+            key = card_key(stem)
+            path = os.path.join(cards_dir, filename)
+            entries[key] = card_entry(filename, path, os.stat(path), previous_entries.get(key))
+    return CardManifest(cards_dir, signature, entries)
+
+
+class CardManifestCache:
+    """Holds the current CardManifest, rebuilding it when the directory changes."""
+
+    def __init__(self, cards_dir=CARDS_DIR):
+        self.cards_dir = cards_dir
+        self._lock = threading.Lock()
+        self._manifest = None
+        self._manifest = self._build('initial')
+
+    def get(self):
+        manifest = self._manifest
+        if not manifest.is_stale():
+            return manifest
+        with self._lock:
+            manifest = self._manifest
+            if manifest.is_stale():
+                manifest = self._build('reload')
+                self._manifest = manifest
+        return manifest
+
+    def _build(self, reason):
+        start = time.perf_counter()
+        manifest = build_card_manifest(self.cards_dir, self._manifest)
+        CATALOG_LOAD.observe(time.perf_counter() - start, 'cards', reason)
+        return manifest
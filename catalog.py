@@ -0,0 +1,648 @@
+import hashlib
+import json
+import math
+import mmap
+import os
+import re
+import shutil
+import threading
+import time
+
+import numpy as np
+
+from metrics import CATALOG_LOAD, timed
+from search_index import SearchIndex, build_search_index
+
+
+VEHICLES_CSV = 'MULOutput - Vehicles.csv'
+# Every unit source merged into one file by unit_sources.py
+CATALOG_CSV = 'units_catalog.csv'
+# The same catalog as typed binary columns, written next to it (see write_catalog_store)
+CATALOG_STORE = 'units_catalog'
+CATALOG_STORE_FORMAT = 4
+# Names the store's current version directory; replaced last, so readers never see a partial write
+STORE_POINTER = 'current.json'
+
+# Columns with a hash index from key to row ids. UnitType keys are lower-cased
+# because the sources spell them inconsistently.
+INDEXED_COLUMNS = ['FullName', 'Name', 'MULId', 'UnitType']
+
+# Indexes that identify a single unit, in the order find_unit tries them
+UNIT_KEY_COLUMNS = ('FullName', 'MULId', 'Name')
+
+# Era availability columns are named like "Clan Invasion (3050 - 3061)" and hold
+# a comma-separated list of the factions fielding the unit in that era
+ERA_COLUMN_PATTERN = re.compile(r'\((\d{4}) - (\d{4})\)$')
+UNAVAILABLE_FACTIONS = {'', 'extinct', 'unknown'}
+
+# Alpha Strike pilot skills run from 0 (best) to 7; the skill cost table is
+# defined relative to a skill 4 pilot
+SKILL_LEVELS = 8
+BASE_SKILL = 4
+SKILL_PV_COLUMNS = [f'Skill{level}PV' for level in range(SKILL_LEVELS)]
+PV_COLUMNS = ['RegPV', 'VetPV'] + SKILL_PV_COLUMNS
+
+# Numeric columns the catalog filters on, as float64 with NaN for missing values
+FLOAT_COLUMNS = ['PV', 'RegPV', 'VetPV', 'Size', 'Armor', 'Structure', 'Short', 'Medium', 'Long']
+
+
+def source_signature(paths):
+    """
+    Returns a cheap fingerprint of the source files based on their mtime and size.
+
+    Args:
+        paths (list): The paths of the files the catalog is built from.
+
+    Returns:
+        tuple: One (path, mtime_ns, size) entry per file; missing files get None values.
+    """
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            signature.append((path, None, None))
+            continue
+        signature.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def parse_skill(skill):
+    """
+    Reads a skill from a request.
+
+    Args:
+        skill: 'regular', 'veteran' or a pilot skill level 0-7 (int or numeric string).
+
+    Returns:
+        'regular', 'veteran' or the level as an int.
+
+    Raises:
+        ValueError: If the skill is not recognized.
+    """
+    if isinstance(skill, str) and skill.strip().lower() in ('regular', 'veteran'):
+        return skill.strip().lower()
+    try:
+        if isinstance(skill, bool):
+            raise TypeError
+        level = int(skill)
+    except (TypeError, ValueError):
+        raise ValueError(f'Unknown skill {skill}; use regular, veteran or 0-{SKILL_LEVELS - 1}')
+    if isinstance(skill, float) and level != skill or not 0 <= level < SKILL_LEVELS:
+        raise ValueError(f'Unknown skill {skill}; use regular, veteran or 0-{SKILL_LEVELS - 1}')
+    return level
+
+
+def skill_pv_column(skill):
+    """Returns the PV column for a skill accepted by parse_skill()."""
+    skill = parse_skill(skill)
+    if skill == 'regular':
+        return 'RegPV'
+    if skill == 'veteran':
+        return 'VetPV'
+    return SKILL_PV_COLUMNS[skill]
+
+
+def skill_cost_table(base_pv):
+    """
+    Applies the Alpha Strike skill cost table to skill 4 PVs. Each level better
+    than 4 adds 1 PV, plus 1 more for every 5 PV above 7; each level worse
+    subtracts 1 PV, plus 1 more for every 10 PV above 14, to a minimum of 1.
+
+    Args:
+        base_pv (ndarray): PVs at skill 4.
+
+    Returns:
+        ndarray: One row per PV with a column for each skill 0-7.
+    """
+    base_pv = np.asarray(base_pv, dtype=float)[..., None]
+    levels_better = BASE_SKILL - np.arange(SKILL_LEVELS)
+    better = base_pv + levels_better * (1 + np.maximum(0, base_pv - 3) // 5)
+    worse = np.maximum(1, base_pv + levels_better * (1 + np.maximum(0, base_pv - 5) // 10))
+    return np.where(levels_better >= 0, better, worse)
+
+
+def source_content_hash(paths):
+    """
+    Hashes the contents of the source files, as build_catalog() does for a
+    catalog's version. Missing files are skipped.
+
+    Args:
+        paths (list): The paths of the files the catalog is built from.
+
+    Returns:
+        str: The hex digest.
+    """
+    content_hash = hashlib.sha256()
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            continue
+        content_hash.update(path.encode('utf-8') + b'\0' + raw)
+    return content_hash.hexdigest()
+
+
+def json_value(value):
+    """Returns None for NaN and infinite floats, which JSON cannot represent, and value otherwise."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def index_key(column, value):
+    """
+    Normalizes a value into the form it is stored under in the column's index.
+
+    Args:
+        column (str): The indexed column.
+        value: The raw value from a record or a request.
+
+    Returns:
+        The normalized key, or None if the value cannot be indexed.
+    """
+    if value is None or (isinstance(value, float) and value != value):  # NaN
+        return None
+    if column == 'MULId':
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return None
+    if column == 'UnitType':
+        return str(value).lower()
+    return str(value)
+
+
+def build_indexes(records):
+    """
+    Builds a hash index over each column in INDEXED_COLUMNS.
+
+    Args:
+        records (list): The unit dictionaries.
+
+    Returns:
+        dict: Column name -> {key: [row ids]} with row ids in catalog order.
+    """
+    indexes = {column: {} for column in INDEXED_COLUMNS}
+    for row_id, record in enumerate(records):
+        for column, index in indexes.items():
+            key = index_key(column, record.get(column))
+            if key is not None:
+                index.setdefault(key, []).append(row_id)
+    return indexes
+
+
+def index_from_keys(keys):
+    """Builds one column's hash index from its per-row keys (None where the row has none)."""
+    index = {}
+    for row_id, key in enumerate(keys):
+        if key is not None:
+            index.setdefault(key, []).append(row_id)
+    return index
+
+
+def build_pv_orders(columns, type_index):
+    """
+    Presorts the rows of each unit type (and of the whole catalog, under None)
+    by every PV column so "what fits" queries are a single bisection.
+
+    Args:
+        columns (dict): The catalog's column arrays.
+        type_index (dict): The UnitType index, lower-cased type -> row ids.
+
+    Returns:
+        dict: (type key or None, PV column) -> (sorted PVs, row ids in the same order).
+    """
+    groups = {None: np.arange(len(columns['RegPV']))}
+    groups.update((key, np.array(row_ids, dtype=np.int64)) for key, row_ids in type_index.items())
+    orders = {}
+    for key, row_ids in groups.items():
+        for column in PV_COLUMNS:
+            pv = columns[column][row_ids]
+            # Units without a PV can never be bought, so they are left out
+            row_ids_with_pv = row_ids[~np.isnan(pv)]
+            pv = pv[~np.isnan(pv)]
+            order = np.argsort(pv, kind='stable')
+            orders[(key, column)] = (pv[order], row_ids_with_pv[order])
+    return orders
+
+
+class RecordStore:
+    """
+    The unit dictionaries, stored as one buffer of compact JSON objects plus an
+    offsets array instead of a list of dicts. Reading a record never touches a
+    per-unit Python object, so workers forked from a preloaded master share the
+    buffer copy-on-write without refcount updates dirtying its pages.
+    """
+
+    def __init__(self, buffer, offsets):
+        self.buffer = buffer
+        self.offsets = offsets
+
+    @classmethod
+    def from_records(cls, records):
+        # Encoded the way Flask's JSON provider would, so bodies can be spliced together.
+        # Missing values are NaN in the catalog and null in the JSON.
+        encoded = [json.dumps({field: json_value(value) for field, value in record.items()},
+                              sort_keys=True, separators=(',', ':'), allow_nan=False).encode('utf-8')
+                   for record in records]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(item) for item in encoded], out=offsets[1:])
+        return cls(b''.join(encoded), offsets)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row_id):
+        return json.loads(self.json(row_id))
+
+    def __iter__(self):
+        for row_id in range(len(self)):
+            yield self[row_id]
+
+    def project(self, row_id, fields):
+        """Returns only the given fields of a record; missing fields are None."""
+        record = self[row_id]
+        return {field: json_value(record.get(field)) for field in fields}
+
+    def json(self, row_id):
+        """Returns the encoded record as bytes without decoding it."""
+        return self.buffer[self.offsets[row_id]:self.offsets[row_id + 1]]
+
+    @timed('RecordStore.json_array')
+    def json_array(self, row_ids=None):
+        """
+        Returns the encoded records as one JSON array.
+
+        Args:
+            row_ids (list): The rows to include, in order; all rows if None.
+
+        Returns:
+            bytes: The array, without a trailing newline.
+        """
+        if row_ids is None:
+            return b'[' + b','.join(self.json(row_id) for row_id in range(len(self))) + b']'
+        return b'[' + b','.join(self.json(row_id) for row_id in row_ids) + b']'
+
+
+class UnitCatalog:
+    """
+    An immutable snapshot of the unit data. A new catalog is built whenever the
+    sources change; an existing one is never modified.
+    """
+
+    def __init__(self, sources, signature, version, records, columns, eras, field_names,
+                 indexes=None, search_index=None):
+        self.sources = tuple(sources)
+        self.signature = signature
+        self.version = version
+        self.columns = columns
+        self.eras = eras
+        self.field_names = field_names
+        # A catalog loaded from the binary store comes with its indexes already built
+        self.indexes = indexes if indexes is not None else build_indexes(records)
+        self.pv_orders = build_pv_orders(columns, self.indexes['UnitType'])
+        self.search_index = search_index if search_index is not None else build_search_index(records)
+        if 'NameRank' not in self.columns:
+            # Rank of each unit's Name, so sorting rows by name never decodes a record
+            names = [str(record.get('Name')) for record in records]
+            self.columns['NameRank'] = np.unique(names, return_inverse=True)[1].astype(np.int64)
+        self.records = records if isinstance(records, RecordStore) else RecordStore.from_records(records)
+
+    def is_stale(self):
+        return source_signature(self.sources) != self.signature
+
+    def lookup(self, column, value):
+        """Returns the row ids whose column matches value, in catalog order."""
+        return self.indexes[column].get(index_key(column, value), [])
+
+    def find_row(self, key, columns=UNIT_KEY_COLUMNS):
+        """
+        Resolves a single unit by trying each column's index in turn.
+
+        Args:
+            key (str): A FullName, MULId or Name.
+            columns (tuple): The indexed columns to try, in order.
+
+        Returns:
+            int: The row id of the first matching unit, or None if nothing matches.
+        """
+        for column in columns:
+            row_ids = self.lookup(column, key)
+            if row_ids:
+                return row_ids[0]
+        return None
+
+    def find_unit(self, key, columns=UNIT_KEY_COLUMNS):
+        """Returns the unit dictionary for find_row(), or None if nothing matches."""
+        row_id = self.find_row(key, columns)
+        return None if row_id is None else self.records[row_id]
+
+    def resolve_eras(self, era):
+        """
+        Finds the era columns matching a year or a case-insensitive name prefix.
+
+        Raises:
+            ValueError: If no era matches.
+        """
+        if era.isdigit():
+            year = int(era)
+            matches = [entry for entry in self.eras if entry[1] <= year <= entry[2]]
+        else:
+            matches = [entry for entry in self.eras if entry[0].lower().startswith(era.lower())]
+        if not matches:
+            raise ValueError(f'Unknown era {era}')
+        return matches
+
+    def availability_mask(self, era=None, faction=None):
+        """
+        Returns a boolean row mask of units available in the era and/or to the faction.
+        Without an era every era is considered; without a faction any faction counts.
+        """
+        mask = np.zeros(len(self.records), dtype=bool)
+        eras = self.resolve_eras(era) if era else self.eras
+        for _, _, _, factions in eras:
+            if faction:
+                row_ids = factions.get(faction.strip().lower())
+                if row_ids is not None:
+                    mask[row_ids] = True
+            else:
+                for row_ids in factions.values():
+                    mask[row_ids] = True
+        return mask
+
+    def units_within(self, pv, unit_type=None, pv_column='RegPV'):
+        """
+        Returns the units costing at most pv, cheapest first.
+
+        Args:
+            pv (float): The remaining PV budget.
+            unit_type (str): Only units of this UnitType (case-insensitive).
+            pv_column (str): A column from PV_COLUMNS.
+
+        Returns:
+            ndarray: The row ids, in ascending PV order.
+        """
+        key = index_key('UnitType', unit_type) if unit_type else None
+        order = self.pv_orders.get((key, pv_column))
+        if order is None:
+            return np.array([], dtype=np.int64)
+        sorted_pv, row_ids = order
+        return row_ids[:np.searchsorted(sorted_pv, pv, side='right')]
+
+    def select(self, unit_type=None, min_pv=None, max_pv=None, pv_column='RegPV',
+               roles=None, sizes=None, era=None, faction=None):
+        """
+        Filters the catalog using the precomputed column arrays.
+
+        Args:
+            unit_type (str or list): Only units of this UnitType, or any of these (case-insensitive).
+            min_pv (float): Minimum value of pv_column.
+            max_pv (float): Maximum value of pv_column.
+            pv_column (str): The PV column the range applies to, one of PV_COLUMNS.
+            roles (list): Only units with one of these roles (case-insensitive).
+            sizes (list): Only units with one of these sizes.
+            era (str): Only units available in this era, by year or name prefix.
+            faction (str): Only units available to this faction.
+
+        Returns:
+            ndarray: The matching row ids in catalog order.
+        """
+        mask = np.ones(len(self.records), dtype=bool)
+        if unit_type:
+            type_mask = np.zeros(len(self.records), dtype=bool)
+            for name in [unit_type] if isinstance(unit_type, str) else unit_type:
+                type_mask[self.lookup('UnitType', name)] = True
+            mask &= type_mask
+        pv = self.columns[pv_column]
+        if min_pv is not None:
+            mask &= pv >= min_pv
+        if max_pv is not None:
+            mask &= pv <= max_pv
+        if roles:
+            role_codes = np.flatnonzero(np.isin(self.columns['RoleLabels'], [role.lower() for role in roles]))
+            mask &= np.isin(self.columns['RoleCode'], role_codes)
+        if sizes:
+            mask &= np.isin(self.columns['Size'], sizes)
+        if era or faction:
+            mask &= self.availability_mask(era, faction)
+        return np.flatnonzero(mask)
+
+
+def write_catalog_store(catalog, store_dir=CATALOG_STORE):
+    """
+    Writes a catalog as a directory of .npy column files and one JSON file of
+    metadata, so it loads by memory-mapping instead of parsing CSV. Everything
+    derived from the records (hash indexes, search index, era index, name ranks)
+    is stored too; only the PV orders are recomputed, which takes a few argsorts.
+
+    Each version is written to its own directory and published by replacing
+    STORE_POINTER, so a process still mapping an older version keeps working.
+
+    Args:
+        catalog (UnitCatalog): The catalog, usually from catalog_build.build_catalog().
+        store_dir (str): The store directory.
+
+    Returns:
+        str: The directory the version was written to.
+    """
+    # A new format never reuses a directory an older one wrote
+    name = f'{catalog.version[:16]}.v{CATALOG_STORE_FORMAT}'
+    directory = os.path.join(store_dir, name)
+    if not os.path.exists(os.path.join(directory, 'catalog.json')):
+        temp_dir = f'{directory}.{os.getpid()}.tmp'
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        os.makedirs(temp_dir)
+
+        def save(file_name, array):
+            np.save(os.path.join(temp_dir, file_name), np.ascontiguousarray(array), allow_pickle=False)
+            return file_name
+
+        columns, labels = {}, {}
+        for column, values in catalog.columns.items():
+            if column in SKILL_PV_COLUMNS:
+                continue  # Views of SkillPV
+            if column.endswith('Labels'):
+                # The label lists of the categorical *Code columns go in the metadata
+                labels[column] = values.tolist()
+                continue
+            columns[column] = {'file': save(f'{column}.npy', values), 'dtype': str(values.dtype),
+                               'shape': list(values.shape)}
+
+        with open(os.path.join(temp_dir, 'records.bin'), 'wb') as f:
+            f.write(catalog.records.buffer)
+        save('record_offsets.npy', catalog.records.offsets)
+
+        # Every era's faction row ids back to back; the metadata holds each slice
+        eras, era_rows, offset = [], [], 0
+        for column, start_year, end_year, factions in catalog.eras:
+            entry = {'column': column, 'start': start_year, 'end': end_year, 'factions': []}
+            for faction, row_ids in factions.items():
+                entry['factions'].append([faction, offset, offset + len(row_ids)])
+                era_rows.append(row_ids)
+                offset += len(row_ids)
+            eras.append(entry)
+        save('era_rows.npy', np.concatenate(era_rows) if era_rows else np.array([], dtype=np.int64))
+
+        # Search postings likewise, in the order of the gram list
+        search = catalog.search_index
+        grams = sorted(search.postings)
+        postings = [search.postings[gram] for gram in grams]
+        save('search_postings.npy', np.concatenate(postings) if postings else np.array([], dtype=np.int32))
+        save('search_offsets.npy', np.concatenate([[0], np.cumsum([len(ids) for ids in postings])]).astype(np.int64))
+        save('search_sizes.npy', search.sizes)
+
+        # Each indexed column's key per row, so the hash indexes rebuild without decoding records
+        keys = {column: [None] * len(catalog.records) for column in catalog.indexes}
+        for column, index in catalog.indexes.items():
+            for key, row_ids in index.items():
+                for row_id in row_ids:
+                    keys[column][row_id] = key
+
+        metadata = {
+            'format': CATALOG_STORE_FORMAT,
+            'version': catalog.version,
+            # The CSVs this version was built from, so a loader can tell when they change
+            'sources': list(catalog.sources),
+            'source_signature': [list(entry) for entry in catalog.signature],
+            'length': len(catalog.records),
+            'field_names': catalog.field_names,
+            'columns': columns,
+            'labels': labels,
+            'eras': eras,
+            'index_keys': keys,
+            'search_grams': grams,
+            'search_texts': search.texts,
+        }
+        with open(os.path.join(temp_dir, 'catalog.json'), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, separators=(',', ':'))
+        os.replace(temp_dir, directory)
+
+    pointer_path = os.path.join(store_dir, STORE_POINTER)
+    temp_path = f'{pointer_path}.{os.getpid()}.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump({'format': CATALOG_STORE_FORMAT, 'directory': name, 'version': catalog.version}, f)
+    os.replace(temp_path, pointer_path)
+    # Older versions are no longer reachable; processes mapping them keep their open files
+    for entry in os.listdir(store_dir):
+        if entry != name and os.path.isdir(os.path.join(store_dir, entry)) and not entry.endswith('.tmp'):
+            shutil.rmtree(os.path.join(store_dir, entry), ignore_errors=True)
+    return directory
+
+
+@timed('load_catalog_store')
+def load_catalog_store(store_dir=CATALOG_STORE):
+    """
+    Loads the catalog write_catalog_store() published, memory-mapping its
+    columns and records. The catalog goes stale when the store's pointer or
+    the CSVs it was built from change.
+
+    Args:
+        store_dir (str): The store directory.
+
+    Returns:
+        UnitCatalog: The catalog.
+
+    Raises:
+        ValueError: If the store was written in another format, or its CSVs
+            have changed since it was built.
+    """
+    pointer_path = os.path.join(store_dir, STORE_POINTER)
+    # Take the signature before reading so a new version published during the load forces another load
+    signature = source_signature([pointer_path])
+    with open(pointer_path) as f:
+        pointer = json.load(f)
+    directory = os.path.join(store_dir, pointer['directory'])
+    with open(os.path.join(directory, 'catalog.json'), encoding='utf-8') as f:
+        metadata = json.load(f)
+    if pointer.get('format') != CATALOG_STORE_FORMAT or metadata.get('format') != CATALOG_STORE_FORMAT:
+        raise ValueError(f'{store_dir} is not in catalog store format {CATALOG_STORE_FORMAT}')
+    sources = metadata['sources']
+    signature += source_signature(sources)
+    # A touched but unchanged CSV still matches the store; only its contents count
+    if (signature[1:] != tuple(tuple(entry) for entry in metadata['source_signature'])
+            and source_content_hash(sources) != metadata['version']):
+        raise ValueError(f'{", ".join(sources)} changed since {store_dir} was built')
+
+    def load(file_name):
+        return np.load(os.path.join(directory, file_name), mmap_mode='r', allow_pickle=False)
+
+    columns = {column: load(entry['file']) for column, entry in metadata['columns'].items()}
+    for column, labels in metadata['labels'].items():
+        columns[column] = np.array(labels, dtype=object)
+    for level, column in enumerate(SKILL_PV_COLUMNS):
+        columns[column] = columns['SkillPV'][:, level]
+
+    with open(os.path.join(directory, 'records.bin'), 'rb') as f:
+        # mmap cannot map an empty file
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else b''
+    records = RecordStore(buffer, load('record_offsets.npy'))
+
+    era_rows = load('era_rows.npy')
+    eras = [(entry['column'], entry['start'], entry['end'],
+             {faction: era_rows[start:end] for faction, start, end in entry['factions']})
+            for entry in metadata['eras']]
+
+    postings, offsets = load('search_postings.npy'), load('search_offsets.npy')
+    search_index = SearchIndex(
+        metadata['search_texts'],
+        {gram: postings[offsets[i]:offsets[i + 1]] for i, gram in enumerate(metadata['search_grams'])},
+        load('search_sizes.npy'))
+    indexes = {column: index_from_keys(keys) for column, keys in metadata['index_keys'].items()}
+    return UnitCatalog([pointer_path] + sources, signature, metadata['version'], records, columns, eras,
+                       metadata['field_names'], indexes=indexes, search_index=search_index)
+
+
+class CatalogCache:
+    """
+    Holds the current UnitCatalog for the whole process. get() only stats the
+    source files; the catalog is rebuilt and swapped in when they change.
+
+    When the binary store exists it is loaded instead of the CSV sources, and
+    the catalog reloads when the data build publishes a new version of it or
+    the CSVs change. A store that no longer matches its CSVs, or that a
+    rebuild swaps out mid-load, is replaced by the CSVs until the build
+    publishes a store again.
+    Loading the store needs only NumPy.
+    """
+
+    def __init__(self, sources=(CATALOG_CSV,), store=CATALOG_STORE):
+        self.sources = tuple(sources)
+        self.store = store
+        self._lock = threading.Lock()
+        self._catalog = self._build('initial')
+
+    def get(self):
+        catalog = self._catalog
+        if not catalog.is_stale():
+            return catalog
+        with self._lock:
+            # Another thread may have rebuilt it while we waited for the lock
+            catalog = self._catalog
+            if catalog.is_stale():
+                catalog = self._build('reload')
+                self._catalog = catalog  # Rebinding the attribute is the atomic swap
+        return catalog
+
+    def _build(self, reason):
+        start = time.perf_counter()
+        pointer_signature = ()
+        if self.store and os.path.exists(os.path.join(self.store, STORE_POINTER)):
+            pointer_signature = source_signature([os.path.join(self.store, STORE_POINTER)])
+            try:
+                catalog = load_catalog_store(self.store)
+                CATALOG_LOAD.observe(time.perf_counter() - start, 'catalog_store', reason)
+                return catalog
+            except (ValueError, OSError) as e:
+                # OSError: a rebuild swapped or pruned the version being read
+                print(f"Warning: {e}; loading {', '.join(self.sources)} instead")
+        # Reading CSV needs pandas, so it is only imported when there is no usable store
+        from catalog_build import build_catalog
+        catalog = build_catalog(self.sources)
+        if pointer_signature:
+            # Also go stale when the build publishes a new store, so it replaces this catalog
+            catalog.sources = (pointer_signature[0][0],) + catalog.sources
+            catalog.signature = pointer_signature + catalog.signature
+        CATALOG_LOAD.observe(time.perf_counter() - start, 'catalog', reason)
+        return catalog
@@ -0,0 +1,228 @@
+import hashlib
+import io
+import os
+
+import numpy as np
+import pandas as pd
+
+from catalog import (BASE_SKILL, ERA_COLUMN_PATTERN, FLOAT_COLUMNS, SKILL_LEVELS, SKILL_PV_COLUMNS,
+                     UNAVAILABLE_FACTIONS, UnitCatalog, skill_cost_table, source_signature)
+from metrics import timed
+from unit_records import UnitTable
+
+
+# Everything that reads unit CSVs with pandas. Only the offline build tools
+# (unit_sources.py, convert_csv_to_js.py) and the app's CSV fallback import
+# this module; an app serving the binary store never loads pandas.
+
+
+def add_skill_pv_columns(df):
+    """
+    Adds a Skill0PV-Skill7PV column for every pilot skill. The MUL prices each
+    unit at its own RegSkill, so the skill 4 PV is the base whose table entry
+    at RegSkill is closest to RegPV. The MUL's RegPV and VetPV are kept as the
+    PVs at RegSkill and VetSkill.
+
+    Args:
+        df (DataFrame): Units with PV and RegPV columns; RegSkill defaults to 4
+            and VetSkill to one better than RegSkill.
+    """
+    reg_pv = pd.to_numeric(df['RegPV'], errors='coerce').to_numpy(dtype=float)
+    if 'RegSkill' in df.columns:
+        reg_skill = pd.to_numeric(df['RegSkill'], errors='coerce').fillna(BASE_SKILL)
+        reg_skill = reg_skill.clip(0, SKILL_LEVELS - 1).to_numpy(dtype=np.int64)
+    else:
+        reg_skill = np.full(len(df), BASE_SKILL)
+    priced = ~np.isnan(reg_pv)
+    skill_pv = np.full((len(df), SKILL_LEVELS), np.nan)
+    if priced.any():
+        # Invert the table once per distinct (RegSkill, RegPV) pair rather than per unit
+        candidates = np.arange(int(np.nanmax(reg_pv)) * 2 + 2)
+        table = skill_cost_table(candidates)
+        pairs, inverse = np.unique(np.column_stack([reg_skill[priced], reg_pv[priced]]), axis=0, return_inverse=True)
+        distance = np.abs(table[:, pairs[:, 0].astype(np.int64)] - pairs[:, 1])
+        skill_pv[priced] = table[np.argmin(distance, axis=0)][inverse.ravel()]
+    rows = np.arange(len(df))
+    skill_pv[rows, reg_skill] = reg_pv
+    if 'VetSkill' in df.columns and 'VetPV' in df.columns:
+        vet_skill = pd.to_numeric(df['VetSkill'], errors='coerce').to_numpy(dtype=float)
+        vet_pv = pd.to_numeric(df['VetPV'], errors='coerce').to_numpy(dtype=float)
+        known = ~np.isnan(vet_skill) & ~np.isnan(vet_pv) & (vet_skill >= 0) & (vet_skill < SKILL_LEVELS)
+        skill_pv[rows[known], vet_skill[known].astype(np.int64)] = vet_pv[known]
+    for level, column in enumerate(SKILL_PV_COLUMNS):
+        values = skill_pv[:, level]
+        df[column] = values if np.isnan(values).any() else values.astype(np.int64)
+
+
+def _whole_numbers(series):
+    # Filling a column's gaps makes it float; keep it integer when every value is whole
+    values = pd.to_numeric(series, errors='coerce')
+    if values.isna().any() or not (values % 1 == 0).all():
+        return values
+    return values.astype(np.int64)
+
+
+def prepare_unit_frame(df):
+    """
+    Fills in the PV columns of units read from any source.
+
+    Args:
+        df (DataFrame): The units; only PV is required.
+
+    Returns:
+        DataFrame: The same frame with RegPV, VetPV, RegSkill, VetSkill and a PV
+            column for every skill.
+    """
+    for column in ('PV', 'RegPV', 'VetPV', 'RegSkill', 'VetSkill'):
+        if column not in df.columns:
+            df[column] = np.nan
+    # Units without per-skill PVs (the Battle Armor list, for one) are priced at
+    # skill 4 (regular) and 3 (veteran)
+    unpriced = df['RegPV'].isna()
+    df['RegPV'] = _whole_numbers(df['RegPV'].fillna(df['PV']))
+    df['RegSkill'] = _whole_numbers(df['RegSkill'].mask(unpriced & df['RegSkill'].isna(), BASE_SKILL))
+    add_skill_pv_columns(df)
+    reg_skill = pd.to_numeric(df['RegSkill'], errors='coerce').fillna(BASE_SKILL).clip(1, SKILL_LEVELS - 1)
+    df['VetSkill'] = _whole_numbers(df['VetSkill'].fillna(reg_skill - 1))
+    vet_skill = pd.to_numeric(df['VetSkill'], errors='coerce').fillna(reg_skill - 1).to_numpy(dtype=np.int64)
+    skill_pv = df[SKILL_PV_COLUMNS].to_numpy(dtype=float)[np.arange(len(df)), vet_skill]
+    df['VetPV'] = _whole_numbers(df['VetPV'].fillna(pd.Series(skill_pv, index=df.index)))
+    return df
+
+
+def load_unit_frame(csv_file):
+    """
+    Reads a unit CSV file into a DataFrame.
+
+    Args:
+        csv_file: The path to the CSV file, or a file-like object with its contents.
+
+    Returns:
+        DataFrame: The units, with RegPV, VetPV and a PV column for every skill.
+    """
+    df = pd.read_csv(csv_file)
+    # A column with any empty cell is read as float; give its whole numbers back as
+    # ints so records serialize MULId 1060 rather than 1060.0
+    for column in df.columns[df.dtypes == float]:
+        values = df[column]
+        if (values.dropna() % 1 == 0).all():
+            df[column] = pd.Series([int(value) if value == value else value for value in values],
+                                   index=df.index, dtype=object)
+    return prepare_unit_frame(df)
+
+
+def build_columns(df):
+    """
+    Extracts the columns used for filtering into NumPy arrays so queries never
+    touch the DataFrame.
+
+    Args:
+        df (DataFrame): The loaded units.
+
+    Returns:
+        dict: Column name -> array with one entry per row.
+    """
+    columns = {}
+    for column in FLOAT_COLUMNS:
+        if column in df.columns:
+            columns[column] = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float)
+        else:
+            columns[column] = np.full(len(df), np.nan)
+    # Every skill's PV in one matrix, so pricing any mix of skills is one fancy index
+    columns['SkillPV'] = np.column_stack(
+        [pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float) if column in df.columns
+         else np.full(len(df), np.nan) for column in SKILL_PV_COLUMNS]).reshape(len(df), SKILL_LEVELS)
+    for level, column in enumerate(SKILL_PV_COLUMNS):
+        columns[column] = columns['SkillPV'][:, level]
+    reg_skill = pd.to_numeric(df['RegSkill'], errors='coerce') if 'RegSkill' in df.columns else pd.Series(np.nan, index=df.index)
+    vet_skill = pd.to_numeric(df['VetSkill'], errors='coerce') if 'VetSkill' in df.columns else pd.Series(np.nan, index=df.index)
+    reg_skill = reg_skill.fillna(BASE_SKILL)
+    columns['RegSkill'] = reg_skill.clip(0, SKILL_LEVELS - 1).to_numpy(dtype=np.int64)
+    columns['VetSkill'] = vet_skill.fillna(reg_skill - 1).clip(0, SKILL_LEVELS - 1).to_numpy(dtype=np.int64)
+    # Role likewise, as codes into its lower-cased labels, so filtering compares integers
+    roles = df['Role'].fillna('').astype(str).str.lower() if 'Role' in df.columns else pd.Series([''] * len(df))
+    codes, labels = pd.factorize(roles)
+    columns['RoleCode'] = codes.astype(np.int64)
+    columns['RoleLabels'] = np.array(list(labels), dtype=object)
+    # UnitType as integer codes so force composition can be counted with bincount
+    unit_types = df['UnitType'].fillna('') if 'UnitType' in df.columns else pd.Series([''] * len(df))
+    codes, labels = pd.factorize(unit_types.astype(str).str.lower())
+    first_spelling = unit_types.astype(str).groupby(codes).first() if len(codes) else []
+    columns['UnitTypeCode'] = codes.astype(np.int64)
+    columns['UnitTypeLabels'] = np.array(list(first_spelling), dtype=object)
+    return columns
+
+
+def build_era_index(df):
+    """
+    Builds an inverted index of faction availability for every era column.
+
+    Args:
+        df (DataFrame): The loaded units.
+
+    Returns:
+        list: One (column, start_year, end_year, {faction: row ids}) entry per era,
+            with faction names lower-cased. "Extinct" and "Unknown" are not indexed.
+    """
+    eras = []
+    for column in df.columns:
+        match = ERA_COLUMN_PATTERN.search(str(column))
+        if not match:
+            continue
+        factions = {}
+        for row_id, value in enumerate(df[column].tolist()):
+            if not isinstance(value, str):
+                continue
+            for faction in value.split(','):
+                faction = faction.strip().lower()
+                if faction not in UNAVAILABLE_FACTIONS:
+                    factions.setdefault(faction, []).append(row_id)
+        factions = {faction: np.array(row_ids, dtype=np.int64) for faction, row_ids in factions.items()}
+        eras.append((column, int(match.group(1)), int(match.group(2)), factions))
+    return eras
+
+
+def unit_table(df):
+    """
+    Stores the units column by column. Columns that fewer than half the units
+    fill (era availability, specials, extra weapons) keep only their values.
+
+    Args:
+        df (DataFrame): The loaded units.
+
+    Returns:
+        UnitTable: The units; each row reads like df.to_dict('records') would give it.
+    """
+    counts = df.notna().sum()
+    sparse = [column for column in df.columns if counts[column] * 2 < len(df)]
+    return UnitTable.from_columns({column: df[column].tolist() for column in df.columns}, sparse, fill=np.nan)
+
+
+@timed('build_catalog')
+def build_catalog(sources):
+    """
+    Loads every source CSV into a new UnitCatalog.
+
+    Args:
+        sources (list): The CSV files to load, in order.
+
+    Returns:
+        UnitCatalog: The freshly built catalog.
+    """
+    # Take the signature before reading so a write during the load forces another rebuild
+    signature = source_signature(sources)
+    # The version is a hash of the source contents, so touching a file without
+    # changing it rebuilds the catalog but keeps every ETag valid. It must match
+    # source_content_hash(), which checks a binary store against its CSVs.
+    content_hash = hashlib.sha256()
+    frames = []
+    for csv_file in sources:
+        if not os.path.exists(csv_file):
+            continue
+        with open(csv_file, 'rb') as f:
+            raw = f.read()
+        content_hash.update(csv_file.encode('utf-8') + b'\0' + raw)
+        frames.append(load_unit_frame(io.BytesIO(raw)))
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    return UnitCatalog(sources, signature, content_hash.hexdigest(), unit_table(df),
+                       build_columns(df), build_era_index(df), [str(column) for column in df.columns])
@@ -1,47 +1,237 @@
 import pandas as pd
+import argparse
+import hashlib
 import json
 import os
 
-def convert_csv_to_js():
-    # List of CSV files to process
-    csv_files = ['MULOutput - Vehicles.csv', 'MULOutput - Protomechs.csv']
-    all_units = []
-    
-    for csv_file in csv_files:
-        if not os.path.exists(csv_file):
-            print(f"Warning: {csv_file} not found!")
+from assets import BUILD_MANIFEST, load_asset_manifest, prune_assets, rewrite_script_tags, write_asset, write_build_manifest
+from cards import hash_file
+from catalog import CATALOG_CSV, CATALOG_STORE, PV_COLUMNS, STORE_POINTER
+from catalog_build import load_unit_frame, unit_table
+from parser import strip_accents
+from search_index import build_search_index
+from unit_sources import UNIT_SOURCES, UNIT_TYPE_KEYS, write_unit_catalog
+
+
+JS_DIR = 'js'
+SHARD_DIR = 'units'
+MANIFEST_JS = 'units_manifest.js'
+SCRIPT_JS = 'script.js'
+INDEX_HTML = 'index.html'
+# The files templates/index.html (the page app.py serves) loads from Flask's static folder
+STATIC_DIR = 'static'
+STATIC_ASSETS = ['script.js', 'style.css']
+DEFAULT_UNIT_TYPE = 'vehicle'
+# Input hashes and outputs of the last build, so unchanged steps are skipped
+BUILD_STATE = '.build_state.json'
+# A change to any of these rebuilds everything
+BUILD_CODE = ['convert_csv_to_js.py', 'unit_sources.py', 'catalog.py', 'catalog_build.py', 'search_index.py', 'assets.py',
+              'unit_records.py', 'parser.py']
+
+
+def shard_units(all_units):
+    """
+    Splits the units by the unit type select value in index.html. Units of a
+    type the page cannot show are left out.
+
+    Args:
+        all_units (list): The unit dictionaries, in catalog order.
+
+    Returns:
+        dict: Unit type select value -> list of its units, in catalog order.
+    """
+    shards = {}
+    for unit in all_units:
+        key = UNIT_TYPE_KEYS.get(str(unit.get('UnitType', '')).lower())
+        if key:
+            shards.setdefault(key, []).append(unit)
+    return shards
+
+
+def build_unit_index(units):
+    """
+    Presorts the positions of one shard's units so the front end never filters
+    or sorts them: byName is the dropdown order, and each PV column (RegPV,
+    VetPV, Skill0PV-Skill7PV) lists positions ascending by cost so "what still
+    fits" is a binary search.
+
+    Args:
+        units (list): The shard's unit dictionaries.
+
+    Returns:
+        dict: {"byName": [...], "RegPV": [...], "VetPV": [...], ...}.
+    """
+    positions = range(len(units))
+    unit_index = {'byName': sorted(positions, key=lambda p: strip_accents(units[p].get('Name', '')).lower())}
+    for column in PV_COLUMNS:
+        priced = [p for p in positions if pd.notna(units[p].get(column))]
+        unit_index[column] = sorted(priced, key=lambda p: units[p][column])
+    return unit_index
+
+
+def pack_unit_columns(all_units):
+    """
+    Packs the units column by column for a shard file; decodeUnitColumns() in
+    js/script.js rebuilds the unit objects. Columns with no values are dropped,
+    columns mostly empty list only the rows that have a value, and strings that
+    repeat (Role, Type, UnitType, ImageURL, ...) are stored once in a dictionary
+    with each row holding its index.
+
+    Args:
+        all_units (list): The unit dictionaries, in shard order.
+
+    Returns:
+        dict: {"length": unit count, "columns": {column: {"values": [...], "rows": [...], "dict": [...]}}},
+            where "rows" and "dict" are present only when used.
+    """
+    columns = {}
+    for column in (all_units[0].keys() if all_units else []):
+        values = [unit.get(column) for unit in all_units]
+        rows = [row for row, value in enumerate(values) if pd.notna(value)]
+        if not rows:
             continue
-        
-        # Read the CSV data
-        df = pd.read_csv(csv_file)
-        
-        # Add regular and veteran PV columns if they don't exist
-        if 'RegPV' not in df.columns:
-            df['RegPV'] = df['PV']
-        if 'VetPV' not in df.columns:
-            df['VetPV'] = df['PV'] * 1.5  # Assuming veteran costs 50% more
-        
-        # Ensure UnitType is preserved and at the start of each record
-        df = df[['UnitType'] + [col for col in df.columns if col != 'UnitType']]  # Move UnitType to first column
-        df['UnitType'] = df['UnitType'].fillna('Vehicle' if 'Vehicles' in csv_file else 'Protomech')  # Fill any NaN values
-        
-        # Convert to list of dictionaries and add to all units
-        units = df.to_dict('records')
-        all_units.extend(units)
+        packed = {}
+        if len(rows) * 2 < len(values):
+            packed['rows'] = rows
+            values = [values[row] for row in rows]
+        else:
+            # NaN is not valid JSON
+            values = [value if pd.notna(value) else None for value in values]
+        present = [value for value in values if value is not None]
+        distinct = list(dict.fromkeys(present))
+        if all(isinstance(value, str) for value in distinct) and len(distinct) * 2 <= len(present):
+            codes = {value: code for code, value in enumerate(distinct)}
+            packed['dict'] = distinct
+            values = [codes.get(value) for value in values]
+        packed['values'] = values
+        columns[column] = packed
+    return {'length': len(all_units), 'columns': columns}
+
+
+def to_js(value):
+    return json.dumps(value, separators=(',', ':'), allow_nan=False)
+
+
+def file_digest(path):
+    return hash_file(path) if os.path.exists(path) else None
+
+
+def load_build_state(path=BUILD_STATE):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_build_state(state, path=BUILD_STATE):
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def build_shard(unit_type, units):
+    """
+    Builds one unit type's shard script: the type's units, its presorted index
+    and the same trigram index the Flask app's /search uses, all keyed by
+    position within the shard.
+
+    Returns:
+        bytes: The script.
+    """
+    shard = {
+        'columns': pack_unit_columns(units),
+        'index': build_unit_index(units),
+        'search': build_search_index(units).to_json(),
+    }
+    return f"// Auto-generated {unit_type} units\nregisterUnitShard({to_js(unit_type)}, {to_js(shard)});\n".encode('utf-8')
+
+
+def convert_csv_to_js(force=False):
+    """
+    Builds units_catalog.csv, its binary copy and the static site's files,
+    redoing only the steps whose inputs changed since the last run. BUILD_STATE
+    records the hash of every input (the source CSVs, each shard's units,
+    js/script.js and the build code itself) and the outputs built from them.
+
+    Args:
+        force (bool): Ignore the recorded state and rebuild everything.
+
+    Returns:
+        dict: The new build state.
+    """
+    state = {} if force else load_build_state()
+    builder = {path: file_digest(path) for path in BUILD_CODE}
+    if state.get('builder') != builder:
+        state = {}  # The build itself changed, so nothing it made before can be trusted
+    sources = {source['path']: file_digest(source['path']) for source in UNIT_SOURCES}
+    new_state = {'builder': builder, 'sources': sources}
+    
+    # Merge every source into the catalog file app.py loads, then export that same file
+    if (state.get('sources') == sources and state.get('catalog') == file_digest(CATALOG_CSV)
+            and os.path.exists(os.path.join(CATALOG_STORE, STORE_POINTER))):
+        print(f"{CATALOG_CSV} is up to date")
+    else:
+        write_unit_catalog()
+    new_state['catalog'] = file_digest(CATALOG_CSV)
     
-    # Create JavaScript file content
-    js_content = f"// Auto-generated from multiple CSV files\n"
-    js_content += "const unitData = " + json.dumps(all_units, indent=2) + ";\n"
+    # Every file the page loads is published under a content-hashed name (see
+    # assets.py), so it can be cached forever; build_manifest.json maps each
+    # logical name to the current file.
+    def published(entry):
+        return entry is not None and os.path.exists(os.path.join(JS_DIR, entry['file']))
     
-    # Write to JavaScript file
-    with open('js/units.js', 'w') as f:
-        f.write(js_content)
+    shards = state.get('shards', {})
+    if state.get('catalog') != new_state['catalog'] or not all(published(entry) for entry in shards.values()):
+        # One script per unit type, loaded by the page only when that type is
+        # selected. Only types whose units changed are rebuilt.
+        all_units = unit_table(load_unit_frame(CATALOG_CSV))
+        previous, shards = shards, {}
+        for unit_type, units in shard_units(all_units).items():
+            digest = hashlib.sha256(json.dumps([dict(unit) for unit in units], sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+            entry = previous.get(unit_type)
+            if published(entry) and entry['digest'] == digest:
+                shards[unit_type] = entry
+                continue
+            name = f'{SHARD_DIR}/{unit_type}.js'
+            shards[unit_type] = {'digest': digest, 'file': write_asset(name, build_shard(unit_type, units), JS_DIR),
+                                 'units': len(units)}
+            print(f"Wrote {len(units)} {unit_type} units to {JS_DIR}/{shards[unit_type]['file']}")
+    new_state['shards'] = shards
     
-    print(f"Successfully converted CSV files to js/units.js")
+    # The manifest and script.js are all index.html loads up front; both are
+    # cheap, and write_asset() skips files already published
+    manifest = {'default': DEFAULT_UNIT_TYPE,
+                'shards': {unit_type: {'file': entry['file'], 'units': entry['units']} for unit_type, entry in shards.items()}}
+    assets = {f'{SHARD_DIR}/{unit_type}.js': entry['file'] for unit_type, entry in shards.items()}
+    content = f"// Auto-generated list of unit shards\nconst unitManifest = {to_js(manifest)};\n"
+    assets[MANIFEST_JS] = write_asset(MANIFEST_JS, content.encode('utf-8'), JS_DIR)
+    with open(os.path.join(JS_DIR, SCRIPT_JS), 'rb') as f:
+        assets[SCRIPT_JS] = write_asset(SCRIPT_JS, f.read(), JS_DIR)
+    
+    if assets != load_asset_manifest(JS_DIR).assets:
+        write_build_manifest(assets, JS_DIR)
+    rewrite_script_tags(INDEX_HTML, assets, JS_DIR)
+    for path in prune_assets(assets, JS_DIR):
+        print(f"Removed {path} from an earlier build")
 
-if __name__ == "__main__":
-    # Create js directory if it doesn't exist
-    if not os.path.exists('js'):
-        os.makedirs('js')
+    # The Flask page's own files, which the template links through STATIC_DIR's manifest
+    static_assets = {}
+    for name in STATIC_ASSETS:
+        with open(os.path.join(STATIC_DIR, name), 'rb') as f:
+            static_assets[name] = write_asset(name, f.read(), STATIC_DIR)
+    if static_assets != load_asset_manifest(STATIC_DIR).assets:
+        write_build_manifest(static_assets, STATIC_DIR)
+    for path in prune_assets(static_assets, STATIC_DIR):
+        print(f"Removed {path} from an earlier build")
     
-    convert_csv_to_js() 
\ No newline at end of file
+    save_build_state(new_state)
+    print(f"The assets listed in {JS_DIR}/{BUILD_MANIFEST} and {STATIC_DIR}/{BUILD_MANIFEST} are up to date")
+    return new_state
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Build units_catalog.csv and the static site from the unit CSVs.')
+    parser.add_argument('--force', action='store_true', help='Rebuild everything, even if no input changed')
+    args = parser.parse_args()
+    convert_csv_to_js(force=args.force) 
\ No newline at end of file
@@ -0,0 +1,132 @@
+import math
+
+import numpy as np
+
+from catalog import parse_skill
+from metrics import timed
+
+
+DEFAULT_MAX_POINTS = 32
+MAX_FORCES_PER_REQUEST = 10000
+MAX_UNITS_PER_REQUEST = 200000
+
+
+def _max_points(value):
+    # bool is an int subclass, but true is no cap
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError('max_points must be a number')
+    return value
+
+
+def _number(value):
+    # PV columns are floats because of missing values; report whole numbers as ints
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+# Skill codes for the units of a batch: a pilot skill level 0-7, or one of these
+REGULAR = -1
+VETERAN = -2
+
+
+def unit_skill_code(unit):
+    """
+    Reads the skill of one force entry.
+
+    Args:
+        unit (dict): A force entry with "skill" ("regular", "veteran" or 0-7) or "isVeteran".
+
+    Returns:
+        int: The skill level, REGULAR or VETERAN.
+
+    Raises:
+        ValueError: If the skill is not recognized.
+    """
+    skill = unit.get('skill')
+    if skill is None:
+        return VETERAN if unit.get('isVeteran') else REGULAR
+    skill = parse_skill(skill)
+    if skill == 'regular':
+        return REGULAR
+    if skill == 'veteran':
+        return VETERAN
+    return skill
+
+
+@timed('evaluate_forces')
+def evaluate_forces(catalog, forces, default_max_points=DEFAULT_MAX_POINTS):
+    """
+    Prices and validates many forces at once. Unit ids are resolved through the
+    catalog's hash indexes; PV lookup, totals and composition counts are array
+    operations over every unit of every force together.
+
+    Args:
+        catalog (UnitCatalog): The catalog to price against.
+        forces (list): Forces as {"units": [{"id": ..., "skill": ...}], "max_points": int}.
+        default_max_points (int): The cap for forces that don't give one.
+
+    Returns:
+        list: One result per force with total, per-unit PV, validity and composition.
+
+    Raises:
+        ValueError: If the request is malformed or too large.
+    """
+    if len(forces) > MAX_FORCES_PER_REQUEST:
+        raise ValueError(f'At most {MAX_FORCES_PER_REQUEST} forces can be evaluated at once')
+    for force in forces:
+        if not isinstance(force, dict) or not isinstance(force.get('units'), list):
+            raise ValueError('Each force must have a units list')
+    # Checked before any id is resolved, so an oversized request costs nothing
+    if sum(len(force['units']) for force in forces) > MAX_UNITS_PER_REQUEST:
+        raise ValueError(f'At most {MAX_UNITS_PER_REQUEST} units can be evaluated at once')
+    force_ids, row_ids, skills, max_points, unknown, known = [], [], [], [], [], []
+    for force_id, force in enumerate(forces):
+        max_points.append(_max_points(force.get('max_points', default_max_points)))
+        unknown.append([])
+        known.append([])
+        for unit in force['units']:
+            if not isinstance(unit, dict):
+                raise ValueError('Each unit must be an object with an id')
+            key = str(unit.get('id', unit.get('FullName', '')))
+            row_id = catalog.find_row(key)
+            known[force_id].append(row_id is not None)
+            if row_id is None:
+                unknown[force_id].append(key)
+                continue
+            force_ids.append(force_id)
+            row_ids.append(row_id)
+            skills.append(unit_skill_code(unit))
+    max_points = np.array(max_points, dtype=float)
+
+    force_ids = np.array(force_ids, dtype=np.int64)
+    row_ids = np.array(row_ids, dtype=np.int64)
+    # Regular and veteran mean each unit's own RegSkill and VetSkill, whose PVs
+    # are the MUL's RegPV and VetPV; then every unit is priced from SkillPV at once
+    skills = np.array(skills, dtype=np.int64)
+    skills = np.where(skills == REGULAR, catalog.columns['RegSkill'][row_ids], skills)
+    skills = np.where(skills == VETERAN, catalog.columns['VetSkill'][row_ids], skills)
+    pv = catalog.columns['SkillPV'][row_ids, skills]
+    totals = np.bincount(force_ids, weights=pv, minlength=len(forces))
+    type_labels = catalog.columns['UnitTypeLabels']
+    type_counts = np.zeros((len(forces), len(type_labels)), dtype=np.int64)
+    np.add.at(type_counts, (force_ids, catalog.columns['UnitTypeCode'][row_ids]), 1)
+    # Units are grouped by force in input order, so each force's PVs are one slice
+    bounds = np.searchsorted(force_ids, np.arange(len(forces) + 1))
+
+    results = []
+    for force_id in range(len(forces)):
+        total = _number(totals[force_id])
+        cap = _number(max_points[force_id])
+        # Unknown units keep their place in the request order as null
+        force_pv = iter(pv[bounds[force_id]:bounds[force_id + 1]])
+        results.append({
+            'total': total,
+            'unit_pv': [_number(next(force_pv)) if is_known else None for is_known in known[force_id]],
+            'max_points': cap,
+            'valid': total <= cap and not unknown[force_id],
+            'over_by': _number(max(total - cap, 0)),
+            'composition': {type_labels[code]: count.item()
+                            for code, count in enumerate(type_counts[force_id]) if count},
+            'unknown_units': unknown[force_id],
+        })
+    return results
@@ -0,0 +1,33 @@
+import gc
+import multiprocessing
+import os
+
+# Run with: gunicorn -c gunicorn.conf.py
+wsgi_app = 'app:create_app()'
+bind = os.environ.get('BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+
+# Load the app (catalog, card manifest and the /get_units body) once in the
+# master. Workers are forked from it, so they boot instantly and share that
+# memory copy-on-write instead of each loading pandas and the CSV.
+preload_app = True
+
+# A collection in the master would touch every object header and leave little
+# of the preloaded heap shared, so collect only after the app is loaded.
+gc.disable()
+
+
+def when_ready(server):
+    # Everything allocated while loading the app is long-lived; move it to the
+    # permanent generation so no worker's collector ever writes to those pages
+    gc.collect()
+    gc.freeze()
+
+
+def pre_fork(server, worker):
+    # Also covers objects the master allocated since the last fork
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    gc.enable()
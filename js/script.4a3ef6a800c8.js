@@ -0,0 +1,556 @@
+// Global variables
+let currentForce = [];
+let currentScale = 1;
+let maxPoints = 32;
+let unitShards = {};
+let pendingShards = {};
+let unitsByFullName = new Map();
+
+// DOM Elements
+let unitTypeSelect;
+let unitSelect;
+let skillSelect;
+let addUnitButton;
+let forceList;
+let forceListItems;
+let previewCard;
+let cardPreview;
+let totalPointsBadge;
+let totalPointsSpan;
+let deleteForceButton;
+let printForceButton;
+let maxPointsInput;
+let fitsOnlyCheckbox;
+let unitSearchInput;
+
+// Initialize
+function init() {
+    // Get DOM elements
+    unitTypeSelect = document.getElementById('unitType');
+    unitSelect = document.getElementById('unitSelect');
+    skillSelect = document.getElementById('skillLevel');
+    addUnitButton = document.getElementById('addUnit');
+    forceList = document.getElementById('forceList');
+    forceListItems = document.getElementById('forceListItems');
+    previewCard = document.getElementById('previewCard');
+    cardPreview = document.getElementById('cardPreview');
+    totalPointsBadge = document.getElementById('totalPointsBadge');
+    totalPointsSpan = document.getElementById('totalPoints');
+    deleteForceButton = document.getElementById('deleteForce');
+    printForceButton = document.getElementById('printForce');
+    maxPointsInput = document.getElementById('maxPoints');
+    fitsOnlyCheckbox = document.getElementById('fitsOnly');
+    unitSearchInput = document.getElementById('unitSearch');
+
+    // Add event listeners
+    unitTypeSelect.addEventListener('change', updateUnitList);
+    unitSelect.addEventListener('change', updateCardPreview);
+    addUnitButton.addEventListener('click', addUnitToForce);
+    deleteForceButton.addEventListener('click', deleteForce);
+    printForceButton.addEventListener('click', printForce);
+    maxPointsInput.addEventListener('change', updateMaxPoints);
+    fitsOnlyCheckbox.addEventListener('change', updateUnitList);
+    unitSearchInput.addEventListener('input', updateUnitList);
+    skillSelect.addEventListener('change', updateUnitList);
+
+    // Scale buttons
+    document.getElementById('scale1').addEventListener('click', () => setScale(1));
+    document.getElementById('scale2').addEventListener('click', () => setScale(2));
+    document.getElementById('scale3').addEventListener('click', () => setScale(3));
+
+    // Set initial unit type to vehicle and load units
+    unitTypeSelect.value = unitManifest.default;
+    updateUnitList();
+    
+    // Select the first unit in the list once its shard has loaded
+    loadUnitShard(unitManifest.default).then(() => {
+        updateUnitList();
+        if (unitSelect.options.length > 1) { // Check if there are units available
+            unitSelect.selectedIndex = 1; // Select the first unit (index 0 is the placeholder)
+            updateCardPreview(); // Update the card preview
+        }
+    }).catch(error => console.error(error));
+    
+    // Update total points
+    updateTotalPoints();
+}
+
+// Called by each js/units/<type>.js as it loads
+function registerUnitShard(type, shard) {
+    const units = decodeUnitColumns(shard.columns);
+    // Index units by FullName once so selections don't scan the whole list
+    units.forEach(unit => unitsByFullName.set(unit.FullName, unit));
+    unitShards[type] = { units, index: shard.index, search: shard.search };
+}
+
+// Load a unit type's shard once. A script tag rather than fetch() keeps
+// index.html working when opened straight from disk.
+function loadUnitShard(type) {
+    const entry = unitManifest.shards[type];
+    if (unitShards[type] || !entry) {
+        return Promise.resolve(unitShards[type]);
+    }
+    if (!pendingShards[type]) {
+        pendingShards[type] = new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = `js/${entry.file}`;
+            script.onload = () => resolve(unitShards[type]);
+            script.onerror = () => {
+                delete pendingShards[type];
+                script.remove();
+                reject(new Error(`Failed to load ${script.src}`));
+            };
+            document.head.appendChild(script);
+        });
+    }
+    return pendingShards[type];
+}
+
+// Rebuild the unit objects from the column layout convert_csv_to_js.py writes.
+// Rows listed in a sparse column's "rows", or null in a dense one, have no value
+// and get no key; dictionary columns hold indexes into "dict".
+function decodeUnitColumns(packed) {
+    const units = Array.from({ length: packed.length }, () => ({}));
+    Object.entries(packed.columns).forEach(([name, column]) => {
+        column.values.forEach((value, i) => {
+            if (value === null) return;
+            units[column.rows ? column.rows[i] : i][name] = column.dict ? column.dict[value] : value;
+        });
+    });
+    return units;
+}
+
+// Count the units in a PV-sorted position list costing at most maxPV
+function countWithinPV(units, positions, column, maxPV) {
+    let low = 0;
+    let high = positions.length;
+    while (low < high) {
+        const mid = (low + high) >> 1;
+        if (units[positions[mid]][column] <= maxPV) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return low;
+}
+
+// PV column for a skill: each unit's own regular or veteran PV, or pilot skill 0-7.
+// convert_csv_to_js.py precomputes every column, so pricing is a single lookup.
+function skillPVColumn(skill) {
+    if (skill === 'regular') return 'RegPV';
+    if (skill === 'veteran') return 'VetPV';
+    return `Skill${skill}PV`;
+}
+
+function skillLabel(skill) {
+    if (skill === 'regular') return 'Regular';
+    if (skill === 'veteran') return 'Veteran';
+    return `Skill ${skill}`;
+}
+
+// Units of a shard that fit the remaining points, most expensive first
+function unitsThatFit(shard, remainingPoints, skill) {
+    const column = skillPVColumn(skill);
+    const positions = shard.index[column] || [];
+    return positions.slice(0, countWithinPV(shard.units, positions, column, remainingPoints)).reverse();
+}
+
+// Fold text the same way search_index.py does: no accents, lower case, no punctuation
+function foldText(text) {
+    return text.normalize('NFD').replace(/[\u0300-\u036f]/g, '').toLowerCase()
+        .replace(/[^a-z0-9]+/g, ' ').trim();
+}
+
+// Padded word trigrams, matching search_index.py
+function textTrigrams(folded) {
+    const grams = new Set();
+    folded.split(' ').filter(word => word).forEach(word => {
+        const padded = `  ${word} `;
+        for (let i = 0; i < padded.length - 2; i++) {
+            grams.add(padded.slice(i, i + 3));
+        }
+    });
+    return grams;
+}
+
+// Rank a shard's unit positions against a query using its prebuilt trigram index
+function searchUnits(searchIndex, query, allowedPositions, limit = 50) {
+    const folded = foldText(query);
+    const grams = textTrigrams(folded);
+    const allowed = new Set(allowedPositions);
+    const shared = new Map();
+    grams.forEach(gram => {
+        (searchIndex.postings[gram] || []).forEach(position => {
+            if (allowed.has(position)) {
+                shared.set(position, (shared.get(position) || 0) + 1);
+            }
+        });
+    });
+    const scored = [];
+    shared.forEach((count, position) => {
+        let score = count / (grams.size + searchIndex.sizes[position] - count);
+        if (count === grams.size && searchIndex.texts[position].includes(folded)) {
+            score += 1;
+        }
+        scored.push([position, score]);
+    });
+    scored.sort((a, b) => b[1] - a[1] || a[0] - b[0]);
+    return scored.slice(0, limit).map(([position]) => position);
+}
+
+// Update unit list based on selected type
+function updateUnitList() {
+    const selectedType = unitTypeSelect.value;
+    const previousSelection = unitSelect.value;
+    const shard = unitShards[selectedType];
+    if (!shard && unitManifest.shards[selectedType]) {
+        // Fetch the type's shard, then list it if the type is still selected
+        unitSelect.innerHTML = '<option value="">Loading units...</option>';
+        cardPreview.style.display = 'none';
+        previewCard.src = '';
+        loadUnitShard(selectedType).then(() => {
+            if (unitTypeSelect.value === selectedType) updateUnitList();
+        }).catch(error => console.error(error));
+        return;
+    }
+    unitSelect.innerHTML = '<option value="">Choose a unit...</option>';
+    
+    // The shard's index holds its units presorted by name and by PV, so
+    // nothing is filtered or sorted here
+    let positions = shard ? shard.index.byName : [];
+    if (shard && fitsOnlyCheckbox.checked) {
+        positions = unitsThatFit(shard, maxPoints - currentTotalPoints(), skillSelect.value);
+    }
+    if (shard && unitSearchInput.value.trim()) {
+        positions = searchUnits(shard.search, unitSearchInput.value, positions);
+    }
+    
+    const skill = skillSelect.value;
+    positions.forEach(position => {
+        const unit = shard.units[position];
+        const option = document.createElement('option');
+        option.value = unit.FullName;
+        option.textContent = skill === 'regular' || skill === 'veteran'
+            ? `${unit.Name} (PV: ${unit.RegPV}/${unit.VetPV})`
+            : `${unit.Name} (PV: ${unit[skillPVColumn(skill)]})`;
+        unitSelect.appendChild(option);
+    });
+    
+    // Keep the current selection when it is still listed
+    unitSelect.value = previousSelection;
+    if (unitSelect.value !== previousSelection || !previousSelection) {
+        unitSelect.value = '';
+        cardPreview.style.display = 'none';
+        previewCard.src = '';
+    }
+}
+
+// Update card preview
+function updateCardPreview() {
+    const selectedUnit = unitSelect.value;
+    if (selectedUnit) {
+        const unitType = unitTypeSelect.value;
+        const unit = unitsByFullName.get(selectedUnit);
+        if (unit) {
+            const cardPath = `Cards/${unit.FullName.replace(/\//g, '-')}.gif`;
+            previewCard.src = cardPath;
+            cardPreview.style.display = 'block';
+        }
+    } else {
+        cardPreview.style.display = 'none';
+        previewCard.src = '';
+    }
+}
+
+// Add unit to force
+function addUnitToForce() {
+    const selectedUnit = unitSelect.value;
+    if (!selectedUnit) return;
+    
+    const unitType = unitTypeSelect.value;
+    const unit = unitsByFullName.get(selectedUnit);
+    if (!unit) return;
+    
+    const skill = skillSelect.value;
+    const pv = unit[skillPVColumn(skill)];
+    
+    const forceUnit = {
+        ...unit,
+        PV: pv,
+        skill,
+        skillLabel: skillLabel(skill),
+        isVeteran: skill === 'veteran'
+    };
+    
+    currentForce.push(forceUnit);
+    updateForceList();
+    updateTotalPoints();
+    
+    // Keep the unit selected and preview visible
+    // Don't reset the selection
+}
+
+// Update force list display
+function updateForceList() {
+    // Clear the force list and force list items
+    forceList.innerHTML = '';
+    forceListItems.innerHTML = '';
+    
+    // Update the card display
+    currentForce.forEach((unit, index) => {
+        const cardDiv = document.createElement('div');
+        cardDiv.className = 'unit-card';
+        
+        const img = document.createElement('img');
+        img.src = `Cards/${unit.FullName.replace(/\//g, '-')}.gif`;
+        img.alt = unit.FullName;
+        
+        cardDiv.appendChild(img);
+        forceList.appendChild(cardDiv);
+    });
+    
+    // Update the force list items
+    currentForce.forEach((unit, index) => {
+        const listItem = document.createElement('li');
+        listItem.className = 'list-group-item d-flex justify-content-between align-items-center';
+        
+        const unitInfo = document.createElement('div');
+        unitInfo.innerHTML = `
+            <strong>${unit.Name}</strong>
+            <span class="badge ${unit.skill === 'regular' ? 'bg-info' : 'bg-warning'} ms-2">${unit.skillLabel}</span>
+            <span class="badge bg-primary ms-2">${unit.PV} PV</span>
+        `;
+        
+        const removeButton = document.createElement('button');
+        removeButton.className = 'btn btn-danger btn-sm';
+        removeButton.innerHTML = '&times;';
+        removeButton.onclick = () => removeUnit(index);
+        
+        listItem.appendChild(unitInfo);
+        listItem.appendChild(removeButton);
+        forceListItems.appendChild(listItem);
+    });
+}
+
+// Remove unit from force
+function removeUnit(index) {
+    currentForce.splice(index, 1);
+    updateForceList();
+    updateTotalPoints();
+}
+
+// Sum the points of the current force
+function currentTotalPoints() {
+    return currentForce.reduce((sum, unit) => sum + unit.PV, 0);
+}
+
+// Update total points
+function updateTotalPoints() {
+    const total = currentTotalPoints();
+    totalPointsSpan.textContent = total;
+    
+    // Update badge color and text based on points
+    if (total > maxPoints) {
+        totalPointsBadge.classList.remove('bg-primary');
+        totalPointsBadge.classList.add('bg-danger');
+        totalPointsBadge.textContent = `Total Points Exceeded! (${total - maxPoints} over limit)`;
+    } else {
+        totalPointsBadge.classList.remove('bg-danger');
+        totalPointsBadge.classList.add('bg-primary');
+        totalPointsBadge.textContent = `Total Points: ${total}`;
+    }
+    
+    // The remaining budget changed, so refresh the "fits" list
+    if (fitsOnlyCheckbox && fitsOnlyCheckbox.checked) {
+        updateUnitList();
+    }
+}
+
+// Set scale
+function setScale(scale) {
+    currentScale = scale;
+    document.querySelectorAll('.unit-card').forEach(card => {
+        card.style.transform = `scale(${scale})`;
+    });
+}
+
+// Update max points
+function updateMaxPoints() {
+    maxPoints = parseInt(maxPointsInput.value) || 32;
+    updateTotalPoints();
+}
+
+// Delete force
+function deleteForce() {
+    if (confirm('Are you sure you want to delete the entire force?')) {
+        currentForce = [];
+        updateForceList();
+        updateTotalPoints();
+    }
+}
+
+// Print force
+function printForce() {
+    // Create a new window
+    const printWindow = window.open('', '_blank');
+    if (!printWindow) {
+        alert('Please allow popups for this site to print your force.');
+        return;
+    }
+
+    // Create the print page HTML
+    const printContent = `
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>BattleTech Force - Print View</title>
+            <style>
+                @page {
+                    margin: 0;
+                    padding: 0;
+                }
+                body {
+                    margin: 0;
+                    padding: 0;
+                    background: white;
+                }
+                .card-container {
+                    position: relative;
+                    width: 10.5in;
+                    height: 7.5in;
+                    margin: 0;
+                    padding: 0;
+                }
+                .unit-card {
+                    position: absolute;
+                    width: 3.5in;
+                    height: 2.5in;
+                    border: 1px solid #ccc;
+                    padding: 0;
+                    margin: 0;
+                    text-align: center;
+                    transform: rotate(90deg);
+                    transform-origin: top left;
+                }
+                .unit-card img {
+                    width: 100%;
+                    height: 100%;
+                    object-fit: contain;
+                }
+                .force-list {
+                    padding: 0.5in;
+                    page-break-before: always;
+                }
+                .force-list h3 {
+                    margin-bottom: 0.5in;
+                }
+                .force-list ul {
+                    list-style: none;
+                    padding: 0;
+                    margin: 0;
+                }
+                .force-list li {
+                    margin-bottom: 0.2in;
+                    display: flex;
+                    justify-content: space-between;
+                    align-items: center;
+                }
+                .force-list .badge {
+                    margin-left: 0.2in;
+                }
+            </style>
+        </head>
+        <body>
+            <div class="card-container" id="cardContainer"></div>
+            <div class="force-list">
+                <h3>Force List</h3>
+                <ul id="forceListItems"></ul>
+            </div>
+            <script>
+                // Function to create and load images
+                function loadImages() {
+                    const container = document.getElementById('cardContainer');
+                    const forceListItems = document.getElementById('forceListItems');
+                    const units = ${JSON.stringify(currentForce)};
+                    
+                    // Create cards in a 3x3 grid
+                    units.forEach((unit, index) => {
+                        const row = Math.floor(index / 3);
+                        const col = index % 3;
+                        
+                        const cardDiv = document.createElement('div');
+                        cardDiv.className = 'unit-card';
+                        cardDiv.style.left = (col * 3.5) + 'in';
+                        cardDiv.style.top = (row * 2.5) + 'in';
+                        
+                        const img = document.createElement('img');
+                        img.src = 'Cards/' + unit.FullName.replace(/\\//g, '-') + '.gif';
+                        img.alt = unit.FullName;
+                        
+                        cardDiv.appendChild(img);
+                        container.appendChild(cardDiv);
+                    });
+                    
+                    // Create force list
+                    units.forEach(unit => {
+                        const listItem = document.createElement('li');
+                        listItem.innerHTML = \`
+                            <div>
+                                <strong>\${unit.Name}</strong>
+                                <span class="badge \${unit.skill === 'regular' ? 'bg-info' : 'bg-warning'}">\${unit.skillLabel}</span>
+                                <span class="badge bg-primary">\${unit.PV} PV</span>
+                            </div>
+                        \`;
+                        forceListItems.appendChild(listItem);
+                    });
+                    
+                    // Wait for all images to load
+                    const images = document.querySelectorAll('#cardContainer .unit-card img');
+                    let loadedImages = 0;
+                    
+                    function checkAllLoaded() {
+                        loadedImages++;
+                        if (loadedImages === images.length) {
+                            // All images loaded, print after a short delay
+                            setTimeout(() => {
+                                window.print();
+                                // Close the window after printing
+                                setTimeout(() => window.close(), 1000);
+                            }, 500);
+                        }
+                    }
+                    
+                    images.forEach(img => {
+                        if (img.complete) {
+                            checkAllLoaded();
+                        } else {
+                            img.onload = checkAllLoaded;
+                            img.onerror = () => {
+                                console.error('Failed to load image: ' + img.src);
+                                checkAllLoaded();
+                            };
+                        }
+                    });
+                    
+                    // Fallback in case some images don't trigger onload
+                    setTimeout(() => {
+                        window.print();
+                        setTimeout(() => window.close(), 1000);
+                    }, 15000);
+                }
+                
+                // Start loading images when the window is ready
+                window.onload = loadImages;
+            </script>
+        </body>
+        </html>
+    `;
+
+    // Write the content to the new window
+    printWindow.document.write(printContent);
+    printWindow.document.close();
+}
+
+// Initialize on load
+document.addEventListener('DOMContentLoaded', init); 
\ No newline at end of file
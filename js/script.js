@@ -2,12 +2,14 @@
 let currentForce = [];
 let currentScale = 1;
 let maxPoints = 32;
+let unitShards = {};
+let pendingShards = {};
+let unitsByFullName = new Map();
 
 // DOM Elements
 let unitTypeSelect;
 let unitSelect;
-let regularRadio;
-let veteranRadio;
+let skillSelect;
 let addUnitButton;
 let forceList;
 let forceListItems;
@@ -18,14 +20,15 @@ let totalPointsSpan;
 let deleteForceButton;
 let printForceButton;
 let maxPointsInput;
+let fitsOnlyCheckbox;
+let unitSearchInput;
 
 // Initialize
 function init() {
     // Get DOM elements
     unitTypeSelect = document.getElementById('unitType');
     unitSelect = document.getElementById('unitSelect');
-    regularRadio = document.getElementById('regular');
-    veteranRadio = document.getElementById('veteran');
+    skillSelect = document.getElementById('skillLevel');
     addUnitButton = document.getElementById('addUnit');
     forceList = document.getElementById('forceList');
     forceListItems = document.getElementById('forceListItems');
@@ -36,6 +39,8 @@ function init() {
     deleteForceButton = document.getElementById('deleteForce');
     printForceButton = document.getElementById('printForce');
     maxPointsInput = document.getElementById('maxPoints');
+    fitsOnlyCheckbox = document.getElementById('fitsOnly');
+    unitSearchInput = document.getElementById('unitSearch');
 
     // Add event listeners
     unitTypeSelect.addEventListener('change', updateUnitList);
@@ -44,6 +49,9 @@ function init() {
     deleteForceButton.addEventListener('click', deleteForce);
     printForceButton.addEventListener('click', printForce);
     maxPointsInput.addEventListener('change', updateMaxPoints);
+    fitsOnlyCheckbox.addEventListener('change', updateUnitList);
+    unitSearchInput.addEventListener('input', updateUnitList);
+    skillSelect.addEventListener('change', updateUnitList);
 
     // Scale buttons
     document.getElementById('scale1').addEventListener('click', () => setScale(1));
@@ -51,54 +59,191 @@ function init() {
     document.getElementById('scale3').addEventListener('click', () => setScale(3));
 
     // Set initial unit type to vehicle and load units
-    unitTypeSelect.value = "vehicle";
+    unitTypeSelect.value = unitManifest.default;
     updateUnitList();
     
-    // Select the first unit in the list
-    if (unitSelect.options.length > 1) { // Check if there are units available
-        unitSelect.selectedIndex = 1; // Select the first unit (index 0 is the placeholder)
-        updateCardPreview(); // Update the card preview
-    }
+    // Select the first unit in the list once its shard has loaded
+    loadUnitShard(unitManifest.default).then(() => {
+        updateUnitList();
+        if (unitSelect.options.length > 1) { // Check if there are units available
+            unitSelect.selectedIndex = 1; // Select the first unit (index 0 is the placeholder)
+            updateCardPreview(); // Update the card preview
+        }
+    }).catch(error => console.error(error));
     
     // Update total points
     updateTotalPoints();
 }
 
+// Called by each js/units/<type>.js as it loads
+function registerUnitShard(type, shard) {
+    const units = decodeUnitColumns(shard.columns);
+    // Index units by FullName once so selections don't scan the whole list
+    units.forEach(unit => unitsByFullName.set(unit.FullName, unit));
+    unitShards[type] = { units, index: shard.index, search: shard.search };
+}
+
+// Load a unit type's shard once. A script tag rather than fetch() keeps
+// index.html working when opened straight from disk.
+function loadUnitShard(type) {
+    const entry = unitManifest.shards[type];
+    if (unitShards[type] || !entry) {
+        return Promise.resolve(unitShards[type]);
+    }
+    if (!pendingShards[type]) {
+        pendingShards[type] = new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = `js/${entry.file}`;
+            script.onload = () => resolve(unitShards[type]);
+            script.onerror = () => {
+                delete pendingShards[type];
+                script.remove();
+                reject(new Error(`Failed to load ${script.src}`));
+            };
+            document.head.appendChild(script);
+        });
+    }
+    return pendingShards[type];
+}
+
+// Rebuild the unit objects from the column layout convert_csv_to_js.py writes.
+// Rows listed in a sparse column's "rows", or null in a dense one, have no value
+// and get no key; dictionary columns hold indexes into "dict".
+function decodeUnitColumns(packed) {
+    const units = Array.from({ length: packed.length }, () => ({}));
+    Object.entries(packed.columns).forEach(([name, column]) => {
+        column.values.forEach((value, i) => {
+            if (value === null) return;
+            units[column.rows ? column.rows[i] : i][name] = column.dict ? column.dict[value] : value;
+        });
+    });
+    return units;
+}
+
+// Count the units in a PV-sorted position list costing at most maxPV
+function countWithinPV(units, positions, column, maxPV) {
+    let low = 0;
+    let high = positions.length;
+    while (low < high) {
+        const mid = (low + high) >> 1;
+        if (units[positions[mid]][column] <= maxPV) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return low;
+}
+
+// PV column for a skill: each unit's own regular or veteran PV, or pilot skill 0-7.
+// convert_csv_to_js.py precomputes every column, so pricing is a single lookup.
+function skillPVColumn(skill) {
+    if (skill === 'regular') return 'RegPV';
+    if (skill === 'veteran') return 'VetPV';
+    return `Skill${skill}PV`;
+}
+
+function skillLabel(skill) {
+    if (skill === 'regular') return 'Regular';
+    if (skill === 'veteran') return 'Veteran';
+    return `Skill ${skill}`;
+}
+
+// Units of a shard that fit the remaining points, most expensive first
+function unitsThatFit(shard, remainingPoints, skill) {
+    const column = skillPVColumn(skill);
+    const positions = shard.index[column] || [];
+    return positions.slice(0, countWithinPV(shard.units, positions, column, remainingPoints)).reverse();
+}
+
+// Fold text the same way search_index.py does: no accents, lower case, no punctuation
+function foldText(text) {
+    return text.normalize('NFD').replace(/[\u0300-\u036f]/g, '').toLowerCase()
+        .replace(/[^a-z0-9]+/g, ' ').trim();
+}
+
+// Padded word trigrams, matching search_index.py
+function textTrigrams(folded) {
+    const grams = new Set();
+    folded.split(' ').filter(word => word).forEach(word => {
+        const padded = `  ${word} `;
+        for (let i = 0; i < padded.length - 2; i++) {
+            grams.add(padded.slice(i, i + 3));
+        }
+    });
+    return grams;
+}
+
+// Rank a shard's unit positions against a query using its prebuilt trigram index
+function searchUnits(searchIndex, query, allowedPositions, limit = 50) {
+    const folded = foldText(query);
+    const grams = textTrigrams(folded);
+    const allowed = new Set(allowedPositions);
+    const shared = new Map();
+    grams.forEach(gram => {
+        (searchIndex.postings[gram] || []).forEach(position => {
+            if (allowed.has(position)) {
+                shared.set(position, (shared.get(position) || 0) + 1);
+            }
+        });
+    });
+    const scored = [];
+    shared.forEach((count, position) => {
+        let score = count / (grams.size + searchIndex.sizes[position] - count);
+        if (count === grams.size && searchIndex.texts[position].includes(folded)) {
+            score += 1;
+        }
+        scored.push([position, score]);
+    });
+    scored.sort((a, b) => b[1] - a[1] || a[0] - b[0]);
+    return scored.slice(0, limit).map(([position]) => position);
+}
+
 // Update unit list based on selected type
 function updateUnitList() {
     const selectedType = unitTypeSelect.value;
+    const previousSelection = unitSelect.value;
+    const shard = unitShards[selectedType];
+    if (!shard && unitManifest.shards[selectedType]) {
+        // Fetch the type's shard, then list it if the type is still selected
+        unitSelect.innerHTML = '<option value="">Loading units...</option>';
+        cardPreview.style.display = 'none';
+        previewCard.src = '';
+        loadUnitShard(selectedType).then(() => {
+            if (unitTypeSelect.value === selectedType) updateUnitList();
+        }).catch(error => console.error(error));
+        return;
+    }
     unitSelect.innerHTML = '<option value="">Choose a unit...</option>';
     
-    // Map the select value to the correct Type value
-    const typeMapping = {
-        'vehicle': ['Vehicle', 'VEHICLE', 'vehicle'],
-        'protomech': ['Protomech', 'PROTOMECH', 'protomech', 'ProtoMech', 'Proto-Mech'],
-        'battlearmor': ['BattleArmor', 'BATTLEARMOR', 'battlearmor', 'Battle Armor'],
-        'infantry': ['Infantry', 'INFANTRY', 'infantry'],
-        'emplacement': ['Emplacement', 'EMPLACEMENT', 'emplacement', 'Gun Emplacement', 'GunEmplacement']
-    };
-    
-    const correctType = typeMapping[selectedType];
-    
-    // Filter units based on type
-    const filteredUnits = unitData.filter(unit => {
-        return unit.UnitType && correctType.some(type => 
-            unit.UnitType.toLowerCase() === type.toLowerCase()
-        );
-    });
-    
-    // Sort units by name
-    filteredUnits.sort((a, b) => a.Name.localeCompare(b.Name));
+    // The shard's index holds its units presorted by name and by PV, so
+    // nothing is filtered or sorted here
+    let positions = shard ? shard.index.byName : [];
+    if (shard && fitsOnlyCheckbox.checked) {
+        positions = unitsThatFit(shard, maxPoints - currentTotalPoints(), skillSelect.value);
+    }
+    if (shard && unitSearchInput.value.trim()) {
+        positions = searchUnits(shard.search, unitSearchInput.value, positions);
+    }
     
-    filteredUnits.forEach(unit => {
+    const skill = skillSelect.value;
+    positions.forEach(position => {
+        const unit = shard.units[position];
         const option = document.createElement('option');
         option.value = unit.FullName;
-        option.textContent = `${unit.Name} (PV: ${unit.RegPV}/${unit.VetPV})`;
+        option.textContent = skill === 'regular' || skill === 'veteran'
+            ? `${unit.Name} (PV: ${unit.RegPV}/${unit.VetPV})`
+            : `${unit.Name} (PV: ${unit[skillPVColumn(skill)]})`;
         unitSelect.appendChild(option);
     });
     
-    cardPreview.style.display = 'none';
-    previewCard.src = '';
+    // Keep the current selection when it is still listed
+    unitSelect.value = previousSelection;
+    if (unitSelect.value !== previousSelection || !previousSelection) {
+        unitSelect.value = '';
+        cardPreview.style.display = 'none';
+        previewCard.src = '';
+    }
 }
 
 // Update card preview
@@ -106,7 +251,7 @@ function updateCardPreview() {
     const selectedUnit = unitSelect.value;
     if (selectedUnit) {
         const unitType = unitTypeSelect.value;
-        const unit = unitData.find(u => u.FullName === selectedUnit);
+        const unit = unitsByFullName.get(selectedUnit);
         if (unit) {
             const cardPath = `Cards/${unit.FullName.replace(/\//g, '-')}.gif`;
             previewCard.src = cardPath;
@@ -124,16 +269,18 @@ function addUnitToForce() {
     if (!selectedUnit) return;
     
     const unitType = unitTypeSelect.value;
-    const unit = unitData.find(u => u.FullName === selectedUnit);
+    const unit = unitsByFullName.get(selectedUnit);
     if (!unit) return;
     
-    const isVeteran = veteranRadio.checked;
-    const pv = isVeteran ? unit.VetPV : unit.RegPV;
+    const skill = skillSelect.value;
+    const pv = unit[skillPVColumn(skill)];
     
     const forceUnit = {
         ...unit,
         PV: pv,
-        isVeteran
+        skill,
+        skillLabel: skillLabel(skill),
+        isVeteran: skill === 'veteran'
     };
     
     currentForce.push(forceUnit);
@@ -171,7 +318,7 @@ function updateForceList() {
         const unitInfo = document.createElement('div');
         unitInfo.innerHTML = `
             <strong>${unit.Name}</strong>
-            <span class="badge ${unit.isVeteran ? 'bg-warning' : 'bg-info'} ms-2">${unit.isVeteran ? 'Veteran' : 'Regular'}</span>
+            <span class="badge ${unit.skill === 'regular' ? 'bg-info' : 'bg-warning'} ms-2">${unit.skillLabel}</span>
             <span class="badge bg-primary ms-2">${unit.PV} PV</span>
         `;
         
@@ -193,9 +340,14 @@ function removeUnit(index) {
     updateTotalPoints();
 }
 
+// Sum the points of the current force
+function currentTotalPoints() {
+    return currentForce.reduce((sum, unit) => sum + unit.PV, 0);
+}
+
 // Update total points
 function updateTotalPoints() {
-    const total = currentForce.reduce((sum, unit) => sum + unit.PV, 0);
+    const total = currentTotalPoints();
     totalPointsSpan.textContent = total;
     
     // Update badge color and text based on points
@@ -208,6 +360,11 @@ function updateTotalPoints() {
         totalPointsBadge.classList.add('bg-primary');
         totalPointsBadge.textContent = `Total Points: ${total}`;
     }
+    
+    // The remaining budget changed, so refresh the "fits" list
+    if (fitsOnlyCheckbox && fitsOnlyCheckbox.checked) {
+        updateUnitList();
+    }
 }
 
 // Set scale
@@ -341,7 +498,7 @@ function printForce() {
                         listItem.innerHTML = \`
                             <div>
                                 <strong>\${unit.Name}</strong>
-                                <span class="badge \${unit.isVeteran ? 'bg-warning' : 'bg-info'}">\${unit.isVeteran ? 'Veteran' : 'Regular'}</span>
+                                <span class="badge \${unit.skill === 'regular' ? 'bg-info' : 'bg-warning'}">\${unit.skillLabel}</span>
                                 <span class="badge bg-primary">\${unit.PV} PV</span>
                             </div>
                         \`;
@@ -0,0 +1,2 @@
+// Auto-generated battlearmor units
+registerUnitShard("battlearmor", {"columns":{"length":1188,"columns":{"UnitType":{"dict":["BattleArmor"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"Name":{"values":["Clan Interface Armor (Sqd4)","Clan Interface Armor (Sqd5)","Clan Interface Armor (Sqd6)","Aerie PA(L) (Salvage) (Sqd4)","Aerie PA(L) (Salvage) (Sqd5)","Aerie PA(L) (Salvage) (Sqd6)","Aerie PA(L) (Sqd4)","Aerie PA(L) (Sqd5)","Aerie PA(L) (Sqd6)","Ailette Rescue PA(L) (Sqd4)","Ailette Rescue PA(L) (Sqd5)","Ailette Rescue PA(L) (Sqd6)","Ailette Zero-G Engineering Exoskeleton (Sqd4)","Ailette Zero-G Engineering Exoskeleton (Sqd5)","Ailette Zero-G Engineering Exoskeleton (Sqd6)","Gladiator Battle Armor S (Sqd4)","Gladiator Battle Armor S (Sqd5)","Gladiator Battle Armor S (Sqd6)","Gladiator Exoskeleton \"The Spider\" (Sqd4)","Gladiator Exoskeleton \"The Spider\" (Sqd5)","Gladiator Exoskeleton \"The Spider\" (Sqd6)","Gladiator Exoskeleton [Armored Glove] (Sqd4)","Gladiator Exoskeleton [Armored Glove] (Sqd5)","Gladiator Exoskeleton [Armored Glove] (Sqd6)","Gladiator Exoskeleton [Industrial Drill] (Sqd4)","Gladiator Exoskeleton [Industrial Drill] (Sqd5)","Gladiator Exoskeleton [Industrial Drill] (Sqd6)","Gorilla Exoskeleton \"Falcata\" (Sqd4)","Gorilla Exoskeleton \"Falcata\" (Sqd5)","Gorilla Exoskeleton \"Falcata\" (Sqd6)","Gorilla Exoskeleton PEX-2B (Sqd4)","Gorilla Exoskeleton PEX-2B (Sqd5)","Gorilla Exoskeleton PEX-2B (Sqd6)","Groundhog Exoskeleton \u201cMaster Thief\" (Sqd1)","Groundhog Exoskeleton CEX-205  [Armored Glove] (Sqd5)","Groundhog Exoskeleton CEX-205  [Armored Glove] (Sqd6)","Groundhog Exoskeleton CEX-205 [Armored Glove] (Sqd4)","Groundhog Exoskeleton CEX-205 [Basic Manipulator] (Sqd4)","Groundhog Exoskeleton CEX-205 [Basic Manipulator] (Sqd5)","Groundhog Exoskeleton CEX-205 [Basic Manipulator] (Sqd6)","Groundhog Exoskeleton CEX-205 [Cargo Lifter] (Sqd4)","Groundhog Exoskeleton CEX-205 [Cargo Lifter] (Sqd5)","Groundhog Exoskeleton CEX-205 [Cargo Lifter] (Sqd6)","Groundhog Exoskeleton CEX-205 [Industrial Drill] (Sqd4)","Groundhog Exoskeleton CEX-205 [Industrial Drill] (Sqd5)","Groundhog Exoskeleton CEX-205 [Industrial Drill] (Sqd6)","Groundhog Exoskeleton CEX-205 [Mine Clearance] (Sqd4)","Groundhog Exoskeleton CEX-205 [Mine Clearance] (Sqd5)","Groundhog Exoskeleton CEX-205 [Mine Clearance] (Sqd6)","Groundhog Exoskeleton CEX-205 [Salvage Arm] (Sqd4)","Groundhog Exoskeleton CEX-205 [Salvage Arm] (Sqd5)","Groundhog Exoskeleton CEX-205 [Salvage Arm] (Sqd6)","Hantu  AIX-210 (Sqd4)","Hantu  AIX-210 (Sqd5)","Hantu  AIX-210 (Sqd6)","HeavyHauler Exoskeleton (Sqd4)","HeavyHauler Exoskeleton (Sqd5)","HeavyHauler Exoskeleton (Sqd6)","Krise PA(L) (Sqd4)","Krise PA(L) (Sqd5)","Krise PA(L) (Sqd6)","Nighthawk PA(L) Mk. XXI (Sqd4)","Nighthawk PA(L) Mk. XXI (Sqd5)","Nighthawk PA(L) Mk. XXI (Sqd6)","Nighthawk PA(L) Mk. XXII (Sqd4)","Nighthawk PA(L) Mk. XXII (Sqd5)","Nighthawk PA(L) Mk. XXII (Sqd6)","Nighthawk PA(L) Mk. XXX (Bounty Hunter) (Sqd4)","Nighthawk PA(L) Mk. XXX (Bounty Hunter) (Sqd5)","Nighthawk PA(L) Mk. XXX (Bounty Hunter) (Sqd6)","Nighthawk PA(L) Mk. XXX (Sqd4)","Nighthawk PA(L) Mk. XXX (Sqd5)","Nighthawk PA(L) Mk. XXX (Sqd6)","PowerLoader Exoskeleton P-5000 (Sqd4)","PowerLoader Exoskeleton P-5000 (Sqd5)","PowerLoader Exoskeleton P-5000 (Sqd6)","Resgate PA(L) (Interdictor) (Sqd4)","Resgate PA(L) (Interdictor) (Sqd5)","Resgate PA(L) (Interdictor) (Sqd6)","Resgate PA(L) (Scout) (Sqd4)","Resgate PA(L) (Scout) (Sqd5)","Resgate PA(L) (Scout) (Sqd6)","Resgate PA(L) (Spotter) (Sqd4)","Resgate PA(L) (Spotter) (Sqd5)","Resgate PA(L) (Spotter) (Sqd6)","Resgate PA(L) (Sqd4)","Resgate PA(L) (Sqd5)","Resgate PA(L) (Sqd6)","Resgate PA(L) (Support) (Sqd4)","Resgate PA(L) (Support) (Sqd5)","Resgate PA(L) (Support) (Sqd6)","Salrilla Exoskeleton  PEX-2F [Salvage Arm] (Sqd4)","Salrilla Exoskeleton  PEX-2F [Salvage Arm] (Sqd5)","Salrilla Exoskeleton  PEX-2F [Salvage Arm] (Sqd6)","Salrilla Exoskeleton PEX-2F [Mine Clearance] (Sqd4)","Salrilla Exoskeleton PEX-2F [Mine Clearance] (Sqd5)","Salrilla Exoskeleton PEX-2F [Mine Clearance] (Sqd6)","Smoothdavid PA(L) II (Sqd4)","Smoothdavid PA(L) II (Sqd5)","Smoothdavid PA(L) II (Sqd6)","Smoothdavid PA(L) III (Sqd4)","Smoothdavid PA(L) III (Sqd5)","Smoothdavid PA(L) III (Sqd6)","Smoothgoliath PA(L) II (Sqd4)","Smoothgoliath PA(L) II (Sqd5)","Smoothgoliath PA(L) II (Sqd6)","Sniper Suit PAB-28 (Sqd4)","Sniper Suit PAB-28 (Sqd5)","Sniper Suit PAB-28 (Sqd6)","Tornado PA(L) G12 (Sqd4)","Tornado PA(L) G12 (Sqd5)","Tornado PA(L) G12 (Sqd6)","Tornado PA(L) G13 [David Light Gauss] (Sqd4)","Tornado PA(L) G13 [David Light Gauss] (Sqd5)","Tornado PA(L) G13 [David Light Gauss] (Sqd6)","Tornado PA(L) G13 [Flamer] (Sqd4)","Tornado PA(L) G13 [Flamer] (Sqd5)","Tornado PA(L) G13 [Flamer] (Sqd6)","Tornado PA(L) G13 [Grenade Launcher] (Sqd4)","Tornado PA(L) G13 [Grenade Launcher] (Sqd5)","Tornado PA(L) G13 [Grenade Launcher] (Sqd6)","Tornado PA(L) G13 [Machine Gun] (Sqd4)","Tornado PA(L) G13 [Machine Gun] (Sqd5)","Tornado PA(L) G13 [Machine Gun] (Sqd6)","Tornado PA(L) G13 [Small Laser] (Sqd4)","Tornado PA(L) G13 [Small Laser] (Sqd5)","Tornado PA(L) G13 [Small Laser] (Sqd6)","Tornado PA(L) G14 (Sqd4)","Tornado PA(L) G14 (Sqd5)","Tornado PA(L) G14 (Sqd6)","Tornado PA(L) G17 (Sqd4)","Tornado PA(L) G17 (Sqd5)","Tornado PA(L) G17 (Sqd6)","Tornado PA(L) P12 \"Hurricane\" (Sqd4)","Tornado PA(L) P12 \"Hurricane\" (Sqd5)","Tornado PA(L) P12 \"Hurricane\" (Sqd6)","Tornado PA(L) P17 \"Hurricane\" (Sqd4)","Tornado PA(L) P17 \"Hurricane\" (Sqd5)","Tornado PA(L) P17 \"Hurricane\" (Sqd6)","Tunnel Rat I Mining Exoskeleton [Armored Glove] (Sqd4)","Tunnel Rat I Mining Exoskeleton [Armored Glove] (Sqd5)","Tunnel Rat I Mining Exoskeleton [Armored Glove] (Sqd6)","Tunnel Rat I Mining Exoskeleton [Industrial Drill] (Sqd4)","Tunnel Rat I Mining Exoskeleton [Industrial Drill] (Sqd5)","Tunnel Rat I Mining Exoskeleton [Industrial Drill] (Sqd6)","Tunnel Rat II Mining Exoskeleton [Armored Glove] (Sqd4)","Tunnel Rat II Mining Exoskeleton [Armored Glove] (Sqd5)","Tunnel Rat II Mining Exoskeleton [Armored Glove] (Sqd6)","Tunnel Rat II Mining Exoskeleton [Industrial Drill] (Sqd4)","Tunnel Rat II Mining Exoskeleton [Industrial Drill] (Sqd5)","Tunnel Rat II Mining Exoskeleton [Industrial Drill] (Sqd6)","Tunnel Rat III Mining Exoskeleton [Armored Glove] (Sqd4)","Tunnel Rat III Mining Exoskeleton [Armored Glove] (Sqd5)","Tunnel Rat III Mining Exoskeleton [Armored Glove] (Sqd6)","Tunnel Rat III Mining Exoskeleton [Industrial Drill] (Sqd4)","Tunnel Rat III Mining Exoskeleton [Industrial Drill] (Sqd5)","Tunnel Rat III Mining Exoskeleton [Industrial Drill] (Sqd6)","Tunnel Rat IV Mining Exoskeleton [Armored Glove/GL] (Sqd4)","Tunnel Rat IV Mining Exoskeleton [Armored Glove/GL] (Sqd5)","Tunnel Rat IV Mining Exoskeleton [Armored Glove/GL] (Sqd6)","Tunnel Rat IV Mining Exoskeleton [Armored Glove/LMG] (Sqd4)","Tunnel Rat IV Mining Exoskeleton [Armored Glove/LMG] (Sqd5)","Tunnel Rat IV Mining Exoskeleton [Armored Glove/LMG] (Sqd6)","Tunnel Rat IV Mining Exoskeleton [Battle Claw/GL] (Sqd4)","Tunnel Rat IV Mining Exoskeleton [Battle Claw/GL] (Sqd5)","Tunnel Rat IV Mining Exoskeleton [Battle Claw/GL] (Sqd6)","Tunnel Rat IV Mining Exoskeleton [Battle Claw/LMG] (Sqd4)","Tunnel Rat IV Mining Exoskeleton [Battle Claw/LMG] (Sqd5)","Tunnel Rat IV Mining Exoskeleton [Battle Claw/LMG] (Sqd6)","Achileus Light Battle Armor (WoB) (Sqd4)","Achileus Light Battle Armor (WoB) (Sqd5)","Achileus Light Battle Armor (WoB) (Sqd6)","Achileus Light Battle Armor [David] (Sqd4)","Achileus Light Battle Armor [David] (Sqd5)","Achileus Light Battle Armor [David] (Sqd6)","Achileus Light Battle Armor [Flamer] (Sqd4)","Achileus Light Battle Armor [Flamer] (Sqd5)","Achileus Light Battle Armor [Flamer] (Sqd6)","Achileus Light Battle Armor [Laser] (Sqd4)","Achileus Light Battle Armor [Laser] (Sqd5)","Achileus Light Battle Armor [Laser] (Sqd6)","Achileus Light Battle Armor [MG] (Sqd4)","Achileus Light Battle Armor [MG] (Sqd5)","Achileus Light Battle Armor [MG] (Sqd6)","Achileus Light Battle Armor [TAG] (Sqd4)","Achileus Light Battle Armor [TAG] (Sqd5)","Achileus Light Battle Armor [TAG] (Sqd6)","Constable Pacification Suit [ECM] (Sqd4)","Constable Pacification Suit [ECM] (Sqd5)","Constable Pacification Suit [ECM] (Sqd6)","Constable Pacification Suit [LMG] (Sqd4)","Constable Pacification Suit [LMG] (Sqd5)","Constable Pacification Suit [LMG] (Sqd6)","Constable Pacification Suit [Sensor] (Sqd4)","Constable Pacification Suit [Sensor] (Sqd5)","Constable Pacification Suit [Sensor] (Sqd6)","Constable Pacification Suit [SRM] (Sqd4)","Constable Pacification Suit [SRM] (Sqd5)","Constable Pacification Suit [SRM] (Sqd6)","Constable Pacification Suit [TAG] (Sqd4)","Constable Pacification Suit [TAG] (Sqd5)","Constable Pacification Suit [TAG] (Sqd6)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [Flamer] (Sqd4)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [Flamer] (Sqd5)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [Flamer] (Sqd6)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [Laser] (Sqd4)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [Laser] (Sqd5)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [Laser] (Sqd6)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [MG]  (Sqd4)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [MG]  (Sqd5)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [MG]  (Sqd6)","Djinn Battle Armor (Sqd4)","Djinn Battle Armor (Sqd5)","Djinn Battle Armor (Sqd6)","Djinn Battle Armor (Stealth) (Sqd4)","Djinn Battle Armor (Stealth) (Sqd5)","Djinn Battle Armor (Stealth) (Sqd6)","Gray Death Scout Suit \"The Willow Wisps\" (Sqd4)","Gray Death Scout Suit \"The Willow Wisps\" (Sqd5)","Gray Death Scout Suit \"The Willow Wisps\" (Sqd6)","Gray Death Scout Suit (Reaper) (Sqd4)","Gray Death Scout Suit (Reaper) (Sqd5)","Gray Death Scout Suit (Reaper) (Sqd6)","Gray Death Scout Suit (Sqd4)","Gray Death Scout Suit (Sqd5)","Gray Death Scout Suit (Sqd6)","Infiltrator Mk. I Battle Armor \"Waddle\" (Sqd4)","Infiltrator Mk. I Battle Armor \"Waddle\" (Sqd5)","Infiltrator Mk. I Battle Armor \"Waddle\" (Sqd6)","Infiltrator Mk. I Battle Armor (Special Ops) (Sqd4)","Infiltrator Mk. I Battle Armor (Special Ops) (Sqd5)","Infiltrator Mk. I Battle Armor (Special Ops) (Sqd6)","Kage Light Battle Armor (DEST) (Sqd4)","Kage Light Battle Armor (DEST) (Sqd5)","Kage Light Battle Armor (DEST) (Sqd6)","Kage Light Battle Armor (Space) (Sqd4)","Kage Light Battle Armor (Space) (Sqd5)","Kage Light Battle Armor (Space) (Sqd6)","Kage Light Battle Armor (Vibro-Claw)  (Sqd4)","Kage Light Battle Armor (Vibro-Claw) (Sqd5)","Kage Light Battle Armor (Vibro-Claw) (Sqd6)","Kage Light Battle Armor [ECM] (Sqd4)","Kage Light Battle Armor [ECM] (Sqd5)","Kage Light Battle Armor [ECM] (Sqd6)","Kage Light Battle Armor [Flamer] (Sqd4)","Kage Light Battle Armor [Flamer] (Sqd5)","Kage Light Battle Armor [Flamer] (Sqd6)","Kage Light Battle Armor [Laser] (Sqd4)","Kage Light Battle Armor [Laser] (Sqd5)","Kage Light Battle Armor [Laser] (Sqd6)","Kage Light Battle Armor [MG] (Sqd4)","Kage Light Battle Armor [MG] (Sqd5)","Kage Light Battle Armor [MG] (Sqd6)","Kage Light Battle Armor [TAG] (Sqd4)","Kage Light Battle Armor [TAG] (Sqd5)","Kage Light Battle Armor [TAG] (Sqd6)","Kage Light Battle Armor C (Sqd4)","Kage Light Battle Armor C (Sqd5)","Kage Light Battle Armor C (Sqd6)","Kishi Battle Armor (Sqd4)","Kishi Battle Armor (Sqd5)","Kishi Battle Armor (Sqd6)","Kobold Battle Armor [MicroGL/Flamer] (Sqd4)","Kobold Battle Armor [MicroGL/Flamer] (Sqd5)","Kobold Battle Armor [MicroGL/Flamer] (Sqd6)","Kobold Battle Armor [MicroGL/SPL] (Sqd4)","Kobold Battle Armor [MicroGL/SPL] (Sqd5)","Kobold Battle Armor [MicroGL/SPL] (Sqd6)","Kobold Battle Armor [MicroGL/TAG] (Sqd4)","Kobold Battle Armor [MicroGL/TAG] (Sqd5)","Kobold Battle Armor [MicroGL/TAG] (Sqd6)","Kobold Battle Armor [SL/Flamer] (Sqd4)","Kobold Battle Armor [SL/Flamer] (Sqd5)","Kobold Battle Armor [SL/Flamer] (Sqd6)","Kobold Battle Armor [SL/TAG] (Sqd4)","Kobold Battle Armor [SL/TAG] (Sqd5)","Kobold Battle Armor [SL/TAG] (Sqd6)","Kobold Battle Armor IIC (Sqd4)","Kobold Battle Armor IIC (Sqd5)","Kobold Battle Armor IIC (Sqd6)","Kobold Battle Armor X-C3 (Sqd4)","Kobold Battle Armor X-C3 (Sqd5)","Kobold Battle Armor X-C3 (Sqd6)","Sea Fox Amphibious Armor (Sqd4)","Sea Fox Amphibious Armor (Sqd5)","Sea Fox Amphibious Armor (Sqd6)","Spectre Stealth Battle Armor (Sqd4)","Spectre Stealth Battle Armor (Sqd5)","Spectre Stealth Battle Armor (Sqd6)","Sylph Battle Armor (Sqd4)","Sylph Battle Armor (Sqd5)","Sylph Battle Armor (Sqd6)","Sylph Battle Armor (Upgrade) (Sqd4)","Sylph Battle Armor (Upgrade) (Sqd5)","Sylph Battle Armor (Upgrade) (Sqd6)","Sylph Battle Armor XR (Sqd4)","Sylph Battle Armor XR (Sqd5)","Sylph Battle Armor XR (Sqd6)","Sylph Battle Armor \"Tinkerbelle\" (Sqd4)","Sylph Battle Armor (Enhanced) (Sqd4)","Sylph Battle Armor (Enhanced) (Sqd5)","Sylph Battle Armor (Enhanced) (Sqd6)","Aegis Point Defense Suit (Sqd4)","Aegis Point Defense Suit (Sqd5)","Aegis Point Defense Suit (Sqd6)","Afreet Medium Battle Armor (Hell's Horses) (Sqd4)","Afreet Medium Battle Armor (Hell's Horses) (Sqd5)","Afreet Medium Battle Armor (Hell's Horses) (Sqd6)","Afreet Medium Battle Armor (Interdictor) (Sqd4)","Afreet Medium Battle Armor (Interdictor) (Sqd5)","Afreet Medium Battle Armor (Interdictor) (Sqd6)","Afreet Medium Battle Armor (Jade Falcon) (Sqd4)","Afreet Medium Battle Armor (Jade Falcon) (Sqd5)","Afreet Medium Battle Armor (Jade Falcon) (Sqd6)","Afreet Medium Battle Armor (Sqd4)","Afreet Medium Battle Armor (Sqd5)","Afreet Medium Battle Armor (Sqd6)","Amazon Battle Armor [MRR] (Sqd4)","Amazon Battle Armor [MRR] (Sqd5)","Amazon Battle Armor [MRR] (Sqd6)","Amazon Battle Armor [PPC] (Sqd4)","Amazon Battle Armor [PPC] (Sqd5)","Amazon Battle Armor [PPC] (Sqd6)","Angerona Scout Suit (Recon) (Sqd4)","Angerona Scout Suit (Recon) (Sqd5)","Angerona Scout Suit (Recon) (Sqd6)","Angerona Scout Suit (Sqd4)","Angerona Scout Suit (Sqd5)","Angerona Scout Suit (Sqd6)","Asura Medium Battle Armor (Anti-Infantry) (Sqd4)","Asura Medium Battle Armor (Anti-Infantry) (Sqd5)","Asura Medium Battle Armor (Anti-Infantry) (Sqd6)","Asura Medium Battle Armor (Sqd4)","Asura Medium Battle Armor (Sqd5)","Asura Medium Battle Armor (Sqd6)","Asura Medium Battle Armor (SRM) (Sqd4)","Asura Medium Battle Armor (SRM) (Sqd5)","Asura Medium Battle Armor (SRM) (Sqd6)","Buraq Fast Battle Armor (Hunter-Killer) (Sqd4)","Buraq Fast Battle Armor (Hunter-Killer) (Sqd5)","Buraq Fast Battle Armor (Hunter-Killer) (Sqd6)","Buraq Fast Battle Armor (Sqd4)","Buraq Fast Battle Armor (Sqd5)","Buraq Fast Battle Armor (Sqd6)","Buraq Fast Battle Armor (Support) (Sqd4)","Buraq Fast Battle Armor (Support) (Sqd5)","Buraq Fast Battle Armor (Support) (Sqd6)","Callisto Battle Armor A [Bearhunter] (Sqd4)","Callisto Battle Armor A [Bearhunter] (Sqd5)","Callisto Battle Armor A [Bearhunter] (Sqd6)","Callisto Battle Armor A [ER Laser] (Sqd4)","Callisto Battle Armor A [ER Laser] (Sqd5)","Callisto Battle Armor A [ER Laser] (Sqd6)","Callisto Battle Armor A [HMG] (Sqd4)","Callisto Battle Armor A [HMG] (Sqd5)","Callisto Battle Armor A [HMG] (Sqd6)","Callisto Battle Armor B [MRR] (Sqd4)","Callisto Battle Armor B [MRR] (Sqd5)","Callisto Battle Armor B [MRR] (Sqd6)","Callisto Battle Armor B [SRM] (Sqd4)","Callisto Battle Armor B [SRM] (Sqd5)","Callisto Battle Armor B [SRM] (Sqd6)","Cavalier Battle Armor [Flamer] (Sqd4)","Cavalier Battle Armor [Flamer] (Sqd5)","Cavalier Battle Armor [Flamer] (Sqd6)","Cavalier Battle Armor [Laser] (Sqd4)","Cavalier Battle Armor [Laser] (Sqd5)","Cavalier Battle Armor [Laser] (Sqd6)","Cavalier Battle Armor [MG] (Sqd4)","Cavalier Battle Armor [MG] (Sqd5)","Cavalier Battle Armor [MG] (Sqd6)","Cavalier Battle Armor [SRM] (Sqd4)","Cavalier Battle Armor [SRM] (Sqd5)","Cavalier Battle Armor [SRM] (Sqd6)","Cavalier II Battle Armor [Flamer] (Sqd4)","Cavalier II Battle Armor [Flamer] (Sqd5)","Cavalier II Battle Armor [Flamer] (Sqd6)","Cavalier II Battle Armor [MRR] (Sqd4)","Cavalier II Battle Armor [MRR] (Sqd5)","Cavalier II Battle Armor [MRR] (Sqd6)","Cavalier II Battle Armor [PPC] (Sqd4)","Cavalier II Battle Armor [PPC] (Sqd5)","Cavalier II Battle Armor [PPC] (Sqd6)","Cavalier II Battle Armor [SRM] (Sqd4)","Cavalier II Battle Armor [SRM] (Sqd5)","Cavalier II Battle Armor [SRM] (Sqd6)","Clan Medium Battle Armor \"Rabid\" (Sqd4)","Clan Medium Battle Armor \"Rabid\" (Sqd5)","Clan Medium Battle Armor \"Rabid\" (Sqd6)","Clan Medium Battle Armor \"Rache\" (Sqd4)","Clan Medium Battle Armor \"Rache\" (Sqd5)","Clan Medium Battle Armor \"Rache\" (Sqd6)","Clan Medium Battle Armor (Laser)  \"Volk\" (Sqd4)","Clan Medium Battle Armor (Laser)  \"Volk\" (Sqd5)","Clan Medium Battle Armor (Laser) \"Volk\" (Sqd6)","Clan Medium Battle Armor (Naval) \"B\u00e4r\" (Sqd4)","Clan Medium Battle Armor (Naval) \"B\u00e4r\" (Sqd5)","Clan Medium Battle Armor (Naval) \"B\u00e4r\" (Sqd6)","Dragoon Battle Armor (Advanced) (Sqd4)","Dragoon Battle Armor (Advanced) (Sqd5)","Dragoon Battle Armor (Advanced) (Sqd6)","Dragoon Battle Armor (Sqd4)","Dragoon Battle Armor (Sqd5)","Dragoon Battle Armor (Sqd6)","Elemental Battle Armor (Fire) [AP Gauss] (Sqd4)","Elemental Battle Armor (Fire) [AP Gauss] (Sqd5)","Elemental Battle Armor (Fire) [AP Gauss] (Sqd6)","Elemental Battle Armor (Fire) [Flamer] (Sqd4)","Elemental Battle Armor (Fire) [Flamer] (Sqd5)","Elemental Battle Armor (Fire) [Flamer] (Sqd6)","Elemental Battle Armor (Fire) [MicroPL] (Sqd4)","Elemental Battle Armor (Fire) [MicroPL] (Sqd5)","Elemental Battle Armor (Fire) [MicroPL] (Sqd6)","Elemental Battle Armor (Headhunter) (Sqd3)","Elemental Battle Armor (Headhunter) (Sqd4)","Elemental Battle Armor (Headhunter) (Sqd5)","Elemental Battle Armor (Headhunter) (Sqd6)","Elemental Battle Armor (Space) [Flamer] (Sqd4)","Elemental Battle Armor (Space) [Flamer] (Sqd5)","Elemental Battle Armor (Space) [Flamer] (Sqd6)","Elemental Battle Armor (Space) [MG] (Sqd4)","Elemental Battle Armor (Space) [MG] (Sqd5)","Elemental Battle Armor (Space) [MG] (Sqd6)","Elemental Battle Armor (Space) [MicroPL] (Sqd4)","Elemental Battle Armor (Space) [MicroPL] (Sqd5)","Elemental Battle Armor (Space) [MicroPL] (Sqd6)","Elemental Battle Armor [AP Gauss] (Sqd3)","Elemental Battle Armor [AP Gauss] (Sqd4)","Elemental Battle Armor [AP Gauss] (Sqd5)","Elemental Battle Armor [AP Gauss] (Sqd6)","Elemental Battle Armor [ERMicroL] (Sqd3)","Elemental Battle Armor [ERMicroL] (Sqd4)","Elemental Battle Armor [ERMicroL] (Sqd5)","Elemental Battle Armor [ERMicroL] (Sqd6)","Elemental Battle Armor [Flamer] (Sqd3)","Elemental Battle Armor [Flamer] (Sqd4)","Elemental Battle Armor [Flamer] (Sqd5)","Elemental Battle Armor [Flamer] (Sqd6)","Elemental Battle Armor [HMG] (Sqd3)","Elemental Battle Armor [HMG] (Sqd4)","Elemental Battle Armor [HMG] (Sqd5)","Elemental Battle Armor [HMG] (Sqd6)","Elemental Battle Armor [Laser] (Sqd3)","Elemental Battle Armor [Laser] (Sqd4)","Elemental Battle Armor [Laser] (Sqd5)","Elemental Battle Armor [Laser] (Sqd6)","Elemental Battle Armor [MG] (Sqd3)","Elemental Battle Armor [MG] (Sqd4)","Elemental Battle Armor [MG] (Sqd5)","Elemental Battle Armor [MG] (Sqd6)","Elemental Battle Armor [MicroPL] (Sqd3)","Elemental Battle Armor [MicroPL] (Sqd4)","Elemental Battle Armor [MicroPL] (Sqd5)","Elemental Battle Armor [MicroPL] (Sqd6)","Elemental II Battle Armor (Sqd4)","Elemental II Battle Armor (Sqd5)","Elemental II Battle Armor (Sqd6)","Elemental III Battle Armor [AP Gauss] (Sqd4)","Elemental III Battle Armor [AP Gauss] (Sqd5)","Elemental III Battle Armor [AP Gauss] (Sqd6)","Elemental III Battle Armor [Flamer] (Sqd4)","Elemental III Battle Armor [Flamer] (Sqd5)","Elemental III Battle Armor [Flamer] (Sqd6)","Elemental III Battle Armor [MicroPL] (Sqd4)","Elemental III Battle Armor [MicroPL] (Sqd5)","Elemental III Battle Armor [MicroPL] (Sqd6)","Fa Shih Battle Armor (Support) [King David] (Sqd4)","Fa Shih Battle Armor (Support) [King David] (Sqd5)","Fa Shih Battle Armor (Support) [King David] (Sqd6)","Fa Shih Battle Armor (Support) [Plasma] (Sqd4)","Fa Shih Battle Armor (Support) [Plasma] (Sqd5)","Fa Shih Battle Armor (Support) [Plasma] (Sqd6)","Fa Shih Battle Armor [Flamer] (Sqd4)","Fa Shih Battle Armor [Flamer] (Sqd5)","Fa Shih Battle Armor [Flamer] (Sqd6)","Fa Shih Battle Armor [Laser] (Sqd4)","Fa Shih Battle Armor [Laser] (Sqd5)","Fa Shih Battle Armor [Laser] (Sqd6)","Fa Shih Battle Armor [LRR] (Sqd4)","Fa Shih Battle Armor [LRR] (Sqd5)","Fa Shih Battle Armor [LRR] (Sqd6)","Fa Shih Battle Armor [MG] (Sqd4)","Fa Shih Battle Armor [MG] (Sqd5)","Fa Shih Battle Armor [MG] (Sqd6)","Fa Shih Battle Armor [TAG] (Sqd4)","Fa Shih Battle Armor [TAG] (Sqd5)","Fa Shih Battle Armor [TAG] (Sqd6)","Fa Shih Battle Armor 2 [MG] (Sqd4)","Fa Shih Battle Armor 2 [MG] (Sqd5)","Fa Shih Battle Armor 2 [MG] (Sqd6)","Gray Death Infiltrator Suit [Firedrake] (Sqd4)","Gray Death Infiltrator Suit [Firedrake] (Sqd5)","Gray Death Infiltrator Suit [Firedrake] (Sqd6)","Gray Death Infiltrator Suit [Mines] (Sqd4)","Gray Death Infiltrator Suit [Mines] (Sqd5)","Gray Death Infiltrator Suit [Mines] (Sqd6)","Gray Death Infiltrator Suit [Remote Sensors] (Sqd4)","Gray Death Infiltrator Suit [Remote Sensors] (Sqd5)","Gray Death Infiltrator Suit [Remote Sensors] (Sqd6)","Gray Death Infiltrator Suit [Sensors] (Sqd4)","Gray Death Infiltrator Suit [Sensors] (Sqd5)","Gray Death Infiltrator Suit [Sensors] (Sqd6)","Gray Death Infiltrator Suit [TAG] (Sqd4)","Gray Death Infiltrator Suit [TAG] (Sqd5)","Gray Death Infiltrator Suit [TAG] (Sqd6)","Gray Death Standard Suit [Flamer] (Sqd4)","Gray Death Standard Suit [Flamer] (Sqd5)","Gray Death Standard Suit [Flamer] (Sqd6)","Gray Death Standard Suit [Laser] (Sqd4)","Gray Death Standard Suit [Laser] (Sqd5)","Gray Death Standard Suit [Laser] (Sqd6)","Gray Death Standard Suit [LRR] (Sqd4)","Gray Death Standard Suit [LRR] (Sqd5)","Gray Death Standard Suit [LRR] (Sqd6)","Gray Death Standard Suit [MG] (Sqd4)","Gray Death Standard Suit [MG] (Sqd5)","Gray Death Standard Suit [MG] (Sqd6)","Gray Death Standard Suit [SRM] (Sqd4)","Gray Death Standard Suit [SRM] (Sqd5)","Gray Death Standard Suit [SRM] (Sqd6)","Gray Death Strike Suit (Harjel) (Sqd4)","Gray Death Strike Suit (HarJel) (Sqd5)","Gray Death Strike Suit (HarJel) (Sqd6)","Gray Death Strike Suit (Prototype) (Sqd4)","Gray Death Strike Suit (Prototype) (Sqd5)","Gray Death Strike Suit (Prototype) (Sqd6)","Gray Death Strike Suit (Sqd4)","Gray Death Strike Suit (Sqd5)","Gray Death Strike Suit (Sqd6)","Infiltrator Mk. II Battle Armor \"Puma\" (Sqd4)","Infiltrator Mk. II Battle Armor \"Puma\" (Sqd5)","Infiltrator Mk. II Battle Armor \"Puma\" (Sqd6)","Infiltrator Mk. II Battle Armor (Magnetic) (Sqd4)","Infiltrator Mk. II Battle Armor (Magnetic) (Sqd5)","Infiltrator Mk. II Battle Armor (Magnetic) (Sqd6)","Infiltrator Mk. II Battle Armor (Marine) (Sqd4)","Infiltrator Mk. II Battle Armor (Marine) (Sqd5)","Infiltrator Mk. II Battle Armor (Marine) (Sqd6)","Infiltrator Mk. II Battle Armor (Sensor) (Sqd4)","Infiltrator Mk. II Battle Armor (Sensor) (Sqd5)","Infiltrator Mk. II Battle Armor (Sensor) (Sqd6)","Infiltrator Mk. II Battle Armor Coral Intent (Sqd4)","Infiltrator Mk. II Battle Armor Coral Intent (Sqd5)","Infiltrator Mk. II Battle Armor Coral Intent (Sqd6)","IS Standard Battle Armor \"Baka\" [LRR] (Sqd4)","IS Standard Battle Armor \"Baka\" [LRR] (Sqd5)","IS Standard Battle Armor \"Baka\" [LRR] (Sqd6)","IS Standard Battle Armor \"Baka\" [SL] (Sqd4)","IS Standard Battle Armor \"Baka\" [SL] (Sqd5)","IS Standard Battle Armor \"Baka\" [SL] (Sqd6)","IS Standard Battle Armor \"Fa Sure\" [David] (Sqd4)","IS Standard Battle Armor \"Fa Sure\" [David] (Sqd5)","IS Standard Battle Armor \"Fa Sure\" [David] (Sqd6)","IS Standard Battle Armor \"Fa Sure\" [MG] (Sqd4)","IS Standard Battle Armor \"Fa Sure\" [MG] (Sqd5)","IS Standard Battle Armor \"Fa Sure\" [MG] (Sqd6)","IS Standard Battle Armor \"Hive\" (Sqd4)","IS Standard Battle Armor \"Hive\" (Sqd5)","IS Standard Battle Armor \"Hive\" (Sqd6)","IS Standard Battle Armor (Magnetic) (Sqd4)","IS Standard Battle Armor (Magnetic) (Sqd5)","IS Standard Battle Armor (Magnetic) (Sqd6)","IS Standard Battle Armor [Flamer] (Sqd4)","IS Standard Battle Armor [Flamer] (Sqd5)","IS Standard Battle Armor [Flamer] (Sqd6)","IS Standard Battle Armor [Laser] (Sqd4)","IS Standard Battle Armor [Laser] (Sqd5)","IS Standard Battle Armor [Laser] (Sqd6)","IS Standard Battle Armor [LRR] (Sqd4)","IS Standard Battle Armor [LRR] (Sqd5)","IS Standard Battle Armor [LRR] (Sqd6)","IS Standard Battle Armor [MG] (Sqd4)","IS Standard Battle Armor [MG] (Sqd5)","IS Standard Battle Armor [MG] (Sqd6)","IS Standard Battle Armor [SRM] (Sqd4)","IS Standard Battle Armor [SRM] (Sqd5)","IS Standard Battle Armor [SRM] (Sqd6)","Leonidas Battle Armor [David] (Sqd4)","Leonidas Battle Armor [David] (Sqd5)","Leonidas Battle Armor [David] (Sqd6)","Leonidas Battle Armor [Firedrake] (Sqd4)","Leonidas Battle Armor [Firedrake] (Sqd5)","Leonidas Battle Armor [Firedrake] (Sqd6)","Leonidas Battle Armor [MG] (Sqd4)","Leonidas Battle Armor [MG] (Sqd5)","Leonidas Battle Armor [MG] (Sqd6)","Leonidas Battle Armor [Sensor] (Sqd4)","Leonidas Battle Armor [Sensor] (Sqd5)","Leonidas Battle Armor [Sensor] (Sqd6)","Leonidas Battle Armor [TAG] (Sqd4)","Leonidas Battle Armor [TAG] (Sqd5)","Leonidas Battle Armor [TAG] (Sqd6)","Longinus Battle Armor \"Hacked\" [David] (Sqd4)","Longinus Battle Armor \"Hacked\" [David] (Sqd5)","Longinus Battle Armor \"Hacked\" [David] (Sqd6)","Longinus Battle Armor \"Hacked\" [MG] (Sqd4)","Longinus Battle Armor \"Hacked\" [MG] (Sqd5)","Longinus Battle Armor \"Hacked\" [MG] (Sqd6)","Longinus Battle Armor (Magnetic) (Sqd4)","Longinus Battle Armor (Magnetic) (Sqd5)","Longinus Battle Armor (Magnetic) (Sqd6)","Longinus Battle Armor [David] (Sqd4)","Longinus Battle Armor [David] (Sqd5)","Longinus Battle Armor [David] (Sqd6)","Longinus Battle Armor [Flamer] (Sqd4)","Longinus Battle Armor [Flamer] (Sqd5)","Longinus Battle Armor [Flamer] (Sqd6)","Longinus Battle Armor [Laser] (Sqd4)","Longinus Battle Armor [Laser] (Sqd5)","Longinus Battle Armor [Laser] (Sqd6)","Longinus Battle Armor [MG] (Sqd4)","Longinus Battle Armor [MG] (Sqd5)","Longinus Battle Armor [MG] (Sqd6)","Longinus C Battle Armor [MRR] (Sqd4)","Longinus C Battle Armor [MRR] (Sqd5)","Longinus C Battle Armor [MRR] (Sqd6)","Longinus C Battle Armor [PPC] (Sqd4)","Longinus C Battle Armor [PPC] (Sqd5)","Longinus C Battle Armor [PPC] (Sqd6)","Oni Battle Armor [Bearhunter] (Sqd4)","Oni Battle Armor [Bearhunter] (Sqd5)","Oni Battle Armor [Bearhunter] (Sqd6)","Oni Battle Armor [MRR] (Sqd4)","Oni Battle Armor [MRR] (Sqd5)","Oni Battle Armor [MRR] (Sqd6)","Oni Battle Armor [Narc] (Sqd4)","Oni Battle Armor [Narc] (Sqd5)","Oni Battle Armor [Narc] (Sqd6)","Oni Battle Armor [PPC] (Sqd4)","Oni Battle Armor [PPC] (Sqd5)","Oni Battle Armor [PPC] (Sqd6)","Purifier Adaptive Battle Armor [Laser] (Sqd4)","Purifier Adaptive Battle Armor [Laser] (Sqd5)","Purifier Adaptive Battle Armor [Laser] (Sqd6)","Purifier Adaptive Battle Armor [Narc] (Sqd4)","Purifier Adaptive Battle Armor [Narc] (Sqd5)","Purifier Adaptive Battle Armor [Narc] (Sqd6)","Purifier Adaptive Battle Armor [PPC] (Sqd4)","Purifier Adaptive Battle Armor [PPC] (Sqd5)","Purifier Adaptive Battle Armor [PPC] (Sqd6)","Purifier Adaptive Battle Armor [TAG] (Sqd4)","Purifier Adaptive Battle Armor [TAG] (Sqd5)","Purifier Adaptive Battle Armor [TAG] (Sqd6)","Purifier Terra Battle Armor [AP Gauss] (Sqd4)","Purifier Terra Battle Armor [AP Gauss] (Sqd5)","Purifier Terra Battle Armor [AP Gauss] (Sqd6)","Purifier Terra Battle Armor [ERSL] (Sqd4)","Purifier Terra Battle Armor [ERSL] (Sqd5)","Purifier Terra Battle Armor [ERSL] (Sqd6)","Purifier Terra Battle Armor [MRR] (Sqd4)","Purifier Terra Battle Armor [MRR] (Sqd5)","Purifier Terra Battle Armor [MRR] (Sqd6)","Purifier Terra Battle Armor [SPL] (Sqd4)","Purifier Terra Battle Armor [SPL] (Sqd5)","Purifier Terra Battle Armor [SPL] (Sqd6)","Quirinus Battle Armor [David] (Sqd4)","Quirinus Battle Armor [David] (Sqd5)","Quirinus Battle Armor [David] (Sqd6)","Quirinus Battle Armor [GL] (Sqd4)","Quirinus Battle Armor [GL] (Sqd5)","Quirinus Battle Armor [GL] (Sqd6)","Quirinus Battle Armor [MG] (Sqd4)","Quirinus Battle Armor [MG] (Sqd5)","Quirinus Battle Armor [MG] (Sqd6)","Raiden Battle Armor (Anti-Infantry) (Sqd4)","Raiden Battle Armor (Anti-Infantry) (Sqd5)","Raiden Battle Armor (Anti-Infantry) (Sqd6)","Raiden Battle Armor (Original) (Sqd4)","Raiden Battle Armor (Original) (Sqd5)","Raiden Battle Armor (Original) (Sqd6)","Raiden Battle Armor [Flamer] (Sqd4)","Raiden Battle Armor [Flamer] (Sqd5)","Raiden Battle Armor [Flamer] (Sqd6)","Raiden Battle Armor [Laser] (Sqd4)","Raiden Battle Armor [Laser] (Sqd5)","Raiden Battle Armor [Laser] (Sqd6)","Raiden Battle Armor [MG] (Sqd4)","Raiden Battle Armor [MG] (Sqd5)","Raiden Battle Armor [MG] (Sqd6)","Raiden Battle Armor [MRM] (Sqd4)","Raiden Battle Armor [MRM] (Sqd5)","Raiden Battle Armor [MRM] (Sqd6)","Raiden Battle Armor [Tsunami] (Sqd4)","Raiden Battle Armor [Tsunami] (Sqd5)","Raiden Battle Armor [Tsunami] (Sqd6)","Raiden II Battle Armor [Flamer] (Sqd4)","Raiden II Battle Armor [Flamer] (Sqd5)","Raiden II Battle Armor [Flamer] (Sqd6)","Raiden II Battle Armor [HMG] (Sqd4)","Raiden II Battle Armor [HMG] (Sqd5)","Raiden II Battle Armor [HMG] (Sqd6)","Rottweiler Battle Armor (Close Combat) (Sqd4)","Rottweiler Battle Armor (Close Combat) (Sqd5)","Rottweiler Battle Armor (Close Combat) (Sqd6)","Rottweiler Battle Armor (Firedrake) (Sqd4)","Rottweiler Battle Armor (Firedrake) (Sqd5)","Rottweiler Battle Armor (Firedrake) (Sqd6)","Rottweiler Battle Armor (Sqd4)","Rottweiler Battle Armor (Sqd5)","Rottweiler Battle Armor (Sqd6)","Rottweiler Battle Armor (Upgrade) (Sqd4)","Rottweiler Battle Armor (Upgrade) (Sqd5)","Rottweiler Battle Armor (Upgrade) (Sqd6)","Salamander Battle Armor (Anti-Infantry) (Sqd4)","Salamander Battle Armor (Anti-Infantry) (Sqd5)","Salamander Battle Armor (Anti-Infantry) (Sqd6)","Salamander Battle Armor (Laser) (Sqd4)","Salamander Battle Armor (Laser) (Sqd5)","Salamander Battle Armor (Laser) (Sqd6)","Salamander Battle Armor (Sqd3)","Salamander Battle Armor (Sqd4)","Salamander Battle Armor (Sqd5)","Salamander Battle Armor (Sqd6)","Se'irim Medium Battle Armor (Anti-Infantry) (Sqd4)","Se'irim Medium Battle Armor (Anti-Infantry) (Sqd5)","Se'irim Medium Battle Armor (Anti-Infantry) (Sqd6)","Se'irim Medium Battle Armor (Capture Team) (Sqd4)","Se'irim Medium Battle Armor (Capture Team) (Sqd5)","Se'irim Medium Battle Armor (Capture Team) (Sqd6)","Se'irim Medium Battle Armor (Sqd4)","Se'irim Medium Battle Armor (Sqd5)","Se'irim Medium Battle Armor (Sqd6)","Simian Battle Armor [Flamer] (Sqd4)","Simian Battle Armor [Flamer] (Sqd5)","Simian Battle Armor [Flamer] (Sqd6)","Simian Battle Armor [HMG] (Sqd4)","Simian Battle Armor [HMG] (Sqd5)","Simian Battle Armor [HMG] (Sqd6)","Simian Battle Armor [LRR] (Sqd4)","Simian Battle Armor [LRR] (Sqd5)","Simian Battle Armor [LRR] (Sqd6)","Simian Battle Armor [SL] (Sqd4)","Simian Battle Armor [SL] (Sqd5)","Simian Battle Armor [SL] (Sqd6)","Surat (Gray Death) Solahma Suit (Sqd4)","Surat (Gray Death) Solahma Suit (Sqd5)","Surat (Gray Death) Solahma Suit (Sqd6)","TinStar Battle Armor (Original) (Sqd4)","TinStar Battle Armor (Original) (Sqd5)","TinStar Battle Armor (Original) (Sqd6)","TinStar Battle Armor (Sqd4)","TinStar Battle Armor (Sqd5)","TinStar Battle Armor (Sqd6)","Trinity Medium Battle Armor (Asterion Upgrade) [MRR] (Sqd4)","Trinity Medium Battle Armor (Asterion Upgrade) [MRR] (Sqd5)","Trinity Medium Battle Armor (Asterion Upgrade) [MRR] (Sqd6)","Trinity Medium Battle Armor (Asterion Upgrade) [PPC] (Sqd4)","Trinity Medium Battle Armor (Asterion Upgrade) [PPC] (Sqd5)","Trinity Medium Battle Armor (Asterion Upgrade) [PPC] (Sqd6)","Trinity Medium Battle Armor (Asterion) [MRR] (Sqd4)","Trinity Medium Battle Armor (Asterion) [MRR] (Sqd5)","Trinity Medium Battle Armor (Asterion) [MRR] (Sqd6)","Trinity Medium Battle Armor (Asterion) [PPC] (Sqd4)","Trinity Medium Battle Armor (Asterion) [PPC] (Sqd5)","Trinity Medium Battle Armor (Asterion) [PPC] (Sqd6)","Trinity Medium Battle Armor (Theseus RL)  [LRR] (Sqd4)","Trinity Medium Battle Armor (Theseus RL) [LRR] (Sqd5)","Trinity Medium Battle Armor (Theseus RL) [LRR] (Sqd6)","Trinity Medium Battle Armor (Theseus Support) \"Killshot\" (Sqd4)","Trinity Medium Battle Armor (Theseus Support) \"Killshot\" (Sqd5)","Trinity Medium Battle Armor (Theseus Support) \"Killshot\" (Sqd6)","Trinity Medium Battle Armor (Theseus) [MRR] (Sqd4)","Trinity Medium Battle Armor (Theseus) [MRR] (Sqd5)","Trinity Medium Battle Armor (Theseus) [MRR] (Sqd6)","Trinity Medium Battle Armor (Ying Long BC3) [David] (Sqd4)","Trinity Medium Battle Armor (Ying Long BC3) [David] (Sqd5)","Trinity Medium Battle Armor (Ying Long BC3) [David] (Sqd6)","Trinity Medium Battle Armor (Ying Long) [Plasma] (Sqd4)","Trinity Medium Battle Armor (Ying Long) [Plasma] (Sqd5)","Trinity Medium Battle Armor (Ying Long) [Plasma] (Sqd6)","Undine Battle Armor (Sqd4)","Undine Battle Armor (Sqd5)","Undine Battle Armor (Sqd6)","Undine Battle Armor (Upgrade) (Sqd4)","Undine Battle Armor (Upgrade) (Sqd5)","Undine Battle Armor (Upgrade) (Sqd6)","Void Medium Battle Armor (DCA) (Sqd4)","Void Medium Battle Armor (DCA) (Sqd5)","Void Medium Battle Armor (DCA) (Sqd6)","Void Medium Battle Armor (Minelayer) (Sqd4)","Void Medium Battle Armor (Minelayer) (Sqd5)","Void Medium Battle Armor (Minelayer) (Sqd6)","Void Medium Battle Armor (Nova Cat) (Sqd4)","Void Medium Battle Armor (Nova Cat) (Sqd5)","Void Medium Battle Armor (Nova Cat) (Sqd6)","Void Medium Battle Armor (Sqd4)","Void Medium Battle Armor (Sqd5)","Void Medium Battle Armor (Sqd6)","Void Medium Battle Armor Caltrop (Sqd4)","Void Medium Battle Armor Caltrop (Sqd5)","Void Medium Battle Armor Caltrop (Sqd6)","Water Elemental Mining Suit (Sqd5)","Wraith Battle Armor (Anti-Infantry) (Sqd4)","Wraith Battle Armor (Anti-Infantry) (Sqd5)","Wraith Battle Armor (Anti-Infantry) (Sqd6)","Wraith Battle Armor (Sqd4)","Wraith Battle Armor (Sqd5)","Wraith Battle Armor (Sqd6)","Black Wolf Battle Armor [ERSPL] (Sqd4)","Black Wolf Battle Armor [ERSPL] (Sqd5)","Black Wolf Battle Armor [ERSPL] (Sqd6)","Black Wolf Battle Armor [Heavy Flamer] (Sqd4)","Black Wolf Battle Armor [Heavy Flamer] (Sqd5)","Black Wolf Battle Armor [Heavy Flamer] (Sqd6)","Black Wolf Battle Armor [Heavy Mortar] (Sqd4)","Black Wolf Battle Armor [Heavy Mortar] (Sqd5)","Black Wolf Battle Armor [Heavy Mortar] (Sqd6)","Black Wolf Battle Armor [LB-X] (Sqd4)","Black Wolf Battle Armor [LB-X] (Sqd5)","Black Wolf Battle Armor [LB-X] (Sqd6)","Black Wolf Battle Armor [Plasma] (Sqd4)","Black Wolf Battle Armor [Plasma] (Sqd5)","Black Wolf Battle Armor [Plasma] (Sqd6)","Centaur Battle Armor (Sqd4)","Centaur Battle Armor (Sqd5)","Centaur Battle Armor (Sqd6)","Corona Heavy Battle Armor (Sqd4)","Corona Heavy Battle Armor (Sqd5)","Corona Heavy Battle Armor (Sqd6)","Corona Heavy Battle Armor (SRM) (Sqd4)","Corona Heavy Battle Armor (SRM) (Sqd5)","Corona Heavy Battle Armor (SRM) (Sqd6)","Cuchulainn Support Armor (Sqd4)","Cuchulainn Support Armor (Sqd5)","Cuchulainn Support Armor (Sqd6)","Elemental II Battle Armor X (Sqd4)","Elemental II Battle Armor X (Sqd5)","Elemental II Battle Armor X (Sqd6)","Gnome Battle Armor \"Dwarf\" (Sqd4)","Gnome Battle Armor (LRM) (Sqd4)","Gnome Battle Armor (LRM) (Sqd5)","Gnome Battle Armor (LRM) (Sqd6)","Gnome Battle Armor (Sqd3)","Gnome Battle Armor (Sqd4)","Gnome Battle Armor (Sqd5)","Gnome Battle Armor (Sqd6)","Gnome Battle Armor (Upgrade) [Bearhunter] (Sqd4)","Gnome Battle Armor (Upgrade) [Bearhunter] (Sqd5)","Gnome Battle Armor (Upgrade) [Bearhunter] (Sqd6)","Gnome Battle Armor (Upgrade) [MRR] (Sqd4)","Gnome Battle Armor (Upgrade) [MRR] (Sqd5)","Gnome Battle Armor (Upgrade) [MRR] (Sqd6)","Gnome Battle Armor (Upgrade) [Pulse Laser] (Sqd4)","Gnome Battle Armor (Upgrade) [Pulse Laser] (Sqd5)","Gnome Battle Armor (Upgrade) [Pulse Laser] (Sqd6)","Gray Death Heavy Suit (Sqd4)","Gray Death Heavy Suit (Sqd5)","Gray Death Heavy Suit (Sqd6)","Grenadier II Battle Armor A (Sqd4)","Grenadier II Battle Armor A (Sqd5)","Grenadier II Battle Armor A (Sqd6)","Grenadier II Battle Armor B (Sqd4)","Grenadier II Battle Armor B (Sqd5)","Grenadier II Battle Armor B (Sqd6)","Grenadier II Battle Armor C (Sqd4)","Grenadier II Battle Armor C (Sqd5)","Grenadier II Battle Armor C (Sqd6)","Grenadier II Battle Armor D (Sqd4)","Grenadier II Battle Armor D (Sqd5)","Grenadier II Battle Armor D (Sqd6)","Marauder Battle Armor (Sqd4)","Marauder Battle Armor (Sqd5)","Marauder Battle Armor (Sqd6)","Ogre Battle Armor (Interdictor) (Sqd4)","Ogre Battle Armor (Interdictor) (Sqd5)","Ogre Battle Armor (Interdictor) (Sqd6)","Ogre Battle Armor (Sqd4)","Ogre Battle Armor (Sqd5)","Ogre Battle Armor (Sqd6)","Phalanx Battle Armor A (Sqd4)","Phalanx Battle Armor A (Sqd5)","Phalanx Battle Armor A (Sqd6)","Phalanx Battle Armor B (Sqd4)","Phalanx Battle Armor B (Sqd5)","Phalanx Battle Armor B (Sqd6)","Phalanx Battle Armor C (Sqd4)","Phalanx Battle Armor C (Sqd5)","Phalanx Battle Armor C (Sqd6)","Phalanx Battle Armor D (Sqd4)","Phalanx Battle Armor D (Sqd5)","Phalanx Battle Armor D (Sqd6)","Rhino Battle Armor (Sqd4)","Rhino Battle Armor (Sqd5)","Rhino Battle Armor (Sqd6)","Rogue Bear Heavy Battle Armor (Hybrid) (Sqd4)","Rogue Bear Heavy Battle Armor (Hybrid) (Sqd5)","Rogue Bear Heavy Battle Armor (Hybrid) (Sqd6)","Rogue Bear Heavy Battle Armor (Sqd4)","Rogue Bear Heavy Battle Armor (Sqd5)","Rogue Bear Heavy Battle Armor (Sqd6)","Rogue Bear Heavy Battle Armor (Upgrade) (Sqd4)","Rogue Bear Heavy Battle Armor (Upgrade) (Sqd5)","Rogue Bear Heavy Battle Armor (Upgrade) (Sqd6)","Rogue Bear Heavy Battle Armor HR (Sqd4)","Rogue Bear Heavy Battle Armor HR (Sqd5)","Rogue Bear Heavy Battle Armor HR (Sqd6)","Shen Long Battle Armor [David] (Sqd4)","Shen Long Battle Armor [David] (Sqd5)","Shen Long Battle Armor [David] (Sqd6)","Shen Long Battle Armor [Interdictor] (Sqd4)","Shen Long Battle Armor [Interdictor] (Sqd5)","Shen Long Battle Armor [Interdictor] (Sqd6)","Shen Long Battle Armor [MG] (Sqd4)","Shen Long Battle Armor [MG] (Sqd5)","Shen Long Battle Armor [MG] (Sqd6)","Shen Long Battle Armor [MRM] (Sqd4)","Shen Long Battle Armor [MRM] (Sqd5)","Shen Long Battle Armor [MRM] (Sqd6)","Shen Long Battle Armor [Pop-Up Mine] (Sqd4)","Shen Long Battle Armor [Pop-Up Mine] (Sqd5)","Shen Long Battle Armor [Pop-Up Mine] (Sqd6)","Shen Long Battle Armor [SRM] (Sqd4)","Shen Long Battle Armor [SRM] (Sqd5)","Shen Long Battle Armor [SRM] (Sqd6)","Sloth Battle Armor \"Huntsman\" (Sqd4)","Sloth Battle Armor \"Huntsman\" (Sqd5)","Sloth Battle Armor \"Huntsman\" (Sqd6)","Sloth Battle Armor (Interdictor) (Sqd4)","Sloth Battle Armor (Interdictor) (Sqd5)","Sloth Battle Armor (Interdictor) (Sqd6)","Sloth Battle Armor (Sqd4)","Sloth Battle Armor (Sqd5)","Sloth Battle Armor (Sqd6)","Stormbird Battle Armor (Jade Falcon) (Sqd4)","Stormbird Battle Armor (Jade Falcon) (Sqd5)","Stormbird Battle Armor (Jade Falcon) (Sqd6)","Stormbird Battle Armor (Sqd4)","Stormbird Battle Armor (Sqd5)","Stormbird Battle Armor (Sqd6)","Taranis Battle Armor (Sqd4)","Taranis Battle Armor (Sqd5)","Taranis Battle Armor (Sqd6)","Tengu Heavy Battle Armor (Support) [LRR] (Sqd4)","Tengu Heavy Battle Armor (Support) [LRR] (Sqd5)","Tengu Heavy Battle Armor (Support) [LRR] (Sqd6)","Tengu Heavy Battle Armor (SVSP) (Sqd4)","Tengu Heavy Battle Armor (SVSP) (Sqd5)","Tengu Heavy Battle Armor (SVSP) (Sqd6)","Tengu Heavy Battle Armor [C3i] (Sqd4)","Tengu Heavy Battle Armor [C3i] (Sqd5)","Tengu Heavy Battle Armor [C3i] (Sqd6)","Tengu Heavy Battle Armor [ML] (Sqd4)","Tengu Heavy Battle Armor [ML] (Sqd5)","Tengu Heavy Battle Armor [ML] (Sqd6)","Tengu Heavy Battle Armor [Plasma] (Sqd4)","Tengu Heavy Battle Armor [Plasma] (Sqd5)","Tengu Heavy Battle Armor [Plasma] (Sqd6)","Tengu Heavy Battle Armor [RL] (Sqd4)","Tengu Heavy Battle Armor [RL] (Sqd5)","Tengu Heavy Battle Armor [RL] (Sqd6)","Thunderbird Battle Armor (Upgrade) [ER Laser] (Sqd4)","Thunderbird Battle Armor (Upgrade) [ER Laser] (Sqd5)","Thunderbird Battle Armor (Upgrade) [ER Laser] (Sqd6)","Thunderbird Battle Armor (Upgrade) [LB-X] (Sqd4)","Thunderbird Battle Armor (Upgrade) [LB-X] (Sqd5)","Thunderbird Battle Armor (Upgrade) [LB-X] (Sqd6)","Thunderbird Battle Armor (Upgrade) [Pulse Laser] (Sqd4)","Thunderbird Battle Armor (Upgrade) [Pulse Laser] (Sqd5)","Thunderbird Battle Armor (Upgrade) [Pulse Laser] (Sqd6)","Thunderbird Battle Armor [AP Gauss] (Sqd4)","Thunderbird Battle Armor [AP Gauss] (Sqd5)","Thunderbird Battle Armor [AP Gauss] (Sqd6)","Thunderbird Battle Armor [ER Laser] (Sqd4)","Thunderbird Battle Armor [ER Laser] (Sqd5)","Thunderbird Battle Armor [ER Laser] (Sqd6)","Thunderbird Battle Armor [Pulse Laser] (Sqd4)","Thunderbird Battle Armor [Pulse Laser] (Sqd5)","Thunderbird Battle Armor [Pulse Laser] (Sqd6)","Thunderbird II Battle Armor (Sqd4)","Thunderbird II Battle Armor (Sqd5)","Thunderbird II Battle Armor (Sqd6)","Undine Battle Armor \"Sebastian\" (Sqd4)","Zou Heavy Battle Armor (C3) (Sqd4)","Zou Heavy Battle Armor (C3) (Sqd5)","Zou Heavy Battle Armor (C3) (Sqd6)","Zou Heavy Battle Armor (Sqd4)","Zou Heavy Battle Armor (Sqd5)","Zou Heavy Battle Armor (Sqd6)","Fenrir Battle Armor \"Longshot\" (Sqd4)","Fenrir Battle Armor \"Longshot\" (Sqd5)","Fenrir Battle Armor \"Longshot\" (Sqd6)","Fenrir Battle Armor [ERML] (Sqd4)","Fenrir Battle Armor [ERML] (Sqd5)","Fenrir Battle Armor [ERML] (Sqd6)","Fenrir Battle Armor [MG] (Sqd4)","Fenrir Battle Armor [MG] (Sqd5)","Fenrir Battle Armor [MG] (Sqd6)","Fenrir Battle Armor [Mortar] (Sqd4)","Fenrir Battle Armor [Mortar] (Sqd5)","Fenrir Battle Armor [Mortar] (Sqd6)","Fenrir Battle Armor [MPL] (Sqd4)","Fenrir Battle Armor [MPL] (Sqd5)","Fenrir Battle Armor [MPL] (Sqd6)","Fenrir Battle Armor [SL] (Sqd4)","Fenrir Battle Armor [SL] (Sqd5)","Fenrir Battle Armor [SL] (Sqd6)","Fenrir Battle Armor [SPL] (Sqd4)","Fenrir Battle Armor [SPL] (Sqd5)","Fenrir Battle Armor [SPL] (Sqd6)","Fenrir Battle Armor [SRM] (Sqd4)","Fenrir Battle Armor [SRM] (Sqd5)","Fenrir Battle Armor [SRM] (Sqd6)","Fenrir Battle Armor [VSP] (Sqd4)","Fenrir Battle Armor [VSP] (Sqd5)","Fenrir Battle Armor [VSP] (Sqd6)","Fenrir II Assault Battle Armor [AI] (Sqd4)","Fenrir II Assault Battle Armor [AI] (Sqd5)","Fenrir II Assault Battle Armor [AI] (Sqd6)","Fenrir II Assault Battle Armor [LRM] (Sqd4)","Fenrir II Assault Battle Armor [LRM] (Sqd5)","Fenrir II Assault Battle Armor [LRM] (Sqd6)","Fenrir II Assault Battle Armor [ML] (Sqd4)","Fenrir II Assault Battle Armor [ML] (Sqd5)","Fenrir II Assault Battle Armor [ML] (Sqd6)","Fenrir II Assault Battle Armor [MRR] (Sqd4)","Fenrir II Assault Battle Armor [MRR] (Sqd5)","Fenrir II Assault Battle Armor [MRR] (Sqd6)","Fenrir II Assault Battle Armor [SRM] (Sqd4)","Fenrir II Assault Battle Armor [SRM] (Sqd5)","Fenrir II Assault Battle Armor [SRM] (Sqd6)","Fusilier Battle Armor (Sqd4)","Fusilier Battle Armor (Sqd5)","Fusilier Battle Armor (Sqd6)","Fusilier Battle Armor (Upgrade) (Sqd4)","Fusilier Battle Armor (Upgrade) (Sqd5)","Fusilier Battle Armor (Upgrade) (Sqd6)","Golem Assault Armor (Fast Assault) (Sqd4)","Golem Assault Armor (Fast Assault) (Sqd5)","Golem Assault Armor (Fast Assault) (Sqd6)","Golem Assault Armor (Rock Golem) (Sqd4)","Golem Assault Armor (Rock Golem) (Sqd5)","Golem Assault Armor (Rock Golem) (Sqd6)","Golem Assault Armor (Sqd4)","Golem Assault Armor (Sqd5)","Golem Assault Armor (Sqd6)","Golem Assault Armor (Support) (Sqd4)","Golem Assault Armor (Support) (Sqd5)","Golem Assault Armor (Support) (Sqd6)","Grenadier Battle Armor (Hunter-Killer) [C3/HRR] (Sqd4)","Grenadier Battle Armor (Hunter-Killer) [C3/HRR] (Sqd5)","Grenadier Battle Armor (Hunter-Killer) [C3/HRR] (Sqd6)","Grenadier Battle Armor (Hunter-Killer) [SRM/MagShot] (Sqd4)","Grenadier Battle Armor (Hunter-Killer) [SRM/MagShot] (Sqd5)","Grenadier Battle Armor (Hunter-Killer) [SRM/MagShot] (Sqd6)","Grenadier Battle Armor (Hunter-Killer) [SRM/Narc] (Sqd4)","Grenadier Battle Armor (Hunter-Killer) [SRM/Narc] (Sqd5)","Grenadier Battle Armor (Hunter-Killer) [SRM/Narc] (Sqd6)","Grenadier Battle Armor (Hunter-Killer) [SVSP/Magshot] (Sqd4)","Grenadier Battle Armor (Hunter-Killer) [SVSP/Magshot] (Sqd5)","Grenadier Battle Armor (Hunter-Killer) [SVSP/Magshot] (Sqd6)","Grenadier Battle Armor [Heavy Flamer/Heavy Flamer] (Sqd4)","Grenadier Battle Armor [Heavy Flamer/Heavy Flamer] (Sqd5)","Grenadier Battle Armor [Heavy Flamer/Heavy Flamer] (Sqd6)","Grenadier Battle Armor [SRM/Flamer] (Sqd4)","Grenadier Battle Armor [SRM/Flamer] (Sqd5)","Grenadier Battle Armor [SRM/Flamer] (Sqd6)","Grenadier Battle Armor [SRM/LRR] (Sqd4)","Grenadier Battle Armor [SRM/LRR] (Sqd5)","Grenadier Battle Armor [SRM/LRR] (Sqd6)","Grenadier Battle Armor [SRM/MagShot] (Sqd4)","Grenadier Battle Armor [SRM/MagShot] (Sqd5)","Grenadier Battle Armor [SRM/MagShot] (Sqd6)","Grenadier Battle Armor [SRM/SL] (Sqd4)","Grenadier Battle Armor [SRM/SL] (Sqd5)","Grenadier Battle Armor [SRM/SL] (Sqd6)","Grenadier Battle Armor [SRM/TAG] (Sqd4)","Grenadier Battle Armor [SRM/TAG] (Sqd5)","Grenadier Battle Armor [SRM/TAG] (Sqd6)","Hauberk Battle Armor (Sqd4)","Hauberk Battle Armor (Sqd5)","Hauberk Battle Armor (Sqd6)","Hauberk Battle Armor Commando (Sqd4)","Hauberk Battle Armor Commando (Sqd5)","Hauberk Battle Armor Commando (Sqd6)","Hauberk Battle Armor U15 (Sqd4)","Hauberk Battle Armor U15 (Sqd5)","Hauberk Battle Armor U15 (Sqd6)","Hauberk II Battle Armor (Sqd4)","Hauberk II Battle Armor (Sqd5)","Hauberk II Battle Armor (Sqd6)","Ironhold Assault Battle Armor (Anti-Tank) (Sqd4)","Ironhold Assault Battle Armor (Anti-Tank) (Sqd5)","Ironhold Assault Battle Armor (Anti-Tank) (Sqd6)","Ironhold Assault Battle Armor (Fire) (Sqd4)","Ironhold Assault Battle Armor (Fire) (Sqd5)","Ironhold Assault Battle Armor (Fire) (Sqd6)","Ironhold Assault Battle Armor (Sqd4)","Ironhold Assault Battle Armor (Sqd5)","Ironhold Assault Battle Armor (Sqd6)","Kanazuchi Assault Battle Armor \"Cyclops\" (Sqd4)","Kanazuchi Assault Battle Armor \"Cyclops\" (Sqd5)","Kanazuchi Assault Battle Armor \"Cyclops\" (Sqd6)","Kanazuchi Assault Battle Armor (Support) (Sqd4)","Kanazuchi Assault Battle Armor (Support) (Sqd5)","Kanazuchi Assault Battle Armor (Support) (Sqd6)","Kanazuchi Assault Battle Armor (Upgrade) [Battle Claw] (Sqd4)","Kanazuchi Assault Battle Armor (Upgrade) [Battle Claw] (Sqd5)","Kanazuchi Assault Battle Armor (Upgrade) [Battle Claw] (Sqd6)","Kanazuchi Assault Battle Armor [Battle Claw] (Sqd4)","Kanazuchi Assault Battle Armor [Battle Claw] (Sqd5)","Kanazuchi Assault Battle Armor [Battle Claw] (Sqd6)","Kanazuchi Assault Battle Armor [Industrial Drill] (Sqd4)","Kanazuchi Assault Battle Armor [Industrial Drill] (Sqd5)","Kanazuchi Assault Battle Armor [Industrial Drill] (Sqd6)","Kanazuchi Assault Battle Armor [Salvage Arm] (Sqd4)","Kanazuchi Assault Battle Armor [Salvage Arm] (Sqd5)","Kanazuchi Assault Battle Armor [Salvage Arm] (Sqd6)","Kopis Assault Battle Armor \"The Dark Alley\" (Sqd4)","Kopis Assault Battle Armor \"The Dark Alley\" (Sqd5)","Kopis Assault Battle Armor \"The Dark Alley\" (Sqd6)","Kopis Assault Battle Armor (AI Mk II) (Sqd4)","Kopis Assault Battle Armor (AI Mk II) (Sqd5)","Kopis Assault Battle Armor (AI Mk II) (Sqd6)","Kopis Assault Battle Armor (AI Mk IIr) (Sqd4)","Kopis Assault Battle Armor (AI Mk IIr) (Sqd5)","Kopis Assault Battle Armor (AI Mk IIr) (Sqd6)","Kopis Assault Battle Armor (Anti-Infantry) (Sqd4)","Kopis Assault Battle Armor (Anti-Infantry) (Sqd5)","Kopis Assault Battle Armor (Anti-Infantry) (Sqd6)","Kopis Assault Battle Armor (Mortar) (Sqd4)","Kopis Assault Battle Armor (Mortar) (Sqd5)","Kopis Assault Battle Armor (Mortar) (Sqd6)","Nephilim Assault Battle Armor (Capture Team) [HMG] (Sqd4)","Nephilim Assault Battle Armor (Capture Team) [HMG] (Sqd5)","Nephilim Assault Battle Armor (Capture Team) [HMG] (Sqd6)","Nephilim Assault Battle Armor (Gauss) (Sqd4)","Nephilim Assault Battle Armor (Gauss) (Sqd5)","Nephilim Assault Battle Armor (Gauss) (Sqd6)","Nephilim Assault Battle Armor (Narc) (Sqd4)","Nephilim Assault Battle Armor (Narc) (Sqd5)","Nephilim Assault Battle Armor (Narc) (Sqd6)","Nephilim Assault Battle Armor (Seeker) [MG] (Sqd4)","Nephilim Assault Battle Armor (Seeker) [MG] (Sqd5)","Nephilim Assault Battle Armor (Seeker) [MG] (Sqd6)","Nephilim Assault Battle Armor (Support) (Sqd4)","Nephilim Assault Battle Armor (Support) (Sqd5)","Nephilim Assault Battle Armor (Support) (Sqd6)","Nephilim Assault Battle Armor [Plasma] (Sqd4)","Nephilim Assault Battle Armor [Plasma] (Sqd5)","Nephilim Assault Battle Armor [Plasma] (Sqd6)","Ravager Assault Battle Armor (LRM) (Sqd4)","Ravager Assault Battle Armor (LRM) (Sqd5)","Ravager Assault Battle Armor (LRM) (Sqd6)","Ravager Assault Battle Armor (Sqd4)","Ravager Assault Battle Armor (Sqd5)","Ravager Assault Battle Armor (Sqd6)","Shedu Assault Battle Armor (Capture Team) (Sqd4)","Shedu Assault Battle Armor (Capture Team) (Sqd5)","Shedu Assault Battle Armor (Capture Team) (Sqd6)","Shedu Assault Battle Armor (PPC) (Sqd4)","Shedu Assault Battle Armor (PPC) (Sqd5)","Shedu Assault Battle Armor (PPC) (Sqd6)","Shedu Assault Battle Armor (Recon) (Sqd4)","Shedu Assault Battle Armor (Recon) (Sqd5)","Shedu Assault Battle Armor (Recon) (Sqd6)","Shedu Assault Battle Armor (Sqd4)","Shedu Assault Battle Armor (Sqd5)","Shedu Assault Battle Armor (Sqd6)","Shedu Assault Battle Armor (Support) (Sqd4)","Shedu Assault Battle Armor (Support) (Sqd5)","Shedu Assault Battle Armor (Support) (Sqd6)","Tortoise II Battle Armor [aSRM] (Sqd4)","Tortoise II Battle Armor [aSRM] (Sqd5)","Tortoise II Battle Armor [aSRM] (Sqd6)","Tortoise II Battle Armor [C3] (Sqd4)","Tortoise II Battle Armor [C3] (Sqd5)","Tortoise II Battle Armor [C3] (Sqd6)","Tortoise II Battle Armor [LRM] (Sqd4)","Tortoise II Battle Armor [LRM] (Sqd5)","Tortoise II Battle Armor [LRM] (Sqd6)","Tortoise II Battle Armor [SRM] (Sqd4)","Tortoise II Battle Armor [SRM] (Sqd5)","Tortoise II Battle Armor [SRM] (Sqd6)","Warg Assault Battle Armor (Reactive) (Sqd4)","Warg Assault Battle Armor (Reactive) (Sqd5)","Warg Assault Battle Armor (Reactive) (Sqd6)","Warg Assault Battle Armor (Sqd4)","Warg Assault Battle Armor (Sqd5)","Warg Assault Battle Armor (Sqd6)","Xiphos Assault Battle Armor A (Sqd4)","Xiphos Assault Battle Armor A (Sqd5)","Xiphos Assault Battle Armor A (Sqd6)","Xiphos Assault Battle Armor B (Sqd4)","Xiphos Assault Battle Armor B (Sqd5)","Xiphos Assault Battle Armor B (Sqd6)","Xiphos Assault Battle Armor C (Sqd4)","Xiphos Assault Battle Armor C (Sqd5)","Xiphos Assault Battle Armor C (Sqd6)"]},"FullName":{"values":["Clan Interface Armor (Sqd4)","Clan Interface Armor (Sqd5)","Clan Interface Armor (Sqd6)","Aerie PA(L) (Salvage) (Sqd4)","Aerie PA(L) (Salvage) (Sqd5)","Aerie PA(L) (Salvage) (Sqd6)","Aerie PA(L) (Sqd4)","Aerie PA(L) (Sqd5)","Aerie PA(L) (Sqd6)","Ailette Rescue PA(L) (Sqd4)","Ailette Rescue PA(L) (Sqd5)","Ailette Rescue PA(L) (Sqd6)","Ailette Zero-G Engineering Exoskeleton (Sqd4)","Ailette Zero-G Engineering Exoskeleton (Sqd5)","Ailette Zero-G Engineering Exoskeleton (Sqd6)","Gladiator Battle Armor S (Sqd4)","Gladiator Battle Armor S (Sqd5)","Gladiator Battle Armor S (Sqd6)","Gladiator Exoskeleton \"The Spider\" (Sqd4)","Gladiator Exoskeleton \"The Spider\" (Sqd5)","Gladiator Exoskeleton \"The Spider\" (Sqd6)","Gladiator Exoskeleton [Armored Glove] (Sqd4)","Gladiator Exoskeleton [Armored Glove] (Sqd5)","Gladiator Exoskeleton [Armored Glove] (Sqd6)","Gladiator Exoskeleton [Industrial Drill] (Sqd4)","Gladiator Exoskeleton [Industrial Drill] (Sqd5)","Gladiator Exoskeleton [Industrial Drill] (Sqd6)","Gorilla Exoskeleton \"Falcata\" (Sqd4)","Gorilla Exoskeleton \"Falcata\" (Sqd5)","Gorilla Exoskeleton \"Falcata\" (Sqd6)","Gorilla Exoskeleton PEX-2B (Sqd4)","Gorilla Exoskeleton PEX-2B (Sqd5)","Gorilla Exoskeleton PEX-2B (Sqd6)","Groundhog Exoskeleton \u201cMaster Thief\" (Sqd1)","Groundhog Exoskeleton CEX-205  [Armored Glove] (Sqd5)","Groundhog Exoskeleton CEX-205  [Armored Glove] (Sqd6)","Groundhog Exoskeleton CEX-205 [Armored Glove] (Sqd4)","Groundhog Exoskeleton CEX-205 [Basic Manipulator] (Sqd4)","Groundhog Exoskeleton CEX-205 [Basic Manipulator] (Sqd5)","Groundhog Exoskeleton CEX-205 [Basic Manipulator] (Sqd6)","Groundhog Exoskeleton CEX-205 [Cargo Lifter] (Sqd4)","Groundhog Exoskeleton CEX-205 [Cargo Lifter] (Sqd5)","Groundhog Exoskeleton CEX-205 [Cargo Lifter] (Sqd6)","Groundhog Exoskeleton CEX-205 [Industrial Drill] (Sqd4)","Groundhog Exoskeleton CEX-205 [Industrial Drill] (Sqd5)","Groundhog Exoskeleton CEX-205 [Industrial Drill] (Sqd6)","Groundhog Exoskeleton CEX-205 [Mine Clearance] (Sqd4)","Groundhog Exoskeleton CEX-205 [Mine Clearance] (Sqd5)","Groundhog Exoskeleton CEX-205 [Mine Clearance] (Sqd6)","Groundhog Exoskeleton CEX-205 [Salvage Arm] (Sqd4)","Groundhog Exoskeleton CEX-205 [Salvage Arm] (Sqd5)","Groundhog Exoskeleton CEX-205 [Salvage Arm] (Sqd6)","Hantu  AIX-210 (Sqd4)","Hantu  AIX-210 (Sqd5)","Hantu  AIX-210 (Sqd6)","HeavyHauler Exoskeleton (Sqd4)","HeavyHauler Exoskeleton (Sqd5)","HeavyHauler Exoskeleton (Sqd6)","Krise PA(L) (Sqd4)","Krise PA(L) (Sqd5)","Krise PA(L) (Sqd6)","Nighthawk PA(L) Mk. XXI (Sqd4)","Nighthawk PA(L) Mk. XXI (Sqd5)","Nighthawk PA(L) Mk. XXI (Sqd6)","Nighthawk PA(L) Mk. XXII (Sqd4)","Nighthawk PA(L) Mk. XXII (Sqd5)","Nighthawk PA(L) Mk. XXII (Sqd6)","Nighthawk PA(L) Mk. XXX (Bounty Hunter) (Sqd4)","Nighthawk PA(L) Mk. XXX (Bounty Hunter) (Sqd5)","Nighthawk PA(L) Mk. XXX (Bounty Hunter) (Sqd6)","Nighthawk PA(L) Mk. XXX (Sqd4)","Nighthawk PA(L) Mk. XXX (Sqd5)","Nighthawk PA(L) Mk. XXX (Sqd6)","PowerLoader Exoskeleton P-5000 (Sqd4)","PowerLoader Exoskeleton P-5000 (Sqd5)","PowerLoader Exoskeleton P-5000 (Sqd6)","Resgate PA(L) (Interdictor) (Sqd4)","Resgate PA(L) (Interdictor) (Sqd5)","Resgate PA(L) (Interdictor) (Sqd6)","Resgate PA(L) (Scout) (Sqd4)","Resgate PA(L) (Scout) (Sqd5)","Resgate PA(L) (Scout) (Sqd6)","Resgate PA(L) (Spotter) (Sqd4)","Resgate PA(L) (Spotter) (Sqd5)","Resgate PA(L) (Spotter) (Sqd6)","Resgate PA(L) (Sqd4)","Resgate PA(L) (Sqd5)","Resgate PA(L) (Sqd6)","Resgate PA(L) (Support) (Sqd4)","Resgate PA(L) (Support) (Sqd5)","Resgate PA(L) (Support) (Sqd6)","Salrilla Exoskeleton  PEX-2F [Salvage Arm] (Sqd4)","Salrilla Exoskeleton  PEX-2F [Salvage Arm] (Sqd5)","Salrilla Exoskeleton  PEX-2F [Salvage Arm] (Sqd6)","Salrilla Exoskeleton PEX-2F [Mine Clearance] (Sqd4)","Salrilla Exoskeleton PEX-2F [Mine Clearance] (Sqd5)","Salrilla Exoskeleton PEX-2F [Mine Clearance] (Sqd6)","Smoothdavid PA(L) II (Sqd4)","Smoothdavid PA(L) II (Sqd5)","Smoothdavid PA(L) II (Sqd6)","Smoothdavid PA(L) III (Sqd4)","Smoothdavid PA(L) III (Sqd5)","Smoothdavid PA(L) III (Sqd6)","Smoothgoliath PA(L) II (Sqd4)","Smoothgoliath PA(L) II (Sqd5)","Smoothgoliath PA(L) II (Sqd6)","Sniper Suit PAB-28 (Sqd4)","Sniper Suit PAB-28 (Sqd5)","Sniper Suit PAB-28 (Sqd6)","Tornado PA(L) G12 (Sqd4)","Tornado PA(L) G12 (Sqd5)","Tornado PA(L) G12 (Sqd6)","Tornado PA(L) G13 [David Light Gauss] (Sqd4)","Tornado PA(L) G13 [David Light Gauss] (Sqd5)","Tornado PA(L) G13 [David Light Gauss] (Sqd6)","Tornado PA(L) G13 [Flamer] (Sqd4)","Tornado PA(L) G13 [Flamer] (Sqd5)","Tornado PA(L) G13 [Flamer] (Sqd6)","Tornado PA(L) G13 [Grenade Launcher] (Sqd4)","Tornado PA(L) G13 [Grenade Launcher] (Sqd5)","Tornado PA(L) G13 [Grenade Launcher] (Sqd6)","Tornado PA(L) G13 [Machine Gun] (Sqd4)","Tornado PA(L) G13 [Machine Gun] (Sqd5)","Tornado PA(L) G13 [Machine Gun] (Sqd6)","Tornado PA(L) G13 [Small Laser] (Sqd4)","Tornado PA(L) G13 [Small Laser] (Sqd5)","Tornado PA(L) G13 [Small Laser] (Sqd6)","Tornado PA(L) G14 (Sqd4)","Tornado PA(L) G14 (Sqd5)","Tornado PA(L) G14 (Sqd6)","Tornado PA(L) G17 (Sqd4)","Tornado PA(L) G17 (Sqd5)","Tornado PA(L) G17 (Sqd6)","Tornado PA(L) P12 \"Hurricane\" (Sqd4)","Tornado PA(L) P12 \"Hurricane\" (Sqd5)","Tornado PA(L) P12 \"Hurricane\" (Sqd6)","Tornado PA(L) P17 \"Hurricane\" (Sqd4)","Tornado PA(L) P17 \"Hurricane\" (Sqd5)","Tornado PA(L) P17 \"Hurricane\" (Sqd6)","Tunnel Rat I Mining Exoskeleton [Armored Glove] (Sqd4)","Tunnel Rat I Mining Exoskeleton [Armored Glove] (Sqd5)","Tunnel Rat I Mining Exoskeleton [Armored Glove] (Sqd6)","Tunnel Rat I Mining Exoskeleton [Industrial Drill] (Sqd4)","Tunnel Rat I Mining Exoskeleton [Industrial Drill] (Sqd5)","Tunnel Rat I Mining Exoskeleton [Industrial Drill] (Sqd6)","Tunnel Rat II Mining Exoskeleton [Armored Glove] (Sqd4)","Tunnel Rat II Mining Exoskeleton [Armored Glove] (Sqd5)","Tunnel Rat II Mining Exoskeleton [Armored Glove] (Sqd6)","Tunnel Rat II Mining Exoskeleton [Industrial Drill] (Sqd4)","Tunnel Rat II Mining Exoskeleton [Industrial Drill] (Sqd5)","Tunnel Rat II Mining Exoskeleton [Industrial Drill] (Sqd6)","Tunnel Rat III Mining Exoskeleton [Armored Glove] (Sqd4)","Tunnel Rat III Mining Exoskeleton [Armored Glove] (Sqd5)","Tunnel Rat III Mining Exoskeleton [Armored Glove] (Sqd6)","Tunnel Rat III Mining Exoskeleton [Industrial Drill] (Sqd4)","Tunnel Rat III Mining Exoskeleton [Industrial Drill] (Sqd5)","Tunnel Rat III Mining Exoskeleton [Industrial Drill] (Sqd6)","Tunnel Rat IV Mining Exoskeleton [Armored Glove/GL] (Sqd4)","Tunnel Rat IV Mining Exoskeleton [Armored Glove/GL] (Sqd5)","Tunnel Rat IV Mining Exoskeleton [Armored Glove/GL] (Sqd6)","Tunnel Rat IV Mining Exoskeleton [Armored Glove/LMG] (Sqd4)","Tunnel Rat IV Mining Exoskeleton [Armored Glove/LMG] (Sqd5)","Tunnel Rat IV Mining Exoskeleton [Armored Glove/LMG] (Sqd6)","Tunnel Rat IV Mining Exoskeleton [Battle Claw/GL] (Sqd4)","Tunnel Rat IV Mining Exoskeleton [Battle Claw/GL] (Sqd5)","Tunnel Rat IV Mining Exoskeleton [Battle Claw/GL] (Sqd6)","Tunnel Rat IV Mining Exoskeleton [Battle Claw/LMG] (Sqd4)","Tunnel Rat IV Mining Exoskeleton [Battle Claw/LMG] (Sqd5)","Tunnel Rat IV Mining Exoskeleton [Battle Claw/LMG] (Sqd6)","Achileus Light Battle Armor (WoB) (Sqd4)","Achileus Light Battle Armor (WoB) (Sqd5)","Achileus Light Battle Armor (WoB) (Sqd6)","Achileus Light Battle Armor [David] (Sqd4)","Achileus Light Battle Armor [David] (Sqd5)","Achileus Light Battle Armor [David] (Sqd6)","Achileus Light Battle Armor [Flamer] (Sqd4)","Achileus Light Battle Armor [Flamer] (Sqd5)","Achileus Light Battle Armor [Flamer] (Sqd6)","Achileus Light Battle Armor [Laser] (Sqd4)","Achileus Light Battle Armor [Laser] (Sqd5)","Achileus Light Battle Armor [Laser] (Sqd6)","Achileus Light Battle Armor [MG] (Sqd4)","Achileus Light Battle Armor [MG] (Sqd5)","Achileus Light Battle Armor [MG] (Sqd6)","Achileus Light Battle Armor [TAG] (Sqd4)","Achileus Light Battle Armor [TAG] (Sqd5)","Achileus Light Battle Armor [TAG] (Sqd6)","Constable Pacification Suit [ECM] (Sqd4)","Constable Pacification Suit [ECM] (Sqd5)","Constable Pacification Suit [ECM] (Sqd6)","Constable Pacification Suit [LMG] (Sqd4)","Constable Pacification Suit [LMG] (Sqd5)","Constable Pacification Suit [LMG] (Sqd6)","Constable Pacification Suit [Sensor] (Sqd4)","Constable Pacification Suit [Sensor] (Sqd5)","Constable Pacification Suit [Sensor] (Sqd6)","Constable Pacification Suit [SRM] (Sqd4)","Constable Pacification Suit [SRM] (Sqd5)","Constable Pacification Suit [SRM] (Sqd6)","Constable Pacification Suit [TAG] (Sqd4)","Constable Pacification Suit [TAG] (Sqd5)","Constable Pacification Suit [TAG] (Sqd6)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [Flamer] (Sqd4)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [Flamer] (Sqd5)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [Flamer] (Sqd6)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [Laser] (Sqd4)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [Laser] (Sqd5)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [Laser] (Sqd6)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [MG]  (Sqd4)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [MG]  (Sqd5)","Djinn Battle Armor (Reflective) \u201cTerrorizer\u201d [MG]  (Sqd6)","Djinn Battle Armor (Sqd4)","Djinn Battle Armor (Sqd5)","Djinn Battle Armor (Sqd6)","Djinn Battle Armor (Stealth) (Sqd4)","Djinn Battle Armor (Stealth) (Sqd5)","Djinn Battle Armor (Stealth) (Sqd6)","Gray Death Scout Suit \"The Willow Wisps\" (Sqd4)","Gray Death Scout Suit \"The Willow Wisps\" (Sqd5)","Gray Death Scout Suit \"The Willow Wisps\" (Sqd6)","Gray Death Scout Suit (Reaper) (Sqd4)","Gray Death Scout Suit (Reaper) (Sqd5)","Gray Death Scout Suit (Reaper) (Sqd6)","Gray Death Scout Suit (Sqd4)","Gray Death Scout Suit (Sqd5)","Gray Death Scout Suit (Sqd6)","Infiltrator Mk. I Battle Armor \"Waddle\" (Sqd4)","Infiltrator Mk. I Battle Armor \"Waddle\" (Sqd5)","Infiltrator Mk. I Battle Armor \"Waddle\" (Sqd6)","Infiltrator Mk. I Battle Armor (Special Ops) (Sqd4)","Infiltrator Mk. I Battle Armor (Special Ops) (Sqd5)","Infiltrator Mk. I Battle Armor (Special Ops) (Sqd6)","Kage Light Battle Armor (DEST) (Sqd4)","Kage Light Battle Armor (DEST) (Sqd5)","Kage Light Battle Armor (DEST) (Sqd6)","Kage Light Battle Armor (Space) (Sqd4)","Kage Light Battle Armor (Space) (Sqd5)","Kage Light Battle Armor (Space) (Sqd6)","Kage Light Battle Armor (Vibro-Claw)  (Sqd4)","Kage Light Battle Armor (Vibro-Claw) (Sqd5)","Kage Light Battle Armor (Vibro-Claw) (Sqd6)","Kage Light Battle Armor [ECM] (Sqd4)","Kage Light Battle Armor [ECM] (Sqd5)","Kage Light Battle Armor [ECM] (Sqd6)","Kage Light Battle Armor [Flamer] (Sqd4)","Kage Light Battle Armor [Flamer] (Sqd5)","Kage Light Battle Armor [Flamer] (Sqd6)","Kage Light Battle Armor [Laser] (Sqd4)","Kage Light Battle Armor [Laser] (Sqd5)","Kage Light Battle Armor [Laser] (Sqd6)","Kage Light Battle Armor [MG] (Sqd4)","Kage Light Battle Armor [MG] (Sqd5)","Kage Light Battle Armor [MG] (Sqd6)","Kage Light Battle Armor [TAG] (Sqd4)","Kage Light Battle Armor [TAG] (Sqd5)","Kage Light Battle Armor [TAG] (Sqd6)","Kage Light Battle Armor C (Sqd4)","Kage Light Battle Armor C (Sqd5)","Kage Light Battle Armor C (Sqd6)","Kishi Battle Armor (Sqd4)","Kishi Battle Armor (Sqd5)","Kishi Battle Armor (Sqd6)","Kobold Battle Armor [MicroGL/Flamer] (Sqd4)","Kobold Battle Armor [MicroGL/Flamer] (Sqd5)","Kobold Battle Armor [MicroGL/Flamer] (Sqd6)","Kobold Battle Armor [MicroGL/SPL] (Sqd4)","Kobold Battle Armor [MicroGL/SPL] (Sqd5)","Kobold Battle Armor [MicroGL/SPL] (Sqd6)","Kobold Battle Armor [MicroGL/TAG] (Sqd4)","Kobold Battle Armor [MicroGL/TAG] (Sqd5)","Kobold Battle Armor [MicroGL/TAG] (Sqd6)","Kobold Battle Armor [SL/Flamer] (Sqd4)","Kobold Battle Armor [SL/Flamer] (Sqd5)","Kobold Battle Armor [SL/Flamer] (Sqd6)","Kobold Battle Armor [SL/TAG] (Sqd4)","Kobold Battle Armor [SL/TAG] (Sqd5)","Kobold Battle Armor [SL/TAG] (Sqd6)","Kobold Battle Armor IIC (Sqd4)","Kobold Battle Armor IIC (Sqd5)","Kobold Battle Armor IIC (Sqd6)","Kobold Battle Armor X-C3 (Sqd4)","Kobold Battle Armor X-C3 (Sqd5)","Kobold Battle Armor X-C3 (Sqd6)","Sea Fox Amphibious Armor (Sqd4)","Sea Fox Amphibious Armor (Sqd5)","Sea Fox Amphibious Armor (Sqd6)","Spectre Stealth Battle Armor (Sqd4)","Spectre Stealth Battle Armor (Sqd5)","Spectre Stealth Battle Armor (Sqd6)","Sylph Battle Armor (Sqd4)","Sylph Battle Armor (Sqd5)","Sylph Battle Armor (Sqd6)","Sylph Battle Armor (Upgrade) (Sqd4)","Sylph Battle Armor (Upgrade) (Sqd5)","Sylph Battle Armor (Upgrade) (Sqd6)","Sylph Battle Armor XR (Sqd4)","Sylph Battle Armor XR (Sqd5)","Sylph Battle Armor XR (Sqd6)","Sylph Battle Armor \"Tinkerbelle\" (Sqd4)","Sylph Battle Armor (Enhanced) (Sqd4)","Sylph Battle Armor (Enhanced) (Sqd5)","Sylph Battle Armor (Enhanced) (Sqd6)","Aegis Point Defense Suit (Sqd4)","Aegis Point Defense Suit (Sqd5)","Aegis Point Defense Suit (Sqd6)","Afreet Medium Battle Armor (Hell's Horses) (Sqd4)","Afreet Medium Battle Armor (Hell's Horses) (Sqd5)","Afreet Medium Battle Armor (Hell's Horses) (Sqd6)","Afreet Medium Battle Armor (Interdictor) (Sqd4)","Afreet Medium Battle Armor (Interdictor) (Sqd5)","Afreet Medium Battle Armor (Interdictor) (Sqd6)","Afreet Medium Battle Armor (Jade Falcon) (Sqd4)","Afreet Medium Battle Armor (Jade Falcon) (Sqd5)","Afreet Medium Battle Armor (Jade Falcon) (Sqd6)","Afreet Medium Battle Armor (Sqd4)","Afreet Medium Battle Armor (Sqd5)","Afreet Medium Battle Armor (Sqd6)","Amazon Battle Armor [MRR] (Sqd4)","Amazon Battle Armor [MRR] (Sqd5)","Amazon Battle Armor [MRR] (Sqd6)","Amazon Battle Armor [PPC] (Sqd4)","Amazon Battle Armor [PPC] (Sqd5)","Amazon Battle Armor [PPC] (Sqd6)","Angerona Scout Suit (Recon) (Sqd4)","Angerona Scout Suit (Recon) (Sqd5)","Angerona Scout Suit (Recon) (Sqd6)","Angerona Scout Suit (Sqd4)","Angerona Scout Suit (Sqd5)","Angerona Scout Suit (Sqd6)","Asura Medium Battle Armor (Anti-Infantry) (Sqd4)","Asura Medium Battle Armor (Anti-Infantry) (Sqd5)","Asura Medium Battle Armor (Anti-Infantry) (Sqd6)","Asura Medium Battle Armor (Sqd4)","Asura Medium Battle Armor (Sqd5)","Asura Medium Battle Armor (Sqd6)","Asura Medium Battle Armor (SRM) (Sqd4)","Asura Medium Battle Armor (SRM) (Sqd5)","Asura Medium Battle Armor (SRM) (Sqd6)","Buraq Fast Battle Armor (Hunter-Killer) (Sqd4)","Buraq Fast Battle Armor (Hunter-Killer) (Sqd5)","Buraq Fast Battle Armor (Hunter-Killer) (Sqd6)","Buraq Fast Battle Armor (Sqd4)","Buraq Fast Battle Armor (Sqd5)","Buraq Fast Battle Armor (Sqd6)","Buraq Fast Battle Armor (Support) (Sqd4)","Buraq Fast Battle Armor (Support) (Sqd5)","Buraq Fast Battle Armor (Support) (Sqd6)","Callisto Battle Armor A [Bearhunter] (Sqd4)","Callisto Battle Armor A [Bearhunter] (Sqd5)","Callisto Battle Armor A [Bearhunter] (Sqd6)","Callisto Battle Armor A [ER Laser] (Sqd4)","Callisto Battle Armor A [ER Laser] (Sqd5)","Callisto Battle Armor A [ER Laser] (Sqd6)","Callisto Battle Armor A [HMG] (Sqd4)","Callisto Battle Armor A [HMG] (Sqd5)","Callisto Battle Armor A [HMG] (Sqd6)","Callisto Battle Armor B [MRR] (Sqd4)","Callisto Battle Armor B [MRR] (Sqd5)","Callisto Battle Armor B [MRR] (Sqd6)","Callisto Battle Armor B [SRM] (Sqd4)","Callisto Battle Armor B [SRM] (Sqd5)","Callisto Battle Armor B [SRM] (Sqd6)","Cavalier Battle Armor [Flamer] (Sqd4)","Cavalier Battle Armor [Flamer] (Sqd5)","Cavalier Battle Armor [Flamer] (Sqd6)","Cavalier Battle Armor [Laser] (Sqd4)","Cavalier Battle Armor [Laser] (Sqd5)","Cavalier Battle Armor [Laser] (Sqd6)","Cavalier Battle Armor [MG] (Sqd4)","Cavalier Battle Armor [MG] (Sqd5)","Cavalier Battle Armor [MG] (Sqd6)","Cavalier Battle Armor [SRM] (Sqd4)","Cavalier Battle Armor [SRM] (Sqd5)","Cavalier Battle Armor [SRM] (Sqd6)","Cavalier II Battle Armor [Flamer] (Sqd4)","Cavalier II Battle Armor [Flamer] (Sqd5)","Cavalier II Battle Armor [Flamer] (Sqd6)","Cavalier II Battle Armor [MRR] (Sqd4)","Cavalier II Battle Armor [MRR] (Sqd5)","Cavalier II Battle Armor [MRR] (Sqd6)","Cavalier II Battle Armor [PPC] (Sqd4)","Cavalier II Battle Armor [PPC] (Sqd5)","Cavalier II Battle Armor [PPC] (Sqd6)","Cavalier II Battle Armor [SRM] (Sqd4)","Cavalier II Battle Armor [SRM] (Sqd5)","Cavalier II Battle Armor [SRM] (Sqd6)","Clan Medium Battle Armor \"Rabid\" (Sqd4)","Clan Medium Battle Armor \"Rabid\" (Sqd5)","Clan Medium Battle Armor \"Rabid\" (Sqd6)","Clan Medium Battle Armor \"Rache\" (Sqd4)","Clan Medium Battle Armor \"Rache\" (Sqd5)","Clan Medium Battle Armor \"Rache\" (Sqd6)","Clan Medium Battle Armor (Laser)  \"Volk\" (Sqd4)","Clan Medium Battle Armor (Laser)  \"Volk\" (Sqd5)","Clan Medium Battle Armor (Laser) \"Volk\" (Sqd6)","Clan Medium Battle Armor (Naval) \"B\u00e4r\" (Sqd4)","Clan Medium Battle Armor (Naval) \"B\u00e4r\" (Sqd5)","Clan Medium Battle Armor (Naval) \"B\u00e4r\" (Sqd6)","Dragoon Battle Armor (Advanced) (Sqd4)","Dragoon Battle Armor (Advanced) (Sqd5)","Dragoon Battle Armor (Advanced) (Sqd6)","Dragoon Battle Armor (Sqd4)","Dragoon Battle Armor (Sqd5)","Dragoon Battle Armor (Sqd6)","Elemental Battle Armor (Fire) [AP Gauss] (Sqd4)","Elemental Battle Armor (Fire) [AP Gauss] (Sqd5)","Elemental Battle Armor (Fire) [AP Gauss] (Sqd6)","Elemental Battle Armor (Fire) [Flamer] (Sqd4)","Elemental Battle Armor (Fire) [Flamer] (Sqd5)","Elemental Battle Armor (Fire) [Flamer] (Sqd6)","Elemental Battle Armor (Fire) [MicroPL] (Sqd4)","Elemental Battle Armor (Fire) [MicroPL] (Sqd5)","Elemental Battle Armor (Fire) [MicroPL] (Sqd6)","Elemental Battle Armor (Headhunter) (Sqd3)","Elemental Battle Armor (Headhunter) (Sqd4)","Elemental Battle Armor (Headhunter) (Sqd5)","Elemental Battle Armor (Headhunter) (Sqd6)","Elemental Battle Armor (Space) [Flamer] (Sqd4)","Elemental Battle Armor (Space) [Flamer] (Sqd5)","Elemental Battle Armor (Space) [Flamer] (Sqd6)","Elemental Battle Armor (Space) [MG] (Sqd4)","Elemental Battle Armor (Space) [MG] (Sqd5)","Elemental Battle Armor (Space) [MG] (Sqd6)","Elemental Battle Armor (Space) [MicroPL] (Sqd4)","Elemental Battle Armor (Space) [MicroPL] (Sqd5)","Elemental Battle Armor (Space) [MicroPL] (Sqd6)","Elemental Battle Armor [AP Gauss] (Sqd3)","Elemental Battle Armor [AP Gauss] (Sqd4)","Elemental Battle Armor [AP Gauss] (Sqd5)","Elemental Battle Armor [AP Gauss] (Sqd6)","Elemental Battle Armor [ERMicroL] (Sqd3)","Elemental Battle Armor [ERMicroL] (Sqd4)","Elemental Battle Armor [ERMicroL] (Sqd5)","Elemental Battle Armor [ERMicroL] (Sqd6)","Elemental Battle Armor [Flamer] (Sqd3)","Elemental Battle Armor [Flamer] (Sqd4)","Elemental Battle Armor [Flamer] (Sqd5)","Elemental Battle Armor [Flamer] (Sqd6)","Elemental Battle Armor [HMG] (Sqd3)","Elemental Battle Armor [HMG] (Sqd4)","Elemental Battle Armor [HMG] (Sqd5)","Elemental Battle Armor [HMG] (Sqd6)","Elemental Battle Armor [Laser] (Sqd3)","Elemental Battle Armor [Laser] (Sqd4)","Elemental Battle Armor [Laser] (Sqd5)","Elemental Battle Armor [Laser] (Sqd6)","Elemental Battle Armor [MG] (Sqd3)","Elemental Battle Armor [MG] (Sqd4)","Elemental Battle Armor [MG] (Sqd5)","Elemental Battle Armor [MG] (Sqd6)","Elemental Battle Armor [MicroPL] (Sqd3)","Elemental Battle Armor [MicroPL] (Sqd4)","Elemental Battle Armor [MicroPL] (Sqd5)","Elemental Battle Armor [MicroPL] (Sqd6)","Elemental II Battle Armor (Sqd4)","Elemental II Battle Armor (Sqd5)","Elemental II Battle Armor (Sqd6)","Elemental III Battle Armor [AP Gauss] (Sqd4)","Elemental III Battle Armor [AP Gauss] (Sqd5)","Elemental III Battle Armor [AP Gauss] (Sqd6)","Elemental III Battle Armor [Flamer] (Sqd4)","Elemental III Battle Armor [Flamer] (Sqd5)","Elemental III Battle Armor [Flamer] (Sqd6)","Elemental III Battle Armor [MicroPL] (Sqd4)","Elemental III Battle Armor [MicroPL] (Sqd5)","Elemental III Battle Armor [MicroPL] (Sqd6)","Fa Shih Battle Armor (Support) [King David] (Sqd4)","Fa Shih Battle Armor (Support) [King David] (Sqd5)","Fa Shih Battle Armor (Support) [King David] (Sqd6)","Fa Shih Battle Armor (Support) [Plasma] (Sqd4)","Fa Shih Battle Armor (Support) [Plasma] (Sqd5)","Fa Shih Battle Armor (Support) [Plasma] (Sqd6)","Fa Shih Battle Armor [Flamer] (Sqd4)","Fa Shih Battle Armor [Flamer] (Sqd5)","Fa Shih Battle Armor [Flamer] (Sqd6)","Fa Shih Battle Armor [Laser] (Sqd4)","Fa Shih Battle Armor [Laser] (Sqd5)","Fa Shih Battle Armor [Laser] (Sqd6)","Fa Shih Battle Armor [LRR] (Sqd4)","Fa Shih Battle Armor [LRR] (Sqd5)","Fa Shih Battle Armor [LRR] (Sqd6)","Fa Shih Battle Armor [MG] (Sqd4)","Fa Shih Battle Armor [MG] (Sqd5)","Fa Shih Battle Armor [MG] (Sqd6)","Fa Shih Battle Armor [TAG] (Sqd4)","Fa Shih Battle Armor [TAG] (Sqd5)","Fa Shih Battle Armor [TAG] (Sqd6)","Fa Shih Battle Armor 2 [MG] (Sqd4)","Fa Shih Battle Armor 2 [MG] (Sqd5)","Fa Shih Battle Armor 2 [MG] (Sqd6)","Gray Death Infiltrator Suit [Firedrake] (Sqd4)","Gray Death Infiltrator Suit [Firedrake] (Sqd5)","Gray Death Infiltrator Suit [Firedrake] (Sqd6)","Gray Death Infiltrator Suit [Mines] (Sqd4)","Gray Death Infiltrator Suit [Mines] (Sqd5)","Gray Death Infiltrator Suit [Mines] (Sqd6)","Gray Death Infiltrator Suit [Remote Sensors] (Sqd4)","Gray Death Infiltrator Suit [Remote Sensors] (Sqd5)","Gray Death Infiltrator Suit [Remote Sensors] (Sqd6)","Gray Death Infiltrator Suit [Sensors] (Sqd4)","Gray Death Infiltrator Suit [Sensors] (Sqd5)","Gray Death Infiltrator Suit [Sensors] (Sqd6)","Gray Death Infiltrator Suit [TAG] (Sqd4)","Gray Death Infiltrator Suit [TAG] (Sqd5)","Gray Death Infiltrator Suit [TAG] (Sqd6)","Gray Death Standard Suit [Flamer] (Sqd4)","Gray Death Standard Suit [Flamer] (Sqd5)","Gray Death Standard Suit [Flamer] (Sqd6)","Gray Death Standard Suit [Laser] (Sqd4)","Gray Death Standard Suit [Laser] (Sqd5)","Gray Death Standard Suit [Laser] (Sqd6)","Gray Death Standard Suit [LRR] (Sqd4)","Gray Death Standard Suit [LRR] (Sqd5)","Gray Death Standard Suit [LRR] (Sqd6)","Gray Death Standard Suit [MG] (Sqd4)","Gray Death Standard Suit [MG] (Sqd5)","Gray Death Standard Suit [MG] (Sqd6)","Gray Death Standard Suit [SRM] (Sqd4)","Gray Death Standard Suit [SRM] (Sqd5)","Gray Death Standard Suit [SRM] (Sqd6)","Gray Death Strike Suit (Harjel) (Sqd4)","Gray Death Strike Suit (HarJel) (Sqd5)","Gray Death Strike Suit (HarJel) (Sqd6)","Gray Death Strike Suit (Prototype) (Sqd4)","Gray Death Strike Suit (Prototype) (Sqd5)","Gray Death Strike Suit (Prototype) (Sqd6)","Gray Death Strike Suit (Sqd4)","Gray Death Strike Suit (Sqd5)","Gray Death Strike Suit (Sqd6)","Infiltrator Mk. II Battle Armor \"Puma\" (Sqd4)","Infiltrator Mk. II Battle Armor \"Puma\" (Sqd5)","Infiltrator Mk. II Battle Armor \"Puma\" (Sqd6)","Infiltrator Mk. II Battle Armor (Magnetic) (Sqd4)","Infiltrator Mk. II Battle Armor (Magnetic) (Sqd5)","Infiltrator Mk. II Battle Armor (Magnetic) (Sqd6)","Infiltrator Mk. II Battle Armor (Marine) (Sqd4)","Infiltrator Mk. II Battle Armor (Marine) (Sqd5)","Infiltrator Mk. II Battle Armor (Marine) (Sqd6)","Infiltrator Mk. II Battle Armor (Sensor) (Sqd4)","Infiltrator Mk. II Battle Armor (Sensor) (Sqd5)","Infiltrator Mk. II Battle Armor (Sensor) (Sqd6)","Infiltrator Mk. II Battle Armor Coral Intent (Sqd4)","Infiltrator Mk. II Battle Armor Coral Intent (Sqd5)","Infiltrator Mk. II Battle Armor Coral Intent (Sqd6)","IS Standard Battle Armor \"Baka\" [LRR] (Sqd4)","IS Standard Battle Armor \"Baka\" [LRR] (Sqd5)","IS Standard Battle Armor \"Baka\" [LRR] (Sqd6)","IS Standard Battle Armor \"Baka\" [SL] (Sqd4)","IS Standard Battle Armor \"Baka\" [SL] (Sqd5)","IS Standard Battle Armor \"Baka\" [SL] (Sqd6)","IS Standard Battle Armor \"Fa Sure\" [David] (Sqd4)","IS Standard Battle Armor \"Fa Sure\" [David] (Sqd5)","IS Standard Battle Armor \"Fa Sure\" [David] (Sqd6)","IS Standard Battle Armor \"Fa Sure\" [MG] (Sqd4)","IS Standard Battle Armor \"Fa Sure\" [MG] (Sqd5)","IS Standard Battle Armor \"Fa Sure\" [MG] (Sqd6)","IS Standard Battle Armor \"Hive\" (Sqd4)","IS Standard Battle Armor \"Hive\" (Sqd5)","IS Standard Battle Armor \"Hive\" (Sqd6)","IS Standard Battle Armor (Magnetic) (Sqd4)","IS Standard Battle Armor (Magnetic) (Sqd5)","IS Standard Battle Armor (Magnetic) (Sqd6)","IS Standard Battle Armor [Flamer] (Sqd4)","IS Standard Battle Armor [Flamer] (Sqd5)","IS Standard Battle Armor [Flamer] (Sqd6)","IS Standard Battle Armor [Laser] (Sqd4)","IS Standard Battle Armor [Laser] (Sqd5)","IS Standard Battle Armor [Laser] (Sqd6)","IS Standard Battle Armor [LRR] (Sqd4)","IS Standard Battle Armor [LRR] (Sqd5)","IS Standard Battle Armor [LRR] (Sqd6)","IS Standard Battle Armor [MG] (Sqd4)","IS Standard Battle Armor [MG] (Sqd5)","IS Standard Battle Armor [MG] (Sqd6)","IS Standard Battle Armor [SRM] (Sqd4)","IS Standard Battle Armor [SRM] (Sqd5)","IS Standard Battle Armor [SRM] (Sqd6)","Leonidas Battle Armor [David] (Sqd4)","Leonidas Battle Armor [David] (Sqd5)","Leonidas Battle Armor [David] (Sqd6)","Leonidas Battle Armor [Firedrake] (Sqd4)","Leonidas Battle Armor [Firedrake] (Sqd5)","Leonidas Battle Armor [Firedrake] (Sqd6)","Leonidas Battle Armor [MG] (Sqd4)","Leonidas Battle Armor [MG] (Sqd5)","Leonidas Battle Armor [MG] (Sqd6)","Leonidas Battle Armor [Sensor] (Sqd4)","Leonidas Battle Armor [Sensor] (Sqd5)","Leonidas Battle Armor [Sensor] (Sqd6)","Leonidas Battle Armor [TAG] (Sqd4)","Leonidas Battle Armor [TAG] (Sqd5)","Leonidas Battle Armor [TAG] (Sqd6)","Longinus Battle Armor \"Hacked\" [David] (Sqd4)","Longinus Battle Armor \"Hacked\" [David] (Sqd5)","Longinus Battle Armor \"Hacked\" [David] (Sqd6)","Longinus Battle Armor \"Hacked\" [MG] (Sqd4)","Longinus Battle Armor \"Hacked\" [MG] (Sqd5)","Longinus Battle Armor \"Hacked\" [MG] (Sqd6)","Longinus Battle Armor (Magnetic) (Sqd4)","Longinus Battle Armor (Magnetic) (Sqd5)","Longinus Battle Armor (Magnetic) (Sqd6)","Longinus Battle Armor [David] (Sqd4)","Longinus Battle Armor [David] (Sqd5)","Longinus Battle Armor [David] (Sqd6)","Longinus Battle Armor [Flamer] (Sqd4)","Longinus Battle Armor [Flamer] (Sqd5)","Longinus Battle Armor [Flamer] (Sqd6)","Longinus Battle Armor [Laser] (Sqd4)","Longinus Battle Armor [Laser] (Sqd5)","Longinus Battle Armor [Laser] (Sqd6)","Longinus Battle Armor [MG] (Sqd4)","Longinus Battle Armor [MG] (Sqd5)","Longinus Battle Armor [MG] (Sqd6)","Longinus C Battle Armor [MRR] (Sqd4)","Longinus C Battle Armor [MRR] (Sqd5)","Longinus C Battle Armor [MRR] (Sqd6)","Longinus C Battle Armor [PPC] (Sqd4)","Longinus C Battle Armor [PPC] (Sqd5)","Longinus C Battle Armor [PPC] (Sqd6)","Oni Battle Armor [Bearhunter] (Sqd4)","Oni Battle Armor [Bearhunter] (Sqd5)","Oni Battle Armor [Bearhunter] (Sqd6)","Oni Battle Armor [MRR] (Sqd4)","Oni Battle Armor [MRR] (Sqd5)","Oni Battle Armor [MRR] (Sqd6)","Oni Battle Armor [Narc] (Sqd4)","Oni Battle Armor [Narc] (Sqd5)","Oni Battle Armor [Narc] (Sqd6)","Oni Battle Armor [PPC] (Sqd4)","Oni Battle Armor [PPC] (Sqd5)","Oni Battle Armor [PPC] (Sqd6)","Purifier Adaptive Battle Armor [Laser] (Sqd4)","Purifier Adaptive Battle Armor [Laser] (Sqd5)","Purifier Adaptive Battle Armor [Laser] (Sqd6)","Purifier Adaptive Battle Armor [Narc] (Sqd4)","Purifier Adaptive Battle Armor [Narc] (Sqd5)","Purifier Adaptive Battle Armor [Narc] (Sqd6)","Purifier Adaptive Battle Armor [PPC] (Sqd4)","Purifier Adaptive Battle Armor [PPC] (Sqd5)","Purifier Adaptive Battle Armor [PPC] (Sqd6)","Purifier Adaptive Battle Armor [TAG] (Sqd4)","Purifier Adaptive Battle Armor [TAG] (Sqd5)","Purifier Adaptive Battle Armor [TAG] (Sqd6)","Purifier Terra Battle Armor [AP Gauss] (Sqd4)","Purifier Terra Battle Armor [AP Gauss] (Sqd5)","Purifier Terra Battle Armor [AP Gauss] (Sqd6)","Purifier Terra Battle Armor [ERSL] (Sqd4)","Purifier Terra Battle Armor [ERSL] (Sqd5)","Purifier Terra Battle Armor [ERSL] (Sqd6)","Purifier Terra Battle Armor [MRR] (Sqd4)","Purifier Terra Battle Armor [MRR] (Sqd5)","Purifier Terra Battle Armor [MRR] (Sqd6)","Purifier Terra Battle Armor [SPL] (Sqd4)","Purifier Terra Battle Armor [SPL] (Sqd5)","Purifier Terra Battle Armor [SPL] (Sqd6)","Quirinus Battle Armor [David] (Sqd4)","Quirinus Battle Armor [David] (Sqd5)","Quirinus Battle Armor [David] (Sqd6)","Quirinus Battle Armor [GL] (Sqd4)","Quirinus Battle Armor [GL] (Sqd5)","Quirinus Battle Armor [GL] (Sqd6)","Quirinus Battle Armor [MG] (Sqd4)","Quirinus Battle Armor [MG] (Sqd5)","Quirinus Battle Armor [MG] (Sqd6)","Raiden Battle Armor (Anti-Infantry) (Sqd4)","Raiden Battle Armor (Anti-Infantry) (Sqd5)","Raiden Battle Armor (Anti-Infantry) (Sqd6)","Raiden Battle Armor (Original) (Sqd4)","Raiden Battle Armor (Original) (Sqd5)","Raiden Battle Armor (Original) (Sqd6)","Raiden Battle Armor [Flamer] (Sqd4)","Raiden Battle Armor [Flamer] (Sqd5)","Raiden Battle Armor [Flamer] (Sqd6)","Raiden Battle Armor [Laser] (Sqd4)","Raiden Battle Armor [Laser] (Sqd5)","Raiden Battle Armor [Laser] (Sqd6)","Raiden Battle Armor [MG] (Sqd4)","Raiden Battle Armor [MG] (Sqd5)","Raiden Battle Armor [MG] (Sqd6)","Raiden Battle Armor [MRM] (Sqd4)","Raiden Battle Armor [MRM] (Sqd5)","Raiden Battle Armor [MRM] (Sqd6)","Raiden Battle Armor [Tsunami] (Sqd4)","Raiden Battle Armor [Tsunami] (Sqd5)","Raiden Battle Armor [Tsunami] (Sqd6)","Raiden II Battle Armor [Flamer] (Sqd4)","Raiden II Battle Armor [Flamer] (Sqd5)","Raiden II Battle Armor [Flamer] (Sqd6)","Raiden II Battle Armor [HMG] (Sqd4)","Raiden II Battle Armor [HMG] (Sqd5)","Raiden II Battle Armor [HMG] (Sqd6)","Rottweiler Battle Armor (Close Combat) (Sqd4)","Rottweiler Battle Armor (Close Combat) (Sqd5)","Rottweiler Battle Armor (Close Combat) (Sqd6)","Rottweiler Battle Armor (Firedrake) (Sqd4)","Rottweiler Battle Armor (Firedrake) (Sqd5)","Rottweiler Battle Armor (Firedrake) (Sqd6)","Rottweiler Battle Armor (Sqd4)","Rottweiler Battle Armor (Sqd5)","Rottweiler Battle Armor (Sqd6)","Rottweiler Battle Armor (Upgrade) (Sqd4)","Rottweiler Battle Armor (Upgrade) (Sqd5)","Rottweiler Battle Armor (Upgrade) (Sqd6)","Salamander Battle Armor (Anti-Infantry) (Sqd4)","Salamander Battle Armor (Anti-Infantry) (Sqd5)","Salamander Battle Armor (Anti-Infantry) (Sqd6)","Salamander Battle Armor (Laser) (Sqd4)","Salamander Battle Armor (Laser) (Sqd5)","Salamander Battle Armor (Laser) (Sqd6)","Salamander Battle Armor (Sqd3)","Salamander Battle Armor (Sqd4)","Salamander Battle Armor (Sqd5)","Salamander Battle Armor (Sqd6)","Se'irim Medium Battle Armor (Anti-Infantry) (Sqd4)","Se'irim Medium Battle Armor (Anti-Infantry) (Sqd5)","Se'irim Medium Battle Armor (Anti-Infantry) (Sqd6)","Se'irim Medium Battle Armor (Capture Team) (Sqd4)","Se'irim Medium Battle Armor (Capture Team) (Sqd5)","Se'irim Medium Battle Armor (Capture Team) (Sqd6)","Se'irim Medium Battle Armor (Sqd4)","Se'irim Medium Battle Armor (Sqd5)","Se'irim Medium Battle Armor (Sqd6)","Simian Battle Armor [Flamer] (Sqd4)","Simian Battle Armor [Flamer] (Sqd5)","Simian Battle Armor [Flamer] (Sqd6)","Simian Battle Armor [HMG] (Sqd4)","Simian Battle Armor [HMG] (Sqd5)","Simian Battle Armor [HMG] (Sqd6)","Simian Battle Armor [LRR] (Sqd4)","Simian Battle Armor [LRR] (Sqd5)","Simian Battle Armor [LRR] (Sqd6)","Simian Battle Armor [SL] (Sqd4)","Simian Battle Armor [SL] (Sqd5)","Simian Battle Armor [SL] (Sqd6)","Surat (Gray Death) Solahma Suit (Sqd4)","Surat (Gray Death) Solahma Suit (Sqd5)","Surat (Gray Death) Solahma Suit (Sqd6)","TinStar Battle Armor (Original) (Sqd4)","TinStar Battle Armor (Original) (Sqd5)","TinStar Battle Armor (Original) (Sqd6)","TinStar Battle Armor (Sqd4)","TinStar Battle Armor (Sqd5)","TinStar Battle Armor (Sqd6)","Trinity Medium Battle Armor (Asterion Upgrade) [MRR] (Sqd4)","Trinity Medium Battle Armor (Asterion Upgrade) [MRR] (Sqd5)","Trinity Medium Battle Armor (Asterion Upgrade) [MRR] (Sqd6)","Trinity Medium Battle Armor (Asterion Upgrade) [PPC] (Sqd4)","Trinity Medium Battle Armor (Asterion Upgrade) [PPC] (Sqd5)","Trinity Medium Battle Armor (Asterion Upgrade) [PPC] (Sqd6)","Trinity Medium Battle Armor (Asterion) [MRR] (Sqd4)","Trinity Medium Battle Armor (Asterion) [MRR] (Sqd5)","Trinity Medium Battle Armor (Asterion) [MRR] (Sqd6)","Trinity Medium Battle Armor (Asterion) [PPC] (Sqd4)","Trinity Medium Battle Armor (Asterion) [PPC] (Sqd5)","Trinity Medium Battle Armor (Asterion) [PPC] (Sqd6)","Trinity Medium Battle Armor (Theseus RL)  [LRR] (Sqd4)","Trinity Medium Battle Armor (Theseus RL) [LRR] (Sqd5)","Trinity Medium Battle Armor (Theseus RL) [LRR] (Sqd6)","Trinity Medium Battle Armor (Theseus Support) \"Killshot\" (Sqd4)","Trinity Medium Battle Armor (Theseus Support) \"Killshot\" (Sqd5)","Trinity Medium Battle Armor (Theseus Support) \"Killshot\" (Sqd6)","Trinity Medium Battle Armor (Theseus) [MRR] (Sqd4)","Trinity Medium Battle Armor (Theseus) [MRR] (Sqd5)","Trinity Medium Battle Armor (Theseus) [MRR] (Sqd6)","Trinity Medium Battle Armor (Ying Long BC3) [David] (Sqd4)","Trinity Medium Battle Armor (Ying Long BC3) [David] (Sqd5)","Trinity Medium Battle Armor (Ying Long BC3) [David] (Sqd6)","Trinity Medium Battle Armor (Ying Long) [Plasma] (Sqd4)","Trinity Medium Battle Armor (Ying Long) [Plasma] (Sqd5)","Trinity Medium Battle Armor (Ying Long) [Plasma] (Sqd6)","Undine Battle Armor (Sqd4)","Undine Battle Armor (Sqd5)","Undine Battle Armor (Sqd6)","Undine Battle Armor (Upgrade) (Sqd4)","Undine Battle Armor (Upgrade) (Sqd5)","Undine Battle Armor (Upgrade) (Sqd6)","Void Medium Battle Armor (DCA) (Sqd4)","Void Medium Battle Armor (DCA) (Sqd5)","Void Medium Battle Armor (DCA) (Sqd6)","Void Medium Battle Armor (Minelayer) (Sqd4)","Void Medium Battle Armor (Minelayer) (Sqd5)","Void Medium Battle Armor (Minelayer) (Sqd6)","Void Medium Battle Armor (Nova Cat) (Sqd4)","Void Medium Battle Armor (Nova Cat) (Sqd5)","Void Medium Battle Armor (Nova Cat) (Sqd6)","Void Medium Battle Armor (Sqd4)","Void Medium Battle Armor (Sqd5)","Void Medium Battle Armor (Sqd6)","Void Medium Battle Armor Caltrop (Sqd4)","Void Medium Battle Armor Caltrop (Sqd5)","Void Medium Battle Armor Caltrop (Sqd6)","Water Elemental Mining Suit (Sqd5)","Wraith Battle Armor (Anti-Infantry) (Sqd4)","Wraith Battle Armor (Anti-Infantry) (Sqd5)","Wraith Battle Armor (Anti-Infantry) (Sqd6)","Wraith Battle Armor (Sqd4)","Wraith Battle Armor (Sqd5)","Wraith Battle Armor (Sqd6)","Black Wolf Battle Armor [ERSPL] (Sqd4)","Black Wolf Battle Armor [ERSPL] (Sqd5)","Black Wolf Battle Armor [ERSPL] (Sqd6)","Black Wolf Battle Armor [Heavy Flamer] (Sqd4)","Black Wolf Battle Armor [Heavy Flamer] (Sqd5)","Black Wolf Battle Armor [Heavy Flamer] (Sqd6)","Black Wolf Battle Armor [Heavy Mortar] (Sqd4)","Black Wolf Battle Armor [Heavy Mortar] (Sqd5)","Black Wolf Battle Armor [Heavy Mortar] (Sqd6)","Black Wolf Battle Armor [LB-X] (Sqd4)","Black Wolf Battle Armor [LB-X] (Sqd5)","Black Wolf Battle Armor [LB-X] (Sqd6)","Black Wolf Battle Armor [Plasma] (Sqd4)","Black Wolf Battle Armor [Plasma] (Sqd5)","Black Wolf Battle Armor [Plasma] (Sqd6)","Centaur Battle Armor (Sqd4)","Centaur Battle Armor (Sqd5)","Centaur Battle Armor (Sqd6)","Corona Heavy Battle Armor (Sqd4)","Corona Heavy Battle Armor (Sqd5)","Corona Heavy Battle Armor (Sqd6)","Corona Heavy Battle Armor (SRM) (Sqd4)","Corona Heavy Battle Armor (SRM) (Sqd5)","Corona Heavy Battle Armor (SRM) (Sqd6)","Cuchulainn Support Armor (Sqd4)","Cuchulainn Support Armor (Sqd5)","Cuchulainn Support Armor (Sqd6)","Elemental II Battle Armor X (Sqd4)","Elemental II Battle Armor X (Sqd5)","Elemental II Battle Armor X (Sqd6)","Gnome Battle Armor \"Dwarf\" (Sqd4)","Gnome Battle Armor (LRM) (Sqd4)","Gnome Battle Armor (LRM) (Sqd5)","Gnome Battle Armor (LRM) (Sqd6)","Gnome Battle Armor (Sqd3)","Gnome Battle Armor (Sqd4)","Gnome Battle Armor (Sqd5)","Gnome Battle Armor (Sqd6)","Gnome Battle Armor (Upgrade) [Bearhunter] (Sqd4)","Gnome Battle Armor (Upgrade) [Bearhunter] (Sqd5)","Gnome Battle Armor (Upgrade) [Bearhunter] (Sqd6)","Gnome Battle Armor (Upgrade) [MRR] (Sqd4)","Gnome Battle Armor (Upgrade) [MRR] (Sqd5)","Gnome Battle Armor (Upgrade) [MRR] (Sqd6)","Gnome Battle Armor (Upgrade) [Pulse Laser] (Sqd4)","Gnome Battle Armor (Upgrade) [Pulse Laser] (Sqd5)","Gnome Battle Armor (Upgrade) [Pulse Laser] (Sqd6)","Gray Death Heavy Suit (Sqd4)","Gray Death Heavy Suit (Sqd5)","Gray Death Heavy Suit (Sqd6)","Grenadier II Battle Armor A (Sqd4)","Grenadier II Battle Armor A (Sqd5)","Grenadier II Battle Armor A (Sqd6)","Grenadier II Battle Armor B (Sqd4)","Grenadier II Battle Armor B (Sqd5)","Grenadier II Battle Armor B (Sqd6)","Grenadier II Battle Armor C (Sqd4)","Grenadier II Battle Armor C (Sqd5)","Grenadier II Battle Armor C (Sqd6)","Grenadier II Battle Armor D (Sqd4)","Grenadier II Battle Armor D (Sqd5)","Grenadier II Battle Armor D (Sqd6)","Marauder Battle Armor (Sqd4)","Marauder Battle Armor (Sqd5)","Marauder Battle Armor (Sqd6)","Ogre Battle Armor (Interdictor) (Sqd4)","Ogre Battle Armor (Interdictor) (Sqd5)","Ogre Battle Armor (Interdictor) (Sqd6)","Ogre Battle Armor (Sqd4)","Ogre Battle Armor (Sqd5)","Ogre Battle Armor (Sqd6)","Phalanx Battle Armor A (Sqd4)","Phalanx Battle Armor A (Sqd5)","Phalanx Battle Armor A (Sqd6)","Phalanx Battle Armor B (Sqd4)","Phalanx Battle Armor B (Sqd5)","Phalanx Battle Armor B (Sqd6)","Phalanx Battle Armor C (Sqd4)","Phalanx Battle Armor C (Sqd5)","Phalanx Battle Armor C (Sqd6)","Phalanx Battle Armor D (Sqd4)","Phalanx Battle Armor D (Sqd5)","Phalanx Battle Armor D (Sqd6)","Rhino Battle Armor (Sqd4)","Rhino Battle Armor (Sqd5)","Rhino Battle Armor (Sqd6)","Rogue Bear Heavy Battle Armor (Hybrid) (Sqd4)","Rogue Bear Heavy Battle Armor (Hybrid) (Sqd5)","Rogue Bear Heavy Battle Armor (Hybrid) (Sqd6)","Rogue Bear Heavy Battle Armor (Sqd4)","Rogue Bear Heavy Battle Armor (Sqd5)","Rogue Bear Heavy Battle Armor (Sqd6)","Rogue Bear Heavy Battle Armor (Upgrade) (Sqd4)","Rogue Bear Heavy Battle Armor (Upgrade) (Sqd5)","Rogue Bear Heavy Battle Armor (Upgrade) (Sqd6)","Rogue Bear Heavy Battle Armor HR (Sqd4)","Rogue Bear Heavy Battle Armor HR (Sqd5)","Rogue Bear Heavy Battle Armor HR (Sqd6)","Shen Long Battle Armor [David] (Sqd4)","Shen Long Battle Armor [David] (Sqd5)","Shen Long Battle Armor [David] (Sqd6)","Shen Long Battle Armor [Interdictor] (Sqd4)","Shen Long Battle Armor [Interdictor] (Sqd5)","Shen Long Battle Armor [Interdictor] (Sqd6)","Shen Long Battle Armor [MG] (Sqd4)","Shen Long Battle Armor [MG] (Sqd5)","Shen Long Battle Armor [MG] (Sqd6)","Shen Long Battle Armor [MRM] (Sqd4)","Shen Long Battle Armor [MRM] (Sqd5)","Shen Long Battle Armor [MRM] (Sqd6)","Shen Long Battle Armor [Pop-Up Mine] (Sqd4)","Shen Long Battle Armor [Pop-Up Mine] (Sqd5)","Shen Long Battle Armor [Pop-Up Mine] (Sqd6)","Shen Long Battle Armor [SRM] (Sqd4)","Shen Long Battle Armor [SRM] (Sqd5)","Shen Long Battle Armor [SRM] (Sqd6)","Sloth Battle Armor \"Huntsman\" (Sqd4)","Sloth Battle Armor \"Huntsman\" (Sqd5)","Sloth Battle Armor \"Huntsman\" (Sqd6)","Sloth Battle Armor (Interdictor) (Sqd4)","Sloth Battle Armor (Interdictor) (Sqd5)","Sloth Battle Armor (Interdictor) (Sqd6)","Sloth Battle Armor (Sqd4)","Sloth Battle Armor (Sqd5)","Sloth Battle Armor (Sqd6)","Stormbird Battle Armor (Jade Falcon) (Sqd4)","Stormbird Battle Armor (Jade Falcon) (Sqd5)","Stormbird Battle Armor (Jade Falcon) (Sqd6)","Stormbird Battle Armor (Sqd4)","Stormbird Battle Armor (Sqd5)","Stormbird Battle Armor (Sqd6)","Taranis Battle Armor (Sqd4)","Taranis Battle Armor (Sqd5)","Taranis Battle Armor (Sqd6)","Tengu Heavy Battle Armor (Support) [LRR] (Sqd4)","Tengu Heavy Battle Armor (Support) [LRR] (Sqd5)","Tengu Heavy Battle Armor (Support) [LRR] (Sqd6)","Tengu Heavy Battle Armor (SVSP) (Sqd4)","Tengu Heavy Battle Armor (SVSP) (Sqd5)","Tengu Heavy Battle Armor (SVSP) (Sqd6)","Tengu Heavy Battle Armor [C3i] (Sqd4)","Tengu Heavy Battle Armor [C3i] (Sqd5)","Tengu Heavy Battle Armor [C3i] (Sqd6)","Tengu Heavy Battle Armor [ML] (Sqd4)","Tengu Heavy Battle Armor [ML] (Sqd5)","Tengu Heavy Battle Armor [ML] (Sqd6)","Tengu Heavy Battle Armor [Plasma] (Sqd4)","Tengu Heavy Battle Armor [Plasma] (Sqd5)","Tengu Heavy Battle Armor [Plasma] (Sqd6)","Tengu Heavy Battle Armor [RL] (Sqd4)","Tengu Heavy Battle Armor [RL] (Sqd5)","Tengu Heavy Battle Armor [RL] (Sqd6)","Thunderbird Battle Armor (Upgrade) [ER Laser] (Sqd4)","Thunderbird Battle Armor (Upgrade) [ER Laser] (Sqd5)","Thunderbird Battle Armor (Upgrade) [ER Laser] (Sqd6)","Thunderbird Battle Armor (Upgrade) [LB-X] (Sqd4)","Thunderbird Battle Armor (Upgrade) [LB-X] (Sqd5)","Thunderbird Battle Armor (Upgrade) [LB-X] (Sqd6)","Thunderbird Battle Armor (Upgrade) [Pulse Laser] (Sqd4)","Thunderbird Battle Armor (Upgrade) [Pulse Laser] (Sqd5)","Thunderbird Battle Armor (Upgrade) [Pulse Laser] (Sqd6)","Thunderbird Battle Armor [AP Gauss] (Sqd4)","Thunderbird Battle Armor [AP Gauss] (Sqd5)","Thunderbird Battle Armor [AP Gauss] (Sqd6)","Thunderbird Battle Armor [ER Laser] (Sqd4)","Thunderbird Battle Armor [ER Laser] (Sqd5)","Thunderbird Battle Armor [ER Laser] (Sqd6)","Thunderbird Battle Armor [Pulse Laser] (Sqd4)","Thunderbird Battle Armor [Pulse Laser] (Sqd5)","Thunderbird Battle Armor [Pulse Laser] (Sqd6)","Thunderbird II Battle Armor (Sqd4)","Thunderbird II Battle Armor (Sqd5)","Thunderbird II Battle Armor (Sqd6)","Undine Battle Armor \"Sebastian\" (Sqd4)","Zou Heavy Battle Armor (C3) (Sqd4)","Zou Heavy Battle Armor (C3) (Sqd5)","Zou Heavy Battle Armor (C3) (Sqd6)","Zou Heavy Battle Armor (Sqd4)","Zou Heavy Battle Armor (Sqd5)","Zou Heavy Battle Armor (Sqd6)","Fenrir Battle Armor \"Longshot\" (Sqd4)","Fenrir Battle Armor \"Longshot\" (Sqd5)","Fenrir Battle Armor \"Longshot\" (Sqd6)","Fenrir Battle Armor [ERML] (Sqd4)","Fenrir Battle Armor [ERML] (Sqd5)","Fenrir Battle Armor [ERML] (Sqd6)","Fenrir Battle Armor [MG] (Sqd4)","Fenrir Battle Armor [MG] (Sqd5)","Fenrir Battle Armor [MG] (Sqd6)","Fenrir Battle Armor [Mortar] (Sqd4)","Fenrir Battle Armor [Mortar] (Sqd5)","Fenrir Battle Armor [Mortar] (Sqd6)","Fenrir Battle Armor [MPL] (Sqd4)","Fenrir Battle Armor [MPL] (Sqd5)","Fenrir Battle Armor [MPL] (Sqd6)","Fenrir Battle Armor [SL] (Sqd4)","Fenrir Battle Armor [SL] (Sqd5)","Fenrir Battle Armor [SL] (Sqd6)","Fenrir Battle Armor [SPL] (Sqd4)","Fenrir Battle Armor [SPL] (Sqd5)","Fenrir Battle Armor [SPL] (Sqd6)","Fenrir Battle Armor [SRM] (Sqd4)","Fenrir Battle Armor [SRM] (Sqd5)","Fenrir Battle Armor [SRM] (Sqd6)","Fenrir Battle Armor [VSP] (Sqd4)","Fenrir Battle Armor [VSP] (Sqd5)","Fenrir Battle Armor [VSP] (Sqd6)","Fenrir II Assault Battle Armor [AI] (Sqd4)","Fenrir II Assault Battle Armor [AI] (Sqd5)","Fenrir II Assault Battle Armor [AI] (Sqd6)","Fenrir II Assault Battle Armor [LRM] (Sqd4)","Fenrir II Assault Battle Armor [LRM] (Sqd5)","Fenrir II Assault Battle Armor [LRM] (Sqd6)","Fenrir II Assault Battle Armor [ML] (Sqd4)","Fenrir II Assault Battle Armor [ML] (Sqd5)","Fenrir II Assault Battle Armor [ML] (Sqd6)","Fenrir II Assault Battle Armor [MRR] (Sqd4)","Fenrir II Assault Battle Armor [MRR] (Sqd5)","Fenrir II Assault Battle Armor [MRR] (Sqd6)","Fenrir II Assault Battle Armor [SRM] (Sqd4)","Fenrir II Assault Battle Armor [SRM] (Sqd5)","Fenrir II Assault Battle Armor [SRM] (Sqd6)","Fusilier Battle Armor (Sqd4)","Fusilier Battle Armor (Sqd5)","Fusilier Battle Armor (Sqd6)","Fusilier Battle Armor (Upgrade) (Sqd4)","Fusilier Battle Armor (Upgrade) (Sqd5)","Fusilier Battle Armor (Upgrade) (Sqd6)","Golem Assault Armor (Fast Assault) (Sqd4)","Golem Assault Armor (Fast Assault) (Sqd5)","Golem Assault Armor (Fast Assault) (Sqd6)","Golem Assault Armor (Rock Golem) (Sqd4)","Golem Assault Armor (Rock Golem) (Sqd5)","Golem Assault Armor (Rock Golem) (Sqd6)","Golem Assault Armor (Sqd4)","Golem Assault Armor (Sqd5)","Golem Assault Armor (Sqd6)","Golem Assault Armor (Support) (Sqd4)","Golem Assault Armor (Support) (Sqd5)","Golem Assault Armor (Support) (Sqd6)","Grenadier Battle Armor (Hunter-Killer) [C3/HRR] (Sqd4)","Grenadier Battle Armor (Hunter-Killer) [C3/HRR] (Sqd5)","Grenadier Battle Armor (Hunter-Killer) [C3/HRR] (Sqd6)","Grenadier Battle Armor (Hunter-Killer) [SRM/MagShot] (Sqd4)","Grenadier Battle Armor (Hunter-Killer) [SRM/MagShot] (Sqd5)","Grenadier Battle Armor (Hunter-Killer) [SRM/MagShot] (Sqd6)","Grenadier Battle Armor (Hunter-Killer) [SRM/Narc] (Sqd4)","Grenadier Battle Armor (Hunter-Killer) [SRM/Narc] (Sqd5)","Grenadier Battle Armor (Hunter-Killer) [SRM/Narc] (Sqd6)","Grenadier Battle Armor (Hunter-Killer) [SVSP/Magshot] (Sqd4)","Grenadier Battle Armor (Hunter-Killer) [SVSP/Magshot] (Sqd5)","Grenadier Battle Armor (Hunter-Killer) [SVSP/Magshot] (Sqd6)","Grenadier Battle Armor [Heavy Flamer/Heavy Flamer] (Sqd4)","Grenadier Battle Armor [Heavy Flamer/Heavy Flamer] (Sqd5)","Grenadier Battle Armor [Heavy Flamer/Heavy Flamer] (Sqd6)","Grenadier Battle Armor [SRM/Flamer] (Sqd4)","Grenadier Battle Armor [SRM/Flamer] (Sqd5)","Grenadier Battle Armor [SRM/Flamer] (Sqd6)","Grenadier Battle Armor [SRM/LRR] (Sqd4)","Grenadier Battle Armor [SRM/LRR] (Sqd5)","Grenadier Battle Armor [SRM/LRR] (Sqd6)","Grenadier Battle Armor [SRM/MagShot] (Sqd4)","Grenadier Battle Armor [SRM/MagShot] (Sqd5)","Grenadier Battle Armor [SRM/MagShot] (Sqd6)","Grenadier Battle Armor [SRM/SL] (Sqd4)","Grenadier Battle Armor [SRM/SL] (Sqd5)","Grenadier Battle Armor [SRM/SL] (Sqd6)","Grenadier Battle Armor [SRM/TAG] (Sqd4)","Grenadier Battle Armor [SRM/TAG] (Sqd5)","Grenadier Battle Armor [SRM/TAG] (Sqd6)","Hauberk Battle Armor (Sqd4)","Hauberk Battle Armor (Sqd5)","Hauberk Battle Armor (Sqd6)","Hauberk Battle Armor Commando (Sqd4)","Hauberk Battle Armor Commando (Sqd5)","Hauberk Battle Armor Commando (Sqd6)","Hauberk Battle Armor U15 (Sqd4)","Hauberk Battle Armor U15 (Sqd5)","Hauberk Battle Armor U15 (Sqd6)","Hauberk II Battle Armor (Sqd4)","Hauberk II Battle Armor (Sqd5)","Hauberk II Battle Armor (Sqd6)","Ironhold Assault Battle Armor (Anti-Tank) (Sqd4)","Ironhold Assault Battle Armor (Anti-Tank) (Sqd5)","Ironhold Assault Battle Armor (Anti-Tank) (Sqd6)","Ironhold Assault Battle Armor (Fire) (Sqd4)","Ironhold Assault Battle Armor (Fire) (Sqd5)","Ironhold Assault Battle Armor (Fire) (Sqd6)","Ironhold Assault Battle Armor (Sqd4)","Ironhold Assault Battle Armor (Sqd5)","Ironhold Assault Battle Armor (Sqd6)","Kanazuchi Assault Battle Armor \"Cyclops\" (Sqd4)","Kanazuchi Assault Battle Armor \"Cyclops\" (Sqd5)","Kanazuchi Assault Battle Armor \"Cyclops\" (Sqd6)","Kanazuchi Assault Battle Armor (Support) (Sqd4)","Kanazuchi Assault Battle Armor (Support) (Sqd5)","Kanazuchi Assault Battle Armor (Support) (Sqd6)","Kanazuchi Assault Battle Armor (Upgrade) [Battle Claw] (Sqd4)","Kanazuchi Assault Battle Armor (Upgrade) [Battle Claw] (Sqd5)","Kanazuchi Assault Battle Armor (Upgrade) [Battle Claw] (Sqd6)","Kanazuchi Assault Battle Armor [Battle Claw] (Sqd4)","Kanazuchi Assault Battle Armor [Battle Claw] (Sqd5)","Kanazuchi Assault Battle Armor [Battle Claw] (Sqd6)","Kanazuchi Assault Battle Armor [Industrial Drill] (Sqd4)","Kanazuchi Assault Battle Armor [Industrial Drill] (Sqd5)","Kanazuchi Assault Battle Armor [Industrial Drill] (Sqd6)","Kanazuchi Assault Battle Armor [Salvage Arm] (Sqd4)","Kanazuchi Assault Battle Armor [Salvage Arm] (Sqd5)","Kanazuchi Assault Battle Armor [Salvage Arm] (Sqd6)","Kopis Assault Battle Armor \"The Dark Alley\" (Sqd4)","Kopis Assault Battle Armor \"The Dark Alley\" (Sqd5)","Kopis Assault Battle Armor \"The Dark Alley\" (Sqd6)","Kopis Assault Battle Armor (AI Mk II) (Sqd4)","Kopis Assault Battle Armor (AI Mk II) (Sqd5)","Kopis Assault Battle Armor (AI Mk II) (Sqd6)","Kopis Assault Battle Armor (AI Mk IIr) (Sqd4)","Kopis Assault Battle Armor (AI Mk IIr) (Sqd5)","Kopis Assault Battle Armor (AI Mk IIr) (Sqd6)","Kopis Assault Battle Armor (Anti-Infantry) (Sqd4)","Kopis Assault Battle Armor (Anti-Infantry) (Sqd5)","Kopis Assault Battle Armor (Anti-Infantry) (Sqd6)","Kopis Assault Battle Armor (Mortar) (Sqd4)","Kopis Assault Battle Armor (Mortar) (Sqd5)","Kopis Assault Battle Armor (Mortar) (Sqd6)","Nephilim Assault Battle Armor (Capture Team) [HMG] (Sqd4)","Nephilim Assault Battle Armor (Capture Team) [HMG] (Sqd5)","Nephilim Assault Battle Armor (Capture Team) [HMG] (Sqd6)","Nephilim Assault Battle Armor (Gauss) (Sqd4)","Nephilim Assault Battle Armor (Gauss) (Sqd5)","Nephilim Assault Battle Armor (Gauss) (Sqd6)","Nephilim Assault Battle Armor (Narc) (Sqd4)","Nephilim Assault Battle Armor (Narc) (Sqd5)","Nephilim Assault Battle Armor (Narc) (Sqd6)","Nephilim Assault Battle Armor (Seeker) [MG] (Sqd4)","Nephilim Assault Battle Armor (Seeker) [MG] (Sqd5)","Nephilim Assault Battle Armor (Seeker) [MG] (Sqd6)","Nephilim Assault Battle Armor (Support) (Sqd4)","Nephilim Assault Battle Armor (Support) (Sqd5)","Nephilim Assault Battle Armor (Support) (Sqd6)","Nephilim Assault Battle Armor [Plasma] (Sqd4)","Nephilim Assault Battle Armor [Plasma] (Sqd5)","Nephilim Assault Battle Armor [Plasma] (Sqd6)","Ravager Assault Battle Armor (LRM) (Sqd4)","Ravager Assault Battle Armor (LRM) (Sqd5)","Ravager Assault Battle Armor (LRM) (Sqd6)","Ravager Assault Battle Armor (Sqd4)","Ravager Assault Battle Armor (Sqd5)","Ravager Assault Battle Armor (Sqd6)","Shedu Assault Battle Armor (Capture Team) (Sqd4)","Shedu Assault Battle Armor (Capture Team) (Sqd5)","Shedu Assault Battle Armor (Capture Team) (Sqd6)","Shedu Assault Battle Armor (PPC) (Sqd4)","Shedu Assault Battle Armor (PPC) (Sqd5)","Shedu Assault Battle Armor (PPC) (Sqd6)","Shedu Assault Battle Armor (Recon) (Sqd4)","Shedu Assault Battle Armor (Recon) (Sqd5)","Shedu Assault Battle Armor (Recon) (Sqd6)","Shedu Assault Battle Armor (Sqd4)","Shedu Assault Battle Armor (Sqd5)","Shedu Assault Battle Armor (Sqd6)","Shedu Assault Battle Armor (Support) (Sqd4)","Shedu Assault Battle Armor (Support) (Sqd5)","Shedu Assault Battle Armor (Support) (Sqd6)","Tortoise II Battle Armor [aSRM] (Sqd4)","Tortoise II Battle Armor [aSRM] (Sqd5)","Tortoise II Battle Armor [aSRM] (Sqd6)","Tortoise II Battle Armor [C3] (Sqd4)","Tortoise II Battle Armor [C3] (Sqd5)","Tortoise II Battle Armor [C3] (Sqd6)","Tortoise II Battle Armor [LRM] (Sqd4)","Tortoise II Battle Armor [LRM] (Sqd5)","Tortoise II Battle Armor [LRM] (Sqd6)","Tortoise II Battle Armor [SRM] (Sqd4)","Tortoise II Battle Armor [SRM] (Sqd5)","Tortoise II Battle Armor [SRM] (Sqd6)","Warg Assault Battle Armor (Reactive) (Sqd4)","Warg Assault Battle Armor (Reactive) (Sqd5)","Warg Assault Battle Armor (Reactive) (Sqd6)","Warg Assault Battle Armor (Sqd4)","Warg Assault Battle Armor (Sqd5)","Warg Assault Battle Armor (Sqd6)","Xiphos Assault Battle Armor A (Sqd4)","Xiphos Assault Battle Armor A (Sqd5)","Xiphos Assault Battle Armor A (Sqd6)","Xiphos Assault Battle Armor B (Sqd4)","Xiphos Assault Battle Armor B (Sqd5)","Xiphos Assault Battle Armor B (Sqd6)","Xiphos Assault Battle Armor C (Sqd4)","Xiphos Assault Battle Armor C (Sqd5)","Xiphos Assault Battle Armor C (Sqd6)"]},"Class":{"dict":["Clan Interface Armor","Aerie PA(L)","Ailette","Ailette Zero-G Engineering Exoskeleton","Gladiator Battle Armor","Gladiator Exoskeleton \"The Spider\"","Gladiator Exoskeleton","Gorilla Exoskeleton","Groundhog Exoskeleton \u201cMaster Thief\"","Groundhog Exoskeleton","Hantu ","HeavyHauler Exoskeleton","Krise PA(L)","Nighthawk PA(L)","PowerLoader Exoskeleton","Resgate PA(L)","Salrilla Exoskeleton","Smoothdavid PA(L)","Smoothgoliath PA(L)","Sniper Suit","Tornado PA(L) G12","Tornado PA(L) G13","Tornado PA(L) G14","Tornado PA(L) G17","Tornado PA(L)","Tunnel Rat I Mining Exoskeleton","Tunnel Rat II Mining Exoskeleton","Tunnel Rat III Mining Exoskeleton","Tunnel Rat IV Mining Exoskeleton","Achileus Light Battle Armor (WoB)","Achileus Light Battle Armor","Constable Pacification Suit","Djinn Battle Armor (Reflective)","Djinn Battle Armor","Gray Death Scout Suit","Infiltrator Mk. I Battle Armor","Kage Light Battle Armor (DEST)","Kage Light Battle Armor (Space)","Kage Light Battle Armor (Vibro-Claw) ","Kage Light Battle Armor (Vibro-Claw)","Kage Light Battle Armor","Kage Light Battle Armor C","Kishi Battle Armor","Kobold Battle Armor","Kobold Battle Armor IIC","Kobold Battle Armor X-C3","Sea Fox Amphibious Armor","Spectre Stealth Battle Armor","Sylph Battle Armor","Aegis Point Defense Suit","Afreet Medium Battle Armor","Amazon Battle Armor","Angerona Scout Suit","Asura Medium Battle Armor","Buraq Fast Battle Armor","Callisto Battle Armor","Cavalier Battle Armor","Cavalier II Battle Armor","Clan Medium Battle Armor","Clan Medium Battle Armor (Laser) ","Clan Medium Battle Armor (Laser)","Clan Medium Battle Armor (Naval)","Dragoon Battle Armor","Elemental Battle Armor (Fire)","Elemental Battle Armor (Headhunter)","Elemental Battle Armor (Space)","Elemental Battle Armor","Elemental II Battle Armor","Elemental III Battle Armor","Fa Shih Battle Armor (Support)","Fa Shih Battle Armor","Fa Shih Battle Armor 2","Gray Death Infiltrator Suit","Gray Death Standard Suit","Gray Death Strike Suit","Infiltrator Mk. II Battle Armor","IS Standard Battle Armor \"Baka\"","IS Standard Battle Armor \"Fa Sure\"","IS Standard Battle Armor \"Hive\"","IS Standard Battle Armor (Magnetic)","IS Standard Battle Armor","Leonidas Battle Armor","Longinus Battle Armor \"Hacked\"","Longinus Battle Armor (Magnetic)","Longinus Battle Armor","Longinus C Battle Armor","Oni Battle Armor","Purifier Adaptive Battle Armor","Purifier Terra Battle Armor","Quirinus Battle Armor","Raiden Battle Armor (Anti-Infantry)","Raiden Battle Armor (Original)","Raiden Battle Armor","Raiden II Battle Armor","Rottweiler Battle Armor","Salamander Battle Armor","Se'irim Medium Battle Armor","Simian Battle Armor","Surat (Gray Death) Solahma Suit","TinStar Battle Armor","Trinity Medium Battle Armor (Asterion Upgrade)","Trinity Medium Battle Armor (Asterion)","Trinity Medium Battle Armor (Theseus RL) ","Trinity Medium Battle Armor (Theseus RL)","Trinity Medium Battle Armor (Theseus Support)","Trinity Medium Battle Armor (Theseus)","Trinity Medium Battle Armor (Ying Long BC3)","Trinity Medium Battle Armor (Ying Long)","Undine Battle Armor","Void Medium Battle Armor","Water Elemental Mining Suit","Wraith Battle Armor","Black Wolf Battle Armor","Centaur Battle Armor","Corona Heavy Battle Armor","Cuchulainn Support Armor","Gnome Battle Armor","Gray Death Heavy Suit","Grenadier II Battle Armor","Marauder Battle Armor","Ogre Battle Armor","Phalanx Battle Armor","Rhino Battle Armor","Rogue Bear Heavy Battle Armor","Shen Long Battle Armor","Sloth Battle Armor","Stormbird Battle Armor","Taranis Battle Armor","Tengu Heavy Battle Armor","Thunderbird Battle Armor (Upgrade)","Thunderbird Battle Armor","Thunderbird II Battle Armor","Zou Heavy Battle Armor","Fenrir Battle Armor \"Longshot\"","Fenrir Battle Armor","Fenrir II Assault Battle Armor","Fusilier Battle Armor","Golem Assault Armor","Grenadier Battle Armor (Hunter-Killer)","Grenadier Battle Armor","Hauberk Battle Armor","Hauberk Battle Armor Commando","Hauberk Battle Armor U15","Hauberk II Battle Armor","Ironhold Assault Battle Armor","Kanazuchi Assault Battle Armor \"Cyclops\"","Kanazuchi Assault Battle Armor (Support)","Kanazuchi Assault Battle Armor (Upgrade)","Kanazuchi Assault Battle Armor","Kopis Assault Battle Armor","Nephilim Assault Battle Armor (Capture Team)","Nephilim Assault Battle Armor (Gauss)","Nephilim Assault Battle Armor (Narc)","Nephilim Assault Battle Armor (Seeker)","Nephilim Assault Battle Armor (Support)","Nephilim Assault Battle Armor","Ravager Assault Battle Armor","Shedu Assault Battle Armor","Tortoise II Battle Armor","Warg Assault Battle Armor","Xiphos Assault Battle Armor"],"values":[0,0,0,1,1,1,1,1,1,2,2,2,3,3,3,4,4,4,5,5,5,6,6,6,6,6,6,7,7,7,7,7,7,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,11,11,11,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,17,17,17,17,17,17,18,18,18,19,19,19,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,23,23,23,24,24,24,24,24,24,25,25,25,25,25,25,26,26,26,26,26,26,27,27,27,27,27,27,28,28,28,28,28,28,28,28,28,28,28,28,29,29,29,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,32,32,32,32,32,32,32,32,32,33,33,33,33,33,33,34,34,34,34,34,34,34,34,34,35,35,35,35,35,35,36,36,36,37,37,37,38,39,39,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,41,41,41,42,42,42,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,44,44,44,45,45,45,46,46,46,47,47,47,48,48,48,48,48,48,48,48,48,48,48,48,48,49,49,49,50,50,50,50,50,50,50,50,50,50,50,50,51,51,51,51,51,51,52,52,52,52,52,52,53,53,53,53,53,53,53,53,53,54,54,54,54,54,54,54,54,54,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,56,56,56,56,56,56,56,56,56,56,56,56,57,57,57,57,57,57,57,57,57,57,57,57,58,58,58,58,58,58,59,59,60,61,61,61,62,62,62,62,62,62,63,63,63,63,63,63,63,63,63,64,64,64,64,65,65,65,65,65,65,65,65,65,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,67,67,67,68,68,68,68,68,68,68,68,68,69,69,69,69,69,69,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,71,71,71,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,74,74,74,74,74,74,74,74,74,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,76,76,76,76,76,76,77,77,77,77,77,77,78,78,78,79,79,79,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,82,82,82,82,82,82,83,83,83,84,84,84,84,84,84,84,84,84,84,84,84,85,85,85,85,85,85,86,86,86,86,86,86,86,86,86,86,86,86,87,87,87,87,87,87,87,87,87,87,87,87,88,88,88,88,88,88,88,88,88,88,88,88,89,89,89,89,89,89,89,89,89,90,90,90,91,91,91,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,93,93,93,93,93,93,94,94,94,94,94,94,94,94,94,94,94,94,95,95,95,95,95,95,95,95,95,95,96,96,96,96,96,96,96,96,96,97,97,97,97,97,97,97,97,97,97,97,97,98,98,98,99,99,99,99,99,99,100,100,100,100,100,100,101,101,101,101,101,101,102,103,103,104,104,104,105,105,105,106,106,106,107,107,107,108,108,108,108,108,108,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,110,111,111,111,111,111,111,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,113,113,113,114,114,114,114,114,114,115,115,115,67,67,67,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,117,117,117,118,118,118,118,118,118,118,118,118,118,118,118,119,119,119,120,120,120,120,120,120,121,121,121,121,121,121,121,121,121,121,121,121,122,122,122,123,123,123,123,123,123,123,123,123,123,123,123,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,125,125,125,125,125,125,125,125,125,126,126,126,126,126,126,127,127,127,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,129,129,129,129,129,129,129,129,129,130,130,130,130,130,130,130,130,130,131,131,131,108,132,132,132,132,132,132,133,133,133,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,136,136,136,136,136,136,137,137,137,137,137,137,137,137,137,137,137,137,138,138,138,138,138,138,138,138,138,138,138,138,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,140,140,140,141,141,141,142,142,142,143,143,143,144,144,144,144,144,144,144,144,144,145,145,145,146,146,146,147,147,147,148,148,148,148,148,148,148,148,148,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,150,150,150,151,151,151,152,152,152,153,153,153,154,154,154,155,155,155,156,156,156,156,156,156,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,158,158,158,158,158,158,158,158,158,158,158,158,159,159,159,159,159,159,160,160,160,160,160,160,160,160,160]},"Model":{"dict":["(Sqd4)","(Sqd5)","(Sqd6)","(Salvage) (Sqd4)","(Salvage) (Sqd5)","(Salvage) (Sqd6)","Rescue PA(L) (Sqd4)","Rescue PA(L) (Sqd5)","Rescue PA(L) (Sqd6)","S (Sqd4)","S (Sqd5)","S (Sqd6)","[Armored Glove] (Sqd4)","[Armored Glove] (Sqd5)","[Armored Glove] (Sqd6)","[Industrial Drill] (Sqd4)","[Industrial Drill] (Sqd5)","[Industrial Drill] (Sqd6)","\"Falcata\" (Sqd4)","\"Falcata\" (Sqd5)","\"Falcata\" (Sqd6)","PEX-2B (Sqd4)","PEX-2B (Sqd5)","PEX-2B (Sqd6)","(Sqd1)","CEX-205  [Armored Glove] (Sqd5)","CEX-205  [Armored Glove] (Sqd6)","CEX-205 [Armored Glove] (Sqd4)","CEX-205 [Basic Manipulator] (Sqd4)","CEX-205 [Basic Manipulator] (Sqd5)","CEX-205 [Basic Manipulator] (Sqd6)","CEX-205 [Cargo Lifter] (Sqd4)","CEX-205 [Cargo Lifter] (Sqd5)","CEX-205 [Cargo Lifter] (Sqd6)","CEX-205 [Industrial Drill] (Sqd4)","CEX-205 [Industrial Drill] (Sqd5)","CEX-205 [Industrial Drill] (Sqd6)","CEX-205 [Mine Clearance] (Sqd4)","CEX-205 [Mine Clearance] (Sqd5)","CEX-205 [Mine Clearance] (Sqd6)","CEX-205 [Salvage Arm] (Sqd4)","CEX-205 [Salvage Arm] (Sqd5)","CEX-205 [Salvage Arm] (Sqd6)","AIX-210 (Sqd4)","AIX-210 (Sqd5)","AIX-210 (Sqd6)","Mk. XXI (Sqd4)","Mk. XXI (Sqd5)","Mk. XXI (Sqd6)","Mk. XXII (Sqd4)","Mk. XXII (Sqd5)","Mk. XXII (Sqd6)","Mk. XXX (Bounty Hunter) (Sqd4)","Mk. XXX (Bounty Hunter) (Sqd5)","Mk. XXX (Bounty Hunter) (Sqd6)","Mk. XXX (Sqd4)","Mk. XXX (Sqd5)","Mk. XXX (Sqd6)","P-5000 (Sqd4)","P-5000 (Sqd5)","P-5000 (Sqd6)","(Interdictor) (Sqd4)","(Interdictor) (Sqd5)","(Interdictor) (Sqd6)","(Scout) (Sqd4)","(Scout) (Sqd5)","(Scout) (Sqd6)","(Spotter) (Sqd4)","(Spotter) (Sqd5)","(Spotter) (Sqd6)","(Support) (Sqd4)","(Support) (Sqd5)","(Support) (Sqd6)"," PEX-2F [Salvage Arm] (Sqd4)"," PEX-2F [Salvage Arm] (Sqd5)"," PEX-2F [Salvage Arm] (Sqd6)","PEX-2F [Mine Clearance] (Sqd4)","PEX-2F [Mine Clearance] (Sqd5)","PEX-2F [Mine Clearance] (Sqd6)","II (Sqd4)","II (Sqd5)","II (Sqd6)","III (Sqd4)","III (Sqd5)","III (Sqd6)","PAB-28 (Sqd4)","PAB-28 (Sqd5)","PAB-28 (Sqd6)","[David Light Gauss] (Sqd4)","[David Light Gauss] (Sqd5)","[David Light Gauss] (Sqd6)","[Flamer] (Sqd4)","[Flamer] (Sqd5)","[Flamer] (Sqd6)","[Grenade Launcher] (Sqd4)","[Grenade Launcher] (Sqd5)","[Grenade Launcher] (Sqd6)","[Machine Gun] (Sqd4)","[Machine Gun] (Sqd5)","[Machine Gun] (Sqd6)","[Small Laser] (Sqd4)","[Small Laser] (Sqd5)","[Small Laser] (Sqd6)","P12 \"Hurricane\" (Sqd4)","P12 \"Hurricane\" (Sqd5)","P12 \"Hurricane\" (Sqd6)","P17 \"Hurricane\" (Sqd4)","P17 \"Hurricane\" (Sqd5)","P17 \"Hurricane\" (Sqd6)","[Armored Glove/GL] (Sqd4)","[Armored Glove/GL] (Sqd5)","[Armored Glove/GL] (Sqd6)","[Armored Glove/LMG] (Sqd4)","[Armored Glove/LMG] (Sqd5)","[Armored Glove/LMG] (Sqd6)","[Battle Claw/GL] (Sqd4)","[Battle Claw/GL] (Sqd5)","[Battle Claw/GL] (Sqd6)","[Battle Claw/LMG] (Sqd4)","[Battle Claw/LMG] (Sqd5)","[Battle Claw/LMG] (Sqd6)","[David] (Sqd4)","[David] (Sqd5)","[David] (Sqd6)","[Laser] (Sqd4)","[Laser] (Sqd5)","[Laser] (Sqd6)","[MG] (Sqd4)","[MG] (Sqd5)","[MG] (Sqd6)","[TAG] (Sqd4)","[TAG] (Sqd5)","[TAG] (Sqd6)","[ECM] (Sqd4)","[ECM] (Sqd5)","[ECM] (Sqd6)","[LMG] (Sqd4)","[LMG] (Sqd5)","[LMG] (Sqd6)","[Sensor] (Sqd4)","[Sensor] (Sqd5)","[Sensor] (Sqd6)","[SRM] (Sqd4)","[SRM] (Sqd5)","[SRM] (Sqd6)","\u201cTerrorizer\u201d [Flamer] (Sqd4)","\u201cTerrorizer\u201d [Flamer] (Sqd5)","\u201cTerrorizer\u201d [Flamer] (Sqd6)","\u201cTerrorizer\u201d [Laser] (Sqd4)","\u201cTerrorizer\u201d [Laser] (Sqd5)","\u201cTerrorizer\u201d [Laser] (Sqd6)","\u201cTerrorizer\u201d [MG]  (Sqd4)","\u201cTerrorizer\u201d [MG]  (Sqd5)","\u201cTerrorizer\u201d [MG]  (Sqd6)","(Stealth) (Sqd4)","(Stealth) (Sqd5)","(Stealth) (Sqd6)","\"The Willow Wisps\" (Sqd4)","\"The Willow Wisps\" (Sqd5)","\"The Willow Wisps\" (Sqd6)","(Reaper) (Sqd4)","(Reaper) (Sqd5)","(Reaper) (Sqd6)","\"Waddle\" (Sqd4)","\"Waddle\" (Sqd5)","\"Waddle\" (Sqd6)","(Special Ops) (Sqd4)","(Special Ops) (Sqd5)","(Special Ops) (Sqd6)","[MicroGL/Flamer] (Sqd4)","[MicroGL/Flamer] (Sqd5)","[MicroGL/Flamer] (Sqd6)","[MicroGL/SPL] (Sqd4)","[MicroGL/SPL] (Sqd5)","[MicroGL/SPL] (Sqd6)","[MicroGL/TAG] (Sqd4)","[MicroGL/TAG] (Sqd5)","[MicroGL/TAG] (Sqd6)","[SL/Flamer] (Sqd4)","[SL/Flamer] (Sqd5)","[SL/Flamer] (Sqd6)","[SL/TAG] (Sqd4)","[SL/TAG] (Sqd5)","[SL/TAG] (Sqd6)","(Upgrade) (Sqd4)","(Upgrade) (Sqd5)","(Upgrade) (Sqd6)","XR (Sqd4)","XR (Sqd5)","XR (Sqd6)","\"Tinkerbelle\" (Sqd4)","(Enhanced) (Sqd4)","(Enhanced) (Sqd5)","(Enhanced) (Sqd6)","(Hell's Horses) (Sqd4)","(Hell's Horses) (Sqd5)","(Hell's Horses) (Sqd6)","(Jade Falcon) (Sqd4)","(Jade Falcon) (Sqd5)","(Jade Falcon) (Sqd6)","[MRR] (Sqd4)","[MRR] (Sqd5)","[MRR] (Sqd6)","[PPC] (Sqd4)","[PPC] (Sqd5)","[PPC] (Sqd6)","(Recon) (Sqd4)","(Recon) (Sqd5)","(Recon) (Sqd6)","(Anti-Infantry) (Sqd4)","(Anti-Infantry) (Sqd5)","(Anti-Infantry) (Sqd6)","(SRM) (Sqd4)","(SRM) (Sqd5)","(SRM) (Sqd6)","(Hunter-Killer) (Sqd4)","(Hunter-Killer) (Sqd5)","(Hunter-Killer) (Sqd6)","A [Bearhunter] (Sqd4)","A [Bearhunter] (Sqd5)","A [Bearhunter] (Sqd6)","A [ER Laser] (Sqd4)","A [ER Laser] (Sqd5)","A [ER Laser] (Sqd6)","A [HMG] (Sqd4)","A [HMG] (Sqd5)","A [HMG] (Sqd6)","B [MRR] (Sqd4)","B [MRR] (Sqd5)","B [MRR] (Sqd6)","B [SRM] (Sqd4)","B [SRM] (Sqd5)","B [SRM] (Sqd6)","\"Rabid\" (Sqd4)","\"Rabid\" (Sqd5)","\"Rabid\" (Sqd6)","\"Rache\" (Sqd4)","\"Rache\" (Sqd5)","\"Rache\" (Sqd6)","\"Volk\" (Sqd4)","\"Volk\" (Sqd5)","\"Volk\" (Sqd6)","\"B\u00e4r\" (Sqd4)","\"B\u00e4r\" (Sqd5)","\"B\u00e4r\" (Sqd6)","(Advanced) (Sqd4)","(Advanced) (Sqd5)","(Advanced) (Sqd6)","[AP Gauss] (Sqd4)","[AP Gauss] (Sqd5)","[AP Gauss] (Sqd6)","[MicroPL] (Sqd4)","[MicroPL] (Sqd5)","[MicroPL] (Sqd6)","(Sqd3)","[AP Gauss] (Sqd3)","[ERMicroL] (Sqd3)","[ERMicroL] (Sqd4)","[ERMicroL] (Sqd5)","[ERMicroL] (Sqd6)","[Flamer] (Sqd3)","[HMG] (Sqd3)","[HMG] (Sqd4)","[HMG] (Sqd5)","[HMG] (Sqd6)","[Laser] (Sqd3)","[MG] (Sqd3)","[MicroPL] (Sqd3)","[King David] (Sqd4)","[King David] (Sqd5)","[King David] (Sqd6)","[Plasma] (Sqd4)","[Plasma] (Sqd5)","[Plasma] (Sqd6)","[LRR] (Sqd4)","[LRR] (Sqd5)","[LRR] (Sqd6)","[Firedrake] (Sqd4)","[Firedrake] (Sqd5)","[Firedrake] (Sqd6)","[Mines] (Sqd4)","[Mines] (Sqd5)","[Mines] (Sqd6)","[Remote Sensors] (Sqd4)","[Remote Sensors] (Sqd5)","[Remote Sensors] (Sqd6)","[Sensors] (Sqd4)","[Sensors] (Sqd5)","[Sensors] (Sqd6)","(Harjel) (Sqd4)","(HarJel) (Sqd5)","(HarJel) (Sqd6)","(Prototype) (Sqd4)","(Prototype) (Sqd5)","(Prototype) (Sqd6)","\"Puma\" (Sqd4)","\"Puma\" (Sqd5)","\"Puma\" (Sqd6)","(Magnetic) (Sqd4)","(Magnetic) (Sqd5)","(Magnetic) (Sqd6)","(Marine) (Sqd4)","(Marine) (Sqd5)","(Marine) (Sqd6)","(Sensor) (Sqd4)","(Sensor) (Sqd5)","(Sensor) (Sqd6)","Coral Intent (Sqd4)","Coral Intent (Sqd5)","Coral Intent (Sqd6)","[SL] (Sqd4)","[SL] (Sqd5)","[SL] (Sqd6)","[Bearhunter] (Sqd4)","[Bearhunter] (Sqd5)","[Bearhunter] (Sqd6)","[Narc] (Sqd4)","[Narc] (Sqd5)","[Narc] (Sqd6)","[ERSL] (Sqd4)","[ERSL] (Sqd5)","[ERSL] (Sqd6)","[SPL] (Sqd4)","[SPL] (Sqd5)","[SPL] (Sqd6)","[GL] (Sqd4)","[GL] (Sqd5)","[GL] (Sqd6)","[MRM] (Sqd4)","[MRM] (Sqd5)","[MRM] (Sqd6)","[Tsunami] (Sqd4)","[Tsunami] (Sqd5)","[Tsunami] (Sqd6)","(Close Combat) (Sqd4)","(Close Combat) (Sqd5)","(Close Combat) (Sqd6)","(Firedrake) (Sqd4)","(Firedrake) (Sqd5)","(Firedrake) (Sqd6)","(Laser) (Sqd4)","(Laser) (Sqd5)","(Laser) (Sqd6)","(Capture Team) (Sqd4)","(Capture Team) (Sqd5)","(Capture Team) (Sqd6)","(Original) (Sqd4)","(Original) (Sqd5)","(Original) (Sqd6)","\"Killshot\" (Sqd4)","\"Killshot\" (Sqd5)","\"Killshot\" (Sqd6)","(DCA) (Sqd4)","(DCA) (Sqd5)","(DCA) (Sqd6)","(Minelayer) (Sqd4)","(Minelayer) (Sqd5)","(Minelayer) (Sqd6)","(Nova Cat) (Sqd4)","(Nova Cat) (Sqd5)","(Nova Cat) (Sqd6)","Caltrop (Sqd4)","Caltrop (Sqd5)","Caltrop (Sqd6)","[ERSPL] (Sqd4)","[ERSPL] (Sqd5)","[ERSPL] (Sqd6)","[Heavy Flamer] (Sqd4)","[Heavy Flamer] (Sqd5)","[Heavy Flamer] (Sqd6)","[Heavy Mortar] (Sqd4)","[Heavy Mortar] (Sqd5)","[Heavy Mortar] (Sqd6)","[LB-X] (Sqd4)","[LB-X] (Sqd5)","[LB-X] (Sqd6)","X (Sqd4)","X (Sqd5)","X (Sqd6)","\"Dwarf\" (Sqd4)","(LRM) (Sqd4)","(LRM) (Sqd5)","(LRM) (Sqd6)","(Upgrade) [Bearhunter] (Sqd4)","(Upgrade) [Bearhunter] (Sqd5)","(Upgrade) [Bearhunter] (Sqd6)","(Upgrade) [MRR] (Sqd4)","(Upgrade) [MRR] (Sqd5)","(Upgrade) [MRR] (Sqd6)","(Upgrade) [Pulse Laser] (Sqd4)","(Upgrade) [Pulse Laser] (Sqd5)","(Upgrade) [Pulse Laser] (Sqd6)","A (Sqd4)","A (Sqd5)","A (Sqd6)","B (Sqd4)","B (Sqd5)","B (Sqd6)","C (Sqd4)","C (Sqd5)","C (Sqd6)","D (Sqd4)","D (Sqd5)","D (Sqd6)","(Hybrid) (Sqd4)","(Hybrid) (Sqd5)","(Hybrid) (Sqd6)","HR (Sqd4)","HR (Sqd5)","HR (Sqd6)","[Interdictor] (Sqd4)","[Interdictor] (Sqd5)","[Interdictor] (Sqd6)","[Pop-Up Mine] (Sqd4)","[Pop-Up Mine] (Sqd5)","[Pop-Up Mine] (Sqd6)","\"Huntsman\" (Sqd4)","\"Huntsman\" (Sqd5)","\"Huntsman\" (Sqd6)","(Support) [LRR] (Sqd4)","(Support) [LRR] (Sqd5)","(Support) [LRR] (Sqd6)","(SVSP) (Sqd4)","(SVSP) (Sqd5)","(SVSP) (Sqd6)","[C3i] (Sqd4)","[C3i] (Sqd5)","[C3i] (Sqd6)","[ML] (Sqd4)","[ML] (Sqd5)","[ML] (Sqd6)","[RL] (Sqd4)","[RL] (Sqd5)","[RL] (Sqd6)","[ER Laser] (Sqd4)","[ER Laser] (Sqd5)","[ER Laser] (Sqd6)","[Pulse Laser] (Sqd4)","[Pulse Laser] (Sqd5)","[Pulse Laser] (Sqd6)","\"Sebastian\" (Sqd4)","(C3) (Sqd4)","(C3) (Sqd5)","(C3) (Sqd6)","[ERML] (Sqd4)","[ERML] (Sqd5)","[ERML] (Sqd6)","[Mortar] (Sqd4)","[Mortar] (Sqd5)","[Mortar] (Sqd6)","[MPL] (Sqd4)","[MPL] (Sqd5)","[MPL] (Sqd6)","[VSP] (Sqd4)","[VSP] (Sqd5)","[VSP] (Sqd6)","[AI] (Sqd4)","[AI] (Sqd5)","[AI] (Sqd6)","[LRM] (Sqd4)","[LRM] (Sqd5)","[LRM] (Sqd6)","(Fast Assault) (Sqd4)","(Fast Assault) (Sqd5)","(Fast Assault) (Sqd6)","(Rock Golem) (Sqd4)","(Rock Golem) (Sqd5)","(Rock Golem) (Sqd6)","[C3/HRR] (Sqd4)","[C3/HRR] (Sqd5)","[C3/HRR] (Sqd6)","[SRM/MagShot] (Sqd4)","[SRM/MagShot] (Sqd5)","[SRM/MagShot] (Sqd6)","[SRM/Narc] (Sqd4)","[SRM/Narc] (Sqd5)","[SRM/Narc] (Sqd6)","[SVSP/Magshot] (Sqd4)","[SVSP/Magshot] (Sqd5)","[SVSP/Magshot] (Sqd6)","[Heavy Flamer/Heavy Flamer] (Sqd4)","[Heavy Flamer/Heavy Flamer] (Sqd5)","[Heavy Flamer/Heavy Flamer] (Sqd6)","[SRM/Flamer] (Sqd4)","[SRM/Flamer] (Sqd5)","[SRM/Flamer] (Sqd6)","[SRM/LRR] (Sqd4)","[SRM/LRR] (Sqd5)","[SRM/LRR] (Sqd6)","[SRM/SL] (Sqd4)","[SRM/SL] (Sqd5)","[SRM/SL] (Sqd6)","[SRM/TAG] (Sqd4)","[SRM/TAG] (Sqd5)","[SRM/TAG] (Sqd6)","(Anti-Tank) (Sqd4)","(Anti-Tank) (Sqd5)","(Anti-Tank) (Sqd6)","(Fire) (Sqd4)","(Fire) (Sqd5)","(Fire) (Sqd6)","[Battle Claw] (Sqd4)","[Battle Claw] (Sqd5)","[Battle Claw] (Sqd6)","[Salvage Arm] (Sqd4)","[Salvage Arm] (Sqd5)","[Salvage Arm] (Sqd6)","\"The Dark Alley\" (Sqd4)","\"The Dark Alley\" (Sqd5)","\"The Dark Alley\" (Sqd6)","(AI Mk II) (Sqd4)","(AI Mk II) (Sqd5)","(AI Mk II) (Sqd6)","(AI Mk IIr) (Sqd4)","(AI Mk IIr) (Sqd5)","(AI Mk IIr) (Sqd6)","(Mortar) (Sqd4)","(Mortar) (Sqd5)","(Mortar) (Sqd6)","(PPC) (Sqd4)","(PPC) (Sqd5)","(PPC) (Sqd6)","[aSRM] (Sqd4)","[aSRM] (Sqd5)","[aSRM] (Sqd6)","[C3] (Sqd4)","[C3] (Sqd5)","[C3] (Sqd6)","(Reactive) (Sqd4)","(Reactive) (Sqd5)","(Reactive) (Sqd6)"],"values":[0,1,2,3,4,5,0,1,2,6,7,8,0,1,2,9,10,11,0,1,2,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,0,1,2,0,1,2,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,0,1,2,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,79,80,81,85,86,87,0,1,2,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,0,1,2,0,1,2,103,104,105,106,107,108,12,13,14,15,16,17,12,13,14,15,16,17,12,13,14,15,16,17,109,110,111,112,113,114,115,116,117,118,119,120,0,1,2,121,122,123,91,92,93,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,130,131,132,145,146,147,148,149,150,151,152,153,0,1,2,154,155,156,157,158,159,160,161,162,0,1,2,163,164,165,166,167,168,0,1,2,0,1,2,0,1,2,133,134,135,91,92,93,124,125,126,127,128,129,130,131,132,0,1,2,0,1,2,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,0,1,2,0,1,2,0,1,2,0,1,2,0,1,2,184,185,186,187,188,189,190,191,192,193,0,1,2,194,195,196,61,62,63,197,198,199,0,1,2,200,201,202,203,204,205,206,207,208,0,1,2,209,210,211,0,1,2,212,213,214,215,216,217,0,1,2,70,71,72,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,91,92,93,124,125,126,127,128,129,142,143,144,91,92,93,200,201,202,203,204,205,142,143,144,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,0,1,2,248,249,250,91,92,93,251,252,253,254,0,1,2,91,92,93,127,128,129,251,252,253,255,248,249,250,256,257,258,259,260,91,92,93,261,262,263,264,265,124,125,126,266,127,128,129,267,251,252,253,0,1,2,248,249,250,91,92,93,251,252,253,268,269,270,271,272,273,91,92,93,124,125,126,274,275,276,127,128,129,130,131,132,127,128,129,277,278,279,280,281,282,283,284,285,286,287,288,130,131,132,91,92,93,124,125,126,274,275,276,127,128,129,142,143,144,289,290,291,292,293,294,0,1,2,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,274,275,276,310,311,312,121,122,123,127,128,129,0,1,2,0,1,2,91,92,93,124,125,126,274,275,276,127,128,129,142,143,144,121,122,123,277,278,279,127,128,129,139,140,141,130,131,132,121,122,123,127,128,129,0,1,2,121,122,123,91,92,93,124,125,126,127,128,129,200,201,202,203,204,205,313,314,315,200,201,202,316,317,318,203,204,205,124,125,126,316,317,318,203,204,205,130,131,132,248,249,250,319,320,321,200,201,202,322,323,324,121,122,123,325,326,327,127,128,129,0,1,2,0,1,2,91,92,93,124,125,126,127,128,129,328,329,330,331,332,333,91,92,93,262,263,264,334,335,336,337,338,339,0,1,2,184,185,186,209,210,211,340,341,342,254,0,1,2,209,210,211,343,344,345,0,1,2,91,92,93,262,263,264,274,275,276,310,311,312,0,1,2,346,347,348,0,1,2,200,201,202,203,204,205,200,201,202,203,204,205,274,275,276,349,350,351,200,201,202,121,122,123,271,272,273,0,1,2,184,185,186,352,353,354,355,356,357,358,359,360,0,1,2,361,362,363,1,209,210,211,0,1,2,364,365,366,367,368,369,370,371,372,373,374,375,271,272,273,0,1,2,0,1,2,212,213,214,0,1,2,376,377,378,379,380,381,382,254,0,1,2,383,384,385,386,387,388,389,390,391,0,1,2,392,393,394,395,396,397,398,399,400,401,402,403,0,1,2,61,62,63,0,1,2,392,393,394,395,396,397,398,399,400,401,402,403,0,1,2,404,405,406,0,1,2,184,185,186,407,408,409,121,122,123,410,411,412,127,128,129,328,329,330,413,414,415,142,143,144,416,417,418,61,62,63,0,1,2,197,198,199,0,1,2,0,1,2,419,420,421,422,423,424,425,426,427,428,429,430,271,272,273,431,432,433,434,435,436,373,374,375,437,438,439,248,249,250,434,435,436,437,438,439,0,1,2,440,441,442,443,0,1,2,0,1,2,444,445,446,127,128,129,447,448,449,450,451,452,310,311,312,322,323,324,142,143,144,453,454,455,456,457,458,459,460,461,428,429,430,200,201,202,142,143,144,0,1,2,184,185,186,462,463,464,465,466,467,0,1,2,70,71,72,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,471,472,473,489,490,491,492,493,494,0,1,2,0,1,2,0,1,2,0,1,2,495,496,497,498,499,500,0,1,2,0,1,2,0,1,2,501,502,503,501,502,503,15,16,17,504,505,506,507,508,509,510,511,512,513,514,515,209,210,211,516,517,518,262,263,264,0,1,2,0,1,2,127,128,129,0,1,2,271,272,273,380,381,382,0,1,2,343,344,345,519,520,521,206,207,208,0,1,2,70,71,72,522,523,524,525,526,527,459,460,461,142,143,144,528,529,530,0,1,2,392,393,394,395,396,397,398,399,400]},"Role":{"dict":["Scout","Ambusher","Missile Boat","Juggernaut","Skirmisher"],"values":[0,0,0,1,1,1,1,1,1,1,1,1,null,null,null,0,0,0,1,1,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,1,1,null,null,null,null,null,null,1,1,1,1,1,1,1,1,1,1,1,1,null,null,null,1,1,1,1,1,1,1,1,1,1,1,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,1,1,1,1,1,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,1,1,1,0,0,0,1,1,1,1,1,1,1,1,1,0,0,0,1,1,1,0,0,0,1,1,1,0,0,0,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,0,0,0,1,1,1,0,0,0,0,0,0,1,1,1,null,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,1,1,1,1,1,1,3,3,3,1,1,1,3,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,0,0,0,1,1,1,2,2,2,1,1,1,2,2,2,1,1,1,3,3,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,4,4,4,3,3,3,1,1,1,3,3,3,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,3,3,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,1,1,1,1,1,1,1,1,1,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,2,2,2,3,3,3,3,3,3,3,3,3,0,0,0,3,3,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3]},"PV":{"values":[6,7,7,10,10,10,10,10,10,8,8,8,5,6,6,7,7,7,7,6,6,5,5,5,5,5,5,7,7,7,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,8,8,8,5,5,5,10,10,10,10,10,10,10,10,10,6,8,8,10,10,10,5,5,5,10,10,10,11,11,11,10,10,10,11,11,11,11,11,11,6,6,6,6,6,6,6,7,7,11,11,11,6,6,6,9,9,9,9,9,9,7,7,7,7,7,8,6,6,6,6,6,7,7,7,7,6,6,6,13,13,13,9,9,9,14,14,14,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,5,5,6,7,7,7,8,8,8,7,7,9,8,8,9,16,16,16,15,15,15,15,15,16,15,15,15,14,14,15,14,14,14,13,13,13,15,15,15,15,15,16,16,16,16,13,13,13,14,14,14,14,14,14,13,13,13,13,13,13,13,13,13,16,16,16,18,18,19,16,16,16,8,8,8,10,10,10,15,15,15,14,14,14,14,14,14,15,15,15,14,14,14,14,14,15,14,14,14,14,14,14,15,15,15,10,10,10,14,14,14,14,14,15,15,15,15,15,15,15,16,16,16,18,18,18,16,16,16,13,13,14,13,13,14,16,16,16,15,15,16,16,16,16,16,13,13,14,13,13,13,15,15,15,15,15,15,19,19,19,17,17,18,18,21,21,15,18,18,17,17,17,16,16,17,14,14,14,18,21,21,15,15,15,18,18,20,18,18,18,19,19,19,12,12,12,12,12,14,12,12,13,17,17,17,17,17,17,14,17,17,14,17,17,13,16,16,15,18,18,16,20,21,20,24,24,17,21,22,17,21,21,15,19,20,14,18,19,14,18,19,14,18,18,15,15,15,15,15,16,18,22,22,15,19,19,15,19,19,15,15,18,19,14,17,17,13,16,16,14,17,17,18,18,21,24,15,16,19,19,16,17,20,20,16,16,19,20,16,16,19,20,15,16,19,19,16,16,19,20,14,17,17,19,23,23,17,21,21,16,20,20,13,13,13,16,16,16,15,15,16,15,15,15,16,16,17,14,14,15,14,14,14,14,14,14,15,15,15,16,16,17,17,17,17,17,17,17,15,15,15,12,14,15,12,14,14,13,15,16,11,13,14,13,15,15,14,17,17,14,17,17,14,17,17,17,17,18,17,17,17,15,15,15,18,18,18,17,17,17,10,12,15,10,12,12,15,19,20,15,18,18,15,15,15,13,17,17,14,17,17,14,17,17,15,18,18,13,16,16,13,17,17,16,16,16,15,15,15,15,15,15,17,17,17,15,15,15,13,13,13,12,12,13,14,17,18,14,17,18,15,18,19,15,18,18,14,17,18,18,21,21,16,19,21,11,13,13,15,17,17,10,12,12,12,14,14,19,19,19,14,14,14,16,16,16,14,14,14,18,21,21,18,21,24,18,21,21,18,21,21,14,14,18,13,13,17,13,13,17,15,18,18,15,15,15,14,17,17,14,17,17,13,16,16,13,17,17,13,17,17,14,17,17,14,17,17,18,18,18,15,19,19,17,17,17,17,17,17,16,16,16,16,16,16,16,17,17,17,15,15,16,15,15,16,15,15,17,14,14,14,14,14,14,15,15,15,14,14,14,10,13,13,14,16,16,14,14,14,14,14,17,12,12,14,14,14,16,11,11,13,11,11,16,17,17,20,14,14,16,16,16,16,17,17,21,11,11,14,18,18,21,16,16,16,18,18,18,17,17,17,17,17,17,18,18,21,7,15,18,19,15,19,19,14,16,19,16,18,18,9,11,12,14,16,16,12,15,15,15,15,15,16,16,22,18,18,24,19,19,22,15,18,19,15,19,19,25,14,20,20,22,16,19,22,18,21,23,16,19,22,15,18,18,17,17,20,17,17,21,18,18,21,17,17,17,16,19,20,20,20,24,13,13,15,15,15,17,14,14,17,12,12,13,16,16,19,16,16,22,15,19,20,18,18,21,15,15,19,14,18,19,19,23,23,18,22,22,16,20,21,16,20,20,16,19,19,19,23,26,15,15,15,17,17,17,12,12,12,20,20,23,21,21,26,22,26,29,15,15,19,18,18,18,14,14,14,17,17,20,15,15,19,13,13,16,18,21,24,18,21,21,18,21,21,18,21,21,18,21,24,18,21,21,18,21,21,11,15,18,18,13,16,19,20,20,24,14,14,17,11,11,11,14,14,15,17,17,17,12,12,13,11,11,11,14,14,17,15,15,16,14,17,18,19,22,22,16,19,22,19,22,22,16,19,22,21,25,25,18,20,20,18,22,25,19,21,23,18,20,25,19,21,24,15,18,18,17,19,20,14,17,20,16,18,20,19,21,24,16,18,21,17,19,20,17,19,20,15,17,20,14,16,19,13,16,19,22,26,29,24,28,31,14,17,18,19,19,21,25,27,30,20,22,22,16,19,22,15,17,20,16,18,20,16,18,20,16,18,20,16,18,20,19,21,24,18,20,21,18,20,21,18,20,21,15,17,18,21,25,25,23,27,30,20,24,24,25,29,30,27,31,31,21,25,28,16,19,22,16,18,20,14,16,16,17,20,21,18,22,23,18,21,22,18,21,21,20,22,25,22,24,28,22,24,28,23,25,31,18,21,21,21,23,26,16,19,19,14,17,17,18,21,21]},"BV":{"values":[37,50,65,27,37,47,27,37,47,28,38,49,20,27,35,47,63,81,44,60,77,34,46,59,34,46,59,60,77,99,20,27,35,4,50,65,37,37,50,65,37,50,65,37,50,65,37,50,65,37,50,65,44,59,72,6,8,10,30,41,53,55,74,95,63,85,109,37,50,65,47,63,81,20,27,35,61,82,105,61,82,105,54,73,94,61,82,105,94,127,203,37,50,65,37,50,65,22,29,38,127,171,219,37,50,65,119,160,206,47,63,81,80,108,138,69,92,119,52,70,90,69,92,119,91,123,158,41,55,70,56,76,97,47,64,82,212,285,367,20,27,35,20,27,35,20,27,35,20,27,35,37,50,65,37,50,65,41,55,71,54,73,94,44,60,77,71,96,123,150,202,259,189,255,327,173,233,300,205,276,355,173,233,300,133,179,230,123,166,213,143,193,248,130,175,318,184,247,318,123,166,213,189,254,327,211,297,382,189,254,327,137,184,237,181,243,313,201,271,348,180,242,311,81,109,140,98,132,170,98,132,170,177,239,307,105,142,182,114,154,198,113,153,196,117,148,189,126,153,194,117,148,189,105,142,182,133,179,230,197,265,341,118,158,202,125,165,210,113,153,196,182,244,313,177,239,307,186,251,323,86,116,149,130,175,226,198,267,343,280,377,485,213,286,368,195,263,338,271,164,221,284,179,242,311,164,221,285,189,255,327,326,439,565,217,292,376,328,441,566,288,388,498,170,229,295,238,320,411,200,270,347,297,400,514,211,298,383,168,226,290,199,268,345,330,444,571,256,315,380,280,347,422,272,337,408,383,510,651,404,533,676,199,268,344,231,311,400,199,268,344,219,295,379,229,308,396,357,481,618,293,395,507,252,339,436,241,325,418,276,372,478,250,337,433,269,362,465,257,346,445,167,225,290,428,576,740,299,403,518,355,479,615,155,223,300,386,216,291,374,216,291,374,272,366,471,297,428,577,742,219,316,426,548,208,300,404,520,213,308,415,534,230,332,447,575,208,300,404,520,247,356,480,617,354,477,613,396,532,684,266,357,459,323,434,558,185,249,320,225,303,390,201,271,348,233,314,404,257,346,445,201,271,348,161,217,279,150,203,260,216,291,374,232,313,402,200,270,347,208,280,360,200,270,347,193,260,334,225,305,389,249,335,431,193,260,334,213,287,369,285,383,493,328,443,569,268,360,463,253,340,437,253,346,444,225,303,389,180,243,312,189,255,327,191,257,339,182,245,315,219,295,379,203,273,351,181,244,313,209,282,362,199,268,344,231,311,400,255,343,441,199,268,344,175,235,303,187,252,324,147,198,255,171,230,296,138,186,239,131,176,227,147,198,255,134,180,231,247,338,434,231,311,400,215,289,372,247,332,427,215,289,372,376,506,651,203,273,554,267,359,462,387,521,670,299,402,517,347,467,601,269,362,466,197,265,341,245,330,424,133,179,230,344,463,595,424,571,734,328,441,568,368,495,637,256,345,443,216,291,374,240,323,416,243,327,420,209,282,362,199,268,344,231,311,400,199,268,344,195,262,337,207,279,358,260,350,450,268,360,463,204,275,353,225,303,389,209,282,362,181,243,313,293,394,506,292,394,506,191,276,372,479,241,324,416,257,345,444,253,340,437,177,238,307,185,249,320,233,314,404,209,282,362,265,357,459,382,515,662,272,366,471,251,338,435,231,311,400,207,279,358,187,252,324,203,273,352,191,257,331,207,279,358,172,232,298,212,285,367,203,273,352,336,452,581,195,262,337,312,423,544,254,342,440,176,237,305,425,573,735,142,290,391,502,291,392,503,348,468,602,289,389,500,294,396,509,303,407,524,280,377,485,269,362,465,495,667,857,373,502,646,621,836,1075,230,310,399,276,454,611,785,299,431,580,747,354,476,612,391,526,676,408,549,706,256,344,443,377,508,653,370,499,641,382,514,661,309,416,535,250,336,432,341,460,592,280,376,484,292,392,505,319,429,551,243,327,420,324,436,561,473,568,731,270,363,467,346,466,599,396,533,685,250,336,432,350,472,607,276,371,477,314,422,543,352,474,610,241,324,416,404,544,700,169,228,293,227,305,392,180,243,312,436,587,754,470,633,813,419,564,725,270,363,467,268,361,464,193,260,335,349,470,604,250,336,432,260,350,450,367,495,636,323,435,560,339,457,588,260,350,450,300,404,519,272,366,471,345,464,596,229,290,391,502,381,513,660,624,840,1080,368,495,637,153,206,265,185,249,320,304,409,526,208,280,360,194,261,336,266,359,461,189,255,328,344,462,592,464,624,802,456,613,789,424,570,733,467,628,808,348,468,602,382,514,660,367,494,635,545,734,944,650,875,1125,685,922,1185,240,323,415,379,511,656,383,515,662,291,391,503,260,350,450,312,420,541,336,452,581,346,466,599,326,439,564,295,398,511,363,489,629,387,520,669,483,650,835,325,438,563,447,601,773,562,756,973,398,536,689,630,848,1090,365,491,632,350,471,605,372,501,644,372,501,644,372,501,644,407,548,705,289,389,501,330,444,570,298,401,515,301,406,522,383,516,663,424,570,733,410,522,710,425,572,736,363,488,628,336,493,634,404,543,699,351,473,608,420,566,728,360,485,624,331,445,573,376,507,651,364,490,631,742,998,1284,619,833,1071,745,1003,1289,788,1061,1364,563,756,975,486,655,842,397,535,688,357,480,617,357,480,617]},"Type":{"dict":["BA","ba","BM"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"Size":{"values":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]},"Tonnage":{"values":[0.2,0.2,0.2,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.4,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.75,0.8,0.8,0.8,0.8,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0,2.0]},"ASMove":{"dict":["6\"f","6\"j","4\"f","2\"f","8\"f","4\"j","14\"v","2\"j","8\"j","12\"v","6\"f/6\"s","10\"v","10\"f","14\"f","2\"f/6\"s","4\"s","2\""],"values":[0,0,0,1,1,1,1,1,1,2,2,2,3,2,2,4,4,4,5,2,2,3,3,3,3,3,3,3,3,3,3,3,3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,3,3,1,1,1,1,1,1,1,1,1,0,0,0,1,1,1,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,3,3,3,0,0,0,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,6,6,6,3,3,3,0,0,0,3,3,3,3,3,3,3,3,3,3,3,3,7,7,7,3,3,7,5,5,5,5,5,5,5,5,5,5,5,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,8,8,1,1,1,8,8,8,1,1,1,8,8,8,2,2,2,2,2,2,1,1,1,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,1,1,1,4,4,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,9,9,1,1,1,10,10,10,4,4,4,11,11,11,11,11,11,12,12,12,11,12,12,12,0,0,0,8,8,8,8,8,8,8,8,8,8,8,8,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,13,13,13,13,13,13,13,13,13,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,4,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,3,3,3,1,1,1,1,1,1,1,1,1,8,8,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,5,5,5,5,5,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,12,12,12,12,12,12,12,12,12,12,12,12,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,14,14,14,1,1,1,8,8,8,0,0,0,8,8,8,8,8,8,0,0,0,15,1,1,1,1,1,1,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,2,2,2,2,2,2,2,2,2,2,2,2,1,1,1,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,7,7,7,1,1,1,5,5,5,5,5,5,1,1,1,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,0,0,0,0,0,0,5,5,5,2,2,2,2,2,2,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,14,2,2,2,2,2,2,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,5,5,5,7,7,7,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,5,5,5,2,2,2,16,16,16,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,2,2,2,2,2,2,2,2,2]},"Short":{"values":[0,1,1,0,0,1,0,0,1,0,0,0,0,0,0,1,1,1,1,0,0,0,0,0,0,0,0,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,0,1,1,2,2,2,0,0,0,2,2,2,0,0,0,1,1,1,1,1,2,1,1,1,1,1,2,2,2,2,0,0,0,0,0,0,0,0,0,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,1,0,0,0,1,1,1,1,1,2,2,2,2,1,1,2,0,0,0,1,1,1,2,2,2,1,1,2,2,2,2,1,1,1,1,1,1,2,2,2,1,1,1,1,1,1,0,0,0,2,2,2,2,2,3,0,0,0,0,0,0,0,0,0,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,2,2,2,1,1,1,1,1,2,1,1,1,2,2,2,2,2,2,1,1,1,0,0,0,1,1,1,0,0,1,2,2,2,2,2,3,1,1,1,1,1,1,2,0,0,0,2,2,2,2,2,2,2,2,2,1,1,2,2,2,2,1,1,1,1,1,1,1,1,2,2,2,2,2,3,3,2,2,2,1,1,2,2,2,2,1,1,1,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,1,1,1,2,2,2,1,1,1,1,1,1,1,1,2,2,2,2,1,1,2,1,1,1,1,1,2,1,1,2,1,1,2,2,2,2,3,3,3,2,2,3,2,2,2,1,1,1,2,2,2,1,1,1,2,1,1,1,1,1,1,2,2,2,2,2,2,3,1,2,2,2,1,2,2,2,2,2,2,3,2,2,2,3,1,2,2,2,2,2,2,3,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,1,1,1,1,1,2,2,2,2,1,1,2,1,1,2,0,0,0,1,1,1,1,1,1,0,0,1,0,0,0,0,0,0,0,0,0,1,1,2,2,2,2,1,1,2,1,1,2,1,1,1,2,2,2,2,2,2,2,2,2,1,1,2,1,1,1,2,2,2,2,2,2,1,1,1,1,1,2,2,2,2,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,1,1,1,1,1,1,0,0,0,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,2,2,2,3,1,1,1,1,1,2,2,2,2,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,1,1,1,2,2,2,0,0,0,1,1,1,0,0,0,2,2,2,2,2,3,2,2,2,2,2,2,0,0,1,0,0,1,1,1,1,2,2,2,2,2,2,1,1,1,2,2,2,1,1,1,0,0,0,0,0,0,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,3,3,3,2,2,2,2,2,2,2,3,3,4,1,1,2,2,2,2,1,1,1,2,2,2,1,1,1,2,2,2,2,3,3,2,2,2,2,2,2,2,2,3,2,2,2,2,2,2,1,1,1,1,1,2,3,3,4,2,2,2,0,0,0,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,1,1,1,1,1,1,2,2,3,0,1,1,2,2,2,2,2,2,3,2,2,2,1,1,2,2,2,2,1,1,1,2,2,2,3,3,4,4,4,5,3,3,4,2,2,3,3,2,2,3,2,3,3,3,3,4,5,2,3,3,3,4,5,2,2,2,3,3,4,1,1,2,3,3,4,0,0,1,3,3,4,1,1,1,1,1,1,3,3,3,2,2,3,2,2,3,4,4,5,2,2,3,2,2,3,3,3,4,2,2,3,1,1,2,2,2,2,2,2,2,3,3,4,1,1,1,1,1,1,2,2,3,1,1,1,3,3,3,3,3,3,3,3,3,3,3,4,3,3,4,2,2,2,3,3,3,0,0,0,2,2,3,1,1,2,1,1,2,2,2,3,2,2,2,2,2,2,2,2,2,2,2,3,2,2,2,3,3,3,2,2,2,2,2,2,3,2,2,3,2,2,3,3,3,3,2,2,3,3,3,3,4,4,5,3,3,3,2,2,3,3,3,4,4,4,5,2,2,2,2,2,3,3,3,3,2,2,3,2,2,2,2,2,2,2,2,2,3,3,3,4,4,5,3,3,4,2,2,2,3,3,4,2,2,3,4,4,4,3,3,4,3,3,4,3,3,4,3,3,4,3,3,4,2,2,3,2,2,2,3,3,4,5,5,6,3,3,4,3,3,3,5,5,6,3,3,3,3,3,4,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,5,3,3,4,3,3,4,4,4,5,2,2,3,2,2,2,2,2,3,1,1,1,2,2,3,4,4,4,1,1,2,1,1,2,2,2,2,1,1,1,3,3,4,1,1,2,4,4,5,2,2,2,4,4,5,4,4,5,4,4,5,5,5,7,3,3,3,4,4,5,2,2,2,1,1,1,2,2,2]},"Medium":{"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,0,0,0,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,1,1,1,2,2,2,1,1,1,0,0,0,1,1,1,0,0,0,2,3,3,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,3,3,3,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,2,2,2,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,1,1,1,2,2,2,2,2,2,2,2,2,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,1,1,2,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,2,2,2,1,1,2,0,0,0,2,2,2,0,0,0,1,1,1,2,2,2,0,0,0,1,1,1,0,0,0,2,2,2,2,2,3,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,2,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,1,1,1,2,2,2,1,1,1,1,1,2,3,3,3,2,2,2,0,0,0,1,1,1,0,0,0,1,1,1,0,0,0,2,2,2,1,1,1,1,1,1,2,2,3,0,0,0,0,0,0,0,2,2,3,2,2,2,0,0,0,2,2,2,1,1,1,0,0,0,3,3,4,3,3,4,3,3,4,0,0,0,2,2,2,3,2,3,3,3,1,2,2,2,3,3,1,2,2,2,2,2,2,2,3,1,1,2,2,2,3,0,0,0,3,3,3,1,1,1,1,1,1,2,2,3,2,2,3,1,1,1,2,2,3,2,2,3,0,0,0,2,2,2,1,1,1,0,0,0,2,2,2,0,0,0,0,0,0,1,1,1,0,0,0,2,2,3,1,1,1,3,3,3,0,0,0,3,3,3,3,3,4,3,3,4,1,1,2,2,2,2,0,0,0,2,2,3,1,1,1,0,0,0,2,2,3,2,2,2,2,2,2,2,2,2,2,2,3,2,2,2,3,3,3,0,2,2,2,2,2,3,2,2,3,2,2,3,0,0,0,2,2,2,3,3,3,0,0,0,0,0,0,2,2,3,2,2,2,0,0,0,2,2,2,2,2,3,3,3,3,2,2,3,2,2,2,2,2,2,0,0,0,3,3,3,2,2,3,3,3,3,2,2,2,3,3,3,2,2,3,2,2,3,3,3,4,2,2,3,3,3,3,3,3,3,2,2,3,2,2,3,1,1,2,3,3,4,3,3,4,2,2,2,3,3,3,5,5,6,3,3,3,3,3,4,2,2,3,2,2,3,2,2,3,2,2,3,2,2,3,4,4,5,3,3,3,3,3,3,3,3,3,3,3,3,0,0,0,2,2,3,1,1,1,2,2,2,3,3,3,1,1,2,2,2,2,2,2,2,1,1,1,2,2,2,0,0,0,2,2,2,0,0,0,4,4,5,4,4,5,4,4,5,5,5,7,3,3,3,4,4,5,2,2,2,1,1,1,2,2,2]},"Long":{"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"Overheat":{"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"CBTMove":{"rows":[4,7,9,12,15,18,27,30,36,37,40,43,46,49,52,55,58,61,64,70,73,77,80,83,86,89,97,100,103,109,112,115,118,121,124,127,130,133,136,139,142,145,148,151,154,157,160,163,166,171,172,175,178,181,184,188,191,194,197,200,202,205,208,211,214,217,220,223,226,229,232,235,238,241,244,247,250,253,256,262,265,268,271,274,278,280,283,286,290,293,296,300,302,306,309,312,315,317,323,326,329,332,335,339,342,345,348,351,354,357,360,362,365,368,371,374,377,380,383,387,390,393,396,398,401,405,408,411,415,418,421,424,428,436,440,444,448,452,455,458,461,464,466,469,472,475,478,481,484,487,490,493,496,499,502,505,508,511,514,517,521,523,526,529,532,535,538,541,544,547,550,553,556,559,562,565,568,571,574,577,580,583,586,589,592,595,598,601,604,607,610,616,619,622,625,628,631,634,637,640,655,658,661,664,667,670,673,676,679,682,685,688,691,694,697,700,704,707,711,713,716,719,722,728,731,734,737,740,743,746,749,752,755,758,761,764,767,771,774,776,779,782,785,788,793,796,799,802,805,808,811,813,817,820,823,826,830,834,837,840,843,845,848,851,854,857,860,863,866,869,872,875,878,882,885,888,891,894,899,902,905,908,911,914,917,920,924,927,929,932,935,938,941,944,947,951,954,957,960,963,966,969,972,975,978,981,984,987,990,993,996,999,1002,1005,1008,1014,1017,1020,1023,1027,1030,1033,1036,1038,1047,1062,1068,1071,1074,1077,1081,1084,1087,1089,1092,1095,1098,1101,1104,1107,1110,1113,1116,1119,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1152,1155,1158,1174,1177,1179,1182,1185],"dict":["2J","1J","1L","3J","3L","2L","1V","2U","5L","1u","4L","2l"],"values":[0,0,1,2,3,1,2,2,4,4,4,4,4,4,4,2,3,1,1,3,5,3,3,3,3,3,4,2,4,2,2,2,2,2,2,2,6,2,4,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,3,3,1,1,1,1,1,1,1,1,5,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,7,4,6,6,4,4,4,1,1,1,1,1,4,4,1,1,1,8,8,8,4,4,4,4,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,1,1,1,1,1,1,3,3,3,3,3,4,4,4,4,4,4,4,4,1,1,1,1,1,2,2,1,1,1,0,1,1,1,1,1,3,3,3,3,3,1,1,1,1,1,1,1,1,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,8,8,8,1,1,1,3,3,3,0,0,0,4,4,4,4,4,4,4,4,4,4,4,4,9,1,1,3,1,1,0,1,1,1,1,1,1,1,5,5,5,0,0,1,1,1,1,1,5,5,5,5,5,2,0,0,5,5,5,5,1,1,1,1,1,10,10,10,10,10,4,4,4,1,5,5,5,5,5,5,5,5,1,1,1,1,1,1,5,0,0,10,10,10,10,10,10,10,10,10,4,4,4,4,1,1,1,5,5,5,5,5,5,2,5,5,2,1,2,1,5,2,2,2,2,2,2,2,2,2,2,5,5,5,11,5,5,5,5,4,4,4,4,4,2,2,0,0,0]},"Armor":{"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,1,1,1,1,1,1,2,2,1,2,2,1,2,2,1,1,2,2,1,2,2,1,2,2,1,2,2,1,1,2,2,1,1,2,2,1,1,2,2,1,1,2,2,1,1,2,2,1,1,2,2,1,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,2,1,2,2,1,2,2,1,1,1,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,2,1,2,2,1,2,2,1,1,2,1,1,2,1,1,2,1,2,2,1,1,1,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,2,1,1,1,1,1,2,1,1,2,1,1,2,1,1,2,1,1,2,1,1,2,1,1,2,1,1,1,1,1,2,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,1,1,1,1,2,1,1,2,2,2,2,1,2,2,1,2,2,3,1,2,2,3,2,2,3,2,2,3,2,2,3,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,1,2,2,2,2,3,2,2,3,1,1,1,1,1,1,1,1,1,1,1,1,2,2,3,1,2,2,2,2,3,2,2,3,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,1,1,1,1,1,1,1,1,2,2,3,2,2,3,1,2,2,2,2,3,2,2,2,2,2,2,2,2,2,2,2,3,2,2,3,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,1,2,2,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,3,3,2,3,3,2,3,3,2,3,3,2,3,3,2,3,3,2,3,3,2,3,4,2,3,4,2,3,4,2,3,4,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,2,2,3,2,3,3,2,3,3,1,2,2,2,3,3,2,3,3,2,3,3,2,3,3,2,3,3,1,2,2,1,2,2,1,2,2,1,2,2,1,2,2,2,3,3,2,3,3,2,3,3,2,3,3,2,3,3,2,3,3,2,3,4,2,3,4,2,3,3,2,3,3,2,3,3,2,3,3,2,3,3,1,2,2,1,2,2,1,2,2,1,2,2,2,3,3,2,3,3,2,3,3,2,3,3,2,3,3]},"ArmorIcons":{"rows":[1005,1008,1014,1017,1027,1030,1033,1036,1081,1084,1087,1122,1125,1128,1131,1134,1137,1140,1143,1174,1177],"dict":["A"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"Structure":{"values":[2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2]},"StructureIcons":{"rows":[4,7,9,12,15,18,27,30,36,37,40,43,46,49,52,55,58,61,64,70,73,77,80,83,86,89,97,100,103,109,112,115,118,121,124,127,130,133,136,139,142,145,148,151,154,157,160,163,166,171,172,175,178,181,184,188,191,194,197,200,202,205,208,211,214,217,220,223,226,229,232,235,238,241,244,247,250,253,256,262,265,268,271,274,278,280,283,286,290,293,296,300,302,306,309,312,315,317,323,326,329,332,335,339,342,345,348,351,354,357,360,362,365,368,371,374,377,380,383,387,390,393,396,398,401,405,408,411,415,418,421,424,428,436,440,444,448,452,455,458,461,464,466,469,472,475,478,481,484,487,490,493,496,499,502,505,508,511,514,517,521,523,526,529,532,535,538,541,544,547,550,553,556,559,562,565,568,571,574,577,580,583,586,589,592,595,598,601,604,607,610,616,619,622,625,628,631,634,637,640,655,658,661,664,667,670,673,676,679,682,685,688,691,694,697,700,704,707,711,713,716,719,722,728,731,734,737,740,743,746,749,752,755,758,761,764,767,771,774,776,779,782,785,788,793,796,799,802,805,808,811,813,817,820,823,826,830,834,837,840,843,845,848,851,854,857,860,863,866,869,872,875,878,882,885,888,891,894,899,902,905,908,911,914,917,920,924,927,929,932,935,938,941,944,947,951,954,957,960,963,966,969,972,975,978,981,984,987,990,993,996,999,1002,1005,1008,1014,1017,1020,1023,1027,1030,1033,1036,1038,1047,1062,1068,1071,1074,1077,1081,1084,1087,1089,1092,1095,1098,1101,1104,1107,1110,1113,1116,1119,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1152,1155,1158,1174,1177,1179,1182,1185],"dict":["S"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"TMM":{"rows":[4,7,9,12,15,18,27,30,36,37,40,43,46,49,52,55,58,61,64,70,73,77,80,83,86,89,97,100,103,109,112,115,118,121,124,127,130,133,136,139,142,145,148,151,154,157,160,163,166,171,172,175,178,181,184,188,191,194,197,200,202,205,208,211,214,217,220,223,226,229,232,235,238,241,244,247,250,253,256,262,265,268,271,274,278,280,283,286,290,293,296,300,302,306,309,312,315,317,323,326,329,332,335,339,342,345,348,351,354,357,360,362,365,368,371,374,377,380,383,387,390,393,396,398,401,405,408,411,415,418,421,424,428,436,440,444,448,452,455,458,461,464,466,469,472,475,478,481,484,487,490,493,496,499,502,505,508,511,514,517,521,523,526,529,532,535,538,541,544,547,550,553,556,559,562,565,568,571,574,577,580,583,586,589,592,595,598,601,604,607,610,616,619,622,625,628,631,634,637,640,655,658,661,664,667,670,673,676,679,682,685,688,691,694,697,700,704,707,711,713,716,719,722,728,731,734,737,740,743,746,749,752,755,758,761,764,767,771,774,776,779,782,785,788,793,796,799,802,805,808,811,813,817,820,823,826,830,834,837,840,843,845,848,851,854,857,860,863,866,869,872,875,878,882,885,888,891,894,899,902,905,908,911,914,917,920,924,927,929,932,935,938,941,944,947,951,954,957,960,963,966,969,972,975,978,981,984,987,990,993,996,999,1002,1005,1008,1014,1017,1020,1023,1027,1030,1033,1036,1038,1047,1062,1068,1071,1074,1077,1081,1084,1087,1089,1092,1095,1098,1101,1104,1107,1110,1113,1116,1119,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1152,1155,1158,1174,1177,1179,1182,1185],"values":[1,1,1,0,2,1,0,0,1,1,1,1,1,1,1,0,2,1,1,2,0,2,2,2,2,2,1,0,1,0,0,0,0,0,0,0,0,0,1,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,0,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,2,2,2,2,2,1,1,1,1,1,1,1,1,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,1,1,1,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,2,1,1,1,1,1,1,1,1,1,1,0,0,0,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,0,0,1,1,1]},"RegSkill":{"values":[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4]},"VetSkill":{"values":[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3]},"RegPV":{"values":[6,7,7,10,10,10,10,10,10,8,8,8,5,6,6,7,7,7,7,6,6,5,5,5,5,5,5,7,7,7,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,8,8,8,5,5,5,10,10,10,10,10,10,10,10,10,6,8,8,10,10,10,5,5,5,10,10,10,11,11,11,10,10,10,11,11,11,11,11,11,6,6,6,6,6,6,6,7,7,11,11,11,6,6,6,9,9,9,9,9,9,7,7,7,7,7,8,6,6,6,6,6,7,7,7,7,6,6,6,13,13,13,9,9,9,14,14,14,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,5,5,6,7,7,7,8,8,8,7,7,9,8,8,9,16,16,16,15,15,15,15,15,16,15,15,15,14,14,15,14,14,14,13,13,13,15,15,15,15,15,16,16,16,16,13,13,13,14,14,14,14,14,14,13,13,13,13,13,13,13,13,13,16,16,16,18,18,19,16,16,16,8,8,8,10,10,10,15,15,15,14,14,14,14,14,14,15,15,15,14,14,14,14,14,15,14,14,14,14,14,14,15,15,15,10,10,10,14,14,14,14,14,15,15,15,15,15,15,15,16,16,16,18,18,18,16,16,16,13,13,14,13,13,14,16,16,16,15,15,16,16,16,16,16,13,13,14,13,13,13,15,15,15,15,15,15,19,19,19,17,17,18,18,21,21,15,18,18,17,17,17,16,16,17,14,14,14,18,21,21,15,15,15,18,18,20,18,18,18,19,19,19,12,12,12,12,12,14,12,12,13,17,17,17,17,17,17,14,17,17,14,17,17,13,16,16,15,18,18,16,20,21,20,24,24,17,21,22,17,21,21,15,19,20,14,18,19,14,18,19,14,18,18,15,15,15,15,15,16,18,22,22,15,19,19,15,19,19,15,15,18,19,14,17,17,13,16,16,14,17,17,18,18,21,24,15,16,19,19,16,17,20,20,16,16,19,20,16,16,19,20,15,16,19,19,16,16,19,20,14,17,17,19,23,23,17,21,21,16,20,20,13,13,13,16,16,16,15,15,16,15,15,15,16,16,17,14,14,15,14,14,14,14,14,14,15,15,15,16,16,17,17,17,17,17,17,17,15,15,15,12,14,15,12,14,14,13,15,16,11,13,14,13,15,15,14,17,17,14,17,17,14,17,17,17,17,18,17,17,17,15,15,15,18,18,18,17,17,17,10,12,15,10,12,12,15,19,20,15,18,18,15,15,15,13,17,17,14,17,17,14,17,17,15,18,18,13,16,16,13,17,17,16,16,16,15,15,15,15,15,15,17,17,17,15,15,15,13,13,13,12,12,13,14,17,18,14,17,18,15,18,19,15,18,18,14,17,18,18,21,21,16,19,21,11,13,13,15,17,17,10,12,12,12,14,14,19,19,19,14,14,14,16,16,16,14,14,14,18,21,21,18,21,24,18,21,21,18,21,21,14,14,18,13,13,17,13,13,17,15,18,18,15,15,15,14,17,17,14,17,17,13,16,16,13,17,17,13,17,17,14,17,17,14,17,17,18,18,18,15,19,19,17,17,17,17,17,17,16,16,16,16,16,16,16,17,17,17,15,15,16,15,15,16,15,15,17,14,14,14,14,14,14,15,15,15,14,14,14,10,13,13,14,16,16,14,14,14,14,14,17,12,12,14,14,14,16,11,11,13,11,11,16,17,17,20,14,14,16,16,16,16,17,17,21,11,11,14,18,18,21,16,16,16,18,18,18,17,17,17,17,17,17,18,18,21,7,15,18,19,15,19,19,14,16,19,16,18,18,9,11,12,14,16,16,12,15,15,15,15,15,16,16,22,18,18,24,19,19,22,15,18,19,15,19,19,25,14,20,20,22,16,19,22,18,21,23,16,19,22,15,18,18,17,17,20,17,17,21,18,18,21,17,17,17,16,19,20,20,20,24,13,13,15,15,15,17,14,14,17,12,12,13,16,16,19,16,16,22,15,19,20,18,18,21,15,15,19,14,18,19,19,23,23,18,22,22,16,20,21,16,20,20,16,19,19,19,23,26,15,15,15,17,17,17,12,12,12,20,20,23,21,21,26,22,26,29,15,15,19,18,18,18,14,14,14,17,17,20,15,15,19,13,13,16,18,21,24,18,21,21,18,21,21,18,21,21,18,21,24,18,21,21,18,21,21,11,15,18,18,13,16,19,20,20,24,14,14,17,11,11,11,14,14,15,17,17,17,12,12,13,11,11,11,14,14,17,15,15,16,14,17,18,19,22,22,16,19,22,19,22,22,16,19,22,21,25,25,18,20,20,18,22,25,19,21,23,18,20,25,19,21,24,15,18,18,17,19,20,14,17,20,16,18,20,19,21,24,16,18,21,17,19,20,17,19,20,15,17,20,14,16,19,13,16,19,22,26,29,24,28,31,14,17,18,19,19,21,25,27,30,20,22,22,16,19,22,15,17,20,16,18,20,16,18,20,16,18,20,16,18,20,19,21,24,18,20,21,18,20,21,18,20,21,15,17,18,21,25,25,23,27,30,20,24,24,25,29,30,27,31,31,21,25,28,16,19,22,16,18,20,14,16,16,17,20,21,18,22,23,18,21,22,18,21,21,20,22,25,22,24,28,22,24,28,23,25,31,18,21,21,21,23,26,16,19,19,14,17,17,18,21,21]},"VetPV":{"values":[7,8,8,12,12,12,12,12,12,10,10,10,6,7,7,8,8,8,8,7,7,6,6,6,6,6,6,8,8,8,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,10,10,10,6,6,6,12,12,12,12,12,12,12,12,12,7,10,10,12,12,12,6,6,6,12,12,12,13,13,13,12,12,12,13,13,13,13,13,13,7,7,7,7,7,7,7,8,8,13,13,13,7,7,7,11,11,11,11,11,11,8,8,8,8,8,10,7,7,7,7,7,8,8,8,8,7,7,7,16,16,16,11,11,11,17,17,17,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,6,6,7,8,8,8,10,10,10,8,8,11,10,10,11,19,19,19,18,18,18,18,18,19,18,18,18,17,17,18,17,17,17,16,16,16,18,18,18,18,18,19,19,19,19,16,16,16,17,17,17,17,17,17,16,16,16,16,16,16,16,16,16,19,19,19,22,22,23,19,19,19,10,10,10,12,12,12,18,18,18,17,17,17,17,17,17,18,18,18,17,17,17,17,17,18,17,17,17,17,17,17,18,18,18,12,12,12,17,17,17,17,17,18,18,18,18,18,18,18,19,19,19,22,22,22,19,19,19,16,16,17,16,16,17,19,19,19,18,18,19,19,19,19,19,16,16,17,16,16,16,18,18,18,18,18,18,23,23,23,20,20,22,22,25,25,18,22,22,20,20,20,19,19,20,17,17,17,22,25,25,18,18,18,22,22,24,22,22,22,23,23,23,14,14,14,14,14,17,14,14,16,20,20,20,20,20,20,17,20,20,17,20,20,16,19,19,18,22,22,19,24,25,24,29,29,20,25,26,20,25,25,18,23,24,17,22,23,17,22,23,17,22,22,18,18,18,18,18,19,22,26,26,18,23,23,18,23,23,18,18,22,23,17,20,20,16,19,19,17,20,20,22,22,25,29,18,19,23,23,19,20,24,24,19,19,23,24,19,19,23,24,18,19,23,23,19,19,23,24,17,20,20,23,28,28,20,25,25,19,24,24,16,16,16,19,19,19,18,18,19,18,18,18,19,19,20,17,17,18,17,17,17,17,17,17,18,18,18,19,19,20,20,20,20,20,20,20,18,18,18,14,17,18,14,17,17,16,18,19,13,16,17,16,18,18,17,20,20,17,20,20,17,20,20,20,20,22,20,20,20,18,18,18,22,22,22,20,20,20,12,14,18,12,14,14,18,23,24,18,22,22,18,18,18,16,20,20,17,20,20,17,20,20,18,22,22,16,19,19,16,20,20,19,19,19,18,18,18,18,18,18,20,20,20,18,18,18,16,16,16,14,14,16,17,20,22,17,20,22,18,22,23,18,22,22,17,20,22,22,25,25,19,23,25,13,16,16,18,20,20,12,14,14,14,17,17,23,23,23,17,17,17,19,19,19,17,17,17,22,25,25,22,25,29,22,25,25,22,25,25,17,17,22,16,16,20,16,16,20,18,22,22,18,18,18,17,20,20,17,20,20,16,19,19,16,20,20,16,20,20,17,20,20,17,20,20,22,22,22,18,23,23,20,20,20,20,20,20,19,19,19,19,19,19,19,20,20,20,18,18,19,18,18,19,18,18,20,17,17,17,17,17,17,18,18,18,17,17,17,12,16,16,17,19,19,17,17,17,17,17,20,14,14,17,17,17,19,13,13,16,13,13,19,20,20,24,17,17,19,19,19,19,20,20,25,13,13,17,22,22,25,19,19,19,22,22,22,20,20,20,20,20,20,22,22,25,8,18,22,23,18,23,23,17,19,23,19,22,22,11,13,14,17,19,19,14,18,18,18,18,18,19,19,26,22,22,29,23,23,26,18,22,23,18,23,23,30,17,24,24,26,19,23,26,22,25,28,19,23,26,18,22,22,20,20,24,20,20,25,22,22,25,20,20,20,19,23,24,24,24,29,16,16,18,18,18,20,17,17,20,14,14,16,19,19,23,19,19,26,18,23,24,22,22,25,18,18,23,17,22,23,23,28,28,22,26,26,19,24,25,19,24,24,19,23,23,23,28,31,18,18,18,20,20,20,14,14,14,24,24,28,25,25,31,26,31,35,18,18,23,22,22,22,17,17,17,20,20,24,18,18,23,16,16,19,22,25,29,22,25,25,22,25,25,22,25,25,22,25,29,22,25,25,22,25,25,13,18,22,22,16,19,23,24,24,29,17,17,20,13,13,13,17,17,18,20,20,20,14,14,16,13,13,13,17,17,20,18,18,19,17,20,22,23,26,26,19,23,26,23,26,26,19,23,26,25,30,30,22,24,24,22,26,30,23,25,28,22,24,30,23,25,29,18,22,22,20,23,24,17,20,24,19,22,24,23,25,29,19,22,25,20,23,24,20,23,24,18,20,24,17,19,23,16,19,23,26,31,35,29,34,37,17,20,22,23,23,25,30,32,36,24,26,26,19,23,26,18,20,24,19,22,24,19,22,24,19,22,24,19,22,24,23,25,29,22,24,25,22,24,25,22,24,25,18,20,22,25,30,30,28,32,36,24,29,29,30,35,36,32,37,37,25,30,34,19,23,26,19,22,24,17,19,19,20,24,25,22,26,28,22,25,26,22,25,25,24,26,30,26,29,34,26,29,34,28,30,37,22,25,25,25,28,31,19,23,23,17,20,20,22,25,25]},"Specials":{"dict":["AM,CAR4,MEC","CAR5,MEC","CAR6,MEC","CAR4,SOA,STL","CAR5,SOA,STL","CAR6,SOA,STL","AM,CAR4,MEC,SOA,STL","AM,CAR5,MEC,SOA,STL","AM,CAR6,MEC,SOA,STL","CAR4,RCN,SOA","CAR5,RCN,SOA","CAR6,RCN,SOA","CAR4,SOA","CAR5,SOA","CAR6,SOA","AM,CAR4,XMEC","AM,CAR5,XMEC","AM,CAR6,XMEC","AM,CAR5,MEC","AM,CAR6,MEC","CAR4,MEC,SRCH","CAR5,MEC,SRCH","CAR6,MEC,SRCH","CAR1,MEC","AM,CAR5,MEC,SRCH","AM,CAR6,MEC,SRCH","AM,CAR4,MEC,SRCH","AM,CAR4","CAR5,SRCH","AM,CAR6","AM,CAR4,MEC,MSW,SRCH","AM,CAR5,MEC,MSW,SRCH","AM,CAR6,MEC,MSW,SRCH","AM,CAR4,MEC,STL","AM,CAR5,MEC,STL","AM,CAR6,MEC,STL","CAR4,SRCH","CAR6,SRCH","CAR4,MEC,RCN,SRCH","CAR5,MEC,RCN,SRCH","CAR6,MEC,RCN,SRCH","AM,CAR4,LECM,MEC,STL","AM,CAR5,LECM,MEC,STL","AM,CAR6,LECM,MEC,STL","CAR4","CAR5","CAR6","AM,CAR4,FR,LECM","CAR5,FR,LECM","CAR6,FR,LECM","AM,CAR4,FR,MEC,RCN","CAR5,FR,RCN","CAR6,FR,RCN","AM,CAR4,FR,LTAG","CAR5,FR,LTAG","CAR6,FR,LTAG","CAR4,FR,MEC,RCN","CAR5,FR,MEC,RCN","CAR6,FR,MEC,RCN","AM,CAR4,FR,MEC","CAR5,FR,MEC","CAR6,FR,MEC","AM,CAR4,LMAS,MEC,STL","AM,CAR5,LMAS,MEC,STL","AM,CAR6,LMAS,MEC,STL","AM,CAR4,HT1/-/-,MEC,STL","AM,CAR5,HT1/-/-,MEC,STL","AM,CAR6,HT1/-/-,MEC,STL","AM,ATMO,CAR4,MEC,STL","AM,ATMO,CAR5,MEC,STL","AM,ATMO,CAR6,MEC,STL","AM,CAR4,LECM,MEC,RCN,STL","AM,CAR5,LECM,MEC,RCN,STL","AM,CAR6,LECM,MEC,RCN,STL","AM,CAR4,LTAG,MEC,STL","AM,CAR5,LTAG,MEC,STL","AM,CAR6,LTAG,MEC,STL","AM,CAR4,LECM,MEC","AM,CAR5,LECM,MEC","AM,CAR6,LECM,MEC","AM,CAR4,MEC,RCN","AM,CAR5,MEC,RCN","AM,CAR6,MEC,RCN","AM,CAR4,LTAG,MEC","AM,CAR5,LTAG,MEC","AM,CAR6,LTAG,MEC","AM,CAR4,HT1/-/-,MEC,RFA","AM,CAR5,HT1/-/-,MEC,RFA","AM,CAR6,HT1/-/-,MEC,RFA","AM,CAR4,MEC,RFA","AM,CAR5,MEC,RFA","AM,CAR6,MEC,RFA","AM,CAR4,LMAS,MEC","AM,CAR5,LMAS,MEC","AM,CAR6,LMAS,MEC","AM,CAR4,HT1/-/-,MEC,RCN,STL","AM,CAR5,HT1/-/-,MEC,RCN,STL","AM,CAR6,HT1/-/-,MEC,RCN,STL","AM,CAR4,MEC,LPRB,RCN","AM,CAR5,MEC,LPRB,RCN","AM,CAR6,MEC,LPRB,RCN","CAR4,MEC,STL","CAR5,MEC,STL","CAR6,MEC,STL","CAR4,MEC,RCN,RSD1,STL","CAR5,MEC,RCN,RSD1,STL","CAR6,MEC,RCN,RSD1,STL","AM,CAR4,C3S,MAS,MEC,MHQ1","AM,CAR5,C3S,MAS,MEC,MHQ1","AM,CAR6,C3S,MAS,MEC,MHQ1","AM,ATMO,CAR4,LECM,LTAG,MEC,STL","AM,ATMO,CAR5,LECM,LTAG,MEC,STL","AM,ATMO,CAR6,LECM,LTAG,MEC,STL","AM,CAR4,C3I,MEC,MHQ2,STL","AM,CAR5,C3I,MEC,MHQ2,STL","AM,CAR6,C3I,MEC,MHQ2,STL","AM,CAR4,MEC,STL,UMU","AM,CAR4,STL,XMEC","AM,CAR5,STL,XMEC","AM,CAR6,STL,XMEC","AM,ATMO,BOMB1,CAR4,MEC","AM,ATMO,BOMB1,CAR5,MEC","AM,ATMO,BOMB1,CAR6,MEC","AM,ATMO,CAR4,MEC,SRCH","AM,ATMO,CAR5,MEC,SRCH","AM,ATMO,CAR6,MEC,SRCH","AM,ATMO,CAR4,MEC","AM,CAR4,MEC,RAMS,STL","AM,CAR5,MEC,RAMS,STL","AM,CAR6,MEC,RAMS,STL","AM,CAR4,FR,LECM,MEC","AM,CAR5,FR,LECM,MEC","AM,CAR6,FR,LECM,MEC","AM,CAR5,FR,MEC","AM,CAR6,FR,MEC","CAR4,LMAS,RCN,RSD1,STL","CAR5,LMAS,RCN,RSD1,STL","CAR6,LMAS,RCN,RSD1,STL","CAR4,RCN,SRCH","CAR5,RCN,SRCH","CAR6,RCN,SRCH","CAR4,LTAG","CAR5,LTAG","CAR6,LTAG","AM,CAR4,HT1/-/-,MEC","AM,CAR5,MEC,HT1/-/-","AM,CAR6,MEC,HT1/-/-","AM,CAR4,HT1/-/-,MEC,SRCH","AM,CAR5,HT1/-/-,MEC,SRCH","AM,CAR6,HT1/-/-,MEC,SRCH","AM,CAR5,HT1/-/-,MEC","AM,CAR6,HT1/-/-,MEC","AM,CAR4,FR,HT1/-/-,MEC","AM,CAR5,FR,HT1/-/-,MEC","AM,CAR6,FR,HT1/-/-,MEC","AM,CAR3,MEC,RCN,RSD1","AM,CAR4,MEC,RCN,RSD1","AM,CAR5,MEC,RCN,RSD1","AM,CAR6,MEC,RCN,RSD1","AM,CAR4,HT1/-/-,MEC,SOA","AM,CAR5,HT1/-/-,MEC,SOA","AM,CAR6,HT1/-/-,MEC,SOA","AM,CAR4,MEC,SOA","AM,CAR5,MEC,SOA","AM,CAR6,MEC,SOA","AM,CAR3,MEC","AM,CAR3,HT1/-/-,MEC","AM,CAR4,HT1/1/-,XMEC","AM,CAR5,HT1/1/-,XMEC","AM,CAR6,HT1/1/-,XMEC","AM,CAR4,HT1/-/-,MDS1,MSW,XMEC","AM,CAR5,HT1/-/-,MDS1,MSW,XMEC","AM,CAR4,MDS1,MSW,XMEC","AM,CAR5,MDS1,MSW,XMEC","AM,CAR6,MDS1,MSW,XMEC","AM,CAR4,LTAG,MDS1,MSW,XMEC","AM,CAR5,LTAG,MDS1,MSW,XMEC","AM,CAR6,LTAG,MDS1,MSW,XMEC","AM,CAR4,MEC,PAR,STL","AM,CAR5,MEC,PAR,STL","AM,CAR6,MEC,PAR,STL","AM,CAR4,MDS1,MEC,PAR,STL","AM,CAR5,MDS1,MEC,PAR,STL","AM,CAR6,MDS1,MEC,PAR,STL","AM,CAR4,MEC,PAR,RCN,RSD1,STL","AM,CAR5,MEC,PAR,RCN,RSD1,STL","AM,CAR6,MEC,PAR,RCN,RSD1,STL","AM,CAR4,MEC,PAR,RCN,STL","AM,CAR5,MEC,PAR,RCN,STL","AM,CAR6,MEC,PAR,RCN,STL","AM,CAR4,LTAG,MEC,PAR,STL","AM,CAR5,LTAG,MEC,PAR,STL","AM,CAR6,LTAG,MEC,PAR,STL","AM,CAR4,HT1/-/-,MEC,RCN","AM,CAR5,HT1/-/-,MEC,RCN","AM,CAR6,HT1/-/-,MEC,RCN","AM,CAR4,LECM,MEC,PAR,STL","AM,CAR5,LECM,MEC,PAR,STL","AM,CAR6,LECM,MEC,PAR,STL","AM,CAR4,LECM,STL,XMEC","AM,CAR5,LECM,STL,XMEC","AM,CAR6,LECM,STL,XMEC","AM,CAR4,SOA,STL,XMEC","AM,CAR5,SOA,STL,XMEC","AM,CAR6,SOA,STL,XMEC","AM,CAR4,LECM,MEC,PAR,RCN,STL","AM,CAR5,LECM,MEC,PAR,RCN,STL","AM,CAR6,LECM,MEC,PAR,RCN,STL","AM,CAR4,MDS2,MSW,XMEC","AM,CAR5,MDS2,MSW,XMEC","AM,CAR6,MDS2,MSW,XMEC","AM,CAR4,C3S,MEC,MHQ1","AM,CAR5,C3S,MEC,MHQ1","AM,CAR6,C3S,MEC,MHQ1","AM,HT1/-/-,CAR4,MEC","AM,HT1/-/-,CAR5,MEC","AM,HT1/-/-,CAR6,MEC","AECM,AM,CAR4,MEC,STL","AECM,AM,CAR5,MEC,STL","AECM,AM,CAR6,MEC,STL","AECM,AM,CAR4,MEC,RCN,STL","AECM,AM,CAR5,MEC,RCN,STL","AECM,AM,CAR6,MEC,RCN,STL","AECM,AM,CAR4,LTAG,MEC,STL","AECM,AM,CAR5,LTAG,MEC,STL","AECM,AM,CAR6,LTAG,MEC,STL","AM,CAR4,C3I,MEC,MHQ2","AM,CAR5,C3I,MEC,MHQ2","AM,CAR6,C3I,MEC,MHQ2","AM,CAR4,CNARC,FR,LECM,MEC","AM,CAR5,CNARC,FR,LECM,MEC","AM,CAR6,CNARC,FR,LECM,MEC","AM,CAR4,MAS,MEC","AM,CAR5,MAS,MEC","AM,CAR6,MAS,MEC","AM,CAR4,CNARC,MAS,MEC","AM,CAR5,CNARC,MAS,MEC","AM,CAR6,CNARC,MAS,MEC","AM,CAR4,LTAG,MAS,MEC","AM,CAR5,LTAG,MAS,MEC","AM,CAR6,LTAG,MAS,MEC","AM,CAR4,LTAG,MEC,RCA","AM,CAR5,LTAG,MEC,RCA","AM,CAR6,LTAG,MEC,RCA","CAR4,HT1/-/-,RCN,STL","CAR5,HT1/-/-,RCN,STL","CAR6,HT1/-/-,RCN,STL","CAR4,STL","CAR5,STL","CAR6,STL","CAR4,RCN,STL","CAR5,RCN,STL","CAR6,RCN,STL","CAR4,RCN,RSD1,STL","CAR5,RCN,RSD1,STL","CAR6,RCN,RSD1,STL","AM,CAR3,FR,HT1/-/-,MEC","AM,CAR4,FR,HT2/-/-,MEC","AM,CAR5,FR,HT2/-/-,MEC","AM,CAR6,FR,HT2/-/-,MEC","AM,BTAS1,CAR4,MEC,SRCH,STL","AM,BTAS1,CAR5,MEC,SRCH,STL","AM,BTAS1,CAR6,MEC,SRCH,STL","AM,CAR4,MEC,SRCH,STL","AM,CAR5,MEC,SRCH,STL","AM,CAR6,MEC,SRCH,STL","AM,C3S,CAR4,MAS,MEC,MHQ1","AM,C3S,CAR5,MAS,MEC,MHQ1","AM,C3S,CAR6,MAS,MEC,MHQ1","AM,CAR4,HT1/1/-,MAS,MEC","AM,CAR5,HT1/1/-,MAS,MEC","AM,CAR6,HT1/1/-,MAS,MEC","AM,CAR4,IF0*,MEC,SUBS1","AM,CAR5,IF0*,MEC,SRCH","AM,CAR6,IF0*,MEC,SRCH","AM,CAR4,IF1,MEC","AM,CAR5,IF1,MEC","AM,CAR6,IF1,MEC","AM,CAR4,MDS1,MEC,STL","AM,CAR5,MDS1,MEC,STL","AM,CAR6,MDS1,MEC,STL","CAR5,MEC,SRCH,UMU","AM,CAR4,MEC,RCA,RCN","AM,CAR5,MEC,RCA,RCN","AM,CAR6,MEC,RCA,RCN","CAR4,MEC,RCA","CAR5,MEC,RCA","CAR6,MEC,RCA","CAR4,HT2/-/-,MEC,RCA","CAR5,HT2/-/-,MEC,RCA","CAR6,HT2/-/-,MEC,RCA","CAR4,FLK1/1/-,MEC,RCA","CAR5,FLK1/1/-,MEC,RCA","CAR6,FLK1/1/-,MEC,RCA","CAR4,HT1/-/-,MEC,RCA","CAR5,HT1/1/-,MEC,RCA","CAR6,HT1/1/-,MEC,RCA","ARTBA-1,CAR4,RCA,XMEC","ARTBA-1,CAR5,RCA,XMEC","ARTBA-1,CAR6,RCA,XMEC","CAR4,MEC","CAR4,HT1/-/-,MEC","CAR5,HT1/-/-,MEC","CAR6,HT1/-/-,MEC","CAR4,XMEC","CAR4,IF1,MEC","CAR5,IF1,MEC","CAR6,IF1,MEC","CAR3,MEC","CAR4,IF0*,MEC","CAR5,IF0*,MEC","CAR6,IF0*,MEC","CAR4,MEC,RCN","CAR5,MEC,RCN","CAR6,MEC,RCN","C3S,CAR4,IF1,MEC,MHQ1,STL","C3S,CAR5,IF1,MEC,MHQ1,STL","C3S,CAR6,IF1,MEC,MHQ1,STL","CAR4,HT1/-/-,MEC,STL","CAR5,HT1/-/-,MEC,STL","CAR6,HT1/-/-,MEC,STL","ARTBA-1,CAR4,MEC,STL","ARTBA-1,CAR5,MEC,STL","ARTBA-1,CAR6,MEC,STL","CAR4,LTAG,XMEC","CAR5,LTAG,XMEC","CAR6,LTAG,XMEC","CAR4,LECM,MAS,MEC","CAR5,LECM,MAS,MEC","CAR6,LECM,MAS,MEC","BTAS1,CAR4,MEC,STL","BTAS1,CAR5,MEC,STL","BTAS1,CAR6,MEC,STL","CAR4,LMAS,MEC,STL","CAR5,LMAS,MEC,STL","CAR6,LMAS,MEC,STL","CAR4,MAS","CAR5,MAS","CAR6,MAS","CAR4,HT2/-/-,LECM,MAS","CAR5,HT2/-/-,LECM,MAS","CAR6,HT2/-/-,LECM,MAS","CAR4,MAS,MDS2","CAR5,MAS,MDS1","CAR6,MAS,MDS1","CAR4,LECM","CAR5,LECM","CAR6,LECM","CAR4,MDS1","CAR5,MDS1","CAR6,MDS1","CAR4,FR,XMEC","CAR5,FR,XMEC","CAR6,FR,XMEC","CAR4,FR,HT2/-/-,MEC","CAR5,FR,HT2/-/-,MEC","CAR6,FR,HT2/-/-,MEC","CAR4,MAS,MEC","CAR5,MAS,MEC","CAR6,MAS,MEC","CAR4,C3I,LTAG,MHQ2,MEC","CAR5,C3I,LTAG,MHQ2,MEC","CAR6,C3I,LTAG,MHQ2,MEC","CAR4,HT1/1/-,MEC","CAR5,HT1/1/-,MEC","CAR6,HT1/1/-,MEC","CAR4,MEC,RFA","CAR5,MEC,RFA","CAR6,MEC,RFA","CAR4,FLK1/1/-,MEC,RFA","CAR5,FLK1/1/-,MEC,RFA","CAR6,FLK1/1/-,MEC,RFA","CAR4,C3S,FLK1/1/-,MEC,MHQ1,RFA","CAR5,C3S,FLK1/1/-,MEC,MHQ1,RFA","CAR6,C3S,FLK1/1/-,MEC,MHQ1,RFA","CAR4,MEC,SUBS1,UMU","CAR4,C3S,MEC,MHQ1,RFA","CAR5,C3S,MEC,MHQ1,RFA","C3S,CAR6,MEC,MHQ1,RFA","CAR4,C3S,IF2,MHQ1","CAR5,C3S,IF2,MHQ1","CAR6,C3S,IF2,MHQ1","CAR4,IF1","CAR5,IF1","CAR6,IF1","CAR4,HT1/1/-,RFA","CAR5,HT1/1/-,RFA","CAR6,HT1/1/-,RFA","CAR4,FR","CAR5,FR","CAR6,FR","CAR4,C3S,MHQ1,STL","CAR5,C3S,MHQ1,STL","CAR6,C3S,MHQ1,STL","CAR4,CNARC,STL","CAR5,CNARC,STL","CAR6,CNARC,STL","CAR4,HT2/-/-,STL","CAR5,HT2/-/-,STL","CAR6,HT2/-/-,STL","CAR4,HT1/-/-,STL","CAR5,HT1/-/-,STL","CAR6,HT1/-/-,STL","CAR4,LTAG,STL","CAR5,LTAG,STL","CAR6,LTAG,STL","CAR4,IF1,STL","CAR5,IF1,STL","CAR6,IF1,STL","CAR4,LECM,MAS","CAR5,LECM,MAS","CAR6,LECM,MAS","CAR4,FLK2/2/-,FR","CAR5,FLK2/2/-,FR","CAR6,FLK3/3/-,FR","CAR4,RCN","CAR5,RCN","CAR6,RCN","CAR4,RCA,RCN","CAR5,RCA,RCN","CAR6,RCA,RCN","CAR4,HT1/-/-","CAR5,HT1/-/-","CAR6,HT1/-/-","CAR4,RCA","CAR5,RCA","CAR6,RCA","BTAS1,CAR4,IF0*,MAS","BTAS1,CAR5,IF0*,MAS","BTAS1,CAR6,IF0*,MAS","CAR4,CNARC,MAS","CAR5,CNARC,MAS","CAR6,CNARC,MAS","CAR4,MAS,RCN,SRCH","CAR5,MAS,RCN,SRCH","CAR6,MAS,RCN,SRCH","CAR4,HT1/1/-,MAS","CAR5,HT1/1/-,MAS","CAR6,HT1/1/-,MAS","CAR4,IF0*","BTAS2,CAR4","BTAS2,CAR5","BTAS2,CAR6","CAR4,LECM,LMAS,RCN","CAR5,LECM,LMAS,RCN","CAR6,LECM,LMAS,RCN","CAR4,LMAS","CAR5,LMAS","CAR6,LMAS","CAR4,HT1/1/-,RCA","CAR5,HT1/1/-,RCA","CAR6,HT1/1/-,RCA","CAR4,HT2/-/-,RCA","CAR5,HT2/-/-,RCA","CAR6,HT2/-/-,RCA"],"values":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,15,16,17,0,18,19,0,18,19,0,18,19,20,21,22,23,24,25,26,26,24,25,27,28,29,27,28,29,30,31,32,27,28,29,33,34,35,36,28,37,38,39,40,41,42,43,33,34,35,0,34,35,33,34,35,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,20,21,22,30,31,32,0,24,25,26,24,25,26,24,25,33,34,35,62,63,64,33,34,35,65,66,67,33,34,35,33,34,35,33,34,35,33,34,35,68,69,70,62,63,64,33,34,35,20,21,22,20,21,19,26,24,25,0,21,19,26,24,25,0,21,19,27,28,19,27,28,19,26,24,19,26,24,19,71,72,73,33,34,35,65,66,67,33,34,35,33,34,35,74,75,76,77,78,79,0,18,19,80,81,82,0,18,19,83,84,85,86,87,88,89,90,91,89,90,91,83,84,85,92,93,94,33,34,35,95,96,97,98,99,100,101,102,103,104,105,106,33,34,35,6,7,8,33,34,35,41,42,43,33,34,35,33,34,35,33,34,35,74,75,76,107,108,109,89,90,91,33,34,35,33,34,35,74,75,76,33,34,35,74,75,76,110,111,112,113,114,115,116,34,35,117,118,119,120,121,122,123,124,125,26,24,25,126,0,18,19,127,128,129,0,18,19,130,131,132,59,133,134,80,81,82,0,18,19,0,18,19,135,136,137,62,63,64,92,93,94,0,18,19,0,18,19,138,139,140,36,28,37,141,142,143,0,18,19,0,18,19,0,18,19,0,18,19,0,18,19,144,145,146,0,18,19,0,18,19,0,18,19,65,66,67,33,34,35,33,34,35,33,34,35,147,148,149,26,24,25,0,24,25,26,24,25,0,18,19,144,150,151,59,133,134,152,153,154,59,133,134,155,156,157,158,159,160,161,162,163,164,162,163,164,165,0,18,19,165,0,18,19,166,144,150,151,165,0,18,19,165,0,18,19,165,0,18,19,165,0,18,19,0,18,19,33,34,35,65,66,67,33,34,35,15,16,17,167,168,169,170,171,170,172,173,174,172,173,174,172,173,174,175,176,177,172,173,174,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,80,81,82,80,81,82,80,81,82,80,81,82,83,84,85,83,84,85,83,83,85,196,197,198,199,200,201,202,203,204,205,206,207,107,108,109,0,18,18,0,18,19,208,209,210,208,209,210,211,212,213,15,16,17,214,215,216,0,18,19,0,18,19,0,18,19,0,18,19,217,218,219,217,218,219,217,218,219,220,221,222,223,224,225,226,227,228,226,227,228,15,16,17,0,18,19,144,150,151,0,18,19,0,18,19,0,18,19,0,18,19,130,131,132,130,131,132,229,230,231,130,131,132,232,233,234,235,236,237,232,233,234,238,239,240,0,18,19,0,18,19,0,18,19,0,18,19,241,242,243,241,242,243,241,242,243,144,150,151,0,18,19,144,150,151,0,18,19,0,18,19,0,18,19,0,18,19,86,87,88,89,90,91,244,245,246,247,248,249,250,251,252,253,254,255,59,133,134,152,153,154,256,257,258,259,65,66,67,260,261,262,263,264,265,147,148,149,26,24,25,26,24,25,26,24,25,0,18,19,15,16,17,15,16,17,0,18,19,0,18,19,0,18,19,0,18,19,0,18,19,0,18,19,0,18,19,266,267,268,269,270,271,272,273,274,275,276,277,33,34,35,278,279,280,33,34,35,33,34,35,278,279,280,281,282,283,284,33,34,35,285,286,287,288,289,290,285,286,287,291,292,293,294,295,296,297,298,299,300,1,2,301,302,303,101,102,103,300,1,2,304,305,306,307,308,300,1,2,300,1,2,309,310,311,300,1,2,312,313,314,101,102,103,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,300,1,2,101,102,103,330,331,332,101,102,103,101,102,103,300,1,2,333,334,335,300,1,2,285,286,287,333,334,335,336,337,338,339,340,341,336,337,338,336,337,338,342,343,344,336,337,338,247,248,249,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,300,1,2,300,1,2,360,361,362,300,1,2,363,364,365,300,1,2,366,367,368,369,370,371,366,367,368,300,1,2,300,1,2,300,1,2,372,373,374,375,376,377,378,366,367,368,379,380,381,44,45,46,44,45,46,44,45,46,44,45,46,44,45,46,44,45,46,44,45,46,44,45,46,44,45,46,382,383,384,44,45,46,44,45,46,44,45,46,247,248,249,385,386,387,44,45,46,388,389,390,388,389,390,388,389,390,391,392,393,247,248,249,394,395,396,247,248,249,397,398,399,400,401,402,247,248,249,247,248,249,247,248,249,403,404,405,406,407,408,336,337,338,409,410,411,247,248,249,412,413,414,388,389,390,44,45,46,44,45,46,44,45,46,44,45,46,44,45,46,44,45,46,44,45,46,44,45,46,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,336,337,338,430,431,432,433,434,435,336,337,338,436,437,438,439,383,384,44,45,46,440,441,442,44,45,46,443,444,445,44,45,46,446,447,448,247,248,249,391,392,393,406,407,408,247,248,249,424,425,426,44,45,46,424,425,426,449,450,451,452,453,454]},"SpecialRules":{"rows":[4,7,9,12,15,18,27,30,36,37,40,43,46,49,52,55,58,61,64,70,73,77,80,83,86,89,97,100,103,109,112,115,118,121,124,127,130,133,136,139,142,145,148,151,154,157,160,163,166,171,172,175,178,181,184,188,191,194,197,200,202,205,208,211,214,217,220,223,226,229,232,235,238,241,244,247,250,253,256,262,265,268,271,274,278,280,283,286,290,293,296,300,302,306,309,312,315,317,323,326,329,332,335,339,342,345,348,351,354,357,360,362,365,368,371,374,377,380,383,387,390,393,396,398,401,405,408,411,415,418,421,424,428,436,440,444,448,452,455,458,461,464,466,469,472,475,478,481,484,487,490,493,496,499,502,505,508,511,514,517,521,523,526,529,532,535,538,541,544,547,550,553,556,559,562,565,568,571,574,577,580,583,586,589,592,595,598,601,604,607,610,616,619,622,625,628,631,634,637,640,655,658,661,664,667,670,673,676,679,682,685,688,691,694,697,700,704,707,711,713,716,719,722,728,731,734,737,740,743,746,749,752,755,758,761,764,767,771,774,776,779,782,785,788,793,796,799,802,805,808,811,813,817,820,823,826,830,834,837,840,843,845,848,851,854,857,860,863,866,869,872,875,878,882,885,888,891,894,899,902,905,908,911,914,917,920,924,927,929,932,935,938,941,944,947,951,954,957,960,963,966,969,972,975,978,981,984,987,990,993,996,999,1002,1005,1008,1014,1017,1020,1023,1027,1030,1033,1036,1038,1047,1062,1068,1071,1074,1077,1081,1084,1087,1089,1092,1095,1098,1101,1104,1107,1110,1113,1116,1119,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1152,1155,1158,1174,1177,1179,1182,1185],"dict":["Special: No Turret, Mechanized, Nimble, Spotter, Swarm","Special: No Turret, Mechanized, Nimble, Spotter, Swarm, ECM6","Special: No Turret, Mechanized, Nimble, Spotter, Swarm, TAG9","Special: No Turret, Mechanized, Nimble, Spotter, Swarm, ECM6, TAG9","Special: Mechanized, Nimble, Spotter, Swarm"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,1,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,2,1,0,0,0,2,0,0,0,2,0,0,0,0,0,0,0,0,0,1,0,0,0,2,0,0,0,2,0,2,3,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,0,0,0,0,0,2,0,0,0,0,0,2,2,2,1,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,3,0,0,0,0,0,0,0,0,1,1,1,1,0,0,0,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,1,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,1,0,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,4,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0]},"ImageURL":{"dict":["https://i.ibb.co/gFgLgXS/machina-domini-jfr.png","https://i.ibb.co/mccjbL8/aerie-3075.png","https://i.ibb.co/mzNkVJ8/ailette-trva.png","https://i.ibb.co/qxsfX2D/gladiator-s-proto.png","https://i.ibb.co/HtPyP0z/gladiator-exo-trva.png","https://i.ibb.co/Stv46CX/gorilla-salrilla-trva.png","https://i.ibb.co/WWbyKG4/groundhog-trva.png","https://i.ibb.co/PN76gXQ/heavyhauler-trva.png","https://i.ibb.co/1zGZtZL/resgate-krise-trva.png","https://i.ibb.co/H2hCG3n/nighthawk-3075.png","https://i.ibb.co/g3zCcvn/powerloader-trva.png","https://i.ibb.co/r2Q97gT/smoothdavid-trva.png","https://i.ibb.co/tZXR8KS/pab-28-3145.png","https://i.ibb.co/Qkjs64n/tornado-3075.png","https://i.ibb.co/kQq2GDz/tunnel-rat-i-ii-trva.png","https://i.ibb.co/FsFznWs/tunnel-rat-iii-iv-trva.png","https://i.ibb.co/ZcHFYBn/achileus-3058u.png","https://i.ibb.co/d0rpdK8/constable-3150.png","https://i.ibb.co/TwmgPD5/djinn-3075.png","https://i.ibb.co/RPQk0dn/gray-death-scout-3058u.png","https://i.ibb.co/5Ls7Ym6/infiltrator-mk-i-3058u.png","https://i.ibb.co/6n835v6/kage-3058u.png","https://i.ibb.co/tqX0SPC/kishi-3145.png","https://i.ibb.co/TB9z752/kobold-3075.png","https://i.ibb.co/gtWc3cP/sea-fox-3150.png","https://i.ibb.co/kqk9DyR/spectre-3150.png","https://i.ibb.co/zP8FmCG/sylph-3058u.png","https://i.ibb.co/Hg5F7ZH/sylph-proto.png","https://i.ibb.co/cJhSJ62/angerona-3085.png","https://i.ibb.co/MB2Sfzq/afreet-3075.png","https://i.ibb.co/fHmTzX5/amazon-3145.png","https://i.ibb.co/RbyqFcn/asura-3075.png","https://i.ibb.co/5WWdkDy/buraq-3145.png","https://i.ibb.co/PFk6DzS/callisto-battle-armor-rg.png","https://i.ibb.co/hWT67g9/cavalier-3058u.png","https://i.ibb.co/tsydcNX/clan-medium-battle-armor-3075.png","https://i.ibb.co/10q1BLy/dragoon-battle-armor-rg.png","https://i.ibb.co/fp1mK6q/elemental-battle-armor-rg.png","https://i.ibb.co/G00w9Zh/elemental-ii-proto.png","https://i.ibb.co/D5HGFXN/fa-shih-3058u.png","https://i.ibb.co/LY34Q4z/gray-death-infiltrator-3150.png","https://i.ibb.co/7NLj0Yk/gray-death-standard-3058u.png","https://i.ibb.co/z2BG2HV/gray-death-strike-proto.png","https://i.ibb.co/n7pXJCk/infiltrator-mk-ii-3058u.png","https://i.ibb.co/mXL5yPH/is-standard-battle-armor-rg.png","https://i.ibb.co/R45MVPc/leonidas-3150.png","https://i.ibb.co/pLBFFH7/longinus-3058u.png","https://i.ibb.co/nzptQMT/oni-3145.png","https://i.ibb.co/kSSzFjH/purifier-3058u.png","https://i.ibb.co/GWFFDMW/quirinus-3145.png","https://i.ibb.co/XCdzdzp/raiden-3058u.png","https://i.ibb.co/m4Hg4C0/rottweiler-3075.png","https://i.ibb.co/475v1xK/salamander-3058u.png","https://i.ibb.co/74pzybb/se-irim-3075.png","https://i.ibb.co/NpCbhzk/simian-3145.png","https://i.ibb.co/FDd7yZT/tinstar-battle-armor-rg.png","https://i.ibb.co/18jQ3Hb/trinity-3075.png","https://i.ibb.co/nggB1mn/undine-3058u.png","https://i.ibb.co/Zcvb8Nv/void-3075.png","https://i.ibb.co/841778w/void-proto.png","https://i.ibb.co/pnJvQP6/water-elemental-trgc.png","https://i.ibb.co/jbrbCC6/wraith-3145.png","https://i.ibb.co/m6nF5X4/black-wolf-3145.png","https://i.ibb.co/DVHWw6L/centaur-3145.png","https://i.ibb.co/r69szJZ/corona-3075.png","https://i.ibb.co/DpSR8XY/cuchulainn-3150.png","https://i.ibb.co/YW015j5/gnome-3058u.png","https://i.ibb.co/CQBy4Yt/gray-death-heavy-suit.jpg","https://i.ibb.co/Y8mTF1V/grenadier-3075.png","https://i.ibb.co/8X1Cn9q/marauder-3145.png","https://i.ibb.co/0svWBPd/ogre-3145.png","https://i.ibb.co/LQ7Ms4B/phalanx-3075.png","https://i.ibb.co/s3byByj/rogue-bear-proto.png","https://i.ibb.co/8jNGpVk/rogue-bear-3075.png","https://i.ibb.co/kqmXBMX/shen-long-3145.png","https://i.ibb.co/rvmN1cg/sloth-3058u.png","https://i.ibb.co/rQ5S6kw/stormbird-battle-armor-rg.png","https://i.ibb.co/DRf7t4k/taranis-3145.png","https://i.ibb.co/PZSWVGG/tengu-3075.png","https://i.ibb.co/VS9zz7N/thunderbird-ii-xtr.png","https://i.ibb.co/Kqbj7nH/zou-3150.png","https://i.ibb.co/FXqjr9Y/fenrir-3058u.png","https://i.ibb.co/c84xk6b/fenrir-ii-3150.png","https://i.ibb.co/KzCxZ2Y/fusilier-3150.png","https://i.ibb.co/wYp49T6/golem-3075.png","https://i.ibb.co/9rQmRZJ/hauberk-3075.png","https://i.ibb.co/YBC3dKj/hauberk-proto.png","https://i.ibb.co/51WMm4K/ironhold-3085.png","https://i.ibb.co/n3XQJ3j/kanazuchi-3058u.png","https://i.ibb.co/GxVHwjJ/kopis-3085.png","https://i.ibb.co/hyt6Pk2/nephilim-3075.png","https://i.ibb.co/zshhRrr/ravager-3085.png","https://i.ibb.co/pJ7QzHd/shedu-3075.png","https://i.ibb.co/pdb7WSx/tortoise-ii-xtr.png","https://i.ibb.co/PxtBtTt/warg-3085.png","https://i.ibb.co/z6pQF8R/xiphos-3150.png"],"values":[0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,3,3,3,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,5,5,5,5,5,5,11,11,11,11,11,11,11,11,11,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,24,24,24,25,25,25,26,26,26,26,26,26,26,26,26,26,27,27,27,28,28,28,29,29,29,29,29,29,29,29,29,29,29,29,30,30,30,30,30,30,28,28,28,28,28,28,31,31,31,31,31,31,31,31,31,32,32,32,32,32,32,32,32,32,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,35,35,35,35,35,35,35,35,35,35,35,35,36,36,36,36,36,36,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,38,38,38,37,37,37,37,37,37,37,37,37,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,42,42,42,42,42,42,42,42,42,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,47,47,47,47,47,47,47,47,47,47,47,47,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,49,49,49,49,49,49,49,49,49,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,51,51,51,51,51,51,51,51,51,51,51,51,52,52,52,52,52,52,52,52,52,52,53,53,53,53,53,53,53,53,53,54,54,54,54,54,54,54,54,54,54,54,54,41,41,41,55,55,55,55,55,55,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,57,57,57,57,57,57,58,58,58,59,59,59,58,58,58,58,58,58,58,58,58,60,61,61,61,61,61,61,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,63,63,63,64,64,64,64,64,64,65,65,65,38,38,38,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,67,67,67,68,68,68,68,68,68,68,68,68,68,68,68,69,69,69,70,70,70,70,70,70,71,71,71,71,71,71,71,71,71,71,71,71,66,66,66,72,72,72,73,73,73,73,73,73,73,73,73,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,75,75,75,75,75,75,75,75,75,76,76,76,76,76,76,77,77,77,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,57,80,80,80,80,80,80,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,83,83,83,83,83,83,84,84,84,84,84,84,84,84,84,84,84,84,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,85,85,85,86,86,86,85,85,85,85,85,85,87,87,87,87,87,87,87,87,87,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,91,91,91,91,91,91,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,93,93,93,93,93,93,93,93,93,93,93,93,94,94,94,94,94,94,95,95,95,95,95,95,95,95,95]},"MULId":{"values":[7387,8828,9191,3673,8600,8964,3674,8601,8965,5579,8708,9072,3683,8605,8969,4215,8619,8983,1212,8516,8880,4216,8620,8984,7206,8808,9171,5440,8705,9069,4225,8624,8988,5791,8634,8998,4252,7207,8809,9172,7208,8810,9173,7209,8811,9174,7210,8812,9175,7211,8813,9176,9244,9245,9246,4281,8638,9002,4465,8644,9008,4718,8651,9015,4719,8652,9016,4721,8654,9018,4720,8653,9017,4851,8658,9022,7202,8804,9167,7203,8805,9168,7204,8806,9169,4909,8659,9023,7205,8807,9170,4969,8666,9030,7212,8814,9177,5090,8675,9039,7201,8803,9166,5091,8676,9040,6307,8732,9095,5256,8685,9049,5257,8686,9050,5258,8687,9051,5259,8688,9052,5260,8689,9053,5261,8690,9054,5263,8691,9055,5612,8709,9073,5264,8692,9056,5560,8706,9070,5303,8698,9062,7218,8820,9183,5304,8699,9063,7219,8821,9184,5305,8700,9064,7213,8815,9178,7214,8816,9179,7215,8817,9180,7216,8818,9181,7217,8819,9182,6,8472,8837,7,8473,8838,8,8474,8839,9,8475,8840,10,8476,8841,11,8477,8842,5838,8717,9081,5839,8718,9082,5841,8720,9216,5840,8719,9083,5842,8721,9084,5793,8715,9079,5794,8716,9080,5792,8714,9078,4083,8614,8978,4084,8615,8979,1274,8524,8888,8460,9535,9536,1275,8525,8889,1614,8532,8896,1615,8533,8897,1730,8546,8910,1731,8547,8911,1732,8548,8912,1733,8549,8913,1734,8550,8914,1735,8551,8915,1736,8552,8916,1737,8553,8917,1738,8554,8918,6363,8736,9099,4454,8639,9003,4455,8640,9004,4456,8641,9005,4457,8642,9006,4458,8643,9007,6728,8783,9146,5561,8707,9071,6308,8733,9096,6523,8761,9124,3146,8587,8951,3147,8588,8952,5170,8677,9041,8384,5171,8678,9042,7388,8829,9192,3677,8602,8966,16,8478,8843,3678,8603,8967,3679,8604,8968,6428,8743,9106,6429,8744,9107,31,8479,8844,32,8480,8845,3743,8606,8970,3745,8608,8972,3744,8607,8971,6234,8723,9086,6233,8722,9085,6235,8724,9087,9437,9438,9439,9440,9441,9442,9443,9444,9445,9446,9447,9448,9449,9450,9451,499,8481,8846,500,8482,8847,501,8483,9534,502,8484,8848,9506,9513,9514,8018,9515,9516,8019,9517,9518,8020,9519,9520,3957,8611,8975,635,8485,8849,3955,8609,8973,3956,8610,8974,9382,9383,9384,9379,9380,9381,949,8486,8850,950,8487,8851,951,8488,8852,9253,952,8489,8853,953,8490,8854,954,8491,8855,955,8492,8856,9204,956,8493,8857,9205,957,8494,8858,9206,958,8495,8859,9207,959,8496,8860,9208,960,8497,8861,9210,961,8498,8862,9209,962,8499,8863,4123,8616,8980,8456,8834,9197,8457,8835,9198,8458,8836,9199,1012,8500,8864,1013,8501,8865,1014,8502,8866,1015,8503,8867,1016,8504,8868,1017,8505,8869,1018,8506,8870,1019,8507,8871,6582,8763,9126,6586,8767,9130,6585,8766,9129,6584,8765,9128,6583,8764,9127,1276,8526,8890,1277,8527,8891,1278,8528,8892,1279,8529,8893,1280,8530,8894,6729,8784,9147,4236,8625,8989,4237,8626,8990,1618,8536,8900,1616,8534,8898,6730,8785,9148,1619,8537,8901,1617,8535,8899,8022,9521,9522,8023,9523,9524,8025,9525,9526,8026,9527,9528,1627,8540,8904,9467,9468,9469,1628,8541,8905,1629,8542,8906,1630,8543,8907,1631,8544,8908,1632,8545,8909,6476,8751,9114,6478,8753,9116,6477,8752,9115,6480,8755,9118,6479,8754,9117,1939,8562,8926,1940,8563,8927,1941,8564,8928,1942,8565,8929,1943,8566,8930,1944,8567,8931,1945,8568,8932,8029,9213,9529,8030,9214,9531,6368,8740,9103,6365,8737,9100,6367,8739,9102,6366,8738,9101,2603,8569,8933,2604,8570,8934,2605,8571,8935,2606,8572,8936,5617,8713,9077,5614,8710,9074,5615,8711,9075,5616,8712,9076,6644,8774,9137,6645,8775,9138,6646,8776,9139,2619,8573,8937,2620,8574,8938,2621,8575,8939,2622,8576,8940,2623,8577,8941,2624,8578,8942,2625,8579,8943,6731,8786,9149,6732,8787,9150,4939,8663,9027,2744,8581,8945,4940,8664,9028,4941,8665,9029,2787,8582,8946,2788,8583,8947,9211,2789,8584,8948,5015,8667,9031,5016,8668,9032,5017,8669,9033,6649,8779,9142,6650,8780,9143,6648,8778,9141,6647,8777,9140,7307,8822,9185,9357,9358,9359,7700,9355,9356,3304,8592,8956,3305,8593,8957,5280,8693,9057,5281,8694,9058,5283,8695,9059,3306,8594,8958,5285,8696,9060,3307,8595,8959,5288,8697,9061,3351,8596,8960,3352,8597,8961,5357,8702,9066,5356,8701,9065,5358,8703,9067,5359,8704,9068,3446,8598,8962,7671,6237,8726,9089,6236,8725,9088,6239,8727,9090,6240,8728,9091,6241,8729,9092,6243,8731,9094,6242,8730,9093,6651,8781,9144,4006,8613,8977,4005,8612,8976,6587,8768,9131,4124,8617,8981,8385,1215,8517,8881,9212,1216,8518,8882,1217,8519,8883,1218,8520,8884,1219,8521,8885,1273,8523,8887,7389,8830,9193,7391,8831,9194,7392,8832,9195,7393,8833,9196,6525,8762,9125,6482,8757,9120,6481,8756,9119,4813,8655,9019,4814,8656,9020,4815,8657,9021,6733,8788,9151,9200,4912,9201,4930,8660,9024,4931,8661,9025,6734,8789,9152,4932,8662,9026,6431,8745,9108,6435,8749,9112,6432,8746,9109,6433,8747,9110,6436,8750,9113,6434,8748,9111,6735,8790,9153,2969,8585,8949,2970,8586,8950,9414,9415,9416,9412,9411,9413,6652,8782,9145,5201,8682,9046,5203,8683,9047,5198,8679,9043,5199,8680,9044,5204,8684,9048,5200,8681,9045,6736,8791,9154,6737,8792,9155,6738,8793,9156,3228,8589,8953,3229,8590,8954,3230,8591,8955,7357,8823,9186,8383,6370,8742,9105,6369,8741,9104,4162,8618,8982,1038,8508,8872,1039,8509,8873,1040,8510,8874,1041,8511,8875,1042,8512,8876,1043,8513,8877,1044,8514,8878,1045,8515,8879,6593,8773,9136,6591,8771,9134,6589,8769,9132,6590,8770,9133,6592,8772,9135,6309,8734,9097,6310,8735,9098,4222,8621,8985,4223,8622,8986,4224,8623,8987,1228,8522,8886,6740,8795,9158,4238,8627,8991,4239,8628,8992,6741,8796,9159,6739,8794,9157,4241,8629,8993,4242,8630,8994,4243,8631,8995,4244,8632,8996,4245,8633,8997,4269,8635,8999,4270,8636,9000,1419,8531,8895,4271,8637,9001,6742,8797,9160,1622,8538,8902,1623,8539,8903,1739,8555,8919,8027,9532,9533,1740,8556,8920,1741,8557,8921,1742,8558,8922,1743,8559,8923,1814,8560,8924,6743,8798,9161,6744,8799,9162,1815,8561,8925,6745,8800,9163,4700,8645,9009,4702,8646,9010,4703,8647,9011,4704,8648,9012,4706,8649,9013,4707,8650,9014,6746,8801,9164,2661,8580,8944,5041,8670,9034,5042,8671,9035,5043,8672,9036,5044,8673,9037,5045,8674,9038,7362,8827,9190,7359,8824,9187,7360,8825,9188,7361,8826,9189,6748,8802,9165,3478,8599,8963,6484,8758,9121,6485,8759,9122,6486,8760,9123]},"WepName1":{"rows":[27,64,89,100,112,115,118,121,124,136,157,160,163,166,172,175,178,188,191,194,197,200,202,205,208,211,214,217,220,226,232,244,247,250,262,265,268,271,274,278,283,286,290,293,296,300,306,309,312,315,317,323,326,329,332,335,339,342,345,348,351,354,357,360,362,365,368,371,374,377,380,383,387,390,393,396,398,401,405,408,411,415,418,421,424,428,436,440,444,448,452,455,458,461,464,466,469,472,475,478,490,493,496,499,502,505,508,511,514,517,521,523,526,529,532,535,541,544,547,550,553,556,559,562,565,568,571,574,577,580,583,592,595,598,601,604,607,610,616,619,622,628,631,637,655,658,661,664,667,670,673,676,679,682,685,688,691,694,697,700,704,707,711,713,716,719,722,728,731,734,737,740,743,746,749,752,755,758,761,764,767,771,774,776,779,782,785,788,793,796,799,802,805,808,811,813,817,820,823,826,830,834,837,840,843,845,848,851,854,857,860,863,866,869,872,875,878,882,885,888,891,894,899,902,905,908,911,914,917,920,924,927,929,932,935,944,947,951,954,957,960,963,966,969,972,975,978,981,987,990,993,996,999,1002,1005,1008,1014,1017,1020,1023,1027,1030,1033,1036,1038,1047,1062,1068,1071,1074,1077,1081,1084,1087,1089,1092,1095,1098,1101,1104,1107,1110,1113,1116,1119,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1152,1155,1158,1174,1177,1179,1182,1185],"dict":["Small Laser","Grenade Launcher (Micro)","Machine Gun (Light)","BA Recoilless Rifle (Medium)","Gauss Rifle [David]","Flamer [BA]","Grenade Launcher (Heavy)","Machine Gun (Medium)","Gauss Rifle [Anti-personnel Gauss Rifle]","Micro Pulse Laser","SRM 1 (OS)","Machine Gun (Heavy)","ER Micro Laser","Machine Gun (Bearhunter AC)","BA Recoilless Rifle (Light)","Advanced SRM 2","ER Medium Laser","ER Small Laser","SRM 1","Support PPC","SRM 2 (OS)","Advanced SRM 2 (OS)","Gauss Rifle [King David]","Plasma Rifle (Man-Portable)","Needler (Firedrake)","Advanced SRM 3","SRM 3","Gauss Rifle [Magshot]","Advanced SRM 4 (OS)","MRM 1","Gauss Rifle [Tsunami]","Heavy Small Laser","Rocket Launcher 4","ER Small Pulse Laser","Heavy Flamer [BA]","Mortar (Heavy)","Battle Armor LB-X AC","Tube Artillery (BA)","Medium Pulse Laser","BA Recoilless Rifle (Heavy)","ER Medium Pulse Laser","LRM 4","SRM 2","SRM 4","Medium VSP Laser","Small Pulse Laser","MRM 5","Small VSP Laser","Medium Laser","LRM 5","SRM 5","Advanced SRM 6","SRM 3 (OS)","Mortar (Light)"],"values":[0,1,2,3,4,5,6,7,0,8,6,2,6,2,4,5,0,6,2,6,6,6,5,0,7,7,4,9,7,6,0,5,0,7,1,1,1,0,0,2,10,4,9,11,2,12,13,11,8,14,3,2,14,7,3,11,13,7,15,16,16,16,17,17,5,0,7,18,5,3,19,18,20,7,12,9,9,5,8,5,9,7,5,7,9,8,5,11,0,7,9,8,8,21,21,22,23,5,0,14,4,4,4,4,4,5,0,14,7,18,24,25,26,27,27,9,4,14,20,4,7,4,7,5,0,14,7,20,4,24,7,4,7,11,4,5,0,7,28,13,3,19,17,19,4,6,7,7,0,5,0,7,29,30,5,11,7,24,0,22,11,5,5,5,2,14,5,14,0,31,19,19,3,7,3,19,14,32,3,4,23,12,12,0,3,27,19,17,24,7,33,34,35,36,23,37,38,39,40,9,8,17,15,3,9,19,0,41,5,24,19,42,42,43,43,35,44,45,7,7,7,7,5,7,46,6,43,22,17,0,8,25,39,14,47,23,7,17,36,45,8,17,45,36,3,48,49,16,7,38,0,45,43,47,13,41,3,50,27,23,7,39,13,51,39,47,0,0,17,17,45,36,8,8,40,52,19,48,48,48,48,39,6,38,35,11,4,19,7,0,23,14,39,27,19,53,39,0,45,45,14,10,34]},"Shots1":{"rows":[27,64,89,100,112,115,118,121,124,136,157,160,163,166,172,175,178,188,191,194,197,200,202,205,208,211,214,217,220,226,232,244,247,250,262,265,268,271,274,278,283,286,290,293,296,300,306,309,312,315,317,323,326,329,332,335,339,342,345,348,351,354,357,360,362,365,368,371,374,377,380,383,387,390,393,396,398,401,405,408,411,415,418,421,424,428,436,440,444,448,452,455,458,461,464,466,469,472,475,478,490,493,496,499,502,505,508,511,514,517,521,523,526,529,532,535,541,544,547,550,553,556,559,562,565,568,571,574,577,580,583,592,595,598,601,604,607,610,616,619,622,628,631,637,655,658,661,664,667,670,673,676,679,682,685,688,691,694,697,700,704,707,711,713,716,719,722,728,731,734,737,740,743,746,749,752,755,758,761,764,767,771,774,776,779,782,785,788,793,796,799,802,805,808,811,813,817,820,823,826,830,834,837,840,843,845,848,851,854,857,860,863,866,869,872,875,878,882,885,888,891,894,899,902,905,908,911,914,917,920,924,927,929,932,935,944,947,951,954,957,960,963,966,969,972,975,978,981,987,990,993,996,999,1002,1005,1008,1014,1017,1020,1023,1027,1030,1033,1036,1038,1047,1062,1068,1071,1074,1077,1081,1084,1087,1089,1092,1095,1098,1101,1104,1107,1110,1113,1116,1119,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1152,1155,1158,1174,1177,1179,1182,1185],"values":[4,4,5,4,4,4,4,4,4,4,4,4,4,4,4,4,4,10,5,10,10,10,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,4,4,5,5,10,5,5,5,5,5,4,4,4,4,4,4,5,10,5,5,5,5,5,5,4,4,4,4,4,4,4,4,20,5,5,5,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,4,12,4,4,4,4,4,16,4,4,4,4,4,4,4,4,8,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,1,4,4,4,4,16,4,4,10,5,10,4,8,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,4,4,4,4,4,10,10,5,5,5,5,5,4,5,5,5,5,5,5,5,5,10,4,4,2,4,4,8,8,8,12,12,4,4,5,10,10,10,5,8,16,3,8,12,8,8,8,5,5,4,4,4,4,4,5,5,5,5,5,5,5,4,4,6,4,4,4,12,8,12,4,8,2,8,16,4,4,5,10,10,5,4,4,4,4,8,4,4,10,20,10,4,24,8,4,4,4,8,8,8,4,8,4,4,4,4,4,4,4,4,4,8,4,4,8,5,5,4,4,4]},"Dam1":{"rows":[27,64,89,100,112,115,118,121,124,136,157,160,163,166,172,175,178,188,191,194,197,200,202,205,208,211,214,217,220,226,232,244,247,250,262,265,268,271,274,278,283,286,290,293,296,300,306,309,312,315,317,323,326,329,332,335,339,342,345,348,351,354,357,360,362,365,368,371,374,377,380,383,387,390,393,396,398,401,405,408,411,415,418,421,424,428,436,440,444,448,452,455,458,461,464,466,469,472,475,478,490,493,496,499,502,505,508,511,514,517,521,523,526,529,532,535,541,544,547,550,553,556,559,562,565,568,571,574,577,580,583,592,595,598,601,604,607,610,616,619,622,628,631,637,655,658,661,664,667,670,673,676,679,682,685,688,691,694,697,700,704,707,711,713,716,719,722,728,731,734,737,740,743,746,749,752,755,758,761,764,767,771,774,776,779,782,785,788,793,796,799,802,805,808,811,813,817,820,823,826,830,834,837,840,843,845,848,851,854,857,860,863,866,869,872,875,878,882,885,888,891,894,899,902,905,908,911,914,917,920,924,927,929,932,935,944,947,951,954,957,960,963,966,969,972,975,978,981,987,990,993,996,999,1002,1005,1008,1014,1017,1020,1023,1027,1030,1033,1036,1038,1047,1062,1068,1071,1074,1077,1081,1084,1087,1089,1092,1095,1098,1101,1104,1107,1110,1113,1116,1119,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1152,1155,1158,1174,1177,1179,1182,1185],"dict":["3","1","2","7","5","6","NODAMAGEFIXME","4"],"values":[0,1,1,0,1,2,1,2,0,0,1,1,1,1,1,2,0,1,1,1,1,1,2,0,2,2,1,0,2,1,0,2,0,2,1,1,1,0,0,1,2,1,0,0,1,2,0,0,0,2,0,1,2,2,0,0,0,2,2,3,3,3,4,4,2,0,2,2,2,0,2,2,2,2,2,0,0,2,0,2,0,2,2,2,0,0,2,0,0,2,0,0,0,2,2,1,2,2,0,2,1,1,1,1,1,2,0,2,2,2,1,2,2,2,2,0,1,2,2,1,2,1,2,2,0,2,2,2,1,1,2,1,2,0,1,2,0,2,2,0,0,2,0,2,1,1,2,2,0,2,0,2,4,1,2,0,2,1,0,1,0,2,2,2,1,2,2,2,0,5,2,2,0,2,0,2,2,6,0,1,2,2,2,0,0,2,2,4,1,2,4,7,0,1,2,1,3,0,3,0,0,4,2,0,0,2,0,4,2,1,2,2,2,2,2,0,3,0,2,2,2,2,2,2,4,1,2,1,0,0,0,2,0,2,7,2,2,4,1,0,0,4,0,1,0,4,4,4,2,5,0,0,2,7,0,4,0,2,2,2,2,0,0,2,0,7,0,0,0,4,0,1,0,0,3,2,2,4,4,4,4,0,1,5,0,0,1,2,2,0,2,2,0,2,2,0,0,0,0,0,2,2,7]},"Range1":{"rows":[27,64,89,100,112,115,118,121,124,136,157,160,163,166,172,175,178,188,191,194,197,200,202,205,208,211,214,217,220,226,232,244,247,250,262,265,268,271,274,278,283,286,290,293,296,300,306,309,312,315,317,323,326,329,332,335,339,342,345,348,351,354,357,360,362,365,368,371,374,377,380,383,387,390,393,396,398,401,405,408,411,415,418,421,424,428,436,440,444,448,452,455,458,461,464,466,469,472,475,478,490,493,496,499,502,505,508,511,514,517,521,523,526,529,532,535,541,544,547,550,553,556,559,562,565,568,571,574,577,580,583,592,595,598,601,604,607,610,616,619,622,628,631,637,655,658,661,664,667,670,673,676,679,682,685,688,691,694,697,700,704,707,711,713,716,719,722,728,731,734,737,740,743,746,749,752,755,758,761,764,767,771,774,776,779,782,785,788,793,796,799,802,805,808,811,813,817,820,823,826,830,834,837,840,843,845,848,851,854,857,860,863,866,869,872,875,878,882,885,888,891,894,899,902,905,908,911,914,917,920,924,927,929,932,935,944,947,951,954,957,960,963,966,969,972,975,978,981,987,990,993,996,999,1002,1005,1008,1014,1017,1020,1023,1027,1030,1033,1036,1038,1047,1062,1068,1071,1074,1077,1081,1084,1087,1089,1092,1095,1098,1101,1104,1107,1110,1113,1116,1119,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1152,1155,1158,1174,1177,1179,1182,1185],"dict":["1/2/3","1/2/2","2/4/6","3/5/8","3/6/9","1/2/4","0/1/2","4/8/12","5/10/15","2/5/7","2/4/5","3/8/15","3/7/12","2/3/4","2/5/8","2/2/2","3/5/7","5/9/14","7/14/21","2/5/9"],"values":[0,1,2,2,3,0,0,0,0,4,0,2,0,2,3,0,0,0,2,0,0,0,0,0,0,0,3,0,0,0,0,0,0,0,1,1,1,0,0,2,4,3,0,1,2,5,6,1,4,2,2,2,2,0,2,1,6,0,7,8,8,8,2,2,0,0,0,4,0,2,9,4,4,0,5,0,0,0,4,0,0,0,0,0,0,4,0,1,0,0,0,4,4,7,7,4,2,0,0,2,3,3,3,3,3,0,0,2,0,4,0,7,4,4,4,0,3,2,4,3,0,3,0,0,0,2,0,4,3,0,0,3,0,1,3,0,0,0,7,6,2,9,10,9,3,0,0,0,0,0,0,0,11,10,0,1,0,0,0,4,1,0,0,0,2,2,0,2,0,0,9,9,2,0,2,9,2,12,2,3,2,5,5,0,2,4,9,2,0,0,2,13,2,14,2,15,7,16,17,0,4,2,7,2,0,9,0,18,0,0,9,4,4,4,4,2,19,2,0,0,0,0,0,0,11,0,4,4,10,0,4,7,16,2,2,2,0,2,14,2,4,2,2,14,2,4,18,7,0,2,0,0,4,2,6,18,2,4,4,2,0,16,6,7,16,2,0,0,10,2,0,14,4,4,17,4,9,4,4,4,4,16,0,2,2,1,3,9,0,0,2,2,16,4,9,0,16,0,2,2,2,4,13]},"WepName2":{"rows":[191,197,220,262,265,271,283,290,293,306,329,332,335,348,351,354,357,360,387,390,393,405,408,411,428,436,440,444,448,452,458,461,464,490,521,544,547,598,601,604,607,610,616,664,667,691,697,704,707,711,716,719,737,740,743,746,755,758,771,774,813,820,826,830,834,837,840,843,845,848,854,857,860,869,872,875,882,888,891,924,927,929,932,947,969,1002,1005,1020,1023,1027,1030,1033,1038,1047,1062,1068,1071,1074,1077,1081,1092,1095,1098,1101,1104,1110,1113,1116,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1155,1158,1174,1177,1179,1182],"dict":["Grenade Launcher (Heavy)","SRM 1","Flamer [BA]","Small Pulse Laser","Machine Gun (Light)","Bomb Rack (Micro)","Machine Gun (Medium)","SRM 3 (OS)","Needler (Firedrake)","Rocket Launcher 4","SRM 6 (OS)","Machine Gun (Bearhunter AC)","ER Micro Laser","Machine Gun (Heavy)","BA Recoilless Rifle (Medium)","SRM 4","SRM 2 (OS)","SRM 2","Advanced SRM 2 (OS)","Micro Pulse Laser","SRM 3","Small Laser","Support PPC","SRM 1 (OS)","Battle Armor Taser","SRM 5 (OS)","Gauss Rifle [Magshot]","Gauss Rifle [David]","Rocket Launcher 1","Rocket Launcher 5","LRM 5 (OS)","LRM 3","LRM 4","Advanced SRM 2","LRM 2 (OS)","SRM 4 (OS)","Medium Laser","Tube Artillery (BA)","BA Recoilless Rifle (Light)","Gauss Rifle [King David]","Heavy Flamer [BA]","Gauss Rifle [Anti-personnel Gauss Rifle]","Advanced SRM 5","LRM 5","MRM 1","Rocket Launcher 2","Plasma Rifle (Man-Portable)"],"values":[0,1,2,2,3,2,4,5,6,7,8,9,10,11,12,13,14,15,2,7,7,16,16,16,17,17,17,17,17,17,18,2,19,8,20,16,21,6,16,16,16,16,22,2,23,2,8,23,12,23,24,25,26,27,6,22,28,29,30,31,21,2,4,32,33,11,34,33,35,15,36,37,38,39,24,26,17,20,17,20,40,36,7,9,41,0,6,4,4,25,25,42,8,8,15,43,26,19,26,23,15,44,16,16,16,0,14,2,34,26,45,20,9,16,31,28,24,13,13,7,33,4,26,46]},"Shots2":{"rows":[191,197,220,262,265,271,283,290,293,306,329,332,335,348,351,354,357,360,387,390,393,405,408,411,428,436,440,444,448,452,458,461,464,490,521,544,547,598,601,604,607,610,616,664,667,691,697,704,707,711,716,719,737,740,743,746,755,758,771,774,813,820,826,830,834,837,840,843,845,848,854,857,860,869,872,875,882,888,891,924,927,929,932,947,969,1002,1005,1020,1023,1027,1030,1033,1038,1047,1062,1068,1071,1074,1077,1081,1092,1095,1098,1101,1104,1110,1113,1116,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1155,1158,1174,1177,1179,1182],"values":[10,5,4,4,4,4,4,5,5,15,4,4,16,5,5,5,5,15,5,30,15,10,10,10,10,10,10,10,10,10,5,5,5,4,15,16,4,4,8,8,8,8,4,4,4,4,4,5,5,5,4,16,4,4,4,4,12,4,4,3,4,5,5,3,5,10,2,5,24,12,4,4,4,4,4,4,10,15,10,15,5,4,12,8,5,4,8,4,4,20,20,5,4,4,12,3,4,4,8,5,12,2,16,16,16,8,8,4,2,8,4,12,8,16,2,8,8,4,8,24,10,5,4,4]},"Dam2":{"rows":[191,197,220,262,265,271,283,290,293,306,329,332,335,348,351,354,357,360,387,390,393,405,408,411,428,436,440,444,448,452,458,461,464,490,521,544,547,598,601,604,607,610,616,664,667,691,697,704,707,711,716,719,737,740,743,746,755,758,771,774,813,820,826,830,834,837,840,843,845,848,854,857,860,869,872,875,882,888,891,924,927,929,932,947,969,1002,1005,1020,1023,1027,1030,1033,1038,1047,1062,1068,1071,1074,1077,1081,1092,1095,1098,1101,1104,1110,1113,1116,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1155,1158,1174,1177,1179,1182],"dict":["1","2","3","DAMAGE_VARIABLE","NODAMAGEFIXME","5","4"],"values":[0,1,1,1,2,1,0,3,1,1,0,4,1,2,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,0,1,1,2,1,1,1,1,1,1,1,1,1,0,1,1,1,0,1,1,0,1,1,4,4,5,5,2,1,0,5,1,2,5,1,1,1,5,0,1,0,0,1,1,1,1,1,6,5,1,4,2,0,1,0,0,1,1,1,0,0,1,5,1,2,1,1,1,5,1,1,1,0,2,1,5,1,4,1,4,1,5,4,0,2,2,1,1,0,1,1]},"Range2":{"rows":[191,197,220,262,265,271,283,290,293,306,329,332,335,348,351,354,357,360,387,390,393,405,408,411,428,436,440,444,448,452,458,461,464,490,521,544,547,598,601,604,607,610,616,664,667,691,697,704,707,711,716,719,737,740,743,746,755,758,771,774,813,820,826,830,834,837,840,843,845,848,854,857,860,869,872,875,882,888,891,924,927,929,932,947,969,1002,1005,1020,1023,1027,1030,1033,1038,1047,1062,1068,1071,1074,1077,1081,1092,1095,1098,1101,1104,1110,1113,1116,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1155,1158,1174,1177,1179,1182],"dict":["1/2/3","3/6/9","2/4/6","0/0/0","3/7/12","0/1/2","1/2/4","1/2/2","4/8/12","2/5/7","3/5/8","7/14/21","2/2/2","2/3/4","3/8/15"],"values":[0,1,0,0,0,0,2,3,0,1,0,4,1,5,6,7,2,1,0,1,1,1,1,1,1,1,1,1,1,1,8,0,0,0,1,1,0,0,1,1,1,1,9,0,1,0,0,1,6,1,0,1,1,10,0,9,4,4,11,11,0,0,2,11,8,5,11,8,1,1,1,12,2,1,0,1,1,1,1,1,13,1,1,4,1,0,0,2,2,1,1,8,0,0,1,11,1,0,1,1,1,14,1,1,1,0,2,0,11,1,4,1,4,1,11,4,0,7,7,1,8,2,1,2]},"WepName3":{"rows":[707,758,820,840,1047,1071,1074,1122,1177],"values":["SRM 1 (OS)","Grenade Launcher (Micro)","SRM 5","Advanced SRM 2","Gauss Rifle [Magshot]","SRM 2 (OS)","Gauss Rifle [Magshot]","Battle Armor Taser","SRM 3"]},"Shots3":{"rows":[707,758,820,840,1047,1071,1074,1122,1177],"values":[5,4,20,5,4,8,4,4,30]},"Dam3":{"rows":[707,758,820,840,1047,1071,1074,1122,1177],"values":[2,1,2,2,2,2,2,1,2]},"Range3":{"rows":[707,758,820,840,1047,1071,1074,1122,1177],"dict":["3/6/9","1/2/2","4/8/12","1/2/3"],"values":[0,1,0,2,0,0,0,3,0]},"WepName4":{"rows":[1074],"values":["SRM 2"]},"Shots4":{"rows":[1074],"values":[8]},"Dam4":{"rows":[1074],"values":[2]},"Range4":{"rows":[1074],"values":["3/6/9"]},"CombDam1":{"rows":[27,64,89,100,112,115,118,121,124,136,157,160,163,166,172,175,178,188,191,194,197,200,202,205,208,211,214,217,220,226,232,244,247,250,262,265,268,271,274,278,283,286,290,293,296,300,306,309,312,315,317,323,326,329,332,335,339,342,345,348,351,354,357,360,362,365,368,371,374,377,380,383,387,390,393,396,398,401,405,408,411,415,418,421,424,428,436,440,444,448,452,455,458,461,464,466,469,472,475,478,490,493,496,499,502,505,508,511,514,517,521,523,526,529,532,535,541,544,547,550,553,556,559,562,565,568,571,574,577,580,583,592,595,598,601,604,607,610,616,619,622,628,631,637,655,658,661,664,667,670,673,676,679,682,685,688,691,694,697,700,704,707,711,713,716,719,722,728,731,734,737,740,743,746,749,752,755,758,761,764,767,771,774,776,779,782,785,788,793,796,799,802,805,808,811,813,817,820,823,826,830,834,837,840,843,845,848,851,854,857,860,863,866,869,872,875,878,882,885,888,891,894,899,902,905,908,911,914,917,920,924,927,929,932,935,944,947,951,954,957,960,963,966,969,972,975,978,981,987,990,993,996,999,1002,1005,1008,1014,1017,1020,1023,1027,1030,1033,1036,1038,1047,1062,1068,1071,1074,1077,1081,1084,1087,1089,1092,1095,1098,1101,1104,1107,1110,1113,1116,1119,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1152,1155,1158,1174,1177,1179,1182,1185],"dict":["4x3","4x1","5x1","4x2","10x1","5x3","5x2","10x2","5x7","5x5","20x2","12x2","16x2","8x2","1x5","16x1","10x3","8x1","4x6","4xNODAMAGEFIXME","4x5","5x4","2x5","4x7","3x5","8x3","4x4","6x5","12x3","20x3","24x2","8x5"],"values":[0,1,2,0,1,3,1,3,0,0,1,1,1,1,1,3,0,4,2,4,4,4,3,0,3,3,1,0,3,1,0,3,0,3,1,1,1,0,0,2,3,1,5,5,4,6,5,5,5,6,0,1,3,3,0,0,5,7,6,8,8,8,9,9,3,0,3,3,3,0,3,3,10,6,6,5,0,3,5,6,5,6,6,6,5,5,6,5,5,6,5,5,5,6,6,1,3,3,0,3,1,1,1,1,1,3,0,3,3,3,2,3,11,3,3,0,1,3,12,1,3,1,3,3,0,3,3,13,1,1,3,1,3,0,1,3,0,3,3,0,0,3,0,3,1,1,3,3,0,3,0,3,14,1,3,0,3,15,0,1,16,6,7,3,17,3,3,3,0,18,3,3,0,3,0,3,3,19,0,1,3,6,6,0,0,3,3,20,4,7,9,21,5,2,6,1,8,5,8,5,5,9,6,5,16,3,0,22,3,1,13,13,13,11,11,0,23,5,7,7,7,6,13,12,24,17,11,17,25,25,5,6,0,3,26,3,3,9,2,5,5,9,5,2,0,20,27,20,3,18,28,25,11,26,25,22,25,12,3,3,6,16,16,6,0,26,0,0,25,20,0,4,29,16,23,30,13,20,20,20,31,25,17,18,25,0,1,3,3,0,3,3,0,3,13,0,0,25,5,5,3,3,26]},"CombDam2":{"rows":[191,197,220,262,265,271,283,290,293,306,329,332,335,348,351,354,357,360,387,390,393,405,408,411,428,436,440,444,448,452,458,461,464,490,521,544,547,598,601,604,607,610,616,664,667,691,697,704,707,711,716,719,737,740,743,746,755,758,771,774,813,820,826,830,834,837,840,843,845,848,854,857,860,869,872,875,882,888,891,924,927,929,932,947,969,1002,1005,1020,1023,1027,1030,1033,1038,1047,1062,1068,1071,1074,1077,1081,1092,1095,1098,1101,1104,1110,1113,1116,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1155,1158,1174,1177,1179,1182],"dict":["10x1","5x2","4x2","4x3","4x1","5xDAMAGE_VARIABLE","15x2","4xNODAMAGEFIXME","16x2","5x3","30x2","10x2","8x2","12xNODAMAGEFIXME","4x5","3x5","5x1","10x3","2x5","24x2","12x2","5x4","8xNODAMAGEFIXME","20x2","8x1","8x3"],"values":[0,1,2,2,3,2,4,5,1,6,4,7,8,9,1,9,9,6,1,10,6,11,11,11,11,11,11,11,11,11,1,1,9,4,6,8,3,2,12,12,12,12,2,2,2,2,4,1,1,1,4,8,2,4,2,2,13,7,14,15,3,1,16,15,1,17,18,1,19,20,14,4,2,4,4,2,11,6,11,6,21,14,20,22,9,4,12,4,4,23,23,1,4,4,20,15,2,3,12,1,20,18,8,8,8,24,25,2,18,12,7,20,22,8,18,22,24,3,25,19,11,16,2,2]},"CombDam3":{"rows":[707,758,820,840,1047,1071,1074,1122,1177],"values":["5x2","4x1","20x2","5x2","4x2","8x2","4x2","4x1","30x2"]},"CombDam4":{"rows":[1074],"values":["8x2"]},"Skill0PV":{"values":[10,11,11,18,18,18,18,18,18,16,16,16,9,10,10,11,11,11,11,10,10,9,9,9,9,9,9,11,11,11,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,16,16,16,9,9,9,18,18,18,18,18,18,18,18,18,10,16,16,18,18,18,9,9,9,18,18,18,19,19,19,18,18,18,19,19,19,19,19,19,10,10,10,10,10,10,10,11,11,19,19,19,10,10,10,17,17,17,17,17,17,11,11,11,11,11,16,10,10,10,10,10,11,11,11,11,10,10,10,25,25,25,17,17,17,26,26,26,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,9,9,10,11,11,11,16,16,16,11,11,17,16,16,17,28,28,28,27,27,27,27,27,28,27,27,27,26,26,27,26,26,26,25,25,25,27,27,27,27,27,28,28,28,28,25,25,25,26,26,26,26,26,26,25,25,25,25,25,25,25,25,25,28,28,28,34,34,35,28,28,28,16,16,16,18,18,18,27,27,27,26,26,26,26,26,26,27,27,27,26,26,26,26,26,27,26,26,26,26,26,26,27,27,27,18,18,18,26,26,26,26,26,27,27,27,27,27,27,27,28,28,28,34,34,34,28,28,28,25,25,26,25,25,26,28,28,28,27,27,28,28,28,28,28,25,25,26,25,25,25,27,27,27,27,27,27,35,35,35,29,29,34,34,37,37,27,34,34,29,29,29,28,28,29,26,26,26,34,37,37,27,27,27,34,34,36,34,34,34,35,35,35,20,20,20,20,20,26,20,20,25,29,29,29,29,29,29,26,29,29,26,29,29,25,28,28,27,34,34,28,36,37,36,44,44,29,37,38,29,37,37,27,35,36,26,34,35,26,34,35,26,34,34,27,27,27,27,27,28,34,38,38,27,35,35,27,35,35,27,27,34,35,26,29,29,25,28,28,26,29,29,34,34,37,44,27,28,35,35,28,29,36,36,28,28,35,36,28,28,35,36,27,28,35,35,28,28,35,36,26,29,29,35,43,43,29,37,37,28,36,36,25,25,25,28,28,28,27,27,28,27,27,27,28,28,29,26,26,27,26,26,26,26,26,26,27,27,27,28,28,29,29,29,29,29,29,29,27,27,27,20,26,27,20,26,26,25,27,28,19,25,26,25,27,27,26,29,29,26,29,29,26,29,29,29,29,34,29,29,29,27,27,27,34,34,34,29,29,29,18,20,27,18,20,20,27,35,36,27,34,34,27,27,27,25,29,29,26,29,29,26,29,29,27,34,34,25,28,28,25,29,29,28,28,28,27,27,27,27,27,27,29,29,29,27,27,27,25,25,25,20,20,25,26,29,34,26,29,34,27,34,35,27,34,34,26,29,34,34,37,37,28,35,37,19,25,25,27,29,29,18,20,20,20,26,26,35,35,35,26,26,26,28,28,28,26,26,26,34,37,37,34,37,44,34,37,37,34,37,37,26,26,34,25,25,29,25,25,29,27,34,34,27,27,27,26,29,29,26,29,29,25,28,28,25,29,29,25,29,29,26,29,29,26,29,29,34,34,34,27,35,35,29,29,29,29,29,29,28,28,28,28,28,28,28,29,29,29,27,27,28,27,27,28,27,27,29,26,26,26,26,26,26,27,27,27,26,26,26,18,25,25,26,28,28,26,26,26,26,26,29,20,20,26,26,26,28,19,19,25,19,19,28,29,29,36,26,26,28,28,28,28,29,29,37,19,19,26,34,34,37,28,28,28,34,34,34,29,29,29,29,29,29,34,34,37,11,27,34,35,27,35,35,26,28,35,28,34,34,17,19,20,26,28,28,20,27,27,27,27,27,28,28,38,34,34,44,35,35,38,27,34,35,27,35,35,45,26,36,36,38,28,35,38,34,37,43,28,35,38,27,34,34,29,29,36,29,29,37,34,34,37,29,29,29,28,35,36,36,36,44,25,25,27,27,27,29,26,26,29,20,20,25,28,28,35,28,28,38,27,35,36,34,34,37,27,27,35,26,34,35,35,43,43,34,38,38,28,36,37,28,36,36,28,35,35,35,43,46,27,27,27,29,29,29,20,20,20,36,36,43,37,37,46,38,46,53,27,27,35,34,34,34,26,26,26,29,29,36,27,27,35,25,25,28,34,37,44,34,37,37,34,37,37,34,37,37,34,37,44,34,37,37,34,37,37,19,27,34,34,25,28,35,36,36,44,26,26,29,19,19,19,26,26,27,29,29,29,20,20,25,19,19,19,26,26,29,27,27,28,26,29,34,35,38,38,28,35,38,35,38,38,28,35,38,37,45,45,34,36,36,34,38,45,35,37,43,34,36,45,35,37,44,27,34,34,29,35,36,26,29,36,28,34,36,35,37,44,28,34,37,29,35,36,29,35,36,27,29,36,26,28,35,25,28,35,38,46,53,44,52,55,26,29,34,35,35,37,45,47,54,36,38,38,28,35,38,27,29,36,28,34,36,28,34,36,28,34,36,28,34,36,35,37,44,34,36,37,34,36,37,34,36,37,27,29,34,37,45,45,43,47,54,36,44,44,45,53,54,47,55,55,37,45,52,28,35,38,28,34,36,26,28,28,29,36,37,34,38,43,34,37,38,34,37,37,36,38,45,38,44,52,38,44,52,43,45,55,34,37,37,37,43,46,28,35,35,26,29,29,34,37,37]},"Skill1PV":{"values":[9,10,10,16,16,16,16,16,16,14,14,14,8,9,9,10,10,10,10,9,9,8,8,8,8,8,8,10,10,10,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,14,14,14,8,8,8,16,16,16,16,16,16,16,16,16,9,14,14,16,16,16,8,8,8,16,16,16,17,17,17,16,16,16,17,17,17,17,17,17,9,9,9,9,9,9,9,10,10,17,17,17,9,9,9,15,15,15,15,15,15,10,10,10,10,10,14,9,9,9,9,9,10,10,10,10,9,9,9,22,22,22,15,15,15,23,23,23,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,8,8,9,10,10,10,14,14,14,10,10,15,14,14,15,25,25,25,24,24,24,24,24,25,24,24,24,23,23,24,23,23,23,22,22,22,24,24,24,24,24,25,25,25,25,22,22,22,23,23,23,23,23,23,22,22,22,22,22,22,22,22,22,25,25,25,30,30,31,25,25,25,14,14,14,16,16,16,24,24,24,23,23,23,23,23,23,24,24,24,23,23,23,23,23,24,23,23,23,23,23,23,24,24,24,16,16,16,23,23,23,23,23,24,24,24,24,24,24,24,25,25,25,30,30,30,25,25,25,22,22,23,22,22,23,25,25,25,24,24,25,25,25,25,25,22,22,23,22,22,22,24,24,24,24,24,24,31,31,31,26,26,30,30,33,33,24,30,30,26,26,26,25,25,26,23,23,23,30,33,33,24,24,24,30,30,32,30,30,30,31,31,31,18,18,18,18,18,23,18,18,22,26,26,26,26,26,26,23,26,26,23,26,26,22,25,25,24,30,30,25,32,33,32,39,39,26,33,34,26,33,33,24,31,32,23,30,31,23,30,31,23,30,30,24,24,24,24,24,25,30,34,34,24,31,31,24,31,31,24,24,30,31,23,26,26,22,25,25,23,26,26,30,30,33,39,24,25,31,31,25,26,32,32,25,25,31,32,25,25,31,32,24,25,31,31,25,25,31,32,23,26,26,31,38,38,26,33,33,25,32,32,22,22,22,25,25,25,24,24,25,24,24,24,25,25,26,23,23,24,23,23,23,23,23,23,24,24,24,25,25,26,26,26,26,26,26,26,24,24,24,18,23,24,18,23,23,22,24,25,17,22,23,22,24,24,23,26,26,23,26,26,23,26,26,26,26,30,26,26,26,24,24,24,30,30,30,26,26,26,16,18,24,16,18,18,24,31,32,24,30,30,24,24,24,22,26,26,23,26,26,23,26,26,24,30,30,22,25,25,22,26,26,25,25,25,24,24,24,24,24,24,26,26,26,24,24,24,22,22,22,18,18,22,23,26,30,23,26,30,24,30,31,24,30,30,23,26,30,30,33,33,25,31,33,17,22,22,24,26,26,16,18,18,18,23,23,31,31,31,23,23,23,25,25,25,23,23,23,30,33,33,30,33,39,30,33,33,30,33,33,23,23,30,22,22,26,22,22,26,24,30,30,24,24,24,23,26,26,23,26,26,22,25,25,22,26,26,22,26,26,23,26,26,23,26,26,30,30,30,24,31,31,26,26,26,26,26,26,25,25,25,25,25,25,25,26,26,26,24,24,25,24,24,25,24,24,26,23,23,23,23,23,23,24,24,24,23,23,23,16,22,22,23,25,25,23,23,23,23,23,26,18,18,23,23,23,25,17,17,22,17,17,25,26,26,32,23,23,25,25,25,25,26,26,33,17,17,23,30,30,33,25,25,25,30,30,30,26,26,26,26,26,26,30,30,33,10,24,30,31,24,31,31,23,25,31,25,30,30,15,17,18,23,25,25,18,24,24,24,24,24,25,25,34,30,30,39,31,31,34,24,30,31,24,31,31,40,23,32,32,34,25,31,34,30,33,38,25,31,34,24,30,30,26,26,32,26,26,33,30,30,33,26,26,26,25,31,32,32,32,39,22,22,24,24,24,26,23,23,26,18,18,22,25,25,31,25,25,34,24,31,32,30,30,33,24,24,31,23,30,31,31,38,38,30,34,34,25,32,33,25,32,32,25,31,31,31,38,41,24,24,24,26,26,26,18,18,18,32,32,38,33,33,41,34,41,47,24,24,31,30,30,30,23,23,23,26,26,32,24,24,31,22,22,25,30,33,39,30,33,33,30,33,33,30,33,33,30,33,39,30,33,33,30,33,33,17,24,30,30,22,25,31,32,32,39,23,23,26,17,17,17,23,23,24,26,26,26,18,18,22,17,17,17,23,23,26,24,24,25,23,26,30,31,34,34,25,31,34,31,34,34,25,31,34,33,40,40,30,32,32,30,34,40,31,33,38,30,32,40,31,33,39,24,30,30,26,31,32,23,26,32,25,30,32,31,33,39,25,30,33,26,31,32,26,31,32,24,26,32,23,25,31,22,25,31,34,41,47,39,46,49,23,26,30,31,31,33,40,42,48,32,34,34,25,31,34,24,26,32,25,30,32,25,30,32,25,30,32,25,30,32,31,33,39,30,32,33,30,32,33,30,32,33,24,26,30,33,40,40,38,42,48,32,39,39,40,47,48,42,49,49,33,40,46,25,31,34,25,30,32,23,25,25,26,32,33,30,34,38,30,33,34,30,33,33,32,34,40,34,39,46,34,39,46,38,40,49,30,33,33,33,38,41,25,31,31,23,26,26,30,33,33]},"Skill2PV":{"values":[8,9,9,14,14,14,14,14,14,12,12,12,7,8,8,9,9,9,9,8,8,7,7,7,7,7,7,9,9,9,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,12,12,12,7,7,7,14,14,14,14,14,14,14,14,14,8,12,12,14,14,14,7,7,7,14,14,14,15,15,15,14,14,14,15,15,15,15,15,15,8,8,8,8,8,8,8,9,9,15,15,15,8,8,8,13,13,13,13,13,13,9,9,9,9,9,12,8,8,8,8,8,9,9,9,9,8,8,8,19,19,19,13,13,13,20,20,20,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,7,7,8,9,9,9,12,12,12,9,9,13,12,12,13,22,22,22,21,21,21,21,21,22,21,21,21,20,20,21,20,20,20,19,19,19,21,21,21,21,21,22,22,22,22,19,19,19,20,20,20,20,20,20,19,19,19,19,19,19,19,19,19,22,22,22,26,26,27,22,22,22,12,12,12,14,14,14,21,21,21,20,20,20,20,20,20,21,21,21,20,20,20,20,20,21,20,20,20,20,20,20,21,21,21,14,14,14,20,20,20,20,20,21,21,21,21,21,21,21,22,22,22,26,26,26,22,22,22,19,19,20,19,19,20,22,22,22,21,21,22,22,22,22,22,19,19,20,19,19,19,21,21,21,21,21,21,27,27,27,23,23,26,26,29,29,21,26,26,23,23,23,22,22,23,20,20,20,26,29,29,21,21,21,26,26,28,26,26,26,27,27,27,16,16,16,16,16,20,16,16,19,23,23,23,23,23,23,20,23,23,20,23,23,19,22,22,21,26,26,22,28,29,28,34,34,23,29,30,23,29,29,21,27,28,20,26,27,20,26,27,20,26,26,21,21,21,21,21,22,26,30,30,21,27,27,21,27,27,21,21,26,27,20,23,23,19,22,22,20,23,23,26,26,29,34,21,22,27,27,22,23,28,28,22,22,27,28,22,22,27,28,21,22,27,27,22,22,27,28,20,23,23,27,33,33,23,29,29,22,28,28,19,19,19,22,22,22,21,21,22,21,21,21,22,22,23,20,20,21,20,20,20,20,20,20,21,21,21,22,22,23,23,23,23,23,23,23,21,21,21,16,20,21,16,20,20,19,21,22,15,19,20,19,21,21,20,23,23,20,23,23,20,23,23,23,23,26,23,23,23,21,21,21,26,26,26,23,23,23,14,16,21,14,16,16,21,27,28,21,26,26,21,21,21,19,23,23,20,23,23,20,23,23,21,26,26,19,22,22,19,23,23,22,22,22,21,21,21,21,21,21,23,23,23,21,21,21,19,19,19,16,16,19,20,23,26,20,23,26,21,26,27,21,26,26,20,23,26,26,29,29,22,27,29,15,19,19,21,23,23,14,16,16,16,20,20,27,27,27,20,20,20,22,22,22,20,20,20,26,29,29,26,29,34,26,29,29,26,29,29,20,20,26,19,19,23,19,19,23,21,26,26,21,21,21,20,23,23,20,23,23,19,22,22,19,23,23,19,23,23,20,23,23,20,23,23,26,26,26,21,27,27,23,23,23,23,23,23,22,22,22,22,22,22,22,23,23,23,21,21,22,21,21,22,21,21,23,20,20,20,20,20,20,21,21,21,20,20,20,14,19,19,20,22,22,20,20,20,20,20,23,16,16,20,20,20,22,15,15,19,15,15,22,23,23,28,20,20,22,22,22,22,23,23,29,15,15,20,26,26,29,22,22,22,26,26,26,23,23,23,23,23,23,26,26,29,9,21,26,27,21,27,27,20,22,27,22,26,26,13,15,16,20,22,22,16,21,21,21,21,21,22,22,30,26,26,34,27,27,30,21,26,27,21,27,27,35,20,28,28,30,22,27,30,26,29,33,22,27,30,21,26,26,23,23,28,23,23,29,26,26,29,23,23,23,22,27,28,28,28,34,19,19,21,21,21,23,20,20,23,16,16,19,22,22,27,22,22,30,21,27,28,26,26,29,21,21,27,20,26,27,27,33,33,26,30,30,22,28,29,22,28,28,22,27,27,27,33,36,21,21,21,23,23,23,16,16,16,28,28,33,29,29,36,30,36,41,21,21,27,26,26,26,20,20,20,23,23,28,21,21,27,19,19,22,26,29,34,26,29,29,26,29,29,26,29,29,26,29,34,26,29,29,26,29,29,15,21,26,26,19,22,27,28,28,34,20,20,23,15,15,15,20,20,21,23,23,23,16,16,19,15,15,15,20,20,23,21,21,22,20,23,26,27,30,30,22,27,30,27,30,30,22,27,30,29,35,35,26,28,28,26,30,35,27,29,33,26,28,35,27,29,34,21,26,26,23,27,28,20,23,28,22,26,28,27,29,34,22,26,29,23,27,28,23,27,28,21,23,28,20,22,27,19,22,27,30,36,41,34,40,43,20,23,26,27,27,29,35,37,42,28,30,30,22,27,30,21,23,28,22,26,28,22,26,28,22,26,28,22,26,28,27,29,34,26,28,29,26,28,29,26,28,29,21,23,26,29,35,35,33,37,42,28,34,34,35,41,42,37,43,43,29,35,40,22,27,30,22,26,28,20,22,22,23,28,29,26,30,33,26,29,30,26,29,29,28,30,35,30,34,40,30,34,40,33,35,43,26,29,29,29,33,36,22,27,27,20,23,23,26,29,29]},"Skill3PV":{"values":[7,8,8,12,12,12,12,12,12,10,10,10,6,7,7,8,8,8,8,7,7,6,6,6,6,6,6,8,8,8,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,10,10,10,6,6,6,12,12,12,12,12,12,12,12,12,7,10,10,12,12,12,6,6,6,12,12,12,13,13,13,12,12,12,13,13,13,13,13,13,7,7,7,7,7,7,7,8,8,13,13,13,7,7,7,11,11,11,11,11,11,8,8,8,8,8,10,7,7,7,7,7,8,8,8,8,7,7,7,16,16,16,11,11,11,17,17,17,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,6,6,7,8,8,8,10,10,10,8,8,11,10,10,11,19,19,19,18,18,18,18,18,19,18,18,18,17,17,18,17,17,17,16,16,16,18,18,18,18,18,19,19,19,19,16,16,16,17,17,17,17,17,17,16,16,16,16,16,16,16,16,16,19,19,19,22,22,23,19,19,19,10,10,10,12,12,12,18,18,18,17,17,17,17,17,17,18,18,18,17,17,17,17,17,18,17,17,17,17,17,17,18,18,18,12,12,12,17,17,17,17,17,18,18,18,18,18,18,18,19,19,19,22,22,22,19,19,19,16,16,17,16,16,17,19,19,19,18,18,19,19,19,19,19,16,16,17,16,16,16,18,18,18,18,18,18,23,23,23,20,20,22,22,25,25,18,22,22,20,20,20,19,19,20,17,17,17,22,25,25,18,18,18,22,22,24,22,22,22,23,23,23,14,14,14,14,14,17,14,14,16,20,20,20,20,20,20,17,20,20,17,20,20,16,19,19,18,22,22,19,24,25,24,29,29,20,25,26,20,25,25,18,23,24,17,22,23,17,22,23,17,22,22,18,18,18,18,18,19,22,26,26,18,23,23,18,23,23,18,18,22,23,17,20,20,16,19,19,17,20,20,22,22,25,29,18,19,23,23,19,20,24,24,19,19,23,24,19,19,23,24,18,19,23,23,19,19,23,24,17,20,20,23,28,28,20,25,25,19,24,24,16,16,16,19,19,19,18,18,19,18,18,18,19,19,20,17,17,18,17,17,17,17,17,17,18,18,18,19,19,20,20,20,20,20,20,20,18,18,18,14,17,18,14,17,17,16,18,19,13,16,17,16,18,18,17,20,20,17,20,20,17,20,20,20,20,22,20,20,20,18,18,18,22,22,22,20,20,20,12,14,18,12,14,14,18,23,24,18,22,22,18,18,18,16,20,20,17,20,20,17,20,20,18,22,22,16,19,19,16,20,20,19,19,19,18,18,18,18,18,18,20,20,20,18,18,18,16,16,16,14,14,16,17,20,22,17,20,22,18,22,23,18,22,22,17,20,22,22,25,25,19,23,25,13,16,16,18,20,20,12,14,14,14,17,17,23,23,23,17,17,17,19,19,19,17,17,17,22,25,25,22,25,29,22,25,25,22,25,25,17,17,22,16,16,20,16,16,20,18,22,22,18,18,18,17,20,20,17,20,20,16,19,19,16,20,20,16,20,20,17,20,20,17,20,20,22,22,22,18,23,23,20,20,20,20,20,20,19,19,19,19,19,19,19,20,20,20,18,18,19,18,18,19,18,18,20,17,17,17,17,17,17,18,18,18,17,17,17,12,16,16,17,19,19,17,17,17,17,17,20,14,14,17,17,17,19,13,13,16,13,13,19,20,20,24,17,17,19,19,19,19,20,20,25,13,13,17,22,22,25,19,19,19,22,22,22,20,20,20,20,20,20,22,22,25,8,18,22,23,18,23,23,17,19,23,19,22,22,11,13,14,17,19,19,14,18,18,18,18,18,19,19,26,22,22,29,23,23,26,18,22,23,18,23,23,30,17,24,24,26,19,23,26,22,25,28,19,23,26,18,22,22,20,20,24,20,20,25,22,22,25,20,20,20,19,23,24,24,24,29,16,16,18,18,18,20,17,17,20,14,14,16,19,19,23,19,19,26,18,23,24,22,22,25,18,18,23,17,22,23,23,28,28,22,26,26,19,24,25,19,24,24,19,23,23,23,28,31,18,18,18,20,20,20,14,14,14,24,24,28,25,25,31,26,31,35,18,18,23,22,22,22,17,17,17,20,20,24,18,18,23,16,16,19,22,25,29,22,25,25,22,25,25,22,25,25,22,25,29,22,25,25,22,25,25,13,18,22,22,16,19,23,24,24,29,17,17,20,13,13,13,17,17,18,20,20,20,14,14,16,13,13,13,17,17,20,18,18,19,17,20,22,23,26,26,19,23,26,23,26,26,19,23,26,25,30,30,22,24,24,22,26,30,23,25,28,22,24,30,23,25,29,18,22,22,20,23,24,17,20,24,19,22,24,23,25,29,19,22,25,20,23,24,20,23,24,18,20,24,17,19,23,16,19,23,26,31,35,29,34,37,17,20,22,23,23,25,30,32,36,24,26,26,19,23,26,18,20,24,19,22,24,19,22,24,19,22,24,19,22,24,23,25,29,22,24,25,22,24,25,22,24,25,18,20,22,25,30,30,28,32,36,24,29,29,30,35,36,32,37,37,25,30,34,19,23,26,19,22,24,17,19,19,20,24,25,22,26,28,22,25,26,22,25,25,24,26,30,26,29,34,26,29,34,28,30,37,22,25,25,25,28,31,19,23,23,17,20,20,22,25,25]},"Skill4PV":{"values":[6,7,7,10,10,10,10,10,10,8,8,8,5,6,6,7,7,7,7,6,6,5,5,5,5,5,5,7,7,7,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,8,8,8,5,5,5,10,10,10,10,10,10,10,10,10,6,8,8,10,10,10,5,5,5,10,10,10,11,11,11,10,10,10,11,11,11,11,11,11,6,6,6,6,6,6,6,7,7,11,11,11,6,6,6,9,9,9,9,9,9,7,7,7,7,7,8,6,6,6,6,6,7,7,7,7,6,6,6,13,13,13,9,9,9,14,14,14,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,5,5,6,7,7,7,8,8,8,7,7,9,8,8,9,16,16,16,15,15,15,15,15,16,15,15,15,14,14,15,14,14,14,13,13,13,15,15,15,15,15,16,16,16,16,13,13,13,14,14,14,14,14,14,13,13,13,13,13,13,13,13,13,16,16,16,18,18,19,16,16,16,8,8,8,10,10,10,15,15,15,14,14,14,14,14,14,15,15,15,14,14,14,14,14,15,14,14,14,14,14,14,15,15,15,10,10,10,14,14,14,14,14,15,15,15,15,15,15,15,16,16,16,18,18,18,16,16,16,13,13,14,13,13,14,16,16,16,15,15,16,16,16,16,16,13,13,14,13,13,13,15,15,15,15,15,15,19,19,19,17,17,18,18,21,21,15,18,18,17,17,17,16,16,17,14,14,14,18,21,21,15,15,15,18,18,20,18,18,18,19,19,19,12,12,12,12,12,14,12,12,13,17,17,17,17,17,17,14,17,17,14,17,17,13,16,16,15,18,18,16,20,21,20,24,24,17,21,22,17,21,21,15,19,20,14,18,19,14,18,19,14,18,18,15,15,15,15,15,16,18,22,22,15,19,19,15,19,19,15,15,18,19,14,17,17,13,16,16,14,17,17,18,18,21,24,15,16,19,19,16,17,20,20,16,16,19,20,16,16,19,20,15,16,19,19,16,16,19,20,14,17,17,19,23,23,17,21,21,16,20,20,13,13,13,16,16,16,15,15,16,15,15,15,16,16,17,14,14,15,14,14,14,14,14,14,15,15,15,16,16,17,17,17,17,17,17,17,15,15,15,12,14,15,12,14,14,13,15,16,11,13,14,13,15,15,14,17,17,14,17,17,14,17,17,17,17,18,17,17,17,15,15,15,18,18,18,17,17,17,10,12,15,10,12,12,15,19,20,15,18,18,15,15,15,13,17,17,14,17,17,14,17,17,15,18,18,13,16,16,13,17,17,16,16,16,15,15,15,15,15,15,17,17,17,15,15,15,13,13,13,12,12,13,14,17,18,14,17,18,15,18,19,15,18,18,14,17,18,18,21,21,16,19,21,11,13,13,15,17,17,10,12,12,12,14,14,19,19,19,14,14,14,16,16,16,14,14,14,18,21,21,18,21,24,18,21,21,18,21,21,14,14,18,13,13,17,13,13,17,15,18,18,15,15,15,14,17,17,14,17,17,13,16,16,13,17,17,13,17,17,14,17,17,14,17,17,18,18,18,15,19,19,17,17,17,17,17,17,16,16,16,16,16,16,16,17,17,17,15,15,16,15,15,16,15,15,17,14,14,14,14,14,14,15,15,15,14,14,14,10,13,13,14,16,16,14,14,14,14,14,17,12,12,14,14,14,16,11,11,13,11,11,16,17,17,20,14,14,16,16,16,16,17,17,21,11,11,14,18,18,21,16,16,16,18,18,18,17,17,17,17,17,17,18,18,21,7,15,18,19,15,19,19,14,16,19,16,18,18,9,11,12,14,16,16,12,15,15,15,15,15,16,16,22,18,18,24,19,19,22,15,18,19,15,19,19,25,14,20,20,22,16,19,22,18,21,23,16,19,22,15,18,18,17,17,20,17,17,21,18,18,21,17,17,17,16,19,20,20,20,24,13,13,15,15,15,17,14,14,17,12,12,13,16,16,19,16,16,22,15,19,20,18,18,21,15,15,19,14,18,19,19,23,23,18,22,22,16,20,21,16,20,20,16,19,19,19,23,26,15,15,15,17,17,17,12,12,12,20,20,23,21,21,26,22,26,29,15,15,19,18,18,18,14,14,14,17,17,20,15,15,19,13,13,16,18,21,24,18,21,21,18,21,21,18,21,21,18,21,24,18,21,21,18,21,21,11,15,18,18,13,16,19,20,20,24,14,14,17,11,11,11,14,14,15,17,17,17,12,12,13,11,11,11,14,14,17,15,15,16,14,17,18,19,22,22,16,19,22,19,22,22,16,19,22,21,25,25,18,20,20,18,22,25,19,21,23,18,20,25,19,21,24,15,18,18,17,19,20,14,17,20,16,18,20,19,21,24,16,18,21,17,19,20,17,19,20,15,17,20,14,16,19,13,16,19,22,26,29,24,28,31,14,17,18,19,19,21,25,27,30,20,22,22,16,19,22,15,17,20,16,18,20,16,18,20,16,18,20,16,18,20,19,21,24,18,20,21,18,20,21,18,20,21,15,17,18,21,25,25,23,27,30,20,24,24,25,29,30,27,31,31,21,25,28,16,19,22,16,18,20,14,16,16,17,20,21,18,22,23,18,21,22,18,21,21,20,22,25,22,24,28,22,24,28,23,25,31,18,21,21,21,23,26,16,19,19,14,17,17,18,21,21]},"Skill5PV":{"values":[5,6,6,9,9,9,9,9,9,7,7,7,4,5,5,6,6,6,6,5,5,4,4,4,4,4,4,6,6,6,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,7,7,7,4,4,4,9,9,9,9,9,9,9,9,9,5,7,7,9,9,9,4,4,4,9,9,9,10,10,10,9,9,9,10,10,10,10,10,10,5,5,5,5,5,5,5,6,6,10,10,10,5,5,5,8,8,8,8,8,8,6,6,6,6,6,7,5,5,5,5,5,6,6,6,6,5,5,5,12,12,12,8,8,8,13,13,13,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,4,4,5,6,6,6,7,7,7,6,6,8,7,7,8,14,14,14,13,13,13,13,13,14,13,13,13,13,13,13,13,13,13,12,12,12,13,13,13,13,13,14,14,14,14,12,12,12,13,13,13,13,13,13,12,12,12,12,12,12,12,12,12,14,14,14,16,16,17,14,14,14,7,7,7,9,9,9,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,9,9,9,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,16,16,16,14,14,14,12,12,13,12,12,13,14,14,14,13,13,14,14,14,14,14,12,12,13,12,12,12,13,13,13,13,13,13,17,17,17,15,15,16,16,19,19,13,16,16,15,15,15,14,14,15,13,13,13,16,19,19,13,13,13,16,16,18,16,16,16,17,17,17,11,11,11,11,11,13,11,11,12,15,15,15,15,15,15,13,15,15,13,15,15,12,14,14,13,16,16,14,18,19,18,22,22,15,19,20,15,19,19,13,17,18,13,16,17,13,16,17,13,16,16,13,13,13,13,13,14,16,20,20,13,17,17,13,17,17,13,13,16,17,13,15,15,12,14,14,13,15,15,16,16,19,22,13,14,17,17,14,15,18,18,14,14,17,18,14,14,17,18,13,14,17,17,14,14,17,18,13,15,15,17,21,21,15,19,19,14,18,18,12,12,12,14,14,14,13,13,14,13,13,13,14,14,15,13,13,13,13,13,13,13,13,13,13,13,13,14,14,15,15,15,15,15,15,15,13,13,13,11,13,13,11,13,13,12,13,14,10,12,13,12,13,13,13,15,15,13,15,15,13,15,15,15,15,16,15,15,15,13,13,13,16,16,16,15,15,15,9,11,13,9,11,11,13,17,18,13,16,16,13,13,13,12,15,15,13,15,15,13,15,15,13,16,16,12,14,14,12,15,15,14,14,14,13,13,13,13,13,13,15,15,15,13,13,13,12,12,12,11,11,12,13,15,16,13,15,16,13,16,17,13,16,16,13,15,16,16,19,19,14,17,19,10,12,12,13,15,15,9,11,11,11,13,13,17,17,17,13,13,13,14,14,14,13,13,13,16,19,19,16,19,22,16,19,19,16,19,19,13,13,16,12,12,15,12,12,15,13,16,16,13,13,13,13,15,15,13,15,15,12,14,14,12,15,15,12,15,15,13,15,15,13,15,15,16,16,16,13,17,17,15,15,15,15,15,15,14,14,14,14,14,14,14,15,15,15,13,13,14,13,13,14,13,13,15,13,13,13,13,13,13,13,13,13,13,13,13,9,12,12,13,14,14,13,13,13,13,13,15,11,11,13,13,13,14,10,10,12,10,10,14,15,15,18,13,13,14,14,14,14,15,15,19,10,10,13,16,16,19,14,14,14,16,16,16,15,15,15,15,15,15,16,16,19,6,13,16,17,13,17,17,13,14,17,14,16,16,8,10,11,13,14,14,11,13,13,13,13,13,14,14,20,16,16,22,17,17,20,13,16,17,13,17,17,22,13,18,18,20,14,17,20,16,19,21,14,17,20,13,16,16,15,15,18,15,15,19,16,16,19,15,15,15,14,17,18,18,18,22,12,12,13,13,13,15,13,13,15,11,11,12,14,14,17,14,14,20,13,17,18,16,16,19,13,13,17,13,16,17,17,21,21,16,20,20,14,18,19,14,18,18,14,17,17,17,21,23,13,13,13,15,15,15,11,11,11,18,18,21,19,19,23,20,23,26,13,13,17,16,16,16,13,13,13,15,15,18,13,13,17,12,12,14,16,19,22,16,19,19,16,19,19,16,19,19,16,19,22,16,19,19,16,19,19,10,13,16,16,12,14,17,18,18,22,13,13,15,10,10,10,13,13,13,15,15,15,11,11,12,10,10,10,13,13,15,13,13,14,13,15,16,17,20,20,14,17,20,17,20,20,14,17,20,19,22,22,16,18,18,16,20,22,17,19,21,16,18,22,17,19,22,13,16,16,15,17,18,13,15,18,14,16,18,17,19,22,14,16,19,15,17,18,15,17,18,13,15,18,13,14,17,12,14,17,20,23,26,22,25,28,13,15,16,17,17,19,22,24,27,18,20,20,14,17,20,13,15,18,14,16,18,14,16,18,14,16,18,14,16,18,17,19,22,16,18,19,16,18,19,16,18,19,13,15,16,19,22,22,21,24,27,18,22,22,22,26,27,24,28,28,19,22,25,14,17,20,14,16,18,13,14,14,15,18,19,16,20,21,16,19,20,16,19,19,18,20,22,20,22,25,20,22,25,21,22,28,16,19,19,19,21,23,14,17,17,13,15,15,16,19,19]},"Skill6PV":{"values":[4,5,5,8,8,8,8,8,8,6,6,6,3,4,4,5,5,5,5,4,4,3,3,3,3,3,3,5,5,5,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,6,6,6,3,3,3,8,8,8,8,8,8,8,8,8,4,6,6,8,8,8,3,3,3,8,8,8,9,9,9,8,8,8,9,9,9,9,9,9,4,4,4,4,4,4,4,5,5,9,9,9,4,4,4,7,7,7,7,7,7,5,5,5,5,5,6,4,4,4,4,4,5,5,5,5,4,4,4,11,11,11,7,7,7,12,12,12,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,3,3,4,5,5,5,6,6,6,5,5,7,6,6,7,12,12,12,11,11,11,11,11,12,11,11,11,12,12,11,12,12,12,11,11,11,11,11,11,11,11,12,12,12,12,11,11,11,12,12,12,12,12,12,11,11,11,11,11,11,11,11,11,12,12,12,14,14,15,12,12,12,6,6,6,8,8,8,11,11,11,12,12,12,12,12,12,11,11,11,12,12,12,12,12,11,12,12,12,12,12,12,11,11,11,8,8,8,12,12,12,12,12,11,11,11,11,11,11,11,12,12,12,14,14,14,12,12,12,11,11,12,11,11,12,12,12,12,11,11,12,12,12,12,12,11,11,12,11,11,11,11,11,11,11,11,11,15,15,15,13,13,14,14,17,17,11,14,14,13,13,13,12,12,13,12,12,12,14,17,17,11,11,11,14,14,16,14,14,14,15,15,15,10,10,10,10,10,12,10,10,11,13,13,13,13,13,13,12,13,13,12,13,13,11,12,12,11,14,14,12,16,17,16,20,20,13,17,18,13,17,17,11,15,16,12,14,15,12,14,15,12,14,14,11,11,11,11,11,12,14,18,18,11,15,15,11,15,15,11,11,14,15,12,13,13,11,12,12,12,13,13,14,14,17,20,11,12,15,15,12,13,16,16,12,12,15,16,12,12,15,16,11,12,15,15,12,12,15,16,12,13,13,15,19,19,13,17,17,12,16,16,11,11,11,12,12,12,11,11,12,11,11,11,12,12,13,12,12,11,12,12,12,12,12,12,11,11,11,12,12,13,13,13,13,13,13,13,11,11,11,10,12,11,10,12,12,11,11,12,9,11,12,11,11,11,12,13,13,12,13,13,12,13,13,13,13,14,13,13,13,11,11,11,14,14,14,13,13,13,8,10,11,8,10,10,11,15,16,11,14,14,11,11,11,11,13,13,12,13,13,12,13,13,11,14,14,11,12,12,11,13,13,12,12,12,11,11,11,11,11,11,13,13,13,11,11,11,11,11,11,10,10,11,12,13,14,12,13,14,11,14,15,11,14,14,12,13,14,14,17,17,12,15,17,9,11,11,11,13,13,8,10,10,10,12,12,15,15,15,12,12,12,12,12,12,12,12,12,14,17,17,14,17,20,14,17,17,14,17,17,12,12,14,11,11,13,11,11,13,11,14,14,11,11,11,12,13,13,12,13,13,11,12,12,11,13,13,11,13,13,12,13,13,12,13,13,14,14,14,11,15,15,13,13,13,13,13,13,12,12,12,12,12,12,12,13,13,13,11,11,12,11,11,12,11,11,13,12,12,12,12,12,12,11,11,11,12,12,12,8,11,11,12,12,12,12,12,12,12,12,13,10,10,12,12,12,12,9,9,11,9,9,12,13,13,16,12,12,12,12,12,12,13,13,17,9,9,12,14,14,17,12,12,12,14,14,14,13,13,13,13,13,13,14,14,17,5,11,14,15,11,15,15,12,12,15,12,14,14,7,9,10,12,12,12,10,11,11,11,11,11,12,12,18,14,14,20,15,15,18,11,14,15,11,15,15,19,12,16,16,18,12,15,18,14,17,19,12,15,18,11,14,14,13,13,16,13,13,17,14,14,17,13,13,13,12,15,16,16,16,20,11,11,11,11,11,13,12,12,13,10,10,11,12,12,15,12,12,18,11,15,16,14,14,17,11,11,15,12,14,15,15,19,19,14,18,18,12,16,17,12,16,16,12,15,15,15,19,20,11,11,11,13,13,13,10,10,10,16,16,19,17,17,20,18,20,23,11,11,15,14,14,14,12,12,12,13,13,16,11,11,15,11,11,12,14,17,20,14,17,17,14,17,17,14,17,17,14,17,20,14,17,17,14,17,17,9,11,14,14,11,12,15,16,16,20,12,12,13,9,9,9,12,12,11,13,13,13,10,10,11,9,9,9,12,12,13,11,11,12,12,13,14,15,18,18,12,15,18,15,18,18,12,15,18,17,19,19,14,16,16,14,18,19,15,17,19,14,16,19,15,17,20,11,14,14,13,15,16,12,13,16,12,14,16,15,17,20,12,14,17,13,15,16,13,15,16,11,13,16,12,12,15,11,12,15,18,20,23,20,22,25,12,13,14,15,15,17,19,21,24,16,18,18,12,15,18,11,13,16,12,14,16,12,14,16,12,14,16,12,14,16,15,17,20,14,16,17,14,16,17,14,16,17,11,13,14,17,19,19,19,21,24,16,20,20,19,23,24,21,25,25,17,19,22,12,15,18,12,14,16,12,12,12,13,16,17,14,18,19,14,17,18,14,17,17,16,18,19,18,20,22,18,20,22,19,19,25,14,17,17,17,19,20,12,15,15,12,13,13,14,17,17]},"Skill7PV":{"values":[3,4,4,7,7,7,7,7,7,5,5,5,2,3,3,4,4,4,4,3,3,2,2,2,2,2,2,4,4,4,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,5,5,5,2,2,2,7,7,7,7,7,7,7,7,7,3,5,5,7,7,7,2,2,2,7,7,7,8,8,8,7,7,7,8,8,8,8,8,8,3,3,3,3,3,3,3,4,4,8,8,8,3,3,3,6,6,6,6,6,6,4,4,4,4,4,5,3,3,3,3,3,4,4,4,4,3,3,3,10,10,10,6,6,6,11,11,11,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,2,2,3,4,4,4,5,5,5,4,4,6,5,5,6,10,10,10,9,9,9,9,9,10,9,9,9,11,11,9,11,11,11,10,10,10,9,9,9,9,9,10,10,10,10,10,10,10,11,11,11,11,11,11,10,10,10,10,10,10,10,10,10,10,10,10,12,12,13,10,10,10,5,5,5,7,7,7,9,9,9,11,11,11,11,11,11,9,9,9,11,11,11,11,11,9,11,11,11,11,11,11,9,9,9,7,7,7,11,11,11,11,11,9,9,9,9,9,9,9,10,10,10,12,12,12,10,10,10,10,10,11,10,10,11,10,10,10,9,9,10,10,10,10,10,10,10,11,10,10,10,9,9,9,9,9,9,13,13,13,11,11,12,12,15,15,9,12,12,11,11,11,10,10,11,11,11,11,12,15,15,9,9,9,12,12,14,12,12,12,13,13,13,9,9,9,9,9,11,9,9,10,11,11,11,11,11,11,11,11,11,11,11,11,10,10,10,9,12,12,10,14,15,14,18,18,11,15,16,11,15,15,9,13,14,11,12,13,11,12,13,11,12,12,9,9,9,9,9,10,12,16,16,9,13,13,9,13,13,9,9,12,13,11,11,11,10,10,10,11,11,11,12,12,15,18,9,10,13,13,10,11,14,14,10,10,13,14,10,10,13,14,9,10,13,13,10,10,13,14,11,11,11,13,17,17,11,15,15,10,14,14,10,10,10,10,10,10,9,9,10,9,9,9,10,10,11,11,11,9,11,11,11,11,11,11,9,9,9,10,10,11,11,11,11,11,11,11,9,9,9,9,11,9,9,11,11,10,9,10,8,10,11,10,9,9,11,11,11,11,11,11,11,11,11,11,11,12,11,11,11,9,9,9,12,12,12,11,11,11,7,9,9,7,9,9,9,13,14,9,12,12,9,9,9,10,11,11,11,11,11,11,11,11,9,12,12,10,10,10,10,11,11,10,10,10,9,9,9,9,9,9,11,11,11,9,9,9,10,10,10,9,9,10,11,11,12,11,11,12,9,12,13,9,12,12,11,11,12,12,15,15,10,13,15,8,10,10,9,11,11,7,9,9,9,11,11,13,13,13,11,11,11,10,10,10,11,11,11,12,15,15,12,15,18,12,15,15,12,15,15,11,11,12,10,10,11,10,10,11,9,12,12,9,9,9,11,11,11,11,11,11,10,10,10,10,11,11,10,11,11,11,11,11,11,11,11,12,12,12,9,13,13,11,11,11,11,11,11,10,10,10,10,10,10,10,11,11,11,9,9,10,9,9,10,9,9,11,11,11,11,11,11,11,9,9,9,11,11,11,7,10,10,11,10,10,11,11,11,11,11,11,9,9,11,11,11,10,8,8,10,8,8,10,11,11,14,11,11,10,10,10,10,11,11,15,8,8,11,12,12,15,10,10,10,12,12,12,11,11,11,11,11,11,12,12,15,4,9,12,13,9,13,13,11,10,13,10,12,12,6,8,9,11,10,10,9,9,9,9,9,9,10,10,16,12,12,18,13,13,16,9,12,13,9,13,13,16,11,14,14,16,10,13,16,12,15,17,10,13,16,9,12,12,11,11,14,11,11,15,12,12,15,11,11,11,10,13,14,14,14,18,10,10,9,9,9,11,11,11,11,9,9,10,10,10,13,10,10,16,9,13,14,12,12,15,9,9,13,11,12,13,13,17,17,12,16,16,10,14,15,10,14,14,10,13,13,13,17,17,9,9,9,11,11,11,9,9,9,14,14,17,15,15,17,16,17,20,9,9,13,12,12,12,11,11,11,11,11,14,9,9,13,10,10,10,12,15,18,12,15,15,12,15,15,12,15,15,12,15,18,12,15,15,12,15,15,8,9,12,12,10,10,13,14,14,18,11,11,11,8,8,8,11,11,9,11,11,11,9,9,10,8,8,8,11,11,11,9,9,10,11,11,12,13,16,16,10,13,16,13,16,16,10,13,16,15,16,16,12,14,14,12,16,16,13,15,17,12,14,16,13,15,18,9,12,12,11,13,14,11,11,14,10,12,14,13,15,18,10,12,15,11,13,14,11,13,14,9,11,14,11,10,13,10,10,13,16,17,20,18,19,22,11,11,12,13,13,15,16,18,21,14,16,16,10,13,16,9,11,14,10,12,14,10,12,14,10,12,14,10,12,14,13,15,18,12,14,15,12,14,15,12,14,15,9,11,12,15,16,16,17,18,21,14,18,18,16,20,21,18,22,22,15,16,19,10,13,16,10,12,14,11,10,10,11,14,15,12,16,17,12,15,16,12,15,15,14,16,16,16,18,19,16,18,19,17,16,22,12,15,15,15,17,17,10,13,13,11,11,11,12,15,15]}}},"index":{"byName":[169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,302,303,304,3,4,5,6,7,8,305,306,307,308,309,310,311,312,313,314,315,316,9,10,11,12,13,14,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,813,814,815,0,1,2,386,387,388,389,390,391,392,393,394,395,396,397,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,816,817,818,819,820,821,822,823,824,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,825,826,827,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,487,488,489,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,15,16,17,18,19,20,21,22,23,24,25,26,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,27,28,29,30,31,32,845,846,847,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,217,218,219,220,221,222,223,224,225,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,848,849,850,851,852,853,854,855,856,857,858,859,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,33,52,53,54,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,55,56,57,226,227,228,229,230,231,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,1080,1081,1082,1083,1084,1085,1086,1087,1088,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,58,59,60,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,860,861,862,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,61,62,63,64,65,66,67,68,69,70,71,72,863,864,865,866,867,868,619,620,621,622,623,624,625,626,627,628,629,630,869,870,871,872,873,874,875,876,877,878,879,880,73,74,75,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,1140,1141,1142,1143,1144,1145,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,91,92,93,94,95,96,713,714,715,716,717,718,719,720,721,283,284,285,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,722,723,724,725,726,727,728,729,730,731,732,733,914,915,916,917,918,919,920,921,922,97,98,99,100,101,102,103,104,105,106,107,108,286,287,288,923,924,925,926,927,928,734,735,736,298,299,300,301,289,290,291,292,293,294,295,296,297,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,737,738,739,740,741,742,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,971,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,1173,1174,1175,1176,1177,1178,791,792,793,794,795,796,797,1179,1180,1181,1182,1183,1184,1185,1186,1187,972,973,974,975,976,977],"RegPV":[12,21,22,23,24,25,26,30,31,32,55,56,57,73,74,75,139,140,141,142,143,144,145,146,147,148,149,150,154,155,0,13,14,19,20,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,67,91,92,93,94,95,96,97,103,104,105,118,119,120,121,122,127,128,129,151,152,153,156,1,2,15,16,17,18,27,28,29,98,99,112,113,114,115,116,123,124,125,126,157,158,159,163,164,791,9,10,11,52,53,54,68,69,117,160,161,162,166,167,226,227,228,106,107,108,109,110,111,133,134,135,165,168,804,3,4,5,6,7,8,58,59,60,61,62,63,64,65,66,70,71,72,76,77,78,82,83,84,229,230,231,259,260,261,544,547,625,734,79,80,81,85,86,87,88,89,90,100,101,102,514,619,752,753,755,756,770,771,805,971,984,985,986,996,997,998,347,348,349,350,351,353,354,505,508,545,548,549,595,596,626,627,628,746,747,806,810,875,876,920,921,922,993,994,130,131,132,187,188,189,199,200,201,208,209,210,211,212,213,214,215,216,283,284,286,287,299,300,302,303,304,355,368,420,466,467,468,511,515,517,559,571,574,592,593,594,597,620,621,658,659,661,662,676,679,682,735,736,754,866,867,877,947,948,975,995,1068,136,137,138,181,182,184,185,186,202,203,204,205,206,207,235,236,237,238,239,240,244,245,246,247,248,250,251,252,253,254,255,262,263,264,265,266,285,288,301,329,330,331,352,362,365,389,392,395,417,423,454,481,482,484,485,486,487,488,489,506,509,510,516,520,523,526,562,565,598,601,610,629,630,634,635,636,640,641,642,655,656,670,673,685,688,722,723,724,725,726,727,731,732,733,737,740,741,742,743,744,748,749,750,761,762,772,798,807,832,872,873,893,938,939,940,981,982,987,988,999,1000,1005,1044,1065,1077,1146,1182,172,173,174,175,176,178,179,180,183,190,191,192,193,194,232,233,234,241,242,243,249,256,257,258,267,268,269,270,271,272,273,292,293,305,306,307,308,309,310,320,335,336,337,371,386,398,399,400,401,402,407,410,413,414,430,446,472,473,475,476,477,483,490,491,492,502,503,504,507,512,518,519,535,536,537,546,550,553,556,557,558,568,580,581,582,583,584,585,589,590,591,604,607,622,664,667,668,669,694,713,714,716,717,719,720,728,729,730,792,795,811,812,813,814,815,825,828,845,868,869,870,884,890,891,914,915,916,932,933,944,945,972,989,1002,1003,1038,1062,1092,1119,169,170,171,177,195,196,197,198,217,218,219,223,224,225,274,275,276,280,281,282,289,290,291,294,295,296,297,298,326,327,369,370,374,403,421,422,431,434,438,439,442,443,447,450,451,463,469,470,471,474,478,479,493,494,513,572,573,577,578,579,616,637,638,639,677,678,703,704,705,706,707,708,709,715,718,738,739,751,757,763,764,765,766,776,777,778,799,801,808,809,816,817,836,842,860,878,879,881,882,902,905,908,949,976,1004,1011,1017,1047,1053,1066,1069,1089,1095,1098,1101,1104,1140,1143,1147,1148,1179,314,315,323,324,325,328,356,357,358,359,360,361,363,364,366,367,380,383,418,419,424,425,435,455,456,460,480,495,496,497,498,499,500,501,521,522,524,525,527,528,529,530,532,533,534,541,542,543,560,561,563,564,566,567,575,576,586,587,588,599,602,611,623,624,660,663,671,672,674,675,680,681,683,684,686,687,689,690,697,698,699,700,701,702,710,711,712,721,745,758,759,767,768,782,783,784,785,786,787,848,849,851,852,857,858,859,871,874,917,918,919,941,942,983,990,991,992,1001,1006,1041,1045,1056,1059,1063,1078,1093,1120,1149,1183,1184,220,221,277,278,279,316,317,321,322,332,338,339,341,342,343,372,373,390,393,396,397,404,415,426,427,531,538,539,540,554,555,569,570,600,603,605,608,609,612,613,643,646,649,652,657,665,666,691,692,693,773,774,779,780,781,788,789,793,802,803,819,820,826,839,846,847,854,855,887,888,894,899,935,936,937,950,953,956,959,962,965,968,973,974,1007,1023,1026,1032,1039,1040,1048,1054,1079,1096,1099,1102,1105,1110,1113,1116,1121,1144,1152,1155,1158,1173,1185,222,311,312,313,344,345,346,387,391,394,408,409,411,412,416,432,433,440,444,448,449,452,457,551,606,617,631,632,633,695,696,794,796,797,800,822,823,827,829,830,837,843,861,880,885,892,895,896,909,910,911,934,946,977,1008,1012,1014,1018,1029,1035,1042,1050,1057,1060,1067,1070,1080,1081,1090,1107,1141,1180,1181,340,375,377,388,436,437,441,445,453,464,465,552,760,833,834,850,862,863,864,886,903,906,907,923,924,943,978,979,1024,1025,1033,1043,1046,1049,1058,1061,1064,1086,1094,1097,1100,1103,1106,1111,1114,1117,1128,1145,1150,1161,318,319,333,334,376,381,384,385,428,461,462,614,615,618,644,645,647,650,651,653,654,769,775,790,840,853,856,889,904,926,927,951,954,955,957,958,960,961,963,966,967,969,970,1020,1030,1036,1051,1055,1082,1108,1112,1115,1118,1122,1137,1151,1156,1159,1160,1174,1175,1176,1186,1187,382,405,406,818,824,835,838,844,883,900,901,929,1009,1010,1013,1015,1016,1019,1027,1071,1087,1088,1091,1142,1153,1157,1162,1164,1167,458,459,841,897,898,912,925,1031,1125,1154,1170,1177,378,379,429,648,821,865,952,964,980,1037,1052,1074,1109,1129,1130,1165,1168,831,1021,1022,1028,1034,1083,1123,1124,1131,1138,1163,1171,913,928,930,1072,1178,1084,1126,1134,1075,1139,1166,1169,931,1073,1132,1085,1127,1133,1076,1135,1136,1172],"VetPV":[12,21,22,23,24,25,26,30,31,32,55,56,57,73,74,75,139,140,141,142,143,144,145,146,147,148,149,150,154,155,0,13,14,19,20,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,67,91,92,93,94,95,96,97,103,104,105,118,119,120,121,122,127,128,129,151,152,153,156,1,2,15,16,17,18,27,28,29,98,99,112,113,114,115,116,123,124,125,126,157,158,159,163,164,791,9,10,11,52,53,54,68,69,117,160,161,162,166,167,226,227,228,106,107,108,109,110,111,133,134,135,165,168,804,3,4,5,6,7,8,58,59,60,61,62,63,64,65,66,70,71,72,76,77,78,82,83,84,229,230,231,259,260,261,544,547,625,734,79,80,81,85,86,87,88,89,90,100,101,102,514,619,752,753,755,756,770,771,805,971,984,985,986,996,997,998,347,348,349,350,351,353,354,505,508,545,548,549,595,596,626,627,628,746,747,806,810,875,876,920,921,922,993,994,130,131,132,187,188,189,199,200,201,208,209,210,211,212,213,214,215,216,283,284,286,287,299,300,302,303,304,355,368,420,466,467,468,511,515,517,559,571,574,592,593,594,597,620,621,658,659,661,662,676,679,682,735,736,754,866,867,877,947,948,975,995,1068,136,137,138,181,182,184,185,186,202,203,204,205,206,207,235,236,237,238,239,240,244,245,246,247,248,250,251,252,253,254,255,262,263,264,265,266,285,288,301,329,330,331,352,362,365,389,392,395,417,423,454,481,482,484,485,486,487,488,489,506,509,510,516,520,523,526,562,565,598,601,610,629,630,634,635,636,640,641,642,655,656,670,673,685,688,722,723,724,725,726,727,731,732,733,737,740,741,742,743,744,748,749,750,761,762,772,798,807,832,872,873,893,938,939,940,981,982,987,988,999,1000,1005,1044,1065,1077,1146,1182,172,173,174,175,176,178,179,180,183,190,191,192,193,194,232,233,234,241,242,243,249,256,257,258,267,268,269,270,271,272,273,292,293,305,306,307,308,309,310,320,335,336,337,371,386,398,399,400,401,402,407,410,413,414,430,446,472,473,475,476,477,483,490,491,492,502,503,504,507,512,518,519,535,536,537,546,550,553,556,557,558,568,580,581,582,583,584,585,589,590,591,604,607,622,664,667,668,669,694,713,714,716,717,719,720,728,729,730,792,795,811,812,813,814,815,825,828,845,868,869,870,884,890,891,914,915,916,932,933,944,945,972,989,1002,1003,1038,1062,1092,1119,169,170,171,177,195,196,197,198,217,218,219,223,224,225,274,275,276,280,281,282,289,290,291,294,295,296,297,298,326,327,369,370,374,403,421,422,431,434,438,439,442,443,447,450,451,463,469,470,471,474,478,479,493,494,513,572,573,577,578,579,616,637,638,639,677,678,703,704,705,706,707,708,709,715,718,738,739,751,757,763,764,765,766,776,777,778,799,801,808,809,816,817,836,842,860,878,879,881,882,902,905,908,949,976,1004,1011,1017,1047,1053,1066,1069,1089,1095,1098,1101,1104,1140,1143,1147,1148,1179,314,315,323,324,325,328,356,357,358,359,360,361,363,364,366,367,380,383,418,419,424,425,435,455,456,460,480,495,496,497,498,499,500,501,521,522,524,525,527,528,529,530,532,533,534,541,542,543,560,561,563,564,566,567,575,576,586,587,588,599,602,611,623,624,660,663,671,672,674,675,680,681,683,684,686,687,689,690,697,698,699,700,701,702,710,711,712,721,745,758,759,767,768,782,783,784,785,786,787,848,849,851,852,857,858,859,871,874,917,918,919,941,942,983,990,991,992,1001,1006,1041,1045,1056,1059,1063,1078,1093,1120,1149,1183,1184,220,221,277,278,279,316,317,321,322,332,338,339,341,342,343,372,373,390,393,396,397,404,415,426,427,531,538,539,540,554,555,569,570,600,603,605,608,609,612,613,643,646,649,652,657,665,666,691,692,693,773,774,779,780,781,788,789,793,802,803,819,820,826,839,846,847,854,855,887,888,894,899,935,936,937,950,953,956,959,962,965,968,973,974,1007,1023,1026,1032,1039,1040,1048,1054,1079,1096,1099,1102,1105,1110,1113,1116,1121,1144,1152,1155,1158,1173,1185,222,311,312,313,344,345,346,387,391,394,408,409,411,412,416,432,433,440,444,448,449,452,457,551,606,617,631,632,633,695,696,794,796,797,800,822,823,827,829,830,837,843,861,880,885,892,895,896,909,910,911,934,946,977,1008,1012,1014,1018,1029,1035,1042,1050,1057,1060,1067,1070,1080,1081,1090,1107,1141,1180,1181,340,375,377,388,436,437,441,445,453,464,465,552,760,833,834,850,862,863,864,886,903,906,907,923,924,943,978,979,1024,1025,1033,1043,1046,1049,1058,1061,1064,1086,1094,1097,1100,1103,1106,1111,1114,1117,1128,1145,1150,1161,318,319,333,334,376,381,384,385,428,461,462,614,615,618,644,645,647,650,651,653,654,769,775,790,840,853,856,889,904,926,927,951,954,955,957,958,960,961,963,966,967,969,970,1020,1030,1036,1051,1055,1082,1108,1112,1115,1118,1122,1137,1151,1156,1159,1160,1174,1175,1176,1186,1187,382,405,406,818,824,835,838,844,883,900,901,929,1009,1010,1013,1015,1016,1019,1027,1071,1087,1088,1091,1142,1153,1157,1162,1164,1167,458,459,841,897,898,912,925,1031,1125,1154,1170,1177,378,379,429,648,821,865,952,964,980,1037,1052,1074,1109,1129,1130,1165,1168,831,1021,1022,1028,1034,1083,1123,1124,1131,1138,1163,1171,913,928,930,1072,1178,1084,1126,1134,1075,1139,1166,1169,931,1073,1132,1085,1127,1133,1076,1135,1136,1172],"Skill0PV":[12,21,22,23,24,25,26,30,31,32,55,56,57,73,74,75,139,140,141,142,143,144,145,146,147,148,149,150,154,155,0,13,14,19,20,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,67,91,92,93,94,95,96,97,103,104,105,118,119,120,121,122,127,128,129,151,152,153,156,1,2,15,16,17,18,27,28,29,98,99,112,113,114,115,116,123,124,125,126,157,158,159,163,164,791,9,10,11,52,53,54,68,69,117,160,161,162,166,167,226,227,228,106,107,108,109,110,111,133,134,135,165,168,804,3,4,5,6,7,8,58,59,60,61,62,63,64,65,66,70,71,72,76,77,78,82,83,84,229,230,231,259,260,261,544,547,625,734,79,80,81,85,86,87,88,89,90,100,101,102,514,619,752,753,755,756,770,771,805,971,984,985,986,996,997,998,347,348,349,350,351,353,354,505,508,545,548,549,595,596,626,627,628,746,747,806,810,875,876,920,921,922,993,994,130,131,132,187,188,189,199,200,201,208,209,210,211,212,213,214,215,216,283,284,286,287,299,300,302,303,304,355,368,420,466,467,468,511,515,517,559,571,574,592,593,594,597,620,621,658,659,661,662,676,679,682,735,736,754,866,867,877,947,948,975,995,1068,136,137,138,181,182,184,185,186,202,203,204,205,206,207,235,236,237,238,239,240,244,245,246,247,248,250,251,252,253,254,255,262,263,264,265,266,285,288,301,329,330,331,352,362,365,389,392,395,417,423,454,481,482,484,485,486,487,488,489,506,509,510,516,520,523,526,562,565,598,601,610,629,630,634,635,636,640,641,642,655,656,670,673,685,688,722,723,724,725,726,727,731,732,733,737,740,741,742,743,744,748,749,750,761,762,772,798,807,832,872,873,893,938,939,940,981,982,987,988,999,1000,1005,1044,1065,1077,1146,1182,172,173,174,175,176,178,179,180,183,190,191,192,193,194,232,233,234,241,242,243,249,256,257,258,267,268,269,270,271,272,273,292,293,305,306,307,308,309,310,320,335,336,337,371,386,398,399,400,401,402,407,410,413,414,430,446,472,473,475,476,477,483,490,491,492,502,503,504,507,512,518,519,535,536,537,546,550,553,556,557,558,568,580,581,582,583,584,585,589,590,591,604,607,622,664,667,668,669,694,713,714,716,717,719,720,728,729,730,792,795,811,812,813,814,815,825,828,845,868,869,870,884,890,891,914,915,916,932,933,944,945,972,989,1002,1003,1038,1062,1092,1119,169,170,171,177,195,196,197,198,217,218,219,223,224,225,274,275,276,280,281,282,289,290,291,294,295,296,297,298,326,327,369,370,374,403,421,422,431,434,438,439,442,443,447,450,451,463,469,470,471,474,478,479,493,494,513,572,573,577,578,579,616,637,638,639,677,678,703,704,705,706,707,708,709,715,718,738,739,751,757,763,764,765,766,776,777,778,799,801,808,809,816,817,836,842,860,878,879,881,882,902,905,908,949,976,1004,1011,1017,1047,1053,1066,1069,1089,1095,1098,1101,1104,1140,1143,1147,1148,1179,314,315,323,324,325,328,356,357,358,359,360,361,363,364,366,367,380,383,418,419,424,425,435,455,456,460,480,495,496,497,498,499,500,501,521,522,524,525,527,528,529,530,532,533,534,541,542,543,560,561,563,564,566,567,575,576,586,587,588,599,602,611,623,624,660,663,671,672,674,675,680,681,683,684,686,687,689,690,697,698,699,700,701,702,710,711,712,721,745,758,759,767,768,782,783,784,785,786,787,848,849,851,852,857,858,859,871,874,917,918,919,941,942,983,990,991,992,1001,1006,1041,1045,1056,1059,1063,1078,1093,1120,1149,1183,1184,220,221,277,278,279,316,317,321,322,332,338,339,341,342,343,372,373,390,393,396,397,404,415,426,427,531,538,539,540,554,555,569,570,600,603,605,608,609,612,613,643,646,649,652,657,665,666,691,692,693,773,774,779,780,781,788,789,793,802,803,819,820,826,839,846,847,854,855,887,888,894,899,935,936,937,950,953,956,959,962,965,968,973,974,1007,1023,1026,1032,1039,1040,1048,1054,1079,1096,1099,1102,1105,1110,1113,1116,1121,1144,1152,1155,1158,1173,1185,222,311,312,313,344,345,346,387,391,394,408,409,411,412,416,432,433,440,444,448,449,452,457,551,606,617,631,632,633,695,696,794,796,797,800,822,823,827,829,830,837,843,861,880,885,892,895,896,909,910,911,934,946,977,1008,1012,1014,1018,1029,1035,1042,1050,1057,1060,1067,1070,1080,1081,1090,1107,1141,1180,1181,340,375,377,388,436,437,441,445,453,464,465,552,760,833,834,850,862,863,864,886,903,906,907,923,924,943,978,979,1024,1025,1033,1043,1046,1049,1058,1061,1064,1086,1094,1097,1100,1103,1106,1111,1114,1117,1128,1145,1150,1161,318,319,333,334,376,381,384,385,428,461,462,614,615,618,644,645,647,650,651,653,654,769,775,790,840,853,856,889,904,926,927,951,954,955,957,958,960,961,963,966,967,969,970,1020,1030,1036,1051,1055,1082,1108,1112,1115,1118,1122,1137,1151,1156,1159,1160,1174,1175,1176,1186,1187,382,405,406,818,824,835,838,844,883,900,901,929,1009,1010,1013,1015,1016,1019,1027,1071,1087,1088,1091,1142,1153,1157,1162,1164,1167,458,459,841,897,898,912,925,1031,1125,1154,1170,1177,378,379,429,648,821,865,952,964,980,1037,1052,1074,1109,1129,1130,1165,1168,831,1021,1022,1028,1034,1083,1123,1124,1131,1138,1163,1171,913,928,930,1072,1178,1084,1126,1134,1075,1139,1166,1169,931,1073,1132,1085,1127,1133,1076,1135,1136,1172],"Skill1PV":[12,21,22,23,24,25,26,30,31,32,55,56,57,73,74,75,139,140,141,142,143,144,145,146,147,148,149,150,154,155,0,13,14,19,20,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,67,91,92,93,94,95,96,97,103,104,105,118,119,120,121,122,127,128,129,151,152,153,156,1,2,15,16,17,18,27,28,29,98,99,112,113,114,115,116,123,124,125,126,157,158,159,163,164,791,9,10,11,52,53,54,68,69,117,160,161,162,166,167,226,227,228,106,107,108,109,110,111,133,134,135,165,168,804,3,4,5,6,7,8,58,59,60,61,62,63,64,65,66,70,71,72,76,77,78,82,83,84,229,230,231,259,260,261,544,547,625,734,79,80,81,85,86,87,88,89,90,100,101,102,514,619,752,753,755,756,770,771,805,971,984,985,986,996,997,998,347,348,349,350,351,353,354,505,508,545,548,549,595,596,626,627,628,746,747,806,810,875,876,920,921,922,993,994,130,131,132,187,188,189,199,200,201,208,209,210,211,212,213,214,215,216,283,284,286,287,299,300,302,303,304,355,368,420,466,467,468,511,515,517,559,571,574,592,593,594,597,620,621,658,659,661,662,676,679,682,735,736,754,866,867,877,947,948,975,995,1068,136,137,138,181,182,184,185,186,202,203,204,205,206,207,235,236,237,238,239,240,244,245,246,247,248,250,251,252,253,254,255,262,263,264,265,266,285,288,301,329,330,331,352,362,365,389,392,395,417,423,454,481,482,484,485,486,487,488,489,506,509,510,516,520,523,526,562,565,598,601,610,629,630,634,635,636,640,641,642,655,656,670,673,685,688,722,723,724,725,726,727,731,732,733,737,740,741,742,743,744,748,749,750,761,762,772,798,807,832,872,873,893,938,939,940,981,982,987,988,999,1000,1005,1044,1065,1077,1146,1182,172,173,174,175,176,178,179,180,183,190,191,192,193,194,232,233,234,241,242,243,249,256,257,258,267,268,269,270,271,272,273,292,293,305,306,307,308,309,310,320,335,336,337,371,386,398,399,400,401,402,407,410,413,414,430,446,472,473,475,476,477,483,490,491,492,502,503,504,507,512,518,519,535,536,537,546,550,553,556,557,558,568,580,581,582,583,584,585,589,590,591,604,607,622,664,667,668,669,694,713,714,716,717,719,720,728,729,730,792,795,811,812,813,814,815,825,828,845,868,869,870,884,890,891,914,915,916,932,933,944,945,972,989,1002,1003,1038,1062,1092,1119,169,170,171,177,195,196,197,198,217,218,219,223,224,225,274,275,276,280,281,282,289,290,291,294,295,296,297,298,326,327,369,370,374,403,421,422,431,434,438,439,442,443,447,450,451,463,469,470,471,474,478,479,493,494,513,572,573,577,578,579,616,637,638,639,677,678,703,704,705,706,707,708,709,715,718,738,739,751,757,763,764,765,766,776,777,778,799,801,808,809,816,817,836,842,860,878,879,881,882,902,905,908,949,976,1004,1011,1017,1047,1053,1066,1069,1089,1095,1098,1101,1104,1140,1143,1147,1148,1179,314,315,323,324,325,328,356,357,358,359,360,361,363,364,366,367,380,383,418,419,424,425,435,455,456,460,480,495,496,497,498,499,500,501,521,522,524,525,527,528,529,530,532,533,534,541,542,543,560,561,563,564,566,567,575,576,586,587,588,599,602,611,623,624,660,663,671,672,674,675,680,681,683,684,686,687,689,690,697,698,699,700,701,702,710,711,712,721,745,758,759,767,768,782,783,784,785,786,787,848,849,851,852,857,858,859,871,874,917,918,919,941,942,983,990,991,992,1001,1006,1041,1045,1056,1059,1063,1078,1093,1120,1149,1183,1184,220,221,277,278,279,316,317,321,322,332,338,339,341,342,343,372,373,390,393,396,397,404,415,426,427,531,538,539,540,554,555,569,570,600,603,605,608,609,612,613,643,646,649,652,657,665,666,691,692,693,773,774,779,780,781,788,789,793,802,803,819,820,826,839,846,847,854,855,887,888,894,899,935,936,937,950,953,956,959,962,965,968,973,974,1007,1023,1026,1032,1039,1040,1048,1054,1079,1096,1099,1102,1105,1110,1113,1116,1121,1144,1152,1155,1158,1173,1185,222,311,312,313,344,345,346,387,391,394,408,409,411,412,416,432,433,440,444,448,449,452,457,551,606,617,631,632,633,695,696,794,796,797,800,822,823,827,829,830,837,843,861,880,885,892,895,896,909,910,911,934,946,977,1008,1012,1014,1018,1029,1035,1042,1050,1057,1060,1067,1070,1080,1081,1090,1107,1141,1180,1181,340,375,377,388,436,437,441,445,453,464,465,552,760,833,834,850,862,863,864,886,903,906,907,923,924,943,978,979,1024,1025,1033,1043,1046,1049,1058,1061,1064,1086,1094,1097,1100,1103,1106,1111,1114,1117,1128,1145,1150,1161,318,319,333,334,376,381,384,385,428,461,462,614,615,618,644,645,647,650,651,653,654,769,775,790,840,853,856,889,904,926,927,951,954,955,957,958,960,961,963,966,967,969,970,1020,1030,1036,1051,1055,1082,1108,1112,1115,1118,1122,1137,1151,1156,1159,1160,1174,1175,1176,1186,1187,382,405,406,818,824,835,838,844,883,900,901,929,1009,1010,1013,1015,1016,1019,1027,1071,1087,1088,1091,1142,1153,1157,1162,1164,1167,458,459,841,897,898,912,925,1031,1125,1154,1170,1177,378,379,429,648,821,865,952,964,980,1037,1052,1074,1109,1129,1130,1165,1168,831,1021,1022,1028,1034,1083,1123,1124,1131,1138,1163,1171,913,928,930,1072,1178,1084,1126,1134,1075,1139,1166,1169,931,1073,1132,1085,1127,1133,1076,1135,1136,1172],"Skill2PV":[12,21,22,23,24,25,26,30,31,32,55,56,57,73,74,75,139,140,141,142,143,144,145,146,147,148,149,150,154,155,0,13,14,19,20,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,67,91,92,93,94,95,96,97,103,104,105,118,119,120,121,122,127,128,129,151,152,153,156,1,2,15,16,17,18,27,28,29,98,99,112,113,114,115,116,123,124,125,126,157,158,159,163,164,791,9,10,11,52,53,54,68,69,117,160,161,162,166,167,226,227,228,106,107,108,109,110,111,133,134,135,165,168,804,3,4,5,6,7,8,58,59,60,61,62,63,64,65,66,70,71,72,76,77,78,82,83,84,229,230,231,259,260,261,544,547,625,734,79,80,81,85,86,87,88,89,90,100,101,102,514,619,752,753,755,756,770,771,805,971,984,985,986,996,997,998,347,348,349,350,351,353,354,505,508,545,548,549,595,596,626,627,628,746,747,806,810,875,876,920,921,922,993,994,130,131,132,187,188,189,199,200,201,208,209,210,211,212,213,214,215,216,283,284,286,287,299,300,302,303,304,355,368,420,466,467,468,511,515,517,559,571,574,592,593,594,597,620,621,658,659,661,662,676,679,682,735,736,754,866,867,877,947,948,975,995,1068,136,137,138,181,182,184,185,186,202,203,204,205,206,207,235,236,237,238,239,240,244,245,246,247,248,250,251,252,253,254,255,262,263,264,265,266,285,288,301,329,330,331,352,362,365,389,392,395,417,423,454,481,482,484,485,486,487,488,489,506,509,510,516,520,523,526,562,565,598,601,610,629,630,634,635,636,640,641,642,655,656,670,673,685,688,722,723,724,725,726,727,731,732,733,737,740,741,742,743,744,748,749,750,761,762,772,798,807,832,872,873,893,938,939,940,981,982,987,988,999,1000,1005,1044,1065,1077,1146,1182,172,173,174,175,176,178,179,180,183,190,191,192,193,194,232,233,234,241,242,243,249,256,257,258,267,268,269,270,271,272,273,292,293,305,306,307,308,309,310,320,335,336,337,371,386,398,399,400,401,402,407,410,413,414,430,446,472,473,475,476,477,483,490,491,492,502,503,504,507,512,518,519,535,536,537,546,550,553,556,557,558,568,580,581,582,583,584,585,589,590,591,604,607,622,664,667,668,669,694,713,714,716,717,719,720,728,729,730,792,795,811,812,813,814,815,825,828,845,868,869,870,884,890,891,914,915,916,932,933,944,945,972,989,1002,1003,1038,1062,1092,1119,169,170,171,177,195,196,197,198,217,218,219,223,224,225,274,275,276,280,281,282,289,290,291,294,295,296,297,298,326,327,369,370,374,403,421,422,431,434,438,439,442,443,447,450,451,463,469,470,471,474,478,479,493,494,513,572,573,577,578,579,616,637,638,639,677,678,703,704,705,706,707,708,709,715,718,738,739,751,757,763,764,765,766,776,777,778,799,801,808,809,816,817,836,842,860,878,879,881,882,902,905,908,949,976,1004,1011,1017,1047,1053,1066,1069,1089,1095,1098,1101,1104,1140,1143,1147,1148,1179,314,315,323,324,325,328,356,357,358,359,360,361,363,364,366,367,380,383,418,419,424,425,435,455,456,460,480,495,496,497,498,499,500,501,521,522,524,525,527,528,529,530,532,533,534,541,542,543,560,561,563,564,566,567,575,576,586,587,588,599,602,611,623,624,660,663,671,672,674,675,680,681,683,684,686,687,689,690,697,698,699,700,701,702,710,711,712,721,745,758,759,767,768,782,783,784,785,786,787,848,849,851,852,857,858,859,871,874,917,918,919,941,942,983,990,991,992,1001,1006,1041,1045,1056,1059,1063,1078,1093,1120,1149,1183,1184,220,221,277,278,279,316,317,321,322,332,338,339,341,342,343,372,373,390,393,396,397,404,415,426,427,531,538,539,540,554,555,569,570,600,603,605,608,609,612,613,643,646,649,652,657,665,666,691,692,693,773,774,779,780,781,788,789,793,802,803,819,820,826,839,846,847,854,855,887,888,894,899,935,936,937,950,953,956,959,962,965,968,973,974,1007,1023,1026,1032,1039,1040,1048,1054,1079,1096,1099,1102,1105,1110,1113,1116,1121,1144,1152,1155,1158,1173,1185,222,311,312,313,344,345,346,387,391,394,408,409,411,412,416,432,433,440,444,448,449,452,457,551,606,617,631,632,633,695,696,794,796,797,800,822,823,827,829,830,837,843,861,880,885,892,895,896,909,910,911,934,946,977,1008,1012,1014,1018,1029,1035,1042,1050,1057,1060,1067,1070,1080,1081,1090,1107,1141,1180,1181,340,375,377,388,436,437,441,445,453,464,465,552,760,833,834,850,862,863,864,886,903,906,907,923,924,943,978,979,1024,1025,1033,1043,1046,1049,1058,1061,1064,1086,1094,1097,1100,1103,1106,1111,1114,1117,1128,1145,1150,1161,318,319,333,334,376,381,384,385,428,461,462,614,615,618,644,645,647,650,651,653,654,769,775,790,840,853,856,889,904,926,927,951,954,955,957,958,960,961,963,966,967,969,970,1020,1030,1036,1051,1055,1082,1108,1112,1115,1118,1122,1137,1151,1156,1159,1160,1174,1175,1176,1186,1187,382,405,406,818,824,835,838,844,883,900,901,929,1009,1010,1013,1015,1016,1019,1027,1071,1087,1088,1091,1142,1153,1157,1162,1164,1167,458,459,841,897,898,912,925,1031,1125,1154,1170,1177,378,379,429,648,821,865,952,964,980,1037,1052,1074,1109,1129,1130,1165,1168,831,1021,1022,1028,1034,1083,1123,1124,1131,1138,1163,1171,913,928,930,1072,1178,1084,1126,1134,1075,1139,1166,1169,931,1073,1132,1085,1127,1133,1076,1135,1136,1172],"Skill3PV":[12,21,22,23,24,25,26,30,31,32,55,56,57,73,74,75,139,140,141,142,143,144,145,146,147,148,149,150,154,155,0,13,14,19,20,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,67,91,92,93,94,95,96,97,103,104,105,118,119,120,121,122,127,128,129,151,152,153,156,1,2,15,16,17,18,27,28,29,98,99,112,113,114,115,116,123,124,125,126,157,158,159,163,164,791,9,10,11,52,53,54,68,69,117,160,161,162,166,167,226,227,228,106,107,108,109,110,111,133,134,135,165,168,804,3,4,5,6,7,8,58,59,60,61,62,63,64,65,66,70,71,72,76,77,78,82,83,84,229,230,231,259,260,261,544,547,625,734,79,80,81,85,86,87,88,89,90,100,101,102,514,619,752,753,755,756,770,771,805,971,984,985,986,996,997,998,347,348,349,350,351,353,354,505,508,545,548,549,595,596,626,627,628,746,747,806,810,875,876,920,921,922,993,994,130,131,132,187,188,189,199,200,201,208,209,210,211,212,213,214,215,216,283,284,286,287,299,300,302,303,304,355,368,420,466,467,468,511,515,517,559,571,574,592,593,594,597,620,621,658,659,661,662,676,679,682,735,736,754,866,867,877,947,948,975,995,1068,136,137,138,181,182,184,185,186,202,203,204,205,206,207,235,236,237,238,239,240,244,245,246,247,248,250,251,252,253,254,255,262,263,264,265,266,285,288,301,329,330,331,352,362,365,389,392,395,417,423,454,481,482,484,485,486,487,488,489,506,509,510,516,520,523,526,562,565,598,601,610,629,630,634,635,636,640,641,642,655,656,670,673,685,688,722,723,724,725,726,727,731,732,733,737,740,741,742,743,744,748,749,750,761,762,772,798,807,832,872,873,893,938,939,940,981,982,987,988,999,1000,1005,1044,1065,1077,1146,1182,172,173,174,175,176,178,179,180,183,190,191,192,193,194,232,233,234,241,242,243,249,256,257,258,267,268,269,270,271,272,273,292,293,305,306,307,308,309,310,320,335,336,337,371,386,398,399,400,401,402,407,410,413,414,430,446,472,473,475,476,477,483,490,491,492,502,503,504,507,512,518,519,535,536,537,546,550,553,556,557,558,568,580,581,582,583,584,585,589,590,591,604,607,622,664,667,668,669,694,713,714,716,717,719,720,728,729,730,792,795,811,812,813,814,815,825,828,845,868,869,870,884,890,891,914,915,916,932,933,944,945,972,989,1002,1003,1038,1062,1092,1119,169,170,171,177,195,196,197,198,217,218,219,223,224,225,274,275,276,280,281,282,289,290,291,294,295,296,297,298,326,327,369,370,374,403,421,422,431,434,438,439,442,443,447,450,451,463,469,470,471,474,478,479,493,494,513,572,573,577,578,579,616,637,638,639,677,678,703,704,705,706,707,708,709,715,718,738,739,751,757,763,764,765,766,776,777,778,799,801,808,809,816,817,836,842,860,878,879,881,882,902,905,908,949,976,1004,1011,1017,1047,1053,1066,1069,1089,1095,1098,1101,1104,1140,1143,1147,1148,1179,314,315,323,324,325,328,356,357,358,359,360,361,363,364,366,367,380,383,418,419,424,425,435,455,456,460,480,495,496,497,498,499,500,501,521,522,524,525,527,528,529,530,532,533,534,541,542,543,560,561,563,564,566,567,575,576,586,587,588,599,602,611,623,624,660,663,671,672,674,675,680,681,683,684,686,687,689,690,697,698,699,700,701,702,710,711,712,721,745,758,759,767,768,782,783,784,785,786,787,848,849,851,852,857,858,859,871,874,917,918,919,941,942,983,990,991,992,1001,1006,1041,1045,1056,1059,1063,1078,1093,1120,1149,1183,1184,220,221,277,278,279,316,317,321,322,332,338,339,341,342,343,372,373,390,393,396,397,404,415,426,427,531,538,539,540,554,555,569,570,600,603,605,608,609,612,613,643,646,649,652,657,665,666,691,692,693,773,774,779,780,781,788,789,793,802,803,819,820,826,839,846,847,854,855,887,888,894,899,935,936,937,950,953,956,959,962,965,968,973,974,1007,1023,1026,1032,1039,1040,1048,1054,1079,1096,1099,1102,1105,1110,1113,1116,1121,1144,1152,1155,1158,1173,1185,222,311,312,313,344,345,346,387,391,394,408,409,411,412,416,432,433,440,444,448,449,452,457,551,606,617,631,632,633,695,696,794,796,797,800,822,823,827,829,830,837,843,861,880,885,892,895,896,909,910,911,934,946,977,1008,1012,1014,1018,1029,1035,1042,1050,1057,1060,1067,1070,1080,1081,1090,1107,1141,1180,1181,340,375,377,388,436,437,441,445,453,464,465,552,760,833,834,850,862,863,864,886,903,906,907,923,924,943,978,979,1024,1025,1033,1043,1046,1049,1058,1061,1064,1086,1094,1097,1100,1103,1106,1111,1114,1117,1128,1145,1150,1161,318,319,333,334,376,381,384,385,428,461,462,614,615,618,644,645,647,650,651,653,654,769,775,790,840,853,856,889,904,926,927,951,954,955,957,958,960,961,963,966,967,969,970,1020,1030,1036,1051,1055,1082,1108,1112,1115,1118,1122,1137,1151,1156,1159,1160,1174,1175,1176,1186,1187,382,405,406,818,824,835,838,844,883,900,901,929,1009,1010,1013,1015,1016,1019,1027,1071,1087,1088,1091,1142,1153,1157,1162,1164,1167,458,459,841,897,898,912,925,1031,1125,1154,1170,1177,378,379,429,648,821,865,952,964,980,1037,1052,1074,1109,1129,1130,1165,1168,831,1021,1022,1028,1034,1083,1123,1124,1131,1138,1163,1171,913,928,930,1072,1178,1084,1126,1134,1075,1139,1166,1169,931,1073,1132,1085,1127,1133,1076,1135,1136,1172],"Skill4PV":[12,21,22,23,24,25,26,30,31,32,55,56,57,73,74,75,139,140,141,142,143,144,145,146,147,148,149,150,154,155,0,13,14,19,20,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,67,91,92,93,94,95,96,97,103,104,105,118,119,120,121,122,127,128,129,151,152,153,156,1,2,15,16,17,18,27,28,29,98,99,112,113,114,115,116,123,124,125,126,157,158,159,163,164,791,9,10,11,52,53,54,68,69,117,160,161,162,166,167,226,227,228,106,107,108,109,110,111,133,134,135,165,168,804,3,4,5,6,7,8,58,59,60,61,62,63,64,65,66,70,71,72,76,77,78,82,83,84,229,230,231,259,260,261,544,547,625,734,79,80,81,85,86,87,88,89,90,100,101,102,514,619,752,753,755,756,770,771,805,971,984,985,986,996,997,998,347,348,349,350,351,353,354,505,508,545,548,549,595,596,626,627,628,746,747,806,810,875,876,920,921,922,993,994,130,131,132,187,188,189,199,200,201,208,209,210,211,212,213,214,215,216,283,284,286,287,299,300,302,303,304,355,368,420,466,467,468,511,515,517,559,571,574,592,593,594,597,620,621,658,659,661,662,676,679,682,735,736,754,866,867,877,947,948,975,995,1068,136,137,138,181,182,184,185,186,202,203,204,205,206,207,235,236,237,238,239,240,244,245,246,247,248,250,251,252,253,254,255,262,263,264,265,266,285,288,301,329,330,331,352,362,365,389,392,395,417,423,454,481,482,484,485,486,487,488,489,506,509,510,516,520,523,526,562,565,598,601,610,629,630,634,635,636,640,641,642,655,656,670,673,685,688,722,723,724,725,726,727,731,732,733,737,740,741,742,743,744,748,749,750,761,762,772,798,807,832,872,873,893,938,939,940,981,982,987,988,999,1000,1005,1044,1065,1077,1146,1182,172,173,174,175,176,178,179,180,183,190,191,192,193,194,232,233,234,241,242,243,249,256,257,258,267,268,269,270,271,272,273,292,293,305,306,307,308,309,310,320,335,336,337,371,386,398,399,400,401,402,407,410,413,414,430,446,472,473,475,476,477,483,490,491,492,502,503,504,507,512,518,519,535,536,537,546,550,553,556,557,558,568,580,581,582,583,584,585,589,590,591,604,607,622,664,667,668,669,694,713,714,716,717,719,720,728,729,730,792,795,811,812,813,814,815,825,828,845,868,869,870,884,890,891,914,915,916,932,933,944,945,972,989,1002,1003,1038,1062,1092,1119,169,170,171,177,195,196,197,198,217,218,219,223,224,225,274,275,276,280,281,282,289,290,291,294,295,296,297,298,326,327,369,370,374,403,421,422,431,434,438,439,442,443,447,450,451,463,469,470,471,474,478,479,493,494,513,572,573,577,578,579,616,637,638,639,677,678,703,704,705,706,707,708,709,715,718,738,739,751,757,763,764,765,766,776,777,778,799,801,808,809,816,817,836,842,860,878,879,881,882,902,905,908,949,976,1004,1011,1017,1047,1053,1066,1069,1089,1095,1098,1101,1104,1140,1143,1147,1148,1179,314,315,323,324,325,328,356,357,358,359,360,361,363,364,366,367,380,383,418,419,424,425,435,455,456,460,480,495,496,497,498,499,500,501,521,522,524,525,527,528,529,530,532,533,534,541,542,543,560,561,563,564,566,567,575,576,586,587,588,599,602,611,623,624,660,663,671,672,674,675,680,681,683,684,686,687,689,690,697,698,699,700,701,702,710,711,712,721,745,758,759,767,768,782,783,784,785,786,787,848,849,851,852,857,858,859,871,874,917,918,919,941,942,983,990,991,992,1001,1006,1041,1045,1056,1059,1063,1078,1093,1120,1149,1183,1184,220,221,277,278,279,316,317,321,322,332,338,339,341,342,343,372,373,390,393,396,397,404,415,426,427,531,538,539,540,554,555,569,570,600,603,605,608,609,612,613,643,646,649,652,657,665,666,691,692,693,773,774,779,780,781,788,789,793,802,803,819,820,826,839,846,847,854,855,887,888,894,899,935,936,937,950,953,956,959,962,965,968,973,974,1007,1023,1026,1032,1039,1040,1048,1054,1079,1096,1099,1102,1105,1110,1113,1116,1121,1144,1152,1155,1158,1173,1185,222,311,312,313,344,345,346,387,391,394,408,409,411,412,416,432,433,440,444,448,449,452,457,551,606,617,631,632,633,695,696,794,796,797,800,822,823,827,829,830,837,843,861,880,885,892,895,896,909,910,911,934,946,977,1008,1012,1014,1018,1029,1035,1042,1050,1057,1060,1067,1070,1080,1081,1090,1107,1141,1180,1181,340,375,377,388,436,437,441,445,453,464,465,552,760,833,834,850,862,863,864,886,903,906,907,923,924,943,978,979,1024,1025,1033,1043,1046,1049,1058,1061,1064,1086,1094,1097,1100,1103,1106,1111,1114,1117,1128,1145,1150,1161,318,319,333,334,376,381,384,385,428,461,462,614,615,618,644,645,647,650,651,653,654,769,775,790,840,853,856,889,904,926,927,951,954,955,957,958,960,961,963,966,967,969,970,1020,1030,1036,1051,1055,1082,1108,1112,1115,1118,1122,1137,1151,1156,1159,1160,1174,1175,1176,1186,1187,382,405,406,818,824,835,838,844,883,900,901,929,1009,1010,1013,1015,1016,1019,1027,1071,1087,1088,1091,1142,1153,1157,1162,1164,1167,458,459,841,897,898,912,925,1031,1125,1154,1170,1177,378,379,429,648,821,865,952,964,980,1037,1052,1074,1109,1129,1130,1165,1168,831,1021,1022,1028,1034,1083,1123,1124,1131,1138,1163,1171,913,928,930,1072,1178,1084,1126,1134,1075,1139,1166,1169,931,1073,1132,1085,1127,1133,1076,1135,1136,1172],"Skill5PV":[12,21,22,23,24,25,26,30,31,32,55,56,57,73,74,75,139,140,141,142,143,144,145,146,147,148,149,150,154,155,0,13,14,19,20,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,67,91,92,93,94,95,96,97,103,104,105,118,119,120,121,122,127,128,129,151,152,153,156,1,2,15,16,17,18,27,28,29,98,99,112,113,114,115,116,123,124,125,126,157,158,159,163,164,791,9,10,11,52,53,54,68,69,117,160,161,162,166,167,226,227,228,106,107,108,109,110,111,133,134,135,165,168,804,3,4,5,6,7,8,58,59,60,61,62,63,64,65,66,70,71,72,76,77,78,82,83,84,229,230,231,259,260,261,544,547,625,734,79,80,81,85,86,87,88,89,90,100,101,102,514,619,752,753,755,756,770,771,805,971,984,985,986,996,997,998,347,348,349,350,351,353,354,505,508,545,548,549,595,596,626,627,628,746,747,806,810,875,876,920,921,922,993,994,130,131,132,187,188,189,199,200,201,208,209,210,211,212,213,214,215,216,283,284,286,287,299,300,302,303,304,355,368,420,466,467,468,511,515,517,559,571,574,592,593,594,597,620,621,658,659,661,662,676,679,682,735,736,754,866,867,877,947,948,975,995,1068,136,137,138,172,173,174,175,176,178,179,180,181,182,183,184,185,186,190,191,192,193,194,202,203,204,205,206,207,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,262,263,264,265,266,267,268,269,270,271,272,273,285,288,292,293,301,305,306,307,308,309,310,320,329,330,331,335,336,337,352,362,365,371,386,389,392,395,398,399,400,401,402,407,410,413,414,417,423,430,446,454,472,473,475,476,477,481,482,483,484,485,486,487,488,489,490,491,492,502,503,504,506,507,509,510,512,516,518,519,520,523,526,535,536,537,546,550,553,556,557,558,562,565,568,580,581,582,583,584,585,589,590,591,598,601,604,607,610,622,629,630,634,635,636,640,641,642,655,656,664,667,668,669,670,673,685,688,694,713,714,716,717,719,720,722,723,724,725,726,727,728,729,730,731,732,733,737,740,741,742,743,744,748,749,750,761,762,772,792,795,798,807,811,812,813,814,815,825,828,832,845,868,869,870,872,873,884,890,891,893,914,915,916,932,933,938,939,940,944,945,972,981,982,987,988,989,999,1000,1002,1003,1005,1038,1044,1062,1065,1077,1092,1119,1146,1182,169,170,171,177,195,196,197,198,217,218,219,223,224,225,274,275,276,280,281,282,289,290,291,294,295,296,297,298,326,327,369,370,374,403,421,422,431,434,438,439,442,443,447,450,451,463,469,470,471,474,478,479,493,494,513,572,573,577,578,579,616,637,638,639,677,678,703,704,705,706,707,708,709,715,718,738,739,751,757,763,764,765,766,776,777,778,799,801,808,809,816,817,836,842,860,878,879,881,882,902,905,908,949,976,1004,1011,1017,1047,1053,1066,1069,1089,1095,1098,1101,1104,1140,1143,1147,1148,1179,314,315,323,324,325,328,356,357,358,359,360,361,363,364,366,367,380,383,418,419,424,425,435,455,456,460,480,495,496,497,498,499,500,501,521,522,524,525,527,528,529,530,532,533,534,541,542,543,560,561,563,564,566,567,575,576,586,587,588,599,602,611,623,624,660,663,671,672,674,675,680,681,683,684,686,687,689,690,697,698,699,700,701,702,710,711,712,721,745,758,759,767,768,782,783,784,785,786,787,848,849,851,852,857,858,859,871,874,917,918,919,941,942,983,990,991,992,1001,1006,1041,1045,1056,1059,1063,1078,1093,1120,1149,1183,1184,220,221,277,278,279,316,317,321,322,332,338,339,341,342,343,372,373,390,393,396,397,404,415,426,427,531,538,539,540,554,555,569,570,600,603,605,608,609,612,613,643,646,649,652,657,665,666,691,692,693,773,774,779,780,781,788,789,793,802,803,819,820,826,839,846,847,854,855,887,888,894,899,935,936,937,950,953,956,959,962,965,968,973,974,1007,1023,1026,1032,1039,1040,1048,1054,1079,1096,1099,1102,1105,1110,1113,1116,1121,1144,1152,1155,1158,1173,1185,222,311,312,313,344,345,346,387,391,394,408,409,411,412,416,432,433,440,444,448,449,452,457,551,606,617,631,632,633,695,696,794,796,797,800,822,823,827,829,830,837,843,861,880,885,892,895,896,909,910,911,934,946,977,1008,1012,1014,1018,1029,1035,1042,1050,1057,1060,1067,1070,1080,1081,1090,1107,1141,1180,1181,340,375,377,388,436,437,441,445,453,464,465,552,760,833,834,850,862,863,864,886,903,906,907,923,924,943,978,979,1024,1025,1033,1043,1046,1049,1058,1061,1064,1086,1094,1097,1100,1103,1106,1111,1114,1117,1128,1145,1150,1161,318,319,333,334,376,381,384,385,428,461,462,614,615,618,644,645,647,650,651,653,654,769,775,790,840,853,856,889,904,926,927,951,954,955,957,958,960,961,963,966,967,969,970,1020,1030,1036,1051,1055,1082,1108,1112,1115,1118,1122,1137,1151,1156,1159,1160,1174,1175,1176,1186,1187,382,405,406,818,824,835,838,844,883,900,901,929,1009,1010,1013,1015,1016,1019,1027,1071,1087,1088,1091,1142,1153,1157,1162,1164,1167,458,459,841,897,898,912,925,1031,1125,1154,1170,1177,378,379,429,648,821,831,865,952,964,980,1021,1022,1028,1034,1037,1052,1074,1083,1109,1123,1124,1129,1130,1131,1138,1163,1165,1168,1171,913,928,930,1072,1178,1084,1126,1134,1075,1139,1166,1169,931,1073,1132,1085,1127,1133,1076,1135,1136,1172],"Skill6PV":[12,21,22,23,24,25,26,30,31,32,55,56,57,73,74,75,139,140,141,142,143,144,145,146,147,148,149,150,154,155,0,13,14,19,20,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,67,91,92,93,94,95,96,97,103,104,105,118,119,120,121,122,127,128,129,151,152,153,156,1,2,15,16,17,18,27,28,29,98,99,112,113,114,115,116,123,124,125,126,157,158,159,163,164,791,9,10,11,52,53,54,68,69,117,160,161,162,166,167,226,227,228,106,107,108,109,110,111,133,134,135,165,168,804,3,4,5,6,7,8,58,59,60,61,62,63,64,65,66,70,71,72,76,77,78,82,83,84,229,230,231,259,260,261,544,547,625,734,79,80,81,85,86,87,88,89,90,100,101,102,514,619,752,753,755,756,770,771,805,971,984,985,986,996,997,998,347,348,349,350,351,353,354,505,508,545,548,549,595,596,626,627,628,746,747,806,810,875,876,920,921,922,993,994,130,131,132,172,173,174,175,176,178,179,180,183,187,188,189,190,191,192,193,194,199,200,201,208,209,210,211,212,213,214,215,216,232,233,234,241,242,243,249,256,257,258,267,268,269,270,271,272,273,283,284,286,287,292,293,299,300,302,303,304,305,306,307,308,309,310,320,335,336,337,355,368,371,386,398,399,400,401,402,407,410,413,414,420,430,446,466,467,468,472,473,475,476,477,483,490,491,492,502,503,504,507,511,512,515,517,518,519,535,536,537,546,550,553,556,557,558,559,568,571,574,580,581,582,583,584,585,589,590,591,592,593,594,597,604,607,620,621,622,658,659,661,662,664,667,668,669,676,679,682,694,713,714,716,717,719,720,728,729,730,735,736,754,792,795,811,812,813,814,815,825,828,845,866,867,868,869,870,877,884,890,891,914,915,916,932,933,944,945,947,948,972,975,989,995,1002,1003,1038,1062,1068,1092,1119,136,137,138,169,170,171,177,181,182,184,185,186,195,196,197,198,202,203,204,205,206,207,217,218,219,223,224,225,235,236,237,238,239,240,244,245,246,247,248,250,251,252,253,254,255,262,263,264,265,266,274,275,276,280,281,282,285,288,289,290,291,294,295,296,297,298,301,326,327,329,330,331,352,362,365,369,370,374,389,392,395,403,417,421,422,423,431,434,438,439,442,443,447,450,451,454,463,469,470,471,474,478,479,481,482,484,485,486,487,488,489,493,494,506,509,510,513,516,520,523,526,562,565,572,573,577,578,579,598,601,610,616,629,630,634,635,636,637,638,639,640,641,642,655,656,670,673,677,678,685,688,703,704,705,706,707,708,709,715,718,722,723,724,725,726,727,731,732,733,737,738,739,740,741,742,743,744,748,749,750,751,757,761,762,763,764,765,766,772,776,777,778,798,799,801,807,808,809,816,817,832,836,842,860,872,873,878,879,881,882,893,902,905,908,938,939,940,949,976,981,982,987,988,999,1000,1004,1005,1011,1017,1044,1047,1053,1065,1066,1069,1077,1089,1095,1098,1101,1104,1140,1143,1146,1147,1148,1179,1182,314,315,323,324,325,328,356,357,358,359,360,361,363,364,366,367,380,383,418,419,424,425,435,455,456,460,480,495,496,497,498,499,500,501,521,522,524,525,527,528,529,530,532,533,534,541,542,543,560,561,563,564,566,567,575,576,586,587,588,599,602,611,623,624,660,663,671,672,674,675,680,681,683,684,686,687,689,690,697,698,699,700,701,702,710,711,712,721,745,758,759,767,768,782,783,784,785,786,787,848,849,851,852,857,858,859,871,874,917,918,919,941,942,983,990,991,992,1001,1006,1041,1045,1056,1059,1063,1078,1093,1120,1149,1183,1184,220,221,277,278,279,316,317,321,322,332,338,339,341,342,343,372,373,390,393,396,397,404,415,426,427,531,538,539,540,554,555,569,570,600,603,605,608,609,612,613,643,646,649,652,657,665,666,691,692,693,773,774,779,780,781,788,789,793,802,803,819,820,826,839,846,847,854,855,887,888,894,899,935,936,937,950,953,956,959,962,965,968,973,974,1007,1023,1026,1032,1039,1040,1048,1054,1079,1096,1099,1102,1105,1110,1113,1116,1121,1144,1152,1155,1158,1173,1185,222,311,312,313,344,345,346,387,391,394,408,409,411,412,416,432,433,440,444,448,449,452,457,551,606,617,631,632,633,695,696,794,796,797,800,822,823,827,829,830,837,843,861,880,885,892,895,896,909,910,911,934,946,977,1008,1012,1014,1018,1029,1035,1042,1050,1057,1060,1067,1070,1080,1081,1090,1107,1141,1180,1181,340,375,377,388,436,437,441,445,453,464,465,552,760,833,834,850,862,863,864,886,903,906,907,923,924,943,978,979,1024,1025,1033,1043,1046,1049,1058,1061,1064,1086,1094,1097,1100,1103,1106,1111,1114,1117,1128,1145,1150,1161,318,319,333,334,376,381,384,385,428,461,462,614,615,618,644,645,647,650,651,653,654,769,775,790,840,853,856,889,904,926,927,951,954,955,957,958,960,961,963,966,967,969,970,1020,1030,1036,1051,1055,1082,1108,1112,1115,1118,1122,1137,1151,1156,1159,1160,1174,1175,1176,1186,1187,382,405,406,818,824,835,838,844,883,900,901,929,1009,1010,1013,1015,1016,1019,1027,1071,1087,1088,1091,1142,1153,1157,1162,1164,1167,458,459,831,841,897,898,912,925,1021,1022,1028,1031,1034,1083,1123,1124,1125,1131,1138,1154,1163,1170,1171,1177,378,379,429,648,821,865,913,928,930,952,964,980,1037,1052,1072,1074,1109,1129,1130,1165,1168,1178,1084,1126,1134,1075,1139,1166,1169,931,1073,1132,1085,1127,1133,1076,1135,1136,1172],"Skill7PV":[12,21,22,23,24,25,26,30,31,32,55,56,57,73,74,75,139,140,141,142,143,144,145,146,147,148,149,150,154,155,0,13,14,19,20,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,67,91,92,93,94,95,96,97,103,104,105,118,119,120,121,122,127,128,129,151,152,153,156,1,2,15,16,17,18,27,28,29,98,99,112,113,114,115,116,123,124,125,126,157,158,159,163,164,791,9,10,11,52,53,54,68,69,117,160,161,162,166,167,226,227,228,106,107,108,109,110,111,133,134,135,165,168,804,3,4,5,6,7,8,58,59,60,61,62,63,64,65,66,70,71,72,76,77,78,82,83,84,229,230,231,259,260,261,544,547,625,734,79,80,81,85,86,87,88,89,90,100,101,102,514,619,752,753,755,756,770,771,805,971,984,985,986,996,997,998,172,173,174,175,176,178,179,180,183,190,191,192,193,194,232,233,234,241,242,243,249,256,257,258,267,268,269,270,271,272,273,292,293,305,306,307,308,309,310,320,335,336,337,347,348,349,350,351,353,354,371,386,398,399,400,401,402,407,410,413,414,430,446,472,473,475,476,477,483,490,491,492,502,503,504,505,507,508,512,518,519,535,536,537,545,546,548,549,550,553,556,557,558,568,580,581,582,583,584,585,589,590,591,595,596,604,607,622,626,627,628,664,667,668,669,694,713,714,716,717,719,720,728,729,730,746,747,792,795,806,810,811,812,813,814,815,825,828,845,868,869,870,875,876,884,890,891,914,915,916,920,921,922,932,933,944,945,972,989,993,994,1002,1003,1038,1062,1092,1119,130,131,132,169,170,171,177,187,188,189,195,196,197,198,199,200,201,208,209,210,211,212,213,214,215,216,217,218,219,223,224,225,274,275,276,280,281,282,283,284,286,287,289,290,291,294,295,296,297,298,299,300,302,303,304,326,327,355,368,369,370,374,403,420,421,422,431,434,438,439,442,443,447,450,451,463,466,467,468,469,470,471,474,478,479,493,494,511,513,515,517,559,571,572,573,574,577,578,579,592,593,594,597,616,620,621,637,638,639,658,659,661,662,676,677,678,679,682,703,704,705,706,707,708,709,715,718,735,736,738,739,751,754,757,763,764,765,766,776,777,778,799,801,808,809,816,817,836,842,860,866,867,877,878,879,881,882,902,905,908,947,948,949,975,976,995,1004,1011,1017,1047,1053,1066,1068,1069,1089,1095,1098,1101,1104,1140,1143,1147,1148,1179,136,137,138,181,182,184,185,186,202,203,204,205,206,207,235,236,237,238,239,240,244,245,246,247,248,250,251,252,253,254,255,262,263,264,265,266,285,288,301,314,315,323,324,325,328,329,330,331,352,356,357,358,359,360,361,362,363,364,365,366,367,380,383,389,392,395,417,418,419,423,424,425,435,454,455,456,460,480,481,482,484,485,486,487,488,489,495,496,497,498,499,500,501,506,509,510,516,520,521,522,523,524,525,526,527,528,529,530,532,533,534,541,542,543,560,561,562,563,564,565,566,567,575,576,586,587,588,598,599,601,602,610,611,623,624,629,630,634,635,636,640,641,642,655,656,660,663,670,671,672,673,674,675,680,681,683,684,685,686,687,688,689,690,697,698,699,700,701,702,710,711,712,721,722,723,724,725,726,727,731,732,733,737,740,741,742,743,744,745,748,749,750,758,759,761,762,767,768,772,782,783,784,785,786,787,798,807,832,848,849,851,852,857,858,859,871,872,873,874,893,917,918,919,938,939,940,941,942,981,982,983,987,988,990,991,992,999,1000,1001,1005,1006,1041,1044,1045,1056,1059,1063,1065,1077,1078,1093,1120,1146,1149,1182,1183,1184,220,221,277,278,279,316,317,321,322,332,338,339,341,342,343,372,373,390,393,396,397,404,415,426,427,531,538,539,540,554,555,569,570,600,603,605,608,609,612,613,643,646,649,652,657,665,666,691,692,693,773,774,779,780,781,788,789,793,802,803,819,820,826,839,846,847,854,855,887,888,894,899,935,936,937,950,953,956,959,962,965,968,973,974,1007,1023,1026,1032,1039,1040,1048,1054,1079,1096,1099,1102,1105,1110,1113,1116,1121,1144,1152,1155,1158,1173,1185,222,311,312,313,344,345,346,387,391,394,408,409,411,412,416,432,433,440,444,448,449,452,457,551,606,617,631,632,633,695,696,794,796,797,800,822,823,827,829,830,837,843,861,880,885,892,895,896,909,910,911,934,946,977,1008,1012,1014,1018,1029,1035,1042,1050,1057,1060,1067,1070,1080,1081,1090,1107,1141,1180,1181,340,375,377,388,436,437,441,445,453,464,465,552,760,833,834,850,862,863,864,886,903,906,907,923,924,943,978,979,1024,1025,1033,1043,1046,1049,1058,1061,1064,1086,1094,1097,1100,1103,1106,1111,1114,1117,1128,1145,1150,1161,318,319,333,334,376,381,384,385,428,461,462,614,615,618,644,645,647,650,651,653,654,769,775,790,840,853,856,889,904,926,927,951,954,955,957,958,960,961,963,966,967,969,970,1020,1030,1036,1051,1055,1082,1108,1112,1115,1118,1122,1137,1151,1156,1159,1160,1174,1175,1176,1186,1187,382,405,406,818,824,831,835,838,844,883,900,901,929,1009,1010,1013,1015,1016,1019,1021,1022,1027,1028,1034,1071,1083,1087,1088,1091,1123,1124,1131,1138,1142,1153,1157,1162,1163,1164,1167,1171,458,459,841,897,898,912,913,925,928,930,1031,1072,1125,1154,1170,1177,1178,378,379,429,648,821,865,952,964,980,1037,1052,1074,1084,1109,1126,1129,1130,1134,1165,1168,1075,1139,1166,1169,931,1073,1132,1085,1127,1133,1076,1135,1136,1172]},"search":{"texts":["clan interface armor sqd4 clan interface armor sqd4","clan interface armor sqd5 clan interface armor sqd5","clan interface armor sqd6 clan interface armor sqd6","aerie pa l salvage sqd4 aerie pa l salvage sqd4","aerie pa l salvage sqd5 aerie pa l salvage sqd5","aerie pa l salvage sqd6 aerie pa l salvage sqd6","aerie pa l sqd4 aerie pa l sqd4","aerie pa l sqd5 aerie pa l sqd5","aerie pa l sqd6 aerie pa l sqd6","ailette rescue pa l sqd4 ailette rescue pa l sqd4","ailette rescue pa l sqd5 ailette rescue pa l sqd5","ailette rescue pa l sqd6 ailette rescue pa l sqd6","ailette zero g engineering exoskeleton sqd4 ailette zero g engineering exoskeleton sqd4","ailette zero g engineering exoskeleton sqd5 ailette zero g engineering exoskeleton sqd5","ailette zero g engineering exoskeleton sqd6 ailette zero g engineering exoskeleton sqd6","gladiator battle armor s sqd4 gladiator battle armor s sqd4","gladiator battle armor s sqd5 gladiator battle armor s sqd5","gladiator battle armor s sqd6 gladiator battle armor s sqd6","gladiator exoskeleton the spider sqd4 gladiator exoskeleton the spider sqd4","gladiator exoskeleton the spider sqd5 gladiator exoskeleton the spider sqd5","gladiator exoskeleton the spider sqd6 gladiator exoskeleton the spider sqd6","gladiator exoskeleton armored glove sqd4 gladiator exoskeleton armored glove sqd4","gladiator exoskeleton armored glove sqd5 gladiator exoskeleton armored glove sqd5","gladiator exoskeleton armored glove sqd6 gladiator exoskeleton armored glove sqd6","gladiator exoskeleton industrial drill sqd4 gladiator exoskeleton industrial drill sqd4","gladiator exoskeleton industrial drill sqd5 gladiator exoskeleton industrial drill sqd5","gladiator exoskeleton industrial drill sqd6 gladiator exoskeleton industrial drill sqd6","gorilla exoskeleton falcata sqd4 gorilla exoskeleton falcata sqd4","gorilla exoskeleton falcata sqd5 gorilla exoskeleton falcata sqd5","gorilla exoskeleton falcata sqd6 gorilla exoskeleton falcata sqd6","gorilla exoskeleton pex 2b sqd4 gorilla exoskeleton pex 2b sqd4","gorilla exoskeleton pex 2b sqd5 gorilla exoskeleton pex 2b sqd5","gorilla exoskeleton pex 2b sqd6 gorilla exoskeleton pex 2b sqd6","groundhog exoskeleton master thief sqd1 groundhog exoskeleton master thief sqd1","groundhog exoskeleton cex 205 armored glove sqd5 groundhog exoskeleton cex 205 armored glove sqd5","groundhog exoskeleton cex 205 armored glove sqd6 groundhog exoskeleton cex 205 armored glove sqd6","groundhog exoskeleton cex 205 armored glove sqd4 groundhog exoskeleton cex 205 armored glove sqd4","groundhog exoskeleton cex 205 basic manipulator sqd4 groundhog exoskeleton cex 205 basic manipulator sqd4","groundhog exoskeleton cex 205 basic manipulator sqd5 groundhog exoskeleton cex 205 basic manipulator sqd5","groundhog exoskeleton cex 205 basic manipulator sqd6 groundhog exoskeleton cex 205 basic manipulator sqd6","groundhog exoskeleton cex 205 cargo lifter sqd4 groundhog exoskeleton cex 205 cargo lifter sqd4","groundhog exoskeleton cex 205 cargo lifter sqd5 groundhog exoskeleton cex 205 cargo lifter sqd5","groundhog exoskeleton cex 205 cargo lifter sqd6 groundhog exoskeleton cex 205 cargo lifter sqd6","groundhog exoskeleton cex 205 industrial drill sqd4 groundhog exoskeleton cex 205 industrial drill sqd4","groundhog exoskeleton cex 205 industrial drill sqd5 groundhog exoskeleton cex 205 industrial drill sqd5","groundhog exoskeleton cex 205 industrial drill sqd6 groundhog exoskeleton cex 205 industrial drill sqd6","groundhog exoskeleton cex 205 mine clearance sqd4 groundhog exoskeleton cex 205 mine clearance sqd4","groundhog exoskeleton cex 205 mine clearance sqd5 groundhog exoskeleton cex 205 mine clearance sqd5","groundhog exoskeleton cex 205 mine clearance sqd6 groundhog exoskeleton cex 205 mine clearance sqd6","groundhog exoskeleton cex 205 salvage arm sqd4 groundhog exoskeleton cex 205 salvage arm sqd4","groundhog exoskeleton cex 205 salvage arm sqd5 groundhog exoskeleton cex 205 salvage arm sqd5","groundhog exoskeleton cex 205 salvage arm sqd6 groundhog exoskeleton cex 205 salvage arm sqd6","hantu aix 210 sqd4 hantu aix 210 sqd4","hantu aix 210 sqd5 hantu aix 210 sqd5","hantu aix 210 sqd6 hantu aix 210 sqd6","heavyhauler exoskeleton sqd4 heavyhauler exoskeleton sqd4","heavyhauler exoskeleton sqd5 heavyhauler exoskeleton sqd5","heavyhauler exoskeleton sqd6 heavyhauler exoskeleton sqd6","krise pa l sqd4 krise pa l sqd4","krise pa l sqd5 krise pa l sqd5","krise pa l sqd6 krise pa l sqd6","nighthawk pa l mk xxi sqd4 nighthawk pa l mk xxi sqd4","nighthawk pa l mk xxi sqd5 nighthawk pa l mk xxi sqd5","nighthawk pa l mk xxi sqd6 nighthawk pa l mk xxi sqd6","nighthawk pa l mk xxii sqd4 nighthawk pa l mk xxii sqd4","nighthawk pa l mk xxii sqd5 nighthawk pa l mk xxii sqd5","nighthawk pa l mk xxii sqd6 nighthawk pa l mk xxii sqd6","nighthawk pa l mk xxx bounty hunter sqd4 nighthawk pa l mk xxx bounty hunter sqd4","nighthawk pa l mk xxx bounty hunter sqd5 nighthawk pa l mk xxx bounty hunter sqd5","nighthawk pa l mk xxx bounty hunter sqd6 nighthawk pa l mk xxx bounty hunter sqd6","nighthawk pa l mk xxx sqd4 nighthawk pa l mk xxx sqd4","nighthawk pa l mk xxx sqd5 nighthawk pa l mk xxx sqd5","nighthawk pa l mk xxx sqd6 nighthawk pa l mk xxx sqd6","powerloader exoskeleton p 5000 sqd4 powerloader exoskeleton p 5000 sqd4","powerloader exoskeleton p 5000 sqd5 powerloader exoskeleton p 5000 sqd5","powerloader exoskeleton p 5000 sqd6 powerloader exoskeleton p 5000 sqd6","resgate pa l interdictor sqd4 resgate pa l interdictor sqd4","resgate pa l interdictor sqd5 resgate pa l interdictor sqd5","resgate pa l interdictor sqd6 resgate pa l interdictor sqd6","resgate pa l scout sqd4 resgate pa l scout sqd4","resgate pa l scout sqd5 resgate pa l scout sqd5","resgate pa l scout sqd6 resgate pa l scout sqd6","resgate pa l spotter sqd4 resgate pa l spotter sqd4","resgate pa l spotter sqd5 resgate pa l spotter sqd5","resgate pa l spotter sqd6 resgate pa l spotter sqd6","resgate pa l sqd4 resgate pa l sqd4","resgate pa l sqd5 resgate pa l sqd5","resgate pa l sqd6 resgate pa l sqd6","resgate pa l support sqd4 resgate pa l support sqd4","resgate pa l support sqd5 resgate pa l support sqd5","resgate pa l support sqd6 resgate pa l support sqd6","salrilla exoskeleton pex 2f salvage arm sqd4 salrilla exoskeleton pex 2f salvage arm sqd4","salrilla exoskeleton pex 2f salvage arm sqd5 salrilla exoskeleton pex 2f salvage arm sqd5","salrilla exoskeleton pex 2f salvage arm sqd6 salrilla exoskeleton pex 2f salvage arm sqd6","salrilla exoskeleton pex 2f mine clearance sqd4 salrilla exoskeleton pex 2f mine clearance sqd4","salrilla exoskeleton pex 2f mine clearance sqd5 salrilla exoskeleton pex 2f mine clearance sqd5","salrilla exoskeleton pex 2f mine clearance sqd6 salrilla exoskeleton pex 2f mine clearance sqd6","smoothdavid pa l ii sqd4 smoothdavid pa l ii sqd4","smoothdavid pa l ii sqd5 smoothdavid pa l ii sqd5","smoothdavid pa l ii sqd6 smoothdavid pa l ii sqd6","smoothdavid pa l iii sqd4 smoothdavid pa l iii sqd4","smoothdavid pa l iii sqd5 smoothdavid pa l iii sqd5","smoothdavid pa l iii sqd6 smoothdavid pa l iii sqd6","smoothgoliath pa l ii sqd4 smoothgoliath pa l ii sqd4","smoothgoliath pa l ii sqd5 smoothgoliath pa l ii sqd5","smoothgoliath pa l ii sqd6 smoothgoliath pa l ii sqd6","sniper suit pab 28 sqd4 sniper suit pab 28 sqd4","sniper suit pab 28 sqd5 sniper suit pab 28 sqd5","sniper suit pab 28 sqd6 sniper suit pab 28 sqd6","tornado pa l g12 sqd4 tornado pa l g12 sqd4","tornado pa l g12 sqd5 tornado pa l g12 sqd5","tornado pa l g12 sqd6 tornado pa l g12 sqd6","tornado pa l g13 david light gauss sqd4 tornado pa l g13 david light gauss sqd4","tornado pa l g13 david light gauss sqd5 tornado pa l g13 david light gauss sqd5","tornado pa l g13 david light gauss sqd6 tornado pa l g13 david light gauss sqd6","tornado pa l g13 flamer sqd4 tornado pa l g13 flamer sqd4","tornado pa l g13 flamer sqd5 tornado pa l g13 flamer sqd5","tornado pa l g13 flamer sqd6 tornado pa l g13 flamer sqd6","tornado pa l g13 grenade launcher sqd4 tornado pa l g13 grenade launcher sqd4","tornado pa l g13 grenade launcher sqd5 tornado pa l g13 grenade launcher sqd5","tornado pa l g13 grenade launcher sqd6 tornado pa l g13 grenade launcher sqd6","tornado pa l g13 machine gun sqd4 tornado pa l g13 machine gun sqd4","tornado pa l g13 machine gun sqd5 tornado pa l g13 machine gun sqd5","tornado pa l g13 machine gun sqd6 tornado pa l g13 machine gun sqd6","tornado pa l g13 small laser sqd4 tornado pa l g13 small laser sqd4","tornado pa l g13 small laser sqd5 tornado pa l g13 small laser sqd5","tornado pa l g13 small laser sqd6 tornado pa l g13 small laser sqd6","tornado pa l g14 sqd4 tornado pa l g14 sqd4","tornado pa l g14 sqd5 tornado pa l g14 sqd5","tornado pa l g14 sqd6 tornado pa l g14 sqd6","tornado pa l g17 sqd4 tornado pa l g17 sqd4","tornado pa l g17 sqd5 tornado pa l g17 sqd5","tornado pa l g17 sqd6 tornado pa l g17 sqd6","tornado pa l p12 hurricane sqd4 tornado pa l p12 hurricane sqd4","tornado pa l p12 hurricane sqd5 tornado pa l p12 hurricane sqd5","tornado pa l p12 hurricane sqd6 tornado pa l p12 hurricane sqd6","tornado pa l p17 hurricane sqd4 tornado pa l p17 hurricane sqd4","tornado pa l p17 hurricane sqd5 tornado pa l p17 hurricane sqd5","tornado pa l p17 hurricane sqd6 tornado pa l p17 hurricane sqd6","tunnel rat i mining exoskeleton armored glove sqd4 tunnel rat i mining exoskeleton armored glove sqd4","tunnel rat i mining exoskeleton armored glove sqd5 tunnel rat i mining exoskeleton armored glove sqd5","tunnel rat i mining exoskeleton armored glove sqd6 tunnel rat i mining exoskeleton armored glove sqd6","tunnel rat i mining exoskeleton industrial drill sqd4 tunnel rat i mining exoskeleton industrial drill sqd4","tunnel rat i mining exoskeleton industrial drill sqd5 tunnel rat i mining exoskeleton industrial drill sqd5","tunnel rat i mining exoskeleton industrial drill sqd6 tunnel rat i mining exoskeleton industrial drill sqd6","tunnel rat ii mining exoskeleton armored glove sqd4 tunnel rat ii mining exoskeleton armored glove sqd4","tunnel rat ii mining exoskeleton armored glove sqd5 tunnel rat ii mining exoskeleton armored glove sqd5","tunnel rat ii mining exoskeleton armored glove sqd6 tunnel rat ii mining exoskeleton armored glove sqd6","tunnel rat ii mining exoskeleton industrial drill sqd4 tunnel rat ii mining exoskeleton industrial drill sqd4","tunnel rat ii mining exoskeleton industrial drill sqd5 tunnel rat ii mining exoskeleton industrial drill sqd5","tunnel rat ii mining exoskeleton industrial drill sqd6 tunnel rat ii mining exoskeleton industrial drill sqd6","tunnel rat iii mining exoskeleton armored glove sqd4 tunnel rat iii mining exoskeleton armored glove sqd4","tunnel rat iii mining exoskeleton armored glove sqd5 tunnel rat iii mining exoskeleton armored glove sqd5","tunnel rat iii mining exoskeleton armored glove sqd6 tunnel rat iii mining exoskeleton armored glove sqd6","tunnel rat iii mining exoskeleton industrial drill sqd4 tunnel rat iii mining exoskeleton industrial drill sqd4","tunnel rat iii mining exoskeleton industrial drill sqd5 tunnel rat iii mining exoskeleton industrial drill sqd5","tunnel rat iii mining exoskeleton industrial drill sqd6 tunnel rat iii mining exoskeleton industrial drill sqd6","tunnel rat iv mining exoskeleton armored glove gl sqd4 tunnel rat iv mining exoskeleton armored glove gl sqd4","tunnel rat iv mining exoskeleton armored glove gl sqd5 tunnel rat iv mining exoskeleton armored glove gl sqd5","tunnel rat iv mining exoskeleton armored glove gl sqd6 tunnel rat iv mining exoskeleton armored glove gl sqd6","tunnel rat iv mining exoskeleton armored glove lmg sqd4 tunnel rat iv mining exoskeleton armored glove lmg sqd4","tunnel rat iv mining exoskeleton armored glove lmg sqd5 tunnel rat iv mining exoskeleton armored glove lmg sqd5","tunnel rat iv mining exoskeleton armored glove lmg sqd6 tunnel rat iv mining exoskeleton armored glove lmg sqd6","tunnel rat iv mining exoskeleton battle claw gl sqd4 tunnel rat iv mining exoskeleton battle claw gl sqd4","tunnel rat iv mining exoskeleton battle claw gl sqd5 tunnel rat iv mining exoskeleton battle claw gl sqd5","tunnel rat iv mining exoskeleton battle claw gl sqd6 tunnel rat iv mining exoskeleton battle claw gl sqd6","tunnel rat iv mining exoskeleton battle claw lmg sqd4 tunnel rat iv mining exoskeleton battle claw lmg sqd4","tunnel rat iv mining exoskeleton battle claw lmg sqd5 tunnel rat iv mining exoskeleton battle claw lmg sqd5","tunnel rat iv mining exoskeleton battle claw lmg sqd6 tunnel rat iv mining exoskeleton battle claw lmg sqd6","achileus light battle armor wob sqd4 achileus light battle armor wob sqd4","achileus light battle armor wob sqd5 achileus light battle armor wob sqd5","achileus light battle armor wob sqd6 achileus light battle armor wob sqd6","achileus light battle armor david sqd4 achileus light battle armor david sqd4","achileus light battle armor david sqd5 achileus light battle armor david sqd5","achileus light battle armor david sqd6 achileus light battle armor david sqd6","achileus light battle armor flamer sqd4 achileus light battle armor flamer sqd4","achileus light battle armor flamer sqd5 achileus light battle armor flamer sqd5","achileus light battle armor flamer sqd6 achileus light battle armor flamer sqd6","achileus light battle armor laser sqd4 achileus light battle armor laser sqd4","achileus light battle armor laser sqd5 achileus light battle armor laser sqd5","achileus light battle armor laser sqd6 achileus light battle armor laser sqd6","achileus light battle armor mg sqd4 achileus light battle armor mg sqd4","achileus light battle armor mg sqd5 achileus light battle armor mg sqd5","achileus light battle armor mg sqd6 achileus light battle armor mg sqd6","achileus light battle armor tag sqd4 achileus light battle armor tag sqd4","achileus light battle armor tag sqd5 achileus light battle armor tag sqd5","achileus light battle armor tag sqd6 achileus light battle armor tag sqd6","constable pacification suit ecm sqd4 constable pacification suit ecm sqd4","constable pacification suit ecm sqd5 constable pacification suit ecm sqd5","constable pacification suit ecm sqd6 constable pacification suit ecm sqd6","constable pacification suit lmg sqd4 constable pacification suit lmg sqd4","constable pacification suit lmg sqd5 constable pacification suit lmg sqd5","constable pacification suit lmg sqd6 constable pacification suit lmg sqd6","constable pacification suit sensor sqd4 constable pacification suit sensor sqd4","constable pacification suit sensor sqd5 constable pacification suit sensor sqd5","constable pacification suit sensor sqd6 constable pacification suit sensor sqd6","constable pacification suit srm sqd4 constable pacification suit srm sqd4","constable pacification suit srm sqd5 constable pacification suit srm sqd5","constable pacification suit srm sqd6 constable pacification suit srm sqd6","constable pacification suit tag sqd4 constable pacification suit tag sqd4","constable pacification suit tag sqd5 constable pacification suit tag sqd5","constable pacification suit tag sqd6 constable pacification suit tag sqd6","djinn battle armor reflective terrorizer flamer sqd4 djinn battle armor reflective terrorizer flamer sqd4","djinn battle armor reflective terrorizer flamer sqd5 djinn battle armor reflective terrorizer flamer sqd5","djinn battle armor reflective terrorizer flamer sqd6 djinn battle armor reflective terrorizer flamer sqd6","djinn battle armor reflective terrorizer laser sqd4 djinn battle armor reflective terrorizer laser sqd4","djinn battle armor reflective terrorizer laser sqd5 djinn battle armor reflective terrorizer laser sqd5","djinn battle armor reflective terrorizer laser sqd6 djinn battle armor reflective terrorizer laser sqd6","djinn battle armor reflective terrorizer mg sqd4 djinn battle armor reflective terrorizer mg sqd4","djinn battle armor reflective terrorizer mg sqd5 djinn battle armor reflective terrorizer mg sqd5","djinn battle armor reflective terrorizer mg sqd6 djinn battle armor reflective terrorizer mg sqd6","djinn battle armor sqd4 djinn battle armor sqd4","djinn battle armor sqd5 djinn battle armor sqd5","djinn battle armor sqd6 djinn battle armor sqd6","djinn battle armor stealth sqd4 djinn battle armor stealth sqd4","djinn battle armor stealth sqd5 djinn battle armor stealth sqd5","djinn battle armor stealth sqd6 djinn battle armor stealth sqd6","gray death scout suit the willow wisps sqd4 gray death scout suit the willow wisps sqd4","gray death scout suit the willow wisps sqd5 gray death scout suit the willow wisps sqd5","gray death scout suit the willow wisps sqd6 gray death scout suit the willow wisps sqd6","gray death scout suit reaper sqd4 gray death scout suit reaper sqd4","gray death scout suit reaper sqd5 gray death scout suit reaper sqd5","gray death scout suit reaper sqd6 gray death scout suit reaper sqd6","gray death scout suit sqd4 gray death scout suit sqd4","gray death scout suit sqd5 gray death scout suit sqd5","gray death scout suit sqd6 gray death scout suit sqd6","infiltrator mk i battle armor waddle sqd4 infiltrator mk i battle armor waddle sqd4","infiltrator mk i battle armor waddle sqd5 infiltrator mk i battle armor waddle sqd5","infiltrator mk i battle armor waddle sqd6 infiltrator mk i battle armor waddle sqd6","infiltrator mk i battle armor special ops sqd4 infiltrator mk i battle armor special ops sqd4","infiltrator mk i battle armor special ops sqd5 infiltrator mk i battle armor special ops sqd5","infiltrator mk i battle armor special ops sqd6 infiltrator mk i battle armor special ops sqd6","kage light battle armor dest sqd4 kage light battle armor dest sqd4","kage light battle armor dest sqd5 kage light battle armor dest sqd5","kage light battle armor dest sqd6 kage light battle armor dest sqd6","kage light battle armor space sqd4 kage light battle armor space sqd4","kage light battle armor space sqd5 kage light battle armor space sqd5","kage light battle armor space sqd6 kage light battle armor space sqd6","kage light battle armor vibro claw sqd4 kage light battle armor vibro claw sqd4","kage light battle armor vibro claw sqd5 kage light battle armor vibro claw sqd5","kage light battle armor vibro claw sqd6 kage light battle armor vibro claw sqd6","kage light battle armor ecm sqd4 kage light battle armor ecm sqd4","kage light battle armor ecm sqd5 kage light battle armor ecm sqd5","kage light battle armor ecm sqd6 kage light battle armor ecm sqd6","kage light battle armor flamer sqd4 kage light battle armor flamer sqd4","kage light battle armor flamer sqd5 kage light battle armor flamer sqd5","kage light battle armor flamer sqd6 kage light battle armor flamer sqd6","kage light battle armor laser sqd4 kage light battle armor laser sqd4","kage light battle armor laser sqd5 kage light battle armor laser sqd5","kage light battle armor laser sqd6 kage light battle armor laser sqd6","kage light battle armor mg sqd4 kage light battle armor mg sqd4","kage light battle armor mg sqd5 kage light battle armor mg sqd5","kage light battle armor mg sqd6 kage light battle armor mg sqd6","kage light battle armor tag sqd4 kage light battle armor tag sqd4","kage light battle armor tag sqd5 kage light battle armor tag sqd5","kage light battle armor tag sqd6 kage light battle armor tag sqd6","kage light battle armor c sqd4 kage light battle armor c sqd4","kage light battle armor c sqd5 kage light battle armor c sqd5","kage light battle armor c sqd6 kage light battle armor c sqd6","kishi battle armor sqd4 kishi battle armor sqd4","kishi battle armor sqd5 kishi battle armor sqd5","kishi battle armor sqd6 kishi battle armor sqd6","kobold battle armor microgl flamer sqd4 kobold battle armor microgl flamer sqd4","kobold battle armor microgl flamer sqd5 kobold battle armor microgl flamer sqd5","kobold battle armor microgl flamer sqd6 kobold battle armor microgl flamer sqd6","kobold battle armor microgl spl sqd4 kobold battle armor microgl spl sqd4","kobold battle armor microgl spl sqd5 kobold battle armor microgl spl sqd5","kobold battle armor microgl spl sqd6 kobold battle armor microgl spl sqd6","kobold battle armor microgl tag sqd4 kobold battle armor microgl tag sqd4","kobold battle armor microgl tag sqd5 kobold battle armor microgl tag sqd5","kobold battle armor microgl tag sqd6 kobold battle armor microgl tag sqd6","kobold battle armor sl flamer sqd4 kobold battle armor sl flamer sqd4","kobold battle armor sl flamer sqd5 kobold battle armor sl flamer sqd5","kobold battle armor sl flamer sqd6 kobold battle armor sl flamer sqd6","kobold battle armor sl tag sqd4 kobold battle armor sl tag sqd4","kobold battle armor sl tag sqd5 kobold battle armor sl tag sqd5","kobold battle armor sl tag sqd6 kobold battle armor sl tag sqd6","kobold battle armor iic sqd4 kobold battle armor iic sqd4","kobold battle armor iic sqd5 kobold battle armor iic sqd5","kobold battle armor iic sqd6 kobold battle armor iic sqd6","kobold battle armor x c3 sqd4 kobold battle armor x c3 sqd4","kobold battle armor x c3 sqd5 kobold battle armor x c3 sqd5","kobold battle armor x c3 sqd6 kobold battle armor x c3 sqd6","sea fox amphibious armor sqd4 sea fox amphibious armor sqd4","sea fox amphibious armor sqd5 sea fox amphibious armor sqd5","sea fox amphibious armor sqd6 sea fox amphibious armor sqd6","spectre stealth battle armor sqd4 spectre stealth battle armor sqd4","spectre stealth battle armor sqd5 spectre stealth battle armor sqd5","spectre stealth battle armor sqd6 spectre stealth battle armor sqd6","sylph battle armor sqd4 sylph battle armor sqd4","sylph battle armor sqd5 sylph battle armor sqd5","sylph battle armor sqd6 sylph battle armor sqd6","sylph battle armor upgrade sqd4 sylph battle armor upgrade sqd4","sylph battle armor upgrade sqd5 sylph battle armor upgrade sqd5","sylph battle armor upgrade sqd6 sylph battle armor upgrade sqd6","sylph battle armor xr sqd4 sylph battle armor xr sqd4","sylph battle armor xr sqd5 sylph battle armor xr sqd5","sylph battle armor xr sqd6 sylph battle armor xr sqd6","sylph battle armor tinkerbelle sqd4 sylph battle armor tinkerbelle sqd4","sylph battle armor enhanced sqd4 sylph battle armor enhanced sqd4","sylph battle armor enhanced sqd5 sylph battle armor enhanced sqd5","sylph battle armor enhanced sqd6 sylph battle armor enhanced sqd6","aegis point defense suit sqd4 aegis point defense suit sqd4","aegis point defense suit sqd5 aegis point defense suit sqd5","aegis point defense suit sqd6 aegis point defense suit sqd6","afreet medium battle armor hell s horses sqd4 afreet medium battle armor hell s horses sqd4","afreet medium battle armor hell s horses sqd5 afreet medium battle armor hell s horses sqd5","afreet medium battle armor hell s horses sqd6 afreet medium battle armor hell s horses sqd6","afreet medium battle armor interdictor sqd4 afreet medium battle armor interdictor sqd4","afreet medium battle armor interdictor sqd5 afreet medium battle armor interdictor sqd5","afreet medium battle armor interdictor sqd6 afreet medium battle armor interdictor sqd6","afreet medium battle armor jade falcon sqd4 afreet medium battle armor jade falcon sqd4","afreet medium battle armor jade falcon sqd5 afreet medium battle armor jade falcon sqd5","afreet medium battle armor jade falcon sqd6 afreet medium battle armor jade falcon sqd6","afreet medium battle armor sqd4 afreet medium battle armor sqd4","afreet medium battle armor sqd5 afreet medium battle armor sqd5","afreet medium battle armor sqd6 afreet medium battle armor sqd6","amazon battle armor mrr sqd4 amazon battle armor mrr sqd4","amazon battle armor mrr sqd5 amazon battle armor mrr sqd5","amazon battle armor mrr sqd6 amazon battle armor mrr sqd6","amazon battle armor ppc sqd4 amazon battle armor ppc sqd4","amazon battle armor ppc sqd5 amazon battle armor ppc sqd5","amazon battle armor ppc sqd6 amazon battle armor ppc sqd6","angerona scout suit recon sqd4 angerona scout suit recon sqd4","angerona scout suit recon sqd5 angerona scout suit recon sqd5","angerona scout suit recon sqd6 angerona scout suit recon sqd6","angerona scout suit sqd4 angerona scout suit sqd4","angerona scout suit sqd5 angerona scout suit sqd5","angerona scout suit sqd6 angerona scout suit sqd6","asura medium battle armor anti infantry sqd4 asura medium battle armor anti infantry sqd4","asura medium battle armor anti infantry sqd5 asura medium battle armor anti infantry sqd5","asura medium battle armor anti infantry sqd6 asura medium battle armor anti infantry sqd6","asura medium battle armor sqd4 asura medium battle armor sqd4","asura medium battle armor sqd5 asura medium battle armor sqd5","asura medium battle armor sqd6 asura medium battle armor sqd6","asura medium battle armor srm sqd4 asura medium battle armor srm sqd4","asura medium battle armor srm sqd5 asura medium battle armor srm sqd5","asura medium battle armor srm sqd6 asura medium battle armor srm sqd6","buraq fast battle armor hunter killer sqd4 buraq fast battle armor hunter killer sqd4","buraq fast battle armor hunter killer sqd5 buraq fast battle armor hunter killer sqd5","buraq fast battle armor hunter killer sqd6 buraq fast battle armor hunter killer sqd6","buraq fast battle armor sqd4 buraq fast battle armor sqd4","buraq fast battle armor sqd5 buraq fast battle armor sqd5","buraq fast battle armor sqd6 buraq fast battle armor sqd6","buraq fast battle armor support sqd4 buraq fast battle armor support sqd4","buraq fast battle armor support sqd5 buraq fast battle armor support sqd5","buraq fast battle armor support sqd6 buraq fast battle armor support sqd6","callisto battle armor a bearhunter sqd4 callisto battle armor a bearhunter sqd4","callisto battle armor a bearhunter sqd5 callisto battle armor a bearhunter sqd5","callisto battle armor a bearhunter sqd6 callisto battle armor a bearhunter sqd6","callisto battle armor a er laser sqd4 callisto battle armor a er laser sqd4","callisto battle armor a er laser sqd5 callisto battle armor a er laser sqd5","callisto battle armor a er laser sqd6 callisto battle armor a er laser sqd6","callisto battle armor a hmg sqd4 callisto battle armor a hmg sqd4","callisto battle armor a hmg sqd5 callisto battle armor a hmg sqd5","callisto battle armor a hmg sqd6 callisto battle armor a hmg sqd6","callisto battle armor b mrr sqd4 callisto battle armor b mrr sqd4","callisto battle armor b mrr sqd5 callisto battle armor b mrr sqd5","callisto battle armor b mrr sqd6 callisto battle armor b mrr sqd6","callisto battle armor b srm sqd4 callisto battle armor b srm sqd4","callisto battle armor b srm sqd5 callisto battle armor b srm sqd5","callisto battle armor b srm sqd6 callisto battle armor b srm sqd6","cavalier battle armor flamer sqd4 cavalier battle armor flamer sqd4","cavalier battle armor flamer sqd5 cavalier battle armor flamer sqd5","cavalier battle armor flamer sqd6 cavalier battle armor flamer sqd6","cavalier battle armor laser sqd4 cavalier battle armor laser sqd4","cavalier battle armor laser sqd5 cavalier battle armor laser sqd5","cavalier battle armor laser sqd6 cavalier battle armor laser sqd6","cavalier battle armor mg sqd4 cavalier battle armor mg sqd4","cavalier battle armor mg sqd5 cavalier battle armor mg sqd5","cavalier battle armor mg sqd6 cavalier battle armor mg sqd6","cavalier battle armor srm sqd4 cavalier battle armor srm sqd4","cavalier battle armor srm sqd5 cavalier battle armor srm sqd5","cavalier battle armor srm sqd6 cavalier battle armor srm sqd6","cavalier ii battle armor flamer sqd4 cavalier ii battle armor flamer sqd4","cavalier ii battle armor flamer sqd5 cavalier ii battle armor flamer sqd5","cavalier ii battle armor flamer sqd6 cavalier ii battle armor flamer sqd6","cavalier ii battle armor mrr sqd4 cavalier ii battle armor mrr sqd4","cavalier ii battle armor mrr sqd5 cavalier ii battle armor mrr sqd5","cavalier ii battle armor mrr sqd6 cavalier ii battle armor mrr sqd6","cavalier ii battle armor ppc sqd4 cavalier ii battle armor ppc sqd4","cavalier ii battle armor ppc sqd5 cavalier ii battle armor ppc sqd5","cavalier ii battle armor ppc sqd6 cavalier ii battle armor ppc sqd6","cavalier ii battle armor srm sqd4 cavalier ii battle armor srm sqd4","cavalier ii battle armor srm sqd5 cavalier ii battle armor srm sqd5","cavalier ii battle armor srm sqd6 cavalier ii battle armor srm sqd6","clan medium battle armor rabid sqd4 clan medium battle armor rabid sqd4","clan medium battle armor rabid sqd5 clan medium battle armor rabid sqd5","clan medium battle armor rabid sqd6 clan medium battle armor rabid sqd6","clan medium battle armor rache sqd4 clan medium battle armor rache sqd4","clan medium battle armor rache sqd5 clan medium battle armor rache sqd5","clan medium battle armor rache sqd6 clan medium battle armor rache sqd6","clan medium battle armor laser volk sqd4 clan medium battle armor laser volk sqd4","clan medium battle armor laser volk sqd5 clan medium battle armor laser volk sqd5","clan medium battle armor laser volk sqd6 clan medium battle armor laser volk sqd6","clan medium battle armor naval bar sqd4 clan medium battle armor naval bar sqd4","clan medium battle armor naval bar sqd5 clan medium battle armor naval bar sqd5","clan medium battle armor naval bar sqd6 clan medium battle armor naval bar sqd6","dragoon battle armor advanced sqd4 dragoon battle armor advanced sqd4","dragoon battle armor advanced sqd5 dragoon battle armor advanced sqd5","dragoon battle armor advanced sqd6 dragoon battle armor advanced sqd6","dragoon battle armor sqd4 dragoon battle armor sqd4","dragoon battle armor sqd5 dragoon battle armor sqd5","dragoon battle armor sqd6 dragoon battle armor sqd6","elemental battle armor fire ap gauss sqd4 elemental battle armor fire ap gauss sqd4","elemental battle armor fire ap gauss sqd5 elemental battle armor fire ap gauss sqd5","elemental battle armor fire ap gauss sqd6 elemental battle armor fire ap gauss sqd6","elemental battle armor fire flamer sqd4 elemental battle armor fire flamer sqd4","elemental battle armor fire flamer sqd5 elemental battle armor fire flamer sqd5","elemental battle armor fire flamer sqd6 elemental battle armor fire flamer sqd6","elemental battle armor fire micropl sqd4 elemental battle armor fire micropl sqd4","elemental battle armor fire micropl sqd5 elemental battle armor fire micropl sqd5","elemental battle armor fire micropl sqd6 elemental battle armor fire micropl sqd6","elemental battle armor headhunter sqd3 elemental battle armor headhunter sqd3","elemental battle armor headhunter sqd4 elemental battle armor headhunter sqd4","elemental battle armor headhunter sqd5 elemental battle armor headhunter sqd5","elemental battle armor headhunter sqd6 elemental battle armor headhunter sqd6","elemental battle armor space flamer sqd4 elemental battle armor space flamer sqd4","elemental battle armor space flamer sqd5 elemental battle armor space flamer sqd5","elemental battle armor space flamer sqd6 elemental battle armor space flamer sqd6","elemental battle armor space mg sqd4 elemental battle armor space mg sqd4","elemental battle armor space mg sqd5 elemental battle armor space mg sqd5","elemental battle armor space mg sqd6 elemental battle armor space mg sqd6","elemental battle armor space micropl sqd4 elemental battle armor space micropl sqd4","elemental battle armor space micropl sqd5 elemental battle armor space micropl sqd5","elemental battle armor space micropl sqd6 elemental battle armor space micropl sqd6","elemental battle armor ap gauss sqd3 elemental battle armor ap gauss sqd3","elemental battle armor ap gauss sqd4 elemental battle armor ap gauss sqd4","elemental battle armor ap gauss sqd5 elemental battle armor ap gauss sqd5","elemental battle armor ap gauss sqd6 elemental battle armor ap gauss sqd6","elemental battle armor ermicrol sqd3 elemental battle armor ermicrol sqd3","elemental battle armor ermicrol sqd4 elemental battle armor ermicrol sqd4","elemental battle armor ermicrol sqd5 elemental battle armor ermicrol sqd5","elemental battle armor ermicrol sqd6 elemental battle armor ermicrol sqd6","elemental battle armor flamer sqd3 elemental battle armor flamer sqd3","elemental battle armor flamer sqd4 elemental battle armor flamer sqd4","elemental battle armor flamer sqd5 elemental battle armor flamer sqd5","elemental battle armor flamer sqd6 elemental battle armor flamer sqd6","elemental battle armor hmg sqd3 elemental battle armor hmg sqd3","elemental battle armor hmg sqd4 elemental battle armor hmg sqd4","elemental battle armor hmg sqd5 elemental battle armor hmg sqd5","elemental battle armor hmg sqd6 elemental battle armor hmg sqd6","elemental battle armor laser sqd3 elemental battle armor laser sqd3","elemental battle armor laser sqd4 elemental battle armor laser sqd4","elemental battle armor laser sqd5 elemental battle armor laser sqd5","elemental battle armor laser sqd6 elemental battle armor laser sqd6","elemental battle armor mg sqd3 elemental battle armor mg sqd3","elemental battle armor mg sqd4 elemental battle armor mg sqd4","elemental battle armor mg sqd5 elemental battle armor mg sqd5","elemental battle armor mg sqd6 elemental battle armor mg sqd6","elemental battle armor micropl sqd3 elemental battle armor micropl sqd3","elemental battle armor micropl sqd4 elemental battle armor micropl sqd4","elemental battle armor micropl sqd5 elemental battle armor micropl sqd5","elemental battle armor micropl sqd6 elemental battle armor micropl sqd6","elemental ii battle armor sqd4 elemental ii battle armor sqd4","elemental ii battle armor sqd5 elemental ii battle armor sqd5","elemental ii battle armor sqd6 elemental ii battle armor sqd6","elemental iii battle armor ap gauss sqd4 elemental iii battle armor ap gauss sqd4","elemental iii battle armor ap gauss sqd5 elemental iii battle armor ap gauss sqd5","elemental iii battle armor ap gauss sqd6 elemental iii battle armor ap gauss sqd6","elemental iii battle armor flamer sqd4 elemental iii battle armor flamer sqd4","elemental iii battle armor flamer sqd5 elemental iii battle armor flamer sqd5","elemental iii battle armor flamer sqd6 elemental iii battle armor flamer sqd6","elemental iii battle armor micropl sqd4 elemental iii battle armor micropl sqd4","elemental iii battle armor micropl sqd5 elemental iii battle armor micropl sqd5","elemental iii battle armor micropl sqd6 elemental iii battle armor micropl sqd6","fa shih battle armor support king david sqd4 fa shih battle armor support king david sqd4","fa shih battle armor support king david sqd5 fa shih battle armor support king david sqd5","fa shih battle armor support king david sqd6 fa shih battle armor support king david sqd6","fa shih battle armor support plasma sqd4 fa shih battle armor support plasma sqd4","fa shih battle armor support plasma sqd5 fa shih battle armor support plasma sqd5","fa shih battle armor support plasma sqd6 fa shih battle armor support plasma sqd6","fa shih battle armor flamer sqd4 fa shih battle armor flamer sqd4","fa shih battle armor flamer sqd5 fa shih battle armor flamer sqd5","fa shih battle armor flamer sqd6 fa shih battle armor flamer sqd6","fa shih battle armor laser sqd4 fa shih battle armor laser sqd4","fa shih battle armor laser sqd5 fa shih battle armor laser sqd5","fa shih battle armor laser sqd6 fa shih battle armor laser sqd6","fa shih battle armor lrr sqd4 fa shih battle armor lrr sqd4","fa shih battle armor lrr sqd5 fa shih battle armor lrr sqd5","fa shih battle armor lrr sqd6 fa shih battle armor lrr sqd6","fa shih battle armor mg sqd4 fa shih battle armor mg sqd4","fa shih battle armor mg sqd5 fa shih battle armor mg sqd5","fa shih battle armor mg sqd6 fa shih battle armor mg sqd6","fa shih battle armor tag sqd4 fa shih battle armor tag sqd4","fa shih battle armor tag sqd5 fa shih battle armor tag sqd5","fa shih battle armor tag sqd6 fa shih battle armor tag sqd6","fa shih battle armor 2 mg sqd4 fa shih battle armor 2 mg sqd4","fa shih battle armor 2 mg sqd5 fa shih battle armor 2 mg sqd5","fa shih battle armor 2 mg sqd6 fa shih battle armor 2 mg sqd6","gray death infiltrator suit firedrake sqd4 gray death infiltrator suit firedrake sqd4","gray death infiltrator suit firedrake sqd5 gray death infiltrator suit firedrake sqd5","gray death infiltrator suit firedrake sqd6 gray death infiltrator suit firedrake sqd6","gray death infiltrator suit mines sqd4 gray death infiltrator suit mines sqd4","gray death infiltrator suit mines sqd5 gray death infiltrator suit mines sqd5","gray death infiltrator suit mines sqd6 gray death infiltrator suit mines sqd6","gray death infiltrator suit remote sensors sqd4 gray death infiltrator suit remote sensors sqd4","gray death infiltrator suit remote sensors sqd5 gray death infiltrator suit remote sensors sqd5","gray death infiltrator suit remote sensors sqd6 gray death infiltrator suit remote sensors sqd6","gray death infiltrator suit sensors sqd4 gray death infiltrator suit sensors sqd4","gray death infiltrator suit sensors sqd5 gray death infiltrator suit sensors sqd5","gray death infiltrator suit sensors sqd6 gray death infiltrator suit sensors sqd6","gray death infiltrator suit tag sqd4 gray death infiltrator suit tag sqd4","gray death infiltrator suit tag sqd5 gray death infiltrator suit tag sqd5","gray death infiltrator suit tag sqd6 gray death infiltrator suit tag sqd6","gray death standard suit flamer sqd4 gray death standard suit flamer sqd4","gray death standard suit flamer sqd5 gray death standard suit flamer sqd5","gray death standard suit flamer sqd6 gray death standard suit flamer sqd6","gray death standard suit laser sqd4 gray death standard suit laser sqd4","gray death standard suit laser sqd5 gray death standard suit laser sqd5","gray death standard suit laser sqd6 gray death standard suit laser sqd6","gray death standard suit lrr sqd4 gray death standard suit lrr sqd4","gray death standard suit lrr sqd5 gray death standard suit lrr sqd5","gray death standard suit lrr sqd6 gray death standard suit lrr sqd6","gray death standard suit mg sqd4 gray death standard suit mg sqd4","gray death standard suit mg sqd5 gray death standard suit mg sqd5","gray death standard suit mg sqd6 gray death standard suit mg sqd6","gray death standard suit srm sqd4 gray death standard suit srm sqd4","gray death standard suit srm sqd5 gray death standard suit srm sqd5","gray death standard suit srm sqd6 gray death standard suit srm sqd6","gray death strike suit harjel sqd4 gray death strike suit harjel sqd4","gray death strike suit harjel sqd5 gray death strike suit harjel sqd5","gray death strike suit harjel sqd6 gray death strike suit harjel sqd6","gray death strike suit prototype sqd4 gray death strike suit prototype sqd4","gray death strike suit prototype sqd5 gray death strike suit prototype sqd5","gray death strike suit prototype sqd6 gray death strike suit prototype sqd6","gray death strike suit sqd4 gray death strike suit sqd4","gray death strike suit sqd5 gray death strike suit sqd5","gray death strike suit sqd6 gray death strike suit sqd6","infiltrator mk ii battle armor puma sqd4 infiltrator mk ii battle armor puma sqd4","infiltrator mk ii battle armor puma sqd5 infiltrator mk ii battle armor puma sqd5","infiltrator mk ii battle armor puma sqd6 infiltrator mk ii battle armor puma sqd6","infiltrator mk ii battle armor magnetic sqd4 infiltrator mk ii battle armor magnetic sqd4","infiltrator mk ii battle armor magnetic sqd5 infiltrator mk ii battle armor magnetic sqd5","infiltrator mk ii battle armor magnetic sqd6 infiltrator mk ii battle armor magnetic sqd6","infiltrator mk ii battle armor marine sqd4 infiltrator mk ii battle armor marine sqd4","infiltrator mk ii battle armor marine sqd5 infiltrator mk ii battle armor marine sqd5","infiltrator mk ii battle armor marine sqd6 infiltrator mk ii battle armor marine sqd6","infiltrator mk ii battle armor sensor sqd4 infiltrator mk ii battle armor sensor sqd4","infiltrator mk ii battle armor sensor sqd5 infiltrator mk ii battle armor sensor sqd5","infiltrator mk ii battle armor sensor sqd6 infiltrator mk ii battle armor sensor sqd6","infiltrator mk ii battle armor coral intent sqd4 infiltrator mk ii battle armor coral intent sqd4","infiltrator mk ii battle armor coral intent sqd5 infiltrator mk ii battle armor coral intent sqd5","infiltrator mk ii battle armor coral intent sqd6 infiltrator mk ii battle armor coral intent sqd6","is standard battle armor baka lrr sqd4 is standard battle armor baka lrr sqd4","is standard battle armor baka lrr sqd5 is standard battle armor baka lrr sqd5","is standard battle armor baka lrr sqd6 is standard battle armor baka lrr sqd6","is standard battle armor baka sl sqd4 is standard battle armor baka sl sqd4","is standard battle armor baka sl sqd5 is standard battle armor baka sl sqd5","is standard battle armor baka sl sqd6 is standard battle armor baka sl sqd6","is standard battle armor fa sure david sqd4 is standard battle armor fa sure david sqd4","is standard battle armor fa sure david sqd5 is standard battle armor fa sure david sqd5","is standard battle armor fa sure david sqd6 is standard battle armor fa sure david sqd6","is standard battle armor fa sure mg sqd4 is standard battle armor fa sure mg sqd4","is standard battle armor fa sure mg sqd5 is standard battle armor fa sure mg sqd5","is standard battle armor fa sure mg sqd6 is standard battle armor fa sure mg sqd6","is standard battle armor hive sqd4 is standard battle armor hive sqd4","is standard battle armor hive sqd5 is standard battle armor hive sqd5","is standard battle armor hive sqd6 is standard battle armor hive sqd6","is standard battle armor magnetic sqd4 is standard battle armor magnetic sqd4","is standard battle armor magnetic sqd5 is standard battle armor magnetic sqd5","is standard battle armor magnetic sqd6 is standard battle armor magnetic sqd6","is standard battle armor flamer sqd4 is standard battle armor flamer sqd4","is standard battle armor flamer sqd5 is standard battle armor flamer sqd5","is standard battle armor flamer sqd6 is standard battle armor flamer sqd6","is standard battle armor laser sqd4 is standard battle armor laser sqd4","is standard battle armor laser sqd5 is standard battle armor laser sqd5","is standard battle armor laser sqd6 is standard battle armor laser sqd6","is standard battle armor lrr sqd4 is standard battle armor lrr sqd4","is standard battle armor lrr sqd5 is standard battle armor lrr sqd5","is standard battle armor lrr sqd6 is standard battle armor lrr sqd6","is standard battle armor mg sqd4 is standard battle armor mg sqd4","is standard battle armor mg sqd5 is standard battle armor mg sqd5","is standard battle armor mg sqd6 is standard battle armor mg sqd6","is standard battle armor srm sqd4 is standard battle armor srm sqd4","is standard battle armor srm sqd5 is standard battle armor srm sqd5","is standard battle armor srm sqd6 is standard battle armor srm sqd6","leonidas battle armor david sqd4 leonidas battle armor david sqd4","leonidas battle armor david sqd5 leonidas battle armor david sqd5","leonidas battle armor david sqd6 leonidas battle armor david sqd6","leonidas battle armor firedrake sqd4 leonidas battle armor firedrake sqd4","leonidas battle armor firedrake sqd5 leonidas battle armor firedrake sqd5","leonidas battle armor firedrake sqd6 leonidas battle armor firedrake sqd6","leonidas battle armor mg sqd4 leonidas battle armor mg sqd4","leonidas battle armor mg sqd5 leonidas battle armor mg sqd5","leonidas battle armor mg sqd6 leonidas battle armor mg sqd6","leonidas battle armor sensor sqd4 leonidas battle armor sensor sqd4","leonidas battle armor sensor sqd5 leonidas battle armor sensor sqd5","leonidas battle armor sensor sqd6 leonidas battle armor sensor sqd6","leonidas battle armor tag sqd4 leonidas battle armor tag sqd4","leonidas battle armor tag sqd5 leonidas battle armor tag sqd5","leonidas battle armor tag sqd6 leonidas battle armor tag sqd6","longinus battle armor hacked david sqd4 longinus battle armor hacked david sqd4","longinus battle armor hacked david sqd5 longinus battle armor hacked david sqd5","longinus battle armor hacked david sqd6 longinus battle armor hacked david sqd6","longinus battle armor hacked mg sqd4 longinus battle armor hacked mg sqd4","longinus battle armor hacked mg sqd5 longinus battle armor hacked mg sqd5","longinus battle armor hacked mg sqd6 longinus battle armor hacked mg sqd6","longinus battle armor magnetic sqd4 longinus battle armor magnetic sqd4","longinus battle armor magnetic sqd5 longinus battle armor magnetic sqd5","longinus battle armor magnetic sqd6 longinus battle armor magnetic sqd6","longinus battle armor david sqd4 longinus battle armor david sqd4","longinus battle armor david sqd5 longinus battle armor david sqd5","longinus battle armor david sqd6 longinus battle armor david sqd6","longinus battle armor flamer sqd4 longinus battle armor flamer sqd4","longinus battle armor flamer sqd5 longinus battle armor flamer sqd5","longinus battle armor flamer sqd6 longinus battle armor flamer sqd6","longinus battle armor laser sqd4 longinus battle armor laser sqd4","longinus battle armor laser sqd5 longinus battle armor laser sqd5","longinus battle armor laser sqd6 longinus battle armor laser sqd6","longinus battle armor mg sqd4 longinus battle armor mg sqd4","longinus battle armor mg sqd5 longinus battle armor mg sqd5","longinus battle armor mg sqd6 longinus battle armor mg sqd6","longinus c battle armor mrr sqd4 longinus c battle armor mrr sqd4","longinus c battle armor mrr sqd5 longinus c battle armor mrr sqd5","longinus c battle armor mrr sqd6 longinus c battle armor mrr sqd6","longinus c battle armor ppc sqd4 longinus c battle armor ppc sqd4","longinus c battle armor ppc sqd5 longinus c battle armor ppc sqd5","longinus c battle armor ppc sqd6 longinus c battle armor ppc sqd6","oni battle armor bearhunter sqd4 oni battle armor bearhunter sqd4","oni battle armor bearhunter sqd5 oni battle armor bearhunter sqd5","oni battle armor bearhunter sqd6 oni battle armor bearhunter sqd6","oni battle armor mrr sqd4 oni battle armor mrr sqd4","oni battle armor mrr sqd5 oni battle armor mrr sqd5","oni battle armor mrr sqd6 oni battle armor mrr sqd6","oni battle armor narc sqd4 oni battle armor narc sqd4","oni battle armor narc sqd5 oni battle armor narc sqd5","oni battle armor narc sqd6 oni battle armor narc sqd6","oni battle armor ppc sqd4 oni battle armor ppc sqd4","oni battle armor ppc sqd5 oni battle armor ppc sqd5","oni battle armor ppc sqd6 oni battle armor ppc sqd6","purifier adaptive battle armor laser sqd4 purifier adaptive battle armor laser sqd4","purifier adaptive battle armor laser sqd5 purifier adaptive battle armor laser sqd5","purifier adaptive battle armor laser sqd6 purifier adaptive battle armor laser sqd6","purifier adaptive battle armor narc sqd4 purifier adaptive battle armor narc sqd4","purifier adaptive battle armor narc sqd5 purifier adaptive battle armor narc sqd5","purifier adaptive battle armor narc sqd6 purifier adaptive battle armor narc sqd6","purifier adaptive battle armor ppc sqd4 purifier adaptive battle armor ppc sqd4","purifier adaptive battle armor ppc sqd5 purifier adaptive battle armor ppc sqd5","purifier adaptive battle armor ppc sqd6 purifier adaptive battle armor ppc sqd6","purifier adaptive battle armor tag sqd4 purifier adaptive battle armor tag sqd4","purifier adaptive battle armor tag sqd5 purifier adaptive battle armor tag sqd5","purifier adaptive battle armor tag sqd6 purifier adaptive battle armor tag sqd6","purifier terra battle armor ap gauss sqd4 purifier terra battle armor ap gauss sqd4","purifier terra battle armor ap gauss sqd5 purifier terra battle armor ap gauss sqd5","purifier terra battle armor ap gauss sqd6 purifier terra battle armor ap gauss sqd6","purifier terra battle armor ersl sqd4 purifier terra battle armor ersl sqd4","purifier terra battle armor ersl sqd5 purifier terra battle armor ersl sqd5","purifier terra battle armor ersl sqd6 purifier terra battle armor ersl sqd6","purifier terra battle armor mrr sqd4 purifier terra battle armor mrr sqd4","purifier terra battle armor mrr sqd5 purifier terra battle armor mrr sqd5","purifier terra battle armor mrr sqd6 purifier terra battle armor mrr sqd6","purifier terra battle armor spl sqd4 purifier terra battle armor spl sqd4","purifier terra battle armor spl sqd5 purifier terra battle armor spl sqd5","purifier terra battle armor spl sqd6 purifier terra battle armor spl sqd6","quirinus battle armor david sqd4 quirinus battle armor david sqd4","quirinus battle armor david sqd5 quirinus battle armor david sqd5","quirinus battle armor david sqd6 quirinus battle armor david sqd6","quirinus battle armor gl sqd4 quirinus battle armor gl sqd4","quirinus battle armor gl sqd5 quirinus battle armor gl sqd5","quirinus battle armor gl sqd6 quirinus battle armor gl sqd6","quirinus battle armor mg sqd4 quirinus battle armor mg sqd4","quirinus battle armor mg sqd5 quirinus battle armor mg sqd5","quirinus battle armor mg sqd6 quirinus battle armor mg sqd6","raiden battle armor anti infantry sqd4 raiden battle armor anti infantry sqd4","raiden battle armor anti infantry sqd5 raiden battle armor anti infantry sqd5","raiden battle armor anti infantry sqd6 raiden battle armor anti infantry sqd6","raiden battle armor original sqd4 raiden battle armor original sqd4","raiden battle armor original sqd5 raiden battle armor original sqd5","raiden battle armor original sqd6 raiden battle armor original sqd6","raiden battle armor flamer sqd4 raiden battle armor flamer sqd4","raiden battle armor flamer sqd5 raiden battle armor flamer sqd5","raiden battle armor flamer sqd6 raiden battle armor flamer sqd6","raiden battle armor laser sqd4 raiden battle armor laser sqd4","raiden battle armor laser sqd5 raiden battle armor laser sqd5","raiden battle armor laser sqd6 raiden battle armor laser sqd6","raiden battle armor mg sqd4 raiden battle armor mg sqd4","raiden battle armor mg sqd5 raiden battle armor mg sqd5","raiden battle armor mg sqd6 raiden battle armor mg sqd6","raiden battle armor mrm sqd4 raiden battle armor mrm sqd4","raiden battle armor mrm sqd5 raiden battle armor mrm sqd5","raiden battle armor mrm sqd6 raiden battle armor mrm sqd6","raiden battle armor tsunami sqd4 raiden battle armor tsunami sqd4","raiden battle armor tsunami sqd5 raiden battle armor tsunami sqd5","raiden battle armor tsunami sqd6 raiden battle armor tsunami sqd6","raiden ii battle armor flamer sqd4 raiden ii battle armor flamer sqd4","raiden ii battle armor flamer sqd5 raiden ii battle armor flamer sqd5","raiden ii battle armor flamer sqd6 raiden ii battle armor flamer sqd6","raiden ii battle armor hmg sqd4 raiden ii battle armor hmg sqd4","raiden ii battle armor hmg sqd5 raiden ii battle armor hmg sqd5","raiden ii battle armor hmg sqd6 raiden ii battle armor hmg sqd6","rottweiler battle armor close combat sqd4 rottweiler battle armor close combat sqd4","rottweiler battle armor close combat sqd5 rottweiler battle armor close combat sqd5","rottweiler battle armor close combat sqd6 rottweiler battle armor close combat sqd6","rottweiler battle armor firedrake sqd4 rottweiler battle armor firedrake sqd4","rottweiler battle armor firedrake sqd5 rottweiler battle armor firedrake sqd5","rottweiler battle armor firedrake sqd6 rottweiler battle armor firedrake sqd6","rottweiler battle armor sqd4 rottweiler battle armor sqd4","rottweiler battle armor sqd5 rottweiler battle armor sqd5","rottweiler battle armor sqd6 rottweiler battle armor sqd6","rottweiler battle armor upgrade sqd4 rottweiler battle armor upgrade sqd4","rottweiler battle armor upgrade sqd5 rottweiler battle armor upgrade sqd5","rottweiler battle armor upgrade sqd6 rottweiler battle armor upgrade sqd6","salamander battle armor anti infantry sqd4 salamander battle armor anti infantry sqd4","salamander battle armor anti infantry sqd5 salamander battle armor anti infantry sqd5","salamander battle armor anti infantry sqd6 salamander battle armor anti infantry sqd6","salamander battle armor laser sqd4 salamander battle armor laser sqd4","salamander battle armor laser sqd5 salamander battle armor laser sqd5","salamander battle armor laser sqd6 salamander battle armor laser sqd6","salamander battle armor sqd3 salamander battle armor sqd3","salamander battle armor sqd4 salamander battle armor sqd4","salamander battle armor sqd5 salamander battle armor sqd5","salamander battle armor sqd6 salamander battle armor sqd6","se irim medium battle armor anti infantry sqd4 se irim medium battle armor anti infantry sqd4","se irim medium battle armor anti infantry sqd5 se irim medium battle armor anti infantry sqd5","se irim medium battle armor anti infantry sqd6 se irim medium battle armor anti infantry sqd6","se irim medium battle armor capture team sqd4 se irim medium battle armor capture team sqd4","se irim medium battle armor capture team sqd5 se irim medium battle armor capture team sqd5","se irim medium battle armor capture team sqd6 se irim medium battle armor capture team sqd6","se irim medium battle armor sqd4 se irim medium battle armor sqd4","se irim medium battle armor sqd5 se irim medium battle armor sqd5","se irim medium battle armor sqd6 se irim medium battle armor sqd6","simian battle armor flamer sqd4 simian battle armor flamer sqd4","simian battle armor flamer sqd5 simian battle armor flamer sqd5","simian battle armor flamer sqd6 simian battle armor flamer sqd6","simian battle armor hmg sqd4 simian battle armor hmg sqd4","simian battle armor hmg sqd5 simian battle armor hmg sqd5","simian battle armor hmg sqd6 simian battle armor hmg sqd6","simian battle armor lrr sqd4 simian battle armor lrr sqd4","simian battle armor lrr sqd5 simian battle armor lrr sqd5","simian battle armor lrr sqd6 simian battle armor lrr sqd6","simian battle armor sl sqd4 simian battle armor sl sqd4","simian battle armor sl sqd5 simian battle armor sl sqd5","simian battle armor sl sqd6 simian battle armor sl sqd6","surat gray death solahma suit sqd4 surat gray death solahma suit sqd4","surat gray death solahma suit sqd5 surat gray death solahma suit sqd5","surat gray death solahma suit sqd6 surat gray death solahma suit sqd6","tinstar battle armor original sqd4 tinstar battle armor original sqd4","tinstar battle armor original sqd5 tinstar battle armor original sqd5","tinstar battle armor original sqd6 tinstar battle armor original sqd6","tinstar battle armor sqd4 tinstar battle armor sqd4","tinstar battle armor sqd5 tinstar battle armor sqd5","tinstar battle armor sqd6 tinstar battle armor sqd6","trinity medium battle armor asterion upgrade mrr sqd4 trinity medium battle armor asterion upgrade mrr sqd4","trinity medium battle armor asterion upgrade mrr sqd5 trinity medium battle armor asterion upgrade mrr sqd5","trinity medium battle armor asterion upgrade mrr sqd6 trinity medium battle armor asterion upgrade mrr sqd6","trinity medium battle armor asterion upgrade ppc sqd4 trinity medium battle armor asterion upgrade ppc sqd4","trinity medium battle armor asterion upgrade ppc sqd5 trinity medium battle armor asterion upgrade ppc sqd5","trinity medium battle armor asterion upgrade ppc sqd6 trinity medium battle armor asterion upgrade ppc sqd6","trinity medium battle armor asterion mrr sqd4 trinity medium battle armor asterion mrr sqd4","trinity medium battle armor asterion mrr sqd5 trinity medium battle armor asterion mrr sqd5","trinity medium battle armor asterion mrr sqd6 trinity medium battle armor asterion mrr sqd6","trinity medium battle armor asterion ppc sqd4 trinity medium battle armor asterion ppc sqd4","trinity medium battle armor asterion ppc sqd5 trinity medium battle armor asterion ppc sqd5","trinity medium battle armor asterion ppc sqd6 trinity medium battle armor asterion ppc sqd6","trinity medium battle armor theseus rl lrr sqd4 trinity medium battle armor theseus rl lrr sqd4","trinity medium battle armor theseus rl lrr sqd5 trinity medium battle armor theseus rl lrr sqd5","trinity medium battle armor theseus rl lrr sqd6 trinity medium battle armor theseus rl lrr sqd6","trinity medium battle armor theseus support killshot sqd4 trinity medium battle armor theseus support killshot sqd4","trinity medium battle armor theseus support killshot sqd5 trinity medium battle armor theseus support killshot sqd5","trinity medium battle armor theseus support killshot sqd6 trinity medium battle armor theseus support killshot sqd6","trinity medium battle armor theseus mrr sqd4 trinity medium battle armor theseus mrr sqd4","trinity medium battle armor theseus mrr sqd5 trinity medium battle armor theseus mrr sqd5","trinity medium battle armor theseus mrr sqd6 trinity medium battle armor theseus mrr sqd6","trinity medium battle armor ying long bc3 david sqd4 trinity medium battle armor ying long bc3 david sqd4","trinity medium battle armor ying long bc3 david sqd5 trinity medium battle armor ying long bc3 david sqd5","trinity medium battle armor ying long bc3 david sqd6 trinity medium battle armor ying long bc3 david sqd6","trinity medium battle armor ying long plasma sqd4 trinity medium battle armor ying long plasma sqd4","trinity medium battle armor ying long plasma sqd5 trinity medium battle armor ying long plasma sqd5","trinity medium battle armor ying long plasma sqd6 trinity medium battle armor ying long plasma sqd6","undine battle armor sqd4 undine battle armor sqd4","undine battle armor sqd5 undine battle armor sqd5","undine battle armor sqd6 undine battle armor sqd6","undine battle armor upgrade sqd4 undine battle armor upgrade sqd4","undine battle armor upgrade sqd5 undine battle armor upgrade sqd5","undine battle armor upgrade sqd6 undine battle armor upgrade sqd6","void medium battle armor dca sqd4 void medium battle armor dca sqd4","void medium battle armor dca sqd5 void medium battle armor dca sqd5","void medium battle armor dca sqd6 void medium battle armor dca sqd6","void medium battle armor minelayer sqd4 void medium battle armor minelayer sqd4","void medium battle armor minelayer sqd5 void medium battle armor minelayer sqd5","void medium battle armor minelayer sqd6 void medium battle armor minelayer sqd6","void medium battle armor nova cat sqd4 void medium battle armor nova cat sqd4","void medium battle armor nova cat sqd5 void medium battle armor nova cat sqd5","void medium battle armor nova cat sqd6 void medium battle armor nova cat sqd6","void medium battle armor sqd4 void medium battle armor sqd4","void medium battle armor sqd5 void medium battle armor sqd5","void medium battle armor sqd6 void medium battle armor sqd6","void medium battle armor caltrop sqd4 void medium battle armor caltrop sqd4","void medium battle armor caltrop sqd5 void medium battle armor caltrop sqd5","void medium battle armor caltrop sqd6 void medium battle armor caltrop sqd6","water elemental mining suit sqd5 water elemental mining suit sqd5","wraith battle armor anti infantry sqd4 wraith battle armor anti infantry sqd4","wraith battle armor anti infantry sqd5 wraith battle armor anti infantry sqd5","wraith battle armor anti infantry sqd6 wraith battle armor anti infantry sqd6","wraith battle armor sqd4 wraith battle armor sqd4","wraith battle armor sqd5 wraith battle armor sqd5","wraith battle armor sqd6 wraith battle armor sqd6","black wolf battle armor erspl sqd4 black wolf battle armor erspl sqd4","black wolf battle armor erspl sqd5 black wolf battle armor erspl sqd5","black wolf battle armor erspl sqd6 black wolf battle armor erspl sqd6","black wolf battle armor heavy flamer sqd4 black wolf battle armor heavy flamer sqd4","black wolf battle armor heavy flamer sqd5 black wolf battle armor heavy flamer sqd5","black wolf battle armor heavy flamer sqd6 black wolf battle armor heavy flamer sqd6","black wolf battle armor heavy mortar sqd4 black wolf battle armor heavy mortar sqd4","black wolf battle armor heavy mortar sqd5 black wolf battle armor heavy mortar sqd5","black wolf battle armor heavy mortar sqd6 black wolf battle armor heavy mortar sqd6","black wolf battle armor lb x sqd4 black wolf battle armor lb x sqd4","black wolf battle armor lb x sqd5 black wolf battle armor lb x sqd5","black wolf battle armor lb x sqd6 black wolf battle armor lb x sqd6","black wolf battle armor plasma sqd4 black wolf battle armor plasma sqd4","black wolf battle armor plasma sqd5 black wolf battle armor plasma sqd5","black wolf battle armor plasma sqd6 black wolf battle armor plasma sqd6","centaur battle armor sqd4 centaur battle armor sqd4","centaur battle armor sqd5 centaur battle armor sqd5","centaur battle armor sqd6 centaur battle armor sqd6","corona heavy battle armor sqd4 corona heavy battle armor sqd4","corona heavy battle armor sqd5 corona heavy battle armor sqd5","corona heavy battle armor sqd6 corona heavy battle armor sqd6","corona heavy battle armor srm sqd4 corona heavy battle armor srm sqd4","corona heavy battle armor srm sqd5 corona heavy battle armor srm sqd5","corona heavy battle armor srm sqd6 corona heavy battle armor srm sqd6","cuchulainn support armor sqd4 cuchulainn support armor sqd4","cuchulainn support armor sqd5 cuchulainn support armor sqd5","cuchulainn support armor sqd6 cuchulainn support armor sqd6","elemental ii battle armor x sqd4 elemental ii battle armor x sqd4","elemental ii battle armor x sqd5 elemental ii battle armor x sqd5","elemental ii battle armor x sqd6 elemental ii battle armor x sqd6","gnome battle armor dwarf sqd4 gnome battle armor dwarf sqd4","gnome battle armor lrm sqd4 gnome battle armor lrm sqd4","gnome battle armor lrm sqd5 gnome battle armor lrm sqd5","gnome battle armor lrm sqd6 gnome battle armor lrm sqd6","gnome battle armor sqd3 gnome battle armor sqd3","gnome battle armor sqd4 gnome battle armor sqd4","gnome battle armor sqd5 gnome battle armor sqd5","gnome battle armor sqd6 gnome battle armor sqd6","gnome battle armor upgrade bearhunter sqd4 gnome battle armor upgrade bearhunter sqd4","gnome battle armor upgrade bearhunter sqd5 gnome battle armor upgrade bearhunter sqd5","gnome battle armor upgrade bearhunter sqd6 gnome battle armor upgrade bearhunter sqd6","gnome battle armor upgrade mrr sqd4 gnome battle armor upgrade mrr sqd4","gnome battle armor upgrade mrr sqd5 gnome battle armor upgrade mrr sqd5","gnome battle armor upgrade mrr sqd6 gnome battle armor upgrade mrr sqd6","gnome battle armor upgrade pulse laser sqd4 gnome battle armor upgrade pulse laser sqd4","gnome battle armor upgrade pulse laser sqd5 gnome battle armor upgrade pulse laser sqd5","gnome battle armor upgrade pulse laser sqd6 gnome battle armor upgrade pulse laser sqd6","gray death heavy suit sqd4 gray death heavy suit sqd4","gray death heavy suit sqd5 gray death heavy suit sqd5","gray death heavy suit sqd6 gray death heavy suit sqd6","grenadier ii battle armor a sqd4 grenadier ii battle armor a sqd4","grenadier ii battle armor a sqd5 grenadier ii battle armor a sqd5","grenadier ii battle armor a sqd6 grenadier ii battle armor a sqd6","grenadier ii battle armor b sqd4 grenadier ii battle armor b sqd4","grenadier ii battle armor b sqd5 grenadier ii battle armor b sqd5","grenadier ii battle armor b sqd6 grenadier ii battle armor b sqd6","grenadier ii battle armor c sqd4 grenadier ii battle armor c sqd4","grenadier ii battle armor c sqd5 grenadier ii battle armor c sqd5","grenadier ii battle armor c sqd6 grenadier ii battle armor c sqd6","grenadier ii battle armor d sqd4 grenadier ii battle armor d sqd4","grenadier ii battle armor d sqd5 grenadier ii battle armor d sqd5","grenadier ii battle armor d sqd6 grenadier ii battle armor d sqd6","marauder battle armor sqd4 marauder battle armor sqd4","marauder battle armor sqd5 marauder battle armor sqd5","marauder battle armor sqd6 marauder battle armor sqd6","ogre battle armor interdictor sqd4 ogre battle armor interdictor sqd4","ogre battle armor interdictor sqd5 ogre battle armor interdictor sqd5","ogre battle armor interdictor sqd6 ogre battle armor interdictor sqd6","ogre battle armor sqd4 ogre battle armor sqd4","ogre battle armor sqd5 ogre battle armor sqd5","ogre battle armor sqd6 ogre battle armor sqd6","phalanx battle armor a sqd4 phalanx battle armor a sqd4","phalanx battle armor a sqd5 phalanx battle armor a sqd5","phalanx battle armor a sqd6 phalanx battle armor a sqd6","phalanx battle armor b sqd4 phalanx battle armor b sqd4","phalanx battle armor b sqd5 phalanx battle armor b sqd5","phalanx battle armor b sqd6 phalanx battle armor b sqd6","phalanx battle armor c sqd4 phalanx battle armor c sqd4","phalanx battle armor c sqd5 phalanx battle armor c sqd5","phalanx battle armor c sqd6 phalanx battle armor c sqd6","phalanx battle armor d sqd4 phalanx battle armor d sqd4","phalanx battle armor d sqd5 phalanx battle armor d sqd5","phalanx battle armor d sqd6 phalanx battle armor d sqd6","rhino battle armor sqd4 rhino battle armor sqd4","rhino battle armor sqd5 rhino battle armor sqd5","rhino battle armor sqd6 rhino battle armor sqd6","rogue bear heavy battle armor hybrid sqd4 rogue bear heavy battle armor hybrid sqd4","rogue bear heavy battle armor hybrid sqd5 rogue bear heavy battle armor hybrid sqd5","rogue bear heavy battle armor hybrid sqd6 rogue bear heavy battle armor hybrid sqd6","rogue bear heavy battle armor sqd4 rogue bear heavy battle armor sqd4","rogue bear heavy battle armor sqd5 rogue bear heavy battle armor sqd5","rogue bear heavy battle armor sqd6 rogue bear heavy battle armor sqd6","rogue bear heavy battle armor upgrade sqd4 rogue bear heavy battle armor upgrade sqd4","rogue bear heavy battle armor upgrade sqd5 rogue bear heavy battle armor upgrade sqd5","rogue bear heavy battle armor upgrade sqd6 rogue bear heavy battle armor upgrade sqd6","rogue bear heavy battle armor hr sqd4 rogue bear heavy battle armor hr sqd4","rogue bear heavy battle armor hr sqd5 rogue bear heavy battle armor hr sqd5","rogue bear heavy battle armor hr sqd6 rogue bear heavy battle armor hr sqd6","shen long battle armor david sqd4 shen long battle armor david sqd4","shen long battle armor david sqd5 shen long battle armor david sqd5","shen long battle armor david sqd6 shen long battle armor david sqd6","shen long battle armor interdictor sqd4 shen long battle armor interdictor sqd4","shen long battle armor interdictor sqd5 shen long battle armor interdictor sqd5","shen long battle armor interdictor sqd6 shen long battle armor interdictor sqd6","shen long battle armor mg sqd4 shen long battle armor mg sqd4","shen long battle armor mg sqd5 shen long battle armor mg sqd5","shen long battle armor mg sqd6 shen long battle armor mg sqd6","shen long battle armor mrm sqd4 shen long battle armor mrm sqd4","shen long battle armor mrm sqd5 shen long battle armor mrm sqd5","shen long battle armor mrm sqd6 shen long battle armor mrm sqd6","shen long battle armor pop up mine sqd4 shen long battle armor pop up mine sqd4","shen long battle armor pop up mine sqd5 shen long battle armor pop up mine sqd5","shen long battle armor pop up mine sqd6 shen long battle armor pop up mine sqd6","shen long battle armor srm sqd4 shen long battle armor srm sqd4","shen long battle armor srm sqd5 shen long battle armor srm sqd5","shen long battle armor srm sqd6 shen long battle armor srm sqd6","sloth battle armor huntsman sqd4 sloth battle armor huntsman sqd4","sloth battle armor huntsman sqd5 sloth battle armor huntsman sqd5","sloth battle armor huntsman sqd6 sloth battle armor huntsman sqd6","sloth battle armor interdictor sqd4 sloth battle armor interdictor sqd4","sloth battle armor interdictor sqd5 sloth battle armor interdictor sqd5","sloth battle armor interdictor sqd6 sloth battle armor interdictor sqd6","sloth battle armor sqd4 sloth battle armor sqd4","sloth battle armor sqd5 sloth battle armor sqd5","sloth battle armor sqd6 sloth battle armor sqd6","stormbird battle armor jade falcon sqd4 stormbird battle armor jade falcon sqd4","stormbird battle armor jade falcon sqd5 stormbird battle armor jade falcon sqd5","stormbird battle armor jade falcon sqd6 stormbird battle armor jade falcon sqd6","stormbird battle armor sqd4 stormbird battle armor sqd4","stormbird battle armor sqd5 stormbird battle armor sqd5","stormbird battle armor sqd6 stormbird battle armor sqd6","taranis battle armor sqd4 taranis battle armor sqd4","taranis battle armor sqd5 taranis battle armor sqd5","taranis battle armor sqd6 taranis battle armor sqd6","tengu heavy battle armor support lrr sqd4 tengu heavy battle armor support lrr sqd4","tengu heavy battle armor support lrr sqd5 tengu heavy battle armor support lrr sqd5","tengu heavy battle armor support lrr sqd6 tengu heavy battle armor support lrr sqd6","tengu heavy battle armor svsp sqd4 tengu heavy battle armor svsp sqd4","tengu heavy battle armor svsp sqd5 tengu heavy battle armor svsp sqd5","tengu heavy battle armor svsp sqd6 tengu heavy battle armor svsp sqd6","tengu heavy battle armor c3i sqd4 tengu heavy battle armor c3i sqd4","tengu heavy battle armor c3i sqd5 tengu heavy battle armor c3i sqd5","tengu heavy battle armor c3i sqd6 tengu heavy battle armor c3i sqd6","tengu heavy battle armor ml sqd4 tengu heavy battle armor ml sqd4","tengu heavy battle armor ml sqd5 tengu heavy battle armor ml sqd5","tengu heavy battle armor ml sqd6 tengu heavy battle armor ml sqd6","tengu heavy battle armor plasma sqd4 tengu heavy battle armor plasma sqd4","tengu heavy battle armor plasma sqd5 tengu heavy battle armor plasma sqd5","tengu heavy battle armor plasma sqd6 tengu heavy battle armor plasma sqd6","tengu heavy battle armor rl sqd4 tengu heavy battle armor rl sqd4","tengu heavy battle armor rl sqd5 tengu heavy battle armor rl sqd5","tengu heavy battle armor rl sqd6 tengu heavy battle armor rl sqd6","thunderbird battle armor upgrade er laser sqd4 thunderbird battle armor upgrade er laser sqd4","thunderbird battle armor upgrade er laser sqd5 thunderbird battle armor upgrade er laser sqd5","thunderbird battle armor upgrade er laser sqd6 thunderbird battle armor upgrade er laser sqd6","thunderbird battle armor upgrade lb x sqd4 thunderbird battle armor upgrade lb x sqd4","thunderbird battle armor upgrade lb x sqd5 thunderbird battle armor upgrade lb x sqd5","thunderbird battle armor upgrade lb x sqd6 thunderbird battle armor upgrade lb x sqd6","thunderbird battle armor upgrade pulse laser sqd4 thunderbird battle armor upgrade pulse laser sqd4","thunderbird battle armor upgrade pulse laser sqd5 thunderbird battle armor upgrade pulse laser sqd5","thunderbird battle armor upgrade pulse laser sqd6 thunderbird battle armor upgrade pulse laser sqd6","thunderbird battle armor ap gauss sqd4 thunderbird battle armor ap gauss sqd4","thunderbird battle armor ap gauss sqd5 thunderbird battle armor ap gauss sqd5","thunderbird battle armor ap gauss sqd6 thunderbird battle armor ap gauss sqd6","thunderbird battle armor er laser sqd4 thunderbird battle armor er laser sqd4","thunderbird battle armor er laser sqd5 thunderbird battle armor er laser sqd5","thunderbird battle armor er laser sqd6 thunderbird battle armor er laser sqd6","thunderbird battle armor pulse laser sqd4 thunderbird battle armor pulse laser sqd4","thunderbird battle armor pulse laser sqd5 thunderbird battle armor pulse laser sqd5","thunderbird battle armor pulse laser sqd6 thunderbird battle armor pulse laser sqd6","thunderbird ii battle armor sqd4 thunderbird ii battle armor sqd4","thunderbird ii battle armor sqd5 thunderbird ii battle armor sqd5","thunderbird ii battle armor sqd6 thunderbird ii battle armor sqd6","undine battle armor sebastian sqd4 undine battle armor sebastian sqd4","zou heavy battle armor c3 sqd4 zou heavy battle armor c3 sqd4","zou heavy battle armor c3 sqd5 zou heavy battle armor c3 sqd5","zou heavy battle armor c3 sqd6 zou heavy battle armor c3 sqd6","zou heavy battle armor sqd4 zou heavy battle armor sqd4","zou heavy battle armor sqd5 zou heavy battle armor sqd5","zou heavy battle armor sqd6 zou heavy battle armor sqd6","fenrir battle armor longshot sqd4 fenrir battle armor longshot sqd4","fenrir battle armor longshot sqd5 fenrir battle armor longshot sqd5","fenrir battle armor longshot sqd6 fenrir battle armor longshot sqd6","fenrir battle armor erml sqd4 fenrir battle armor erml sqd4","fenrir battle armor erml sqd5 fenrir battle armor erml sqd5","fenrir battle armor erml sqd6 fenrir battle armor erml sqd6","fenrir battle armor mg sqd4 fenrir battle armor mg sqd4","fenrir battle armor mg sqd5 fenrir battle armor mg sqd5","fenrir battle armor mg sqd6 fenrir battle armor mg sqd6","fenrir battle armor mortar sqd4 fenrir battle armor mortar sqd4","fenrir battle armor mortar sqd5 fenrir battle armor mortar sqd5","fenrir battle armor mortar sqd6 fenrir battle armor mortar sqd6","fenrir battle armor mpl sqd4 fenrir battle armor mpl sqd4","fenrir battle armor mpl sqd5 fenrir battle armor mpl sqd5","fenrir battle armor mpl sqd6 fenrir battle armor mpl sqd6","fenrir battle armor sl sqd4 fenrir battle armor sl sqd4","fenrir battle armor sl sqd5 fenrir battle armor sl sqd5","fenrir battle armor sl sqd6 fenrir battle armor sl sqd6","fenrir battle armor spl sqd4 fenrir battle armor spl sqd4","fenrir battle armor spl sqd5 fenrir battle armor spl sqd5","fenrir battle armor spl sqd6 fenrir battle armor spl sqd6","fenrir battle armor srm sqd4 fenrir battle armor srm sqd4","fenrir battle armor srm sqd5 fenrir battle armor srm sqd5","fenrir battle armor srm sqd6 fenrir battle armor srm sqd6","fenrir battle armor vsp sqd4 fenrir battle armor vsp sqd4","fenrir battle armor vsp sqd5 fenrir battle armor vsp sqd5","fenrir battle armor vsp sqd6 fenrir battle armor vsp sqd6","fenrir ii assault battle armor ai sqd4 fenrir ii assault battle armor ai sqd4","fenrir ii assault battle armor ai sqd5 fenrir ii assault battle armor ai sqd5","fenrir ii assault battle armor ai sqd6 fenrir ii assault battle armor ai sqd6","fenrir ii assault battle armor lrm sqd4 fenrir ii assault battle armor lrm sqd4","fenrir ii assault battle armor lrm sqd5 fenrir ii assault battle armor lrm sqd5","fenrir ii assault battle armor lrm sqd6 fenrir ii assault battle armor lrm sqd6","fenrir ii assault battle armor ml sqd4 fenrir ii assault battle armor ml sqd4","fenrir ii assault battle armor ml sqd5 fenrir ii assault battle armor ml sqd5","fenrir ii assault battle armor ml sqd6 fenrir ii assault battle armor ml sqd6","fenrir ii assault battle armor mrr sqd4 fenrir ii assault battle armor mrr sqd4","fenrir ii assault battle armor mrr sqd5 fenrir ii assault battle armor mrr sqd5","fenrir ii assault battle armor mrr sqd6 fenrir ii assault battle armor mrr sqd6","fenrir ii assault battle armor srm sqd4 fenrir ii assault battle armor srm sqd4","fenrir ii assault battle armor srm sqd5 fenrir ii assault battle armor srm sqd5","fenrir ii assault battle armor srm sqd6 fenrir ii assault battle armor srm sqd6","fusilier battle armor sqd4 fusilier battle armor sqd4","fusilier battle armor sqd5 fusilier battle armor sqd5","fusilier battle armor sqd6 fusilier battle armor sqd6","fusilier battle armor upgrade sqd4 fusilier battle armor upgrade sqd4","fusilier battle armor upgrade sqd5 fusilier battle armor upgrade sqd5","fusilier battle armor upgrade sqd6 fusilier battle armor upgrade sqd6","golem assault armor fast assault sqd4 golem assault armor fast assault sqd4","golem assault armor fast assault sqd5 golem assault armor fast assault sqd5","golem assault armor fast assault sqd6 golem assault armor fast assault sqd6","golem assault armor rock golem sqd4 golem assault armor rock golem sqd4","golem assault armor rock golem sqd5 golem assault armor rock golem sqd5","golem assault armor rock golem sqd6 golem assault armor rock golem sqd6","golem assault armor sqd4 golem assault armor sqd4","golem assault armor sqd5 golem assault armor sqd5","golem assault armor sqd6 golem assault armor sqd6","golem assault armor support sqd4 golem assault armor support sqd4","golem assault armor support sqd5 golem assault armor support sqd5","golem assault armor support sqd6 golem assault armor support sqd6","grenadier battle armor hunter killer c3 hrr sqd4 grenadier battle armor hunter killer c3 hrr sqd4","grenadier battle armor hunter killer c3 hrr sqd5 grenadier battle armor hunter killer c3 hrr sqd5","grenadier battle armor hunter killer c3 hrr sqd6 grenadier battle armor hunter killer c3 hrr sqd6","grenadier battle armor hunter killer srm magshot sqd4 grenadier battle armor hunter killer srm magshot sqd4","grenadier battle armor hunter killer srm magshot sqd5 grenadier battle armor hunter killer srm magshot sqd5","grenadier battle armor hunter killer srm magshot sqd6 grenadier battle armor hunter killer srm magshot sqd6","grenadier battle armor hunter killer srm narc sqd4 grenadier battle armor hunter killer srm narc sqd4","grenadier battle armor hunter killer srm narc sqd5 grenadier battle armor hunter killer srm narc sqd5","grenadier battle armor hunter killer srm narc sqd6 grenadier battle armor hunter killer srm narc sqd6","grenadier battle armor hunter killer svsp magshot sqd4 grenadier battle armor hunter killer svsp magshot sqd4","grenadier battle armor hunter killer svsp magshot sqd5 grenadier battle armor hunter killer svsp magshot sqd5","grenadier battle armor hunter killer svsp magshot sqd6 grenadier battle armor hunter killer svsp magshot sqd6","grenadier battle armor heavy flamer heavy flamer sqd4 grenadier battle armor heavy flamer heavy flamer sqd4","grenadier battle armor heavy flamer heavy flamer sqd5 grenadier battle armor heavy flamer heavy flamer sqd5","grenadier battle armor heavy flamer heavy flamer sqd6 grenadier battle armor heavy flamer heavy flamer sqd6","grenadier battle armor srm flamer sqd4 grenadier battle armor srm flamer sqd4","grenadier battle armor srm flamer sqd5 grenadier battle armor srm flamer sqd5","grenadier battle armor srm flamer sqd6 grenadier battle armor srm flamer sqd6","grenadier battle armor srm lrr sqd4 grenadier battle armor srm lrr sqd4","grenadier battle armor srm lrr sqd5 grenadier battle armor srm lrr sqd5","grenadier battle armor srm lrr sqd6 grenadier battle armor srm lrr sqd6","grenadier battle armor srm magshot sqd4 grenadier battle armor srm magshot sqd4","grenadier battle armor srm magshot sqd5 grenadier battle armor srm magshot sqd5","grenadier battle armor srm magshot sqd6 grenadier battle armor srm magshot sqd6","grenadier battle armor srm sl sqd4 grenadier battle armor srm sl sqd4","grenadier battle armor srm sl sqd5 grenadier battle armor srm sl sqd5","grenadier battle armor srm sl sqd6 grenadier battle armor srm sl sqd6","grenadier battle armor srm tag sqd4 grenadier battle armor srm tag sqd4","grenadier battle armor srm tag sqd5 grenadier battle armor srm tag sqd5","grenadier battle armor srm tag sqd6 grenadier battle armor srm tag sqd6","hauberk battle armor sqd4 hauberk battle armor sqd4","hauberk battle armor sqd5 hauberk battle armor sqd5","hauberk battle armor sqd6 hauberk battle armor sqd6","hauberk battle armor commando sqd4 hauberk battle armor commando sqd4","hauberk battle armor commando sqd5 hauberk battle armor commando sqd5","hauberk battle armor commando sqd6 hauberk battle armor commando sqd6","hauberk battle armor u15 sqd4 hauberk battle armor u15 sqd4","hauberk battle armor u15 sqd5 hauberk battle armor u15 sqd5","hauberk battle armor u15 sqd6 hauberk battle armor u15 sqd6","hauberk ii battle armor sqd4 hauberk ii battle armor sqd4","hauberk ii battle armor sqd5 hauberk ii battle armor sqd5","hauberk ii battle armor sqd6 hauberk ii battle armor sqd6","ironhold assault battle armor anti tank sqd4 ironhold assault battle armor anti tank sqd4","ironhold assault battle armor anti tank sqd5 ironhold assault battle armor anti tank sqd5","ironhold assault battle armor anti tank sqd6 ironhold assault battle armor anti tank sqd6","ironhold assault battle armor fire sqd4 ironhold assault battle armor fire sqd4","ironhold assault battle armor fire sqd5 ironhold assault battle armor fire sqd5","ironhold assault battle armor fire sqd6 ironhold assault battle armor fire sqd6","ironhold assault battle armor sqd4 ironhold assault battle armor sqd4","ironhold assault battle armor sqd5 ironhold assault battle armor sqd5","ironhold assault battle armor sqd6 ironhold assault battle armor sqd6","kanazuchi assault battle armor cyclops sqd4 kanazuchi assault battle armor cyclops sqd4","kanazuchi assault battle armor cyclops sqd5 kanazuchi assault battle armor cyclops sqd5","kanazuchi assault battle armor cyclops sqd6 kanazuchi assault battle armor cyclops sqd6","kanazuchi assault battle armor support sqd4 kanazuchi assault battle armor support sqd4","kanazuchi assault battle armor support sqd5 kanazuchi assault battle armor support sqd5","kanazuchi assault battle armor support sqd6 kanazuchi assault battle armor support sqd6","kanazuchi assault battle armor upgrade battle claw sqd4 kanazuchi assault battle armor upgrade battle claw sqd4","kanazuchi assault battle armor upgrade battle claw sqd5 kanazuchi assault battle armor upgrade battle claw sqd5","kanazuchi assault battle armor upgrade battle claw sqd6 kanazuchi assault battle armor upgrade battle claw sqd6","kanazuchi assault battle armor battle claw sqd4 kanazuchi assault battle armor battle claw sqd4","kanazuchi assault battle armor battle claw sqd5 kanazuchi assault battle armor battle claw sqd5","kanazuchi assault battle armor battle claw sqd6 kanazuchi assault battle armor battle claw sqd6","kanazuchi assault battle armor industrial drill sqd4 kanazuchi assault battle armor industrial drill sqd4","kanazuchi assault battle armor industrial drill sqd5 kanazuchi assault battle armor industrial drill sqd5","kanazuchi assault battle armor industrial drill sqd6 kanazuchi assault battle armor industrial drill sqd6","kanazuchi assault battle armor salvage arm sqd4 kanazuchi assault battle armor salvage arm sqd4","kanazuchi assault battle armor salvage arm sqd5 kanazuchi assault battle armor salvage arm sqd5","kanazuchi assault battle armor salvage arm sqd6 kanazuchi assault battle armor salvage arm sqd6","kopis assault battle armor the dark alley sqd4 kopis assault battle armor the dark alley sqd4","kopis assault battle armor the dark alley sqd5 kopis assault battle armor the dark alley sqd5","kopis assault battle armor the dark alley sqd6 kopis assault battle armor the dark alley sqd6","kopis assault battle armor ai mk ii sqd4 kopis assault battle armor ai mk ii sqd4","kopis assault battle armor ai mk ii sqd5 kopis assault battle armor ai mk ii sqd5","kopis assault battle armor ai mk ii sqd6 kopis assault battle armor ai mk ii sqd6","kopis assault battle armor ai mk iir sqd4 kopis assault battle armor ai mk iir sqd4","kopis assault battle armor ai mk iir sqd5 kopis assault battle armor ai mk iir sqd5","kopis assault battle armor ai mk iir sqd6 kopis assault battle armor ai mk iir sqd6","kopis assault battle armor anti infantry sqd4 kopis assault battle armor anti infantry sqd4","kopis assault battle armor anti infantry sqd5 kopis assault battle armor anti infantry sqd5","kopis assault battle armor anti infantry sqd6 kopis assault battle armor anti infantry sqd6","kopis assault battle armor mortar sqd4 kopis assault battle armor mortar sqd4","kopis assault battle armor mortar sqd5 kopis assault battle armor mortar sqd5","kopis assault battle armor mortar sqd6 kopis assault battle armor mortar sqd6","nephilim assault battle armor capture team hmg sqd4 nephilim assault battle armor capture team hmg sqd4","nephilim assault battle armor capture team hmg sqd5 nephilim assault battle armor capture team hmg sqd5","nephilim assault battle armor capture team hmg sqd6 nephilim assault battle armor capture team hmg sqd6","nephilim assault battle armor gauss sqd4 nephilim assault battle armor gauss sqd4","nephilim assault battle armor gauss sqd5 nephilim assault battle armor gauss sqd5","nephilim assault battle armor gauss sqd6 nephilim assault battle armor gauss sqd6","nephilim assault battle armor narc sqd4 nephilim assault battle armor narc sqd4","nephilim assault battle armor narc sqd5 nephilim assault battle armor narc sqd5","nephilim assault battle armor narc sqd6 nephilim assault battle armor narc sqd6","nephilim assault battle armor seeker mg sqd4 nephilim assault battle armor seeker mg sqd4","nephilim assault battle armor seeker mg sqd5 nephilim assault battle armor seeker mg sqd5","nephilim assault battle armor seeker mg sqd6 nephilim assault battle armor seeker mg sqd6","nephilim assault battle armor support sqd4 nephilim assault battle armor support sqd4","nephilim assault battle armor support sqd5 nephilim assault battle armor support sqd5","nephilim assault battle armor support sqd6 nephilim assault battle armor support sqd6","nephilim assault battle armor plasma sqd4 nephilim assault battle armor plasma sqd4","nephilim assault battle armor plasma sqd5 nephilim assault battle armor plasma sqd5","nephilim assault battle armor plasma sqd6 nephilim assault battle armor plasma sqd6","ravager assault battle armor lrm sqd4 ravager assault battle armor lrm sqd4","ravager assault battle armor lrm sqd5 ravager assault battle armor lrm sqd5","ravager assault battle armor lrm sqd6 ravager assault battle armor lrm sqd6","ravager assault battle armor sqd4 ravager assault battle armor sqd4","ravager assault battle armor sqd5 ravager assault battle armor sqd5","ravager assault battle armor sqd6 ravager assault battle armor sqd6","shedu assault battle armor capture team sqd4 shedu assault battle armor capture team sqd4","shedu assault battle armor capture team sqd5 shedu assault battle armor capture team sqd5","shedu assault battle armor capture team sqd6 shedu assault battle armor capture team sqd6","shedu assault battle armor ppc sqd4 shedu assault battle armor ppc sqd4","shedu assault battle armor ppc sqd5 shedu assault battle armor ppc sqd5","shedu assault battle armor ppc sqd6 shedu assault battle armor ppc sqd6","shedu assault battle armor recon sqd4 shedu assault battle armor recon sqd4","shedu assault battle armor recon sqd5 shedu assault battle armor recon sqd5","shedu assault battle armor recon sqd6 shedu assault battle armor recon sqd6","shedu assault battle armor sqd4 shedu assault battle armor sqd4","shedu assault battle armor sqd5 shedu assault battle armor sqd5","shedu assault battle armor sqd6 shedu assault battle armor sqd6","shedu assault battle armor support sqd4 shedu assault battle armor support sqd4","shedu assault battle armor support sqd5 shedu assault battle armor support sqd5","shedu assault battle armor support sqd6 shedu assault battle armor support sqd6","tortoise ii battle armor asrm sqd4 tortoise ii battle armor asrm sqd4","tortoise ii battle armor asrm sqd5 tortoise ii battle armor asrm sqd5","tortoise ii battle armor asrm sqd6 tortoise ii battle armor asrm sqd6","tortoise ii battle armor c3 sqd4 tortoise ii battle armor c3 sqd4","tortoise ii battle armor c3 sqd5 tortoise ii battle armor c3 sqd5","tortoise ii battle armor c3 sqd6 tortoise ii battle armor c3 sqd6","tortoise ii battle armor lrm sqd4 tortoise ii battle armor lrm sqd4","tortoise ii battle armor lrm sqd5 tortoise ii battle armor lrm sqd5","tortoise ii battle armor lrm sqd6 tortoise ii battle armor lrm sqd6","tortoise ii battle armor srm sqd4 tortoise ii battle armor srm sqd4","tortoise ii battle armor srm sqd5 tortoise ii battle armor srm sqd5","tortoise ii battle armor srm sqd6 tortoise ii battle armor srm sqd6","warg assault battle armor reactive sqd4 warg assault battle armor reactive sqd4","warg assault battle armor reactive sqd5 warg assault battle armor reactive sqd5","warg assault battle armor reactive sqd6 warg assault battle armor reactive sqd6","warg assault battle armor sqd4 warg assault battle armor sqd4","warg assault battle armor sqd5 warg assault battle armor sqd5","warg assault battle armor sqd6 warg assault battle armor sqd6","xiphos assault battle armor a sqd4 xiphos assault battle armor a sqd4","xiphos assault battle armor a sqd5 xiphos assault battle armor a sqd5","xiphos assault battle armor a sqd6 xiphos assault battle armor a sqd6","xiphos assault battle armor b sqd4 xiphos assault battle armor b sqd4","xiphos assault battle armor b sqd5 xiphos assault battle armor b sqd5","xiphos assault battle armor b sqd6 xiphos assault battle armor b sqd6","xiphos assault battle armor c sqd4 xiphos assault battle armor c sqd4","xiphos assault battle armor c sqd5 xiphos assault battle armor c sqd5","xiphos assault battle armor c sqd6 xiphos assault battle armor c sqd6"],"sizes":[26.0,26.0,26.0,23.0,23.0,23.0,16.0,16.0,16.0,25.0,25.0,25.0,42.0,42.0,42.0,28.0,28.0,28.0,37.0,37.0,37.0,39.0,39.0,39.0,44.0,44.0,44.0,33.0,33.0,33.0,32.0,32.0,32.0,40.0,48.0,48.0,48.0,53.0,53.0,53.0,47.0,47.0,47.0,52.0,52.0,52.0,49.0,49.0,49.0,46.0,46.0,46.0,19.0,19.0,19.0,29.0,29.0,29.0,16.0,16.0,16.0,27.0,27.0,27.0,28.0,28.0,28.0,40.0,40.0,40.0,27.0,27.0,27.0,35.0,35.0,35.0,30.0,30.0,30.0,23.0,23.0,23.0,25.0,25.0,25.0,18.0,18.0,18.0,25.0,25.0,25.0,41.0,41.0,41.0,47.0,47.0,47.0,24.0,24.0,24.0,25.0,25.0,25.0,26.0,26.0,26.0,22.0,22.0,22.0,22.0,22.0,22.0,38.0,38.0,38.0,29.0,29.0,29.0,36.0,36.0,36.0,33.0,33.0,33.0,32.0,32.0,32.0,22.0,22.0,22.0,22.0,22.0,22.0,31.0,31.0,31.0,31.0,31.0,31.0,51.0,51.0,51.0,53.0,53.0,53.0,52.0,52.0,52.0,54.0,54.0,54.0,53.0,53.0,53.0,55.0,55.0,55.0,53.0,53.0,53.0,56.0,56.0,56.0,53.0,53.0,53.0,54.0,54.0,54.0,36.0,36.0,36.0,38.0,38.0,38.0,39.0,39.0,39.0,37.0,37.0,37.0,35.0,35.0,35.0,36.0,36.0,36.0,36.0,36.0,36.0,36.0,36.0,36.0,38.0,38.0,38.0,35.0,35.0,35.0,36.0,36.0,36.0,52.0,52.0,52.0,51.0,51.0,51.0,49.0,49.0,49.0,24.0,24.0,24.0,31.0,31.0,31.0,40.0,40.0,40.0,32.0,32.0,32.0,25.0,25.0,25.0,39.0,39.0,39.0,44.0,44.0,44.0,34.0,34.0,34.0,34.0,34.0,34.0,40.0,40.0,40.0,33.0,33.0,33.0,36.0,36.0,36.0,34.0,34.0,34.0,32.0,32.0,32.0,33.0,33.0,33.0,31.0,31.0,31.0,24.0,24.0,24.0,40.0,40.0,40.0,36.0,36.0,36.0,37.0,37.0,37.0,34.0,34.0,34.0,31.0,31.0,31.0,29.0,29.0,29.0,30.0,30.0,30.0,28.0,28.0,28.0,32.0,32.0,32.0,23.0,23.0,23.0,31.0,31.0,31.0,26.0,26.0,26.0,34.0,32.0,32.0,32.0,29.0,29.0,29.0,43.0,43.0,43.0,42.0,42.0,42.0,43.0,43.0,43.0,31.0,31.0,31.0,28.0,28.0,28.0,28.0,28.0,28.0,29.0,29.0,29.0,23.0,23.0,23.0,42.0,42.0,42.0,30.0,30.0,30.0,33.0,33.0,33.0,41.0,41.0,41.0,28.0,28.0,28.0,35.0,35.0,35.0,38.0,38.0,38.0,36.0,36.0,36.0,32.0,32.0,32.0,32.0,32.0,32.0,31.0,31.0,31.0,33.0,33.0,33.0,32.0,32.0,32.0,30.0,30.0,30.0,30.0,30.0,30.0,36.0,36.0,36.0,34.0,34.0,34.0,34.0,34.0,34.0,33.0,33.0,33.0,36.0,36.0,36.0,36.0,36.0,36.0,41.0,41.0,41.0,38.0,38.0,38.0,34.0,34.0,34.0,26.0,26.0,26.0,41.0,41.0,41.0,39.0,39.0,39.0,41.0,41.0,41.0,39.0,39.0,39.0,39.0,40.0,40.0,40.0,36.0,36.0,36.0,41.0,41.0,41.0,36.0,36.0,36.0,36.0,36.0,36.0,36.0,36.0,35.0,35.0,35.0,35.0,32.0,32.0,32.0,32.0,34.0,34.0,34.0,34.0,31.0,31.0,31.0,31.0,36.0,36.0,36.0,36.0,31.0,31.0,31.0,40.0,40.0,40.0,39.0,39.0,39.0,40.0,40.0,40.0,43.0,43.0,43.0,39.0,39.0,39.0,31.0,31.0,31.0,31.0,31.0,31.0,29.0,29.0,29.0,28.0,28.0,28.0,29.0,29.0,29.0,30.0,30.0,30.0,42.0,42.0,42.0,38.0,38.0,38.0,46.0,46.0,46.0,39.0,39.0,39.0,36.0,36.0,36.0,35.0,35.0,35.0,34.0,34.0,34.0,32.0,32.0,32.0,31.0,31.0,31.0,31.0,31.0,31.0,33.0,33.0,33.0,36.0,36.0,36.0,26.0,26.0,26.0,39.0,39.0,39.0,42.0,42.0,42.0,40.0,40.0,40.0,39.0,39.0,39.0,45.0,45.0,45.0,36.0,36.0,36.0,34.0,34.0,34.0,42.0,42.0,42.0,39.0,39.0,39.0,34.0,34.0,34.0,38.0,38.0,38.0,36.0,36.0,36.0,35.0,35.0,35.0,33.0,33.0,33.0,32.0,32.0,32.0,32.0,32.0,32.0,33.0,33.0,33.0,37.0,37.0,37.0,30.0,30.0,30.0,32.0,32.0,32.0,31.0,31.0,31.0,40.0,40.0,40.0,37.0,37.0,37.0,36.0,36.0,36.0,33.0,33.0,33.0,34.0,34.0,34.0,32.0,32.0,32.0,30.0,30.0,30.0,33.0,33.0,33.0,33.0,33.0,33.0,32.0,32.0,32.0,26.0,26.0,26.0,27.0,27.0,27.0,26.0,26.0,26.0,40.0,40.0,40.0,40.0,40.0,40.0,38.0,38.0,38.0,39.0,39.0,39.0,41.0,41.0,41.0,38.0,38.0,38.0,37.0,37.0,37.0,36.0,36.0,36.0,33.0,33.0,33.0,30.0,30.0,30.0,30.0,30.0,30.0,37.0,37.0,37.0,34.0,34.0,34.0,32.0,32.0,32.0,31.0,31.0,31.0,28.0,28.0,28.0,29.0,29.0,29.0,33.0,33.0,33.0,35.0,35.0,35.0,32.0,32.0,32.0,40.0,40.0,40.0,39.0,39.0,39.0,29.0,29.0,29.0,37.0,37.0,37.0,40.0,40.0,40.0,33.0,33.0,33.0,28.0,28.0,28.0,28.0,43.0,43.0,43.0,45.0,45.0,45.0,32.0,32.0,32.0,31.0,31.0,31.0,28.0,28.0,28.0,28.0,28.0,28.0,26.0,26.0,26.0,31.0,31.0,31.0,35.0,35.0,35.0,26.0,26.0,26.0,52.0,52.0,52.0,53.0,53.0,53.0,44.0,44.0,44.0,45.0,45.0,45.0,47.0,47.0,47.0,56.0,56.0,56.0,43.0,43.0,43.0,51.0,51.0,51.0,49.0,49.0,49.0,25.0,25.0,25.0,32.0,32.0,32.0,34.0,34.0,34.0,39.0,39.0,39.0,39.0,39.0,39.0,30.0,30.0,30.0,38.0,38.0,38.0,32.0,37.0,37.0,37.0,25.0,25.0,25.0,34.0,34.0,34.0,41.0,41.0,41.0,40.0,40.0,40.0,33.0,33.0,33.0,35.0,35.0,35.0,26.0,26.0,26.0,31.0,31.0,31.0,34.0,34.0,34.0,29.0,29.0,29.0,33.0,33.0,33.0,30.0,28.0,28.0,28.0,24.0,24.0,24.0,24.0,42.0,42.0,42.0,36.0,36.0,36.0,44.0,44.0,44.0,26.0,26.0,26.0,32.0,32.0,32.0,32.0,32.0,32.0,33.0,33.0,33.0,33.0,33.0,33.0,27.0,27.0,27.0,34.0,34.0,34.0,23.0,23.0,23.0,27.0,27.0,27.0,27.0,27.0,27.0,28.0,28.0,28.0,28.0,28.0,28.0,24.0,24.0,24.0,40.0,40.0,40.0,34.0,34.0,34.0,42.0,42.0,42.0,36.0,36.0,36.0,33.0,33.0,33.0,38.0,38.0,38.0,30.0,30.0,30.0,31.0,31.0,31.0,39.0,39.0,39.0,30.0,30.0,30.0,32.0,32.0,32.0,34.0,34.0,34.0,23.0,23.0,23.0,39.0,39.0,39.0,27.0,27.0,27.0,26.0,26.0,26.0,41.0,41.0,41.0,34.0,34.0,34.0,34.0,34.0,34.0,33.0,33.0,33.0,37.0,37.0,37.0,33.0,33.0,33.0,46.0,46.0,46.0,43.0,43.0,43.0,50.0,50.0,50.0,38.0,38.0,38.0,38.0,38.0,38.0,42.0,42.0,42.0,33.0,33.0,33.0,34.0,31.0,31.0,31.0,28.0,28.0,28.0,34.0,34.0,34.0,30.0,30.0,30.0,28.0,28.0,28.0,31.0,31.0,31.0,29.0,29.0,29.0,27.0,27.0,27.0,28.0,28.0,28.0,28.0,28.0,28.0,29.0,29.0,29.0,37.0,37.0,37.0,39.0,39.0,39.0,38.0,38.0,38.0,39.0,39.0,39.0,38.0,38.0,38.0,27.0,27.0,27.0,35.0,35.0,35.0,29.0,29.0,29.0,29.0,29.0,29.0,24.0,24.0,24.0,31.0,31.0,31.0,46.0,46.0,46.0,51.0,51.0,51.0,48.0,48.0,48.0,52.0,52.0,52.0,40.0,40.0,40.0,37.0,37.0,37.0,35.0,35.0,35.0,39.0,39.0,39.0,33.0,33.0,33.0,35.0,35.0,35.0,26.0,26.0,26.0,35.0,35.0,35.0,30.0,30.0,30.0,29.0,29.0,29.0,43.0,43.0,43.0,39.0,39.0,39.0,34.0,34.0,34.0,43.0,43.0,43.0,42.0,42.0,42.0,48.0,48.0,48.0,40.0,40.0,40.0,52.0,52.0,52.0,43.0,43.0,43.0,45.0,45.0,45.0,39.0,39.0,39.0,40.0,40.0,40.0,43.0,43.0,43.0,37.0,37.0,37.0,51.0,51.0,51.0,40.0,40.0,40.0,38.0,38.0,38.0,43.0,43.0,43.0,41.0,41.0,41.0,41.0,41.0,41.0,37.0,37.0,37.0,33.0,33.0,33.0,43.0,43.0,43.0,34.0,34.0,34.0,36.0,36.0,36.0,30.0,30.0,30.0,37.0,37.0,37.0,34.0,34.0,34.0,33.0,33.0,33.0,34.0,34.0,34.0,33.0,33.0,33.0,39.0,39.0,39.0,30.0,30.0,30.0,33.0,33.0,33.0,33.0,33.0,33.0,34.0,34.0,34.0],"postings":{"  a":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,22,23,34,35,36,49,50,51,52,53,54,91,92,93,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"  c":[0,1,2,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,94,95,96,163,164,165,166,167,168,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,238,239,240,256,257,258,280,281,282,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,541,542,543,613,614,615,616,617,618,691,692,693,716,717,718,782,783,784,788,789,790,813,814,815,816,817,818,819,820,821,822,823,824,854,855,856,875,876,877,938,939,940,972,973,974,1038,1039,1040,1071,1072,1073,1089,1090,1091,1095,1096,1097,1098,1099,1100,1122,1123,1124,1146,1147,1148,1164,1165,1166,1185,1186,1187],"  i":[0,1,2,24,25,26,43,44,45,76,77,78,97,98,99,100,101,102,103,104,105,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,226,227,228,229,230,231,277,278,279,308,309,310,329,330,331,374,375,376,377,378,379,380,381,382,383,384,385,454,455,456,457,458,459,460,461,462,463,464,465,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,664,665,666,685,686,687,688,689,690,703,704,705,713,714,715,716,717,718,719,720,721,792,793,794,825,826,827,848,849,850,851,852,853,854,855,856,857,858,859,863,864,865,899,900,901,917,918,919,968,969,970,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1101,1102,1103,1110,1111,1112,1113,1114,1115,1116,1117,1118,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172],"  s":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,845,846,847,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187]," ar":[0,1,2,15,16,17,21,22,23,34,35,36,49,50,51,91,92,93,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187]," cl":[0,1,2,46,47,48,94,95,96,163,164,165,166,167,168,238,239,240,386,387,388,389,390,391,392,393,394,395,396,397,691,692,693,1095,1096,1097,1098,1099,1100]," in":[0,1,2,24,25,26,43,44,45,76,77,78,142,143,144,148,149,150,154,155,156,226,227,228,229,230,231,308,309,310,329,330,331,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,664,665,666,703,704,705,713,714,715,792,793,794,863,864,865,899,900,901,917,918,919,1101,1102,1103,1116,1117,1118]," sq":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,845,846,847,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"ace":[0,1,2,235,236,237,417,418,419,420,421,422,423,424,425],"an ":[0,1,2,386,387,388,389,390,391,392,393,394,395,396,397,722,723,724,725,726,727,728,729,730,731,732,733,914,915,916,971],"arm":[0,1,2,15,16,17,21,22,23,34,35,36,49,50,51,91,92,93,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"ce ":[0,1,2,46,47,48,94,95,96,235,236,237,417,418,419,420,421,422,423,424,425],"cla":[0,1,2,163,164,165,166,167,168,238,239,240,386,387,388,389,390,391,392,393,394,395,396,397,1095,1096,1097,1098,1099,1100],"d4 ":[0,3,6,9,12,15,18,21,24,27,30,36,37,40,43,46,49,52,55,58,61,64,67,70,73,76,79,82,85,88,91,94,97,100,103,106,109,112,115,118,121,124,127,130,133,136,139,142,145,148,151,154,157,160,163,166,169,172,175,178,181,184,187,190,193,196,199,202,205,208,211,214,217,220,223,226,229,232,235,238,241,244,247,250,253,256,259,262,265,268,271,274,277,280,283,286,289,292,295,298,299,302,305,308,311,314,317,320,323,326,329,332,335,338,341,344,347,350,353,356,359,362,365,368,371,374,377,380,383,386,389,392,395,398,401,404,407,410,414,417,420,423,427,431,435,439,443,447,451,454,457,460,463,466,469,472,475,478,481,484,487,490,493,496,499,502,505,508,511,514,517,520,523,526,529,532,535,538,541,544,547,550,553,556,559,562,565,568,571,574,577,580,583,586,589,592,595,598,601,604,607,610,613,616,619,622,625,628,631,634,637,640,643,646,649,652,655,658,661,664,667,670,673,676,679,682,685,688,691,694,697,700,703,706,710,713,716,719,722,725,728,731,734,737,740,743,746,749,752,755,758,761,764,767,770,773,776,779,782,785,788,792,795,798,801,804,807,810,813,816,819,822,825,828,829,833,836,839,842,845,848,851,854,857,860,863,866,869,872,875,878,881,884,887,890,893,896,899,902,905,908,911,914,917,920,923,926,929,932,935,938,941,944,947,950,953,956,959,962,965,968,971,972,975,978,981,984,987,990,993,996,999,1002,1005,1008,1011,1014,1017,1020,1023,1026,1029,1032,1035,1038,1041,1044,1047,1050,1053,1056,1059,1062,1065,1068,1071,1074,1077,1080,1083,1086,1089,1092,1095,1098,1101,1104,1107,1110,1113,1116,1119,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1152,1155,1158,1161,1164,1167,1170,1173,1176,1179,1182,1185],"erf":[0,1,2],"fac":[0,1,2],"int":[0,1,2,76,77,78,302,303,304,308,309,310,541,542,543,863,864,865,899,900,901,917,918,919],"lan":[0,1,2,386,387,388,389,390,391,392,393,394,395,396,397,869,870,871,872,873,874,875,876,877,878,879,880],"mor":[0,1,2,15,16,17,21,22,23,34,35,36,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"nte":[0,1,2,67,68,69,76,77,78,308,309,310,338,339,340,347,348,349,413,414,415,416,541,542,543,619,620,621,836,837,838,863,864,865,899,900,901,917,918,919,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049],"or ":[0,1,2,15,16,17,18,19,20,21,22,23,24,25,26,37,38,39,76,77,78,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,193,194,195,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"qd4":[0,3,6,9,12,15,18,21,24,27,30,36,37,40,43,46,49,52,55,58,61,64,67,70,73,76,79,82,85,88,91,94,97,100,103,106,109,112,115,118,121,124,127,130,133,136,139,142,145,148,151,154,157,160,163,166,169,172,175,178,181,184,187,190,193,196,199,202,205,208,211,214,217,220,223,226,229,232,235,238,241,244,247,250,253,256,259,262,265,268,271,274,277,280,283,286,289,292,295,298,299,302,305,308,311,314,317,320,323,326,329,332,335,338,341,344,347,350,353,356,359,362,365,368,371,374,377,380,383,386,389,392,395,398,401,404,407,410,414,417,420,423,427,431,435,439,443,447,451,454,457,460,463,466,469,472,475,478,481,484,487,490,493,496,499,502,505,508,511,514,517,520,523,526,529,532,535,538,541,544,547,550,553,556,559,562,565,568,571,574,577,580,583,586,589,592,595,598,601,604,607,610,613,616,619,622,625,628,631,634,637,640,643,646,649,652,655,658,661,664,667,670,673,676,679,682,685,688,691,694,697,700,703,706,710,713,716,719,722,725,728,731,734,737,740,743,746,749,752,755,758,761,764,767,770,773,776,779,782,785,788,792,795,798,801,804,807,810,813,816,819,822,825,828,829,833,836,839,842,845,848,851,854,857,860,863,866,869,872,875,878,881,884,887,890,893,896,899,902,905,908,911,914,917,920,923,926,929,932,935,938,941,944,947,950,953,956,959,962,965,968,971,972,975,978,981,984,987,990,993,996,999,1002,1005,1008,1011,1014,1017,1020,1023,1026,1029,1032,1035,1038,1041,1044,1047,1050,1053,1056,1059,1062,1065,1068,1071,1074,1077,1080,1083,1086,1089,1092,1095,1098,1101,1104,1107,1110,1113,1116,1119,1122,1125,1128,1131,1134,1137,1140,1143,1146,1149,1152,1155,1158,1161,1164,1167,1170,1173,1176,1179,1182,1185],"rfa":[0,1,2],"rmo":[0,1,2,15,16,17,21,22,23,34,35,36,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"sqd":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,845,846,847,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"ter":[0,1,2,33,40,41,42,67,68,69,76,77,78,82,83,84,202,203,204,205,206,207,208,209,210,308,309,310,338,339,340,347,348,349,413,414,415,416,619,620,621,643,644,645,646,647,648,649,650,651,652,653,654,743,744,745,746,747,748,749,750,751,752,753,754,791,836,837,838,863,864,865,899,900,901,917,918,919,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049],"d5 ":[1,4,7,10,13,16,19,22,25,28,31,34,38,41,44,47,50,53,56,59,62,65,68,71,74,77,80,83,86,89,92,95,98,101,104,107,110,113,116,119,122,125,128,131,134,137,140,143,146,149,152,155,158,161,164,167,170,173,176,179,182,185,188,191,194,197,200,203,206,209,212,215,218,221,224,227,230,233,236,239,242,245,248,251,254,257,260,263,266,269,272,275,278,281,284,287,290,293,296,300,303,306,309,312,315,318,321,324,327,330,333,336,339,342,345,348,351,354,357,360,363,366,369,372,375,378,381,384,387,390,393,396,399,402,405,408,411,415,418,421,424,428,432,436,440,444,448,452,455,458,461,464,467,470,473,476,479,482,485,488,491,494,497,500,503,506,509,512,515,518,521,524,527,530,533,536,539,542,545,548,551,554,557,560,563,566,569,572,575,578,581,584,587,590,593,596,599,602,605,608,611,614,617,620,623,626,629,632,635,638,641,644,647,650,653,656,659,662,665,668,671,674,677,680,683,686,689,692,695,698,701,704,707,711,714,717,720,723,726,729,732,735,738,741,744,747,750,753,756,759,762,765,768,771,774,777,780,783,786,789,791,793,796,799,802,805,808,811,814,817,820,823,826,830,834,837,840,843,846,849,852,855,858,861,864,867,870,873,876,879,882,885,888,891,894,897,900,903,906,909,912,915,918,921,924,927,930,933,936,939,942,945,948,951,954,957,960,963,966,969,973,976,979,982,985,988,991,994,997,1000,1003,1006,1009,1012,1015,1018,1021,1024,1027,1030,1033,1036,1039,1042,1045,1048,1051,1054,1057,1060,1063,1066,1069,1072,1075,1078,1081,1084,1087,1090,1093,1096,1099,1102,1105,1108,1111,1114,1117,1120,1123,1126,1129,1132,1135,1138,1141,1144,1147,1150,1153,1156,1159,1162,1165,1168,1171,1174,1177,1180,1183,1186],"qd5":[1,4,7,10,13,16,19,22,25,28,31,34,38,41,44,47,50,53,56,59,62,65,68,71,74,77,80,83,86,89,92,95,98,101,104,107,110,113,116,119,122,125,128,131,134,137,140,143,146,149,152,155,158,161,164,167,170,173,176,179,182,185,188,191,194,197,200,203,206,209,212,215,218,221,224,227,230,233,236,239,242,245,248,251,254,257,260,263,266,269,272,275,278,281,284,287,290,293,296,300,303,306,309,312,315,318,321,324,327,330,333,336,339,342,345,348,351,354,357,360,363,366,369,372,375,378,381,384,387,390,393,396,399,402,405,408,411,415,418,421,424,428,432,436,440,444,448,452,455,458,461,464,467,470,473,476,479,482,485,488,491,494,497,500,503,506,509,512,515,518,521,524,527,530,533,536,539,542,545,548,551,554,557,560,563,566,569,572,575,578,581,584,587,590,593,596,599,602,605,608,611,614,617,620,623,626,629,632,635,638,641,644,647,650,653,656,659,662,665,668,671,674,677,680,683,686,689,692,695,698,701,704,707,711,714,717,720,723,726,729,732,735,738,741,744,747,750,753,756,759,762,765,768,771,774,777,780,783,786,789,791,793,796,799,802,805,808,811,814,817,820,823,826,830,834,837,840,843,846,849,852,855,858,861,864,867,870,873,876,879,882,885,888,891,894,897,900,903,906,909,912,915,918,921,924,927,930,933,936,939,942,945,948,951,954,957,960,963,966,969,973,976,979,982,985,988,991,994,997,1000,1003,1006,1009,1012,1015,1018,1021,1024,1027,1030,1033,1036,1039,1042,1045,1048,1051,1054,1057,1060,1063,1066,1069,1072,1075,1078,1081,1084,1087,1090,1093,1096,1099,1102,1105,1108,1111,1114,1117,1120,1123,1126,1129,1132,1135,1138,1141,1144,1147,1150,1153,1156,1159,1162,1165,1168,1171,1174,1177,1180,1183,1186],"d6 ":[2,5,8,11,14,17,20,23,26,29,32,35,39,42,45,48,51,54,57,60,63,66,69,72,75,78,81,84,87,90,93,96,99,102,105,108,111,114,117,120,123,126,129,132,135,138,141,144,147,150,153,156,159,162,165,168,171,174,177,180,183,186,189,192,195,198,201,204,207,210,213,216,219,222,225,228,231,234,237,240,243,246,249,252,255,258,261,264,267,270,273,276,279,282,285,288,291,294,297,301,304,307,310,313,316,319,322,325,328,331,334,337,340,343,346,349,352,355,358,361,364,367,370,373,376,379,382,385,388,391,394,397,400,403,406,409,412,416,419,422,425,429,433,437,441,445,449,453,456,459,462,465,468,471,474,477,480,483,486,489,492,495,498,501,504,507,510,513,516,519,522,525,528,531,534,537,540,543,546,549,552,555,558,561,564,567,570,573,576,579,582,585,588,591,594,597,600,603,606,609,612,615,618,621,624,627,630,633,636,639,642,645,648,651,654,657,660,663,666,669,672,675,678,681,684,687,690,693,696,699,702,705,708,712,715,718,721,724,727,730,733,736,739,742,745,748,751,754,757,760,763,766,769,772,775,778,781,784,787,790,794,797,800,803,806,809,812,815,818,821,824,827,831,835,838,841,844,847,850,853,856,859,862,865,868,871,874,877,880,883,886,889,892,895,898,901,904,907,910,913,916,919,922,925,928,931,934,937,940,943,946,949,952,955,958,961,964,967,970,974,977,980,983,986,989,992,995,998,1001,1004,1007,1010,1013,1016,1019,1022,1025,1028,1031,1034,1037,1040,1043,1046,1049,1052,1055,1058,1061,1064,1067,1070,1073,1076,1079,1082,1085,1088,1091,1094,1097,1100,1103,1106,1109,1112,1115,1118,1121,1124,1127,1130,1133,1136,1139,1142,1145,1148,1151,1154,1157,1160,1163,1166,1169,1172,1175,1178,1181,1184,1187],"qd6":[2,5,8,11,14,17,20,23,26,29,32,35,39,42,45,48,51,54,57,60,63,66,69,72,75,78,81,84,87,90,93,96,99,102,105,108,111,114,117,120,123,126,129,132,135,138,141,144,147,150,153,156,159,162,165,168,171,174,177,180,183,186,189,192,195,198,201,204,207,210,213,216,219,222,225,228,231,234,237,240,243,246,249,252,255,258,261,264,267,270,273,276,279,282,285,288,291,294,297,301,304,307,310,313,316,319,322,325,328,331,334,337,340,343,346,349,352,355,358,361,364,367,370,373,376,379,382,385,388,391,394,397,400,403,406,409,412,416,419,422,425,429,433,437,441,445,449,453,456,459,462,465,468,471,474,477,480,483,486,489,492,495,498,501,504,507,510,513,516,519,522,525,528,531,534,537,540,543,546,549,552,555,558,561,564,567,570,573,576,579,582,585,588,591,594,597,600,603,606,609,612,615,618,621,624,627,630,633,636,639,642,645,648,651,654,657,660,663,666,669,672,675,678,681,684,687,690,693,696,699,702,705,708,712,715,718,721,724,727,730,733,736,739,742,745,748,751,754,757,760,763,766,769,772,775,778,781,784,787,790,794,797,800,803,806,809,812,815,818,821,824,827,831,835,838,841,844,847,850,853,856,859,862,865,868,871,874,877,880,883,886,889,892,895,898,901,904,907,910,913,916,919,922,925,928,931,934,937,940,943,946,949,952,955,958,961,964,967,970,974,977,980,983,986,989,992,995,998,1001,1004,1007,1010,1013,1016,1019,1022,1025,1028,1031,1034,1037,1040,1043,1046,1049,1052,1055,1058,1061,1064,1067,1070,1073,1076,1079,1082,1085,1088,1091,1094,1097,1100,1103,1106,1109,1112,1115,1118,1121,1124,1127,1130,1133,1136,1139,1142,1145,1148,1151,1154,1157,1160,1163,1166,1169,1172,1175,1178,1181,1184,1187],"  l":[3,4,5,6,7,8,9,10,11,40,41,42,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,160,161,162,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,190,191,192,205,206,207,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,350,351,352,365,366,367,392,393,394,442,443,444,445,475,476,477,478,479,480,508,509,510,511,512,513,544,545,546,565,566,567,568,569,570,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,631,632,633,673,674,675,706,707,708,728,729,730,755,756,757,764,765,766,767,768,769,807,808,809,829,830,831,842,843,844,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,932,933,934,950,951,952,953,954,955,956,957,958,962,963,964,965,966,967,978,979,980,1008,1009,1010,1056,1057,1058,1140,1141,1142,1167,1168,1169],"  p":[3,4,5,6,7,8,9,10,11,30,31,32,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,302,303,304,320,321,322,380,381,382,469,470,471,523,524,525,529,530,531,616,617,618,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,746,747,748,752,753,754,767,768,769,810,811,812,842,843,844,869,870,871,872,873,874,875,876,877,878,879,880,908,909,910,944,945,946,956,957,958,965,966,967,1137,1138,1139,1149,1150,1151]," ae":[3,4,5,6,7,8,302,303,304]," l ":[3,4,5,6,7,8,9,10,11,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138]," pa":[3,4,5,6,7,8,9,10,11,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201]," sa":[3,4,5,49,50,51,91,92,93,94,95,96,703,704,705,706,707,708,709,710,711,712,1104,1105,1106],"aer":[3,4,5,6,7,8],"age":[3,4,5,49,50,51,91,92,93,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,1104,1105,1106,1140,1141,1142,1143,1144,1145],"alv":[3,4,5,49,50,51,91,92,93,1104,1105,1106],"eri":[3,4,5,6,7,8,12,13,14,743,744,745,746,747,748,749,750,751,752,753,754],"ge ":[3,4,5,49,50,51,91,92,93,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,1104,1105,1106],"ie ":[3,4,5,6,7,8],"lva":[3,4,5,49,50,51,91,92,93,1104,1105,1106],"pa ":[3,4,5,6,7,8,9,10,11,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138],"rie":[3,4,5,6,7,8],"sal":[3,4,5,49,50,51,91,92,93,94,95,96,703,704,705,706,707,708,709,710,711,712,1104,1105,1106],"vag":[3,4,5,49,50,51,91,92,93,1104,1105,1106,1140,1141,1142,1143,1144,1145],"  r":[9,10,11,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,202,203,204,205,206,207,208,209,210,220,221,222,323,324,325,386,387,388,389,390,391,496,497,498,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,755,756,757,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,947,948,949,1029,1030,1031,1140,1141,1142,1143,1144,1145,1152,1153,1154,1173,1174,1175]," ai":[9,10,11,12,13,14,52,53,54,1005,1006,1007,1110,1111,1112,1113,1114,1115]," re":[9,10,11,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,202,203,204,205,206,207,208,209,210,220,221,222,323,324,325,496,497,498,1152,1153,1154,1173,1174,1175],"ail":[9,10,11,12,13,14],"cue":[9,10,11],"esc":[9,10,11],"ett":[9,10,11,12,13,14],"ile":[9,10,11,12,13,14,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,691,692,693,694,695,696,697,698,699,700,701,702],"let":[9,10,11,12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,55,56,57,73,74,75,91,92,93,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168],"res":[9,10,11,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90],"scu":[9,10,11],"te ":[9,10,11,12,13,14,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,496,497,498],"tte":[9,10,11,12,13,14,82,83,84],"ue ":[9,10,11,884,885,886,887,888,889,890,891,892,893,894,895],"  e":[12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,55,56,57,73,74,75,91,92,93,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,187,188,189,241,242,243,299,300,301,350,351,352,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,646,647,648,791,798,799,800,825,826,827,950,951,952,962,963,964,981,982,983],"  g":[12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162,163,164,165,217,218,219,220,221,222,223,224,225,404,405,406,426,427,428,429,457,458,459,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,643,644,645,658,659,660,734,735,736,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,845,846,847,848,849,850,851,852,853,854,855,856,857,858,859,959,960,961,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1125,1126,1127],"  z":[12,13,14,972,973,974,975,976,977]," en":[12,13,14,299,300,301]," ex":[12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,55,56,57,73,74,75,91,92,93,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168]," g ":[12,13,14]," ze":[12,13,14],"eer":[12,13,14],"ele":[12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,55,56,57,73,74,75,91,92,93,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,791,825,826,827],"eng":[12,13,14,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949],"ero":[12,13,14,323,324,325,326,327,328],"eto":[12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,55,56,57,73,74,75,91,92,93,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168],"exo":[12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,55,56,57,73,74,75,91,92,93,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168],"gin":[12,13,14,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,667,668,669,737,738,739],"ine":[12,13,14,46,47,48,94,95,96,121,122,123,493,494,495,535,536,537,770,771,772,773,774,775,779,780,781,908,909,910,971],"ing":[12,13,14,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,466,467,468,764,765,766,767,768,769,791],"kel":[12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,55,56,57,73,74,75,91,92,93,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168],"nee":[12,13,14],"ng ":[12,13,14,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,466,467,468,764,765,766,767,768,769,791,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913],"ngi":[12,13,14,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618],"on ":[12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,55,56,57,73,74,75,91,92,93,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,311,312,313,317,318,319,320,321,322,323,324,325,398,399,400,401,402,403,743,744,745,746,747,748,749,750,751,752,753,754,923,924,925,1152,1153,1154],"osk":[12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,55,56,57,73,74,75,91,92,93,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168],"rin":[12,13,14,535,536,537,655,656,657,658,659,660,661,662,663,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769],"ro ":[12,13,14,238,239,240],"ske":[12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,55,56,57,73,74,75,91,92,93,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168],"ton":[12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,55,56,57,73,74,75,91,92,93,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168],"xos":[12,13,14,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,55,56,57,73,74,75,91,92,93,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168],"zer":[12,13,14,202,203,204,205,206,207,208,209,210],"  b":[15,16,17,37,38,39,67,68,69,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187]," ba":[15,16,17,37,38,39,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187]," gl":[15,16,17,18,19,20,21,22,23,24,25,26,34,35,36,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162,163,164,165,658,659,660]," s ":[15,16,17,305,306,307],"adi":[15,16,17,18,19,20,21,22,23,24,25,26,848,849,850,851,852,853,854,855,856,857,858,859,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067],"ato":[15,16,17,18,19,20,21,22,23,24,25,26,37,38,39,226,227,228,229,230,231,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543],"att":[15,16,17,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"bat":[15,16,17,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"dia":[15,16,17,18,19,20,21,22,23,24,25,26],"gla":[15,16,17,18,19,20,21,22,23,24,25,26],"iat":[15,16,17,18,19,20,21,22,23,24,25,26,103,104,105],"lad":[15,16,17,18,19,20,21,22,23,24,25,26],"le ":[15,16,17,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"tle":[15,16,17,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"tor":[15,16,17,18,19,20,21,22,23,24,25,26,37,38,39,76,77,78,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,226,227,228,229,230,231,308,309,310,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,863,864,865,899,900,901,917,918,919,923,924,925,926,927,928,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172],"ttl":[15,16,17,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"  t":[18,19,20,33,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,184,185,186,199,200,201,202,203,204,205,206,207,208,209,210,217,218,219,253,254,255,268,269,270,274,275,276,298,484,485,486,502,503,504,589,590,591,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,682,683,684,716,717,718,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,1065,1066,1067,1080,1081,1082,1107,1108,1109,1122,1123,1124,1146,1147,1148,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172]," sp":[18,19,20,82,83,84,229,230,231,235,236,237,265,266,267,286,287,288,417,418,419,420,421,422,423,424,425,652,653,654,996,997,998]," th":[18,19,20,33,217,218,219,755,756,757,758,759,760,761,762,763,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,1107,1108,1109],"der":[18,19,20,73,74,75,703,704,705,706,707,708,709,710,711,712,860,861,862,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970],"er ":[18,19,20,33,40,41,42,55,56,57,67,68,69,73,74,75,82,83,84,106,107,108,115,116,117,118,119,120,124,125,126,175,176,177,178,179,180,202,203,204,205,206,207,208,209,210,220,221,222,244,245,246,247,248,249,262,263,264,271,272,273,338,339,340,347,348,349,350,351,352,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,392,393,394,407,408,409,413,414,415,416,417,418,419,434,435,436,437,442,443,444,445,460,461,462,472,473,474,475,476,477,505,506,507,508,509,510,562,563,564,565,566,567,604,605,606,607,608,609,619,620,621,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,670,671,672,673,674,675,685,686,687,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,722,723,724,779,780,781,791,801,802,803,836,837,838,842,843,844,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,950,951,952,956,957,958,962,963,964,965,966,967,1020,1021,1022,1023,1024,1025,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1131,1132,1133,1140,1141,1142,1143,1144,1145],"he ":[18,19,20,217,218,219,389,390,391,1107,1108,1109],"ide":[18,19,20,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690],"pid":[18,19,20],"spi":[18,19,20],"the":[18,19,20,217,218,219,755,756,757,758,759,760,761,762,763,1107,1108,1109],"ed ":[21,22,23,34,35,36,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162,299,300,301,398,399,400,592,593,594,595,596,597],"glo":[21,22,23,34,35,36,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162],"lov":[21,22,23,34,35,36,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162],"ore":[21,22,23,34,35,36,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162],"ove":[21,22,23,34,35,36,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162],"red":[21,22,23,34,35,36,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162,490,491,492,580,581,582,694,695,696],"ve ":[21,22,23,34,35,36,139,140,141,145,146,147,151,152,153,157,158,159,160,161,162,202,203,204,205,206,207,208,209,210,556,557,558,631,632,633,634,635,636,637,638,639,640,641,642,1173,1174,1175],"  d":[24,25,26,43,44,45,112,113,114,142,143,144,148,149,150,154,155,156,172,173,174,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,232,233,234,302,303,304,398,399,400,401,402,403,466,467,468,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,550,551,552,577,578,579,592,593,594,601,602,603,655,656,657,734,735,736,764,765,766,776,777,778,828,845,846,847,857,858,859,878,879,880,896,897,898,1101,1102,1103,1107,1108,1109]," dr":[24,25,26,43,44,45,142,143,144,148,149,150,154,155,156,398,399,400,401,402,403,1101,1102,1103],"al ":[24,25,26,43,44,45,142,143,144,148,149,150,154,155,156,229,230,231,395,396,397,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,541,542,543,667,668,669,737,738,739,791,825,826,827,1101,1102,1103],"dri":[24,25,26,43,44,45,142,143,144,148,149,150,154,155,156,1101,1102,1103],"dus":[24,25,26,43,44,45,142,143,144,148,149,150,154,155,156,1101,1102,1103],"ial":[24,25,26,43,44,45,142,143,144,148,149,150,154,155,156,229,230,231,1101,1102,1103],"ill":[24,25,26,27,28,29,30,31,32,43,44,45,91,92,93,94,95,96,142,143,144,148,149,150,154,155,156,217,218,219,338,339,340,758,759,760,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1101,1102,1103],"ind":[24,25,26,43,44,45,142,143,144,148,149,150,154,155,156,1101,1102,1103],"ll ":[24,25,26,43,44,45,124,125,126,142,143,144,148,149,150,154,155,156,305,306,307,1101,1102,1103],"ndu":[24,25,26,43,44,45,142,143,144,148,149,150,154,155,156,1101,1102,1103],"ria":[24,25,26,43,44,45,142,143,144,148,149,150,154,155,156,1101,1102,1103],"ril":[24,25,26,27,28,29,30,31,32,43,44,45,91,92,93,94,95,96,142,143,144,148,149,150,154,155,156,1101,1102,1103],"str":[24,25,26,43,44,45,142,143,144,148,149,150,154,155,156,520,521,522,523,524,525,526,527,528,1101,1102,1103],"tri":[24,25,26,43,44,45,142,143,144,148,149,150,154,155,156,520,521,522,523,524,525,526,527,528,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,1101,1102,1103],"ust":[24,25,26,43,44,45,142,143,144,148,149,150,154,155,156,1101,1102,1103],"  f":[27,28,29,115,116,117,175,176,177,202,203,204,244,245,246,262,263,264,271,272,273,283,284,285,311,312,313,338,339,340,341,342,343,344,345,346,362,363,364,374,375,376,404,405,406,407,408,409,410,411,412,417,418,419,434,435,436,437,460,461,462,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,505,506,507,550,551,552,553,554,555,562,563,564,580,581,582,604,605,606,670,671,672,685,686,687,694,695,696,722,723,724,801,802,803,923,924,925,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1050,1051,1052,1053,1054,1055,1083,1084,1085]," fa":[27,28,29,311,312,313,338,339,340,341,342,343,344,345,346,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,550,551,552,553,554,555,923,924,925,1026,1027,1028]," go":[27,28,29,30,31,32,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037],"alc":[27,28,29,311,312,313,923,924,925],"ata":[27,28,29],"cat":[27,28,29,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,782,783,784],"fal":[27,28,29,311,312,313,923,924,925],"gor":[27,28,29,30,31,32],"la ":[27,28,29,30,31,32,91,92,93,94,95,96],"lca":[27,28,29],"lla":[27,28,29,30,31,32,91,92,93,94,95,96],"ori":[27,28,29,30,31,32,202,203,204,205,206,207,208,209,210,667,668,669,737,738,739],"ta ":[27,28,29],"  2":[30,31,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,91,92,93,94,95,96,106,107,108,487,488,489]," 2b":[30,31,32]," pe":[30,31,32,91,92,93,94,95,96],"2b ":[30,31,32],"ex ":[30,31,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,91,92,93,94,95,96],"pex":[30,31,32,91,92,93,94,95,96],"  m":[33,37,38,39,46,47,48,61,62,63,64,65,66,67,68,69,70,71,72,94,95,96,121,122,123,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,181,182,183,208,209,210,226,227,228,229,230,231,250,251,252,262,263,264,265,266,267,268,269,270,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,329,330,331,332,333,334,335,336,337,356,357,358,368,369,370,377,378,379,386,387,388,389,390,391,392,393,394,395,396,397,410,411,412,420,421,422,423,424,425,446,447,448,449,450,451,452,453,463,464,465,481,482,483,487,488,489,493,494,495,514,515,516,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,553,554,555,559,560,561,571,572,573,583,584,585,595,596,597,598,599,600,610,611,612,613,614,615,622,623,624,649,650,651,661,662,663,676,677,678,679,680,681,713,714,715,716,717,718,719,720,721,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,804,805,806,839,840,841,860,861,862,902,903,904,905,906,907,908,909,910,941,942,943,984,985,986,987,988,989,990,991,992,1011,1012,1013,1014,1015,1016,1041,1042,1043,1047,1048,1049,1059,1060,1061,1110,1111,1112,1113,1114,1115,1119,1120,1121,1131,1132,1133]," gr":[33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,118,119,120,217,218,219,220,221,222,223,224,225,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,734,735,736,845,846,847,848,849,850,851,852,853,854,855,856,857,858,859,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067]," ma":[33,37,38,39,121,122,123,532,533,534,535,536,537,559,560,561,598,599,600,860,861,862,1041,1042,1043,1047,1048,1049,1059,1060,1061],"ast":[33,338,339,340,341,342,343,344,345,346,743,744,745,746,747,748,749,750,751,752,753,754,971,1026,1027,1028],"d1 ":[33],"dho":[33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51],"ef ":[33],"gro":[33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51],"hie":[33],"hog":[33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51],"ief":[33],"mas":[33],"ndh":[33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51],"og ":[33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51],"oun":[33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,67,68,69],"qd1":[33],"rou":[33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51],"ste":[33,214,215,216,286,287,288,743,744,745,746,747,748,749,750,751,752,753,754],"thi":[33],"und":[33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,770,771,772,773,774,775,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971]," 20":[34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51]," ce":[34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,813,814,815],"05 ":[34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51],"205":[34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51],"cex":[34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51],"ani":[37,38,39,929,930,931],"asi":[37,38,39],"bas":[37,38,39,971],"ic ":[37,38,39,277,278,279,532,533,534,559,560,561,598,599,600],"ipu":[37,38,39],"lat":[37,38,39],"man":[37,38,39,703,704,705,706,707,708,709,710,711,712,914,915,916,1071,1072,1073],"nip":[37,38,39,106,107,108],"pul":[37,38,39,842,843,844,956,957,958,965,966,967],"sic":[37,38,39],"ula":[37,38,39,822,823,824]," ca":[40,41,42,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,716,717,718,782,783,784,788,789,790,1122,1123,1124,1146,1147,1148]," li":[40,41,42,112,113,114,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258],"arg":[40,41,42,1173,1174,1175,1176,1177,1178],"car":[40,41,42],"fte":[40,41,42],"go ":[40,41,42],"ift":[40,41,42],"lif":[40,41,42],"rgo":[40,41,42]," mi":[46,47,48,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,262,263,264,265,266,267,268,269,270,410,411,412,423,424,425,450,451,452,453,463,464,465,493,494,495,779,780,781,791,908,909,910],"anc":[46,47,48,94,95,96,299,300,301,398,399,400],"ara":[46,47,48,94,95,96,860,861,862,929,930,931],"cle":[46,47,48,94,95,96],"ear":[46,47,48,94,95,96,347,348,349,619,620,621,836,837,838,884,885,886,887,888,889,890,891,892,893,894,895],"lea":[46,47,48,94,95,96],"min":[46,47,48,94,95,96,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,493,494,495,779,780,781,791,908,909,910],"nce":[46,47,48,94,95,96,299,300,301,398,399,400],"ne ":[46,47,48,94,95,96,121,122,123,133,134,135,136,137,138,535,536,537,770,771,772,773,774,775,908,909,910,971],"ran":[46,47,48,94,95,96,929,930,931],"rm ":[49,50,51,91,92,93,196,197,198,335,336,337,359,360,361,371,372,373,383,384,385,517,518,519,574,575,576,679,680,681,819,820,821,829,830,831,905,906,907,911,912,913,999,1000,1001,1008,1009,1010,1017,1018,1019,1041,1042,1043,1044,1045,1046,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1104,1105,1106,1140,1141,1142,1161,1162,1163,1167,1168,1169,1170,1171,1172],"  h":[52,53,54,55,56,57,67,68,69,133,134,135,136,137,138,305,306,307,338,339,340,353,354,355,413,414,415,416,438,439,440,441,520,521,522,556,557,558,592,593,594,595,596,597,688,689,690,725,726,727,801,802,803,804,805,806,816,817,818,819,820,821,845,846,847,884,885,886,887,888,889,890,891,892,893,894,895,914,915,916,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,972,973,974,975,976,977,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1122,1123,1124]," 21":[52,53,54]," ha":[52,53,54,520,521,522,592,593,594,595,596,597,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079],"10 ":[52,53,54],"210":[52,53,54],"aix":[52,53,54],"ant":[52,53,54,329,330,331,664,665,666,703,704,705,713,714,715,792,793,794,1080,1081,1082,1116,1117,1118],"han":[52,53,54,299,300,301],"ix ":[52,53,54],"ntu":[52,53,54],"tu ":[52,53,54]," he":[55,56,57,305,306,307,413,414,415,416,801,802,803,804,805,806,816,817,818,819,820,821,845,846,847,884,885,886,887,888,889,890,891,892,893,894,895,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,972,973,974,975,976,977,1050,1051,1052],"aul":[55,56,57,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"avy":[55,56,57,801,802,803,804,805,806,816,817,818,819,820,821,845,846,847,884,885,886,887,888,889,890,891,892,893,894,895,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,972,973,974,975,976,977,1050,1051,1052],"eav":[55,56,57,801,802,803,804,805,806,816,817,818,819,820,821,845,846,847,884,885,886,887,888,889,890,891,892,893,894,895,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,972,973,974,975,976,977,1050,1051,1052],"hau":[55,56,57,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079],"hea":[55,56,57,413,414,415,416,801,802,803,804,805,806,816,817,818,819,820,821,845,846,847,884,885,886,887,888,889,890,891,892,893,894,895,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,972,973,974,975,976,977,1050,1051,1052],"ler":[55,56,57,338,339,340,691,692,693,694,695,696,697,698,699,700,701,702,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049],"ule":[55,56,57],"vyh":[55,56,57],"yha":[55,56,57],"  k":[58,59,60,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,338,339,340,466,467,468,758,759,760,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121]," kr":[58,59,60],"ise":[58,59,60,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172],"kri":[58,59,60],"ris":[58,59,60],"se ":[58,59,60,302,303,304,691,692,693,713,714,715,716,717,718,719,720,721,842,843,844,956,957,958,965,966,967,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172],"  n":[61,62,63,64,65,66,67,68,69,70,71,72,395,396,397,625,626,627,634,635,636,782,783,784,1044,1045,1046,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139],"  x":[61,62,63,64,65,66,67,68,69,70,71,72,280,281,282,295,296,297,807,808,809,825,826,827,953,954,955,1179,1180,1181,1182,1183,1184,1185,1186,1187]," mk":[61,62,63,64,65,66,67,68,69,70,71,72,226,227,228,229,230,231,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,1110,1111,1112,1113,1114,1115]," ni":[61,62,63,64,65,66,67,68,69,70,71,72]," xx":[61,62,63,64,65,66,67,68,69,70,71,72],"awk":[61,62,63,64,65,66,67,68,69,70,71,72],"ght":[61,62,63,64,65,66,67,68,69,70,71,72,112,113,114,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258],"haw":[61,62,63,64,65,66,67,68,69,70,71,72],"hth":[61,62,63,64,65,66,67,68,69,70,71,72],"igh":[61,62,63,64,65,66,67,68,69,70,71,72,112,113,114,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258],"mk ":[61,62,63,64,65,66,67,68,69,70,71,72,226,227,228,229,230,231,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,1110,1111,1112,1113,1114,1115],"nig":[61,62,63,64,65,66,67,68,69,70,71,72],"tha":[61,62,63,64,65,66,67,68,69,70,71,72],"wk ":[61,62,63,64,65,66,67,68,69,70,71,72],"xi ":[61,62,63],"xxi":[61,62,63,64,65,66],"ii ":[64,65,66,97,98,99,100,101,102,103,104,105,145,146,147,148,149,150,151,152,153,154,155,156,374,375,376,377,378,379,380,381,382,383,384,385,454,455,456,457,458,459,460,461,462,463,464,465,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,685,686,687,688,689,690,825,826,827,848,849,850,851,852,853,854,855,856,857,858,859,968,969,970,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1077,1078,1079,1110,1111,1112,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172],"xii":[64,65,66]," bo":[67,68,69]," hu":[67,68,69,133,134,135,136,137,138,338,339,340,914,915,916,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049],"bou":[67,68,69],"hun":[67,68,69,338,339,340,347,348,349,413,414,415,416,619,620,621,836,837,838,914,915,916,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049],"nty":[67,68,69],"ty ":[67,68,69,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769],"unt":[67,68,69,338,339,340,347,348,349,413,414,415,416,619,620,621,836,837,838,914,915,916,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049],"xx ":[67,68,69,70,71,72],"xxx":[67,68,69,70,71,72],"  5":[73,74,75]," 50":[73,74,75]," p ":[73,74,75]," po":[73,74,75,302,303,304,908,909,910],"00 ":[73,74,75],"000":[73,74,75],"500":[73,74,75],"ade":[73,74,75,118,119,120,292,293,294,311,312,313,700,701,702,743,744,745,746,747,748,773,774,775,836,837,838,839,840,841,842,843,844,890,891,892,923,924,925,950,951,952,953,954,955,956,957,958,1023,1024,1025,1095,1096,1097],"erl":[73,74,75],"loa":[73,74,75],"oad":[73,74,75],"owe":[73,74,75],"pow":[73,74,75],"rlo":[73,74,75],"wer":[73,74,75],"ate":[76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,791],"cto":[76,77,78,308,309,310,863,864,865,899,900,901,917,918,919],"dic":[76,77,78,308,309,310,863,864,865,899,900,901,917,918,919],"erd":[76,77,78,308,309,310,863,864,865,899,900,901,917,918,919],"esg":[76,77,78,79,80,81,82,83,84,85,86,87,88,89,90],"gat":[76,77,78,79,80,81,82,83,84,85,86,87,88,89,90],"ict":[76,77,78,308,309,310,863,864,865,899,900,901,917,918,919],"rdi":[76,77,78,308,309,310,863,864,865,899,900,901,917,918,919],"sga":[76,77,78,79,80,81,82,83,84,85,86,87,88,89,90]," sc":[79,80,81,217,218,219,220,221,222,223,224,225,323,324,325,326,327,328],"cou":[79,80,81,217,218,219,220,221,222,223,224,225,323,324,325,326,327,328],"out":[79,80,81,217,218,219,220,221,222,223,224,225,323,324,325,326,327,328],"sco":[79,80,81,217,218,219,220,221,222,223,224,225,323,324,325,326,327,328],"ut ":[79,80,81,217,218,219,220,221,222,223,224,225,323,324,325,326,327,328],"ott":[82,83,84,691,692,693,694,695,696,697,698,699,700,701,702],"pot":[82,83,84],"spo":[82,83,84]," su":[88,89,90,106,107,108,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,217,218,219,220,221,222,223,224,225,302,303,304,323,324,325,326,327,328,344,345,346,466,467,468,469,470,471,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,550,551,552,553,554,555,734,735,736,758,759,760,791,822,823,824,845,846,847,932,933,934,1035,1036,1037,1092,1093,1094,1134,1135,1136,1158,1159,1160],"ort":[88,89,90,344,345,346,466,467,468,469,470,471,758,759,760,804,805,806,822,823,824,932,933,934,987,988,989,1035,1036,1037,1092,1093,1094,1119,1120,1121,1134,1135,1136,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172],"por":[88,89,90,344,345,346,466,467,468,469,470,471,758,759,760,822,823,824,932,933,934,1035,1036,1037,1092,1093,1094,1134,1135,1136,1158,1159,1160],"ppo":[88,89,90,344,345,346,466,467,468,469,470,471,758,759,760,822,823,824,932,933,934,1035,1036,1037,1092,1093,1094,1134,1135,1136,1158,1159,1160],"rt ":[88,89,90,344,345,346,466,467,468,469,470,471,758,759,760,822,823,824,932,933,934,1035,1036,1037,1092,1093,1094,1134,1135,1136,1158,1159,1160],"sup":[88,89,90,344,345,346,466,467,468,469,470,471,758,759,760,822,823,824,932,933,934,1035,1036,1037,1092,1093,1094,1134,1135,1136,1158,1159,1160],"upp":[88,89,90,344,345,346,466,467,468,469,470,471,758,759,760,822,823,824,932,933,934,1035,1036,1037,1092,1093,1094,1134,1135,1136,1158,1159,1160]," 2f":[91,92,93,94,95,96],"2f ":[91,92,93,94,95,96],"alr":[91,92,93,94,95,96],"lri":[91,92,93,94,95,96]," ii":[97,98,99,100,101,102,103,104,105,145,146,147,148,149,150,151,152,153,154,155,156,277,278,279,374,375,376,377,378,379,380,381,382,383,384,385,454,455,456,457,458,459,460,461,462,463,464,465,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,685,686,687,688,689,690,825,826,827,848,849,850,851,852,853,854,855,856,857,858,859,968,969,970,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1077,1078,1079,1110,1111,1112,1113,1114,1115,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172]," sm":[97,98,99,100,101,102,103,104,105,124,125,126],"avi":[97,98,99,100,101,102,112,113,114,172,173,174,466,467,468,550,551,552,577,578,579,592,593,594,601,602,603,655,656,657,764,765,766,896,897,898],"dav":[97,98,99,100,101,102,112,113,114,172,173,174,466,467,468,550,551,552,577,578,579,592,593,594,601,602,603,655,656,657,764,765,766,896,897,898],"hda":[97,98,99,100,101,102],"id ":[97,98,99,100,101,102,112,113,114,172,173,174,386,387,388,466,467,468,550,551,552,577,578,579,592,593,594,601,602,603,655,656,657,764,765,766,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,884,885,886,896,897,898],"moo":[97,98,99,100,101,102,103,104,105],"oot":[97,98,99,100,101,102,103,104,105],"oth":[97,98,99,100,101,102,103,104,105,914,915,916,917,918,919,920,921,922],"smo":[97,98,99,100,101,102,103,104,105],"thd":[97,98,99,100,101,102],"vid":[97,98,99,100,101,102,112,113,114,172,173,174,466,467,468,550,551,552,577,578,579,592,593,594,601,602,603,655,656,657,764,765,766,896,897,898],"iii":[100,101,102,151,152,153,154,155,156,457,458,459,460,461,462,463,464,465],"ath":[103,104,105,217,218,219,220,221,222,223,224,225,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,734,735,736,845,846,847],"gol":[103,104,105,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037],"hgo":[103,104,105],"lia":[103,104,105],"oli":[103,104,105],"th ":[103,104,105,214,215,216,217,218,219,220,221,222,223,224,225,286,287,288,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,734,735,736,792,793,794,795,796,797,845,846,847,914,915,916,917,918,919,920,921,922],"thg":[103,104,105]," 28":[106,107,108]," sn":[106,107,108],"28 ":[106,107,108],"ab ":[106,107,108],"ipe":[106,107,108],"it ":[106,107,108,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,217,218,219,220,221,222,223,224,225,302,303,304,323,324,325,326,327,328,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,734,735,736,791,845,846,847],"pab":[106,107,108],"per":[106,107,108,220,221,222],"sni":[106,107,108],"sui":[106,107,108,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,217,218,219,220,221,222,223,224,225,302,303,304,323,324,325,326,327,328,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,734,735,736,791,845,846,847],"uit":[106,107,108,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,217,218,219,220,221,222,223,224,225,302,303,304,323,324,325,326,327,328,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,734,735,736,791,845,846,847]," g1":[109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132]," to":[109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172],"12 ":[109,110,111,133,134,135],"ado":[109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138],"do ":[109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,1071,1072,1073],"g12":[109,110,111],"nad":[109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,848,849,850,851,852,853,854,855,856,857,858,859,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067],"orn":[109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138],"rna":[109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138]," da":[112,113,114,172,173,174,466,467,468,550,551,552,577,578,579,592,593,594,601,602,603,655,656,657,764,765,766,896,897,898,1107,1108,1109]," ga":[112,113,114,404,405,406,426,427,428,429,457,458,459,643,644,645,959,960,961,1125,1126,1127],"13 ":[112,113,114,115,116,117,118,119,120,121,122,123,124,125,126],"aus":[112,113,114,404,405,406,426,427,428,429,457,458,459,643,644,645,959,960,961,1125,1126,1127],"g13":[112,113,114,115,116,117,118,119,120,121,122,123,124,125,126],"gau":[112,113,114,404,405,406,426,427,428,429,457,458,459,643,644,645,959,960,961,1125,1126,1127],"ht ":[112,113,114,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258],"lig":[112,113,114,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258],"ss ":[112,113,114,404,405,406,426,427,428,429,457,458,459,643,644,645,959,960,961,1125,1126,1127],"uss":[112,113,114,404,405,406,426,427,428,429,457,458,459,643,644,645,959,960,961,1125,1126,1127]," fl":[115,116,117,175,176,177,202,203,204,244,245,246,262,263,264,271,272,273,362,363,364,374,375,376,407,408,409,417,418,419,434,435,436,437,460,461,462,472,473,474,505,506,507,562,563,564,604,605,606,670,671,672,685,686,687,722,723,724,801,802,803,1050,1051,1052,1053,1054,1055],"ame":[115,116,117,175,176,177,202,203,204,244,245,246,262,263,264,271,272,273,362,363,364,374,375,376,407,408,409,417,418,419,434,435,436,437,460,461,462,472,473,474,505,506,507,562,563,564,604,605,606,670,671,672,685,686,687,722,723,724,801,802,803,1050,1051,1052,1053,1054,1055],"fla":[115,116,117,175,176,177,202,203,204,244,245,246,262,263,264,271,272,273,362,363,364,374,375,376,407,408,409,417,418,419,434,435,436,437,460,461,462,472,473,474,505,506,507,562,563,564,604,605,606,670,671,672,685,686,687,722,723,724,801,802,803,1050,1051,1052,1053,1054,1055],"lam":[115,116,117,175,176,177,202,203,204,244,245,246,262,263,264,271,272,273,362,363,364,374,375,376,407,408,409,417,418,419,434,435,436,437,460,461,462,472,473,474,505,506,507,562,563,564,604,605,606,670,671,672,685,686,687,703,704,705,706,707,708,709,710,711,712,722,723,724,801,802,803,1050,1051,1052,1053,1054,1055],"mer":[115,116,117,175,176,177,202,203,204,244,245,246,262,263,264,271,272,273,362,363,364,374,375,376,407,408,409,417,418,419,434,435,436,437,460,461,462,472,473,474,505,506,507,562,563,564,604,605,606,670,671,672,685,686,687,722,723,724,801,802,803,1050,1051,1052,1053,1054,1055]," la":[118,119,120,124,125,126,178,179,180,205,206,207,247,248,249,350,351,352,365,366,367,392,393,394,442,443,444,445,475,476,477,508,509,510,565,566,567,607,608,609,631,632,633,673,674,675,706,707,708,842,843,844,950,951,952,956,957,958,962,963,964,965,966,967],"aun":[118,119,120],"che":[118,119,120,389,390,391],"de ":[118,119,120,292,293,294,311,312,313,700,701,702,743,744,745,746,747,748,773,774,775,836,837,838,839,840,841,842,843,844,890,891,892,923,924,925,950,951,952,953,954,955,956,957,958,1023,1024,1025,1095,1096,1097],"ena":[118,119,120,848,849,850,851,852,853,854,855,856,857,858,859,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067],"gre":[118,119,120,848,849,850,851,852,853,854,855,856,857,858,859,863,864,865,866,867,868,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067],"her":[118,119,120],"lau":[118,119,120],"nch":[118,119,120],"ren":[118,119,120,848,849,850,851,852,853,854,855,856,857,858,859,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067],"unc":[118,119,120]," gu":[121,122,123],"ach":[121,122,123,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,389,390,391],"chi":[121,122,123,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106],"gun":[121,122,123],"hin":[121,122,123,881,882,883],"mac":[121,122,123],"un ":[121,122,123],"all":[124,125,126,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,1107,1108,1109],"ase":[124,125,126,178,179,180,205,206,207,247,248,249,350,351,352,365,366,367,392,393,394,442,443,444,445,475,476,477,508,509,510,565,566,567,607,608,609,631,632,633,673,674,675,706,707,708,842,843,844,950,951,952,956,957,958,962,963,964,965,966,967],"las":[124,125,126,178,179,180,205,206,207,247,248,249,350,351,352,365,366,367,392,393,394,442,443,444,445,469,470,471,475,476,477,508,509,510,565,566,567,607,608,609,631,632,633,673,674,675,706,707,708,767,768,769,810,811,812,842,843,844,944,945,946,950,951,952,956,957,958,962,963,964,965,966,967,1137,1138,1139],"mal":[124,125,126],"ser":[124,125,126,178,179,180,205,206,207,247,248,249,350,351,352,365,366,367,392,393,394,442,443,444,445,475,476,477,508,509,510,565,566,567,607,608,609,631,632,633,673,674,675,706,707,708,842,843,844,950,951,952,956,957,958,962,963,964,965,966,967],"sma":[124,125,126,469,470,471,767,768,769,810,811,812,914,915,916,944,945,946,1137,1138,1139],"14 ":[127,128,129],"g14":[127,128,129],"17 ":[130,131,132,136,137,138],"g17":[130,131,132]," p1":[133,134,135,136,137,138],"ane":[133,134,135,136,137,138],"can":[133,134,135,136,137,138],"hur":[133,134,135,136,137,138],"ica":[133,134,135,136,137,138,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201],"p12":[133,134,135],"ric":[133,134,135,136,137,138],"rri":[133,134,135,136,137,138],"urr":[133,134,135,136,137,138],"p17":[136,137,138]," i ":[139,140,141,142,143,144,226,227,228,229,230,231]," ra":[139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,386,387,388,389,390,391,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,1140,1141,1142,1143,1144,1145]," tu":[139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168],"at ":[139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,691,692,693,734,735,736,782,783,784],"el ":[139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,520,521,522],"ini":[139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,791],"nel":[139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,779,780,781],"nin":[139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,791],"nne":[139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168],"rat":[139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,226,227,228,229,230,231,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,734,735,736],"tun":[139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168],"unn":[139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168]," iv":[157,158,159,160,161,162,163,164,165,166,167,168],"gl ":[157,158,159,163,164,165,262,263,264,265,266,267,268,269,270,658,659,660],"iv ":[157,158,159,160,161,162,163,164,165,166,167,168]," lm":[160,161,162,166,167,168,190,191,192],"lmg":[160,161,162,166,167,168,190,191,192],"mg ":[160,161,162,166,167,168,181,182,183,190,191,192,208,209,210,250,251,252,353,354,355,368,369,370,420,421,422,438,439,440,441,446,447,448,449,481,482,483,487,488,489,514,515,516,553,554,555,571,572,573,583,584,585,595,596,597,610,611,612,661,662,663,676,677,678,688,689,690,725,726,727,902,903,904,984,985,986,1122,1123,1124,1131,1132,1133],"aw ":[163,164,165,166,167,168,238,239,240,1095,1096,1097,1098,1099,1100],"law":[163,164,165,166,167,168,238,239,240,1095,1096,1097,1098,1099,1100],"  w":[169,170,171,217,218,219,226,227,228,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,1173,1174,1175,1176,1177,1178]," ac":[169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186]," wo":[169,170,171,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812],"eus":[169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,755,756,757,758,759,760,761,762,763],"hil":[169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139],"leu":[169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186],"ob ":[169,170,171],"us ":[169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,283,284,285,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,655,656,657,658,659,660,661,662,663,755,756,757,758,759,760,761,762,763],"wob":[169,170,171]," mg":[181,182,183,208,209,210,250,251,252,368,369,370,420,421,422,446,447,448,449,481,482,483,487,488,489,514,515,516,553,554,555,571,572,573,583,584,585,595,596,597,610,611,612,661,662,663,676,677,678,902,903,904,984,985,986,1131,1132,1133]," ta":[184,185,186,199,200,201,253,254,255,268,269,270,274,275,276,484,485,486,502,503,504,589,590,591,640,641,642,929,930,931,1065,1066,1067,1080,1081,1082],"ag ":[184,185,186,199,200,201,253,254,255,268,269,270,274,275,276,484,485,486,502,503,504,589,590,591,640,641,642,1065,1066,1067],"tag":[184,185,186,199,200,201,253,254,255,268,269,270,274,275,276,484,485,486,502,503,504,589,590,591,640,641,642,1065,1066,1067]," co":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,541,542,543,691,692,693,816,817,818,819,820,821,1071,1072,1073]," ec":[187,188,189,241,242,243],"abl":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201],"aci":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201],"ati":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201],"ble":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201],"cif":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201],"cm ":[187,188,189,241,242,243],"con":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,311,312,313,323,324,325,923,924,925,1152,1153,1154],"ecm":[187,188,189,241,242,243],"fic":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201],"ifi":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654],"ion":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,743,744,745,746,747,748,749,750,751,752,753,754],"nst":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,737,738,739,740,741,742],"ons":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201],"pac":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,235,236,237,417,418,419,420,421,422,423,424,425],"sta":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,737,738,739,740,741,742],"tab":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201],"tio":[187,188,189,190,191,192,193,194,195,196,197,198,199,200,201]," se":[193,194,195,283,284,285,496,497,498,499,500,501,538,539,540,586,587,588,713,714,715,716,717,718,719,720,721,971,1131,1132,1133],"ens":[193,194,195,302,303,304,496,497,498,499,500,501,538,539,540,586,587,588],"nso":[193,194,195,496,497,498,499,500,501,538,539,540,586,587,588],"sen":[193,194,195,496,497,498,499,500,501,538,539,540,586,587,588],"sor":[193,194,195,496,497,498,499,500,501,538,539,540,586,587,588]," sr":[196,197,198,335,336,337,359,360,361,371,372,373,383,384,385,517,518,519,574,575,576,819,820,821,911,912,913,999,1000,1001,1017,1018,1019,1041,1042,1043,1044,1045,1046,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1170,1171,1172],"srm":[196,197,198,335,336,337,359,360,361,371,372,373,383,384,385,517,518,519,574,575,576,819,820,821,911,912,913,999,1000,1001,1017,1018,1019,1041,1042,1043,1044,1045,1046,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1161,1162,1163,1170,1171,1172]," dj":[202,203,204,205,206,207,208,209,210,211,212,213,214,215,216]," te":[202,203,204,205,206,207,208,209,210,643,644,645,646,647,648,649,650,651,652,653,654,716,717,718,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,1122,1123,1124,1146,1147,1148],"cti":[202,203,204,205,206,207,208,209,210,1173,1174,1175],"dji":[202,203,204,205,206,207,208,209,210,211,212,213,214,215,216],"ect":[202,203,204,205,206,207,208,209,210,286,287,288],"efl":[202,203,204,205,206,207,208,209,210],"err":[202,203,204,205,206,207,208,209,210,643,644,645,646,647,648,649,650,651,652,653,654],"fle":[202,203,204,205,206,207,208,209,210],"inn":[202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,822,823,824],"ive":[202,203,204,205,206,207,208,209,210,556,557,558,631,632,633,634,635,636,637,638,639,640,641,642,1173,1174,1175],"ize":[202,203,204,205,206,207,208,209,210],"jin":[202,203,204,205,206,207,208,209,210,211,212,213,214,215,216],"lec":[202,203,204,205,206,207,208,209,210],"nn ":[202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,822,823,824],"ref":[202,203,204,205,206,207,208,209,210],"riz":[202,203,204,205,206,207,208,209,210],"ror":[202,203,204,205,206,207,208,209,210],"rro":[202,203,204,205,206,207,208,209,210],"tiv":[202,203,204,205,206,207,208,209,210,631,632,633,634,635,636,637,638,639,640,641,642,1173,1174,1175]," st":[214,215,216,286,287,288,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,923,924,925,926,927,928],"alt":[214,215,216,286,287,288,788,789,790],"eal":[214,215,216,286,287,288],"lth":[214,215,216,286,287,288],"tea":[214,215,216,286,287,288,716,717,718,1122,1123,1124,1146,1147,1148]," de":[217,218,219,220,221,222,223,224,225,232,233,234,302,303,304,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,734,735,736,845,846,847]," wi":[217,218,219],"ay ":[217,218,219,220,221,222,223,224,225,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,734,735,736,845,846,847],"dea":[217,218,219,220,221,222,223,224,225,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,734,735,736,845,846,847],"eat":[217,218,219,220,221,222,223,224,225,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,734,735,736,845,846,847],"gra":[217,218,219,220,221,222,223,224,225,292,293,294,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,700,701,702,734,735,736,743,744,745,746,747,748,773,774,775,836,837,838,839,840,841,842,843,844,845,846,847,890,891,892,950,951,952,953,954,955,956,957,958,1023,1024,1025,1095,1096,1097],"isp":[217,218,219],"llo":[217,218,219],"low":[217,218,219],"ow ":[217,218,219],"ps ":[217,218,219,229,230,231,1089,1090,1091],"ray":[217,218,219,220,221,222,223,224,225,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,734,735,736,845,846,847],"sps":[217,218,219],"wil":[217,218,219],"wis":[217,218,219],"ape":[220,221,222],"eap":[220,221,222],"rea":[220,221,222,1173,1174,1175]," wa":[226,227,228,791,1173,1174,1175,1176,1177,1178],"add":[226,227,228],"ddl":[226,227,228],"dle":[226,227,228],"fil":[226,227,228,229,230,231,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543],"ilt":[226,227,228,229,230,231,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543],"inf":[226,227,228,229,230,231,329,330,331,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,664,665,666,703,704,705,713,714,715,792,793,794,1116,1117,1118],"ltr":[226,227,228,229,230,231,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,788,789,790],"nfi":[226,227,228,229,230,231,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543],"tra":[226,227,228,229,230,231,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543],"wad":[226,227,228],"  o":[229,230,231,619,620,621,622,623,624,625,626,627,628,629,630,667,668,669,737,738,739,863,864,865,866,867,868]," op":[229,230,231],"cia":[229,230,231],"eci":[229,230,231],"ops":[229,230,231,1089,1090,1091],"pec":[229,230,231,286,287,288],"spe":[229,230,231,286,287,288]," ka":[232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106],"des":[232,233,234],"est":[232,233,234],"kag":[232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258],"st ":[232,233,234,338,339,340,341,342,343,344,345,346,1026,1027,1028],"spa":[235,236,237,417,418,419,420,421,422,423,424,425],"  v":[238,239,240,392,393,394,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,1002,1003,1004]," vi":[238,239,240],"bro":[238,239,240],"ibr":[238,239,240],"vib":[238,239,240]," c ":[256,257,258,613,614,615,616,617,618,854,855,856,875,876,877,1185,1186,1187]," ki":[259,260,261,338,339,340,466,467,468,758,759,760,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049],"hi ":[259,260,261,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106],"ish":[259,260,261],"kis":[259,260,261],"shi":[259,260,261,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489]," ko":[262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121],"bol":[262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282],"cro":[262,263,264,265,266,267,268,269,270,410,411,412,423,424,425,430,431,432,433,450,451,452,453,463,464,465],"icr":[262,263,264,265,266,267,268,269,270,410,411,412,423,424,425,430,431,432,433,450,451,452,453,463,464,465],"kob":[262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282],"ld ":[262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,1080,1081,1082,1083,1084,1085,1086,1087,1088],"mic":[262,263,264,265,266,267,268,269,270,410,411,412,423,424,425,430,431,432,433,450,451,452,453,463,464,465],"obo":[262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282],"ogl":[262,263,264,265,266,267,268,269,270],"old":[262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,1080,1081,1082,1083,1084,1085,1086,1087,1088],"rog":[262,263,264,265,266,267,268,269,270,884,885,886,887,888,889,890,891,892,893,894,895],"pl ":[265,266,267,410,411,412,423,424,425,450,451,452,453,463,464,465,652,653,654,798,799,800,990,991,992,996,997,998],"spl":[265,266,267,652,653,654,798,799,800,996,997,998]," sl":[271,272,273,274,275,276,547,548,549,731,732,733,914,915,916,917,918,919,920,921,922,993,994,995,1062,1063,1064],"sl ":[271,272,273,274,275,276,547,548,549,646,647,648,731,732,733,993,994,995,1062,1063,1064],"iic":[277,278,279]," c3":[280,281,282,938,939,940,972,973,974,1038,1039,1040,1164,1165,1166]," x ":[280,281,282,807,808,809,825,826,827,953,954,955],"c3 ":[280,281,282,764,765,766,972,973,974,1038,1039,1040,1164,1165,1166]," am":[283,284,285,317,318,319,320,321,322]," fo":[283,284,285],"amp":[283,284,285],"bio":[283,284,285],"ea ":[283,284,285],"fox":[283,284,285],"hib":[283,284,285],"ibi":[283,284,285],"iou":[283,284,285],"mph":[283,284,285],"ous":[283,284,285],"ox ":[283,284,285],"phi":[283,284,285,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139],"sea":[283,284,285],"ctr":[286,287,288],"re ":[286,287,288,404,405,406,407,408,409,410,411,412,550,551,552,553,554,555,716,717,718,863,864,865,866,867,868,1083,1084,1085,1122,1123,1124,1146,1147,1148],"tre":[286,287,288]," sy":[289,290,291,292,293,294,295,296,297,298,299,300,301],"lph":[289,290,291,292,293,294,295,296,297,298,299,300,301],"ph ":[289,290,291,292,293,294,295,296,297,298,299,300,301],"syl":[289,290,291,292,293,294,295,296,297,298,299,300,301],"ylp":[289,290,291,292,293,294,295,296,297,298,299,300,301],"  u":[292,293,294,700,701,702,743,744,745,746,747,748,770,771,772,773,774,775,836,837,838,839,840,841,842,843,844,890,891,892,908,909,910,950,951,952,953,954,955,956,957,958,971,1023,1024,1025,1074,1075,1076,1095,1096,1097]," up":[292,293,294,700,701,702,743,744,745,746,747,748,773,774,775,836,837,838,839,840,841,842,843,844,890,891,892,908,909,910,950,951,952,953,954,955,956,957,958,1023,1024,1025,1095,1096,1097],"pgr":[292,293,294,700,701,702,743,744,745,746,747,748,773,774,775,836,837,838,839,840,841,842,843,844,890,891,892,950,951,952,953,954,955,956,957,958,1023,1024,1025,1095,1096,1097],"rad":[292,293,294,700,701,702,743,744,745,746,747,748,773,774,775,836,837,838,839,840,841,842,843,844,890,891,892,950,951,952,953,954,955,956,957,958,1023,1024,1025,1095,1096,1097],"upg":[292,293,294,700,701,702,743,744,745,746,747,748,773,774,775,836,837,838,839,840,841,842,843,844,890,891,892,950,951,952,953,954,955,956,957,958,1023,1024,1025,1095,1096,1097]," xr":[295,296,297],"xr ":[295,296,297]," ti":[298,737,738,739,740,741,742],"bel":[298],"ell":[298,305,306,307],"erb":[298,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970],"ink":[298],"ker":[298,1131,1132,1133],"lle":[298,338,339,340,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1107,1108,1109],"nke":[298],"rbe":[298],"tin":[298,737,738,739,740,741,742],"ced":[299,300,301,398,399,400],"enh":[299,300,301],"nha":[299,300,301],"aeg":[302,303,304],"def":[302,303,304],"efe":[302,303,304],"egi":[302,303,304],"fen":[302,303,304,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019],"gis":[302,303,304],"is ":[302,303,304,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,929,930,931,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121],"nse":[302,303,304],"nt ":[302,303,304,541,542,543],"oin":[302,303,304],"poi":[302,303,304]," af":[305,306,307,308,309,310,311,312,313,314,315,316]," ho":[305,306,307]," me":[305,306,307,308,309,310,311,312,313,314,315,316,329,330,331,332,333,334,335,336,337,386,387,388,389,390,391,392,393,394,395,396,397,713,714,715,716,717,718,719,720,721,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790],"afr":[305,306,307,308,309,310,311,312,313,314,315,316],"diu":[305,306,307,308,309,310,311,312,313,314,315,316,329,330,331,332,333,334,335,336,337,386,387,388,389,390,391,392,393,394,395,396,397,713,714,715,716,717,718,719,720,721,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790],"edi":[305,306,307,308,309,310,311,312,313,314,315,316,329,330,331,332,333,334,335,336,337,386,387,388,389,390,391,392,393,394,395,396,397,713,714,715,716,717,718,719,720,721,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790],"eet":[305,306,307,308,309,310,311,312,313,314,315,316],"es ":[305,306,307,493,494,495],"et ":[305,306,307,308,309,310,311,312,313,314,315,316],"fre":[305,306,307,308,309,310,311,312,313,314,315,316],"hel":[305,306,307],"hor":[305,306,307],"ium":[305,306,307,308,309,310,311,312,313,314,315,316,329,330,331,332,333,334,335,336,337,386,387,388,389,390,391,392,393,394,395,396,397,713,714,715,716,717,718,719,720,721,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790],"med":[305,306,307,308,309,310,311,312,313,314,315,316,329,330,331,332,333,334,335,336,337,386,387,388,389,390,391,392,393,394,395,396,397,713,714,715,716,717,718,719,720,721,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790],"ors":[305,306,307,496,497,498,499,500,501],"ree":[305,306,307,308,309,310,311,312,313,314,315,316],"rse":[305,306,307],"ses":[305,306,307],"um ":[305,306,307,308,309,310,311,312,313,314,315,316,329,330,331,332,333,334,335,336,337,386,387,388,389,390,391,392,393,394,395,396,397,713,714,715,716,717,718,719,720,721,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790],"  j":[311,312,313,923,924,925]," ja":[311,312,313,923,924,925],"jad":[311,312,313,923,924,925],"lco":[311,312,313,923,924,925]," mr":[317,318,319,356,357,358,377,378,379,613,614,615,622,623,624,649,650,651,679,680,681,743,744,745,749,750,751,761,762,763,839,840,841,905,906,907,1014,1015,1016],"ama":[317,318,319,320,321,322,703,704,705,706,707,708,709,710,711,712],"azo":[317,318,319,320,321,322],"maz":[317,318,319,320,321,322],"mrr":[317,318,319,356,357,358,377,378,379,613,614,615,622,623,624,649,650,651,743,744,745,749,750,751,761,762,763,839,840,841,1014,1015,1016],"rr ":[317,318,319,356,357,358,377,378,379,478,479,480,511,512,513,544,545,546,568,569,570,613,614,615,622,623,624,649,650,651,728,729,730,743,744,745,749,750,751,755,756,757,761,762,763,839,840,841,932,933,934,1014,1015,1016,1038,1039,1040,1056,1057,1058],"zon":[317,318,319,320,321,322]," pp":[320,321,322,380,381,382,616,617,618,628,629,630,637,638,639,746,747,748,752,753,754,1149,1150,1151],"pc ":[320,321,322,380,381,382,616,617,618,628,629,630,637,638,639,746,747,748,752,753,754,1149,1150,1151],"ppc":[320,321,322,380,381,382,616,617,618,628,629,630,637,638,639,746,747,748,752,753,754,1149,1150,1151]," an":[323,324,325,326,327,328,329,330,331,664,665,666,703,704,705,713,714,715,792,793,794,1080,1081,1082,1116,1117,1118],"ang":[323,324,325,326,327,328],"eco":[323,324,325,1152,1153,1154],"ger":[323,324,325,326,327,328,1140,1141,1142,1143,1144,1145],"na ":[323,324,325,326,327,328,816,817,818,819,820,821],"nge":[323,324,325,326,327,328],"ona":[323,324,325,326,327,328,816,817,818,819,820,821],"rec":[323,324,325,1152,1153,1154],"ron":[323,324,325,326,327,328,816,817,818,819,820,821,1080,1081,1082,1083,1084,1085,1086,1087,1088]," as":[329,330,331,332,333,334,335,336,337,743,744,745,746,747,748,749,750,751,752,753,754,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"asu":[329,330,331,332,333,334,335,336,337],"fan":[329,330,331,664,665,666,703,704,705,713,714,715,792,793,794,1116,1117,1118],"nfa":[329,330,331,664,665,666,703,704,705,713,714,715,792,793,794,1116,1117,1118],"nti":[329,330,331,664,665,666,703,704,705,713,714,715,792,793,794,1080,1081,1082,1116,1117,1118],"ntr":[329,330,331,664,665,666,703,704,705,713,714,715,792,793,794,1116,1117,1118],"ra ":[329,330,331,332,333,334,335,336,337,643,644,645,646,647,648,649,650,651,652,653,654],"ry ":[329,330,331,664,665,666,703,704,705,713,714,715,792,793,794,1116,1117,1118],"sur":[329,330,331,332,333,334,335,336,337,550,551,552,553,554,555,734,735,736],"ti ":[329,330,331,664,665,666,703,704,705,713,714,715,792,793,794,1080,1081,1082,1116,1117,1118],"try":[329,330,331,664,665,666,703,704,705,713,714,715,792,793,794,1116,1117,1118],"ura":[329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,734,735,736]," bu":[338,339,340,341,342,343,344,345,346],"aq ":[338,339,340,341,342,343,344,345,346],"bur":[338,339,340,341,342,343,344,345,346],"fas":[338,339,340,341,342,343,344,345,346,1026,1027,1028],"kil":[338,339,340,758,759,760,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049],"raq":[338,339,340,341,342,343,344,345,346]," a ":[347,348,349,350,351,352,353,354,355,848,849,850,869,870,871,1179,1180,1181]," be":[347,348,349,619,620,621,836,837,838,884,885,886,887,888,889,890,891,892,893,894,895],"arh":[347,348,349,619,620,621,836,837,838],"bea":[347,348,349,619,620,621,836,837,838,884,885,886,887,888,889,890,891,892,893,894,895],"cal":[347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,788,789,790],"ist":[347,348,349,350,351,352,353,354,355,356,357,358,359,360,361],"lis":[347,348,349,350,351,352,353,354,355,356,357,358,359,360,361],"lli":[347,348,349,350,351,352,353,354,355,356,357,358,359,360,361],"rhu":[347,348,349,619,620,621,836,837,838],"sto":[347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,923,924,925,926,927,928],"to ":[347,348,349,350,351,352,353,354,355,356,357,358,359,360,361]," er":[350,351,352,430,431,432,433,646,647,648,798,799,800,950,951,952,962,963,964,981,982,983]," hm":[353,354,355,438,439,440,441,688,689,690,725,726,727,1122,1123,1124],"hmg":[353,354,355,438,439,440,441,688,689,690,725,726,727,1122,1123,1124]," b ":[356,357,358,359,360,361,851,852,853,872,873,874,1182,1183,1184],"ali":[362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385],"ava":[362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,395,396,397,1140,1141,1142,1143,1144,1145],"cav":[362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385],"ier":[362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,848,849,850,851,852,853,854,855,856,857,858,859,1020,1021,1022,1023,1024,1025,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067],"lie":[362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,1020,1021,1022,1023,1024,1025],"val":[362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,395,396,397],"abi":[386,387,388],"bid":[386,387,388],"rab":[386,387,388],"rac":[389,390,391]," vo":[392,393,394,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790],"lk ":[392,393,394],"olk":[392,393,394],"vol":[392,393,394]," na":[395,396,397,625,626,627,634,635,636,1044,1045,1046,1128,1129,1130],"ar ":[395,396,397,737,738,739,740,741,742,804,805,806,884,885,886,887,888,889,890,891,892,893,894,895,987,988,989,1119,1120,1121],"bar":[395,396,397],"nav":[395,396,397]," ad":[398,399,400,631,632,633,634,635,636,637,638,639,640,641,642],"adv":[398,399,400],"ago":[398,399,400,401,402,403],"dra":[398,399,400,401,402,403,490,491,492,580,581,582,694,695,696],"dva":[398,399,400],"goo":[398,399,400,401,402,403],"oon":[398,399,400,401,402,403],"rag":[398,399,400,401,402,403],"van":[398,399,400]," ap":[404,405,406,426,427,428,429,457,458,459,643,644,645,959,960,961]," el":[404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,791,825,826,827]," fi":[404,405,406,407,408,409,410,411,412,490,491,492,580,581,582,694,695,696,1083,1084,1085],"ap ":[404,405,406,426,427,428,429,457,458,459,643,644,645,959,960,961],"eme":[404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,791,825,826,827],"ent":[404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,541,542,543,791,813,814,815,825,826,827],"fir":[404,405,406,407,408,409,410,411,412,490,491,492,580,581,582,694,695,696,1083,1084,1085],"ire":[404,405,406,407,408,409,410,411,412,490,491,492,580,581,582,694,695,696,1083,1084,1085],"lem":[404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,791,825,826,827,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037],"men":[404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,791,825,826,827],"nta":[404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,791,813,814,815,825,826,827],"tal":[404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,791,825,826,827],"opl":[410,411,412,423,424,425,450,451,452,453,463,464,465],"rop":[410,411,412,423,424,425,450,451,452,453,463,464,465,788,789,790],"adh":[413,414,415,416],"d3 ":[413,426,430,434,438,442,446,450,709,832],"dhu":[413,414,415,416],"ead":[413,414,415,416],"qd3":[413,426,430,434,438,442,446,450,709,832],"erm":[430,431,432,433,981,982,983],"ol ":[430,431,432,433],"rmi":[430,431,432,433],"rol":[430,431,432,433]," sh":[466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160],"fa ":[466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,550,551,552,553,554,555],"hih":[466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489],"ih ":[466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489],"kin":[466,467,468]," pl":[469,470,471,767,768,769,810,811,812,944,945,946,1137,1138,1139],"asm":[469,470,471,767,768,769,810,811,812,944,945,946,1137,1138,1139],"ma ":[469,470,471,529,530,531,734,735,736,767,768,769,810,811,812,944,945,946,1137,1138,1139],"pla":[469,470,471,767,768,769,810,811,812,944,945,946,1137,1138,1139]," lr":[478,479,480,511,512,513,544,545,546,568,569,570,728,729,730,755,756,757,829,830,831,932,933,934,1008,1009,1010,1056,1057,1058,1140,1141,1142,1167,1168,1169],"lrr":[478,479,480,511,512,513,544,545,546,568,569,570,728,729,730,755,756,757,932,933,934,1056,1057,1058]," 2 ":[487,488,489],"ake":[490,491,492,580,581,582,694,695,696],"edr":[490,491,492,580,581,582,694,695,696],"ke ":[490,491,492,520,521,522,523,524,525,526,527,528,580,581,582,694,695,696],"rak":[490,491,492,580,581,582,694,695,696],"nes":[493,494,495],"emo":[496,497,498],"mot":[496,497,498],"ote":[496,497,498],"rem":[496,497,498],"rs ":[496,497,498,499,500,501],"and":[505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,703,704,705,706,707,708,709,710,711,712,1071,1072,1073],"ard":[505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576],"dar":[505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,1107,1108,1109],"nda":[505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576],"rd ":[505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,923,924,925,926,927,928,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970],"tan":[505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,1080,1081,1082],"arj":[520,521,522],"har":[520,521,522],"ike":[520,521,522,523,524,525,526,527,528],"jel":[520,521,522],"rik":[520,521,522,523,524,525,526,527,528],"rje":[520,521,522]," pr":[523,524,525],"oto":[523,524,525],"oty":[523,524,525],"pe ":[523,524,525],"pro":[523,524,525],"rot":[523,524,525,691,692,693,694,695,696,697,698,699,700,701,702],"tot":[523,524,525],"typ":[523,524,525],"ype":[523,524,525]," pu":[529,530,531,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,842,843,844,956,957,958,965,966,967],"pum":[529,530,531],"uma":[529,530,531],"agn":[532,533,534,559,560,561,598,599,600],"eti":[532,533,534,559,560,561,598,599,600],"gne":[532,533,534,559,560,561,598,599,600],"mag":[532,533,534,559,560,561,598,599,600,1041,1042,1043,1047,1048,1049,1059,1060,1061],"net":[532,533,534,559,560,561,598,599,600],"tic":[532,533,534,559,560,561,598,599,600],"ari":[535,536,537],"mar":[535,536,537,860,861,862],"cor":[541,542,543,816,817,818,819,820,821],"ora":[541,542,543],"ral":[541,542,543],"ten":[541,542,543,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949]," is":[544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576],"aka":[544,545,546,547,548,549],"bak":[544,545,546,547,548,549],"ka ":[544,545,546,547,548,549],"ure":[550,551,552,553,554,555,716,717,718,1122,1123,1124,1146,1147,1148]," hi":[556,557,558],"hiv":[556,557,558]," le":[577,578,579,580,581,582,583,584,585,586,587,588,589,590,591],"as ":[577,578,579,580,581,582,583,584,585,586,587,588,589,590,591],"das":[577,578,579,580,581,582,583,584,585,586,587,588,589,590,591],"eon":[577,578,579,580,581,582,583,584,585,586,587,588,589,590,591],"ida":[577,578,579,580,581,582,583,584,585,586,587,588,589,590,591],"leo":[577,578,579,580,581,582,583,584,585,586,587,588,589,590,591],"nid":[577,578,579,580,581,582,583,584,585,586,587,588,589,590,591],"oni":[577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,619,620,621,622,623,624,625,626,627,628,629,630]," lo":[592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,764,765,766,767,768,769,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,978,979,980],"ack":[592,593,594,595,596,597,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812],"cke":[592,593,594,595,596,597],"hac":[592,593,594,595,596,597],"inu":[592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,655,656,657,658,659,660,661,662,663],"ked":[592,593,594,595,596,597],"lon":[592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,764,765,766,767,768,769,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,978,979,980],"nus":[592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,655,656,657,658,659,660,661,662,663],"ong":[592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,764,765,766,767,768,769,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,978,979,980]," on":[619,620,621,622,623,624,625,626,627,628,629,630],"ni ":[619,620,621,622,623,624,625,626,627,628,629,630],"arc":[625,626,627,634,635,636,1044,1045,1046,1128,1129,1130],"nar":[625,626,627,634,635,636,1044,1045,1046,1128,1129,1130],"rc ":[625,626,627,634,635,636,1044,1045,1046,1128,1129,1130],"ada":[631,632,633,634,635,636,637,638,639,640,641,642],"apt":[631,632,633,634,635,636,637,638,639,640,641,642,716,717,718,1122,1123,1124,1146,1147,1148],"dap":[631,632,633,634,635,636,637,638,639,640,641,642],"fie":[631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654],"pti":[631,632,633,634,635,636,637,638,639,640,641,642],"pur":[631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654],"rif":[631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654],"uri":[631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654],"rra":[643,644,645,646,647,648,649,650,651,652,653,654],"ers":[646,647,648,798,799,800],"rsl":[646,647,648],"  q":[655,656,657,658,659,660,661,662,663]," qu":[655,656,657,658,659,660,661,662,663],"iri":[655,656,657,658,659,660,661,662,663,713,714,715,716,717,718,719,720,721],"qui":[655,656,657,658,659,660,661,662,663],"uir":[655,656,657,658,659,660,661,662,663],"aid":[664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690],"den":[664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690],"en ":[664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913],"rai":[664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,792,793,794,795,796,797]," or":[667,668,669,737,738,739],"igi":[667,668,669,737,738,739],"ina":[667,668,669,737,738,739],"nal":[667,668,669,737,738,739],"rig":[667,668,669,737,738,739],"mrm":[679,680,681,905,906,907]," ts":[682,683,684],"ami":[682,683,684],"mi ":[682,683,684],"nam":[682,683,684],"sun":[682,683,684],"tsu":[682,683,684],"una":[682,683,684]," ro":[691,692,693,694,695,696,697,698,699,700,701,702,884,885,886,887,888,889,890,891,892,893,894,895,1029,1030,1031],"clo":[691,692,693,1089,1090,1091],"com":[691,692,693,1071,1072,1073],"eil":[691,692,693,694,695,696,697,698,699,700,701,702],"los":[691,692,693],"mba":[691,692,693],"omb":[691,692,693],"ose":[691,692,693],"ttw":[691,692,693,694,695,696,697,698,699,700,701,702],"twe":[691,692,693,694,695,696,697,698,699,700,701,702],"wei":[691,692,693,694,695,696,697,698,699,700,701,702],"ala":[703,704,705,706,707,708,709,710,711,712,869,870,871,872,873,874,875,876,877,878,879,880],"nde":[703,704,705,706,707,708,709,710,711,712,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970]," ir":[713,714,715,716,717,718,719,720,721,1080,1081,1082,1083,1084,1085,1086,1087,1088],"im ":[713,714,715,716,717,718,719,720,721,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139],"rim":[713,714,715,716,717,718,719,720,721],"am ":[716,717,718,1122,1123,1124,1146,1147,1148],"cap":[716,717,718,1122,1123,1124,1146,1147,1148],"eam":[716,717,718,1122,1123,1124,1146,1147,1148],"ptu":[716,717,718,1122,1123,1124,1146,1147,1148],"tur":[716,717,718,1122,1123,1124,1146,1147,1148]," si":[722,723,724,725,726,727,728,729,730,731,732,733],"ian":[722,723,724,725,726,727,728,729,730,731,732,733,971],"imi":[722,723,724,725,726,727,728,729,730,731,732,733],"mia":[722,723,724,725,726,727,728,729,730,731,732,733],"sim":[722,723,724,725,726,727,728,729,730,731,732,733]," so":[734,735,736],"ahm":[734,735,736],"hma":[734,735,736],"lah":[734,735,736],"ola":[734,735,736],"sol":[734,735,736],"ins":[737,738,739,740,741,742],"tar":[737,738,739,740,741,742,804,805,806,929,930,931,987,988,989,1119,1120,1121]," tr":[743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769],"ity":[743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769],"nit":[743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769],"rio":[743,744,745,746,747,748,749,750,751,752,753,754]," rl":[755,756,757,947,948,949],"ese":[755,756,757,758,759,760,761,762,763],"hes":[755,756,757,758,759,760,761,762,763],"rl ":[755,756,757,947,948,949],"seu":[755,756,757,758,759,760,761,762,763],"hot":[758,759,760,978,979,980,1041,1042,1043,1047,1048,1049,1059,1060,1061],"lls":[758,759,760],"lsh":[758,759,760],"ot ":[758,759,760,978,979,980,1041,1042,1043,1047,1048,1049,1059,1060,1061],"sho":[758,759,760,978,979,980,1041,1042,1043,1047,1048,1049,1059,1060,1061],"  y":[764,765,766,767,768,769]," bc":[764,765,766]," yi":[764,765,766,767,768,769],"bc3":[764,765,766],"yin":[764,765,766,767,768,769]," un":[770,771,772,773,774,775,971],"din":[770,771,772,773,774,775,971],"ndi":[770,771,772,773,774,775,971]," dc":[776,777,778],"ca ":[776,777,778],"dca":[776,777,778],"oid":[776,777,778,779,780,781,782,783,784,785,786,787,788,789,790],"voi":[776,777,778,779,780,781,782,783,784,785,786,787,788,789,790],"aye":[779,780,781],"ela":[779,780,781],"lay":[779,780,781],"yer":[779,780,781]," no":[782,783,784],"nov":[782,783,784],"ova":[782,783,784],"va ":[782,783,784],"op ":[788,789,790,908,909,910],"tro":[788,789,790],"wat":[791]," wr":[792,793,794,795,796,797],"ait":[792,793,794,795,796,797],"ith":[792,793,794,795,796,797],"wra":[792,793,794,795,796,797]," bl":[798,799,800,801,802,803,804,805,806,807,808,809,810,811,812],"bla":[798,799,800,801,802,803,804,805,806,807,808,809,810,811,812],"ck ":[798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,1029,1030,1031],"lac":[798,799,800,801,802,803,804,805,806,807,808,809,810,811,812],"lf ":[798,799,800,801,802,803,804,805,806,807,808,809,810,811,812],"olf":[798,799,800,801,802,803,804,805,806,807,808,809,810,811,812],"rsp":[798,799,800],"wol":[798,799,800,801,802,803,804,805,806,807,808,809,810,811,812],"vy ":[801,802,803,804,805,806,816,817,818,819,820,821,845,846,847,884,885,886,887,888,889,890,891,892,893,894,895,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,972,973,974,975,976,977,1050,1051,1052]," mo":[804,805,806,987,988,989,1119,1120,1121],"rta":[804,805,806,987,988,989,1119,1120,1121]," lb":[807,808,809,953,954,955],"lb ":[807,808,809,953,954,955],"aur":[813,814,815],"cen":[813,814,815],"tau":[813,814,815],"ur ":[813,814,815],"oro":[816,817,818,819,820,821]," cu":[822,823,824],"ain":[822,823,824],"chu":[822,823,824],"cuc":[822,823,824],"hul":[822,823,824],"lai":[822,823,824],"uch":[822,823,824,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106]," dw":[828]," gn":[828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844],"arf":[828],"dwa":[828],"gno":[828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844],"me ":[828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844],"nom":[828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844],"ome":[828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844],"rf ":[828],"war":[828,1173,1174,1175,1176,1177,1178],"lrm":[829,830,831,1008,1009,1010,1140,1141,1142,1167,1168,1169],"lse":[842,843,844,956,957,958,965,966,967],"uls":[842,843,844,956,957,958,965,966,967],"die":[848,849,850,851,852,853,854,855,856,857,858,859,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067]," d ":[857,858,859,878,879,880],"aud":[860,861,862],"rau":[860,861,862],"ude":[860,861,862]," og":[863,864,865,866,867,868],"ogr":[863,864,865,866,867,868]," ph":[869,870,871,872,873,874,875,876,877,878,879,880],"anx":[869,870,871,872,873,874,875,876,877,878,879,880],"hal":[869,870,871,872,873,874,875,876,877,878,879,880],"nx ":[869,870,871,872,873,874,875,876,877,878,879,880],"pha":[869,870,871,872,873,874,875,876,877,878,879,880]," rh":[881,882,883],"ino":[881,882,883],"no ":[881,882,883],"rhi":[881,882,883]," hy":[884,885,886],"bri":[884,885,886],"gue":[884,885,886,887,888,889,890,891,892,893,894,895],"hyb":[884,885,886],"ogu":[884,885,886,887,888,889,890,891,892,893,894,895],"rid":[884,885,886],"ybr":[884,885,886]," hr":[893,894,895,1038,1039,1040],"hr ":[893,894,895],"hen":[896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913],"she":[896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160],"pop":[908,909,910],"up ":[908,909,910],"lot":[914,915,916,917,918,919,920,921,922],"nts":[914,915,916],"slo":[914,915,916,917,918,919,920,921,922],"tsm":[914,915,916],"bir":[923,924,925,926,927,928,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970],"ird":[923,924,925,926,927,928,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970],"mbi":[923,924,925,926,927,928],"orm":[923,924,925,926,927,928],"rmb":[923,924,925,926,927,928],"nis":[929,930,931],"gu ":[932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949],"ngu":[932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949]," sv":[935,936,937,1047,1048,1049],"sp ":[935,936,937,1002,1003,1004,1047,1048,1049],"svs":[935,936,937,1047,1048,1049],"vsp":[935,936,937,1002,1003,1004,1047,1048,1049],"3i ":[938,939,940],"c3i":[938,939,940]," ml":[941,942,943,1011,1012,1013],"ml ":[941,942,943,981,982,983,1011,1012,1013],"rbi":[950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970],"thu":[950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970],"eba":[971],"seb":[971],"sti":[971],"tia":[971]," zo":[972,973,974,975,976,977],"ou ":[972,973,974,975,976,977],"zou":[972,973,974,975,976,977]," fe":[978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019],"enr":[978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019],"gsh":[978,979,980,1041,1042,1043,1047,1048,1049,1059,1060,1061],"ir ":[978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1113,1114,1115],"ngs":[978,979,980],"nri":[978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019],"rir":[978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019],"rml":[981,982,983]," mp":[990,991,992],"mpl":[990,991,992]," vs":[1002,1003,1004],"ai ":[1005,1006,1007,1110,1111,1112,1113,1114,1115],"ass":[1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"lt ":[1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"sau":[1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"ssa":[1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187],"ult":[1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187]," fu":[1020,1021,1022,1023,1024,1025],"fus":[1020,1021,1022,1023,1024,1025],"ili":[1020,1021,1022,1023,1024,1025,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139],"sil":[1020,1021,1022,1023,1024,1025],"usi":[1020,1021,1022,1023,1024,1025],"em ":[1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037],"ole":[1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037],"ock":[1029,1030,1031],"roc":[1029,1030,1031],"hrr":[1038,1039,1040],"ags":[1041,1042,1043,1047,1048,1049,1059,1060,1061],"aub":[1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079],"ber":[1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079],"erk":[1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079],"rk ":[1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1107,1108,1109],"ube":[1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079],"mma":[1071,1072,1073],"ndo":[1071,1072,1073],"omm":[1071,1072,1073]," u1":[1074,1075,1076],"15 ":[1074,1075,1076],"u15":[1074,1075,1076],"ank":[1080,1081,1082],"hol":[1080,1081,1082,1083,1084,1085,1086,1087,1088],"iro":[1080,1081,1082,1083,1084,1085,1086,1087,1088],"nho":[1080,1081,1082,1083,1084,1085,1086,1087,1088],"nk ":[1080,1081,1082],"onh":[1080,1081,1082,1083,1084,1085,1086,1087,1088]," cy":[1089,1090,1091],"ana":[1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106],"azu":[1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106],"cyc":[1089,1090,1091],"kan":[1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106],"lop":[1089,1090,1091],"naz":[1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106],"ycl":[1089,1090,1091],"zuc":[1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106]," al":[1107,1108,1109],"ark":[1107,1108,1109],"ey ":[1107,1108,1109],"kop":[1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121],"ley":[1107,1108,1109],"opi":[1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121],"pis":[1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121],"iir":[1113,1114,1115]," ne":[1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139],"eph":[1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139],"lim":[1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139],"nep":[1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139],"eek":[1131,1132,1133],"eke":[1131,1132,1133],"see":[1131,1132,1133],"rav":[1140,1141,1142,1143,1144,1145],"du ":[1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160],"edu":[1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160],"hed":[1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160],"asr":[1161,1162,1163],"ois":[1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172],"rto":[1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172],"toi":[1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172],"act":[1173,1174,1175],"eac":[1173,1174,1175],"rg ":[1173,1174,1175,1176,1177,1178]," xi":[1179,1180,1181,1182,1183,1184,1185,1186,1187],"hos":[1179,1180,1181,1182,1183,1184,1185,1186,1187],"iph":[1179,1180,1181,1182,1183,1184,1185,1186,1187],"os ":[1179,1180,1181,1182,1183,1184,1185,1186,1187],"pho":[1179,1180,1181,1182,1183,1184,1185,1186,1187],"xip":[1179,1180,1181,1182,1183,1184,1185,1186,1187]}}});
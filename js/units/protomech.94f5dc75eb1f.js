@@ -0,0 +1,2 @@
+// Auto-generated protomech units
+registerUnitShard("protomech", {"columns":{"length":86,"columns":{"UnitType":{"dict":["Protomech"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"Name":{"values":["Erinyes","Erinyes 2","Erinyes 3","Harpy","Harpy 2","Harpy 3","Harpy 4","Cecerops","Cecerops 2","Cecerops 3","Cecerops 4","Cecerops 5","Siren","Siren 2","Siren 3","Siren 4","Siren 5","Orc","Orc 2","Orc 3","Orc 4","Satyr","Satyr 2","Satyr 3","Satyr 4","Satyr XP","Centaur","Centaur 2","Centaur 3","Centaur 4","Centaur Z","Procyon","Procyon 2","Procyon 3","Procyon 4","Procyon 5","Procyon Z","Chrysaor","Chrysaor 2","Hydra","Hydra 2","Hydra 3","Hydra 4","Procyon (Quad)","Basilisk","Basilisk (Quad)","Basilisk (Quad) B","Basilisk 2","Basilisk 3","Roc","Roc 2","Roc 3","Roc 4","Roc 5","Roc Z","Gorgon","Gorgon 2","Gorgon 3","Gorgon 4","Gorgon 5","Gorgon 6","Hippogriff","Triton","Triton 2","Triton 3","Triton 4","Delphyne","Delphyne 2","Delphyne 3","Minotaur","Minotaur 2","Minotaur 3","Minotaur 4","Minotaur P2","Minotaur XP","Minotaur Z","Hobgoblin","Hobgoblin 2","Boggart","Boggart 2","Svartalfa","Svartalfa 2","Svartalfa 3","Sprite","Sprite 2","Sprite 3"]},"FullName":{"values":["Erinyes","Erinyes 2","Erinyes 3","Harpy","Harpy 2","Harpy 3","Harpy 4","Cecerops","Cecerops 2","Cecerops 3","Cecerops 4","Cecerops 5","Siren","Siren 2","Siren 3","Siren 4","Siren 5","Orc","Orc 2","Orc 3","Orc 4","Satyr","Satyr 2","Satyr 3","Satyr 4","Satyr XP","Centaur","Centaur 2","Centaur 3","Centaur 4","Centaur Z","Procyon","Procyon 2","Procyon 3","Procyon 4","Procyon 5","Procyon Z","Chrysaor","Chrysaor 2","Hydra","Hydra 2","Hydra 3","Hydra 4","Procyon (Quad)","Basilisk","Basilisk (Quad)","Basilisk (Quad) B","Basilisk 2","Basilisk 3","Roc","Roc 2","Roc 3","Roc 4","Roc 5","Roc Z","Gorgon","Gorgon 2","Gorgon 3","Gorgon 4","Gorgon 5","Gorgon 6","Hippogriff","Triton","Triton 2","Triton 3","Triton 4","Delphyne","Delphyne 2","Delphyne 3","Minotaur","Minotaur 2","Minotaur 3","Minotaur 4","Minotaur P2","Minotaur XP","Minotaur Z","Hobgoblin","Hobgoblin 2","Boggart","Boggart 2","Svartalfa","Svartalfa 2","Svartalfa 3","Sprite","Sprite 2","Sprite 3"]},"Class":{"values":["Erinyes","Erinyes 2","Erinyes 3","Harpy","Harpy 2","Harpy 3","Harpy 4","Cecerops","Cecerops 2","Cecerops 3","Cecerops 4","Cecerops 5","Siren","Siren 2","Siren 3","Siren 4","Siren 5","Orc","Orc 2","Orc 3","Orc 4","Satyr","Satyr 2","Satyr 3","Satyr 4","Satyr XP","Centaur","Centaur 2","Centaur 3","Centaur 4","Centaur Z","Procyon","Procyon 2","Procyon 3","Procyon 4","Procyon 5","Procyon Z","Chrysaor","Chrysaor 2","Hydra","Hydra 2","Hydra 3","Hydra 4","Procyon (Quad)","Basilisk","Basilisk (Quad)","Basilisk (Quad) B","Basilisk 2","Basilisk 3","Roc","Roc 2","Roc 3","Roc 4","Roc 5","Roc Z","Gorgon","Gorgon 2","Gorgon 3","Gorgon 4","Gorgon 5","Gorgon 6","Hippogriff","Triton","Triton 2","Triton 3","Triton 4","Delphyne","Delphyne 2","Delphyne 3","Minotaur","Minotaur 2","Minotaur 3","Minotaur 4","Minotaur P2","Minotaur XP","Minotaur Z","Hobgoblin","Hobgoblin 2","Boggart","Boggart 2","Svartalfa","Svartalfa 2","Svartalfa 3","Sprite","Sprite 2","Sprite 3"]},"Model":{"dict":["2","3","4","5","XP","Z","(Quad)","B","6","P2"],"values":[null,0,1,null,0,1,2,null,0,1,2,3,null,0,1,2,3,null,0,1,2,null,0,1,2,4,null,0,1,2,5,null,0,1,2,3,5,null,0,null,0,1,2,6,null,null,7,0,1,null,0,1,2,3,5,null,0,1,2,3,8,null,null,0,1,2,null,0,1,null,0,1,2,9,4,5,null,0,null,0,null,0,1,null,0,1]},"Role":{"dict":["Scout","Ambusher","Striker","Missile Boat","Brawler","Skirmisher","Sniper","Juggernaut"],"values":[0,0,0,1,1,0,1,0,0,0,0,1,0,0,2,0,2,2,3,2,2,2,0,2,2,2,3,0,2,2,3,2,3,3,2,2,2,0,0,4,1,3,4,2,4,2,2,4,2,4,4,4,4,2,5,3,4,4,4,6,2,3,4,4,4,0,4,4,4,7,6,3,6,1,7,1,1,1,2,2,4,3,2,3,6,2]},"PV":{"values":[5,3,6,2,2,6,5,6,7,7,6,4,9,7,7,8,7,12,11,12,10,12,10,7,7,8,11,10,12,14,11,11,13,11,11,12,12,9,9,8,6,11,8,12,9,12,11,10,11,12,12,11,12,13,12,10,9,15,12,9,13,11,9,11,9,6,12,13,13,11,7,14,10,11,11,11,11,11,10,17,20,17,20,20,12,17]},"Type":{"dict":["PM"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"ASMove":{"dict":["8Fj","10F","6Fj","8F/6Fj","18F","16F","14F","8F","20F","26F","12F","14Fj","14F/10Fj","12F/18Fj","10Fj","12Fj","12F/10Fj","8F/10Fj","10F/14Fj","6F/14Fj","6F","6F/10Fj","8Fg","10Fg"],"values":[0,1,1,2,2,1,3,4,5,6,5,7,8,8,5,9,5,10,10,10,10,6,11,12,6,13,10,10,10,5,10,1,1,1,1,14,15,10,16,7,3,14,7,10,7,1,8,0,17,14,14,1,14,18,14,7,0,1,3,7,10,19,0,0,0,0,14,14,14,2,20,14,14,20,20,21,7,7,14,18,22,22,23,21,2,21]},"CBTMove":{"dict":["4J","5F","3J","9F","8F","7F","4F","10F","13F","6F","7J","5J","9J","6J","10J","3F"],"values":[0,1,1,2,2,1,0,3,4,5,4,6,7,7,4,8,4,9,9,9,9,5,10,11,5,12,9,9,9,4,9,1,1,1,1,11,13,9,14,6,13,11,6,9,6,1,7,0,0,11,11,1,11,10,11,6,0,1,0,6,9,10,0,0,0,0,11,11,11,2,15,11,11,15,15,14,6,6,11,10,0,0,11,11,2,11]},"Armor":{"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,0,1,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,2,1,2,2,1,1,2,2,2]},"ArmorIcons":{"dict":["A","AA"],"values":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,0,0,0,0,null,0,null,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,1,1,0,1,1,0,0,1,1,1]},"Structure":{"values":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]},"StructureIcons":{"dict":["S"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"TMM":{"values":[2,2,2,2,2,2,2,3,3,3,3,1,4,4,3,4,3,2,2,2,2,3,4,4,3,3,2,2,2,3,2,2,2,2,2,3,3,2,3,1,2,3,1,2,1,2,4,2,2,3,3,2,3,3,3,1,2,2,2,1,2,2,2,2,2,2,3,3,3,2,1,3,3,1,1,2,1,1,3,3,1,1,2,2,2,2]},"RegSkill":{"values":[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5]},"VetSkill":{"values":[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4]},"RegPV":{"values":[5,3,6,2,2,6,5,6,7,7,6,4,9,7,7,8,7,12,11,12,10,12,10,7,7,8,11,10,12,14,11,11,13,11,11,12,12,9,9,8,6,11,8,12,9,12,11,10,11,12,12,11,12,13,12,10,9,15,12,9,13,11,9,11,9,6,12,13,13,11,7,14,10,11,11,11,11,11,10,17,20,17,20,20,12,17]},"VetPV":{"values":[6,3,7,2,2,7,6,7,8,8,7,4,10,8,8,9,8,14,13,14,12,14,12,8,8,9,13,12,14,16,13,13,15,13,13,14,14,10,10,9,7,13,9,14,10,14,13,12,13,14,14,13,14,15,14,12,10,18,14,10,15,13,10,13,10,7,14,15,15,13,8,16,12,13,13,13,13,13,12,20,24,20,24,24,14,20]},"Specials":{"dict":["ENE","MCS","IF0*","ENE,LPRB,RCN","JMPW1","LTAG","JMPS1","IF0*,MCS","IF1","MEL","ENE,JMPS1","ECM","SRM1/1","AECM","IF0*,JMPS2","FLK0*/0*/0*","MCS,JMPS1","UCS","ENE,HT1/1/1","GLD","GLD,IF2,LRM2/2/2","IF1,JMPS1,LRM1/1/1"],"values":[null,0,null,null,0,null,null,0,null,null,0,1,null,null,null,0,null,null,2,null,null,3,0,4,5,6,2,null,0,null,7,0,8,2,null,null,1,0,0,null,null,2,null,null,2,9,9,null,10,0,0,0,11,6,1,8,0,12,null,1,13,14,null,2,0,0,0,null,0,0,15,8,null,1,null,16,17,17,18,10,19,20,19,21,0,6]},"ECM6":{"rows":[52,60],"dict":["ECM"],"values":[0,0]},"PRB":{"rows":[21],"values":["PRB"]},"IF":{"rows":[32,55,71,81,83],"dict":["IF1","IF2"],"values":[0,0,0,1,0]},"SpecialRules":{"dict":["PMECH","PRB, PMECH","IF1, PMECH","ECM, PMECH","IF2, PMECH"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,0,0,2,0,0,0,0,3,0,0,0,0,0,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,4,0,2,0,0]},"ImageURL":{"dict":["https://i.ibb.co/BTSj78J/erinyes-3075.png","https://i.ibb.co/RzC8ML8/harpy-3060.png","https://i.ibb.co/yYy2hb8/ceretops-3075.png","https://i.ibb.co/BrvGdvB/siren-3060.png","https://i.ibb.co/1sQgPkw/orc-3075.png","https://i.ibb.co/Z64ZczD/satyr-3060.png","https://i.ibb.co/SJbcswG/satyr-proto.png","https://i.ibb.co/txhY9GT/centaur-3060.png","https://i.ibb.co/Mcq94X5/procyon-3075.png","https://i.ibb.co/Yt2b5yS/chrysaor-3075.png","https://i.ibb.co/LYMCVwB/hydra-3060.png","https://i.ibb.co/S0wTz53/procyon-quad-proto.png","https://i.ibb.co/tYhSH72/basilisk-3075.png","https://i.ibb.co/6ZzKjqm/basilisk-quad-wor.png","https://i.ibb.co/ZNt7mTt/roc-3060.png","https://i.ibb.co/y6pMVNg/gorgon-3060.png","https://i.ibb.co/w0HXf6j/hippogriff-3150.png","https://i.ibb.co/T1zrkTS/triton-3075.png","https://i.ibb.co/M97CB5H/delphyne-3075.png","https://i.ibb.co/CtKgHDj/minotaur-3060.png","https://i.ibb.co/M9dG9wj/minotaur-proto.png","https://i.ibb.co/44GLkpd/hobgoblin-wor.png","https://i.ibb.co/bJVLF94/boggart-wor.png","https://i.ibb.co/khpCYQC/svartalfa-proto.png","https://i.ibb.co/znP75Kj/sprite-wor.png"],"values":[0,0,0,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,5,5,5,5,6,7,7,7,7,7,8,8,8,8,8,8,9,9,10,10,10,10,11,12,13,13,12,12,14,14,14,14,14,14,15,15,15,15,15,15,16,17,17,17,17,18,18,18,19,19,19,19,20,19,20,21,21,22,22,23,23,23,24,24,24]},"Weapons":{"values":["SRM 1 - 1x2 @ 3/6/9","ER Micro Laser - 1x2 @ 1/2/4","Light Machine Gun - 1x1 @ 2/4/6","Machine Gun - 1x2 @ 1/2/3","ER Micro Laser - 1x2 @ 1/2/4","Light Machine Gun - 1x1 @ 2/4/6","Light Machine Gun - 1x1 @ 2/4/6","ER Micro Laser - 1x2 @ 1/2/4","Streak SRM 1 - 1x2 @ 3/6/9","SRM 2 - 2x2 @ 3/6/9","Micro Pulse Laser - 1x3 @ 1/2/3","AP Gauss Rifle - 1x3 @ 3/6/9","Light Machine Gun - 2x1 @ 2/4/6","Machine Gun - 2x2 @ 1/2/3","SRM 1 - 2x2 @ 3/6/9","ER Micro Laser - 1x2 @ 1/2/4","AP Gauss Rifle - 1x3 @ 3/6/9","SRM 1 - 4x2 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3\nLRM 2 - 1x5 @ 7/14/21","SRM 3 - 3x2 @ 3/6/9\nSRM 1 - 2x2 @ 3/6/9","SRM 3 - 3x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","ER Small Laser - 1x5 @ 2/4/6","Micro Pulse Laser - 1x3 @ 1/2/3","Streak SRM 2 - 2x2 @ 3/6/9","AP Gauss Rifle - 1x3 @ 3/6/9","SRM 2 - 2x2 @ 3/6/9","SRM 2 - 2x2 @ 3/6/9\nLRM 3 - 1x5 @ 7/14/21\nER Micro Laser - 1x2 @ 1/2/4","SRM 2 - 2x2 @ 3/6/9\nHeavy Small Laser - 1x6 @ 1/2/3","ER Medium Laser - 1x7 @ 5/10/15","SRM 1 - 2x2 @ 3/6/9\nAP Gauss Rifle - 1x3 @ 3/6/9","LRM 4 - 1x5 @ 7/14/21\nER Micro Laser - 1x2 @ 1/2/4","ER Small Laser - 2x5 @ 2/4/6","LRM 4 - 1x5 @ 7/14/21","LRM 3 - 1x5 @ 7/14/21\nHeavy Small Laser - 1x6 @ 1/2/3","Streak SRM 3 - 3x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3","SRM 2 - 2x2 @ 3/6/9\nER Small Laser - 1x5 @ 2/4/6","ER Small Laser - 1x5 @ 2/4/6\nSRM 1 - 1x2 @ 3/6/9","ER Micro Laser - 4x2 @ 1/2/4","Micro Pulse Laser - 2x3 @ 1/2/3","Micro Pulse Laser - 1x3 @ 1/2/3\nStreak SRM 3 - 3x2 @ 3/6/9","Streak SRM 5 - 4x2 @ 3/6/9","LRM 6 - 1x5 @ 7/14/21","AP Gauss Rifle - 3x3 @ 3/6/9","AP Gauss Rifle - 2x3 @ 3/6/9\nSRM 2 - 2x2 @ 3/6/9","ER Medium Laser - 1x7 @ 5/10/15\nLRM 3 - 1x5 @ 7/14/21","SRM 4 - 3x2 @ 3/6/9",null,"ER Small Laser - 1x5 @ 2/4/6\nER Micro Laser - 2x2 @ 1/2/4\nSRM 2 - 2x2 @ 3/6/9","ER Medium Laser - 1x7 @ 5/10/15","ER Medium Laser - 1x7 @ 5/10/15","Heavy Medium Laser - 1x10 @ 3/6/9","Medium Pulse Laser - 1x7 @ 4/8/12","AP Gauss Rifle - 1x3 @ 3/6/9","Medium Chemical Laser - 1x5 @ 3/6/9","Medium Chemical Laser - 1x5 @ 3/6/9","ER Micro Laser - 1x2 @ 1/2/4\nLRM 10 - 1x5 @ 7/14/21","Medium Pulse Laser - 1x7 @ 4/8/12","SRM 4 - 6x2 @ 3/6/9","AP Gauss Rifle - 1x3 @ 3/6/9\nSRM 6 - 4x2 @ 3/6/9","Streak LRM 5 - 1x5 @ 7/14/21","AP Gauss Rifle - 1x3 @ 3/6/9","LRM 2 - 1x5 @ 7/14/21","ER Micro Laser - 1x2 @ 1/2/4\nStreak SRM 4 - 3x2 @ 3/6/9","ER Small Laser - 1x5 @ 2/4/6\nER Micro Laser - 2x2 @ 1/2/4\nLRM 3 - 1x5 @ 7/14/21","Heavy Medium Laser - 1x10 @ 3/6/9","ER Micro Laser - 1x2 @ 1/2/4\nHeavy Small Laser - 2x6 @ 1/2/3","Medium Pulse Laser - 1x7 @ 4/8/12","SRM 3 - 6x2 @ 3/6/9\nER Micro Laser - 2x2 @ 1/2/4","ER Medium Laser - 1x7 @ 5/10/15\nMicro Pulse Laser - 1x3 @ 1/2/3","ER Medium Laser - 2x7 @ 5/10/15","LB 2-X AC (Slug) - 1x2 @ 10/20/30\n-- OR -- - x @ \nLB 2-X AC (Pellet) - 2x1 @ 10/20/30","LRM 12 - 2x5 @ 7/14/21","ProtoMech AC/2 - 1x2 @ 7/14/20","Improved Heavy Small Laser - 2x6 @ 1/2/3\nSRM 4 - 3x2 @ 3/6/9","Improved Heavy Small Laser - 2x6 @ 1/2/3\nSRM 5 - 4x2 @ 3/6/9","Improved Heavy Medium Laser - 1x10 @ 3/6/9","AP Gauss Rifle - 1x3 @ 3/6/9\nFusillade Launcher - 1x6 @ 5/10/15","AP Gauss Rifle - 4x3 @ 3/6/9","Plasma Cannon - 1x2D6 Heat @ 6/12/18","Medium Pulse Laser - 1x7 @ 4/8/12","Medium Chemical Laser - 2x5 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3\nStreak SRM 6 - 4x2 @ 3/6/9","LRM 15 - 4x5 @ 7/14/21","Medium Chemical Laser - 5x5 @ 3/6/9","LRM 5 - 3x5 @ 7/14/21","ER Large Laser - 1x10 @ 8/15/25","Fusillade Launcher - 2x6 @ 5/10/15\nMedium Chemical Laser - 2x5 @ 3/6/9"]},"WepName1":{"dict":["SRM 1","ER Micro Laser","Light Machine Gun","Machine Gun","Streak SRM 1","SRM 2","Micro Pulse Laser","AP Gauss Rifle","SRM 3","ER Small Laser","Streak SRM 2","ER Medium Laser","LRM 4","LRM 3","Streak SRM 3","Streak SRM 5","LRM 6","SRM 4","Heavy Medium Laser","Medium Pulse Laser","Medium Chemical Laser","Streak LRM 5","LRM 2","LB 2-X AC (Slug)","LRM 12","ProtoMech AC/2","Improved Heavy Small Laser","Improved Heavy Medium Laser","Plasma Cannon","LRM 15","LRM 5","ER Large Laser","Fusillade Launcher"],"values":[0,1,2,3,1,2,2,1,4,5,6,7,2,3,0,1,7,0,3,8,8,9,6,10,7,5,5,5,11,0,12,9,12,13,14,5,9,1,6,6,15,16,7,7,11,17,null,9,11,11,18,19,7,20,20,1,19,17,7,21,7,22,1,9,18,1,19,8,11,11,23,24,25,26,26,27,7,7,28,19,20,29,20,30,31,32]},"Shots1":{"values":[1,1,1,1,1,1,1,1,1,2,1,1,2,2,2,1,1,4,1,3,3,1,1,2,1,2,2,2,1,2,1,2,1,1,3,2,1,4,2,1,4,1,3,2,1,3,null,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1,1,1,6,1,2,1,2,1,2,2,1,1,4,1,1,2,4,5,3,1,2]},"Dam1":{"dict":["2","1","3","5","7","10","6","2D6 Heat"],"values":[0,0,1,0,0,1,1,0,0,0,2,2,1,0,0,0,2,0,0,0,0,3,2,0,2,0,0,0,4,0,3,3,3,3,0,0,3,0,2,2,0,3,2,2,4,0,null,3,4,4,5,4,2,3,3,0,4,0,2,3,2,3,0,3,5,0,4,0,4,4,0,3,0,6,6,5,2,2,7,4,3,3,3,3,5,6]},"Range1":{"dict":["3/6/9","1/2/4","2/4/6","1/2/3","5/10/15","7/14/21","4/8/12","10/20/30","7/14/20","6/12/18","8/15/25"],"values":[0,1,2,3,1,2,2,1,0,0,3,0,2,3,0,1,0,0,3,0,0,2,3,0,0,0,0,0,4,0,5,2,5,5,0,0,2,1,3,3,0,5,0,0,4,0,null,2,4,4,0,6,0,0,0,1,6,0,0,5,0,5,1,2,0,1,6,0,4,4,7,5,8,3,3,0,0,0,9,6,0,5,0,5,10,4]},"WepName2":{"rows":[18,19,20,26,27,29,30,33,34,35,36,39,43,44,47,55,58,62,63,65,67,68,70,73,74,76,80,85],"values":["LRM 2","SRM 1","Machine Gun","LRM 3","Heavy Small Laser","AP Gauss Rifle","ER Micro Laser","Heavy Small Laser","Machine Gun","ER Small Laser","SRM 1","Streak SRM 3","SRM 2","LRM 3","ER Micro Laser","LRM 10","SRM 6","Streak SRM 4","ER Micro Laser","Heavy Small Laser","ER Micro Laser","Micro Pulse Laser","-- OR --","SRM 4","SRM 5","Fusillade Launcher","Machine Gun","Medium Chemical Laser"]},"Shots2":{"rows":[18,19,20,26,27,29,30,33,34,35,36,39,43,44,47,55,58,62,63,65,67,68,73,74,76,80,85],"values":[1,2,2,1,1,1,1,1,1,1,1,3,2,1,2,1,4,3,2,2,2,1,3,4,1,1,2]},"Dam2":{"rows":[18,19,20,26,27,29,30,33,34,35,36,39,43,44,47,55,58,62,63,65,67,68,73,74,76,80,85],"dict":["5.0","2.0","6.0","3.0"],"values":[0,1,1,0,2,3,1,2,1,0,1,1,1,0,1,0,1,1,1,2,1,3,1,1,2,1,0]},"Range2":{"rows":[18,19,20,26,27,29,30,33,34,35,36,39,43,44,47,55,58,62,63,65,67,68,73,74,76,80,85],"dict":["7/14/21","3/6/9","1/2/3","1/2/4","2/4/6","5/10/15"],"values":[0,1,2,0,2,1,3,2,2,4,1,1,1,0,3,0,1,1,3,2,3,2,1,1,5,2,1]},"WepName3":{"rows":[26,47,63,70,80],"values":["ER Micro Laser","SRM 2","LRM 3","LB 2-X AC (Pellet)","Streak SRM 6"]},"Shots3":{"rows":[26,47,63,70,80],"values":[1,2,1,2,4]},"Dam3":{"rows":[26,47,63,70,80],"values":[2,2,5,1,2]},"Range3":{"rows":[26,47,63,70,80],"values":["1/2/4","3/6/9","7/14/21","10/20/30","3/6/9"]},"CombDam1":{"dict":["1x2","1x1","2x2","1x3","2x1","4x2","3x2","1x5","1x7","2x5","2x3","3x3","1x10","6x2","2x7","2x6","4x3","1x2D6 Heat","4x5","5x5","3x5"],"values":[0,0,1,0,0,1,1,0,0,2,3,3,4,2,2,0,3,5,0,6,6,7,3,2,3,2,2,2,8,2,7,9,7,7,6,2,7,5,10,3,5,7,11,10,8,6,null,7,8,8,12,8,3,7,7,0,8,13,3,7,3,7,0,7,12,0,8,13,8,14,0,9,0,15,15,12,3,16,17,8,9,18,19,20,12,15]},"CombDam2":{"rows":[18,19,20,26,27,29,30,33,34,35,36,39,43,44,47,55,58,62,63,65,67,68,73,74,76,80,85],"dict":["1x5","2x2","1x6","1x3","1x2","3x2","4x2","2x6","2x5"],"values":[0,1,1,0,2,3,4,2,4,0,4,5,1,0,1,0,6,5,1,7,1,3,5,6,2,4,8]},"CombDam3":{"rows":[26,47,63,70,80],"values":["1x2","2x2","1x5","2x1","4x2"]},"PMECH":{"dict":["PMECH"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"Skill0PV":{"values":[10,8,11,7,7,11,10,11,16,16,11,9,18,16,16,17,16,25,20,25,19,25,19,16,16,17,20,19,25,28,20,20,26,20,20,25,25,18,18,17,11,20,17,25,18,25,20,19,20,25,25,20,25,26,25,19,18,29,25,18,26,20,18,20,18,11,25,26,26,20,16,28,19,20,20,20,20,20,19,35,38,35,38,38,25,35]},"Skill1PV":{"values":[9,7,10,6,6,10,9,10,14,14,10,8,16,14,14,15,14,22,18,22,17,22,17,14,14,15,18,17,22,25,18,18,23,18,18,22,22,16,16,15,10,18,15,22,16,22,18,17,18,22,22,18,22,23,22,17,16,26,22,16,23,18,16,18,16,10,22,23,23,18,14,25,17,18,18,18,18,18,17,31,34,31,34,34,22,31]},"Skill2PV":{"values":[8,6,9,5,5,9,8,9,12,12,9,7,14,12,12,13,12,19,16,19,15,19,15,12,12,13,16,15,19,22,16,16,20,16,16,19,19,14,14,13,9,16,13,19,14,19,16,15,16,19,19,16,19,20,19,15,14,23,19,14,20,16,14,16,14,9,19,20,20,16,12,22,15,16,16,16,16,16,15,27,30,27,30,30,19,27]},"Skill3PV":{"values":[7,5,8,4,4,8,7,8,10,10,8,6,12,10,10,11,10,16,14,16,13,16,13,10,10,11,14,13,16,19,14,14,17,14,14,16,16,12,12,11,8,14,11,16,12,16,14,13,14,16,16,14,16,17,16,13,12,20,16,12,17,14,12,14,12,8,16,17,17,14,10,19,13,14,14,14,14,14,13,23,26,23,26,26,16,23]},"Skill4PV":{"values":[6,3,7,2,2,7,6,7,8,8,7,4,10,8,8,9,8,14,13,14,12,14,12,8,8,9,13,12,14,16,13,13,15,13,13,14,14,10,10,9,7,13,9,14,10,14,13,12,13,14,14,13,14,15,14,12,10,18,14,10,15,13,10,13,10,7,14,15,15,13,8,16,12,13,13,13,13,13,12,20,24,20,24,24,14,20]},"Skill5PV":{"values":[5,3,6,2,2,6,5,6,7,7,6,4,9,7,7,8,7,12,11,12,10,12,10,7,7,8,11,10,12,14,11,11,13,11,11,12,12,9,9,8,6,11,8,12,9,12,11,10,11,12,12,11,12,13,12,10,9,15,12,9,13,11,9,11,9,6,12,13,13,11,7,14,10,11,11,11,11,11,10,17,20,17,20,20,12,17]},"Skill6PV":{"values":[4,2,5,1,1,5,4,5,6,6,5,3,8,6,6,7,6,11,10,11,9,11,9,6,6,7,10,9,11,12,10,10,12,10,10,11,11,8,8,7,5,10,7,11,8,11,10,9,10,11,11,10,11,12,11,9,8,13,11,8,12,10,8,10,8,5,11,12,12,10,6,12,9,10,10,10,10,10,9,15,18,15,18,18,11,15]},"Skill7PV":{"values":[3,1,4,1,1,4,3,4,5,5,4,2,7,5,5,6,5,10,9,10,8,10,8,5,5,6,9,8,10,10,9,9,11,9,9,10,10,7,7,6,4,9,6,10,7,10,9,8,9,10,10,9,10,11,10,8,7,11,10,7,11,9,7,9,7,4,10,11,11,9,5,10,8,9,9,9,9,9,8,13,16,13,16,16,10,13]}}},"index":{"byName":[44,45,46,47,48,78,79,7,8,9,10,11,26,27,28,29,30,37,38,66,67,68,0,1,2,55,56,57,58,59,60,3,4,5,6,61,76,77,39,40,41,42,69,70,71,72,73,74,75,17,18,19,20,31,43,32,33,34,35,36,49,50,51,52,53,54,21,22,23,24,25,12,13,14,15,16,83,84,85,80,81,82,62,63,64,65],"RegPV":[3,4,1,11,0,6,2,5,7,10,40,65,8,9,13,14,16,23,24,70,15,25,39,42,12,37,38,44,56,59,62,64,20,22,27,47,55,72,78,18,26,30,31,33,34,41,46,48,51,61,63,69,73,74,75,76,77,17,19,21,28,35,36,43,45,49,50,52,54,58,66,84,32,53,60,67,68,29,71,57,79,81,85,80,82,83],"VetPV":[3,4,1,11,0,6,2,5,7,10,40,65,8,9,13,14,16,23,24,70,15,25,39,42,12,37,38,44,56,59,62,64,20,22,27,47,55,72,78,18,26,30,31,33,34,41,46,48,51,61,63,69,73,74,75,76,77,17,19,21,28,35,36,43,45,49,50,52,54,58,66,84,32,53,60,67,68,29,71,57,79,81,85,80,82,83],"Skill0PV":[3,4,1,11,0,6,2,5,7,10,40,65,8,9,13,14,16,23,24,70,15,25,39,42,12,37,38,44,56,59,62,64,20,22,27,47,55,72,78,18,26,30,31,33,34,41,46,48,51,61,63,69,73,74,75,76,77,17,19,21,28,35,36,43,45,49,50,52,54,58,66,84,32,53,60,67,68,29,71,57,79,81,85,80,82,83],"Skill1PV":[3,4,1,11,0,6,2,5,7,10,40,65,8,9,13,14,16,23,24,70,15,25,39,42,12,37,38,44,56,59,62,64,20,22,27,47,55,72,78,18,26,30,31,33,34,41,46,48,51,61,63,69,73,74,75,76,77,17,19,21,28,35,36,43,45,49,50,52,54,58,66,84,32,53,60,67,68,29,71,57,79,81,85,80,82,83],"Skill2PV":[3,4,1,11,0,6,2,5,7,10,40,65,8,9,13,14,16,23,24,70,15,25,39,42,12,37,38,44,56,59,62,64,20,22,27,47,55,72,78,18,26,30,31,33,34,41,46,48,51,61,63,69,73,74,75,76,77,17,19,21,28,35,36,43,45,49,50,52,54,58,66,84,32,53,60,67,68,29,71,57,79,81,85,80,82,83],"Skill3PV":[3,4,1,11,0,6,2,5,7,10,40,65,8,9,13,14,16,23,24,70,15,25,39,42,12,37,38,44,56,59,62,64,20,22,27,47,55,72,78,18,26,30,31,33,34,41,46,48,51,61,63,69,73,74,75,76,77,17,19,21,28,35,36,43,45,49,50,52,54,58,66,84,32,53,60,67,68,29,71,57,79,81,85,80,82,83],"Skill4PV":[3,4,1,11,0,6,2,5,7,10,40,65,8,9,13,14,16,23,24,70,15,25,39,42,12,37,38,44,56,59,62,64,20,22,27,47,55,72,78,18,26,30,31,33,34,41,46,48,51,61,63,69,73,74,75,76,77,17,19,21,28,35,36,43,45,49,50,52,54,58,66,84,32,53,60,67,68,29,71,57,79,81,85,80,82,83],"Skill5PV":[3,4,1,11,0,6,2,5,7,10,40,65,8,9,13,14,16,23,24,70,15,25,39,42,12,37,38,44,56,59,62,64,20,22,27,47,55,72,78,18,26,30,31,33,34,41,46,48,51,61,63,69,73,74,75,76,77,17,19,21,28,35,36,43,45,49,50,52,54,58,66,84,32,53,60,67,68,29,71,57,79,81,85,80,82,83],"Skill6PV":[3,4,1,11,0,6,2,5,7,10,40,65,8,9,13,14,16,23,24,70,15,25,39,42,12,37,38,44,56,59,62,64,20,22,27,47,55,72,78,18,26,30,31,33,34,41,46,48,51,61,63,69,73,74,75,76,77,17,19,21,28,35,36,43,45,49,50,52,54,58,66,84,29,32,53,60,67,68,71,57,79,81,85,80,82,83],"Skill7PV":[1,3,4,11,0,6,2,5,7,10,40,65,8,9,13,14,16,23,24,70,15,25,39,42,12,37,38,44,56,59,62,64,20,22,27,47,55,72,78,18,26,30,31,33,34,41,46,48,51,61,63,69,73,74,75,76,77,17,19,21,28,29,35,36,43,45,49,50,52,54,58,66,71,84,32,53,57,60,67,68,79,81,85,80,82,83]},"search":{"texts":["erinyes","erinyes 2 2","erinyes 3 3","harpy","harpy 2 2","harpy 3 3","harpy 4 4","cecerops","cecerops 2 2","cecerops 3 3","cecerops 4 4","cecerops 5 5","siren","siren 2 2","siren 3 3","siren 4 4","siren 5 5","orc","orc 2 2","orc 3 3","orc 4 4","satyr","satyr 2 2","satyr 3 3","satyr 4 4","satyr xp xp","centaur","centaur 2 2","centaur 3 3","centaur 4 4","centaur z z","procyon","procyon 2 2","procyon 3 3","procyon 4 4","procyon 5 5","procyon z z","chrysaor","chrysaor 2 2","hydra","hydra 2 2","hydra 3 3","hydra 4 4","procyon quad quad","basilisk","basilisk quad","basilisk quad b b","basilisk 2 2","basilisk 3 3","roc","roc 2 2","roc 3 3","roc 4 4","roc 5 5","roc z z","gorgon","gorgon 2 2","gorgon 3 3","gorgon 4 4","gorgon 5 5","gorgon 6 6","hippogriff","triton","triton 2 2","triton 3 3","triton 4 4","delphyne","delphyne 2 2","delphyne 3 3","minotaur","minotaur 2 2","minotaur 3 3","minotaur 4 4","minotaur p2 p2","minotaur xp xp","minotaur z z","hobgoblin","hobgoblin 2 2","boggart","boggart 2 2","svartalfa","svartalfa 2 2","svartalfa 3 3","sprite","sprite 2 2","sprite 3 3"],"sizes":[8.0,10.0,10.0,6.0,8.0,8.0,8.0,9.0,11.0,11.0,11.0,11.0,6.0,8.0,8.0,8.0,8.0,4.0,6.0,6.0,6.0,6.0,8.0,8.0,8.0,9.0,8.0,10.0,10.0,10.0,10.0,8.0,10.0,10.0,10.0,10.0,10.0,9.0,11.0,6.0,8.0,8.0,8.0,13.0,9.0,14.0,15.0,11.0,11.0,4.0,6.0,6.0,6.0,6.0,6.0,7.0,9.0,9.0,9.0,9.0,9.0,11.0,7.0,9.0,9.0,9.0,9.0,11.0,11.0,9.0,11.0,11.0,11.0,12.0,12.0,11.0,10.0,12.0,8.0,10.0,10.0,12.0,12.0,7.0,9.0,9.0],"postings":{"  e":[0,1,2]," er":[0,1,2],"eri":[0,1,2],"es ":[0,1,2],"iny":[0,1,2],"nye":[0,1,2],"rin":[0,1,2],"yes":[0,1,2],"  2":[1,4,8,13,18,22,27,32,38,40,47,50,56,63,67,70,77,79,81,84]," 2 ":[1,4,8,13,18,22,27,32,38,40,47,50,56,63,67,70,77,79,81,84],"  3":[2,5,9,14,19,23,28,33,41,48,51,57,64,68,71,82,85]," 3 ":[2,5,9,14,19,23,28,33,41,48,51,57,64,68,71,82,85],"  h":[3,4,5,6,39,40,41,42,61,76,77]," ha":[3,4,5,6],"arp":[3,4,5,6],"har":[3,4,5,6],"py ":[3,4,5,6],"rpy":[3,4,5,6],"  4":[6,10,15,20,24,29,34,42,52,58,65,72]," 4 ":[6,10,15,20,24,29,34,42,52,58,65,72],"  c":[7,8,9,10,11,26,27,28,29,30,37,38]," ce":[7,8,9,10,11,26,27,28,29,30],"cec":[7,8,9,10,11],"cer":[7,8,9,10,11],"ece":[7,8,9,10,11],"ero":[7,8,9,10,11],"ops":[7,8,9,10,11],"ps ":[7,8,9,10,11],"rop":[7,8,9,10,11],"  5":[11,16,35,53,59]," 5 ":[11,16,35,53,59],"  s":[12,13,14,15,16,21,22,23,24,25,80,81,82,83,84,85]," si":[12,13,14,15,16],"en ":[12,13,14,15,16],"ire":[12,13,14,15,16],"ren":[12,13,14,15,16],"sir":[12,13,14,15,16],"  o":[17,18,19,20]," or":[17,18,19,20],"orc":[17,18,19,20],"rc ":[17,18,19,20]," sa":[21,22,23,24,25],"aty":[21,22,23,24,25],"sat":[21,22,23,24,25],"tyr":[21,22,23,24,25],"yr ":[21,22,23,24,25],"  x":[25,74]," xp":[25,74],"xp ":[25,74],"aur":[26,27,28,29,30,69,70,71,72,73,74,75],"cen":[26,27,28,29,30],"ent":[26,27,28,29,30],"nta":[26,27,28,29,30],"tau":[26,27,28,29,30,69,70,71,72,73,74,75],"ur ":[26,27,28,29,30,69,70,71,72,73,74,75],"  z":[30,36,54,75]," z ":[30,36,54,75],"  p":[31,32,33,34,35,36,43,73]," pr":[31,32,33,34,35,36,43],"cyo":[31,32,33,34,35,36,43],"ocy":[31,32,33,34,35,36,43],"on ":[31,32,33,34,35,36,43,55,56,57,58,59,60,62,63,64,65],"pro":[31,32,33,34,35,36,43],"roc":[31,32,33,34,35,36,43,49,50,51,52,53,54],"yon":[31,32,33,34,35,36,43]," ch":[37,38],"aor":[37,38],"chr":[37,38],"hry":[37,38],"or ":[37,38],"rys":[37,38],"sao":[37,38],"ysa":[37,38]," hy":[39,40,41,42],"dra":[39,40,41,42],"hyd":[39,40,41,42],"ra ":[39,40,41,42],"ydr":[39,40,41,42],"  q":[43,45,46]," qu":[43,45,46],"ad ":[43,45,46],"qua":[43,45,46],"uad":[43,45,46],"  b":[44,45,46,47,48,78,79]," ba":[44,45,46,47,48],"asi":[44,45,46,47,48],"bas":[44,45,46,47,48],"ili":[44,45,46,47,48],"isk":[44,45,46,47,48],"lis":[44,45,46,47,48],"sil":[44,45,46,47,48],"sk ":[44,45,46,47,48]," b ":[46],"  r":[49,50,51,52,53,54]," ro":[49,50,51,52,53,54],"oc ":[49,50,51,52,53,54],"  g":[55,56,57,58,59,60]," go":[55,56,57,58,59,60],"gon":[55,56,57,58,59,60],"gor":[55,56,57,58,59,60],"org":[55,56,57,58,59,60],"rgo":[55,56,57,58,59,60],"  6":[60]," 6 ":[60]," hi":[61],"ff ":[61],"gri":[61],"hip":[61],"iff":[61],"ipp":[61],"ogr":[61],"pog":[61],"ppo":[61],"rif":[61],"  t":[62,63,64,65]," tr":[62,63,64,65],"ito":[62,63,64,65],"rit":[62,63,64,65,83,84,85],"ton":[62,63,64,65],"tri":[62,63,64,65],"  d":[66,67,68]," de":[66,67,68],"del":[66,67,68],"elp":[66,67,68],"hyn":[66,67,68],"lph":[66,67,68],"ne ":[66,67,68],"phy":[66,67,68],"yne":[66,67,68],"  m":[69,70,71,72,73,74,75]," mi":[69,70,71,72,73,74,75],"ino":[69,70,71,72,73,74,75],"min":[69,70,71,72,73,74,75],"not":[69,70,71,72,73,74,75],"ota":[69,70,71,72,73,74,75]," p2":[73],"p2 ":[73]," ho":[76,77],"bgo":[76,77],"bli":[76,77],"gob":[76,77],"hob":[76,77],"in ":[76,77],"lin":[76,77],"obg":[76,77],"obl":[76,77]," bo":[78,79],"art":[78,79,80,81,82],"bog":[78,79],"gar":[78,79],"gga":[78,79],"ogg":[78,79],"rt ":[78,79]," sv":[80,81,82],"alf":[80,81,82],"fa ":[80,81,82],"lfa":[80,81,82],"rta":[80,81,82],"sva":[80,81,82],"tal":[80,81,82],"var":[80,81,82]," sp":[83,84,85],"ite":[83,84,85],"pri":[83,84,85],"spr":[83,84,85],"te ":[83,84,85]}}});
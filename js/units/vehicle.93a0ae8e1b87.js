@@ -0,0 +1,2 @@
+// Auto-generated vehicle units
+registerUnitShard("vehicle", {"columns":{"length":1142,"columns":{"UnitType":{"dict":["Vehicle"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"Name":{"values":["AC/2 Carrier","AC/2 Carrier (LB-X)","Aeron Strike VTOL","Aeron Strike VTOL (BAP)","Aesir Medium AA Vehicle","Aesir Medium AA Vehicle (HAG)","Aithon Assault Transport","Ajax Assault Tank (Sealed)","Ajax Assault Tank A","Ajax Assault Tank B","Ajax Assault Tank C","Ajax Assault Tank D","Ajax Assault Tank Prime","Alacorn Heavy Tank Mk. I","Alacorn Heavy Tank Mk. II","Alacorn Heavy Tank Mk. III","Alacorn Heavy Tank Mk. IV","Alacorn Heavy Tank Mk. VI","Alacorn Heavy Tank Mk. VII","Anat APC","Anhur (P-Stealth)","Anhur Transport","Anhur Transport (BA)","Ares Medium Tank","Ares Medium Tank (Plasma)","Armored Personnel Carrier (Hover LRM)","Armored Personnel Carrier (Hover MG)","Armored Personnel Carrier (Hover Sensors)","Armored Personnel Carrier (Hover SRM)","Armored Personnel Carrier (Hover)","Armored Personnel Carrier (Tracked LRM)","Armored Personnel Carrier (Tracked MG)","Armored Personnel Carrier (Tracked SRM)","Armored Personnel Carrier (Tracked)","Armored Personnel Carrier (Wheeled LRM)","Armored Personnel Carrier (Wheeled MG)","Armored Personnel Carrier (Wheeled SRM)","Armored Personnel Carrier (Wheeled)","Arrow IV Assault Vehicle","Arrow IV Carrier","Asshur Artillery Spotter","Asshur Fast Reconnaissance Vehicle","Asshur Fast Reconnaissance Vehicle (Proto AC)","Athena Combat Vehicle","Athena Combat Vehicle (HAG)","Athena Combat Vehicle XR","Axel Heavy Tank IIC","Axel Heavy Tank IIC (XL)","Axel Heavy Tank Mk. 1","Axel Heavy Tank Mk. 2","Badger (C) Tracked Transport A","Badger (C) Tracked Transport B","Badger (C) Tracked Transport C","Badger (C) Tracked Transport D","Badger (C) Tracked Transport E","Badger (C) Tracked Transport F","Badger (C) Tracked Transport H","Badger (C) Tracked Transport Prime","Badger Tracked Transport A","Badger Tracked Transport B","Badger Tracked Transport C","Badger Tracked Transport D","Badger Tracked Transport E","Badger Tracked Transport F","Badger Tracked Transport G","Badger Tracked Transport Prime","Balac Strike VTOL","Balac Strike VTOL (Hybrid)","Balac Strike VTOL (LRM)","Balac Strike VTOL (Spotter)","Ballista Artillery Trailer","Ballista Self-Propelled Artillery Tank","Bandit (C) Hovercraft A","Bandit (C) Hovercraft B","Bandit (C) Hovercraft C","Bandit (C) Hovercraft D","Bandit (C) Hovercraft E","Bandit (C) Hovercraft F","Bandit (C) Hovercraft G","Bandit (C) Hovercraft H","Bandit (C) Hovercraft Prime","Bandit Hovercraft \"Warthog\"","Bandit Hovercraft A","Bandit Hovercraft B","Bandit Hovercraft C","Bandit Hovercraft D","Bandit Hovercraft E","Bandit Hovercraft F","Bandit Hovercraft G","Bandit Hovercraft H","Bandit Hovercraft I","Bandit Hovercraft Mk. II","Bandit Hovercraft Prime","Bardiche Heavy Strike Tank","Bardiche Heavy Strike Tank (Minesweeper)","Bardiche Heavy Strike Tank C","BattleMech Recovery Vehicle","Beagle Hover Scout","Beagle Hover Scout (C3i)","Beagle Hover Scout (LRRP)","Beagle Hover Scout (Sealed)","Beagle Hover Scout (TAG)","Behemoth Heavy Tank","Behemoth Heavy Tank (Armor)","Behemoth Heavy Tank (Davion)","Behemoth Heavy Tank (Flamer)","Behemoth Heavy Tank (Kurita Upgrade)","Behemoth Heavy Tank (Kurita)","Behemoth Heavy Tank (Liao)","Behemoth Heavy Tank (Refit)","Behemoth II Heavy Tank","Behemoth II Heavy Tank (Support)","Bellona Hover Tank","Bellona Hover Tank (Laser)","Bellona Hover Tank (XL)","Blizzard Hover Transport","Blizzard Hover Transport \"Black Blizzard\"","Blizzard Hover Transport (SRM)","Bokkusu Support Trailer","Bolla Stealth Tank (RotS) A","Bolla Stealth Tank (RotS) B","Bolla Stealth Tank (RotS) C","Bolla Stealth Tank (RotS) D","Bolla Stealth Tank (RotS) Prime","Bolla Stealth Tank Comminus","Bolla Stealth Tank Dominus","Bolla Stealth Tank Infernus","Bolla Stealth Tank Invictus","Browning Mobile Headquarters","Browning Mobile Headquarters (Half-Track)","Brutus Assault Tank","Brutus Assault Tank (HPPC)","Brutus Assault Tank (LRM)","Brutus Assault Tank (PPC 2)","Brutus Assault Tank (PPC)","Bulldog Medium Tank","Bulldog Medium Tank (AC2)","Bulldog Medium Tank (Cell)","Bulldog Medium Tank (Chemical)","Bulldog Medium Tank (ERLL)","Bulldog Medium Tank (LB-X)","Bulldog Medium Tank (LRM)","Bulldog Medium Tank (Plasma)","Bulwark Assault Vehicle","Bulwark Assault Vehicle (Original)","Burke Defense Tank","Burke Defense Tank (HPPC)","Burke Defense Tank (Royal)","Burke II Superheavy Tank","Buzzard Hover Tank","Cardinal Transport","Cardinal Transport (RAF)","Carnivore Assault Tank","Carnivore Assault Tank (HAG)","Carnivore Assault Tank (Second Line)","Cavalry Attack Helicopter","Cavalry Attack Helicopter (BA)","Cavalry Attack Helicopter (Infantry)","Cavalry Attack Helicopter (Infiltrator)","Cavalry Attack Helicopter (LRM)","Cavalry Attack Helicopter (SRM)","Cavalry Attack Helicopter (TAG)","Cavalry Attack Helicopter Cadence Rain","Centipede Scout Car","Centipede Scout Car (SRM)","Centipede Scout Car (TAG)","Centipede Scout Car Commando","Chalchiuhtotolin Support Tank","Chalchiuhtotolin Support Tank (Bombast Laser)","Chalchiuhtotolin Support Tank (Chemical Laser)","Chalchiuhtotolin Support Tank (XL)","Challenger MBT Mk. XV","Challenger MBT X","Challenger MBT XI","Challenger MBT XII","Challenger MBT XIVs","Challenger MBT XVc","Chaparral Missile Artillery Tank","Chaparral Missile Artillery Tank (CASE)","Chaparral Missile Artillery Tank (ERML)","Chaparral Missile Artillery Tank (MG)","Chaparral Missile Artillery Tank (SRM)","Chevalier Light Tank","Chevalier Light Tank (BAP)","Chevalier Light Tank (MML)","Chevalier Light Tank (Speed)","Cizin Hover Tank","Cizin Hover Tank (Support)","Cobra Transport VTOL","Cobra Transport VTOL (Command)","Cobra Transport VTOL (MASH)","Cobra Transport VTOL (Original)","Command Van","Command Van (ICE)","Command Van (Q-Vehicle)","Condor Heavy Hover Tank","Condor Heavy Hover Tank (Davion)","Condor Heavy Hover Tank (Fission)","Condor Heavy Hover Tank (Flamer)","Condor Heavy Hover Tank (Fusion)","Condor Heavy Hover Tank (LAC)","Condor Heavy Hover Tank (Laser Upgrade)","Condor Heavy Hover Tank (Laser)","Condor Heavy Hover Tank (Liao)","Condor Heavy Hover Tank (Ultra)","Condor Heavy Hover Tank (Upgrade)","Condor Heavy Hover Tank (Upgrade) (Laser)","Condor Heavy Hover Tank C","Condor Multi-Purpose Tank","Condor Multi-Purpose Tank (Reactive)","Coolant Truck (Hover)","Coolant Truck (Tracked)","Coolant Truck 135-K \"Lifesaver\"","Crane Heavy Transport","Crow Scout Helicopter","Crow Scout Helicopter \"Dragonfly\"","Crow Scout Helicopter (C3)","Crow Scout Helicopter (Export)","Cyrano Gunship","Cyrano Gunship (ML)","Cyrano Gunship (Plasma)","Cyrano Gunship (Royal)","Cyrano Gunship Fury","Daimyo HQ 67-K","Daimyo HQ 67-K2","Daimyo HQ 67-NC","Daimyo HQ 67-R","Danai Support Vehicle","Danai Support Vehicle (Arrow)","Darter Scout Car","Darter Scout Car (BAP)","Darter Scout Car (C3)","Darter Scout Car (ECM)","Darter Scout Car (SRM)","Darter Scout Car (SRM2)","Demolisher Heavy Tank (Arrow IV)","Demolisher Heavy Tank (Cell)","Demolisher Heavy Tank (Clan)","Demolisher Heavy Tank (Defensive)","Demolisher Heavy Tank (Gauss)","Demolisher Heavy Tank (MRM)","Demolisher Heavy Tank (Reinforced)","Demolisher Heavy Tank Mk. II","Demolisher II Heavy Tank","Demolisher II Heavy Tank (MML)","Demolisher II Heavy Tank (Thunderbolt)","Demolisher II Heavy Tank II-X","Demon Medium Tank","Demon Medium Tank (Armor)","Demon Medium Tank (Rifle)","Demon Tank","Demon Tank (HGR)","Demon Tank (Horned Demon)","Demon Tank (PPC)","Demon Tank (Royal)","Demon Tank CX-2","Desert Scorpion Light Tank","Destrier Siege Vehicle","Devastator Heavy Tank","Devastator II Superheavy Tank","DI Morgan Assault Tank","DI Morgan Assault Tank (Gauss)","DI Morgan Assault Tank (LRM)","DI Multipurpose Light VTOL","DI Multipurpose Light VTOL (Gunship)","DI Schmitt Tank","DI Schmitt Tank (Targeting Computer)","Diggs Drone Control Tank","Donar Assault Helicopter","Donar Assault Helicopter (Close Support)","Donar Assault Helicopter (Recon)","Drillson Heavy Hover Tank","Drillson Heavy Hover Tank (ERLL)","Drillson Heavy Hover Tank (MML)","Drillson Heavy Hover Tank (Sealed)","Drillson Heavy Hover Tank (SRM)","Drillson Heavy Hover Tank (Streak)","Drillson Heavy Hover Tank C","Drillson Heavy Hover Tank C 2","Eldingar Hover Sled","Eldingar Hover Sled (HMMHV) \"HumHov\"","Eldingar Hover Sled (Streak)","Engineering Vehicle","Engineering Vehicle (AC)","Engineering Vehicle (Flamer)","Enyo Strike Tank","Enyo Strike Tank (ER Pulse)","Enyo Strike Tank (LB-X) \"Sholef\"","Enyo Strike Tank XR","Epona Pursuit Tank A","Epona Pursuit Tank B","Epona Pursuit Tank C","Epona Pursuit Tank D","Epona Pursuit Tank E","Epona Pursuit Tank Prime","Eurus MBT A","Eurus MBT B","Eurus MBT C","Eurus MBT D","Eurus MBT Prime","Falcon Hover Tank","Fensalir Combat WiGE","Ferret Light Scout VTOL","Ferret Light Scout VTOL \"Fermi\"","Ferret Light Scout VTOL (Armor) \"Wild Weasel\"","Ferret Light Scout VTOL (Cargo)","Flatbed Truck","Flatbed Truck (Armor)","Flatbed Truck (LRM)","Flatbed Truck (Mortar)","Flatbed Truck (RL)","Flatbed Truck (SRM)","Fortune Wheeled Assault Vehicle","Fortune Wheeled Assault Vehicle (C3M)","Fortune Wheeled Assault Vehicle (Thunderbolt)","Fox Armored Car","Fox Armored Car (Flamer)","Fox Armored Car (Interdictor)","Fox Armored Car (VSP)","Fulcrum Heavy Hover Tank (Hybrid)","Fulcrum Heavy Hovertank","Fulcrum Heavy Hovertank II","Fulcrum Heavy Hovertank III","Fulcrum Heavy Hovertank X","Fury Command Tank","Fury Command Tank (C3M)","Fury Command Tank (C3S)","Fury Command Tank (Fury II)","Fury Command Tank (Fury III)","Fury Command Tank (Fury IIIm)","Fury Command Tank (Original)","Fury Command Tank (Royal)","Fury Command Tank CX-17","Gabriel Reconnaissance Hovercraft","Gabriel Reconnaissance Hovercraft (ERSL)","Gabriel Reconnaissance Hovercraft (TDF)","Gallant Urban Assault Tank","Galleon Light Tank C","Galleon Light Tank GAL-100","Galleon Light Tank GAL-102","Galleon Light Tank GAL-103","Galleon Light Tank GAL-104","Galleon Light Tank GAL-105","Galleon Light Tank GAL-106","Galleon Light Tank GAL-106M","Galleon Light Tank GAL-200","Galleon Light Tank GAL-200 (RL)","Galleon Light Tank GAL-200R","Galleon Light Tank GAL-201","Galleon Light Tank GAL-300","Galleon Light Tank Maxwell","Garrot Superheavy Transport","Garuda Heavy VTOL","Giggins APC","Giggins APC (Fire Support)","Gladius Medium Hover Tank Mk. II","Gladius Medium Hovertank","Glaive Medium Tank","Glaive Medium Tank (MFB)","Glory Heavy Fire Support Vehicle","Glory Heavy Fire Support Vehicle (3090 Upgrade)","Glory Heavy Fire Support Vehicle (Arrow IV)","Glory Heavy Fire Support Vehicle (Light Gauss)","Goblin II Infantry Support Vehicle","Goblin III Infantry Support Vehicle","Goblin Infantry Support Vehicle","Goblin Infantry Support Vehicle (Sealed)","Goblin Medium Tank","Goblin Medium Tank (LRM)","Goblin Medium Tank (MG)","Goblin Medium Tank (SRM)","Goblin Medium Tank X","Gossamer VTOL","Gossamer VTOL (XL)","Gulltoppr OmniMonitor A","Gulltoppr OmniMonitor B","Gulltoppr OmniMonitor Prime","Gun Trailer (Ambush)","Gun Trailer (Artillery/AAA)","Gun Trailer (LRM)","Gun Trailer (Mjolnir)","Gun Trailer (SC)","Gun Trailer (Siege)","Gun Trailer (Stronghold)","Gun Trailer (Thumper)","Gun Trailer (Thunderbolt)","Gun Trailer (Ultra)","G\u00fcrteltier MBT","G\u00fcrteltier MBT (C3M)","Gurzil Support Tank","Hachiman Fire Support Tank","Hachiman Fire Support Tank (AAA)","Hadur Fast Support Vehicle","Hadur Fast Support Vehicle (LRM)","Hadur Fast Support Vehicle (Reactive)","Hanse MBT","Harasser Laser Platform","Harasser Missile Platform","Harasser Missile Platform \"Leaping Lisa\"","Harasser Missile Platform \"Mini-Peggy\"","Harasser Missile Platform (Flamer)","Harasser Missile Platform (Fuel Cell)","Harasser Missile Platform (Heavy Ferro)","Harasser Missile Platform (iNarc)","Harasser Missile Platform (LFE)","Harasser Missile Platform (LRM)","Harasser Missile Platform (Marian)","Harasser Missile Platform (MML)","Harasser Missile Platform (Speed)","Harasser Missile Platform (Thunderbolt)","Harrier Heavy Hover Tank","Harrier Heavy Hover Tank (PPC)","Harrier Heavy Hover Tank (Re-Laser)","Hasek Mechanized Combat Vehicle","Hawk Hover Tank (LTV-4)","Hawk Moth Gunship","Hawk Moth Gunship \"Verwandlung\"","Hawk Moth Gunship (Armor)","Hawk Moth Gunship (Thunderbolt)","Hawk Moth II Gunship","Hawk Moth II Gunship (MML)","Hawk Moth II Gunship (Sniper)","Heavy BattleMech Recovery Vehicle","Heavy Hover APC","Heavy Hover APC (LRM)","Heavy Hover APC (MG)","Heavy Hover APC (Scout Tank)","Heavy Hover APC (SRM)","Heavy LRM Carrier","Heavy LRM Carrier (EN Variant)","Heavy MML Carrier","Heavy NLRM Carrier","Heavy Tracked APC","Heavy Tracked APC (LRM)","Heavy Tracked APC (MG)","Heavy Tracked APC (SRM)","Heavy Weapons Carrier (PPC)","Heavy Wheeled APC","Heavy Wheeled APC (LRM)","Heavy Wheeled APC (MG)","Heavy Wheeled APC (SRM)","Heavy Wheeled APC (WoB)","Heimdall Ground Monitor Tank A","Heimdall Ground Monitor Tank B","Heimdall Ground Monitor Tank C","Heimdall Ground Monitor Tank D","Heimdall Ground Monitor Tank Prime","Hephaestus Jump Tank","Hephaestus Scout Tank A","Hephaestus Scout Tank B","Hephaestus Scout Tank C","Hephaestus Scout Tank D","Hephaestus Scout Tank Prime","Hetzer Wheeled Assault Gun","Hetzer Wheeled Assault Gun (AC10)","Hetzer Wheeled Assault Gun (Cell)","Hetzer Wheeled Assault Gun (Laser)","Hetzer Wheeled Assault Gun (LB-X)","Hetzer Wheeled Assault Gun (LRM)","Hetzer Wheeled Assault Gun (Scout)","Hetzer Wheeled Assault Gun (Sealed)","Hetzer Wheeled Assault Gun (SRM)","Hetzer Wheeled Assault Gun C","Hexareme HQ Hovercraft","Hi-Scout Drone Carrier","Hi-Scout Drone Carrier \"Cunnington\"","Hipparch Cavalry Tank","Huitzilopochtli Assault Tank \"Huey\"  ","Huitzilopochtli Assault Tank \"Huey\" (AAA)","Huitzilopochtli Assault Tank \"Huey\" (LRM)","Huitzilopochtli Assault Tank \"Huey\" (Streak)","Hunter Light Support Tank","Hunter Light Support Tank \"Assault Hunter\"","Hunter Light Support Tank (3054 Upgrade)","Hunter Light Support Tank (Ammo)","Hunter Light Support Tank (Amphibious)","Hunter Light Support Tank (Cell)","Hunter Light Support Tank (ERLL)","Hunter Light Support Tank (LPL)","Hunter Light Support Tank (LRM10)","Hunter Light Support Tank (LRM15)","Ignis Infantry Support Tank","Ignis Infantry Support Tank (SRM)","Indra Infantry Transport","Indra Infantry Transport (BA)","Ishtar Heavy Fire Support Tank","Ishtar Heavy Fire Support Tank (Gauss)","Ishtar Heavy Fire Support Tank (Original)","J-27 Ordnance Transport","J-27 Ordnance Transport (Armor)","J-27 Ordnance Transport (Fusion)","J-27 Ordnance Transport K-27 \"Killjoy\"","J-27 Ordnance Transport Trailer","J. Edgar Light Hover Tank","J. Edgar Light Hover Tank (Cell)","J. Edgar Light Hover Tank (Chemical)","J. Edgar Light Hover Tank (Flamer)","J. Edgar Light Hover Tank (ICE)","J. Edgar Light Hover Tank (Kurita)","J. Edgar Light Hover Tank (LAC)","J. Edgar Light Hover Tank (Light PPC)","J. Edgar Light Hover Tank (MG)","J. Edgar Light Hover Tank (TAG)","J. Edgar Light Hover Tank (X-Pulse)","Jagdpanzer II","JES I Tactical Missile Carrier","JES I Tactical Missile Carrier (3082 Upgrade)","JES II Strategic Missile Carrier","JES II Strategic Missile Carrier (Ammo)","JES II Strategic Missile Carrier (Support)","JES III Missile Carrier","JES III Missile Carrier (C3)","JES III Missile Carrier (MML)","JES III Missile Carrier (Speed)","JES III Missile Carrier (Thunderbolt)","JI2A1 Attack APC","JI2A1 Attack APC (MML)","Joust Medium Tank BE700","Joust Medium Tank BE701","Kalki Cruise Missile Launcher","Kamakiri Attack VTOL","Kamakiri Attack VTOL (Gauss) \"Shi Kamakiri\"","Kamisori Light Tank A","Kamisori Light Tank B","Kamisori Light Tank C","Kamisori Light Tank Prime","Kamisori Light Tank R","Kanga Medium Hovertank","Kanga Medium Hovertank (AC)","Kanga-X Jump Tank","Karnov UR Gunship","Karnov UR Transport","Karnov UR Transport (3055 Upgrade)","Karnov UR Transport (AC)","Karnov UR Transport (Artillery)","Karnov UR Transport (BA Stealth)","Karnov UR Transport (BA)","Karnov UR Transport (Heavy Stealth)","Karnov UR Transport (Periphery)","Kelswa Assault Tank","Kestrel VTOL","Kestrel VTOL (Clan)","Kestrel VTOL (MedEvac)","Kestrel VTOL (ML)","Kestrel VTOL (Scout)","Kestrel VTOL (SL)","Kestrel VTOL (SRM)","Kinnol MBT","Kinnol MBT (PPC)","Kinnol MBT (RAC)","Kite Reconnaissance Vehicle","Kite Reconnaissance Vehicle (Fusion)","Kokou Defense Tank","Kokou Defense Tank (XL)","Korvin Tank KRV-3","Kruger Combat Car","Kruger Combat Car (Original)","Ku Wheeled Assault Tank","Ku Wheeled Assault Tank (IFV) \"Turhan II\"","Lamprey Transport Helicopter","Laser Carrier","Light SRM Carrier","Light Thunderbolt Carrier","Lightning Attack Hovercraft","Lightning Attack Hovercraft (ERML)","Lightning Attack Hovercraft (ERSL)","Lightning Attack Hovercraft (RL)","Lightning Attack Hovercraft (Royal)","Lightning Attack Hovercraft CX-3","LRM Carrier","LRM Carrier (3055 Upgrade)","LRM Carrier (WoB)","LRM Carrier C","Luduan Scout Vehicle","M.A.S.H. Truck","M.A.S.H. Truck (AMS)","M.A.S.H. Truck (ICE)","Magi Infantry Support Vehicle","Magi Infantry Support Vehicle (UCSV)","Main Gauche Light Support Tank","Main Gauche Light Support Tank (C3)","Main Gauche Light Support Tank (IFV)","Main Gauche Light Support Tank (XL)","Mamono IFV","Manteuffel Attack Tank A","Manteuffel Attack Tank B","Manteuffel Attack Tank C","Manteuffel Attack Tank D","Manteuffel Attack Tank E","Manteuffel Attack Tank Prime","Manticore Heavy Tank","Manticore Heavy Tank \"The Ballista\"","Manticore Heavy Tank (3055 Upgrade)","Manticore Heavy Tank (C3M)","Manticore Heavy Tank (C3S)","Manticore Heavy Tank (HPPC)","Manticore Heavy Tank (LB-X)","Manticore Heavy Tank (RAC)","Manticore Heavy Tank (XL)","Manticore Heavy Tank EC","Manticore II Heavy Tank","Mantis Light Attack VTOL","Mantis Light Attack VTOL (ECCM)","Marksman Artillery Vehicle","Marksman Artillery Vehicle (AC)","Marksman Artillery Vehicle (Light PPC)","Marksman MBT M1","Marksman MBT M1A","Marksman MBT M1J","Mars Assault Vehicle","Mars Assault Vehicle (ATM)","Mars Assault Vehicle (HAG)","Mars Assault Vehicle (XL)","Marsden MBT II","Marsden MBT II-A","Marsden MBT II-A (LB-X)","Marten Scout VTOL","Marten Scout VTOL (Infantry)","Maultier Hover APC","Maultier Hover APC (BA)","Maultier Hover APC (Basic)","Maultier Hover APC (Fusion)","Maultier Hover APC (Intermediate)","Maultier Hover APC (MG)","Maxim (I) Heavy Hover Transport","Maxim (I) Heavy Hover Transport (Company Command)","Maxim Flanker","Maxim Heavy Hover Transport","Maxim Heavy Hover Transport (3052 Upgrade)","Maxim Heavy Hover Transport (Anti-Infantry)","Maxim Heavy Hover Transport (BA Factory Upgrade)","Maxim Heavy Hover Transport (BA Field Upgrade)","Maxim Heavy Hover Transport (C3M)","Maxim Heavy Hover Transport (C3S)","Maxim Heavy Hover Transport (Clan)","Maxim Heavy Hover Transport (Escort)","Maxim Heavy Hover Transport (Fire Support)","Maxim Heavy Hover Transport (SRM2)","Maxim Heavy Hover Transport (SRM4)","Maxim Mk II Transport","Maxim Mk II Transport (ECM)","Maxim Mk II Transport (Infantry Support) \"Shiloh\"","Merkava Heavy Tank Mk IX","Merkava Heavy Tank Mk VIII","MHI Amphibious APC","MHI Defense AA Tank","Minion Advanced Tactical Vehicle","Minion Advanced Tactical Vehicle \"Silver Bullet\"","Minion Advanced Tactical Vehicle (Gauss) \"Sandblaster\"","Minion Advanced Tactical Vehicle (TAG)","Minion Advanced Tactical Vehicle (Targeting Computer)","MIT 23 MASH Vehicle","MIT 24 MASH Vehicle","Mithras Light Tank","Mithras Light Tank (ERLL)","Mobile Headquarters","Mobile Headquarters (ICE - LL)","Mobile Headquarters (ICE - LRM)","Mobile Headquarters (ICE)","Mobile Headquarters (LL)","Mobile Headquarters (LRM)","Mobile Long Tom Artillery LT-MOB-25","Mobile Long Tom Artillery LT-MOB-25F","Mobile Long Tom Artillery LT-MOB-95","Moltke MBT M1","Moltke MBT M2","Moltke MBT M3","Morningstar City Command Vehicle","Morningstar City Command Vehicle (Company Command)","Morningstar City Command Vehicle (HPG)","Morningstar City Command Vehicle (Laser)","Morrigu Fire Support Vehicle","Morrigu Fire Support Vehicle (HAG)","Morrigu Fire Support Vehicle (Laser)","Mortar Carrier","MRM Carrier","Musketeer Hover Tank","Musketeer Hover Tank (3080 Upgrade)","Musketeer Hover Tank (Armor)","Myrmidon Medium Tank","Myrmidon Medium Tank (Anti-Infantry)","Myrmidon Medium Tank P (Tate)","Myrmidon Medium Tank Type 2","Nacon Armored Scout","Narukami Heavy Tank NK-1C","Narukami Heavy Tank NK-BC3","Nightshade ECM VTOL","Nightshade ECM VTOL (Armor)","Nightshade ECM VTOL (LAC)","Nightshade ECM VTOL (Light PPC)","Nightshade ECM VTOL (Royal)","Nuberu Anti-Aircraft Tank","Odin Scout Tank","Odin Scout Tank (Spotter)","Ontos Heavy Tank","Ontos Heavy Tank (3053 Upgrade)","Ontos Heavy Tank (Chemical Laser)","Ontos Heavy Tank (Fusion)","Ontos Heavy Tank (Light Gauss)","Ontos Heavy Tank (LRM)","Ontos Heavy Tank (MML)","Ontos Heavy Tank (Sealed)","Ontos Heavy Tank HEAT","Ontos Heavy Tank X All-Aspect Assault Tank","Onuris Attack VTOL A","Onuris Attack VTOL B","Onuris Attack VTOL C","Onuris Attack VTOL D","Onuris Attack VTOL E","Onuris Attack VTOL Prime","Oro Heavy Tank","Oro Heavy Tank (HAG)","Packrat LRPV \"Gespenst\"","Packrat LRPV PKR-T5","Packrat LRPV PKR-T5 (ICE)","Packrat LRPV PKR-T5 (ML)","Packrat LRPV PKR-T5 (SRM2)","Padilla Anti-Missile Tank","Padilla Heavy Artillery Tank","Padilla Heavy Artillery Tank (LRM)","Padilla Tube Artillery Tank","Padilla Tube Artillery Tank (AMS)","Padilla Tube Artillery Tank (LTC)","Padilla Tube Artillery Tank (Thumper)","Paladin Defense System","Palmoni Assault Infantry Fighting Vehicle","Partisan AA Vehicle","Partisan AA Vehicle (3134 Upgrade)","Partisan Air Defense Tank","Partisan Air Defense Tank (Cell)","Partisan Air Defense Tank (Company Command)","Partisan Air Defense Tank (Lance Command)","Partisan Air Defense Tank (LRM)","Partisan Air Defense Tank (Quad RAC)","Partisan Air Defense Tank (RAC)","Partisan Air Defense Tank (XL)","Partisan Heavy Tank","Partisan Heavy Tank (AC2)","Partisan Heavy Tank (C3)","Partisan Heavy Tank (Cell)","Partisan Heavy Tank (ELRM)","Partisan Heavy Tank (Light Gauss)","Partisan Heavy Tank (LRM)","Partisan Heavy Tank (Refit)","Partisan Hull Defense","Patton Tank","Patton Tank -SB","Patton Tank (Taurian)","Patton Tank (Ultra)","Patton Tank (XL)","Pegasus Scout Hover Tank","Pegasus Scout Hover Tank (3058 Upgrade)","Pegasus Scout Hover Tank (C3)","Pegasus Scout Hover Tank (Missile)","Pegasus Scout Hover Tank (MML)","Pegasus Scout Hover Tank (MRM)","Pegasus Scout Hover Tank (Sealed)","Pegasus Scout Hover Tank (Sensors)","Pegasus Scout Hover Tank (Unarmed)","Pegasus Scout Hover Tank (X-Pulse)","Pegasus Scout Hover Tank X","Peregrine Attack VTOL","Peregrine Attack VTOL (Cargo)","Peregrine Attack VTOL (Kurita)","Phalanx Support Tank","Phalanx Support Tank (Prototype)","Pike Support Vehicle","Pike Support Vehicle (AC5)","Pike Support Vehicle (Clan)","Pike Support Vehicle (LB-X)","Pike Support Vehicle (Missile)","Pike Support Vehicle (Plasma)","Pike Support Vehicle (RAC) \"Assault Pike\"","Pilum Heavy Tank","Pilum Heavy Tank (Arrow IV)","Pilum Heavy Tank (ELRM)","Pinto Attack VTOL","Pinto Attack VTOL (WoB)","Pixiu Heavy Tank","Plainsman Medium Hovertank","Plainsman Medium Hovertank (Scout)","Plainsman Medium Hovertank (Sealed)","Plainsman Medium Hovertank (Streak)","Po Heavy Tank","Po Heavy Tank (HV Prototype)","Po Heavy Tank (HV)","Po Heavy Tank (LB-X)","Po Heavy Tank (Light Gauss)","Po II Heavy Tank","Po II Heavy Tank (Arrow IV)","Po II Heavy Tank (Gauss)","Po II Heavy Tank (Stealth)","Pollux ADA Heavy Tank","Pollux II ADA Heavy Tank","Praetorian Mobile Strategic Command HQ","Predator Tank Destroyer","Predator Tank Destroyer (Elite)","Predator Tank Destroyer (Original)","Prowler Multi-Terrain Vehicle","Prowler Multi-Terrain Vehicle (3140 Upgrade)","Prowler Multi-Terrain Vehicle (ECM)","Prowler Multi-Terrain Vehicle (RAF)","Prowler Multi-Terrain Vehicle (Sealed)","Prowler Multi-Terrain Vehicle (Security)","Prowler Multi-Terrain Vehicle (Succession Wars)","Prowler Multi-Terrain Vehicle (Support)","Prowler Multi-Terrain Vehicle (WoB)","Puma Assault Tank PAT-005","Puma Assault Tank PAT-005b","Puma Assault Tank PAT-007","Puma Assault Tank PAT-008","Quaestor Mobile Tactical Command HQ","R10 Mechanized ICV (Coolant Truck)","R10 Mechanized ICV A","R10 Mechanized ICV B","R10 Mechanized ICV Prime","Ranger Armored Fighting Vehicle VV1","Ranger Armored Fighting Vehicle VV1 (Interdictor)","Ranger Armored Fighting Vehicle VV1 (MG)","Ranger Armored Fighting Vehicle VV2","Ranger Armored Fighting Vehicle VV22","Red Kite Attack VTOL","Regulator Hovertank","Regulator Hovertank (Alan)","Regulator Hovertank (Arrow IV)","Regulator Hovertank (RAC)","Regulator II Hovertank","Regulator II Hovertank (RAC)","Regulator II Hovertank (Stealth)","Rhino Fire Support Tank","Rhino Fire Support Tank (Flamer)","Rhino Fire Support Tank (Hagar)","Rhino Fire Support Tank (MG)","Rhino Fire Support Tank (ML)","Rhino Fire Support Tank (Royal)","Rhino Fire Support Tank (SL)","Rhino Fire Support Tank EC","Ripper Infantry Transport","Ripper Infantry Transport (ERML)","Ripper Infantry Transport (Infantry)","Ripper Infantry Transport (Light PPC)","Ripper Infantry Transport (MG)","Ripper Infantry Transport (Royal)","Ripper Infantry Transport (SPL)","Rommel Tank","Rommel Tank (Gauss)","Rommel Tank (Sealed)","Rommel Tank Howitzer","Rommel Tank Howitzer Prototype","Rotunda Scout Vehicle RND-J-1-11","Rotunda Scout Vehicle RND-J-1-11 (LRM)","Rotunda Scout Vehicle RND-J-1-11 (RL)","Rotunda Scout Vehicle RND-J-1-11 (SRM)","Sabaku Kaze Heavy Scout Hover Tank","Saladin Assault Hover Tank","Saladin Assault Hover Tank (Armor)","Saladin Assault Hover Tank (Clan Cargo)","Saladin Assault Hover Tank (LB-X)","Saladin Assault Hover Tank (Ultra)","Saladin Assault Hover Tank Ifrit","Saladin Mk II HCV","Saladin Mk II HCV (BC3)","Saracen Medium Hover Tank","Saracen Medium Hover Tank (MRM)","Saracen Mk II HCV","Saracen Mk II HCV (BC3)","Savannah Master Hovercraft","Savannah Master Hovercraft (Interdictor)","Savannah Master Hovercraft (Reflective)","Savannah Master Hovercraft (SL)","Saxon APC","Saxon APC (HQ)","Saxon APC (Laser)","Saxon APC (MASH)","Scapha Hovertank A","Scapha Hovertank B","Scapha Hovertank C","Scapha Hovertank D","Scapha Hovertank E","Scapha Hovertank F","Scapha Hovertank G","Scapha Hovertank H","Scapha Hovertank I","Scapha Hovertank J","Scapha Hovertank Prime","Schildkr\u00f6te Line Tank","Schildkr\u00f6te Line Tank (HPPC)","Schildkr\u00f6te Line Tank (Light Gauss)","Schildkr\u00f6te Line Tank (Plasma)","Schiltron Mobile Fire-Support Platform A","Schiltron Mobile Fire-Support Platform B","Schiltron Mobile Fire-Support Platform C","Schiltron Mobile Fire-Support Platform D","Schiltron Mobile Fire-Support Platform E","Schiltron Mobile Fire-Support Platform F","Schiltron Mobile Fire-Support Platform Prime","Schrek AC Carrier","Schrek AC Carrier (Lothian)","Schrek Gauss Carrier","Schrek II-X PPC Carrier","Schrek PPC Carrier","Schrek PPC Carrier (Anti-Infantry)","Schrek PPC Carrier (Armor)","Schrek PPC Carrier (C3M)","Schrek PPC Carrier (LB-X)","Schrek PPC Carrier (XL)","Scimitar Medium Hover Tank","Scimitar Medium Hover Tank (C3)","Scimitar Medium Hover Tank (Missile)","Scimitar Medium Hover Tank (TAG)","Scimitar Mk II HCV","Scimitar Mk II HCV (3136 Upgrade)","Scimitar Mk II HCV (BC3)","Scorpion Light Tank","Scorpion Light Tank (Armor)","Scorpion Light Tank (Hardened)","Scorpion Light Tank (LAC)","Scorpion Light Tank (LRM)","Scorpion Light Tank (Minesweeper Prototype)","Scorpion Light Tank (Minesweeper)","Scorpion Light Tank (ML)","Scorpion Light Tank (MRM)","Scorpion Light Tank (RAC)","Scorpion Light Tank (Rifle)","Scorpion Light Tank (SRM)","Scorpion Light Tank (Thunderbolt)","Scorpion Light Tank (Ultra)","Scorpion Light Tank C","Sea Hunter Maritime Tank","Sekhmet Assault Vehicle","Sekhmet Assault Vehicle (Streak)","Shamash Reconnaissance Vehicle","Shamash Reconnaissance Vehicle (Flamer)","Shamash Reconnaissance Vehicle (Interdictor)","Shandra Advanced Scout Vehicle","Shandra Advanced Scout Vehicle (Original)","Sheriff Infantry Support Tank","Shillelagh Missile Tank","Shillelagh Missile Tank (Original)","Shoden Assault Vehicle","Shoden Assault Vehicle (LB-X)","Shoden Assault Vehicle (Streak)","Shun Transport VTOL","Shun Transport VTOL (Support)","Skadi Swift Attack VTOL","Skanda Light Tank","Skanda Light Tank (TSEMP)","Skimmer","Skulker Wheeled Scout Tank","Skulker Wheeled Scout Tank (C3M)","Skulker Wheeled Scout Tank (MG)","Skulker Wheeled Scout Tank (SRM)","Skulker Wheeled Scout Tank C","Skulker Wheeled Scout Tank Mk. II","Skulker Wheeled Scout Tank X-5","Sleipnir APC Tank","Sleipnir APC Tank (SRM)","SM Tank Destroyer SM1","SM Tank Destroyer SM1 \"Telos\"","SM Tank Destroyer SM1A","SM Tank Destroyer SM1B","SM Tank Destroyer SM3","SM2 Heavy Artillery Vehicle","SM2 Heavy Artillery Vehicle (LTC)","SM5 Field Commander (Prototype) Prime","Sniper Artillery","\u015eoarece Superheavy MBT","Sokar Urban Combat Tank","Sortek Assault Craft","Sortek Assault Craft (Interdictor)","Sprint Scout Helicopter","Sprint Scout Helicopter (C3)","Sprint Scout Helicopter (C3i)","Sprint Scout Helicopter (Interdictor)","Sprint Scout Helicopter (Laser)","Sprint Scout Helicopter (Troop Transport)","SRM Carrier","SRM Carrier (3054 Upgrade)","SRM Carrier (C3)","SRM Carrier (WoB)","SRM Carrier C","Striker Light Tank","Striker Light Tank \"Wet Striker\"","Striker Light Tank (3053 Upgrade)","Striker Light Tank (3061 Upgrade)","Striker Light Tank (Ammo)","Striker Light Tank (Laser)","Striker Light Tank (LRM)","Striker Light Tank (Narc)","Striker Light Tank (Sealed)","Striker Light Tank (SRM)","Striker Light Tank (Stealth)","Strix Stealth VTOL","SturmFeur \"Kalki\" Cruise Missile Launcher  ","SturmFeur Heavy Tank","SturmFeur Heavy Tank (Assault)","SturmFeur Heavy Tank (Cell)","SturmFeur Heavy Tank (Heavy Gauss)","SturmFeur Heavy Tank (SRM)","SturmFeur Heavy Tank (Steiner)","SturmFeur Heavy Tank (Support) \"Gilmore\"","SturmFeur Heavy Tank (WoB)","Stygian Strike Tank","Stygian Strike Tank (Armor)","Stygian Strike Tank (WoB)","Svantovit Infantry Fighting Vehicle","Svantovit Infantry Fighting Vehicle (ATM) \"Masada\"","Svantovit Infantry Fighting Vehicle (Original)","Swift Wind Scout Car","Swift Wind Scout Car (ICE - Cargo)","Swift Wind Scout Car (ICE - Speed)","Swift Wind Scout Car (ICE)","Tamerlane Strike Sled","Tamerlane Strike Sled (Flamer)","Tamerlane Strike Sled (RL)","Tamerlane Strike Sled 2","Tenmaku Command Trailer","Tepp\u014d Artillery Vehicle","Testudo Siege Tank","Thang-Ta APC","Thor Artillery Vehicle","Thor Artillery Vehicle (AC)","Thor Artillery Vehicle (C3i)","Thor Artillery Vehicle (Clan)","Thumper Artillery Vehicle","Thumper Artillery Vehicle (Angel)","Thumper Artillery Vehicle Maxwell","Thumper Artillery Vehicle TAV-1","Thumper Artillery Vehicle TAV-2","Tiger Medium Tank (Prototype)","Tiger Medium Tank T-12","Tokugawa Heavy Tank","Tokugawa Heavy Tank (C3)","Tokugawa Heavy Tank (MRM)","Tokugawa Heavy Tank (SD2)","Tokugawa Heavy Tank (Streak)","Tokugawa Heavy Tank TKG-150","Tokugawa Heavy Tank TKG-151","Tokugawa Heavy Tank Yumi","Trajan Assault Infantry Fighting Vehicle","Trajan Assault Infantry Fighting Vehicle (ICE)","Transportable Field Repair Unit JI-100","Tribune Mobile Tactical Command HQ","Tufana Hovercraft","Tufana Hovercraft (iNarc)","Turhan Urban Combat Vehicle","Turhan Urban Combat Vehicle (C3)","Turhan Urban Combat Vehicle (Original)","Typhoon Urban Assault Vehicle","Typhoon Urban Assault Vehicle (LB-X)","Typhoon Urban Assault Vehicle (RAC)","Typhoon Urban Assault Vehicle (Tracked)","Tyr Infantry Support Tank","Tyr Infantry Support Tank (Kurita)","Vali Artillery Vehicle","Vargr APC Tank","Vargr APC Tank (LRM)","Vector Combat Support VTOL","Vector Combat Support VTOL (Attack)","Vector Combat Support VTOL (EW)","Vector Combat Support VTOL (Scout)","Vedette Medium Tank","Vedette Medium Tank \"Doris' Delight\"","Vedette Medium Tank (AC/10)","Vedette Medium Tank (AC2)","Vedette Medium Tank (Armor)","Vedette Medium Tank (Cell)","Vedette Medium Tank (LB-X)","Vedette Medium Tank (Liao)","Vedette Medium Tank (Light Gauss)","Vedette Medium Tank (NETC)","Vedette Medium Tank (RAC)","Vedette Medium Tank (Ultra)","Vedette Medium Tank V-G7X","Vedette Medium Tank V7","Vedette Medium Tank V9","Vidar Heavy Defense Tank","Von Luckner Heavy Tank (Royal)","Von Luckner Heavy Tank (Star League)","Von Luckner Heavy Tank VNL-K100","Von Luckner Heavy Tank VNL-K65N","Von Luckner Heavy Tank VNL-K65W","Von Luckner Heavy Tank VNL-K70","Von Luckner Heavy Tank VNL-K75N","Von Luckner Heavy Tank VNL-K85N","Von Luckner Heavy Tank VNL-K90","Von Luckner Heavy Tank VNL-X71 (Yakuza)","Warrior Attack Helicopter H-10","Warrior Attack Helicopter H-7","Warrior Attack Helicopter H-7A","Warrior Attack Helicopter H-7C","Warrior Attack Helicopter H-7F","Warrior Attack Helicopter H-8","Warrior Attack Helicopter H-9","Warrior Attack Helicopter HX-9","Warrior Stealth Helicopter S-9","Weapons/Troop Carrier (LRM)","Wheeled Scout","Wheeled Scout (Camera)","Wheeled Scout (Sensors)","Whirlwind Scout Hover Tank","Whirlwind Scout Hover Tank (AAA)","Whirlwind Scout Hover Tank (IFV)","Winston Combat Vehicle","Winston Combat Vehicle (LAC)","Winston Combat Vehicle (Support)","Winston Combat Vehicle (TSEMP)","Winston Combat Vehicle (XXL)","Winterhawk APC","Yasha VTOL","Yasha VTOL \"Spectre\"","Yasha VTOL (Interdictor)","Yellow Jacket Gunship","Yellow Jacket Gunship (Ammo)","Yellow Jacket Gunship (Arrow IV)","Yellow Jacket Gunship (PPC)","Yellow Jacket Gunship (RAC)","Zahn Heavy Transport","Zephyr Hovertank","Zephyr Hovertank (C3i)","Zephyr Hovertank (LRM)","Zephyr Hovertank (OmniDrone) A","Zephyr Hovertank (OmniDrone) B","Zephyr Hovertank (OmniDrone) C","Zephyr Hovertank (OmniDrone) Prime","Zephyr Hovertank (Royal)","Zephyr Hovertank (SRM2)","Zephyr Hovertank EC","Zephyros Infantry Support Vehicle","Zephyros Infantry Support Vehicle (Dual Turret)","Zhukov Heavy Tank","Zhukov Heavy Tank (LB-X)","Zhukov Heavy Tank (Liao)","Zhukov Heavy Tank (WoB)","Zibler Fast Strike Tank A","Zibler Fast Strike Tank B","Zibler Fast Strike Tank C","Zibler Fast Strike Tank D","Zibler Fast Strike Tank Prime","Zorya Light Tank","Zorya Light Tank (Ammo)","Zorya Light Tank (ATM)"]},"FullName":{"values":["AC/2 Carrier","AC/2 Carrier (LB-X)","Aeron Strike VTOL","Aeron Strike VTOL (BAP)","Aesir Medium AA Vehicle","Aesir Medium AA Vehicle (HAG)","Aithon Assault Transport","Ajax Assault Tank (Sealed)","Ajax Assault Tank A","Ajax Assault Tank B","Ajax Assault Tank C","Ajax Assault Tank D","Ajax Assault Tank Prime","Alacorn Heavy Tank Mk. I","Alacorn Heavy Tank Mk. II","Alacorn Heavy Tank Mk. III","Alacorn Heavy Tank Mk. IV","Alacorn Heavy Tank Mk. VI","Alacorn Heavy Tank Mk. VII","Anat APC","Anhur (P-Stealth)","Anhur Transport","Anhur Transport (BA)","Ares Medium Tank","Ares Medium Tank (Plasma)","Armored Personnel Carrier (Hover LRM)","Armored Personnel Carrier (Hover MG)","Armored Personnel Carrier (Hover Sensors)","Armored Personnel Carrier (Hover SRM)","Armored Personnel Carrier (Hover)","Armored Personnel Carrier (Tracked LRM)","Armored Personnel Carrier (Tracked MG)","Armored Personnel Carrier (Tracked SRM)","Armored Personnel Carrier (Tracked)","Armored Personnel Carrier (Wheeled LRM)","Armored Personnel Carrier (Wheeled MG)","Armored Personnel Carrier (Wheeled SRM)","Armored Personnel Carrier (Wheeled)","Arrow IV Assault Vehicle","Arrow IV Carrier","Asshur Artillery Spotter","Asshur Fast Reconnaissance Vehicle","Asshur Fast Reconnaissance Vehicle (Proto AC)","Athena Combat Vehicle","Athena Combat Vehicle (HAG)","Athena Combat Vehicle XR","Axel Heavy Tank IIC","Axel Heavy Tank IIC (XL)","Axel Heavy Tank Mk. 1","Axel Heavy Tank Mk. 2","Badger (C) Tracked Transport A","Badger (C) Tracked Transport B","Badger (C) Tracked Transport C","Badger (C) Tracked Transport D","Badger (C) Tracked Transport E","Badger (C) Tracked Transport F","Badger (C) Tracked Transport H","Badger (C) Tracked Transport Prime","Badger Tracked Transport A","Badger Tracked Transport B","Badger Tracked Transport C","Badger Tracked Transport D","Badger Tracked Transport E","Badger Tracked Transport F","Badger Tracked Transport G","Badger Tracked Transport Prime","Balac Strike VTOL","Balac Strike VTOL (Hybrid)","Balac Strike VTOL (LRM)","Balac Strike VTOL (Spotter)","Ballista Artillery Trailer","Ballista Self-Propelled Artillery Tank","Bandit (C) Hovercraft A","Bandit (C) Hovercraft B","Bandit (C) Hovercraft C","Bandit (C) Hovercraft D","Bandit (C) Hovercraft E","Bandit (C) Hovercraft F","Bandit (C) Hovercraft G","Bandit (C) Hovercraft H","Bandit (C) Hovercraft Prime","Bandit Hovercraft \"Warthog\"","Bandit Hovercraft A","Bandit Hovercraft B","Bandit Hovercraft C","Bandit Hovercraft D","Bandit Hovercraft E","Bandit Hovercraft F","Bandit Hovercraft G","Bandit Hovercraft H","Bandit Hovercraft I","Bandit Hovercraft Mk. II","Bandit Hovercraft Prime","Bardiche Heavy Strike Tank","Bardiche Heavy Strike Tank (Minesweeper)","Bardiche Heavy Strike Tank C","BattleMech Recovery Vehicle","Beagle Hover Scout","Beagle Hover Scout (C3i)","Beagle Hover Scout (LRRP)","Beagle Hover Scout (Sealed)","Beagle Hover Scout (TAG)","Behemoth Heavy Tank","Behemoth Heavy Tank (Armor)","Behemoth Heavy Tank (Davion)","Behemoth Heavy Tank (Flamer)","Behemoth Heavy Tank (Kurita Upgrade)","Behemoth Heavy Tank (Kurita)","Behemoth Heavy Tank (Liao)","Behemoth Heavy Tank (Refit)","Behemoth II Heavy Tank","Behemoth II Heavy Tank (Support)","Bellona Hover Tank","Bellona Hover Tank (Laser)","Bellona Hover Tank (XL)","Blizzard Hover Transport","Blizzard Hover Transport \"Black Blizzard\"","Blizzard Hover Transport (SRM)","Bokkusu Support Trailer","Bolla Stealth Tank (RotS) A","Bolla Stealth Tank (RotS) B","Bolla Stealth Tank (RotS) C","Bolla Stealth Tank (RotS) D","Bolla Stealth Tank (RotS) Prime","Bolla Stealth Tank Comminus","Bolla Stealth Tank Dominus","Bolla Stealth Tank Infernus","Bolla Stealth Tank Invictus","Browning Mobile Headquarters","Browning Mobile Headquarters (Half-Track)","Brutus Assault Tank","Brutus Assault Tank (HPPC)","Brutus Assault Tank (LRM)","Brutus Assault Tank (PPC 2)","Brutus Assault Tank (PPC)","Bulldog Medium Tank","Bulldog Medium Tank (AC2)","Bulldog Medium Tank (Cell)","Bulldog Medium Tank (Chemical)","Bulldog Medium Tank (ERLL)","Bulldog Medium Tank (LB-X)","Bulldog Medium Tank (LRM)","Bulldog Medium Tank (Plasma)","Bulwark Assault Vehicle","Bulwark Assault Vehicle (Original)","Burke Defense Tank","Burke Defense Tank (HPPC)","Burke Defense Tank (Royal)","Burke II Superheavy Tank","Buzzard Hover Tank","Cardinal Transport","Cardinal Transport (RAF)","Carnivore Assault Tank","Carnivore Assault Tank (HAG)","Carnivore Assault Tank (Second Line)","Cavalry Attack Helicopter","Cavalry Attack Helicopter (BA)","Cavalry Attack Helicopter (Infantry)","Cavalry Attack Helicopter (Infiltrator)","Cavalry Attack Helicopter (LRM)","Cavalry Attack Helicopter (SRM)","Cavalry Attack Helicopter (TAG)","Cavalry Attack Helicopter Cadence Rain","Centipede Scout Car","Centipede Scout Car (SRM)","Centipede Scout Car (TAG)","Centipede Scout Car Commando","Chalchiuhtotolin Support Tank","Chalchiuhtotolin Support Tank (Bombast Laser)","Chalchiuhtotolin Support Tank (Chemical Laser)","Chalchiuhtotolin Support Tank (XL)","Challenger MBT Mk. XV","Challenger MBT X","Challenger MBT XI","Challenger MBT XII","Challenger MBT XIVs","Challenger MBT XVc","Chaparral Missile Artillery Tank","Chaparral Missile Artillery Tank (CASE)","Chaparral Missile Artillery Tank (ERML)","Chaparral Missile Artillery Tank (MG)","Chaparral Missile Artillery Tank (SRM)","Chevalier Light Tank","Chevalier Light Tank (BAP)","Chevalier Light Tank (MML)","Chevalier Light Tank (Speed)","Cizin Hover Tank","Cizin Hover Tank (Support)","Cobra Transport VTOL","Cobra Transport VTOL (Command)","Cobra Transport VTOL (MASH)","Cobra Transport VTOL (Original)","Command Van","Command Van (ICE)","Command Van (Q-Vehicle)","Condor Heavy Hover Tank","Condor Heavy Hover Tank (Davion)","Condor Heavy Hover Tank (Fission)","Condor Heavy Hover Tank (Flamer)","Condor Heavy Hover Tank (Fusion)","Condor Heavy Hover Tank (LAC)","Condor Heavy Hover Tank (Laser Upgrade)","Condor Heavy Hover Tank (Laser)","Condor Heavy Hover Tank (Liao)","Condor Heavy Hover Tank (Ultra)","Condor Heavy Hover Tank (Upgrade)","Condor Heavy Hover Tank (Upgrade) (Laser)","Condor Heavy Hover Tank C","Condor Multi-Purpose Tank","Condor Multi-Purpose Tank (Reactive)","Coolant Truck (Hover)","Coolant Truck (Tracked)","Coolant Truck 135-K \"Lifesaver\"","Crane Heavy Transport","Crow Scout Helicopter","Crow Scout Helicopter \"Dragonfly\"","Crow Scout Helicopter (C3)","Crow Scout Helicopter (Export)","Cyrano Gunship","Cyrano Gunship (ML)","Cyrano Gunship (Plasma)","Cyrano Gunship (Royal)","Cyrano Gunship Fury","Daimyo HQ 67-K","Daimyo HQ 67-K2","Daimyo HQ 67-NC","Daimyo HQ 67-R","Danai Support Vehicle","Danai Support Vehicle (Arrow)","Darter Scout Car","Darter Scout Car (BAP)","Darter Scout Car (C3)","Darter Scout Car (ECM)","Darter Scout Car (SRM)","Darter Scout Car (SRM2)","Demolisher Heavy Tank (Arrow IV)","Demolisher Heavy Tank (Cell)","Demolisher Heavy Tank (Clan)","Demolisher Heavy Tank (Defensive)","Demolisher Heavy Tank (Gauss)","Demolisher Heavy Tank (MRM)","Demolisher Heavy Tank (Reinforced)","Demolisher Heavy Tank Mk. II","Demolisher II Heavy Tank","Demolisher II Heavy Tank (MML)","Demolisher II Heavy Tank (Thunderbolt)","Demolisher II Heavy Tank II-X","Demon Medium Tank","Demon Medium Tank (Armor)","Demon Medium Tank (Rifle)","Demon Tank","Demon Tank (HGR)","Demon Tank (Horned Demon)","Demon Tank (PPC)","Demon Tank (Royal)","Demon Tank CX-2","Desert Scorpion Light Tank","Destrier Siege Vehicle","Devastator Heavy Tank","Devastator II Superheavy Tank","DI Morgan Assault Tank","DI Morgan Assault Tank (Gauss)","DI Morgan Assault Tank (LRM)","DI Multipurpose Light VTOL","DI Multipurpose Light VTOL (Gunship)","DI Schmitt Tank","DI Schmitt Tank (Targeting Computer)","Diggs Drone Control Tank","Donar Assault Helicopter","Donar Assault Helicopter (Close Support)","Donar Assault Helicopter (Recon)","Drillson Heavy Hover Tank","Drillson Heavy Hover Tank (ERLL)","Drillson Heavy Hover Tank (MML)","Drillson Heavy Hover Tank (Sealed)","Drillson Heavy Hover Tank (SRM)","Drillson Heavy Hover Tank (Streak)","Drillson Heavy Hover Tank C","Drillson Heavy Hover Tank C 2","Eldingar Hover Sled","Eldingar Hover Sled (HMMHV) \"HumHov\"","Eldingar Hover Sled (Streak)","Engineering Vehicle","Engineering Vehicle (AC)","Engineering Vehicle (Flamer)","Enyo Strike Tank","Enyo Strike Tank (ER Pulse)","Enyo Strike Tank (LB-X) \"Sholef\"","Enyo Strike Tank XR","Epona Pursuit Tank A","Epona Pursuit Tank B","Epona Pursuit Tank C","Epona Pursuit Tank D","Epona Pursuit Tank E","Epona Pursuit Tank Prime","Eurus MBT A","Eurus MBT B","Eurus MBT C","Eurus MBT D","Eurus MBT Prime","Falcon Hover Tank","Fensalir Combat WiGE","Ferret Light Scout VTOL","Ferret Light Scout VTOL \"Fermi\"","Ferret Light Scout VTOL (Armor) \"Wild Weasel\"","Ferret Light Scout VTOL (Cargo)","Flatbed Truck","Flatbed Truck (Armor)","Flatbed Truck (LRM)","Flatbed Truck (Mortar)","Flatbed Truck (RL)","Flatbed Truck (SRM)","Fortune Wheeled Assault Vehicle","Fortune Wheeled Assault Vehicle (C3M)","Fortune Wheeled Assault Vehicle (Thunderbolt)","Fox Armored Car","Fox Armored Car (Flamer)","Fox Armored Car (Interdictor)","Fox Armored Car (VSP)","Fulcrum Heavy Hover Tank (Hybrid)","Fulcrum Heavy Hovertank","Fulcrum Heavy Hovertank II","Fulcrum Heavy Hovertank III","Fulcrum Heavy Hovertank X","Fury Command Tank","Fury Command Tank (C3M)","Fury Command Tank (C3S)","Fury Command Tank (Fury II)","Fury Command Tank (Fury III)","Fury Command Tank (Fury IIIm)","Fury Command Tank (Original)","Fury Command Tank (Royal)","Fury Command Tank CX-17","Gabriel Reconnaissance Hovercraft","Gabriel Reconnaissance Hovercraft (ERSL)","Gabriel Reconnaissance Hovercraft (TDF)","Gallant Urban Assault Tank","Galleon Light Tank C","Galleon Light Tank GAL-100","Galleon Light Tank GAL-102","Galleon Light Tank GAL-103","Galleon Light Tank GAL-104","Galleon Light Tank GAL-105","Galleon Light Tank GAL-106","Galleon Light Tank GAL-106M","Galleon Light Tank GAL-200","Galleon Light Tank GAL-200 (RL)","Galleon Light Tank GAL-200R","Galleon Light Tank GAL-201","Galleon Light Tank GAL-300","Galleon Light Tank Maxwell","Garrot Superheavy Transport","Garuda Heavy VTOL","Giggins APC","Giggins APC (Fire Support)","Gladius Medium Hover Tank Mk. II","Gladius Medium Hovertank","Glaive Medium Tank","Glaive Medium Tank (MFB)","Glory Heavy Fire Support Vehicle","Glory Heavy Fire Support Vehicle (3090 Upgrade)","Glory Heavy Fire Support Vehicle (Arrow IV)","Glory Heavy Fire Support Vehicle (Light Gauss)","Goblin II Infantry Support Vehicle","Goblin III Infantry Support Vehicle","Goblin Infantry Support Vehicle","Goblin Infantry Support Vehicle (Sealed)","Goblin Medium Tank","Goblin Medium Tank (LRM)","Goblin Medium Tank (MG)","Goblin Medium Tank (SRM)","Goblin Medium Tank X","Gossamer VTOL","Gossamer VTOL (XL)","Gulltoppr OmniMonitor A","Gulltoppr OmniMonitor B","Gulltoppr OmniMonitor Prime","Gun Trailer (Ambush)","Gun Trailer (Artillery/AAA)","Gun Trailer (LRM)","Gun Trailer (Mjolnir)","Gun Trailer (SC)","Gun Trailer (Siege)","Gun Trailer (Stronghold)","Gun Trailer (Thumper)","Gun Trailer (Thunderbolt)","Gun Trailer (Ultra)","G\u00fcrteltier MBT","G\u00fcrteltier MBT (C3M)","Gurzil Support Tank","Hachiman Fire Support Tank","Hachiman Fire Support Tank (AAA)","Hadur Fast Support Vehicle","Hadur Fast Support Vehicle (LRM)","Hadur Fast Support Vehicle (Reactive)","Hanse MBT","Harasser Laser Platform","Harasser Missile Platform","Harasser Missile Platform \"Leaping Lisa\"","Harasser Missile Platform \"Mini-Peggy\"","Harasser Missile Platform (Flamer)","Harasser Missile Platform (Fuel Cell)","Harasser Missile Platform (Heavy Ferro)","Harasser Missile Platform (iNarc)","Harasser Missile Platform (LFE)","Harasser Missile Platform (LRM)","Harasser Missile Platform (Marian)","Harasser Missile Platform (MML)","Harasser Missile Platform (Speed)","Harasser Missile Platform (Thunderbolt)","Harrier Heavy Hover Tank","Harrier Heavy Hover Tank (PPC)","Harrier Heavy Hover Tank (Re-Laser)","Hasek Mechanized Combat Vehicle","Hawk Hover Tank (LTV-4)","Hawk Moth Gunship","Hawk Moth Gunship \"Verwandlung\"","Hawk Moth Gunship (Armor)","Hawk Moth Gunship (Thunderbolt)","Hawk Moth II Gunship","Hawk Moth II Gunship (MML)","Hawk Moth II Gunship (Sniper)","Heavy BattleMech Recovery Vehicle","Heavy Hover APC","Heavy Hover APC (LRM)","Heavy Hover APC (MG)","Heavy Hover APC (Scout Tank)","Heavy Hover APC (SRM)","Heavy LRM Carrier","Heavy LRM Carrier (EN Variant)","Heavy MML Carrier","Heavy NLRM Carrier","Heavy Tracked APC","Heavy Tracked APC (LRM)","Heavy Tracked APC (MG)","Heavy Tracked APC (SRM)","Heavy Weapons Carrier (PPC)","Heavy Wheeled APC","Heavy Wheeled APC (LRM)","Heavy Wheeled APC (MG)","Heavy Wheeled APC (SRM)","Heavy Wheeled APC (WoB)","Heimdall Ground Monitor Tank A","Heimdall Ground Monitor Tank B","Heimdall Ground Monitor Tank C","Heimdall Ground Monitor Tank D","Heimdall Ground Monitor Tank Prime","Hephaestus Jump Tank","Hephaestus Scout Tank A","Hephaestus Scout Tank B","Hephaestus Scout Tank C","Hephaestus Scout Tank D","Hephaestus Scout Tank Prime","Hetzer Wheeled Assault Gun","Hetzer Wheeled Assault Gun (AC10)","Hetzer Wheeled Assault Gun (Cell)","Hetzer Wheeled Assault Gun (Laser)","Hetzer Wheeled Assault Gun (LB-X)","Hetzer Wheeled Assault Gun (LRM)","Hetzer Wheeled Assault Gun (Scout)","Hetzer Wheeled Assault Gun (Sealed)","Hetzer Wheeled Assault Gun (SRM)","Hetzer Wheeled Assault Gun C","Hexareme HQ Hovercraft","Hi-Scout Drone Carrier","Hi-Scout Drone Carrier \"Cunnington\"","Hipparch Cavalry Tank","Huitzilopochtli Assault Tank \"Huey\"  ","Huitzilopochtli Assault Tank \"Huey\" (AAA)","Huitzilopochtli Assault Tank \"Huey\" (LRM)","Huitzilopochtli Assault Tank \"Huey\" (Streak)","Hunter Light Support Tank","Hunter Light Support Tank \"Assault Hunter\"","Hunter Light Support Tank (3054 Upgrade)","Hunter Light Support Tank (Ammo)","Hunter Light Support Tank (Amphibious)","Hunter Light Support Tank (Cell)","Hunter Light Support Tank (ERLL)","Hunter Light Support Tank (LPL)","Hunter Light Support Tank (LRM10)","Hunter Light Support Tank (LRM15)","Ignis Infantry Support Tank","Ignis Infantry Support Tank (SRM)","Indra Infantry Transport","Indra Infantry Transport (BA)","Ishtar Heavy Fire Support Tank","Ishtar Heavy Fire Support Tank (Gauss)","Ishtar Heavy Fire Support Tank (Original)","J-27 Ordnance Transport","J-27 Ordnance Transport (Armor)","J-27 Ordnance Transport (Fusion)","J-27 Ordnance Transport K-27 \"Killjoy\"","J-27 Ordnance Transport Trailer","J. Edgar Light Hover Tank","J. Edgar Light Hover Tank (Cell)","J. Edgar Light Hover Tank (Chemical)","J. Edgar Light Hover Tank (Flamer)","J. Edgar Light Hover Tank (ICE)","J. Edgar Light Hover Tank (Kurita)","J. Edgar Light Hover Tank (LAC)","J. Edgar Light Hover Tank (Light PPC)","J. Edgar Light Hover Tank (MG)","J. Edgar Light Hover Tank (TAG)","J. Edgar Light Hover Tank (X-Pulse)","Jagdpanzer II","JES I Tactical Missile Carrier","JES I Tactical Missile Carrier (3082 Upgrade)","JES II Strategic Missile Carrier","JES II Strategic Missile Carrier (Ammo)","JES II Strategic Missile Carrier (Support)","JES III Missile Carrier","JES III Missile Carrier (C3)","JES III Missile Carrier (MML)","JES III Missile Carrier (Speed)","JES III Missile Carrier (Thunderbolt)","JI2A1 Attack APC","JI2A1 Attack APC (MML)","Joust Medium Tank BE700","Joust Medium Tank BE701","Kalki Cruise Missile Launcher","Kamakiri Attack VTOL","Kamakiri Attack VTOL (Gauss) \"Shi Kamakiri\"","Kamisori Light Tank A","Kamisori Light Tank B","Kamisori Light Tank C","Kamisori Light Tank Prime","Kamisori Light Tank R","Kanga Medium Hovertank","Kanga Medium Hovertank (AC)","Kanga-X Jump Tank","Karnov UR Gunship","Karnov UR Transport","Karnov UR Transport (3055 Upgrade)","Karnov UR Transport (AC)","Karnov UR Transport (Artillery)","Karnov UR Transport (BA Stealth)","Karnov UR Transport (BA)","Karnov UR Transport (Heavy Stealth)","Karnov UR Transport (Periphery)","Kelswa Assault Tank","Kestrel VTOL","Kestrel VTOL (Clan)","Kestrel VTOL (MedEvac)","Kestrel VTOL (ML)","Kestrel VTOL (Scout)","Kestrel VTOL (SL)","Kestrel VTOL (SRM)","Kinnol MBT","Kinnol MBT (PPC)","Kinnol MBT (RAC)","Kite Reconnaissance Vehicle","Kite Reconnaissance Vehicle (Fusion)","Kokou Defense Tank","Kokou Defense Tank (XL)","Korvin Tank KRV-3","Kruger Combat Car","Kruger Combat Car (Original)","Ku Wheeled Assault Tank","Ku Wheeled Assault Tank (IFV) \"Turhan II\"","Lamprey Transport Helicopter","Laser Carrier","Light SRM Carrier","Light Thunderbolt Carrier","Lightning Attack Hovercraft","Lightning Attack Hovercraft (ERML)","Lightning Attack Hovercraft (ERSL)","Lightning Attack Hovercraft (RL)","Lightning Attack Hovercraft (Royal)","Lightning Attack Hovercraft CX-3","LRM Carrier","LRM Carrier (3055 Upgrade)","LRM Carrier (WoB)","LRM Carrier C","Luduan Scout Vehicle","M.A.S.H. Truck","M.A.S.H. Truck (AMS)","M.A.S.H. Truck (ICE)","Magi Infantry Support Vehicle","Magi Infantry Support Vehicle (UCSV)","Main Gauche Light Support Tank","Main Gauche Light Support Tank (C3)","Main Gauche Light Support Tank (IFV)","Main Gauche Light Support Tank (XL)","Mamono IFV","Manteuffel Attack Tank A","Manteuffel Attack Tank B","Manteuffel Attack Tank C","Manteuffel Attack Tank D","Manteuffel Attack Tank E","Manteuffel Attack Tank Prime","Manticore Heavy Tank","Manticore Heavy Tank \"The Ballista\"","Manticore Heavy Tank (3055 Upgrade)","Manticore Heavy Tank (C3M)","Manticore Heavy Tank (C3S)","Manticore Heavy Tank (HPPC)","Manticore Heavy Tank (LB-X)","Manticore Heavy Tank (RAC)","Manticore Heavy Tank (XL)","Manticore Heavy Tank EC","Manticore II Heavy Tank","Mantis Light Attack VTOL","Mantis Light Attack VTOL (ECCM)","Marksman Artillery Vehicle","Marksman Artillery Vehicle (AC)","Marksman Artillery Vehicle (Light PPC)","Marksman MBT M1","Marksman MBT M1A","Marksman MBT M1J","Mars Assault Vehicle","Mars Assault Vehicle (ATM)","Mars Assault Vehicle (HAG)","Mars Assault Vehicle (XL)","Marsden MBT II","Marsden MBT II-A","Marsden MBT II-A (LB-X)","Marten Scout VTOL","Marten Scout VTOL (Infantry)","Maultier Hover APC","Maultier Hover APC (BA)","Maultier Hover APC (Basic)","Maultier Hover APC (Fusion)","Maultier Hover APC (Intermediate)","Maultier Hover APC (MG)","Maxim (I) Heavy Hover Transport","Maxim (I) Heavy Hover Transport (Company Command)","Maxim Flanker","Maxim Heavy Hover Transport","Maxim Heavy Hover Transport (3052 Upgrade)","Maxim Heavy Hover Transport (Anti-Infantry)","Maxim Heavy Hover Transport (BA Factory Upgrade)","Maxim Heavy Hover Transport (BA Field Upgrade)","Maxim Heavy Hover Transport (C3M)","Maxim Heavy Hover Transport (C3S)","Maxim Heavy Hover Transport (Clan)","Maxim Heavy Hover Transport (Escort)","Maxim Heavy Hover Transport (Fire Support)","Maxim Heavy Hover Transport (SRM2)","Maxim Heavy Hover Transport (SRM4)","Maxim Mk II Transport","Maxim Mk II Transport (ECM)","Maxim Mk II Transport (Infantry Support) \"Shiloh\"","Merkava Heavy Tank Mk IX","Merkava Heavy Tank Mk VIII","MHI Amphibious APC","MHI Defense AA Tank","Minion Advanced Tactical Vehicle","Minion Advanced Tactical Vehicle \"Silver Bullet\"","Minion Advanced Tactical Vehicle (Gauss) \"Sandblaster\"","Minion Advanced Tactical Vehicle (TAG)","Minion Advanced Tactical Vehicle (Targeting Computer)","MIT 23 MASH Vehicle","MIT 24 MASH Vehicle","Mithras Light Tank","Mithras Light Tank (ERLL)","Mobile Headquarters","Mobile Headquarters (ICE - LL)","Mobile Headquarters (ICE - LRM)","Mobile Headquarters (ICE)","Mobile Headquarters (LL)","Mobile Headquarters (LRM)","Mobile Long Tom Artillery LT-MOB-25","Mobile Long Tom Artillery LT-MOB-25F","Mobile Long Tom Artillery LT-MOB-95","Moltke MBT M1","Moltke MBT M2","Moltke MBT M3","Morningstar City Command Vehicle","Morningstar City Command Vehicle (Company Command)","Morningstar City Command Vehicle (HPG)","Morningstar City Command Vehicle (Laser)","Morrigu Fire Support Vehicle","Morrigu Fire Support Vehicle (HAG)","Morrigu Fire Support Vehicle (Laser)","Mortar Carrier","MRM Carrier","Musketeer Hover Tank","Musketeer Hover Tank (3080 Upgrade)","Musketeer Hover Tank (Armor)","Myrmidon Medium Tank","Myrmidon Medium Tank (Anti-Infantry)","Myrmidon Medium Tank P (Tate)","Myrmidon Medium Tank Type 2","Nacon Armored Scout","Narukami Heavy Tank NK-1C","Narukami Heavy Tank NK-BC3","Nightshade ECM VTOL","Nightshade ECM VTOL (Armor)","Nightshade ECM VTOL (LAC)","Nightshade ECM VTOL (Light PPC)","Nightshade ECM VTOL (Royal)","Nuberu Anti-Aircraft Tank","Odin Scout Tank","Odin Scout Tank (Spotter)","Ontos Heavy Tank","Ontos Heavy Tank (3053 Upgrade)","Ontos Heavy Tank (Chemical Laser)","Ontos Heavy Tank (Fusion)","Ontos Heavy Tank (Light Gauss)","Ontos Heavy Tank (LRM)","Ontos Heavy Tank (MML)","Ontos Heavy Tank (Sealed)","Ontos Heavy Tank HEAT","Ontos Heavy Tank X All-Aspect Assault Tank","Onuris Attack VTOL A","Onuris Attack VTOL B","Onuris Attack VTOL C","Onuris Attack VTOL D","Onuris Attack VTOL E","Onuris Attack VTOL Prime","Oro Heavy Tank","Oro Heavy Tank (HAG)","Packrat LRPV \"Gespenst\"","Packrat LRPV PKR-T5","Packrat LRPV PKR-T5 (ICE)","Packrat LRPV PKR-T5 (ML)","Packrat LRPV PKR-T5 (SRM2)","Padilla Anti-Missile Tank","Padilla Heavy Artillery Tank","Padilla Heavy Artillery Tank (LRM)","Padilla Tube Artillery Tank","Padilla Tube Artillery Tank (AMS)","Padilla Tube Artillery Tank (LTC)","Padilla Tube Artillery Tank (Thumper)","Paladin Defense System","Palmoni Assault Infantry Fighting Vehicle","Partisan AA Vehicle","Partisan AA Vehicle (3134 Upgrade)","Partisan Air Defense Tank","Partisan Air Defense Tank (Cell)","Partisan Air Defense Tank (Company Command)","Partisan Air Defense Tank (Lance Command)","Partisan Air Defense Tank (LRM)","Partisan Air Defense Tank (Quad RAC)","Partisan Air Defense Tank (RAC)","Partisan Air Defense Tank (XL)","Partisan Heavy Tank","Partisan Heavy Tank (AC2)","Partisan Heavy Tank (C3)","Partisan Heavy Tank (Cell)","Partisan Heavy Tank (ELRM)","Partisan Heavy Tank (Light Gauss)","Partisan Heavy Tank (LRM)","Partisan Heavy Tank (Refit)","Partisan Hull Defense","Patton Tank","Patton Tank -SB","Patton Tank (Taurian)","Patton Tank (Ultra)","Patton Tank (XL)","Pegasus Scout Hover Tank","Pegasus Scout Hover Tank (3058 Upgrade)","Pegasus Scout Hover Tank (C3)","Pegasus Scout Hover Tank (Missile)","Pegasus Scout Hover Tank (MML)","Pegasus Scout Hover Tank (MRM)","Pegasus Scout Hover Tank (Sealed)","Pegasus Scout Hover Tank (Sensors)","Pegasus Scout Hover Tank (Unarmed)","Pegasus Scout Hover Tank (X-Pulse)","Pegasus Scout Hover Tank X","Peregrine Attack VTOL","Peregrine Attack VTOL (Cargo)","Peregrine Attack VTOL (Kurita)","Phalanx Support Tank","Phalanx Support Tank (Prototype)","Pike Support Vehicle","Pike Support Vehicle (AC5)","Pike Support Vehicle (Clan)","Pike Support Vehicle (LB-X)","Pike Support Vehicle (Missile)","Pike Support Vehicle (Plasma)","Pike Support Vehicle (RAC) \"Assault Pike\"","Pilum Heavy Tank","Pilum Heavy Tank (Arrow IV)","Pilum Heavy Tank (ELRM)","Pinto Attack VTOL","Pinto Attack VTOL (WoB)","Pixiu Heavy Tank","Plainsman Medium Hovertank","Plainsman Medium Hovertank (Scout)","Plainsman Medium Hovertank (Sealed)","Plainsman Medium Hovertank (Streak)","Po Heavy Tank","Po Heavy Tank (HV Prototype)","Po Heavy Tank (HV)","Po Heavy Tank (LB-X)","Po Heavy Tank (Light Gauss)","Po II Heavy Tank","Po II Heavy Tank (Arrow IV)","Po II Heavy Tank (Gauss)","Po II Heavy Tank (Stealth)","Pollux ADA Heavy Tank","Pollux II ADA Heavy Tank","Praetorian Mobile Strategic Command HQ","Predator Tank Destroyer","Predator Tank Destroyer (Elite)","Predator Tank Destroyer (Original)","Prowler Multi-Terrain Vehicle","Prowler Multi-Terrain Vehicle (3140 Upgrade)","Prowler Multi-Terrain Vehicle (ECM)","Prowler Multi-Terrain Vehicle (RAF)","Prowler Multi-Terrain Vehicle (Sealed)","Prowler Multi-Terrain Vehicle (Security)","Prowler Multi-Terrain Vehicle (Succession Wars)","Prowler Multi-Terrain Vehicle (Support)","Prowler Multi-Terrain Vehicle (WoB)","Puma Assault Tank PAT-005","Puma Assault Tank PAT-005b","Puma Assault Tank PAT-007","Puma Assault Tank PAT-008","Quaestor Mobile Tactical Command HQ","R10 Mechanized ICV (Coolant Truck)","R10 Mechanized ICV A","R10 Mechanized ICV B","R10 Mechanized ICV Prime","Ranger Armored Fighting Vehicle VV1","Ranger Armored Fighting Vehicle VV1 (Interdictor)","Ranger Armored Fighting Vehicle VV1 (MG)","Ranger Armored Fighting Vehicle VV2","Ranger Armored Fighting Vehicle VV22","Red Kite Attack VTOL","Regulator Hovertank","Regulator Hovertank (Alan)","Regulator Hovertank (Arrow IV)","Regulator Hovertank (RAC)","Regulator II Hovertank","Regulator II Hovertank (RAC)","Regulator II Hovertank (Stealth)","Rhino Fire Support Tank","Rhino Fire Support Tank (Flamer)","Rhino Fire Support Tank (Hagar)","Rhino Fire Support Tank (MG)","Rhino Fire Support Tank (ML)","Rhino Fire Support Tank (Royal)","Rhino Fire Support Tank (SL)","Rhino Fire Support Tank EC","Ripper Infantry Transport","Ripper Infantry Transport (ERML)","Ripper Infantry Transport (Infantry)","Ripper Infantry Transport (Light PPC)","Ripper Infantry Transport (MG)","Ripper Infantry Transport (Royal)","Ripper Infantry Transport (SPL)","Rommel Tank","Rommel Tank (Gauss)","Rommel Tank (Sealed)","Rommel Tank Howitzer","Rommel Tank Howitzer Prototype","Rotunda Scout Vehicle RND-J-1-11","Rotunda Scout Vehicle RND-J-1-11 (LRM)","Rotunda Scout Vehicle RND-J-1-11 (RL)","Rotunda Scout Vehicle RND-J-1-11 (SRM)","Sabaku Kaze Heavy Scout Hover Tank","Saladin Assault Hover Tank","Saladin Assault Hover Tank (Armor)","Saladin Assault Hover Tank (Clan Cargo)","Saladin Assault Hover Tank (LB-X)","Saladin Assault Hover Tank (Ultra)","Saladin Assault Hover Tank Ifrit","Saladin Mk II HCV","Saladin Mk II HCV (BC3)","Saracen Medium Hover Tank","Saracen Medium Hover Tank (MRM)","Saracen Mk II HCV","Saracen Mk II HCV (BC3)","Savannah Master Hovercraft","Savannah Master Hovercraft (Interdictor)","Savannah Master Hovercraft (Reflective)","Savannah Master Hovercraft (SL)","Saxon APC","Saxon APC (HQ)","Saxon APC (Laser)","Saxon APC (MASH)","Scapha Hovertank A","Scapha Hovertank B","Scapha Hovertank C","Scapha Hovertank D","Scapha Hovertank E","Scapha Hovertank F","Scapha Hovertank G","Scapha Hovertank H","Scapha Hovertank I","Scapha Hovertank J","Scapha Hovertank Prime","Schildkr\u00f6te Line Tank","Schildkr\u00f6te Line Tank (HPPC)","Schildkr\u00f6te Line Tank (Light Gauss)","Schildkr\u00f6te Line Tank (Plasma)","Schiltron Mobile Fire-Support Platform A","Schiltron Mobile Fire-Support Platform B","Schiltron Mobile Fire-Support Platform C","Schiltron Mobile Fire-Support Platform D","Schiltron Mobile Fire-Support Platform E","Schiltron Mobile Fire-Support Platform F","Schiltron Mobile Fire-Support Platform Prime","Schrek AC Carrier","Schrek AC Carrier (Lothian)","Schrek Gauss Carrier","Schrek II-X PPC Carrier","Schrek PPC Carrier","Schrek PPC Carrier (Anti-Infantry)","Schrek PPC Carrier (Armor)","Schrek PPC Carrier (C3M)","Schrek PPC Carrier (LB-X)","Schrek PPC Carrier (XL)","Scimitar Medium Hover Tank","Scimitar Medium Hover Tank (C3)","Scimitar Medium Hover Tank (Missile)","Scimitar Medium Hover Tank (TAG)","Scimitar Mk II HCV","Scimitar Mk II HCV (3136 Upgrade)","Scimitar Mk II HCV (BC3)","Scorpion Light Tank","Scorpion Light Tank (Armor)","Scorpion Light Tank (Hardened)","Scorpion Light Tank (LAC)","Scorpion Light Tank (LRM)","Scorpion Light Tank (Minesweeper Prototype)","Scorpion Light Tank (Minesweeper)","Scorpion Light Tank (ML)","Scorpion Light Tank (MRM)","Scorpion Light Tank (RAC)","Scorpion Light Tank (Rifle)","Scorpion Light Tank (SRM)","Scorpion Light Tank (Thunderbolt)","Scorpion Light Tank (Ultra)","Scorpion Light Tank C","Sea Hunter Maritime Tank","Sekhmet Assault Vehicle","Sekhmet Assault Vehicle (Streak)","Shamash Reconnaissance Vehicle","Shamash Reconnaissance Vehicle (Flamer)","Shamash Reconnaissance Vehicle (Interdictor)","Shandra Advanced Scout Vehicle","Shandra Advanced Scout Vehicle (Original)","Sheriff Infantry Support Tank","Shillelagh Missile Tank","Shillelagh Missile Tank (Original)","Shoden Assault Vehicle","Shoden Assault Vehicle (LB-X)","Shoden Assault Vehicle (Streak)","Shun Transport VTOL","Shun Transport VTOL (Support)","Skadi Swift Attack VTOL","Skanda Light Tank","Skanda Light Tank (TSEMP)","Skimmer","Skulker Wheeled Scout Tank","Skulker Wheeled Scout Tank (C3M)","Skulker Wheeled Scout Tank (MG)","Skulker Wheeled Scout Tank (SRM)","Skulker Wheeled Scout Tank C","Skulker Wheeled Scout Tank Mk. II","Skulker Wheeled Scout Tank X-5","Sleipnir APC Tank","Sleipnir APC Tank (SRM)","SM Tank Destroyer SM1","SM Tank Destroyer SM1 \"Telos\"","SM Tank Destroyer SM1A","SM Tank Destroyer SM1B","SM Tank Destroyer SM3","SM2 Heavy Artillery Vehicle","SM2 Heavy Artillery Vehicle (LTC)","SM5 Field Commander (Prototype) Prime","Sniper Artillery","\u015eoarece Superheavy MBT","Sokar Urban Combat Tank","Sortek Assault Craft","Sortek Assault Craft (Interdictor)","Sprint Scout Helicopter","Sprint Scout Helicopter (C3)","Sprint Scout Helicopter (C3i)","Sprint Scout Helicopter (Interdictor)","Sprint Scout Helicopter (Laser)","Sprint Scout Helicopter (Troop Transport)","SRM Carrier","SRM Carrier (3054 Upgrade)","SRM Carrier (C3)","SRM Carrier (WoB)","SRM Carrier C","Striker Light Tank","Striker Light Tank \"Wet Striker\"","Striker Light Tank (3053 Upgrade)","Striker Light Tank (3061 Upgrade)","Striker Light Tank (Ammo)","Striker Light Tank (Laser)","Striker Light Tank (LRM)","Striker Light Tank (Narc)","Striker Light Tank (Sealed)","Striker Light Tank (SRM)","Striker Light Tank (Stealth)","Strix Stealth VTOL","SturmFeur \"Kalki\" Cruise Missile Launcher  ","SturmFeur Heavy Tank","SturmFeur Heavy Tank (Assault)","SturmFeur Heavy Tank (Cell)","SturmFeur Heavy Tank (Heavy Gauss)","SturmFeur Heavy Tank (SRM)","SturmFeur Heavy Tank (Steiner)","SturmFeur Heavy Tank (Support) \"Gilmore\"","SturmFeur Heavy Tank (WoB)","Stygian Strike Tank","Stygian Strike Tank (Armor)","Stygian Strike Tank (WoB)","Svantovit Infantry Fighting Vehicle","Svantovit Infantry Fighting Vehicle (ATM) \"Masada\"","Svantovit Infantry Fighting Vehicle (Original)","Swift Wind Scout Car","Swift Wind Scout Car (ICE - Cargo)","Swift Wind Scout Car (ICE - Speed)","Swift Wind Scout Car (ICE)","Tamerlane Strike Sled","Tamerlane Strike Sled (Flamer)","Tamerlane Strike Sled (RL)","Tamerlane Strike Sled 2","Tenmaku Command Trailer","Tepp\u014d Artillery Vehicle","Testudo Siege Tank","Thang-Ta APC","Thor Artillery Vehicle","Thor Artillery Vehicle (AC)","Thor Artillery Vehicle (C3i)","Thor Artillery Vehicle (Clan)","Thumper Artillery Vehicle","Thumper Artillery Vehicle (Angel)","Thumper Artillery Vehicle Maxwell","Thumper Artillery Vehicle TAV-1","Thumper Artillery Vehicle TAV-2","Tiger Medium Tank (Prototype)","Tiger Medium Tank T-12","Tokugawa Heavy Tank","Tokugawa Heavy Tank (C3)","Tokugawa Heavy Tank (MRM)","Tokugawa Heavy Tank (SD2)","Tokugawa Heavy Tank (Streak)","Tokugawa Heavy Tank TKG-150","Tokugawa Heavy Tank TKG-151","Tokugawa Heavy Tank Yumi","Trajan Assault Infantry Fighting Vehicle","Trajan Assault Infantry Fighting Vehicle (ICE)","Transportable Field Repair Unit JI-100","Tribune Mobile Tactical Command HQ","Tufana Hovercraft","Tufana Hovercraft (iNarc)","Turhan Urban Combat Vehicle","Turhan Urban Combat Vehicle (C3)","Turhan Urban Combat Vehicle (Original)","Typhoon Urban Assault Vehicle","Typhoon Urban Assault Vehicle (LB-X)","Typhoon Urban Assault Vehicle (RAC)","Typhoon Urban Assault Vehicle (Tracked)","Tyr Infantry Support Tank","Tyr Infantry Support Tank (Kurita)","Vali Artillery Vehicle","Vargr APC Tank","Vargr APC Tank (LRM)","Vector Combat Support VTOL","Vector Combat Support VTOL (Attack)","Vector Combat Support VTOL (EW)","Vector Combat Support VTOL (Scout)","Vedette Medium Tank","Vedette Medium Tank \"Doris' Delight\"","Vedette Medium Tank (AC/10)","Vedette Medium Tank (AC2)","Vedette Medium Tank (Armor)","Vedette Medium Tank (Cell)","Vedette Medium Tank (LB-X)","Vedette Medium Tank (Liao)","Vedette Medium Tank (Light Gauss)","Vedette Medium Tank (NETC)","Vedette Medium Tank (RAC)","Vedette Medium Tank (Ultra)","Vedette Medium Tank V-G7X","Vedette Medium Tank V7","Vedette Medium Tank V9","Vidar Heavy Defense Tank","Von Luckner Heavy Tank (Royal)","Von Luckner Heavy Tank (Star League)","Von Luckner Heavy Tank VNL-K100","Von Luckner Heavy Tank VNL-K65N","Von Luckner Heavy Tank VNL-K65W","Von Luckner Heavy Tank VNL-K70","Von Luckner Heavy Tank VNL-K75N","Von Luckner Heavy Tank VNL-K85N","Von Luckner Heavy Tank VNL-K90","Von Luckner Heavy Tank VNL-X71 (Yakuza)","Warrior Attack Helicopter H-10","Warrior Attack Helicopter H-7","Warrior Attack Helicopter H-7A","Warrior Attack Helicopter H-7C","Warrior Attack Helicopter H-7F","Warrior Attack Helicopter H-8","Warrior Attack Helicopter H-9","Warrior Attack Helicopter HX-9","Warrior Stealth Helicopter S-9","Weapons/Troop Carrier (LRM)","Wheeled Scout","Wheeled Scout (Camera)","Wheeled Scout (Sensors)","Whirlwind Scout Hover Tank","Whirlwind Scout Hover Tank (AAA)","Whirlwind Scout Hover Tank (IFV)","Winston Combat Vehicle","Winston Combat Vehicle (LAC)","Winston Combat Vehicle (Support)","Winston Combat Vehicle (TSEMP)","Winston Combat Vehicle (XXL)","Winterhawk APC","Yasha VTOL","Yasha VTOL \"Spectre\"","Yasha VTOL (Interdictor)","Yellow Jacket Gunship","Yellow Jacket Gunship (Ammo)","Yellow Jacket Gunship (Arrow IV)","Yellow Jacket Gunship (PPC)","Yellow Jacket Gunship (RAC)","Zahn Heavy Transport","Zephyr Hovertank","Zephyr Hovertank (C3i)","Zephyr Hovertank (LRM)","Zephyr Hovertank (OmniDrone) A","Zephyr Hovertank (OmniDrone) B","Zephyr Hovertank (OmniDrone) C","Zephyr Hovertank (OmniDrone) Prime","Zephyr Hovertank (Royal)","Zephyr Hovertank (SRM2)","Zephyr Hovertank EC","Zephyros Infantry Support Vehicle","Zephyros Infantry Support Vehicle (Dual Turret)","Zhukov Heavy Tank","Zhukov Heavy Tank (LB-X)","Zhukov Heavy Tank (Liao)","Zhukov Heavy Tank (WoB)","Zibler Fast Strike Tank A","Zibler Fast Strike Tank B","Zibler Fast Strike Tank C","Zibler Fast Strike Tank D","Zibler Fast Strike Tank Prime","Zorya Light Tank","Zorya Light Tank (Ammo)","Zorya Light Tank (ATM)"]},"Common":{"rows":[102,104,106,107,135,137,138,139,142,195,201,202,204,205,210,212,236,237,239,271,273,276,277,285,286,289,294,295,299,338,339,343,344,423,432,437,452,453,455,461,462,493,500,502,503,569,570,571,572,590,594,595,598,627,655,661,662,694,695,696,698,745,747,748,749,750,751,752,754,766,768,769,770,866,867,868,869,896,898,900,905,948,949,951,952,976,977,978,980,994,995,996,998,1061,1065,1066,1072,1080,1082,1083,1084,1088,1090,1091,1092],"dict":["!"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"Class":{"dict":["AC/2 Carrier","Aeron Strike VTOL","Aesir Medium AA Vehicle","Aithon Assault Transport","Ajax Assault Tank","Alacorn Heavy Tank","Anat APC","Anhur","Anhur Transport","Ares Medium Tank","Armored Personnel Carrier","Arrow IV Assault Vehicle","Arrow IV Carrier","Asshur Artillery Spotter","Asshur Fast Reconnaissance Vehicle","Athena Combat Vehicle","Axel Heavy Tank IIC","Axel Heavy Tank","Badger (C) Tracked Transport","Badger Tracked Transport","Balac Strike VTOL","Ballista Artillery Trailer","Ballista Self-Propelled Artillery Tank","Bandit (C) Hovercraft","Bandit Hovercraft","Bandit Hovercraft Mk. II","Bardiche Heavy Strike Tank","BattleMech Recovery Vehicle","Beagle Hover Scout","Behemoth Heavy Tank","Behemoth II Heavy Tank","Bellona Hover Tank","Blizzard Hover Transport","Bokkusu Support Trailer","Bolla Stealth Tank (RotS)","Bolla Stealth Tank","Browning Mobile Headquarters","Brutus Assault Tank","Bulldog Medium Tank","Bulwark Assault Vehicle","Burke Defense Tank","Burke II Superheavy Tank","Buzzard Hover Tank","Cardinal Transport","Carnivore Assault Tank","Cavalry Attack Helicopter","Centipede Scout Car","Chalchiuhtotolin Support Tank","Challenger MBT","Chaparral Missile Artillery Tank","Chevalier Light Tank","Cizin Hover Tank","Cobra Transport VTOL","Command Van","Condor Heavy Hover Tank","Condor Heavy Hover Tank (Upgrade)","Condor Multi-Purpose Tank","Coolant Truck","Crane Heavy Transport","Crow Scout Helicopter","Cyrano Gunship","Daimyo HQ","Danai Support Vehicle","Darter Scout Car","Demolisher Heavy Tank","Demolisher II Heavy Tank","Demon Medium Tank","Demon Tank","Desert Scorpion Light Tank","Destrier Siege Vehicle","Devastator Heavy Tank","Devastator II Superheavy Tank","DI Morgan Assault Tank","DI Multipurpose Light VTOL","DI Schmitt Tank","Diggs Drone Control Tank","Donar Assault Helicopter","Drillson Heavy Hover Tank","Eldingar Hover Sled","Engineering Vehicle","Enyo Strike Tank","Epona Pursuit Tank","Eurus MBT","Falcon Hover Tank","Fensalir Combat WiGE","Ferret Light Scout VTOL","Flatbed Truck","Fortune Wheeled Assault Vehicle","Fox Armored Car","Fulcrum Heavy Hover Tank","Fulcrum Heavy Hovertank","Fury Command Tank","Gabriel Reconnaissance Hovercraft","Gallant Urban Assault Tank","Galleon Light Tank","Garrot Superheavy Transport","Garuda Heavy VTOL","Giggins APC","Gladius Medium Hover Tank","Gladius Medium Hovertank","Glaive Medium Tank","Glory Heavy Fire Support Vehicle","Goblin II Infantry Support Vehicle","Goblin III Infantry Support Vehicle","Goblin Infantry Support Vehicle","Goblin Medium Tank","Gossamer VTOL","Gulltoppr OmniMonitor","Gun Trailer","G\u00fcrteltier MBT","Gurzil Support Tank","Hachiman Fire Support Tank","Hadur Fast Support Vehicle","Hanse MBT","Harasser Laser Platform","Harasser Missile Platform","Harrier Heavy Hover Tank","Hasek Mechanized Combat Vehicle","Hawk Hover Tank","Hawk Moth Gunship","Hawk Moth II Gunship","Heavy BattleMech Recovery Vehicle","Heavy Hover APC","Heavy LRM Carrier","Heavy MML Carrier","Heavy NLRM Carrier","Heavy Tracked APC","Heavy Weapons Carrier","Heavy Wheeled APC","Heimdall Ground Monitor Tank","Hephaestus Jump Tank","Hephaestus Scout Tank","Hetzer Wheeled Assault Gun","Hexareme HQ Hovercraft","Hi-Scout Drone Carrier","Hipparch Cavalry Tank","Huitzilopochtli Assault Tank \"Huey\"","Hunter Light Support Tank","Ignis Infantry Support Tank","Indra Infantry Transport","Ishtar Heavy Fire Support Tank","J-27 Ordnance Transport","J-27 Ordnance Transport Trailer","J. Edgar Light Hover Tank","Jagdpanzer II","JES I Tactical Missile Carrier","JES II Strategic Missile Carrier","JES III Missile Carrier","JI2A1 Attack APC","Joust Medium Tank","Kalki Cruise Missile Launcher","Kamakiri Attack VTOL","Kamisori Light Tank","Kanga Medium Hovertank","Kanga-X Jump Tank","Karnov UR Gunship","Karnov UR Transport","Kelswa Assault Tank","Kestrel VTOL","Kinnol MBT","Kite Reconnaissance Vehicle","Kokou Defense Tank","Korvin Tank","Kruger Combat Car","Ku Wheeled Assault Tank","Lamprey Transport Helicopter","Laser Carrier","Light SRM Carrier","Light Thunderbolt Carrier","Lightning Attack Hovercraft","LRM Carrier","Luduan Scout Vehicle","M.A.S.H. Truck","Magi Infantry Support Vehicle","Main Gauche Light Support Tank","Mamono IFV","Manteuffel Attack Tank","Manticore Heavy Tank","Manticore II Heavy Tank","Mantis Light Attack VTOL","Marksman Artillery Vehicle","Marksman MBT","Mars Assault Vehicle","Marsden MBT","Marten Scout VTOL","Maultier Hover APC","Maxim (I) Heavy Hover Transport","Maxim Flanker","Maxim Heavy Hover Transport","Maxim Mk II Transport","Merkava Heavy Tank","MHI Amphibious APC","MHI Defense AA Tank","Minion Advanced Tactical Vehicle","MIT 23 MASH Vehicle","MIT 24 MASH Vehicle","Mithras Light Tank","Mobile Headquarters","Mobile Long Tom Artillery","Moltke MBT","Morningstar City Command Vehicle","Morrigu Fire Support Vehicle","Mortar Carrier","MRM Carrier","Musketeer Hover Tank","Myrmidon Medium Tank","Nacon Armored Scout","Narukami Heavy Tank","Nightshade ECM VTOL","Nuberu Anti-Aircraft Tank","Odin Scout Tank","Ontos Heavy Tank","Onuris Attack VTOL","Oro Heavy Tank","Packrat LRPV","Padilla Anti-Missile Tank","Padilla Heavy Artillery Tank","Padilla Tube Artillery Tank","Paladin Defense System","Palmoni Assault Infantry Fighting Vehicle","Partisan AA Vehicle","Partisan Air Defense Tank","Partisan Heavy Tank","Partisan Hull Defense","Patton Tank","Pegasus Scout Hover Tank","Peregrine Attack VTOL","Phalanx Support Tank","Pike Support Vehicle","Pilum Heavy Tank","Pinto Attack VTOL","Pixiu Heavy Tank","Plainsman Medium Hovertank","Po Heavy Tank","Po II Heavy Tank","Pollux ADA Heavy Tank","Pollux II ADA Heavy Tank","Praetorian Mobile Strategic Command HQ","Predator Tank Destroyer","Prowler Multi-Terrain Vehicle","Puma Assault Tank","Quaestor Mobile Tactical Command HQ","R10 Mechanized ICV","Ranger Armored Fighting Vehicle","Red Kite Attack VTOL","Regulator Hovertank","Regulator II Hovertank","Rhino Fire Support Tank","Ripper Infantry Transport","Rommel Tank","Rotunda Scout Vehicle","Sabaku Kaze Heavy Scout Hover Tank","Saladin Assault Hover Tank","Saladin Mk II HCV","Saracen Medium Hover Tank","Saracen Mk II HCV","Savannah Master Hovercraft","Saxon APC","Scapha Hovertank","Schildkr\u00f6te Line Tank","Schiltron Mobile Fire-Support Platform","Schrek AC Carrier","Schrek Gauss Carrier","Schrek II-X PPC Carrier","Schrek PPC Carrier","Scimitar Medium Hover Tank","Scimitar Mk II HCV","Scorpion Light Tank","Sea Hunter Maritime Tank","Sekhmet Assault Vehicle","Shamash Reconnaissance Vehicle","Shandra Advanced Scout Vehicle","Sheriff Infantry Support Tank","Shillelagh Missile Tank","Shoden Assault Vehicle","Shun Transport VTOL","Skadi Swift Attack VTOL","Skanda Light Tank","Skimmer","Skulker Wheeled Scout Tank","Skulker Wheeled Scout Tank Mk. II","Sleipnir APC Tank","SM Tank Destroyer","SM2 Heavy Artillery Vehicle","SM5 Field Commander (Prototype)","Sniper Artillery","\u015eoarece Superheavy MBT","Sokar Urban Combat Tank","Sortek Assault Craft","Sprint Scout Helicopter","SRM Carrier","Striker Light Tank","Strix Stealth VTOL","SturmFeur \"Kalki\" Cruise Missile Launcher","SturmFeur Heavy Tank","Stygian Strike Tank","Svantovit Infantry Fighting Vehicle","Swift Wind Scout Car","Tamerlane Strike Sled","Tenmaku Command Trailer","Tepp\u014d Artillery Vehicle","Testudo Siege Tank","Thang-Ta APC","Thor Artillery Vehicle","Thumper Artillery Vehicle","Tiger Medium Tank","Tokugawa Heavy Tank","Trajan Assault Infantry Fighting Vehicle","Transportable Field Repair Unit","Tribune Mobile Tactical Command HQ","Tufana Hovercraft","Turhan Urban Combat Vehicle","Typhoon Urban Assault Vehicle","Tyr Infantry Support Tank","Vali Artillery Vehicle","Vargr APC Tank","Vector Combat Support VTOL","Vedette Medium Tank","Vidar Heavy Defense Tank","Von Luckner Heavy Tank","Warrior Attack Helicopter","Warrior Stealth Helicopter","Weapons/Troop Carrier","Wheeled Scout","Whirlwind Scout Hover Tank","Winston Combat Vehicle","Winterhawk APC","Yasha VTOL","Yellow Jacket Gunship","Zahn Heavy Transport","Zephyr Hovertank","Zephyr Hovertank (OmniDrone)","Zephyros Infantry Support Vehicle","Zhukov Heavy Tank","Zibler Fast Strike Tank","Zorya Light Tank"],"values":[0,0,1,1,2,2,3,4,4,4,4,4,4,5,5,5,5,5,5,6,7,8,8,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,11,12,13,14,14,15,15,15,16,16,17,17,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,20,20,20,20,21,22,23,23,23,23,23,23,23,23,23,24,24,24,24,24,24,24,24,24,24,25,24,26,26,26,27,28,28,28,28,28,29,29,29,29,29,29,29,29,30,30,31,31,31,32,32,32,33,34,34,34,34,34,35,35,35,35,36,36,37,37,37,37,37,38,38,38,38,38,38,38,38,39,39,40,40,40,41,42,43,43,44,44,44,45,45,45,45,45,45,45,45,46,46,46,46,47,47,47,47,48,48,48,48,48,48,49,49,49,49,49,50,50,50,50,51,51,52,52,52,52,53,53,53,54,54,54,54,54,54,54,54,54,54,55,55,54,56,56,57,57,57,58,59,59,59,59,60,60,60,60,60,61,61,61,61,62,62,63,63,63,63,63,63,64,64,64,64,64,64,64,64,65,65,65,65,66,66,66,67,67,67,67,67,67,68,69,70,71,72,72,72,73,73,74,74,75,76,76,76,77,77,77,77,77,77,77,77,78,78,78,79,79,79,80,80,80,80,81,81,81,81,81,81,82,82,82,82,82,83,84,85,85,85,85,86,86,86,86,86,86,87,87,87,88,88,88,88,89,90,90,90,90,91,91,91,91,91,91,91,91,91,92,92,92,93,94,94,94,94,94,94,94,94,94,94,94,94,94,94,95,96,97,97,98,99,100,100,101,101,101,101,102,103,104,104,105,105,105,105,105,106,106,107,107,107,108,108,108,108,108,108,108,108,108,108,109,109,110,111,111,112,112,112,113,114,115,115,115,115,115,115,115,115,115,115,115,115,115,116,116,116,117,118,119,119,119,119,120,120,120,121,122,122,122,122,122,123,123,124,125,126,126,126,126,127,128,128,128,128,128,129,129,129,129,129,130,131,131,131,131,131,132,132,132,132,132,132,132,132,132,132,133,134,134,135,136,136,136,136,137,137,137,137,137,137,137,137,137,137,138,138,139,139,140,140,140,141,141,141,141,142,143,143,143,143,143,143,143,143,143,143,143,144,145,145,146,146,146,147,147,147,147,147,148,148,149,149,150,151,151,152,152,152,152,152,153,153,154,155,156,156,156,156,156,156,156,156,157,158,158,158,158,158,158,158,159,159,159,160,160,161,161,162,163,163,164,164,165,166,167,168,169,169,169,169,169,169,170,170,170,170,171,172,172,172,173,173,174,174,174,174,175,176,176,176,176,176,176,177,177,177,177,177,177,177,177,177,177,178,179,179,180,180,180,181,181,181,182,182,182,182,183,183,183,184,184,185,185,185,185,185,185,186,186,187,188,188,188,188,188,188,188,188,188,188,188,188,189,189,189,190,190,191,192,193,193,193,193,193,194,195,196,196,197,197,197,197,197,197,198,198,198,199,199,199,200,200,200,200,201,201,201,202,203,204,204,204,205,205,205,205,206,207,207,208,208,208,208,208,209,210,210,211,211,211,211,211,211,211,211,211,211,212,212,212,212,212,212,213,213,214,214,214,214,214,215,216,216,217,217,217,217,218,219,220,220,221,221,221,221,221,221,221,221,222,222,222,222,222,222,222,222,223,224,224,224,224,224,225,225,225,225,225,225,225,225,225,225,225,226,226,226,227,227,228,228,228,228,228,228,228,229,229,229,230,230,231,232,232,232,232,233,233,233,233,233,234,234,234,234,235,236,237,238,238,238,239,239,239,239,239,239,239,239,239,240,240,240,240,241,242,242,242,242,243,243,243,243,243,244,245,245,245,245,246,246,246,247,247,247,247,247,247,247,247,248,248,248,248,248,248,248,249,249,249,249,249,250,250,250,250,251,252,252,252,252,252,252,253,253,254,254,255,255,256,256,256,256,257,257,257,257,258,258,258,258,258,258,258,258,258,258,258,259,259,259,259,260,260,260,260,260,260,260,261,261,262,263,264,264,264,264,264,264,265,265,265,265,266,266,266,267,267,267,267,267,267,267,267,267,267,267,267,267,267,267,268,269,269,270,270,270,271,271,272,273,273,274,274,274,275,275,276,277,277,278,279,279,279,279,279,280,279,281,281,282,282,282,282,282,283,283,284,285,286,287,288,288,289,289,289,289,289,289,290,290,290,290,290,291,291,291,291,291,291,291,291,291,291,291,292,293,294,294,294,294,294,294,294,294,295,295,295,296,296,296,297,297,297,297,298,298,298,298,299,300,301,302,303,303,303,303,304,304,304,304,304,305,305,306,306,306,306,306,306,306,306,307,307,308,309,310,310,311,311,311,312,312,312,312,313,313,314,315,315,316,316,316,316,317,317,317,317,317,317,317,317,317,317,317,317,317,317,317,318,319,319,319,319,319,319,319,319,319,319,320,320,320,320,320,320,320,320,321,322,323,323,323,324,324,324,325,325,325,325,325,326,327,327,327,328,328,328,328,328,329,330,330,330,331,331,331,331,330,330,330,332,332,333,333,333,333,334,334,334,334,334,335,335,335]},"Model":{"dict":["(LB-X)","(BAP)","(HAG)","(Sealed)","A","B","C","D","Prime","Mk. I","Mk. II","Mk. III","Mk. IV","Mk. VI","Mk. VII","(P-Stealth)","(BA)","(Plasma)","(Hover LRM)","(Hover MG)","(Hover Sensors)","(Hover SRM)","(Hover)","(Tracked LRM)","(Tracked MG)","(Tracked SRM)","(Tracked)","(Wheeled LRM)","(Wheeled MG)","(Wheeled SRM)","(Wheeled)","(Proto AC)","XR","(XL)","Mk 1","Mk 2","E","F","H","G","(Hybrid)","(LRM)","(Spotter)","\"Warthog\"","I","(Minesweeper)","(C3i)","(LRRP)","(TAG)","(Armor)","(Davion)","(Flamer)","(Kurita Upgrade)","(Kurita)","(Liao)","(Refit)","(Support)","(Laser)","\"Black Blizzard\"","(SRM)","Comminus","Dominus","Infernus","Invictus","(Half-Track)","(HPPC)","(PPC 2)","(PPC)","(AC2)","(Cell)","(Chemical)","(ERLL)","(Original)","(Royal)","(RAF)","(Second Line)","(Infantry)","(Infiltrator)","Cadence Rain","Commando","(Bombast Laser)","(Chemical Laser)","Mk. XV","X","XI","XII","XIVs","XVc","(CASE)","(ERML)","(MG)","(MML)","(Speed)","(Command)","(MASH)","(ICE)","(Q-Vehicle)","(Fission)","(Fusion)","(LAC)","(Laser Upgrade)","(Ultra)","(Reactive)","135-K \"Lifesaver\"","\"Dragonfly\"","(C3)","(Export)","(ML)","Fury","67-K","67-K2","67-NC","67-R","(Arrow)","(ECM)","(SRM2)","(Arrow IV)","(Clan)","(Defensive)","(Gauss)","(MRM)","(Reinforced)","(Thunderbolt)","II-X","(Rifle)","(HGR)","(Horned Demon)","CX-2","(Gunship)","(Targeting Computer)","(Close Support)","(Recon)","(Streak)","C 2","(HMMHV) \"HumHov\"","(AC)","(ER Pulse)","(LB-X) \"Sholef\"","\"Fermi\"","(Armor) \"Wild Weasel\"","(Cargo)","(Mortar)","(RL)","(C3M)","(Interdictor)","(VSP)","II","III","(C3S)","(Fury II)","(Fury III)","(Fury IIIm)","CX-17","(ERSL)","(TDF)","GAL-100","GAL-102","GAL-103","GAL-104","GAL-105","GAL-106","GAL-106M","GAL-200","GAL-200 (RL)","GAL-200R","GAL-201","GAL-300","Maxwell","(Fire Support)","(MFB)","(3090 Upgrade)","(Light Gauss)","(Ambush)","(Artillery/AAA)","(Mjolnir)","(SC)","(Siege)","(Stronghold)","(Thumper)","(AAA)","\"Leaping Lisa\"","\"Mini-Peggy\"","(Fuel Cell)","(Heavy Ferro)","(iNarc)","(LFE)","(Marian)","(Re-Laser)","(LTV-4)","\"Verwandlung\"","(Sniper)","(Scout Tank)","(EN Variant)","(WoB)","(AC10)","(Scout)","\"Cunnington\"","\"Assault Hunter\"","(3054 Upgrade)","(Ammo)","(Amphibious)","(LPL)","(LRM10)","(LRM15)","K-27 \"Killjoy\"","(Light PPC)","(X-Pulse)","(3082 Upgrade)","BE700","BE701","(Gauss) \"Shi Kamakiri\"","R","(3055 Upgrade)","(Artillery)","(BA Stealth)","(Heavy Stealth)","(Periphery)","(MedEvac)","(SL)","(RAC)","KRV-3","(IFV) \"Turhan II\"","CX-3","(AMS)","(UCSV)","(IFV)","\"The Ballista\"","EC","(ECCM)","M1","M1A","M1J","(ATM)","II-A","II-A (LB-X)","(Basic)","(Intermediate)","(Company Command)","(3052 Upgrade)","(Anti-Infantry)","(BA Factory Upgrade)","(BA Field Upgrade)","(Escort)","(SRM4)","(Infantry Support) \"Shiloh\"","Mk IX","Mk VIII","\"Silver Bullet\"","(Gauss) \"Sandblaster\"","(ICE - LL)","(ICE - LRM)","(LL)","LT-MOB-25","LT-MOB-25F","LT-MOB-95","M2","M3","(HPG)","(3080 Upgrade)","P (Tate)","Type 2","NK-1C","NK-BC3","(3053 Upgrade)","HEAT","X All-Aspect Assault Tank","\"Gespenst\"","PKR-T5","PKR-T5 (ICE)","PKR-T5 (ML)","PKR-T5 (SRM2)","(LTC)","(3134 Upgrade)","(Lance Command)","(Quad RAC)","(ELRM)","-SB","(Taurian)","(3058 Upgrade)","(Missile)","(Sensors)","(Unarmed)","(Prototype)","(AC5)","(RAC) \"Assault Pike\"","(HV Prototype)","(HV)","(Stealth)","(Elite)","(3140 Upgrade)","(Security)","(Succession Wars)","PAT-005","PAT-005b","PAT-007","PAT-008","(Coolant Truck)","VV1","VV1 (Interdictor)","VV1 (MG)","VV2","VV22","(Alan)","(Hagar)","(SPL)","Howitzer","Howitzer Prototype","RND-J-1-11","RND-J-1-11 (LRM)","RND-J-1-11 (RL)","RND-J-1-11 (SRM)","(Clan Cargo)","Ifrit","(BC3)","(Reflective)","(HQ)","J","(Lothian)","(3136 Upgrade)","(Hardened)","(Minesweeper Prototype)","(TSEMP)","X-5","SM1","SM1 \"Telos\"","SM1A","SM1B","SM3","(Troop Transport)","\"Wet Striker\"","(3061 Upgrade)","(Narc)","(Assault)","(Heavy Gauss)","(Steiner)","(Support) \"Gilmore\"","(ATM) \"Masada\"","(ICE - Cargo)","(ICE - Speed)","2","(Angel)","TAV-1","TAV-2","T-12","(SD2)","TKG-150","TKG-151","Yumi","JI-100","(Attack)","(EW)","\"Doris' Delight\"","(AC/10)","(NETC)","V-G7X","V7","V9","(Star League)","VNL-K100","VNL-K65N","VNL-K65W","VNL-K70","VNL-K75N","VNL-K85N","VNL-K90","VNL-X71 (Yakuza)","H-10","H-7","H-7A","H-7C","H-7F","H-8","H-9","HX-9","S-9","(Camera)","(XXL)","\"Spectre\"","(Dual Turret)"],"values":[null,0,null,1,null,2,null,3,4,5,6,7,8,9,10,11,12,13,14,null,15,null,16,null,17,18,19,20,21,22,23,24,25,26,27,28,29,30,null,null,null,null,31,null,2,32,null,33,34,35,4,5,6,7,36,37,38,8,4,5,6,7,36,37,39,8,null,40,41,42,null,null,4,5,6,7,36,37,39,38,8,43,4,5,6,7,36,37,39,38,44,null,8,null,45,6,null,null,46,47,3,48,null,49,50,51,52,53,54,55,null,56,null,57,33,null,58,59,null,4,5,6,7,8,60,61,62,63,null,64,null,65,41,66,67,null,68,69,70,71,0,41,17,null,72,null,65,73,null,null,null,74,null,2,75,null,16,76,77,41,59,48,78,null,59,48,79,null,80,81,33,82,83,84,85,86,87,null,88,89,90,59,null,1,91,92,null,56,null,93,94,72,null,95,96,null,50,97,51,98,99,100,57,54,101,null,57,6,null,102,22,26,103,null,null,104,105,106,null,107,17,73,108,109,110,111,112,null,113,null,1,105,114,59,115,116,69,117,118,119,120,121,10,null,91,122,123,null,49,124,null,125,126,67,73,127,null,null,null,null,null,119,41,null,128,null,129,null,null,130,131,null,71,91,3,59,132,6,133,null,134,132,null,135,51,null,136,137,32,4,5,6,7,36,8,4,5,6,7,8,null,null,null,138,139,140,null,49,41,141,142,59,null,143,122,null,51,144,145,40,null,146,147,83,null,143,148,149,150,151,72,73,152,null,153,154,null,6,155,156,157,158,159,160,161,162,163,164,165,166,167,null,null,null,168,10,null,null,169,null,170,116,171,null,null,null,3,null,41,90,59,83,null,33,4,5,8,172,173,41,174,175,176,177,178,122,101,null,143,null,null,179,null,41,102,null,null,null,180,181,51,182,183,184,185,41,186,91,92,122,null,67,187,null,188,null,189,49,122,null,91,190,null,null,41,90,191,59,null,192,null,null,null,41,90,59,67,null,41,90,59,193,4,5,6,7,8,null,4,5,6,7,8,null,194,69,57,0,41,195,3,59,6,null,null,196,null,null,179,41,132,null,197,198,199,200,69,71,201,202,203,null,59,null,16,null,119,72,null,49,98,204,null,null,69,70,51,95,53,99,205,90,48,206,null,null,207,null,199,56,null,105,91,92,122,null,91,208,209,null,null,210,4,5,6,8,211,null,135,null,null,null,212,135,213,214,16,215,216,null,null,117,217,107,195,218,59,null,67,219,null,98,null,33,220,null,72,null,221,null,null,null,null,null,89,153,142,73,222,null,212,193,6,null,null,223,95,null,224,null,105,225,33,null,4,5,6,7,36,8,null,226,212,143,148,65,0,219,33,227,null,null,228,null,135,205,229,230,231,null,232,2,33,146,233,234,null,76,null,16,235,98,236,90,null,237,null,null,238,239,240,241,143,148,117,242,168,115,243,null,114,244,245,246,null,null,null,247,248,48,129,null,null,null,71,null,249,250,95,251,41,252,253,254,229,255,256,null,237,257,57,null,2,57,null,null,null,258,49,null,239,259,260,null,261,262,null,49,99,205,73,null,null,42,null,263,81,98,171,41,91,3,264,265,4,5,6,7,36,8,null,2,266,267,268,269,270,null,null,41,null,223,271,178,null,null,null,272,null,69,237,273,41,274,219,33,null,68,105,69,275,171,41,55,null,null,276,277,101,33,null,278,105,279,91,120,3,280,281,206,83,null,140,53,null,282,null,283,117,0,279,17,284,null,116,275,null,193,null,null,195,3,132,null,285,286,0,171,null,116,119,287,null,null,null,null,288,72,null,289,114,74,3,290,291,56,193,292,293,294,295,null,296,4,5,8,297,298,299,300,301,null,null,302,116,219,null,219,287,null,51,303,90,107,73,218,227,null,89,76,205,90,73,304,null,119,3,305,306,307,308,309,310,null,null,49,311,0,101,312,null,313,null,120,null,313,null,144,314,218,null,315,57,94,4,5,6,7,36,37,39,38,44,316,8,null,65,171,17,4,5,6,7,36,37,8,null,317,null,null,null,239,49,143,0,33,null,105,279,48,null,318,313,null,49,319,99,41,320,45,107,120,219,124,59,122,101,6,null,null,132,null,51,144,null,72,null,null,72,null,0,132,null,56,null,null,321,null,null,143,90,59,6,null,322,null,59,323,324,325,326,327,null,271,8,null,null,null,null,144,null,105,46,144,57,328,null,198,105,193,6,null,329,263,330,199,57,41,331,3,59,287,null,null,null,332,69,333,59,334,335,193,null,49,193,null,336,72,null,337,338,95,null,51,142,339,null,null,null,null,null,135,46,117,null,340,167,341,342,282,343,null,105,120,344,132,345,346,347,null,95,348,null,null,184,null,105,72,null,0,219,26,null,53,null,null,41,null,349,350,195,null,351,352,68,49,69,0,54,171,353,219,101,354,355,356,null,73,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,41,null,375,280,null,179,225,null,99,56,321,376,null,null,377,144,null,199,116,67,219,null,null,46,41,4,5,6,8,73,115,227,null,378,null,0,54,193,4,5,6,7,8,null,199,232]},"Role":{"dict":["Sniper","Scout","Missile Boat","Juggernaut","Striker","Brawler","Skirmisher","Ambusher"],"values":[0,0,1,1,0,0,2,2,3,2,3,2,3,3,3,3,3,0,3,1,2,4,1,2,2,2,1,1,1,1,2,1,1,1,2,1,1,1,2,2,4,4,1,3,3,3,5,5,3,3,4,1,1,1,1,1,1,4,4,1,2,4,1,1,0,4,4,4,2,4,2,2,4,2,4,4,4,4,1,4,4,1,1,4,4,2,2,4,4,6,4,1,4,5,5,2,null,1,1,1,1,1,3,3,3,3,3,3,3,3,2,0,4,2,0,1,4,1,3,0,2,6,5,6,0,6,6,2,1,1,3,3,2,3,3,5,5,5,5,5,5,2,5,0,0,0,0,0,3,4,4,4,5,5,5,4,4,4,1,2,4,2,1,1,1,1,1,5,5,5,5,0,3,0,3,3,0,2,2,2,2,2,4,4,0,4,4,4,1,1,1,1,1,1,1,4,1,4,4,4,4,4,4,4,4,2,2,4,4,4,null,null,7,1,1,1,1,1,1,4,1,1,1,1,0,1,5,2,2,1,1,1,1,1,1,2,3,3,3,0,3,0,3,3,2,2,0,4,4,1,5,5,5,0,6,0,5,0,3,3,0,0,2,1,4,3,3,4,4,4,1,4,4,4,4,4,4,4,4,6,4,6,null,4,1,6,6,6,4,2,4,4,4,4,4,6,5,5,5,0,4,6,1,1,1,null,1,1,2,0,1,1,3,3,2,1,1,1,1,4,4,4,4,4,0,5,0,0,0,0,0,0,0,1,1,1,3,4,1,4,1,1,0,1,1,1,7,7,1,4,1,null,0,6,6,4,4,0,1,2,3,2,2,2,3,3,5,5,2,3,3,5,4,1,2,0,0,7,2,2,0,7,2,7,2,2,7,0,0,2,2,0,2,2,2,6,1,4,4,4,4,4,4,4,4,2,4,4,4,0,4,4,4,0,4,0,4,0,2,4,4,0,null,1,1,1,1,1,2,2,2,2,1,1,1,1,4,1,1,1,1,1,3,2,3,3,3,4,2,1,1,1,1,7,7,7,7,7,2,7,5,7,7,6,null,1,1,2,2,2,0,2,7,2,2,2,2,0,0,5,2,3,3,0,5,0,0,0,null,null,null,7,null,1,1,1,1,1,1,1,1,1,1,1,5,4,4,2,2,2,2,2,2,2,2,4,2,6,6,2,2,0,0,1,1,1,1,4,4,4,4,1,null,4,2,1,null,null,1,0,1,1,null,1,1,1,1,6,6,5,1,1,0,0,2,1,1,5,4,4,7,7,2,4,4,4,1,4,4,2,2,2,2,1,null,null,null,6,6,0,0,4,0,5,6,6,0,0,5,6,5,2,5,5,5,0,5,5,5,5,5,1,1,2,5,2,3,3,3,2,3,2,2,3,3,3,1,1,1,1,1,1,1,1,4,4,2,4,4,4,4,4,4,4,4,4,2,4,4,4,1,0,2,2,1,0,4,1,4,4,4,1,null,4,0,null,null,null,null,null,null,2,2,2,0,2,0,6,6,null,6,2,2,0,2,7,4,4,4,6,5,6,1,1,0,0,1,1,1,1,1,0,4,1,3,3,3,3,0,2,0,3,3,3,0,4,4,4,4,4,5,0,1,1,1,4,1,0,2,2,2,2,2,2,2,3,0,0,0,0,0,0,2,0,3,0,0,0,0,0,2,0,2,0,3,5,0,5,5,5,4,4,4,4,1,4,4,1,1,4,4,4,null,4,0,5,0,0,0,0,2,0,0,2,2,2,4,4,0,4,1,4,4,5,5,5,5,0,5,2,5,5,2,2,1,4,4,4,5,1,5,5,5,1,2,5,5,2,2,2,2,1,null,5,0,5,1,1,1,4,4,4,0,1,2,4,0,6,1,2,2,2,2,2,2,2,2,1,1,1,1,1,1,1,3,5,0,5,5,1,2,1,1,4,4,4,1,4,4,1,4,1,4,4,4,1,1,1,1,1,1,1,1,1,4,0,1,1,4,1,1,1,1,4,1,0,0,0,0,3,2,3,3,2,2,2,0,0,0,0,0,0,0,0,0,0,4,1,2,4,1,4,4,5,5,5,5,2,2,2,7,5,5,5,7,5,5,0,2,5,0,1,1,1,1,1,5,2,2,5,5,5,1,0,4,4,4,1,1,1,1,1,1,1,1,5,5,4,2,4,4,4,2,0,4,2,3,7,4,1,1,1,1,1,1,1,7,7,7,7,7,2,1,2,2,2,2,2,2,2,2,5,1,2,2,0,2,3,3,3,2,3,2,2,4,2,4,4,1,1,1,1,1,1,1,1,3,2,2,1,2,5,2,2,2,2,2,2,2,null,5,5,5,3,5,5,5,0,2,3,3,null,1,1,4,5,5,5,3,3,3,3,4,2,2,5,6,4,4,4,1,5,0,6,5,5,0,0,4,0,0,4,0,6,5,5,2,0,5,3,3,3,3,3,3,3,3,1,1,1,0,1,4,1,1,1,6,1,1,1,1,1,1,2,3,0,0,0,1,1,1,2,0,0,2,0,4,0,4,4,2,4,1,1,4,4,4,1,4,4,3,0,0,3,0,4,4,0,4,2,2,4]},"PV":{"values":[12,15,24,27,19,28,45,47,53,56,51,46,50,27,29,35,38,39,39,14,29,22,19,26,23,12,11,10,11,10,8,6,7,6,8,8,9,8,44,32,25,25,15,38,48,38,40,46,28,26,20,19,21,19,16,19,19,19,15,19,16,20,14,15,16,19,34,29,35,34,64,24,36,38,40,36,37,32,41,40,40,32,31,35,35,32,36,35,32,30,35,32,36,35,32,44,4,21,16,15,15,18,39,44,45,39,48,44,41,38,50,44,32,37,44,15,24,14,19,35,44,42,39,44,36,38,46,41,20,18,32,36,33,28,32,17,17,25,29,24,24,21,25,38,35,26,29,30,47,29,28,28,41,45,31,26,29,30,21,22,23,25,24,18,15,18,15,28,29,33,38,40,44,46,49,41,44,24,24,24,24,24,19,20,23,22,46,45,18,25,18,17,16,14,10,27,23,33,33,34,33,32,34,32,35,32,35,32,23,24,19,9,8,20,20,16,21,20,20,27,21,23,26,25,26,19,29,21,30,7,10,9,9,11,9,42,38,33,26,34,38,31,27,39,47,57,43,23,25,18,28,34,30,22,38,33,17,90,31,55,33,37,57,27,30,36,38,21,23,26,24,28,29,37,32,27,34,42,37,41,33,40,7,14,9,39,34,36,33,42,38,36,34,29,36,46,38,46,44,34,26,52,8,8,11,6,2,4,8,5,6,4,27,32,38,23,23,24,23,49,42,48,48,43,29,37,34,29,46,43,29,30,32,15,15,12,31,19,13,31,40,27,18,33,24,12,13,13,18,22,16,15,41,15,23,25,20,22,8,43,57,49,40,25,23,24,23,15,20,16,21,24,32,21,99,95,85,5,19,16,15,13,12,9,13,17,16,54,55,47,37,28,38,48,39,35,16,22,23,24,22,24,23,15,27,18,23,20,23,19,29,30,35,23,27,15,19,15,24,35,32,22,6,11,14,12,15,15,31,32,30,31,5,10,6,11,13,8,11,8,11,18,57,54,48,47,50,34,30,33,24,30,30,15,14,22,17,17,18,17,20,18,19,50,12,21,17,48,52,50,44,20,16,16,20,16,28,16,18,21,17,11,15,21,22,36,38,26,2,4,2,9,3,23,20,32,23,20,35,20,27,24,30,32,29,33,43,48,45,42,31,33,30,30,27,29,24,35,29,50,39,37,17,23,22,16,13,25,24,36,17,11,12,19,15,14,19,20,17,38,13,13,11,17,16,14,14,36,40,38,30,31,31,34,23,14,14,27,34,25,20,16,20,26,26,26,21,32,25,22,32,35,27,28,6,8,7,26,30,13,17,19,16,29,44,34,38,33,34,42,28,30,29,34,31,30,26,28,31,28,31,25,13,29,28,31,40,47,46,56,54,68,57,30,26,27,14,11,9,9,12,18,12,11,35,44,27,29,37,30,36,36,42,38,38,37,33,29,27,25,24,32,28,25,16,24,25,22,23,23,23,7,9,17,18,21,12,19,18,19,20,37,37,36,32,38,33,30,31,17,23,42,43,29,24,22,34,33,36,23,23,22,25,28,41,45,20,21,19,22,20,22,25,18,31,42,41,41,32,33,34,37,32,31,37,40,29,47,38,43,26,27,19,14,14,19,12,24,34,30,29,27,29,31,82,36,16,15,25,26,31,30,42,34,30,30,19,16,21,30,30,29,30,23,25,28,37,33,32,35,25,30,32,30,38,29,31,27,15,38,38,20,8,26,18,16,18,21,22,23,26,19,28,36,38,32,30,30,40,25,28,25,25,20,26,28,21,19,30,36,27,32,32,34,30,19,21,16,25,26,24,25,25,25,20,22,22,37,43,42,45,21,10,25,24,25,21,23,19,28,30,32,31,23,28,34,43,49,34,39,39,45,39,39,46,39,44,15,15,10,15,10,15,12,27,30,34,41,41,12,13,12,12,38,19,22,9,19,24,24,32,31,29,28,33,32,15,11,15,12,25,35,30,25,32,27,27,27,23,28,29,36,32,35,41,28,28,24,29,48,51,37,46,42,52,55,24,32,29,33,25,23,27,34,32,28,21,29,26,29,27,36,36,11,11,14,10,14,12,14,11,13,11,11,13,12,13,10,16,41,45,21,12,17,19,15,23,22,16,37,36,40,24,28,31,29,26,7,14,15,10,14,21,21,22,18,22,42,29,35,40,39,36,36,44,38,66,23,28,30,12,13,11,11,18,9,26,27,32,33,30,20,20,22,27,22,28,16,19,19,20,26,29,46,36,54,47,40,41,51,53,53,27,30,30,28,28,34,12,7,5,12,18,19,19,18,42,91,39,15,23,21,22,29,22,27,27,29,30,16,16,26,28,31,31,29,22,22,28,37,32,5,24,25,30,18,26,18,39,32,39,40,32,28,19,25,26,22,27,24,25,16,26,18,14,26,20,16,16,14,16,17,18,29,19,21,42,35,37,30,30,40,27,36,38,41,46,10,15,15,20,15,20,19,18,22,13,14,16,16,27,27,30,44,40,49,46,42,11,26,21,31,21,18,23,23,21,28,35,33,33,31,29,23,26,31,33,33,30,30,26,29,30,32,28,38,38,38,45,18,14,19]},"BV":{"values":[403,536,875,775,768,1505,1666,1551,2042,1706,1883,1507,1789,1080,1017,1432,1400,1850,2163,308,1035,720,637,1151,1201,193,114,78,131,102,208,157,168,142,194,172,176,157,1404,0,930,952,333,1855,2444,1427,1612,2003,931,902,492,540,537,506,474,441,516,602,437,431,450,540,434,399,474,549,1271,797,1278,934,1461,531,1145,1162,1231,1093,1063,1119,915,1209,1054,872,902,753,792,827,839,887,837,708,914,770,929,1305,1198,1291,90,335,266,219,249,295,1173,1406,1662,1130,1789,1336,1324,1246,1903,1781,1018,1262,1603,277,464,264,0,1059,961,1068,877,1243,1005,908,1076,968,365,377,1115,1186,1248,979,1208,605,556,861,999,842,855,748,977,1737,1681,815,875,1105,1222,780,641,582,1997,2286,1248,503,604,605,446,487,509,495,568,271,431,327,455,1057,912,1177,1498,1724,1710,1830,1851,1512,1894,812,814,847,801,832,668,583,671,613,1762,1932,367,367,367,265,193,178,278,653,592,721,715,939,960,803,977,765,1252,965,1197,804,811,963,347,357,321,385,288,186,288,415,459,645,927,740,594,583,647,583,683,576,855,125,136,125,193,192,167,1297,1585,1563,891,1529,1242,1434,981,1619,1397,2336,1927,454,636,386,1094,1314,1179,836,1333,0,554,2859,1037,2245,1390,1623,1869,542,711,1457,1625,785,915,582,808,949,960,910,870,926,899,1295,1516,1402,1289,1843,194,423,196,1527,1130,1527,1144,1976,1255,1563,1773,1436,1477,1986,2147,1856,1770,1668,676,1643,58,108,103,17,34,117,172,65,232,67,1349,1178,1402,549,530,547,543,1543,1167,1248,1185,1686,1184,1336,1413,1234,1827,1720,1184,1255,0,198,162,168,1056,633,309,651,872,779,564,762,601,345,443,455,504,648,451,316,1484,476,718,613,586,806,277,1686,1980,1704,1452,839,794,790,897,555,656,527,647,886,1091,663,3704,2938,3228,137,452,407,502,299,248,224,265,513,491,2125,1863,1765,1484,1418,1667,2294,1785,1537,321,413,354,351,365,477,519,375,765,412,487,427,509,541,790,859,859,841,684,492,749,501,745,928,851,490,176,188,284,218,330,271,948,1159,722,1245,206,276,228,266,445,189,265,213,255,330,2244,2254,2131,1990,1943,1044,768,957,577,850,777,574,536,900,520,767,657,553,775,630,1051,1408,347,515,382,1132,1454,1567,1520,648,670,641,675,639,939,660,610,645,599,463,502,897,728,1404,1616,1072,47,70,47,170,44,544,398,570,459,433,696,532,626,482,564,621,1009,752,978,1349,1362,1209,1037,1020,947,1108,995,435,396,1315,1077,1036,1378,1552,599,487,527,536,669,752,744,1154,221,125,152,556,227,233,499,416,590,1632,155,166,126,252,175,175,192,1200,1212,1671,671,943,1189,1474,809,429,336,1091,1042,478,566,578,714,510,956,884,709,633,710,833,798,1050,1266,453,220,269,213,798,831,464,472,725,565,1422,1486,1508,1274,1172,1256,1504,993,1135,957,958,1008,1149,961,1241,1191,1147,1435,434,304,688,976,684,1474,1778,1702,2076,1948,2545,2520,1056,1054,1090,179,107,209,165,197,301,210,170,770,851,781,764,794,715,794,817,817,773,1147,835,869,763,682,476,483,828,1038,879,564,1026,456,560,512,456,508,153,206,670,750,319,249,387,319,435,402,835,726,1348,1355,1363,1438,736,680,458,940,1685,2059,1324,517,779,1120,1114,897,815,749,780,984,690,1719,1859,367,344,325,490,631,1100,691,338,938,1242,1572,1287,1269,1164,1268,1156,1173,1031,1624,1744,1131,1349,1676,1551,1116,1492,397,344,294,501,263,1155,1135,1113,592,692,985,690,1624,1116,597,553,923,980,920,836,1303,1296,1247,1110,673,580,662,992,1156,968,1021,835,1113,961,1468,1213,1160,1278,640,706,787,678,906,781,618,571,317,1119,1119,344,88,564,533,461,648,715,892,862,943,1367,961,1121,1102,1302,710,703,1450,600,578,632,600,719,870,1021,778,734,1181,1118,1215,1415,772,1224,785,775,1051,480,721,1245,788,679,680,1160,703,799,697,1353,1546,1323,1631,437,355,839,756,746,604,688,607,711,786,835,1212,896,1016,1282,1426,1490,971,1462,1439,1574,1444,1478,1670,1464,1679,345,432,108,371,125,228,160,933,1178,1270,1353,1507,400,303,320,286,997,596,594,150,760,808,955,862,793,673,676,837,635,215,128,294,131,435,708,565,436,1399,984,1002,1141,666,794,736,811,2096,1047,1425,1009,1057,954,1104,1456,1439,1078,1603,1120,1466,1434,773,1005,1203,1242,935,881,1040,993,1258,1074,532,680,704,582,631,783,665,306,325,477,289,425,350,452,320,469,385,338,373,414,425,354,570,1606,2178,504,228,520,417,311,810,669,584,1412,1314,1425,499,770,923,1078,1437,86,314,230,252,319,445,454,491,505,553,1585,1055,1214,1512,1593,1028,1422,2147,895,2285,599,937,884,82,82,71,139,220,71,816,794,903,958,1098,564,573,691,775,701,860,605,621,590,583,684,688,803,1400,2199,1822,1711,1390,1685,1670,1578,960,1001,714,698,988,889,83,81,39,83,403,436,484,359,0,1874,1336,241,608,664,482,830,568,758,758,731,682,0,574,912,891,941,991,921,731,654,1127,1182,1043,199,424,583,756,673,709,640,1104,1064,1434,1166,1260,687,653,758,827,512,0,0,0,475,1219,649,458,944,731,552,495,478,545,712,590,1223,599,1146,1396,1261,1216,1001,1100,1319,1060,1350,1584,1688,1847,180,295,292,446,303,419,484,392,668,324,291,291,291,667,811,667,1551,1314,1830,2565,1621,204,799,677,631,782,803,612,582,797,792,904,820,867,686,509,478,676,811,896,967,840,844,920,956,1021,939,664,1072,1017,1021,1205,562,575,693]},"Type":{"dict":["CV","cv"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"Size":{"values":[3,3,1,1,2,2,4,4,4,4,4,4,4,4,4,4,4,4,4,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,4,3,1,1,1,3,3,3,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,2,1,1,1,1,1,4,4,4,4,4,4,4,4,4,4,2,2,2,1,1,1,3,3,3,3,3,3,3,3,3,3,1,1,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,3,3,3,4,2,2,2,4,4,4,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,4,4,4,4,4,4,2,2,2,2,2,1,1,1,1,2,2,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,1,1,1,1,1,1,4,4,4,4,4,4,4,4,4,4,4,4,2,2,2,3,3,3,3,3,3,1,4,4,4,4,4,4,1,1,4,4,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,2,4,1,1,1,1,1,1,1,1,1,1,4,4,4,1,1,1,1,2,2,2,2,2,4,4,4,4,4,4,4,4,4,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,4,4,4,4,2,2,2,2,2,2,2,2,2,1,1,4,4,4,1,1,1,1,1,1,1,1,1,1,4,4,4,2,2,2,2,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,1,1,1,1,1,1,1,3,1,1,1,1,1,4,4,4,4,1,1,1,1,1,1,1,1,1,1,4,4,4,4,4,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,4,3,3,1,4,4,4,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,4,4,4,3,3,3,3,3,1,1,2,2,4,2,2,1,1,1,1,1,2,2,2,1,1,1,1,1,1,1,2,1,4,1,1,1,1,1,1,1,3,3,3,1,1,3,3,2,1,1,2,2,1,3,2,2,1,1,1,1,1,1,3,3,3,3,1,1,1,1,3,3,1,1,1,1,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,1,1,3,3,3,4,4,4,4,4,4,4,3,3,3,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,3,4,3,3,3,3,3,3,3,4,4,4,3,3,2,2,2,2,2,2,2,1,4,4,1,1,1,1,1,3,1,1,4,4,4,4,4,4,4,4,4,4,1,1,1,1,1,1,3,3,1,1,1,1,1,2,3,3,2,2,2,2,4,4,2,2,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,3,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,3,3,3,3,3,3,3,3,3,3,1,1,3,1,1,1,1,3,3,3,3,3,3,3,3,3,3,3,3,2,2,2,2,2,2,2,2,2,2,2,2,4,4,4,4,1,2,2,2,2,2,2,2,2,2,1,2,2,2,2,2,2,2,4,4,4,4,4,4,4,4,1,1,1,1,1,1,1,3,3,3,3,3,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,3,1,1,1,1,1,2,2,2,3,3,3,2,2,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,3,3,2,4,4,2,2,2,1,1,1,1,1,1,3,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,4,4,4,4,4,4,4,4,4,2,2,2,1,1,1,1,1,1,1,1,1,1,1,3,4,3,1,2,2,2,2,3,3,3,3,3,2,2,3,3,3,3,3,3,3,3,4,4,3,1,1,1,2,2,2,3,3,3,3,2,2,2,3,3,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,3,3,3,3,3,1,1,1,1,1,1,1,1,1,3,2,2,2,2,2,2,2,2,2,2,1,1,3,3,3,3,2,2,2,2,2,1,1,1]},"Tonnage":{"values":[60.0,60.0,25.0,25.0,55.0,55.0,100.0,90.0,90.0,90.0,90.0,90.0,90.0,95.0,95.0,95.0,95.0,95.0,95.0,25.0,30.0,30.0,30.0,40.0,40.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,80.0,60.0,20.0,20.0,20.0,75.0,75.0,75.0,65.0,65.0,65.0,65.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,25.0,25.0,25.0,25.0,100.0,55.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,70.0,70.0,70.0,50.0,15.0,15.0,15.0,15.0,15.0,100.0,100.0,100.0,100.0,100.0,100.0,100.0,100.0,100.0,100.0,45.0,45.0,45.0,25.0,25.0,25.0,75.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,25.0,25.0,75.0,75.0,75.0,75.0,75.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,85.0,85.0,75.0,75.0,75.0,140.0,50.0,50.0,50.0,80.0,80.0,80.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,20.0,20.0,20.0,20.0,50.0,50.0,50.0,50.0,90.0,90.0,90.0,90.0,90.0,90.0,50.0,50.0,50.0,50.0,50.0,35.0,35.0,35.0,35.0,45.0,45.0,30.0,30.0,30.0,30.0,15.0,15.0,15.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,30.0,30.0,30.0,30.0,15.0,15.0,15.0,15.0,30.0,30.0,30.0,30.0,30.0,50.0,50.0,50.0,50.0,45.0,45.0,13.0,13.0,13.0,13.0,13.0,13.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,100.0,100.0,100.0,100.0,45.0,45.0,45.0,60.0,60.0,60.0,60.0,60.0,60.0,25.0,200.0,80.0,160.0,100.0,100.0,100.0,25.0,25.0,80.0,80.0,35.0,21.0,21.0,21.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,40.0,40.0,40.0,55.0,55.0,55.0,55.0,50.0,50.0,50.0,50.0,50.0,50.0,60.0,60.0,60.0,60.0,60.0,50.0,80.0,5.0,5.0,5.0,5.0,10.0,10.0,10.0,10.0,10.0,10.0,80.0,80.0,80.0,20.0,20.0,20.0,20.0,50.0,50.0,50.0,50.0,50.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,5.0,5.0,5.0,70.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,40.0,40.0,40.0,40.0,40.0,45.0,45.0,85.0,85.0,85.0,85.0,45.0,45.0,45.0,45.0,45.0,45.0,45.0,45.0,45.0,25.0,25.0,190.0,190.0,190.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,100.0,100.0,80.0,50.0,50.0,50.0,50.0,50.0,75.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,50.0,50.0,50.0,40.0,50.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,70.0,20.0,20.0,20.0,20.0,20.0,80.0,80.0,80.0,80.0,20.0,20.0,20.0,20.0,20.0,20.0,20.0,20.0,20.0,20.0,95.0,95.0,95.0,95.0,95.0,35.0,30.0,30.0,30.0,30.0,30.0,40.0,40.0,40.0,40.0,40.0,40.0,40.0,40.0,40.0,40.0,90.0,60.0,60.0,30.0,85.0,85.0,85.0,85.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,30.0,30.0,35.0,35.0,65.0,65.0,65.0,20.0,20.0,20.0,20.0,20.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,40.0,50.0,50.0,95.0,95.0,95.0,60.0,60.0,60.0,60.0,60.0,25.0,25.0,40.0,40.0,150.0,55.0,55.0,20.0,20.0,20.0,20.0,20.0,50.0,50.0,50.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,45.0,30.0,95.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,70.0,70.0,70.0,30.0,30.0,70.0,70.0,50.0,10.0,10.0,50.0,50.0,30.0,60.0,40.0,40.0,35.0,35.0,35.0,35.0,35.0,35.0,60.0,60.0,60.0,60.0,25.0,20.0,20.0,20.0,70.0,70.0,30.0,30.0,30.0,30.0,70.0,70.0,70.0,70.0,70.0,70.0,70.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,70.0,15.0,15.0,65.0,65.0,65.0,95.0,95.0,95.0,100.0,100.0,100.0,100.0,60.0,60.0,60.0,15.0,15.0,15.0,15.0,15.0,15.0,15.0,15.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,75.0,75.0,35.0,60.0,20.0,20.0,20.0,20.0,20.0,20.0,20.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,75.0,65.0,95.0,75.0,75.0,75.0,60.0,60.0,60.0,60.0,80.0,80.0,80.0,60.0,60.0,50.0,50.0,50.0,40.0,40.0,40.0,40.0,20.0,90.0,90.0,25.0,25.0,25.0,25.0,25.0,60.0,20.0,20.0,95.0,95.0,95.0,95.0,95.0,95.0,95.0,95.0,95.0,95.0,30.0,30.0,30.0,30.0,30.0,30.0,60.0,60.0,20.0,20.0,20.0,20.0,20.0,55.0,75.0,75.0,55.0,55.0,55.0,55.0,130.0,85.0,50.0,50.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,65.0,65.0,65.0,65.0,65.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,30.0,30.0,30.0,40.0,40.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,70.0,70.0,70.0,30.0,30.0,70.0,35.0,35.0,35.0,35.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,75.0,75.0,60.0,45.0,45.0,45.0,55.0,55.0,55.0,55.0,55.0,55.0,55.0,55.0,55.0,95.0,95.0,95.0,95.0,30.0,45.0,45.0,45.0,45.0,45.0,45.0,45.0,45.0,45.0,25.0,45.0,45.0,45.0,45.0,50.0,50.0,50.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,10.0,10.0,10.0,10.0,10.0,10.0,10.0,65.0,65.0,65.0,65.0,65.0,20.0,20.0,20.0,20.0,50.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,5.0,5.0,5.0,5.0,35.0,35.0,35.0,35.0,40.0,40.0,40.0,40.0,40.0,40.0,40.0,40.0,40.0,40.0,40.0,50.0,50.0,50.0,50.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,80.0,95.0,80.0,80.0,80.0,80.0,80.0,80.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,25.0,35.0,65.0,65.0,11.0,11.0,11.0,25.0,25.0,50.0,40.0,40.0,70.0,70.0,70.0,40.0,40.0,30.0,35.0,35.0,5.0,20.0,20.0,20.0,20.0,20.0,20.0,20.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,75.0,75.0,50.0,80.0,175.0,50.0,45.0,45.0,10.0,10.0,10.0,10.0,10.0,10.0,60.0,60.0,60.0,60.0,60.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,35.0,30.0,125.0,85.0,85.0,85.0,85.0,85.0,85.0,85.0,85.0,40.0,40.0,40.0,35.0,35.0,35.0,8.0,8.0,8.0,8.0,20.0,20.0,20.0,20.0,75.0,150.0,75.0,10.0,55.0,55.0,55.0,55.0,60.0,60.0,60.0,60.0,60.0,55.0,55.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,60.0,85.0,85.0,70.0,30.0,35.0,35.0,50.0,50.0,50.0,70.0,70.0,70.0,70.0,45.0,45.0,40.0,65.0,65.0,22.0,22.0,22.0,22.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,50.0,75.0,75.0,75.0,75.0,75.0,75.0,75.0,75.0,75.0,75.0,75.0,20.0,21.0,21.0,21.0,21.0,20.0,20.0,20.0,21.0,20.0,20.0,20.0,20.0,45.0,45.0,45.0,70.0,70.0,70.0,70.0,70.0,20.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,30.0,65.0,40.0,40.0,40.0,40.0,40.0,40.0,40.0,40.0,40.0,40.0,25.0,25.0,75.0,75.0,75.0,75.0,50.0,50.0,50.0,50.0,50.0,35.0,35.0,35.0]},"ASMove":{"dict":["6\"t","24\"v","6\"w","16\"w","16\"v","10\"t","20\"h","12\"t","12\"w","18\"h","8\"t","22\"v","20\"v","0\"t","10\"w","8\"w","24\"h","28\"h","22\"h","4\"t","0\"w","14\"w","16\"h","26\"v","18\"v","18\"t","10\"g","30\"v","26\"h","14\"t","16\"t","10\"v","20\"h/14\"j","36\"h","14\"h","28\"v","18\"h/16\"j","10\"h","14\"v","16\"h/12\"j","32\"v","20\"w","18\"w","18\"h/18\"j","22\"h/14\"j","22\"w","4\"w","12\"v"],"values":[0,0,1,1,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,3,4,4,4,5,5,6,6,6,6,6,7,7,7,7,8,8,8,8,0,0,9,9,9,0,0,0,10,5,0,0,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,11,12,12,11,13,0,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,14,15,14,8,16,17,18,17,17,19,19,19,19,19,19,19,19,0,0,9,9,6,9,9,9,20,14,14,14,14,14,14,14,14,14,21,7,0,0,0,0,0,10,10,10,5,10,10,10,10,10,10,19,19,0,19,22,4,4,10,10,10,12,12,12,23,12,12,12,23,22,22,22,9,14,14,14,14,0,0,0,0,0,0,10,10,10,10,10,8,8,8,21,6,6,4,4,4,4,21,8,8,22,22,22,22,22,22,22,22,22,9,9,9,22,7,7,22,10,15,4,23,23,23,23,1,1,1,1,12,14,14,8,14,14,15,21,21,21,21,21,21,0,10,0,0,0,0,0,0,0,0,0,0,21,21,21,15,15,15,15,14,10,5,19,0,19,0,19,0,24,24,2,2,8,24,24,24,9,9,22,9,9,9,9,9,9,9,9,7,5,7,7,5,5,25,9,9,9,9,9,9,7,5,5,5,5,9,26,27,27,27,27,14,14,14,14,14,14,2,2,2,17,17,17,17,6,6,6,6,28,10,10,10,10,10,10,10,10,10,28,28,28,2,7,7,29,29,29,7,30,30,7,7,7,7,7,7,31,4,8,8,22,22,14,14,0,0,0,0,10,5,10,10,10,10,10,10,10,11,11,19,19,19,13,20,20,13,20,20,13,20,20,20,0,0,10,10,10,9,9,9,5,6,6,32,6,6,6,16,16,33,6,6,16,16,16,6,6,6,5,34,4,4,4,4,11,11,35,15,22,22,22,22,22,19,19,19,0,5,5,5,5,22,8,8,8,8,21,0,0,0,0,0,36,22,22,22,22,22,15,15,14,15,15,15,15,15,15,15,34,10,10,9,19,19,19,19,5,10,10,5,10,29,10,10,5,5,10,10,14,14,2,2,15,5,5,5,5,13,18,18,18,18,22,18,22,18,18,18,18,14,37,22,19,19,19,2,2,2,15,2,6,6,5,5,19,38,38,7,30,7,7,7,39,22,39,11,11,12,4,4,11,12,4,12,0,1,1,1,1,27,1,1,5,5,5,9,9,19,0,5,21,21,15,21,24,0,15,14,18,18,18,18,18,18,0,19,0,0,18,14,14,14,5,5,10,10,7,7,10,5,5,5,5,5,5,10,5,10,10,10,10,10,10,10,10,10,11,40,10,10,10,0,0,0,19,19,19,0,0,0,0,23,23,9,9,9,6,9,9,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,10,10,14,10,9,18,9,9,9,14,8,7,7,8,2,14,8,8,8,19,0,0,10,10,10,14,14,14,14,0,0,0,0,0,34,22,34,5,5,5,7,41,0,0,35,35,1,1,35,0,3,3,0,0,0,0,0,0,0,0,0,0,12,12,12,12,12,12,10,10,42,21,21,21,21,2,5,5,2,2,2,2,19,0,14,14,0,0,0,0,0,0,0,0,0,0,0,0,0,19,0,0,19,10,5,5,10,10,22,9,9,22,18,9,9,22,22,17,17,1,1,1,10,10,0,0,0,0,0,0,0,15,15,15,12,12,5,9,9,9,9,10,10,10,10,10,10,10,10,10,0,0,10,7,7,5,10,10,10,10,10,10,10,10,10,0,0,0,0,7,14,14,14,14,8,8,8,8,8,11,9,9,9,9,6,6,6,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,10,10,10,0,10,42,3,3,3,9,22,22,22,22,22,43,6,6,22,22,6,6,28,28,28,28,6,6,6,6,18,18,18,18,18,18,18,18,18,44,17,0,0,0,0,2,2,2,2,2,2,2,0,19,0,0,0,0,0,0,0,10,22,22,22,22,6,6,6,10,10,10,10,10,0,10,10,10,10,10,10,10,5,10,10,10,10,28,28,28,3,3,14,5,5,15,15,15,38,38,12,29,29,28,21,21,21,21,42,21,3,14,14,22,22,22,22,22,0,0,18,0,19,15,9,6,23,23,23,23,23,23,0,0,0,10,10,14,8,14,14,14,14,14,14,14,14,14,24,19,0,0,10,0,0,0,0,0,9,22,9,6,18,6,41,3,45,41,16,16,16,16,20,46,0,42,14,15,14,14,15,15,15,15,15,10,10,15,15,15,15,15,15,15,14,0,0,0,8,18,18,15,15,15,2,2,2,0,9,9,15,15,15,1,1,1,1,5,7,5,5,5,5,5,5,5,5,5,5,7,5,5,19,0,0,0,0,0,0,0,0,0,0,12,24,24,24,12,12,12,23,23,22,21,21,21,22,9,9,0,0,0,0,0,6,38,38,38,47,47,47,24,47,14,9,9,9,9,9,9,9,9,9,9,3,3,0,0,0,10,22,22,22,22,22,10,10,5]},"Short":{"values":[1,0,1,1,0,3,4,4,7,3,7,2,5,3,5,3,6,4,4,1,2,2,1,3,2,0,1,0,0,0,0,1,0,0,0,1,0,0,3,0,3,3,1,6,7,6,4,4,3,3,3,2,2,2,2,2,2,2,1,2,0,3,3,1,1,2,4,4,3,3,2,0,2,2,3,2,3,1,3,3,3,2,1,2,2,0,1,2,3,1,1,2,3,3,3,4,0,1,0,0,0,0,6,5,7,6,8,7,7,6,4,5,3,3,3,0,2,0,0,1,3,4,1,4,1,2,4,3,0,0,4,4,3,4,3,3,2,3,3,3,3,2,3,3,3,3,4,4,9,2,1,2,5,6,3,2,2,3,0,1,2,0,1,1,1,0,0,4,4,5,5,3,5,4,5,4,4,1,1,1,1,1,2,2,2,2,4,3,1,1,1,1,0,0,0,2,1,3,3,3,2,2,3,2,3,2,2,3,2,2,0,0,0,1,1,0,1,2,1,2,1,1,2,2,2,2,2,1,1,0,0,0,0,1,0,1,6,6,5,4,6,3,4,5,6,5,4,2,2,1,4,5,4,2,4,3,2,2,6,5,4,5,5,0,2,7,7,1,2,2,1,2,2,4,2,3,3,5,4,4,2,3,0,2,1,6,4,4,2,4,4,3,4,2,4,7,5,8,6,3,2,5,0,0,0,0,0,0,0,0,0,0,3,2,4,2,2,1,2,3,2,3,2,2,2,3,2,2,5,4,2,2,1,1,1,0,3,2,2,2,2,1,1,2,1,1,1,1,1,2,2,0,3,1,2,2,1,2,0,4,5,3,2,2,2,3,2,1,1,2,3,2,3,1,8,0,3,0,0,1,0,0,0,1,0,2,3,4,4,6,6,5,2,5,2,3,1,2,2,2,2,2,2,0,2,0,2,2,2,1,2,2,3,2,2,1,2,1,1,3,3,0,0,0,1,1,1,1,3,2,6,3,0,1,1,1,1,0,1,1,1,2,9,5,5,5,6,2,2,3,2,2,2,2,1,3,2,2,1,2,2,3,2,2,0,0,1,4,4,8,7,1,3,1,1,1,2,2,2,3,2,1,1,3,2,5,6,3,0,0,0,1,0,1,1,2,1,1,2,1,1,2,1,2,4,6,6,5,5,4,3,3,6,2,3,2,1,4,3,0,2,2,1,2,1,1,1,2,2,3,2,0,0,2,0,0,1,0,1,5,0,0,0,1,0,1,0,3,4,4,1,2,4,4,2,1,1,4,2,2,4,3,2,2,2,2,1,3,2,2,3,3,3,1,1,0,0,2,3,1,1,2,1,4,5,3,2,2,3,4,3,1,3,2,3,3,3,4,4,3,3,2,0,1,4,2,6,7,8,9,12,9,8,3,2,2,0,0,0,0,0,1,0,0,3,3,2,3,3,3,3,2,2,2,3,4,2,3,3,1,0,2,3,2,1,2,2,1,2,2,2,0,0,2,2,1,1,0,1,1,0,1,1,1,2,5,3,2,2,1,2,5,5,3,2,4,3,2,2,2,2,2,1,2,3,3,1,1,0,0,1,1,3,1,5,7,7,6,3,2,4,6,3,5,3,3,3,5,4,4,4,4,0,1,1,2,0,2,2,2,1,2,1,3,1,3,1,0,2,2,2,2,3,3,4,3,2,2,2,3,1,3,3,3,2,2,2,2,3,4,2,2,3,3,3,2,2,2,0,3,3,2,0,3,0,0,1,2,2,2,2,1,3,4,3,2,2,2,2,2,2,2,2,2,3,3,2,2,4,2,3,3,2,2,1,2,2,2,2,1,2,3,2,1,2,2,2,4,5,6,6,1,0,3,2,3,2,3,3,3,3,3,2,1,0,3,2,3,1,3,4,3,4,4,3,4,5,1,1,0,0,0,1,1,3,4,3,2,2,1,0,1,1,4,2,2,0,2,3,2,2,2,1,2,2,2,1,0,1,1,0,1,1,0,2,1,1,1,0,1,1,3,0,2,1,2,2,1,3,8,4,4,5,5,5,3,3,5,2,3,3,3,3,2,3,3,1,1,1,2,3,3,1,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,5,5,2,0,1,1,0,1,2,1,7,6,8,1,1,2,2,0,0,1,0,0,1,1,1,1,2,3,4,1,2,4,3,1,1,4,1,4,4,2,1,0,0,0,0,1,0,6,6,6,6,6,2,2,2,2,2,2,1,1,2,2,2,2,0,2,5,4,3,4,5,2,5,2,2,2,2,3,3,0,0,0,0,1,2,1,1,2,0,2,1,1,3,0,2,0,1,1,1,1,2,2,3,3,5,4,4,2,2,2,3,3,0,1,1,2,2,2,2,6,3,6,6,3,2,0,2,1,2,2,2,2,1,2,2,1,2,2,1,2,1,1,2,1,3,2,2,6,4,5,5,5,7,3,7,3,4,3,0,1,1,1,0,1,1,0,0,0,1,1,1,2,2,2,3,4,5,2,4,0,2,1,3,2,2,0,1,2,2,3,2,2,2,0,0,0,2,3,2,2,2,3,2,2,4,1,3,3,2,4,2,1,2]},"Medium":{"values":[1,1,1,1,1,3,4,3,7,5,7,2,6,3,5,3,6,5,4,0,2,2,1,3,2,0,0,0,0,0,0,0,0,0,0,0,0,0,2,0,3,3,1,6,7,5,4,4,3,3,2,2,2,2,1,2,2,2,1,2,1,2,0,1,1,2,3,2,3,2,2,0,2,2,3,2,2,1,2,3,3,1,1,2,2,1,2,2,1,1,2,1,2,3,3,5,0,1,0,0,0,0,6,5,8,5,8,7,5,5,6,7,2,3,3,0,2,0,0,1,2,3,1,3,1,2,4,2,0,0,5,5,4,4,4,2,2,2,2,2,2,3,3,4,4,4,4,4,9,2,2,2,5,6,3,2,2,2,0,1,2,1,1,1,1,0,0,3,4,5,5,4,6,4,6,4,5,1,1,1,1,1,2,2,2,2,4,3,1,1,1,1,0,0,0,2,0,2,2,3,2,2,3,2,3,2,2,3,2,2,0,0,0,0,1,0,1,1,1,2,1,1,2,1,1,1,2,1,1,0,0,0,0,1,0,1,6,5,4,4,6,3,4,5,5,7,5,2,1,1,4,5,4,2,5,4,1,2,5,6,3,5,8,1,2,6,7,1,2,2,1,2,2,3,2,2,3,4,3,3,2,3,0,2,0,5,4,4,2,4,4,3,3,2,4,7,4,6,6,3,2,5,0,0,0,0,0,0,1,0,0,0,3,2,5,1,1,1,1,3,2,3,2,2,2,3,2,2,5,4,2,2,1,1,1,0,2,2,1,2,2,1,1,2,1,1,1,1,1,2,1,0,3,0,2,2,1,2,0,5,6,3,4,2,1,2,2,1,2,1,3,2,3,1,9,0,3,0,0,2,0,0,1,1,0,2,3,4,3,7,6,4,2,5,2,3,1,2,2,2,2,2,2,0,2,1,2,1,2,1,2,2,3,1,2,1,2,1,2,3,2,0,0,0,0,0,1,1,5,4,5,3,0,0,0,1,1,0,0,0,1,1,7,5,5,5,6,2,2,3,1,2,2,2,1,3,2,2,2,2,2,3,2,1,0,0,1,3,3,8,7,2,3,2,2,1,2,2,3,2,1,0,0,2,2,5,6,3,0,0,0,1,0,1,0,2,1,1,2,1,1,1,1,2,3,6,6,6,6,8,4,4,4,4,3,2,1,3,3,0,3,3,1,1,1,1,0,2,2,3,0,0,0,2,0,0,1,0,1,4,0,0,0,1,0,0,0,3,3,3,1,2,4,4,2,1,1,4,2,2,4,3,2,2,2,2,1,3,2,3,5,5,3,1,0,0,0,2,2,1,2,2,1,4,5,3,2,2,2,4,3,2,4,3,3,3,3,4,4,3,3,2,0,1,4,1,6,5,7,9,9,9,9,3,2,2,0,0,0,0,0,1,0,0,3,3,2,2,3,2,3,3,3,3,3,3,2,2,2,1,0,2,3,2,1,2,2,1,2,2,2,0,0,2,2,1,1,1,1,1,1,0,0,0,3,4,3,2,1,1,2,5,5,3,3,4,3,2,2,2,2,2,1,2,4,4,1,1,0,1,1,2,3,1,5,7,7,7,4,4,4,5,4,5,3,3,2,5,3,4,4,3,0,1,1,2,0,2,2,3,1,2,0,3,1,3,1,1,2,2,2,2,5,3,4,3,2,1,2,3,3,4,4,3,2,2,3,2,3,3,2,2,3,3,2,2,2,2,0,3,3,2,0,3,0,0,1,2,2,2,3,1,3,5,3,3,2,2,2,2,2,2,2,1,3,3,1,1,4,2,3,3,2,2,1,2,2,2,3,1,3,2,3,1,2,3,2,5,6,5,5,0,0,3,1,3,1,0,0,3,3,3,2,1,0,3,2,3,1,4,4,4,4,4,5,4,5,1,1,0,1,0,1,0,3,3,3,2,2,1,1,1,1,3,2,2,0,2,3,1,2,1,2,2,2,1,1,0,1,0,0,1,1,0,2,1,1,1,0,1,1,2,0,2,2,2,2,1,2,7,6,4,6,4,6,1,2,5,3,4,3,3,3,3,3,3,1,1,2,2,1,2,2,1,1,1,0,1,1,1,1,2,1,1,2,1,1,0,1,5,5,2,0,1,1,0,1,2,1,5,6,7,1,2,2,2,0,0,1,0,0,1,1,1,1,1,2,4,1,2,4,3,0,0,4,1,4,4,2,1,0,0,0,0,1,0,6,6,6,6,6,2,2,2,2,2,3,1,1,1,2,2,2,0,2,6,4,4,4,5,3,5,2,2,2,2,2,3,0,0,0,0,1,1,1,1,2,0,2,1,1,2,0,2,0,0,0,1,1,2,2,3,3,5,4,4,2,2,2,3,3,0,1,1,2,2,2,2,6,3,6,6,3,2,0,1,1,1,2,1,1,1,2,1,0,2,1,0,1,1,1,2,1,3,2,2,6,4,5,5,4,6,3,6,3,3,3,0,1,1,2,0,2,1,0,1,1,1,1,1,2,2,2,5,4,5,2,4,0,2,1,2,2,2,0,1,2,1,3,2,2,2,0,0,1,2,3,2,2,2,3,2,2,3,1,3,2,2,4,2,1,2]},"Long":{"values":[1,1,1,1,1,3,0,2,0,5,2,0,3,0,0,0,0,5,2,0,2,0,0,3,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,4,4,0,4,4,1,1,0,0,1,0,0,0,0,0,0,0,1,0,0,0,1,0,1,1,2,1,0,0,1,2,0,0,1,0,0,0,0,0,1,0,0,1,1,0,0,0,1,0,0,2,2,2,0,0,0,0,0,0,2,2,4,2,4,4,4,3,6,5,2,2,3,0,0,0,0,1,1,0,0,0,1,0,0,1,0,0,2,3,3,1,2,0,0,1,0,1,1,2,0,4,3,4,3,3,1,2,1,0,3,3,1,0,0,0,0,1,0,1,0,0,0,0,0,2,0,0,2,3,3,4,4,2,4,0,0,0,0,0,1,1,2,1,0,3,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,2,2,2,0,2,2,0,0,0,0,0,0,0,0,0,0,0,1,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,0,3,0,0,3,4,5,0,0,0,2,2,2,2,2,3,0,0,0,5,3,5,7,1,1,1,1,0,1,0,1,1,2,1,2,0,0,1,2,1,0,3,0,0,0,2,0,1,2,3,2,2,2,0,0,0,3,2,2,3,0,2,0,0,0,0,0,0,1,0,0,0,0,1,3,0,0,0,0,0,1,1,0,0,2,0,2,2,4,4,2,2,1,0,0,0,1,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,3,0,0,0,0,2,0,3,3,0,4,1,0,0,0,0,2,0,0,1,0,1,9,0,3,0,0,2,0,0,1,0,0,2,0,4,3,5,4,3,0,3,0,0,0,0,0,0,0,1,0,0,0,1,0,1,0,1,0,1,0,1,1,1,0,1,2,0,1,0,0,0,0,0,0,0,5,4,3,3,0,0,0,0,1,0,0,0,0,0,4,5,3,2,2,0,1,0,0,0,0,0,0,0,0,0,2,0,0,0,2,0,0,0,0,1,3,5,4,2,0,2,2,1,2,2,2,1,1,0,0,2,0,4,4,3,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,5,5,8,4,4,2,4,3,0,0,2,2,0,3,3,1,0,0,0,0,2,1,1,0,0,0,0,0,0,0,0,0,3,0,0,0,0,0,0,0,2,2,1,0,0,4,4,1,0,0,3,0,0,0,0,2,0,0,0,0,0,0,3,5,5,3,0,0,0,0,0,0,1,1,0,1,0,0,1,2,2,1,0,2,2,1,2,2,3,1,0,2,2,3,0,0,0,0,1,2,3,2,6,4,8,6,1,0,1,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,2,1,0,0,0,2,2,2,0,2,0,0,0,0,0,0,0,0,2,0,0,1,0,0,1,0,0,0,3,2,2,0,1,0,0,4,5,3,3,0,0,0,1,1,1,0,0,1,4,4,0,0,0,1,0,2,0,0,1,2,1,2,3,4,3,2,2,1,2,3,2,0,2,0,2,3,0,0,0,0,0,2,0,3,1,0,0,1,0,1,1,1,2,2,2,2,5,3,0,3,2,1,2,3,3,4,4,3,0,0,2,1,2,3,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,1,1,2,1,2,0,3,3,0,2,0,0,2,0,0,0,0,0,1,1,1,1,1,1,2,2,1,1,0,0,2,0,1,0,1,0,1,1,1,1,0,3,5,3,4,0,0,0,1,0,0,0,0,0,0,0,2,1,0,0,2,0,1,3,2,3,2,2,4,2,3,0,0,0,1,0,0,0,0,2,2,1,1,0,1,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,1,1,0,0,0,2,2,2,1,1,0,5,0,2,2,5,0,2,5,3,4,3,3,3,3,3,3,1,1,1,0,0,1,1,1,1,0,0,1,1,1,0,0,1,1,0,1,1,0,1,3,4,0,0,0,0,0,0,1,1,3,1,1,0,2,2,1,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,2,0,0,0,0,0,0,2,1,0,0,0,0,0,0,0,0,0,0,0,1,0,1,2,1,2,1,1,1,1,1,0,0,2,5,4,2,2,3,2,3,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,2,1,0,0,2,1,1,0,0,0,0,0,0,0,0,2,0,0,1,1,0,0,1,0,0,0,0,1,2,0,0,2,1,0,0,1,1,0,1,0,0,2,3,3,2,0,0,1,1,0,0,2,0,0,0,1,1,0,0,1,0,1,1,0,0,0,0,0,0,3,1,4,2,2,0,2,1,2,2,2,0,1,0,0,0,0,1,0,0,0,1,0,0,0,0,0,0,2,2,0,1,1,1,2,0,2,1,1]},"Overheat":{"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"CBTMove":{"dict":["3T","12V","3W","8W","8V","5T","10H","6T","6W","9H","4T","11V","10V","0T","5W","4W","12H","14H","11H","2T","0W","7W","8H","13V","9V","9T","5G","15V","13H","7T","8T","5V","10J","18H","7H","14V","9J","5H","7V","8J","16V","10W","9W","11J","11W","2W","6V"],"values":[0,0,1,1,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,3,4,4,4,5,5,6,6,6,6,6,7,7,7,7,8,8,8,8,0,0,9,9,9,0,0,0,10,5,0,0,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,11,12,12,11,13,0,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,14,15,14,8,16,17,18,17,17,19,19,19,19,19,19,19,19,0,0,9,9,6,9,9,9,20,14,14,14,14,14,14,14,14,14,21,7,0,0,0,0,0,10,10,10,5,10,10,10,10,10,10,19,19,0,19,22,4,4,10,10,10,12,12,12,23,12,12,12,23,22,22,22,9,14,14,14,14,0,0,0,0,0,0,10,10,10,10,10,8,8,8,21,6,6,4,4,4,4,21,8,8,22,22,22,22,22,22,22,22,22,9,9,9,22,7,7,22,10,15,4,23,23,23,23,1,1,1,1,12,14,14,8,14,14,15,21,21,21,21,21,21,0,10,0,0,0,0,0,0,0,0,0,0,21,21,21,15,15,15,15,14,10,5,19,0,19,0,19,0,24,24,2,2,8,24,24,24,9,9,22,9,9,9,9,9,9,9,9,7,5,7,7,5,5,25,9,9,9,9,9,9,7,5,5,5,5,9,26,27,27,27,27,14,14,14,14,14,14,2,2,2,17,17,17,17,6,6,6,6,28,10,10,10,10,10,10,10,10,10,28,28,28,2,7,7,29,29,29,7,30,30,7,7,7,7,7,7,31,4,8,8,22,22,14,14,0,0,0,0,10,5,10,10,10,10,10,10,10,11,11,19,19,19,13,20,20,13,20,20,13,20,20,20,0,0,10,10,10,9,9,9,5,6,6,32,6,6,6,16,16,33,6,6,16,16,16,6,6,6,5,34,4,4,4,4,11,11,35,15,22,22,22,22,22,19,19,19,0,5,5,5,5,22,8,8,8,8,21,0,0,0,0,0,36,22,22,22,22,22,15,15,14,15,15,15,15,15,15,15,34,10,10,9,19,19,19,19,5,10,10,5,10,29,10,10,5,5,10,10,14,14,2,2,15,5,5,5,5,13,18,18,18,18,22,18,22,18,18,18,18,14,37,22,19,19,19,2,2,2,15,2,6,6,5,5,19,38,38,7,30,7,7,7,39,22,39,11,11,12,4,4,11,12,4,12,0,1,1,1,1,27,1,1,5,5,5,9,9,19,0,5,21,21,15,21,24,0,15,14,18,18,18,18,18,18,0,19,0,0,18,14,14,14,5,5,10,10,7,7,10,5,5,5,5,5,5,10,5,10,10,10,10,10,10,10,10,10,11,40,10,10,10,0,0,0,19,19,19,0,0,0,0,23,23,9,9,9,6,9,9,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,10,10,14,10,9,18,9,9,9,14,8,7,7,8,2,14,8,8,8,19,0,0,10,10,10,14,14,14,14,0,0,0,0,0,34,22,34,5,5,5,7,41,0,0,35,35,1,1,35,0,3,3,0,0,0,0,0,0,0,0,0,0,12,12,12,12,12,12,10,10,42,21,21,21,21,2,5,5,2,2,2,2,19,0,14,14,0,0,0,0,0,0,0,0,0,0,0,0,0,19,0,0,19,10,5,5,10,10,22,9,9,22,18,9,9,22,22,17,17,1,1,1,10,10,0,0,0,0,0,0,0,15,15,15,12,12,5,9,9,9,9,10,10,10,10,10,10,10,10,10,0,0,10,7,7,5,10,10,10,10,10,10,10,10,10,0,0,0,0,7,14,14,14,14,8,8,8,8,8,11,9,9,9,9,6,6,6,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,10,10,10,0,10,42,3,3,3,9,22,22,22,22,22,36,6,6,22,22,6,6,28,28,28,28,6,6,6,6,18,18,18,18,18,18,18,18,18,43,17,0,0,0,0,2,2,2,2,2,2,2,0,19,0,0,0,0,0,0,0,10,22,22,22,22,6,6,6,10,10,10,10,10,0,10,10,10,10,10,10,10,5,10,10,10,10,28,28,28,3,3,14,5,5,15,15,15,38,38,12,29,29,28,21,21,21,21,42,21,3,14,14,22,22,22,22,22,0,0,18,0,19,15,9,6,23,23,23,23,23,23,0,0,0,10,10,14,8,14,14,14,14,14,14,14,14,14,24,19,0,0,10,0,0,0,0,0,9,22,9,6,18,6,41,3,44,41,16,16,16,16,20,45,0,42,14,15,14,14,15,15,15,15,15,10,10,15,15,15,15,15,15,15,14,0,0,0,8,18,18,15,15,15,2,2,2,0,9,9,15,15,15,1,1,1,1,5,7,5,5,5,5,5,5,5,5,5,5,7,5,5,19,0,0,0,0,0,0,0,0,0,0,12,24,24,24,12,12,12,23,23,22,21,21,21,22,9,9,0,0,0,0,0,6,38,38,38,46,46,46,24,46,14,9,9,9,9,9,9,9,9,9,9,3,3,0,0,0,10,22,22,22,22,22,10,10,5]},"Armor":{"values":[2,3,2,2,6,6,7,10,10,10,10,10,10,6,4,10,7,7,10,2,2,2,2,3,3,1,1,1,1,1,1,1,1,1,1,2,2,2,9,2,2,2,2,5,8,8,7,7,6,5,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,2,2,2,2,10,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,5,5,0,2,2,1,2,2,7,11,7,7,7,7,7,7,9,6,4,4,4,2,2,2,8,6,6,6,6,6,6,6,6,6,2,2,5,5,6,5,7,3,3,6,7,6,6,3,6,8,7,3,3,5,4,3,3,3,8,8,8,2,3,3,2,2,1,3,2,2,2,3,2,4,4,4,5,10,8,8,8,8,9,3,3,3,3,3,3,2,4,2,4,4,2,2,2,2,2,2,2,3,4,5,5,4,5,5,4,5,3,4,4,3,3,3,4,4,4,4,1,1,1,2,1,1,2,1,1,4,4,4,4,3,4,1,1,1,1,1,1,5,7,6,4,7,6,6,5,9,9,12,9,2,4,2,5,5,6,5,6,5,4,20,5,12,7,5,7,4,4,5,5,5,2,2,2,3,3,4,4,3,4,4,4,5,4,4,1,1,1,5,6,5,4,3,3,3,3,3,3,6,6,6,6,6,3,8,0,0,1,0,0,1,0,0,1,0,7,7,7,3,3,3,3,5,5,5,6,5,8,8,9,8,7,7,8,8,7,1,1,1,9,3,2,4,5,4,3,4,4,2,2,2,2,4,3,3,4,4,5,3,3,3,2,8,10,10,8,6,6,6,6,4,4,4,4,6,2,2,23,23,23,1,3,3,2,3,3,2,3,3,3,13,13,7,4,4,3,3,3,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,6,3,1,1,1,2,3,3,3,1,2,2,2,2,2,2,5,2,5,2,2,2,2,1,2,2,2,2,3,12,12,12,12,12,4,3,3,3,3,3,3,4,3,4,4,3,3,4,3,4,8,3,3,2,3,4,6,6,3,2,2,3,3,3,2,2,3,3,5,5,3,3,5,5,4,0,1,0,1,1,3,3,4,3,3,4,3,4,3,4,4,3,2,2,6,6,2,4,4,4,4,4,3,3,6,5,4,4,4,4,4,4,4,4,2,2,4,1,1,1,1,1,1,1,2,1,8,1,1,1,1,1,1,1,7,7,7,4,4,5,6,4,2,2,4,5,3,2,2,2,2,2,2,2,2,1,2,2,2,4,2,2,2,2,6,6,3,3,3,3,5,7,7,7,7,7,7,6,6,6,6,6,6,6,6,6,6,6,1,1,4,5,4,7,10,8,7,7,12,7,8,8,8,1,1,1,1,2,2,2,2,4,4,3,3,4,3,4,4,4,4,4,4,4,3,3,4,4,4,5,5,4,6,3,3,3,3,3,2,2,2,2,3,1,3,3,3,3,2,2,2,8,8,8,5,5,4,5,7,7,6,3,2,4,5,6,5,5,5,5,3,9,9,1,2,2,1,1,5,1,1,4,6,6,6,6,5,6,6,6,4,3,3,3,3,3,3,4,5,2,2,2,2,2,4,3,3,4,4,4,4,8,7,3,3,5,5,5,5,5,7,5,5,3,3,3,5,5,5,3,3,6,8,8,8,8,8,3,3,3,3,4,3,3,3,3,3,3,0,0,0,4,3,5,5,5,6,5,5,6,6,6,6,2,3,6,3,3,3,3,6,6,7,6,5,6,6,6,6,4,4,7,3,3,2,4,5,4,4,4,4,4,4,4,6,6,6,7,3,4,4,4,4,5,6,5,5,6,2,4,2,3,4,6,6,4,9,9,11,9,9,9,9,9,1,1,1,1,1,1,1,6,6,6,8,8,1,1,1,1,5,1,2,1,1,1,4,4,4,4,4,4,4,1,1,1,1,5,5,5,5,4,4,4,4,4,4,4,4,4,4,4,7,7,7,7,6,6,6,6,6,6,6,5,5,5,6,4,3,5,4,7,5,3,5,3,4,3,4,4,2,2,4,2,3,2,3,2,2,2,2,2,2,2,2,3,9,9,1,1,1,2,2,7,4,3,6,6,6,3,3,3,4,4,0,2,2,2,2,2,2,2,4,4,5,4,5,3,5,9,9,3,6,22,3,3,3,1,1,1,1,1,1,2,2,3,2,4,3,3,4,4,4,4,3,4,3,3,3,2,3,10,11,11,10,10,10,11,11,3,4,3,2,2,2,1,1,0,1,2,2,2,2,10,14,7,2,4,5,4,5,6,6,6,7,7,3,3,6,6,6,6,6,6,6,5,7,7,1,2,3,3,4,4,4,7,7,7,7,3,3,2,8,8,2,2,2,2,3,5,4,3,5,3,4,3,2,3,2,4,5,3,3,7,7,7,5,6,7,6,6,12,12,16,1,1,1,1,1,1,2,1,1,1,2,2,2,3,3,3,10,10,10,10,10,1,2,2,2,2,1,2,3,3,7,4,4,4,4,4,4,4,4,4,5,4,4,6,6,6,6,5,5,5,5,5,2,2,2]},"ArmorIcons":{"dict":["AA","AAA","AAAAAA","AAAAAAA","AAAAAAAAAA","AAAA","A","AAAAAAAAA","AAAAA","AAAAAAAA","AAAAAAAAAAA","AAAAAAAAAAAA","AAAAAAAAAAAAAAAAAAAA","AAAAAAAAAAAAAAAAAAAAAAA","AAAAAAAAAAAAA","AAAAAAAAAAAAAAAAAAAAAA","AAAAAAAAAAAAAA","AAAAAAAAAAAAAAAA"],"values":[0,1,0,0,2,2,3,4,4,4,4,4,4,2,5,4,3,3,4,0,0,0,0,1,1,6,6,6,6,6,6,6,6,6,6,0,0,0,7,0,0,0,0,8,9,9,3,3,2,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,4,5,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,8,8,8,null,0,0,6,0,0,3,10,3,3,3,3,3,3,7,2,5,5,5,0,0,0,9,2,2,2,2,2,2,2,2,2,0,0,8,8,2,8,3,1,1,2,3,2,2,1,2,9,3,1,1,8,5,1,1,1,9,9,9,0,1,1,0,0,6,1,0,0,0,1,0,5,5,5,8,4,9,9,9,9,7,1,1,1,1,1,1,0,5,0,5,5,0,0,0,0,0,0,0,1,5,8,8,5,8,8,5,8,1,5,5,1,1,1,5,5,5,5,6,6,6,0,6,6,0,6,6,5,5,5,5,1,5,6,6,6,6,6,6,8,3,2,5,3,2,2,8,7,7,11,7,0,5,0,8,8,2,8,2,8,5,12,8,11,3,8,3,5,5,8,8,8,0,0,0,1,1,5,5,1,5,5,5,8,5,5,6,6,6,8,2,8,5,1,1,1,1,1,1,2,2,2,2,2,1,9,null,null,6,null,null,6,null,null,6,null,3,3,3,1,1,1,1,8,8,8,2,8,9,9,7,9,3,3,9,9,3,6,6,6,7,1,0,5,8,5,1,5,5,0,0,0,0,5,1,1,5,5,8,1,1,1,0,9,4,4,9,2,2,2,2,5,5,5,5,2,0,0,13,13,13,6,1,1,0,1,1,0,1,1,1,14,14,3,5,5,1,1,1,3,6,6,6,6,6,6,6,6,6,6,6,6,6,6,1,1,1,2,1,6,6,6,0,1,1,1,6,0,0,0,0,0,0,8,0,8,0,0,0,0,6,0,0,0,0,1,11,11,11,11,11,5,1,1,1,1,1,1,5,1,5,5,1,1,5,1,5,9,1,1,0,1,5,2,2,1,0,0,1,1,1,0,0,1,1,8,8,1,1,8,8,5,null,6,null,6,6,1,1,5,1,1,5,1,5,1,5,5,1,0,0,2,2,0,5,5,5,5,5,1,1,2,8,5,5,5,5,5,5,5,5,0,0,5,6,6,6,6,6,6,6,0,6,9,6,6,6,6,6,6,6,3,3,3,5,5,8,2,5,0,0,5,8,1,0,0,0,0,0,0,0,0,6,0,0,0,5,0,0,0,0,2,2,1,1,1,1,8,3,3,3,3,3,3,2,2,2,2,2,2,2,2,2,2,2,6,6,5,8,5,3,4,9,3,3,11,3,9,9,9,6,6,6,6,0,0,0,0,5,5,1,1,5,1,5,5,5,5,5,5,5,1,1,5,5,5,8,8,5,2,1,1,1,1,1,0,0,0,0,1,6,1,1,1,1,0,0,0,9,9,9,8,8,5,8,3,3,2,1,0,5,8,2,8,8,8,8,1,7,7,6,0,0,6,6,8,6,6,5,2,2,2,2,8,2,2,2,5,1,1,1,1,1,1,5,8,0,0,0,0,0,5,1,1,5,5,5,5,9,3,1,1,8,8,8,8,8,3,8,8,1,1,1,8,8,8,1,1,2,9,9,9,9,9,1,1,1,1,5,1,1,1,1,1,1,null,null,null,5,1,8,8,8,2,8,8,2,2,2,2,0,1,2,1,1,1,1,2,2,3,2,8,2,2,2,2,5,5,3,1,1,0,5,8,5,5,5,5,5,5,5,2,2,2,3,1,5,5,5,5,8,2,8,8,2,0,5,0,1,5,2,2,5,7,7,10,7,7,7,7,7,6,6,6,6,6,6,6,2,2,2,9,9,6,6,6,6,8,6,0,6,6,6,5,5,5,5,5,5,5,6,6,6,6,8,8,8,8,5,5,5,5,5,5,5,5,5,5,5,3,3,3,3,2,2,2,2,2,2,2,8,8,8,2,5,1,8,5,3,8,1,8,1,5,1,5,5,0,0,5,0,1,0,1,0,0,0,0,0,0,0,0,1,7,7,6,6,6,0,0,3,5,1,2,2,2,1,1,1,5,5,null,0,0,0,0,0,0,0,5,5,8,5,8,1,8,7,7,1,2,15,1,1,1,6,6,6,6,6,6,0,0,1,0,5,1,1,5,5,5,5,1,5,1,1,1,0,1,4,10,10,4,4,4,10,10,1,5,1,0,0,0,6,6,null,6,0,0,0,0,4,16,3,0,5,8,5,8,2,2,2,3,3,1,1,2,2,2,2,2,2,2,8,3,3,6,0,1,1,5,5,5,3,3,3,3,1,1,0,9,9,0,0,0,0,1,8,5,1,8,1,5,1,0,1,0,5,8,1,1,3,3,3,8,2,3,2,2,11,11,17,6,6,6,6,6,6,0,6,6,6,0,0,0,1,1,1,4,4,4,4,4,6,0,0,0,0,6,0,1,1,3,5,5,5,5,5,5,5,5,5,8,5,5,2,2,2,2,8,8,8,8,8,0,0,0]},"Structure":{"values":[3,3,2,2,3,3,5,5,5,5,5,5,5,5,5,5,5,5,4,2,2,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,5,3,1,1,1,4,4,5,4,4,4,4,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,5,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,2,1,1,1,1,1,5,5,5,5,5,5,5,5,5,5,3,3,3,2,2,2,4,3,3,3,3,3,3,3,3,3,2,2,4,4,4,4,4,3,3,3,3,3,3,3,3,5,5,4,4,4,10,3,3,3,4,4,4,2,2,2,2,2,2,2,2,1,1,1,1,3,3,3,3,5,5,5,5,5,5,2,2,2,2,2,2,2,2,2,3,3,2,2,2,2,1,1,1,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,2,2,2,2,1,1,1,1,2,2,2,2,2,3,3,3,3,3,3,1,1,1,1,1,1,4,4,4,4,4,4,4,4,5,5,5,5,3,3,3,3,3,3,3,3,3,2,14,4,10,5,5,5,2,2,4,4,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,1,1,1,1,1,1,1,1,1,1,4,4,4,1,1,1,1,3,3,3,3,3,4,4,4,4,4,4,4,4,4,1,1,1,4,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,2,2,2,2,3,2,5,5,5,5,3,3,3,3,3,3,3,3,3,2,2,16,16,16,1,2,2,2,2,2,2,2,2,2,5,5,4,3,3,3,3,3,4,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,2,2,2,2,2,2,2,3,1,1,1,1,1,4,4,4,4,1,1,1,1,1,1,1,1,1,1,5,5,5,5,5,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,7,3,3,2,5,5,5,5,2,2,2,2,2,2,2,2,2,2,2,2,2,2,4,4,4,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,4,4,4,3,3,3,3,3,2,2,2,2,11,3,3,1,1,1,1,1,2,2,3,2,2,2,2,2,2,2,3,2,5,2,2,2,2,2,2,2,4,4,4,2,2,4,4,3,1,1,3,3,2,3,2,2,2,2,2,2,2,2,3,3,3,3,2,1,1,1,3,3,2,2,2,2,4,4,4,4,4,4,4,3,3,3,3,3,3,3,3,3,3,4,1,1,4,4,4,5,5,5,5,5,5,5,3,3,3,1,1,1,1,1,1,1,1,3,3,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,2,3,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,3,4,3,4,4,4,3,3,3,3,4,4,4,3,3,3,3,3,2,2,2,2,1,5,5,2,2,2,2,2,4,1,1,5,5,5,5,5,5,5,5,5,5,2,2,2,2,2,2,3,3,1,1,1,1,1,3,4,4,3,3,3,3,9,5,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,4,4,4,2,2,4,2,2,2,2,3,3,3,3,3,3,3,3,3,4,4,3,2,2,2,3,3,3,3,3,3,3,3,3,5,5,5,5,2,3,3,3,3,3,3,3,3,3,2,3,3,3,3,3,3,3,4,4,5,4,4,4,4,4,1,1,1,1,1,1,1,4,4,4,4,4,1,1,1,1,3,2,2,2,2,2,2,2,2,2,2,2,2,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,4,4,4,4,4,4,4,4,4,4,5,4,4,4,4,4,4,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,4,4,1,1,1,2,2,3,2,2,4,4,4,2,2,2,2,2,1,1,1,1,1,1,1,1,3,3,3,2,3,3,3,4,4,3,4,13,3,2,2,1,1,1,1,1,1,3,3,3,3,3,2,3,2,2,2,2,2,2,2,2,2,2,9,5,5,5,5,5,5,5,5,2,2,2,2,2,2,1,1,1,1,1,1,1,1,4,11,4,1,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,5,5,3,2,2,2,3,3,3,4,4,4,4,3,3,2,4,4,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,5,4,4,4,4,4,4,4,4,4,4,1,2,2,2,2,1,1,2,2,1,1,1,1,3,3,3,4,4,4,4,4,1,2,2,2,2,2,2,2,2,5,2,2,2,2,2,2,2,2,2,2,2,2,4,4,4,4,3,3,3,3,3,2,2,2]},"StructureIcons":{"dict":["SSS","SS","SSSSS","SSSS","S","SSSSSSSSSS","SSSSSSSSSSSSSS","SSSSSSSSSSSSSSSS","SSSSSSS","SSSSSSSSSSS","SSSSSSSSS","SSSSSSSSSSSSS"],"values":[0,0,1,1,0,0,2,2,2,2,2,2,2,2,2,2,2,2,3,1,1,1,1,1,1,4,4,4,4,4,4,4,4,4,4,4,4,4,2,0,4,4,4,3,3,2,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,3,3,1,4,4,4,4,4,2,2,2,2,2,2,2,2,2,2,0,0,0,1,1,1,3,0,0,0,0,0,0,0,0,0,1,1,3,3,3,3,3,0,0,0,0,0,0,0,0,2,2,3,3,3,5,0,0,0,3,3,3,1,1,1,1,1,1,1,1,4,4,4,4,0,0,0,0,2,2,2,2,2,2,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,4,4,4,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,4,4,4,4,1,1,1,1,1,0,0,0,0,0,0,4,4,4,4,4,4,3,3,3,3,3,3,3,3,2,2,2,2,0,0,0,0,0,0,0,0,0,1,6,3,5,2,2,2,1,1,3,3,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,4,4,4,4,4,4,4,4,4,4,3,3,3,4,4,4,4,0,0,0,0,0,3,3,3,3,3,3,3,3,3,4,4,4,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,0,1,2,2,2,2,0,0,0,0,0,0,0,0,0,1,1,7,7,7,4,1,1,1,1,1,1,1,1,1,2,2,3,0,0,0,0,0,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,0,4,4,4,4,4,3,3,3,3,4,4,4,4,4,4,4,4,4,4,2,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,0,0,1,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,4,4,4,4,4,1,1,1,1,1,1,1,1,1,1,1,1,0,0,3,3,3,0,0,0,0,0,1,1,1,1,9,0,0,4,4,4,4,4,1,1,0,1,1,1,1,1,1,1,0,1,2,1,1,1,1,1,1,1,3,3,3,1,1,3,3,0,4,4,0,0,1,0,1,1,1,1,1,1,1,1,0,0,0,0,1,4,4,4,0,0,1,1,1,1,3,3,3,3,3,3,3,0,0,0,0,0,0,0,0,0,0,3,4,4,3,3,3,2,2,2,2,2,2,2,0,0,0,4,4,4,4,4,4,4,4,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,3,1,0,4,4,4,4,4,4,1,1,1,1,1,1,1,1,1,0,3,0,3,3,3,0,0,0,0,3,3,3,0,0,0,0,0,1,1,1,1,4,2,2,1,1,1,1,1,3,4,4,2,2,2,2,2,2,2,2,2,2,1,1,1,1,1,1,0,0,4,4,4,4,4,0,3,3,0,0,0,0,10,2,0,0,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,3,3,3,1,1,3,1,1,1,1,0,0,0,0,0,0,0,0,0,3,3,0,1,1,1,0,0,0,0,0,0,0,0,0,2,2,2,2,1,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,3,3,2,3,3,3,3,3,4,4,4,4,4,4,4,3,3,3,3,3,4,4,4,4,0,1,1,1,1,1,1,1,1,1,1,1,1,4,4,4,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,3,3,3,3,3,3,3,3,3,3,2,3,3,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,3,4,4,4,1,1,0,1,1,3,3,3,1,1,1,1,1,4,4,4,4,4,4,4,4,0,0,0,1,0,0,0,3,3,0,3,11,0,1,1,4,4,4,4,4,4,0,0,0,0,0,1,0,1,1,1,1,1,1,1,1,1,1,10,2,2,2,2,2,2,2,2,1,1,1,1,1,1,4,4,4,4,4,4,4,4,3,9,3,4,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,0,1,1,1,0,0,0,3,3,3,3,0,0,1,3,3,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,3,3,3,3,3,3,3,3,3,3,4,1,1,1,1,4,4,1,1,4,4,4,4,0,0,0,3,3,3,3,3,4,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,3,0,0,0,0,0,1,1,1]},"TMM":{"values":[1,1,4,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,4,3,3,2,2,4,4,4,4,4,2,2,2,2,2,2,2,2,1,1,3,3,3,1,1,1,1,2,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,4,4,4,4,0,1,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,2,1,2,2,4,4,4,4,4,0,0,0,0,0,0,0,0,1,1,3,3,4,3,3,3,0,3,3,3,3,3,3,3,3,3,3,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,0,0,1,0,3,3,3,1,1,1,4,4,4,5,4,4,4,5,3,3,3,3,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,2,2,2,3,4,4,3,3,3,3,3,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,2,2,3,1,1,3,4,4,4,4,4,4,4,4,4,2,2,2,2,2,2,3,3,3,3,3,3,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,1,1,1,1,2,1,2,0,1,0,1,0,1,3,3,1,1,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,2,2,2,2,2,2,3,3,3,3,3,3,3,2,2,2,2,2,3,2,4,5,4,4,2,2,2,2,2,2,1,1,1,4,4,4,4,4,4,4,4,4,1,1,1,1,1,1,1,1,1,4,4,4,1,2,2,3,3,3,2,3,3,2,2,2,3,2,2,2,3,2,2,3,3,2,2,1,1,1,1,1,2,1,1,1,1,1,1,1,4,4,0,0,0,0,0,0,1,0,0,0,0,0,0,1,1,1,1,1,3,3,3,2,4,4,5,4,4,4,4,4,5,4,4,4,4,4,4,4,4,2,3,3,3,3,3,4,4,4,1,3,3,3,3,3,0,0,0,1,2,2,2,2,3,2,2,2,2,3,1,1,1,1,1,4,3,3,3,3,3,1,1,2,1,1,1,1,1,1,1,3,1,1,3,0,0,0,0,2,1,1,2,1,3,1,1,2,2,1,1,2,2,1,1,1,2,2,2,2,0,4,4,4,4,3,4,3,4,4,4,4,3,2,3,0,0,0,1,1,1,1,1,4,4,2,2,0,3,3,2,3,2,2,2,4,3,4,4,4,4,3,3,5,4,4,4,1,4,4,4,4,4,4,4,2,2,2,3,3,0,1,2,3,3,1,3,3,1,1,2,4,4,4,4,4,5,1,0,1,1,5,2,2,2,2,2,1,1,2,2,1,2,2,2,2,2,2,1,2,1,1,1,1,1,1,1,1,1,4,4,1,1,1,1,1,1,0,0,0,1,1,1,1,4,4,3,3,3,4,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,1,1,2,1,3,4,3,3,3,2,2,2,2,2,1,2,2,2,2,0,1,1,1,1,1,2,2,2,2,1,1,1,1,1,3,3,3,2,2,2,2,4,1,1,4,4,4,4,4,1,3,3,1,1,1,1,1,1,1,1,1,1,4,4,4,4,4,4,1,1,4,3,3,3,3,2,2,2,1,1,1,1,0,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,0,1,2,2,1,1,3,3,3,3,4,3,3,3,3,4,4,4,4,4,1,1,1,1,1,1,1,1,1,1,1,1,4,4,3,3,3,3,3,1,1,1,1,1,1,1,1,2,1,1,1,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,4,3,4,3,3,4,4,5,1,1,1,1,1,1,1,1,4,4,4,4,4,4,4,1,1,1,1,1,3,3,3,3,3,3,3,3,3,3,4,4,4,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,4,1,1,1,1,1,1,1,1,1,1,1,1,0,2,1,1,1,1,1,1,1,3,3,3,3,4,4,4,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,4,4,4,3,3,2,2,2,1,1,1,4,3,4,3,3,4,3,3,3,3,4,3,3,2,2,3,4,3,3,3,1,1,4,1,0,1,3,4,4,4,4,4,4,4,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,3,4,0,1,1,1,1,1,1,1,1,3,3,3,4,4,4,4,3,4,4,4,4,4,4,0,0,1,3,2,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,4,4,1,1,1,1,1,1,1,3,3,1,1,1,4,4,4,4,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,1,1,1,1,1,1,1,1,1,1,4,3,3,3,4,4,4,5,5,3,3,3,3,3,3,3,1,1,1,1,1,4,3,4,3,2,2,2,3,2,2,3,3,3,3,3,3,3,3,3,3,3,3,1,1,1,1,3,3,3,3,3,1,1,2]},"RegSkill":{"values":[6,6,5,6,5,5,5,6,6,6,5,6,6,6,6,6,6,6,6,5,6,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,5,5,4,4,4,5,4,6,6,5,5,5,5,5,5,4,5,6,6,6,6,6,6,6,6,5,5,5,5,6,6,5,5,5,5,5,5,5,4,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,5,5,4,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,5,5,6,5,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,4,4,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,5,6,6,6,6,5,6,5,5,5,6,6,6,6,6,6,5,5,5,4,5,6,6,6,5,5,5,5,5,5,5,4,5,5,4,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,5,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,5,5,5,5,5,5,4,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,5,6,6,6,6,5,5,4,4,6,6,6,6,6,6,6,6,6,6,6,6,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,5,6,6,6,5,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,5,5,5,5,6,6,6,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,5,5,6,5,6,6,6,6,6,6,6,6,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,5,6,6,5,4,6,6,6,6,6,6,6,6,6,6,6,6,5,5,6,5,5,5,5,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,5,5,5,6,6,6,6,6,6,6,6,6,6,5,5,5,5,5,5,5,5,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,5,6,5,6,5,6,6,5,6,6,6,6,5,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,5,5,5,5,5,6,6,6,6,6,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,5,6,5,6,5,5,5,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,6,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,6,5,5,6,6,6,5,6,6,6,6,6,5,6,6,6,6,6,6,6,6,6,6,6,5,5,6,6,6,6,6,6,6,6,5,5,5,5]},"VetSkill":{"values":[5,5,4,5,4,4,4,5,5,5,4,5,5,5,5,5,5,5,5,4,5,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,4,3,3,3,4,3,5,5,4,4,4,4,4,4,3,4,5,5,5,5,5,5,5,5,4,4,4,4,5,5,4,4,4,4,4,4,4,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,4,4,3,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,3,3,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,4,5,5,5,5,4,5,4,4,4,5,5,5,5,5,5,4,4,4,3,4,5,5,5,4,4,4,4,4,4,4,3,4,4,3,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,4,4,4,4,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,4,5,5,5,5,4,4,3,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,4,4,4,4,5,5,5,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,4,4,5,4,5,5,5,5,5,5,5,5,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,4,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,4,4,4,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,4,4,4,5,5,5,5,5,5,5,5,5,5,4,4,4,4,4,4,4,4,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,3,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,4,5,5,4,5,5,5,5,4,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,4,4,4,4,4,5,5,5,5,5,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,4,5,4,5,4,4,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,4,4,5,5,5,4,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,5,5,4,4,4,4]},"RegPV":{"values":[12,15,29,27,23,34,54,47,53,56,61,46,50,27,29,35,38,39,40,17,29,26,23,31,29,12,11,10,11,10,8,6,7,6,8,8,9,8,44,32,30,30,18,54,68,54,48,64,28,26,24,23,25,23,19,23,27,23,15,19,16,20,14,15,16,19,41,35,42,41,64,24,43,46,48,43,44,38,44,56,48,32,31,35,35,32,36,35,32,30,35,32,36,37,32,44,4,21,16,17,15,18,39,44,45,39,58,44,41,38,50,44,38,44,62,15,24,14,19,42,44,42,39,44,36,38,46,41,20,18,32,36,33,28,32,17,17,25,29,24,24,21,25,38,35,26,29,30,47,29,34,28,49,54,37,26,26,30,21,22,23,25,24,18,15,19,15,34,35,33,46,40,44,55,49,41,44,24,24,24,24,24,19,20,23,22,64,63,18,25,18,17,16,14,10,27,23,33,33,34,40,32,34,32,35,32,35,42,23,24,19,9,8,20,20,16,21,20,20,27,21,23,26,25,26,18,29,21,30,7,10,9,9,11,9,42,38,40,26,34,38,31,27,39,48,57,43,23,25,18,28,41,30,22,38,33,17,90,31,55,33,44,58,27,30,36,46,21,28,31,29,28,29,37,32,27,34,50,44,49,47,48,7,14,9,47,41,43,40,50,46,43,48,35,43,64,46,55,53,41,26,52,8,8,11,6,2,4,8,5,6,4,27,32,38,23,23,24,23,49,42,48,48,43,29,37,34,29,46,42,29,30,32,15,15,12,31,23,13,31,40,32,18,33,24,12,13,12,18,22,16,15,49,15,23,25,25,22,8,43,68,49,40,25,23,24,23,15,20,16,21,24,38,25,118,94,85,5,19,16,16,13,12,9,13,17,16,64,66,56,44,34,46,68,47,35,16,22,23,24,22,24,23,15,27,18,23,20,23,19,29,30,35,23,27,15,19,15,24,35,32,22,6,11,14,12,15,15,31,32,30,31,5,10,6,11,13,8,11,8,11,18,68,64,58,56,60,41,36,40,29,36,36,15,14,22,17,17,18,17,20,18,23,50,12,21,17,58,62,70,62,20,16,16,20,18,28,16,18,21,17,11,15,25,26,43,46,31,2,4,2,9,3,23,20,32,24,20,35,20,32,24,30,32,29,33,43,48,54,42,31,33,30,30,27,29,24,42,35,50,39,37,20,23,22,16,13,25,25,43,17,11,12,19,15,14,19,20,17,38,13,16,11,17,16,14,14,36,40,38,36,37,37,41,23,14,14,32,41,25,20,16,20,26,26,26,21,32,25,22,32,35,32,28,6,8,7,26,30,13,17,19,16,29,44,34,38,33,34,42,28,30,29,34,31,36,26,34,37,28,37,25,13,29,28,31,40,47,46,67,64,81,68,26,26,27,14,11,9,9,12,18,12,11,35,43,27,29,37,30,36,36,42,38,46,37,33,29,27,25,24,32,28,25,16,24,25,26,23,23,28,7,9,20,26,21,12,19,18,19,20,37,37,36,32,38,33,36,36,17,28,50,52,35,24,22,34,33,36,23,23,22,25,34,41,45,20,21,19,22,20,26,30,22,31,42,41,41,32,33,34,37,32,31,44,48,35,56,46,52,31,32,19,14,14,19,12,29,34,30,29,27,29,31,82,36,16,18,25,26,30,30,42,41,30,30,19,16,21,30,30,29,30,23,25,28,37,33,32,42,25,30,32,30,38,29,31,27,15,38,38,20,8,26,18,16,18,21,26,23,26,27,28,36,38,32,30,30,40,25,28,25,25,20,26,28,21,19,30,36,27,32,32,34,29,19,21,16,25,26,24,25,25,25,20,22,22,37,43,42,54,21,10,25,24,25,21,23,19,28,30,32,31,23,28,41,43,59,41,39,39,45,39,39,46,39,44,15,15,10,15,10,15,12,27,30,34,41,41,12,13,12,12,38,19,22,11,19,24,29,32,31,29,28,33,32,15,11,15,12,25,35,30,25,32,27,27,27,23,34,35,36,38,35,49,28,28,29,29,48,51,37,55,42,52,55,24,32,29,40,25,23,27,34,32,28,21,29,26,29,27,36,36,11,11,14,10,14,12,14,11,13,11,11,13,12,13,12,18,49,54,25,14,20,19,15,23,22,16,44,43,48,29,34,37,35,26,7,14,15,10,14,21,21,22,18,22,50,29,42,40,47,43,43,44,38,66,28,28,30,12,13,11,11,18,9,26,27,32,33,36,20,20,22,27,22,28,16,19,19,20,26,35,46,36,54,47,40,41,51,53,53,27,30,30,34,34,41,12,7,5,12,18,19,19,18,41,91,39,15,23,21,22,35,22,27,27,29,30,16,16,26,28,31,31,29,22,22,28,37,32,5,24,25,30,18,26,18,39,32,39,40,38,28,19,25,26,22,27,24,25,16,26,16,14,26,20,16,16,14,16,17,18,35,19,21,50,35,37,30,30,40,27,36,38,41,46,10,15,15,20,15,20,19,18,22,13,14,16,16,27,27,30,53,40,59,55,42,11,26,25,31,21,18,23,23,25,28,35,33,33,31,29,23,26,31,33,33,36,36,26,29,30,32,28,38,38,38,54,22,14,23]},"VetPV":{"values":[14,18,34,32,27,40,63,56,63,67,71,55,60,32,35,42,46,47,48,20,35,30,27,36,34,14,13,12,13,12,10,7,8,7,10,10,11,10,53,38,35,35,21,63,79,63,56,75,34,31,28,27,29,27,22,27,32,27,18,23,19,24,17,18,19,23,48,41,49,48,76,29,50,54,56,50,51,44,51,66,56,38,37,42,42,38,43,42,38,36,42,38,43,44,38,53,5,25,19,20,18,22,47,53,54,47,68,53,49,46,60,53,44,51,72,18,29,17,23,49,53,50,47,53,43,46,55,49,24,22,38,43,40,34,38,20,20,30,35,29,29,25,30,46,42,31,35,36,56,35,40,34,57,63,43,31,31,36,25,26,28,30,29,22,18,23,18,40,41,40,54,48,53,64,59,49,53,29,29,29,29,29,23,24,28,26,75,73,22,30,22,20,19,17,12,32,28,40,40,41,47,38,41,38,42,38,42,49,28,29,23,11,10,24,24,19,25,24,24,32,25,28,31,30,31,22,35,25,36,8,12,11,11,13,11,50,46,47,31,41,46,37,32,47,58,68,52,28,30,22,34,48,36,26,46,40,20,108,37,66,40,51,69,32,36,43,54,25,33,36,34,34,35,44,38,32,41,58,51,57,55,56,8,17,11,55,48,50,47,58,54,50,56,41,50,75,54,64,62,48,31,62,10,10,13,7,3,5,10,6,7,5,32,38,46,28,28,29,28,59,50,58,58,52,35,44,41,35,55,50,35,36,38,18,18,14,37,27,16,37,48,37,22,40,29,14,16,14,22,26,19,18,57,18,28,30,30,26,10,52,79,59,48,30,28,29,28,18,24,19,25,29,44,29,137,112,102,6,23,19,19,16,14,11,16,20,19,74,77,65,51,40,54,79,55,42,19,26,28,29,26,29,28,18,32,22,28,24,28,23,35,36,42,28,32,18,23,18,29,42,38,26,7,13,17,14,18,18,37,38,36,37,6,12,7,13,16,10,13,10,13,22,79,74,68,65,70,48,42,47,34,42,42,18,17,26,20,20,22,20,24,22,27,60,14,25,20,68,72,82,72,24,19,19,24,22,34,19,22,25,20,13,18,29,30,50,54,36,3,5,3,11,4,28,24,38,29,24,42,24,37,29,36,38,35,40,52,58,63,50,37,40,36,36,32,35,29,49,41,60,47,44,23,28,26,19,16,30,30,50,20,13,14,23,18,17,23,24,20,46,16,19,13,20,19,17,17,43,48,46,42,43,43,48,28,17,17,37,48,30,24,19,24,31,31,31,25,38,30,26,38,42,37,34,7,10,8,31,36,16,20,23,19,35,53,41,46,40,41,50,34,36,35,41,37,42,31,40,43,34,43,30,16,35,34,37,48,56,55,78,74,94,79,31,31,32,17,13,11,11,14,22,14,13,42,52,32,35,44,36,43,43,50,46,54,44,40,35,32,30,29,38,34,30,19,29,30,30,28,28,33,8,11,23,30,25,14,23,22,23,24,44,44,43,38,46,40,42,42,20,33,58,61,41,29,26,41,40,43,28,28,26,30,40,49,54,24,25,23,26,24,30,35,26,37,50,49,49,38,40,41,44,38,37,51,56,41,65,54,61,36,37,23,17,17,23,14,34,41,36,35,32,35,37,98,43,19,21,30,31,36,36,50,48,36,36,23,19,25,36,36,35,36,28,30,34,44,40,38,49,30,36,38,36,46,35,37,32,18,46,46,24,10,31,22,19,22,25,30,28,31,32,34,43,46,38,36,36,48,30,34,30,30,24,31,34,25,23,36,43,32,38,38,41,35,23,25,19,30,31,29,30,30,30,24,26,26,44,52,50,63,25,12,30,29,30,25,28,23,34,36,38,37,28,34,48,52,69,48,47,47,54,47,47,55,47,53,18,18,12,18,12,18,14,32,36,41,49,49,14,16,14,14,46,23,26,13,23,29,34,38,37,35,34,40,38,18,13,18,14,30,42,36,30,38,32,32,32,28,40,41,43,44,42,57,34,34,34,35,58,61,44,64,50,62,66,29,38,35,47,30,28,32,41,38,34,25,35,31,35,32,43,43,13,13,17,12,17,14,17,13,16,13,13,16,14,16,14,22,57,63,29,16,23,23,18,28,26,19,51,50,56,34,40,43,41,31,8,17,18,12,17,25,25,26,22,26,58,35,49,48,55,50,50,53,46,79,33,34,36,14,16,13,13,22,11,31,32,38,40,42,24,24,26,32,26,34,19,23,23,24,31,41,55,43,64,56,48,49,61,63,63,32,36,36,40,40,48,14,8,6,14,22,23,23,22,49,109,47,18,28,25,26,41,26,32,32,35,36,19,19,31,34,37,37,35,26,26,34,44,38,6,29,30,36,22,31,22,47,38,47,48,44,34,23,30,31,26,32,29,30,19,31,19,17,31,24,19,19,17,19,20,22,41,23,25,58,42,44,36,36,48,32,43,46,49,55,12,18,18,24,18,24,23,22,26,16,17,19,19,32,32,36,62,48,69,64,50,13,31,29,37,25,22,28,28,29,34,42,40,40,37,35,28,31,37,40,40,42,42,31,35,36,38,34,46,46,46,63,26,17,27]},"Specials":{"values":["AC1/1/1,EE,SRCH","C3S,FLK0*/1/1,MHQ1,SRCH","ATMO,ECM,ENE,SRCH","ATMO,CT0.5,ECM,ENE,PRB,RCN,SRCH","ARS,CASE,FLK0*/1/1,SRCH,TUR(0*/1/1,FLK0*/1/1)","ARS,CASE,FLK3/2/2,SRCH,TUR(3/3/3,FLK3/2/2)","ARS,ARTLTC-1,CASE,IT10,SRCH,TUR(4/4/-)","C3S,CASE,ECM,IF1,MHQ1,SEAL,SRCH,TOR1/1/-,TUR(4/3/2,IF1,TOR1/1/-)","C3S,CASE,ECM,MHQ1,OMNI,SRCH,TUR(7/7/-)","C3M,CASE,IF4,MHQ5,OMNI,SRCH,TAG,TUR(3/5/5,IF4)","CASE,ECM,OMNI,SRCH,TUR(2/2/2)","ARTAIS-1,CASE,CT8,DCC6,ECM,IT4,OMNI,REAR0*/0*/-,SRCH,TUR(1/1/-,ARTAIS-1)","C3S,CASE,MHQ1,OMNI,SRCH,TUR(5/6/3)","AC3/3/-,SRCH,TUR(3/3/-,AC3/3/-)","AC5/5/-,SRCH,TUR(5/5/-,AC5/5/-)","AC3/3/-,SRCH,TUR(3/3/-,AC3/3/-)","AC6/6/-,SRCH,TUR(6/6/-,AC6/6/-)","SRCH,TUR(4/5/5)","SRCH","AMP,ENE,FC,IT5,SRCH,TUR(1/-/-)","ATMO,CASE,CT6,ECM,IF1,LRM1/1/1,SRCH,STL","ATMO,ENE,IT7,REAR1/1/-,SRCH","ATMO,CASE,ECM,IT10,REAR1/1/-,SRCH","CASE,IF1,SRCH,TUR(1/1/1)","CASE,HT1/1/1,IF1,SRCH,TUR(HT1/1/1)","EE,IF0*,SRCH","EE,SRCH,TUR(1/-/-)","EE,ENE,IT1,RCN,RSD1,SRCH","EE,IT1,SRCH","EE,IT1,SRCH,TUR(0*/-/-)","EE,IF0*,SRCH","EE,SRCH,TUR(1/-/-)","EE,IT1,SRCH","EE,IT1,SRCH,TUR(0*/-/-)","EE,IF0*,SRCH","EE,SRCH,TUR(1/-/-)","EE,IT1,SRCH,TUR(0*/0*/-)","EE,IT1,SRCH,TUR(0*/-/-)","AMS,ARTAIS-1,CASE,HTC,SRCH,TUR(3/2/-,AMS,ARTAIS-1)","ARTAIS-2,EE,SRCH","CASE,SRCH,TAG,TUR(3/3/-)","CASE,SRCH,TUR(3/3/-)","CASE,FC,SRCH,TUR(1/1/-)","CASE,IF1,SRCH,TUR(2/2/-)","CASE,ECM,FLK4/4/4,SRCH,TUR(3/3/-)","CASE,FC,SRCH,TUR(6/5/-)","CASE,ECM,IF2,SRCH,TUR(4/4/4,IF2)","AMS,CASE,ECM,IF2,SRCH,TUR(4/4/4,IF2,AMS)","AC2/2/0,EE,IF1,SRCH,TUR(3/3/1,AC2/2/0,IF1)","AC2/2/0,EE,IF1,REAR0*/-/-,SRCH,TUR(3/3/1,AC2/2/0,IF1)","CASE,IT5,OMNI,SRCH,TUR(3/2/-)","CASE,IT5,OMNI,SRCH,TUR(2/2/-)","CASE,IF1,IT5,OMNI,SRCH,TUR(2/2/1,IF1)","CASE,IT5,OMNI,SRCH,TUR(2/2/-)","CASE,IT5,OMNI,SRCH,TUR(2/1/0*)","CASE,IT5,OMNI,SRCH,TUR(2/2/-)","CASE,IT5,OMNI,SRCH,TUR(2/2/-)","CASE,IT5,OMNI,SRCH,TUR(2/2/-)","IT4,OMNI,SRCH,TUR(1/1/-)","IT4,OMNI,SRCH,SRM1/1,TUR(1/1/-)","IF1,IT4,OMNI,SRCH,TUR(0*/0*/0*)","ENE,IT4,OMNI,SRCH,TUR(2/2/-)","ENE,IT4,OMNI,REAR0*/-/-,SRCH,TUR(2/-/-)","ENE,IT8,OMNI,SRCH,TUR(1/1/-)","IT4,OMNI,SRCH,TUR(1/1/1)","IT4,OMNI,SRCH,TUR(2/2/-)","ATMO,CASE,SRCH","ATMO,CASE,SRCH","ATMO,CASE,CT0.5,IF1,LRM1/1/1,SRCH","ATMO,CASE,ECM,PRB,RCN,SRCH,TAG","AMS,ARTAIS-2,C3S,CASE,CR,ECM,HTC,IT4,MHQ5,REAR0*/0*/-,SRCH,TUR(2/2/2,AMS,ARTAIS-2)","ARTS-1,EE,REAR0*/-/-,SRCH,TUR(ARTS-1)","CASE,IT5,OMNI,SRCH,TUR(2/2/1)","CASE,IF1,IT5,LRM1/1/1,OMNI,SRCH,TUR(2/2/2,LRM1/1/1,IF1)","ENE,IT5,OMNI,SRCH,TUR(3/3/-)","CASE,FLK0*/0*/0*,IT5,OMNI,SRCH,TUR(0*/0*/0*,FLK0*/0*/0*)","CASE,IT5,OMNI,SRCH,TUR(3/2/1)","CASE,HT1/1/1,IT5,OMNI,SRCH,TUR(1/1/1,HT1/1/1)","CASE,ECM,IT5,OMNI,PRB,RCN,SRCH,TUR(2/2/-)","CASE,IT5,OMNI,SRCH,TUR(2/2/-)","CASE,IT5,OMNI,SRCH,TUR(3/3/-)","ARS,SRCH,TUR(2/1/-)","ENE,IT4,OMNI,SRCH,TUR(1/1/1)","IT4,OMNI,SRCH,SRM1/1,TUR(2/2/-,SRM1/1)","IT4,OMNI,SRCH,SRM1/1,TUR(2/2/-,SRM1/1)","IF1,IT4,OMNI,SRCH,TUR(0*/1/1,IF1)","IF1,IT4,OMNI,SRCH,TUR(0*/1/1,IF1)","ENE,IT4,OMNI,SRCH,TUR(1/1/-)","ENE,IT4,OMNI,SRCH,TUR(1/1/-)","IT8,OMNI,SRCH,TUR(1/1/-)","IT4,OMNI,SRCH,TUR(1/1/1)","ARS,CASE,SRCH,TUR(2/1/-)","IT4,OMNI,SRCH,TUR(2/2/-)","IF0*,INARC,MDS2,RCA,SRCH,TUR(2/2/1,INARC)","IF0*,MDS4,MSW,RCA,SRCH,TUR(2/3/2)","IF2,MDS4,MSW,RCA,SRCH,TUR(1/2/2,IF2)","CT10,EE,ENE,SRCH","ENE,PRB,RCN,SRCH,TUR(1/1/-)","AMS,C3I,MHQ2,SRCH,TUR(AMS)","ENE,MDS2,PRB,RCN,SRCH","C3I,ENE,MHQ2,SEAL,SRCH","ECM,ENE,PRB,RCN,SRCH,TAG,TUR(TAG)","AC2/2/-,EE,IF1,LRM1/1/1,SRCH,SRM2/2,TUR(4/4/-,SRM2/2,AC2/2/-)","AC2/2/-,EE,IF1,LRM1/1/1,SRCH,SRM2/2,TUR(4/4/-,SRM2/2,AC2/2/-)","CASE,SRCH,TUR(5/5/3)","AC2/2/-,EE,HT2/-/-,IF1,LRM1/1/1,SRCH,SRM2/2,TUR(4/4/-,SRM2/2,AC2/2/-)","BRA,CASE,SRCH,TUR(7/7/4)","IF1,SRCH,TUR(7/7/3)","CASE,EE,IF2,LRM0/2/2,SRCH,SRM5/2,TUR(3/3/2,IF1)","CASE,EE,FLK1/1/1,IF1,LRM1/1/1,SRCH,SRM2/2,TUR(3/3/2,FLK1/1/1,SRM2/2)","SRCH,IF4, TUR(4/6/6,IF4)","IF2,LRM1/2/2,SRCH,TUR(5/7/5,IF2,LRM1/2/2)","CASE,SRCH,TUR(2/2/2)","CASE,IF1,SRCH,TUR(2/2/2,IF1)","ARS,CASE,SRCH,TUR(3/3/3)","EE,IF0*,IT6,SRCH,TUR(0*/0*/0*,IF0*)","ECM,EE,SRCH,SRM1/1,TUR(2/2/-,SRM 1/1)","EE,IT6,SRCH,TUR(0*/0*/-)","AMS,CASE,CT18,HTC,IT4,MFB,SRCH","AMS,C3S,ECM,IT4,MHQ1,OMNI,SRCH,STL,TAG,TUR(1/1/1,AMS,TAG)","C3M,C3S,ECM,IF1,IT4,MHQ6,OMNI,SRCH,STL,TAG,TUR(3/2/1,IF1)","C3S,ECM,IT4,MHQ1,OMNI,SRCH,STL,TAG,TUR(3/3/-,TAG)","ARTSC-1,C3S,ECM,IT4,MHQ1,OMNI,SRCH,STL,TUR(ARTSC-1)","C3S,ECM,IF0*,IT4,MHQ1,OMNI,SRCH,STL,TAG,TUR(3/3/0*,IF0*,TAG)","AMS,C3I,ECM,IT6,MHQ2,OMNI,SRCH,STL,TUR(1/1/1,AMS)","AC1/1/-,C3I,ECM,IT6,MHQ2,OMNI,SRCH,STL,TUR(2/2/-,AC1/1/-)","C3I,ECM,IT6,MHQ2,OMNI,SRCH,STL,TUR(4/4/-)","C3I,ECM,IF1,IT6,MHQ2,OMNI,SRCH,STL,TUR(3/2/1,IF1)","AMS,CASE,ECM,MHQ4,RCN,SRCH,TUR(AMS)","AMS,CASE,ECM,MHQ4,SRCH,TUR(AMS)","IF1,LRM1/1/1,SRCH,SRM1/1,TUR(3/3/2,IF1,LRM1/1/1)","C3S,IF1,LRM1/1/1,MHQ1,SRCH,SRM1/1,TUR(2/3/3,IF1,LRM1/1/1)","IF2,LRM1/2/2,SRCH,SRM1/1,TUR(2/3/3,IF2,LRM1/2/2)","SRCH,TUR(3/3/1)","SRCH,SRM1/1,TUR(2/2/2)","EE,SRCH,SRM1/1,TUR(2/2/-,SRM1/1)","EE,SRCH,SRM1/1,TUR(2/2/0*,SRM1/1)","FC,IF1,SRCH,TUR(3/2/1, IF1)","CR,FC,SRCH,SRM1/1,TUR(2/2/-,SRM1/1)","CASE,FC,SRCH,TUR(2/2/1)","CASE,FC,FLK1/1/1,SRCH,SRM1/1,TUR(2/2/1,FLK1/1/1,SRM1/1)","EE,IF1,LRM1/1/1,SRCH,SRM1/1,TUR(2/3/2,IF1,LRM1/1/1,SRM1/1)","CASE,FC,SRCH,TUR(3/3/-)","SRCH,TUR(2/2/2)","SRCH,TUR(2/2/2)","IF1,SRCH,TUR(3/3/3)","C3I,MHQ2,SRCH,TUR(3/3/3)","SRCH,TUR(3/3/3)","AC8/8/-,IF1,SRCH,TUR(8/8/-,AC8/8/-)","FC,IF1,SRCH,TUR(2/2/2,IF1)","ATMO,FLK0*/0*/0*,IF0*,IT10,SRCH","ATMO,IF0*,IT12,SRCH","CASE,ECM,SRCH,TUR(3/3/3)","AMS,CASE,ECM,FLK3/2/2,SRCH,TUR(3/3/3,AMS,FLK3/2/2)","CASE,FLK1/1/1,SRCH,TUR(1/1/1,FLK1/1/1)","ATMO,EE,SRCH,SRM1/1","ATMO,IT4,SRCH","ATMO,IT3.5,SRCH","ATMO,ECM,IT4,SRCH,STL,TUR(0*/0*/-)","ATMO,EE,IF1,SRCH","ATMO,EE,SRCH,SRM2/2","ATMO,EE,IF1,SRCH,TAG","ATMO,ECM,IT4,SRCH,STL","EE,PRB,RCN,REAR0*/-/-,SRCH","EE,SRCH","ECM,EE,PRB,RCN,REAR0*/-/-,SRCH,TAG","ARS,ECM,FC,RFA,SRCH,TUR(0*/0*/-)","CASE,REAR0*/0*/-,SRCH,TUR(3/3/2)","CASE,REAR0*/0*/-,SRCH,TUR(3/3/-)","CASE,REAR0*/0*/-,SRCH,TUR(4/4/-)","CASE,CR,SRCH,TUR(5/5/2)","FLK1/1/1,SRCH,TUR(3/4/3,FLK1/1/1)","AMS,FLK1/1/1,IF1,REAR0*/-/-,SRCH,TUR(3/3/3,AMS,FLK1/1/1,IF1)","C3M,MHQ5,SRCH,TAG,TUR(3/4/4)","C3S,ECM,IF1,MHQ1,SRCH,TUR(4/5/4,IF1)","AMS,FLK1/1/1,,IF0*,REAR0*/-/-,SEAL,SRCH,TOR1/1/-,TUR(3/3/2,AMS,FLK1/1/1,IF0*)","FLK1/1/1,IF2,SRCH,TUR(3/3/3,FLK1/1/1)","ARTAIS-1,REAR1/1/-,SRCH","ARTAIS-1,CASE,REAR1/1/-,SRCH","ARTAIS-1,REAR1/1/-,SRCH","ARTAIS-1,REAR1/1/-,SRCH","ARTAIS-1,REAR1/1/-,SRCH","SRCH,TUR(1/1/1)","PRB,RCN,SRCH,TUR(1/1/1)","IF0*,SRCH,TUR(1/1/1)","SRCH,TUR(1/1/1)","CASE,SRCH,TUR(4/4/0)","CASE,ECM,SRCH,TUR(2/2/2)","AMS,ATMO,CT10,SRCH","AMS,ATMO,IT3,MHQ7,RCN,SRCH","AMS,ATMO,CT9,SRCH","ATMO,CT14,ENE,SRCH","MHQ4,RCN,SRCH","EE,MHQ4,RCN,SRCH","EE,IF0*,SRCH,TUR(0*/0*/0*,IF0*)","EE,SRCH,TUR(2/2/1)","EE,SRCH,TUR(0*/0*/0*)","SRCH,TUR(3/2/-)","EE,REAR0*/-/-,SRCH,TUR(2/2/-)","AC1/1/-,SRCH,TUR(3/3/-,AC1/1/-)","AMS,REL,SRCH,TUR(2/2/-,REL)","ENE,REL,SRCH,TUR(2/2/-, REL)","SRCH,TUR(3/3/-)","EE,ENE,SRCH,TUR(2/2/-)","AMS,CASE,FC,RFA,SRCH,TAG,TUR(3/3/2,TAG)","FLK0*/0*/0*,IF1,SRCH,TUR(1/1/1,IF1)","AMS,ECM,IF1,SRCH,TUR(1/1/1,AMS,IF1)","AC1/1/-,CASE,EE,SRCH,TUR(3/3/-)","FLK0*/0*/0*,IF1,SRCH,TUR(1/1/1,IF1)","FLK0*/0*/0*,IF1,RCA,SRCH,TUR(1/1/1,IF1)","CT5,EE,SRCH,TUR(0*/-/-)","CT6,EE,SRCH,TUR(0*/-/-)","CT8,EE,SRCH,TUR(0*/-/-)","ATMO,IT8,SRCH","ATMO,ECM,ENE,PRB,RCN,SRCH,TAG","ATMO,C3S,ECM,ENE,MHQ1,PRB,RCN,SRCH,TAG","ATMO,C3S,ECM,ENE,MHQ1,PRB,RCN,SRCH","ATMO,SRCH","ATMO,ENE,PRB,RCN,SRCH","ATMO,ENE,PRB,RCN,SRCH","ATMO,ENE,SRCH","AMS,ATMO,PRB,RCN,SRCH,TAG","AMS,ATMO,ECM,IT4,REAR(0*/-/-),TUR(2/2/-),SRCH","IT4,MHQ7,RCN,SRCH,TUR(2/1/-)","IT4,MHQ7,RCN,SRCH,TUR(1/1/1)","IT3,SRCH,TUR(2/1/-)","IT3,MHQ7,REAR0*/0*/0*,RCN,SRCH,TUR(1/1/-)","ARTT-1,SRCH,TUR(1/1/-)","ARTAIS-1,ECM,SRCH,STL,TUR(1/1/-)","CT3,EE,SRCH","CT2,EE,PRB,RCN,SRCH","C3S,CT2,EE,MHQ1,SRCH","CT2,ECM,EE,SRCH","CT2,EE,SRCH","CT1,EE,SRCH","ARTAIS-2,TUR(ARTAIS-2),SRCH","CASE,FC,SRCH,TUR(6/6/-)","CASE,FLK3/3/-,SRCH,TUR(5/5/-,FLK3/3/-)","AC4/4/-,EE,REAR0*/-/-,SRCH,TUR(4/4/-,AC4/4/-)","SRCH,TUR(4/4/3)","C3S,MHQ1,SRCH,TUR(6/6/-)","BRA,SRCH,TUR(3/3/3)","AC4/4/-,EE,SRCH,TUR(4/4/-,AC4/4/-)","CASE,FLK1/1/-,SRCH,TUR(5/5/-,FLK1/1/-)","CASE,ECM,IF2,SRCH,TUR(6/5/3,IF2)","CASE,IF4,SRCH,TUR(5/7/4,IF4)","CASE,SRCH,TUR(3/3/3)","SRCH,TUR(2/2/-)","SRCH,TUR(1/1/-)","SRCH,TUR(1/1/-)","CASE,SRCH,TUR(2/2/2)","C3I,CASE,MHQ2,SRCH","SRCH,TUR(2/2/2)","ENE,SRCH,TUR(2/2/2)","CASE,SRCH,TUR(2/2/2)","MDS4,RCA,SRCH,TUR(1/1/-)","CASE,SRCH,TUR(1/1/-)","AMS,ARTLTC-2,C3S,CASE,CR,ECM,HTC,MHQ2,REAR0*/0*/-,SRCH,TUR(1/1/0,AMS,ARTLTC-2)","AC4/4/-,SRCH,TUR(5/4/-,AC4/4/-)","AMS,CASE,CR,REAR1/2","SRCH,TUR(3/3/3)","C3S,MHQ1,SRCH,TUR(5/5/5)","C3S,CASE,IF5,MHQ1,SRCH,TUR(4/7/7,IF5)","ATMO,ENE,IT4,PRB,RCN,SRCH,TAG,TUR(0*/1/1)","ATMO,IF0*,SRCH,TUR(0*/1/1)","IF1,SRCH,TUR(6/6/1,IF1)","IF1,SRCH,TUR(7/7/1,IF1)","AECM,AMP,CASE,DCC4,SRCH,TUR(1/1/-)","ATMO,CASE,SRCH","ATMO,ENE,LTAG,PRB,RCN,SRCH","ATMO,ECM,ENE,PRB,RCN,SRCH,TAG","IF1,SRCH,TUR(2/2/-)","IF1,SRCH,TUR(1/1/1)","CASE,IF1,SRCH,TUR(2/2/-)","CT0.5,IF0*,SEAL,SRCH,TUR(2/2/2,IF0*)","SRCH,SRM1/1,TUR(2/2/-)","SRCH,TUR(2/2/-)","CASE,IF1,SRCH,TUR(3/3/-)","CASE,SRCH,TUR(3/2/2)","CASE,ECM,IT5,SRCH,TUR(4/3/1)","AECM,CASE,FLK0*/0*/0*,IT5,SRCH,TUR(0*/0*/0*,FLK0*/0*/0*)","AECM,CASE,SRCH,TUR(3/3/3)","EE,ENE,ENG,MEL,SRCH","AC2/2/-,EE,SRCH","EE,ENG,HT1/-/-,MEL,SRCH,TUR(0*/-/-)","CASE,SRCH,TUR(3/3/2)","CASE,CR,SRCH,SRM2/2,TUR(2/2/-)","CASE,ECM,FLK1/1/1,HT1/1/1,SRCH,SRM2/2,TUR(2/2/1,HT1/1/1,FLK1/1/1)","ARS,ENE,SRCH,TUR(2/2/2)","CASE,IF2,LRM2/2/2,OMNI,SRCH,TAG,TUR(4/4/3,IF2,LRM2/2/2)","CASE,OMNI,SRCH,TUR(2/2/2)","CASE,ECM,OMNI,SRCH,TAG,TUR(3/3/2)","CASE,FLK2/1/1,OMNI,SRCH,TUR(2/2/2,FLK2/1/1)","CASE,HT2/2/2,OMNI,SRCH,TUR(2/2/-,HT2/2/2)","CASE,OMNI,SRCH,TUR(4/4/-)","CASE,CR,OMNI,SRCH,TUR(7/7/-)","CASE,CR,FLK3/2/2,OMNI,SRCH,TUR(5/4/3,FLK3/2/2)","CASE,CR,OMNI,SRCH,TUR(8/6/2)","CASE,CR,OMNI,SRCH,TUR(6/6/2)","AMS,CASE,CR,OMNI,SRCH,TUR(3/3/3,AMS)","CT0.5,EE,SRCH,SRM1/1, TUR(2/2/-,SRM1/1)","IF1,IT4,SRCH","ATMO,EE,IT1,SRCH","ATMO,ECM,ENE,IT1,SRCH,STL","ATMO,EE,SRCH","ATMO,CT2.5,EE,ENE,SRCH","CT6,EE,ENE,SRCH","CT4,EE,ENE,SRCH","EE,IF1,SRCH","EE,REAR0*/0*/0*,SRCH","EE,ENE,SRCH,","CT4,EE,SRCH","FLK3/3/-,SRCH,TUR(3/3/-,FLK3/3/-)","C3M,CASE,FLK2/2/1,MHQ5,SRCH,TAG,TUR(2/2/1,FLK2/2/1)","CASE,IF3,SRCH,TUR(3/5/3,IF3)","ENE,SRCH,TUR(2/1/-)","ENE,SRCH,TUR(2/1/-)","ECM,SRCH","ENE,SRCH,TUR(2/1/-)","AECM,ARS,RCA,SRCH,TUR(2/2/-)","ECM,IF1,SRCH,TAG,TUR(2/2/1,IF1)","ECM,IF1,SRCH,TAG,TUR(3/3/1,IF1)","C3S,ECM,IF0*,MHQ1,SRCH,TAG,TUR(2/2/0*,IF0*)","AECM,ARS,RCA,SRCH,TUR(2/2/-)","IT1,SRCH,TUR(2/2/2)","C3M,IT4,MHQ5,SRCH,TAG,TUR(3/3/-)","C3S,MHQ1,SRCH,TUR(2/2/2)","SRCH,TUR(1/2/2)","C3BSS,CASE,MHQ2,PRB,RCN,SRCH,TUR(4/4/4)","C3BSM,CASE,MHQ6,SRCH,TAG,TUR(4/4/4)","IT1,SRCH,TUR(2/2/2)","AMS,SRCH,TUR(2/2/2,AMS)","AECM,DCC5,FLK1/1/1,MHQ3,RCA,SRCH,TUR(1/1/1,FLK1/1/1)","ENE,SRCH,TUR(1/1/-)","ENE,SRCH,TUR(1/1/-)","ENE,SRCH,TUR(0*/0*/0*)","AC1/1/-,CASE,EE,IF1,SRCH,TUR(2/2/-,AC1/1/-)","CASE,FC,SRCH,TUR(2/2/-)","EE,ENE,SRCH,TUR(1/1/-)","ENE,PRB,RCN,SRCH,TUR(1/1/-)","C3I,ECM,ENE,MHQ2,PRB,RCN,SRCH,TUR(1/1/-)","C3I,ENE,MHQ2,SRCH,TUR(1/1/1)","ARTTC-1,CASE,SRCH,TUR(ARTTC-1)","CR,ENE,PRB,RCN,SRCH,TAG,TUR(2/2/1)","AMS,CASE,CR,IT4,SRCH,TUR(1/1/-)","EE,SRCH,TUR(1/1/-)","EE,SRCH,TUR(1/0*/-)","EE,SRCH,TUR(1/0*/-)","CASE,ECM,STL,SRCH,TUR(1/1/-)","IF0*,SRCH,TUR(2/2/-)","ARS,CASE,IT4,SRCH,TUR(2/1/-)","ATMO,EE,IT1,SRCH,TUR(0*/0*/-)","ATMO,CASE,ECM,SRCH,TAG,TUR(1/1/1,TAG)","ECM,IT8,SRCH,TUR(1/-/-)","IF0*,IT4,SRCH,TUR(2/2/0*,IF0*)","EE,REAR0*/0*/-,SRCH","AC1/1/-,EE,SRCH","IF1,SRCH,TUR(2/1/1)","AMP,ENE,MFB,SRCH","ECM,IF2,SRCH,TUR(3/4/3,IF2)","C3S,CASE,ECM,IF2,MHQ1,PRB,RCN,SRCH,TUR(4/5/3,IF2)","ARTAIS-1,CASE,ECM,SRCH,TUR(2/2/-,ARTAIS-1)","ECM,IF2,SRCH,TUR(2/4/4,IF2)","AMS,IF1,IT3,SRCH,TUR(2/2/1,IF1)","CASE,IT4,REL,SRCH,TUR(1/1/0,REL)","AMS,IT3,SRCH,TUR(2/2/-)","AMS,SEAL,SRCH,TUR(2/2/-)","EE,IT1,SRCH,TUR(1/1/-)","EE,IF1,IT1,LRM1/1/1,SRCH,TUR(1/2/2,IF1,LRM1/1/1)","EE,IT5,REAR0*/-/-,SRCH,TUR(1/1/-)","EE,IT1,SRCH,SRM2/2,TUR(3/3/-,SRM2/2)","IF1,IT8,SRCH,TUR(2/2/1,IF1)","ATMO,ENE,SRCH","ATMO,CASE,FLK1/1/1,SRCH","CASE,ECM,IF4,OMNI,SRCH,TUR(8/9/9,IF4)","ARTLTC-2,C3BSM2,CASE,ECM,MHQ12,OMNI,SRCH,TUR(ARTLTC-2),TAG","AMS,ARTLTC-1,CASE,ECM,OMNI,SRCH,TUR(3/3/3,AMS,ARTLTC-1)","EE,HTC,REAR0*/0*/-,SRCH","ARTAIS-1,CR,EE,HTC,SRCH,TUR(ARTAIS-1)","CR,EE,HTC,IF2,LRM1/2/2,SRCH,TUR(1/2/2,IF2,LRM1/2/2)","ECM,HTC,REAR1/2/2,SRCH,STL","ARTSC-1,CR,EE,HTC,SRCH,TUR(ARTSC-1)","CR,EE,HTC,IF1,SRCH,TUR(0*/1/1,IF1)","EE,HTC,IT4,SRCH,TUR(1/1/0)","ARTT-1,CR,EE,HTC,SRCH,TUR(ARTT-1)","CR,EE,HTC,IF2,SRCH,TUR(2/2/2,IF2)","CR,EE,HTC,SRCH,TUR(3/3/0)","C3S,CASE,ECM,IF0*,MHQ1,REAR0*/-/-,SRCH,TUR(4/4/4,IF0*)","C3M,CASE,ECM,FLK1/1/1,IF0*,MHQ5,REAR0*/-/-,SRCH,TAG,TUR(3/3/3,FLK1/1/1,IF0*)","CASE,CR,IF2,SRCH,TUR(5/5/3)","CASE,IF3,SRCH,TUR(5/5/4,IF3)","CASE,FLK3/2/2,SRCH,TUR(5/4/3,FLK3/2/2)","ARTAC-1,CASE,SRCH,TUR(ARTAC-1)","CASE,IF2,LTAG,RCA,SRCH,TUR(3/3/3,IF2)","ARTAC-1,CASE,RCA,SRCH,TUR(ARTAC-1)","CASE,HT1/1/-,SRCH","EE,ENE,SRCH,TUR(1/1/-)","EE,SRCH,SRM2/2,TUR(2/2/-,SRM2/2)","EE,JMPW1,SRCH,SRM1/1,TUR(2/2/-,SRM1/1)","EE,RCN,RSD1,SRCH,SRM1/1,TUR(2/2/-,SRM1/1)","EE,SRCH,SRM1/1,TUR(2/2/-,SRM1/1)","FC,IF1,RFA,SRCH,SRM2/1,TUR(2/2/1,IF1,SRM2/1)","FC,SRCH,SRM2/2,TUR(2/2/-,SRM2/2)","FC,INARC,SRCH,TUR(0*/0*/-,INARC)","ENE,SRCH,TUR(2/2/-)","EE,IF1,SRCH,TUR(0*/1/1,IF1)","FC,SRCH,TAG,TUR(2/2/-, TAG)","FC,IF1,SRCH,TUR(2/1/1, IF1)","FC,SRCH,SRM2/2,TUR(2/2/-,SRM2/2)","FC,IF1,SRCH,TUR(1/1/1, IF1)","REAR1/1/-,SRCH","SRCH","CASE,REAR1/1/-,REL,SRCH","ENE,IT4,SRCH,TUR(2/1/1)","EE,SRCH,TUR(2/2/1)","ATMO,EE,SRCH","ATMO,FC,SRCH,TUR(2/2/-)","ATMO,EE,SRCH","ATMO,FC,IF1,SRCH","ATMO,SRCH,SRM1/1,TUR(1/1/-)","ATMO,IF1,SRCH,TUR(1/1/-)","ATMO,SRCH,TUR(0*/0*/0*)","CT30,EE,ENE,SRCH","EE,IT6,SRCH","EE,IF0*,IT3,SRCH","EE,IT3,REAR0*/-/-,SRCH","CASE,EE,SRCH","EE,IT3,SRCH","EE,IF5,LRM2/5/5,SRCH,TUR(3/5/5,LRM2/5/5,IF5)","CR,IF4,LRM1/2/2,SRCH,TUR(2/4/4,IF4,LRM1/2/2)","EE,IF3,LRM0/2/3,SRCH,SRM6/2,TUR(6/5/3,SRM6/2,LRM0/2/3,IF3)","CR,FC,IF3,LRM3/3/3,SRCH,TUR(3/3/3,IF3,LRM2/3/3)","EE,IT6,SRCH","EE,IF0*,IT3,SRCH","EE,IT3,REAR0*/-/-,SRCH","EE,IT3,SRCH","ENE,SRCH,TUR(1/1/1)","EE,IT6,SRCH","EE,IF0*,IT3,SRCH","EE,IT3,REAR0*/-/-,SRCH","EE,IT3,SRCH","ENE,IT6,SRCH","CASE,FLK1/1/1,OMNI,SRCH,TUR(7/5/2)","CASE,FLK1/1/1,IF4,LRM4/4/4,OMNI,SRCH,TUR(4/4/4,IF4,LRM4/4/4)","CASE,FLK3/3/3,OMNI,SRCH,TUR(3/3/2,FLK1/1/1)","CASE,FLK1/1/1,OMNI,SRCH,TUR(4/4/0)","CASE,FLK1/1/1,OMNI,SRCH,TUR(4/4/-)","ARS,ECM,ENE,PRB,RCN,SRCH,TAG,TUR(2/2/-,TAG)","CASE,IF1,IT4,OMNI,PRB,RCN,SRCH,TUR(2/2/1,IF1)","CASE,IT4,OMNI,PRB,RCN,SRCH,TUR(3/3/-)","CASE,IT4,OMNI,PRB,RCN,SRCH,TUR(2/1/0*)","CASE,ECM,IT5,OMNI,PRB,RCN,SRCH,TUR(2/2/-)","ECM,ENE,IT4,OMNI,PRB,RCN,SRCH,TAG,TUR(2/2/-,TAG)","AC2/2/-,EE,SRCH","AC1/1/-,EE,SRCH","FC,SRCH","EE,ENE,SRCH","FLK1/1/-,SRCH","EE,IF2,LRM1/2/2,SRCH","AC2/2/-,EE,RCN,RSD1,SRCH","C3I,CASE,MHQ2,SEAL,SRCH","EE,SRCH,SRM3/3","CASE,EE,FLK2/2/2,SRCH","AMS,CASE,ECM,FLK0*/0*/0*,IT4,MHQ3,SRCH,TUR(2/1/0*,AMS,FLK0*/0*/0*)","CT15,DCC5,EE,SRCH,TUR(0*/0*/-)","AECM,AMP,C3BSM,C3RS,CT14,DCC6,ENE,MHQ5,RSD1,SRCH,TAG","EE,SRCH,TUR(1/1/-)","ARTAC-2,CASE,ECM,EE,SRCH,TUR(3/3/-)","ARTAC-2,CASE,ECM,FC,FLK3/2/2,SRCH,TUR(3/3/3,FLK3/2/2)","CASE,CR,ECM,EE,IF2,SRCH,TUR(3/3/-)","CASE,CR,ECM,EE,SRCH, TUR(3/3/-)","IF1,LRM1/1/1,REAR0*/-/-,SRCH","SRCH","IF2,SRCH","IF1,LRM1/1/1,SRCH","AMP,FC,IF1,MDS2,SRCH,TOR0*/1/1,TUR(1/1/1,IF1)","CASE,FC,IF1,REAR0*/-/-,SRCH","IF1,SRCH","IF1,SRCH","IF1,REAR0*/-/-,SRCH","IF1,REAR0*/-/-,SRCH","EE,HT1/-/-,IT1,SRCH,TUR(0*/-/-)","EE,IT1,SRCH,TUR(1/0*/-)","CASE,IT3,SRCH,TUR(1/-/-)","CASE,HT1/1/1,IT5,LPRB,RCN,SRCH,TUR(2/2/-)","AMS,CASE,FLK1/1/1,IF1,SRCH,TUR(3/3/3,FLK1/1/1)","CASE,FLK1/1/1,IF1,SRCH,TUR(3/3/3,FLK1/1/1)","CASE,FLK1/1/1,IF1,SRCH,TUR(3/3/3,FLK1/1/1)","CT3,EE,HTC,SRCH,TUR(0*/-/-)","CT3,EE,HTC,SRCH,TUR(0*/-/-)","CT3,HTC,SRCH,TUR(0*/-/-)","EE,HTC,SRCH,TUR(1/1/-)","CT8,ENE,HTC,SRCH","SRCH,TUR(1/1/-)","FC,SRCH,TUR(1/0*/-)","FC,SRCH,TUR(2/2/-)","SRCH,TUR(1/1/-)","EE,SRCH,TUR(1/1/-)","C3S,ENE,MHQ1,SRCH,TUR(2/2/-)","EE,SRCH,TUR(1/1/0*)","ENE,SRCH,TUR(1/1/1)","SRCH,TUR(2/1/-)","ENE,PRB,RCN,SRCH,TAG,TUR(1/1/-,TAG)","SRCH,TUR(2/2/-)","ECM,STL,SRCH","SRCH,SRM5/5,TUR(1/1/-)","SRCH,SRM5/5,TUR(1/1/-)","C3S,ECM,IF5,LRM2/4/5,MHQ1,SRCH","ECM,IF5,LRM2/4/5,SRCH","IF6,SRCH","IF4,LRM2/4/4,SRCH,TUR(2/4/4,IF4,LRM2/4/4)","C3S,IF4,LRM2/4/4,MHQ1,SRCH,TUR(2/4/4,IF4,LRM2/4/4)","IF2,LRM0/2/2,SRCH,SRM4/2,TUR(5/4/2,IF2,LRM0/2/2,SRM4/2)","IF4,LRM2/4/4,SRCH,TUR(2/4/4,IF4,LRM2/4/4)","IF3,SRCH,TUR(3/3/3,IF3)","FC,IT4,SRCH,SRM1/1,TUR(2/2/0,SRM1/1)","FC,IF0*,IT4,SRCH,TUR(1/1/0*,IF0*)","CASE,LPRB,RCN,SRCH,TUR(4/3/2)","CASE,IF1,SRCH,TUR(3/3/2,IF1)","ARTCM5-1,FC,HTC,SRCH,TUR(0*/0*/-)","ATMO,IF2,RFA,SRCH","ATMO,RFA,SRCH","ENE,OMNI,SRCH,TUR(1/1/1)","ENE,OMNI,SRCH,TUR(2/1/-)","C3S,ECM,ENE,MHQ1,OMNI,PRB,RCN,SRCH,TUR(1/1/-)","ENE,OMNI,SRCH,TUR(1/1/-)","ENE,HT1/1/1,OMNI,SRCH","EE,IF1,SRCH,JMPW1","AC1/1/-,EE,IF1,SRCH","CASE,SRCH,TUR(3/3/1),JMPW1","ATMO,EE,REAR0*/-/-,SRCH","ATMO,CT6,EE,ENE,SRCH","ATMO,EE,IT7,SRCH","AC2/2/-,ATMO,SRCH","ARTT-1,ATMO,SRCH","ATMO,ECM,ENE,IT10,SRCH,STL","ATMO,ECM,ENE,IT8,SRCH","AECM,ATMO,CT14,IT4,SRCH,STL","ATMO,EE,ENE,SRCH","CASE,SRCH,TUR(4/3/3)","ATMO,EE,IT3.5,SRCH","ATMO,CASE,EE,IT4,SRCH","ATMO,EE,ENE,IT3.5,MASH2,SRCH","ATMO,CT1,EE,ENE,SRCH","ATMO,EE,MHQ1,RCN,RSD1,SRCH","ATMO,EE,ENE,IT1.5,SRCH","ATMO,EE,IT3,SRCH","CASE,FLK1/1/1,IF1,SRCH,TUR(2/2/1,FLK1/1/1)","C3S,CASE,IF1,MHQ1,SRCH,TUR(2/2/1)","CASE,IF1,RCA,SRCH,TUR(2/2/-)","AECM,ARS,FC,LTAG,PRB,RCN,SRCH,TUR(1/1/-,LTAG)","AECM,ARS,ENE,SRCH,TUR(2/2/-)","IF1,TUR(4/4/4),SRCH","IF1, TUR(4/4/4), SRCH","IF1,REAR0*/-/-,SRCH,TUR(2/2/1,IF1)","ENE,SRCH,TUR(1/1/0)","ENE,SRCH,TUR(1/1/0)","CASE,SRCH,TUR(3/3/3)","CASE,ECM,IT10,SRCH,TUR(2/2/-)","ATMO,IT4,SRCH,SRM1/1","EE,ENE,SRCH","EE,SRCH,SRM3/3,TUR(3/3/0,SRM3/3)","IF2,SRCH,TUR(2/2/2,IF2)","ENE,SRCH","ENE,SRCH","ENE,SRCH","AMS,SRCH","SRCH,TAG","ECM,ENE,SRCH,STL","EE,IF3,LRM1/3/3,SRCH","C3S,EE,IF4,MHQ1,SRCH","C3I,IF5,MHQ2,SRCH","CASE,CR,IF3,LRM3/3/3,SRCH,TUR(3/3/3,IF3,LRM3/3/3)","AECM,BH,RCN,SRCH,STL,TAG,TUR(1/0/0,TAG)","ENE,MASH5,SRCH,TUR(1/-/-)","AMS,CASE,FC,MASH5,SRCH,TUR(AMS)","EE,ENE,MASH5,SRCH","CASE,SRCH","C3I,CASE,IT6,MHQ2,SRCH","SRCH","C3S,MHQ1,SRCH","IT4,SRCH","SRCH","AMP,AMS,CASE,IT8,RFA,SRCH,TUR(4/4/-,AMS)","C3S,CASE,MHQ1,OMNI,SRCH,TUR(3/3/-)","CASE,OMNI,SRCH,TUR(1/1/-)","C3M,CASE,MHQ5,OMNI,SRCH,TAG,TUR(2/2/2)","AMS,CASE,IF1,IT8,OMNI,SRCH,TUR(2/2/2,AMS,IF1)","CASE,ECM,FLK1/1/1,MTAS1,OMNI,SRCH,TUR(1/1/1,FLK1/1/1,MTAS1)","C3S,CASE,ECM,MHQ1,OMNI,SRCH,TUR(4/4/-)","IF1,SRCH,TUR(2/3/2,IF1)","C3S,CASE,ES,IF1,MHQ1,SRCH,TUR(2/3/2,IF1)","IF1,SRCH,TUR(3/3/1,IF1)","C3M,IF1,MHQ5,SRCH,TAG,TUR(2/2/2,IF1)","C3S,IF1,MHQ1,SRCH,TUR(2/3/2,IF1)","AMS,IF0*,SRCH,TUR(3/3/3,AMS,IF0*)","FLK1/1/1,SRCH,TUR(2/2/1,FLK1/1/1)","SRCH,TUR(3/3/-)","CASE,IF1,SRCH,TUR(3/3/2,IF1)","IF1, SRCH, TUR(3/3/2,IF1)","AMP,IF1,SRCH,LRM1/1/1,TUR(3/3/3,IF1,LRM1/1/1)","ATMO,ECM,ENE,PRB,RCN,SRCH","ATMO,C3S,ECM,ENE,MHQ1,SRCH","ARTS-1,SRCH,TUR(1/1/-)","AC2/2/-,SRCH,TUR(1/1/-)","ARTS-1,SRCH,TUR(1/1/1)","SRCH,SRM1/1,TUR(6/6/2,SRM1/1)","CASE,IF1,SRCH,TUR(7/5/3,IF1)","SRCH,SRM1/1,TUR(8/7/2, SRM 1/1)","CASE,ECM,FLK1/1/1,IF3,SRCH,TUR(3/3/3)","CASE,ECM,SRCH,TUR(4/4/2)","CASE,ECM,FLK2/2/2,IF4,SRCH,TUR(3/4/3)","CASE,ECM,FLK1/1/1,IF3,SRCH,TUR(3/3/3)","EE,SRCH,SRM2/2,TUR(1/1/1)","AC1/1/-,EE,SRCH,TUR(2/1/-,AC1/1/-)","EE,FLK1/1/1,SRCH,TUR(2/1/1,FLK1/1/1)","ATMO,EE,IT1,RCN,RSD1,SRCH","ATMO,EE,ENE,IT3,RCN,RSD1,SRCH","EE,IT3,SRCH","EE,IT4,SRCH","EE,IT3,SRCH","ENE,IT4,SRCH","EE,IT3,SRCH","EE,IT4,SRCH","IT12,SRCH,TAG,TUR(3/3/-,TAG)","C3M2,ECM,MHQ10,SRCH,TAG,TUR(3/3/-)","IF1,IT4,REAR0*/-/-,SRCH","EE,IF1,IT3,SRCH,SRM1/1,TUR(2/1/-)","EE,IF1,IT3,SRCH,TAG,TUR(2/1/-,TAG)","EE,IF1,IT3,SRCH,TAG,TUR(2/1/-,TAG)","EE,IF1,IT4,SRCH,TUR(2/1/-)","EE,IF1,IT4,SRCH,TAG,TUR(1/1/-,TAG)","C3M,EE,IF1,MHQ5,SRCH,TAG,TUR(1/1/-)","C3S,EE,IF1,IT4,MHQ1,SRCH,TAG,TUR(1/1/-,TAG)","CASE,ECM,EE,IF1,IT6,SRCH,TUR(2/2/-)","FC,IF1,REAR1/1/0*,SRCH,TUR(2/2/-)","EE,IF2,IT3,LRM1/2/2,SRCH,TUR(1/1/1,IF1)","EE,IF1,IT3,SRCH,SRM1/1,TUR(2/2/-,SRM1/1)","EE,IT3,SRCH,SRM2/2,TUR(2/1/-)","CASE,IF0*,IT16,SRCH,TUR(1/1/0*,IF0*)","ECM,IT16,SRCH,TUR(0*/0*/-)","CASE,IF0*,IT8,SRCH,TUR(2/2/2,IF0*)","IF1,SRCH,TUR(3/3/2,IF1)","IF1,SRCH,TUR(2/2/2,IF1)","AMP,IT8,SRCH,TUR(1/1/-)","AMP,CASE,FLK1/1/1,SRCH,TUR(2/2/2,FLK1/1/1)","C3S,ENE,MHQ1,SRCH","AMS,ENE,RFA,SRCH","SRCH","ENE,SRCH,TAG","ENE,SRCH","ENE,MASH7,SRCH","ENE,MASH11,SRCH","CASE,SRCH,TUR(1/1/0*)","CASE,SRCH,TUR(2/2/2)","CT0.5,ENE,MHQ7,RCN,SRCH,TUR(1/1/-)","EE,ENE,MHQ2,RCN,SRCH","CT0.5,EE,IF1,MHQ2,RCN,SRCH,TUR(0*/1/1,IF1)","EE,ENE,MHQ2,RCN,SRCH,TUR(1/1/-)","ENE,MHQ3,RCN,SRCH,TUR(1/1/-)","IF1,MHQ2,RCN,SRCH,TUR(0*/1/1,IF1)","ARTLT-1,EE,HTC,MHQ2,SRCH","ARTLT-1,CASE,EE,HTC,SRCH","ARTLT-1,CASE,EE,HTC,SRCH","SRCH,TUR(2/3/3)","IF2,LRM0/2/2,SRCH,SRM4/2,TUR(5/3/2,SRM3/1,LRM0/1/2,IF2)","FLK1/1/1,SRCH,TAG,TUR(3/3/2,FLK1/1/1,TAG)","AC1/1/-,C3M,IT4,MHQ5,SRCH,TAG,TUR(2/2/-,AC1/1/-)","C3M2,ECM,IT4,MHQ10,SRCH,TAG,TUR(1/1/1)","HPG,IT6,SRCH","AC1/1/-,IT4,SRCH,TUR(2/2/-,AC1/1/-)","CASE,ECM,IF2,LRM2/2/2,SRCH,TUR(4/4/4,LRM2/2/2,IF2)","CASE,ECM,FLK3/2/2,IF2,LRM2/2/2,SRCH,TUR(5/5/5,IF2,FLK3/2/2,LRM2/2/2)","ENE,SRCH,TUR(3/3/3)","FC,IF3,SRCH","C3S,EE,MHQ1,SRCH","CASE,EE,SRCH,TAG,TUR(3/3/-)","CASE,IT4,SRCH,TAG,TUR(2/2/-)","CASE,EE,SRCH,TAG,TUR(2/2/1)","SRCH,TUR(2/2/1)","SRCH,TUR(2/2/1)","SRCH,TUR(2/2/-)","ENE,MDS6,SRCH,TUR(1/1/-)","CASE,SRCH","AMS,CASE,CR,SRCH,TUR(3/4/4,AMS)","AMS,C3BSS,CASE,CR,MHQ2,SRCH,TUR(3/4/4,AMS)","ATMO,CT1,ECM,ENE,SRCH","ATMO,CT1,ENE,SRCH","ATMO,SRCH,TAG","ATMO,C3I,ECM,ENE,MHQ2,SRCH","ATMO,CT0.5,ECM,ENE,SRCH","CASE,FC,FLK1/1/1,RFA,SRCH,TUR(1/2/2,FLK 1/1/1)","CASE,PRB,RCN,SRCH,TUR(2/2/-)","CASE,ECM,FC,PRB,RCN,SNARC,SRCH,TAG,TUR(1/1/-)","EE,IF1,SRCH,TUR(5/5/1,IF1)","CASE,IF1,SRCH,TUR(7/7/2,IF1)","CASE,IF1,SRCH,TUR(7/7/1, IF1)","IF1,LRM1/1/1,SRCH,TUR(6/7/2,LRM1/1/1,IF1)","SRCH,TUR(3/4/3)","EE,IF3,LRM2/3/3,SRCH,TUR(LRM2/3/3,IF3)","CASE,IF1,SRCH,TUR(4/4/3,IF1)","CASE,IF1,SEAL,SRCH,TUR(6/5/2,IF1)","IF1,SEAL,SRCH,TUR(3/4/2,IF1)","IF1,SEAL,SRCH,TUR(5/5/1,IF1)","ATMO,CASE,OMNI,RFA,SRCH","ATMO,CASE,IF2,LRM2/2/2,OMNI,RFA,SRCH","ATMO,CASE,FLK1/1/-,OMNI,RFA,SRCH","ATMO,CASE,OMNI,RFA,SRCH","ATMO,CASE,OMNI,RFA,SRCH","ATMO,CASE,HT1/1/1,OMNI,RFA,SRCH,SRM3/3","CASE,FLK1/1/-,SRCH,TUR(3/3/2,FLK1/1/-)","CASE,FLK2/2/2,SRCH,TUR(4/3/3,FLK2/2/2)","AECM,AMP,BH,ENE,IT4,PRB,RCN,SEAL,SRCH,STL","IT1,REAR0*/-/-,SRCH","EE,IT1,SRCH","SRCH","IT3,REAR0*/0*/-,SRCH","ECM,STL,RAMS,SRCH,TUR(2/2/2,RAMS)","AMS,ARTAIS-1,SRCH,TAG","AMS,IF2,LRM1/2/2,SRCH","ARTS-1,IF1,SRCH,TUR(1/1/1,IF1,ARTS-1)","AMS,ARTT-1,ECM,SRCH,SRM2/2,TUR(2/2/-,AMS,ARTT-1,SRM2/2)","ARTLTC-1,ECM,IF0*,SRCH,TUR(1/0*/0*,IF0*,ARTLTC-1)","ARTT-1,ECM,IF1,SRCH,TUR(3/3/1,IF1,ARTT-1)","ARTLT-2,CASE,HTC,MHQ1,SRCH,TUR(ARTLT-2)","AMS,C3I,IF1,IT8,MHQ2,REAR0*/0*/-,SRCH,TUR(3/3/1,AMS,IF1)","FLK1/1/1,SRCH,TUR(1/1/1,FLK1/1/1)","CASE,SRCH,TUR(0*/1/1)","C3S,FLK1/1/1,MHQ1,SRCH,TUR(2/2/2,FLK1/1/1)","AMS,C3S,FC,FLK1/1/1,MHQ1,SRCH,TUR(2/2/2,AMS,FLK1/1/1)","C3M2,FLK1/1/1,MHQ10,SRCH,TAG,TUR(2/2/2,FLK1/1/1)","C3M,CASE,MHQ5,SRCH,TAG,TUR(2/2/2)","AMS,C3S,FC,IF5,MHQ1,SRCH,TUR(3/5/5,AMS,IF5)","C3S,MHQ1,SRCH,TUR(3/3/3)","C3S,FLK0*/0*/0*,MHQ1,SRCH,TUR(4/4/0*,FLK0*/0*/0*)","C3S,FLK1/1/1,MHQ1,SRCH,TUR(3/3/3,FLK1/1/1)","AC2/2/2,EE,SRCH,TUR(2/2/2,AC2/2/2)","AC1/1/1,EE,SRCH,TUR(AC1/1/1)","AC2/2/2,C3S,CASE,EE,MHQ1,SRCH,TUR(2/2/2,AC2/2/2)","C3S,CASE,FC,MHQ1,SRCH,TUR(3/3/3)","C3S,CASE,IF2,FC,MHQ1,SRCH,TUR(1/3/3,IF2)","CASE,SRCH,TUR(3/4/4)","EE,IF4,LRM2/4/4,SRCH,TUR(2/4/4,LRM2/4/4,IF4)","EE,FLK1/1/1,SRCH,TUR(2/3/3,FLK1/1/1)","C3BS,MHQ2,SEAL,SRCH,TUR(2/2/-)","AC1/1/-,SRCH,TUR(2/2/0*,AC1/1/-)","FLK1/1/1,HTC,IF0*,SEAL,SRCH,TUR(2/3/2,FLK1/1/1,IF0*)","FLK1/1/1,IF0*,REAR0*/-/-,SRCH,TUR(1/1/1,FLK1/1/1,IF0*)","REAR0*/-/-,SRCH,TUR(3/3/2)","CASE,IF0*,REAR0*/-/-,SRCH,TUR(3/3/3,IF0*)","EE,SRCH,SRM1/1,TUR(2/2/-,SRM1/1)","ECM,PRB,RCN,SRCH,SRM1/1,TAG,TUR(2/2,SRM1/1)","C3S,MHQ1,SRCH,TUR(3/3/-)","EE,SRCH,SRM2/2,TUR(3/3/-,SRM2/2)","IF1,PRB,RCN,SRCH,TUR(2/2/1, IF1)","C3S,ECM,MHQ1,SRCH,TUR(2/2/-)","ECM,IF0*,PRB,RCN,SEAL,SRCH,TAG,TUR(1/1/0*,IF0*)","EE,RCN,RSD1,SRCH,SRM1/1,TUR(2/2/-,SRM1/1)","CT12,EE,ENE,SRCH","C3S,MHQ1,SRCH,TUR(3/3/-)","C3S,MHQ1,SRCH,TUR(3/3/-)","ATMO,SRCH,SRM1/1","ATMO,CT7,ENE,SRCH","ATMO,SRCH,SRM1/1","AMP,ARTSC-1,TUR(ARTSC-1),CASE,SRCH","AMP,ARTSC-1,CASE,IT1,SRCH,TUR(0*/-/-,ARTSC-1)","EE,SRCH,TUR(0*/1/1)","AC1/1/1,EE,SRCH,TUR(1/1/1,AC1/1/1)","CASE,SRCH,TUR(2/2/2)","CASE,FC,FLK1/1/1,SRCH,TUR(1/1/1,FLK1/1/1)","EE,IF2,LRM1/2/2,SRCH,TUR(1/2/2,LRM1/2/2,IF2)","CASE,HT2/2/2,SRCH,TUR(HT2/2/2)","SRCH,TUR(3/3/3)","IF2,SRCH,TUR(2/4/3,IF2)","ARTAIS-1,SRCH,TUR(1/1/-,ARTAIS-1)","C3BSS,CASE,IF2,MHQ2,SRCH,","ATMO,IF0*,IT1,PRB,RCN,SRCH","ATMO,IF0*,IT6,SRCH","ECM,IF1,SRCH,STL,TUR(2/2/2,IF1)","EE,SRCH,SRM2/2,TUR(2/2/-,SRM2/2)","EE,PRB,RCN,SRCH,SRM2/2,TUR(2/2/-,SRM2/2)","FC,SEAL,SRCH,SRM2/2,TOR0*/0*/-,TUR(2/2/-,SRM2/2)","EE,SRCH,TUR(2/2/-)","AC1/1/-,EE,SRCH,TUR(2/1/-,AC1/1/-)","CR,SRCH,TUR(1/1/1)","CR,FC,SRCH,TUR(1/1/1)","EE,FLK1/1/1,SRCH,TUR(1/1/1,FLK1/1/1)","CASE,EE,SRCH,TUR(1/1/1)","IF1,SRCH,TUR(4/4/1,IF1)","ARTAIS-1,IF1,SRCH,TUR(2/2/1,IF1,ARTAIS-1)","SRCH,SRM1/1,TUR(3/3/2, SRM1/1)","AECM,SRCH,SRM1/1,STL,TUR(3/3/2,SRM1/1)","ARTS-1,FLK1/1/1,SRCH,TUR(2/2/1,FLK1/1/1,ARTS-1)","ARTAIS-1,ECM,FLK1/1/1,SRCH,TUR(2/2/1,ARTAIS-1,FLK1/1/1)","ARS,CT1,ENE,MHQ10,RCN,SRCH,TUR(1/1/-)","FC,FLK1/1/0,SRCH","SRCH","AC2/2/0,EE,SRCH","AMP,CT4.5,IF1,PRB,RCN,SRCH,TUR(2/2/1,IF1)","AMP,IF0*,IT4,PRB,RCN,SRCH,TSEMP1,TUR(1/1/0*,IF0*,TSEMP1)","AMP,CT4.5,ECM,IF1,SRCH,TUR(2/2/1,IF1)","AMP,C3S,IF0*,IT4,MHQ1,PRB,RCN,SRCH,TUR(3/2/1,IF0*)","CT4.5,IF1,PRB,RCN,SEAL,SRCH,TUR(2/2/1,IF1)","AMP,CASE,IF1,IT5,PRB,RCN,SRCH,TSEMP1,TUR(0*/1/1,IF1,TSEMP1)","AMP,CT8,IF1,SRCH,TUR(2/2/1,IF1)","AMP,IF1,IT4,SRCH,TUR(2/2/1,IF1)","AMP,C3I,IF0*,IT6,MHQ2,SRCH,TUR(2/2/0*,IF0*)","IF2,LRM1/2/2,REAR1/-/-,SRCH,TUR(1/1/1)","CASE,IF3,REAR0*/-/-,SRCH,TUR(1/1/1)","C3I,IF1,MHQ2,REAR1/-/-,SRCH,TUR(2/2/2)","AMS,ECM,IF2,SRCH,TUR(2/2/2,AMS)","ECM,MHQ5,RCN,SRCH","CT20,SRCH","AC1/1/-,CASE,IT4,OMNI,SRCH,TUR(2/2/-,AC1/1/-)","CASE,ECM,FLK1/1/1,IT4,OMNI,PRB,RCN,SRCH,TUR(1/1/1,FLK1/1/1)","CASE,IT12,OMNI,SRCH,SRM2/2,TUR(2/2/-,SRM2/2)","SRCH,TUR(2/0*/-)","ECM,SRCH,TUR(2/-/-)","SRCH,TUR(2/-/-)","SRCH,TUR(2/2/-)","SRCH,TUR(3/3/-)","ATMO,FC,SRCH,TUR(2/2/0)","SRCH,TUR(2/2/2)","ECM,FLK1/1/1,SRCH,STL,TUR(1/1/1,FLK1/1/1)","ARTAIS-1,TUR(ARTAIS-1),SRCH","CASE,SRCH,TUR(3/3/-)","SRCH,TUR(2/2/2)","ECM,SRCH,TUR(3/3/-)","ECM,SRCH,STL,TUR(1/1/1)","IF2,LRM1/2/2,SRCH,TUR(2/3/2,LRM1/2/2,IF2)","IF2,LRM1/2/2,SRCH,TUR(2/3/2,LRM1/2/2,IF2)","AMS,IF2,LRM1/2/2,SRCH,TUR(3/4/3,IF2,LRM1/2/2)","IF2,LRM1/2/2,SRCH,TUR(2/3/2,LRM1/2/2,IF2)","IF2,LRM1/2/2,SRCH,TUR(2/3/2,LRM1/2/2,IF2)","AMS,ECM,IF3,SRCH,TUR(3/4/3,AMS,IF2)","IF2,LRM1/2/2,SRCH,TUR(2/3/2,LRM1/2/2,IF2)","CASE,ENG,IF3,LRM3/3/3,SRCH,TUR(4/4/3,IF2,LRM2/2/2)","ATMO,ENE,IT1,SRCH","ATMO,ENE,IT1,SRCH","ATMO,ENE,IT4,SRCH","ATMO,ENE,IT1,SRCH","ATMO,IT1,SRCH","ATMO,ENE,IT1,SRCH","ATMO,ENE,IT1,SRCH","AC2/2/-,SRCH,TUR(3/3/0*,AC2/2/-)","REAR0*/-/-,SRCH,TUR(3/3/2)","ECM,SEAL,SRCH,TOR1/1/-,TUR(3/3/2)","ARTLTC-1,IF1,SRCH,TUR(0*/1/1,ARTLTC-1,IF1)","ARTLTC-1,IF1,SRCH,TUR(0*/1/1,ARTLTC-1,IF1)","SRCH","EE,IF1,SRCH","EE,ENE,SRCH","EE,SRCH","REAR1/1/-,SRCH,TUR(3/2/-)","AC2/2/-,EE,SRCH","AC2/2/-,EE,SRCH","CT17,EE,ENE,SRCH","EE,FLK1/1/-,SRCH","EE,SRCH","ENE,SRCH","SRCH","C3BSS,ENE,MHQ2,SRCH","EE,IF1,SRCH,TUR(1/2/1,IF1)","EE,SRCH,TUR(2/2/-)","IF0*,SRCH,TUR(2/2/0*,IF0*)","C3BSS,IF0*,MHQ2,SRCH,TUR(2/1/0*,IF0*)","ENE,SRCH","ECM,ENE,SRCH","ENE,RFA,SRCH","ENE,SRCH","IT5,SRCH,TUR(0*/-/-)","ENE,MHQ3,RCN,SRCH,TAG,TUR(1/1/-,TAG)","ENE,IT5,SRCH,TUR(1/1/-)","MASH2,SRCH,TUR(0*/-/-)","OMNI,RFA,SRCH,TUR(2/2/-)","OMNI,RFA,SRCH,TUR(1/1/1)","FLK1/1/1,OMNI,RFA,SRCH,TUR(1/1/1,FLK1/1/1)","INARC,OMNI,RFA,SRCH,TUR(1/1/-,INARC)","ARTTC-1,OMNI,RFA,SRCH,TUR(ARTTC-1)","OMNI,RFA,SRCH,TAG,TUR(1/1/1,TAG)","C3S,MHQ1,OMNI,RFA,SRCH,TUR(1/1/1)","C3S,ENE,MHQ1,OMNI,RFA,SRCH,TUR(3/2/-)","C3M,MHQ5,OMNI,RFA,SRCH,TSEMP1,TUR(TSEMP1)","ECM,ENE,OMNI,RFA,SRCH,TUR(2/2/-),JMPW1","AECM,BH,ENE,OMNI,RCN,RFA,SRCH,TUR(1/2/2)","AMS,ARS,CASE,FLK1/1/1,SRCH,TUR(2/2/2,AMS,FLK1/1/1)","AMS,ARS,CASE,SRCH,TUR(2/2/2,AMS)","AMS,ARS,CASE,SRCH,TUR(1/1/1,AMS)","AMS,ARS,CASE,IF0*,SRCH,TAG,TUR(3/2/1,AMS,IF0*,TAG)","C3M,ECM,MHQ5,OMNI,SRCH,TAG,TUR(4/3/-)","C3M,ECM,IF4,MHQ5,OMNI,SRCH,TAG,TUR(3/3/3,IF2)","C3M,ECM,ENE,MHQ5,OMNI,SRCH,TAG,TUR(4/4/-)","C3M,ECM,IF1,MHQ5,OMNI,SRCH,TAG,TUR(5/5/-)","AC2/2/-,C3M,ECM,IF2,LRM-/1/2,MHQ5,OMNI,SRCH,SRM3/1,TAG,TUR(2/2/-,AC2/2/-)","C3M,ECM,IF4,MHQ5,OMNI,SRCH,TAG,TUR(3/3/3,IF2)","ARTAIS-2,C3M,ECM,MHQ5,OMNI,SRCH,TAG,TUR(3/1/-)","AC1/2/2,EE,SRCH,TUR(2/2/2,AC1/2/2)","EE,SRCH,TUR(5/5/5)","ECM,SRCH,STL,TUR(2/3/3)","ENE,SRCH,TUR(3/4/4)","ENE,SRCH,TUR(3/3/3)","SRCH,TUR(3/3/3)","ENE,SRCH,TUR(3/3/3)","AMS,C3M,ECM,MHQ5,SRCH,TAG,TUR(2/3/3)","CASE,CR,FLK1/1/1,SRCH,TUR(3/3/3,FLK1/1/1)","ENE,SRCH,TUR(3/3/3)","EE,SRCH,TUR(1/1/1)","C3S,MHQ1,SRCH,TUR(1/1/1)","EE,IF1,SRCH,TUR(1/2/1,IF1)","EE,SNARC,SRCH,SRM1/1,TAG,TUR(2/2,SNARC,SRM1/1,TAG)","ECM,SRCH,TUR(1/1/-)","ECM,SRCH,TUR(1/2/1)","C3BSS,MHQ2,SRCH,TUR(1/2/1)","EE,SRCH,TUR(1/1/1)","EE,SRCH,TUR(0*/1/1)","CASE,CR,FC,SRCH,TUR(1/1/-)","EE,SRCH,TUR(0*/0*/0*)","EE,IF1,SRCH,TUR(1/1/1,IF1)","EE,IF1,MSW,SRCH","CR,FC,IF1,MSW,SRCH","CT1,EE,SRCH,TUR(2/1/-)","EE,SRCH,TUR(2/2/-)","EE,SRCH,TUR(1/1/1)","EE,SRCH,TUR(1/1/1)","EE,SRCH,SRM2/2,TUR(2/2/-,SRM2/2)","EE,IF1,SRCH,TUR(1/1/1, IF1)","CASE,FC,SRCH,TUR(1/1/1)","CASE, EE, FLK0*/0*/0*, SRCH, TUR(1/0*/0*, FLK(0*,0*,0*)","AMP,ES,IF1,MDS2,SRCH,TOR0*/1/1","CASE,SRCH,SRM2/2,TUR(3/3/3)","CASE,RCA,SRCH,TUR(4/4/4)","ENE,SRCH,TUR(2/2/-)","ENE,SRCH,TUR(0*/0*/-)","ECM,ENE,SRCH,TUR(1/1/-)","ECM,REAR0*/-/-,SRCH","ECM,EE,REAR0*/-/-,SRCH","AC1/1/-,CASE,FC,SRCH,TUR(1/1/-,AC1/1/-)","FC,IF1,SRCH,TUR(2/2/1,IF1)","EE,IF1,SRCH,TUR(1/1/1,IF1)","CASE,SRCH,TUR(7/5/3)","CASE,FLK1/1/1,SRCH,SRM1/1,TUR(4/4/1,FLK1/1/1,SRM1/1)","CASE,SRCH,TUR(7/7/1)","ATMO,ECM,IT12,SRCH,STL,TAG,","ATMO,ECM,IT8,SRCH","ATMO,CASE,SRCH,TUR(2/2/2)","CASE,SRCH","CASE,SRCH,TSEMP1","ENE,REAR0*/-/-,SRCH","EE,ENE,SRCH","C3M,EE,ENE,MHQ5,SRCH,TAG","EE,IT2,SRCH","EE,SRCH","CASE,ECM,LPRB,RCN,SRCH,STL,WAT","AECM,BH,ENE,FC,RCN,SRCH","AECM,BH,ENE,RCN,SRCH","EE,HTC,IT4,SRCH,TUR(2/1/-)","EE,HTC,IT4,SRCH,SRM2/2,TUR(3/2/-,SRM2/2)","CASE,SRCH,TUR(0*/0*/-)","CASE,ECM,IF1,SRCH,STL","CASE,FLK1/1/-,LPRB,RCN,SRCH,TUR(0*/0*/-)","BRA,LPRB,RCN,SRCH,TUR(0*/0*/-)","CASE,SRCH,TUR(0*/0*/-)","AMP,ARTS-1,CASE,EE,REAR0*/-/-,SRCH","AMP,ARTLTC-1,CASE,EE,REAR0*/-/-,SRCH","BRA,CASE,OMNI,SRCH,TAG,TUR(1/1/-,TAG)","AMP,ARTS-1,CASE,HTC,MHQ4,RCN,SRCH,TUR(0*/-/-)","AC3/3/-,AMP,FC,SRCH,TUR(4/4/0*,AC 3/3/-)","CASE,EE,HT1/-/-,SRCH,TUR(3/3/-)","AMS,SRCH","AMS,ARS,C3S,ECM,MHQ1,SRCH","ATMO,ENE,PRB,RCN,SRCH,TAG","ATMO,C3S,ENE,MHQ1,PRB,RCN,SRCH","ATMO,C3I,ENE,MHQ2,SRCH","ATMO,ECM,ENE,SRCH,TAG","ATMO,ENE,PRB,RCN,SRCH","ATMO,ENE,IT2,SRCH","EE,SRCH,SRM6/6","EE,SNARC,SRCH,SRM5/5","C3S,ECM,EE,MHQ1,SRCH,SRM5/5","C3I,ECM,MHQ2,SRCH,TAG,TUR(6/6/-,TAG)","CASE,CR,EE,SRCH,SRM6/6,TUR(6/6/-,SRM6/6)","EE,IF1,SRCH,TUR(2/2/1,IF1)","AMP,FC,SRCH,TUR(2/2/0*)","IF1,SRCH,TUR(2/2/1,IF1)","C3S,ECM,IF1,MHQ1,SRCH,TUR(2/2/2,IF1)","IF1,SRCH,TUR(2/2/1,IF1)","ECM,IF1,SRCH,TUR(2/3/2,IF1)","EE,IF1,SRCH,TUR(1/1/1,IF1)","IF1,SRCH,SNARC,TUR(1/1/1,IF1,SNARC)","ECM,FC,IF1,SEAL,SRCH,TUR(2/1/1,IF1)","EE,IF1,SRCH,TUR(2/2/1,IF1)","CASE,ECM,IF1,SRCH,SRM2/1,STL,TUR(2/2/1, IF1, SRM2/1)","ATMO,ECM,LPRB,RCN,SRCH,STL,TUR(2/2/-),WAT","ARTCM5-1,SRCH,TUR(0*/-/-)","EE,IF2,LRM1/2/2,SRCH,TUR(1/1/1,LRM1/1/1,IF1)","CASE,ECM,IF2,SRCH,TUR(2/2/1, IF1)","CASE,FC,IF2,SRCH,TUR(2/2/2,IF1)","IF1,SRCH,TUR(1/2/1,IF1)","EE,IF1,LRM1/1/1,SRCH,SRM2/2,TUR(3/3/-,SRM2/2)","CASE,ECM,IF2,SRCH,TAG,TUR(4/4/2,IF1,TAG)","ARTAIS-1,CASE,IF2,SRCH,TAG,TUR(2/3/2,IF2,TAG)","C3I,CASE,IF2,MHQ2,SRCH,TAG,TUR(4/4/2,IF1,TAG)","IF1,SRCH,TUR(1/1/1,IF1)","IF1,SRCH,TUR(1/1/1,IF1)","C3I,IF1,MHQ2,SRCH,TUR(0*/1/1,IF1)","CASE,IF1,IT5,SRCH,TUR(1/1/-)","CASE,IT5,SRCH,TUR(3/2/1)","CASE,IF1,IT3,SRCH,TUR(2/2/-)","CT0.5,ENE,MHQ2,RCN,SRCH","CT3,EE,ENE,SRCH","CT3,EE,ENE,SRCH","EE,ENE,MHQ2,RCN,SRCH","SRCH,TUR(1/1/-)","ENE,SRCH,TUR(1/1/-)","ENE,REAR0*/0*/0*,SRCH,TUR(1/1/-)","SRCH,TUR(1/1/-)","AMS,C3M2,CASE,CT5,ECM,HTC,IT8,MHQ20,RCN,SRCH,TAG,TUR(AMS)","AMS,ARTAIS-2,ARTS-1,CASE,ECM,HTC,IT4,MHQ3,SRCH,TUR(ARTS-1)","ARTAIS-1,CASE,FC,SRCH,TUR(2/2/2,ARTAIS-1)","ENE,IT1,SRCH,TUR(1/1/0)","ARTT-1,CASE,SRCH,TUR(1/1/-)","AC1/1/-,EE,SRCH,TUR(2/0*/-)","ARTT-1,C3I,CASE,MHQ2,SRCH","ARTT-1,CASE,SRCH,TUR(2/2/-)","ARTT-1,EE,REAR0*/-/-,SRCH","AECM,ARTT-1,CASE,FC,SRCH","AECM,ARTT-1,CASE,FC,SRCH","ARTT-1,CASE,ECM,REAR0*/-/-,SRCH,TUR(1/1/-)","ARTT-1,CASE,PRB,RCN,REAR0*/-/-,SRCH,TUR(1/1/-)","SRCH","AC1/1/-,EE,SRCH,TUR(2/2/-,AC1/1/-)","FLK1/1/1,SRCH,TUR(2/2/1,FLK1/1/1)","C3S,FLK1/1/1,MHQ1,SRCH,TUR(2/2/1,FLK1/1/1)","SRCH,TAG,TUR(3/3/-)","AMS,SRCH,TUR(4/4/2)","FLK1/1/1,SRCH,TUR(3/2/1,FLK1/1/1)","AC1/1/-,EE,SRCH,TUR(2/2/-,AC1/1/-)","EE,SRCH,TUR(2/2/0*)","C3S,IF1,MHQ1,SRCH,TUR(2/2/2,IF1)","AMS,C3S,ECM,IF1,IT8,MHQ1,REAR0*/0*/-,SRCH,TUR(3/3/1,IF1)","AMS,EE,IF1,IT8,REAR0*/0*/-,SRCH,TUR(2/3/1,IF1)","CT33,SRCH","AMS,BH,ECM,ENE,MHQ5,RCN,RSD1,SRCH","IF0*,SRCH,SNARC,TAG,TUR(1/1/0*,IF0*,SNARC,TAG)","INARC,SRCH,TAG,TUR(2/2/-,TAG)","IT5,SRCH,TUR(2/2/-)","AMS,C3M,IT4,MHQ5,SRCH,TAG,TUR(2/2/-,AMS)","IT5,SRCH,TUR(2/2/-)","AC2/2/-,PRB,RCN,REAR0*/-/-,SRCH,TUR(5/5/-,AC2/2/-)","C3S,FLK1/1/1,MHQ1,REAR0*/0*/-,SRCH,TUR(3/3/2,FLK1/1/1)","PRB,RCN,SRCH,TUR(5/5/-)","AC2/2/-,PRB,RCN,REAR0*/-/-,SRCH,TUR(5/5/-,AC2/2/-)","CASE,IT5,SRCH,TUR(3/3/1)","IF1,IT4,SRCH,TUR(2/2/1,IF1)","ARTAIS-1,EE,HTC,SRCH","EE,HTC,IT7,SRCH,TUR(2/1/-)","EE,HTC,IF1,IT7,SRCH,TUR(1/1/1,IF1)","ATMO,ENE,IT3,SRCH","ATMO,SRCH,SRM1/1","ATMO,ENE,ECM,SRCH,TAG","ATMO,ENE,PRB,RCN,SRCH,TAG","EE,SRCH,TUR(0*/1/1)","SRCH,TUR(2/2/2)","AC1/1/-,SRCH,TUR(1/1/-,AC1/1/-)","EE,SRCH,TUR(0*/0*/0*)","CASE,FC,SRCH,TUR(2/2/2)","AMS,C3S,CASE,FC,FLK1/1/1,MHQ1,REAR0*/0*/-,SRCH,TUR(1/1/1,FLK1/1/1)","EE,FLK0*/0*/0*,SRCH,TUR(0*/0*/0*,FLK0*/0*/0*)","EE,SRCH,TUR(1/1/-)","EE,SRCH,TUR(1/1/1)","EE,SRCH,TUR(1/1/1)","EE,SRCH,TUR(2/2/-)","EE,SRCH,TUR(1/1/1)","CASE,RCA,SRCH,TUR(2/2/-)","CASE,FC,SRCH,TUR(2/2/-)","FC,RFA,SRCH,TUR(2/2/2)","AMS,CASE,FC,IF2,SRCH,TUR(6/6/3,AMS,IF2)","FLK1/1/1,IF1,SRCH,TUR(4/3/2,FLK1/1/1)","AC2/2/-,IF1,REAR0*/-/-,SRCH,TUR(4/4/-,AC2/2/-)","AC4/4/-,SRCH,TUR(5/5/-,AC4/4/-)","AC2/2/-,REAR0*/1/1,SRCH,SRM2/2,TUR(4/4/-,SRM2/2,AC2/2/-)","CASE,IF1,SRCH,TUR(5/5/-)","AC1/1/-,REAR0*/1/1,SRCH,TUR(3/3/1,AC1/1/-)","SRCH,TUR(5/5/-)","CR,FLK1/1/-,REAR1/1/-,SRCH,SRM1/1,TUR(3/3/-,FLK1/1/-,SRM1/1)","CR,REAR0*/0*/0*,SRCH,TUR(4/3/2)","CASE,CR,FLK1/1/-,SRCH,TUR(3/3/-, FLK1/1/-)","ATMO,IT5,SRCH","ATMO,EE,SRCH","ATMO,EE,SRCH","ATMO,EE,IF1,SRCH","ATMO,FC,SRCH,TAG","ATMO,IF0*,SRCH","ATMO,SRCH","ATMO,CASE,ECM,SRCH,STL","ATMO,ECM,IF1,SRCH,STL","EE,IF1,IT1.5,SRCH,TUR(0*/1/1,IF1)","CT0.5,EE,SRCH","EE,RCN,SRCH","EE,RCN,RSD1,SRCH","CT0.5,SRCH,TUR(2/2/0*)","CASE,FLK0*/0*/0*,SRCH,TUR(2/2/0*,FLK0*/0*/0*)","CASE,IT4,PRB,RCN,SRCH,TUR(2/2/0*)","AMS,CASE,IF2,LRM1/2/2,SRCH,TUR(2/3/3,AMS,LRM1/2/2,IF2)","AC1/1/-,AMS,CASE,IF1,SRCH,TUR(3/3/1,AC1/1/-,IF1)","AECM,CASE,IF2,LRM2/2/2,SRCH,SRM1/1,TAG,TUR(3/3/3,IF2)","AMS,CASE,IF2,LRM2/2/2,SRCH,TSEMP2,TUR(2/2/2,AMS,IF2,LRM2/2/2)","AMS,CASE,IF2,LRM2/2/2,REL,SRCH,TUR(4/4/2,AMS,IF2,LRM2/2/2)","FC,IT4,SRCH,TUR(0*/0*/-)","ATMO,C3S,CASE,MHQ1,SRCH","ATMO,ECM,SRCH,STL","ATMO,CASE,ECM,IF1,PRB,RCN,SRCH","ATMO,EE,SRCH","ATMO,EE,SRCH","ARTAIS-1,ATMO,CASE,EE,SRCH","ATMO,C3S,ENE,MHQ1,SRCH","ATMO,CASE,EE,SRCH","FC,IF0*,IT8,SRCH,TAG,TUR(2/1/0*,IF0*,TAG)","ECM,REAR0*/-/-,SRCH,TAG,TUR(2/2/-,TAG)","C3I,ECM,MHQ2,REAR0*/-/-,SRCH,TAG,TUR(2/2/-,TAG)","C3I,IF1,MHQ2,SRCH,TUR(1/1/-)","AECM,DRO,ENE,OMNI,SRCH,TAG,TUR(2/2/-)","AECM,BH,C3S,DRO,ENE,MHQ1,OMNI,RCN,SRCH,TUR(0*/0*/-)","AECM,DRO,OMNI,SRCH","AECM,DRO,OMNI,SRCH,TUR(0*/1/1)","ECM,REAR0*/-/-,SNARC,SRCH,TAG,TUR(2/2/-,TAG)","REAR1/0*/-,SRCH,TUR(2/2/-)","ECM,SRCH,TAG,TUR(1/1/-,TAG)","CASE,ECM,SRCH,TUR(2/2/-)","CASE,ECM,SRCH,TUR(2/2/-)","AC2/2/-,EE,SRCH,TUR(2/2/-,AC2/2/-)","C3I,CASE,EE,FLK1/1/1,MHQ2,SRCH,TUR(2/2/2,FLK1/1/1)","C3S,CASE,ECM,EE,FLK1/1/1,MHQ1,SRCH,TUR(2/2/2,FLK1/1/1)","C3I,CASE,IF0*,MHQ2,SRCH,TUR(3/2/-)","CASE,OMNI,SRCH,TUR(1/1/1)","CASE,FLK1/1/1,OMNI,SRCH,TUR(3/3/1,FLK1/1/1)","C3S,CASE,IF1,MHQ1,OMNI,SRCH,TUR(3/2/1,IF1)","C3BSS,ENE,MHQ2,OMNI,SRCH,TUR(2/2/2)","C3S,CASE,MHQ1,OMNI,SRCH,TUR(4/4/0)","CASE,ECM,EE,FLK0*/0*/0*,IF1,SRCH,TUR(2/2/2,IF1,FLK0*/0*/0*)","CASE,ECM,EE,FLK0*/0*/0*,IF1,SRCH,TUR(1/1/1,IF1,FLK0*/0*/0*)","CASE,ECM,FC,FLK0*/0*/0*,SRCH,TUR(2/2/1,FLK0*/0*/0*)"]},"TUR":{"dict":["TUR"],"values":[null,null,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,null,null,null,0,0,null,0,null,null,0,null,0,null,0,null,0,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,0,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,0,0,0,null,null,null,0,null,null,null,null,null,null,null,0,0,0,0,0,0,0,0,0,0,0,null,null,null,null,null,0,0,0,0,0,0,null,null,null,null,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,null,null,null,null,null,null,null,0,0,0,0,0,0,0,null,null,null,null,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,0,0,0,0,0,0,null,0,0,0,0,0,0,0,0,null,null,null,0,0,0,0,0,0,0,0,0,0,0,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,null,null,null,null,null,null,null,null,null,0,0,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,0,0,0,null,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,null,0,0,null,0,null,null,0,0,0,null,null,null,null,null,null,0,0,0,0,null,null,null,null,0,null,null,null,null,null,0,0,0,0,0,0,0,0,0,0,0,null,null,null,null,null,null,null,null,null,null,0,0,null,0,0,0,0,0,null,null,null,null,0,null,null,null,null,null,0,0,0,0,0,0,0,0,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,null,0,0,null,null,null,0,0,0,0,0,0,0,0,0,0,null,null,0,0,0,0,null,null,null,0,null,null,null,null,null,null,null,null,null,0,null,null,null,null,null,null,null,0,0,0,0,0,0,0,0,0,0,0,0,null,null,0,0,null,null,null,null,null,null,null,null,null,0,0,0,0,null,null,null,null,null,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,null,null,null,null,null,null,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,null,null,null,null,null,0,0,0,null,0,0,0,0,null,null,null,0,0,0,0,0,null,0,0,0,0,null,null,0,0,0,0,0,0,0,null,0,0,null,null,null,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,null,null,null,null,0,0,null,null,null,null,null,0,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,0,null,null,null,0,0,0,0,0,0,0,0,0,0,0,null,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,null,null,null,null,null,0,0,0,0,0,null,null,null,null,0,null,null,null,null,null,null,null,null,0,0,0,0,null,null,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,0,0,0,0,0,0,0,0,null,0,0,0,0,0,null,null,0,0,0,0,0,0,null,null,0,null,null,null,null,null,null,null,null,null,null,0,0,0,null,0,0,0,null,null,0,0,0,0,null,null,null,null,null,null,null,null,null,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,null,null,0,0,0,0,0,0,0,0,0,0,null,0,null,null,null,0,0,null,0,0,0,0,0,0,0,0,0,0,0,null,null,0,0,0,0,0,0,0,0,0,0,0,null,0,0,null,null,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,null,null,null,null,null,null,null,0,null,null,null,0,0,0,0,0,0,0,0,0,null,null,null,null,null,null,null,null,0,0,0,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"AMS":{"rows":[38,47,70,98,118,119,124,128,129,153,172,175,188,189,190,200,204,206,221,222,257,259,299,331,344,363,365,366,376,463,485,566,575,583,587,595,647,684,685,717,718,719,721,725,729,732,810,831,834,885,886,887,888,903,968,969,1016,1017,1034,1039,1040,1042,1046,1066,1076,1103,1104,1106,1107],"dict":["AMS"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"ECM6":{"rows":[2,3,7,8,10,11,20,22,44,46,47,69,70,78,101,116,119,120,121,122,123,124,125,126,127,128,129,152,153,158,162,165,166,174,187,206,214,215,216,222,228,232,244,257,267,270,279,280,281,287,291,303,317,319,320,321,322,323,332,340,348,352,353,359,360,361,362,374,375,376,380,387,388,447,451,452,463,465,467,468,469,470,504,507,508,524,535,536,537,550,551,558,568,573,588,589,601,602,609,610,611,612,625,634,640,668,671,672,686,689,690,693,712,717,721,722,723,751,755,756,778,791,793,800,810,811,814,817,823,827,828,834,846,867,883,884,889,890,891,892,893,894,895,898,903,910,911,933,934,935,942,943,952,953,954,958,969,973,978,979,984,986,989,991,992,995,999,1016,1017,1025,1026,1027,1039,1042,1059,1094,1095,1105,1110,1111,1118,1119,1121,1122,1123,1124,1125,1127,1128,1129,1132,1139,1140,1141],"dict":["ECM"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"PRB":{"rows":[3,69,78,97,99,101,163,165,183,214,215,216,218,219,221,230,263,269,270,328,339,340,343,360,447,448,449,450,451,452,484,502,517,524,550,601,692,693,712,751,754,756,776,780,798,799,801,802,803,814,952,959,960,970,971,974,992,1028,1048,1050,1051,1060,1102,1111],"dict":["PRB"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"IF":{"rows":[7,9,20,23,24,43,46,47,48,49,52,60,68,73,85,86,95,102,103,105,107,108,109,110,111,113,120,127,130,131,132,137,141,145,148,149,159,161,172,174,176,205,206,208,209,244,245,262,265,266,271,272,273,277,289,301,308,314,320,321,336,357,359,360,362,363,368,371,374,379,382,385,389,390,393,401,405,407,409,418,420,428,429,430,431,443,448,458,469,471,473,474,475,476,477,478,479,480,485,486,487,507,508,509,510,511,512,513,514,518,520,527,528,547,548,549,552,553,554,562,569,570,571,572,587,590,591,592,593,594,598,599,600,607,609,611,612,626,627,628,629,630,631,632,633,634,635,636,637,642,643,657,660,665,671,672,674,694,695,696,697,699,700,701,702,703,705,719,720,723,725,732,740,742,754,770,773,775,778,788,789,798,800,802,803,804,805,807,808,809,810,829,830,831,832,833,834,835,836,847,848,850,862,890,892,893,894,908,917,918,919,925,928,937,938,958,981,983,984,985,986,987,988,989,990,991,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1007,1038,1039,1040,1053,1056,1076,1077,1078,1081,1090,1095,1096,1103,1104,1105,1106,1107,1111,1120,1136,1139,1140],"dict":["IF1","IF4","IF2","IF5","IF3","IF6"],"values":[0,1,0,0,0,0,2,2,0,0,0,0,0,0,0,0,2,0,0,0,0,2,0,1,2,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,2,0,0,0,0,2,1,3,0,0,0,0,0,0,2,0,0,4,0,0,0,0,2,2,2,0,0,0,1,2,0,2,2,4,2,0,0,0,0,0,0,3,1,4,4,1,0,2,2,0,2,0,0,0,0,0,0,0,0,0,0,3,3,5,1,1,2,1,4,0,2,0,0,0,0,0,0,0,0,2,4,1,3,4,0,0,0,0,0,0,0,0,0,0,4,1,4,0,0,0,0,0,0,0,0,0,0,2,0,0,0,0,0,2,2,2,4,0,0,0,0,4,0,0,0,0,2,2,0,0,0,3,2,1,0,2,2,2,0,0,0,0,0,0,0,0,0,2,4,0,2,2,2,2,2,2,4,2,4,0,0,0,0,1,0,2,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,0,0,2,2,2,0,0,0,0,0,0,0,0,0,0,2,0,0,0,0,0,0,2,0,2,2,2,0,0,0,0,0]},"APC":{"rows":[6,11,19,21,22,27,28,29,32,33,36,37,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,70,72,73,74,75,76,77,78,79,80,82,83,84,85,86,87,88,89,90,92,115,117,118,119,120,121,122,123,124,125,126,127,150,151,156,157,158,162,189,213,222,223,224,225,226,263,279,280,301,302,303,324,325,330,344,350,351,353,354,363,364,365,367,368,369,370,371,383,413,423,424,425,427,432,433,434,435,437,438,439,440,441,448,449,450,451,452,463,481,482,483,484,515,516,532,535,536,537,540,541,542,545,546,558,559,578,581,583,587,616,617,618,619,620,621,622,623,624,626,627,628,629,630,631,633,634,636,637,638,639,640,641,644,667,668,669,670,677,712,713,714,716,725,765,776,777,799,801,803,805,806,813,814,815,837,838,839,840,841,842,843,870,872,942,943,950,955,956,975,1005,1006,1007,1016,1017,1019,1039,1040,1045,1046,1047,1052,1053,1055,1056,1057,1087,1096,1102,1108,1117],"dict":["IT10","IT4","IT5","IT7","IT1","IT8","IT6","IT12","IT3","IT16","IT2"],"values":[0,1,2,3,0,4,4,4,4,4,4,4,2,2,2,2,2,2,2,2,1,1,1,1,1,5,1,1,1,2,2,2,2,2,2,2,2,2,1,1,1,1,1,1,1,5,1,1,6,6,1,1,1,1,1,1,6,6,6,6,0,7,1,8,1,1,8,5,1,1,1,8,8,1,2,2,1,4,4,4,1,4,1,1,4,5,1,8,1,8,4,4,2,4,5,1,1,6,8,8,8,6,8,8,8,6,8,8,8,6,1,1,1,2,1,1,4,4,8,2,1,1,3,0,5,1,8,1,8,4,8,0,1,6,1,5,5,4,8,8,1,8,1,8,1,7,1,8,8,8,1,1,1,6,8,8,8,9,9,5,5,1,1,6,1,1,1,4,4,8,5,4,4,6,1,1,2,1,6,1,1,7,4,4,1,4,4,4,4,2,2,7,5,10,1,1,10,2,2,8,5,1,4,5,5,2,1,2,2,1,3,3,8,2,4,1,1,5]},"ART":{"rows":[6,11,38,39,70,71,122,177,178,179,180,181,227,228,235,257,342,361,375,376,378,381,384,392,394,467,468,534,603,605,661,662,663,718,720,721,722,723,724,764,765,774,789,792,793,824,847,848,878,895,962,963,965,1000,1017,1018,1020,1022,1023,1024,1025,1026,1027,1028,1054,1114],"dict":["ARTLTC-1","ARTAIS-1","ARTAIS-2","ARTS-1","ARTSC-1","ARTT-1","ARTLTC-2","ARTTC-1","ARTAC-1","ARTAC-2","ARTLT-1","ARTLT-2"],"values":[0,1,1,2,2,3,4,1,1,1,1,1,5,1,2,6,7,1,6,0,1,4,5,8,8,9,9,5,3,3,10,10,10,1,3,5,0,5,11,4,4,1,1,3,1,1,0,0,7,2,3,0,3,1,2,1,5,5,5,5,5,5,5,5,1,1]},"STL":{"rows":[20,119,120,121,122,123,124,125,126,127,158,162,228,303,348,380,504,535,537,568,573,712,717,778,791,823,828,898,942,952,958,991,992,1094,1095,1110],"dict":["STL"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"MHQ":{"rows":[9,70,120,128,129,173,189,192,193,223,224,226,313,325,329,375,388,465,586,593,625,632,655,667,668,730,731,794,811,882,889,890,891,892,893,894,895,903,949,965,1016,1042,1046],"dict":["HQ"],"values":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"SpecialRules":{"dict":["ECM","ECM, PRB","TUR","TUR, IT10, ARTLTC-1","TUR, ECM, IF1","TUR, ECM","TUR, IF4, HQ","TUR, ECM, IT4, ARTAIS-1","TUR, IT5","ECM, IF1, STL","IT7","ECM, IT10","TUR, IF1","IT1","TUR, IT1","TUR, AMS, ARTAIS-1","ARTAIS-2","TUR, ECM, IF2","TUR, AMS, ECM, IF2","TUR, IF1, IT5","TUR, IT4","TUR, IF1, IT4","TUR, IT8","IF1","TUR, AMS, ECM, IT4, ARTAIS-2, HQ","TUR, ARTS-1","TUR, ECM, PRB, IT5","TUR, IF2","TUR, PRB","TUR, AMS","PRB","TUR, ECM, PRB","TUR, IF4","TUR, IT6","AMS, IT4","TUR, AMS, ECM, IT4, STL","TUR, ECM, IF1, IT4, STL, HQ","TUR, ECM, IT4, STL","TUR, ECM, IT4, ARTSC-1, STL","TUR, AMS, ECM, IT6, STL","TUR, ECM, IT6, STL","TUR, ECM, IF1, IT6, STL","TUR, AMS, ECM, HQ","IT10","IT12","TUR, AMS, ECM","IT4","IT3","ECM, IT4, STL","TUR, AMS, IF1","TUR, HQ","ARTAIS-1","AMS","AMS, IT3, HQ","HQ","TUR, AMS, ECM, IF1","IT8","AMS, PRB","TUR, AMS, ECM, IT4","TUR, IT4, HQ","TUR, IT3","TUR, IT3, HQ","TUR, ARTT-1","TUR, ECM, ARTAIS-1, STL","TUR, ARTAIS-2","TUR, AMS, ECM, ARTLTC-2","TUR, IF5","TUR, PRB, IT4","TUR, ECM, IT5","IF1, IT4","ECM, IT1, STL","TUR, IF3","TUR, ARTTC-1","TUR, AMS, IT4","TUR, ECM, STL","TUR, ECM, IT8","TUR, ECM, PRB, IF2","TUR, ECM, ARTAIS-1","TUR, AMS, IF1, IT3","TUR, AMS, IT3","TUR, IF1, IT1","TUR, IF1, IT8","TUR, ECM, IF4","TUR, ECM, ARTLTC-2, HQ","TUR, AMS, ECM, ARTLTC-1","TUR, ARTAIS-1","ECM, STL","TUR, ARTSC-1","TUR, ECM, HQ","TUR, ARTAC-1","IT6","TUR, PRB, IF1, IT4","TUR, ECM, PRB, IT4","IF2","ECM, HQ","TUR, ECM, ARTAC-2","TUR, PRB, IT5","ECM, IF5","IF6","ARTT-1","ECM, IT10, STL","ECM, IT8","TUR, ECM, IT10","IF3","IF4","IF5","TUR, AMS, IT8","TUR, AMS, IF1, IT8","TUR, IF1, HQ","TUR, ECM, IF3","TUR, IT12","TUR, IF1, IT3","TUR, ECM, IF1, IT6","TUR, IF2, IT3","TUR, IT16","TUR, ECM, IT16","ARTLT-1","TUR, ECM, IT4, HQ","ECM, PRB, IT4, STL","TUR, AMS, ECM, STL","AMS, ARTAIS-1","AMS, IF2","TUR, IF1, ARTS-1","TUR, AMS, ECM, ARTT-1","TUR, ECM, ARTLTC-1","TUR, ECM, IF1, ARTT-1","TUR, ARTLT-2","TUR, AMS, IF5","TUR, PRB, IF1","TUR, IT1, ARTSC-1","PRB, IT1","TUR, ECM, IF1, STL","TUR, IF1, ARTAIS-1","TUR, PRB, IF1, IT5","TUR, AMS, IF2","TUR, AMS, ECM, IF3","TUR, IF1, ARTLTC-1","TUR, ECM, IF4, HQ","TUR, ECM, IF1, HQ","TUR, ECM, IF2, HQ","TUR, ECM, ARTAIS-2, HQ","ECM, IT12, STL","IT2","ECM, PRB, STL","ARTS-1","ARTLTC-1","TUR, ARTS-1, HQ","AMS, ECM","TUR, ECM, PRB, STL","TUR, IF2, ARTAIS-1","TUR, AMS, ECM, IT8, HQ","TUR, AMS, ECM, IT4, ARTAIS-2","ECM, ARTT-1","TUR, ECM, ARTT-1","TUR, PRB, ARTT-1","TUR, AMS, ECM, IF1, IT8","AMS, ECM, HQ","TUR, AMS, IT4, HQ","TUR, IT7","TUR, IF1, IT7","IT5","ECM, PRB, IF1"],"values":[null,null,0,1,2,2,3,4,5,6,5,7,2,2,2,2,2,2,null,8,9,10,11,12,12,null,2,13,13,14,null,2,13,14,null,2,14,14,15,16,2,2,2,12,5,2,17,18,12,12,8,8,19,8,8,8,8,8,20,20,21,20,20,22,20,20,null,null,23,1,24,25,8,19,8,8,8,8,26,8,8,2,20,20,20,21,21,20,20,22,20,2,20,2,2,27,null,28,29,30,null,31,12,12,2,12,2,12,27,12,32,27,2,12,2,33,5,33,34,35,36,37,38,37,39,40,40,41,42,42,12,12,27,2,2,2,2,12,2,2,2,12,2,2,2,12,2,2,12,12,43,44,5,45,2,null,46,47,37,23,null,23,48,30,null,1,5,2,2,2,2,2,49,50,4,29,27,51,51,51,51,51,2,28,2,2,2,5,52,53,52,null,54,54,2,2,2,2,2,2,29,2,2,2,29,12,55,2,12,12,2,2,2,56,1,1,1,null,30,30,null,57,58,59,59,60,61,62,63,null,30,null,0,null,null,64,2,2,2,2,2,2,2,2,17,32,2,2,2,2,2,null,2,2,2,2,2,65,2,52,2,2,66,67,2,12,12,5,null,30,1,12,12,12,2,2,2,12,2,68,68,5,null,null,2,2,2,5,2,27,2,5,2,2,2,2,2,2,2,29,2,69,13,70,null,null,null,null,23,null,null,null,2,50,71,2,2,0,2,5,4,4,5,5,14,59,2,2,28,50,14,29,5,2,2,2,12,2,2,28,31,2,72,28,73,2,2,2,74,2,20,14,5,75,20,null,null,12,null,17,76,77,17,78,20,79,29,14,80,8,14,81,null,null,82,83,84,null,85,27,86,87,12,20,62,27,2,5,88,27,71,2,89,27,89,null,2,2,2,2,2,12,2,2,2,12,2,12,2,12,null,null,null,20,2,null,2,null,23,2,12,2,null,90,47,47,null,47,66,32,71,71,90,47,47,47,2,90,47,47,47,90,2,32,2,2,2,31,91,67,67,26,92,null,null,null,null,null,93,null,null,null,null,58,2,94,2,95,95,17,5,23,null,93,23,12,23,23,23,23,23,14,14,60,96,49,12,12,2,2,2,2,null,2,2,2,2,2,2,2,2,2,28,2,86,2,2,97,97,98,32,32,27,32,71,20,20,28,12,2,93,null,2,2,31,2,null,23,23,2,null,null,10,null,99,100,101,48,null,2,47,46,47,null,null,13,47,12,12,12,31,5,12,12,12,2,2,2,102,46,null,2,27,null,null,null,52,null,86,103,104,105,71,74,2,29,null,null,90,null,null,46,null,106,2,2,50,107,5,5,12,12,12,108,12,29,2,2,12,12,12,1,0,25,2,25,2,12,2,109,5,82,109,2,2,2,13,47,47,46,47,46,47,46,110,88,69,111,111,111,21,21,108,21,112,12,113,111,60,114,115,22,12,12,22,2,null,52,null,null,null,null,null,2,2,50,null,12,2,2,12,116,116,116,2,27,2,59,117,90,20,17,17,2,103,null,2,20,2,2,2,2,2,null,29,29,0,null,null,0,0,2,28,31,12,12,12,12,2,71,12,12,12,12,null,93,null,null,null,null,2,2,118,13,13,null,47,119,120,121,122,123,124,125,126,107,2,2,2,29,50,50,127,2,2,2,2,2,2,2,27,2,32,2,2,2,2,2,2,2,2,31,2,2,128,5,31,2,null,2,2,null,null,null,87,129,2,2,2,2,27,2,2,27,85,93,130,90,131,2,28,2,2,2,2,2,2,2,12,132,2,74,25,77,50,null,null,null,128,67,4,67,128,133,12,21,33,27,71,12,18,94,null,20,92,110,2,5,2,2,2,2,2,74,85,2,2,5,74,27,27,134,27,27,135,27,71,13,13,46,13,13,13,13,2,2,5,136,136,null,23,null,null,2,null,null,null,null,null,null,null,null,12,2,2,2,null,0,null,null,8,2,8,2,2,2,2,2,72,2,2,2,50,5,5,29,29,29,29,88,137,88,138,139,137,140,2,2,74,2,2,2,2,42,2,2,2,2,12,2,5,5,2,2,2,2,2,12,23,23,2,2,2,2,2,12,2,2,23,2,2,2,2,5,0,0,2,12,12,2,2,2,141,101,2,null,null,null,null,54,142,null,143,0,0,20,20,2,9,28,28,2,144,145,2,146,2,2,52,147,30,30,null,0,30,142,null,null,0,5,2,12,2,12,4,12,4,12,12,4,12,131,148,2,27,17,27,12,12,17,149,27,12,12,12,19,8,111,null,null,null,null,2,2,2,2,150,151,85,14,62,2,99,62,99,152,152,153,154,null,2,2,2,2,29,2,2,2,12,155,107,null,156,2,2,8,157,8,28,2,28,28,8,21,51,158,159,47,null,0,30,2,2,2,2,2,29,2,2,2,2,2,2,2,2,2,134,12,12,2,2,12,2,2,2,2,2,160,null,null,23,null,null,null,86,9,80,null,null,null,2,2,67,134,49,17,134,134,20,null,86,161,null,null,51,null,null,22,5,5,12,5,5,0,5,5,2,5,5,5,2,2,5,2,2,2,12,2,2,4,4,5]},"ImageURL":{"dict":["https://i.ibb.co/fQ8fzGB/ferret-3039.png","https://i.ibb.co/1Lm0tJw/gabriel-3050u.png","https://i.ibb.co/KLhB9QZ/savannah-master-hovercraft-rg.png","https://i.ibb.co/rmQfRg4/swift-wind-3039.png","https://i.ibb.co/GQ71C7t/armored-personnel-carrier-hover-3039.png","https://i.ibb.co/sW2BqkV/armored-personnel-carrier-tracked-3039.png","https://i.ibb.co/1Myq3N3/armored-personnel-carrier-wheeled-3039.png","https://i.ibb.co/Qpp93wb/flatbed-truck-3060.png","https://i.ibb.co/jJ59gXV/kruger-3150.png","https://i.ibb.co/xMbH2kK/mobile-long-tom-artillery-rg.png","https://i.ibb.co/TBMJXmS/ripper-3050u.png","https://i.ibb.co/VSTTWqN/sprint-3058u.png","https://i.ibb.co/3hyvWx0/thang-ta-3150.jpg","https://i.ibb.co/gSd9Gg9/shamash-3060.png","https://i.ibb.co/KXXfJ4W/darter-3075.png","https://i.ibb.co/z6FcFnY/beagle-3050u.png","https://i.ibb.co/mBFChRp/mobile-hq-rg.png","https://i.ibb.co/P6RGJ1N/crow-3075.png","https://i.ibb.co/XsjMx91/mantis-3060.png","https://i.ibb.co/cwrqjMm/marten-3150.png","https://i.ibb.co/5r16P8z/maultier-3058u.png","https://i.ibb.co/bBYGnyS/asshur-3060.png","https://i.ibb.co/4pKvD02/centipede-3058u.png","https://i.ibb.co/gTQxrZh/fox-3085.png","https://i.ibb.co/RjcTdpd/heavy-hover-apc-3060.png","https://i.ibb.co/bQTQcCT/heavy-tracked-apc-3060.png","https://i.ibb.co/K99xbVx/scimitar-3039.png","https://i.ibb.co/3MsvW43/heavy-wheeled-apc-3060.png","https://i.ibb.co/V9BXQP4/j-27-3039.png","https://i.ibb.co/h9cRHpw/j-27-trailer-3039.png","https://i.ibb.co/tHytf9z/kamisori-light-tank-rg.png","https://i.ibb.co/KGcv6YV/mash-truck-rg.png","https://i.ibb.co/CJzYHRP/minion-3067.png","https://i.ibb.co/nLxxQ1Y/mit23-3075.png","https://i.ibb.co/fM7vkpw/nacon-3150.png","https://i.ibb.co/pJGQWdQ/odin-3060.png","https://i.ibb.co/7WPDb99/packrat-3039.png","https://i.ibb.co/9W8gLMm/pandion-3085.png","https://i.ibb.co/GMF5bWs/rotunda-3050u.png","https://i.ibb.co/V3R433z/skulker-wheeled-scout-tank-rg.png","https://i.ibb.co/9WKMx5n/skulker-mk-2-proto.png","https://i.ibb.co/qxmz70H/tamerlane-3075.png","https://i.ibb.co/8XvbKfW/warrior-attack-helicopter-rg.png","https://i.ibb.co/02n1N7M/saracen-3039.png","https://i.ibb.co/KsHY4DS/wheeled-scout-irreg.png","https://i.ibb.co/0n69yV6/winterhawk-3150.png","https://i.ibb.co/p3wGr0C/donar-3060.png","https://i.ibb.co/vkTkyfb/warrior-proto.png","https://i.ibb.co/r3dYv73/vector-hlot2.png","https://i.ibb.co/KX1bc6x/aeron-3085.png","https://i.ibb.co/YNnkk3j/anat-3150.jpg","https://i.ibb.co/3spD0qk/balac-3085.png","https://i.ibb.co/zP6dkc2/blizzard-hover-transport-3058u.png","https://i.ibb.co/5RnjX9R/cavalry-3058u.png","https://i.ibb.co/kx8vPzV/cavalry-proto.png","https://i.ibb.co/Lnk5Gb5/scorpion-light-tank-rg.png","https://i.ibb.co/10wrYD8/di-multipurpose-light-vtol-3150.png","https://i.ibb.co/VVBvckW/gossamer-3145.png","https://i.ibb.co/Rz7wwyj/harrasser-missile-platform-rg.png","https://i.ibb.co/smkqH99/hawk-moth-3060.png","https://i.ibb.co/s10rHLc/hawk-moth-ii-3085.png","https://i.ibb.co/4dCLFth/j-edgar-light-hover-tank-rg.png","https://i.ibb.co/cJkpdf8/ji2a1-attack-apc.png","https://i.ibb.co/mCJGkF4/kestrel-3058u.png","https://i.ibb.co/9gm6Ln2/luduan-3085.png","https://i.ibb.co/pd2sdrL/mithras-3060.png","https://i.ibb.co/72DV8R2/nightshade-3050u.png","https://i.ibb.co/mNMTK2M/red-kite-3150.jpg","https://i.ibb.co/0sqrScN/sea-skimmer-3039.png","https://i.ibb.co/m8CDzz9/sea-skimmer-proto.png","https://i.ibb.co/yqq9rQB/shandra-3145.png","https://i.ibb.co/xDr9hjz/zephyros-3085.png","https://i.ibb.co/cwh8RG0/anhur-3060.png","https://i.ibb.co/ph0x85y/badger-3058u.png","https://i.ibb.co/vPX5Rt0/cobra-vtol-3075.png","https://i.ibb.co/rcPvkz4/coolant-truck-3039.png","https://i.ibb.co/9rypMFw/crane-3145.jpg","https://i.ibb.co/2dmrptQ/cyrano-3050u.png","https://i.ibb.co/g48dwnJ/galleon-light-tank-rg.png","https://i.ibb.co/8NwQsWW/garrot-3150.png","https://i.ibb.co/rdTHWmw/hephaestus-3067.png","https://i.ibb.co/jHCg9B2/hipparch-hrw.png","https://i.ibb.co/YjJ3tCm/ignis-3075.png","https://i.ibb.co/w0GJvrG/karnov-ur-transport-rg.png","https://i.ibb.co/fnd3wZs/kite-3150.png","https://i.ibb.co/s20FDxB/lamprey-3150.png","https://i.ibb.co/V28qHqq/main-gauche-3067.png","https://i.ibb.co/nbQRkYW/onuris-attack-vtol-rg.png","https://i.ibb.co/k3pMXrF/peregrine-3058u.png","https://i.ibb.co/QK1sj3g/pinto-3060.png","https://i.ibb.co/zbx2jxX/praetorian-edda.png","https://i.ibb.co/SRL18fQ/skadi-3085.jpg","https://i.ibb.co/wBDtMVD/strix-3150.png","https://i.ibb.co/dLfJRz3/tribune-edda.png","https://i.ibb.co/Yt9wJWz/yasha-3085.png","https://i.ibb.co/dpZF2Bt/yellow-jacket-3058u.png","https://i.ibb.co/4t4cf3g/chevalier-3060.png","https://i.ibb.co/gDSpj3g/diggs-xtr.png","https://i.ibb.co/YLTRhyy/gun-trailer-3150.png","https://i.ibb.co/r4ZJtxS/hephaestus-proto.png","https://i.ibb.co/qsdbpG2/hunter-light-support-tank-rg.png","https://i.ibb.co/2FzVQHs/hunter-proto.png","https://i.ibb.co/cTqkrfS/indra-3060.png","https://i.ibb.co/Kwb7dsV/lightning-3050u.png","https://i.ibb.co/ys0JgR5/mhi-amphibious-apc-3085.png","https://i.ibb.co/MZjtb1m/nisos-3150.png","https://i.ibb.co/2WTzJ8y/pegasus-rg.png","https://i.ibb.co/cNqNvLJ/pegasus-proto.png","https://i.ibb.co/YbfgB1p/plainsman-3058u.png","https://i.ibb.co/FK64sx2/saladin-3039.png","https://i.ibb.co/x1FdBmP/saladin-mk-ii-3150.jpg","https://i.ibb.co/fXyD0TQ/saracen-mk-ii-3150.jpg","https://i.ibb.co/7JcX3tY/saxon-3075.png","https://i.ibb.co/LvscBhr/scimitar-mk-ii-3085.jpg","https://i.ibb.co/02HHTPf/skanda-3150.png","https://i.ibb.co/GMP69ZG/striker-light-tank-rg.png","https://i.ibb.co/TMb91JR/svantovit-3060.png","https://i.ibb.co/kJqwPSQ/tufana-3085.png","https://i.ibb.co/kMM4P14/engineering-vehicle-3039.png","https://i.ibb.co/RhrdT3T/garuda-proto.png","https://i.ibb.co/yY7MpZz/giggins-3085.png","https://i.ibb.co/hF2yTQf/gladius-3060.png","https://i.ibb.co/VQWzLZH/hasek-3085.png","https://i.ibb.co/swtfpWQ/hetzer-wheeled-assault-gun-rg.png","https://i.ibb.co/tMXQ5h6/hiryo-3075.png","https://i.ibb.co/Pjyfmm6/hiryo-proto.png","https://i.ibb.co/vmk6ZjJ/hetzer-3039.png","https://i.ibb.co/Thm32ZQ/joust-3085.png","https://i.ibb.co/XDKpDC8/light-srm-carrier-3060.png","https://i.ibb.co/hXRQFZW/myrmidon-3060.png","https://i.ibb.co/zrBYnyC/myrmidon-proto.png","https://i.ibb.co/yWmmrf7/phalanx-proto.png","https://i.ibb.co/dpSpC2W/scapha-3085.png","https://i.ibb.co/jfCJ3dX/shillelagh-3150.jpg","https://i.ibb.co/j5hZrTW/shun-3150.png","https://i.ibb.co/rbjqMB0/stygian-3067.png","https://i.ibb.co/gWPGBC8/vali-hlot2.png","https://i.ibb.co/G9VLQgd/zephyr-3050u.png","https://i.ibb.co/tDVS0bb/bellona-3075.png","https://i.ibb.co/wSS1H6r/cizin-3145.jpg","https://i.ibb.co/8B5SJwV/danai-3075.png","https://i.ibb.co/8ztT8sx/demon-3085.png","https://i.ibb.co/cTWmJTz/glaive-3067.png","https://i.ibb.co/GxJm5Zg/goblin-infantry-support-vehicle-rg.png","https://i.ibb.co/1rdMYs1/predator-3150.png","https://i.ibb.co/NxYbBsT/r10-3085.jpg","https://i.ibb.co/G7zMjxp/ranger-3085.png","https://i.ibb.co/NSWb64L/regulator-3058u.png","https://i.ibb.co/XkLBQCn/sortek-3150.png","https://i.ibb.co/HVbHNb5/swallow-3150.png","https://i.ibb.co/T4LhNDQ/tyr-3067.png","https://i.ibb.co/qYYn5BG/whirlwind-scout-hover-tank-rg.png","https://i.ibb.co/SJPLhX0/bandit-3058u.png","https://i.ibb.co/ZGrcsSD/bandit-proto.png","https://i.ibb.co/2n4C2CV/battlemech-recovery-vehicle-3060.png","https://i.ibb.co/wshHPXG/falcon-hover-tank-rg.png","https://i.ibb.co/HK5jHsw/cardinal-3145.png","https://i.ibb.co/31j6Wj0/chalchiuhtotolin-3085.png","https://i.ibb.co/gP7yfkZ/chaparral-3050u.png","https://i.ibb.co/pQ5zVFv/condor-rg.png","https://i.ibb.co/ChPw9Ch/condor-3075.png","https://i.ibb.co/XSL6BH4/drillson-heavy-hover-tank-rg.png","https://i.ibb.co/WVD8R8P/eldingar-3085.png","https://i.ibb.co/jMB8YWg/epona-3060.png","https://i.ibb.co/SxzjHwJ/fulcrum-proto.png","https://i.ibb.co/hRwrrkR/fulcrum-3058u.png","https://i.ibb.co/mFBcMYx/hachiman-3060.png","https://i.ibb.co/5GjvY3c/hadur-3150.png","https://i.ibb.co/b3qG7Cp/harrier-hover-tank-rg.png","https://i.ibb.co/LrjZnd2/hawk-hover-tank.png","https://i.ibb.co/CVrWmsY/jes-i-3075.png","https://i.ibb.co/cDGTKLB/kanga-3050u.png","https://i.ibb.co/gdwcBzc/ku-3060.png","https://i.ibb.co/NTsPKM1/maxim-rg.png","https://i.ibb.co/5nYvLzm/maxim-mk-ii-3085.png","https://i.ibb.co/D1dDdNJ/musketeer-3067.png","https://i.ibb.co/0FLcNcc/partisan-aa-3150.jpg","https://i.ibb.co/vmm54KC/regulator-ii-3085.png","https://i.ibb.co/HGg4rQT/sabaku-kaze-3075.png","https://i.ibb.co/1RH31bF/schildkrote-3150.png","https://i.ibb.co/ypsWZD0/sleipnir-ha.png","https://i.ibb.co/FKH1y5T/sm1-tank-destroyer-rg.png","https://i.ibb.co/RPBxrtx/sokar-proto.png","https://i.ibb.co/N3pmQ28/turhan-3075.png","https://i.ibb.co/720mT6q/vedette-medium-tank-rg.png","https://i.ibb.co/Kqm9HDJ/vedette-proto.png","https://i.ibb.co/jDGbT9h/zibler-3150.png","https://i.ibb.co/rFy39mF/aesir-3145.jpg","https://i.ibb.co/YNDQqk4/reaper-prim.png","https://i.ibb.co/3TK7bQH/enyo-3067.png","https://i.ibb.co/F4cLBm3/enyo-proto.png","https://i.ibb.co/yWSJhvM/kamakiri-3085.png","https://i.ibb.co/sWzQyR8/padilla-3085.png","https://i.ibb.co/D7FQRLj/prowler-3085.png","https://i.ibb.co/4S95vJS/thor-3050u.png","https://i.ibb.co/7bsXDSv/tiger-hrw.png","https://i.ibb.co/VHjpQzD/lrm-carrier-rg.png","https://i.ibb.co/SV47Yzn/srm-carrier-rg.png","https://i.ibb.co/Zg5dX58/bolla-3085.png","https://i.ibb.co/zF1qM3h/bolla-jhs76.png","https://i.ibb.co/NVVBJXY/bulldog-rg.png","https://i.ibb.co/9bfnYJ2/demon-3050u.png","https://i.ibb.co/d6Vwmrw/eurus-mbt-rg.png","https://i.ibb.co/N9bN27S/hi-scout-drone-carrier-3039.png","https://i.ibb.co/thWpVF2/jes-iii-3085.jpg","https://i.ibb.co/bm0gJ3P/lb-x-carrier-hlot2.png","https://i.ibb.co/m67qdhD/manticore-rg.png","https://i.ibb.co/18vK3Wr/marsden-3075.png","https://i.ibb.co/S6SVg7X/mhi-defense-aa-tank-3085.png","https://i.ibb.co/QvkgwJn/morningstar-3067.png","https://i.ibb.co/fnmtk4T/nuberu-proto.png","https://i.ibb.co/st8GNNT/oro-3060.png","https://i.ibb.co/dGsgsdJ/pike-support-vehicle-rg.png","https://i.ibb.co/fFrwB9z/po-3058u.png","https://i.ibb.co/BfTnHbK/po-proto.png","https://i.ibb.co/gWHxtYw/po-ii-3085.png","https://i.ibb.co/PDCKJx0/thumper-3075.png","https://i.ibb.co/F56mWdH/thumper-proto.png","https://i.ibb.co/tQHtdrk/tokugawa-3058u.png","https://i.ibb.co/ByPn1sp/patton-tank-rg.png","https://i.ibb.co/Qd6d3CF/ishtar-3060.png","https://i.ibb.co/zN9Phtz/marksman-3050u.png","https://i.ibb.co/DRj24cL/rommel-howitzer-proto.png","https://i.ibb.co/1nBshmp/sekhmet-3150.jpg","https://i.ibb.co/rvRFYmv/vargr-ha.png","https://i.ibb.co/98CggC4/zahn-3150.png","https://i.ibb.co/7vXsNrq/bardiche-3150.jpg","https://i.ibb.co/S5ML0Lm/gallant-3085.png","https://i.ibb.co/yh4Ct19/kinnol-3085.png","https://i.ibb.co/5WQV2Wb/burke-3050u.png","https://i.ibb.co/2hmBJFL/magi-3050u.png","https://i.ibb.co/GdNtRbq/mamono-3150.jpg","https://i.ibb.co/5BcYLm3/manteuffel-3067.png","https://i.ibb.co/Qdw15mm/manticore-ii-3085.png","https://i.ibb.co/whVfk0N/pilum-3058u.png","https://i.ibb.co/2NVSYbh/pixiu-3085.png","https://i.ibb.co/z2ff0cz/shoden-3067.png","https://i.ibb.co/M1MYRR4/ji-100-3085.png","https://i.ibb.co/Qp7tM5Z/typhoon-3058u.png","https://i.ibb.co/2q1qcbW/winston-3085.png","https://i.ibb.co/XsH3d4f/athena-3060.png","https://i.ibb.co/qksXMWx/bokkusu-3085.png","https://i.ibb.co/YTWD7pg/brutus-3058u.png","https://i.ibb.co/MSZDLhF/hanse-3145.png","https://i.ibb.co/8xtsRFZ/merkava-3075.png","https://i.ibb.co/Vx374KF/moltke-3085.png","https://i.ibb.co/tBg0V7b/moltke-m3-3085.png","https://i.ibb.co/m9CzT7j/monitor-3039.png","https://i.ibb.co/JxLLQw3/padilla-3058u.png","https://i.ibb.co/LS9MbqQ/testudo-3150.png","https://i.ibb.co/bNW9zry/vidar-proto.png","https://i.ibb.co/ZgtkBW5/von-luckner-heavy-tank-rg.png","https://i.ibb.co/jTNLKgS/zhukov-3058u.png","https://i.ibb.co/JqLxS8j/arrow-iv-assault-vehicle-3150.png","https://i.ibb.co/VNcNd22/carnivore-3085.png","https://i.ibb.co/gPsf6Gt/demolisher-rg.png","https://i.ibb.co/Tk2N69n/di-schmitt-3145.png","https://i.ibb.co/kyx3q8C/fensalir-3085.png","https://i.ibb.co/XtMcRB4/Fortune-3067.png","https://i.ibb.co/9NkgG4c/fury-3050u.png","https://i.ibb.co/ZKG6g9k/gurzil-3145.jpg","https://i.ibb.co/q7FyKTX/heavy-lrm-carrier-3060.png","https://i.ibb.co/YRTXTRs/heavy-nlrm-carrier-proto.png","https://i.ibb.co/TrrSckx/morrigu-3067.png","https://i.ibb.co/0JYpZF4/partisan-heavy-tank-rg.png","https://i.ibb.co/M5K2C2f/rhino-3050u.png","https://i.ibb.co/5RNHpBX/schiltron-3060.png","https://i.ibb.co/VCFNWGc/schrek-ppc-carrier-rg.png","https://i.ibb.co/NSgYcZc/sniper-sniper.png","https://i.ibb.co/QC7sZNM/bulwark-3145.jpg","https://i.ibb.co/hmG1956/glory-3067.png","https://i.ibb.co/f8qh4XD/huitzilopochtli-3060.png","https://i.ibb.co/Q8G0r1c/mauna-kea-3075.png","https://i.ibb.co/59qvfvy/palmoni-3085.png","https://i.ibb.co/WPQN1Cn/sturmfeur-heavy-tank-rg.png","https://i.ibb.co/R64b6c7/trajan-3085.png","https://i.ibb.co/JpG0qtW/ajax-3067.png","https://i.ibb.co/7vhP6r2/challenger-proto.png","https://i.ibb.co/FbwNRxd/challenger-3058u.png","https://i.ibb.co/FK2v0Jd/hexareme-3150.png","https://i.ibb.co/Jks1nPC/narukami-3145.jpg","https://i.ibb.co/n1wCrB1/alacorn-3058u.png","https://i.ibb.co/t83RKYc/heimdall-3067.png","https://i.ibb.co/5h7Mhkj/jes-ii-3085.png","https://i.ibb.co/J73n1Py/kelswa-3150.png","https://i.ibb.co/99wfJ4Q/marksman-mbt-3085.png","https://i.ibb.co/ZxHZyd9/ontos-heavy-tank-rg.png","https://i.ibb.co/qpNLdB4/ontos-proto.png","https://i.ibb.co/PZy9x6p/puma-3050u.png","https://i.ibb.co/P5jN4dP/aithon-proto.png","https://i.ibb.co/hyt6VWR/ballista-3145.png","https://i.ibb.co/ZJQYF3N/behemoth-heavy-tank-rg.png","https://i.ibb.co/h1T28Bp/behemoth-ii-3145.png","https://i.ibb.co/h9Rw9X0/demolisher-ii-3060.png","https://i.ibb.co/MB9cftT/di-morgan-3075.png","https://i.ibb.co/whf1myJ/gurteltier-3085.png","https://i.ibb.co/K9YzBdz/mars-3060.png","https://i.ibb.co/HBXs62B/neptune-submarine-3039.png","https://i.ibb.co/FWJ9SPJ/paladin-3085.png","https://i.ibb.co/F87GPL6/kalki-cruise-missile-launcher.png","https://i.ibb.co/Zh7DSj4/teppo-3085.png","https://i.ibb.co/02GtSrh/demolisher-original.png","https://i.ibb.co/PG2QDq6/soarece-xtr.png","https://i.ibb.co/VjGkG26/gulltoppr-3150.jpg","https://i.ibb.co/BGdqWSv/destrier-3150.png"],"values":[0,0,0,0,1,1,1,2,2,2,2,2,3,3,3,3,4,4,4,4,5,5,5,5,6,6,6,6,7,7,7,7,7,7,8,8,9,9,9,9,9,9,10,10,10,10,10,10,10,11,11,11,11,11,11,12,13,13,13,14,14,14,14,14,14,15,15,15,15,15,16,16,16,17,17,17,17,18,18,19,19,20,20,20,20,20,20,21,21,21,22,22,22,22,23,23,23,23,24,24,24,24,24,25,25,25,25,26,27,27,27,27,27,28,28,28,28,29,30,30,30,30,30,31,31,31,32,32,32,32,32,33,33,34,35,35,36,36,36,36,36,37,37,37,37,37,38,38,38,38,39,39,39,39,39,40,39,41,41,41,41,42,42,42,42,43,44,44,44,45,46,46,46,42,42,42,42,47,48,48,48,48,49,49,50,51,51,51,51,52,52,52,16,16,53,53,53,54,53,53,53,54,55,56,56,57,57,58,58,58,58,58,58,58,58,58,58,58,58,58,58,59,59,59,59,60,60,60,61,61,61,61,61,61,61,61,61,61,61,62,62,63,63,63,63,63,63,63,64,65,65,16,16,16,16,16,16,66,66,66,66,66,67,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,68,68,69,68,68,70,70,71,71,72,72,72,73,73,73,73,73,73,73,73,73,73,73,73,74,74,75,75,75,76,77,77,77,77,77,78,78,78,78,78,78,78,78,78,78,78,78,78,78,79,80,80,80,80,80,81,82,82,83,83,83,83,83,83,83,84,84,85,86,86,86,86,87,87,87,87,87,87,88,88,88,89,89,90,91,92,93,94,94,94,95,95,95,95,95,96,96,96,96,97,98,98,98,98,98,98,98,98,98,98,99,100,100,100,100,101,100,100,100,100,100,102,102,103,103,103,103,103,103,104,105,105,106,106,106,106,106,106,106,106,106,107,106,108,108,108,108,109,109,109,109,109,109,110,110,43,43,111,111,112,112,112,112,26,26,26,26,113,113,113,100,114,114,115,115,115,115,115,115,115,115,115,115,115,116,116,116,117,117,118,118,118,119,120,120,121,121,122,123,123,123,123,123,123,123,123,123,123,124,124,125,124,124,126,127,127,128,128,129,130,129,129,131,131,132,132,132,132,132,132,132,132,132,132,132,133,133,134,134,135,135,135,136,137,137,137,137,137,137,137,137,137,137,138,138,138,139,139,140,140,141,141,141,142,142,143,143,143,143,143,143,143,143,143,83,144,144,144,145,145,145,145,146,146,147,147,147,147,148,148,149,149,149,150,150,151,151,151,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,153,152,154,155,156,156,157,157,157,157,158,158,158,158,158,159,159,159,159,159,159,159,159,159,159,160,160,159,159,159,161,161,161,161,161,161,161,161,162,162,162,163,163,163,163,163,163,155,164,165,165,165,165,166,166,167,167,167,168,168,168,169,170,170,171,171,171,172,172,173,173,173,173,173,173,173,173,173,173,174,174,174,175,175,175,176,176,177,177,177,178,179,180,180,181,181,181,181,182,183,183,183,184,184,184,184,184,184,184,184,184,184,184,184,185,185,185,186,186,186,186,186,187,187,188,189,190,189,189,191,191,192,193,193,193,193,193,193,193,193,194,194,194,194,195,195,196,196,197,198,198,198,198,198,199,199,199,199,200,200,200,200,200,200,200,200,201,201,201,201,201,201,202,202,202,202,202,203,203,204,204,204,204,204,196,205,205,205,196,196,196,196,206,206,206,206,206,206,206,206,206,206,207,207,207,208,209,209,209,209,196,196,210,211,211,212,212,212,212,212,212,212,213,213,214,213,213,215,215,215,215,90,197,197,197,197,197,216,217,216,216,216,218,218,218,218,218,218,218,218,219,219,219,219,220,220,220,221,221,221,9,219,219,219,219,219,219,219,219,222,222,223,223,224,224,225,226,226,226,227,227,7,228,228,228,229,229,230,230,231,232,232,232,232,232,232,233,234,234,234,235,236,236,236,237,238,238,238,238,239,239,239,239,239,240,240,240,241,242,242,242,242,242,229,229,229,243,244,244,9,245,245,246,247,248,241,249,250,251,251,251,251,251,251,251,251,251,251,252,252,252,252,253,254,254,254,255,255,255,255,255,255,255,255,255,256,256,257,257,257,257,257,257,257,258,258,258,259,259,259,259,259,259,259,259,259,260,261,261,261,262,263,263,263,264,264,264,264,264,264,264,264,264,264,264,264,264,264,264,264,264,265,265,265,265,265,266,266,266,266,266,266,266,267,267,267,267,267,267,267,267,267,268,269,269,270,270,270,270,271,271,271,271,272,272,272,272,273,274,274,274,274,274,274,274,274,275,275,276,276,276,276,276,276,277,278,278,278,278,278,279,280,280,281,281,281,281,281,281,281,282,282,282,282,282,283,283,283,284,285,285,285,9,286,286,286,286,286,286,286,286,287,286,288,288,288,288,267,289,290,291,291,291,291,291,291,291,291,292,292,293,293,293,293,294,294,294,295,295,296,296,296,296,297,297,297,297,274,298,229,299,300,301,302,303,303,303,304]},"MULId":{"values":[1060,5605,1058,1059,1165,1164,1166,2807,2805,9452,2806,5065,3145,3142,3143,3144,111,3731,114,115,116,117,119,120,121,122,124,125,1134,1129,1130,1131,1132,1133,6311,6312,2203,9366,9367,9368,9369,2204,2725,2719,2720,2721,2722,2723,2724,3026,3022,3023,3024,3025,3027,6487,2921,2919,2920,836,832,833,834,835,4050,312,310,7330,311,313,9385,3977,3978,747,8411,745,746,2029,2028,6313,6314,2109,2104,2105,2106,2107,2108,133,135,134,514,513,515,3920,1151,1150,6749,1152,1435,1431,1432,1433,1434,1453,1450,1451,1452,1454,1458,1455,1456,1457,1459,1645,1643,1644,1647,1646,9332,9333,9334,9331,9335,1971,9453,1970,4640,2185,5725,4641,4642,2191,6753,6244,2317,2316,5606,2399,2400,2401,2402,2415,8046,8047,2413,2414,2745,2746,2747,2748,2958,2955,2956,2957,9360,5071,5068,3158,3156,3157,3159,3512,3516,3517,3518,8304,5401,7819,7820,6594,906,904,905,3513,3514,3515,9361,5387,6768,6771,6770,6769,14,13,6245,210,6750,208,209,398,396,397,9399,9386,506,9465,503,3909,504,505,507,508,8078,6595,6596,6537,6538,1385,1390,1386,1387,1388,5785,9550,9551,9552,1389,9553,6751,9549,6752,1427,5786,1426,1428,6653,6697,6698,1641,5774,9473,1637,1638,1639,9474,9475,1640,1642,9476,6315,6316,1769,1764,1765,1766,5775,1767,1768,6437,2193,2192,2201,2196,2197,2198,2199,2200,2278,2274,2275,2276,2277,6488,2847,9555,9556,2841,2842,2843,4996,2844,2845,9557,9558,2846,9559,9554,9560,5009,5005,5006,5007,5008,6654,6699,3634,3633,33,35,34,192,193,194,195,196,197,198,199,200,201,202,203,658,3971,687,688,689,6655,787,784,785,786,7329,9341,1175,1176,1177,1178,8041,9336,9337,1179,1180,9338,9339,9340,1181,6539,4313,4314,4315,5726,4316,4324,1605,1604,1753,1754,1755,1756,9561,1757,1758,6541,8052,6540,4569,4568,5727,4570,9418,9419,9420,9421,9422,9417,2479,2477,2478,2532,2533,7297,6246,7298,6958,3612,3610,3611,3617,3613,3614,3615,3616,582,579,580,581,7299,6528,6529,6532,6536,6534,6530,6527,6533,6531,6535,4311,1579,1572,1573,1574,4341,9562,1575,1576,1577,1578,1613,1612,1884,1880,1881,1882,1883,5554,6656,6438,6439,2461,2455,2456,2457,9254,2458,2459,2460,2462,4798,2463,2541,2539,2540,2542,2780,2777,2778,2779,2781,5567,6371,6372,2796,2795,6373,6374,2811,2808,2809,2810,2831,2829,2830,2832,6375,6376,6377,2854,6247,8058,3105,3097,3098,3099,5154,3100,3101,3102,3103,3104,9563,3139,3137,3138,3314,3313,990,988,989,4202,1196,1195,1213,1214,6317,1513,1506,9387,1507,1508,1509,1510,1511,1512,9388,1528,1529,4325,1526,1527,1664,1711,1712,1869,1877,2245,4689,4690,2246,4816,2480,6659,6660,6661,6662,6663,6664,6665,6666,6667,6668,6657,6378,6379,6440,8057,5158,5157,5728,6773,3632,3629,3630,7301,7302,7303,7300,3631,5435,7674,326,325,8036,6380,6381,822,5568,871,6754,870,4217,5729,1220,9564,1222,1221,1226,1223,1224,1225,1227,5787,6441,8053,6442,6493,6491,6492,6490,2638,2641,2677,2674,2675,2676,6318,6319,6597,6598,8059,5314,5730,9362,9364,9363,220,221,222,223,224,225,226,227,229,230,231,232,233,234,235,236,237,238,3783,239,304,9342,6542,6543,537,536,3938,6756,558,554,555,556,557,683,679,5776,680,9309,9310,6757,681,682,9308,685,684,9311,7304,7305,932,929,9472,930,931,933,9470,9471,947,6758,948,991,992,993,994,995,996,4154,4188,1154,1155,1156,1157,1359,1358,6248,8050,8051,9436,9454,9455,5587,1703,1702,1745,1744,1746,1846,1845,2127,2118,2119,2120,2122,2123,9312,2124,2125,2126,2129,6787,2128,4688,5731,4687,6494,6495,2679,2678,2680,2761,6599,7613,7614,2971,5607,2972,8265,5096,3320,3319,5306,3395,3387,8299,3388,9481,3389,3390,3391,3392,3393,3394,3396,5341,6788,3397,6322,6323,6324,6325,6321,6249,6250,6775,4127,4126,5732,4128,6382,6383,7386,6789,2583,2584,2585,6790,2587,2588,2589,3189,3186,3187,3188,8153,5244,5,4,3735,410,411,412,6791,413,414,415,416,417,441,439,6792,9256,9255,9257,440,9258,876,872,873,874,875,5555,9390,9391,9392,9393,9389,1532,5608,6669,6700,6701,6702,6703,1861,6776,6778,6777,1952,1951,1953,9426,2021,2014,2015,2016,2017,2018,2019,2020,9456,7675,2084,2086,2087,6670,4671,4669,5733,4670,6793,2243,4737,2342,2341,2523,2519,2520,9423,2521,9424,2522,2549,2546,4841,2547,2548,2551,2550,6794,6795,6957,3030,3028,3029,3031,9425,3210,5229,3211,3212,3213,3263,3260,3261,3262,3264,3265,3266,3267,182,183,180,181,1635,1633,1634,2077,2075,2076,9365,2450,9343,2451,9344,5569,2737,2735,2736,4934,4933,6384,8056,7615,7616,6444,6496,6497,8049,4200,4199,1429,1789,1788,6796,7672,7673,1991,1992,6385,4584,4585,5734,5735,6797,4586,6601,2531,2530,8048,6445,5056,5736,5057,1706,3337,3335,3336,3338,3553,3552,6798,6799,6800,137,136,3747,3844,435,431,432,433,434,445,443,444,6326,2174,2176,2202,2205,2206,2207,2219,2404,5206,6544,5348,3449,3450,3451,3452,9482,3453,3454,9483,9484,5788,3650,3648,3649,3651,6446,465,463,464,858,9259,859,860,861,862,9260,864,897,6602,6603,1057,8038,8039,1055,1056,8040,5789,4181,1149,5737,1161,1158,1159,4193,6801,6802,4194,1160,5556,6251,1440,1439,1441,4276,4674,5738,4673,2440,2434,2435,2436,2437,2438,2439,2441,2445,2442,2443,9566,9567,9568,2444,9569,2446,4913,2681,7327,2685,7691,2815,2816,2817,2818,2819,2820,2821,2822,9477,9478,2827,2824,2825,2826,9479,9480,6327,6498,6499,4219,6803,5739,4218,1551,1550,8042,8043,2113,2110,2111,2112,2411,3115,9372,9370,3113,3114,9371,9373,6967,3282,3281,21,3688,3689,5740,5741,3690,3939,538,539,540,541,542,7306,6388,6389,5622,5623,23,24,8151,25,26,4292,5742,5743,6804,4293,1705,1704,6805,6604,2078,2079,6806,8044,2331,2325,9400,2326,2327,2328,2329,2330,4748,4749,2599,2600,2601,2602,2823,3685,6330,324,321,9457,322,9458,323,9459,9460,6447,6448,866,865,867,4069,900,898,899,4256,4255,2082,2080,2081,2083,4711,2258,4709,4710,3112,6328,7328,4416,5207,8037,5778,6607,6608,6606,6329]},"Weapons":{"values":["AC/2 - 5x2 @ 8/16/24","LB 2-X AC (Slug) - 5x2 @ 9/18/27\n-- OR -- - x @ \nLB 2-X AC (Pellet) - 10x1 @ 9/18/27","ER Large Laser - 1x8 @ 7/14/19","ER Large Laser - 1x8 @ 7/14/19","LB 2-X AC (Slug) - 4x2 @ 10/20/30\n-- OR -- - x @ \nLB 2-X AC (Pellet) - 8x1 @ 10/20/30","HAG/40 - 6x5 @ 8/16/24","Long Tom Cannon - 1x20 @ 6/13/20\nMedium Pulse Laser - 4x7 @ 4/8/12","MML 9 - 1x5 @ 3/14/21\nER Large Laser - 1x8 @ 7/14/19\nMedium Pulse Laser - 2x6 @ 2/4/6","Rotary AC/5 - 18x5 @ 5/10/15\nER Small Laser - 1x3 @ 2/4/5","PPC - 1x10 @ 6/12/18\nLRM 15 - 6x5 @ 7/14/21","Streak SRM 6 - 16x2 @ 3/6/9\nMRM 40 - 5x5 @ 3/8/15\nPPC - 1x10 @ 6/12/18","Light Machine Gun - 3x1 @ 2/4/6\nArrow IV - 1x20 @ 1/2/8\nER Medium Laser - 2x5 @ 4/8/12","Ultra AC/10 - 2x10 @ 6/12/18\nGauss Rifle - 1x15 @ 7/15/22\nMedium Pulse Laser - 2x6 @ 2/4/6\nStreak SRM 4 - 3x2 @ 3/6/9","AC/10 - 3x10 @ 5/10/15","AC/20 - 3x20 @ 3/6/9","AC/10 - 3x10 @ 5/10/15","AC/20 - 3x20 @ 3/6/9","Gauss Rifle - 3x15 @ 7/15/22","Heavy Gauss Rifle - 2x15 @ 6/13/20","Micro Pulse Laser - 2x3 @ 1/2/3","LRM 15 - 4x5 @ 7/14/21","ER Medium Laser - 1x7 @ 5/10/15\nMedium Pulse Laser - 1x7 @ 4/8/12","ER Medium Laser - 1x7 @ 5/10/15\nAP Gauss Rifle - 1x3 @ 3/6/9","LRM 10 - 1x5 @ 7/14/21\nLRM 15 - 2x5 @ 7/14/21\nER Large Laser - 1x10 @ 8/15/25","LRM 15 - 4x5 @ 7/14/21\nPlasma Cannon - 1x2D6 Heat @ 6/12/18","LRM 5 - 1x5 @ 7/14/21","Machine Gun - 3x2 @ 1/2/3",null,"SRM 2 - 2x2 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3","LRM 5 - 1x5 @ 7/14/21","Machine Gun - 3x2 @ 1/2/3","SRM 2 - 2x2 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3","LRM 5 - 1x5 @ 7/14/21","Machine Gun - 4x2 @ 1/2/3","SRM 2 - 2x2 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3","Arrow IV - 1x20 @ 1/2/8\nMedium VSP Laser - 2x7 @ 2/5/9","Arrow IV - 2x20 @ 1/2/8","ER Medium Laser - 2x7 @ 5/10/15\nStreak SRM 6 - 4x2 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3\nStreak SRM 6 - 4x2 @ 3/6/9\nER Medium Laser - 2x7 @ 5/10/15","ProtoMech AC/8 - 1x8 @ 3/7/10","Gauss Rifle - 2x15 @ 7/15/22\nLRM 10 - 1x5 @ 7/14/21\nER Medium Laser - 2x7 @ 5/10/15\nMachine Gun - 2x2 @ 1/2/3","HAG/30 - 4x5 @ 8/16/24\nER Medium Laser - 2x7 @ 5/10/15\nAP Gauss Rifle - 2x3 @ 3/6/9","Large Chemical Laser - 4x8 @ 5/10/15\nMedium Chemical Laser - 2x5 @ 3/6/9\nMachine Gun - 4x2 @ 1/2/3","AP Gauss Rifle - 1x3 @ 3/6/9\nLarge Pulse Laser - 1x10 @ 6/14/20\nLRM 15 - 4x5 @ 7/14/21","AP Gauss Rifle - 1x3 @ 3/6/9\nER Large Laser - 1x10 @ 8/15/25\nLRM 15 - 4x5 @ 7/14/21","Machine Gun - 2x2 @ 1/2/3\nLRM 10 - 1x5 @ 7/14/21\nAC/20 - 1x20 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3\nLRM 10 - 1x5 @ 7/14/21\nAC/20 - 1x20 @ 3/6/9","ER Small Laser - 3x5 @ 2/4/6\nMachine Gun - 6x2 @ 1/2/3","Medium Pulse Laser - 1x7 @ 4/8/12\nStreak SRM 2 - 2x2 @ 3/6/9","LRM 10 - 1x5 @ 7/14/21\nER Small Laser - 1x5 @ 2/4/6","Streak SRM 6 - 4x2 @ 3/6/9","ATM 3 - 1x5 @ 5/10/15\nER Small Laser - 1x5 @ 2/4/6","AP Gauss Rifle - 4x3 @ 3/6/9","Heavy Medium Laser - 1x10 @ 3/6/9\nStreak SRM 2 - 2x2 @ 3/6/9","ER Medium Laser - 1x7 @ 5/10/15\nStreak SRM 4 - 3x2 @ 3/6/9","SRM 2 - 8x2 @ 3/6/9","SRM 4 - 6x2 @ 3/6/9","LRM 5 - 2x5 @ 7/14/21","Small Laser - 2x3 @ 1/2/3\nMedium Laser - 3x5 @ 3/6/9","Small Laser - 9x3 @ 1/2/3","ER Medium Laser - 1x5 @ 4/8/12","Light PPC - 1x5 @ 6/12/18\nSRM 2 - 2x2 @ 3/6/9","SRM 2 - 2x2 @ 3/6/9\nMedium Laser - 3x5 @ 3/6/9","ER Medium Laser - 1x7 @ 5/10/15\nATM 6 - 3x5 @ 5/10/15","ATM 6 - 3x5 @ 5/10/15\nHeavy Machine Gun - 1x3 @ 1/2/3","LRM 15 - 4x5 @ 7/14/21\nER Medium Laser - 1x7 @ 5/10/15","ATM 6 - 3x5 @ 5/10/15","ER Medium Laser - 2x5 @ 4/8/12\nArrow IV - 2x20 @ 1/2/8","Machine Gun - 2x2 @ 1/2/3","SRM 2 - 4x2 @ 3/6/9\nER Large Laser - 1x10 @ 8/15/25","LRM 20 - 3x5 @ 7/14/21","Medium Pulse Laser - 3x7 @ 4/8/12","ER Medium Laser - 2x7 @ 5/10/15\nLB 2-X AC (Slug) - 1x2 @ 10/20/30\n-- OR -- - x @ \nLB 2-X AC (Pellet) - 2x1 @ 10/20/30","ATM 9 - 2x5 @ 5/10/15","Streak SRM 2 - 2x2 @ 3/6/9\nPlasma Cannon - 1x2D6 Heat @ 6/12/18\nAP Gauss Rifle - 2x3 @ 3/6/9","Heavy Machine Gun - 4x3 @ 1/2/3\nHeavy Machine Gun Array - 1x3 @ 1/2/3\nER Medium Laser - 1x7 @ 5/10/15\nLight Machine Gun - 4x1 @ 2/4/6\nLight Machine Gun Array - 1x1 @ 2/4/6","Medium Pulse Laser - 1x7 @ 4/8/12\nHeavy Medium Laser - 1x10 @ 3/6/9\nStreak SRM 4 - 3x2 @ 3/6/9","Streak SRM 6 - 8x2 @ 3/6/9","Large VSP Laser - 1x9 @ 4/8/15\nMachine Gun - 1x2 @ 1/2/3","PPC - 1x10 @ 6/12/18","SRM 2 - 2x2 @ 3/6/9\nSRM 4 - 6x2 @ 3/6/9","SRM 6 - 8x2 @ 3/6/9","LRM 5 - 2x5 @ 7/14/21","Medium Laser - 1x5 @ 3/6/9\nLRM 10 - 1x5 @ 7/14/21","Medium Laser - 1x5 @ 3/6/9\nLarge Laser - 1x8 @ 5/10/15","Small Laser - 6x3 @ 1/2/3\nMedium Laser - 2x5 @ 3/6/9","ER Medium Laser - 1x5 @ 4/8/12\nSRM 2 - 2x2 @ 3/6/9","Light Machine Gun - 1x1 @ 2/4/6\nLight PPC - 2x5 @ 6/12/18",null,"SRM 2 - 4x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3\nMedium Laser - 3x5 @ 3/6/9","MML 7 - 1x5 @ 3/14/21\nMagshot Gauss Rifle - 4x2 @ 3/6/9\nLight PPC - 2x5 @ 6/12/18","MML 3 - 1x5 @ 3/14/21\nMagshot Gauss Rifle - 4x2 @ 3/6/9\nHeavy PPC - 1x15 @ 6/12/18","Streak SRM 6 - 4x2 @ 3/6/9\nAP Gauss Rifle - 4x3 @ 3/6/9\n'Mech Mortar 8 - 2x8 @ 7/14/21",null,"Small Laser - 1x3 @ 1/2/3\nMedium Laser - 1x5 @ 3/6/9",null,"Flamer - 1x2 @ 1/2/3",null,null,"LRM 5 - 3x5 @ 7/14/21\nMachine Gun - 4x2 @ 1/2/3\nSRM 2 - 8x2 @ 3/6/9\nSRM 6 - 8x2 @ 3/6/9\nAC/10 - 2x10 @ 5/10/15","LRM 5 - 3x5 @ 7/14/21\nSRM 6 - 8x2 @ 3/6/9\nAC/10 - 2x10 @ 5/10/15","ER Medium Laser - 2x5 @ 4/8/12\nSRM 2 - 8x2 @ 3/6/9\nRocket Launcher 10 - 3x5 @ 5/10/15\nMagshot Gauss Rifle - 2x2 @ 3/6/9\nGauss Rifle - 2x15 @ 7/15/22\nStreak SRM 6 - 8x2 @ 3/6/9","LRM 5 - 3x5 @ 7/14/21\nMachine Gun - 4x2 @ 1/2/3\nFlamer (Vehicle) - 6x2 @ 1/2/3\nSRM 6 - 8x2 @ 3/6/9\nAC/10 - 2x10 @ 5/10/15","ER Medium Laser - 2x5 @ 4/8/12\nUltra AC/10 - 4x10 @ 6/12/18\nStreak SRM 6 - 12x2 @ 3/6/9","LRM 5 - 2x5 @ 7/14/21\nUltra AC/10 - 4x10 @ 6/12/18\nSRM 6 - 8x2 @ 3/6/9\nMRM 10 - 3x5 @ 3/8/15","MML 5 - 6x5 @ 3/14/21\nMachine Gun - 2x2 @ 1/2/3\nGauss Rifle - 1x15 @ 7/15/22\nRocket Launcher 10 - 6x5 @ 5/10/15","LRM 5 - 3x5 @ 7/14/21\nMachine Gun - 4x2 @ 1/2/3\nSRM 2 - 8x2 @ 3/6/9\nLB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nSRM 6 - 8x2 @ 3/6/9","Gauss Rifle - 1x15 @ 7/15/22\nThunderbolt 5 - 8x5 @ 6/12/18\nRocket Launcher 10 - 6x5 @ 5/10/15","LRM 20 - 5x5 @ 7/14/21\nStreak SRM 4 - 6x2 @ 3/6/9\nER Large Laser - 1x8 @ 7/14/19\nGauss Rifle - 1x15 @ 7/15/22","Light Machine Gun - 4x1 @ 2/4/6\nFlamer - 2x2 @ 1/2/3\nUltra AC/10 - 2x10 @ 6/12/18","Light Machine Gun - 6x1 @ 2/4/6\nLRM 10 - 1x5 @ 7/14/21\nFlamer - 1x2 @ 1/2/3\nER Large Laser - 1x10 @ 8/15/25","ER Large Laser - 1x10 @ 8/15/25\nStreak LRM 5 - 2x5 @ 7/14/21","LRM 5 - 1x5 @ 7/14/21","SRM 4 - 6x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","SRM 2 - 4x2 @ 3/6/9",null,"Machine Gun - 1x2 @ 1/2/3\nLight Gauss Rifle - 1x8 @ 8/17/25","Machine Gun - 1x2 @ 1/2/3\nMML 7 - 2x5 @ 3/14/21\nMagshot Gauss Rifle - 3x2 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3\nLight AC/5 - 1x5 @ 5/10/15\nStreak SRM 6 - 8x2 @ 3/6/9","Medium Chemical Laser - 1x5 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3\nSniper Cannon - 1x10 @ 4/8/12","Machine Gun - 2x2 @ 1/2/3\nRotary AC/5 - 6x5 @ 5/10/15\nMML 3 - 1x5 @ 3/14/21","Machine Gun - 1x2 @ 1/2/3\nLight Gauss Rifle - 1x8 @ 8/17/25","Machine Gun - 1x2 @ 1/2/3\nLight AC/5 - 2x5 @ 5/10/15\nHeavy Flamer - 1x4 @ 2/3/4","Machine Gun - 1x2 @ 1/2/3\nStreak SRM 6 - 12x2 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3\nMML 9 - 2x5 @ 3/14/21",null,null,"Large Laser - 2x8 @ 5/10/15\nLRM 20 - 3x5 @ 7/14/21\nSRM 6 - 8x2 @ 3/6/9\nSRM 2 - 2x2 @ 3/6/9","Heavy PPC - 1x15 @ 6/12/18\nLRM 20 - 3x5 @ 7/14/21\nSRM 6 - 8x2 @ 3/6/9\nSRM 2 - 2x2 @ 3/6/9","LRM 20 - 5x5 @ 7/14/21\nSRM 6 - 8x2 @ 3/6/9\nSRM 2 - 2x2 @ 3/6/9","Large Laser - 2x8 @ 5/10/15\nPPC - 1x10 @ 6/12/18\nSRM 2 - 8x2 @ 3/6/9","PPC - 2x10 @ 6/12/18\nSRM 6 - 8x2 @ 3/6/9\nSRM 2 - 2x2 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3\nSRM 4 - 6x2 @ 3/6/9\nLarge Laser - 1x8 @ 5/10/15","Machine Gun - 2x2 @ 1/2/3\nSRM 4 - 6x2 @ 3/6/9\nAC/2 - 2x2 @ 8/16/24","Machine Gun - 1x2 @ 1/2/3\nMML 5 - 2x5 @ 3/14/21\nSnub-Nose PPC - 1x8 @ 9/13/15","Machine Gun - 1x2 @ 1/2/3\nLarge Chemical Laser - 1x8 @ 5/10/15\nSRM 4 - 6x2 @ 3/6/9","Heavy Machine Gun - 1x3 @ 1/2/3\nER Large Laser - 1x8 @ 7/14/19\nSRM 4 - 6x2 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3\nLB 5-X AC (Slug) - 2x5 @ 7/14/21\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 10x1 @ 7/14/21\nSRM 4 - 6x2 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3\nSRM 4 - 6x2 @ 3/6/9\nLRM 20 - 3x5 @ 7/14/21","Heavy Machine Gun - 1x3 @ 1/2/3\nPlasma Rifle - 1x10 @ 5/10/15\nStreak SRM 4 - 6x2 @ 3/6/9","Improved Heavy Gauss Rifle - 1x22 @ 6/12/19\nHeavy PPC - 1x15 @ 6/12/18","Heavy Gauss Rifle - 1x15 @ 6/13/20\nGauss Rifle - 1x15 @ 7/15/22","LRM 10 - 1x5 @ 7/14/21\nPPC - 3x10 @ 6/12/18","Streak SRM 4 - 3x2 @ 3/6/9\nHeavy PPC - 2x15 @ 6/12/18","Streak SRM 2 - 4x2 @ 3/6/9\nPPC - 3x10 @ 6/12/18","LRM 5 - 2x5 @ 7/14/21\nAC/20 - 4x20 @ 3/6/9","Light PPC - 1x5 @ 6/12/18\nMML 7 - 2x5 @ 3/14/21","AP Gauss Rifle - 2x3 @ 3/6/9\nLB 2-X AC (Slug) - 1x2 @ 10/20/30\n-- OR -- - x @ \nLB 2-X AC (Pellet) - 2x1 @ 10/20/30\nLRM 5 - 1x5 @ 7/14/21","Small Pulse Laser - 3x3 @ 2/4/6\nMML 5 - 1x5 @ 3/14/21","ER Medium Laser - 2x7 @ 5/10/15\nHeavy Machine Gun - 2x3 @ 1/2/3\nGauss Rifle - 2x15 @ 7/15/22","Medium Pulse Laser - 2x7 @ 4/8/12\nAP Gauss Rifle - 4x3 @ 3/6/9\nHAG/40 - 6x5 @ 8/16/24","Medium Pulse Laser - 2x7 @ 4/8/12\nLight Machine Gun - 2x1 @ 2/4/6\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18","SRM 6 - 4x2 @ 3/6/9\nSRM 2 - 6x2 @ 3/6/9","Medium Laser - 3x5 @ 3/6/9\nMachine Gun - 3x2 @ 1/2/3","Magshot Gauss Rifle - 2x2 @ 3/6/9","LRM 10 - 1x5 @ 7/14/21\nSRM 2 - 2x2 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9\nSRM 2 - 8x2 @ 3/6/9","LRM 10 - 1x5 @ 7/14/21","Magshot Gauss Rifle - 3x2 @ 3/6/9","Medium Laser - 1x5 @ 3/6/9","SRM 2 - 12x2 @ 3/6/9",null,"Magshot Gauss Rifle - 2x2 @ 3/6/9","Light Machine Gun - 3x1 @ 2/4/6\nMicro Pulse Laser - 2x3 @ 1/2/3\nLarge Pulse Laser - 1x10 @ 6/14/20\nFlamer (Vehicle) - 1x2 @ 1/2/3\nStreak SRM 4 - 6x2 @ 3/6/9","Light Machine Gun - 3x1 @ 2/4/6\nBombast Laser - 1x12 @ 5/10/15\nStreak SRM 4 - 6x2 @ 3/6/9","Light Machine Gun - 3x1 @ 2/4/6\nER Medium Laser - 2x7 @ 5/10/15\nLarge Chemical Laser - 1x8 @ 5/10/15\nStreak SRM 4 - 6x2 @ 3/6/9","Light Machine Gun - 3x1 @ 2/4/6\nMedium Pulse Laser - 4x7 @ 4/8/12\nStreak LRM 15 - 2x5 @ 7/14/21","Magshot Gauss Rifle - 4x2 @ 3/6/9\nGauss Rifle - 1x15 @ 7/15/22\nSilver Bullet Gauss Rifle - 10x1 @ 7/15/22","Gauss Rifle - 1x15 @ 7/15/22\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nLRM 10 - 1x5 @ 7/14/21\nMedium Pulse Laser - 2x6 @ 2/4/6\nStreak SRM 2 - 4x2 @ 3/6/9","Gauss Rifle - 2x15 @ 7/15/22\nER Medium Laser - 1x5 @ 4/8/12","Gauss Rifle - 1x15 @ 7/15/22\nRotary AC/2 - 6x2 @ 6/12/18\nLRM 15 - 2x5 @ 7/14/21\nStreak SRM 4 - 3x2 @ 3/6/9\nER Medium Laser - 2x5 @ 4/8/12","ER Large Laser - 1x8 @ 7/14/19\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nMML 7 - 1x5 @ 3/14/21\nSRM 4 - 3x2 @ 3/6/9\nStreak SRM 2 - 4x2 @ 3/6/9","Thunderbolt 15 - 1x15 @ 6/12/18\nMagshot Gauss Rifle - 4x2 @ 3/6/9\nGauss Rifle - 1x15 @ 7/15/22\nSilver Bullet Gauss Rifle - 10x1 @ 7/15/22","Arrow IV - 1x20 @ 1/2/8\nMedium Laser - 2x5 @ 3/6/9","Arrow IV - 1x20 @ 1/2/8\nMedium Laser - 2x5 @ 3/6/9","Arrow IV - 1x20 @ 1/2/8\nER Medium Laser - 2x5 @ 4/8/12","Arrow IV - 1x20 @ 1/2/8\nMedium Laser - 2x5 @ 3/6/9","Arrow IV - 1x20 @ 1/2/8\nMedium Laser - 2x5 @ 3/6/9","ER Large Laser - 1x8 @ 7/14/19\nStreak SRM 2 - 4x2 @ 3/6/9","ER Large Laser - 1x8 @ 7/14/19\nStreak SRM 2 - 4x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3","ER Large Laser - 1x8 @ 7/14/19\nMML 5 - 1x5 @ 3/14/21","Streak SRM 2 - 2x2 @ 3/6/9\nER Large Laser - 1x8 @ 7/14/19","SRM 2 - 4x2 @ 3/6/9\nER Medium Laser - 4x7 @ 5/10/15","Streak LRM 15 - 2x5 @ 7/14/21\nER Large Laser - 1x10 @ 8/15/25","Medium Laser - 1x5 @ 3/6/9","Medium Laser - 1x5 @ 3/6/9","Medium Laser - 1x5 @ 3/6/9","Medium Laser - 1x5 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3\nLRM 5 - 1x5 @ 7/14/21","Machine Gun - 1x2 @ 1/2/3\nAC/5 - 1x5 @ 6/12/18\nMedium Laser - 2x5 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3\nAC/2 - 2x2 @ 8/16/24","Flamer (Vehicle) - 2x2 @ 1/2/3\nMachine Gun - 2x2 @ 1/2/3\nMedium Laser - 3x5 @ 3/6/9","Flamer (Vehicle) - 1x2 @ 1/2/3\nMedium Laser - 3x5 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3\nAC/10 - 1x10 @ 5/10/15\nMedium Laser - 3x5 @ 3/6/9","Light AC/5 - 1x5 @ 5/10/15\nMedium Re-engineered Laser - 2x6 @ 3/6/9","Medium Re-engineered Laser - 3x6 @ 3/6/9","ER Medium Laser - 4x5 @ 4/8/12\nSRM 2 - 6x2 @ 3/6/9","Medium Laser - 4x5 @ 3/6/9","Ultra AC/10 - 2x10 @ 6/12/18\nMedium Chemical Laser - 2x5 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3\nLB 5-X AC (Slug) - 1x5 @ 7/14/21\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 5x1 @ 7/14/21\nLRM 15 - 2x5 @ 7/14/21","Machine Gun - 2x2 @ 1/2/3\nER Large Laser - 1x8 @ 7/14/19\nLRM 15 - 2x5 @ 7/14/21","ProtoMech AC/2 - 1x2 @ 7/14/20\nProtoMech AC/8 - 1x8 @ 3/7/10\nMedium Chemical Laser - 3x5 @ 3/6/9","LB 5-X AC (Slug) - 1x5 @ 7/14/21\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 5x1 @ 7/14/21\nMachine Gun - 2x2 @ 1/2/3\nLRM 15 - 2x5 @ 7/14/21","LB 5-X AC (Slug) - 1x5 @ 7/14/21\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 5x1 @ 7/14/21\nMachine Gun - 2x2 @ 1/2/3\nLRM 15 - 2x5 @ 7/14/21","Flamer (Vehicle) - 2x2 @ 1/2/3","Flamer (Vehicle) - 2x2 @ 1/2/3","Flamer (Vehicle) - 2x2 @ 1/2/3","Machine Gun - 4x2 @ 1/2/3","ER Small Laser - 2x3 @ 2/4/5",null,"ER Small Laser - 2x3 @ 2/4/5","Rocket Launcher 10 - 3x5 @ 5/10/15\nER Small Laser - 2x3 @ 2/4/5\nMachine Gun - 2x2 @ 1/2/3","Large Laser - 1x8 @ 5/10/15","Medium Laser - 3x5 @ 3/6/9","Plasma Rifle - 1x10 @ 5/10/15","ER Large Laser - 1x8 @ 7/14/19","Large Laser - 1x8 @ 5/10/15\nMachine Gun - 4x2 @ 1/2/3","Medium Laser - 2x5 @ 3/6/9\nRocket Launcher 10 - 7x5 @ 5/10/15","Machine Gun - 2x2 @ 1/2/3\nLight PPC - 2x5 @ 6/12/18","Large Laser - 1x8 @ 5/10/15\nMachine Gun - 4x2 @ 1/2/3","Rocket Launcher 10 - 3x5 @ 5/10/15\nPlasma Rifle - 1x10 @ 5/10/15","ER Medium Laser - 2x5 @ 4/8/12","Arrow IV - 1x20 @ 1/2/8\nMagshot Gauss Rifle - 4x2 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3","SRM 2 - 2x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3","Medium Laser - 2x5 @ 3/6/9\nArrow IV - 2x20 @ 1/2/8","SRM 4 - 3x2 @ 3/6/9","Ultra AC/20 - 4x20 @ 3/7/10","Machine Gun - 6x2 @ 1/2/3\nLB 20-X AC (Slug) - 2x20 @ 4/8/12\n-- OR -- - x @ \nLB 20-X AC (Pellet) - 40x1 @ 4/8/12\nMedium Pulse Laser - 2x7 @ 4/8/12","Machine Gun - 3x2 @ 1/2/3\nAC/20 - 2x20 @ 3/6/9","Gauss Rifle - 2x15 @ 7/15/22\nMedium Laser - 2x5 @ 3/6/9","AC/20 - 2x20 @ 3/6/9","Ultra AC/10 - 4x10 @ 6/12/18","Ultra AC/20 - 2x20 @ 3/7/10\nLB 20-X AC (Slug) - 1x20 @ 4/8/12\n-- OR -- - x @ \nLB 20-X AC (Pellet) - 20x1 @ 4/8/12\nMachine Gun - 2x2 @ 1/2/3","MRM 30 - 0x5 @ 3/8/15","MML 9 - 5x5 @ 3/14/21\nMachine Gun - 2x2 @ 1/2/3","Thunderbolt 20 - 2x20 @ 6/12/18\nStreak SRM 6 - 4x2 @ 3/6/9\nER Medium Laser - 2x5 @ 4/8/12","Improved Heavy Gauss Rifle - 1x22 @ 6/12/19\nUltra AC/10 - 4x10 @ 6/12/18","Light Machine Gun - 2x1 @ 2/4/6\nFlamer (Vehicle) - 2x2 @ 1/2/3\nMedium Pulse Laser - 2x6 @ 2/4/6","Machine Gun - 4x2 @ 1/2/3\nER Medium Laser - 2x5 @ 4/8/12","Heavy Gauss Rifle - 1x15 @ 6/13/20\nStreak SRM 6 - 4x2 @ 3/6/9\nER Medium Laser - 2x5 @ 4/8/12","SRM 6 - 4x2 @ 3/6/9\nMedium Laser - 2x5 @ 3/6/9\nGauss Rifle - 1x15 @ 7/15/22","Medium Laser - 4x5 @ 3/6/9\nGauss Rifle - 1x15 @ 7/15/22","PPC - 2x10 @ 6/12/18","Streak SRM 2 - 6x2 @ 3/6/9\nMedium Pulse Laser - 2x6 @ 2/4/6\nGauss Rifle - 1x15 @ 7/15/22","Improved Heavy Gauss Rifle - 1x22 @ 6/12/19\nMedium Laser - 2x5 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3\nLarge Laser - 1x8 @ 5/10/15","Light Machine Gun - 4x1 @ 2/4/6\nLong Tom Cannon - 2x20 @ 6/13/20\nER Medium Laser - 2x5 @ 4/8/12","Flamer - 1x2 @ 1/2/3\nSRM 6 - 4x2 @ 3/6/9\nSmall Laser - 3x3 @ 1/2/3\nAC/20 - 2x20 @ 3/6/9","Improved Heavy Gauss Rifle - 2x22 @ 6/12/19\nFlamer (Vehicle) - 1x2 @ 1/2/3\nSmall Laser - 1x3 @ 1/2/3\nER Medium Laser - 2x5 @ 4/8/12\nLight Machine Gun - 2x1 @ 2/4/6","Machine Gun - 2x2 @ 1/2/3\nER PPC - 3x10 @ 7/14/23","Machine Gun - 2x2 @ 1/2/3\nGauss Rifle - 3x15 @ 7/15/22","ER Medium Laser - 2x5 @ 4/8/12\nLRM 20 - 10x5 @ 7/14/21","Light PPC - 1x5 @ 6/12/18","MML 7 - 1x5 @ 3/14/21\nLight PPC - 1x5 @ 6/12/18","Flamer - 2x2 @ 1/2/3\nRotary AC/5 - 12x5 @ 5/10/15\nLRM 15 - 2x5 @ 7/14/21\nMedium Laser - 4x5 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","Flamer (Vehicle) - 2x2 @ 1/2/3\nRotary AC/5 - 12x5 @ 5/10/15\nLRM 15 - 2x5 @ 7/14/21\nMedium Laser - 4x5 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","ER Medium Laser - 1x5 @ 4/8/12\nLight Machine Gun - 2x1 @ 2/4/6","ER Large Laser - 1x10 @ 8/15/25\nStreak SRM 2 - 4x2 @ 3/6/9","Heavy Medium Laser - 2x10 @ 3/6/9\nStreak SRM 2 (I-OS) - 4x2 @ 3/6/9","ER Large Laser - 1x10 @ 8/15/25","LRM 10 - 1x5 @ 7/14/21\nMachine Gun - 2x2 @ 1/2/3\nSRM 2 - 4x2 @ 3/6/9\nLarge Laser - 1x8 @ 5/10/15","LRM 10 - 1x5 @ 7/14/21\nMachine Gun - 1x2 @ 1/2/3\nER Large Laser - 1x8 @ 7/14/19\nSRM 2 - 2x2 @ 3/6/9","MML 5 - 2x5 @ 3/14/21\nMachine Gun - 2x2 @ 1/2/3\nLarge Pulse Laser - 1x9 @ 3/7/10\nStreak SRM 2 - 4x2 @ 3/6/9","Light PPC - 2x5 @ 6/12/18\nMML 3 - 1x5 @ 3/14/21","SRM 2 - 12x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3\nLarge Laser - 1x8 @ 5/10/15","Streak SRM 2 - 8x2 @ 3/6/9\nLarge Pulse Laser - 1x9 @ 3/7/10","LRM 10 - 1x5 @ 7/14/21\nMachine Gun - 2x2 @ 1/2/3\nLarge Chemical Laser - 1x8 @ 5/10/15\nER Small Laser - 4x5 @ 2/4/6","ATM 3 - 5x5 @ 5/10/15\nMachine Gun - 2x2 @ 1/2/3\nLarge Pulse Laser - 1x10 @ 6/14/20","ATM 9 - 2x5 @ 5/10/15\nStreak SRM 2 - 6x2 @ 3/6/9","Medium Pulse Laser - 2x7 @ 4/8/12\nLB 2-X AC (Slug) - 1x2 @ 10/20/30\n-- OR -- - x @ \nLB 2-X AC (Pellet) - 2x1 @ 10/20/30","Streak LRM 15 - 4x5 @ 7/14/21",null,"AC/20 - 1x20 @ 3/6/9","Flamer (Vehicle) - 3x2 @ 1/2/3","Streak SRM 6 - 12x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3\nLarge Pulse Laser - 1x10 @ 6/14/20","SRM 6 - 8x2 @ 3/6/9\nER Medium Pulse Laser - 2x7 @ 5/9/14","AP Gauss Rifle - 2x3 @ 3/6/9\nSRM 6 - 12x2 @ 3/6/9\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nPlasma Cannon - 1x2D6 Heat @ 6/12/18","ER Large Pulse Laser - 1x10 @ 7/15/23","ER Medium Laser - 2x7 @ 5/10/15\nLRM 20 - 5x5 @ 7/14/21","Streak SRM 4 - 6x2 @ 3/6/9\nUltra AC/10 - 2x10 @ 6/12/18","ER PPC - 1x15 @ 7/14/23\nStreak SRM 6 - 4x2 @ 3/6/9","ER Medium Laser - 2x7 @ 5/10/15\nHAG/20 - 2x5 @ 8/16/24","Plasma Cannon - 2x2D6 Heat @ 6/12/18\nAP Gauss Rifle - 6x3 @ 3/6/9","Medium Pulse Laser - 4x7 @ 4/8/12\nStreak SRM 4 - 3x2 @ 3/6/9","Ultra AC/20 - 2x20 @ 4/8/12\nER Small Laser - 5x5 @ 2/4/6","HAG/40 - 6x5 @ 8/16/24\nER Medium Laser - 2x7 @ 5/10/15","ATM 12 - 6x5 @ 5/10/15\nImproved Heavy Medium Laser - 1x10 @ 3/6/9\nAP Gauss Rifle - 2x3 @ 3/6/9","ER PPC - 1x15 @ 7/14/23\nStreak SRM 6 - 12x2 @ 3/6/9","Large Pulse Laser - 1x10 @ 6/14/20\nGauss Rifle - 1x15 @ 7/15/22\nMachine Gun - 3x2 @ 1/2/3\nMachine Gun Array - 1x2 @ 1/2/3","SRM 6 - 8x2 @ 3/6/9\nMedium Laser - 1x5 @ 3/6/9","Heavy Gauss Rifle - 1x15 @ 6/13/20\nMML 7 - 2x5 @ 3/14/21\nER Medium Laser - 2x5 @ 4/8/12","HAG/30 - 4x5 @ 8/16/24\nATM 9 - 5x5 @ 5/10/15\nER Medium Laser - 2x7 @ 5/10/15","Gauss Rifle - 1x15 @ 7/15/22\nER Medium Laser - 2x5 @ 4/8/12\nMachine Gun - 3x2 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3",null,null,null,"LRM 10 - 1x5 @ 7/14/21",null,"Prototype Rocket Launcher 15 - 8x5 @ 4/9/15","SRM 2 - 2x2 @ 3/6/9","LB 20-X AC (Slug) - 2x20 @ 4/8/12\n-- OR -- - x @ \nLB 20-X AC (Pellet) - 40x1 @ 4/8/12","LB 20-X AC (Slug) - 1x20 @ 4/8/12\n-- OR -- - x @ \nLB 20-X AC (Pellet) - 20x1 @ 4/8/12\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18","Flamer - 1x2 @ 1/2/3\nStreak SRM 6 - 4x2 @ 3/6/9\nThunderbolt 15 - 2x15 @ 6/12/18","ER Medium Laser - 1x5 @ 4/8/12\nSmall Pulse Laser - 2x3 @ 1/2/3","ER Medium Laser - 1x5 @ 4/8/12\nSmall Pulse Laser - 1x3 @ 1/2/3\nFlamer - 1x2 @ 1/2/3","ER Medium Laser - 1x5 @ 4/8/12\nMachine Gun - 2x2 @ 1/2/3","ER Medium Laser - 1x5 @ 4/8/12\nSmall VSP Laser - 1x4 @ 2/4/6","Large Laser - 1x8 @ 5/10/15\nMedium Laser - 1x5 @ 3/6/9\nLRM 10 - 1x5 @ 7/14/21","Magshot Gauss Rifle - 3x2 @ 3/6/9\nMedium Pulse Laser - 2x7 @ 4/8/12","Snub-Nose PPC - 1x8 @ 9/13/15\nMML 7 - 1x5 @ 3/14/21","LRM 10 - 1x5 @ 7/14/21\nMedium Laser - 3x5 @ 3/6/9\nSRM 6 - 4x2 @ 3/6/9","Magshot Gauss Rifle - 2x2 @ 3/6/9\nMedium Pulse Laser - 2x7 @ 4/8/12","Gauss Rifle - 1x15 @ 7/15/22","Plasma Rifle - 1x10 @ 5/10/15\nRotary AC/5 - 6x5 @ 5/10/15","Light AC/5 - 1x5 @ 5/10/15\nGauss Rifle - 1x15 @ 7/15/22","Medium Laser - 1x5 @ 3/6/9\nGauss Rifle - 1x15 @ 7/15/22","ER Medium Laser - 2x5 @ 4/8/12\nGauss Rifle - 1x15 @ 7/15/22\nRotary AC/5 - 6x5 @ 7/14/21","ER Medium Laser - 1x5 @ 4/8/12\nGauss Rifle - 1x15 @ 7/15/22\nRotary AC/5 - 6x5 @ 7/14/21","Gauss Rifle - 1x15 @ 7/15/22","Gauss Rifle - 1x15 @ 7/15/22","LB 5-X AC (Slug) - 2x5 @ 7/14/21\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 10x1 @ 7/14/21","Medium Laser - 1x5 @ 3/6/9","ER Small Laser - 2x3 @ 2/4/5","Rocket Launcher 10 - 3x5 @ 5/10/15","LRM 10 - 1x5 @ 7/14/21\nAC/10 - 1x10 @ 5/10/15\nMachine Gun - 4x2 @ 1/2/3\nSRM 2 - 2x2 @ 3/6/9","Medium Chemical Laser - 2x5 @ 3/6/9\nLarge Chemical Laser - 1x8 @ 5/10/15","Small Laser - 2x3 @ 1/2/3\nMedium Laser - 1x5 @ 3/6/9","Medium Pulse Laser - 1x6 @ 2/4/6\nMedium Laser - 2x5 @ 3/6/9","ER Medium Laser - 1x5 @ 4/8/12\nMedium Laser - 2x5 @ 3/6/9","ER Large Laser - 1x8 @ 7/14/19","ER Medium Laser - 2x5 @ 4/8/12\nThumper Cannon - 1x5 @ 4/9/14","Medium Laser - 2x5 @ 3/6/9\nLight PPC - 1x5 @ 6/12/18","Machine Gun - 2x2 @ 1/2/3\nER Medium Laser - 1x5 @ 4/8/12","Medium Laser - 1x5 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","Prototype Rocket Launcher 10 - 6x5 @ 5/10/15\nMachine Gun - 2x2 @ 1/2/3\nPrototype Rocket Launcher 20 - 5x5 @ 3/7/12","Rocket Launcher 10 - 6x5 @ 5/10/15\nMachine Gun - 2x2 @ 1/2/3\nRocket Launcher 20 - 5x5 @ 3/7/12","Magshot Gauss Rifle - 2x2 @ 3/6/9\nLight AC/5 - 1x5 @ 5/10/15","MML 7 - 1x5 @ 3/14/21\nER Small Laser - 2x3 @ 2/4/5\nER Medium Laser - 1x5 @ 4/8/12","Small Pulse Laser - 2x3 @ 1/2/3\nMachine Gun - 2x2 @ 1/2/3\nER Medium Laser - 1x5 @ 4/8/12","Light Machine Gun - 2x1 @ 2/4/6","Streak LRM 15 - 2x5 @ 7/14/21\nER Large Laser - 1x10 @ 8/15/25","Heavy Machine Gun - 2x3 @ 1/2/3","ER Medium Laser - 2x5 @ 4/8/12\nMML 5 - 1x5 @ 3/14/21","AC/10 - 1x10 @ 5/10/15","Light AC/5 - 1x5 @ 5/10/15\nLight Machine Gun Array - 1x1 @ 2/4/6\nLight Machine Gun - 4x1 @ 2/4/6\nRocket Launcher 15 - 4x5 @ 4/9/15",null,"LRM 15 - 2x5 @ 7/14/21\nER Large Laser - 1x8 @ 7/14/19\nMachine Gun - 2x2 @ 1/2/3","Rotary AC/5 - 6x5 @ 5/10/15\nLRM 15 - 4x5 @ 7/14/21\nER Medium Laser - 2x5 @ 4/8/12","ER Medium Laser - 2x5 @ 4/8/12\nLRM 15 - 4x5 @ 7/14/21\nRotary AC/5 - 6x5 @ 5/10/15","ER Medium Laser - 3x5 @ 4/8/12\nPlasma Rifle - 1x10 @ 5/10/15\nArrow IV - 1x20 @ 1/2/8","Light Gauss Rifle - 1x8 @ 8/17/25\nLRM 15 - 4x5 @ 7/14/21","Machine Gun - 2x2 @ 1/2/3\nER Medium Laser - 1x5 @ 4/8/12\nLRM 10 - 1x5 @ 7/14/21\nSRM 6 - 4x2 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3\nLarge Re-engineered Laser - 1x9 @ 5/10/15","Machine Gun - 2x2 @ 1/2/3\nLarge Pulse Laser - 1x9 @ 3/7/10\nSRM 6 - 4x2 @ 3/6/9","Snub-Nose PPC - 1x8 @ 9/13/15\nSRM 6 - 4x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3\nLarge Laser - 1x8 @ 5/10/15","Machine Gun - 1x2 @ 1/2/3\nLRM 10 - 3x5 @ 7/14/21","Machine Gun - 5x2 @ 1/2/3\nSRM 6 - 4x2 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3\nSRM 6 - 12x2 @ 3/6/9","Light PPC - 1x5 @ 6/12/18\nMML 9 - 1x5 @ 3/14/21\nMagshot Gauss Rifle - 2x2 @ 3/6/9","Medium Pulse Laser - 3x7 @ 4/8/12","LB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18","Gauss Rifle - 2x15 @ 7/15/22\nLRM 20 - 8x5 @ 7/14/21","Long Tom Cannon - 2x20 @ 6/13/20","Long Tom Cannon - 1x20 @ 6/13/20\nGauss Rifle - 2x15 @ 7/15/22",null,"Arrow IV - 1x20 @ 1/2/8","LRM 10 - 4x5 @ 7/14/21",null,"'Mech Mortar 2 - 3x20 @ 7/14/21","Sniper Cannon - 1x10 @ 4/8/12",null,"Light AC/5 - 1x5 @ 5/10/15","Thunderbolt 20 - 1x20 @ 6/12/18","Ultra AC/20 - 2x20 @ 3/7/10","Machine Gun - 2x2 @ 1/2/3\nER PPC - 1x10 @ 7/14/23\nGauss Rifle - 1x15 @ 7/15/22\nMML 7 - 1x5 @ 3/14/21","Machine Gun - 3x2 @ 1/2/3\nER PPC - 1x10 @ 7/14/23\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nMML 7 - 1x5 @ 3/14/21","'Mech Mortar 8 - 2x8 @ 7/14/21\nStreak LRM 15 - 4x5 @ 7/14/21\nMedium Pulse Laser - 2x7 @ 4/8/12","Streak SRM 4 - 3x2 @ 3/6/9\nER Medium Laser - 2x7 @ 5/10/15\nLRM 20 - 5x5 @ 7/14/21","HAG/20 - 2x5 @ 8/16/24\nER Medium Laser - 2x7 @ 5/10/15","ER Medium Laser - 2x7 @ 5/10/15\nAP Gauss Rifle - 2x3 @ 3/6/9\nArrow IV - 1x20 @ 1/2/9","ER Medium Laser - 2x7 @ 5/10/15\nAP Gauss Rifle - 2x3 @ 3/6/9\nLRM 15 - 4x5 @ 7/14/21","ER Medium Laser - 2x7 @ 5/10/15\nAP Gauss Rifle - 2x3 @ 3/6/9\nArrow IV - 1x20 @ 1/2/9","Plasma Rifle - 2x10 @ 5/10/15\nLight AC/5 - 1x5 @ 5/10/15\nLight Machine Gun - 4x1 @ 2/4/6","Medium Laser - 2x5 @ 3/6/9","SRM 6 - 8x2 @ 3/6/9","SRM 4 - 6x2 @ 3/6/9","SRM 4 - 6x2 @ 3/6/9","Flamer (Vehicle) - 1x2 @ 1/2/3\nSRM 4 - 6x2 @ 3/6/9","MML 5 - 2x5 @ 3/14/21","SRM 6 - 8x2 @ 3/6/9","SRM 2 (I-OS) - 4x2 @ 3/6/9","Medium Laser - 3x5 @ 3/6/9","LRM 10 - 1x5 @ 7/14/21","MRM 20 - 3x5 @ 3/8/15","MML 5 - 2x5 @ 3/14/21","SRM 6 - 8x2 @ 3/6/9","Thunderbolt 5 - 2x5 @ 6/12/18","Large Laser - 1x8 @ 5/10/15\nSRM 6 - 4x2 @ 3/6/9","PPC - 1x10 @ 6/12/18\nSRM 6 - 4x2 @ 3/6/9","Large Re-engineered Laser - 1x9 @ 5/10/15\nStreak SRM 6 - 4x2 @ 3/6/9","PPC - 1x10 @ 6/12/18\nSmall Pulse Laser - 1x3 @ 1/2/3","PPC - 1x10 @ 6/12/18\nSRM 4 - 3x2 @ 3/6/9","Light Gauss Rifle - 1x8 @ 8/17/25","Rotary AC/5 - 6x5 @ 5/10/15\nMachine Gun - 1x2 @ 1/2/3","Light Gauss Rifle - 1x8 @ 8/17/25","Thunderbolt 15 - 1x15 @ 6/12/18","SRM 6 - 8x2 @ 3/6/9\nER Medium Laser - 2x5 @ 4/8/12","MML 5 - 2x5 @ 3/14/21\nER Medium Laser - 2x5 @ 4/8/12","HVAC/2 - 1x2 @ 10/20/35",null,"Machine Gun - 2x2 @ 1/2/3","LRM 5 - 1x5 @ 7/14/21\nMachine Gun - 2x2 @ 1/2/3","Machine Gun - 4x2 @ 1/2/3","Light AC/5 - 1x5 @ 5/10/15","SRM 4 - 3x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","LRM 20 - 10x5 @ 7/14/21","Enhanced LRM 15 - 4x5 @ 7/14/21\nExtended LRM 15 - 4x5 @ 12/22/38","MML 9 - 7x5 @ 3/14/21","Enhanced LRM 15 - 8x5 @ 7/14/21","Machine Gun - 2x2 @ 1/2/3","LRM 5 - 1x5 @ 7/14/21\nMachine Gun - 2x2 @ 1/2/3","Machine Gun - 4x2 @ 1/2/3","SRM 4 - 3x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","PPC - 1x10 @ 6/12/18","Machine Gun - 2x2 @ 1/2/3","LRM 5 - 1x5 @ 7/14/21\nMachine Gun - 2x2 @ 1/2/3","Machine Gun - 4x2 @ 1/2/3","SRM 4 - 3x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","Small VSP Laser - 2x4 @ 2/4/6","LB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nATM 12 - 6x5 @ 5/10/15\nHeavy Medium Laser - 1x10 @ 3/6/9","LB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nLRM 20 - 8x5 @ 7/14/21","LB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nMedium Pulse Laser - 3x7 @ 4/8/12\nHAG/20 - 2x5 @ 8/16/24","LB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nER Medium Laser - 3x7 @ 5/10/15\nLarge Chemical Laser - 2x8 @ 5/10/15","LB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nHeavy Large Laser - 1x16 @ 5/10/15\nStreak SRM 4 - 9x2 @ 3/6/9","ER Medium Laser - 2x7 @ 5/10/15","LRM 15 - 2x5 @ 7/14/21\nER Small Laser - 1x5 @ 2/4/6","ER Medium Laser - 2x7 @ 5/10/15\nStreak SRM 6 - 4x2 @ 3/6/9","ATM 3 - 2x5 @ 5/10/15","AP Gauss Rifle - 2x3 @ 3/6/9\nER Medium Laser - 2x7 @ 5/10/15","Medium Pulse Laser - 2x7 @ 4/8/12","AC/20 - 1x20 @ 3/6/9","AC/10 - 1x10 @ 5/10/15","Ultra AC/20 - 2x20 @ 3/7/10","Medium Laser - 4x5 @ 3/6/9","LB 20-X AC (Slug) - 1x20 @ 4/8/12\n-- OR -- - x @ \nLB 20-X AC (Pellet) - 20x1 @ 4/8/12","LRM 15 - 4x5 @ 7/14/21","AC/20 - 1x20 @ 3/6/9","Rotary AC/5 - 6x5 @ 5/10/15","SRM 6 - 20x2 @ 3/6/9","HAG/30 - 4x5 @ 8/16/24","Light Machine Gun - 2x1 @ 2/4/6\nSnub-Nose PPC - 1x8 @ 9/13/15\nLB 2-X AC (Slug) - 1x2 @ 9/18/27\n-- OR -- - x @ \nLB 2-X AC (Pellet) - 2x1 @ 9/18/27","SRM 2 - 2x2 @ 3/6/9",null,"Medium Laser - 1x5 @ 3/6/9\nSmall Laser - 1x3 @ 1/2/3\nSRM 2 - 2x2 @ 3/6/9","Snub-Nose PPC - 1x8 @ 9/13/15","Light PPC - 2x5 @ 6/12/18",null,"LRM 20 - 3x5 @ 7/14/21","Ultra AC/20 - 2x20 @ 3/7/10","LRM 15 - 4x5 @ 7/14/21","Enhanced LRM 10 - 1x5 @ 7/14/21","ER Large Laser - 1x8 @ 7/14/19\nLRM 15 - 2x5 @ 7/14/21","Large Pulse Laser - 1x9 @ 3/7/10\nLRM 15 - 2x5 @ 7/14/21","LRM 20 - 3x5 @ 7/14/21","Medium Laser - 2x5 @ 3/6/9\nLRM 10 - 1x5 @ 7/14/21\nMachine Gun - 4x2 @ 1/2/3","LRM 15 - 2x5 @ 7/14/21\nMachine Gun - 4x2 @ 1/2/3","Flamer (Vehicle) - 4x2 @ 1/2/3\nMachine Gun - 1x2 @ 1/2/3","Flamer (Vehicle) - 2x2 @ 1/2/3\nMachine Gun - 1x2 @ 1/2/3\nSRM 2 - 4x2 @ 3/6/9","ER PPC - 1x15 @ 7/14/23\nMachine Gun - 4x2 @ 1/2/3","Plasma Cannon - 1x2D6 Heat @ 6/12/18\nAP Gauss Rifle - 4x3 @ 3/6/9","ER Medium Laser - 2x7 @ 5/10/15\nLRM 15 - 2x5 @ 7/14/21\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nUltra AC/10 - 2x10 @ 6/12/18","ER Medium Laser - 2x7 @ 5/10/15\nLRM 15 - 2x5 @ 7/14/21\nHAG/20 - 2x5 @ 8/16/24\nGauss Rifle - 1x15 @ 7/15/22","LRM 10 - 1x5 @ 7/14/21\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nUltra AC/10 - 2x10 @ 6/12/18","Machine Gun - 1x2 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3",null,"SRM 4 - 3x2 @ 3/6/9","Medium Laser - 1x5 @ 3/6/9\nSRM 2 - 4x2 @ 3/6/9","Rifle (Cannon, Light) - 1x3 @ 4/8/12\nMachine Gun - 2x2 @ 1/2/3","Medium Laser - 1x5 @ 3/6/9\nFlamer (Vehicle) - 2x2 @ 1/2/3","Medium Chemical Laser - 1x5 @ 3/6/9\nSRM 4 - 3x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","Medium Laser - 1x5 @ 3/6/9\nSRM 2 - 4x2 @ 3/6/9","Medium Laser - 3x5 @ 3/6/9\nSmall Laser - 1x3 @ 1/2/3","Light AC/5 - 1x5 @ 5/10/15\nRocket Launcher 10 - 6x5 @ 5/10/15","Light PPC - 1x5 @ 6/12/18\nSRM 2 (I-OS) - 4x2 @ 3/6/9","Medium Laser - 1x5 @ 3/6/9\nMachine Gun - 4x2 @ 1/2/3","Medium Laser - 2x5 @ 3/6/9","SRM 2 - 4x2 @ 3/6/9\nMedium X-Pulse Laser - 1x6 @ 3/6/9","Ultra AC/20 - 2x20 @ 3/7/10\nMachine Gun - 2x2 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3\nSRM 4 - 12x2 @ 3/6/9\nER Small Laser - 1x3 @ 2/4/5\nSRM 6 - 12x2 @ 3/6/9","SRM 6 - 12x2 @ 3/6/9\nSRM 4 - 12x2 @ 3/6/9\nER Small Laser - 1x3 @ 2/4/5\nMachine Gun - 1x2 @ 1/2/3","ER Medium Laser - 1x5 @ 4/8/12\nLRM 15 - 8x5 @ 7/14/21\nMML 9 - 2x5 @ 3/14/21","ER Medium Laser - 1x5 @ 4/8/12\nLRM 15 - 8x5 @ 7/14/21\nMML 9 - 2x5 @ 3/14/21","LRM 20 - 10x5 @ 7/14/21\nLRM 10 - 3x5 @ 7/14/21","Machine Gun - 2x2 @ 1/2/3\nLRM 15 - 8x5 @ 7/14/21","Machine Gun - 2x2 @ 1/2/3\nLRM 15 - 8x5 @ 7/14/21","Machine Gun - 2x2 @ 1/2/3\nER Medium Laser - 2x5 @ 4/8/12\nMML 9 - 5x5 @ 3/14/21","LRM 15 - 8x5 @ 7/14/21","Machine Gun - 2x2 @ 1/2/3\nThunderbolt 10 - 4x10 @ 6/12/18","SRM 4 - 6x2 @ 3/6/9","MML 3 - 1x5 @ 3/14/21","ER Large Laser - 1x10 @ 8/15/25\nATM 9 - 2x5 @ 5/10/15\nLight Machine Gun - 4x1 @ 2/4/6","ER Large Laser - 1x10 @ 8/15/25\nLRM 10 - 1x5 @ 7/14/21\nLight Machine Gun - 8x1 @ 2/4/6","Magshot Gauss Rifle - 2x2 @ 3/6/9","PPC - 1x10 @ 6/12/18\nThunderbolt 10 - 2x10 @ 6/12/18","Improved Heavy Gauss Rifle - 1x22 @ 6/12/19","Light PPC - 1x5 @ 6/12/18","Medium VSP Laser - 1x7 @ 2/5/9","ER Medium Laser - 1x5 @ 4/8/12","Large Laser - 1x8 @ 5/10/15","Plasma Cannon - 1x2D6 Heat @ 6/12/18","AC/5 - 1x5 @ 6/12/18\nLRM 10 - 1x5 @ 7/14/21\nSRM 4 - 3x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3","AC/5 - 1x5 @ 6/12/18\nLRM 10 - 1x5 @ 7/14/21\nSRM 4 - 3x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3","Large Chemical Laser - 1x8 @ 5/10/15\nStreak LRM 10 - 1x5 @ 7/14/21\nStreak SRM 4 - 3x2 @ 3/6/9","Machine Gun - 6x2 @ 1/2/3",null,"Machine Gun - 2x2 @ 1/2/3","AC/20 - 1x20 @ 3/6/9",null,null,"ER Medium Laser - 2x5 @ 4/8/12","Machine Gun - 2x2 @ 1/2/3","Rocket Launcher 20 - 10x5 @ 3/7/12\nRocket Launcher 10 - 8x5 @ 5/10/15","ER Medium Laser - 2x5 @ 4/8/12\nGauss Rifle - 2x15 @ 7/15/22\nHeavy Machine Gun - 2x3 @ 1/2/3","Machine Gun - 2x2 @ 1/2/3","Machine Gun - 2x2 @ 1/2/3",null,"Medium Laser - 1x5 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3","Small Laser - 2x3 @ 1/2/3","SRM 2 - 2x2 @ 3/6/9","MML 5 - 2x5 @ 3/14/21\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nER Medium Laser - 1x5 @ 4/8/12","PPC - 1x10 @ 6/12/18\nMedium Laser - 1x5 @ 3/6/9\nMachine Gun - 3x2 @ 1/2/3\nMML 5 - 2x5 @ 3/14/21","MML 5 - 2x5 @ 3/14/21\nRotary AC/5 - 6x5 @ 5/10/15","SRM 2 - 4x2 @ 3/6/9\nAP Gauss Rifle - 2x3 @ 3/6/9","Medium Pulse Laser - 2x7 @ 4/8/12","LRM 10 - 1x5 @ 7/14/21\nLarge Pulse Laser - 3x10 @ 6/14/20","LRM 10 - 1x5 @ 7/14/21\nLarge Pulse Laser - 3x10 @ 6/14/20","Machine Gun - 4x2 @ 1/2/3\nLarge Laser - 1x8 @ 5/10/15\nLRM 10 - 1x5 @ 7/14/21","ER Medium Laser - 2x5 @ 4/8/12","Medium Laser - 2x5 @ 3/6/9","Streak SRM 4 - 3x2 @ 3/6/9\nER Large Laser - 1x10 @ 8/15/25\nER Small Laser - 1x5 @ 2/4/6\nUltra AC/10 - 2x10 @ 6/12/18","AP Gauss Rifle - 2x3 @ 3/6/9\nER Medium Laser - 2x7 @ 5/10/15","SRM 4 - 6x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3","Medium Laser - 8x5 @ 3/6/9","SRM 6 - 20x2 @ 3/6/9","Thunderbolt 5 - 5x5 @ 6/12/18","Medium Pulse Laser - 2x6 @ 2/4/6\nSRM 4 (OS) - 6x2 @ 3/6/9","Rocket Launcher 15 - 14x5 @ 4/9/15\nER Medium Laser - 2x5 @ 4/8/12","Rocket Launcher 15 - 14x5 @ 4/9/15\nER Small Laser - 2x3 @ 2/4/5\nER Medium Laser - 1x5 @ 4/8/12","Rocket Launcher 15 - 14x5 @ 4/9/15","Medium Pulse Laser - 2x6 @ 2/4/6\nStreak SRM 2 - 4x2 @ 3/6/9","Medium Pulse Laser - 1x6 @ 2/4/6\nRocket Launcher 15 - 12x5 @ 4/9/15","LRM 20 - 8x5 @ 7/14/21","LRM 20 - 8x5 @ 7/14/21","LRM 20 - 8x5 @ 7/14/21","LRM 20 - 8x5 @ 7/14/21","Magshot Gauss Rifle - 3x2 @ 3/6/9","Medium Laser - 3x5 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","Medium Laser - 3x5 @ 3/6/9\nMachine Gun - 4x2 @ 1/2/3\nMachine Gun Array - 1x2 @ 1/2/3","Light Gauss Rifle - 1x8 @ 8/17/25\nMachine Gun - 2x2 @ 1/2/3","Light Gauss Rifle - 1x8 @ 8/17/25\nER Small Laser - 1x3 @ 2/4/5","Streak SRM 2 - 2x2 @ 3/6/9","SRM 2 - 2x2 @ 3/6/9","ER Medium Laser - 1x5 @ 4/8/12","Light Machine Gun - 4x1 @ 2/4/6\nPlasma Rifle - 1x10 @ 5/10/15","Light Gauss Rifle - 1x8 @ 8/17/25\nMachine Gun - 2x2 @ 1/2/3","Light Machine Gun - 2x1 @ 2/4/6\nSnub-Nose PPC - 1x8 @ 9/13/15\nMRM 40 - 5x5 @ 3/8/15","Medium Laser - 2x5 @ 3/6/9\nER Small Laser - 1x3 @ 2/4/5\nUltra AC/20 - 2x20 @ 3/7/10","Heavy Gauss Rifle - 1x15 @ 6/13/20\nER Small Laser - 3x3 @ 2/4/5","Machine Gun - 2x2 @ 1/2/3\nGauss Rifle - 1x15 @ 7/15/22","LRM 10 - 1x5 @ 7/14/21\nLight PPC - 2x5 @ 6/12/18","ER Small Laser - 1x3 @ 2/4/5\nMedium Laser - 2x5 @ 3/6/9\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nBattleMech Taser - 1x1 @ 1/2/4","Rotary AC/5 - 6x5 @ 5/10/15\nER Medium Laser - 3x5 @ 4/8/12","Medium Laser - 1x5 @ 3/6/9\nLRM 10 - 1x5 @ 7/14/21\nSRM 6 - 4x2 @ 3/6/9\nPPC - 1x10 @ 6/12/18","HVAC/5 - 1x5 @ 8/16/28\nExtended LRM 10 - 1x5 @ 12/22/38","Streak SRM 2 - 2x2 @ 3/6/9\nLarge Pulse Laser - 1x9 @ 3/7/10\nLRM 10 - 1x5 @ 7/14/21\nSRM 6 - 4x2 @ 3/6/9","Streak SRM 2 - 2x2 @ 3/6/9\nPPC - 1x10 @ 6/12/18\nLRM 10 - 1x5 @ 7/14/21","Streak SRM 2 - 2x2 @ 3/6/9\nLRM 10 - 1x5 @ 7/14/21\nPPC - 1x10 @ 6/12/18\nStreak SRM 4 - 3x2 @ 3/6/9","Heavy PPC - 1x15 @ 6/12/18\nMML 7 - 1x5 @ 3/14/21","Medium Pulse Laser - 1x6 @ 2/4/6\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nStreak SRM 6 - 4x2 @ 3/6/9","ER Medium Laser - 2x5 @ 4/8/12\nRotary AC/5 - 6x5 @ 5/10/15\nSRM 6 - 4x2 @ 3/6/9","Medium Laser - 1x5 @ 3/6/9\nER PPC - 1x10 @ 7/14/23\nEnhanced LRM 10 - 1x5 @ 7/14/21\nStreak SRM 6 - 4x2 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9\nImproved LRM 10 - 1x5 @ 7/14/21\nEnhanced PPC - 1x12 @ 7/14/23","Enhanced LRM 10 - 3x5 @ 7/14/21\nHeavy PPC - 1x15 @ 6/12/18","ER Small Laser - 5x3 @ 2/4/5",null,"Large Laser - 1x8 @ 5/10/15","AC/20 - 1x20 @ 3/6/9\nPrototype Rocket Launcher 10 - 4x5 @ 5/10/15\nPrototype Rocket Launcher 15 - 4x5 @ 4/9/15\nLarge Laser - 1x8 @ 5/10/15","Heavy Machine Gun - 4x3 @ 1/2/3\nLight PPC - 1x5 @ 6/12/18","Gauss Rifle - 1x15 @ 7/15/22\nMRM 10 - 3x5 @ 3/8/15\nSRM 6 - 8x2 @ 3/6/9\nStreak SRM 4 - 6x2 @ 3/6/9\nMachine Gun - 4x2 @ 1/2/3","Gauss Rifle - 1x15 @ 7/15/22\nMML 9 - 2x5 @ 3/14/21\nMedium Laser - 4x5 @ 3/6/9\nMachine Gun - 4x2 @ 1/2/3","Gauss Rifle - 1x15 @ 7/15/22\nMRM 20 - 5x5 @ 3/8/15\nSRM 6 - 8x2 @ 3/6/9\nStreak SRM 4 - 6x2 @ 3/6/9\nMachine Gun - 4x2 @ 1/2/3","LB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nLRM 15 - 6x5 @ 7/14/21\nStreak SRM 6 - 8x2 @ 3/6/9\nER Large Laser - 1x10 @ 8/15/25\nGauss Rifle - 1x15 @ 7/15/22","ATM 9 - 7x5 @ 5/10/15\nStreak SRM 4 - 6x2 @ 3/6/9\nHeavy Large Laser - 1x16 @ 5/10/15\nGauss Rifle - 1x15 @ 7/15/22\nMachine Gun - 2x2 @ 1/2/3","HAG/30 - 4x5 @ 8/16/24\nLRM 15 - 6x5 @ 7/14/21\nER Large Laser - 1x10 @ 8/15/25\nGauss Rifle - 1x15 @ 7/15/22\nAP Gauss Rifle - 2x3 @ 3/6/9","LB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nLRM 15 - 6x5 @ 7/14/21\nStreak SRM 6 - 8x2 @ 3/6/9\nER Large Laser - 1x10 @ 8/15/25\nGauss Rifle - 1x15 @ 7/15/22","SRM 6 - 8x2 @ 3/6/9\nAC/5 - 1x5 @ 6/12/18\nMachine Gun - 2x2 @ 1/2/3","SRM 6 - 4x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3\nAC/10 - 1x10 @ 5/10/15","Streak SRM 2 - 4x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18","SRM 2 - 2x2 @ 3/6/9",null,"Small Laser - 2x3 @ 1/2/3",null,null,"Streak SRM 2 - 2x2 @ 3/6/9","SRM 2 - 2x2 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3","Streak SRM 6 - 4x2 @ 3/6/9\nER Medium Laser - 2x5 @ 4/8/12","Streak SRM 6 - 4x2 @ 3/6/9\nER Medium Laser - 2x5 @ 4/8/12","LRM 15 - 2x5 @ 7/14/21\nSRM 4 - 3x2 @ 3/6/9\nSRM 2 - 2x2 @ 3/6/9\nMachine Gun - 3x2 @ 1/2/3","LRM 5 - 2x5 @ 7/14/21\nSRM 2 - 4x2 @ 3/6/9\nMachine Gun - 3x2 @ 1/2/3\nSRM 6 - 4x2 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3\nLRM 5 - 2x5 @ 7/14/21\nStreak SRM 2 - 4x2 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9\nMachine Gun - 7x2 @ 1/2/3\nLRM 5 - 2x5 @ 7/14/21","SRM 6 - 4x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3\nLRM 5 - 2x5 @ 7/14/21\nStreak SRM 2 - 4x2 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9\nLRM 5 - 2x5 @ 7/14/21\nStreak SRM 2 - 4x2 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9\nLRM 5 - 2x5 @ 7/14/21\nStreak SRM 2 - 4x2 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9\nLRM 5 - 2x5 @ 7/14/21\nStreak SRM 2 - 4x2 @ 3/6/9","LRM 15 - 2x5 @ 7/14/21\nSRM 2 - 4x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3\nStreak SRM 6 - 4x2 @ 3/6/9","MML 5 - 2x5 @ 3/14/21\nSRM 2 (I-OS) - 4x2 @ 3/6/9\nMachine Gun - 3x2 @ 1/2/3\nMachine Gun Array - 1x2 @ 1/2/3\nStreak SRM 6 - 4x2 @ 3/6/9","LRM 15 - 2x5 @ 7/14/21\nMachine Gun - 2x2 @ 1/2/3\nLRM 5 - 2x5 @ 7/14/21","LRM 5 - 2x5 @ 7/14/21\nMachine Gun - 3x2 @ 1/2/3\nSRM 2 - 4x2 @ 3/6/9\nSRM 6 - 4x2 @ 3/6/9","SRM 4 - 3x2 @ 3/6/9\nSRM 2 - 4x2 @ 3/6/9\nMachine Gun - 3x2 @ 1/2/3\nSRM 6 - 4x2 @ 3/6/9","MML 3 - 1x5 @ 3/14/21","Streak SRM 2 - 2x2 @ 3/6/9","Light PPC - 2x5 @ 6/12/18\nMML 3 - 1x5 @ 3/14/21\nMachine Gun - 2x2 @ 1/2/3","Machine Gun - 2x2 @ 1/2/3\nLRM 15 - 2x5 @ 7/14/21\nStreak SRM 4 - 3x2 @ 3/6/9\nLight Gauss Rifle - 1x8 @ 8/17/25","Machine Gun - 2x2 @ 1/2/3\nLRM 15 - 2x5 @ 7/14/21\nSRM 4 - 3x2 @ 3/6/9\nAC/5 - 1x5 @ 6/12/18","ER Medium Laser - 1x5 @ 4/8/12","Light Machine Gun - 3x1 @ 2/4/6\nLB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18","Medium Pulse Laser - 2x6 @ 2/4/6","Medium Pulse Laser - 1x6 @ 2/4/6","Magshot Gauss Rifle - 8x2 @ 3/6/9","Medium Pulse Laser - 2x6 @ 2/4/6","Medium Pulse Laser - 2x6 @ 2/4/6",null,"Flamer - 1x2 @ 1/2/3","ER Medium Laser - 2x7 @ 5/10/15\nUltra AC/2 - 2x2 @ 9/18/27","AP Gauss Rifle - 1x3 @ 3/6/9\nER Large Laser - 1x10 @ 8/15/25","Medium Laser - 1x5 @ 3/6/9","Large Laser - 1x8 @ 5/10/15","LRM 10 - 1x5 @ 7/14/21","Medium Laser - 1x5 @ 3/6/9","Large Laser - 1x8 @ 5/10/15","LRM 10 - 1x5 @ 7/14/21","Machine Gun - 4x2 @ 1/2/3","Machine Gun - 4x2 @ 1/2/3","Machine Gun - 4x2 @ 1/2/3","Light Gauss Rifle - 2x8 @ 8/17/25\nER Large Laser - 1x8 @ 7/14/19","Snub-Nose PPC - 1x8 @ 9/13/15\nMML 7 - 5x5 @ 3/14/21","LB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nPlasma Rifle - 1x10 @ 5/10/15","AC/10 - 1x10 @ 5/10/15\nMachine Gun - 3x2 @ 1/2/3","AC/5 - 1x5 @ 6/12/18\nMachine Gun - 3x2 @ 1/2/3","Magshot Gauss Rifle - 3x2 @ 3/6/9","AC/10 - 1x10 @ 5/10/15\nLarge Laser - 1x8 @ 5/10/15","ER Large Laser - 2x10 @ 8/15/25\nLRM 15 - 4x5 @ 7/14/21\nSRM 2 - 4x2 @ 3/6/9","SRM 2 - 4x2 @ 3/6/9\nHAG/40 - 6x5 @ 8/16/24\nLRM 15 - 4x5 @ 7/14/21","ER Large Laser - 3x10 @ 8/15/25","'Mech Mortar 8 - 3x8 @ 7/14/21","MRM 30 - 0x5 @ 3/8/15","Rotary AC/5 - 6x5 @ 5/10/15\nStreak SRM 2 - 4x2 @ 3/6/9","Rotary AC/5 - 6x5 @ 5/10/15","Rotary AC/2 - 6x2 @ 6/12/18\nStreak SRM 2 - 4x2 @ 3/6/9","PPC - 1x10 @ 6/12/18\nSRM 6 - 4x2 @ 3/6/9","Light Machine Gun - 6x1 @ 2/4/6\nER Large Laser - 1x8 @ 7/14/19","Light Machine Gun - 6x1 @ 2/4/6\nLight Machine Gun Array - 2x1 @ 2/4/6\nSnub-Nose PPC - 1x8 @ 9/13/15","Plasma Rifle - 1x10 @ 5/10/15","ATM 6 - 2x5 @ 5/10/15\nLight Machine Gun - 2x1 @ 2/4/6","PPC - 2x10 @ 6/12/18\nGauss Rifle - 1x15 @ 7/15/22","Gauss Rifle - 2x15 @ 7/15/22\nLight PPC - 1x5 @ 6/12/18\nSRM 2 (I-OS) - 2x2 @ 3/6/9","Medium Laser - 1x5 @ 3/6/9","Medium Laser - 1x5 @ 3/6/9","Light AC/2 - 1x2 @ 6/12/18","Light PPC - 1x5 @ 6/12/18","Large Pulse Laser - 1x9 @ 3/7/10","LB 5-X AC (Slug) - 4x5 @ 8/15/24\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 20x1 @ 8/15/24","ER Small Laser - 1x5 @ 2/4/6\nMedium Pulse Laser - 2x7 @ 4/8/12\nStreak SRM 2 - 2x2 @ 3/6/9","AP Gauss Rifle - 2x3 @ 3/6/9","LRM 5 - 2x5 @ 7/14/21\nMedium Laser - 8x5 @ 3/6/9","Medium Laser - 4x5 @ 3/6/9\nMedium Pulse Laser - 3x6 @ 2/4/6\nLRM 15 - 2x5 @ 7/14/21\nSRM 4 - 3x2 @ 3/6/9\nSRM 6 - 4x2 @ 3/6/9","Large Chemical Laser - 8x8 @ 5/10/15\nLRM 5 - 2x5 @ 7/14/21","Medium Laser - 10x5 @ 3/6/9\nLRM 10 - 3x5 @ 7/14/21","Light Gauss Rifle - 3x8 @ 8/17/25\nER Medium Laser - 2x5 @ 4/8/12","LRM 20 - 5x5 @ 7/14/21\nLRM 10 - 3x5 @ 7/14/21","Light Gauss Rifle - 2x8 @ 8/17/25\nMML 7 - 2x5 @ 3/14/21\nER Medium Laser - 2x5 @ 4/8/12","Medium Laser - 4x5 @ 3/6/9\nER Medium Laser - 2x5 @ 4/8/12\nMML 7 - 2x5 @ 3/14/21","ER Large Laser - 1x8 @ 7/14/19\nMedium Laser - 3x5 @ 3/6/9\nEnhanced LRM 15 - 2x5 @ 7/14/21","Medium Laser - 8x5 @ 3/6/9\nEnhanced LRM 15 - 2x5 @ 7/14/21","ER PPC - 1x15 @ 7/14/23\nAP Gauss Rifle - 4x3 @ 3/6/9","LRM 20 - 5x5 @ 7/14/21","LB 20-X AC (Slug) - 1x20 @ 4/8/12\n-- OR -- - x @ \nLB 20-X AC (Pellet) - 20x1 @ 4/8/12","Medium Chemical Laser - 5x5 @ 3/6/9\nImproved Heavy Medium Laser - 2x10 @ 3/6/9","Large Pulse Laser - 1x10 @ 6/14/20\nATM 9 - 2x5 @ 5/10/15","Plasma Cannon - 1x2D6 Heat @ 6/12/18\nSRM 6 - 16x2 @ 3/6/9","ER Medium Laser - 1x7 @ 5/10/15\nLarge Pulse Laser - 1x10 @ 6/14/20\nLB 20-X AC (Slug) - 1x20 @ 4/8/12\n-- OR -- - x @ \nLB 20-X AC (Pellet) - 20x1 @ 4/8/12","Large Pulse Laser - 1x10 @ 6/14/20\nHAG/30 - 4x5 @ 8/16/24",null,"SRM 6 - 4x2 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9","Medium Laser - 2x5 @ 3/6/9\nSRM 6 - 4x2 @ 3/6/9","SRM 2 - 2x2 @ 3/6/9","Gauss Rifle - 1x15 @ 7/15/22","Arrow IV - 1x20 @ 1/2/8\nMedium Pulse Laser - 2x6 @ 2/4/6","LRM 20 - 5x5 @ 7/14/21","Small Pulse Laser - 2x3 @ 1/2/3\nLRM 5 - 2x5 @ 7/14/21","SRM 6 - 8x2 @ 3/6/9","Long Tom Cannon - 1x20 @ 6/13/20\nSmall Pulse Laser - 2x3 @ 1/2/3\nLRM 5 - 1x5 @ 7/14/21","Medium Pulse Laser - 2x6 @ 2/4/6\nMML 3 - 2x5 @ 3/14/21","ER Medium Laser - 2x5 @ 4/8/12","Light Machine Gun - 3x1 @ 2/4/6\nMML 7 - 2x5 @ 3/14/21\nLight AC/5 - 1x5 @ 5/10/15\nER Medium Laser - 1x5 @ 4/8/12","LB 5-X AC (Slug) - 2x5 @ 7/14/21\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 10x1 @ 7/14/21","HVAC/2 - 2x2 @ 10/20/35\nRocket Launcher 10 - 1x5 @ 5/10/15","LB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nAC/2 - 2x2 @ 8/16/24","Machine Gun - 2x2 @ 1/2/3\nLB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nAC/2 - 2x2 @ 8/16/24","LB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18","Ultra AC/5 - 4x5 @ 6/13/20\nAC/2 - 2x2 @ 8/16/24","Machine Gun - 2x2 @ 1/2/3\nLRM 15 - 8x5 @ 7/14/21","Rotary AC/2 - 24x2 @ 6/12/18","Rotary AC/5 - 12x5 @ 5/10/15\nLB 2-X AC (Slug) - 2x2 @ 9/18/27\n-- OR -- - x @ \nLB 2-X AC (Pellet) - 4x1 @ 9/18/27","LB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nUltra AC/5 - 4x5 @ 6/13/20","Machine Gun - 2x2 @ 1/2/3\nAC/5 - 4x5 @ 6/12/18","Machine Gun - 2x2 @ 1/2/3\nAC/2 - 5x2 @ 8/16/24","AC/5 - 4x5 @ 6/12/18","Machine Gun - 2x2 @ 1/2/3\nUltra AC/5 - 8x5 @ 6/13/20","Machine Gun - 2x2 @ 1/2/3\nExtended LRM 10 - 6x5 @ 12/22/38","Light Gauss Rifle - 4x8 @ 8/17/25","Machine Gun - 2x2 @ 1/2/3\nLRM 15 - 8x5 @ 7/14/21","Machine Gun - 2x2 @ 1/2/3\nLB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nUltra AC/5 - 2x5 @ 6/13/20","Large X-Pulse Laser - 2x9 @ 5/10/15","Small Laser - 1x3 @ 1/2/3\nLRM 5 - 1x5 @ 7/14/21\nAC/10 - 1x10 @ 5/10/15","Silver Bullet Gauss Rifle - 10x1 @ 7/15/22\nLRM 5 - 1x5 @ 7/14/21\nER Medium Laser - 2x5 @ 4/8/12","ER Medium Laser - 1x5 @ 4/8/12\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nLRM 5 - 1x5 @ 7/14/21","Ultra AC/10 - 2x10 @ 6/12/18\nMedium Laser - 2x5 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","Medium X-Pulse Laser - 1x6 @ 3/6/9\nUltra AC/10 - 2x10 @ 6/12/18\nMML 5 - 1x5 @ 3/14/21","Medium Laser - 1x5 @ 3/6/9\nSRM 6 - 8x2 @ 3/6/9","SRM 6 - 8x2 @ 3/6/9\nMedium Pulse Laser - 1x6 @ 2/4/6","Medium Pulse Laser - 2x6 @ 2/4/6\nStreak SRM 4 - 6x2 @ 3/6/9","SRM 6 - 12x2 @ 3/6/9","Medium X-Pulse Laser - 1x6 @ 3/6/9\nMML 3 - 2x5 @ 3/14/21","MRM 20 - 3x5 @ 3/8/15\nER Medium Laser - 1x5 @ 4/8/12","Medium Pulse Laser - 1x6 @ 2/4/6\nMML 3 - 1x5 @ 3/14/21","Medium Laser - 1x5 @ 3/6/9\nSRM 4 - 6x2 @ 3/6/9",null,"Medium X-Pulse Laser - 2x6 @ 3/6/9\nStreak SRM 6 - 4x2 @ 3/6/9","Medium X-Pulse Laser - 2x6 @ 3/6/9\nStreak SRM 6 - 4x2 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3\nSRM 4 - 6x2 @ 3/6/9",null,"Machine Gun - 1x2 @ 1/2/3\nSniper Cannon - 1x10 @ 4/8/12","Medium Laser - 2x5 @ 3/6/9\nSRM 4 - 6x2 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3\nSniper Cannon - 1x10 @ 4/8/12","SRM 2 - 4x2 @ 3/6/9\nAC/2 - 3x2 @ 8/16/24","SRM 2 - 4x2 @ 3/6/9\nAC/5 - 2x5 @ 6/12/18","ER Small Laser - 1x5 @ 2/4/6\nUltra AC/2 - 10x2 @ 9/18/27","SRM 2 - 4x2 @ 3/6/9\nLB 5-X AC (Slug) - 3x5 @ 7/14/21\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 15x1 @ 7/14/21","SRM 2 - 4x2 @ 3/6/9\nLRM 20 - 5x5 @ 7/14/21","Streak SRM 2 - 4x2 @ 3/6/9\nPlasma Cannon - 3x2D6 Heat @ 6/12/18","Small Laser - 1x3 @ 1/2/3\nRotary AC/2 - 18x2 @ 6/12/18","LRM 15 - 4x5 @ 7/14/21\nStreak SRM 2 - 4x2 @ 3/6/9\nMedium Pulse Laser - 2x6 @ 2/4/6","Arrow IV - 1x20 @ 1/2/8\nStreak SRM 2 - 4x2 @ 3/6/9\nMedium Pulse Laser - 2x6 @ 2/4/6","ER Medium Laser - 2x5 @ 4/8/12\nExtended LRM 15 - 4x5 @ 12/22/38","Medium Laser - 3x5 @ 3/6/9\nLRM 5 - 1x5 @ 7/14/21","ER Medium Laser - 2x5 @ 4/8/12\nMML 5 - 1x5 @ 3/14/21","Flamer (Vehicle) - 1x2 @ 1/2/3\nThunderbolt 5 - 1x5 @ 6/12/18\nGauss Rifle - 1x15 @ 7/15/22","SRM 6 - 8x2 @ 3/6/9\nSRM 2 - 2x2 @ 3/6/9","SRM 6 - 8x2 @ 3/6/9","SRM 6 - 8x2 @ 3/6/9","Streak SRM 4 - 6x2 @ 3/6/9\nSRM 2 - 2x2 @ 3/6/9","AC/10 - 1x10 @ 5/10/15\nMachine Gun - 2x2 @ 1/2/3","Streak SRM 6 - 4x2 @ 3/6/9\nHVAC/10 - 1x10 @ 6/12/20","Streak SRM 6 - 4x2 @ 3/6/9\nHVAC/10 - 1x10 @ 6/12/20","LB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nMachine Gun - 2x2 @ 1/2/3","Light Gauss Rifle - 1x8 @ 8/17/25\nMachine Gun - 3x2 @ 1/2/3","Ultra AC/20 - 2x20 @ 3/7/10\nLRM 5 - 2x5 @ 7/14/21\nStreak SRM 2 - 4x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","Arrow IV - 1x20 @ 1/2/8\nLRM 5 - 2x5 @ 7/14/21\nStreak SRM 2 - 4x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","Gauss Rifle - 1x15 @ 7/15/22\nMachine Gun - 2x2 @ 1/2/3\nSRM 6 - 8x2 @ 3/6/9\nSRM 2 (I-OS) - 4x2 @ 3/6/9","Gauss Rifle - 1x15 @ 7/15/22\nMachine Gun - 2x2 @ 1/2/3\nSRM 6 - 8x2 @ 3/6/9","Small Pulse Laser - 1x3 @ 1/2/3\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nMedium Laser - 1x5 @ 3/6/9","Small X-Pulse Laser - 2x3 @ 2/4/5\nArrow IV - 1x20 @ 1/2/8\nSilver Bullet Gauss Rifle - 10x1 @ 7/15/22","ER Medium Laser - 1x5 @ 4/8/12","LB 20-X AC (Slug) - 1x20 @ 4/8/12\n-- OR -- - x @ \nLB 20-X AC (Pellet) - 20x1 @ 4/8/12","Improved Heavy Gauss Rifle - 1x22 @ 6/12/19","AC/20 - 1x20 @ 3/6/9","SRM 2 - 2x2 @ 3/6/9\nLRM 10 - 1x5 @ 7/14/21\nMedium Pulse Laser - 2x6 @ 2/4/6","MML 7 - 1x5 @ 3/14/21","SRM 2 - 2x2 @ 3/6/9\nLRM 10 - 1x5 @ 7/14/21\nMedium Pulse Laser - 2x6 @ 2/4/6","MML 7 - 1x5 @ 3/14/21\nMedium Pulse Laser - 2x6 @ 2/4/6","SRM 2 - 2x2 @ 3/6/9\nLRM 10 - 1x5 @ 7/14/21\nMedium Pulse Laser - 2x6 @ 2/4/6","SRM 2 - 2x2 @ 3/6/9\nLRM 10 - 1x5 @ 7/14/21","SRM 2 - 2x2 @ 3/6/9\nLRM 10 - 1x5 @ 7/14/21\nMedium Laser - 2x5 @ 3/6/9","SRM 2 - 2x2 @ 3/6/9\nLRM 15 - 2x5 @ 7/14/21\nMedium Laser - 2x5 @ 3/6/9","MML 7 - 1x5 @ 3/14/21\nER Medium Laser - 2x5 @ 4/8/12","Medium Laser - 2x5 @ 3/6/9\nSRM 4 - 3x2 @ 3/6/9\nLRM 20 - 5x5 @ 7/14/21\nPPC - 1x10 @ 6/12/18","Medium Laser - 2x5 @ 3/6/9\nStreak SRM 2 - 4x2 @ 3/6/9\nLRM 20 - 5x5 @ 7/14/21\nER PPC - 1x10 @ 7/14/23","MML 7 - 3x5 @ 3/14/21\nMedium Laser - 2x5 @ 3/6/9\nMachine Gun - 4x2 @ 1/2/3\nMachine Gun Array - 2x2 @ 1/2/3\nHeavy PPC - 1x15 @ 6/12/18","MML 9 - 4x5 @ 3/14/21\nER PPC - 1x10 @ 7/14/23","ER Small Laser - 1x3 @ 2/4/5\nMachine Gun - 2x2 @ 1/2/3","Medium Laser - 4x5 @ 3/6/9\nLight AC/5 - 2x5 @ 5/10/15","Small Pulse Laser - 2x3 @ 1/2/3\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18","Flamer (Vehicle) - 2x2 @ 1/2/3","ER Medium Laser - 2x5 @ 4/8/12\nSRM 6 - 8x2 @ 3/6/9","Small Laser - 4x3 @ 1/2/3\nMachine Gun - 8x2 @ 1/2/3","ER Small Laser - 2x3 @ 2/4/5\nLight Machine Gun - 4x1 @ 2/4/6\nLight Machine Gun Array - 1x1 @ 2/4/6\nMachine Gun - 4x2 @ 1/2/3\nMachine Gun Array - 1x2 @ 1/2/3","Small Laser - 4x3 @ 1/2/3\nMachine Gun - 8x2 @ 1/2/3","ER Small Laser - 2x3 @ 2/4/5\nMagshot Gauss Rifle - 8x2 @ 3/6/9","ER Small Laser - 2x3 @ 2/4/5\nMagshot Gauss Rifle - 8x2 @ 3/6/9","Medium Chemical Laser - 6x5 @ 3/6/9","Gauss Rifle - 1x15 @ 7/15/22","Silver Bullet Gauss Rifle - 10x1 @ 7/15/22","Arrow IV - 1x20 @ 1/2/8","Rotary AC/5 - 6x5 @ 5/10/15","Gauss Rifle - 1x15 @ 7/15/22","Rotary AC/5 - 6x5 @ 5/10/15","Light Gauss Rifle - 1x8 @ 8/17/25","LRM 10 - 1x5 @ 7/14/21\nLRM 20 - 5x5 @ 7/14/21\nMedium Laser - 2x5 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9\nFlamer (Vehicle) - 2x2 @ 1/2/3\nMedium Laser - 2x5 @ 3/6/9\nLRM 20 - 5x5 @ 7/14/21","LRM 20 - 5x5 @ 7/14/21\nMedium Laser - 2x5 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9\nMachine Gun - 3x2 @ 1/2/3\nMedium Laser - 2x5 @ 3/6/9\nLRM 20 - 5x5 @ 7/14/21","Medium Laser - 4x5 @ 3/6/9\nSRM 2 - 2x2 @ 3/6/9\nLRM 20 - 5x5 @ 7/14/21","LRM 10 - 1x5 @ 7/14/21\nMedium Pulse Laser - 2x6 @ 2/4/6\nLRM 20 - 5x5 @ 7/14/21","SRM 6 - 4x2 @ 3/6/9\nSmall Laser - 4x3 @ 1/2/3\nMedium Laser - 2x5 @ 3/6/9\nLRM 20 - 5x5 @ 7/14/21","LRM 10 - 1x5 @ 7/14/21\nPrototype ER Medium Laser (CP) - 3x5 @ 4/8/12\nLRM 20 - 5x5 @ 7/14/21","Medium Laser - 2x5 @ 3/6/9","ER Medium Laser - 2x5 @ 4/8/12","Small Pulse Laser - 1x3 @ 1/2/3","Light PPC - 1x5 @ 6/12/18","Machine Gun - 2x2 @ 1/2/3","Medium Pulse Laser - 1x6 @ 2/4/6","Small Pulse Laser - 2x3 @ 1/2/3","Small Laser - 1x3 @ 1/2/3\nLRM 5 - 1x5 @ 7/14/21\nAC/20 - 1x20 @ 3/6/9","Gauss Rifle - 1x15 @ 7/15/22\nMedium Laser - 2x5 @ 3/6/9\nMachine Gun - 4x2 @ 1/2/3","ER Medium Laser - 2x5 @ 4/8/12\nLong Tom Cannon - 1x20 @ 6/13/20\nThunderbolt 5 - 1x5 @ 6/12/18","ER Medium Laser - 2x5 @ 4/8/12\nLong Tom Cannon - 1x20 @ 6/13/20\nThunderbolt 5 - 1x5 @ 6/12/18","Heavy PPC - 1x15 @ 6/12/18\nStreak SRM 6 - 4x2 @ 3/6/9\nMachine Gun - 3x2 @ 1/2/3","Large Laser - 1x8 @ 5/10/15\nSRM 2 - 2x2 @ 3/6/9","SRM 2 - 8x2 @ 3/6/9","LRM 5 - 2x5 @ 7/14/21","Prototype Rocket Launcher 15 - 10x5 @ 4/9/15","SRM 4 - 3x2 @ 3/6/9\nSmall Laser - 2x3 @ 1/2/3\nMedium Laser - 4x5 @ 3/6/9","AC/20 - 1x20 @ 3/6/9","AC/20 - 1x20 @ 3/6/9",null,"LB 20-X AC (Slug) - 1x20 @ 4/8/12\n-- OR -- - x @ \nLB 20-X AC (Pellet) - 20x1 @ 4/8/12","Ultra AC/20 - 2x20 @ 3/7/10","Snub-Nose PPC - 1x8 @ 9/13/15","Snub-Nose PPC - 1x8 @ 9/13/15\nStreak SRM 4 - 3x2 @ 3/6/9","Snub-Nose PPC - 1x8 @ 9/13/15\nRocket Launcher 10 - 3x5 @ 5/10/15","LRM 10 - 1x5 @ 7/14/21\nSRM 2 - 6x2 @ 3/6/9","MRM 20 - 3x5 @ 3/8/15\nStreak SRM 2 - 2x2 @ 3/6/9","ER Medium Laser - 2x5 @ 4/8/12\nMML 7 - 1x5 @ 3/14/21","ER Medium Laser - 1x5 @ 4/8/12\nMML 5 - 1x5 @ 3/14/21","Medium Laser - 1x5 @ 3/6/9",null,"ER Medium Laser - 1x5 @ 4/8/12","Small Laser - 2x3 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3","ER Medium Laser - 2x5 @ 4/8/12","ER Medium Laser - 1x5 @ 4/8/12","Machine Gun - 1x2 @ 1/2/3","Rotary AC/5 - 6x5 @ 5/10/15","Light Gauss Rifle - 1x8 @ 8/17/25","LB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18","Snub-Nose PPC - 1x8 @ 9/13/15","Thumper Cannon - 1x5 @ 4/9/14","AC/5 - 1x5 @ 6/12/18","Light AC/2 - 2x2 @ 6/12/18","Medium VSP Laser - 2x7 @ 2/5/9",null,"Medium Pulse Laser - 3x6 @ 2/4/6",null,"LB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nLight PPC - 1x5 @ 6/12/18","Heavy PPC - 1x15 @ 6/12/18\nSRM 2 - 2x2 @ 3/6/9","Light Gauss Rifle - 1x8 @ 8/17/25","Plasma Rifle - 1x10 @ 5/10/15\nMML 7 - 1x5 @ 3/14/21","MRM 40 - 10x5 @ 3/8/15\nMedium Laser - 2x5 @ 3/6/9\nSmall Laser - 4x3 @ 1/2/3\nMRM 10 - 3x5 @ 3/8/15","LRM 15 - 8x5 @ 7/14/21\nMedium Laser - 1x5 @ 3/6/9\nSmall Laser - 2x3 @ 1/2/3","Large Laser - 4x8 @ 5/10/15","LRM 15 - 2x5 @ 7/14/21\nRotary AC/5 - 12x5 @ 5/10/15","MML 9 - 4x5 @ 3/14/21\nLight AC/5 - 3x5 @ 5/10/15","Thunderbolt 15 - 2x15 @ 6/12/18\nMML 3 - 4x5 @ 3/14/21\nER Medium Laser - 1x5 @ 4/8/12","Arrow IV - 2x20 @ 1/2/8\nMedium Laser - 2x5 @ 3/6/9\nSmall Laser - 4x3 @ 1/2/3","Machine Gun - 8x2 @ 1/2/3\nAC/5 - 3x5 @ 6/12/18","Ultra AC/10 - 6x10 @ 6/12/18","Light Gauss Rifle - 3x8 @ 8/17/25","Light PPC - 6x5 @ 6/12/18","PPC - 3x10 @ 6/12/18","PPC - 3x10 @ 6/12/18\nMachine Gun - 2x2 @ 1/2/3","PPC - 3x10 @ 6/12/18","PPC - 2x10 @ 6/12/18\nLight PPC - 1x5 @ 6/12/18","PPC - 1x10 @ 6/12/18\nLB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18","PPC - 3x10 @ 6/12/18","SRM 2 - 4x2 @ 3/6/9\nAC/5 - 1x5 @ 6/12/18","Rotary AC/2 - 6x2 @ 6/12/18","SRM 2 - 4x2 @ 3/6/9\nLRM 15 - 2x5 @ 7/14/21","SRM 4 - 6x2 @ 3/6/9","ER Small Laser - 1x3 @ 2/4/5\nSmall Laser - 4x3 @ 1/2/3\nMachine Gun - 2x2 @ 1/2/3\nSRM 4 - 3x2 @ 3/6/9","Small Laser - 4x3 @ 1/2/3\nLight PPC - 1x5 @ 6/12/18\nSRM 4 - 3x2 @ 3/6/9","Light PPC - 1x5 @ 6/12/18\nSRM 4 - 3x2 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3\nAC/5 - 1x5 @ 6/12/18","Machine Gun - 1x2 @ 1/2/3\nAC/5 - 1x5 @ 6/12/18","Machine Gun - 1x2 @ 1/2/3\nLight AC/5 - 1x5 @ 5/10/15","Machine Gun - 1x2 @ 1/2/3\nLight AC/2 - 2x2 @ 6/12/18","LRM 5 - 1x5 @ 7/14/21\nLRM 10 - 1x5 @ 7/14/21","LRM 5 - 2x5 @ 7/14/21\nMachine Gun - 1x2 @ 1/2/3","LRM 5 - 2x5 @ 7/14/21\nMachine Gun - 1x2 @ 1/2/3","Medium Laser - 2x5 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3\nMRM 20 - 3x5 @ 3/8/15","Machine Gun - 1x2 @ 1/2/3\nRotary AC/2 - 6x2 @ 6/12/18","Rifle (Cannon, Heavy) - 1x9 @ 6/12/18","Machine Gun - 1x2 @ 1/2/3\nSRM 6 - 8x2 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3\nThunderbolt 10 - 1x10 @ 6/12/18","Ultra AC/5 - 2x5 @ 6/13/20\nMachine Gun - 1x2 @ 1/2/3","Machine Gun - 2x2 @ 1/2/3\nLB 5-X AC (Slug) - 1x5 @ 8/15/24\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 5x1 @ 8/15/24","Enhanced LRM 10 - 1x5 @ 7/14/21","Machine Gun - 2x2 @ 1/2/3\nSRM 4 - 3x2 @ 3/6/9","SRM 2 - 8x2 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9","SRM 6 - 8x2 @ 3/6/9\nAP Gauss Rifle - 2x3 @ 3/6/9\nLarge Pulse Laser - 2x10 @ 6/14/20","ER Medium Laser - 1x7 @ 5/10/15","SRM 4 - 3x2 @ 3/6/9\nER Small Laser - 1x3 @ 2/4/5",null,"Light AC/5 - 2x5 @ 5/10/15","Light Machine Gun - 2x1 @ 2/4/6\nMML 5 - 2x5 @ 3/14/21","Machine Gun - 1x2 @ 1/2/3\nLRM 15 - 2x5 @ 7/14/21","ATM 9 - 7x5 @ 5/10/15\nLight Machine Gun - 4x1 @ 2/4/6","AP Gauss Rifle - 8x3 @ 3/6/9\nER Medium Laser - 2x7 @ 5/10/15\nSRM 4 - 6x2 @ 3/6/9\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18","ATM 9 - 2x5 @ 5/10/15\nStreak SRM 6 - 16x2 @ 3/6/9\nLight Machine Gun - 2x1 @ 2/4/6","Magshot Gauss Rifle - 2x2 @ 3/6/9","Light PPC - 2x5 @ 6/12/18","ER Micro Laser - 2x2 @ 1/2/4\nUltra AC/10 - 2x10 @ 6/12/18","ER Medium Laser - 2x7 @ 5/10/15\nUltra AC/2 - 4x2 @ 9/18/27","ProtoMech AC/2 - 2x2 @ 7/14/20","Small Laser - 1x3 @ 1/2/3","Medium Laser - 1x5 @ 3/6/9",null,"Machine Gun - 2x2 @ 1/2/3","SRM 4 - 3x2 @ 3/6/9","Medium Chemical Laser - 1x5 @ 3/6/9","Medium Laser - 1x5 @ 3/6/9","ER Medium Laser - 1x5 @ 4/8/12","Machine Gun - 2x2 @ 1/2/3\nMedium Laser - 2x5 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3\nSRM 4 - 9x2 @ 3/6/9","Ultra AC/20 - 2x20 @ 4/8/12\nLight Machine Gun - 4x1 @ 2/4/6","Extended LRM 15 - 2x5 @ 12/22/38\nMachine Gun - 1x2 @ 1/2/3","LB 20-X AC (Slug) - 1x20 @ 4/8/12\n-- OR -- - x @ \nLB 20-X AC (Pellet) - 20x1 @ 4/8/12\nLight Machine Gun - 4x1 @ 2/4/6\nLight Machine Gun Array - 1x1 @ 2/4/6","Ultra AC/20 - 2x20 @ 4/8/12\nLight Machine Gun - 4x1 @ 2/4/6","Medium Pulse Laser - 1x7 @ 4/8/12\nGauss Rifle - 1x15 @ 7/15/22\nLight Machine Gun - 4x1 @ 2/4/6","Heavy Machine Gun - 2x3 @ 1/2/3","Long Tom Cannon - 1x20 @ 6/13/20\nHeavy Machine Gun - 2x3 @ 1/2/3","Ultra AC/20 - 2x20 @ 4/8/12\nER Medium Laser - 1x7 @ 5/10/15","ER Small Laser - 2x3 @ 2/4/5\nMachine Gun - 2x2 @ 1/2/3","Machine Gun - 1x2 @ 1/2/3\nAC/10 - 1x10 @ 5/10/15\nAC/2 - 1x2 @ 8/16/24\nAC/20 - 1x20 @ 3/6/9",null,"Rotary AC/2 - 12x2 @ 6/12/18","Light PPC - 2x5 @ 6/12/18",null,null,null,null,"Medium Laser - 1x5 @ 3/6/9",null,"SRM 6 - 40x2 @ 3/6/9","SRM 6 - 36x2 @ 3/6/9","SRM 6 - 36x2 @ 3/6/9","Streak SRM 4 - 27x2 @ 3/6/9","SRM 6 - 40x2 @ 3/6/9","LRM 10 - 1x5 @ 7/14/21\nSRM 6 - 4x2 @ 3/6/9","LRM 10 - 1x5 @ 7/14/21\nSRM 6 - 4x2 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9\nRocket Launcher 10 - 6x5 @ 5/10/15","LRM 15 - 2x5 @ 7/14/21\nStreak SRM 2 - 4x2 @ 3/6/9","ER Medium Laser - 1x5 @ 4/8/12\nLRM 15 - 2x5 @ 7/14/21","LRM 15 - 2x5 @ 7/14/21","LRM 10 - 1x5 @ 7/14/21\nSRM 2 - 4x2 @ 3/6/9","MML 5 - 2x5 @ 3/14/21\nLight Machine Gun - 1x1 @ 2/4/6","ER Medium Laser - 2x5 @ 4/8/12\nLRM 15 - 2x5 @ 7/14/21","LRM 10 - 1x5 @ 7/14/21\nSRM 2 - 8x2 @ 3/6/9","MML 5 - 2x5 @ 3/14/21\nSRM 6 - 4x2 @ 3/6/9","Ultra AC/2 - 2x2 @ 9/18/27\nER Small Laser - 2x5 @ 2/4/6","Machine Gun - 2x2 @ 1/2/3","LRM 20 - 5x5 @ 7/14/21\nMachine Gun - 2x2 @ 1/2/3","Improved Heavy Gauss Rifle - 1x22 @ 6/12/19\nLRM 20 - 3x5 @ 7/14/21\nLRM 10 - 1x5 @ 7/14/21\nER Medium Laser - 1x7 @ 5/10/15","LRM 20 - 5x5 @ 7/14/21\nMachine Gun - 2x2 @ 1/2/3",null,"LRM 20 - 3x5 @ 7/14/21\nSRM 4 - 12x2 @ 3/6/9\nMachine Gun - 3x2 @ 1/2/3","LRM 20 - 3x5 @ 7/14/21\nMML 9 - 2x5 @ 3/14/21\nER Medium Laser - 2x5 @ 4/8/12","Arrow IV - 1x20 @ 1/2/8\nThunderbolt 5 - 5x5 @ 6/12/18\nER Small Laser - 1x3 @ 2/4/5","LRM 20 - 3x5 @ 7/14/21\nER Medium Laser - 2x5 @ 4/8/12\nMML 9 - 2x5 @ 3/14/21","LRM 15 - 2x5 @ 7/14/21\nER Medium Laser - 2x5 @ 4/8/12","LRM 15 - 2x5 @ 7/14/21\nER Medium Laser - 2x5 @ 4/8/12","Medium Pulse Laser - 2x6 @ 2/4/6\nLRM 10 - 1x5 @ 7/14/21","LRM 5 - 2x5 @ 7/14/21\nMachine Gun - 2x2 @ 1/2/3\nStreak SRM 2 - 4x2 @ 3/6/9","ATM 9 - 2x5 @ 5/10/15\nAP Gauss Rifle - 2x3 @ 3/6/9","LRM 5 - 2x5 @ 7/14/21\nMachine Gun - 2x2 @ 1/2/3\nStreak SRM 4 - 6x2 @ 3/6/9",null,null,null,null,"SRM 2 - 2x2 @ 3/6/9\nER Medium Laser - 1x5 @ 4/8/12","Flamer - 1x2 @ 1/2/3\nMedium Laser - 2x5 @ 3/6/9","Rocket Launcher 10 - 3x5 @ 5/10/15\nER Medium Laser - 1x5 @ 4/8/12","SRM 2 - 2x2 @ 3/6/9\nMedium Laser - 1x5 @ 3/6/9","Medium Pulse Laser - 2x6 @ 2/4/6\nLight Machine Gun - 2x1 @ 2/4/6","Arrow IV - 2x20 @ 1/2/8\nLight Machine Gun - 1x1 @ 2/4/6","Light Machine Gun - 2x1 @ 2/4/6\nUltra AC/10 - 2x10 @ 6/12/18\nArrow IV - 1x20 @ 1/2/8","ER Small Laser - 2x3 @ 2/4/5","Medium Laser - 2x5 @ 3/6/9","Prototype Rocket Launcher 20 - 5x5 @ 3/7/12\nMachine Gun - 4x2 @ 1/2/3\nAC/10 - 1x10 @ 5/10/15",null,"ER Medium Laser - 2x7 @ 5/10/15","Machine Gun - 2x2 @ 1/2/3","SRM 2 - 4x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","SRM 2 - 4x2 @ 3/6/9\nMachine Gun - 2x2 @ 1/2/3","Machine Gun - 2x2 @ 1/2/3\nER Small Laser - 2x3 @ 2/4/5","Machine Gun - 2x2 @ 1/2/3\nER Small Laser - 2x3 @ 2/4/5","Machine Gun - 2x2 @ 1/2/3\nAC/10 - 1x10 @ 5/10/15\nSRM 4 - 3x2 @ 3/6/9","LB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nSRM 6 - 4x2 @ 3/6/9\nMedium Pulse Laser - 2x6 @ 2/4/6","LB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nSRM 6 - 4x2 @ 3/6/9\nMedium Pulse Laser - 2x6 @ 2/4/6","MRM 30 - 0x5 @ 3/8/15\nSRM 6 - 4x2 @ 3/6/9\nMedium Pulse Laser - 2x6 @ 2/4/6","LB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nStreak SRM 6 - 4x2 @ 3/6/9\nSmall Pulse Laser - 1x3 @ 1/2/3\nMedium Pulse Laser - 2x6 @ 2/4/6","Flamer - 1x2 @ 1/2/3\nStreak SRM 4 - 6x2 @ 3/6/9\nUltra AC/10 - 2x10 @ 6/12/18","AC/10 - 1x10 @ 5/10/15\nSRM 6 - 4x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3","AC/2 - 2x2 @ 8/16/24\nSRM 6 - 4x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3","Extended LRM 15 - 2x5 @ 12/22/38\nHVAC/10 - 1x10 @ 6/12/20","Light Machine Gun - 3x1 @ 2/4/6\nLRM 10 - 1x5 @ 7/14/21\nStreak SRM 6 - 4x2 @ 3/6/9\nLight AC/5 - 1x5 @ 5/10/15","Light Machine Gun - 3x1 @ 2/4/6\nMML 7 - 2x5 @ 3/14/21\nLight AC/5 - 1x5 @ 5/10/15\nER Medium Laser - 1x5 @ 4/8/12","Machine Gun - 2x2 @ 1/2/3","ER Medium Laser - 1x5 @ 4/8/12","MML 7 - 1x5 @ 3/14/21","Medium Pulse Laser - 2x6 @ 2/4/6\nER Small Laser - 1x3 @ 2/4/5","Machine Gun - 2x2 @ 1/2/3\nLarge Laser - 2x8 @ 5/10/15","Machine Gun - 1x2 @ 1/2/3\nLarge Laser - 2x8 @ 5/10/15","Machine Gun - 2x2 @ 1/2/3\nLarge Laser - 2x8 @ 5/10/15","AC/20 - 1x20 @ 3/6/9\nStreak SRM 2 - 8x2 @ 3/6/9\nMedium Pulse Laser - 2x6 @ 2/4/6\nSRM 6 - 4x2 @ 3/6/9","LB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nStreak SRM 4 - 6x2 @ 3/6/9","Rotary AC/5 - 12x5 @ 5/10/15\nER Medium Laser - 2x5 @ 4/8/12\nStreak SRM 2 - 8x2 @ 3/6/9","AC/20 - 1x20 @ 3/6/9\nStreak SRM 2 - 8x2 @ 3/6/9\nMedium Laser - 2x5 @ 3/6/9\nSRM 6 - 4x2 @ 3/6/9","ER Large Laser - 1x10 @ 8/15/25\nStreak SRM 4 - 6x2 @ 3/6/9","MML 7 - 2x5 @ 3/14/21\nLight Machine Gun - 2x1 @ 2/4/6","Arrow IV - 1x20 @ 1/2/8","Machine Gun - 2x2 @ 1/2/3\nMedium Laser - 2x5 @ 3/6/9","Machine Gun - 2x2 @ 1/2/3\nLRM 15 - 2x5 @ 7/14/21","Small Pulse Laser - 1x3 @ 1/2/3\nMedium Laser - 2x5 @ 3/6/9","Medium Laser - 1x5 @ 3/6/9\nSRM 4 - 6x2 @ 3/6/9","Small Pulse Laser - 1x3 @ 1/2/3\nMedium Laser - 2x5 @ 3/6/9","Small Pulse Laser - 1x3 @ 1/2/3\nMedium Laser - 2x5 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3\nAC/5 - 1x5 @ 6/12/18","ER Medium Laser - 1x5 @ 4/8/12\nGauss Rifle - 1x15 @ 7/15/22","Machine Gun - 1x2 @ 1/2/3\nAC/10 - 1x10 @ 5/10/15","Machine Gun - 1x2 @ 1/2/3\nSRM 2 - 2x2 @ 3/6/9\nAC/2 - 1x2 @ 8/16/24","Heavy Machine Gun - 1x3 @ 1/2/3\nUltra AC/10 - 2x10 @ 6/12/18","Machine Gun - 1x2 @ 1/2/3\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nSRM 2 - 2x2 @ 3/6/9","Machine Gun - 1x2 @ 1/2/3\nLB 5-X AC (Slug) - 1x5 @ 7/14/21\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 5x1 @ 7/14/21","Machine Gun - 1x2 @ 1/2/3\nMedium Laser - 2x5 @ 3/6/9","Light Gauss Rifle - 1x8 @ 8/17/25","Machine Gun - 1x2 @ 1/2/3\nUltra AC/5 - 2x5 @ 6/13/20","Rotary AC/5 - 6x5 @ 5/10/15","Ultra AC/5 - 2x5 @ 6/13/20","Magshot Gauss Rifle - 2x2 @ 3/6/9\nLight AC/5 - 1x5 @ 5/10/15\nBombast Laser - 1x12 @ 5/10/15","Magshot Gauss Rifle - 2x2 @ 3/6/9\nBombast Laser - 1x12 @ 5/10/15","Magshot Gauss Rifle - 2x2 @ 3/6/9\nGauss Rifle - 1x15 @ 7/15/22","LRM 15 - 4x5 @ 7/14/21\nLarge Chemical Laser - 4x8 @ 5/10/15","LRM 10 - 1x5 @ 7/14/21\nLB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nStreak SRM 2 - 8x2 @ 3/6/9\nSmall Pulse Laser - 1x3 @ 1/2/3","Small Pulse Laser - 1x3 @ 1/2/3\nLRM 15 - 2x5 @ 7/14/21\nAC/20 - 1x20 @ 3/6/9\nStreak SRM 2 - 8x2 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9\nAC/20 - 2x20 @ 3/6/9","Flamer - 1x2 @ 1/2/3\nSRM 6 - 8x2 @ 3/6/9\nAC/20 - 1x20 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3\nSRM 4 - 3x2 @ 3/6/9","Small Pulse Laser - 1x3 @ 1/2/3\nMML 5 - 2x5 @ 3/14/21\nUltra AC/20 - 2x20 @ 3/7/10\nStreak SRM 4 - 6x2 @ 3/6/9\nLight Machine Gun - 1x1 @ 2/4/6","Flamer - 1x2 @ 1/2/3\nSRM 4 - 3x2 @ 3/6/9\nPPC - 1x10 @ 6/12/18\nAC/10 - 1x10 @ 5/10/15\nMachine Gun - 1x2 @ 1/2/3","MRM 20 - 3x5 @ 3/8/15\nMachine Gun - 2x2 @ 1/2/3\nUltra AC/20 - 2x20 @ 3/7/10\nSRM 6 - 4x2 @ 3/6/9\nMedium Laser - 2x5 @ 3/6/9","Flamer - 1x2 @ 1/2/3\nLB 20-X AC (Slug) - 1x20 @ 4/8/12\n-- OR -- - x @ \nLB 20-X AC (Pellet) - 20x1 @ 4/8/12\nSRM 6 - 8x2 @ 3/6/9\nSRM 4 (I-OS) - 3x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3","Flamer - 1x2 @ 1/2/3\nGauss Rifle - 1x15 @ 7/15/22\nSnub-Nose PPC - 1x8 @ 9/13/15\nSRM 4 - 3x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3","LB 20-X AC (Slug) - 1x20 @ 4/8/12\n-- OR -- - x @ \nLB 20-X AC (Pellet) - 20x1 @ 4/8/12\nSRM 4 - 3x2 @ 3/6/9\nMedium Pulse Laser - 1x6 @ 2/4/6","Machine Gun - 2x2 @ 1/2/3","SRM 4 - 3x2 @ 3/6/9\nAC/2 - 1x2 @ 8/16/24","Machine Gun - 1x2 @ 1/2/3\nAC/5 - 1x5 @ 6/12/18","SRM 4 - 3x2 @ 3/6/9\nLRM 10 - 1x5 @ 7/14/21","Ultra AC/2 - 2x2 @ 8/17/25\nSRM 2 (I-OS) - 2x2 @ 3/6/9","LRM 5 - 1x5 @ 7/14/21\nStreak SRM 2 - 4x2 @ 3/6/9","Rotary AC/2 - 6x2 @ 6/12/18","HVAC/2 - 1x2 @ 10/20/35","Extended LRM 10 - 1x5 @ 12/22/38","LRM 10 - 1x5 @ 7/14/21","Medium Laser - 1x5 @ 3/6/9","Medium Laser - 1x5 @ 3/6/9","Medium Laser - 1x5 @ 3/6/9","AC/2 - 2x2 @ 8/16/24\nMedium Laser - 2x5 @ 3/6/9","LB 2-X AC (Slug) - 2x2 @ 9/18/27\n-- OR -- - x @ \nLB 2-X AC (Pellet) - 4x1 @ 9/18/27\nER Medium Laser - 2x5 @ 4/8/12","Light AC/2 - 2x2 @ 6/12/18\nER Medium Laser - 2x5 @ 4/8/12","Streak SRM 6 - 4x2 @ 3/6/9\nLRM 15 - 4x5 @ 7/14/21\nLight PPC - 2x5 @ 6/12/18","Streak SRM 6 - 4x2 @ 3/6/9\nMML 7 - 2x5 @ 3/14/21\nLight AC/5 - 2x5 @ 5/10/15","SRM 4 - 6x2 @ 3/6/9\nLight PPC - 2x5 @ 6/12/18\nLRM 20 - 5x5 @ 7/14/21","LRM 15 - 4x5 @ 7/14/21","LRM 15 - 4x5 @ 7/14/21\nLarge Re-engineered Laser - 2x9 @ 5/10/15","SRM 2 - 2x2 @ 3/6/9\nMachine Gun - 1x2 @ 1/2/3","Heavy PPC - 1x15 @ 6/12/18\nLight Machine Gun - 1x1 @ 2/4/6","Light Gauss Rifle - 1x8 @ 8/17/25","MML 7 - 2x5 @ 3/14/21","Gauss Rifle - 1x15 @ 7/15/22","Gauss Rifle - 1x15 @ 7/15/22","Arrow IV - 1x20 @ 1/2/8","ER PPC - 1x10 @ 7/14/23","Rotary AC/5 - 6x5 @ 5/10/15","MML 7 - 1x5 @ 3/14/21\nFlamer (Vehicle) - 2x2 @ 1/2/3","SRM 6 - 4x2 @ 3/6/9\nMedium Laser - 3x5 @ 3/6/9","Streak SRM 2 - 2x2 @ 3/6/9\nMedium Laser - 3x5 @ 3/6/9","LRM 5 - 2x5 @ 7/14/21\nER Medium Laser - 2x5 @ 4/8/12","Medium Laser - 3x5 @ 3/6/9","ER Flamer - 1x2 @ 3/5/7",null,"Light PPC - 1x5 @ 6/12/18","Medium Laser - 3x5 @ 3/6/9","SRM 6 - 4x2 @ 3/6/9\nMedium Laser - 3x5 @ 3/6/9","Improved SRM 6 - 4x2 @ 3/6/9\nPrototype ER Medium Laser (CP) - 2x5 @ 4/8/12","ER Medium Laser - 2x7 @ 5/10/15\nLight Machine Gun - 2x1 @ 2/4/6","Light Machine Gun - 2x1 @ 2/4/6\nER Medium Laser - 2x7 @ 5/10/15","AC/10 - 2x10 @ 5/10/15\nSRM 6 - 4x2 @ 3/6/9","LB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nSRM 4 - 3x2 @ 3/6/9","LB 10-X AC (Slug) - 2x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 20x1 @ 6/12/18\nSRM 4 - 3x2 @ 3/6/9","MML 7 - 1x5 @ 3/14/21\nLarge VSP Laser - 2x9 @ 4/8/15","Light AC/2 - 4x2 @ 6/12/18","ER Medium Laser - 2x5 @ 4/8/12\nLB 10-X AC (Slug) - 1x10 @ 6/12/18\n-- OR -- - x @ \nLB 10-X AC (Pellet) - 10x1 @ 6/12/18\nLight Machine Gun - 4x1 @ 2/4/6\nLight Machine Gun Array - 1x1 @ 2/4/6","Snub-Nose PPC - 1x8 @ 9/13/15\nMML 7 - 2x5 @ 3/14/21","Heavy PPC - 1x15 @ 6/12/18","Medium Laser - 4x5 @ 3/6/9\nStreak SRM 4 - 9x2 @ 3/6/9","LB 5-X AC (Slug) - 1x5 @ 8/15/24\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 5x1 @ 8/15/24\nLRM 10 - 1x5 @ 7/14/21","LB 5-X AC (Slug) - 1x5 @ 8/15/24\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 5x1 @ 8/15/24\nLRM 10 - 1x5 @ 7/14/21","LB 5-X AC (Slug) - 1x5 @ 8/15/24\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 5x1 @ 8/15/24\nATM 6 - 2x5 @ 5/10/15",null,"Medium Laser - 4x5 @ 3/6/9\nStreak SRM 4 - 9x2 @ 3/6/9","LB 5-X AC (Slug) - 1x5 @ 8/15/24\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 5x1 @ 8/15/24\nLRM 10 - 1x5 @ 7/14/21","LB 5-X AC (Slug) - 1x5 @ 8/15/24\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 5x1 @ 8/15/24\nLRM 10 - 1x5 @ 7/14/21","LB 5-X AC (Slug) - 1x5 @ 8/15/24\n-- OR -- - x @ \nLB 5-X AC (Pellet) - 5x1 @ 8/15/24\nATM 6 - 2x5 @ 5/10/15"]},"WepName1":{"dict":["AC/2","LB 2-X AC (Slug)","ER Large Laser","HAG/40","Long Tom Cannon","MML 9","Rotary AC/5","PPC","Streak SRM 6","Light Machine Gun","Ultra AC/10","AC/10","AC/20","Gauss Rifle","Heavy Gauss Rifle","Micro Pulse Laser","LRM 15","ER Medium Laser","LRM 10","LRM 5","Machine Gun","SRM 2","Arrow IV","ProtoMech AC/8","HAG/30","Large Chemical Laser","AP Gauss Rifle","ER Small Laser","Medium Pulse Laser","ATM 3","Heavy Medium Laser","SRM 4","Small Laser","Light PPC","ATM 6","LRM 20","ATM 9","Streak SRM 2","Heavy Machine Gun","Large VSP Laser","SRM 6","Medium Laser","MML 7","MML 3","Flamer","MML 5","Medium Chemical Laser","Large Laser","Heavy PPC","Improved Heavy Gauss Rifle","Streak SRM 4","Small Pulse Laser","Magshot Gauss Rifle","Thunderbolt 15","Streak LRM 15","Flamer (Vehicle)","Light AC/5","Medium Re-engineered Laser","ProtoMech AC/2","LB 5-X AC (Slug)","Rocket Launcher 10","Plasma Rifle","Ultra AC/20","MRM 30","Thunderbolt 20","ER Large Pulse Laser","ER PPC","Plasma Cannon","ATM 12","Large Pulse Laser","Prototype Rocket Launcher 15","LB 20-X AC (Slug)","Snub-Nose PPC","Prototype Rocket Launcher 10","Light Gauss Rifle","LB 10-X AC (Slug)","'Mech Mortar 2","Sniper Cannon","'Mech Mortar 8","HAG/20","SRM 2 (I-OS)","MRM 20","Thunderbolt 5","Large Re-engineered Laser","HVAC/2","Enhanced LRM 15","Small VSP Laser","Enhanced LRM 10","Rifle (Cannon, Light)","Medium VSP Laser","AC/5","Rocket Launcher 20","Rocket Launcher 15","HVAC/5","Rotary AC/2","Light AC/2","Ultra AC/5","Large X-Pulse Laser","Silver Bullet Gauss Rifle","Medium X-Pulse Laser","Small X-Pulse Laser","Thumper Cannon","MRM 40","Rifle (Cannon, Heavy)","ER Micro Laser","Extended LRM 15","Ultra AC/2","Prototype Rocket Launcher 20","Extended LRM 10","ER Flamer","Improved SRM 6"],"values":[0,1,2,2,1,3,4,5,6,7,8,9,10,11,12,11,12,13,14,15,16,17,17,18,16,19,20,null,21,20,19,20,21,20,19,20,21,20,22,22,17,20,23,13,24,25,26,26,20,20,27,28,18,8,29,26,30,17,21,31,19,32,32,17,33,21,17,34,16,34,17,20,21,35,28,17,36,37,38,28,8,39,7,21,40,19,41,41,32,17,9,null,21,42,43,8,null,32,null,44,null,null,19,19,17,19,17,19,45,19,13,35,9,9,2,19,31,21,null,20,20,20,46,20,20,20,20,20,null,null,47,48,35,47,7,20,20,20,20,38,20,20,38,49,14,18,50,37,19,33,26,51,17,28,28,40,41,52,18,40,18,52,41,21,null,52,9,9,9,9,52,13,13,13,2,53,22,22,22,22,22,2,2,2,37,21,54,41,41,41,41,20,20,20,20,20,55,55,20,56,57,17,41,10,20,20,58,59,59,55,55,55,20,27,null,27,60,47,41,61,2,47,41,20,47,60,17,22,20,20,20,20,21,41,31,62,20,20,13,12,10,62,63,5,64,49,9,20,14,40,41,7,37,49,20,9,44,49,20,20,17,33,42,44,55,17,2,30,2,18,18,45,33,21,37,18,29,36,28,54,null,12,55,8,40,26,65,17,50,66,17,67,28,62,3,68,66,69,40,14,24,13,20,null,null,null,18,null,70,21,71,71,44,17,17,17,17,47,52,72,18,52,13,61,56,41,17,17,13,13,59,41,27,60,18,46,32,28,17,2,17,41,20,41,73,60,52,42,51,9,54,38,17,11,56,null,16,6,17,17,74,20,20,20,72,20,20,20,20,33,28,75,13,4,4,null,22,18,null,76,77,null,56,64,62,20,20,78,50,79,17,17,17,61,41,40,31,31,55,45,40,80,41,18,81,45,40,82,47,7,83,7,7,74,6,74,53,40,45,84,null,20,19,20,56,31,35,85,5,85,20,19,20,31,7,20,19,20,31,86,75,75,75,75,75,17,16,17,29,26,28,12,11,62,41,71,16,12,6,40,24,9,21,null,41,72,33,null,35,62,16,87,2,69,35,41,16,55,55,66,67,17,17,18,20,20,20,null,31,41,88,41,46,41,41,56,33,41,41,21,62,20,40,17,17,35,20,20,20,16,20,31,43,2,2,52,7,49,33,89,17,47,67,90,90,25,20,null,20,12,null,null,17,20,91,17,20,20,null,41,20,32,21,45,7,45,21,28,18,18,20,17,41,50,26,31,41,40,82,28,92,92,92,28,28,35,35,35,35,52,41,41,74,74,37,21,17,9,74,9,41,14,20,18,27,6,41,93,37,37,37,48,28,17,41,40,87,27,null,47,12,38,13,13,13,75,36,24,75,40,40,37,21,null,32,null,null,37,21,20,8,8,16,19,40,40,40,40,40,40,16,45,16,19,31,43,37,33,20,20,17,9,28,28,52,28,28,null,44,17,26,41,47,18,41,47,18,20,20,20,74,72,75,11,90,52,11,2,21,2,78,63,6,6,94,7,9,9,61,34,7,13,41,41,95,33,69,59,27,26,19,41,25,41,74,35,74,41,2,41,66,35,71,46,69,67,17,69,null,40,40,41,21,13,22,35,51,40,4,28,17,9,59,84,75,20,75,96,20,94,6,75,20,20,90,20,20,74,20,20,97,32,98,17,10,99,41,40,28,40,99,81,28,41,null,99,99,20,null,20,41,20,21,21,27,21,21,37,32,16,22,17,41,17,55,40,40,40,50,11,8,8,75,74,62,22,13,13,51,100,17,71,49,12,21,42,21,42,21,21,21,21,42,41,41,42,5,27,41,51,55,17,32,27,32,27,27,46,13,98,22,6,13,6,74,18,40,35,40,41,18,40,18,41,17,51,33,20,28,51,32,13,17,17,48,47,21,19,70,31,12,12,null,71,62,72,72,72,18,81,17,17,41,null,17,32,20,17,17,20,6,74,75,72,101,90,95,89,null,28,null,75,48,74,61,102,16,47,16,5,53,22,20,10,74,33,7,7,7,7,7,7,21,94,21,31,27,32,33,20,20,20,20,19,19,19,41,20,20,103,20,20,96,20,87,20,21,40,40,17,31,null,56,9,20,36,26,36,52,33,104,17,58,32,41,null,20,31,46,41,17,20,20,62,105,71,62,28,38,4,62,27,20,null,94,33,null,null,null,null,41,null,40,40,40,50,40,18,18,40,16,17,16,18,45,17,18,45,106,20,35,49,35,null,35,35,22,35,16,16,28,19,36,19,null,null,null,null,21,44,60,21,28,22,9,27,41,107,null,17,20,21,21,20,20,20,75,75,63,75,44,11,0,105,9,9,20,17,42,28,20,20,20,12,75,6,12,2,42,22,20,20,51,41,51,51,20,17,20,20,38,20,20,20,74,20,6,96,52,52,52,16,18,51,40,44,51,44,81,44,44,71,20,31,20,31,106,19,94,84,108,18,41,41,41,0,1,95,8,8,31,16,16,21,48,74,42,13,13,22,66,6,42,40,37,19,41,109,null,33,41,40,110,17,9,11,75,75,42,95,17,72,48,41,59,59,59,null,41,59,59,59]},"Shots1":{"values":[5,5,1,1,4,6,1,1,18,1,16,3,2,3,3,3,3,3,2,2,4,1,1,1,4,1,3,null,2,2,1,3,2,1,1,4,2,2,1,2,2,2,1,2,4,4,1,1,2,2,3,1,1,4,1,4,1,1,8,6,2,2,9,1,1,2,1,3,4,3,2,2,4,3,3,2,2,2,4,1,8,1,1,2,8,2,1,1,6,1,1,null,4,1,1,4,null,1,null,1,null,null,3,3,2,3,2,2,6,3,1,5,4,6,1,1,6,4,null,1,1,2,1,2,1,1,1,2,null,null,2,1,5,2,2,1,2,1,1,1,2,1,1,1,1,1,3,4,2,1,2,3,2,2,2,4,3,2,1,4,1,3,1,12,null,2,3,3,3,3,4,1,2,1,1,1,1,1,1,1,1,1,1,1,2,4,2,1,1,1,1,1,1,1,1,2,2,1,1,1,3,4,4,2,2,2,1,1,1,2,2,2,4,2,null,2,3,1,3,1,1,1,2,2,1,3,2,1,1,1,1,1,2,2,3,4,6,3,2,2,4,2,0,5,2,1,2,4,1,4,4,2,6,1,2,4,1,2,2,2,2,1,1,2,2,1,1,2,1,1,1,2,2,12,8,1,5,2,2,4,null,1,3,12,8,2,1,2,6,1,2,2,4,2,6,6,1,1,8,1,4,1,1,null,null,null,1,null,8,2,2,1,1,1,1,1,1,1,3,1,1,2,1,1,1,1,2,1,1,1,2,1,2,3,1,2,2,1,1,1,2,2,2,1,6,6,2,1,2,2,2,2,2,1,1,null,2,6,2,3,1,2,1,2,1,1,1,5,1,1,3,1,2,2,1,null,1,4,null,3,1,null,1,1,2,2,3,2,3,2,2,2,2,2,2,8,6,6,1,2,8,4,3,1,3,2,8,2,1,1,1,1,1,1,6,1,1,8,2,1,null,2,1,4,1,3,10,4,7,8,2,1,4,3,1,2,1,4,3,2,2,2,2,2,2,2,2,2,2,2,2,1,1,2,4,1,4,1,6,20,4,2,2,null,1,1,2,null,3,2,4,1,1,1,3,2,2,4,2,1,1,2,2,1,1,1,1,null,3,1,1,1,1,1,3,1,1,1,2,4,2,1,12,1,1,10,2,2,2,8,2,6,1,1,1,2,1,1,1,1,1,1,1,1,1,1,6,null,2,1,null,null,2,2,10,2,2,2,null,1,2,2,2,2,1,2,4,2,1,1,4,2,2,3,2,6,8,20,5,2,14,14,14,2,1,8,8,8,8,3,3,3,1,1,2,2,1,4,1,2,2,1,2,1,1,6,1,1,2,2,2,1,1,2,1,4,3,5,null,1,1,4,1,1,1,1,7,4,1,8,4,4,2,null,2,null,null,2,2,1,4,4,2,2,4,4,4,4,4,4,2,2,2,2,3,1,2,2,2,2,1,3,2,1,8,2,2,null,1,2,1,1,1,1,1,1,1,4,4,4,2,1,2,1,1,3,1,2,4,3,3,0,6,6,6,1,6,6,1,2,2,2,1,1,1,1,1,4,1,2,2,4,8,10,3,5,2,4,1,8,1,5,1,5,1,1,1,1,null,4,4,2,2,1,1,5,2,8,1,2,2,3,2,2,2,2,2,4,2,24,12,2,2,2,4,2,2,4,2,2,2,1,10,1,2,1,1,8,2,12,1,3,1,1,null,2,2,2,null,1,2,1,4,4,1,4,4,4,1,4,1,2,3,2,1,8,8,8,6,1,4,4,1,1,2,1,1,1,1,2,1,1,1,1,2,1,2,1,2,2,2,2,1,2,2,3,4,1,4,2,2,2,4,2,4,2,2,6,1,10,1,6,1,6,1,1,4,5,4,4,1,4,1,2,2,1,1,2,1,2,1,1,2,2,1,1,8,2,10,3,1,1,null,1,2,1,1,1,1,3,2,1,1,null,1,2,1,2,1,1,6,1,1,1,1,1,2,2,null,3,null,1,1,1,1,10,8,4,2,4,2,2,8,6,3,6,3,3,3,2,1,3,4,6,4,6,1,4,1,1,1,1,1,1,2,2,2,1,1,1,1,1,2,2,1,2,8,4,8,1,3,null,2,2,1,7,8,2,2,2,2,2,2,1,1,null,2,3,1,1,1,2,2,2,2,1,2,1,2,1,2,2,1,null,12,2,null,null,null,null,1,null,40,36,36,27,40,1,1,4,2,1,2,1,2,2,1,2,2,2,5,1,5,null,3,3,1,3,2,2,2,2,2,2,null,null,null,null,2,1,3,2,2,2,2,2,2,5,null,2,2,4,4,2,2,2,1,1,0,1,1,1,2,2,3,3,2,1,1,2,2,1,2,1,2,12,1,1,2,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,2,2,2,2,4,1,1,4,1,1,1,3,1,1,1,2,3,1,3,2,1,6,1,1,1,1,1,1,2,2,2,4,4,6,4,4,2,1,1,2,1,1,1,1,6,1,4,2,2,3,1,null,1,3,4,4,2,2,2,2,2,1,4,2,1,1,4,1,1,1,null,4,1,1,1]},"Dam1":{"dict":["2","8","5","20","10","1","15","3","7","9","22","6","2D6 Heat","4"],"values":[0,0,1,1,0,2,3,2,2,4,0,5,4,4,3,4,3,6,6,7,2,8,8,2,2,2,0,null,0,0,2,0,0,0,2,0,0,0,3,3,8,0,1,6,2,1,7,7,0,0,2,8,2,0,2,7,4,8,0,0,2,7,7,2,2,0,8,2,2,2,2,0,0,2,8,8,2,0,7,8,0,9,4,0,0,2,2,2,7,2,5,null,0,2,2,0,null,7,null,0,null,null,2,2,2,2,2,2,2,2,6,2,5,5,4,2,0,0,null,0,0,0,2,0,0,0,0,0,null,null,1,6,2,1,4,0,0,0,0,7,0,0,7,10,6,2,0,0,2,2,7,7,8,8,8,0,2,0,2,0,2,0,2,0,null,0,5,5,5,5,0,6,6,6,1,6,3,3,3,3,3,1,1,1,0,0,2,2,2,2,2,0,0,0,0,0,0,0,0,2,11,2,2,4,0,0,0,2,2,0,0,0,0,7,null,7,2,1,2,4,1,1,2,0,1,2,2,3,0,0,0,0,0,2,0,3,0,0,6,3,4,3,2,2,3,10,5,0,6,0,2,4,0,10,0,5,0,10,0,0,2,2,2,0,0,2,4,4,4,2,2,2,2,0,0,2,2,2,8,2,null,3,0,0,0,7,4,8,0,6,8,12,8,3,2,2,6,4,0,6,2,6,0,null,null,null,2,null,2,0,3,3,0,2,2,2,2,1,0,1,2,0,6,4,2,2,2,2,6,6,2,2,7,2,2,2,7,11,2,1,2,2,0,2,2,2,0,2,7,5,2,7,2,4,2,null,2,2,2,2,1,0,0,0,1,0,0,0,0,2,8,4,6,3,3,null,3,2,null,3,4,null,2,3,3,0,0,1,0,2,8,8,8,4,2,0,0,0,0,2,0,0,2,2,2,2,0,2,1,4,9,4,4,1,2,1,6,0,2,0,null,0,2,0,2,0,2,2,2,2,0,2,0,0,4,0,2,0,0,13,4,4,4,4,4,8,2,8,2,7,8,3,4,3,2,3,2,3,2,0,2,5,0,null,2,1,2,null,2,3,2,2,1,9,2,2,2,0,0,6,12,8,8,2,0,0,0,null,0,2,7,2,2,2,2,2,2,2,2,0,3,0,0,2,2,2,0,0,0,2,0,0,2,4,4,0,4,10,2,8,2,1,12,2,2,1,0,null,0,3,null,null,2,0,2,2,0,0,null,2,0,7,0,2,4,2,0,8,2,2,0,2,2,0,7,0,2,0,2,11,2,2,2,11,11,2,2,2,2,0,2,2,1,1,0,0,2,5,1,5,2,6,0,2,7,2,2,2,0,0,0,6,11,2,2,0,2,7,null,1,3,7,6,6,6,4,2,2,4,0,0,0,0,null,7,null,null,0,0,0,0,0,2,2,0,0,0,0,0,0,2,2,2,2,0,2,0,2,0,0,2,5,11,11,0,11,11,null,0,8,7,2,1,2,2,1,2,0,0,0,1,1,4,4,2,0,4,4,0,4,1,2,2,2,0,4,5,5,4,2,4,6,2,2,0,2,9,2,2,7,2,2,1,2,1,2,1,2,1,2,6,2,3,2,4,12,8,4,null,0,0,2,0,6,3,2,7,0,3,11,2,5,2,0,4,0,4,2,0,0,2,4,0,0,2,0,0,1,0,0,9,7,5,2,4,11,2,0,11,0,11,2,11,2,null,11,11,0,null,0,2,0,0,0,2,0,0,0,7,2,3,2,2,2,0,0,0,0,0,4,0,0,4,1,3,3,6,6,7,7,2,3,10,3,0,2,0,2,0,0,0,0,2,2,2,2,2,7,2,7,0,2,7,7,7,7,7,2,6,5,3,2,6,2,1,2,0,2,0,2,2,0,2,2,2,7,2,0,11,7,7,6,2,2,6,1,0,2,2,0,3,3,null,3,3,1,1,1,2,2,2,2,2,null,2,7,0,2,2,0,2,1,4,1,2,2,0,8,null,11,null,4,6,1,4,2,2,1,2,2,6,3,0,4,1,2,4,4,4,4,4,4,0,0,0,0,7,7,2,0,0,0,0,2,2,2,2,0,0,9,0,0,2,0,2,0,0,0,0,8,0,null,2,5,0,2,7,2,0,2,0,8,0,7,2,null,0,0,2,2,2,0,0,3,2,3,3,8,7,3,3,7,0,null,0,2,null,null,null,null,2,null,0,0,0,0,0,2,2,0,2,2,2,2,2,2,2,2,0,0,2,10,2,null,2,2,3,2,2,2,11,2,2,2,null,null,null,null,0,0,2,0,11,3,5,7,2,2,null,8,0,0,0,0,0,0,4,4,2,4,0,4,0,2,5,5,0,2,2,11,0,0,0,3,4,2,3,4,2,3,0,0,7,2,7,7,0,2,0,0,7,0,0,0,1,0,2,2,0,0,0,2,2,7,0,0,7,0,2,0,0,3,0,0,0,0,0,2,0,0,2,2,2,2,2,0,0,0,0,0,0,2,2,0,6,1,2,6,6,3,4,2,2,0,0,2,2,0,null,2,2,0,0,8,5,4,4,4,2,0,2,1,6,2,2,2,2,null,2,2,2,2]},"Range1":{"dict":["8/16/24","9/18/27","7/14/19","10/20/30","6/13/20","3/14/21","5/10/15","6/12/18","3/6/9","2/4/6","7/15/22","1/2/3","7/14/21","1/2/8","3/7/10","4/8/12","4/8/15","8/15/25","6/12/19","7/14/20","2/4/5","3/8/15","7/15/23","7/14/23","6/14/20","4/9/15","9/13/15","8/17/25","10/20/35","2/5/9","3/7/12","8/16/28","8/15/24","4/9/14","1/2/4","12/22/38","3/5/7"],"values":[0,1,2,2,3,0,4,5,6,7,8,9,7,6,8,6,8,10,4,11,12,6,6,12,12,12,11,null,8,11,12,11,8,11,12,11,8,11,13,13,6,11,14,10,0,6,8,8,11,11,9,15,12,8,6,8,8,6,8,8,12,11,11,15,7,8,6,6,12,6,15,11,8,12,15,6,6,8,11,15,8,16,7,8,8,12,8,8,11,15,9,null,8,5,5,8,null,11,null,11,null,null,12,12,15,12,15,12,5,12,10,12,9,9,17,12,8,8,null,11,11,11,8,11,11,11,11,11,null,null,6,7,12,6,7,11,11,11,11,11,11,11,11,18,4,12,8,8,12,7,8,9,6,15,15,8,8,8,12,8,12,8,8,8,null,8,9,9,9,9,8,10,10,10,2,7,13,13,13,13,13,2,2,2,8,8,12,8,8,8,8,11,11,11,11,11,11,11,11,6,8,15,8,7,11,11,19,12,12,11,11,11,11,20,null,20,6,6,8,6,2,6,8,11,6,6,15,13,11,11,11,11,8,8,8,14,11,11,10,8,7,14,21,5,7,18,9,11,4,8,8,7,8,18,11,9,11,18,11,11,15,7,5,11,11,15,17,8,17,12,12,5,7,8,8,12,6,6,15,12,null,8,11,8,8,8,22,6,8,23,6,7,15,15,0,6,23,24,8,4,0,10,11,null,null,null,12,null,25,8,15,15,11,15,15,15,15,6,8,26,12,8,10,6,6,8,15,15,10,10,12,8,20,6,12,8,11,9,15,2,15,8,11,8,6,6,8,5,11,9,12,11,15,6,6,null,12,6,15,15,27,11,11,11,26,11,11,11,11,7,15,7,10,4,4,null,13,12,null,12,15,null,6,7,14,11,11,12,8,0,6,6,6,6,8,8,8,8,11,5,8,8,8,12,21,5,8,7,6,7,6,7,7,27,6,27,7,8,5,28,null,11,12,11,6,8,12,12,5,12,11,12,11,8,7,11,12,11,8,9,7,7,7,7,7,6,12,6,6,8,15,8,6,14,8,15,12,8,6,8,0,9,8,null,8,26,7,null,12,14,12,12,2,14,12,8,12,11,11,23,7,6,6,12,11,11,11,null,8,8,15,8,8,8,8,6,7,8,8,8,14,11,8,15,15,12,11,11,11,12,11,8,5,17,17,8,7,18,7,29,15,6,7,7,7,6,11,null,11,8,null,null,15,11,30,15,11,11,null,8,11,11,8,5,7,5,8,15,12,12,11,15,8,8,8,8,8,8,7,9,25,25,25,9,9,12,12,12,12,8,8,8,27,27,8,8,15,9,27,9,8,4,11,12,20,6,8,31,8,8,8,7,9,15,8,8,12,20,null,6,8,11,10,10,10,7,6,0,7,8,8,8,8,null,11,null,null,8,8,11,8,8,12,12,8,8,8,8,8,8,12,5,12,12,8,5,8,7,11,11,15,9,9,9,8,9,9,null,11,6,8,8,6,12,8,6,12,11,11,11,27,26,7,6,7,8,6,17,8,17,12,21,6,6,7,7,9,9,6,6,7,10,8,8,7,7,14,32,9,8,12,8,6,8,27,12,27,8,2,8,23,12,15,8,24,7,6,24,null,8,8,8,8,10,13,12,11,8,4,9,15,9,12,28,7,11,7,4,11,7,6,7,11,11,7,11,11,27,11,11,6,11,10,15,7,8,8,8,9,8,8,21,9,8,null,8,8,11,null,11,8,11,8,8,9,8,8,8,11,12,13,15,8,15,11,8,8,8,8,6,8,8,7,27,14,13,10,10,11,20,15,15,18,8,8,5,8,5,8,8,8,8,5,8,8,5,5,20,8,11,11,15,11,20,11,20,20,8,10,10,13,6,10,6,27,12,8,12,8,8,12,8,12,8,15,11,7,11,9,11,11,10,15,15,7,6,8,12,25,8,8,8,null,15,14,26,26,26,12,21,15,15,8,null,15,11,11,15,15,11,6,27,7,26,33,7,7,29,null,9,null,7,7,27,6,21,12,6,12,5,7,13,11,7,27,7,7,7,7,7,7,7,8,7,8,8,20,11,7,11,11,11,11,12,12,12,8,11,11,7,11,11,4,11,12,11,8,8,8,6,8,null,6,9,11,6,8,6,8,7,34,6,19,11,8,null,11,8,8,8,15,11,11,15,35,15,15,15,11,4,15,20,11,null,7,7,null,null,null,null,8,null,8,8,8,8,8,12,12,8,12,15,12,12,5,15,12,5,1,11,12,18,12,null,12,12,13,12,12,12,9,12,6,12,null,null,null,null,8,11,6,8,9,13,9,20,8,30,null,6,11,8,8,11,11,11,7,7,21,7,11,6,0,35,9,9,11,15,5,9,11,11,11,8,7,6,8,17,5,13,11,11,11,8,11,11,11,15,11,11,11,11,11,11,27,11,6,4,8,8,8,12,12,11,8,11,11,11,21,11,11,15,11,8,11,8,27,12,7,28,35,12,8,8,8,0,1,7,8,8,8,12,12,8,7,27,5,10,10,13,23,6,5,8,8,12,8,36,null,7,8,8,8,6,9,6,7,7,5,7,15,26,7,8,32,32,32,null,8,32,32,32]},"WepName2":{"dict":["-- OR --","Medium Pulse Laser","ER Large Laser","ER Small Laser","LRM 15","MRM 40","Arrow IV","Gauss Rifle","AP Gauss Rifle","Plasma Cannon","Medium VSP Laser","Streak SRM 6","LRM 10","ER Medium Laser","Medium Chemical Laser","Large Pulse Laser","Machine Gun","Streak SRM 2","Streak SRM 4","Medium Laser","SRM 2","ATM 6","Heavy Machine Gun","LB 2-X AC (Slug)","Heavy Machine Gun Array","Heavy Medium Laser","SRM 4","Large Laser","Light PPC","Magshot Gauss Rifle","SRM 6","Ultra AC/10","Thunderbolt 5","Flamer","Streak LRM 5","Light Gauss Rifle","MML 7","Light AC/5","Rotary AC/5","MML 9","LRM 20","PPC","MML 5","Large Chemical Laser","LB 5-X AC (Slug)","Plasma Rifle","Heavy PPC","AC/20","Light Machine Gun","Micro Pulse Laser","Bombast Laser","LB 10-X AC (Slug)","Rotary AC/2","LRM 5","AC/5","AC/2","AC/10","Medium Re-engineered Laser","ProtoMech AC/8","Rocket Launcher 10","LB 20-X AC (Slug)","Flamer (Vehicle)","Long Tom Cannon","ER PPC","Streak SRM 2 (I-OS)","MML 3","ER Medium Pulse Laser","HAG/20","Improved Heavy Medium Laser","ATM 9","Small Pulse Laser","Small VSP Laser","Thumper Cannon","Light Machine Gun Array","Large Re-engineered Laser","Streak LRM 15","Extended LRM 15","Snub-Nose PPC","Small Laser","SRM 2 (I-OS)","Medium X-Pulse Laser","Thunderbolt 10","Streak LRM 10","SRM 4 (OS)","Rocket Launcher 15","Extended LRM 10","Improved LRM 10","Prototype Rocket Launcher 10","MRM 10","MRM 20","Ultra AC/2","HAG/40","Enhanced LRM 15","HAG/30","Ultra AC/5","Sniper Cannon","HVAC/10","Prototype ER Medium Laser (CP)","Light AC/2","Large VSP Laser"],"values":[null,0,null,null,0,null,1,2,3,4,5,6,7,null,null,null,null,null,null,null,null,1,8,4,9,null,null,null,null,null,null,null,null,null,null,null,null,null,10,null,11,11,null,12,13,14,15,2,12,12,16,17,3,null,3,null,17,18,null,null,null,19,null,null,20,19,21,22,13,null,6,null,2,null,null,23,null,9,24,25,null,16,null,26,null,null,12,27,19,20,28,null,16,29,29,8,null,19,null,null,null,null,16,30,20,16,31,31,16,16,32,18,33,12,34,null,16,null,null,35,36,37,16,38,35,37,11,39,null,null,40,40,30,41,30,26,26,42,43,2,44,26,45,46,7,41,46,41,47,36,23,42,22,8,48,20,16,null,20,20,null,null,null,null,null,null,49,50,13,1,7,51,13,52,51,29,19,19,13,19,19,17,17,42,2,13,2,null,null,null,null,null,null,53,54,55,16,19,56,57,null,20,null,14,44,2,58,0,0,null,null,null,null,null,null,null,3,null,null,null,null,16,59,28,16,45,null,29,null,null,null,null,16,6,null,null,60,47,19,null,null,60,null,16,11,31,61,13,11,19,7,null,1,19,27,62,30,61,63,7,40,null,28,38,38,48,17,64,null,16,16,16,65,16,15,16,16,17,23,null,null,null,null,16,66,30,null,40,31,11,67,8,18,3,13,68,11,7,19,36,69,13,null,null,null,null,null,null,null,null,0,0,11,70,70,16,71,19,1,36,19,1,null,38,7,7,7,7,null,null,0,null,null,null,56,43,19,19,19,null,72,28,13,16,16,16,37,3,16,null,2,null,42,null,73,null,2,4,4,45,4,13,74,15,30,27,12,30,30,39,null,0,40,null,7,null,null,null,null,null,null,null,null,null,null,63,63,75,13,13,8,8,8,37,null,null,null,null,26,null,null,null,null,null,null,null,null,null,30,30,11,70,26,null,16,null,null,13,13,null,null,null,16,null,null,16,null,76,null,null,null,16,null,16,null,null,16,null,16,null,0,0,0,0,0,null,3,11,null,13,null,null,null,null,null,0,null,null,null,null,null,77,null,null,78,null,null,null,null,null,null,null,4,4,null,12,16,16,16,16,8,4,4,51,null,null,null,null,null,20,16,61,26,20,78,59,79,16,null,80,16,26,26,4,4,12,4,4,13,null,81,null,null,69,12,null,81,null,null,null,null,null,null,12,12,82,null,null,null,null,null,null,null,null,59,7,null,null,null,null,null,null,null,51,19,38,8,null,15,15,27,null,null,2,13,16,null,null,null,83,13,3,null,17,84,null,null,null,null,null,16,16,16,3,null,null,null,45,16,77,3,3,7,28,19,13,12,85,15,41,12,36,51,38,63,86,46,null,null,null,87,28,88,39,89,0,18,4,0,54,16,16,null,null,null,null,null,null,null,null,13,13,26,20,16,16,16,53,53,53,20,79,16,16,20,null,null,65,4,4,null,51,null,null,null,null,null,null,null,90,2,null,null,null,null,null,null,null,null,null,2,36,0,16,16,null,27,4,91,null,null,null,17,null,17,30,2,73,null,48,7,28,null,null,null,null,null,0,1,null,19,1,53,12,13,12,36,13,19,92,8,null,0,68,69,30,15,93,null,null,null,30,null,null,1,null,53,null,70,65,null,36,0,59,0,51,0,55,4,null,23,0,54,55,null,94,85,null,4,51,null,53,53,51,19,31,30,1,18,null,65,13,65,26,null,11,11,26,null,95,26,95,55,54,90,44,40,9,52,17,17,76,53,42,32,20,null,null,20,16,96,96,0,16,53,53,16,16,51,6,null,0,null,null,12,null,12,1,12,12,12,4,13,26,17,19,63,16,37,51,null,30,16,48,16,29,29,null,null,null,null,null,null,null,null,40,61,19,16,20,1,78,97,null,null,null,null,null,null,null,53,19,62,62,11,20,null,null,null,78,null,null,null,0,null,null,18,59,20,17,36,42,null,null,null,null,null,null,null,null,null,null,0,null,null,null,null,null,null,null,null,0,20,null,36,19,19,null,38,37,65,19,54,null,null,null,null,16,null,28,51,null,54,null,4,null,78,28,26,54,54,37,98,12,16,16,16,89,52,null,30,81,16,44,null,26,null,null,8,null,3,null,null,42,4,48,13,11,null,null,31,90,null,null,null,null,null,null,null,null,null,19,26,48,16,0,48,7,null,22,13,16,56,null,null,null,null,null,null,null,null,null,null,null,null,null,null,30,30,59,17,4,null,20,48,4,20,30,3,null,16,40,16,null,26,39,32,13,13,13,12,16,8,16,null,null,null,null,13,19,13,19,48,48,31,null,null,16,null,null,null,16,16,3,3,56,0,0,30,0,18,30,30,96,12,36,null,null,null,3,27,27,27,17,0,13,17,18,48,null,19,4,19,26,19,19,54,7,56,20,31,51,44,19,null,94,null,null,37,50,7,43,51,4,47,30,42,26,16,60,7,0,null,55,54,12,79,17,null,null,null,null,null,null,null,19,0,13,4,36,28,null,74,16,48,null,null,null,null,null,null,null,61,19,19,13,null,null,null,null,null,19,97,48,13,30,0,0,99,null,51,36,null,18,0,0,0,null,18,0,0,0]},"Shots2":{"values":[null,null,null,null,null,null,4,1,1,6,5,1,1,null,null,null,null,null,null,null,null,1,1,2,1,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,4,4,null,1,2,2,1,1,1,1,6,2,1,null,1,null,2,3,null,null,null,3,null,null,2,3,3,1,1,null,2,null,1,null,null,1,null,1,1,1,null,1,null,6,null,null,1,1,2,2,2,null,1,4,4,4,null,1,null,null,null,null,4,8,8,4,4,4,2,4,8,6,2,1,2,null,2,null,null,1,2,1,2,6,1,2,12,2,null,null,3,3,8,1,8,6,6,2,1,1,2,6,1,1,1,3,2,3,4,2,1,1,2,4,2,6,3,null,2,8,null,null,null,null,null,null,2,1,2,4,1,1,1,6,1,4,2,2,2,2,2,4,4,1,1,4,1,null,null,null,null,null,null,1,1,2,2,3,1,2,null,6,null,2,1,1,1,null,null,null,null,null,null,null,null,null,2,null,null,null,null,4,7,2,4,1,null,4,null,null,null,null,1,2,null,null,2,2,2,null,null,1,null,2,4,4,2,2,4,2,1,null,2,2,1,2,4,1,3,3,10,null,1,12,12,2,4,4,null,2,1,2,1,2,1,2,2,6,1,null,null,null,null,2,2,12,null,5,2,4,2,6,3,5,2,1,12,1,1,2,5,2,null,null,null,null,null,null,null,null,null,null,4,2,1,2,1,1,2,1,3,2,null,6,1,1,1,1,null,null,null,null,null,null,1,1,1,2,2,null,1,1,1,2,2,2,1,2,2,null,1,null,1,null,1,null,1,4,4,1,4,1,1,1,4,1,3,4,12,1,null,null,8,null,2,null,null,null,null,null,null,null,null,null,null,1,1,4,2,2,2,2,2,1,null,null,null,null,6,null,null,null,null,null,null,null,null,null,4,4,4,1,3,null,1,null,null,2,2,null,null,null,2,null,null,2,null,4,null,null,null,2,null,2,null,null,2,null,2,null,null,null,null,null,null,null,1,4,null,2,null,null,null,null,null,null,null,null,null,null,null,1,null,null,1,null,null,null,null,null,null,null,2,2,null,1,4,1,1,4,4,2,2,1,null,null,null,null,null,4,2,2,3,4,1,6,4,4,null,1,2,12,12,8,8,3,8,8,2,null,4,null,null,2,1,null,2,null,null,null,null,null,null,1,1,1,null,null,null,null,null,null,null,null,8,2,null,null,null,null,null,null,null,1,1,6,2,null,3,3,1,null,null,1,2,1,null,null,null,6,2,2,null,4,12,null,null,null,null,null,2,4,2,1,null,null,null,1,2,1,1,3,1,2,2,3,1,1,1,1,1,1,1,6,1,1,1,null,null,null,4,1,3,2,5,null,6,6,null,1,1,2,null,null,null,null,null,null,null,null,2,2,3,4,2,7,2,2,2,2,4,4,2,3,4,null,null,1,2,2,null,2,null,null,null,null,null,null,null,2,1,null,null,null,null,null,null,null,null,null,1,5,null,3,3,null,1,4,6,null,null,null,4,null,4,4,1,2,null,2,1,1,null,null,null,null,null,null,2,null,8,3,2,3,2,3,2,2,3,2,4,null,null,2,2,16,1,4,null,null,null,4,null,null,2,null,2,null,2,2,null,2,null,1,null,2,null,2,8,null,2,null,4,5,null,8,6,null,8,2,null,1,1,1,2,2,8,1,6,null,2,1,1,6,null,4,4,6,null,1,6,1,3,2,10,3,5,3,18,4,4,4,1,1,1,2,null,null,2,2,1,1,null,3,2,2,2,2,1,1,null,null,null,null,1,null,1,2,1,1,1,2,2,3,4,2,1,2,2,1,null,8,8,4,8,8,8,null,null,null,null,null,null,null,null,5,2,2,3,2,2,4,3,null,null,null,null,null,null,null,1,2,1,1,4,2,null,null,null,2,null,null,null,null,null,null,3,3,6,2,1,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,1,2,1,null,12,3,4,2,3,null,null,null,null,2,null,1,2,null,1,null,2,null,4,1,3,1,1,1,2,1,1,1,1,3,6,null,8,1,1,1,null,3,null,null,2,null,1,null,null,2,2,4,2,16,null,null,2,4,null,null,null,null,null,null,null,null,null,2,9,4,1,null,4,1,null,2,1,2,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,4,4,6,4,2,null,4,1,2,8,4,2,null,2,3,2,null,12,2,5,2,2,2,1,2,2,2,null,null,null,null,1,2,1,1,2,1,2,null,null,4,null,null,null,2,2,2,2,1,null,null,4,null,6,4,4,1,1,2,null,null,null,1,2,2,2,8,null,2,8,6,2,null,2,2,2,6,2,2,1,1,1,2,2,1,1,2,null,2,null,null,1,1,1,4,2,2,2,8,2,3,2,1,1,null,null,1,1,1,2,4,null,null,null,null,null,null,null,2,null,2,4,2,2,null,2,1,1,null,null,null,null,null,null,null,2,3,3,2,null,null,null,null,null,3,2,2,2,4,null,null,2,null,1,2,null,9,null,null,null,null,9,null,null,null]},"Dam2":{"dict":["7","8","3","5","20","15","2D6 Heat","2","10","1","12","6","9","4"],"values":[null,null,null,null,null,null,0,1,2,3,3,4,5,null,null,null,null,null,null,null,null,0,2,3,6,null,null,null,null,null,null,null,null,null,null,null,null,null,0,null,7,7,null,3,0,3,8,8,3,3,7,7,3,null,3,null,7,7,null,null,null,3,null,null,7,3,3,2,0,null,4,null,8,null,null,7,null,6,2,8,null,7,null,7,null,null,3,1,3,7,3,null,7,7,7,2,null,3,null,null,null,null,7,7,7,7,8,8,7,7,3,7,7,3,3,null,7,null,null,1,3,3,7,3,1,3,7,3,null,null,3,3,7,8,7,7,7,3,1,1,3,7,8,5,5,8,5,8,4,3,7,3,2,2,9,7,7,null,7,7,null,null,null,null,null,null,2,10,0,0,5,8,3,7,8,7,3,3,3,3,3,7,7,3,1,0,8,null,null,null,null,null,null,3,3,7,7,3,8,11,null,7,null,3,3,1,1,null,null,null,null,null,null,null,null,null,2,null,null,null,null,7,3,3,7,8,null,7,null,null,null,null,7,4,null,null,4,4,3,null,null,4,null,7,7,8,7,3,7,3,5,null,11,3,1,4,7,7,8,5,3,null,3,3,3,9,7,7,null,7,7,7,3,7,12,7,7,7,7,null,null,null,null,7,0,7,null,3,8,7,3,2,7,3,0,8,7,5,3,3,3,3,null,null,null,null,null,null,null,null,null,null,7,2,2,7,13,3,0,3,3,0,null,3,5,5,5,5,null,null,null,null,null,null,8,1,3,3,3,null,3,3,3,7,7,7,3,2,7,null,8,null,3,null,9,null,1,3,3,8,3,3,12,12,7,1,3,7,7,3,null,null,3,null,5,null,null,null,null,null,null,null,null,null,null,8,8,3,0,0,2,2,2,3,null,null,null,null,7,null,null,null,null,null,null,null,null,null,7,7,7,2,7,null,7,null,null,3,3,null,null,null,7,null,null,7,null,3,null,null,null,7,null,7,null,null,7,null,7,null,null,null,null,null,null,null,3,7,null,0,null,null,null,null,null,null,null,null,null,null,null,1,null,null,2,null,null,null,null,null,null,null,3,3,null,3,7,7,7,7,2,3,3,8,null,null,null,null,null,7,7,7,7,7,2,3,7,7,null,11,7,7,7,3,3,3,3,3,3,null,8,null,null,3,3,null,8,null,null,null,null,null,null,3,3,3,null,null,null,null,null,null,null,null,3,5,null,null,null,null,null,null,null,8,3,3,2,null,8,8,1,null,null,8,0,7,null,null,null,7,3,2,null,7,3,null,null,null,null,null,7,7,7,2,null,null,null,8,7,1,2,2,5,3,3,3,3,3,12,8,3,3,8,3,8,3,5,null,null,null,3,3,3,3,3,null,7,3,null,3,7,7,null,null,null,null,null,null,null,null,3,3,7,7,7,7,7,3,3,3,7,7,7,7,7,null,null,3,3,3,null,8,null,null,null,null,null,null,null,7,8,null,null,null,null,null,null,null,null,null,1,3,null,7,7,null,1,3,3,null,null,null,7,null,7,7,1,9,null,9,5,3,null,null,null,null,null,null,0,null,3,11,3,3,3,3,3,3,3,3,2,null,null,8,3,7,8,3,null,null,null,7,null,null,11,null,3,null,2,3,null,3,null,3,null,8,null,7,3,null,7,null,3,7,null,3,3,null,3,8,null,3,3,8,3,8,7,11,7,null,3,3,3,7,null,7,7,7,null,8,7,8,7,3,7,3,3,6,7,7,7,3,3,3,3,7,null,null,7,7,8,8,null,7,3,3,7,7,8,4,null,null,null,null,3,null,3,11,3,3,3,3,3,7,7,3,8,7,3,8,null,7,7,9,7,7,7,null,null,null,null,null,null,null,null,3,7,3,7,7,11,2,3,null,null,null,null,null,null,null,3,3,4,4,7,7,null,null,null,2,null,null,null,null,null,null,7,3,7,7,3,3,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,7,null,3,3,3,null,3,3,3,3,3,null,null,null,null,7,null,3,8,null,3,null,3,null,2,3,7,3,3,3,7,3,7,7,7,3,7,null,7,8,7,3,null,7,null,null,2,null,2,null,null,3,3,9,0,7,null,null,8,7,null,null,null,null,null,null,null,null,null,3,7,9,7,null,9,5,null,2,0,7,8,null,null,null,null,null,null,null,null,null,null,null,null,null,null,7,7,3,7,3,null,7,9,3,7,7,3,null,7,3,7,null,7,3,3,3,3,3,3,7,2,7,null,null,null,null,3,3,3,3,9,9,8,null,null,7,null,null,null,7,7,2,2,8,null,null,7,null,7,7,7,8,3,3,null,null,null,2,1,1,1,7,null,3,7,7,9,null,3,3,3,7,3,3,3,5,8,7,8,8,3,3,null,3,null,null,3,10,5,1,8,3,4,7,3,7,7,4,5,null,null,7,3,3,7,7,null,null,null,null,null,null,null,3,null,3,3,3,3,null,12,7,9,null,null,null,null,null,null,null,7,3,3,3,null,null,null,null,null,3,3,9,0,7,null,null,12,null,8,3,null,7,null,null,null,null,7,null,null,null]},"Range2":{"dict":["4/8/12","7/14/19","2/4/5","7/14/21","3/8/15","1/2/8","7/15/22","3/6/9","6/12/18","2/5/9","5/10/15","6/14/20","8/15/25","1/2/3","2/4/6","10/20/30","8/17/25","3/14/21","8/16/24","3/7/10","6/13/20","7/14/23","5/9/14","4/9/14","12/22/38","9/13/15","4/9/15","9/18/27","6/12/20","8/15/24","4/8/15"],"values":[null,null,null,null,null,null,0,1,2,3,4,5,6,null,null,null,null,null,null,null,null,0,7,3,8,null,null,null,null,null,null,null,null,null,null,null,null,null,9,null,7,7,null,3,10,7,11,12,3,3,13,7,14,null,14,null,7,7,null,null,null,7,null,null,7,7,10,13,10,null,5,null,12,null,null,15,null,8,13,7,null,13,null,7,null,null,3,10,7,7,8,null,13,7,7,7,null,7,null,null,null,null,13,7,7,13,8,8,13,13,8,7,13,3,3,null,13,null,null,16,17,10,13,10,16,10,7,17,null,null,3,3,7,8,7,7,7,17,10,1,3,7,10,8,6,8,8,8,7,17,15,17,13,7,14,7,13,null,7,7,null,null,null,null,null,null,13,10,10,0,6,8,0,8,8,7,7,7,0,7,7,7,7,17,1,10,12,null,null,null,null,null,null,3,8,18,13,7,10,7,null,7,null,7,3,1,19,null,null,null,null,null,null,null,null,null,2,null,null,null,null,13,10,8,13,10,null,7,null,null,null,null,13,5,null,null,0,7,7,null,null,0,null,13,7,8,13,0,7,7,6,null,14,7,10,20,7,13,21,6,3,null,8,10,10,14,7,7,null,13,13,13,17,13,19,13,13,7,15,null,null,null,null,13,22,7,null,3,8,7,18,7,7,14,10,7,7,6,7,17,10,0,null,null,null,null,null,null,null,null,null,null,7,13,13,13,14,7,0,17,7,0,null,10,6,6,6,6,null,null,null,null,null,null,10,10,7,7,7,null,23,8,0,13,13,13,10,2,13,null,12,null,17,null,14,null,1,3,3,10,3,0,10,19,7,10,3,7,7,17,null,null,3,null,6,null,null,null,null,null,null,null,null,null,null,21,21,3,10,10,7,7,7,10,null,null,null,null,7,null,null,null,null,null,null,null,null,null,7,7,7,13,7,null,13,null,null,0,0,null,null,null,13,null,null,13,null,24,null,null,null,13,null,13,null,null,13,null,13,null,null,null,null,null,null,null,14,7,null,10,null,null,null,null,null,null,null,null,null,null,null,25,null,null,13,null,null,null,null,null,null,null,3,3,null,3,13,13,13,13,7,3,3,8,null,null,null,null,null,7,13,13,7,7,13,10,7,13,null,7,13,7,7,3,3,3,3,3,0,null,8,null,null,10,3,null,8,null,null,null,null,null,null,3,3,3,null,null,null,null,null,null,null,null,10,6,null,null,null,null,null,null,null,8,7,10,7,null,11,11,10,null,null,12,10,13,null,null,null,7,0,2,null,7,26,null,null,null,null,null,13,13,13,2,null,null,null,10,13,25,2,2,6,8,7,0,3,24,19,8,3,17,8,10,21,3,8,null,null,null,10,8,4,17,4,null,7,3,null,8,13,13,null,null,null,null,null,null,null,null,0,0,7,7,13,13,13,3,3,3,7,7,13,13,7,null,null,17,3,3,null,8,null,null,null,null,null,null,null,27,12,null,null,null,null,null,null,null,null,null,1,17,null,13,13,null,10,3,18,null,null,null,7,null,7,7,1,14,null,14,6,8,null,null,null,null,null,null,0,null,7,14,3,3,0,3,17,0,7,3,7,null,null,7,10,7,11,18,null,null,null,7,null,null,14,null,3,null,13,17,null,17,null,10,null,8,null,18,3,null,27,null,8,18,null,20,24,null,3,8,null,3,3,8,7,8,7,14,7,null,17,0,17,7,null,7,7,7,null,0,7,0,18,8,27,3,3,8,8,7,7,24,3,17,8,7,null,null,7,13,28,28,null,13,3,3,13,13,8,5,null,null,null,null,3,null,3,14,3,3,3,3,0,7,7,7,21,13,10,8,null,7,13,14,13,7,7,null,null,null,null,null,null,null,null,3,13,7,13,7,14,13,0,null,null,null,null,null,null,null,3,7,20,20,7,7,null,null,null,13,null,null,null,null,null,null,7,10,7,7,17,17,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,7,null,17,7,7,null,10,10,17,7,8,null,null,null,null,13,null,8,8,null,8,null,3,null,13,8,7,8,8,10,8,3,13,13,13,4,8,null,7,8,13,29,null,7,null,null,7,null,2,null,null,17,3,14,10,7,null,null,8,27,null,null,null,null,null,null,null,null,null,7,7,14,13,null,14,6,null,13,10,13,10,null,null,null,null,null,null,null,null,null,null,null,null,null,null,7,7,10,7,3,null,7,14,3,7,7,14,null,13,3,13,null,7,17,8,0,0,0,3,13,7,13,null,null,null,null,0,7,0,7,14,14,8,null,null,13,null,null,null,13,13,2,2,10,null,null,7,null,7,7,7,28,3,17,null,null,null,2,10,10,10,7,null,0,7,7,14,null,7,3,7,7,7,7,8,6,10,7,8,8,3,7,null,20,null,null,10,10,6,10,8,3,7,7,17,7,13,0,6,null,null,18,8,3,7,7,null,null,null,null,null,null,null,7,null,0,3,17,8,null,10,13,14,null,null,null,null,null,null,null,13,7,7,0,null,null,null,null,null,7,0,14,10,7,null,null,30,null,8,17,null,7,null,null,null,null,7,null,null,null]},"WepName3":{"rows":[1,4,7,10,11,12,23,41,43,44,45,46,47,48,49,75,77,78,79,92,93,94,95,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,123,125,130,131,132,133,134,135,136,137,138,139,140,141,142,150,152,153,154,166,167,168,169,170,171,173,174,175,182,194,196,197,198,204,205,206,207,208,216,236,241,244,246,248,249,252,255,256,257,263,264,269,270,271,273,275,276,278,283,285,295,297,299,300,301,310,311,312,314,317,320,326,327,330,334,344,345,347,348,354,356,357,358,359,361,363,364,369,371,385,386,387,388,390,391,392,393,440,441,442,443,444,455,461,464,475,478,481,482,483,492,501,502,503,504,508,513,514,523,524,525,535,543,544,550,553,561,571,579,580,584,586,588,589,590,592,593,594,595,600,602,603,604,605,606,607,608,609,610,611,622,623,624,625,626,627,628,629,630,631,632,633,634,637,638,639,641,662,667,668,677,681,687,688,691,696,697,698,702,706,718,721,722,724,725,726,730,731,739,741,742,743,744,745,765,769,770,774,782,784,785,786,787,788,789,791,794,796,798,800,801,803,804,805,809,813,825,826,828,829,830,831,832,840,841,842,843,844,849,853,872,881,885,886,890,891,900,906,907,923,928,936,937,955,957,962,991,994,995,996,997,1001,1003,1014,1017,1025,1026,1027,1028,1029,1030,1031,1032,1034,1035,1043,1044,1045,1046,1059,1061,1062,1068,1072,1073,1075,1076,1077,1078,1079,1080,1081,1096,1098,1099,1100,1126,1127,1130,1134,1135,1136,1139,1140,1141],"dict":["LB 2-X AC (Pellet)","Medium Pulse Laser","PPC","ER Medium Laser","ER Large Laser","AP Gauss Rifle","Machine Gun","LRM 15","AC/20","-- OR --","Streak SRM 4","Medium Laser","Light PPC","Heavy PPC","'Mech Mortar 8","SRM 2","AC/10","Rocket Launcher 10","Flamer (Vehicle)","Streak SRM 6","SRM 6","Gauss Rifle","Ultra AC/10","Flamer","Magshot Gauss Rifle","Sniper Cannon","MML 3","Heavy Flamer","Large Laser","AC/2","Snub-Nose PPC","SRM 4","LRM 20","HAG/40","LB 10-X AC (Slug)","Large Pulse Laser","Large Chemical Laser","Streak LRM 15","Silver Bullet Gauss Rifle","Medium Chemical Laser","LB 5-X AC (Pellet)","Small Laser","LB 20-X AC (Pellet)","Thunderbolt 15","LRM 10","Rotary AC/5","Prototype Rocket Launcher 20","Rocket Launcher 20","Light Machine Gun","Arrow IV","LB 10-X AC (Pellet)","LB 2-X AC (Slug)","HAG/20","ER Small Laser","MML 9","Heavy Machine Gun","Machine Gun Array","MRM 40","Ultra AC/20","Enhanced LRM 10","Enhanced PPC","Prototype Rocket Launcher 15","Heavy Large Laser","LRM 5","Streak SRM 2","SRM 2 (I-OS)","MML 7","Enhanced LRM 15","LB 20-X AC (Slug)","Light AC/5","MML 5","Light Machine Gun Array","Thunderbolt 5","Bombast Laser"],"values":[0,0,1,2,3,1,4,3,3,5,6,7,7,8,8,9,5,3,10,11,12,13,14,15,16,17,18,19,20,21,15,17,4,22,23,24,19,25,26,27,20,20,15,15,15,28,29,30,31,31,9,32,10,9,21,33,34,35,10,36,37,38,9,7,9,21,6,11,11,6,11,9,7,39,40,40,6,9,9,3,1,3,21,21,3,41,41,7,7,15,4,35,28,36,35,9,35,34,5,6,3,3,6,42,42,43,23,44,20,45,45,40,6,46,47,3,3,48,6,3,45,49,44,20,6,24,50,21,34,1,32,49,7,49,48,50,50,50,50,50,42,51,15,6,15,34,52,9,6,53,53,54,54,54,48,48,31,31,10,55,9,6,44,53,3,56,57,58,34,20,44,44,2,9,20,59,60,61,20,11,20,50,62,4,50,6,16,34,15,6,63,63,63,64,64,64,6,6,63,15,6,6,10,31,9,50,15,7,30,65,40,64,7,3,66,67,42,68,63,69,40,50,9,50,9,50,9,16,3,9,6,70,9,1,1,21,50,64,64,20,20,9,38,42,1,1,1,11,11,32,32,6,9,71,11,11,11,32,32,11,32,8,6,72,72,6,11,42,50,50,41,41,3,41,9,6,31,9,35,31,48,42,48,29,44,6,3,53,54,64,10,49,16,31,50,50,1,50,22,6,6,19,69,1,50,64,11,29,9,9,73,9,8,8,58,2,58,9,30,42,0,12,69,32,50,50,9,40,40,40,40,40,40]},"Shots3":{"rows":[1,4,7,10,11,12,23,41,43,44,45,46,47,48,49,77,78,79,92,93,94,95,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,123,125,130,131,132,133,134,135,136,137,138,139,141,142,152,153,154,166,167,168,169,170,173,175,182,194,196,197,198,205,206,207,208,216,244,246,248,249,252,255,256,257,263,264,269,270,271,273,275,276,283,285,295,297,299,300,301,310,311,312,314,317,320,326,327,330,334,344,345,347,348,354,356,357,358,359,361,363,364,369,371,385,386,387,388,390,391,392,393,440,441,442,443,444,455,461,464,475,478,481,482,492,501,502,503,504,508,513,514,523,524,525,535,544,550,553,561,571,579,580,584,586,588,589,590,593,594,595,600,602,603,604,605,606,607,608,609,610,611,622,623,624,625,626,627,628,629,630,631,632,633,634,637,638,639,662,667,668,677,681,687,688,691,696,697,698,702,706,718,721,722,724,726,731,741,742,744,745,769,770,774,782,784,785,786,787,789,791,794,796,798,800,801,803,804,805,813,825,826,828,829,830,831,832,840,841,842,843,844,849,853,872,881,885,886,890,891,906,907,928,936,937,955,957,962,991,994,995,996,997,1001,1003,1014,1017,1025,1026,1027,1028,1029,1030,1031,1032,1034,1035,1043,1044,1045,1046,1059,1068,1073,1075,1076,1077,1078,1080,1081,1096,1098,1099,1100,1126,1127,1134,1135,1136,1139,1140,1141],"values":[10,8,2,1,2,2,1,2,2,2,4,4,4,1,1,2,1,3,3,2,1,2,8,2,3,6,12,8,1,8,6,1,2,1,3,8,1,1,1,8,8,2,8,2,1,2,1,6,6,3,6,2,6,1,1,6,1,2,10,2,1,1,2,3,2,3,2,3,5,5,2,2,2,2,1,1,2,3,1,2,2,4,1,1,1,1,1,1,1,2,3,2,2,3,40,20,2,1,1,4,6,6,10,4,5,5,1,1,4,2,2,6,1,1,4,1,2,10,1,1,2,5,1,4,1,4,20,20,20,20,20,20,1,2,4,4,1,2,2,1,1,2,2,5,4,8,3,3,3,2,3,1,1,1,1,5,2,1,4,1,1,1,4,1,1,4,8,4,8,10,1,1,10,2,1,1,2,3,2,2,2,4,4,4,2,3,2,4,3,2,3,3,20,4,4,1,2,20,2,2,2,2,2,20,1,1,1,10,20,20,20,1,2,2,1,2,2,1,10,4,4,8,8,10,20,2,2,2,2,2,5,5,4,1,2,2,2,5,5,2,5,1,4,1,1,3,4,20,10,10,4,2,1,4,2,3,2,6,2,20,4,1,1,3,2,1,2,4,6,1,1,3,10,10,2,10,2,1,1,4,1,2,20,8,2,1,1,1,1,2,1,2,1,20,4,2,2,5,20,20,5,5,5,5,5,5]},"Dam3":{"rows":[1,4,7,10,11,12,23,41,43,44,45,46,47,48,49,77,78,79,92,93,94,95,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,123,125,130,131,132,133,134,135,136,137,138,139,141,142,152,153,154,166,167,168,169,170,173,175,182,194,196,197,198,205,206,207,208,216,244,246,248,249,252,255,256,257,263,264,269,270,271,273,275,276,283,285,295,297,299,300,301,310,311,312,314,317,320,326,327,330,334,344,345,347,348,354,356,357,358,359,361,363,364,369,371,385,386,387,388,390,391,392,393,440,441,442,443,444,455,461,464,475,478,481,482,492,501,502,503,504,508,513,514,523,524,525,535,544,550,553,561,571,579,580,584,586,588,589,590,593,594,595,600,602,603,604,605,606,607,608,609,610,611,622,623,624,625,626,627,628,629,630,631,632,633,634,637,638,639,662,667,668,677,681,687,688,691,696,697,698,702,706,718,721,722,724,726,731,741,742,744,745,769,770,774,782,784,785,786,787,789,791,794,796,798,800,801,803,804,805,813,825,826,828,829,830,831,832,840,841,842,843,844,849,853,872,881,885,886,890,891,906,907,928,936,937,955,957,962,991,994,995,996,997,1001,1003,1014,1017,1025,1026,1027,1028,1029,1030,1031,1032,1034,1035,1043,1044,1045,1046,1059,1068,1073,1075,1076,1077,1078,1080,1081,1096,1098,1099,1100,1126,1127,1134,1135,1136,1139,1140,1141],"values":[1,1,6,10,5,6,10,7,7,3,2,5,5,20,20,3,7,2,5,5,15,8,2,10,5,2,2,2,15,2,5,8,10,2,2,2,10,5,4,2,2,2,2,2,8,2,8,2,2,5,2,15,5,10,10,2,8,5,1,5,15,2,5,5,2,5,5,5,1,1,2,5,6,5,15,15,5,3,3,5,5,2,8,9,8,8,10,10,10,3,2,5,7,2,1,1,15,2,5,2,5,5,1,2,5,5,5,5,1,2,5,5,20,5,2,2,2,1,15,10,7,5,20,5,20,1,1,1,1,1,1,1,2,2,2,2,10,5,2,3,3,5,5,5,1,1,2,2,2,3,2,5,5,5,2,5,20,10,2,5,5,10,2,5,12,5,2,5,2,1,16,10,1,2,10,10,2,2,5,5,5,2,2,2,2,2,5,2,2,2,2,2,1,2,5,8,2,1,2,5,5,5,5,1,20,5,5,1,1,1,1,10,5,2,5,6,6,15,1,2,2,2,2,1,1,6,6,6,5,5,5,5,2,1,5,5,5,5,5,5,5,20,2,5,5,2,5,1,1,1,3,3,5,3,2,2,10,2,1,1,1,2,5,2,5,3,5,2,2,20,10,2,1,1,6,1,10,2,2,2,5,6,1,2,5,2,12,20,20,20,10,20,8,1,1,5,5,5,1,1,1,1,1,1,1,1]},"Range3":{"rows":[1,4,7,10,11,12,23,41,43,44,45,46,47,48,49,77,78,79,92,93,94,95,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,123,125,130,131,132,133,134,135,136,137,138,139,141,142,152,153,154,166,167,168,169,170,173,175,182,194,196,197,198,205,206,207,208,216,244,246,248,249,252,255,256,257,263,264,269,270,271,273,275,276,283,285,295,297,299,300,301,310,311,312,314,317,320,326,327,330,334,344,345,347,348,354,356,357,358,359,361,363,364,369,371,385,386,387,388,390,391,392,393,440,441,442,443,444,455,461,464,475,478,481,482,492,501,502,503,504,508,513,514,523,524,525,535,544,550,553,561,571,579,580,584,586,588,589,590,593,594,595,600,602,603,604,605,606,607,608,609,610,611,622,623,624,625,626,627,628,629,630,631,632,633,634,637,638,639,662,667,668,677,681,687,688,691,696,697,698,702,706,718,721,722,724,726,731,741,742,744,745,769,770,774,782,784,785,786,787,789,791,794,796,798,800,801,803,804,805,813,825,826,828,829,830,831,832,840,841,842,843,844,849,853,872,881,885,886,890,891,906,907,928,936,937,955,957,962,991,994,995,996,997,1001,1003,1014,1017,1025,1026,1027,1028,1029,1030,1031,1032,1034,1035,1043,1044,1045,1046,1059,1068,1073,1075,1076,1077,1078,1080,1081,1096,1098,1099,1100,1126,1127,1134,1135,1136,1139,1140,1141],"dict":["9/18/27","10/20/30","2/4/6","6/12/18","4/8/12","8/15/25","5/10/15","3/6/9","1/2/3","7/14/21","7/15/22","7/14/19","3/14/21","2/3/4","8/16/24","9/13/15","6/14/20","3/7/10","3/7/12","1/2/8","1/2/9","2/4/5","3/8/15","7/14/23","4/9/15","8/15/24"],"values":[0,1,2,3,4,2,5,6,6,7,8,9,9,7,7,7,6,7,7,3,3,9,7,6,6,8,7,7,10,7,6,11,3,8,7,7,4,12,13,7,7,7,7,7,6,14,15,7,7,9,7,10,14,3,16,7,6,9,10,9,10,8,7,7,8,7,9,7,9,9,8,4,2,4,10,10,4,8,8,9,9,7,11,17,6,6,16,16,3,7,8,4,6,8,4,4,3,8,9,7,9,9,9,8,18,18,4,4,2,8,4,6,19,9,7,8,7,3,10,3,4,9,20,9,20,2,3,3,3,3,3,4,0,7,8,7,3,14,8,21,21,12,12,12,2,2,7,7,7,8,8,9,2,4,8,22,17,3,7,9,9,3,7,9,23,24,7,7,7,3,6,5,3,8,6,3,7,8,9,9,9,7,7,7,8,8,9,7,8,8,7,7,3,7,9,15,7,25,7,9,4,12,9,4,4,9,6,9,3,3,3,6,4,8,12,2,2,10,3,7,7,7,7,10,4,2,2,2,7,7,9,9,8,2,7,7,7,9,9,7,9,7,8,3,3,8,7,4,3,3,8,8,4,8,8,7,16,7,2,4,2,14,9,8,4,21,12,7,7,19,6,7,3,3,2,3,3,8,8,7,6,2,3,7,7,14,6,7,7,17,3,17,15,4,0,3,6,9,3,3,25,25,25,25,25,25]},"WepName4":{"rows":[12,43,75,78,102,104,105,107,108,109,111,113,130,131,140,150,154,166,168,171,173,174,175,204,207,208,236,241,256,257,263,264,269,270,271,275,278,285,297,311,334,354,361,385,386,440,441,442,443,444,461,481,482,483,501,502,523,524,543,544,553,584,586,588,590,592,594,600,602,603,604,605,606,607,608,611,622,623,624,626,630,631,633,634,638,639,641,662,691,706,721,724,725,730,731,739,743,765,782,784,785,786,788,803,804,805,809,813,826,828,831,881,885,900,906,923,936,955,962,991,1026,1027,1029,1034,1035,1043,1044,1046,1061,1062,1072,1073,1075,1076,1077,1078,1079,1080,1081,1096,1126,1127,1130,1134,1135,1136,1139,1140,1141],"dict":["Streak SRM 4","Machine Gun","LB 2-X AC (Pellet)","Light Machine Gun","SRM 6","Magshot Gauss Rifle","MRM 10","Rocket Launcher 10","LB 10-X AC (Slug)","Gauss Rifle","ER Large Laser","SRM 2","LB 5-X AC (Pellet)","-- OR --","Flamer (Vehicle)","LB 10-X AC (Pellet)","Silver Bullet Gauss Rifle","LB 20-X AC (Pellet)","AC/20","ER Medium Laser","Medium Laser","Large Laser","Streak SRM 2","ER Small Laser","Machine Gun Array","Rocket Launcher 15","MML 7","ATM 12","LRM 20","Medium Pulse Laser","Heavy Large Laser","MML 5","Ultra AC/10","PPC","Streak SRM 6","LRM 15","Light Gauss Rifle","AC/5","Plasma Rifle","SRM 4","AC/2","Ultra AC/5","SRM 2 (I-OS)","ER PPC","Light PPC","Light AC/5","AC/10","LRM 10","ATM 6"],"values":[0,1,2,3,4,5,4,6,7,8,9,10,11,11,12,2,13,14,0,15,0,15,16,12,1,1,17,17,18,19,20,20,21,11,22,23,2,13,24,8,11,25,4,26,13,27,28,29,19,30,13,13,9,15,4,1,1,1,15,31,32,13,33,4,0,15,34,21,0,1,0,35,9,9,35,13,1,4,22,22,34,24,4,4,36,37,15,38,39,13,19,40,15,2,41,15,15,12,1,1,1,42,15,33,43,24,15,1,28,28,28,44,6,15,39,12,8,3,18,19,4,4,34,45,19,4,0,4,15,12,15,22,1,0,46,4,17,39,39,19,39,39,15,47,47,48,47,47,48]},"Shots4":{"rows":[12,43,75,78,102,104,105,107,108,109,111,113,130,131,140,150,166,168,171,173,174,175,204,207,208,236,241,256,257,263,264,269,270,271,275,278,297,311,334,354,361,385,440,441,442,443,444,482,483,501,502,523,524,543,544,553,586,588,590,592,594,600,602,603,604,605,606,607,608,622,623,624,626,630,631,633,634,638,639,641,662,691,721,724,725,730,731,739,743,765,782,784,785,786,788,803,804,805,809,813,826,828,831,881,885,900,906,923,936,955,962,991,1026,1027,1029,1034,1035,1043,1044,1046,1061,1062,1072,1073,1075,1076,1077,1078,1079,1080,1081,1096,1126,1127,1130,1134,1135,1136,1139,1140,1141],"values":[3,2,2,4,8,2,8,3,6,2,1,1,2,2,10,2,1,6,10,3,10,10,5,2,2,40,20,2,2,4,4,1,2,4,4,2,1,1,2,4,4,1,6,8,3,3,1,1,10,12,1,1,1,10,2,2,1,4,3,10,4,1,6,4,6,6,1,1,6,3,4,4,4,4,1,4,4,1,1,20,1,3,1,2,20,4,4,20,10,15,2,2,2,4,10,1,1,2,10,4,5,5,5,1,3,20,3,5,1,4,1,1,4,4,4,1,1,4,6,4,10,5,20,8,1,6,1,4,20,3,3,2,3,3,10,1,1,2,1,1,2]},"Dam4":{"rows":[12,43,75,78,102,104,105,107,108,109,111,113,130,131,140,150,166,168,171,173,174,175,204,207,208,236,241,256,257,263,264,269,270,271,275,278,297,311,334,354,361,385,440,441,442,443,444,482,483,501,502,523,524,543,544,553,586,588,590,592,594,600,602,603,604,605,606,607,608,622,623,624,626,630,631,633,634,638,639,641,662,691,721,724,725,730,731,739,743,765,782,784,785,786,788,803,804,805,809,813,826,828,831,881,885,900,906,923,936,955,962,991,1026,1027,1029,1034,1035,1043,1044,1046,1061,1062,1072,1073,1075,1076,1077,1078,1079,1080,1081,1096,1126,1127,1130,1134,1135,1136,1139,1140,1141],"values":[2,2,1,1,2,2,2,5,5,10,15,10,2,2,1,1,2,2,1,2,1,1,1,2,2,1,1,20,5,5,5,8,2,2,5,1,2,10,2,5,2,5,5,5,7,7,16,15,1,2,2,2,2,1,5,10,10,2,2,1,2,8,2,2,2,5,15,15,5,2,2,2,2,2,2,2,2,8,5,1,10,2,5,2,1,1,5,1,1,1,2,2,2,2,1,10,10,2,1,2,5,5,5,5,5,1,2,1,10,1,20,7,2,2,2,5,5,2,2,2,1,1,1,2,2,2,10,2,1,2,2,5,2,2,1,5,5,5,5,5,5]},"Range4":{"rows":[12,43,75,78,102,104,105,107,108,109,111,113,130,131,140,150,166,168,171,173,174,175,204,207,208,236,241,256,257,263,264,269,270,271,275,278,297,311,334,354,361,385,440,441,442,443,444,482,483,501,502,523,524,543,544,553,586,588,590,592,594,600,602,603,604,605,606,607,608,622,623,624,626,630,631,633,634,638,639,641,662,691,721,724,725,730,731,739,743,765,782,784,785,786,788,803,804,805,809,813,826,828,831,881,885,900,906,923,936,955,962,991,1026,1027,1029,1034,1035,1043,1044,1046,1061,1062,1072,1073,1075,1076,1077,1078,1079,1080,1081,1096,1126,1127,1130,1134,1135,1136,1139,1140,1141],"dict":["3/6/9","1/2/3","10/20/30","2/4/6","3/8/15","5/10/15","6/12/18","7/15/22","8/15/25","7/14/21","4/8/12","4/9/15","3/14/21","8/17/25","8/16/24","9/18/27","6/13/20","7/14/23","8/15/24"],"values":[0,1,2,3,0,0,0,4,5,6,7,8,0,0,9,2,1,0,6,0,6,7,9,1,1,10,10,0,10,0,0,5,0,0,3,2,1,6,0,11,0,12,5,9,10,5,5,7,6,0,1,1,1,6,12,6,6,0,0,6,0,5,0,1,0,9,7,7,9,1,0,0,0,0,1,0,0,13,6,6,5,0,10,14,6,15,16,6,6,9,1,1,1,0,6,6,17,1,6,1,9,9,9,6,4,6,0,18,6,3,0,5,0,0,0,5,10,0,0,0,6,9,6,0,1,0,5,0,10,0,0,10,0,0,6,9,9,5,9,9,5]},"WepName5":{"rows":[78,102,104,105,109,140,150,154,166,171,173,174,204,207,208,236,241,257,263,264,285,311,386,440,442,443,444,461,481,483,543,584,592,602,604,605,606,607,608,611,631,691,706,725,739,743,788,805,813,936,955,1026,1027,1029,1061,1072,1075,1076,1077,1078,1079,1080,1081,1130],"dict":["Light Machine Gun Array","AC/10","Gauss Rifle","-- OR --","SRM 4","LRM 5","LB 10-X AC (Pellet)","Streak SRM 4","LRM 10","ER Medium Laser","MML 7","LRM 15","Medium Pulse Laser","Machine Gun","Light Machine Gun","Heavy Medium Laser","HAG/20","Large Chemical Laser","LB 2-X AC (Pellet)","Ultra AC/10","Streak SRM 6","AP Gauss Rifle","SRM 6","LB 20-X AC (Pellet)","AC/2","Ultra AC/5","Medium Laser","Heavy PPC","Machine Gun Array","Small Pulse Laser","SRM 2","Streak SRM 2"],"values":[0,1,2,1,3,4,5,6,7,8,9,10,11,11,11,12,13,14,13,13,6,3,6,15,16,17,7,18,6,19,9,6,20,13,13,20,13,21,20,6,20,22,23,24,25,5,26,27,28,3,0,12,12,29,30,31,4,14,13,26,22,13,12,14]},"Shots5":{"rows":[78,102,104,105,140,150,154,166,171,173,174,204,207,208,236,241,257,263,264,285,386,440,442,443,444,461,481,483,543,584,592,602,604,605,606,607,608,611,631,691,706,725,739,743,788,805,813,955,1026,1027,1029,1061,1072,1075,1076,1077,1078,1079,1080,1081,1130],"values":[1,2,2,2,6,1,10,6,1,2,1,2,2,2,2,2,2,2,2,10,10,1,2,2,9,2,10,2,1,10,4,4,4,8,2,2,8,10,4,4,20,2,2,1,1,1,1,1,2,2,1,2,8,3,1,1,2,8,1,1,4]},"Dam5":{"rows":[78,102,104,105,140,150,154,166,171,173,174,204,207,208,236,241,257,263,264,285,386,440,442,443,444,461,481,483,543,584,592,602,604,605,606,607,608,611,631,691,706,725,739,743,788,805,813,955,1026,1027,1029,1061,1072,1075,1076,1077,1078,1079,1080,1081,1130],"values":[1,10,15,10,2,5,1,2,5,5,5,5,5,5,7,2,1,2,2,1,1,10,5,8,2,1,1,10,5,1,2,2,2,2,2,3,2,1,2,2,1,2,5,5,5,15,2,1,6,6,3,2,2,2,1,2,5,2,2,6,1]},"Range5":{"rows":[78,102,104,105,140,150,154,166,171,173,174,204,207,208,236,241,257,263,264,285,386,440,442,443,444,461,481,483,543,584,592,602,604,605,606,607,608,611,631,691,706,725,739,743,788,805,813,955,1026,1027,1029,1061,1072,1075,1076,1077,1078,1079,1080,1081,1130],"dict":["2/4/6","5/10/15","7/15/22","3/6/9","7/14/21","6/12/18","4/8/12","3/14/21","1/2/3","8/16/24","9/18/27","6/13/20"],"values":[0,1,2,1,3,4,5,3,4,6,7,4,4,4,6,8,0,8,8,5,5,3,9,1,3,10,5,5,6,5,3,8,8,3,8,3,3,5,3,3,6,9,11,4,3,5,8,0,0,0,8,3,3,3,0,8,3,3,8,0,0]},"WepName6":{"rows":[104,109,171,174,285,311,386,481,584,605,608,936,1029,1072,1079,1130],"values":["Streak SRM 6","LB 10-X AC (Pellet)","Medium Pulse Laser","SRM 4","Plasma Cannon","LB 10-X AC (Pellet)","MML 7","Ultra AC/10","BattleMech Taser","ER Large Laser","ER Large Laser","LB 10-X AC (Pellet)","Medium Pulse Laser","Small Pulse Laser","SRM 4 (I-OS)","Light Machine Gun Array"]},"Shots6":{"rows":[104,109,171,174,285,311,386,481,584,605,608,936,1029,1072,1079,1130],"values":[8,20,2,3,1,10,1,2,1,1,1,10,2,1,3,1]},"Dam6":{"rows":[104,109,171,174,285,311,386,481,584,605,608,936,1029,1072,1079,1130],"dict":["2","1","6","2D6 Heat","5","10","3"],"values":[0,1,2,0,3,1,4,5,1,5,5,1,2,6,0,1]},"Range6":{"rows":[104,109,171,174,285,311,386,481,584,605,608,936,1029,1072,1079,1130],"dict":["3/6/9","6/12/18","2/4/6","3/14/21","1/2/4","8/15/25","1/2/3"],"values":[0,1,2,0,1,1,3,1,4,5,5,1,2,6,0,2]},"WepName7":{"rows":[109,171,174,605,608,1079],"values":["SRM 6","Streak SRM 2","Streak SRM 2","Gauss Rifle","Gauss Rifle","Machine Gun"]},"Shots7":{"rows":[109,171,174,605,608,1079],"values":[8,4,4,1,1,1]},"Dam7":{"rows":[109,171,174,605,608,1079],"values":[2,2,2,15,15,2]},"Range7":{"rows":[109,171,174,605,608,1079],"dict":["3/6/9","7/15/22","1/2/3"],"values":[0,0,0,1,1,2]},"CombDam1":{"dict":["5x2","1x8","4x2","5x1","1x20","1x5","18x5","1x10","16x2","3x1","2x10","3x10","3x20","3x15","2x15","2x3","4x5","1x7","3x2","2x2","1x2","2x20","2x7","4x8","1x3","3x5","4x3","8x2","6x2","2x5","9x3","3x7","1x9","6x3","1x1","6x5","1x15","5x5","4x1","6x1","2x8","1x22","3x3","12x2","3x6","4x20","4x10","2x1","2x22","2x2D6 Heat","4x7","8x5","1x6","10x5","7x5","2x4","20x2","1x2D6 Heat","2x6","14x5","5x3","3x8","8x8","24x2","12x5","2x9","10x1","6x10","8x3","40x2","36x2","27x2"],"values":[0,0,1,1,2,3,4,5,6,7,8,9,10,11,12,11,12,13,14,15,16,17,17,5,16,5,18,null,19,19,5,18,19,20,5,2,19,19,4,21,22,19,1,14,null,23,24,24,19,19,25,17,5,2,5,26,7,17,27,28,29,15,30,5,5,19,17,25,16,25,29,19,2,25,31,22,29,19,26,17,27,32,7,19,27,29,5,5,33,5,34,null,2,5,5,2,null,24,null,20,null,null,25,25,29,25,29,29,35,25,36,37,38,39,7,5,28,2,null,20,20,19,5,19,20,20,20,19,null,null,40,36,37,40,10,20,19,20,20,24,19,20,24,41,36,5,18,2,29,5,15,42,22,22,22,2,25,19,5,2,5,18,5,43,null,19,9,9,9,9,2,36,14,36,1,36,4,4,4,4,4,1,1,1,19,2,29,5,5,5,5,20,20,20,20,19,19,20,20,5,44,16,16,10,19,19,20,5,5,19,19,19,2,15,null,15,25,1,25,7,1,1,29,19,1,25,29,4,20,20,20,20,19,29,18,45,28,18,14,21,46,21,null,37,21,41,47,2,36,2,16,10,28,41,19,38,20,48,19,19,29,5,5,19,19,5,7,10,7,5,5,29,29,43,27,5,37,29,22,16,null,4,18,43,27,15,7,22,28,36,22,49,50,21,3,35,36,7,27,36,null,36,20,null,null,null,5,null,51,19,21,4,20,5,5,5,5,1,18,1,5,19,36,7,5,5,29,5,36,36,29,5,15,25,5,29,15,52,5,1,29,29,19,5,35,35,19,5,15,47,29,15,29,7,5,null,29,35,29,25,1,19,20,19,1,20,20,0,20,5,31,7,14,21,4,null,4,16,null,12,7,null,5,4,21,19,18,40,18,3,22,22,22,10,29,27,28,28,20,29,27,2,25,5,25,29,27,29,1,7,32,7,7,1,35,1,36,27,29,20,null,19,5,2,5,18,53,16,54,51,19,5,2,18,7,19,5,2,18,55,10,10,10,10,10,22,29,22,29,15,22,4,7,21,16,4,16,4,35,56,null,47,19,null,5,1,29,null,25,21,16,5,1,32,25,29,29,2,19,36,57,22,22,5,20,20,20,null,18,5,24,5,5,5,25,5,5,5,29,2,21,20,43,5,5,53,19,19,19,51,19,28,5,7,7,19,7,41,5,17,5,1,57,5,5,1,28,null,19,4,null,null,29,19,53,29,19,19,null,5,19,15,19,29,7,29,2,22,5,5,2,29,29,18,15,28,51,56,37,58,59,59,59,58,52,51,51,51,51,18,25,25,1,1,19,19,5,38,1,47,29,36,19,5,24,35,5,5,19,19,19,36,52,29,5,2,25,60,null,1,4,26,36,36,36,7,54,null,7,27,2,2,19,null,15,null,null,19,19,20,2,2,29,29,2,2,2,2,2,2,29,29,29,29,18,5,19,29,19,19,5,9,58,52,27,58,58,null,20,22,24,5,1,5,5,1,5,2,2,2,40,1,10,7,5,18,7,10,2,11,61,null,35,35,28,7,39,39,7,29,10,14,5,5,20,5,32,16,5,15,29,16,62,53,61,37,40,16,1,51,36,37,4,37,7,57,17,7,null,2,2,29,19,36,4,37,15,27,4,58,29,9,29,19,10,19,10,16,19,63,64,10,19,19,16,19,19,23,19,19,65,24,66,5,10,52,5,27,58,43,52,25,52,5,null,58,58,19,null,20,29,20,2,2,5,2,2,2,24,16,4,29,25,29,20,27,27,27,28,7,2,2,7,1,21,4,36,36,24,15,5,4,41,4,19,5,19,5,19,19,19,19,5,29,29,25,16,24,16,15,19,29,26,15,26,15,15,35,36,66,4,35,36,35,1,5,2,37,2,16,5,2,5,29,29,24,5,19,52,15,24,36,29,29,36,1,27,29,53,18,4,4,null,4,21,1,1,1,5,25,29,5,5,null,5,15,20,29,5,20,35,1,7,1,5,5,19,22,null,44,null,7,36,1,7,53,51,23,29,16,14,21,27,67,61,35,11,11,11,10,7,11,2,28,2,28,24,26,5,20,20,20,20,5,29,29,29,20,20,32,20,20,29,19,5,19,27,2,27,17,18,null,29,47,20,54,68,29,19,29,19,22,19,24,5,null,19,18,5,5,5,19,19,21,29,4,21,17,15,4,21,15,20,null,43,29,null,null,null,null,5,null,69,70,70,71,69,5,5,2,29,5,29,5,29,29,5,29,19,19,37,41,37,null,25,25,4,25,29,29,58,29,29,29,null,null,null,null,19,20,25,19,58,21,47,15,29,37,null,22,19,2,2,19,19,19,7,7,null,7,20,7,19,29,9,9,19,5,5,58,19,20,19,4,10,64,4,7,29,4,19,19,24,5,24,24,20,5,20,20,24,20,20,20,1,20,35,29,19,19,19,16,5,24,2,20,24,20,25,20,20,4,19,18,20,18,19,5,28,20,5,5,5,5,5,19,19,19,2,2,28,16,16,19,36,1,29,36,36,4,7,35,5,2,19,29,25,20,null,5,25,2,2,22,47,10,10,10,5,2,29,1,36,16,5,5,5,null,16,5,5,5]},"CombDam2":{"dict":["4x7","1x8","1x3","6x5","5x5","1x20","1x15","1x7","2x5","1x2D6 Heat","2x7","4x2","1x5","1x10","6x2","2x2","3x2","3x5","2x20","1x2","4x3","8x2","4x10","8x5","12x2","3x10","2x15","4x20","2x3","2x1","1x12","2x6","7x5","3x15","10x5","12x5","1x9","2x10","3x1","6x3","1x4","1x1","4x5","1x6","3x3","7x2","5x1","3x6","16x2","5x2","10x2","3x2D6 Heat","18x2","4x1","9x2","2x8","4x8","2x9"],"values":[null,null,null,null,null,null,0,1,2,3,4,5,6,null,null,null,null,null,null,null,null,7,2,8,9,null,null,null,null,null,null,null,null,null,null,null,null,null,10,null,11,11,null,12,10,8,13,13,12,12,14,15,12,null,12,null,15,16,null,null,null,17,null,null,15,17,17,2,7,null,18,null,13,null,null,19,null,9,2,13,null,19,null,14,null,null,12,1,8,15,8,null,19,11,11,20,null,12,null,null,null,null,11,21,21,11,22,22,15,11,23,14,15,12,8,null,15,null,null,1,8,12,15,3,1,8,24,8,null,null,17,17,21,13,21,14,14,8,1,1,8,14,13,6,6,25,26,25,27,8,19,12,28,20,29,14,16,null,15,21,null,null,null,null,null,null,28,30,10,0,6,13,12,14,13,11,8,8,8,8,8,11,11,12,1,0,13,null,null,null,null,null,null,12,12,15,15,17,13,31,null,14,null,8,12,1,1,null,null,null,null,null,null,null,null,null,28,null,null,null,null,11,32,8,11,13,null,11,null,null,null,null,19,18,null,null,18,18,8,null,null,5,null,15,11,22,15,8,11,8,6,null,31,8,1,18,11,19,25,33,34,null,12,35,35,29,11,11,null,15,19,15,12,15,36,15,15,14,19,null,null,null,null,15,10,24,null,4,37,11,38,39,16,4,10,13,24,6,12,8,4,8,null,null,null,null,null,null,null,null,null,null,11,28,2,15,40,12,10,12,17,10,null,3,6,6,6,6,null,null,null,null,null,null,13,1,12,8,8,null,12,12,12,15,15,15,12,28,15,null,13,null,12,null,41,null,1,42,42,13,42,12,36,36,11,1,17,11,24,12,null,null,23,null,26,null,null,null,null,null,null,null,null,null,null,13,13,42,10,10,28,28,28,12,null,null,null,null,14,null,null,null,null,null,null,null,null,null,11,11,11,2,16,null,19,null,null,8,8,null,null,null,15,null,null,15,null,42,null,null,null,15,null,15,null,null,15,null,15,null,null,null,null,null,null,null,12,11,null,10,null,null,null,null,null,null,null,null,null,null,null,1,null,null,2,null,null,null,null,null,null,null,8,8,null,12,11,19,19,11,20,8,8,13,null,null,null,null,null,11,15,15,16,11,2,3,11,11,null,43,15,24,24,23,23,17,23,23,8,null,22,null,null,8,12,null,37,null,null,null,null,null,null,12,12,12,null,null,null,null,null,null,null,null,23,26,null,null,null,null,null,null,null,13,12,3,28,null,25,25,1,null,null,13,10,19,null,null,null,14,8,28,null,11,35,null,null,null,null,null,15,11,15,2,null,null,null,13,15,1,2,44,6,8,8,17,12,12,36,13,12,12,13,3,13,12,6,null,null,null,42,12,17,8,4,null,14,3,null,12,19,15,null,null,null,null,null,null,null,null,8,8,16,11,15,45,15,8,8,8,11,11,15,16,11,null,null,12,8,8,null,37,null,null,null,null,null,null,null,15,13,null,null,null,null,null,null,null,null,null,1,4,null,16,16,null,1,42,46,null,null,null,11,null,11,11,1,29,null,29,6,12,null,null,null,null,null,null,10,null,23,47,8,17,8,17,8,8,17,8,20,null,null,37,8,48,13,null,null,null,null,11,null,null,31,null,8,null,28,8,null,8,null,12,null,37,null,15,23,null,15,null,42,49,null,23,3,null,23,37,null,12,12,13,8,37,21,43,14,null,8,12,12,14,null,11,11,14,null,13,14,13,16,8,50,17,4,51,52,11,11,42,12,12,12,15,null,null,15,15,13,13,null,16,8,8,15,15,13,5,null,null,null,null,12,null,12,31,12,12,12,8,8,16,11,8,13,15,8,13,null,21,21,53,21,21,21,null,null,null,null,null,null,null,null,4,15,8,16,15,31,20,17,null,null,null,null,null,null,null,12,8,5,5,11,15,null,null,null,28,null,null,null,null,null,null,16,17,14,15,12,12,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,15,null,12,8,12,null,35,17,42,8,17,null,null,null,null,15,null,12,37,null,12,null,8,null,20,12,16,12,12,12,15,12,19,19,19,17,14,null,21,13,19,12,null,16,null,null,28,null,2,null,null,8,8,53,10,48,null,null,37,11,null,null,null,null,null,null,null,null,null,8,54,53,19,null,53,6,null,28,7,15,13,null,null,null,null,null,null,null,null,null,null,null,null,null,null,11,11,3,11,8,null,11,41,8,21,11,8,null,15,17,15,null,24,8,4,8,8,8,12,15,28,15,null,null,null,null,12,8,12,12,29,41,37,null,null,11,null,null,null,15,15,28,28,13,null,null,11,null,14,11,11,13,12,8,null,null,null,2,55,55,55,21,null,8,21,14,29,null,8,8,8,14,8,8,12,6,13,15,37,13,12,8,null,8,null,null,12,30,6,56,37,8,18,21,8,16,15,5,6,null,null,19,12,12,15,11,null,null,null,null,null,null,null,8,null,8,42,8,8,null,57,19,41,null,null,null,null,null,null,null,15,17,17,8,null,null,null,null,null,17,8,29,10,11,null,null,57,null,13,8,null,54,null,null,null,null,57,46,46,49]},"CombDam3":{"rows":[1,4,7,10,11,12,23,41,43,44,45,46,47,48,49,77,78,79,92,93,94,95,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,123,125,130,131,132,133,134,135,136,137,138,139,141,142,152,153,154,166,167,168,169,170,173,175,182,194,196,197,198,205,206,207,208,216,244,246,248,249,252,255,256,257,263,264,269,270,271,273,275,276,283,285,295,297,299,300,301,310,311,312,314,317,320,326,327,330,334,344,345,347,348,354,356,357,358,359,361,363,364,369,371,385,386,387,388,390,391,392,393,440,441,442,443,444,455,461,464,475,478,481,482,492,501,502,503,504,508,513,514,523,524,525,535,544,550,553,561,571,579,580,584,586,588,589,590,593,594,595,600,602,603,604,605,606,607,608,609,610,611,622,623,624,625,626,627,628,629,630,631,632,633,634,637,638,639,662,667,668,677,681,687,688,691,696,697,698,702,706,718,721,722,724,726,731,741,742,744,745,769,770,774,782,784,785,786,787,789,791,794,796,798,800,801,803,804,805,813,825,826,828,829,830,831,832,840,841,842,843,844,849,853,872,881,885,886,890,891,906,907,928,936,937,955,957,962,991,994,995,996,997,1001,1003,1014,1017,1025,1026,1027,1028,1029,1030,1031,1032,1034,1035,1043,1044,1045,1046,1059,1068,1073,1075,1076,1077,1078,1080,1081,1096,1098,1099,1100,1126,1127,1134,1135,1136,1139,1140,1141],"dict":["10x1","8x1","2x6","1x10","2x5","2x7","2x3","4x2","4x5","1x20","1x7","3x2","3x5","1x15","2x8","8x2","2x10","6x2","12x2","6x5","1x8","1x2","1x5","1x4","2x2","2x15","5x1","3x3","1x3","1x9","40x1","20x1","5x5","4x1","3x1","2x20","1x12","1x16","1x1","4x3","2x1"],"values":[0,1,2,3,4,2,3,5,5,6,7,8,8,9,9,6,10,11,12,4,13,14,15,16,12,17,18,15,13,15,19,20,16,21,11,15,3,22,23,15,15,24,15,24,20,24,20,17,17,12,17,25,26,3,3,17,20,4,0,4,13,21,4,12,24,12,4,12,26,26,24,4,2,4,13,13,4,27,28,4,4,7,20,29,20,20,3,3,3,6,11,4,5,11,30,31,25,21,22,7,19,19,0,7,32,32,22,22,33,24,4,19,9,22,7,21,24,0,13,3,5,32,9,8,9,33,31,31,31,31,31,31,21,24,7,7,3,34,24,28,28,4,4,32,33,1,11,11,11,6,11,22,22,22,21,32,35,3,7,22,22,3,7,22,36,8,15,8,15,0,37,3,0,24,3,3,24,11,4,4,4,7,7,7,24,11,4,7,11,24,11,11,31,7,8,20,24,31,24,4,4,4,4,31,9,22,22,0,31,31,31,3,4,24,22,2,2,13,0,7,7,15,15,0,31,2,2,2,4,4,32,32,7,38,4,4,4,32,32,4,32,9,7,22,22,11,8,31,0,0,39,6,22,39,24,11,16,17,40,31,33,21,22,11,4,28,4,7,17,9,3,11,0,0,2,0,16,21,21,7,22,2,31,15,4,21,36,9,9,35,3,35,20,31,33,4,4,32,31,31,26,26,26,22,22,22]},"CombDam4":{"rows":[12,43,75,78,102,104,105,107,108,109,111,113,130,131,140,150,166,168,171,173,174,175,204,207,208,236,241,256,257,263,264,269,270,271,275,278,297,311,334,354,361,385,440,441,442,443,444,482,483,501,502,523,524,543,544,553,586,588,590,592,594,600,602,603,604,605,606,607,608,622,623,624,626,630,631,633,634,638,639,641,662,691,721,724,725,730,731,739,743,765,782,784,785,786,788,803,804,805,809,813,826,828,831,881,885,900,906,923,936,955,962,991,1026,1027,1029,1034,1035,1043,1044,1046,1061,1062,1072,1073,1075,1076,1077,1078,1079,1080,1081,1096,1126,1127,1130,1134,1135,1136,1139,1140,1141],"dict":["3x2","2x2","2x1","4x1","8x2","3x5","6x5","2x10","1x15","1x10","10x1","1x2","6x2","5x1","40x1","20x1","2x20","2x5","4x5","1x8","4x2","1x5","8x5","3x7","1x16","12x2","15x1","5x5","1x20","1x7"],"values":[0,1,2,3,4,1,4,5,6,7,8,9,1,1,10,2,11,12,10,0,10,10,13,1,1,14,15,16,17,18,18,19,1,20,18,2,11,9,1,18,20,21,6,22,23,23,24,8,10,25,11,11,11,10,17,7,9,20,0,10,20,19,12,20,12,6,8,8,6,0,20,20,20,20,11,20,20,19,21,15,9,0,21,1,15,3,18,15,10,26,1,1,1,20,10,9,9,1,10,20,27,27,27,21,5,15,0,13,9,3,28,29,20,20,20,21,21,20,12,20,10,13,15,4,11,12,9,20,15,0,0,17,0,0,10,21,21,17,21,21,21]},"CombDam5":{"rows":[78,102,104,105,140,150,154,166,171,173,174,204,207,208,236,241,257,263,264,285,386,440,442,443,444,461,481,483,543,584,592,602,604,605,606,607,608,611,631,691,706,725,739,743,788,805,813,955,1026,1027,1029,1061,1072,1075,1076,1077,1078,1079,1080,1081,1130],"dict":["1x1","2x10","2x15","6x2","1x5","10x1","2x5","2x7","2x2","2x1","1x10","3x1","2x8","9x2","4x2","8x2","2x3","20x1","1x15","1x2","2x6","1x3","3x2","1x6","4x1"],"values":[0,1,2,1,3,4,5,3,4,6,4,6,6,6,7,8,9,8,8,5,5,10,11,12,13,9,5,1,4,5,14,14,14,15,8,16,15,5,14,14,17,8,6,4,4,18,19,0,20,20,21,8,15,22,0,19,6,15,19,23,24]},"CombDam6":{"rows":[104,109,171,174,285,311,386,481,584,605,608,936,1029,1072,1079,1130],"values":["8x2","20x1","2x6","3x2","1x2D6 Heat","10x1","1x5","2x10","1x1","1x10","1x10","10x1","2x6","1x3","3x2","1x1"]},"CombDam7":{"rows":[109,171,174,605,608,1079],"values":["8x2","4x2","4x2","1x15","1x15","1x2"]},"Star League (2571 - 2780)":{"dict":["Unknown","Inner Sphere General, Mercenary, Periphery General, Star League General","Inner Sphere General, Periphery General, Rim Worlds Republic - Terran Corps, Star League General","Federated Suns","Inner Sphere General, Mercenary, Star League General","Rim Worlds Republic - Terran Corps, Star League Regular, Star League Royal","Star League Regular, Star League Royal","Capellan Confederation, Draconis Combine","Star League Royal","Rim Worlds Republic - Terran Corps, Star League General","Star League General","Draconis Combine","Rim Worlds Republic - Terran Corps, Star League Royal","Rim Worlds Republic - Terran Corps","Extinct","Draconis Combine, Federated Suns, Lyran Commonwealth, Rim Worlds Republic - Terran Corps, Star League General","Star League General, Star League Royal","Star League Regular, Unique","Inner Sphere General, Periphery General, Star League General","Star League Regular"],"values":[null,0,0,0,null,0,0,null,0,0,0,null,null,0,0,0,1,1,1,2,1,1,1,1,1,1,1,1,null,1,0,1,0,1,null,3,1,4,4,4,4,1,null,0,0,0,0,5,0,null,0,0,0,0,0,null,null,0,0,null,0,0,0,0,0,null,0,6,0,0,null,0,0,null,0,0,0,null,0,null,0,null,0,0,0,0,0,null,null,0,null,0,0,0,null,0,0,0,null,1,1,0,1,null,1,1,1,0,null,1,1,1,0,null,0,1,0,null,0,0,0,0,0,null,0,0,null,0,0,0,0,null,null,null,null,0,0,1,0,0,0,null,0,0,0,0,5,0,0,0,null,0,0,0,0,null,0,null,0,0,0,0,0,0,0,0,null,1,1,null,null,0,0,0,0,0,0,0,null,5,5,5,0,0,null,null,0,0,0,null,0,0,null,1,null,0,0,0,0,0,0,0,null,null,0,null,0,null,null,0,0,0,0,0,0,0,0,0,0,0,0,null,0,0,0,null,0,0,null,0,0,0,0,0,0,0,0,0,0,null,0,null,0,0,0,0,0,0,null,null,0,null,0,0,0,7,7,null,0,0,0,8,null,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,0,0,0,null,0,null,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,9,9,10,1,11,null,null,0,0,8,12,0,1,0,0,0,0,0,0,0,0,0,0,0,0,null,0,0,0,0,0,null,null,13,null,0,0,0,0,0,0,null,0,null,null,0,0,0,0,0,0,0,0,0,null,0,0,null,0,null,null,null,null,null,0,0,null,0,0,0,0,null,0,0,0,null,0,0,0,0,0,0,0,0,0,0,null,null,0,0,0,0,0,0,0,0,0,null,0,null,0,0,0,8,0,null,null,0,null,0,0,0,0,0,0,0,0,0,0,null,0,0,0,null,0,0,0,0,0,null,0,null,0,null,0,null,0,0,0,null,0,0,0,null,0,0,null,null,0,null,0,0,0,0,0,0,0,0,0,0,null,0,0,null,0,null,1,1,null,null,0,0,null,null,null,0,0,0,0,0,0,0,0,0,null,0,0,0,0,null,0,0,null,null,null,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,null,0,null,0,null,0,0,null,null,0,0,0,0,0,0,5,9,0,null,0,0,null,0,null,0,null,0,0,null,0,null,0,null,0,null,1,11,1,0,0,null,0,0,0,0,0,0,0,0,null,0,0,0,null,0,null,0,0,null,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,null,null,null,0,null,0,0,0,null,0,0,0,1,null,0,0,0,0,0,0,0,0,0,null,0,0,0,0,null,0,0,0,0,0,0,0,null,0,0,0,0,0,0,0,0,null,0,null,0,0,0,null,0,null,0,0,null,0,0,1,null,0,null,0,null,null,0,null,0,0,0,0,0,0,0,0,0,null,0,0,null,0,0,null,0,null,0,0,null,null,null,0,0,0,0,0,null,null,0,9,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,null,null,0,0,0,null,0,null,0,1,0,0,0,0,0,0,null,0,0,0,14,1,15,0,null,0,0,0,0,0,0,0,0,0,null,0,0,0,0,0,0,0,null,0,5,9,12,0,0,0,0,0,0,null,0,null,0,0,0,0,null,null,4,4,null,0,0,0,null,0,0,0,0,0,0,0,0,0,1,1,0,null,null,0,0,0,null,null,null,null,0,null,0,0,0,0,0,0,null,0,0,0,0,null,0,0,0,0,null,0,0,0,0,null,0,0,0,0,null,0,0,0,0,0,0,0,null,0,0,0,null,0,0,null,0,0,4,null,0,0,0,0,null,0,0,0,0,null,0,null,0,null,null,0,0,null,1,null,null,0,0,null,0,null,0,null,0,0,0,0,0,0,null,null,0,0,null,null,0,0,null,null,0,0,0,null,0,0,0,0,null,0,0,null,null,0,0,0,0,null,0,16,null,0,9,1,0,0,0,null,null,0,null,null,5,1,0,1,0,0,0,0,0,0,null,0,0,0,null,null,0,0,0,0,0,0,0,0,0,0,null,null,0,null,0,0,0,0,0,0,null,0,0,null,0,0,1,0,0,10,8,0,null,null,0,null,null,null,0,0,null,0,0,0,0,0,0,0,null,0,0,0,0,0,0,0,null,null,0,17,1,0,0,0,0,0,0,0,0,null,0,null,null,0,0,0,0,0,null,null,0,null,0,0,0,null,0,0,0,null,0,18,18,null,null,0,0,0,0,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,0,14,14,19,19,17,1,0,0,0,0,0,0,null,0,0,null,0,0,0,0,null,0,0,0,0,0,0,0,0,0,1,5,0,0,null,null,null,null,0,0,0,0,0,0,0,null,0,null,0,0,null,null,0,0,null,0,null,0,0,0,null,0,0,0,null,null,null,null,null,null,null,0,0,0,null]},"Early Succession War (2781 - 2900)":{"dict":["Unknown","Capellan Confederation","HW Clan General, Inner Sphere General, Mercenary, Periphery General, Star League in Exile","Inner Sphere General, Mercenary, Periphery General","Inner Sphere General, Mercenary, Periphery General, Star League in Exile","Star League in Exile","Federated Suns, Star League in Exile","HW Clan General, Inner Sphere General, Mercenary, Periphery General","HW Clan General, Inner Sphere General, Star League in Exile","Federated Suns","Extinct","ComStar, HW Clan General, Inner Sphere General, Mercenary, Periphery General, Star League in Exile","Inner Sphere General","ComStar, Inner Sphere General, Mercenary, Periphery General","Free Worlds League","Inner Sphere General, Star League in Exile","Unique","Capellan Confederation, Free Worlds League","Inner Sphere General, Mercenary, Taurian Concordat","Inner Sphere General, Mercenary","HW Clan General","Mercenary","Capellan Confederation, Draconis Combine","Capellan Confederation, ComStar, Lyran Commonwealth","HW Clan General, Star League in Exile","Lyran Commonwealth","Clan Wolf, Unique","ComStar, Inner Sphere General, Star League in Exile","Capellan Confederation, HW Clan General, Star League in Exile","Clan Goliath Scorpion, Clan Hell's Horses, Clan Ice Hellion, Clan Jade Falcon, ComStar, Inner Sphere General, Mercenary, Periphery General, Star League in Exile","Periphery General, Star League in Exile","ComStar, Inner Sphere General, Mercenary, Periphery General, Star League in Exile","Draconis Combine","Clan Blood Spirit","Clan Hell's Horses","ComStar, HW Clan General, Inner Sphere General, Star League in Exile","Clan Burrock","Clan Hell's Horses, Clan Steel Viper","Capellan Confederation, Federated Suns, HW Clan General, Star League in Exile","Clan Coyote"],"values":[null,0,0,0,null,0,0,null,0,0,0,null,null,1,1,1,2,3,2,2,4,4,4,4,4,4,4,4,null,2,4,4,5,4,null,6,7,2,2,2,2,2,null,0,0,0,0,8,0,null,0,0,0,0,0,null,null,0,0,null,0,0,0,9,9,null,0,10,0,0,null,0,0,null,0,0,0,null,0,null,0,null,0,0,0,0,0,null,null,0,null,0,0,0,null,0,0,0,null,11,11,0,11,null,11,11,11,0,null,11,2,11,0,null,3,11,9,null,0,0,0,0,0,null,0,12,null,0,0,0,0,null,null,null,null,0,0,13,3,14,1,null,0,0,0,0,8,5,5,5,null,0,12,0,0,null,0,null,0,0,0,0,0,0,0,0,null,4,4,null,null,0,0,0,0,0,0,0,null,15,15,15,0,0,null,null,0,0,0,null,0,0,null,2,null,0,0,0,0,0,0,0,null,null,0,null,0,null,null,16,0,17,0,0,0,0,14,0,0,0,0,null,0,0,0,null,0,0,null,0,0,18,3,0,0,0,19,0,0,null,0,null,20,0,0,0,0,0,null,null,0,null,21,21,21,22,22,null,23,0,0,24,null,null,0,0,0,3,0,0,3,0,0,0,3,0,0,0,null,0,0,25,25,null,0,null,0,0,null,0,26,26,26,26,0,0,0,26,0,0,0,0,27,8,13,13,11,null,null,0,0,28,5,0,29,0,0,0,0,0,0,0,30,0,0,0,0,null,0,0,0,0,0,null,null,12,null,0,0,0,0,0,0,null,0,null,null,0,0,0,0,0,0,0,0,0,null,0,0,null,0,null,null,null,null,null,0,0,null,0,0,0,0,null,0,0,0,null,0,0,0,0,0,0,0,0,0,0,null,null,0,0,0,0,0,0,0,0,0,null,0,null,0,0,0,28,0,null,null,0,null,0,0,12,0,0,0,12,12,0,0,null,0,0,0,null,0,0,0,0,0,null,0,null,0,null,0,null,0,0,0,null,0,0,0,null,0,0,null,null,0,null,0,0,0,0,0,0,0,0,0,0,null,0,20,null,0,null,31,31,null,null,0,0,null,null,null,3,0,3,0,0,0,0,0,0,null,0,0,0,0,null,0,0,null,null,null,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,null,32,null,0,null,0,0,null,null,0,0,0,0,0,0,8,15,33,null,0,0,null,0,null,0,null,0,0,null,0,null,0,null,0,null,4,32,4,0,0,null,0,0,0,0,0,0,0,0,null,0,0,0,null,0,null,0,0,null,0,null,0,0,34,34,34,34,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,null,null,null,0,null,0,0,0,null,0,0,0,2,null,0,0,0,0,0,0,0,1,0,null,0,0,0,0,null,0,0,0,0,0,0,0,null,0,0,34,34,34,0,0,34,null,0,null,0,0,0,null,0,null,0,0,null,0,0,13,null,0,null,5,null,null,0,null,0,0,0,0,0,0,0,0,3,null,0,0,null,0,0,null,0,null,0,0,null,null,null,0,0,0,0,0,null,null,0,10,null,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,null,null,0,0,0,null,0,null,0,13,0,0,0,3,3,0,null,5,0,20,10,3,3,0,null,0,0,0,0,0,0,0,0,0,null,3,0,0,0,0,3,0,null,0,15,15,35,0,0,0,0,0,0,null,0,null,0,0,0,0,null,null,19,19,null,0,0,0,null,0,0,0,0,0,0,0,0,36,4,3,0,null,null,0,0,0,null,null,null,null,0,null,0,0,0,0,0,0,null,0,0,0,0,null,0,0,0,0,null,0,0,0,0,null,0,0,0,0,null,0,0,0,0,32,0,0,null,0,0,0,null,0,37,null,5,0,2,null,0,0,0,0,null,0,0,0,0,null,0,null,0,null,null,0,0,null,3,null,null,0,0,null,20,null,0,null,0,0,0,0,0,0,null,null,0,0,null,null,0,0,null,null,0,0,0,null,0,0,0,0,null,0,0,null,null,0,0,0,0,null,0,24,null,0,10,11,0,0,0,null,null,0,null,null,24,2,0,31,0,0,0,0,0,0,null,0,0,0,null,null,0,0,0,0,0,3,0,0,0,3,null,null,0,null,0,0,0,0,0,0,null,0,0,null,0,0,4,0,0,12,38,0,null,null,0,null,null,null,0,0,null,0,0,0,0,0,0,0,null,0,0,0,0,0,0,0,null,null,3,10,3,39,0,0,0,0,0,0,0,null,0,null,null,12,0,0,0,0,null,null,0,null,0,0,0,null,0,0,0,null,0,13,13,null,null,0,0,0,0,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,0,10,10,10,10,10,11,0,0,0,0,0,0,null,0,0,null,0,0,0,0,null,0,0,14,0,17,0,0,0,0,11,8,0,0,null,null,null,null,0,0,0,0,0,0,0,null,0,null,0,0,null,null,0,0,null,0,null,0,0,0,null,0,0,0,null,null,null,null,null,null,null,0,0,0,null]},"Late Succession War - LosTech (2901 - 3019)":{"dict":["Unknown","Federated Suns, Free Worlds League, Lyran Commonwealth","Federated Suns, Lyran Commonwealth","Capellan Confederation","ComStar, HW Clan General, Inner Sphere General, Mercenary, Periphery General, Wolf's Dragoons","Marian Hegemony, Taurian Concordat","ComStar, Inner Sphere General, Mercenary, Periphery General, Wolf's Dragoons","ComStar, HW Clan General, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Inner Sphere General, Mercenary, Periphery General","Extinct","ComStar, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Clan Blood Spirit","HW Clan General","Federated Suns","Inner Sphere General, Mercenary, Periphery General, Wolf's Dragoons","Taurian Concordat","ComStar, HW Clan General, Inner Sphere General","ComStar, Inner Sphere General, Mercenary, Periphery General","Free Worlds League","ComStar","Inner Sphere General","Clan Goliath Scorpion","ComStar, HW Clan General","Capellan Confederation, Free Worlds League","Draconis Combine","Inner Sphere General, Taurian Concordat","ComStar, Inner Sphere General, Periphery General","Wolf's Dragoons","Mercenary","Capellan Confederation, Draconis Combine","Lyran Commonwealth","Clan Wolf, Unique","Draconis Combine, Lyran Commonwealth, Magistracy of Canopus","Periphery General","Unique","Inner Sphere General, Mercenary","Inner Sphere General, Mercenary, Wolf's Dragoons","Inner Sphere General, Magistracy of Canopus, Taurian Concordat","Capellan Confederation, Draconis Combine, Federated Suns, Lyran Commonwealth","Clan Burrock, Clan Diamond Shark, Clan Fire Mandrill, Clan Hell's Horses, Clan Ice Hellion, Clan Nova Cat, Clan Wolf","Clan Cloud Cobra, Clan Ghost Bear, Clan Goliath Scorpion, Clan Hell's Horses, Clan Ice Hellion","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Clan Burrock","Magistracy of Canopus","Clan Blood Spirit, Clan Burrock, Clan Diamond Shark, Clan Fire Mandrill, Clan Goliath Scorpion, Clan Hell's Horses, Clan Star Adder, Clan Steel Viper, Clan Wolf","Capellan Confederation, Federated Suns","ComStar, Inner Sphere General","Inner Sphere General, Magistracy of Canopus, Mercenary, Taurian Concordat, Wolf's Dragoons","Clan Coyote","Clan Hell's Horses, Clan Wolf, ComStar","Capellan Confederation, Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Wolf's Dragoons","Capellan Confederation, Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Pirates, Wolf's Dragoons"],"values":[null,0,1,2,null,0,0,null,0,0,0,null,null,3,3,3,4,5,4,4,6,6,6,6,6,6,6,6,null,7,8,9,9,10,null,11,4,12,12,12,12,4,null,0,0,0,0,12,0,null,0,0,0,0,0,null,null,0,0,null,0,0,0,13,13,null,0,9,0,0,null,14,14,null,0,0,0,null,0,null,0,null,0,15,0,0,0,null,null,0,null,0,0,0,null,0,0,0,null,4,4,0,4,null,4,4,4,0,null,4,4,4,0,null,14,16,13,null,0,0,0,0,0,null,0,9,null,0,0,0,0,null,null,null,null,0,0,17,8,18,3,null,0,0,0,0,19,9,9,9,null,0,20,20,0,null,0,null,0,0,0,0,0,0,0,0,null,14,14,null,null,0,21,14,14,14,0,0,null,9,9,9,0,0,null,null,0,0,0,null,0,0,null,22,null,0,0,0,0,0,0,0,null,null,0,null,0,null,null,9,0,23,0,0,0,0,18,0,0,0,0,null,0,0,0,null,0,0,null,24,0,25,8,0,0,0,26,0,0,null,0,null,12,0,0,0,27,0,null,null,0,null,28,28,28,29,29,null,19,0,0,12,null,null,0,0,0,8,0,0,8,0,0,0,8,0,0,0,null,0,0,30,30,null,0,null,0,0,null,0,31,31,31,31,0,0,0,31,27,27,27,27,19,9,6,6,7,null,null,0,0,12,9,0,6,0,0,0,0,0,0,32,33,0,0,0,0,null,0,0,0,0,0,null,null,9,null,0,28,34,0,0,0,null,0,null,null,0,0,0,0,0,0,0,0,0,null,0,0,null,0,null,null,null,null,null,0,0,null,0,0,0,0,null,19,0,0,null,0,0,0,0,0,0,0,0,0,0,null,null,0,0,8,0,0,0,0,8,8,null,0,null,0,0,0,12,0,null,null,0,null,0,0,20,0,0,0,20,20,0,0,null,0,0,0,null,14,0,0,0,0,null,0,null,0,null,0,null,0,0,0,null,0,35,0,null,0,0,null,null,0,null,0,0,0,0,0,0,0,0,36,0,null,0,12,null,0,null,6,6,null,null,0,0,null,null,null,8,0,8,0,8,37,0,8,0,null,0,0,0,0,null,0,0,null,null,null,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,null,9,null,0,null,0,0,null,null,0,0,0,0,0,0,12,9,11,null,0,0,null,0,null,0,null,0,0,null,0,null,0,null,0,null,38,24,38,0,0,null,0,3,0,0,0,0,0,0,null,0,0,0,null,0,null,0,0,null,0,null,0,0,39,39,39,39,0,0,0,0,0,27,27,27,27,27,27,27,0,0,null,27,null,null,null,0,null,0,0,0,null,0,0,0,19,null,13,3,0,0,0,0,0,3,0,null,0,0,0,0,null,0,0,0,0,0,0,0,null,0,0,40,40,40,0,0,40,null,0,null,0,0,0,null,0,null,0,0,null,0,0,17,null,0,null,9,null,null,0,null,0,0,0,0,0,0,0,14,14,null,0,0,null,0,0,null,0,null,0,0,null,null,null,33,0,0,0,0,null,null,0,9,null,0,0,8,0,0,0,3,0,0,0,0,0,0,0,0,0,0,0,0,null,0,null,null,0,0,0,null,0,null,0,19,0,19,0,41,14,0,null,9,0,12,9,9,14,0,null,0,0,0,0,0,0,0,0,0,null,14,0,0,0,0,14,0,null,0,9,9,22,0,0,0,0,0,0,null,0,null,0,0,0,0,null,null,9,9,null,0,0,0,null,0,0,0,0,0,0,0,0,42,9,9,0,null,null,0,0,0,null,null,null,null,0,null,43,0,0,43,0,0,null,0,0,0,0,null,0,0,0,0,null,0,0,0,0,null,0,0,0,0,null,0,0,0,0,24,0,0,null,0,0,0,null,0,44,null,9,0,12,null,0,0,0,0,null,0,0,0,0,null,0,null,33,null,null,0,0,null,9,null,null,0,0,null,12,null,0,null,0,0,0,0,0,0,null,null,0,0,null,null,0,0,null,null,0,0,0,null,0,0,0,0,null,0,0,null,null,0,45,3,45,null,0,12,null,0,9,4,0,0,0,null,null,0,null,null,12,9,13,46,0,24,0,0,0,0,null,0,0,0,null,null,0,0,0,0,0,8,0,0,0,14,null,null,0,null,0,0,0,0,0,0,null,0,0,null,0,0,9,0,0,9,12,0,null,null,0,null,null,null,0,0,null,0,0,0,0,0,0,0,null,47,0,0,0,0,47,0,null,null,14,9,14,48,0,0,0,0,0,0,0,null,0,null,null,20,0,0,0,0,null,null,0,null,0,0,0,null,0,0,0,null,0,17,17,null,null,0,0,0,0,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,0,9,9,9,9,9,19,0,0,0,0,0,0,null,0,0,null,0,0,0,0,null,0,0,18,0,23,0,0,0,0,49,12,0,0,null,null,null,null,50,0,51,0,0,0,0,null,0,null,0,0,null,null,0,0,null,0,null,0,0,0,null,0,13,13,null,null,null,null,null,null,null,0,0,0,null]},"Late Succession War - Renaissance (3020 - 3049)":{"dict":["Unknown","Federated Suns, Free Worlds League, Lyran Commonwealth","Federated Suns, Lyran Commonwealth","Lyran Commonwealth","Capellan Confederation, St. Ives Compact","ComStar, HW Clan General, Inner Sphere General, Mercenary, Periphery General, Wolf's Dragoons","Marian Hegemony, Taurian Concordat","ComStar, HW Clan General, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","ComStar, Inner Sphere General, Mercenary, Periphery General, Wolf's Dragoons","ComStar, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Inner Sphere General, Mercenary, Periphery General","Extinct","HW Clan General","Federated Suns","Inner Sphere General, Mercenary, Periphery General, Wolf's Dragoons","Federated Suns, Taurian Concordat","Taurian Concordat","ComStar, HW Clan General, Inner Sphere General","ComStar, Inner Sphere General, Mercenary, Periphery General","Free Worlds League","ComStar","Inner Sphere General","Mercenary","Clan Cloud Cobra, Clan Goliath Scorpion","ComStar, HW Clan General","Free Rasalhague Republic, Free Worlds League","Capellan Confederation, Free Worlds League","Inner Sphere General, Taurian Concordat","ComStar, Inner Sphere General, Periphery General","Wolf's Dragoons","Capellan Confederation, Draconis Combine","Clan Wolf, Unique","Draconis Combine, Free Rasalhague Republic, Lyran Commonwealth, Magistracy of Canopus","Periphery General","Unique","Draconis Combine","Inner Sphere General, Mercenary","Inner Sphere General, Mercenary, Wolf's Dragoons","Inner Sphere General, Magistracy of Canopus, Taurian Concordat","Clan Blood Spirit","Capellan Confederation, Draconis Combine, Federated Suns, Free Rasalhague Republic, Lyran Commonwealth, St. Ives Compact","Draconis Combine, Free Rasalhague Republic","Federated Suns, St. Ives Compact","Capellan Confederation, Federated Suns, Lyran Commonwealth, St. Ives Compact","Lyran Commonwealth, Mercenary","Clan Cloud Cobra, Clan Ghost Bear, Clan Goliath Scorpion, Clan Hell's Horses, Clan Ice Hellion","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Magistracy of Canopus","Free Rasalhague Republic","Clan Blood Spirit, Clan Burrock, Clan Fire Mandrill, Clan Hell's Horses","Capellan Confederation, Federated Suns, St. Ives Compact","Capellan Confederation","ComStar, Inner Sphere General","Inner Sphere General, Magistracy of Canopus, Mercenary, Taurian Concordat, Wolf's Dragoons","Clan Coyote","Capellan Confederation, Free Worlds League, St. Ives Compact","Clan Hell's Horses, Clan Wolf, ComStar","Capellan Confederation, Draconis Combine, Federated Suns, Free Rasalhague Republic, Lyran Commonwealth, Mercenary, St. Ives Compact, Wolf's Dragoons","Capellan Confederation, Draconis Combine, Federated Suns, Free Rasalhague Republic, Lyran Commonwealth, Mercenary, Pirates, St. Ives Compact, Wolf's Dragoons","Draconis Combine, Federated Suns"],"values":[null,0,1,2,null,0,0,null,0,0,3,null,null,4,4,4,5,6,7,7,8,8,9,9,8,8,9,9,null,7,10,9,11,9,null,11,5,12,12,12,12,5,null,0,0,0,0,12,0,null,0,0,0,0,0,null,null,0,0,null,0,0,0,13,13,null,0,11,0,0,null,14,14,null,0,0,0,null,0,null,13,null,0,15,0,16,0,null,null,0,null,0,0,0,null,0,0,0,null,7,7,0,7,null,7,7,7,0,null,5,7,7,0,null,14,17,13,null,0,0,0,0,0,null,0,11,null,0,0,0,0,null,null,null,null,0,0,18,10,19,4,null,0,0,0,0,20,11,11,11,null,0,21,21,0,null,0,null,0,0,0,0,0,0,0,22,null,14,14,null,null,0,23,14,14,14,0,0,null,11,11,11,0,0,null,null,0,0,0,null,0,0,null,24,null,0,0,0,0,0,0,0,null,null,0,null,0,null,null,11,25,26,0,0,0,0,19,0,0,0,0,null,0,0,0,null,0,0,null,11,0,27,10,0,0,0,28,0,0,null,0,null,12,29,29,29,29,29,null,null,0,null,22,22,22,30,30,null,20,0,0,12,null,null,0,0,0,10,0,0,10,0,0,0,10,0,0,0,null,0,0,3,3,null,0,null,0,0,null,0,31,31,31,31,0,0,0,31,29,29,29,29,20,11,8,8,7,null,null,0,0,12,11,0,8,19,0,0,0,0,0,32,33,0,0,0,0,null,0,0,0,0,0,null,null,11,null,0,22,34,0,0,0,null,0,null,null,0,0,0,0,0,0,0,0,0,null,21,35,null,0,null,null,null,null,null,0,0,null,0,0,0,0,null,20,0,0,null,0,0,0,0,0,0,0,0,0,0,null,null,0,0,10,0,0,0,0,10,10,null,0,null,0,0,0,12,0,null,null,0,null,0,0,21,0,0,0,21,21,0,0,null,0,0,0,null,14,0,0,0,0,null,0,null,0,null,0,null,0,0,0,null,0,36,0,null,0,0,null,null,0,null,0,0,0,0,0,37,0,0,37,0,null,0,12,null,0,null,8,8,null,null,0,0,null,null,null,10,0,10,0,10,38,0,10,0,null,0,0,0,0,null,0,0,null,null,null,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,null,11,null,0,null,0,0,null,null,0,0,0,0,0,0,12,11,39,null,0,0,null,0,null,0,null,0,0,null,0,null,0,null,0,null,40,41,40,0,0,null,0,4,0,0,0,0,0,0,null,0,0,0,null,0,null,0,0,null,0,null,0,0,12,12,12,12,0,0,0,0,0,29,29,29,29,29,29,29,0,0,null,29,null,null,null,0,null,0,0,0,null,0,0,0,20,null,42,11,43,44,0,0,0,4,0,null,0,0,0,0,null,2,0,0,14,0,0,0,null,0,0,45,45,45,0,0,45,null,0,null,0,0,0,null,0,null,0,0,null,2,0,18,null,0,null,11,null,null,0,null,0,0,0,0,0,0,0,46,46,null,0,0,null,0,0,null,0,null,0,0,null,null,null,33,0,0,0,0,null,null,0,11,null,0,19,10,0,0,0,4,0,0,0,0,0,0,0,0,0,0,0,0,null,0,null,null,0,0,0,null,0,null,0,20,0,20,0,14,46,0,null,11,0,12,11,11,14,0,null,0,0,0,0,0,0,0,0,0,null,14,0,0,0,0,14,0,null,0,11,11,24,0,0,0,0,0,0,null,0,null,0,0,0,0,null,null,11,11,null,0,0,0,null,0,0,0,0,0,0,0,0,11,11,11,0,null,null,0,0,0,null,null,null,null,0,null,47,0,0,47,0,0,null,0,0,0,0,null,0,0,0,0,null,0,0,0,0,null,0,0,0,0,null,0,0,0,0,41,41,0,null,0,48,48,null,0,49,null,11,0,12,null,0,0,0,0,null,0,0,0,0,null,0,null,33,null,null,0,0,null,11,null,null,0,0,null,12,null,0,null,0,0,0,0,0,0,null,null,0,0,null,null,0,0,null,null,0,0,0,null,0,0,0,0,null,0,0,null,null,0,50,51,50,null,0,12,null,0,11,5,0,0,0,null,null,0,null,null,12,11,13,52,0,41,0,0,0,0,null,0,0,0,null,null,0,0,0,0,0,10,0,0,0,14,null,null,0,null,0,0,0,0,0,0,null,0,0,null,0,0,11,0,0,11,12,0,null,null,0,null,null,null,0,0,null,0,0,0,0,0,0,0,null,53,0,0,0,0,53,0,null,null,14,11,14,54,0,0,0,0,0,0,0,null,0,null,null,21,0,0,0,0,null,null,0,null,0,0,0,null,0,0,0,null,0,18,18,null,null,0,0,0,2,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,0,null,0,0,11,11,11,11,11,20,0,0,0,0,0,0,null,0,0,null,0,0,0,0,null,0,0,19,0,55,0,0,0,0,56,12,0,0,null,null,null,null,57,0,58,0,0,0,0,null,0,null,0,0,null,null,0,0,null,0,null,0,0,0,null,59,13,13,null,null,null,null,null,null,null,0,0,0,null]},"Clan Invasion (3050 - 3061)":{"dict":["Unknown","Federated Commonwealth, Federated Suns, Free Worlds League, Lyran Alliance, Lyran Commonwealth","Federated Commonwealth, Federated Suns, Lyran Alliance, Lyran Commonwealth","Extinct","Capellan Confederation, St. Ives Compact","HW Clan General, Inner Sphere General, IS Clan General, Mercenary, Periphery General, Wolf's Dragoons","Marian Hegemony, Taurian Concordat","HW Clan General, Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Inner Sphere General, Mercenary, Periphery General, Wolf's Dragoons","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Inner Sphere General, Mercenary, Periphery General","HW Clan General","Capellan Confederation, Draconis Combine, Federated Commonwealth, Federated Suns, Lyran Alliance","Capellan Confederation, Draconis Combine, Federated Commonwealth, Federated Suns, Lyran Alliance, Lyran Commonwealth","HW Clan General, IS Clan General","Capellan Confederation, ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Lyran Alliance, Word of Blake","Inner Sphere General, Kell Hounds, Mercenary, Wolf's Dragoons","Federated Commonwealth, Federated Suns","Inner Sphere General, Periphery General","Federated Commonwealth, Federated Suns, Taurian Concordat","Taurian Concordat","Mercenary","HW Clan General, Inner Sphere General, IS Clan General","Free Worlds League","ComStar, Word of Blake","Inner Sphere General","Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Kell Hounds, Lyran Alliance, Lyran Commonwealth, Mercenary, Periphery General, Wolf's Dragoons","Clan Cloud Cobra, Clan Goliath Scorpion, Clan Ice Hellion, Clan Star Adder","ComStar, HW Clan General, Word of Blake","Capellan Confederation, ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Free Worlds League, Lyran Alliance, Lyran Commonwealth","Inner Sphere General, Mercenary, Wolf's Dragoons","Inner Sphere General, Taurian Concordat","Capellan Confederation, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Free Worlds League, Lyran Alliance, Lyran Commonwealth, Mercenary, Periphery General","Draconis Combine","HW Clan General, IS Clan General, Wolf's Dragoons","ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Lyran Alliance, Lyran Commonwealth, Wolf's Dragoons","Mercenary, Wolf's Dragoons","Capellan Confederation, Draconis Combine","Word of Blake","Clan Jade Falcon, Inner Sphere General, Mercenary, Periphery General, Wolf's Dragoons","Clan Ghost Bear","Federated Commonwealth, Lyran Alliance, Lyran Commonwealth","Wolf's Dragoons","Kell Hounds, Mercenary, Wolf's Dragoons","Periphery General","Unique","Federated Commonwealth, Federated Suns, Lyran Alliance","Draconis Combine, Federated Commonwealth, Federated Suns, Lyran Alliance, Word of Blake","Clan Jade Falcon","Draconis Combine, Federated Commonwealth, Federated Suns, Lyran Alliance, Lyran Commonwealth","Capellan Confederation, Draconis Combine, Federated Commonwealth, Federated Suns, Free Worlds League, Lyran Alliance, Lyran Commonwealth, Mercenary, Periphery General","Capellan Confederation, Federated Commonwealth, Federated Suns, Free Worlds League, Lyran Alliance, Lyran Commonwealth, Mercenary, Periphery General","Capellan Confederation, Draconis Combine, Free Worlds League, Mercenary, Periphery General","Capellan Confederation, Draconis Combine, Federated Commonwealth, Federated Suns, Free Worlds League, Lyran Alliance, Lyran Commonwealth, Magistracy of Canopus, Taurian Concordat","Clan Blood Spirit","Capellan Confederation, ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Lyran Alliance, Lyran Commonwealth, St. Ives Compact, Word of Blake","Draconis Combine, Free Rasalhague Republic","HW Clan General, Wolf's Dragoons","IS Clan General, Mercenary, Periphery General, Wolf's Dragoons","Federated Commonwealth, Federated Suns, St. Ives Compact","Capellan Confederation, Federated Commonwealth, Federated Suns, Lyran Alliance, Lyran Commonwealth, St. Ives Compact","Federated Commonwealth, Lyran Alliance, Lyran Commonwealth, Mercenary","Federated Commonwealth, Lyran Alliance, Mercenary","Federated Commonwealth, Federated Suns, Lyran Alliance, Lyran Commonwealth, Word of Blake","Clan Cloud Cobra, Clan Ghost Bear, Clan Goliath Scorpion, Clan Hell's Horses, Clan Ice Hellion","Federated Commonwealth, Federated Suns, Lyran Alliance, Lyran Commonwealth, Mercenary","Clan Blood Spirit, Clan Cloud Cobra, Clan Coyote, Clan Fire Mandrill, Clan Goliath Scorpion, Clan Ice Hellion, Clan Snow Raven, Clan Star Adder, Clan Steel Viper, IS Clan General, Wolf's Dragoons","Capellan Confederation, Magistracy of Canopus, Taurian Concordat","Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Outworlds Alliance, Taurian Concordat, Wolf's Dragoons","ComStar, HW Clan General, IS Clan General, Word of Blake","Federated Commonwealth, Federated Suns, Lyran Alliance, Word of Blake","Magistracy of Canopus","Clan Jade Falcon, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Clan Ghost Bear, Free Rasalhague Republic","Clan Wolf (in Exile), Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Lyran Alliance, Lyran Commonwealth, Mercenary","Clan Wolf (in Exile), Inner Sphere General, Mercenary","ComStar, Unique","Federated Commonwealth, Federated Suns, Word of Blake","Inner Sphere General, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat, Wolf's Dragoons","Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Free Worlds League, Mercenary, Wolf's Dragoons, Word of Blake","Capellan Confederation, Draconis Combine, Word of Blake","Federated Commonwealth, Federated Suns, Lyran Alliance, Lyran Commonwealth, Mercenary, Wolf's Dragoons","Draconis Combine, Federated Commonwealth, Federated Suns, Kell Hounds, Lyran Alliance, Lyran Commonwealth, Mercenary, Taurian Concordat, Wolf's Dragoons","Capellan Confederation, ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, HW Clan General, IS Clan General, Kell Hounds, Lyran Alliance, Lyran Commonwealth, Mercenary, Wolf's Dragoons, Word of Blake","Capellan Confederation, Federated Commonwealth, Federated Suns, Free Worlds League, Lyran Alliance, Lyran Commonwealth, St. Ives Compact","Clan Hell's Horses, Clan Wolf, Clan Wolf (in Exile), ComStar, Free Rasalhague Republic, Word of Blake","Capellan Confederation, ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Lyran Alliance, Lyran Commonwealth, Mercenary, St. Ives Compact, Wolf's Dragoons, Word of Blake","Capellan Confederation, ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Lyran Alliance, Lyran Commonwealth, Mercenary, Pirates, St. Ives Compact, Wolf's Dragoons, Word of Blake","Inner Sphere General, Mercenary","Clan Coyote, Clan Ghost Bear, Clan Goliath Scorpion, Clan Hell's Horses","Draconis Combine, Federated Commonwealth, Federated Suns"],"values":[null,0,1,2,null,0,0,null,0,0,3,null,null,4,4,4,5,6,7,7,8,8,9,9,8,8,9,9,null,7,10,9,3,9,null,3,5,11,11,11,11,5,null,12,0,0,13,14,15,null,16,0,0,16,16,null,null,0,0,null,17,17,17,17,17,null,0,3,0,0,null,9,9,null,0,0,0,null,0,null,18,null,0,19,0,20,0,null,null,0,null,0,0,0,null,0,0,0,null,7,7,0,7,null,7,7,7,21,null,5,7,7,0,null,8,22,2,null,0,0,0,0,0,null,0,3,null,0,0,0,0,null,null,null,null,0,0,8,8,23,4,null,0,0,0,0,24,3,3,3,null,0,25,25,0,null,0,null,0,0,0,0,26,0,0,21,null,8,8,null,null,0,27,8,8,8,0,0,null,3,3,3,0,0,null,null,0,0,0,null,0,0,null,28,null,0,0,0,16,16,16,0,null,null,0,null,0,null,null,3,29,29,0,0,0,0,23,0,0,0,0,null,0,30,0,null,0,0,null,3,0,31,32,33,0,0,18,25,0,null,0,null,34,35,35,3,35,35,null,null,0,null,36,36,36,37,37,null,38,0,0,14,null,null,10,0,0,39,0,0,39,9,0,0,39,0,0,40,null,0,0,41,41,null,0,null,0,0,null,0,42,42,42,42,0,0,0,42,43,43,43,43,24,3,8,5,7,null,null,0,0,14,3,0,9,9,0,0,0,0,0,9,44,0,0,0,0,null,0,0,0,0,0,null,null,3,null,9,21,45,0,0,0,null,0,null,null,0,0,0,0,0,0,0,0,0,null,25,25,null,0,null,null,null,null,null,0,0,null,18,0,0,0,null,24,0,24,null,0,0,0,0,0,0,0,0,0,0,null,null,0,2,8,0,0,46,46,8,8,null,0,null,0,0,0,14,0,null,null,0,null,47,0,25,0,0,0,25,25,0,0,null,0,0,0,null,8,48,33,0,0,null,0,null,0,null,0,null,0,0,0,null,0,30,33,null,0,0,null,null,0,null,0,49,46,16,0,30,49,0,30,0,null,0,14,null,0,null,8,8,null,null,0,0,null,null,null,50,0,51,0,52,53,0,50,0,null,0,0,0,0,null,0,0,null,null,null,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,null,3,null,0,null,0,0,null,null,0,0,0,0,0,0,14,3,54,null,0,0,null,0,null,0,null,0,0,null,0,null,0,null,0,null,55,56,55,0,0,null,0,3,0,0,0,0,0,0,null,0,0,0,null,0,null,0,0,null,0,null,0,0,57,57,57,57,0,0,0,0,0,42,42,42,42,42,42,42,42,0,null,42,null,null,null,0,null,0,0,0,null,0,0,0,58,null,59,3,60,61,0,0,62,4,0,null,0,0,0,0,null,2,0,0,8,63,0,0,null,0,0,64,64,64,0,0,64,null,0,null,0,0,0,null,0,null,0,0,null,65,0,10,null,0,null,3,null,null,0,null,16,16,16,0,66,0,16,9,9,null,0,0,null,0,0,null,0,null,0,0,null,null,null,44,0,0,0,0,null,null,0,3,null,0,23,8,0,0,0,4,0,16,0,67,0,0,0,0,0,0,0,0,null,0,null,null,0,0,0,null,0,null,0,68,0,9,0,9,9,0,null,3,0,14,3,3,8,0,null,0,0,0,0,0,0,0,0,0,null,8,0,0,0,0,8,0,null,0,3,3,69,0,0,0,0,0,0,null,0,null,0,0,0,0,null,null,3,3,null,9,0,0,null,0,65,0,0,0,70,0,0,3,3,3,0,null,null,0,0,0,null,null,null,null,0,null,71,34,0,71,0,0,null,0,0,0,23,null,0,0,0,0,null,72,0,0,0,null,0,0,0,0,null,33,0,0,0,33,33,0,null,0,73,73,null,0,3,null,3,0,11,null,0,0,0,0,null,74,0,0,0,null,0,null,44,null,null,0,0,null,3,null,null,0,0,null,14,null,0,null,0,0,0,0,0,0,null,null,46,0,null,null,0,0,null,null,0,0,17,null,0,0,0,0,null,0,0,null,null,0,16,16,16,null,0,14,null,0,3,5,0,0,0,null,null,0,null,null,14,3,17,25,0,56,0,0,0,0,null,0,0,0,null,null,0,0,0,0,34,8,75,33,0,8,null,null,0,null,0,0,0,0,0,0,null,0,0,null,0,0,3,0,0,3,14,76,null,null,0,null,null,null,0,0,null,0,77,77,0,0,0,77,null,78,0,0,0,0,78,16,null,null,8,3,8,3,79,79,79,0,0,0,79,null,0,null,null,25,0,0,0,80,null,null,0,null,0,0,0,null,0,0,0,null,0,10,10,null,null,0,0,0,81,0,0,0,null,0,0,0,0,0,0,0,0,82,0,0,0,0,null,0,0,3,3,3,3,3,83,0,0,0,0,0,0,null,0,0,null,0,0,0,0,null,16,0,84,0,84,0,0,0,0,85,14,0,0,null,null,null,null,86,0,87,0,0,0,88,null,0,null,0,0,null,null,0,0,null,0,null,0,0,89,null,90,17,17,null,null,null,null,null,null,null,0,0,0,null]},"Civil War (3062 - 3067)":{"dict":["Unknown","Federated Commonwealth, Federated Suns, Lyran Alliance","Taurian Concordat","Extinct","Capellan Confederation, St. Ives Compact","Capellan Confederation, Magistracy of Canopus, St. Ives Compact, Taurian Concordat","HW Clan General, Inner Sphere General, IS Clan General, Mercenary, Periphery General, Wolf's Dragoons","Marian Hegemony, Taurian Concordat","HW Clan General, Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Inner Sphere General, Mercenary, Periphery General, Wolf's Dragoons","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Inner Sphere General, Mercenary, Periphery General","HW Clan General","Capellan Confederation, Draconis Combine, Federated Commonwealth, Federated Suns, Lyran Alliance","HW Clan General, IS Clan General","Capellan Confederation, ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Lyran Alliance, Word of Blake","Inner Sphere General, Mercenary, Wolf's Dragoons","Inner Sphere General, Kell Hounds, Mercenary, Wolf's Dragoons","Federated Commonwealth, Federated Suns","Inner Sphere General, Periphery General","Federated Commonwealth, Federated Suns, Taurian Concordat","Lyran Alliance, Mercenary, Wolf's Dragoons","Federated Commonwealth, Lyran Alliance","Mercenary","HW Clan General, Inner Sphere General, IS Clan General","Capellan Confederation","Free Worlds League","ComStar, Word of Blake","Inner Sphere General","Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Lyran Alliance, Mercenary, Periphery General, Wolf's Dragoons","Clan Hell's Horses","Clan Cloud Cobra, Clan Goliath Scorpion, Clan Ice Hellion, Clan Star Adder","Capellan Confederation, Magistracy of Canopus, Mercenary, Taurian Concordat, Wolf's Dragoons, Word of Blake","ComStar, HW Clan General, Word of Blake","Capellan Confederation, ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Free Worlds League, Lyran Alliance","Inner Sphere General, Mercenary, Taurian Concordat","Capellan Confederation, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Free Worlds League, Lyran Alliance, Mercenary, Periphery General","Draconis Combine","HW Clan General, IS Clan General, Wolf's Dragoons","ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Lyran Alliance, Wolf's Dragoons, Word of Blake","Mercenary, Wolf's Dragoons","Capellan Confederation, Draconis Combine","Word of Blake","Clan Jade Falcon, Inner Sphere General, Mercenary, Periphery General, Wolf's Dragoons","Federated Suns","Clan Ghost Bear, Clan Hell's Horses","Lyran Alliance","Wolf's Dragoons","Periphery General","Clan Hell's Horses, Clan Star Adder","Unique","Free Worlds League, Word of Blake","Inner Sphere General, Mercenary, Outworlds Alliance, Taurian Concordat, Wolf's Dragoons","Capellan Confederation, Draconis Combine, Federated Commonwealth, Federated Suns, Free Worlds League, Lyran Alliance, Word of Blake","Draconis Combine, Word of Blake","Clan Jade Falcon","Clan Diamond Shark, Clan Nova Cat, Draconis Combine, Federated Commonwealth, Federated Suns, Lyran Alliance","Draconis Combine, Federated Commonwealth, Federated Suns, Lyran Alliance","Capellan Confederation, Draconis Combine, Federated Commonwealth, Federated Suns, Free Worlds League, Mercenary, Periphery General","Capellan Confederation, Free Worlds League, Lyran Alliance, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat","Capellan Confederation, Magistracy of Canopus, Taurian Concordat","Capellan Confederation, Draconis Combine, Free Worlds League, Mercenary, Periphery General","Capellan Confederation, Draconis Combine, Federated Commonwealth, Federated Suns, Free Worlds League, Magistracy of Canopus, Taurian Concordat","Capellan Confederation, ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Lyran Alliance, St. Ives Compact, Word of Blake","Draconis Combine, Free Rasalhague Republic","Capellan Confederation, Magistracy of Canopus","Federated Suns, Kell Hounds, Lyran Alliance, Mercenary, Wolf's Dragoons","HW Clan General, Wolf's Dragoons","Federated Commonwealth, Federated Suns, St. Ives Compact","Capellan Confederation, Federated Commonwealth, Federated Suns, Lyran Alliance, St. Ives Compact","Lyran Alliance, Mercenary","Federated Commonwealth, Federated Suns, Lyran Alliance, Word of Blake","Clan Cloud Cobra, Clan Diamond Shark, Clan Ghost Bear, Clan Goliath Scorpion, Clan Hell's Horses, Clan Ice Hellion, Clan Nova Cat, Clan Star Adder, Clan Wolf, Clan Wolf (in Exile)","Federated Commonwealth, Federated Suns, Lyran Alliance, Mercenary, Word of Blake","Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Outworlds Alliance, Taurian Concordat, Wolf's Dragoons","Clan Diamond Shark, Clan Ghost Bear, Clan Hell's Horses, Clan Jade Falcon, Clan Wolf, HW Clan General, Word of Blake","Federated Commonwealth, Federated Suns, Lyran Alliance, Mercenary","Draconis Combine, Federated Commonwealth, Federated Suns","Capellan Confederation, Federated Commonwealth, Federated Suns","Magistracy of Canopus","Federated Commonwealth, Federated Suns, Magistracy of Canopus, Taurian Concordat","Clan Diamond Shark, Clan Nova Cat, Draconis Combine","Draconis Combine, Unique","Clan Ghost Bear, Free Rasalhague Republic","Clan Wolf (in Exile), Federated Commonwealth, Federated Suns, Lyran Alliance","Clan Wolf (in Exile), Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Lyran Alliance, Mercenary","ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Free Worlds League, Lyran Alliance, Word of Blake","Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Free Worlds League, Lyran Alliance","Inner Sphere General, Magistracy of Canopus, Mercenary, Taurian Concordat, Wolf's Dragoons","Clan Wolf (in Exile), Inner Sphere General, Mercenary","ComStar, Unique","Clan Blood Spirit, Clan Fire Mandrill","Federated Commonwealth, Federated Suns, Word of Blake","Circinus Federation, Inner Sphere General, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat, Wolf's Dragoons","Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Free Worlds League, Mercenary, Wolf's Dragoons, Word of Blake","Capellan Confederation, Draconis Combine, Word of Blake","Clan Wolf (in Exile), Lyran Alliance","Federated Commonwealth, Federated Suns, Lyran Alliance, Mercenary, Wolf's Dragoons","Draconis Combine, Federated Commonwealth, Federated Suns, Lyran Alliance, Mercenary, Taurian Concordat, Wolf's Dragoons","Capellan Confederation, ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, HW Clan General, IS Clan General, Lyran Alliance, Mercenary, Wolf's Dragoons, Word of Blake","ComStar, Federated Commonwealth, Federated Suns, Lyran Alliance, Word of Blake","Clan Steel Viper, Clan Wolf (in Exile)","Clan Nova Cat, Inner Sphere General, Magistracy of Canopus, Mercenary, Wolf's Dragoons","Capellan Confederation, Federated Commonwealth, Federated Suns, Free Worlds League, Lyran Alliance, St. Ives Compact","Clan Hell's Horses, Clan Wolf, Clan Wolf (in Exile), ComStar, Free Rasalhague Republic, Word of Blake","Capellan Confederation, ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Lyran Alliance, Mercenary, St. Ives Compact, Wolf's Dragoons, Word of Blake","Capellan Confederation, Clan Diamond Shark, ComStar, Draconis Combine, Federated Commonwealth, Federated Suns, Free Rasalhague Republic, Lyran Alliance, Mercenary, Wolf's Dragoons, Word of Blake","Inner Sphere General, Mercenary","Clan Cloud Cobra, Clan Coyote, Clan Snow Raven, Clan Star Adder, Clan Steel Viper, IS Clan General","Clan Cloud Cobra, Clan Coyote, Clan Ghost Bear, Clan Goliath Scorpion, Clan Hell's Horses, Clan Ice Hellion"],"values":[null,0,1,1,null,2,2,null,0,0,3,null,null,4,4,5,6,7,8,8,9,9,10,10,9,9,10,10,null,8,11,10,3,10,null,3,6,12,12,12,12,6,null,13,0,0,13,14,15,null,16,0,0,16,17,null,null,0,0,null,18,18,18,18,18,null,0,3,0,0,null,10,10,null,0,0,0,null,0,null,19,null,0,20,0,2,0,null,null,0,null,21,22,0,null,0,0,0,null,8,8,0,8,null,8,8,8,23,null,6,8,8,0,null,9,24,1,null,0,0,0,0,0,null,0,3,null,0,0,25,18,null,null,null,null,0,0,9,9,26,4,null,0,0,0,0,27,3,3,3,null,0,28,28,0,null,0,null,0,0,0,0,29,0,0,23,null,9,9,null,null,30,31,9,9,9,0,0,null,3,3,3,0,0,null,null,0,0,0,null,32,32,null,33,null,16,16,0,16,16,16,0,null,null,0,null,0,null,null,3,34,34,0,0,0,0,26,0,0,0,0,null,0,16,0,null,0,0,null,3,0,35,36,37,0,0,11,28,0,null,0,null,38,39,39,3,39,39,null,null,0,null,40,40,40,41,41,null,42,0,0,14,null,null,11,0,0,43,0,0,43,9,44,0,43,0,0,45,null,0,0,46,46,null,0,null,0,0,null,0,47,47,47,47,47,0,47,47,40,40,40,40,27,3,9,6,8,null,null,0,0,14,3,0,9,9,42,42,0,0,0,9,48,0,0,0,0,null,49,49,49,0,49,null,null,3,null,9,23,50,0,28,48,null,0,null,null,26,0,51,0,0,0,0,0,0,null,28,28,null,0,null,null,null,null,null,0,0,null,19,18,0,28,null,27,0,27,null,0,0,0,0,0,0,0,0,0,0,null,null,1,1,52,0,0,1,1,52,52,null,0,null,42,42,42,14,0,null,null,0,null,53,0,28,0,54,0,28,28,0,0,null,9,0,0,null,9,55,28,28,0,null,0,null,37,null,0,null,0,0,0,null,0,16,37,null,0,0,null,null,0,null,0,56,57,16,18,16,57,0,16,0,null,0,14,null,0,null,9,9,null,null,0,0,null,null,null,58,0,59,60,61,62,0,58,0,null,0,0,0,0,null,0,0,null,null,null,0,0,0,null,0,0,0,0,0,0,0,0,0,0,0,0,null,3,null,0,null,26,0,null,null,42,42,0,0,0,0,14,3,3,null,0,0,null,0,null,0,null,0,0,null,0,null,0,null,0,null,63,64,63,0,0,null,0,3,0,0,0,0,0,0,null,0,65,0,null,0,null,0,0,null,0,null,66,0,67,67,67,67,47,0,0,47,0,40,40,40,40,40,40,40,40,0,null,40,null,null,null,0,null,0,0,0,null,0,0,9,9,null,68,3,69,70,0,0,16,4,0,null,0,0,0,0,null,1,0,0,9,71,0,0,null,0,0,72,72,72,0,0,72,null,0,null,1,0,0,null,0,null,0,0,null,73,0,11,null,0,null,3,null,null,0,null,16,16,16,0,38,0,16,10,10,null,0,0,null,0,0,null,0,null,0,0,null,null,null,48,0,0,0,0,null,null,0,3,null,50,3,9,0,0,0,4,0,16,18,60,0,0,0,0,0,0,0,0,null,0,null,null,0,0,0,null,0,null,0,74,0,10,0,10,10,0,null,3,27,14,3,3,9,9,null,0,0,0,0,0,0,0,0,0,null,9,0,0,0,0,9,0,null,0,3,3,75,0,0,0,0,0,0,null,0,null,0,0,0,0,null,null,3,3,null,9,42,0,null,0,76,77,77,0,71,0,0,3,3,3,0,null,null,0,0,78,null,null,null,null,0,null,79,38,0,79,0,80,null,0,0,0,26,null,0,0,0,0,null,43,9,0,0,null,0,0,0,0,null,37,37,0,81,37,37,82,null,0,83,83,null,0,3,null,3,0,12,null,0,84,0,0,null,85,0,0,0,null,0,null,48,null,null,0,0,null,3,null,null,0,0,null,14,null,0,null,1,1,0,0,0,1,null,null,1,0,null,null,0,0,null,null,18,1,18,null,0,0,0,0,null,0,0,null,null,0,16,16,16,null,0,14,null,0,3,6,0,0,0,null,null,0,null,null,14,3,18,86,42,37,87,0,0,0,null,0,0,0,null,null,0,0,88,0,38,9,89,37,0,9,null,null,0,null,0,0,0,0,0,0,null,0,0,null,0,0,3,0,0,3,14,90,null,null,0,null,null,null,0,91,null,0,92,92,0,0,18,92,null,93,18,0,0,0,93,17,null,null,9,3,9,3,94,94,94,94,0,0,94,null,0,null,null,28,0,0,0,95,null,null,0,null,0,0,18,null,0,0,0,null,0,11,11,null,null,0,0,96,97,0,0,0,null,0,0,18,18,0,0,18,0,98,57,57,0,0,null,0,0,3,3,3,3,3,99,100,101,0,0,0,101,null,0,0,null,0,0,0,0,null,102,0,103,16,103,0,0,0,0,104,14,0,0,null,null,null,null,105,0,105,0,106,0,107,null,0,null,0,0,null,null,0,0,null,0,null,108,0,109,null,77,18,18,null,null,null,null,null,null,null,0,0,0,null]},"Jihad (3068 - 3085)":{"dict":["Federated Suns","Federated Suns, Lyran Alliance","Fronc Reaches, Taurian Concordat","Draconis Combine, Federated Suns, Lyran Alliance, Mercenary","Unknown","Extinct","Capellan Confederation","Calderon Protectorate, Capellan Confederation, Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Escorpi\u00f3n Imperio, HW Clan General, Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Fronc Reaches, Marian Hegemony, Taurian Concordat","Escorpi\u00f3n Imperio, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","HW Clan General, Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Inner Sphere General, Mercenary, Periphery General","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","HW Clan General, Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Periphery General, Society, Wolf's Dragoons","HW Clan General","Capellan Confederation, Draconis Combine, Federated Suns, Lyran Alliance","Draconis Combine, Federated Suns","Capellan Confederation, Draconis Combine, Federated Suns, Filtvelt Coalition, Lyran Alliance","HW Clan General, IS Clan General, Society","Capellan Confederation, ComStar, Draconis Combine, Federated Suns, Filtvelt Coalition, Free Rasalhague Republic, Lyran Alliance, Word of Blake","Inner Sphere General, Kell Hounds, Mercenary, Wolf's Dragoons","ComStar, Word of Blake","Draconis Combine, Federated Suns, Filtvelt Coalition, Free Worlds League, Kell Hounds, Lyran Alliance, Mercenary, Wolf's Dragoons","Clan Diamond Shark","IS Clan General","Federated Suns, Filtvelt Coalition","Word of Blake","Draconis Combine, Unique","Draconis Combine","Kell Hounds, Mercenary, Wolf's Dragoons","Inner Sphere General, Periphery General","Taurian Concordat","Federated Suns, Taurian Concordat","Clan Blood Spirit, Clan Stone Lion","Kell Hounds, Lyran Alliance, Mercenary, Wolf's Dragoons","Lyran Alliance","Mercenary","HW Clan General, Inner Sphere General, IS Clan General","Federated Suns, Filtvelt Coalition, Lyran Alliance","Clan Snow Raven, Outworlds Alliance, Unique","Capellan Confederation, Word of Blake","Clan Ghost Bear","Free Worlds League","Inner Sphere General","Unique","Capellan Confederation, Fronc Reaches, Magistracy of Canopus","Fronc Reaches, Magistracy of Canopus","Magistracy of Canopus","Federated Suns, Free Rasalhague Republic, Kell Hounds, Lyran Alliance, Mercenary, Periphery General, Wolf's Dragoons","Clan Hell's Horses","Clan Burrock, Clan Cloud Cobra, Clan Goliath Scorpion, Clan Ice Hellion, Clan Star Adder, Clan Stone Lion, Escorpi\u00f3n Imperio","Draconis Combine, Federated Suns, IS Clan General, Mercenary, Outworlds Alliance","Capellan Confederation, Fronc Reaches, Kell Hounds, Magistracy of Canopus, Mercenary, Taurian Concordat, Wolf's Dragoons, Word of Blake","ComStar, HW Clan General, Word of Blake","Filtvelt Coalition, Inner Sphere General, Kell Hounds, Mercenary, Wolf's Dragoons","Federated Suns, Unique","Capellan Confederation, ComStar, Draconis Combine, Federated Suns, Free Rasalhague Republic, Free Worlds League, Lyran Alliance","Fronc Reaches, Inner Sphere General, Mercenary, Taurian Concordat","Capellan Confederation, Draconis Combine, Federated Suns, Free Rasalhague Republic, Free Worlds League, Lyran Alliance, Mercenary, Periphery General","Marian Hegemony","Inner Sphere General, Mercenary","HW Clan General, IS Clan General, Society, Wolf's Dragoons","ComStar, Draconis Combine, Federated Suns, Free Rasalhague Republic, Lyran Alliance, Wolf's Dragoons, Word of Blake","Clan Goliath Scorpion, Clan Stone Lion, Escorpi\u00f3n Imperio","Capellan Confederation, Draconis Combine","Capellan Confederation, Draconis Combine, Federated Suns, Free Worlds League, Kell Hounds, Lyran Alliance, Mercenary, Wolf's Dragoons, Word of Blake","Clan Jade Falcon, Escorpi\u00f3n Imperio, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Capellan Confederation, Unique","Pirates, Unique","Clan Wolf, Wolf's Dragoons","Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Escorpi\u00f3n Imperio, HW Clan General, IS Clan General, Society","Periphery General","Free Worlds League, Unique","Clan Burrock, Clan Hell's Horses, Clan Star Adder, Clan Stone Lion","Marian Hegemony, Mercenary","Escorpi\u00f3n Imperio, Free Worlds League, Word of Blake","Draconis Combine, Federated Suns, Free Worlds League, Lyran Alliance","Fronc Reaches, Inner Sphere General, Kell Hounds, Mercenary, Outworlds Alliance, Taurian Concordat, Wolf's Dragoons","Clan Jade Falcon","ComStar","Capellan Confederation, Draconis Combine, Federated Suns, Free Worlds League, Lyran Alliance, Word of Blake","Draconis Combine, Federated Suns, Lyran Alliance, Word of Blake","Draconis Combine, Word of Blake","Draconis Combine, Federated Suns, Lyran Alliance","Clan Diamond Shark, Clan Nova Cat, Draconis Combine, Federated Suns, Filtvelt Coalition, Lyran Alliance","Marian Hegemony, Taurian Concordat","Capellan Confederation, Draconis Combine, Escorpi\u00f3n Imperio, Federated Suns, Free Worlds League, Mercenary, Periphery General","Calderon Protectorate, Capellan Confederation, Free Worlds League, Fronc Reaches, Lyran Alliance, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat","Capellan Confederation, Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Capellan Confederation, Draconis Combine, Free Worlds League, Mercenary, Periphery General","Capellan Confederation, Draconis Combine, Federated Suns, Filtvelt Coalition, Free Worlds League, Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Capellan Confederation, Draconis Combine, Federated Suns, Free Worlds League, Mercenary, Periphery General","Capellan Confederation, Clan Jade Falcon, Clan Nova Cat, Clan Wolf, Clan Wolf (in Exile), ComStar, Draconis Combine, Federated Suns, Free Worlds League, Lyran Alliance","Free Worlds League, Lyran Alliance, Unique","Free Worlds League, Word of Blake","Magistracy of Canopus, Unique","ComStar, Federated Suns, Lyran Alliance, Mercenary, Word of Blake","ComStar, Draconis Combine, Federated Suns, Filtvelt Coalition, Lyran Alliance, Word of Blake","Pirates","ComStar, Draconis Combine, Federated Suns, Filtvelt Coalition, Free Worlds League, Lyran Alliance, Marian Hegemony, Mercenary","Capellan Confederation, Magistracy of Canopus","Federated Suns, Kell Hounds, Lyran Alliance, Mercenary, Wolf's Dragoons","Clan Wolf, HW Clan General, Wolf's Dragoons","Capellan Confederation, Federated Suns, Lyran Alliance","Lyran Alliance, Mercenary","Federated Suns, Lyran Alliance, Word of Blake","Clan Burrock, Clan Cloud Cobra, Clan Diamond Shark, Clan Ghost Bear, Clan Goliath Scorpion, Clan Hell's Horses, Clan Ice Hellion, Clan Nova Cat, Clan Star Adder, Clan Stone Lion, Clan Wolf, Clan Wolf (in Exile), Escorpi\u00f3n Imperio","Clan Hell's Horses, Escorpi\u00f3n Imperio","Federated Suns, Lyran Alliance, Marian Hegemony, Mercenary","Clan Snow Raven, Outworlds Alliance","Federated Suns, Filtvelt Coalition, Lyran Alliance, Mercenary, Word of Blake","Escorpi\u00f3n Imperio, HW Clan General, IS Clan General, Society, Wolf's Dragoons","Clan Nova Cat, Draconis Combine","Capellan Confederation, Magistracy of Canopus, Taurian Concordat","Clan Hell's Horses, Unique","Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Outworlds Alliance, Taurian Concordat, Wolf's Dragoons","Clan Ghost Bear, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Clan Diamond Shark, Clan Ghost Bear, Clan Hell's Horses, Clan Jade Falcon, Clan Wolf, Escorpi\u00f3n Imperio, HW Clan General, Society, Word of Blake","Federated Suns, Filtvelt Coalition, Lyran Alliance, Mercenary","Capellan Confederation, Federated Suns, Word of Blake","Clan Snow Raven","Federated Suns, Magistracy of Canopus, Taurian Concordat","Clan Jade Falcon, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Clan Diamond Shark, Clan Nova Cat, Draconis Combine","Clan Ghost Bear, Free Rasalhague Republic","Clan Wolf (in Exile), Federated Suns, Filtvelt Coalition, Lyran Alliance","Taurian Concordat, Unique","Clan Wolf (in Exile), Federated Suns, Filtvelt Coalition, Free Rasalhague Republic, Lyran Alliance, Mercenary","Clan Wolf (in Exile), Federated Suns","Lyran Alliance, Unique","HW Clan General, IS Clan General","Clan Nova Cat","Clan Jade Falcon, Clan Nova Cat, Clan Wolf","Capellan Confederation, Federated Suns, Magistracy of Canopus","ComStar, Draconis Combine, Escorpi\u00f3n Imperio, Federated Suns, Free Rasalhague Republic, Free Worlds League, Lyran Alliance, Word of Blake","Draconis Combine, Federated Suns, Free Rasalhague Republic, Free Worlds League, Lyran Alliance","Calderon Protectorate, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Taurian Concordat, Wolf's Dragoons","Clan Wolf (in Exile), Inner Sphere General, Mercenary","Escorpi\u00f3n Imperio, HW Clan General, IS Clan General, Society, Word of Blake","ComStar, Unique","Clan Blood Spirit, Clan Burrock, Clan Cloud Cobra, Clan Fire Mandrill, Clan Star Adder, Clan Stone Lion, Draconis Combine, Federated Suns, IS Clan General, Lyran Alliance","Federated Suns, Word of Blake","Circinus Federation, Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat, Wolf's Dragoons","Pirates, Society","Draconis Combine, Federated Suns, Free Rasalhague Republic, Free Worlds League, Kell Hounds, Mercenary, Wolf's Dragoons, Word of Blake","Capellan Confederation, Draconis Combine, Mercenary, Word of Blake","Free Worlds League, Mercenary","Clan Wolf (in Exile), Lyran Alliance","ComStar, Federated Suns","Draconis Combine, Federated Suns, Kell Hounds, Lyran Alliance, Mercenary, Taurian Concordat, Wolf's Dragoons","Capellan Confederation, ComStar, Draconis Combine, Federated Suns, HW Clan General, IS Clan General, Kell Hounds, Lyran Alliance, Mercenary, Wolf's Dragoons, Word of Blake","ComStar, Federated Suns, Lyran Alliance, Word of Blake","Clan Hell's Horses, Clan Steel Viper, Clan Stone Lion, Clan Wolf (in Exile)","Clan Hell's Horses, Clan Wolf (in Exile)","Capellan Confederation, ComStar, Draconis Combine, Federated Suns, Free Rasalhague Republic, Free Worlds League, Kell Hounds, Lyran Alliance, Mercenary, Periphery General, Wolf's Dragoons","Clan Nova Cat, Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Wolf's Dragoons","Capellan Confederation, Federated Suns, Filtvelt Coalition, Free Worlds League, Lyran Alliance","Capellan Confederation, Federated Suns, Free Worlds League, Lyran Alliance","Capellan Confederation, ComStar, Draconis Combine, Federated Suns, Free Rasalhague Republic, Free Worlds League, Kell Hounds, Lyran Alliance, Magistracy of Canopus, Mercenary, Wolf's Dragoons","Capellan Confederation, ComStar, Draconis Combine, Federated Suns, Free Rasalhague Republic, Free Worlds League, Kell Hounds, Lyran Alliance, Mercenary, Wolf's Dragoons","Clan Hell's Horses, Clan Wolf, Clan Wolf (in Exile), ComStar, Escorpi\u00f3n Imperio, Free Rasalhague Republic, Word of Blake","Capellan Confederation, ComStar, Draconis Combine, Federated Suns, Free Rasalhague Republic, Kell Hounds, Lyran Alliance, Mercenary, Wolf's Dragoons, Word of Blake","Capellan Confederation, Clan Diamond Shark, ComStar, Draconis Combine, Federated Suns, Free Rasalhague Republic, Kell Hounds, Lyran Alliance, Mercenary, Wolf's Dragoons, Word of Blake","Clan Burrock, Clan Cloud Cobra, Clan Coyote, Clan Ghost Bear, Clan Goliath Scorpion, Clan Hell's Horses, Clan Ice Hellion, Clan Star Adder, Clan Stone Lion, Escorpi\u00f3n Imperio"],"values":[null,0,1,1,null,2,2,null,3,4,5,null,null,6,6,7,8,9,8,8,10,10,10,10,10,10,10,10,null,11,12,13,5,13,null,5,14,15,15,15,15,14,null,16,1,17,18,19,20,null,21,22,23,21,21,null,null,24,25,null,26,0,26,26,26,null,27,5,22,27,null,13,13,null,28,29,30,null,27,null,31,null,32,33,32,2,2,null,null,34,null,35,36,36,null,4,4,4,null,8,8,2,8,null,8,8,8,37,null,8,8,8,27,null,13,38,39,null,4,4,4,4,4,null,4,5,null,40,0,41,0,null,null,null,null,42,36,13,13,43,6,null,4,4,0,0,22,5,5,5,null,17,44,44,4,null,45,null,46,47,48,36,49,36,45,5,null,13,13,null,null,50,51,13,13,13,4,4,null,5,5,5,4,4,null,null,4,52,25,null,53,53,null,54,null,21,55,4,55,55,21,56,null,null,4,null,4,null,null,5,57,57,4,4,4,4,43,4,4,43,4,null,4,21,27,null,4,4,null,5,4,58,59,29,60,4,12,61,4,null,4,null,62,63,63,5,63,63,null,null,64,null,30,30,30,65,65,null,27,27,27,19,null,null,12,4,66,67,68,4,67,13,61,4,67,4,4,25,null,45,4,36,36,null,4,null,4,69,null,50,70,70,70,70,70,70,70,70,30,30,30,30,22,5,13,8,8,null,null,71,32,72,5,4,10,13,27,27,4,4,4,13,73,4,4,4,74,null,75,75,75,50,75,null,null,5,null,13,76,45,4,44,73,null,4,null,null,43,4,77,4,4,4,4,4,4,null,44,44,null,27,null,null,null,null,null,4,4,null,31,44,78,44,null,22,27,22,null,4,4,4,4,4,4,4,4,4,4,null,null,1,1,79,4,4,1,1,79,79,null,80,null,27,27,27,72,81,null,null,4,null,82,83,44,4,84,85,44,44,4,28,null,13,13,13,null,13,80,44,44,45,null,4,null,29,null,4,null,36,36,36,null,66,21,29,null,4,4,null,null,4,null,69,86,85,21,0,55,85,23,55,4,null,50,19,null,4,null,10,13,null,null,4,87,null,null,null,88,4,89,90,91,92,27,93,4,null,28,4,29,29,null,94,4,null,null,null,0,69,6,null,95,4,4,4,4,4,4,4,4,4,4,4,null,5,null,4,null,96,27,null,null,27,27,4,4,4,4,19,5,5,null,50,4,null,4,null,97,null,4,4,null,36,null,4,null,98,null,99,29,99,56,100,null,4,5,4,4,4,4,101,4,null,68,102,102,null,4,null,4,4,null,29,null,103,4,104,104,104,104,70,70,70,70,45,30,30,30,30,30,30,30,30,30,null,30,null,null,null,4,null,4,4,4,null,13,13,13,13,null,0,5,105,106,4,4,21,6,4,null,21,4,4,4,null,107,4,107,13,107,4,4,null,4,4,108,108,108,109,109,108,null,4,null,1,110,56,null,111,null,4,4,null,112,4,12,null,4,null,5,null,null,50,null,21,21,21,21,113,4,21,13,13,null,4,4,null,0,0,null,4,null,4,4,null,null,null,73,114,29,114,4,null,null,29,29,null,45,5,13,4,66,90,6,21,21,21,115,4,4,45,4,4,4,4,4,null,4,null,null,4,50,116,null,4,null,4,117,4,118,4,10,13,27,null,5,22,19,5,5,10,13,null,4,4,4,4,4,27,27,27,27,null,13,4,4,4,4,13,4,null,27,5,5,119,81,4,4,4,4,4,null,36,null,4,4,4,4,null,null,5,5,null,13,27,4,null,45,120,17,17,17,107,0,4,5,5,5,36,null,null,121,27,121,null,null,null,null,122,null,47,113,4,47,4,123,null,68,6,6,43,null,4,4,4,4,null,124,13,27,4,null,4,74,96,27,null,29,29,74,125,29,29,28,null,126,126,126,null,50,5,null,5,36,15,null,4,127,4,128,null,129,130,4,131,null,4,null,73,null,null,4,4,null,5,null,null,4,4,null,132,null,27,null,1,1,1,1,4,1,null,null,1,4,null,null,133,134,null,null,0,1,56,null,4,4,4,4,null,50,116,null,null,135,21,21,21,null,22,132,null,43,5,14,43,43,43,null,null,4,null,null,132,5,0,136,27,29,137,4,4,100,null,27,102,27,null,null,4,4,138,4,113,13,139,29,4,13,null,null,4,null,4,4,4,4,4,4,null,36,36,null,0,0,5,4,4,5,140,141,null,null,45,null,null,null,4,142,null,13,143,143,13,143,0,143,null,144,0,4,4,4,144,117,null,null,13,5,13,145,146,146,146,146,146,146,146,null,4,null,null,44,66,66,4,147,null,null,148,null,4,0,0,null,42,4,4,null,43,13,13,null,null,4,4,149,103,36,4,27,null,27,0,150,150,150,150,150,4,151,85,85,85,56,null,4,4,5,5,5,5,5,152,153,154,155,155,4,154,null,156,4,null,4,4,4,4,null,157,4,158,21,159,160,161,4,69,162,72,22,27,null,null,null,null,163,4,163,4,164,4,61,null,4,null,149,36,null,null,36,36,null,4,null,19,42,165,null,17,0,0,null,null,null,null,null,null,null,4,4,4,null]},"Early Republic (3086 - 3100)":{"dict":["Federated Suns","Fronc Reaches, Taurian Concordat","Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary","Lyran Commonwealth, Mercenary","Extinct","Capellan Confederation","Calderon Protectorate, Capellan Confederation, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Escorpi\u00f3n Imperio, Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Fronc Reaches, Marian Hegemony, Taurian Concordat","Escorpi\u00f3n Imperio, Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance","Escorpi\u00f3n Imperio, Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion","Inner Sphere General, IS Clan General, Mercenary, Periphery General","Inner Sphere General, Mercenary, Periphery General","Calderon Protectorate, Federated Suns, Filtvelt Coalition, Fronc Reaches, Taurian Concordat","Capellan Confederation, Draconis Combine, Federated Suns, Lyran Commonwealth, Republic of the Sphere","Federated Suns, Lyran Commonwealth, Republic of the Sphere","Clan Nova Cat, Draconis Combine, Federated Suns","Federated Suns, Filtvelt Coalition","Clan Diamond Shark, Clan Hell's Horses, Clan Nova Cat, Clan Wolf, Clan Wolf (in Exile), Rasalhague Dominion","Capellan Confederation, Draconis Combine, Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Republic of the Sphere","Inner Sphere General, Mercenary","Filtvelt Coalition, Inner Sphere General, Mercenary","Filtvelt Coalition, Fronc Reaches, Inner Sphere General, Magistracy of Canopus, Marian Hegemony, Mercenary","Clan Diamond Shark","IS Clan General, Republic of the Sphere","Calderon Protectorate, Federated Suns, Filtvelt Coalition","Republic of the Sphere","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Draconis Combine, Unique","Draconis Combine, Republic of the Sphere","Capellan Confederation, Clan Nova Cat, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Magistracy of Canopus, Mercenary, Republic of the Sphere, Wolf's Dragoons","Federated Suns, Republic of the Sphere","Federated Suns, Fronc Reaches, Taurian Concordat","Unknown","Kell Hounds, Lyran Commonwealth, Mercenary, Wolf's Dragoons","Lyran Commonwealth","Escorpi\u00f3n Imperio, Inner Sphere General, IS Clan General, Mercenary, Periphery General","Mercenary","Inner Sphere General, IS Clan General, Mercenary","Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Republic of the Sphere","Outworlds Alliance, Raven Alliance, Unique","Capellan Confederation, Republic of the Sphere","Rasalhague Dominion","Capellan Confederation, Draconis Combine, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Mercenary, Periphery General","Free Worlds League (Duchy of Andurien), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality)","Capellan Confederation, Fronc Reaches, Magistracy of Canopus","Federated Suns, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Republic of the Sphere","Inner Sphere General, Rasalhague Dominion","Filtvelt Coalition, Inner Sphere General","Capellan Confederation, Rasalhague Dominion","Fronc Reaches, Magistracy of Canopus","Magistracy of Canopus","Clan Nova Cat, Clan Wolf (in Exile), Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth","Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance","Capellan Confederation, Unique","Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Clan Hell's Horses, Rasalhague Dominion","Escorpi\u00f3n Imperio","Inner Sphere General, Mercenary, Periphery General, Raven Alliance","Capellan Confederation, Magistracy of Canopus, Mercenary","Federated Suns, Free Worlds League (Duchy of Andurien), Republic of the Sphere","Clan Diamond Shark, Clan Hell's Horses, Fronc Reaches, Inner Sphere General, Magistracy of Canopus, Mercenary","Inner Sphere General, IS Clan General","Capellan Confederation, Fronc Reaches, Kell Hounds, Magistracy of Canopus, Mercenary, Republic of the Sphere, Taurian Concordat, Wolf's Dragoons","Federated Suns, Unique","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Regulan Fiefs), Lyran Commonwealth","Capellan Confederation, Draconis Combine, Federated Suns, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Rasalhague Dominion","Unique","Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Mercenary","Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Republic of the Sphere","Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality)","Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Regulan Fiefs)","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Mercenary","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Mercenary, Republic of the Sphere","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Magistracy of Canopus, Marian Hegemony, Mercenary","Inner Sphere General","Free Worlds League (Marik-Stewart Commonwealth), Republic of the Sphere","Fronc Reaches, Inner Sphere General, Mercenary, Taurian Concordat","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Mercenary, Periphery General","Draconis Combine","Marian Hegemony, Mercenary, Pirates","Federated Suns, Filtvelt Coalition, Mercenary, Republic of the Sphere","Clan Hell's Horses, Clan Jade Falcon, Clan Wolf (in Exile), Rasalhague Dominion, Raven Alliance, Wolf's Dragoons","Draconis Combine, Federated Suns, Lyran Commonwealth, Republic of the Sphere, Wolf's Dragoons","Capellan Confederation, Draconis Combine","Clan Hell's Horses, Clan Wolf, Clan Wolf (in Exile), Rasalhague Dominion","Calderon Protectorate, Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat, Wolf's Dragoons","Clan Jade Falcon, Escorpi\u00f3n Imperio, Inner Sphere General, Mercenary, Periphery General","Inner Sphere General, Kell Hounds, Mercenary, Wolf's Dragoons","Periphery General","IS Clan General","Lyran Commonwealth, Republic of the Sphere","Calderon Protectorate, Filtvelt Coalition, Inner Sphere General, Mercenary, Pirates","Clan Hell's Horses","Pirates, Unique","Clan Hell's Horses, Clan Wolf (in Exile), Rasalhague Dominion","Clan Wolf, Lyran Commonwealth, Republic of the Sphere","Fronc Reaches, Inner Sphere General, Magistracy of Canopus","Capellan Confederation, Mercenary, Periphery General","Calderon Protectorate, Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Clan Hell's Horses, Clan Jade Falcon, Escorpi\u00f3n Imperio, Raven Alliance","Capellan Confederation, Escorpi\u00f3n Imperio, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Periphery General, Republic of the Sphere","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Periphery General, Republic of the Sphere","Marian Hegemony, Mercenary","Capellan Confederation, Free Worlds League (Duchy of Andurien), Periphery General","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Republic of the Sphere","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Mercenary, Republic of the Sphere","Capellan Confederation, Escorpi\u00f3n Imperio, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere","Clan Nova Cat, Draconis Combine, Republic of the Sphere","Clan Diamond Shark, Clan Hell's Horses, Clan Nova Cat, Clan Wolf (in Exile), Inner Sphere General, Mercenary","Filtvelt Coalition, Inner Sphere General, Magistracy of Canopus, Mercenary","Clan Diamond Shark, Draconis Combine, Federated Suns, Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Rim Commonality), Lyran Commonwealth, Republic of the Sphere","Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion","Capellan Confederation, Draconis Combine, Federated Suns, Mercenary, Rasalhague Dominion, Republic of the Sphere","Federated Suns, Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Republic of the Sphere","Federated Suns, Lyran Commonwealth, Mercenary, Periphery General, Republic of the Sphere","Federated Suns, Lyran Commonwealth","Federated Suns, Lyran Commonwealth, Mercenary, Periphery General","Clan Jade Falcon, Clan Wolf","Escorpi\u00f3n Imperio, IS Clan General, Republic of the Sphere","Inner Sphere General, Magistracy of Canopus, Mercenary","Draconis Combine, Federated Suns, Lyran Commonwealth","Draconis Combine, Federated Suns, Lyran Commonwealth, Republic of the Sphere","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Wolf's Dragoons","Clan Jade Falcon","Lyran Commonwealth, Mercenary, Republic of the Sphere","Pirates","Clan Diamond Shark, Clan Nova Cat, Clan Wolf (in Exile), Draconis Combine, Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Republic of the Sphere","Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Republic of the Sphere","Clan Diamond Shark, Clan Nova Cat, Clan Wolf (in Exile), Draconis Combine, Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Mercenary, Republic of the Sphere","Draconis Combine, Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Mercenary","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Magistracy of Canopus","Capellan Confederation, Draconis Combine, Escorpi\u00f3n Imperio, Federated Suns, Free Worlds League (Duchy of Andurien), Free Worlds League (Regulan Fiefs), Mercenary, Periphery General, Raven Alliance","Calderon Protectorate, Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Regulan Fiefs), Fronc Reaches, Magistracy of Canopus, Marian Hegemony, Taurian Concordat","Calderon Protectorate, Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Regulan Fiefs), Fronc Reaches, Magistracy of Canopus, Marian Hegemony, Taurian Concordat","Capellan Confederation, Draconis Combine, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Mercenary, Periphery General, Raven Alliance","Capellan Confederation, Draconis Combine, Federated Suns, Filtvelt Coalition, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Federated Suns, Mercenary, Republic of the Sphere","Free Worlds League (Oriente Protectorate), Lyran Commonwealth","Inner Sphere General, Periphery General","Magistracy of Canopus, Unique","Federated Suns, Lyran Commonwealth, Mercenary, Republic of the Sphere","Draconis Combine, Federated Suns, Filtvelt Coalition","Clan Diamond Shark, Clan Nova Cat, Clan Wolf (in Exile), Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Mercenary, Rasalhague Dominion, Republic of the Sphere","Calderon Protectorate, Draconis Combine, Federated Suns, Filtvelt Coalition, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Marian Hegemony, Mercenary, Republic of the Sphere","Capellan Confederation, Magistracy of Canopus","Lyran Commonwealth, Marian Hegemony, Mercenary, Taurian Concordat","Federated Suns, Kell Hounds, Lyran Commonwealth, Mercenary, Wolf's Dragoons","Clan Wolf","Clan Jade Falcon, Unique","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance, Wolf's Dragoons","Inner Sphere General, Kell Hounds, Mercenary, Rasalhague Dominion, Wolf's Dragoons","Draconis Combine, Mercenary, Republic of the Sphere","Federated Suns, Free Worlds League (Oriente Protectorate), Lyran Commonwealth, Mercenary, Republic of the Sphere","Clan Diamond Shark, Clan Hell's Horses, Clan Wolf, Clan Wolf (in Exile), Escorpi\u00f3n Imperio, Rasalhague Dominion","Federated Suns, Lyran Commonwealth, Marian Hegemony, Mercenary, Republic of the Sphere, Taurian Concordat","Clan Diamond Shark, Outworlds Alliance, Rasalhague Dominion, Raven Alliance","Capellan Confederation, Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Mercenary, Republic of the Sphere","Clan Hell's Horses, Clan Jade Falcon","Escorpi\u00f3n Imperio, IS Clan General, Wolf's Dragoons","Calderon Protectorate, Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Capellan Confederation, Periphery General","Lyran Commonwealth, Unique","Clan Hell's Horses, Unique","Escorpi\u00f3n Imperio, Inner Sphere General, Mercenary, Periphery General","Clan Hell's Horses, Clan Jade Falcon, Clan Wolf, Escorpi\u00f3n Imperio, Rasalhague Dominion, Republic of the Sphere","Federated Suns, Filtvelt Coalition, Free Worlds League (Duchy of Andurien), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Lyran Commonwealth, Marian Hegemony, Mercenary, Republic of the Sphere","Draconis Combine, Federated Suns, Republic of the Sphere","Capellan Confederation, Draconis Combine, Federated Suns, Free Worlds League (Duchy of Tamarind-Abbey), Fronc Reaches, Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere","Calderon Protectorate, Federated Suns, Filtvelt Coalition, Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Republic of the Sphere","Capellan Confederation, Federated Suns, Republic of the Sphere","Clan Diamond Shark, Rasalhague Dominion, Raven Alliance","Escorpi\u00f3n Imperio, IS Clan General","Capellan Confederation, Federated Suns, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Mercenary, Taurian Concordat","Calderon Protectorate, Capellan Confederation, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat","Capellan Confederation, Free Worlds League (Duchy of Andurien), Magistracy of Canopus","Capellan Confederation, Clan Jade Falcon, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Periphery General","Draconis Combine, Federated Suns, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Republic of the Sphere","Free Worlds League (Marik-Stewart Commonwealth), Unique","Clan Diamond Shark, Clan Nova Cat, Draconis Combine, Republic of the Sphere","Clan Hell's Horses, Clan Jade Falcon, Clan Wolf, Clan Wolf (in Exile), Republic of the Sphere","Clan Wolf (in Exile), Federated Suns, Filtvelt Coalition, Free Worlds League (Regulan Fiefs), Lyran Commonwealth, Mercenary, Republic of the Sphere","Taurian Concordat, Unique","Clan Wolf (in Exile), Federated Suns, Filtvelt Coalition, Free Worlds League (Regulan Fiefs), Fronc Reaches, Lyran Commonwealth, Mercenary, Rasalhague Dominion, Republic of the Sphere, Taurian Concordat","Clan Wolf (in Exile), Federated Suns, Lyran Commonwealth, Republic of the Sphere","Clan Wolf (in Exile), Lyran Commonwealth","Clan Hell's Horses, Clan Jade Falcon, Rasalhague Dominion","Clan Nova Cat, Draconis Combine","Clan Hell's Horses, Republic of the Sphere","Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Rasalhague Dominion, Raven Alliance, Wolf's Dragoons","Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Magistracy of Canopus, Mercenary","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Magistracy of Canopus","Free Worlds League (Duchy of Andurien)","Escorpi\u00f3n Imperio, Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Rim Commonality), Lyran Commonwealth, Pirates, Rasalhague Dominion","Draconis Combine, Federated Suns","Capellan Confederation, Clan Hell's Horses, Clan Wolf, Clan Wolf (in Exile), Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary","Inner Sphere General, Kell Hounds, Mercenary, Periphery General","Clan Nova Cat, Clan Wolf (in Exile), Inner Sphere General, Magistracy of Canopus, Mercenary, Taurian Concordat","Draconis Combine, Periphery General","Clan Wolf (in Exile), Kell Hounds","Clan Wolf (in Exile), Kell Hounds, Lyran Commonwealth, Pirates","Free Worlds League (Regulan Fiefs), Lyran Commonwealth","Republic of the Sphere, Unique","Clan Diamond Shark, Inner Sphere General","Clan Nova Cat, Clan Wolf (in Exile), Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","IS Clan General, Kell Hounds, Mercenary, Periphery General, Raven Alliance, Wolf's Dragoons","Draconis Combine, Federated Suns, Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Oriente Protectorate), Mercenary, Rasalhague Dominion, Republic of the Sphere","Clan Nova Cat, Inner Sphere General, Magistracy of Canopus, Mercenary, Rasalhague Dominion, Raven Alliance","Capellan Confederation, Draconis Combine, Free Worlds League (Duchy of Andurien), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Magistracy of Canopus, Mercenary, Republic of the Sphere, Taurian Concordat","Clan Hell's Horses, Rasalhague Dominion, Raven Alliance","Free Worlds League (Oriente Protectorate)","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance","Clan Wolf (in Exile), Free Worlds League (Regulan Fiefs), Lyran Commonwealth","Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Republic of the Sphere, Taurian Concordat","Clan Diamond Shark, Clan Wolf, Clan Wolf (in Exile), Draconis Combine, Escorpi\u00f3n Imperio, Federated Suns, Lyran Commonwealth, Republic of the Sphere","Clan Diamond Shark, Clan Hell's Horses, Clan Nova Cat, Clan Wolf (in Exile), Lyran Commonwealth, Raven Alliance","Clan Jade Falcon, Federated Suns, Republic of the Sphere","Clan Nova Cat, Fronc Reaches, Inner Sphere General, Magistracy of Canopus, Marian Hegemony, Mercenary","Capellan Confederation, Federated Suns, Filtvelt Coalition, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Republic of the Sphere","Capellan Confederation, Federated Suns, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere","Capellan Confederation, Federated Suns, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Republic of the Sphere","Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Wolf's Dragoons","Federated Suns, Free Worlds League (Regulan Fiefs), Lyran Commonwealth, Republic of the Sphere","Clan Hell's Horses, Clan Wolf, Clan Wolf (in Exile), Rasalhague Dominion, Republic of the Sphere","Escorpi\u00f3n Imperio, IS Clan General, Mercenary, Republic of the Sphere","Republic of the Sphere, Taurian Concordat","Capellan Confederation, Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Republic of the Sphere","Federated Suns, Mercenary","Capellan Confederation, Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Periphery General, Republic of the Sphere","Capellan Confederation, Clan Nova Cat, Draconis Combine, Federated Suns, Free Worlds League (Marik-Stewart Commonwealth), Lyran Commonwealth, Mercenary, Republic of the Sphere","Clan Wolf (in Exile), Lyran Commonwealth, Republic of the Sphere","IS Clan General, Lyran Commonwealth, Republic of the Sphere","Clan Diamond Shark, Clan Hell's Horses, Rasalhague Dominion, Republic of the Sphere","Clan Hell's Horses, Escorpi\u00f3n Imperio, Rasalhague Dominion, Republic of the Sphere"],"values":[null,0,0,0,null,1,1,null,2,3,4,null,null,5,5,6,7,8,7,7,9,9,9,9,10,10,10,10,null,11,12,12,4,12,null,13,11,4,4,4,4,11,null,14,15,16,17,18,19,null,20,4,21,22,22,null,null,23,24,null,25,0,25,25,25,null,4,4,4,26,null,27,27,null,28,29,30,null,31,null,12,null,1,32,1,1,1,null,null,33,null,34,35,35,null,31,31,31,null,7,7,1,7,null,36,36,36,37,null,36,36,36,26,null,12,38,39,null,33,33,33,33,33,null,33,4,null,40,0,41,0,null,null,null,null,42,35,12,43,44,45,null,33,33,46,46,26,4,4,4,null,47,48,48,49,null,33,null,45,50,51,52,53,35,54,4,null,55,55,null,null,56,57,58,12,12,33,59,null,4,4,4,60,61,null,null,38,38,62,null,63,63,null,26,null,20,21,0,21,21,20,64,null,null,11,null,33,null,null,4,65,66,67,68,69,70,71,33,72,73,74,null,67,75,76,null,33,33,null,4,29,77,78,79,80,20,12,20,33,null,81,null,82,83,83,4,83,83,null,null,57,null,4,4,4,84,84,null,26,26,4,85,null,null,12,75,86,87,54,45,87,12,88,89,87,88,27,90,null,33,26,91,91,null,92,null,93,94,null,95,96,96,96,96,96,96,96,96,3,3,3,3,97,4,12,36,36,null,null,98,99,100,4,33,101,12,4,4,33,33,33,102,89,89,33,33,4,null,93,93,93,93,93,null,null,4,null,58,103,67,26,75,104,null,33,null,null,105,106,107,33,33,33,33,33,33,null,4,4,null,4,null,null,null,null,null,108,109,null,12,110,20,75,null,26,111,26,null,11,11,112,33,33,112,11,11,113,112,null,null,35,114,115,3,33,116,116,117,117,null,118,null,26,26,26,119,4,null,null,33,null,120,121,75,79,29,122,75,75,79,28,null,123,123,123,null,27,124,75,75,67,null,33,null,79,null,33,null,35,125,125,null,88,20,79,null,33,33,null,null,33,null,126,127,128,129,15,130,122,48,130,33,null,93,90,null,131,null,12,12,null,null,26,8,null,null,null,132,12,133,134,135,136,4,135,33,null,28,79,79,79,null,62,38,null,null,null,137,4,5,null,138,33,33,33,33,33,33,33,33,33,33,33,null,4,null,33,null,139,4,null,null,4,4,26,26,26,26,4,4,57,null,93,33,null,33,null,140,null,26,26,null,91,null,33,null,141,null,142,4,142,33,126,null,33,4,143,143,143,143,144,15,null,54,145,145,null,33,null,146,33,null,29,null,147,33,148,148,148,148,148,148,148,148,4,4,4,4,4,4,4,4,4,4,null,4,null,null,null,33,null,149,124,33,null,150,53,53,53,null,0,4,5,4,33,33,88,5,33,null,151,90,26,33,null,116,152,15,12,153,33,33,null,33,42,154,154,154,154,154,154,null,0,null,15,155,4,null,156,null,33,33,null,157,33,12,null,123,null,4,null,null,158,null,151,151,151,151,159,33,151,27,27,null,125,91,null,31,0,null,33,null,26,5,null,null,null,126,108,79,108,33,null,null,29,4,null,4,57,58,33,139,160,5,20,20,20,161,141,33,162,15,15,15,15,15,null,33,null,null,56,93,163,null,33,null,33,58,26,53,33,164,12,4,null,4,4,90,4,4,164,12,null,26,26,26,26,26,4,4,4,4,null,58,128,33,84,33,58,33,null,4,4,4,165,4,33,33,33,33,33,null,35,null,33,33,33,33,null,null,4,4,null,58,4,33,null,67,166,167,167,168,31,0,33,4,4,4,169,null,null,170,4,4,null,null,null,null,171,null,50,172,33,50,33,173,null,4,5,174,70,null,145,175,145,26,null,176,12,4,33,null,177,4,75,4,null,29,29,178,179,79,79,28,null,42,42,42,null,180,4,null,4,75,4,null,33,181,33,182,null,183,184,185,162,null,33,null,126,null,null,33,33,null,4,null,null,151,33,null,186,null,4,null,15,15,15,15,15,15,null,null,141,33,null,null,187,179,null,null,141,141,4,null,26,33,33,33,null,188,163,null,null,189,20,20,20,null,4,26,null,190,4,11,191,192,193,null,null,79,null,null,4,4,4,194,26,79,195,33,33,126,null,4,12,4,null,null,118,196,197,33,119,12,198,199,33,12,null,null,33,null,33,33,200,185,33,201,null,91,202,null,31,31,4,33,33,4,165,203,null,null,64,null,null,null,204,62,null,205,31,31,27,0,31,31,null,12,12,0,33,33,12,206,null,null,12,4,12,33,207,207,207,207,207,207,207,null,33,null,null,75,208,20,33,209,null,null,68,null,0,0,0,null,210,33,33,null,211,212,212,null,null,33,33,213,116,35,3,4,null,26,31,31,31,31,31,31,31,214,116,141,15,64,null,79,33,4,4,4,4,4,215,35,216,216,216,216,216,null,123,217,null,75,26,33,12,null,218,33,219,220,221,222,88,223,4,224,225,4,226,null,null,null,null,227,228,229,33,230,33,12,null,33,null,231,185,null,null,75,75,null,15,null,232,233,234,null,195,0,0,null,null,null,null,null,null,null,33,33,33,null]},"Late Republic (3101 - 3130)":{"dict":["Federated Suns","Fronc Reaches, Taurian Concordat","Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary","Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Kell Hounds, Lyran Commonwealth, Mercenary","Extinct","Calderon Protectorate, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Escorpi\u00f3n Imperio, Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Fronc Reaches, Marian Hegemony, Taurian Concordat","Escorpi\u00f3n Imperio, Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance","Escorpi\u00f3n Imperio, Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion","Inner Sphere General, IS Clan General, Mercenary, Periphery General","Inner Sphere General, Mercenary, Periphery General","Calderon Protectorate, Federated Suns, Filtvelt Coalition, Fronc Reaches, Taurian Concordat","Capellan Confederation, Federated Suns, Lyran Commonwealth, Republic of the Sphere","Federated Suns, Lyran Commonwealth, Republic of the Sphere","Clan Nova Cat, Draconis Combine, Federated Suns","Federated Suns, Filtvelt Coalition","Clan Hell's Horses, Clan Nova Cat, Clan Wolf, Clan Wolf (in Exile), Rasalhague Dominion","Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Republic of the Sphere","Inner Sphere General, Mercenary","Filtvelt Coalition, Inner Sphere General, Mercenary","Filtvelt Coalition, Fronc Reaches, Inner Sphere General, Magistracy of Canopus, Marian Hegemony, Mercenary","Clan Sea Fox","IS Clan General, Republic of the Sphere","Calderon Protectorate, Federated Suns, Filtvelt Coalition","Republic of the Sphere","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Draconis Combine, Republic of the Sphere","Capellan Confederation, Clan Nova Cat, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Magistracy of Canopus, Mercenary, Republic of the Sphere, Wolf's Dragoons","Federated Suns, Republic of the Sphere","Unknown","Kell Hounds, Lyran Commonwealth, Mercenary, Wolf's Dragoons","Lyran Commonwealth","Escorpi\u00f3n Imperio, Inner Sphere General, IS Clan General, Mercenary, Periphery General","Mercenary","Inner Sphere General, IS Clan General, Mercenary","Capellan Confederation, Republic of the Sphere","Rasalhague Dominion","Mercenary, Periphery General","Free Worlds League (Duchy of Andurien), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality)","Capellan Confederation, Fronc Reaches, Magistracy of Canopus","Federated Suns, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Republic of the Sphere","Inner Sphere General, Rasalhague Dominion","Draconis Combine, Federated Suns, Filtvelt Coalition","Capellan Confederation, Kell Hounds, Lyran Commonwealth, Mercenary, Rasalhague Dominion, Wolf's Dragoons","Fronc Reaches, Magistracy of Canopus","Magistracy of Canopus","Clan Nova Cat, Clan Wolf (in Exile), Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth","Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance","Capellan Confederation, Lyran Commonwealth","Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Clan Hell's Horses, Rasalhague Dominion","Escorpi\u00f3n Imperio","Capellan Confederation, Magistracy of Canopus, Mercenary","Federated Suns, Free Worlds League (Duchy of Andurien), Magistracy of Canopus, Republic of the Sphere","Clan Hell's Horses, Clan Sea Fox, Fronc Reaches, Inner Sphere General, Magistracy of Canopus, Mercenary","Inner Sphere General, IS Clan General","Capellan Confederation, Fronc Reaches, Kell Hounds, Magistracy of Canopus, Mercenary, Republic of the Sphere, Taurian Concordat, Wolf's Dragoons","Inner Sphere General, IS Clan General, Kell Hounds, Magistracy of Canopus, Mercenary, Taurian Concordat, Wolf's Dragoons","Clan Nova Cat, Clan Sea Fox, Raven Alliance","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Regulan Fiefs), Lyran Commonwealth","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Kell Hounds, Magistracy of Canopus, Mercenary, Republic of the Sphere","Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Republic of the Sphere","Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere","Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Regulan Fiefs)","Marian Hegemony","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Mercenary","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Mercenary, Republic of the Sphere","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Magistracy of Canopus, Marian Hegemony, Mercenary","Inner Sphere General","Free Worlds League (Marik-Stewart Commonwealth), Republic of the Sphere","Draconis Combine, Mercenary, Periphery General","Draconis Combine","Marian Hegemony, Mercenary, Pirates","Inner Sphere General, Magistracy of Canopus, Mercenary, Taurian Concordat","Federated Suns, Filtvelt Coalition, Mercenary, Republic of the Sphere","Clan Wolf (in Exile), Rasalhague Dominion, Raven Alliance, Wolf's Dragoons","Draconis Combine, Republic of the Sphere, Wolf's Dragoons","Clan Hell's Horses, Clan Wolf, Clan Wolf (in Exile), Rasalhague Dominion","Calderon Protectorate, Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat, Wolf's Dragoons","Clan Jade Falcon, Escorpi\u00f3n Imperio, Inner Sphere General, Mercenary, Periphery General","Capellan Confederation, Escorpi\u00f3n Imperio, Federated Suns, Mercenary, Periphery General","Periphery General","Capellan Confederation, Clan Jade Falcon, Escorpi\u00f3n Imperio, Federated Suns, Mercenary, Periphery General","Inner Sphere General, Kell Hounds, Mercenary, Wolf's Dragoons","IS Clan General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","IS Clan General","Lyran Commonwealth, Republic of the Sphere","Calderon Protectorate, Filtvelt Coalition, Inner Sphere General, Mercenary, Pirates","Clan Hell's Horses","Clan Hell's Horses, Clan Wolf (in Exile), Rasalhague Dominion","Clan Wolf, Lyran Commonwealth, Republic of the Sphere","Lyran Commonwealth, Mercenary","Fronc Reaches, Inner Sphere General, Magistracy of Canopus","Capellan Confederation, Mercenary, Periphery General","Calderon Protectorate, Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Clan Hell's Horses, Clan Jade Falcon, Escorpi\u00f3n Imperio, Raven Alliance","Capellan Confederation, Escorpi\u00f3n Imperio, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Periphery General, Republic of the Sphere","Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Mercenary","Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Periphery General, Republic of the Sphere","Inner Sphere General, Mercenary, Periphery General, Raven Alliance","Unique","Capellan Confederation, Free Worlds League (Duchy of Andurien), Periphery General","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Republic of the Sphere","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Mercenary, Republic of the Sphere","Capellan Confederation, Escorpi\u00f3n Imperio, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere","Capellan Confederation, Clan Nova Cat, Draconis Combine, Free Worlds League (Oriente Protectorate), Republic of the Sphere","Clan Hell's Horses, Clan Nova Cat, Clan Sea Fox, Clan Wolf (in Exile), Inner Sphere General, Mercenary","Filtvelt Coalition, Inner Sphere General, Magistracy of Canopus, Mercenary","Clan Sea Fox, Draconis Combine, Federated Suns, Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Rim Commonality), Lyran Commonwealth, Republic of the Sphere","Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion","Federated Suns, Free Worlds League (Regulan Fiefs), Lyran Commonwealth, Mercenary, Rasalhague Dominion, Republic of the Sphere","Capellan Confederation, Draconis Combine, Federated Suns, Mercenary, Rasalhague Dominion, Republic of the Sphere","Federated Suns, Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Republic of the Sphere","Federated Suns, Lyran Commonwealth","Clan Jade Falcon, Clan Wolf, Clan Wolf (in Exile), Lyran Commonwealth","Escorpi\u00f3n Imperio, IS Clan General, Republic of the Sphere","Capellan Confederation, Magistracy of Canopus","Inner Sphere General, Magistracy of Canopus, Mercenary","Draconis Combine, Federated Suns, Lyran Commonwealth","Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Republic of the Sphere","Draconis Combine, Federated Suns, Lyran Commonwealth, Republic of the Sphere","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Wolf's Dragoons","Lyran Commonwealth, Mercenary, Republic of the Sphere","Clan Jade Falcon, Republic of the Sphere","Pirates","Clan Nova Cat, Clan Sea Fox, Clan Wolf (in Exile), Draconis Combine, Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Republic of the Sphere","Clan Nova Cat, Clan Sea Fox, Clan Wolf (in Exile), Draconis Combine, Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Mercenary, Republic of the Sphere","Draconis Combine, Federated Suns, Filtvelt Coalition, Mercenary","Filtvelt Coalition, Inner Sphere General","Draconis Combine, Federated Suns, Filtvelt Coalition, Pirates","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Magistracy of Canopus","Capellan Confederation, Draconis Combine, Escorpi\u00f3n Imperio, Federated Suns, Free Worlds League (Duchy of Andurien), Free Worlds League (Regulan Fiefs), Mercenary, Periphery General, Raven Alliance","Capellan Confederation, Fronc Reaches, Magistracy of Canopus, Marian Hegemony, Taurian Concordat","Calderon Protectorate, Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Regulan Fiefs), Fronc Reaches, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat","Free Worlds League (Non-Aligned Worlds), Free Worlds League (Rim Commonality), Mercenary, Periphery General","Capellan Confederation, Federated Suns, Filtvelt Coalition, Free Worlds League (Duchy of Andurien), Free Worlds League (Marik-Stewart Commonwealth), Fronc Reaches, Taurian Concordat","ComStar, Inner Sphere General, IS Clan General, Mercenary","Federated Suns, Mercenary, Republic of the Sphere","Capellan Confederation","Inner Sphere General, Periphery General","Clan Nova Cat, Clan Sea Fox, Draconis Combine, Mercenary, Republic of the Sphere","Magistracy of Canopus, Unique","Federated Suns, Lyran Commonwealth, Mercenary, Republic of the Sphere","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), IS Clan General, Mercenary, Republic of the Sphere","Calderon Protectorate, Draconis Combine, Federated Suns, Filtvelt Coalition, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Marian Hegemony, Mercenary, Republic of the Sphere","Lyran Commonwealth, Marian Hegemony, Mercenary, Taurian Concordat","Federated Suns, Kell Hounds, Lyran Commonwealth, Mercenary, Wolf's Dragoons","Clan Wolf","Mercenary, Republic of the Sphere","Clan Jade Falcon, Unique","Clan Jade Falcon, Lyran Commonwealth","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance, Wolf's Dragoons","Draconis Combine, Federated Suns, Filtvelt Coalition, Free Worlds League (Marik-Stewart Commonwealth), Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere","Kell Hounds, Mercenary, Wolf's Dragoons","Inner Sphere General, Kell Hounds, Mercenary, Rasalhague Dominion, Wolf's Dragoons","Draconis Combine, Mercenary, Republic of the Sphere, Taurian Concordat","Federated Suns, Free Worlds League (Oriente Protectorate), Lyran Commonwealth, Mercenary, Republic of the Sphere","Clan Hell's Horses, Clan Wolf (in Exile), Federated Suns, Lyran Commonwealth, Mercenary, Rasalhague Dominion, Republic of the Sphere","Clan Hell's Horses, Clan Sea Fox, Clan Wolf, Clan Wolf (in Exile), Escorpi\u00f3n Imperio, Rasalhague Dominion","Federated Suns, Lyran Commonwealth, Marian Hegemony, Mercenary, Republic of the Sphere, Taurian Concordat","Clan Sea Fox, Rasalhague Dominion, Raven Alliance","Capellan Confederation, Federated Suns, Filtvelt Coalition, Free Worlds League (Duchy of Andurien), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Lyran Commonwealth, Mercenary, Republic of the Sphere","Clan Hell's Horses, Clan Jade Falcon","Escorpi\u00f3n Imperio, IS Clan General, Wolf's Dragoons","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Mercenary, Periphery General","Clan Nova Cat, Draconis Combine, Kell Hounds, Lyran Commonwealth, Mercenary, Republic of the Sphere","Calderon Protectorate, Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Capellan Confederation, Periphery General","Clan Hell's Horses, Clan Wolf, Lyran Commonwealth","Escorpi\u00f3n Imperio, Inner Sphere General, Mercenary, Periphery General","ComStar","Capellan Confederation, Draconis Combine, Mercenary","Capellan Confederation, Mercenary","Clan Hell's Horses, Clan Jade Falcon, Clan Wolf, Escorpi\u00f3n Imperio, Rasalhague Dominion, Republic of the Sphere","Federated Suns, Filtvelt Coalition, Free Worlds League (Duchy of Andurien), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Lyran Commonwealth, Marian Hegemony, Mercenary, Republic of the Sphere","Draconis Combine, Federated Suns, Republic of the Sphere","Capellan Confederation, Draconis Combine, Federated Suns, Free Worlds League (Duchy of Tamarind-Abbey), Fronc Reaches, Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere","Calderon Protectorate, Federated Suns, Filtvelt Coalition, Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Republic of the Sphere","Capellan Confederation, Federated Suns, Republic of the Sphere","Escorpi\u00f3n Imperio, IS Clan General","Capellan Confederation, Federated Suns, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Mercenary, Taurian Concordat","Calderon Protectorate, Capellan Confederation, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Magistracy of Canopus","Capellan Confederation, Free Worlds League (Duchy of Andurien), Magistracy of Canopus","Federated Suns, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Republic of the Sphere","Capellan Confederation, Clan Jade Falcon, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Periphery General","Draconis Combine, Federated Suns, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Republic of the Sphere","Clan Nova Cat, Clan Sea Fox, Draconis Combine, Republic of the Sphere","Clan Hell's Horses, Clan Jade Falcon, Clan Wolf, Clan Wolf (in Exile), Republic of the Sphere","Calderon Protectorate, Taurian Concordat","Clan Wolf (in Exile), Federated Suns, Filtvelt Coalition, Free Worlds League (Regulan Fiefs), Lyran Commonwealth, Mercenary, Republic of the Sphere","Clan Wolf (in Exile), Federated Suns, Filtvelt Coalition, Free Worlds League (Regulan Fiefs), Fronc Reaches, Lyran Commonwealth, Mercenary, Republic of the Sphere, Taurian Concordat","Clan Wolf (in Exile), Federated Suns, Lyran Commonwealth, Republic of the Sphere","Clan Wolf (in Exile), Lyran Commonwealth","Free Worlds League (Marik-Stewart Commonwealth), Mercenary","Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Rasalhague Dominion, Taurian Concordat, Wolf's Dragoons","Clan Hell's Horses, Clan Jade Falcon, Rasalhague Dominion","Clan Nova Cat, Draconis Combine","Clan Hell's Horses, Republic of the Sphere","Clan Hell's Horses, Unique","Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Rasalhague Dominion, Raven Alliance, Wolf's Dragoons","Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Magistracy of Canopus, Mercenary","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Magistracy of Canopus","Free Worlds League (Duchy of Andurien)","Escorpi\u00f3n Imperio, Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Rim Commonality), Lyran Commonwealth, Pirates, Rasalhague Dominion","Federated Suns, Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Mercenary, Republic of the Sphere","Clan Jade Falcon, Clan Wolf","Capellan Confederation, Clan Hell's Horses, Clan Wolf, Clan Wolf (in Exile), Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary","Inner Sphere General, Kell Hounds, Mercenary, Periphery General","Draconis Combine, Escorpi\u00f3n Imperio, Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), IS Clan General, Lyran Commonwealth, Republic of the Sphere","Clan Nova Cat, Clan Wolf (in Exile), Inner Sphere General, Magistracy of Canopus, Mercenary, Taurian Concordat","Draconis Combine, Periphery General","Federated Suns, Lyran Commonwealth, Mercenary, Republic of the Sphere, Wolf's Dragoons","Clan Wolf (in Exile), Kell Hounds, Lyran Commonwealth","Clan Wolf (in Exile), Federated Suns, Lyran Commonwealth","Free Worlds League (Regulan Fiefs), Lyran Commonwealth","Clan Hell's Horses, Clan Jade Falcon, Escorpi\u00f3n Imperio, Rasalhague Dominion, Republic of the Sphere","Clan Sea Fox, Inner Sphere General","Clan Nova Cat, Clan Wolf (in Exile), Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Federated Suns, Filtvelt Coalition, Kell Hounds, Lyran Commonwealth, Mercenary, Wolf's Dragoons","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Raven Alliance, Wolf's Dragoons","Mercenary, Periphery General, Republic of the Sphere","Draconis Combine, Federated Suns, Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Oriente Protectorate), Mercenary, Rasalhague Dominion, Republic of the Sphere","Clan Nova Cat, Inner Sphere General, Magistracy of Canopus, Mercenary, Rasalhague Dominion, Raven Alliance","Clan Hell's Horses, Rasalhague Dominion, Raven Alliance","Free Worlds League (Oriente Protectorate)","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance","Federated Suns, Free Worlds League (Regulan Fiefs), Lyran Commonwealth, Mercenary","Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Republic of the Sphere, Taurian Concordat","Clan Sea Fox, Clan Wolf, Clan Wolf (in Exile), Draconis Combine, Escorpi\u00f3n Imperio, Federated Suns, Lyran Commonwealth, Republic of the Sphere","Clan Hell's Horses, Clan Nova Cat, Clan Sea Fox, Clan Wolf (in Exile), Lyran Commonwealth, Raven Alliance","Clan Jade Falcon, Federated Suns, Republic of the Sphere","Clan Nova Cat, Fronc Reaches, Inner Sphere General, Magistracy of Canopus, Marian Hegemony, Mercenary","Filtvelt Coalition, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth","Capellan Confederation, Federated Suns, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere","Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth","Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Wolf's Dragoons","Federated Suns, Free Worlds League (Regulan Fiefs), Lyran Commonwealth, Republic of the Sphere","Clan Hell's Horses, Clan Wolf, Clan Wolf (in Exile), Rasalhague Dominion, Republic of the Sphere","Escorpi\u00f3n Imperio, IS Clan General, Mercenary, Republic of the Sphere","Republic of the Sphere, Taurian Concordat","Federated Suns, Filtvelt Coalition, Mercenary","Draconis Combine, Federated Suns, Mercenary, Periphery General","Clan Nova Cat, Draconis Combine, Federated Suns, Free Worlds League (Marik-Stewart Commonwealth), Mercenary, Republic of the Sphere","Capellan Confederation, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Mercenary, Republic of the Sphere, Taurian Concordat","Clan Wolf (in Exile), Free Worlds League (Oriente Protectorate), Lyran Commonwealth, Republic of the Sphere","Clan Wolf (in Exile), Lyran Commonwealth, Mercenary","IS Clan General, Lyran Commonwealth, Republic of the Sphere","Clan Hell's Horses, Clan Sea Fox, Rasalhague Dominion, Republic of the Sphere","Clan Hell's Horses, Escorpi\u00f3n Imperio, Rasalhague Dominion, Republic of the Sphere","Draconis Combine, Federated Suns","Clan Wolf (in Exile), Kell Hounds"],"values":[null,0,0,0,null,1,1,null,2,3,4,null,null,4,4,5,6,7,6,6,8,8,8,8,9,9,9,9,null,10,11,11,4,11,null,12,10,4,4,4,4,10,null,13,14,15,16,17,18,null,19,4,20,21,21,null,null,22,23,null,24,0,24,24,24,null,4,4,4,25,null,26,26,null,4,27,28,null,29,null,11,null,1,1,1,1,1,null,null,30,null,31,32,32,null,29,29,29,null,6,6,1,6,null,33,33,33,34,null,33,33,33,25,null,11,35,18,null,27,27,27,27,27,null,30,4,null,4,0,36,0,null,null,null,null,37,32,11,38,39,40,null,30,30,41,41,4,4,4,4,null,42,43,43,44,null,30,null,40,45,46,47,48,49,4,4,null,50,50,null,null,51,52,11,38,11,30,53,null,4,4,4,54,55,null,null,35,35,56,null,57,57,null,58,null,19,20,0,20,20,19,4,null,null,10,null,59,null,null,4,60,60,4,61,62,63,64,65,66,67,68,null,4,69,70,null,19,19,null,4,27,71,38,72,73,74,11,19,30,null,75,null,76,77,77,4,77,77,null,null,52,null,4,4,4,4,4,null,25,25,4,78,null,null,11,69,79,80,4,40,81,11,26,82,83,84,85,86,null,30,25,87,87,null,88,null,89,4,null,90,91,91,91,91,91,91,91,91,92,92,92,92,93,4,11,33,33,null,null,94,95,96,4,30,97,11,4,4,30,98,30,99,4,82,30,25,4,null,89,89,89,89,89,null,null,4,null,100,65,101,25,69,102,null,30,null,null,103,104,105,30,30,30,30,30,30,null,4,4,null,4,null,null,null,null,null,106,107,null,11,108,19,69,null,25,109,25,null,10,10,110,111,10,110,10,10,112,110,null,null,32,113,38,92,30,114,114,38,38,null,115,null,25,25,25,116,4,null,null,117,null,118,119,69,120,27,121,69,4,72,4,null,122,122,122,null,38,4,69,72,4,null,30,null,72,null,30,null,32,123,123,null,84,19,72,null,30,30,null,null,124,null,125,126,120,127,14,128,121,129,130,30,null,89,86,null,131,null,11,11,null,null,25,7,null,null,null,132,11,133,134,135,136,4,135,37,null,4,72,72,72,null,56,137,null,null,null,138,4,139,null,4,25,25,25,25,25,25,25,25,25,25,25,null,4,null,30,null,140,4,null,null,4,4,25,25,25,25,4,4,52,null,89,30,null,141,null,142,null,25,25,null,87,null,30,null,143,null,16,4,4,30,30,null,30,4,144,144,144,144,145,14,null,4,117,117,null,138,null,146,30,null,27,null,147,30,148,148,148,148,148,148,148,148,4,4,4,4,4,4,4,4,4,4,null,4,null,null,null,149,null,150,151,151,null,152,153,11,11,null,0,4,4,4,30,0,154,139,19,null,155,86,25,25,null,114,156,14,11,157,30,30,null,158,37,159,159,159,159,159,159,null,0,null,14,160,4,null,161,null,30,30,null,162,30,11,null,122,null,4,null,null,163,null,155,155,155,155,164,155,155,165,165,null,123,87,null,29,0,null,30,null,25,139,null,null,null,125,166,72,166,30,null,null,27,4,null,4,4,100,100,140,167,139,19,19,19,168,143,169,4,69,69,69,69,69,null,30,null,null,51,89,4,null,72,null,30,100,25,48,25,11,11,4,null,4,4,86,4,4,170,11,null,25,25,25,25,25,171,171,171,171,null,11,120,30,172,173,11,173,null,171,4,4,174,4,30,30,30,30,30,null,32,null,30,30,30,30,null,null,4,4,null,100,4,86,null,4,175,176,176,177,29,0,19,4,4,4,178,null,null,179,4,4,null,null,null,null,161,null,4,180,30,4,30,181,null,4,139,182,183,null,53,184,117,185,null,186,11,4,86,null,187,4,69,4,null,27,27,4,188,72,72,4,null,37,37,37,null,189,4,null,4,69,4,null,190,191,69,4,null,192,193,194,4,null,30,null,125,null,null,195,30,null,4,null,null,155,196,null,197,null,4,null,14,14,14,14,14,14,null,null,143,30,null,null,198,188,null,null,143,143,4,null,25,25,25,30,null,199,200,null,null,201,19,19,19,null,171,25,null,202,4,10,203,204,205,null,null,72,null,null,4,4,4,206,207,72,72,30,30,125,null,4,11,4,null,null,208,209,210,36,211,11,212,213,30,11,null,null,214,null,30,30,215,216,30,215,null,87,217,null,29,29,4,0,0,4,218,30,null,null,4,null,null,null,219,56,null,220,29,29,26,0,29,29,null,11,11,221,0,30,11,222,null,null,223,4,223,30,224,224,224,224,224,224,224,null,30,null,null,4,225,19,72,74,null,null,98,null,0,0,29,null,226,30,30,null,227,228,228,null,null,30,30,215,4,32,229,4,null,25,29,29,29,29,29,29,29,230,114,143,14,4,null,72,72,4,4,4,4,4,231,32,232,232,232,232,232,null,122,233,null,69,25,19,11,null,234,30,235,236,237,238,84,239,4,240,241,171,242,null,null,null,null,120,243,244,30,245,30,11,null,246,null,247,248,null,null,69,69,null,14,null,249,250,251,null,252,0,0,null,null,null,null,null,null,null,253,253,253,null]},"Dark Ages (3131 - 3150)":{"dict":["Extinct","Federated Suns","Fronc Reaches, Taurian Concordat","Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary","Clan Wolf, Inner Sphere General, Kell Hounds, Mercenary, Wolf's Dragoons","Calderon Protectorate, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Escorpi\u00f3n Imperio, Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Periphery General, Scorpion Empire, Wolf's Dragoons","Fronc Reaches, Marian Hegemony, Taurian Concordat","Clan Wolf, Escorpi\u00f3n Imperio, Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance, Scorpion Empire","Clan Wolf, Escorpi\u00f3n Imperio, Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion, Scorpion Empire","Inner Sphere General, IS Clan General, Mercenary, Periphery General","Inner Sphere General, Mercenary, Periphery General","Calderon Protectorate, Federated Suns, Filtvelt Coalition, Fronc Reaches, Taurian Concordat","Federated Suns, Republic of the Sphere","Federated Suns, Lyran Commonwealth, Republic of the Sphere","Federated Suns, Filtvelt Coalition","Clan Hell's Horses, Clan Wolf (in Exile), Rasalhague Dominion","Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Republic of the Sphere","Inner Sphere General, Mercenary","Filtvelt Coalition, Inner Sphere General, Mercenary","Filtvelt Coalition, Fronc Reaches, Inner Sphere General, Magistracy of Canopus, Marian Hegemony, Mercenary","Clan Sea Fox","IS Clan General, Republic of the Sphere","Calderon Protectorate, Federated Suns, Filtvelt Coalition","Republic of the Sphere","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Draconis Combine, Republic of the Sphere","Capellan Confederation, Clan Nova Cat, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Magistracy of Canopus, Mercenary, Republic of the Sphere, Wolf's Dragoons","Capellan Confederation, Federated Suns, Republic of the Sphere","Unknown","Kell Hounds, Lyran Commonwealth, Mercenary, Wolf's Dragoons","Lyran Commonwealth","Escorpi\u00f3n Imperio, Inner Sphere General, IS Clan General, Mercenary, Periphery General, Scorpion Empire","Mercenary","Inner Sphere General, IS Clan General, Mercenary","Filtvelt Coalition, Lyran Commonwealth, Rasalhague Dominion, Republic of the Sphere","Capellan Confederation, Clan Sea Fox, Filtvelt Coalition, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Kell Hounds, Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Mercenary, Republic of the Sphere, Taurian Concordat, Wolf's Dragoons","Capellan Confederation, Republic of the Sphere","Rasalhague Dominion","Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality)","Capellan Confederation, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus","Federated Suns, Lyran Commonwealth, Mercenary","Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Republic of the Sphere","Inner Sphere General, Rasalhague Dominion","Capellan Confederation, Kell Hounds, Lyran Commonwealth, Mercenary, Rasalhague Dominion, Wolf's Dragoons","Capellan Confederation, Fronc Reaches, Magistracy of Canopus","Fronc Reaches, Magistracy of Canopus","Magistracy of Canopus","Clan Nova Cat, Clan Wolf (in Exile), Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth","Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance","Capellan Confederation, Lyran Commonwealth","Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Clan Hell's Horses, Rasalhague Dominion","Escorpi\u00f3n Imperio, Scorpion Empire","Mercenary, Periphery General","Lyran Commonwealth, Mercenary","Capellan Confederation, Magistracy of Canopus, Mercenary","Federated Suns, Free Worlds League (Duchy of Andurien), Magistracy of Canopus, Republic of the Sphere","Clan Hell's Horses, Clan Sea Fox, Fronc Reaches, Inner Sphere General, Magistracy of Canopus, Mercenary","Inner Sphere General, IS Clan General","Capellan Confederation, Fronc Reaches, Kell Hounds, Magistracy of Canopus, Mercenary, Republic of the Sphere, Taurian Concordat, Wolf's Dragoons","Clan Nova Cat, Clan Sea Fox, Raven Alliance","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Kell Hounds, Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere, Taurian Concordat","Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Republic of the Sphere","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Kell Hounds, Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere, Taurian Concordat, Wolf's Dragoons","Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Regulan Fiefs)","Marian Hegemony","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Mercenary","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Magistracy of Canopus, Marian Hegemony, Mercenary","Inner Sphere General","Free Worlds League, Free Worlds League (Marik-Stewart Commonwealth), Republic of the Sphere","Draconis Combine, Mercenary, Periphery General","Draconis Combine","Marian Hegemony, Mercenary, Pirates","Draconis Combine, Federated Suns, Free Worlds League, Fronc Reaches, Marian Hegemony, Taurian Concordat","Capellan Confederation, Federated Suns, Filtvelt Coalition, Mercenary, Republic of the Sphere","Clan Wolf (in Exile), Raven Alliance, Wolf's Dragoons","Draconis Combine, Republic of the Sphere, Wolf's Dragoons","Republic of the Sphere, Wolf's Dragoons","Calderon Protectorate, Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat, Wolf's Dragoons","Escorpi\u00f3n Imperio, Inner Sphere General, Mercenary, Periphery General","Capellan Confederation, Escorpi\u00f3n Imperio, Federated Suns, Mercenary, Periphery General, Scorpion Empire","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Mercenary, Periphery General","Periphery General","Inner Sphere General, Kell Hounds, Wolf's Dragoons","IS Clan General","Clan Jade Falcon, Lyran Commonwealth, Republic of the Sphere","Lyran Commonwealth, Republic of the Sphere","Calderon Protectorate, Filtvelt Coalition, Inner Sphere General, Mercenary, Pirates","Clan Hell's Horses","Clan Wolf, Lyran Commonwealth, Republic of the Sphere","Fronc Reaches, Inner Sphere General, Magistracy of Canopus","Escorpi\u00f3n Imperio, Mercenary, Periphery General, Scorpion Empire","Capellan Confederation, Mercenary, Periphery General","Calderon Protectorate, Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Clan Hell's Horses, Escorpi\u00f3n Imperio, Raven Alliance, Scorpion Empire","Clan Sea Fox, Clan Wolf, Lyran Commonwealth, Marian Hegemony","Capellan Confederation, Escorpi\u00f3n Imperio, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Periphery General, Republic of the Sphere, Scorpion Empire","Free Worlds League","Inner Sphere General, Marian Hegemony, Mercenary","Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Marian Hegemony, Mercenary","Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Mercenary, Periphery General, Republic of the Sphere","Capellan Confederation, Mercenary","Mercenary, Republic of the Sphere","Inner Sphere General, Mercenary, Periphery General, Raven Alliance","Unique","Capellan Confederation, Free Worlds League (Duchy of Andurien), Periphery General","Capellan Confederation, Clan Sea Fox, Draconis Combine, Lyran Commonwealth, Rasalhague Dominion, Raven Alliance","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Republic of the Sphere","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Mercenary, Republic of the Sphere","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere","Capellan Confederation, Clan Nova Cat, Draconis Combine, Free Worlds League, Free Worlds League (Oriente Protectorate), Republic of the Sphere","Clan Hell's Horses, Clan Nova Cat, Clan Sea Fox, Clan Wolf (in Exile), Inner Sphere General, Mercenary","Filtvelt Coalition, Inner Sphere General, Magistracy of Canopus, Mercenary","Clan Sea Fox, Draconis Combine, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Rim Commonality), Lyran Commonwealth, Republic of the Sphere","Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion","Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Republic of the Sphere","Kell Hounds, Lyran Commonwealth","Federated Suns, Lyran Commonwealth","Clan Jade Falcon, Clan Wolf, Clan Wolf (in Exile), Lyran Commonwealth","Escorpi\u00f3n Imperio, IS Clan General, Republic of the Sphere, Scorpion Empire","Capellan Confederation, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Magistracy of Canopus, Mercenary","Inner Sphere General, Magistracy of Canopus, Mercenary","Draconis Combine, Federated Suns, Lyran Commonwealth","Clan Wolf, Filtvelt Coalition, Inner Sphere General, Mercenary","Draconis Combine, Federated Suns, Lyran Commonwealth, Republic of the Sphere","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Wolf's Dragoons","Lyran Commonwealth, Mercenary, Republic of the Sphere","Inner Sphere General, Kell Hounds, Mercenary, Wolf's Dragoons","Mercenary, Pirates","Clan Nova Cat, Draconis Combine, Free Worlds League, Mercenary","Clan Jade Falcon, Republic of the Sphere","Pirates","Clan Nova Cat, Clan Sea Fox, Clan Wolf (in Exile), Draconis Combine, Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Republic of the Sphere","Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Republic of the Sphere","Clan Nova Cat, Clan Sea Fox, Clan Wolf (in Exile), Draconis Combine, Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Mercenary, Republic of the Sphere","Federated Suns, Filtvelt Coalition, Mercenary","Filtvelt Coalition, Inner Sphere General","Draconis Combine, Filtvelt Coalition, Mercenary, Pirates","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Magistracy of Canopus","Rasalhague Dominion, Republic of the Sphere","Capellan Confederation, Draconis Combine, Escorpi\u00f3n Imperio, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Regulan Fiefs), Mercenary, Periphery General, Raven Alliance, Scorpion Empire","Capellan Confederation, Fronc Reaches, Magistracy of Canopus, Marian Hegemony, Taurian Concordat","Calderon Protectorate, Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Regulan Fiefs), Fronc Reaches, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat","Free Worlds League, Free Worlds League (Non-Aligned Worlds), Free Worlds League (Rim Commonality), Mercenary, Periphery General","Capellan Confederation, Federated Suns, Filtvelt Coalition, Free Worlds League (Duchy of Andurien), Fronc Reaches, Taurian Concordat","Clan Wolf, Rasalhague Dominion","ComStar, Inner Sphere General, IS Clan General, Mercenary","Federated Suns, Mercenary, Republic of the Sphere","Capellan Confederation","Inner Sphere General, Periphery General","Clan Jade Falcon, Clan Nova Cat, Clan Sea Fox, Draconis Combine, Mercenary, Republic of the Sphere","Federated Suns, Mercenary","Federated Suns, Lyran Commonwealth, Mercenary, Republic of the Sphere","Filtvelt Coalition, Marian Hegemony, Pirates","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), IS Clan General, Mercenary, Republic of the Sphere","Calderon Protectorate, Draconis Combine, Federated Suns, Filtvelt Coalition, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Marian Hegemony, Mercenary, Republic of the Sphere","Capellan Confederation, Magistracy of Canopus","Lyran Commonwealth, Marian Hegemony, Mercenary, Taurian Concordat","Federated Suns, Lyran Commonwealth, Mercenary, Taurian Concordat","Federated Suns, Kell Hounds, Lyran Commonwealth, Mercenary, Wolf's Dragoons","Clan Wolf","Clan Jade Falcon, Unique","Clan Jade Falcon, Lyran Commonwealth","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance, Wolf's Dragoons","Capellan Confederation, Draconis Combine, Federated Suns, Mercenary, Periphery General, Republic of the Sphere","Clan Jade Falcon, Inner Sphere General, Mercenary","Inner Sphere General, Kell Hounds, Mercenary, Rasalhague Dominion, Wolf's Dragoons","Draconis Combine, Mercenary, Republic of the Sphere, Taurian Concordat","Clan Jade Falcon, Federated Suns, Lyran Commonwealth, Republic of the Sphere","Clan Jade Falcon, Federated Suns, Free Worlds League, Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Lyran Commonwealth, Mercenary, Republic of the Sphere","Clan Jade Falcon, Clan Wolf","Clan Hell's Horses, Clan Wolf (in Exile), Federated Suns, Lyran Commonwealth, Mercenary, Rasalhague Dominion, Republic of the Sphere","Clan Hell's Horses, Clan Sea Fox, Clan Wolf, Clan Wolf (in Exile), Escorpi\u00f3n Imperio, Rasalhague Dominion, Scorpion Empire","Federated Suns, Lyran Commonwealth, Marian Hegemony, Mercenary, Republic of the Sphere, Taurian Concordat","Clan Sea Fox, Rasalhague Dominion, Raven Alliance","Calderon Protectorate, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Fronc Reaches, Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere, Taurian Concordat","Federated Suns, Free Worlds League, Republic of the Sphere","Clan Jade Falcon, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Wolf's Dragoons","Clan Hell's Horses, Clan Jade Falcon","Escorpi\u00f3n Imperio, IS Clan General, Scorpion Empire, Wolf's Dragoons","Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Rim Commonality), Mercenary, Periphery General","Draconis Combine, Lyran Commonwealth, Mercenary, Republic of the Sphere","Draconis Combine, Federated Suns, Republic of the Sphere","Draconis Combine, Federated Suns","Clan Nova Cat, Inner Sphere General, Kell Hounds, Mercenary","Calderon Protectorate, Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Capellan Confederation, Periphery General","Clan Hell's Horses, Clan Jade Falcon, Clan Wolf, Lyran Commonwealth","Inner Sphere General, Wolf's Dragoons","Clan Hell's Horses, Clan Wolf","Scorpion Empire","Escorpi\u00f3n Imperio, Inner Sphere General, Mercenary, Periphery General, Scorpion Empire","ComStar","Clan Hell's Horses, Clan Jade Falcon, Clan Wolf, Escorpi\u00f3n Imperio, Rasalhague Dominion, Republic of the Sphere, Scorpion Empire","Clan Jade Falcon, Inner Sphere General","IS Clan General, Mercenary","Federated Suns, Filtvelt Coalition, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Lyran Commonwealth, Marian Hegemony, Mercenary, Republic of the Sphere","Capellan Confederation, Draconis Combine, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Tamarind-Abbey), Fronc Reaches, Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere","Calderon Protectorate, Clan Hell's Horses, Clan Jade Falcon, Clan Wolf, Federated Suns, Filtvelt Coalition, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Republic of the Sphere","Capellan Confederation, Escorpi\u00f3n Imperio, Free Worlds League (Duchy of Andurien), IS Clan General, Magistracy of Canopus, Scorpion Empire","Inner Sphere General, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat","Capellan Confederation, Federated Suns, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Mercenary, Taurian Concordat","Calderon Protectorate, Capellan Confederation, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Fronc Reaches, Magistracy of Canopus","Capellan Confederation, Free Worlds League (Duchy of Andurien), Magistracy of Canopus","Capellan Confederation, Clan Jade Falcon, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Republic of the Sphere","Capellan Confederation, Clan Jade Falcon, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Mercenary, Periphery General","Draconis Combine, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Republic of the Sphere","Clan Nova Cat, Clan Sea Fox, Draconis Combine, Republic of the Sphere","Clan Hell's Horses, Clan Jade Falcon, Clan Wolf, Clan Wolf (in Exile), Republic of the Sphere","Calderon Protectorate, Taurian Concordat","Clan Wolf (in Exile), Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Marian Hegemony, Mercenary, Republic of the Sphere","Clan Wolf (in Exile), Federated Suns, Filtvelt Coalition, Free Worlds League, Free Worlds League (Regulan Fiefs), Fronc Reaches, Lyran Commonwealth, Mercenary, Republic of the Sphere, Taurian Concordat","Clan Wolf (in Exile), Federated Suns, Lyran Commonwealth, Republic of the Sphere","Clan Wolf (in Exile), Lyran Commonwealth","Clan Jade Falcon","Clan Wolf, Free Worlds League, Mercenary","Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Rasalhague Dominion, Taurian Concordat, Wolf's Dragoons","Capellan Confederation, Clan Hell's Horses, Clan Jade Falcon, Clan Sea Fox, Clan Wolf, Free Worlds League, Lyran Commonwealth, Rasalhague Dominion","Clan Nova Cat, Draconis Combine","Clan Hell's Horses, Republic of the Sphere","Clan Hell's Horses, Unique","Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Rasalhague Dominion, Raven Alliance, Wolf's Dragoons","Free Worlds League, Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Regulan Fiefs), Lyran Commonwealth","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Magistracy of Canopus, Mercenary","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Magistracy of Canopus","Free Worlds League (Duchy of Andurien)","Escorpi\u00f3n Imperio, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Rim Commonality), Lyran Commonwealth, Scorpion Empire","Capellan Confederation, Federated Suns, Free Worlds League, Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Mercenary, Republic of the Sphere","Capellan Confederation, Clan Hell's Horses, Clan Wolf, Clan Wolf (in Exile), Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Raven Alliance","Inner Sphere General, Kell Hounds, Mercenary, Periphery General","Inner Sphere General, Kell Hounds, Mercenary","Escorpi\u00f3n Imperio, Inner Sphere General, IS Clan General, Scorpion Empire","Clan Nova Cat, Clan Wolf (in Exile), Inner Sphere General, Mercenary, Periphery General","Draconis Combine, Periphery General","Inner Sphere General, Mercenary, Periphery General, Scorpion Empire","Federated Suns, Lyran Commonwealth, Mercenary, Republic of the Sphere, Wolf's Dragoons","Clan Wolf (in Exile), Kell Hounds, Lyran Commonwealth","Clan Wolf (in Exile), Federated Suns, Lyran Commonwealth","Free Worlds League, Free Worlds League (Regulan Fiefs), Lyran Commonwealth","Clan Hell's Horses, Escorpi\u00f3n Imperio, Rasalhague Dominion, Republic of the Sphere, Scorpion Empire","Clan Sea Fox, Inner Sphere General","Clan Nova Cat, Clan Wolf (in Exile), Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Capellan Confederation, Draconis Combine, Federated Suns, Filtvelt Coalition, Fronc Reaches, Lyran Commonwealth, Mercenary, Taurian Concordat","Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Mercenary, Republic of the Sphere","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Raven Alliance, Wolf's Dragoons","Draconis Combine, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Oriente Protectorate), Mercenary, Rasalhague Dominion, Republic of the Sphere","Clan Nova Cat, Inner Sphere General, Magistracy of Canopus, Mercenary, Rasalhague Dominion, Raven Alliance","Inner Sphere General, Magistracy of Canopus, Mercenary, Taurian Concordat","Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Mercenary","Clan Hell's Horses, Rasalhague Dominion, Raven Alliance","Free Worlds League, Free Worlds League (Oriente Protectorate)","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance","Federated Suns, Free Worlds League, Free Worlds League (Regulan Fiefs), Lyran Commonwealth, Mercenary","Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Republic of the Sphere, Taurian Concordat","Clan Sea Fox, Clan Wolf (in Exile), Escorpi\u00f3n Imperio, Lyran Commonwealth, Marian Hegemony, Republic of the Sphere, Scorpion Empire","Clan Hell's Horses, Clan Nova Cat, Clan Sea Fox, Clan Wolf (in Exile), Lyran Commonwealth, Raven Alliance","Clan Jade Falcon, Federated Suns, Republic of the Sphere","Clan Nova Cat, Fronc Reaches, Inner Sphere General, Magistracy of Canopus, Mercenary","Clan Wolf, Free Worlds League (Duchy of Andurien)","Capellan Confederation, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Magistracy of Canopus, Mercenary, Republic of the Sphere","Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Wolf's Dragoons","Federated Suns, Free Worlds League, Free Worlds League (Regulan Fiefs), Lyran Commonwealth, Republic of the Sphere","Clan Hell's Horses, Clan Wolf, Clan Wolf (in Exile), Republic of the Sphere","Escorpi\u00f3n Imperio, IS Clan General, Mercenary, Republic of the Sphere, Scorpion Empire","Clan Nova Cat, Draconis Combine, Raven Alliance, Republic of the Sphere","Clan Nova Cat, Draconis Combine, Federated Suns, Free Worlds League, Free Worlds League (Marik-Stewart Commonwealth), Mercenary, Republic of the Sphere","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Free Worlds League (Duchy of Tamarind-Abbey), Free Worlds League (Marik-Stewart Commonwealth), Free Worlds League (Non-Aligned Worlds), Free Worlds League (Oriente Protectorate), Free Worlds League (Regulan Fiefs), Free Worlds League (Rim Commonality), Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Mercenary, Republic of the Sphere, Taurian Concordat","Clan Wolf (in Exile), Free Worlds League, Free Worlds League (Oriente Protectorate), Lyran Commonwealth, Republic of the Sphere","Clan Wolf (in Exile), Lyran Commonwealth, Mercenary","IS Clan General, Lyran Commonwealth, Republic of the Sphere","Clan Hell's Horses, Clan Sea Fox, Rasalhague Dominion, Republic of the Sphere"],"values":[null,0,1,1,null,2,2,null,3,4,0,null,null,0,0,5,6,7,6,6,8,8,8,8,9,9,9,9,null,10,11,11,0,11,null,12,10,10,10,10,10,10,null,13,14,1,15,16,17,null,18,0,19,20,20,null,null,21,22,null,23,1,23,23,23,null,0,0,0,24,null,25,25,null,0,26,27,null,28,null,11,null,2,2,2,2,2,null,null,29,null,30,31,31,null,28,28,28,null,6,6,2,6,null,32,32,32,33,null,32,32,32,24,null,11,34,35,null,26,26,26,26,26,null,36,0,null,0,1,37,1,null,null,null,null,38,31,11,0,39,40,null,41,41,42,42,0,0,0,0,null,43,0,0,44,null,29,null,45,46,47,48,49,50,0,0,null,51,51,null,null,52,53,11,54,11,55,56,null,0,0,0,57,58,null,null,34,34,59,null,60,60,null,51,null,18,19,1,19,19,18,0,null,null,10,null,61,null,null,0,0,0,0,62,63,64,65,66,67,64,68,null,0,69,70,null,18,18,null,0,26,71,54,72,73,11,11,18,74,null,75,null,76,77,78,0,78,78,null,null,53,null,0,0,0,0,0,null,0,24,0,16,null,null,11,69,79,80,0,45,81,82,25,83,81,84,25,85,null,29,24,86,87,null,88,null,89,0,null,16,90,90,90,90,90,90,90,90,55,55,55,55,91,0,11,92,32,null,null,93,94,95,0,96,97,11,0,0,98,99,100,101,0,83,102,103,0,null,89,89,89,89,89,null,null,0,null,104,66,105,24,69,106,null,107,null,null,108,109,110,21,21,21,21,21,21,null,0,0,null,0,null,null,null,null,null,111,112,null,11,113,18,69,null,24,114,24,null,10,10,115,11,10,115,10,10,115,115,null,null,31,116,54,55,117,118,118,0,54,null,119,null,24,24,24,120,0,null,null,121,null,122,123,69,124,26,125,69,0,72,0,null,126,126,126,null,54,0,69,72,0,null,72,null,72,null,72,null,31,127,127,null,128,129,72,null,130,72,null,null,131,null,132,133,134,135,14,136,125,137,138,1,null,89,85,null,139,null,11,11,null,null,140,7,null,null,null,141,11,142,143,144,145,0,144,146,null,0,72,72,72,null,59,147,null,null,null,148,0,149,null,0,24,24,24,24,24,24,24,24,24,24,24,null,0,null,102,null,150,0,null,null,0,0,24,24,24,24,0,0,53,null,89,89,null,151,null,0,null,24,24,null,86,null,152,null,153,null,154,0,0,29,29,null,149,0,155,155,155,155,156,14,null,0,157,157,null,148,null,158,159,null,26,null,160,11,161,161,161,161,161,161,161,161,0,0,0,0,0,0,0,0,0,0,null,0,null,null,null,103,null,162,163,163,null,164,134,54,165,null,1,0,0,0,1,1,33,0,166,null,167,85,24,24,null,31,168,169,54,170,171,171,null,172,38,173,173,173,173,173,173,null,1,null,169,174,0,null,175,null,89,89,null,176,177,11,null,178,null,0,null,null,179,null,167,167,167,167,180,167,167,0,181,null,182,86,null,183,184,null,98,null,24,149,null,null,null,132,185,72,185,29,null,null,26,0,null,0,0,49,104,150,186,0,18,18,18,187,153,188,0,189,189,189,189,189,null,190,null,null,52,89,0,null,72,null,24,104,24,49,24,11,11,0,null,0,0,85,0,191,192,11,null,24,24,24,24,24,193,193,193,193,null,11,134,72,18,18,11,102,null,193,0,0,194,0,89,89,89,89,89,null,31,null,69,195,166,166,null,null,0,0,null,104,0,196,null,0,197,183,183,198,13,1,18,0,0,0,199,null,null,28,0,0,null,null,null,null,175,null,0,200,201,0,34,202,null,0,149,203,204,null,56,205,157,206,null,207,11,0,196,null,208,0,189,0,null,26,26,0,209,72,72,0,null,38,0,0,null,210,0,null,0,195,10,null,211,212,69,0,null,213,214,215,0,null,216,null,132,null,null,217,161,null,0,null,null,167,218,null,219,null,0,null,14,14,14,14,14,14,null,null,153,1,null,null,220,209,null,null,153,153,0,null,24,24,24,24,null,221,222,null,null,223,18,18,18,null,193,24,null,224,0,10,225,226,227,null,null,72,null,null,0,0,0,228,229,72,72,3,72,0,null,0,11,0,null,null,171,230,231,232,233,54,234,235,72,236,null,null,237,null,238,238,238,239,238,238,null,87,240,null,13,13,0,1,1,0,241,29,null,null,0,null,null,null,242,59,null,243,28,28,25,28,28,28,null,54,11,244,13,245,54,246,null,null,0,0,0,29,247,247,247,247,247,247,247,null,54,null,null,0,248,18,72,249,null,null,250,null,1,1,13,null,251,216,216,null,252,253,253,null,null,31,118,238,0,31,254,0,null,24,13,13,13,13,13,13,13,255,118,153,14,0,null,72,72,0,0,0,0,0,256,31,257,257,257,257,257,null,178,258,null,69,24,18,11,null,259,260,0,261,0,262,128,263,0,264,265,193,24,null,null,null,null,182,136,54,266,267,149,11,null,268,null,269,270,null,null,69,69,null,14,null,271,272,241,null,184,1,1,null,null,null,null,null,null,null,238,238,238,null]},"ilClan (3151 - 9999)":{"dict":["Extinct","Federated Suns","Fronc Reaches, Taurian Concordat","Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Tamar Pact, Vesper Marches","Clan Protectorate, Inner Sphere General, Kell Hounds, Mercenary, Wolf Empire, Wolf's Dragoons","Calderon Protectorate, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Periphery General, Scorpion Empire, Wolf's Dragoons","Fronc Reaches, Marian Hegemony, Taurian Concordat","Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance, Scorpion Empire, Wolf Empire","Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance, Scorpion Empire, Star League (Clan Smoke Jaguar), Wolf Empire","Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion, Scorpion Empire, Wolf Empire","Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion, Scorpion Empire, Star League (Clan Smoke Jaguar), Star League (Clan Wolf), Wolf Empire","Inner Sphere General, IS Clan General, Mercenary, Periphery General","Inner Sphere General, Mercenary, Periphery General","Calderon Protectorate, Federated Suns, Filtvelt Coalition, Fronc Reaches, Taurian Concordat","Federated Suns, Lyran Commonwealth, Tamar Pact, Vesper Marches","Federated Suns, Filtvelt Coalition","Clan Hell's Horses, Rasalhague Dominion, Star League (Clan Wolf)","Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Tamar Pact, Vesper Marches","Inner Sphere General, Mercenary","Filtvelt Coalition, Inner Sphere General, Mercenary","Filtvelt Coalition, Fronc Reaches, Inner Sphere General, Magistracy of Canopus, Marian Hegemony, Mercenary","Clan Protectorate, Clan Sea Fox","IS Clan General","Calderon Protectorate, Federated Suns, Filtvelt Coalition","Capellan Confederation","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Draconis Combine","Capellan Confederation, Clan Protectorate, Free Worlds League, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Mercenary, Wolf's Dragoons","Capellan Confederation, Federated Suns","Unknown","Kell Hounds, Lyran Commonwealth, Mercenary, Tamar Pact, Vesper Marches, Wolf's Dragoons","Lyran Commonwealth, Tamar Pact, Vesper Marches","Inner Sphere General, IS Clan General, Mercenary, Periphery General, Scorpion Empire","Mercenary","Star League (Clan Smoke Jaguar)","Inner Sphere General, IS Clan General, Mercenary","Filtvelt Coalition, Lyran Commonwealth, Rasalhague Dominion, Tamar Pact, Vesper Marches","Alyina Mercantile League, Calderon Protectorate, Capellan Confederation, Clan Sea Fox, Filtvelt Coalition, Free Worlds League, Free Worlds League (Duchy of Andurien), Fronc Reaches, Kell Hounds, Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Mercenary, Tamar Pact, Taurian Concordat, Vesper Marches, Wolf Empire, Wolf's Dragoons","Rasalhague Dominion","Free Worlds League, Free Worlds League (Duchy of Andurien)","Capellan Confederation, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus","Federated Suns, Lyran Commonwealth, Mercenary","Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Mercenary, Tamar Pact, Vesper Marches","Inner Sphere General, Rasalhague Dominion","Capellan Confederation, Kell Hounds, Lyran Commonwealth, Mercenary, Rasalhague Dominion, Raven Alliance, Tamar Pact, Vesper Marches, Wolf's Dragoons","Capellan Confederation, Fronc Reaches, Magistracy of Canopus","Fronc Reaches, Magistracy of Canopus","Magistracy of Canopus","Clan Protectorate, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Star League (Clan Wolf), Tamar Pact, Vesper Marches","Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance","Capellan Confederation, Lyran Commonwealth, Tamar Pact, Vesper Marches","Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Clan Hell's Horses, Rasalhague Dominion","Scorpion Empire","Alyina Mercantile League, Clan Jade Falcon, Inner Sphere General, Mercenary, Periphery General","Mercenary, Periphery General","Capellan Confederation, Magistracy of Canopus, Mercenary","Federated Suns, Free Worlds League (Duchy of Andurien), Magistracy of Canopus","Clan Hell's Horses, Clan Protectorate, Clan Sea Fox, Fronc Reaches, Inner Sphere General, Magistracy of Canopus, Mercenary","Inner Sphere General, IS Clan General","Capellan Confederation, Fronc Reaches, Kell Hounds, Magistracy of Canopus, Mercenary, Taurian Concordat, Wolf's Dragoons","Clan Sea Fox, Raven Alliance","Capellan Confederation, Clan Protectorate, Free Worlds League, Free Worlds League (Duchy of Andurien), Kell Hounds, Lyran Commonwealth, Mercenary, Periphery General, Tamar Pact, Vesper Marches, Wolf Empire","Free Worlds League, Star League (Clan Wolf)","Capellan Confederation, Clan Protectorate, Free Worlds League, Free Worlds League (Duchy of Andurien), Kell Hounds, Lyran Commonwealth, Magistracy of Canopus, Star League (Clan Wolf), Tamar Pact, Taurian Concordat, Vesper Marches, Wolf Empire, Wolf's Dragoons","Marian Hegemony","Capellan Confederation, Clan Protectorate, Free Worlds League, Free Worlds League (Duchy of Andurien), Fronc Reaches, Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Mercenary, Tamar Pact, Vesper Marches","Capellan Confederation, Clan Protectorate, Free Worlds League, Kell Hounds, Lyran Commonwealth, Mercenary, Periphery General, Tamar Pact, Vesper Marches, Wolf Empire","Capellan Confederation, Clan Protectorate, Free Worlds League, Free Worlds League (Duchy of Andurien), Magistracy of Canopus, Marian Hegemony, Mercenary","Inner Sphere General","Free Worlds League","Inner Sphere General, Mercenary, Star League (Clan Smoke Jaguar), Star League (Clan Wolf)","Draconis Combine, Mercenary, Periphery General","Marian Hegemony, Mercenary, Pirates","Capellan Confederation, Federated Suns, Filtvelt Coalition, Mercenary","Raven Alliance, Star League (Clan Wolf), Wolf's Dragoons","Draconis Combine, Wolf's Dragoons","Wolf's Dragoons","Clan Protectorate, Inner Sphere General","Calderon Protectorate, Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat, Wolf's Dragoons","Capellan Confederation, Federated Suns, Mercenary, Periphery General, Scorpion Empire","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Mercenary, Periphery General","Clan Protectorate, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Wolf's Dragoons","Periphery General","Clan Protectorate, Inner Sphere General, Kell Hounds, Mercenary, Wolf's Dragoons","Lyran Commonwealth, Tamar Pact","Calderon Protectorate, Filtvelt Coalition, Inner Sphere General, Mercenary, Pirates","Clan Hell's Horses","Clan Hell's Horses, Rasalhague Dominion, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf)","Clan Hell's Horses, Lyran Commonwealth, Star League (Clan Smoke Jaguar), Star League (Clan Wolf), Wolf Empire, Wolf's Dragoons","Lyran Commonwealth, Mercenary, Vesper Marches","Fronc Reaches, Inner Sphere General, Magistracy of Canopus, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf)","Mercenary, Periphery General, Scorpion Empire","Capellan Confederation, Mercenary, Periphery General","Calderon Protectorate, Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Clan Hell's Horses, Raven Alliance, Scorpion Empire","Clan Protectorate, Clan Sea Fox, Free Worlds League, Lyran Commonwealth, Marian Hegemony, Wolf Empire","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Mercenary, Periphery General, Scorpion Empire, Tamar Pact","Clan Protectorate, Inner Sphere General, Mercenary, Periphery General","Inner Sphere General, Marian Hegemony, Mercenary","Free Worlds League, Free Worlds League (Duchy of Andurien), Marian Hegemony, Mercenary","Free Worlds League, Free Worlds League (Duchy of Andurien), Mercenary, Periphery General","Capellan Confederation, Mercenary","Inner Sphere General, Mercenary, Periphery General, Raven Alliance","Unique","Inner Sphere General, IS Clan General, Kell Hounds, Mercenary, Wolf's Dragoons","Capellan Confederation, Free Worlds League (Duchy of Andurien), Periphery General","Capellan Confederation, Clan Sea Fox, Draconis Combine, Lyran Commonwealth, Rasalhague Dominion, Raven Alliance","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Mercenary, Tamar Pact","Capellan Confederation, Clan Protectorate, Free Worlds League, Free Worlds League (Duchy of Andurien), Fronc Reaches, Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Mercenary, Tamar Pact","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Magistracy of Canopus, Mercenary, Tamar Pact","Capellan Confederation, Clan Protectorate, Draconis Combine, Free Worlds League","Clan Hell's Horses, Clan Protectorate, Clan Sea Fox, Inner Sphere General, Mercenary, Star League (Clan Wolf)","Filtvelt Coalition, Inner Sphere General, Magistracy of Canopus, Mercenary","Star League (Clan Smoke Jaguar), Star League (Clan Wolf)","Clan Sea Fox, Draconis Combine, Federated Suns, Free Worlds League, Lyran Commonwealth, Star League (Clan Smoke Jaguar), Star League (Clan Wolf), Tamar Pact, Vesper Marches","Inner Sphere General, Mercenary, Periphery General, Rasalhague Dominion","Lyran Commonwealth, Mercenary, Tamar Pact, Vesper Marches","Kell Hounds, Lyran Commonwealth, Mercenary","Alyina Mercantile League, Clan Jade Falcon, Lyran Commonwealth, Star League (Clan Jade Falcon), Star League (Clan Wolf), Tamar Pact, Wolf Empire","IS Clan General, Scorpion Empire","Capellan Confederation, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Magistracy of Canopus, Mercenary, Tamar Pact, Vesper Marches","Inner Sphere General, Magistracy of Canopus, Mercenary","Draconis Combine, Federated Suns, Lyran Commonwealth, Tamar Pact, Vesper Marches","Filtvelt Coalition, Inner Sphere General, Mercenary, Wolf Empire","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Wolf's Dragoons","Inner Sphere General, Kell Hounds, Mercenary, Wolf's Dragoons","Mercenary, Pirates","Draconis Combine, Free Worlds League, Mercenary","Star League (Clan Jade Falcon), Tamar Pact","Pirates","Clan Protectorate, Clan Sea Fox, Draconis Combine, Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Tamar Pact, Vesper Marches","Clan Protectorate, Clan Sea Fox, Draconis Combine, Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Mercenary, Tamar Pact, Vesper Marches","Federated Suns, Filtvelt Coalition, Mercenary","Filtvelt Coalition, Inner Sphere General","Draconis Combine, Filtvelt Coalition, Mercenary, Pirates","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Magistracy of Canopus","Capellan Confederation, Draconis Combine, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Mercenary, Periphery General, Raven Alliance, Scorpion Empire","Capellan Confederation, Fronc Reaches, Magistracy of Canopus, Marian Hegemony, Taurian Concordat","Calderon Protectorate, Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Marian Hegemony, Mercenary, Taurian Concordat","Free Worlds League, Mercenary, Periphery General","Capellan Confederation, Federated Suns, Filtvelt Coalition, Free Worlds League (Duchy of Andurien), Fronc Reaches, Taurian Concordat","Free Worlds League, IS Clan General","Federated Suns, Mercenary","Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf)","Inner Sphere General, Periphery General","Clan Protectorate, Clan Sea Fox, Draconis Combine, Mercenary, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Wolf's Dragoons","Mercenary, Wolf Empire","Alyina Mercantile League, Clan Jade Falcon, Lyran Commonwealth, Tamar Pact, Vesper Marches","Federated Suns, Lyran Commonwealth, Mercenary, Tamar Pact, Vesper Marches","Filtvelt Coalition, Marian Hegemony, Pirates","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), IS Clan General, Mercenary","Calderon Protectorate, Draconis Combine, Federated Suns, Filtvelt Coalition, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Marian Hegemony, Mercenary, Tamar Pact, Vesper Marches","Capellan Confederation, Magistracy of Canopus","Lyran Commonwealth, Marian Hegemony, Mercenary, Tamar Pact, Taurian Concordat, Vesper Marches","Federated Suns, Lyran Commonwealth, Mercenary, Taurian Concordat","Federated Suns, Kell Hounds, Lyran Commonwealth, Mercenary, Wolf's Dragoons","Star League (Clan Wolf), Wolf Empire, Wolf's Dragoons","Mercenary, Star League (Clan Smoke Jaguar)","Alyina Mercantile League, Clan Jade Falcon, Lyran Commonwealth, Tamar Pact","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf), Wolf's Dragoons","Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf), Tamar Pact, Vesper Marches","Capellan Confederation, Draconis Combine, Federated Suns, Mercenary, Periphery General","Clan Jade Falcon, Clan Sea Fox, Inner Sphere General, Mercenary","Inner Sphere General, Kell Hounds, Mercenary, Rasalhague Dominion, Wolf's Dragoons","Wolf Empire","Draconis Combine, Mercenary, Taurian Concordat","Alyina Mercantile League, Clan Jade Falcon, Federated Suns, Lyran Commonwealth, Tamar Pact, Vesper Marches","Alyina Mercantile League, Capellan Confederation, Clan Jade Falcon, Federated Suns, Free Worlds League, Lyran Commonwealth, Mercenary, Tamar Pact, Vesper Marches","Clan Jade Falcon, Star League (Clan Wolf), Wolf Empire","Clan Hell's Horses, Clan Jade Falcon, Star League (Clan Wolf), Wolf Empire","Clan Hell's Horses, Federated Suns, Lyran Commonwealth, Mercenary, Rasalhague Dominion, Star League (Clan Wolf), Tamar Pact, Vesper Marches","Clan Hell's Horses, Clan Sea Fox, Rasalhague Dominion, Scorpion Empire, Star League (Clan Wolf)","Federated Suns, Lyran Commonwealth, Marian Hegemony, Mercenary, Tamar Pact, Taurian Concordat, Vesper Marches","Clan Protectorate, Clan Sea Fox, Rasalhague Dominion, Raven Alliance","Clan Protectorate, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Mercenary, Periphery General, Tamar Pact, Vesper Marches, Wolf Empire","Capellan Confederation, Clan Protectorate, Draconis Combine, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Mercenary","Alyina Mercantile League, Clan Jade Falcon, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Star League (Clan Jade Falcon), Wolf Empire, Wolf's Dragoons","Alyina Mercantile League, Clan Hell's Horses, Clan Jade Falcon, Star League (Clan Jade Falcon)","IS Clan General, Kell Hounds, Scorpion Empire, Wolf's Dragoons","Draconis Combine, Lyran Commonwealth, Mercenary, Tamar Pact, Vesper Marches","Draconis Combine, Federated Suns","Clan Protectorate, Inner Sphere General, Kell Hounds, Mercenary","Kell Hounds, Unique","Calderon Protectorate, Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Taurian Concordat","Capellan Confederation, Periphery General","Federated Suns, Lyran Commonwealth, Mercenary, Tamar Pact","Clan Hell's Horses, Lyran Commonwealth, Tamar Pact, Wolf Empire","Inner Sphere General, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf), Wolf's Dragoons","Clan Hell's Horses, Star League (Clan Wolf)","Inner Sphere General, Mercenary, Periphery General, Scorpion Empire","Inner Sphere General, Mercenary, Periphery General, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf)","Alyina Mercantile League, Clan Hell's Horses, Clan Jade Falcon, Rasalhague Dominion, Scorpion Empire, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf), Wolf Empire","Lyran Commonwealth","Alyina Mercantile League, Clan Jade Falcon, Inner Sphere General, Star League (Clan Jade Falcon), Wolf Empire","Alyina Mercantile League, Clan Jade Falcon, Inner Sphere General, Mercenary, Star League (Clan Jade Falcon), Wolf Empire","Free Worlds League, IS Clan General, Mercenary, Tamar Pact","Federated Suns, Filtvelt Coalition, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Marian Hegemony, Mercenary, Tamar Pact, Vesper Marches","Capellan Confederation, Draconis Combine, Federated Suns, Free Worlds League, Fronc Reaches, Lyran Commonwealth, Magistracy of Canopus, Mercenary, Tamar Pact, Vesper Marches","Alyina Mercantile League, Clan Protectorate, Inner Sphere General, Mercenary, Wolf Empire","Calderon Protectorate, Clan Hell's Horses, Federated Suns, Filtvelt Coalition, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Tamar Pact, Vesper Marches, Wolf Empire","Capellan Confederation, Free Worlds League (Duchy of Andurien), IS Clan General, Magistracy of Canopus, Scorpion Empire","Capellan Confederation, Federated Suns, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Mercenary, Taurian Concordat","Calderon Protectorate, Capellan Confederation, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus, Mercenary, Taurian Concordat","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Fronc Reaches, Magistracy of Canopus","Capellan Confederation, Free Worlds League (Duchy of Andurien), Magistracy of Canopus","Alyina Mercantile League, Capellan Confederation, Clan Jade Falcon, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf), Tamar Pact, Vesper Marches","Alyina Mercantile League, Capellan Confederation, Clan Jade Falcon, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Mercenary, Periphery General, Star League (Clan Jade Falcon), Tamar Pact, Vesper Marches","Draconis Combine, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Vesper Marches","Inner Sphere General, Wolf's Dragoons","Clan Protectorate, Clan Sea Fox, Draconis Combine","Alyina Mercantile League, Clan Hell's Horses, Clan Jade Falcon, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf), Wolf Empire","Alyina Mercantile League, Clan Jade Falcon, Inner Sphere General, Star League (Clan Jade Falcon)","Calderon Protectorate, Taurian Concordat","Federated Suns, Filtvelt Coalition, Lyran Commonwealth, Marian Hegemony, Mercenary, Tamar Pact, Vesper Marches","Federated Suns, Filtvelt Coalition, Free Worlds League, Fronc Reaches, Lyran Commonwealth, Mercenary, Tamar Pact, Taurian Concordat, Vesper Marches","Lyran Commonwealth, Star League (Clan Wolf), Tamar Pact, Vesper Marches","Star League (Clan Jade Falcon)","Free Worlds League, Mercenary, Wolf Empire","Inner Sphere General, Kell Hounds, Mercenary, Rasalhague Dominion, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf), Wolf's Dragoons","Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Rasalhague Dominion, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf), Taurian Concordat, Wolf's Dragoons","Alyina Mercantile League, Capellan Confederation, Clan Hell's Horses, Clan Jade Falcon, Clan Protectorate, Clan Sea Fox, Free Worlds League, Lyran Commonwealth, Rasalhague Dominion, Star League (Clan Jade Falcon), Star League (Clan Wolf), Tamar Pact, Vesper Marches, Wolf Empire","Clan Protectorate, Draconis Combine","Mercenary, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf)","Clan Hell's Horses, Unique","Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Rasalhague Dominion, Raven Alliance, Wolf's Dragoons","Free Worlds League, Lyran Commonwealth, Tamar Pact, Vesper Marches","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Magistracy of Canopus, Mercenary","Free Worlds League (Duchy of Andurien)","Alyina Mercantile League, Clan Jade Falcon, Free Worlds League, Lyran Commonwealth, Scorpion Empire, Tamar Pact, Vesper Marches","Capellan Confederation, Federated Suns, Free Worlds League, Mercenary","Alyina Mercantile League, Clan Jade Falcon, Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Tamar Pact, Vesper Marches","Alyina Mercantile League, Clan Jade Falcon, Star League (Clan Jade Falcon), Star League (Clan Wolf), Wolf Empire, Wolf's Dragoons","Capellan Confederation, Clan Hell's Horses, Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Raven Alliance, Star League (Clan Wolf), Tamar Pact, Vesper Marches, Wolf Empire","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf)","Inner Sphere General, Kell Hounds, Mercenary","Inner Sphere General, IS Clan General, Scorpion Empire","Clan Protectorate, Inner Sphere General, Mercenary, Periphery General, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf)","Draconis Combine, Periphery General","Inner Sphere General, Mercenary, Periphery General, Scorpion Empire, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf)","Kell Hounds, Lyran Commonwealth","Kell Hounds, Lyran Commonwealth, Vesper Marches","Federated Suns, Lyran Commonwealth, Vesper Marches","Clan Hell's Horses, Rasalhague Dominion, Scorpion Empire","Clan Protectorate, Clan Sea Fox, Inner Sphere General","Clan Protectorate, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Star League (Clan Wolf), Wolf's Dragoons","Filtvelt Coalition, Fronc Reaches, Inner Sphere General, Mercenary, Taurian Concordat","Federated Suns, Star League (Clan Wolf)","Federated Suns, Free Worlds League, Mercenary","Clan Protectorate, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Raven Alliance, Wolf's Dragoons","Draconis Combine, Federated Suns, Free Worlds League, Mercenary, Rasalhague Dominion, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf)","Clan Protectorate, Inner Sphere General, Magistracy of Canopus, Mercenary, Rasalhague Dominion, Raven Alliance, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf)","Draconis Combine, Mercenary","Free Worlds League, Free Worlds League (Duchy of Andurien), Mercenary","Clan Hell's Horses, Rasalhague Dominion, Raven Alliance","Clan Jade Falcon, Star League (Clan Jade Falcon)","Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Raven Alliance","Kell Hounds, Lyran Commonwealth, Star League (Clan Wolf), Tamar Pact, Vesper Marches","Federated Suns, Free Worlds League, Lyran Commonwealth, Mercenary","Draconis Combine, Federated Suns, Lyran Commonwealth, Mercenary, Tamar Pact, Taurian Concordat, Vesper Marches","Clan Protectorate, Clan Sea Fox, Lyran Commonwealth, Marian Hegemony, Scorpion Empire, Tamar Pact, Vesper Marches","Clan Hell's Horses, Clan Sea Fox, Kell Hounds, Lyran Commonwealth, Raven Alliance","Alyina Mercantile League, Clan Jade Falcon, Inner Sphere General, Kell Hounds, Mercenary, Periphery General, Rasalhague Dominion, Star League (Clan Jade Falcon), Wolf's Dragoons","Alyina Mercantile League, Clan Jade Falcon, Federated Suns, Wolf Empire","Inner Sphere General, Mercenary, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf)","Clan Protectorate, Fronc Reaches, Inner Sphere General, Magistracy of Canopus, Marian Hegemony, Mercenary","Free Worlds League, Free Worlds League (Duchy of Andurien), Magistracy of Canopus, Star League (Clan Wolf), Wolf Empire","Capellan Confederation, Federated Suns, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Magistracy of Canopus, Mercenary, Tamar Pact, Vesper Marches","Fronc Reaches, Inner Sphere General, Kell Hounds, Magistracy of Canopus, Mercenary, Wolf's Dragoons","Federated Suns, Free Worlds League, Lyran Commonwealth, Tamar Pact, Vesper Marches","Clan Hell's Horses, Wolf Empire","IS Clan General, Mercenary, Scorpion Empire","Clan Protectorate, Federated Suns, Filtvelt Coalition, Mercenary, Taurian Concordat","Clan Protectorate, Draconis Combine, Federated Suns, Mercenary, Raven Alliance","Clan Protectorate, Draconis Combine, Federated Suns, Free Worlds League, Mercenary, Star League (Clan Wolf)","Alyina Mercantile League, Clan Protectorate, Inner Sphere General, Mercenary, Periphery General, Wolf Empire","Capellan Confederation, Free Worlds League, Free Worlds League (Duchy of Andurien), Lyran Commonwealth, Magistracy of Canopus, Marian Hegemony, Mercenary, Star League (Clan Jade Falcon), Star League (Clan Smoke Jaguar), Star League (Clan Wolf), Tamar Pact, Taurian Concordat, Vesper Marches","Lyran Commonwealth, Mercenary, Star League (Clan Wolf), Tamar Pact, Vesper Marches","IS Clan General, Lyran Commonwealth, Tamar Pact, Vesper Marches","Clan Hell's Horses, Clan Protectorate, Clan Sea Fox, Rasalhague Dominion"],"values":[null,0,1,1,null,2,2,null,3,4,0,null,null,0,0,5,6,7,6,6,8,8,9,9,10,10,11,11,null,12,13,13,0,13,null,14,12,12,12,12,12,12,null,1,15,1,16,17,18,null,19,0,20,21,21,null,null,22,23,null,24,1,24,24,24,null,0,0,0,25,null,26,26,null,0,27,28,null,29,null,13,null,2,2,2,2,2,null,null,30,null,31,32,32,null,29,29,29,null,6,6,2,6,null,33,33,33,34,null,33,33,33,35,null,13,36,37,null,27,27,27,27,27,null,38,0,null,0,1,25,1,null,null,null,null,39,32,13,0,40,41,null,42,42,43,43,0,0,0,0,null,44,0,0,45,null,30,null,46,47,48,49,50,51,0,0,null,52,52,null,null,53,54,55,56,13,13,57,null,0,0,0,58,59,null,null,36,36,60,null,61,61,null,52,null,19,20,1,19,19,19,0,null,null,12,null,62,null,null,0,0,0,0,63,64,65,40,66,67,68,69,null,0,70,71,null,72,72,null,0,27,73,56,27,74,13,13,19,26,null,75,null,76,77,78,0,78,78,null,null,54,null,0,0,0,0,0,null,0,35,0,17,null,null,13,79,80,13,0,46,81,82,83,84,81,85,83,23,null,30,86,86,86,null,87,null,88,0,null,89,90,90,90,90,90,90,90,90,91,91,91,91,92,0,13,93,33,null,null,94,95,96,0,97,98,99,0,0,71,100,101,102,0,84,103,34,0,null,88,88,88,88,88,null,null,0,null,104,66,105,106,70,107,null,108,null,null,109,110,111,23,23,23,23,23,23,null,0,0,null,0,null,null,null,null,null,112,113,null,13,114,19,70,null,115,116,115,null,12,12,117,13,12,117,12,12,117,117,null,null,32,43,56,118,119,15,15,0,56,null,120,null,25,25,25,121,0,null,null,122,null,123,124,70,125,27,124,70,0,27,0,null,126,126,126,null,56,0,70,27,0,null,27,null,27,null,27,null,32,118,118,null,127,128,27,null,129,27,null,null,130,null,131,132,3,133,15,134,124,135,136,1,null,88,23,null,137,null,13,13,null,null,39,7,null,null,null,138,13,139,140,141,142,0,141,143,null,0,27,27,27,null,60,36,null,null,null,144,0,25,null,0,145,145,145,145,145,145,145,145,145,145,145,null,0,null,103,null,146,0,null,null,0,0,34,34,34,34,0,0,54,null,88,88,null,147,null,0,null,148,148,null,149,null,144,null,150,null,151,0,0,30,30,null,25,0,152,152,152,152,153,15,null,0,154,154,null,144,null,155,156,null,27,null,157,13,158,158,158,158,158,158,158,158,0,0,0,0,0,0,0,0,0,0,null,0,null,null,null,159,null,0,160,160,null,161,162,56,163,null,1,0,0,0,1,1,34,0,164,null,165,23,166,166,null,32,167,168,56,169,170,171,null,172,39,173,173,173,173,173,173,null,1,null,168,174,0,null,175,null,88,88,null,176,177,13,null,178,null,0,null,null,179,null,165,165,165,165,180,165,165,0,102,null,181,149,null,182,182,null,71,null,145,25,null,null,null,131,183,27,183,184,null,null,27,0,null,0,0,50,104,146,185,0,19,19,19,186,187,188,0,189,189,189,189,189,null,190,null,null,53,88,0,null,27,null,35,104,35,50,35,13,13,0,null,0,0,23,0,54,191,192,null,35,35,35,35,35,0,0,0,0,null,13,3,27,13,19,13,103,null,0,0,0,193,0,88,88,88,88,88,null,194,null,70,195,196,196,null,null,0,0,null,104,0,197,null,0,198,182,182,199,1,1,200,0,0,0,201,null,null,29,0,0,null,null,null,null,175,null,0,202,13,0,36,203,null,0,25,204,205,null,57,206,154,207,null,208,13,0,197,null,209,0,210,0,null,27,27,0,211,27,27,0,null,39,0,0,null,212,0,null,0,213,12,null,214,215,70,0,null,216,15,217,0,null,218,null,131,null,null,219,166,null,0,null,null,220,221,null,222,null,0,null,15,15,15,15,15,15,null,null,150,1,null,null,223,211,null,null,150,150,0,null,224,224,35,145,null,88,225,null,null,226,19,19,19,null,0,145,null,227,0,12,228,137,229,null,null,27,null,null,0,0,0,230,231,27,27,232,27,0,null,0,192,0,null,null,233,234,235,236,237,56,238,239,27,240,null,null,150,null,241,241,242,243,241,242,null,32,227,null,1,1,0,1,1,0,244,30,null,null,0,null,null,null,245,60,null,246,29,29,26,29,29,29,null,56,13,247,248,249,56,250,null,null,0,0,0,30,251,251,251,251,251,251,251,null,56,null,null,0,252,19,253,13,null,null,254,null,1,1,1,null,255,256,256,null,71,257,257,null,null,194,42,258,0,32,259,0,null,145,1,1,1,1,1,1,1,260,15,150,15,0,null,27,27,0,0,0,0,0,261,32,262,262,262,262,262,null,263,264,null,265,145,19,13,null,266,267,0,268,0,269,127,270,0,271,272,0,145,null,null,null,null,181,273,56,274,275,206,276,null,277,null,227,278,null,null,70,70,null,15,null,279,280,244,null,182,1,1,null,null,null,null,null,null,null,241,241,241,null]},"Skill0PV":{"values":[26,35,56,61,46,70,108,107,119,126,124,106,110,61,65,79,88,89,90,35,65,53,46,62,56,26,25,20,25,20,18,16,17,16,18,18,19,18,98,72,61,61,36,98,124,98,97,116,62,56,47,46,52,46,37,46,47,46,35,43,36,44,34,35,36,43,82,71,83,82,144,54,88,91,97,88,89,74,89,100,97,72,71,79,79,72,80,79,72,70,79,72,80,83,72,98,10,47,36,37,35,38,89,98,101,89,116,98,91,88,110,98,74,89,110,35,54,34,43,83,98,92,89,98,80,88,106,91,44,38,72,80,73,62,72,37,37,55,65,54,54,47,55,88,79,56,65,70,107,65,70,62,98,108,73,56,56,70,47,52,53,55,54,38,35,43,35,70,71,73,91,90,98,109,109,91,98,54,54,54,54,54,43,44,53,52,116,115,38,55,38,37,36,34,20,61,53,73,73,74,80,72,74,72,79,72,79,83,53,54,43,19,18,44,44,36,47,44,44,61,47,53,56,55,56,38,65,47,70,17,20,19,19,25,19,92,88,80,56,74,88,71,61,89,108,127,97,53,55,38,62,82,70,52,88,73,37,200,71,125,73,89,128,61,70,80,91,47,55,62,56,62,65,83,72,61,74,100,89,98,83,97,17,34,19,92,82,88,80,100,91,88,88,71,88,116,91,109,107,82,56,116,18,18,25,16,8,10,18,11,16,10,61,72,88,53,53,54,53,109,92,108,108,97,65,83,74,65,106,92,65,70,72,35,35,26,71,46,29,71,90,64,38,73,54,26,29,26,38,52,36,35,98,35,53,55,55,52,18,97,136,109,90,55,53,54,53,35,44,36,47,54,74,52,235,214,191,11,43,36,36,29,26,19,29,37,36,127,133,110,89,70,91,124,92,79,36,52,53,54,52,54,53,35,61,38,53,44,53,43,65,70,79,53,61,35,43,35,54,79,72,52,16,25,34,26,35,35,71,72,70,71,11,20,16,25,29,18,25,18,25,38,136,127,116,110,119,82,72,80,56,72,72,35,34,52,37,37,38,37,44,38,46,110,26,47,37,116,125,126,110,44,36,36,44,38,62,36,38,47,37,25,35,52,53,88,91,62,8,10,8,19,9,53,44,72,54,44,79,44,64,54,70,72,65,73,97,108,124,92,71,73,70,70,61,65,54,83,71,110,89,83,38,53,52,36,29,55,55,88,37,25,26,43,35,34,43,44,37,88,29,34,25,37,36,34,34,80,90,88,72,73,73,82,53,34,34,64,82,55,44,36,44,56,56,56,47,72,55,52,72,79,64,62,16,18,17,56,70,29,37,43,36,65,98,74,88,73,74,92,62,70,65,74,71,72,56,70,73,62,73,55,29,65,62,71,90,107,106,134,127,162,136,56,56,61,34,25,19,19,26,38,26,25,79,97,61,65,83,70,80,80,92,88,91,83,73,65,61,55,54,72,62,55,36,54,55,53,53,53,55,17,19,38,46,47,26,43,38,43,44,83,83,80,72,88,73,72,72,37,55,100,106,71,54,52,74,73,80,53,53,52,55,70,91,101,44,47,43,52,44,53,61,44,71,92,91,91,72,73,74,83,72,71,89,97,71,110,91,106,62,64,43,34,34,43,26,56,74,70,65,61,65,71,182,80,36,36,55,56,70,70,92,82,70,70,43,36,47,70,70,65,70,53,55,62,83,73,72,83,55,70,72,70,88,65,71,61,35,88,88,44,18,56,38,36,38,47,53,53,56,47,62,80,88,72,70,70,90,55,62,55,55,44,56,62,47,43,70,80,61,72,72,74,65,43,47,36,55,56,54,55,55,55,44,52,52,83,97,92,108,47,20,55,54,55,47,53,43,62,70,72,71,53,62,82,97,118,82,89,89,101,89,89,106,89,98,35,35,20,35,20,35,26,61,70,74,91,91,26,29,26,26,88,43,52,20,43,54,56,72,71,65,62,73,72,35,25,35,26,55,79,70,55,72,61,61,61,53,70,71,80,74,79,98,62,62,56,65,108,115,83,109,92,116,125,54,72,65,80,55,53,61,74,72,62,47,65,56,65,61,80,80,25,25,34,20,34,26,34,25,29,25,25,29,26,29,25,38,98,108,52,28,38,43,35,53,52,36,89,88,97,56,70,73,71,56,17,34,35,20,34,47,47,52,38,52,100,65,83,90,92,88,88,98,88,146,55,62,70,26,29,25,25,38,19,56,61,72,73,72,44,44,52,61,52,62,36,43,43,44,56,71,106,80,124,107,90,91,115,119,119,61,70,70,70,70,82,26,17,11,26,38,43,43,38,91,205,89,35,53,47,52,71,52,61,61,65,70,36,36,56,62,71,71,65,52,52,62,83,72,11,54,55,70,38,56,38,89,72,89,90,74,62,43,55,56,52,61,54,55,36,56,36,34,56,44,36,36,34,36,37,38,71,43,47,100,79,83,70,70,90,61,80,88,91,106,20,35,35,44,35,44,43,38,52,29,34,36,36,61,61,70,107,90,118,109,92,25,56,52,71,47,38,53,53,52,62,79,73,73,71,65,53,56,71,73,73,72,72,56,65,70,72,62,88,88,88,108,44,28,46]},"Skill1PV":{"values":[23,31,50,54,41,62,96,95,106,112,110,94,98,54,58,70,78,79,80,31,58,47,41,55,50,23,22,18,22,18,16,14,15,14,16,16,17,16,87,64,54,54,32,87,110,87,86,103,55,50,42,41,46,41,33,41,42,41,31,38,32,39,30,31,32,38,73,63,74,73,128,48,78,81,86,78,79,66,79,89,86,64,63,70,70,64,71,70,64,62,70,64,71,74,64,87,9,42,32,33,31,34,79,87,90,79,103,87,81,78,98,87,66,79,98,31,48,30,38,74,87,82,79,87,71,78,94,81,39,34,64,71,65,55,64,33,33,49,58,48,48,42,49,78,70,50,58,62,95,58,62,55,87,96,65,50,50,62,42,46,47,49,48,34,31,38,31,62,63,65,81,80,87,97,97,81,87,48,48,48,48,48,38,39,47,46,103,102,34,49,34,33,32,30,18,54,47,65,65,66,71,64,66,64,70,64,70,74,47,48,38,17,16,39,39,32,42,39,39,54,42,47,50,49,50,34,58,42,62,15,18,17,17,22,17,82,78,71,50,66,78,63,54,79,96,113,86,47,49,34,55,73,62,46,78,65,33,178,63,111,65,79,114,54,62,71,81,42,49,55,50,55,58,74,64,54,66,89,79,87,74,86,15,30,17,82,73,78,71,89,81,78,78,63,78,103,81,97,95,73,50,103,16,16,22,14,7,9,16,10,14,9,54,64,78,47,47,48,47,97,82,96,96,86,58,74,66,58,94,82,58,62,64,31,31,23,63,41,26,63,80,57,34,65,48,23,26,23,34,46,32,31,87,31,47,49,49,46,16,86,121,97,80,49,47,48,47,31,39,32,42,48,66,46,209,190,170,10,38,32,32,26,23,17,26,33,32,113,118,98,79,62,81,110,82,70,32,46,47,48,46,48,47,31,54,34,47,39,47,38,58,62,70,47,54,31,38,31,48,70,64,46,14,22,30,23,31,31,63,64,62,63,10,18,14,22,26,16,22,16,22,34,121,113,103,98,106,73,64,71,50,64,64,31,30,46,33,33,34,33,39,34,41,98,23,42,33,103,111,112,98,39,32,32,39,34,55,32,34,42,33,22,31,46,47,78,81,55,7,9,7,17,8,47,39,64,48,39,70,39,57,48,62,64,58,65,86,96,110,82,63,65,62,62,54,58,48,74,63,98,79,74,34,47,46,32,26,49,49,78,33,22,23,38,31,30,38,39,33,78,26,30,22,33,32,30,30,71,80,78,64,65,65,73,47,30,30,57,73,49,39,32,39,50,50,50,42,64,49,46,64,70,57,55,14,16,15,50,62,26,33,38,32,58,87,66,78,65,66,82,55,62,58,66,63,64,50,62,65,55,65,49,26,58,55,63,80,95,94,119,113,144,121,50,50,54,30,22,17,17,23,34,23,22,70,86,54,58,74,62,71,71,82,78,81,74,65,58,54,49,48,64,55,49,32,48,49,47,47,47,49,15,17,34,41,42,23,38,34,38,39,74,74,71,64,78,65,64,64,33,49,89,94,63,48,46,66,65,71,47,47,46,49,62,81,90,39,42,38,46,39,47,54,39,63,82,81,81,64,65,66,74,64,63,79,86,63,98,81,94,55,57,38,30,30,38,23,50,66,62,58,54,58,63,162,71,32,32,49,50,62,62,82,73,62,62,38,32,42,62,62,58,62,47,49,55,74,65,64,74,49,62,64,62,78,58,63,54,31,78,78,39,16,50,34,32,34,42,47,47,50,42,55,71,78,64,62,62,80,49,55,49,49,39,50,55,42,38,62,71,54,64,64,66,58,38,42,32,49,50,48,49,49,49,39,46,46,74,86,82,96,42,18,49,48,49,42,47,38,55,62,64,63,47,55,73,86,105,73,79,79,90,79,79,94,79,87,31,31,18,31,18,31,23,54,62,66,81,81,23,26,23,23,78,38,46,18,38,48,50,64,63,58,55,65,64,31,22,31,23,49,70,62,49,64,54,54,54,47,62,63,71,66,70,87,55,55,50,58,96,102,74,97,82,103,111,48,64,58,71,49,47,54,66,64,55,42,58,50,58,54,71,71,22,22,30,18,30,23,30,22,26,22,22,26,23,26,22,34,87,96,46,25,34,38,31,47,46,32,79,78,86,50,62,65,63,50,15,30,31,18,30,42,42,46,34,46,89,58,74,80,82,78,78,87,78,130,49,55,62,23,26,22,22,34,17,50,54,64,65,64,39,39,46,54,46,55,32,38,38,39,50,63,94,71,110,95,80,81,102,106,106,54,62,62,62,62,73,23,15,10,23,34,38,38,34,81,182,79,31,47,42,46,63,46,54,54,58,62,32,32,50,55,63,63,58,46,46,55,74,64,10,48,49,62,34,50,34,79,64,79,80,66,55,38,49,50,46,54,48,49,32,50,32,30,50,39,32,32,30,32,33,34,63,38,42,89,70,74,62,62,80,54,71,78,81,94,18,31,31,39,31,39,38,34,46,26,30,32,32,54,54,62,95,80,105,97,82,22,50,46,63,42,34,47,47,46,55,70,65,65,63,58,47,50,63,65,65,64,64,50,58,62,64,55,78,78,78,96,39,25,41]},"Skill2PV":{"values":[20,27,44,47,36,54,84,83,93,98,96,82,86,47,51,61,68,69,70,27,51,41,36,48,44,20,19,16,19,16,14,12,13,12,14,14,15,14,76,56,47,47,28,76,96,76,75,90,48,44,37,36,40,36,29,36,37,36,27,33,28,34,26,27,28,33,64,55,65,64,112,42,68,71,75,68,69,58,69,78,75,56,55,61,61,56,62,61,56,54,61,56,62,65,56,76,8,37,28,29,27,30,69,76,79,69,90,76,71,68,86,76,58,69,86,27,42,26,33,65,76,72,69,76,62,68,82,71,34,30,56,62,57,48,56,29,29,43,51,42,42,37,43,68,61,44,51,54,83,51,54,48,76,84,57,44,44,54,37,40,41,43,42,30,27,33,27,54,55,57,71,70,76,85,85,71,76,42,42,42,42,42,33,34,41,40,90,89,30,43,30,29,28,26,16,47,41,57,57,58,62,56,58,56,61,56,61,65,41,42,33,15,14,34,34,28,37,34,34,47,37,41,44,43,44,30,51,37,54,13,16,15,15,19,15,72,68,62,44,58,68,55,47,69,84,99,75,41,43,30,48,64,54,40,68,57,29,156,55,97,57,69,100,47,54,62,71,37,43,48,44,48,51,65,56,47,58,78,69,76,65,75,13,26,15,72,64,68,62,78,71,68,68,55,68,90,71,85,83,64,44,90,14,14,19,12,6,8,14,9,12,8,47,56,68,41,41,42,41,85,72,84,84,75,51,65,58,51,82,72,51,54,56,27,27,20,55,36,23,55,70,50,30,57,42,20,23,20,30,40,28,27,76,27,41,43,43,40,14,75,106,85,70,43,41,42,41,27,34,28,37,42,58,40,183,166,149,9,33,28,28,23,20,15,23,29,28,99,103,86,69,54,71,96,72,61,28,40,41,42,40,42,41,27,47,30,41,34,41,33,51,54,61,41,47,27,33,27,42,61,56,40,12,19,26,20,27,27,55,56,54,55,9,16,12,19,23,14,19,14,19,30,106,99,90,86,93,64,56,62,44,56,56,27,26,40,29,29,30,29,34,30,36,86,20,37,29,90,97,98,86,34,28,28,34,30,48,28,30,37,29,19,27,40,41,68,71,48,6,8,6,15,7,41,34,56,42,34,61,34,50,42,54,56,51,57,75,84,96,72,55,57,54,54,47,51,42,65,55,86,69,65,30,41,40,28,23,43,43,68,29,19,20,33,27,26,33,34,29,68,23,26,19,29,28,26,26,62,70,68,56,57,57,64,41,26,26,50,64,43,34,28,34,44,44,44,37,56,43,40,56,61,50,48,12,14,13,44,54,23,29,33,28,51,76,58,68,57,58,72,48,54,51,58,55,56,44,54,57,48,57,43,23,51,48,55,70,83,82,104,99,126,106,44,44,47,26,19,15,15,20,30,20,19,61,75,47,51,65,54,62,62,72,68,71,65,57,51,47,43,42,56,48,43,28,42,43,41,41,41,43,13,15,30,36,37,20,33,30,33,34,65,65,62,56,68,57,56,56,29,43,78,82,55,42,40,58,57,62,41,41,40,43,54,71,79,34,37,33,40,34,41,47,34,55,72,71,71,56,57,58,65,56,55,69,75,55,86,71,82,48,50,33,26,26,33,20,44,58,54,51,47,51,55,142,62,28,28,43,44,54,54,72,64,54,54,33,28,37,54,54,51,54,41,43,48,65,57,56,65,43,54,56,54,68,51,55,47,27,68,68,34,14,44,30,28,30,37,41,41,44,37,48,62,68,56,54,54,70,43,48,43,43,34,44,48,37,33,54,62,47,56,56,58,51,33,37,28,43,44,42,43,43,43,34,40,40,65,75,72,84,37,16,43,42,43,37,41,33,48,54,56,55,41,48,64,75,92,64,69,69,79,69,69,82,69,76,27,27,16,27,16,27,20,47,54,58,71,71,20,23,20,20,68,33,40,16,33,42,44,56,55,51,48,57,56,27,19,27,20,43,61,54,43,56,47,47,47,41,54,55,62,58,61,76,48,48,44,51,84,89,65,85,72,90,97,42,56,51,62,43,41,47,58,56,48,37,51,44,51,47,62,62,19,19,26,16,26,20,26,19,23,19,19,23,20,23,19,30,76,84,40,22,30,33,27,41,40,28,69,68,75,44,54,57,55,44,13,26,27,16,26,37,37,40,30,40,78,51,65,70,72,68,68,76,68,114,43,48,54,20,23,19,19,30,15,44,47,56,57,56,34,34,40,47,40,48,28,33,33,34,44,55,82,62,96,83,70,71,89,93,93,47,54,54,54,54,64,20,13,9,20,30,33,33,30,71,159,69,27,41,37,40,55,40,47,47,51,54,28,28,44,48,55,55,51,40,40,48,65,56,9,42,43,54,30,44,30,69,56,69,70,58,48,33,43,44,40,47,42,43,28,44,28,26,44,34,28,28,26,28,29,30,55,33,37,78,61,65,54,54,70,47,62,68,71,82,16,27,27,34,27,34,33,30,40,23,26,28,28,47,47,54,83,70,92,85,72,19,44,40,55,37,30,41,41,40,48,61,57,57,55,51,41,44,55,57,57,56,56,44,51,54,56,48,68,68,68,84,34,22,36]},"Skill3PV":{"values":[17,23,38,40,31,46,72,71,80,84,82,70,74,40,44,52,58,59,60,23,44,35,31,41,38,17,16,14,16,14,12,10,11,10,12,12,13,12,65,48,40,40,24,63,79,63,64,75,41,38,32,31,34,31,25,31,32,31,23,28,24,29,22,23,24,28,55,47,56,55,96,36,58,61,64,58,59,50,59,66,64,48,47,52,52,48,53,52,48,46,52,48,53,56,48,65,7,32,24,25,23,26,59,65,68,59,77,65,61,58,74,65,50,59,72,23,36,22,28,56,65,62,59,65,53,58,70,61,29,26,48,53,49,41,48,25,25,37,44,36,36,32,37,58,52,38,44,46,71,44,46,41,65,72,49,38,38,46,32,34,35,37,36,26,23,28,23,46,47,49,61,60,65,73,73,61,65,36,36,36,36,36,28,29,35,34,75,73,26,37,26,25,24,22,14,40,35,49,49,50,53,48,50,48,52,48,52,56,35,36,28,13,12,29,29,24,32,29,29,40,32,35,38,37,38,26,44,32,46,11,14,13,13,16,13,62,58,53,38,50,58,47,40,59,72,85,64,35,37,26,41,55,46,34,58,49,25,134,47,83,49,59,86,40,46,53,61,32,37,41,38,41,44,56,48,40,50,67,59,65,55,64,11,22,13,62,55,58,53,67,61,58,56,47,58,75,61,73,71,55,38,77,12,12,16,10,5,7,12,8,10,7,40,48,58,35,35,36,35,73,62,72,72,64,44,56,50,44,70,62,44,46,48,23,23,17,47,31,20,47,60,43,26,49,36,17,20,17,26,34,24,23,65,23,35,37,37,34,12,64,91,73,60,37,35,36,35,23,29,24,32,36,50,34,157,142,128,8,28,24,24,20,17,13,20,25,24,85,88,74,59,46,61,79,62,52,24,34,35,36,34,36,35,23,40,26,35,29,35,28,44,46,52,35,40,23,28,23,36,52,48,34,10,16,22,17,23,23,47,48,46,47,8,14,10,16,20,12,16,12,16,26,91,85,77,74,80,55,48,53,38,48,48,23,22,34,25,25,26,25,29,26,31,74,17,32,25,77,83,82,72,29,24,24,29,26,41,24,26,32,25,16,23,34,35,58,61,41,5,7,5,13,6,35,29,48,36,29,52,29,43,36,46,48,44,49,64,72,82,62,47,49,46,46,40,44,36,56,47,74,59,56,26,35,34,24,20,37,37,58,25,16,17,28,23,22,28,29,25,58,20,22,16,25,24,22,22,53,60,58,48,49,49,55,35,22,22,43,55,37,29,24,29,38,38,38,32,48,37,34,48,52,43,41,10,12,11,38,46,20,25,28,24,44,65,50,58,49,50,62,41,46,44,50,47,48,38,46,49,41,49,37,20,44,41,47,60,71,70,89,85,108,91,38,38,40,22,16,13,13,17,26,17,16,52,64,40,44,56,46,53,53,62,58,61,56,49,44,40,37,36,48,41,37,24,36,37,35,35,35,37,11,13,26,30,32,17,28,26,28,29,56,56,53,48,58,49,48,48,25,37,67,70,47,36,34,50,49,53,35,35,34,37,46,61,68,29,32,28,34,29,35,40,29,47,62,61,61,48,49,50,56,48,47,59,64,47,74,61,70,41,43,28,22,22,28,17,38,50,46,44,40,44,47,122,53,24,24,37,38,46,46,62,55,46,46,28,24,32,46,46,44,46,35,37,41,56,49,48,56,37,46,48,46,58,44,47,40,23,58,58,29,12,38,26,24,26,32,35,35,38,32,41,53,58,48,46,46,60,37,41,37,37,29,38,41,32,28,46,53,40,48,48,50,44,28,32,24,37,38,36,37,37,37,29,34,34,56,64,62,72,32,14,37,36,37,32,35,28,41,46,48,47,35,41,55,64,79,55,59,59,68,59,59,70,59,65,23,23,14,23,14,23,17,40,46,50,61,61,17,20,17,17,58,28,34,14,28,36,38,48,47,44,41,49,48,23,16,23,17,37,52,46,37,48,40,40,40,35,46,47,53,50,52,65,41,41,38,44,72,76,56,73,62,77,83,36,48,44,53,37,35,40,50,48,41,32,44,38,44,40,53,53,16,16,22,14,22,17,22,16,20,16,16,20,17,20,16,26,65,72,34,19,26,28,23,35,34,24,59,58,64,38,46,49,47,38,11,22,23,14,22,32,32,34,26,34,67,44,56,60,62,58,58,65,58,98,37,41,46,17,20,16,16,26,13,38,40,48,49,48,29,29,34,40,34,41,24,28,28,29,38,47,70,53,82,71,60,61,76,80,80,40,46,46,46,46,55,17,11,8,17,26,28,28,26,61,136,59,23,35,32,34,47,34,40,40,44,46,24,24,38,41,47,47,44,34,34,41,56,48,8,36,37,46,26,38,26,59,48,59,60,50,41,28,37,38,34,40,36,37,24,38,24,22,38,29,24,24,22,24,25,26,47,28,32,67,52,56,46,46,60,40,53,58,61,70,14,23,23,29,23,29,28,26,34,20,22,24,24,40,40,46,71,60,79,73,62,16,38,34,47,32,26,35,35,34,41,52,49,49,47,44,35,38,47,49,49,48,48,38,44,46,48,41,58,58,58,72,29,19,31]},"Skill4PV":{"values":[14,19,34,33,27,40,63,59,67,70,71,58,62,33,37,43,48,49,50,20,37,30,27,36,34,14,13,12,13,12,10,8,9,8,10,10,11,10,54,40,35,35,21,54,68,54,56,64,34,32,28,27,29,27,22,27,27,27,19,23,20,24,18,19,20,23,48,41,49,48,80,30,50,54,56,50,51,44,51,56,56,40,39,43,43,40,44,43,40,38,43,40,44,47,40,54,6,27,20,21,19,22,49,54,57,49,68,54,51,48,62,54,44,51,62,19,30,18,23,49,54,52,49,54,44,48,58,51,24,22,40,44,41,34,40,21,21,31,37,30,30,27,31,48,43,32,37,38,59,37,40,34,57,63,43,32,32,38,27,28,29,31,30,22,19,23,19,40,41,41,54,50,54,64,61,51,54,30,30,30,30,30,23,24,29,28,64,63,22,31,22,21,20,18,12,33,29,41,41,42,47,40,42,40,43,40,43,49,29,30,23,11,10,24,24,20,27,24,24,33,27,29,32,31,32,22,37,27,38,9,12,11,11,13,11,52,48,47,32,42,48,39,33,49,60,71,53,29,31,22,34,48,38,28,48,41,21,112,39,69,41,51,72,33,38,44,54,27,33,36,34,34,37,47,40,33,42,58,51,57,47,56,9,18,11,55,48,50,47,58,54,50,48,41,50,64,54,64,62,48,32,64,10,10,13,8,4,6,10,7,8,6,33,40,48,29,29,30,29,61,52,60,60,53,37,47,42,37,58,52,37,38,40,19,19,14,39,27,17,39,50,37,22,41,30,14,17,14,22,28,20,19,57,19,29,31,31,28,10,53,79,61,50,31,29,30,29,19,24,20,27,30,44,29,137,118,107,7,23,20,20,17,14,11,17,21,20,74,77,65,51,40,54,68,55,43,20,28,29,30,28,30,29,19,33,22,29,24,29,23,37,38,43,29,33,19,23,19,30,43,40,28,8,13,18,14,19,19,39,40,38,39,7,12,8,13,17,10,13,10,13,22,79,74,68,65,70,48,42,47,34,42,42,19,18,28,21,21,22,21,24,22,27,62,14,27,21,68,72,70,62,24,20,20,24,22,34,20,22,27,21,13,19,29,30,50,54,36,4,6,4,11,5,29,24,40,30,24,43,24,37,30,38,40,37,41,53,60,68,52,39,41,38,38,33,37,30,49,41,62,49,47,23,29,28,20,17,31,31,50,21,13,14,23,19,18,23,24,21,48,17,19,13,21,20,18,18,44,50,48,42,43,43,48,29,18,18,37,48,31,24,20,24,32,32,32,27,40,31,28,40,43,37,34,8,10,9,32,38,17,21,23,20,37,54,42,48,41,42,52,34,38,37,42,39,42,32,40,43,34,43,31,17,37,34,39,50,59,58,78,74,94,79,32,32,33,18,13,11,11,14,22,14,13,43,53,33,37,47,38,44,44,52,48,54,47,41,37,33,31,30,40,34,31,20,30,31,30,29,29,33,9,11,23,26,27,14,23,22,23,24,47,47,44,40,48,41,42,42,21,33,58,61,41,30,28,42,41,44,29,29,28,31,40,51,57,24,27,23,28,24,30,35,26,39,52,51,51,40,41,42,47,40,39,51,56,41,65,54,61,36,37,23,18,18,23,14,34,42,38,37,33,37,39,102,44,20,21,31,32,38,38,52,48,38,38,23,20,27,38,38,37,38,29,31,34,47,41,40,49,31,38,40,38,48,37,39,33,19,48,48,24,10,32,22,20,22,27,30,29,32,27,34,44,48,40,38,38,50,31,34,31,31,24,32,34,27,23,38,44,33,40,40,42,37,23,27,20,31,32,30,31,31,31,24,28,28,47,53,52,63,27,12,31,30,31,27,29,23,34,38,40,39,29,34,48,53,69,48,49,49,57,49,49,58,49,54,19,19,12,19,12,19,14,33,38,42,51,51,14,17,14,14,48,23,28,13,23,30,34,40,39,37,34,41,40,19,13,19,14,31,43,38,31,40,33,33,33,29,40,41,44,44,43,57,34,34,34,37,60,63,47,64,52,64,69,30,40,37,47,31,29,33,42,40,34,27,37,32,37,33,44,44,13,13,18,12,18,14,18,13,17,13,13,17,14,17,14,22,57,63,29,16,23,23,19,29,28,20,51,50,56,34,40,43,41,32,9,18,19,12,18,27,27,28,22,28,58,37,49,50,55,50,50,54,48,82,33,34,38,14,17,13,13,22,11,32,33,40,41,42,24,24,28,33,28,34,20,23,23,24,32,41,58,44,68,59,50,51,63,67,67,33,38,38,40,40,48,14,9,7,14,22,23,23,22,51,113,49,19,29,27,28,41,28,33,33,37,38,20,20,32,34,39,39,37,28,28,34,47,40,7,30,31,38,22,32,22,49,40,49,50,44,34,23,31,32,28,33,30,31,20,32,20,18,32,24,20,20,18,20,21,22,41,23,27,58,43,47,38,38,50,33,44,48,51,58,12,19,19,24,19,24,23,22,28,17,18,20,20,33,33,38,62,50,69,64,52,13,32,29,39,27,22,29,29,29,34,43,41,41,39,37,29,32,39,41,41,42,42,32,37,38,40,34,48,48,48,63,26,17,27]},"Skill5PV":{"values":[14,18,29,32,23,34,54,56,63,67,61,55,60,32,35,42,46,47,48,17,35,26,23,31,29,14,13,12,13,12,10,7,8,7,10,10,11,10,53,38,30,30,18,49,61,49,48,58,34,31,24,23,25,23,19,23,24,23,18,23,19,24,17,18,19,23,41,35,42,41,76,29,43,46,48,43,44,38,44,50,48,38,37,42,42,38,43,42,38,36,42,38,43,44,38,53,5,25,19,20,18,22,47,53,54,47,58,53,49,46,60,53,38,44,56,18,29,17,23,42,53,50,47,53,43,46,55,49,24,22,38,43,40,34,38,20,20,30,35,29,29,25,30,46,42,31,35,36,56,35,34,34,49,54,37,31,31,36,25,26,28,30,29,22,18,23,18,34,35,40,46,48,53,55,59,49,53,29,29,29,29,29,23,24,28,26,58,57,22,30,22,20,19,17,12,32,28,40,40,41,40,38,41,38,42,38,42,42,28,29,23,11,10,24,24,19,25,24,24,32,25,28,31,30,31,22,35,25,36,8,12,11,11,13,11,50,46,40,31,41,46,37,32,47,58,68,52,28,30,22,34,41,36,26,46,40,20,108,37,66,40,44,69,32,36,43,46,25,28,31,29,34,35,44,38,32,41,50,44,49,42,48,8,17,11,47,41,43,40,50,46,43,43,35,43,58,46,55,53,41,31,62,10,10,13,7,3,5,10,6,7,5,32,38,46,28,28,29,28,59,50,58,58,52,35,44,41,35,55,50,35,36,38,18,18,14,37,23,16,37,48,32,22,40,29,14,16,14,22,26,19,18,49,18,28,30,30,26,10,52,68,59,48,30,28,29,28,18,24,19,25,29,38,25,118,112,102,6,23,19,19,16,14,11,16,20,19,64,66,56,44,34,46,61,47,42,19,26,28,29,26,29,28,18,32,22,28,24,28,23,35,36,42,28,32,18,23,18,29,42,38,26,7,13,17,14,18,18,37,38,36,37,6,12,7,13,16,10,13,10,13,22,68,64,58,56,60,41,36,40,29,36,36,18,17,26,20,20,22,20,24,22,23,60,14,25,20,58,62,63,56,24,19,19,24,22,34,19,22,25,20,13,18,25,26,43,46,31,3,5,3,11,4,28,24,38,29,24,42,24,32,29,36,38,35,40,52,58,63,50,37,40,36,36,32,35,29,42,35,60,47,44,20,28,26,19,16,30,30,43,20,13,14,23,18,17,23,24,20,46,16,16,13,20,19,17,17,43,48,46,36,37,37,41,28,17,17,32,41,30,24,19,24,31,31,31,25,38,30,26,38,42,32,34,7,10,8,31,36,16,20,23,19,35,53,41,46,40,41,50,34,36,35,41,37,36,31,34,37,34,37,30,16,35,34,37,48,56,55,67,64,81,68,31,31,32,17,13,11,11,14,22,14,13,42,52,32,35,44,36,43,43,50,46,46,44,40,35,32,30,29,38,34,30,19,29,30,26,28,28,28,8,11,20,23,25,14,23,22,23,24,44,44,43,38,46,40,36,36,20,28,50,52,35,29,26,41,40,43,28,28,26,30,34,49,54,24,25,23,26,24,26,30,22,37,50,49,49,38,40,41,44,38,37,44,48,35,56,46,52,31,32,23,17,17,23,14,29,41,36,35,32,35,37,98,43,19,18,30,31,36,36,50,41,36,36,23,19,25,36,36,35,36,28,30,34,44,40,38,42,30,36,38,36,46,35,37,32,18,46,46,24,10,31,22,19,22,25,26,28,31,24,34,43,46,38,36,36,48,30,34,30,30,24,31,34,25,23,36,43,32,38,38,41,35,23,25,19,30,31,29,30,30,30,24,26,26,44,52,50,54,25,12,30,29,30,25,28,23,34,36,38,37,28,34,41,52,59,41,47,47,54,47,47,55,47,53,18,18,12,18,12,18,14,32,36,41,49,49,14,16,14,14,46,23,26,11,23,29,29,38,37,35,34,40,38,18,13,18,14,30,42,36,30,38,32,32,32,28,34,35,43,38,42,49,34,34,29,35,58,61,44,55,50,62,66,29,38,35,40,30,28,32,41,38,34,25,35,31,35,32,43,43,13,13,17,12,17,14,17,13,16,13,13,16,14,16,12,22,49,54,25,14,20,23,18,28,26,19,44,43,48,29,34,37,35,31,8,17,18,12,17,25,25,26,22,26,50,35,42,48,47,43,43,53,46,79,28,34,36,14,16,13,13,22,11,31,32,38,40,36,24,24,26,32,26,34,19,23,23,24,31,35,55,43,64,56,48,49,61,63,63,32,36,36,34,34,41,14,8,6,14,22,23,23,22,49,109,47,18,28,25,26,35,26,32,32,35,36,19,19,31,34,37,37,35,26,26,34,44,38,6,29,30,36,22,31,22,47,38,47,48,38,34,23,30,31,26,32,29,30,19,31,19,17,31,24,19,19,17,19,20,22,35,23,25,50,42,44,36,36,48,32,43,46,49,55,12,18,18,24,18,24,23,22,26,16,17,19,19,32,32,36,53,48,59,55,50,13,31,25,37,25,22,28,28,25,34,42,40,40,37,35,28,31,37,40,40,36,36,31,35,36,38,34,46,46,46,54,22,14,23]},"Skill6PV":{"values":[12,15,26,27,20,30,48,47,53,56,54,46,50,27,29,35,38,39,40,15,29,23,20,28,26,12,11,10,11,10,8,6,7,6,8,8,9,8,44,32,27,27,16,44,54,44,43,52,28,26,21,20,22,20,17,20,21,20,15,19,16,20,14,15,16,19,36,31,37,36,64,24,38,41,43,38,39,34,39,44,43,32,31,35,35,32,36,35,32,30,35,32,36,37,32,44,4,21,16,17,15,18,39,44,45,39,52,44,41,38,50,44,34,39,50,15,24,14,19,37,44,42,39,44,36,38,46,41,20,18,32,36,33,28,32,17,17,25,29,24,24,21,25,38,35,26,29,30,47,29,30,28,44,48,33,26,26,30,21,22,23,25,24,18,15,19,15,30,31,33,41,40,44,49,49,41,44,24,24,24,24,24,19,20,23,22,52,51,18,25,18,17,16,14,10,27,23,33,33,34,36,32,34,32,35,32,35,37,23,24,19,9,8,20,20,16,21,20,20,27,21,23,26,25,26,18,29,21,30,7,10,9,9,11,9,42,38,36,26,34,38,31,27,39,48,57,43,23,25,18,28,36,30,22,38,33,17,90,31,55,33,39,58,27,30,36,41,21,25,28,26,28,29,37,32,27,34,44,39,44,37,43,7,14,9,42,36,38,36,44,41,38,38,31,38,52,41,49,47,36,26,52,8,8,11,6,2,4,8,5,6,4,27,32,38,23,23,24,23,49,42,48,48,43,29,37,34,29,46,42,29,30,32,15,15,12,31,20,13,31,40,28,18,33,24,12,13,12,18,22,16,15,44,15,23,25,25,22,8,43,60,49,40,25,23,24,23,15,20,16,21,24,34,22,105,94,85,5,19,16,16,13,12,9,13,17,16,57,59,50,39,30,41,54,42,35,16,22,23,24,22,24,23,15,27,18,23,20,23,19,29,30,35,23,27,15,19,15,24,35,32,22,6,11,14,12,15,15,31,32,30,31,5,10,6,11,13,8,11,8,11,18,60,57,52,50,53,36,32,36,26,32,32,15,14,22,17,17,18,17,20,18,20,50,12,21,17,52,55,56,50,20,16,16,20,18,28,16,18,21,17,11,15,22,23,38,41,28,2,4,2,9,3,23,20,32,24,20,35,20,28,24,30,32,29,33,43,48,54,42,31,33,30,30,27,29,24,37,31,50,39,37,18,23,22,16,13,25,25,38,17,11,12,19,15,14,19,20,17,38,13,14,11,17,16,14,14,36,40,38,32,33,33,36,23,14,14,28,36,25,20,16,20,26,26,26,21,32,25,22,32,35,28,28,6,8,7,26,30,13,17,19,16,29,44,34,38,33,34,42,28,30,29,34,31,32,26,30,33,28,33,25,13,29,28,31,40,47,46,60,57,72,60,26,26,27,14,11,9,9,12,18,12,11,35,43,27,29,37,30,36,36,42,38,41,37,33,29,27,25,24,32,28,25,16,24,25,23,23,23,25,7,9,18,20,21,12,19,18,19,20,37,37,36,32,38,33,32,32,17,25,44,46,31,24,22,34,33,36,23,23,22,25,30,41,45,20,21,19,22,20,23,27,20,31,42,41,41,32,33,34,37,32,31,39,43,31,50,41,46,28,28,19,14,14,19,12,26,34,30,29,27,29,31,82,36,16,16,25,26,30,30,42,36,30,30,19,16,21,30,30,29,30,23,25,28,37,33,32,37,25,30,32,30,38,29,31,27,15,38,38,20,8,26,18,16,18,21,23,23,26,21,28,36,38,32,30,30,40,25,28,25,25,20,26,28,21,19,30,36,27,32,32,34,29,19,21,16,25,26,24,25,25,25,20,22,22,37,43,42,48,21,10,25,24,25,21,23,19,28,30,32,31,23,28,36,43,52,36,39,39,45,39,39,46,39,44,15,15,10,15,10,15,12,27,30,34,41,41,12,13,12,12,38,19,22,10,19,24,26,32,31,29,28,33,32,15,11,15,12,25,35,30,25,32,27,27,27,23,30,31,36,34,35,44,28,28,26,29,48,51,37,49,42,52,55,24,32,29,36,25,23,27,34,32,28,21,29,26,29,27,36,36,11,11,14,10,14,12,14,11,13,11,11,13,12,13,11,18,44,48,22,12,18,19,15,23,22,16,39,38,43,26,30,33,31,26,7,14,15,10,14,21,21,22,18,22,44,29,37,40,42,38,38,44,38,66,25,28,30,12,13,11,11,18,9,26,27,32,33,32,20,20,22,27,22,28,16,19,19,20,26,31,46,36,54,47,40,41,51,53,53,27,30,30,30,30,36,12,7,5,12,18,19,19,18,41,91,39,15,23,21,22,31,22,27,27,29,30,16,16,26,28,31,31,29,22,22,28,37,32,5,24,25,30,18,26,18,39,32,39,40,34,28,19,25,26,22,27,24,25,16,26,16,14,26,20,16,16,14,16,17,18,31,19,21,44,35,37,30,30,40,27,36,38,41,46,10,15,15,20,15,20,19,18,22,13,14,16,16,27,27,30,47,40,52,49,42,11,26,22,31,21,18,23,23,22,28,35,33,33,31,29,23,26,31,33,33,32,32,26,29,30,32,28,38,38,38,48,20,12,20]},"Skill7PV":{"values":[11,13,23,24,17,26,42,41,46,49,47,40,44,24,25,31,33,34,35,13,25,20,17,25,23,11,10,9,10,9,7,5,6,5,7,7,8,7,39,28,24,24,14,39,47,39,38,46,25,23,18,17,19,17,15,17,18,17,13,17,14,18,12,13,14,17,31,27,32,31,56,21,33,36,38,33,34,30,34,38,38,28,27,31,31,28,32,31,28,26,31,28,32,32,28,39,3,18,14,15,13,16,34,39,39,34,46,39,36,33,44,39,30,34,44,13,21,12,17,32,39,37,34,39,32,33,40,36,18,16,28,32,29,25,28,15,15,22,25,21,21,18,22,33,31,23,25,26,41,25,26,25,39,42,29,23,23,26,18,19,20,22,21,16,13,17,13,26,27,29,36,35,39,43,43,36,39,21,21,21,21,21,17,18,20,19,46,45,16,22,16,15,14,12,9,24,20,29,29,30,32,28,30,28,31,28,31,32,20,21,17,8,7,18,18,14,18,18,18,24,18,20,23,22,23,16,25,18,26,6,9,8,8,10,8,37,33,32,23,30,33,27,24,34,42,50,38,20,22,16,25,31,26,19,33,29,15,79,27,48,29,34,51,24,26,32,36,18,22,25,23,25,25,32,28,24,30,38,34,39,32,38,6,12,8,37,31,33,32,38,36,33,33,27,33,46,36,43,41,31,23,46,7,7,10,5,1,3,7,4,5,3,24,28,33,20,20,21,20,43,37,42,42,38,25,32,30,25,40,37,25,26,28,13,13,11,27,17,11,27,35,24,16,29,21,11,11,11,16,19,14,13,39,13,20,22,22,19,7,38,52,43,35,22,20,21,20,13,18,14,18,21,30,19,92,82,74,4,17,14,14,11,11,8,11,15,14,50,52,44,34,26,36,47,37,31,14,19,20,21,19,21,20,13,24,16,20,18,20,17,25,26,31,20,24,13,17,13,21,31,28,19,5,10,12,11,13,13,27,28,26,27,4,9,5,10,11,7,10,7,10,16,52,50,46,44,46,31,28,32,23,28,28,13,12,19,15,15,16,15,18,16,17,44,11,18,15,46,48,49,44,18,14,14,18,16,25,14,16,18,15,10,13,19,20,33,36,25,1,3,1,8,2,20,18,28,21,18,31,18,24,21,26,28,25,29,38,42,47,37,27,29,26,26,24,25,21,32,27,44,34,32,16,20,19,14,11,22,22,33,15,10,11,17,13,12,17,18,15,33,11,12,10,15,14,12,12,32,35,33,28,29,29,31,20,12,12,24,31,22,18,14,18,23,23,23,18,28,22,19,28,31,24,25,5,7,6,23,26,11,15,17,14,25,39,30,33,29,30,37,25,26,25,30,27,28,23,26,29,25,29,22,11,25,25,27,35,41,40,53,50,63,52,23,23,24,12,10,8,8,11,16,11,10,31,38,24,25,32,26,32,32,37,33,36,32,29,25,24,22,21,28,25,22,14,21,22,20,20,20,22,6,8,16,17,18,11,17,16,17,18,32,32,32,28,33,29,28,28,15,22,38,40,27,21,19,30,29,32,20,20,19,22,26,36,39,18,18,17,19,18,20,24,18,27,37,36,36,28,29,30,32,28,27,34,38,27,44,36,40,25,24,17,12,12,17,11,23,30,26,25,24,25,27,72,32,14,14,22,23,26,26,37,31,26,26,17,14,18,26,26,25,26,20,22,25,32,29,28,32,22,26,28,26,33,25,27,24,13,33,33,18,7,23,16,14,16,18,20,20,23,18,25,32,33,28,26,26,35,22,25,22,22,18,23,25,18,17,26,32,24,28,28,30,25,17,18,14,22,23,21,22,22,22,18,19,19,32,38,37,42,18,9,22,21,22,18,20,17,25,26,28,27,20,25,31,38,45,31,34,34,39,34,34,40,34,39,13,13,9,13,9,13,11,24,26,30,36,36,11,11,11,11,33,17,19,9,17,21,23,28,27,25,25,29,28,13,10,13,11,22,31,26,22,28,24,24,24,20,26,27,32,30,31,39,25,25,23,25,42,45,32,43,37,46,48,21,28,25,32,22,20,24,30,28,25,18,25,23,25,24,32,32,10,10,12,9,12,11,12,10,11,10,10,11,11,11,10,16,39,42,19,10,16,17,13,20,19,14,34,33,38,23,26,29,27,23,6,12,13,9,12,18,18,19,16,19,38,25,32,35,37,33,33,39,33,58,22,25,26,11,11,10,10,16,8,23,24,28,29,28,18,18,19,24,19,25,14,17,17,18,23,27,40,32,47,41,35,36,45,46,46,24,26,26,26,26,31,11,6,4,11,16,17,17,16,36,80,34,13,20,18,19,27,19,24,24,25,26,14,14,23,25,27,27,25,19,19,25,32,28,4,21,22,26,16,23,16,34,28,34,35,30,25,17,22,23,19,24,21,22,14,23,14,12,23,18,14,14,12,14,15,16,27,17,18,38,31,32,26,26,35,24,32,33,36,40,9,13,13,18,13,18,17,16,19,11,12,14,14,24,24,26,41,35,45,43,37,10,23,19,27,18,16,20,20,19,25,31,29,29,27,25,20,23,27,29,29,28,28,23,25,26,28,25,33,33,33,42,18,10,17]}}},"index":{"byName":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,747,748,749,746,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,845,846,847,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141],"RegPV":[306,488,490,492,96,307,311,489,309,377,432,1010,1041,31,33,305,310,422,434,574,32,229,282,576,651,947,1009,30,34,35,37,212,302,303,308,358,437,439,575,762,36,211,231,232,234,284,383,491,618,619,652,975,27,29,194,230,433,812,839,841,916,950,1087,26,28,233,304,423,435,438,440,481,531,542,617,623,856,867,913,914,920,922,923,972,973,1108,0,25,335,345,347,382,425,464,532,620,622,656,716,843,849,851,852,869,918,925,927,970,1008,1011,338,346,381,384,436,526,540,579,602,850,921,924,926,971,1096,62,117,193,283,424,454,535,545,546,555,556,616,713,714,915,917,919,932,948,951,1064,1069,1097,1140,1,58,63,100,115,164,166,333,334,351,353,367,403,415,417,426,427,453,482,534,758,837,838,840,842,866,868,935,949,1019,1088,1089,1091,60,64,98,192,215,350,369,379,380,386,396,472,473,477,525,541,544,561,582,644,726,737,765,797,938,987,1029,1030,1061,1063,1067,1068,1070,1098,1099,19,99,135,136,191,256,385,456,457,459,466,480,530,538,543,580,669,1071,42,101,129,163,188,190,225,249,342,348,405,441,458,461,475,478,621,658,727,764,766,928,955,974,1012,1015,1045,1047,1072,1094,1113,54,59,65,118,165,182,210,378,409,416,533,536,581,657,659,688,712,715,736,787,795,818,854,857,934,988,989,1013,1014,1054,1074,1093,61,128,183,213,214,217,218,368,407,460,471,474,494,497,499,522,537,560,562,653,660,686,690,761,783,804,933,981,982,990,1066,1090,1092,97,141,158,216,220,227,267,370,465,479,566,655,687,738,767,786,796,811,816,906,952,953,1021,1075,1112,159,185,253,349,357,397,400,421,455,524,569,675,681,689,693,805,806,855,937,954,956,983,985,1022,1024,1036,1037,1057,1095,1139,4,22,51,53,55,57,160,184,196,208,221,247,315,316,318,337,354,364,366,398,402,406,408,413,462,493,523,554,648,649,679,680,743,769,817,823,878,901,936,1020,1114,1115,1123,1141,50,71,116,139,140,162,177,178,179,180,181,209,317,344,365,371,399,401,418,496,501,516,640,645,674,800,814,858,896,1042,1059,52,137,142,161,189,223,248,355,356,363,373,483,527,528,559,568,601,639,643,646,682,728,744,750,779,781,782,798,801,802,803,813,815,870,873,900,931,1043,1055,1060,1110,1116,21,49,145,155,156,222,224,238,300,484,563,564,565,577,596,613,614,647,654,691,729,763,768,770,784,799,908,946,976,991,1031,1046,1056,1062,1065,1109,1124,1130,3,13,56,195,219,242,263,275,312,404,414,514,615,626,638,721,757,771,790,844,875,876,877,902,910,977,984,1002,1025,1026,1058,1082,1100,1101,48,133,151,250,268,271,476,573,590,599,604,642,650,670,745,772,780,785,819,824,863,885,886,905,967,968,986,1032,1038,1053,1117,1134,2,14,20,24,138,146,149,226,270,272,324,327,330,410,450,504,515,583,592,603,627,637,717,720,722,741,755,794,859,862,887,888,898,907,909,942,958,1027,1035,1122,1131,40,41,89,147,157,228,252,264,331,411,430,502,512,513,578,591,629,692,719,730,731,734,735,739,740,742,751,753,776,777,788,820,845,872,969,1003,1004,1028,1044,1079,1080,1102,1132,23,82,241,258,269,336,339,428,431,487,510,594,605,694,703,710,723,756,822,861,1033,1034,1111,1121,1125,39,81,85,88,91,94,130,134,201,203,205,274,313,332,341,420,429,495,500,503,557,567,570,572,641,664,698,702,711,748,752,775,791,792,821,860,865,874,897,904,978,1040,1049,1133,132,169,197,198,255,260,343,505,511,587,636,666,677,699,747,864,979,1119,1120,1126,1127,5,150,167,199,202,239,276,326,391,585,588,593,597,676,683,700,718,793,846,879,903,943,1005,1006,15,67,83,84,87,90,144,168,204,206,293,395,412,419,498,518,571,624,673,706,871,880,883,945,992,1023,1073,1077,1118,86,92,124,131,265,448,451,452,547,550,595,630,631,663,667,668,678,725,773,789,881,911,912,980,994,1083,1128,1129,93,154,273,325,521,551,552,598,600,628,635,661,662,701,746,807,891,944,1039,1078,16,77,109,112,125,143,236,240,254,314,372,539,549,586,633,665,754,759,760,774,853,882,965,1052,1084,1135,1136,1137,17,102,105,122,243,520,829,830,832,833,835,1018,1048,1050,18,171,200,237,288,340,362,449,548,606,778,899,960,997,1051,1081,1104,66,69,108,127,175,251,286,299,447,553,558,684,696,697,733,825,828,847,848,998,1007,1016,1085,68,119,121,207,235,320,329,509,517,589,632,695,732,749,809,893,959,1107,72,75,246,287,291,294,323,359,485,506,529,625,808,826,940,962,963,38,76,78,95,103,107,111,113,120,123,172,176,261,278,390,584,704,836,939,964,104,685,831,11,73,126,170,266,290,296,328,392,486,608,634,708,834,993,1086,7,148,280,285,394,607,961,996,46,74,80,244,281,292,321,322,507,705,889,941,152,174,279,319,352,361,884,929,12,110,277,289,463,519,671,957,1076,890,999,301,672,709,894,8,298,1000,1001,1103,6,43,45,153,508,810,930,995,1138,173,259,297,892,895,1106,9,79,389,445,707,245,106,262,444,467,827,1105,446,10,114,468,470,187,47,70,186,295,387,443,610,388,966,609,44,360,393,442,612,469,611,724,376,257,1017,375,374],"VetPV":[306,488,490,492,96,307,311,489,309,377,432,1010,1041,31,33,305,310,422,434,574,32,229,282,576,651,947,1009,30,34,35,37,212,302,303,308,358,437,439,575,762,36,211,231,232,234,284,383,491,618,619,652,975,27,29,194,230,433,812,839,841,916,950,1087,26,28,233,304,423,435,438,440,481,531,542,617,623,856,867,913,914,920,922,923,972,973,1108,0,25,335,345,347,382,425,464,532,620,622,656,716,843,849,851,852,869,918,925,927,970,1008,1011,338,346,381,384,436,526,540,579,602,850,921,924,926,932,971,1096,62,117,193,283,424,454,535,545,546,555,556,616,713,714,915,917,919,948,951,1064,1069,1097,1140,1,58,63,100,115,164,166,333,334,351,353,367,403,415,417,426,427,453,482,534,758,837,838,840,842,866,868,935,949,1019,1088,1089,1091,60,64,98,192,215,350,369,379,380,386,396,472,473,477,525,541,544,561,582,644,726,737,765,797,938,987,1029,1030,1061,1063,1067,1068,1070,1098,1099,19,99,135,136,191,256,385,456,457,459,466,480,530,538,543,580,669,1071,42,727,54,101,129,163,188,190,225,249,342,348,405,441,458,461,475,478,621,658,764,766,928,955,974,1012,1015,1045,1047,1072,1094,1113,59,65,118,165,182,210,378,409,416,522,533,536,581,653,657,659,688,712,715,736,787,795,818,854,857,933,934,988,989,1013,1014,1054,1074,1093,61,128,183,213,214,217,218,368,407,460,471,474,494,497,499,537,560,562,660,686,690,761,783,804,981,982,990,1066,1090,1092,97,141,158,216,220,227,267,370,465,479,566,655,687,738,767,786,796,811,816,906,952,953,1021,1075,1112,159,185,253,349,357,397,400,421,455,524,569,675,681,689,693,805,806,855,937,954,956,983,985,1022,1024,1036,1037,1057,1095,1139,4,22,51,53,55,57,337,462,1141,50,160,184,196,208,221,247,315,316,318,354,364,366,398,402,406,408,413,493,523,554,648,649,679,680,743,769,817,823,878,901,936,1020,1114,1115,1123,52,71,116,139,140,162,177,178,179,180,181,209,317,344,365,371,373,399,401,418,483,496,501,516,640,645,674,800,814,858,896,931,1042,1059,1110,1116,21,137,142,161,189,223,248,355,356,363,484,527,528,559,568,601,639,643,646,647,654,682,691,728,744,750,768,779,781,782,798,801,802,803,813,815,870,873,900,1043,1055,1060,49,145,155,156,222,224,238,300,563,564,565,577,596,613,614,729,763,770,784,799,908,946,976,991,1031,1046,1056,1062,1065,1109,1124,1130,3,13,56,195,219,242,263,275,312,404,414,514,615,626,638,721,757,771,790,844,875,876,877,902,910,977,984,1002,1025,1026,1058,1082,1100,1101,268,650,670,967,2,24,48,133,151,250,270,271,450,476,573,590,599,604,642,717,745,772,780,785,819,824,859,863,885,886,887,905,942,968,986,1032,1038,1053,1117,1134,14,20,40,41,138,146,149,226,272,324,327,330,410,504,515,583,592,603,627,637,692,720,722,741,755,794,862,888,898,907,909,958,1027,1035,1122,1131,23,89,147,157,228,252,264,269,331,411,430,487,502,512,513,578,591,629,710,719,730,731,734,735,739,740,742,751,753,776,777,788,820,845,872,969,1003,1004,1028,1044,1079,1080,1102,1132,82,241,258,336,339,341,428,431,500,510,557,572,594,605,694,703,711,723,756,822,861,1033,1034,1111,1121,1125,39,81,85,88,91,94,130,134,201,203,205,274,313,332,420,429,495,503,567,570,641,664,698,702,748,752,775,791,792,821,860,865,874,897,904,978,1040,1049,1133,5,132,150,167,169,197,198,255,260,343,391,505,511,587,597,636,666,677,683,699,747,864,879,943,979,1005,1006,1119,1120,1126,1127,67,168,199,202,239,276,293,326,518,585,588,593,673,676,700,706,718,793,846,880,903,945,992,1023,1073,15,83,84,87,90,144,204,206,395,412,419,448,451,452,498,550,571,595,624,667,668,871,883,980,1077,1118,1128,1129,86,92,124,131,154,265,547,551,552,598,600,630,631,663,678,725,773,789,881,911,912,944,994,1083,77,93,112,273,325,372,521,628,635,661,662,701,746,807,882,891,1039,1052,1078,16,109,125,143,236,240,254,314,539,549,586,633,665,754,759,760,774,853,965,1084,1135,1136,1137,17,102,105,122,200,237,243,288,449,520,829,830,832,833,835,899,1018,1048,1050,18,66,69,171,251,286,299,340,362,447,548,553,558,606,733,778,825,828,960,997,1007,1051,1081,1104,68,108,119,127,175,207,517,684,696,697,749,847,848,959,998,1016,1085,72,75,121,235,287,291,294,320,329,485,509,529,589,632,695,732,809,893,940,962,963,1107,76,78,113,261,278,390,704,939,246,323,359,506,625,808,826,38,95,103,107,111,120,123,172,176,584,836,964,73,104,170,266,290,296,392,486,634,685,708,831,11,126,280,285,328,394,608,834,961,993,1086,7,46,74,80,148,281,292,607,705,941,996,152,279,352,884,929,244,277,289,321,322,507,671,889,957,1076,174,319,361,12,110,463,519,672,709,890,999,298,301,894,1103,6,8,43,45,153,508,810,930,1000,1001,1138,173,297,892,995,1106,389,445,707,79,259,895,9,106,245,444,467,262,827,1105,446,10,114,468,470,187,387,443,610,47,186,295,70,388,609,44,360,393,442,612,966,469,611,724,376,257,1017,375,374],"Skill0PV":[306,488,490,492,96,307,311,489,309,377,432,1010,1041,31,33,305,310,422,434,574,32,229,282,576,651,947,1009,30,34,35,37,212,302,303,308,358,437,439,575,762,36,211,231,232,234,284,383,491,618,619,652,975,27,29,194,230,433,812,839,841,856,916,950,1087,26,28,233,304,423,435,438,440,481,531,542,617,623,867,913,914,920,922,923,927,972,973,1108,0,25,335,345,347,382,425,464,532,620,622,656,716,843,849,851,852,869,918,925,970,1008,1011,932,1140,338,346,381,384,436,526,540,579,602,850,921,924,926,971,1096,62,117,193,283,424,454,535,541,545,546,555,556,616,713,714,915,917,919,948,951,1064,1069,1097,1,19,58,63,100,115,164,166,333,334,351,353,367,403,415,417,426,427,453,482,534,758,837,838,840,842,866,868,935,949,1019,1088,1089,1091,42,60,64,98,192,215,350,369,379,380,386,396,472,473,477,525,544,561,582,644,726,727,737,765,797,938,987,1029,1030,1061,1063,1067,1068,1070,1098,1099,54,99,135,136,191,256,385,456,457,459,466,480,530,538,543,580,669,1071,101,129,163,188,190,225,249,342,348,405,441,458,461,475,478,522,621,653,658,764,766,928,933,955,974,1012,1015,1045,1047,1072,1094,1113,59,65,118,165,182,210,378,409,416,533,536,581,657,659,688,712,715,736,787,795,818,854,857,934,988,989,1013,1014,1054,1074,1093,61,128,183,213,214,217,218,368,407,460,471,474,494,497,499,537,560,562,660,686,690,693,761,783,804,981,982,990,1066,1090,1092,1139,4,22,51,53,55,57,337,462,654,1141,50,56,97,141,158,216,220,227,267,370,465,479,566,655,687,738,767,771,786,796,811,816,906,952,953,1021,1075,1112,52,159,185,253,349,357,373,397,400,421,455,483,524,569,675,681,689,805,806,855,931,937,954,956,983,985,1022,1024,1036,1037,1057,1095,1110,1116,21,160,184,196,208,221,247,315,316,318,354,364,366,398,402,406,408,413,484,493,523,554,647,648,649,679,680,691,743,768,769,817,823,878,901,936,1020,1114,1115,1123,71,116,139,140,162,177,178,179,180,181,209,317,344,365,371,399,401,418,496,501,516,640,645,674,800,814,858,896,1042,1059,137,142,161,189,223,248,268,355,356,363,527,528,559,568,601,639,643,646,650,670,682,728,744,750,779,781,782,798,801,802,803,813,815,870,873,900,967,1043,1055,1060,2,24,49,145,155,156,222,224,238,270,300,450,563,564,565,577,596,613,614,717,729,763,770,784,799,859,887,908,942,946,976,991,1031,1046,1056,1062,1065,1109,1124,1130,3,13,40,41,195,219,242,263,275,312,404,414,514,615,626,638,692,721,757,790,844,875,876,877,902,910,977,984,1002,1025,1026,1058,1082,1100,1101,23,48,133,151,250,269,271,476,487,573,590,599,604,642,710,745,772,780,785,819,824,863,885,886,905,968,986,1032,1038,1053,1117,1134,341,500,557,572,711,14,20,138,146,149,226,272,324,327,330,410,504,515,583,592,603,627,637,720,722,741,755,794,862,888,898,907,909,958,1027,1035,1122,1131,5,89,147,150,157,167,228,252,264,331,391,411,430,502,512,513,578,591,597,629,683,719,730,731,734,735,739,740,742,751,753,776,777,788,820,845,872,879,943,969,1003,1004,1005,1006,1028,1044,1079,1080,1102,1132,67,82,168,241,258,293,336,339,428,431,510,518,594,605,673,694,703,706,723,756,822,861,880,945,992,1023,1033,1034,1073,1111,1121,1125,39,81,85,88,91,94,130,134,201,203,205,274,313,332,420,429,448,451,452,495,503,550,567,570,595,641,664,667,668,698,702,748,752,775,791,792,821,860,865,874,897,904,978,980,1040,1049,1128,1129,1133,132,154,169,197,198,255,260,343,505,511,551,552,587,598,600,636,666,677,699,747,864,944,979,1119,1120,1126,1127,77,112,199,202,239,276,326,372,585,588,593,676,700,718,793,846,882,903,1052,15,83,84,87,90,144,204,206,395,412,419,498,571,624,871,883,1077,1118,86,92,124,131,200,237,265,288,449,547,630,631,663,678,725,773,789,881,899,911,912,994,1083,66,69,251,286,299,447,553,558,733,825,828,1007,68,93,119,207,273,280,325,517,521,628,635,661,662,701,746,749,807,891,959,1039,1078,16,72,75,109,125,143,236,240,254,287,291,292,294,314,485,529,539,549,586,633,665,754,759,760,774,853,940,962,963,965,1084,1135,1136,1137,17,76,78,102,105,113,122,243,261,278,390,520,704,829,830,832,833,835,939,1018,1048,1050,18,171,340,362,548,606,778,960,997,1051,1081,1104,73,108,127,170,175,266,290,296,392,486,634,684,696,697,708,847,848,998,1016,1085,121,235,285,320,329,394,509,589,632,695,732,809,893,961,1107,46,74,80,246,281,323,359,506,625,705,808,826,941,38,43,45,95,103,107,111,120,123,152,172,176,279,352,584,836,884,929,964,79,277,289,671,957,1076,104,685,831,11,126,328,608,672,709,834,993,1086,7,148,298,607,996,1103,6,153,244,321,322,507,810,889,930,1138,173,174,297,319,361,892,1106,12,110,114,389,445,463,470,519,707,187,890,999,47,106,186,295,301,444,467,894,827,1105,8,446,1000,1001,10,44,393,508,995,259,468,895,9,469,245,387,443,610,262,388,609,360,442,612,70,966,611,724,376,257,1017,375,374],"Skill1PV":[306,488,490,492,96,307,311,489,309,377,432,1010,1041,31,33,305,310,422,434,574,32,229,282,576,651,947,1009,30,34,35,37,212,302,303,308,358,437,439,575,762,36,211,231,232,234,284,383,491,618,619,652,975,27,29,194,230,433,812,839,841,856,916,950,1087,26,28,233,304,423,435,438,440,481,531,542,617,623,867,913,914,920,922,923,927,972,973,1108,0,25,335,345,347,382,425,464,532,620,622,656,716,843,849,851,852,869,918,925,970,1008,1011,932,1140,338,346,381,384,436,526,540,579,602,850,921,924,926,971,1096,62,117,193,283,424,454,535,541,545,546,555,556,616,713,714,915,917,919,948,951,1064,1069,1097,1,19,58,63,100,115,164,166,333,334,351,353,367,403,415,417,426,427,453,482,534,758,837,838,840,842,866,868,935,949,1019,1088,1089,1091,42,60,64,98,192,215,350,369,379,380,386,396,472,473,477,525,544,561,582,644,726,727,737,765,797,938,987,1029,1030,1061,1063,1067,1068,1070,1098,1099,54,99,135,136,191,256,385,456,457,459,466,480,530,538,543,580,669,1071,101,129,163,188,190,225,249,342,348,405,441,458,461,475,478,522,621,653,658,764,766,928,933,955,974,1012,1015,1045,1047,1072,1094,1113,59,65,118,165,182,210,378,409,416,533,536,581,657,659,688,712,715,736,787,795,818,854,857,934,988,989,1013,1014,1054,1074,1093,61,128,183,213,214,217,218,368,407,460,471,474,494,497,499,537,560,562,660,686,690,693,761,783,804,981,982,990,1066,1090,1092,1139,4,22,51,53,55,57,337,462,654,1141,50,56,97,141,158,216,220,227,267,370,465,479,566,655,687,738,767,771,786,796,811,816,906,952,953,1021,1075,1112,52,159,185,253,349,357,373,397,400,421,455,483,524,569,675,681,689,805,806,855,931,937,954,956,983,985,1022,1024,1036,1037,1057,1095,1110,1116,21,160,184,196,208,221,247,315,316,318,354,364,366,398,402,406,408,413,484,493,523,554,647,648,649,679,680,691,743,768,769,817,823,878,901,936,1020,1114,1115,1123,71,116,139,140,162,177,178,179,180,181,209,317,344,365,371,399,401,418,496,501,516,640,645,674,800,814,858,896,1042,1059,137,142,161,189,223,248,268,355,356,363,527,528,559,568,601,639,643,646,650,670,682,728,744,750,779,781,782,798,801,802,803,813,815,870,873,900,967,1043,1055,1060,2,24,49,145,155,156,222,224,238,270,300,450,563,564,565,577,596,613,614,717,729,763,770,784,799,859,887,908,942,946,976,991,1031,1046,1056,1062,1065,1109,1124,1130,3,13,40,41,195,219,242,263,275,312,404,414,514,615,626,638,692,721,757,790,844,875,876,877,902,910,977,984,1002,1025,1026,1058,1082,1100,1101,23,48,133,151,250,269,271,476,487,573,590,599,604,642,710,745,772,780,785,819,824,863,885,886,905,968,986,1032,1038,1053,1117,1134,341,500,557,572,711,14,20,138,146,149,226,272,324,327,330,410,504,515,583,592,603,627,637,720,722,741,755,794,862,888,898,907,909,958,1027,1035,1122,1131,5,89,147,150,157,167,228,252,264,331,391,411,430,502,512,513,578,591,597,629,683,719,730,731,734,735,739,740,742,751,753,776,777,788,820,845,872,879,943,969,1003,1004,1005,1006,1028,1044,1079,1080,1102,1132,67,82,168,241,258,293,336,339,428,431,510,518,594,605,673,694,703,706,723,756,822,861,880,945,992,1023,1033,1034,1073,1111,1121,1125,39,81,85,88,91,94,130,134,201,203,205,274,313,332,420,429,448,451,452,495,503,550,567,570,595,641,664,667,668,698,702,748,752,775,791,792,821,860,865,874,897,904,978,980,1040,1049,1128,1129,1133,132,154,169,197,198,255,260,343,505,511,551,552,587,598,600,636,666,677,699,747,864,944,979,1119,1120,1126,1127,77,112,199,202,239,276,326,372,585,588,593,676,700,718,793,846,882,903,1052,15,83,84,87,90,144,204,206,395,412,419,498,571,624,871,883,1077,1118,86,92,124,131,200,237,265,288,449,547,630,631,663,678,725,773,789,881,899,911,912,994,1083,66,69,251,286,299,447,553,558,733,825,828,1007,68,93,119,207,273,280,325,517,521,628,635,661,662,701,746,749,807,891,959,1039,1078,16,72,75,109,125,143,236,240,254,287,291,292,294,314,485,529,539,549,586,633,665,754,759,760,774,853,940,962,963,965,1084,1135,1136,1137,17,76,78,102,105,113,122,243,261,278,390,520,704,829,830,832,833,835,939,1018,1048,1050,18,171,340,362,548,606,778,960,997,1051,1081,1104,73,108,127,170,175,266,290,296,392,486,634,684,696,697,708,847,848,998,1016,1085,121,235,285,320,329,394,509,589,632,695,732,809,893,961,1107,46,74,80,246,281,323,359,506,625,705,808,826,941,38,43,45,95,103,107,111,120,123,152,172,176,279,352,584,836,884,929,964,79,277,289,671,957,1076,104,685,831,11,126,328,608,672,709,834,993,1086,7,148,298,607,996,1103,6,153,244,321,322,507,810,889,930,1138,173,174,297,319,361,892,1106,12,110,114,389,445,463,470,519,707,187,890,999,47,106,186,295,301,444,467,894,827,1105,8,446,1000,1001,10,44,393,508,995,259,468,895,9,469,245,387,443,610,262,388,609,360,442,612,70,966,611,724,376,257,1017,375,374],"Skill2PV":[306,488,490,492,96,307,311,489,309,377,432,1010,1041,31,33,305,310,422,434,574,32,229,282,576,651,947,1009,30,34,35,37,212,302,303,308,358,437,439,575,762,36,211,231,232,234,284,383,491,618,619,652,975,27,29,194,230,433,812,839,841,856,916,950,1087,26,28,233,304,423,435,438,440,481,531,542,617,623,867,913,914,920,922,923,927,972,973,1108,0,25,335,345,347,382,425,464,532,620,622,656,716,843,849,851,852,869,918,925,970,1008,1011,932,1140,338,346,381,384,436,526,540,579,602,850,921,924,926,971,1096,62,117,193,283,424,454,535,541,545,546,555,556,616,713,714,915,917,919,948,951,1064,1069,1097,1,19,58,63,100,115,164,166,333,334,351,353,367,403,415,417,426,427,453,482,534,758,837,838,840,842,866,868,935,949,1019,1088,1089,1091,42,60,64,98,192,215,350,369,379,380,386,396,472,473,477,525,544,561,582,644,726,727,737,765,797,938,987,1029,1030,1061,1063,1067,1068,1070,1098,1099,54,99,135,136,191,256,385,456,457,459,466,480,530,538,543,580,669,1071,101,129,163,188,190,225,249,342,348,405,441,458,461,475,478,522,621,653,658,764,766,928,933,955,974,1012,1015,1045,1047,1072,1094,1113,59,65,118,165,182,210,378,409,416,533,536,581,657,659,688,712,715,736,787,795,818,854,857,934,988,989,1013,1014,1054,1074,1093,61,128,183,213,214,217,218,368,407,460,471,474,494,497,499,537,560,562,660,686,690,693,761,783,804,981,982,990,1066,1090,1092,1139,4,22,51,53,55,57,337,462,654,1141,50,56,97,141,158,216,220,227,267,370,465,479,566,655,687,738,767,771,786,796,811,816,906,952,953,1021,1075,1112,52,159,185,253,349,357,373,397,400,421,455,483,524,569,675,681,689,805,806,855,931,937,954,956,983,985,1022,1024,1036,1037,1057,1095,1110,1116,21,160,184,196,208,221,247,315,316,318,354,364,366,398,402,406,408,413,484,493,523,554,647,648,649,679,680,691,743,768,769,817,823,878,901,936,1020,1114,1115,1123,71,116,139,140,162,177,178,179,180,181,209,317,344,365,371,399,401,418,496,501,516,640,645,674,800,814,858,896,1042,1059,137,142,161,189,223,248,268,355,356,363,527,528,559,568,601,639,643,646,650,670,682,728,744,750,779,781,782,798,801,802,803,813,815,870,873,900,967,1043,1055,1060,2,24,49,145,155,156,222,224,238,270,300,450,563,564,565,577,596,613,614,717,729,763,770,784,799,859,887,908,942,946,976,991,1031,1046,1056,1062,1065,1109,1124,1130,3,13,40,41,195,219,242,263,275,312,404,414,514,615,626,638,692,721,757,790,844,875,876,877,902,910,977,984,1002,1025,1026,1058,1082,1100,1101,23,48,133,151,250,269,271,476,487,573,590,599,604,642,710,745,772,780,785,819,824,863,885,886,905,968,986,1032,1038,1053,1117,1134,341,500,557,572,711,14,20,138,146,149,226,272,324,327,330,410,504,515,583,592,603,627,637,720,722,741,755,794,862,888,898,907,909,958,1027,1035,1122,1131,5,89,147,150,157,167,228,252,264,331,391,411,430,502,512,513,578,591,597,629,683,719,730,731,734,735,739,740,742,751,753,776,777,788,820,845,872,879,943,969,1003,1004,1005,1006,1028,1044,1079,1080,1102,1132,67,82,168,241,258,293,336,339,428,431,510,518,594,605,673,694,703,706,723,756,822,861,880,945,992,1023,1033,1034,1073,1111,1121,1125,39,81,85,88,91,94,130,134,201,203,205,274,313,332,420,429,448,451,452,495,503,550,567,570,595,641,664,667,668,698,702,748,752,775,791,792,821,860,865,874,897,904,978,980,1040,1049,1128,1129,1133,132,154,169,197,198,255,260,343,505,511,551,552,587,598,600,636,666,677,699,747,864,944,979,1119,1120,1126,1127,77,112,199,202,239,276,326,372,585,588,593,676,700,718,793,846,882,903,1052,15,83,84,87,90,144,204,206,395,412,419,498,571,624,871,883,1077,1118,86,92,124,131,200,237,265,288,449,547,630,631,663,678,725,773,789,881,899,911,912,994,1083,66,69,251,286,299,447,553,558,733,825,828,1007,68,93,119,207,273,280,325,517,521,628,635,661,662,701,746,749,807,891,959,1039,1078,16,72,75,109,125,143,236,240,254,287,291,292,294,314,485,529,539,549,586,633,665,754,759,760,774,853,940,962,963,965,1084,1135,1136,1137,17,76,78,102,105,113,122,243,261,278,390,520,704,829,830,832,833,835,939,1018,1048,1050,18,171,340,362,548,606,778,960,997,1051,1081,1104,73,108,127,170,175,266,290,296,392,486,634,684,696,697,708,847,848,998,1016,1085,121,235,285,320,329,394,509,589,632,695,732,809,893,961,1107,46,74,80,246,281,323,359,506,625,705,808,826,941,38,43,45,95,103,107,111,120,123,152,172,176,279,352,584,836,884,929,964,79,277,289,671,957,1076,104,685,831,11,126,328,608,672,709,834,993,1086,7,148,298,607,996,1103,6,153,244,321,322,507,810,889,930,1138,173,174,297,319,361,892,1106,12,110,114,389,445,463,470,519,707,187,890,999,47,106,186,295,301,444,467,894,827,1105,8,446,1000,1001,10,44,393,508,995,259,468,895,9,469,245,387,443,610,262,388,609,360,442,612,70,966,611,724,376,257,1017,375,374],"Skill3PV":[306,488,490,492,96,307,311,489,309,377,432,1010,1041,31,33,305,310,422,434,574,32,229,282,576,651,947,1009,30,34,35,37,212,302,303,308,358,437,439,575,762,36,211,231,232,234,284,383,491,618,619,652,975,27,29,194,230,433,812,839,841,856,916,950,1087,26,28,233,304,423,435,438,440,481,531,542,617,623,867,913,914,920,922,923,927,972,973,1108,0,25,335,345,347,382,425,464,532,620,622,656,716,843,849,851,852,869,918,925,970,1008,1011,932,1140,338,346,381,384,436,526,540,579,602,850,921,924,926,971,1096,62,117,193,283,424,454,535,541,545,546,555,556,616,713,714,915,917,919,948,951,1064,1069,1097,1,19,58,63,100,115,164,166,333,334,351,353,367,403,415,417,426,427,453,482,534,758,837,838,840,842,866,868,935,949,1019,1088,1089,1091,42,60,64,98,192,215,350,369,379,380,386,396,472,473,477,525,544,561,582,644,726,727,737,765,797,938,987,1029,1030,1061,1063,1067,1068,1070,1098,1099,54,99,135,136,191,256,385,456,457,459,466,480,530,538,543,580,669,1071,101,129,163,188,190,225,249,342,348,405,441,458,461,475,478,522,621,653,658,764,766,928,933,955,974,1012,1015,1045,1047,1072,1094,1113,59,65,118,165,182,210,378,409,416,533,536,581,657,659,688,712,715,736,787,795,818,854,857,934,988,989,1013,1014,1054,1074,1093,61,128,183,213,214,217,218,368,407,460,471,474,494,497,499,537,560,562,660,686,690,693,761,783,804,981,982,990,1066,1090,1092,1139,654,4,22,51,53,55,57,337,462,1141,50,56,97,141,158,216,220,227,267,370,465,479,566,655,687,738,767,771,786,796,811,816,906,952,953,1021,1075,1112,52,159,185,253,349,357,373,397,400,421,455,483,524,569,675,681,689,805,806,855,931,937,954,956,983,985,1022,1024,1036,1037,1057,1095,1110,1116,21,160,184,196,208,221,247,315,316,318,354,364,366,398,402,406,408,413,484,493,523,554,647,648,649,679,680,691,743,768,769,817,823,878,901,936,1020,1114,1115,1123,71,116,139,140,162,177,178,179,180,181,209,317,344,365,371,399,401,418,496,501,516,640,645,674,800,814,858,896,1042,1059,137,142,161,189,223,248,268,355,356,363,527,528,559,568,601,639,643,646,650,670,682,728,744,750,779,781,782,798,801,802,803,813,815,870,873,900,967,1043,1055,1060,2,24,49,145,155,156,222,224,238,270,300,450,563,564,565,577,596,613,614,717,729,763,770,784,799,859,887,908,942,946,976,991,1031,1046,1056,1062,1065,1109,1124,1130,3,13,40,41,195,219,242,263,275,312,404,414,514,615,626,638,692,721,757,790,844,875,876,877,902,910,977,984,1002,1025,1026,1058,1082,1100,1101,23,48,133,151,250,269,271,476,487,573,590,599,604,642,710,745,772,780,785,819,824,863,885,886,905,968,986,1032,1038,1053,1117,1134,341,500,557,572,711,14,20,138,146,149,226,272,324,327,330,410,504,515,583,592,603,627,637,720,722,741,755,794,862,888,898,907,909,958,1027,1035,1122,1131,5,89,147,150,157,167,228,252,264,331,391,411,430,502,512,513,578,591,597,629,683,719,730,731,734,735,739,740,742,751,753,776,777,788,820,845,872,879,943,969,1003,1004,1005,1006,1028,1044,1079,1080,1102,1132,67,82,168,241,258,293,336,339,428,431,510,518,594,605,673,694,703,706,723,756,822,861,880,945,992,1023,1033,1034,1073,1111,1121,1125,39,81,85,88,91,94,130,134,201,203,205,274,313,332,420,429,448,451,452,495,503,550,567,570,595,641,664,667,668,698,702,748,752,775,791,792,821,860,865,874,897,904,978,980,1040,1049,1128,1129,1133,132,154,169,197,198,255,260,343,505,511,551,552,587,598,600,636,666,677,699,747,864,944,979,1119,1120,1126,1127,77,112,199,202,239,276,326,372,585,588,593,676,700,718,793,846,882,903,1052,15,83,84,87,90,144,204,206,395,412,419,498,571,624,871,883,1077,1118,86,92,124,131,200,237,265,288,449,547,630,631,663,678,725,773,789,881,899,911,912,994,1083,66,69,251,280,286,299,447,553,558,733,825,828,1007,68,93,119,207,273,292,325,517,521,628,635,661,662,701,746,749,807,891,959,1039,1078,16,72,75,109,125,143,236,240,254,287,291,294,314,485,529,539,549,586,633,665,754,759,760,774,853,940,962,963,965,1084,1135,1136,1137,17,76,78,102,105,113,122,243,261,278,390,520,704,829,830,832,833,835,939,1018,1048,1050,18,171,340,362,548,606,778,960,997,1051,1081,1104,73,108,127,170,175,266,290,296,392,486,634,684,696,697,708,847,848,998,1016,1085,121,235,285,320,329,394,509,589,632,695,732,809,893,961,1107,43,45,46,74,80,246,281,323,359,506,625,705,808,826,941,38,95,103,107,111,120,123,152,172,176,279,352,584,836,884,929,964,79,277,289,671,957,1076,104,685,831,11,126,328,608,672,709,834,993,1086,7,148,298,607,996,1103,6,114,153,244,321,322,470,507,810,889,930,1138,173,174,187,297,319,361,892,1106,12,110,389,445,463,519,707,47,186,295,890,999,106,301,444,467,894,44,393,827,1105,8,446,1000,1001,10,469,508,995,259,468,895,9,245,387,443,610,262,388,609,360,442,612,70,966,611,724,376,257,1017,375,374],"Skill4PV":[306,488,490,492,96,307,311,489,309,377,432,1010,1041,31,33,305,310,422,434,574,32,229,282,576,651,947,1009,30,34,35,37,212,302,303,308,358,437,439,575,762,36,211,231,232,234,284,383,491,618,619,652,975,27,29,194,230,433,812,839,841,916,950,1087,26,28,233,304,423,435,438,440,481,531,542,617,623,856,867,913,914,920,922,923,972,973,1108,0,25,335,345,347,382,425,464,532,620,622,656,716,843,849,851,852,869,918,925,927,970,1008,1011,932,338,346,381,384,436,526,540,579,602,850,921,924,926,971,1096,1140,62,117,193,283,424,454,535,545,546,555,556,616,713,714,915,917,919,948,951,1064,1069,1097,1,58,63,100,115,164,166,333,334,351,353,367,403,415,417,426,427,453,482,534,541,758,837,838,840,842,866,868,935,949,1019,1088,1089,1091,19,60,64,98,192,215,350,369,379,380,386,396,472,473,477,525,544,561,582,644,726,737,765,797,938,987,1029,1030,1061,1063,1067,1068,1070,1098,1099,42,99,135,136,191,256,385,456,457,459,466,480,530,538,543,580,669,727,1071,54,101,129,163,188,190,225,249,342,348,405,441,458,461,475,478,621,658,764,766,928,955,974,1012,1015,1045,1047,1072,1094,1113,59,65,118,165,182,210,378,409,416,522,533,536,581,653,657,659,688,712,715,736,787,795,818,854,857,933,934,988,989,1013,1014,1054,1074,1093,61,128,183,213,214,217,218,368,407,460,471,474,494,497,499,537,560,562,660,686,690,761,783,804,981,982,990,1066,1090,1092,654,693,1139,4,22,51,53,55,56,57,97,141,158,216,220,227,267,337,370,462,465,479,566,655,687,738,767,771,786,796,811,816,906,952,953,1021,1075,1112,1141,50,159,185,253,349,357,397,400,421,455,524,569,675,681,689,805,806,855,937,954,956,983,985,1022,1024,1036,1037,1057,1095,52,160,184,196,208,221,247,315,316,318,354,364,366,373,398,402,406,408,413,483,493,523,554,648,649,679,680,743,769,817,823,878,901,931,936,1020,1110,1114,1115,1116,1123,21,71,116,139,140,162,177,178,179,180,181,209,317,344,365,371,399,401,418,484,496,501,516,640,645,647,674,691,768,800,814,858,896,1042,1059,137,142,161,189,223,248,355,356,363,527,528,559,568,601,639,643,646,682,728,744,750,779,781,782,798,801,802,803,813,815,870,873,900,1043,1055,1060,49,145,155,156,222,224,238,300,563,564,565,577,596,613,614,729,763,770,784,799,908,946,976,991,1031,1046,1056,1062,1065,1109,1124,1130,3,13,195,219,242,263,268,275,312,404,414,514,615,626,638,650,670,721,757,790,844,875,876,877,902,910,967,977,984,1002,1025,1026,1058,1082,1100,1101,2,24,48,133,151,250,270,271,450,476,573,590,599,604,642,717,745,772,780,785,819,824,859,863,885,886,887,905,942,968,986,1032,1038,1053,1117,1134,40,41,692,23,269,487,710,14,20,138,146,149,226,272,324,327,330,341,410,500,504,515,557,572,583,592,603,627,637,711,720,722,741,755,794,862,888,898,907,909,958,1027,1035,1122,1131,89,147,157,228,252,264,331,411,430,502,512,513,578,591,629,719,730,731,734,735,739,740,742,751,753,776,777,788,820,845,872,969,1003,1004,1028,1044,1079,1080,1102,1132,82,241,258,336,339,428,431,510,594,605,694,703,723,756,822,861,1033,1034,1111,1121,1125,5,39,81,85,88,91,94,130,134,150,167,201,203,205,274,313,332,391,420,429,495,503,567,570,597,641,664,683,698,702,748,752,775,791,792,821,860,865,874,879,897,904,943,978,1005,1006,1040,1049,1133,67,132,168,169,197,198,255,260,293,343,505,511,518,587,636,666,673,677,699,706,747,864,880,945,979,992,1023,1073,1119,1120,1126,1127,199,202,239,276,326,448,451,452,550,585,588,593,595,667,668,676,700,718,793,846,903,980,1128,1129,15,83,84,87,90,144,154,204,206,395,412,419,498,551,552,571,598,600,624,871,883,944,1077,1118,77,86,92,112,124,131,265,372,547,630,631,663,678,725,773,789,881,882,911,912,994,1052,1083,93,200,237,273,280,288,325,449,521,628,635,661,662,701,746,807,891,899,1039,1078,16,66,69,109,125,143,236,240,251,254,286,292,299,314,447,539,549,553,558,586,633,665,733,754,759,760,774,825,828,853,965,1007,1084,1135,1136,1137,17,68,102,105,119,122,207,243,517,520,749,829,830,832,833,835,959,1018,1048,1050,18,72,75,171,287,291,294,340,362,485,529,548,606,778,940,960,962,963,997,1051,1081,1104,76,78,108,113,127,175,261,278,390,684,696,697,704,847,848,939,998,1016,1085,121,235,320,329,509,589,632,695,732,809,893,1107,246,323,359,506,625,808,826,38,43,45,73,95,103,107,111,120,123,170,172,176,266,290,296,392,486,584,634,708,836,964,285,394,961,46,74,79,80,281,705,941,104,152,279,352,685,831,884,929,11,126,277,289,328,608,671,834,957,993,1076,1086,7,148,607,996,244,321,322,507,889,174,319,361,672,709,12,110,114,298,463,470,519,1103,6,153,187,810,890,930,999,1138,47,173,186,295,297,301,892,894,1106,389,445,707,8,1000,1001,44,106,393,444,467,508,995,259,827,895,1105,9,446,469,10,245,262,468,387,443,610,388,609,360,442,612,70,966,611,724,376,257,1017,375,374],"Skill5PV":[306,488,490,492,96,307,311,489,309,377,432,1010,1041,31,33,305,310,422,434,574,32,229,282,576,651,947,1009,30,34,35,37,212,302,303,308,358,437,439,575,762,36,211,231,232,234,284,383,491,618,619,652,856,975,27,29,194,230,433,812,839,841,916,927,950,1087,26,28,233,304,423,435,438,440,481,531,542,617,623,867,913,914,920,922,923,972,973,1108,0,25,335,345,347,382,425,464,532,620,622,656,716,843,849,851,852,869,918,925,932,970,1008,1011,1140,338,346,381,384,436,526,540,541,579,602,850,921,924,926,971,1096,19,62,117,193,283,424,454,535,545,546,555,556,616,713,714,915,917,919,948,951,1064,1069,1097,1,42,58,63,100,115,164,166,333,334,351,353,367,403,415,417,426,427,453,482,534,727,758,837,838,840,842,866,868,935,949,1019,1088,1089,1091,54,60,64,98,192,215,350,369,379,380,386,396,472,473,477,525,544,561,582,644,726,737,765,797,938,987,1029,1030,1061,1063,1067,1068,1070,1098,1099,99,135,136,191,256,385,456,457,459,466,480,522,530,538,543,580,653,669,933,1071,101,129,163,188,190,225,249,342,348,405,441,458,461,475,478,621,658,693,764,766,928,955,974,1012,1015,1045,1047,1072,1094,1113,1139,4,22,51,53,55,57,59,65,118,165,182,210,337,378,409,416,462,533,536,581,654,657,659,688,712,715,736,787,795,818,854,857,934,988,989,1013,1014,1054,1074,1093,1141,50,56,61,128,183,213,214,217,218,368,407,460,471,474,494,497,499,537,560,562,660,686,690,761,771,783,804,981,982,990,1066,1090,1092,52,97,141,158,216,220,227,267,370,373,465,479,483,566,655,687,738,767,786,796,811,816,906,931,952,953,1021,1075,1110,1112,1116,21,159,185,253,349,357,397,400,421,455,484,524,569,647,675,681,689,691,768,805,806,855,937,954,956,983,985,1022,1024,1036,1037,1057,1095,160,184,196,208,221,247,268,315,316,318,354,364,366,398,402,406,408,413,493,523,554,648,649,650,670,679,680,743,769,817,823,878,901,936,967,1020,1114,1115,1123,2,24,71,116,139,140,162,177,178,179,180,181,209,270,317,344,365,371,399,401,418,450,496,501,516,640,645,674,717,800,814,858,859,887,896,942,1042,1059,40,41,137,142,161,189,223,248,355,356,363,527,528,559,568,601,639,643,646,682,692,728,744,750,779,781,782,798,801,802,803,813,815,870,873,900,1043,1055,1060,23,49,145,155,156,222,224,238,269,300,487,563,564,565,577,596,613,614,710,729,763,770,784,799,908,946,976,991,1031,1046,1056,1062,1065,1109,1124,1130,3,13,195,219,242,263,275,312,341,404,414,500,514,557,572,615,626,638,711,721,757,790,844,875,876,877,902,910,977,984,1002,1025,1026,1058,1082,1100,1101,5,48,133,150,151,167,250,271,391,476,573,590,597,599,604,642,683,745,772,780,785,819,824,863,879,885,886,905,943,968,986,1005,1006,1032,1038,1053,1117,1134,14,20,67,138,146,149,168,226,272,293,324,327,330,410,504,515,518,583,592,603,627,637,673,706,720,722,741,755,794,862,880,888,898,907,909,945,958,992,1023,1027,1035,1073,1122,1131,89,147,157,228,252,264,331,411,430,448,451,452,502,512,513,550,578,591,595,629,667,668,719,730,731,734,735,739,740,742,751,753,776,777,788,820,845,872,969,980,1003,1004,1028,1044,1079,1080,1102,1128,1129,1132,82,154,241,258,336,339,428,431,510,551,552,594,598,600,605,694,703,723,756,822,861,944,1033,1034,1111,1121,1125,39,77,81,85,88,91,94,112,130,134,201,203,205,274,313,332,372,420,429,495,503,567,570,641,664,698,702,748,752,775,791,792,821,860,865,874,882,897,904,978,1040,1049,1052,1133,132,169,197,198,200,237,255,260,288,343,449,505,511,587,636,666,677,699,747,864,899,979,1119,1120,1126,1127,66,69,199,202,239,251,276,286,299,326,447,553,558,585,588,593,676,700,718,733,793,825,828,846,903,1007,15,68,83,84,87,90,119,144,204,206,207,280,395,412,419,498,517,571,624,749,871,883,959,1077,1118,72,75,86,92,124,131,265,287,291,292,294,485,529,547,630,631,663,678,725,773,789,881,911,912,940,962,963,994,1083,76,78,93,113,261,273,278,325,390,521,628,635,661,662,701,704,746,807,891,939,1039,1078,16,73,109,125,143,170,236,240,254,266,290,296,314,392,486,539,549,586,633,634,665,708,754,759,760,774,853,965,1084,1135,1136,1137,17,102,105,122,243,285,394,520,829,830,832,833,835,961,1018,1048,1050,18,46,74,80,171,281,340,362,548,606,705,778,941,960,997,1051,1081,1104,43,45,108,127,152,175,279,352,684,696,697,847,848,884,929,998,1016,1085,79,121,235,277,289,320,329,509,589,632,671,695,732,809,893,957,1076,1107,246,323,359,506,625,672,709,808,826,38,95,103,107,111,120,123,172,176,298,584,836,964,1103,6,104,153,685,810,831,930,1138,11,126,173,297,328,608,834,892,993,1086,1106,7,114,148,389,445,470,607,707,996,187,47,106,186,244,295,321,322,444,467,507,889,174,319,361,827,1105,12,110,446,463,519,10,44,393,890,999,301,468,894,8,469,508,1000,1001,387,443,610,995,259,388,895,9,609,245,360,442,612,262,70,966,611,724,376,257,1017,375,374],"Skill6PV":[306,488,490,492,96,307,311,489,309,377,432,1010,1041,31,33,305,310,422,434,574,32,229,282,576,651,947,1009,30,34,35,37,212,302,303,308,358,437,439,575,762,36,211,231,232,234,284,383,491,618,619,652,975,27,29,194,230,433,812,839,841,856,916,950,1087,26,28,233,304,423,435,438,440,481,531,542,617,623,867,913,914,920,922,923,927,972,973,1108,0,25,335,345,347,382,425,464,532,620,622,656,716,843,849,851,852,869,918,925,932,970,1008,1011,1140,338,346,381,384,436,526,540,579,602,850,921,924,926,971,1096,62,117,193,283,424,454,535,541,545,546,555,556,616,713,714,915,917,919,948,951,1064,1069,1097,1,19,58,63,100,115,164,166,333,334,351,353,367,403,415,417,426,427,453,482,534,758,837,838,840,842,866,868,935,949,1019,1088,1089,1091,42,60,64,98,192,215,350,369,379,380,386,396,472,473,477,525,544,561,582,644,726,727,737,765,797,938,987,1029,1030,1061,1063,1067,1068,1070,1098,1099,54,99,135,136,191,256,385,456,457,459,466,480,530,538,543,580,669,1071,101,129,163,188,190,225,249,342,348,405,441,458,461,475,478,522,621,653,658,764,766,928,933,955,974,1012,1015,1045,1047,1072,1094,1113,59,65,118,165,182,210,378,409,416,533,536,581,657,659,688,712,715,736,787,795,818,854,857,934,988,989,1013,1014,1054,1074,1093,4,22,51,53,55,57,61,128,183,213,214,217,218,337,368,407,460,462,471,474,494,497,499,537,560,562,654,660,686,690,693,761,783,804,981,982,990,1066,1090,1092,1139,1141,50,56,97,141,158,216,220,227,267,370,465,479,566,655,687,738,767,771,786,796,811,816,906,952,953,1021,1075,1112,52,159,185,253,349,357,373,397,400,421,455,483,524,569,675,681,689,805,806,855,931,937,954,956,983,985,1022,1024,1036,1037,1057,1095,1110,1116,21,160,184,196,208,221,247,315,316,318,354,364,366,398,402,406,408,413,484,493,523,554,647,648,649,679,680,691,743,768,769,817,823,878,901,936,1020,1114,1115,1123,71,116,139,140,162,177,178,179,180,181,209,317,344,365,371,399,401,418,496,501,516,640,645,674,800,814,858,896,1042,1059,137,142,161,189,223,248,268,355,356,363,527,528,559,568,601,639,643,646,650,670,682,728,744,750,779,781,782,798,801,802,803,813,815,870,873,900,967,1043,1055,1060,2,24,49,145,155,156,222,224,238,270,300,450,563,564,565,577,596,613,614,717,729,763,770,784,799,859,887,908,942,946,976,991,1031,1046,1056,1062,1065,1109,1124,1130,3,13,40,41,195,219,242,263,275,312,404,414,514,615,626,638,692,721,757,790,844,875,876,877,902,910,977,984,1002,1025,1026,1058,1082,1100,1101,23,48,133,151,250,269,271,341,476,487,500,557,572,573,590,599,604,642,710,711,745,772,780,785,819,824,863,885,886,905,968,986,1032,1038,1053,1117,1134,14,20,138,146,149,226,272,324,327,330,410,504,515,583,592,603,627,637,720,722,741,755,794,862,888,898,907,909,958,1027,1035,1122,1131,5,89,147,150,157,167,228,252,264,331,391,411,430,502,512,513,578,591,597,629,683,719,730,731,734,735,739,740,742,751,753,776,777,788,820,845,872,879,943,969,1003,1004,1005,1006,1028,1044,1079,1080,1102,1132,67,82,168,241,258,293,336,339,428,431,510,518,594,605,673,694,703,706,723,756,822,861,880,945,992,1023,1033,1034,1073,1111,1121,1125,39,81,85,88,91,94,130,134,201,203,205,274,313,332,420,429,448,451,452,495,503,550,567,570,595,641,664,667,668,698,702,748,752,775,791,792,821,860,865,874,897,904,978,980,1040,1049,1128,1129,1133,132,154,169,197,198,255,260,343,505,511,551,552,587,598,600,636,666,677,699,747,864,944,979,1119,1120,1126,1127,77,112,199,202,239,276,326,372,585,588,593,676,700,718,793,846,882,903,1052,15,83,84,87,90,144,204,206,395,412,419,498,571,624,871,883,1077,1118,66,69,86,92,124,131,200,237,251,265,286,288,299,447,449,547,553,558,630,631,663,678,725,733,773,789,825,828,881,899,911,912,994,1007,1083,68,93,119,207,273,280,325,517,521,628,635,661,662,701,746,749,807,891,959,1039,1078,16,72,75,109,125,143,236,240,254,287,291,292,294,314,485,529,539,549,586,633,665,754,759,760,774,853,940,962,963,965,1084,1135,1136,1137,17,76,78,102,105,113,122,243,261,278,390,520,704,829,830,832,833,835,939,1018,1048,1050,18,171,340,362,548,606,778,960,997,1051,1081,1104,73,108,127,170,175,266,290,296,392,486,634,684,696,697,708,847,848,998,1016,1085,121,235,285,320,329,394,509,589,632,695,732,809,893,961,1107,46,74,80,246,281,323,359,506,625,705,808,826,941,38,43,45,79,95,103,107,111,120,123,152,172,176,277,279,289,352,584,671,836,884,929,957,964,1076,104,685,831,11,126,328,608,672,709,834,993,1086,7,148,298,607,996,1103,6,153,244,321,322,507,810,889,930,1138,173,174,297,319,361,892,1106,12,110,114,389,445,463,470,519,707,187,890,999,47,106,186,295,301,444,467,827,894,1105,8,446,1000,1001,10,44,393,508,995,259,468,895,9,469,245,387,443,610,262,388,360,442,609,612,70,966,611,724,376,257,1017,375,374],"Skill7PV":[306,488,490,492,96,307,311,489,309,377,432,1010,1041,31,33,305,310,422,434,574,32,229,282,576,651,947,1009,30,34,35,37,212,302,303,308,358,437,439,575,762,36,211,231,232,234,284,383,491,618,619,652,975,27,29,194,230,433,812,839,841,856,916,950,1087,26,28,233,304,423,435,438,440,481,531,542,617,623,867,913,914,920,922,923,927,932,972,973,1108,1140,0,25,335,338,345,346,347,381,382,384,425,436,464,526,532,540,579,602,620,622,656,716,843,849,850,851,852,869,918,921,924,925,926,970,971,1008,1011,1096,62,117,193,283,424,454,535,541,545,546,555,556,616,713,714,915,917,919,948,951,1064,1069,1097,1,19,58,63,100,115,164,166,333,334,351,353,367,403,415,417,426,427,453,482,534,758,837,838,840,842,866,868,935,949,1019,1088,1089,1091,42,60,64,98,192,215,350,369,379,380,386,396,472,473,477,525,544,561,582,644,726,727,737,765,797,938,987,1029,1030,1061,1063,1067,1068,1070,1098,1099,54,99,135,136,191,256,385,456,457,459,466,480,530,538,543,580,669,1071,101,129,163,188,190,225,249,342,348,405,441,458,461,475,478,522,621,653,658,764,766,928,933,955,974,1012,1015,1045,1047,1072,1094,1113,4,22,51,53,55,57,59,65,118,165,182,210,337,378,409,416,462,533,536,581,654,657,659,688,712,715,736,787,795,818,854,857,934,988,989,1013,1014,1054,1074,1093,1141,50,56,61,97,128,141,158,183,213,214,216,217,218,220,227,267,368,370,407,460,465,471,474,479,494,497,499,537,560,562,566,655,660,686,687,690,693,738,761,767,771,783,786,796,804,811,816,906,952,953,981,982,990,1021,1066,1075,1090,1092,1112,1139,52,159,185,253,349,357,373,397,400,421,455,483,524,569,675,681,689,805,806,855,931,937,954,956,983,985,1022,1024,1036,1037,1057,1095,1110,1116,21,160,184,196,208,221,247,315,316,318,354,364,366,398,402,406,408,413,484,493,523,554,647,648,649,679,680,691,743,768,769,817,823,878,901,936,1020,1114,1115,1123,71,116,139,140,162,177,178,179,180,181,209,317,344,365,371,399,401,418,496,501,516,640,645,674,800,814,858,896,1042,1059,137,142,161,189,223,248,268,355,356,363,527,528,559,568,601,639,643,646,650,670,682,728,744,750,779,781,782,798,801,802,803,813,815,870,873,900,967,1043,1055,1060,2,24,49,145,155,156,222,224,238,270,300,450,563,564,565,577,596,613,614,717,729,763,770,784,799,859,887,908,942,946,976,991,1031,1046,1056,1062,1065,1109,1124,1130,3,13,40,41,195,219,242,263,275,312,341,404,414,500,514,557,572,615,626,638,692,711,721,757,790,844,875,876,877,902,910,977,984,1002,1025,1026,1058,1082,1100,1101,14,20,23,48,133,138,146,149,151,226,250,269,271,272,324,327,330,410,476,487,504,515,573,583,590,592,599,603,604,627,637,642,710,720,722,741,745,755,772,780,785,794,819,824,862,863,885,886,888,898,905,907,909,958,968,986,1027,1032,1035,1038,1053,1117,1122,1131,1134,5,89,147,150,157,167,228,252,264,331,391,411,430,502,512,513,578,591,597,629,683,719,730,731,734,735,739,740,742,751,753,776,777,788,820,845,872,879,943,969,1003,1004,1005,1006,1028,1044,1079,1080,1102,1132,67,82,168,241,258,293,336,339,428,431,510,518,594,605,673,694,703,706,723,756,822,861,880,945,992,1023,1033,1034,1073,1111,1121,1125,39,81,85,88,91,94,130,134,201,203,205,274,313,332,420,429,448,451,452,495,503,550,567,570,595,641,664,667,668,698,702,748,752,775,791,792,821,860,865,874,897,904,978,980,1040,1049,1128,1129,1133,132,154,169,197,198,255,260,343,505,511,551,552,587,598,600,636,666,677,699,747,864,944,979,1119,1120,1126,1127,77,112,199,202,239,276,326,372,585,588,593,676,700,718,793,846,882,903,1052,15,66,69,83,84,87,90,144,204,206,251,286,299,395,412,419,447,498,553,558,571,624,733,825,828,871,883,1007,1077,1118,68,86,92,93,119,124,131,200,207,237,265,273,280,288,325,449,517,521,547,628,630,631,635,661,662,663,678,701,725,746,749,773,789,807,881,891,899,911,912,959,994,1039,1078,1083,16,72,75,109,125,143,236,240,254,287,291,292,294,314,485,529,539,549,586,633,665,754,759,760,774,853,940,962,963,965,1084,1135,1136,1137,17,76,78,102,105,113,122,243,261,278,390,520,704,829,830,832,833,835,939,1018,1048,1050,18,171,340,362,548,606,778,960,997,1051,1081,1104,73,108,127,170,175,266,290,296,392,486,634,684,696,697,708,847,848,998,1016,1085,121,235,285,320,329,394,509,589,632,695,732,809,893,961,1107,46,74,79,80,246,277,281,289,323,359,506,625,671,705,808,826,941,957,1076,38,43,45,95,103,104,107,111,120,123,152,172,176,279,352,584,685,831,836,884,929,964,11,126,328,608,672,709,834,993,1086,7,148,298,607,996,1103,6,153,244,321,322,507,810,889,930,1138,173,174,297,319,361,892,1106,12,110,114,389,445,463,470,519,707,187,827,890,999,1105,8,47,106,186,295,301,444,446,467,894,1000,1001,10,44,393,508,995,259,468,895,9,469,245,387,443,610,262,360,388,442,612,609,70,966,611,724,376,257,1017,375,374]},"search":{"texts":["ac 2 carrier","ac 2 carrier lb x ac 2 carrier lb x","aeron strike vtol","aeron strike vtol bap aeron strike vtol bap","aesir medium aa vehicle","aesir medium aa vehicle hag aesir medium aa vehicle hag","aithon assault transport","ajax assault tank sealed ajax assault tank sealed","ajax assault tank a ajax assault tank a","ajax assault tank b ajax assault tank b","ajax assault tank c ajax assault tank c","ajax assault tank d ajax assault tank d","ajax assault tank prime ajax assault tank prime","alacorn heavy tank mk i alacorn heavy tank mk i","alacorn heavy tank mk ii alacorn heavy tank mk ii","alacorn heavy tank mk iii alacorn heavy tank mk iii","alacorn heavy tank mk iv alacorn heavy tank mk iv","alacorn heavy tank mk vi alacorn heavy tank mk vi","alacorn heavy tank mk vii alacorn heavy tank mk vii","anat apc","anhur p stealth anhur p stealth","anhur transport","anhur transport ba anhur transport ba","ares medium tank","ares medium tank plasma ares medium tank plasma","armored personnel carrier hover lrm armored personnel carrier hover lrm","armored personnel carrier hover mg armored personnel carrier hover mg","armored personnel carrier hover sensors armored personnel carrier hover sensors","armored personnel carrier hover srm armored personnel carrier hover srm","armored personnel carrier hover armored personnel carrier hover","armored personnel carrier tracked lrm armored personnel carrier tracked lrm","armored personnel carrier tracked mg armored personnel carrier tracked mg","armored personnel carrier tracked srm armored personnel carrier tracked srm","armored personnel carrier tracked armored personnel carrier tracked","armored personnel carrier wheeled lrm armored personnel carrier wheeled lrm","armored personnel carrier wheeled mg armored personnel carrier wheeled mg","armored personnel carrier wheeled srm armored personnel carrier wheeled srm","armored personnel carrier wheeled armored personnel carrier wheeled","arrow iv assault vehicle","arrow iv carrier","asshur artillery spotter","asshur fast reconnaissance vehicle","asshur fast reconnaissance vehicle proto ac asshur fast reconnaissance vehicle proto ac","athena combat vehicle","athena combat vehicle hag athena combat vehicle hag","athena combat vehicle xr athena combat vehicle xr","axel heavy tank iic","axel heavy tank iic xl axel heavy tank iic xl","axel heavy tank mk 1 axel heavy tank mk 1","axel heavy tank mk 2 axel heavy tank mk 2","badger c tracked transport a badger c tracked transport a","badger c tracked transport b badger c tracked transport b","badger c tracked transport c badger c tracked transport c","badger c tracked transport d badger c tracked transport d","badger c tracked transport e badger c tracked transport e","badger c tracked transport f badger c tracked transport f","badger c tracked transport h badger c tracked transport h","badger c tracked transport prime badger c tracked transport prime","badger tracked transport a badger tracked transport a","badger tracked transport b badger tracked transport b","badger tracked transport c badger tracked transport c","badger tracked transport d badger tracked transport d","badger tracked transport e badger tracked transport e","badger tracked transport f badger tracked transport f","badger tracked transport g badger tracked transport g","badger tracked transport prime badger tracked transport prime","balac strike vtol","balac strike vtol hybrid balac strike vtol hybrid","balac strike vtol lrm balac strike vtol lrm","balac strike vtol spotter balac strike vtol spotter","ballista artillery trailer","ballista self propelled artillery tank","bandit c hovercraft a bandit c hovercraft a","bandit c hovercraft b bandit c hovercraft b","bandit c hovercraft c bandit c hovercraft c","bandit c hovercraft d bandit c hovercraft d","bandit c hovercraft e bandit c hovercraft e","bandit c hovercraft f bandit c hovercraft f","bandit c hovercraft g bandit c hovercraft g","bandit c hovercraft h bandit c hovercraft h","bandit c hovercraft prime bandit c hovercraft prime","bandit hovercraft warthog bandit hovercraft warthog","bandit hovercraft a bandit hovercraft a","bandit hovercraft b bandit hovercraft b","bandit hovercraft c bandit hovercraft c","bandit hovercraft d bandit hovercraft d","bandit hovercraft e bandit hovercraft e","bandit hovercraft f bandit hovercraft f","bandit hovercraft g bandit hovercraft g","bandit hovercraft h bandit hovercraft h","bandit hovercraft i bandit hovercraft i","bandit hovercraft mk ii","bandit hovercraft prime bandit hovercraft prime","bardiche heavy strike tank","bardiche heavy strike tank minesweeper bardiche heavy strike tank minesweeper","bardiche heavy strike tank c bardiche heavy strike tank c","battlemech recovery vehicle","beagle hover scout","beagle hover scout c3i beagle hover scout c3i","beagle hover scout lrrp beagle hover scout lrrp","beagle hover scout sealed beagle hover scout sealed","beagle hover scout tag beagle hover scout tag","behemoth heavy tank","behemoth heavy tank armor behemoth heavy tank armor","behemoth heavy tank davion behemoth heavy tank davion","behemoth heavy tank flamer behemoth heavy tank flamer","behemoth heavy tank kurita upgrade behemoth heavy tank kurita upgrade","behemoth heavy tank kurita behemoth heavy tank kurita","behemoth heavy tank liao behemoth heavy tank liao","behemoth heavy tank refit behemoth heavy tank refit","behemoth ii heavy tank","behemoth ii heavy tank support behemoth ii heavy tank support","bellona hover tank","bellona hover tank laser bellona hover tank laser","bellona hover tank xl bellona hover tank xl","blizzard hover transport","blizzard hover transport black blizzard blizzard hover transport black blizzard","blizzard hover transport srm blizzard hover transport srm","bokkusu support trailer","bolla stealth tank rots a bolla stealth tank rots a","bolla stealth tank rots b bolla stealth tank rots b","bolla stealth tank rots c bolla stealth tank rots c","bolla stealth tank rots d bolla stealth tank rots d","bolla stealth tank rots prime bolla stealth tank rots prime","bolla stealth tank comminus bolla stealth tank comminus","bolla stealth tank dominus bolla stealth tank dominus","bolla stealth tank infernus bolla stealth tank infernus","bolla stealth tank invictus bolla stealth tank invictus","browning mobile headquarters","browning mobile headquarters half track browning mobile headquarters half track","brutus assault tank","brutus assault tank hppc brutus assault tank hppc","brutus assault tank lrm brutus assault tank lrm","brutus assault tank ppc 2 brutus assault tank ppc 2","brutus assault tank ppc brutus assault tank ppc","bulldog medium tank","bulldog medium tank ac2 bulldog medium tank ac2","bulldog medium tank cell bulldog medium tank cell","bulldog medium tank chemical bulldog medium tank chemical","bulldog medium tank erll bulldog medium tank erll","bulldog medium tank lb x bulldog medium tank lb x","bulldog medium tank lrm bulldog medium tank lrm","bulldog medium tank plasma bulldog medium tank plasma","bulwark assault vehicle","bulwark assault vehicle original bulwark assault vehicle original","burke defense tank","burke defense tank hppc burke defense tank hppc","burke defense tank royal burke defense tank royal","burke ii superheavy tank","buzzard hover tank","cardinal transport","cardinal transport raf cardinal transport raf","carnivore assault tank","carnivore assault tank hag carnivore assault tank hag","carnivore assault tank second line carnivore assault tank second line","cavalry attack helicopter","cavalry attack helicopter ba cavalry attack helicopter ba","cavalry attack helicopter infantry cavalry attack helicopter infantry","cavalry attack helicopter infiltrator cavalry attack helicopter infiltrator","cavalry attack helicopter lrm cavalry attack helicopter lrm","cavalry attack helicopter srm cavalry attack helicopter srm","cavalry attack helicopter tag cavalry attack helicopter tag","cavalry attack helicopter cadence rain cavalry attack helicopter cadence rain","centipede scout car","centipede scout car srm centipede scout car srm","centipede scout car tag centipede scout car tag","centipede scout car commando centipede scout car commando","chalchiuhtotolin support tank","chalchiuhtotolin support tank bombast laser chalchiuhtotolin support tank bombast laser","chalchiuhtotolin support tank chemical laser chalchiuhtotolin support tank chemical laser","chalchiuhtotolin support tank xl chalchiuhtotolin support tank xl","challenger mbt mk xv challenger mbt mk xv","challenger mbt x challenger mbt x","challenger mbt xi challenger mbt xi","challenger mbt xii challenger mbt xii","challenger mbt xivs challenger mbt xivs","challenger mbt xvc challenger mbt xvc","chaparral missile artillery tank","chaparral missile artillery tank case chaparral missile artillery tank case","chaparral missile artillery tank erml chaparral missile artillery tank erml","chaparral missile artillery tank mg chaparral missile artillery tank mg","chaparral missile artillery tank srm chaparral missile artillery tank srm","chevalier light tank","chevalier light tank bap chevalier light tank bap","chevalier light tank mml chevalier light tank mml","chevalier light tank speed chevalier light tank speed","cizin hover tank","cizin hover tank support cizin hover tank support","cobra transport vtol","cobra transport vtol command cobra transport vtol command","cobra transport vtol mash cobra transport vtol mash","cobra transport vtol original cobra transport vtol original","command van","command van ice command van ice","command van q vehicle command van q vehicle","condor heavy hover tank","condor heavy hover tank davion condor heavy hover tank davion","condor heavy hover tank fission condor heavy hover tank fission","condor heavy hover tank flamer condor heavy hover tank flamer","condor heavy hover tank fusion condor heavy hover tank fusion","condor heavy hover tank lac condor heavy hover tank lac","condor heavy hover tank laser upgrade condor heavy hover tank laser upgrade","condor heavy hover tank laser condor heavy hover tank laser","condor heavy hover tank liao condor heavy hover tank liao","condor heavy hover tank ultra condor heavy hover tank ultra","condor heavy hover tank upgrade","condor heavy hover tank upgrade laser condor heavy hover tank upgrade laser","condor heavy hover tank c condor heavy hover tank c","condor multi purpose tank","condor multi purpose tank reactive condor multi purpose tank reactive","coolant truck hover coolant truck hover","coolant truck tracked coolant truck tracked","coolant truck 135 k lifesaver coolant truck 135 k lifesaver","crane heavy transport","crow scout helicopter","crow scout helicopter dragonfly crow scout helicopter dragonfly","crow scout helicopter c3 crow scout helicopter c3","crow scout helicopter export crow scout helicopter export","cyrano gunship","cyrano gunship ml cyrano gunship ml","cyrano gunship plasma cyrano gunship plasma","cyrano gunship royal cyrano gunship royal","cyrano gunship fury cyrano gunship fury","daimyo hq 67 k daimyo hq 67 k","daimyo hq 67 k2 daimyo hq 67 k2","daimyo hq 67 nc daimyo hq 67 nc","daimyo hq 67 r daimyo hq 67 r","danai support vehicle","danai support vehicle arrow danai support vehicle arrow","darter scout car","darter scout car bap darter scout car bap","darter scout car c3 darter scout car c3","darter scout car ecm darter scout car ecm","darter scout car srm darter scout car srm","darter scout car srm2 darter scout car srm2","demolisher heavy tank arrow iv demolisher heavy tank arrow iv","demolisher heavy tank cell demolisher heavy tank cell","demolisher heavy tank clan demolisher heavy tank clan","demolisher heavy tank defensive demolisher heavy tank defensive","demolisher heavy tank gauss demolisher heavy tank gauss","demolisher heavy tank mrm demolisher heavy tank mrm","demolisher heavy tank reinforced demolisher heavy tank reinforced","demolisher heavy tank mk ii demolisher heavy tank mk ii","demolisher ii heavy tank","demolisher ii heavy tank mml demolisher ii heavy tank mml","demolisher ii heavy tank thunderbolt demolisher ii heavy tank thunderbolt","demolisher ii heavy tank ii x demolisher ii heavy tank ii x","demon medium tank","demon medium tank armor demon medium tank armor","demon medium tank rifle demon medium tank rifle","demon tank","demon tank hgr demon tank hgr","demon tank horned demon demon tank horned demon","demon tank ppc demon tank ppc","demon tank royal demon tank royal","demon tank cx 2 demon tank cx 2","desert scorpion light tank","destrier siege vehicle","devastator heavy tank","devastator ii superheavy tank","di morgan assault tank","di morgan assault tank gauss di morgan assault tank gauss","di morgan assault tank lrm di morgan assault tank lrm","di multipurpose light vtol","di multipurpose light vtol gunship di multipurpose light vtol gunship","di schmitt tank","di schmitt tank targeting computer di schmitt tank targeting computer","diggs drone control tank","donar assault helicopter","donar assault helicopter close support donar assault helicopter close support","donar assault helicopter recon donar assault helicopter recon","drillson heavy hover tank","drillson heavy hover tank erll drillson heavy hover tank erll","drillson heavy hover tank mml drillson heavy hover tank mml","drillson heavy hover tank sealed drillson heavy hover tank sealed","drillson heavy hover tank srm drillson heavy hover tank srm","drillson heavy hover tank streak drillson heavy hover tank streak","drillson heavy hover tank c drillson heavy hover tank c","drillson heavy hover tank c 2 drillson heavy hover tank c 2","eldingar hover sled","eldingar hover sled hmmhv humhov eldingar hover sled hmmhv humhov","eldingar hover sled streak eldingar hover sled streak","engineering vehicle","engineering vehicle ac engineering vehicle ac","engineering vehicle flamer engineering vehicle flamer","enyo strike tank","enyo strike tank er pulse enyo strike tank er pulse","enyo strike tank lb x sholef enyo strike tank lb x sholef","enyo strike tank xr enyo strike tank xr","epona pursuit tank a epona pursuit tank a","epona pursuit tank b epona pursuit tank b","epona pursuit tank c epona pursuit tank c","epona pursuit tank d epona pursuit tank d","epona pursuit tank e epona pursuit tank e","epona pursuit tank prime epona pursuit tank prime","eurus mbt a eurus mbt a","eurus mbt b eurus mbt b","eurus mbt c eurus mbt c","eurus mbt d eurus mbt d","eurus mbt prime eurus mbt prime","falcon hover tank","fensalir combat wige","ferret light scout vtol","ferret light scout vtol fermi ferret light scout vtol fermi","ferret light scout vtol armor wild weasel ferret light scout vtol armor wild weasel","ferret light scout vtol cargo ferret light scout vtol cargo","flatbed truck","flatbed truck armor flatbed truck armor","flatbed truck lrm flatbed truck lrm","flatbed truck mortar flatbed truck mortar","flatbed truck rl flatbed truck rl","flatbed truck srm flatbed truck srm","fortune wheeled assault vehicle","fortune wheeled assault vehicle c3m fortune wheeled assault vehicle c3m","fortune wheeled assault vehicle thunderbolt fortune wheeled assault vehicle thunderbolt","fox armored car","fox armored car flamer fox armored car flamer","fox armored car interdictor fox armored car interdictor","fox armored car vsp fox armored car vsp","fulcrum heavy hover tank hybrid fulcrum heavy hover tank hybrid","fulcrum heavy hovertank","fulcrum heavy hovertank ii fulcrum heavy hovertank ii","fulcrum heavy hovertank iii fulcrum heavy hovertank iii","fulcrum heavy hovertank x fulcrum heavy hovertank x","fury command tank","fury command tank c3m fury command tank c3m","fury command tank c3s fury command tank c3s","fury command tank fury ii fury command tank fury ii","fury command tank fury iii fury command tank fury iii","fury command tank fury iiim fury command tank fury iiim","fury command tank original fury command tank original","fury command tank royal fury command tank royal","fury command tank cx 17 fury command tank cx 17","gabriel reconnaissance hovercraft","gabriel reconnaissance hovercraft ersl gabriel reconnaissance hovercraft ersl","gabriel reconnaissance hovercraft tdf gabriel reconnaissance hovercraft tdf","gallant urban assault tank","galleon light tank c galleon light tank c","galleon light tank gal 100 galleon light tank gal 100","galleon light tank gal 102 galleon light tank gal 102","galleon light tank gal 103 galleon light tank gal 103","galleon light tank gal 104 galleon light tank gal 104","galleon light tank gal 105 galleon light tank gal 105","galleon light tank gal 106 galleon light tank gal 106","galleon light tank gal 106m galleon light tank gal 106m","galleon light tank gal 200 galleon light tank gal 200","galleon light tank gal 200 rl galleon light tank gal 200 rl","galleon light tank gal 200r galleon light tank gal 200r","galleon light tank gal 201 galleon light tank gal 201","galleon light tank gal 300 galleon light tank gal 300","galleon light tank maxwell galleon light tank maxwell","garrot superheavy transport","garuda heavy vtol","giggins apc","giggins apc fire support giggins apc fire support","gladius medium hover tank mk ii gladius medium hover tank mk ii","gladius medium hovertank","glaive medium tank","glaive medium tank mfb glaive medium tank mfb","glory heavy fire support vehicle","glory heavy fire support vehicle 3090 upgrade glory heavy fire support vehicle 3090 upgrade","glory heavy fire support vehicle arrow iv glory heavy fire support vehicle arrow iv","glory heavy fire support vehicle light gauss glory heavy fire support vehicle light gauss","goblin ii infantry support vehicle","goblin iii infantry support vehicle","goblin infantry support vehicle","goblin infantry support vehicle sealed goblin infantry support vehicle sealed","goblin medium tank","goblin medium tank lrm goblin medium tank lrm","goblin medium tank mg goblin medium tank mg","goblin medium tank srm goblin medium tank srm","goblin medium tank x goblin medium tank x","gossamer vtol","gossamer vtol xl gossamer vtol xl","gulltoppr omnimonitor a gulltoppr omnimonitor a","gulltoppr omnimonitor b gulltoppr omnimonitor b","gulltoppr omnimonitor prime gulltoppr omnimonitor prime","gun trailer ambush gun trailer ambush","gun trailer artillery aaa gun trailer artillery aaa","gun trailer lrm gun trailer lrm","gun trailer mjolnir gun trailer mjolnir","gun trailer sc gun trailer sc","gun trailer siege gun trailer siege","gun trailer stronghold gun trailer stronghold","gun trailer thumper gun trailer thumper","gun trailer thunderbolt gun trailer thunderbolt","gun trailer ultra gun trailer ultra","gurteltier mbt","gurteltier mbt c3m gurteltier mbt c3m","gurzil support tank","hachiman fire support tank","hachiman fire support tank aaa hachiman fire support tank aaa","hadur fast support vehicle","hadur fast support vehicle lrm hadur fast support vehicle lrm","hadur fast support vehicle reactive hadur fast support vehicle reactive","hanse mbt","harasser laser platform","harasser missile platform","harasser missile platform leaping lisa harasser missile platform leaping lisa","harasser missile platform mini peggy harasser missile platform mini peggy","harasser missile platform flamer harasser missile platform flamer","harasser missile platform fuel cell harasser missile platform fuel cell","harasser missile platform heavy ferro harasser missile platform heavy ferro","harasser missile platform inarc harasser missile platform inarc","harasser missile platform lfe harasser missile platform lfe","harasser missile platform lrm harasser missile platform lrm","harasser missile platform marian harasser missile platform marian","harasser missile platform mml harasser missile platform mml","harasser missile platform speed harasser missile platform speed","harasser missile platform thunderbolt harasser missile platform thunderbolt","harrier heavy hover tank","harrier heavy hover tank ppc harrier heavy hover tank ppc","harrier heavy hover tank re laser harrier heavy hover tank re laser","hasek mechanized combat vehicle","hawk hover tank ltv 4 hawk hover tank ltv 4","hawk moth gunship","hawk moth gunship verwandlung hawk moth gunship verwandlung","hawk moth gunship armor hawk moth gunship armor","hawk moth gunship thunderbolt hawk moth gunship thunderbolt","hawk moth ii gunship","hawk moth ii gunship mml hawk moth ii gunship mml","hawk moth ii gunship sniper hawk moth ii gunship sniper","heavy battlemech recovery vehicle","heavy hover apc","heavy hover apc lrm heavy hover apc lrm","heavy hover apc mg heavy hover apc mg","heavy hover apc scout tank heavy hover apc scout tank","heavy hover apc srm heavy hover apc srm","heavy lrm carrier","heavy lrm carrier en variant heavy lrm carrier en variant","heavy mml carrier","heavy nlrm carrier","heavy tracked apc","heavy tracked apc lrm heavy tracked apc lrm","heavy tracked apc mg heavy tracked apc mg","heavy tracked apc srm heavy tracked apc srm","heavy weapons carrier ppc heavy weapons carrier ppc","heavy wheeled apc","heavy wheeled apc lrm heavy wheeled apc lrm","heavy wheeled apc mg heavy wheeled apc mg","heavy wheeled apc srm heavy wheeled apc srm","heavy wheeled apc wob heavy wheeled apc wob","heimdall ground monitor tank a heimdall ground monitor tank a","heimdall ground monitor tank b heimdall ground monitor tank b","heimdall ground monitor tank c heimdall ground monitor tank c","heimdall ground monitor tank d heimdall ground monitor tank d","heimdall ground monitor tank prime heimdall ground monitor tank prime","hephaestus jump tank","hephaestus scout tank a hephaestus scout tank a","hephaestus scout tank b hephaestus scout tank b","hephaestus scout tank c hephaestus scout tank c","hephaestus scout tank d hephaestus scout tank d","hephaestus scout tank prime hephaestus scout tank prime","hetzer wheeled assault gun","hetzer wheeled assault gun ac10 hetzer wheeled assault gun ac10","hetzer wheeled assault gun cell hetzer wheeled assault gun cell","hetzer wheeled assault gun laser hetzer wheeled assault gun laser","hetzer wheeled assault gun lb x hetzer wheeled assault gun lb x","hetzer wheeled assault gun lrm hetzer wheeled assault gun lrm","hetzer wheeled assault gun scout hetzer wheeled assault gun scout","hetzer wheeled assault gun sealed hetzer wheeled assault gun sealed","hetzer wheeled assault gun srm hetzer wheeled assault gun srm","hetzer wheeled assault gun c hetzer wheeled assault gun c","hexareme hq hovercraft","hi scout drone carrier","hi scout drone carrier cunnington hi scout drone carrier cunnington","hipparch cavalry tank","huitzilopochtli assault tank huey","huitzilopochtli assault tank huey aaa huitzilopochtli assault tank huey aaa","huitzilopochtli assault tank huey lrm huitzilopochtli assault tank huey lrm","huitzilopochtli assault tank huey streak huitzilopochtli assault tank huey streak","hunter light support tank","hunter light support tank assault hunter hunter light support tank assault hunter","hunter light support tank 3054 upgrade hunter light support tank 3054 upgrade","hunter light support tank ammo hunter light support tank ammo","hunter light support tank amphibious hunter light support tank amphibious","hunter light support tank cell hunter light support tank cell","hunter light support tank erll hunter light support tank erll","hunter light support tank lpl hunter light support tank lpl","hunter light support tank lrm10 hunter light support tank lrm10","hunter light support tank lrm15 hunter light support tank lrm15","ignis infantry support tank","ignis infantry support tank srm ignis infantry support tank srm","indra infantry transport","indra infantry transport ba indra infantry transport ba","ishtar heavy fire support tank","ishtar heavy fire support tank gauss ishtar heavy fire support tank gauss","ishtar heavy fire support tank original ishtar heavy fire support tank original","j 27 ordnance transport","j 27 ordnance transport armor j 27 ordnance transport armor","j 27 ordnance transport fusion j 27 ordnance transport fusion","j 27 ordnance transport k 27 killjoy j 27 ordnance transport k 27 killjoy","j 27 ordnance transport trailer","j edgar light hover tank","j edgar light hover tank cell j edgar light hover tank cell","j edgar light hover tank chemical j edgar light hover tank chemical","j edgar light hover tank flamer j edgar light hover tank flamer","j edgar light hover tank ice j edgar light hover tank ice","j edgar light hover tank kurita j edgar light hover tank kurita","j edgar light hover tank lac j edgar light hover tank lac","j edgar light hover tank light ppc j edgar light hover tank light ppc","j edgar light hover tank mg j edgar light hover tank mg","j edgar light hover tank tag j edgar light hover tank tag","j edgar light hover tank x pulse j edgar light hover tank x pulse","jagdpanzer ii","jes i tactical missile carrier","jes i tactical missile carrier 3082 upgrade jes i tactical missile carrier 3082 upgrade","jes ii strategic missile carrier","jes ii strategic missile carrier ammo jes ii strategic missile carrier ammo","jes ii strategic missile carrier support jes ii strategic missile carrier support","jes iii missile carrier","jes iii missile carrier c3 jes iii missile carrier c3","jes iii missile carrier mml jes iii missile carrier mml","jes iii missile carrier speed jes iii missile carrier speed","jes iii missile carrier thunderbolt jes iii missile carrier thunderbolt","ji2a1 attack apc","ji2a1 attack apc mml ji2a1 attack apc mml","joust medium tank be700 joust medium tank be700","joust medium tank be701 joust medium tank be701","kalki cruise missile launcher","kamakiri attack vtol","kamakiri attack vtol gauss shi kamakiri kamakiri attack vtol gauss shi kamakiri","kamisori light tank a kamisori light tank a","kamisori light tank b kamisori light tank b","kamisori light tank c kamisori light tank c","kamisori light tank prime kamisori light tank prime","kamisori light tank r kamisori light tank r","kanga medium hovertank","kanga medium hovertank ac kanga medium hovertank ac","kanga x jump tank","karnov ur gunship","karnov ur transport","karnov ur transport 3055 upgrade karnov ur transport 3055 upgrade","karnov ur transport ac karnov ur transport ac","karnov ur transport artillery karnov ur transport artillery","karnov ur transport ba stealth karnov ur transport ba stealth","karnov ur transport ba karnov ur transport ba","karnov ur transport heavy stealth karnov ur transport heavy stealth","karnov ur transport periphery karnov ur transport periphery","kelswa assault tank","kestrel vtol","kestrel vtol clan kestrel vtol clan","kestrel vtol medevac kestrel vtol medevac","kestrel vtol ml kestrel vtol ml","kestrel vtol scout kestrel vtol scout","kestrel vtol sl kestrel vtol sl","kestrel vtol srm kestrel vtol srm","kinnol mbt","kinnol mbt ppc kinnol mbt ppc","kinnol mbt rac kinnol mbt rac","kite reconnaissance vehicle","kite reconnaissance vehicle fusion kite reconnaissance vehicle fusion","kokou defense tank","kokou defense tank xl kokou defense tank xl","korvin tank krv 3 korvin tank krv 3","kruger combat car","kruger combat car original kruger combat car original","ku wheeled assault tank","ku wheeled assault tank ifv turhan ii ku wheeled assault tank ifv turhan ii","lamprey transport helicopter","laser carrier","light srm carrier","light thunderbolt carrier","lightning attack hovercraft","lightning attack hovercraft erml lightning attack hovercraft erml","lightning attack hovercraft ersl lightning attack hovercraft ersl","lightning attack hovercraft rl lightning attack hovercraft rl","lightning attack hovercraft royal lightning attack hovercraft royal","lightning attack hovercraft cx 3 lightning attack hovercraft cx 3","lrm carrier","lrm carrier 3055 upgrade lrm carrier 3055 upgrade","lrm carrier wob lrm carrier wob","lrm carrier c lrm carrier c","luduan scout vehicle","m a s h truck","m a s h truck ams m a s h truck ams","m a s h truck ice m a s h truck ice","magi infantry support vehicle","magi infantry support vehicle ucsv magi infantry support vehicle ucsv","main gauche light support tank","main gauche light support tank c3 main gauche light support tank c3","main gauche light support tank ifv main gauche light support tank ifv","main gauche light support tank xl main gauche light support tank xl","mamono ifv","manteuffel attack tank a manteuffel attack tank a","manteuffel attack tank b manteuffel attack tank b","manteuffel attack tank c manteuffel attack tank c","manteuffel attack tank d manteuffel attack tank d","manteuffel attack tank e manteuffel attack tank e","manteuffel attack tank prime manteuffel attack tank prime","manticore heavy tank","manticore heavy tank the ballista manticore heavy tank the ballista","manticore heavy tank 3055 upgrade manticore heavy tank 3055 upgrade","manticore heavy tank c3m manticore heavy tank c3m","manticore heavy tank c3s manticore heavy tank c3s","manticore heavy tank hppc manticore heavy tank hppc","manticore heavy tank lb x manticore heavy tank lb x","manticore heavy tank rac manticore heavy tank rac","manticore heavy tank xl manticore heavy tank xl","manticore heavy tank ec manticore heavy tank ec","manticore ii heavy tank","mantis light attack vtol","mantis light attack vtol eccm mantis light attack vtol eccm","marksman artillery vehicle","marksman artillery vehicle ac marksman artillery vehicle ac","marksman artillery vehicle light ppc marksman artillery vehicle light ppc","marksman mbt m1 marksman mbt m1","marksman mbt m1a marksman mbt m1a","marksman mbt m1j marksman mbt m1j","mars assault vehicle","mars assault vehicle atm mars assault vehicle atm","mars assault vehicle hag mars assault vehicle hag","mars assault vehicle xl mars assault vehicle xl","marsden mbt ii marsden mbt ii","marsden mbt ii a marsden mbt ii a","marsden mbt ii a lb x marsden mbt ii a lb x","marten scout vtol","marten scout vtol infantry marten scout vtol infantry","maultier hover apc","maultier hover apc ba maultier hover apc ba","maultier hover apc basic maultier hover apc basic","maultier hover apc fusion maultier hover apc fusion","maultier hover apc intermediate maultier hover apc intermediate","maultier hover apc mg maultier hover apc mg","maxim i heavy hover transport","maxim i heavy hover transport company command maxim i heavy hover transport company command","maxim flanker","maxim heavy hover transport","maxim heavy hover transport 3052 upgrade maxim heavy hover transport 3052 upgrade","maxim heavy hover transport anti infantry maxim heavy hover transport anti infantry","maxim heavy hover transport ba factory upgrade maxim heavy hover transport ba factory upgrade","maxim heavy hover transport ba field upgrade maxim heavy hover transport ba field upgrade","maxim heavy hover transport c3m maxim heavy hover transport c3m","maxim heavy hover transport c3s maxim heavy hover transport c3s","maxim heavy hover transport clan maxim heavy hover transport clan","maxim heavy hover transport escort maxim heavy hover transport escort","maxim heavy hover transport fire support maxim heavy hover transport fire support","maxim heavy hover transport srm2 maxim heavy hover transport srm2","maxim heavy hover transport srm4 maxim heavy hover transport srm4","maxim mk ii transport","maxim mk ii transport ecm maxim mk ii transport ecm","maxim mk ii transport infantry support shiloh maxim mk ii transport infantry support shiloh","merkava heavy tank mk ix merkava heavy tank mk ix","merkava heavy tank mk viii merkava heavy tank mk viii","mhi amphibious apc","mhi defense aa tank","minion advanced tactical vehicle","minion advanced tactical vehicle silver bullet minion advanced tactical vehicle silver bullet","minion advanced tactical vehicle gauss sandblaster minion advanced tactical vehicle gauss sandblaster","minion advanced tactical vehicle tag minion advanced tactical vehicle tag","minion advanced tactical vehicle targeting computer minion advanced tactical vehicle targeting computer","mit 23 mash vehicle","mit 24 mash vehicle","mithras light tank","mithras light tank erll mithras light tank erll","mobile headquarters","mobile headquarters ice ll mobile headquarters ice ll","mobile headquarters ice lrm mobile headquarters ice lrm","mobile headquarters ice mobile headquarters ice","mobile headquarters ll mobile headquarters ll","mobile headquarters lrm mobile headquarters lrm","mobile long tom artillery lt mob 25 mobile long tom artillery lt mob 25","mobile long tom artillery lt mob 25f mobile long tom artillery lt mob 25f","mobile long tom artillery lt mob 95 mobile long tom artillery lt mob 95","moltke mbt m1 moltke mbt m1","moltke mbt m2 moltke mbt m2","moltke mbt m3 moltke mbt m3","morningstar city command vehicle","morningstar city command vehicle company command morningstar city command vehicle company command","morningstar city command vehicle hpg morningstar city command vehicle hpg","morningstar city command vehicle laser morningstar city command vehicle laser","morrigu fire support vehicle","morrigu fire support vehicle hag morrigu fire support vehicle hag","morrigu fire support vehicle laser morrigu fire support vehicle laser","mortar carrier","mrm carrier","musketeer hover tank","musketeer hover tank 3080 upgrade musketeer hover tank 3080 upgrade","musketeer hover tank armor musketeer hover tank armor","myrmidon medium tank","myrmidon medium tank anti infantry myrmidon medium tank anti infantry","myrmidon medium tank p tate myrmidon medium tank p tate","myrmidon medium tank type 2 myrmidon medium tank type 2","nacon armored scout","narukami heavy tank nk 1c narukami heavy tank nk 1c","narukami heavy tank nk bc3 narukami heavy tank nk bc3","nightshade ecm vtol","nightshade ecm vtol armor nightshade ecm vtol armor","nightshade ecm vtol lac nightshade ecm vtol lac","nightshade ecm vtol light ppc nightshade ecm vtol light ppc","nightshade ecm vtol royal nightshade ecm vtol royal","nuberu anti aircraft tank","odin scout tank","odin scout tank spotter odin scout tank spotter","ontos heavy tank","ontos heavy tank 3053 upgrade ontos heavy tank 3053 upgrade","ontos heavy tank chemical laser ontos heavy tank chemical laser","ontos heavy tank fusion ontos heavy tank fusion","ontos heavy tank light gauss ontos heavy tank light gauss","ontos heavy tank lrm ontos heavy tank lrm","ontos heavy tank mml ontos heavy tank mml","ontos heavy tank sealed ontos heavy tank sealed","ontos heavy tank heat ontos heavy tank heat","ontos heavy tank x all aspect assault tank ontos heavy tank x all aspect assault tank","onuris attack vtol a onuris attack vtol a","onuris attack vtol b onuris attack vtol b","onuris attack vtol c onuris attack vtol c","onuris attack vtol d onuris attack vtol d","onuris attack vtol e onuris attack vtol e","onuris attack vtol prime onuris attack vtol prime","oro heavy tank","oro heavy tank hag oro heavy tank hag","packrat lrpv gespenst packrat lrpv gespenst","packrat lrpv pkr t5 packrat lrpv pkr t5","packrat lrpv pkr t5 ice packrat lrpv pkr t5 ice","packrat lrpv pkr t5 ml packrat lrpv pkr t5 ml","packrat lrpv pkr t5 srm2 packrat lrpv pkr t5 srm2","padilla anti missile tank","padilla heavy artillery tank","padilla heavy artillery tank lrm padilla heavy artillery tank lrm","padilla tube artillery tank","padilla tube artillery tank ams padilla tube artillery tank ams","padilla tube artillery tank ltc padilla tube artillery tank ltc","padilla tube artillery tank thumper padilla tube artillery tank thumper","paladin defense system","palmoni assault infantry fighting vehicle","partisan aa vehicle","partisan aa vehicle 3134 upgrade partisan aa vehicle 3134 upgrade","partisan air defense tank","partisan air defense tank cell partisan air defense tank cell","partisan air defense tank company command partisan air defense tank company command","partisan air defense tank lance command partisan air defense tank lance command","partisan air defense tank lrm partisan air defense tank lrm","partisan air defense tank quad rac partisan air defense tank quad rac","partisan air defense tank rac partisan air defense tank rac","partisan air defense tank xl partisan air defense tank xl","partisan heavy tank","partisan heavy tank ac2 partisan heavy tank ac2","partisan heavy tank c3 partisan heavy tank c3","partisan heavy tank cell partisan heavy tank cell","partisan heavy tank elrm partisan heavy tank elrm","partisan heavy tank light gauss partisan heavy tank light gauss","partisan heavy tank lrm partisan heavy tank lrm","partisan heavy tank refit partisan heavy tank refit","partisan hull defense","patton tank","patton tank sb patton tank sb","patton tank taurian patton tank taurian","patton tank ultra patton tank ultra","patton tank xl patton tank xl","pegasus scout hover tank","pegasus scout hover tank 3058 upgrade pegasus scout hover tank 3058 upgrade","pegasus scout hover tank c3 pegasus scout hover tank c3","pegasus scout hover tank missile pegasus scout hover tank missile","pegasus scout hover tank mml pegasus scout hover tank mml","pegasus scout hover tank mrm pegasus scout hover tank mrm","pegasus scout hover tank sealed pegasus scout hover tank sealed","pegasus scout hover tank sensors pegasus scout hover tank sensors","pegasus scout hover tank unarmed pegasus scout hover tank unarmed","pegasus scout hover tank x pulse pegasus scout hover tank x pulse","pegasus scout hover tank x pegasus scout hover tank x","peregrine attack vtol","peregrine attack vtol cargo peregrine attack vtol cargo","peregrine attack vtol kurita peregrine attack vtol kurita","phalanx support tank","phalanx support tank prototype phalanx support tank prototype","pike support vehicle","pike support vehicle ac5 pike support vehicle ac5","pike support vehicle clan pike support vehicle clan","pike support vehicle lb x pike support vehicle lb x","pike support vehicle missile pike support vehicle missile","pike support vehicle plasma pike support vehicle plasma","pike support vehicle rac assault pike pike support vehicle rac assault pike","pilum heavy tank","pilum heavy tank arrow iv pilum heavy tank arrow iv","pilum heavy tank elrm pilum heavy tank elrm","pinto attack vtol","pinto attack vtol wob pinto attack vtol wob","pixiu heavy tank","plainsman medium hovertank","plainsman medium hovertank scout plainsman medium hovertank scout","plainsman medium hovertank sealed plainsman medium hovertank sealed","plainsman medium hovertank streak plainsman medium hovertank streak","po heavy tank","po heavy tank hv prototype po heavy tank hv prototype","po heavy tank hv po heavy tank hv","po heavy tank lb x po heavy tank lb x","po heavy tank light gauss po heavy tank light gauss","po ii heavy tank","po ii heavy tank arrow iv po ii heavy tank arrow iv","po ii heavy tank gauss po ii heavy tank gauss","po ii heavy tank stealth po ii heavy tank stealth","pollux ada heavy tank","pollux ii ada heavy tank","praetorian mobile strategic command hq","predator tank destroyer","predator tank destroyer elite predator tank destroyer elite","predator tank destroyer original predator tank destroyer original","prowler multi terrain vehicle","prowler multi terrain vehicle 3140 upgrade prowler multi terrain vehicle 3140 upgrade","prowler multi terrain vehicle ecm prowler multi terrain vehicle ecm","prowler multi terrain vehicle raf prowler multi terrain vehicle raf","prowler multi terrain vehicle sealed prowler multi terrain vehicle sealed","prowler multi terrain vehicle security prowler multi terrain vehicle security","prowler multi terrain vehicle succession wars prowler multi terrain vehicle succession wars","prowler multi terrain vehicle support prowler multi terrain vehicle support","prowler multi terrain vehicle wob prowler multi terrain vehicle wob","puma assault tank pat 005 puma assault tank pat 005","puma assault tank pat 005b puma assault tank pat 005b","puma assault tank pat 007 puma assault tank pat 007","puma assault tank pat 008 puma assault tank pat 008","quaestor mobile tactical command hq","r10 mechanized icv coolant truck r10 mechanized icv coolant truck","r10 mechanized icv a r10 mechanized icv a","r10 mechanized icv b r10 mechanized icv b","r10 mechanized icv prime r10 mechanized icv prime","ranger armored fighting vehicle vv1 ranger armored fighting vehicle vv1","ranger armored fighting vehicle vv1 interdictor ranger armored fighting vehicle vv1 interdictor","ranger armored fighting vehicle vv1 mg ranger armored fighting vehicle vv1 mg","ranger armored fighting vehicle vv2 ranger armored fighting vehicle vv2","ranger armored fighting vehicle vv22 ranger armored fighting vehicle vv22","red kite attack vtol","regulator hovertank","regulator hovertank alan regulator hovertank alan","regulator hovertank arrow iv regulator hovertank arrow iv","regulator hovertank rac regulator hovertank rac","regulator ii hovertank","regulator ii hovertank rac regulator ii hovertank rac","regulator ii hovertank stealth regulator ii hovertank stealth","rhino fire support tank","rhino fire support tank flamer rhino fire support tank flamer","rhino fire support tank hagar rhino fire support tank hagar","rhino fire support tank mg rhino fire support tank mg","rhino fire support tank ml rhino fire support tank ml","rhino fire support tank royal rhino fire support tank royal","rhino fire support tank sl rhino fire support tank sl","rhino fire support tank ec rhino fire support tank ec","ripper infantry transport","ripper infantry transport erml ripper infantry transport erml","ripper infantry transport infantry ripper infantry transport infantry","ripper infantry transport light ppc ripper infantry transport light ppc","ripper infantry transport mg ripper infantry transport mg","ripper infantry transport royal ripper infantry transport royal","ripper infantry transport spl ripper infantry transport spl","rommel tank","rommel tank gauss rommel tank gauss","rommel tank sealed rommel tank sealed","rommel tank howitzer rommel tank howitzer","rommel tank howitzer prototype rommel tank howitzer prototype","rotunda scout vehicle rnd j 1 11 rotunda scout vehicle rnd j 1 11","rotunda scout vehicle rnd j 1 11 lrm rotunda scout vehicle rnd j 1 11 lrm","rotunda scout vehicle rnd j 1 11 rl rotunda scout vehicle rnd j 1 11 rl","rotunda scout vehicle rnd j 1 11 srm rotunda scout vehicle rnd j 1 11 srm","sabaku kaze heavy scout hover tank","saladin assault hover tank","saladin assault hover tank armor saladin assault hover tank armor","saladin assault hover tank clan cargo saladin assault hover tank clan cargo","saladin assault hover tank lb x saladin assault hover tank lb x","saladin assault hover tank ultra saladin assault hover tank ultra","saladin assault hover tank ifrit saladin assault hover tank ifrit","saladin mk ii hcv","saladin mk ii hcv bc3 saladin mk ii hcv bc3","saracen medium hover tank","saracen medium hover tank mrm saracen medium hover tank mrm","saracen mk ii hcv","saracen mk ii hcv bc3 saracen mk ii hcv bc3","savannah master hovercraft","savannah master hovercraft interdictor savannah master hovercraft interdictor","savannah master hovercraft reflective savannah master hovercraft reflective","savannah master hovercraft sl savannah master hovercraft sl","saxon apc","saxon apc hq saxon apc hq","saxon apc laser saxon apc laser","saxon apc mash saxon apc mash","scapha hovertank a scapha hovertank a","scapha hovertank b scapha hovertank b","scapha hovertank c scapha hovertank c","scapha hovertank d scapha hovertank d","scapha hovertank e scapha hovertank e","scapha hovertank f scapha hovertank f","scapha hovertank g scapha hovertank g","scapha hovertank h scapha hovertank h","scapha hovertank i scapha hovertank i","scapha hovertank j scapha hovertank j","scapha hovertank prime scapha hovertank prime","schildkrote line tank","schildkrote line tank hppc schildkrote line tank hppc","schildkrote line tank light gauss schildkrote line tank light gauss","schildkrote line tank plasma schildkrote line tank plasma","schiltron mobile fire support platform a schiltron mobile fire support platform a","schiltron mobile fire support platform b schiltron mobile fire support platform b","schiltron mobile fire support platform c schiltron mobile fire support platform c","schiltron mobile fire support platform d schiltron mobile fire support platform d","schiltron mobile fire support platform e schiltron mobile fire support platform e","schiltron mobile fire support platform f schiltron mobile fire support platform f","schiltron mobile fire support platform prime schiltron mobile fire support platform prime","schrek ac carrier","schrek ac carrier lothian schrek ac carrier lothian","schrek gauss carrier","schrek ii x ppc carrier","schrek ppc carrier","schrek ppc carrier anti infantry schrek ppc carrier anti infantry","schrek ppc carrier armor schrek ppc carrier armor","schrek ppc carrier c3m schrek ppc carrier c3m","schrek ppc carrier lb x schrek ppc carrier lb x","schrek ppc carrier xl schrek ppc carrier xl","scimitar medium hover tank","scimitar medium hover tank c3 scimitar medium hover tank c3","scimitar medium hover tank missile scimitar medium hover tank missile","scimitar medium hover tank tag scimitar medium hover tank tag","scimitar mk ii hcv","scimitar mk ii hcv 3136 upgrade scimitar mk ii hcv 3136 upgrade","scimitar mk ii hcv bc3 scimitar mk ii hcv bc3","scorpion light tank","scorpion light tank armor scorpion light tank armor","scorpion light tank hardened scorpion light tank hardened","scorpion light tank lac scorpion light tank lac","scorpion light tank lrm scorpion light tank lrm","scorpion light tank minesweeper prototype scorpion light tank minesweeper prototype","scorpion light tank minesweeper scorpion light tank minesweeper","scorpion light tank ml scorpion light tank ml","scorpion light tank mrm scorpion light tank mrm","scorpion light tank rac scorpion light tank rac","scorpion light tank rifle scorpion light tank rifle","scorpion light tank srm scorpion light tank srm","scorpion light tank thunderbolt scorpion light tank thunderbolt","scorpion light tank ultra scorpion light tank ultra","scorpion light tank c scorpion light tank c","sea hunter maritime tank","sekhmet assault vehicle","sekhmet assault vehicle streak sekhmet assault vehicle streak","shamash reconnaissance vehicle","shamash reconnaissance vehicle flamer shamash reconnaissance vehicle flamer","shamash reconnaissance vehicle interdictor shamash reconnaissance vehicle interdictor","shandra advanced scout vehicle","shandra advanced scout vehicle original shandra advanced scout vehicle original","sheriff infantry support tank","shillelagh missile tank","shillelagh missile tank original shillelagh missile tank original","shoden assault vehicle","shoden assault vehicle lb x shoden assault vehicle lb x","shoden assault vehicle streak shoden assault vehicle streak","shun transport vtol","shun transport vtol support shun transport vtol support","skadi swift attack vtol","skanda light tank","skanda light tank tsemp skanda light tank tsemp","skimmer","skulker wheeled scout tank","skulker wheeled scout tank c3m skulker wheeled scout tank c3m","skulker wheeled scout tank mg skulker wheeled scout tank mg","skulker wheeled scout tank srm skulker wheeled scout tank srm","skulker wheeled scout tank c skulker wheeled scout tank c","skulker wheeled scout tank mk ii","skulker wheeled scout tank x 5 skulker wheeled scout tank x 5","sleipnir apc tank","sleipnir apc tank srm sleipnir apc tank srm","sm tank destroyer sm1 sm tank destroyer sm1","sm tank destroyer sm1 telos sm tank destroyer sm1 telos","sm tank destroyer sm1a sm tank destroyer sm1a","sm tank destroyer sm1b sm tank destroyer sm1b","sm tank destroyer sm3 sm tank destroyer sm3","sm2 heavy artillery vehicle","sm2 heavy artillery vehicle ltc sm2 heavy artillery vehicle ltc","sm5 field commander prototype prime sm5 field commander prototype prime","sniper artillery","soarece superheavy mbt","sokar urban combat tank","sortek assault craft","sortek assault craft interdictor sortek assault craft interdictor","sprint scout helicopter","sprint scout helicopter c3 sprint scout helicopter c3","sprint scout helicopter c3i sprint scout helicopter c3i","sprint scout helicopter interdictor sprint scout helicopter interdictor","sprint scout helicopter laser sprint scout helicopter laser","sprint scout helicopter troop transport sprint scout helicopter troop transport","srm carrier","srm carrier 3054 upgrade srm carrier 3054 upgrade","srm carrier c3 srm carrier c3","srm carrier wob srm carrier wob","srm carrier c srm carrier c","striker light tank","striker light tank wet striker striker light tank wet striker","striker light tank 3053 upgrade striker light tank 3053 upgrade","striker light tank 3061 upgrade striker light tank 3061 upgrade","striker light tank ammo striker light tank ammo","striker light tank laser striker light tank laser","striker light tank lrm striker light tank lrm","striker light tank narc striker light tank narc","striker light tank sealed striker light tank sealed","striker light tank srm striker light tank srm","striker light tank stealth striker light tank stealth","strix stealth vtol","sturmfeur kalki cruise missile launcher","sturmfeur heavy tank","sturmfeur heavy tank assault sturmfeur heavy tank assault","sturmfeur heavy tank cell sturmfeur heavy tank cell","sturmfeur heavy tank heavy gauss sturmfeur heavy tank heavy gauss","sturmfeur heavy tank srm sturmfeur heavy tank srm","sturmfeur heavy tank steiner sturmfeur heavy tank steiner","sturmfeur heavy tank support gilmore sturmfeur heavy tank support gilmore","sturmfeur heavy tank wob sturmfeur heavy tank wob","stygian strike tank","stygian strike tank armor stygian strike tank armor","stygian strike tank wob stygian strike tank wob","svantovit infantry fighting vehicle","svantovit infantry fighting vehicle atm masada svantovit infantry fighting vehicle atm masada","svantovit infantry fighting vehicle original svantovit infantry fighting vehicle original","swift wind scout car","swift wind scout car ice cargo swift wind scout car ice cargo","swift wind scout car ice speed swift wind scout car ice speed","swift wind scout car ice swift wind scout car ice","tamerlane strike sled","tamerlane strike sled flamer tamerlane strike sled flamer","tamerlane strike sled rl tamerlane strike sled rl","tamerlane strike sled 2 tamerlane strike sled 2","tenmaku command trailer","teppo artillery vehicle","testudo siege tank","thang ta apc","thor artillery vehicle","thor artillery vehicle ac thor artillery vehicle ac","thor artillery vehicle c3i thor artillery vehicle c3i","thor artillery vehicle clan thor artillery vehicle clan","thumper artillery vehicle","thumper artillery vehicle angel thumper artillery vehicle angel","thumper artillery vehicle maxwell thumper artillery vehicle maxwell","thumper artillery vehicle tav 1 thumper artillery vehicle tav 1","thumper artillery vehicle tav 2 thumper artillery vehicle tav 2","tiger medium tank prototype tiger medium tank prototype","tiger medium tank t 12 tiger medium tank t 12","tokugawa heavy tank","tokugawa heavy tank c3 tokugawa heavy tank c3","tokugawa heavy tank mrm tokugawa heavy tank mrm","tokugawa heavy tank sd2 tokugawa heavy tank sd2","tokugawa heavy tank streak tokugawa heavy tank streak","tokugawa heavy tank tkg 150 tokugawa heavy tank tkg 150","tokugawa heavy tank tkg 151 tokugawa heavy tank tkg 151","tokugawa heavy tank yumi tokugawa heavy tank yumi","trajan assault infantry fighting vehicle","trajan assault infantry fighting vehicle ice trajan assault infantry fighting vehicle ice","transportable field repair unit ji 100 transportable field repair unit ji 100","tribune mobile tactical command hq","tufana hovercraft","tufana hovercraft inarc tufana hovercraft inarc","turhan urban combat vehicle","turhan urban combat vehicle c3 turhan urban combat vehicle c3","turhan urban combat vehicle original turhan urban combat vehicle original","typhoon urban assault vehicle","typhoon urban assault vehicle lb x typhoon urban assault vehicle lb x","typhoon urban assault vehicle rac typhoon urban assault vehicle rac","typhoon urban assault vehicle tracked typhoon urban assault vehicle tracked","tyr infantry support tank","tyr infantry support tank kurita tyr infantry support tank kurita","vali artillery vehicle","vargr apc tank","vargr apc tank lrm vargr apc tank lrm","vector combat support vtol","vector combat support vtol attack vector combat support vtol attack","vector combat support vtol ew vector combat support vtol ew","vector combat support vtol scout vector combat support vtol scout","vedette medium tank","vedette medium tank doris delight vedette medium tank doris delight","vedette medium tank ac 10 vedette medium tank ac 10","vedette medium tank ac2 vedette medium tank ac2","vedette medium tank armor vedette medium tank armor","vedette medium tank cell vedette medium tank cell","vedette medium tank lb x vedette medium tank lb x","vedette medium tank liao vedette medium tank liao","vedette medium tank light gauss vedette medium tank light gauss","vedette medium tank netc vedette medium tank netc","vedette medium tank rac vedette medium tank rac","vedette medium tank ultra vedette medium tank ultra","vedette medium tank v g7x vedette medium tank v g7x","vedette medium tank v7 vedette medium tank v7","vedette medium tank v9 vedette medium tank v9","vidar heavy defense tank","von luckner heavy tank royal von luckner heavy tank royal","von luckner heavy tank star league von luckner heavy tank star league","von luckner heavy tank vnl k100 von luckner heavy tank vnl k100","von luckner heavy tank vnl k65n von luckner heavy tank vnl k65n","von luckner heavy tank vnl k65w von luckner heavy tank vnl k65w","von luckner heavy tank vnl k70 von luckner heavy tank vnl k70","von luckner heavy tank vnl k75n von luckner heavy tank vnl k75n","von luckner heavy tank vnl k85n von luckner heavy tank vnl k85n","von luckner heavy tank vnl k90 von luckner heavy tank vnl k90","von luckner heavy tank vnl x71 yakuza von luckner heavy tank vnl x71 yakuza","warrior attack helicopter h 10 warrior attack helicopter h 10","warrior attack helicopter h 7 warrior attack helicopter h 7","warrior attack helicopter h 7a warrior attack helicopter h 7a","warrior attack helicopter h 7c warrior attack helicopter h 7c","warrior attack helicopter h 7f warrior attack helicopter h 7f","warrior attack helicopter h 8 warrior attack helicopter h 8","warrior attack helicopter h 9 warrior attack helicopter h 9","warrior attack helicopter hx 9 warrior attack helicopter hx 9","warrior stealth helicopter s 9 warrior stealth helicopter s 9","weapons troop carrier lrm weapons troop carrier lrm","wheeled scout","wheeled scout camera wheeled scout camera","wheeled scout sensors wheeled scout sensors","whirlwind scout hover tank","whirlwind scout hover tank aaa whirlwind scout hover tank aaa","whirlwind scout hover tank ifv whirlwind scout hover tank ifv","winston combat vehicle","winston combat vehicle lac winston combat vehicle lac","winston combat vehicle support winston combat vehicle support","winston combat vehicle tsemp winston combat vehicle tsemp","winston combat vehicle xxl winston combat vehicle xxl","winterhawk apc","yasha vtol","yasha vtol spectre yasha vtol spectre","yasha vtol interdictor yasha vtol interdictor","yellow jacket gunship","yellow jacket gunship ammo yellow jacket gunship ammo","yellow jacket gunship arrow iv yellow jacket gunship arrow iv","yellow jacket gunship ppc yellow jacket gunship ppc","yellow jacket gunship rac yellow jacket gunship rac","zahn heavy transport","zephyr hovertank","zephyr hovertank c3i zephyr hovertank c3i","zephyr hovertank lrm zephyr hovertank lrm","zephyr hovertank omnidrone a zephyr hovertank omnidrone a","zephyr hovertank omnidrone b zephyr hovertank omnidrone b","zephyr hovertank omnidrone c zephyr hovertank omnidrone c","zephyr hovertank omnidrone prime zephyr hovertank omnidrone prime","zephyr hovertank royal zephyr hovertank royal","zephyr hovertank srm2 zephyr hovertank srm2","zephyr hovertank ec zephyr hovertank ec","zephyros infantry support vehicle","zephyros infantry support vehicle dual turret zephyros infantry support vehicle dual turret","zhukov heavy tank","zhukov heavy tank lb x zhukov heavy tank lb x","zhukov heavy tank liao zhukov heavy tank liao","zhukov heavy tank wob zhukov heavy tank wob","zibler fast strike tank a zibler fast strike tank a","zibler fast strike tank b zibler fast strike tank b","zibler fast strike tank c zibler fast strike tank c","zibler fast strike tank d zibler fast strike tank d","zibler fast strike tank prime zibler fast strike tank prime","zorya light tank","zorya light tank ammo zorya light tank ammo","zorya light tank atm zorya light tank atm"],"sizes":[13.0,18.0,18.0,22.0,23.0,27.0,24.0,24.0,18.0,19.0,19.0,19.0,23.0,24.0,25.0,26.0,25.0,25.0,26.0,8.0,16.0,16.0,19.0,17.0,24.0,35.0,34.0,39.0,35.0,31.0,37.0,36.0,37.0,33.0,37.0,36.0,37.0,33.0,24.0,16.0,24.0,35.0,43.0,22.0,26.0,25.0,20.0,23.0,21.0,21.0,26.0,25.0,24.0,26.0,26.0,26.0,26.0,30.0,24.0,23.0,24.0,24.0,24.0,24.0,24.0,28.0,18.0,25.0,22.0,25.0,26.0,38.0,22.0,21.0,20.0,22.0,22.0,22.0,22.0,21.0,26.0,26.0,20.0,19.0,20.0,20.0,20.0,20.0,20.0,19.0,20.0,24.0,24.0,27.0,39.0,29.0,28.0,19.0,23.0,24.0,25.0,23.0,20.0,26.0,27.0,27.0,35.0,27.0,25.0,26.0,23.0,31.0,19.0,24.0,22.0,25.0,29.0,29.0,24.0,26.0,25.0,26.0,26.0,30.0,28.0,27.0,28.0,28.0,29.0,39.0,20.0,25.0,24.0,26.0,24.0,20.0,24.0,25.0,29.0,25.0,25.0,24.0,27.0,24.0,33.0,19.0,24.0,25.0,25.0,19.0,19.0,23.0,23.0,27.0,35.0,26.0,29.0,34.0,38.0,30.0,30.0,30.0,37.0,19.0,22.0,23.0,27.0,30.0,44.0,43.0,33.0,20.0,17.0,18.0,19.0,20.0,19.0,33.0,37.0,38.0,35.0,37.0,21.0,25.0,25.0,27.0,17.0,25.0,21.0,27.0,26.0,30.0,12.0,16.0,21.0,23.0,30.0,31.0,29.0,30.0,27.0,36.0,28.0,28.0,29.0,31.0,36.0,24.0,26.0,35.0,20.0,20.0,30.0,21.0,22.0,32.0,24.0,29.0,15.0,18.0,22.0,21.0,20.0,15.0,16.0,16.0,15.0,22.0,28.0,17.0,21.0,19.0,21.0,20.0,21.0,31.0,27.0,27.0,30.0,28.0,26.0,33.0,28.0,25.0,29.0,36.0,27.0,18.0,24.0,24.0,11.0,15.0,18.0,15.0,17.0,16.0,27.0,23.0,22.0,30.0,23.0,29.0,27.0,27.0,35.0,16.0,33.0,24.0,25.0,39.0,31.0,25.0,30.0,29.0,32.0,29.0,32.0,27.0,29.0,20.0,30.0,26.0,20.0,23.0,27.0,17.0,25.0,28.0,20.0,21.0,21.0,21.0,21.0,20.0,24.0,12.0,12.0,12.0,12.0,16.0,18.0,21.0,24.0,27.0,41.0,30.0,14.0,20.0,18.0,21.0,17.0,18.0,32.0,36.0,43.0,16.0,22.0,28.0,20.0,30.0,23.0,26.0,27.0,25.0,18.0,21.0,21.0,21.0,22.0,23.0,27.0,24.0,23.0,34.0,39.0,38.0,27.0,21.0,24.0,24.0,24.0,24.0,24.0,24.0,25.0,24.0,27.0,25.0,24.0,24.0,27.0,28.0,18.0,12.0,25.0,30.0,24.0,19.0,22.0,33.0,46.0,42.0,44.0,34.0,35.0,32.0,38.0,19.0,23.0,21.0,23.0,21.0,14.0,17.0,24.0,24.0,28.0,19.0,24.0,16.0,20.0,15.0,18.0,23.0,18.0,23.0,17.0,15.0,19.0,20.0,27.0,31.0,27.0,31.0,36.0,10.0,22.0,26.0,38.0,34.0,32.0,36.0,37.0,32.0,30.0,29.0,32.0,29.0,32.0,38.0,22.0,26.0,30.0,32.0,21.0,18.0,30.0,24.0,30.0,21.0,24.0,28.0,34.0,15.0,19.0,18.0,26.0,19.0,18.0,29.0,18.0,19.0,18.0,22.0,21.0,22.0,26.0,18.0,22.0,21.0,22.0,21.0,31.0,31.0,31.0,31.0,35.0,21.0,24.0,24.0,24.0,24.0,28.0,27.0,31.0,32.0,32.0,32.0,31.0,33.0,32.0,31.0,29.0,21.0,23.0,33.0,22.0,32.0,35.0,36.0,39.0,26.0,34.0,39.0,31.0,37.0,31.0,31.0,29.0,31.0,31.0,27.0,30.0,23.0,26.0,31.0,37.0,40.0,24.0,30.0,31.0,33.0,29.0,25.0,30.0,34.0,31.0,29.0,32.0,28.0,29.0,28.0,27.0,33.0,14.0,31.0,44.0,33.0,38.0,40.0,24.0,26.0,27.0,30.0,36.0,16.0,20.0,24.0,24.0,30.0,21.0,31.0,22.0,22.0,22.0,26.0,22.0,23.0,26.0,18.0,18.0,20.0,32.0,23.0,30.0,31.0,23.0,34.0,30.0,20.0,13.0,18.0,21.0,16.0,19.0,16.0,17.0,11.0,15.0,15.0,28.0,35.0,19.0,22.0,17.0,17.0,26.0,24.0,36.0,29.0,13.0,18.0,26.0,28.0,33.0,33.0,31.0,34.0,33.0,12.0,25.0,16.0,13.0,21.0,14.0,17.0,18.0,30.0,35.0,31.0,34.0,35.0,34.0,11.0,24.0,25.0,25.0,25.0,25.0,29.0,21.0,33.0,34.0,25.0,25.0,25.0,26.0,25.0,24.0,24.0,24.0,25.0,30.0,27.0,29.0,37.0,14.0,15.0,15.0,21.0,24.0,25.0,24.0,14.0,16.0,21.0,18.0,27.0,18.0,21.0,24.0,25.0,31.0,20.0,29.0,42.0,14.0,27.0,40.0,40.0,46.0,44.0,31.0,31.0,32.0,32.0,37.0,32.0,32.0,21.0,25.0,40.0,24.0,26.0,18.0,20.0,33.0,47.0,51.0,35.0,50.0,19.0,19.0,19.0,24.0,20.0,27.0,28.0,24.0,23.0,24.0,32.0,33.0,32.0,12.0,12.0,12.0,32.0,37.0,36.0,38.0,29.0,33.0,35.0,15.0,12.0,20.0,33.0,26.0,20.0,33.0,25.0,26.0,20.0,24.0,25.0,20.0,26.0,24.0,28.0,26.0,25.0,16.0,23.0,17.0,30.0,32.0,24.0,29.0,21.0,21.0,24.0,19.0,35.0,20.0,21.0,21.0,21.0,21.0,25.0,15.0,18.0,22.0,19.0,23.0,22.0,24.0,26.0,28.0,32.0,26.0,29.0,30.0,33.0,23.0,42.0,20.0,33.0,26.0,31.0,39.0,40.0,30.0,35.0,30.0,29.0,20.0,24.0,23.0,25.0,25.0,32.0,24.0,26.0,22.0,12.0,15.0,18.0,18.0,15.0,25.0,38.0,28.0,33.0,29.0,29.0,31.0,32.0,33.0,32.0,27.0,22.0,28.0,29.0,21.0,30.0,21.0,25.0,26.0,26.0,28.0,27.0,33.0,17.0,26.0,22.0,18.0,22.0,17.0,27.0,33.0,34.0,34.0,14.0,25.0,16.0,19.0,26.0,17.0,25.0,23.0,25.0,22.0,25.0,39.0,24.0,30.0,33.0,30.0,43.0,34.0,34.0,37.0,39.0,46.0,38.0,34.0,25.0,26.0,25.0,25.0,36.0,33.0,21.0,21.0,25.0,35.0,47.0,38.0,35.0,36.0,21.0,20.0,25.0,29.0,23.0,23.0,26.0,31.0,24.0,30.0,30.0,27.0,27.0,29.0,26.0,27.0,26.0,31.0,26.0,36.0,29.0,31.0,30.0,12.0,18.0,19.0,21.0,31.0,31.0,35.0,33.0,34.0,33.0,27.0,32.0,37.0,32.0,32.0,33.0,18.0,22.0,26.0,29.0,18.0,22.0,27.0,38.0,38.0,29.0,10.0,13.0,16.0,15.0,19.0,19.0,19.0,19.0,19.0,19.0,19.0,18.0,19.0,19.0,23.0,22.0,27.0,32.0,29.0,40.0,40.0,40.0,40.0,40.0,39.0,43.0,18.0,26.0,21.0,24.0,19.0,32.0,25.0,22.0,24.0,22.0,27.0,30.0,34.0,29.0,19.0,32.0,23.0,20.0,26.0,29.0,23.0,23.0,42.0,32.0,23.0,24.0,24.0,26.0,23.0,31.0,26.0,22.0,25.0,24.0,30.0,31.0,38.0,43.0,30.0,39.0,29.0,24.0,33.0,23.0,28.0,29.0,20.0,24.0,23.0,18.0,23.0,8.0,26.0,30.0,29.0,29.0,28.0,32.0,30.0,18.0,21.0,20.0,25.0,21.0,21.0,20.0,28.0,32.0,34.0,17.0,22.0,24.0,21.0,33.0,23.0,26.0,27.0,33.0,28.0,37.0,12.0,25.0,14.0,16.0,13.0,19.0,23.0,32.0,32.0,24.0,23.0,22.0,24.0,25.0,22.0,25.0,17.0,40.0,21.0,29.0,26.0,27.0,24.0,27.0,36.0,25.0,18.0,24.0,22.0,35.0,46.0,44.0,20.0,27.0,29.0,24.0,21.0,26.0,24.0,23.0,23.0,24.0,18.0,12.0,23.0,25.0,27.0,28.0,26.0,31.0,34.0,31.0,31.0,27.0,21.0,19.0,22.0,23.0,23.0,26.0,26.0,26.0,24.0,41.0,44.0,39.0,34.0,18.0,24.0,27.0,29.0,36.0,30.0,35.0,34.0,37.0,25.0,32.0,22.0,15.0,19.0,26.0,33.0,29.0,31.0,20.0,33.0,26.0,24.0,26.0,25.0,25.0,25.0,32.0,25.0,24.0,26.0,25.0,22.0,22.0,25.0,29.0,34.0,31.0,31.0,31.0,30.0,31.0,31.0,30.0,37.0,30.0,29.0,30.0,30.0,30.0,29.0,29.0,30.0,30.0,26.0,14.0,21.0,21.0,27.0,31.0,31.0,23.0,27.0,31.0,29.0,27.0,15.0,11.0,19.0,23.0,22.0,27.0,30.0,26.0,26.0,21.0,17.0,21.0,21.0,29.0,29.0,29.0,33.0,23.0,22.0,20.0,34.0,46.0,18.0,23.0,23.0,22.0,26.0,26.0,26.0,26.0,30.0,17.0,22.0,21.0],"postings":{"  2":[0,1,49,133,255,278,345,346,347,348,488,489,490,491,492,651,652,661,662,682,1015,1028],"  a":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,58,70,71,72,82,103,119,130,131,132,133,134,136,143,144,152,153,154,155,156,157,158,159,160,161,162,177,178,179,180,181,228,235,248,260,261,262,268,269,270,283,289,295,304,307,312,313,314,315,316,317,318,336,353,354,361,374,377,378,391,417,423,424,425,426,427,432,433,434,435,437,438,439,440,441,442,448,453,454,455,456,457,458,459,460,461,462,467,468,469,470,472,474,475,489,508,515,516,520,521,522,528,533,534,539,557,558,563,564,565,566,567,568,574,575,576,584,585,586,587,588,589,601,602,603,604,605,609,610,611,612,614,615,618,619,620,621,622,623,629,644,645,646,647,648,649,650,661,662,663,678,680,683,687,691,703,704,705,706,707,708,709,717,718,719,720,721,722,723,725,726,727,728,729,730,731,732,733,734,735,737,761,762,763,767,772,774,776,777,789,792,793,807,808,809,810,813,816,817,818,819,820,821,823,824,854,855,856,857,858,859,870,871,872,873,874,889,896,897,901,902,914,929,930,934,935,939,940,941,944,955,956,962,963,965,968,969,985,995,1003,1006,1017,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1039,1040,1048,1049,1050,1051,1054,1055,1056,1058,1063,1064,1065,1087,1088,1089,1090,1091,1092,1093,1094,1101,1108,1113,1114,1121,1134,1140,1141],"  c":[0,1,10,25,26,27,28,29,30,31,32,33,34,35,36,37,39,43,44,45,50,51,52,53,54,55,56,57,60,72,73,74,75,76,77,78,79,80,84,95,98,121,124,137,138,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,229,230,231,232,233,234,236,237,255,266,267,269,277,278,291,297,301,305,313,315,316,317,318,324,325,326,327,328,329,330,331,332,337,388,401,413,428,429,430,431,436,444,450,455,462,464,465,466,476,494,495,505,506,507,508,509,510,511,512,513,514,519,524,541,555,556,560,561,562,568,569,570,571,572,580,586,593,594,625,632,633,634,650,667,668,669,670,674,675,696,706,729,730,731,738,739,752,762,768,794,811,812,856,876,891,896,897,898,899,900,901,902,903,904,905,907,927,949,952,964,967,968,969,971,972,976,977,978,979,980,993,996,1008,1009,1010,1011,1016,1022,1023,1032,1042,1045,1046,1047,1057,1058,1059,1060,1066,1096,1098,1103,1104,1105,1106,1107,1119,1123,1136]," 2 ":[0,1,49,133,255,278,682,1015,1028]," ac":[0,1,42,136,283,454,528,533,604,737,767,896,897,1021,1063,1064]," ca":[0,1,25,26,27,28,29,30,31,32,33,34,35,36,37,39,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,178,229,230,231,232,233,234,305,315,316,317,318,428,429,430,431,436,464,465,466,505,506,507,508,509,510,511,512,513,514,555,556,560,561,562,569,570,571,572,674,675,762,856,896,897,898,899,900,901,902,903,904,905,976,977,978,979,980,1008,1009,1010,1011,1096,1098],"ac ":[0,1,42,66,67,68,69,200,283,499,528,533,542,549,597,604,688,733,734,772,825,827,896,897,916,922,1021,1050,1063,1071,1104,1116],"arr":[0,1,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,177,178,179,180,181,228,235,351,361,410,411,412,428,429,430,431,436,464,465,505,506,507,508,509,510,511,512,513,514,560,561,562,569,570,571,572,674,675,774,789,824,896,897,898,899,900,901,902,903,904,905,976,977,978,979,980,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1114],"car":[0,1,25,26,27,28,29,30,31,32,33,34,35,36,37,39,150,151,152,153,154,163,164,165,166,229,230,231,232,233,234,305,315,316,317,318,428,429,430,431,436,464,465,505,506,507,508,509,510,511,512,513,514,555,556,560,561,562,569,570,571,572,674,675,762,856,896,897,898,899,900,901,902,903,904,905,976,977,978,979,980,1008,1009,1010,1011,1096],"er ":[0,1,25,26,27,28,29,30,31,32,33,34,35,36,37,39,40,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,69,70,94,97,98,99,100,101,105,112,113,114,115,116,117,118,149,155,156,157,158,159,160,161,162,168,169,171,172,173,174,175,176,182,183,184,185,186,187,195,196,197,198,199,200,201,202,203,204,205,206,207,210,212,214,215,216,217,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,257,266,268,269,270,271,272,273,274,275,276,277,278,279,280,281,284,286,300,316,319,355,372,373,377,378,379,380,381,382,383,384,385,386,387,388,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,414,421,423,424,425,426,427,428,429,430,431,436,453,454,455,456,457,458,459,460,461,462,464,465,471,472,473,474,475,476,477,478,479,480,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,519,555,556,559,560,561,562,569,570,571,572,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,647,648,650,670,673,674,675,676,677,678,693,696,723,750,751,752,753,754,755,756,757,758,759,760,795,796,797,798,799,800,801,802,803,804,805,806,816,817,818,819,820,830,837,838,839,840,841,842,843,847,848,853,854,855,856,857,858,859,862,863,866,867,868,869,872,896,897,898,899,900,901,902,903,904,905,906,907,908,909,918,919,928,932,947,948,949,950,951,952,953,954,957,958,959,960,961,964,965,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,993,999,1013,1016,1024,1025,1026,1027,1028,1029,1030,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1100,1101,1102,1134,1135,1136,1137,1138],"ier":[0,1,25,26,27,28,29,30,31,32,33,34,35,36,37,39,182,183,184,185,257,387,388,410,411,412,428,429,430,431,436,464,465,505,506,507,508,509,510,511,512,513,514,560,561,562,569,570,571,572,618,619,620,621,622,623,674,675,896,897,898,899,900,901,902,903,904,905,976,977,978,979,980,1096],"rie":[0,1,25,26,27,28,29,30,31,32,33,34,35,36,37,39,257,333,334,335,410,411,412,428,429,430,431,436,464,465,505,506,507,508,509,510,511,512,513,514,560,561,562,569,570,571,572,674,675,896,897,898,899,900,901,902,903,904,905,976,977,978,979,980,1096],"rri":[0,1,25,26,27,28,29,30,31,32,33,34,35,36,37,39,410,411,412,428,429,430,431,436,464,465,505,506,507,508,509,510,511,512,513,514,560,561,562,569,570,571,572,671,672,673,674,675,896,897,898,899,900,901,902,903,904,905,976,977,978,979,980,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096],"  l":[1,25,30,34,68,99,108,113,132,140,141,154,159,168,169,182,183,184,185,200,201,202,203,206,212,256,262,263,264,287,302,303,304,305,308,337,338,339,340,341,342,343,344,345,346,347,348,349,350,362,368,379,393,396,398,404,405,412,414,424,428,429,433,438,456,457,458,469,471,472,473,474,475,476,477,478,479,480,493,494,495,496,497,498,499,500,501,502,503,519,522,523,524,525,526,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,579,580,581,582,596,601,602,605,615,653,654,656,657,659,660,661,662,663,670,673,688,689,696,698,699,712,713,714,715,716,719,722,731,732,741,742,769,786,787,840,850,857,872,885,886,887,888,897,904,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,940,945,946,963,974,981,982,983,984,985,986,987,988,989,990,991,993,1049,1056,1067,1068,1069,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1096,1104,1120,1131,1132,1139,1140,1141],"  x":[1,45,47,114,140,170,171,172,173,174,175,176,246,287,288,323,371,373,457,503,529,553,582,596,598,612,615,703,735,749,759,760,769,786,857,899,904,905,940,954,1049,1067,1086,1107,1131]," lb":[1,140,287,457,596,615,769,786,857,904,940,1049,1067,1131]," x ":[1,140,172,246,287,323,371,457,503,529,596,615,703,759,760,769,786,857,899,904,940,954,1049,1067,1131],"lb ":[1,140,287,457,596,615,769,786,857,904,940,1049,1067,1131],"  s":[2,3,7,20,27,28,32,36,40,66,67,68,69,71,93,94,95,97,98,99,100,101,111,117,118,119,120,121,122,123,124,125,126,127,148,154,160,163,164,165,166,167,168,169,170,181,185,187,214,215,216,217,227,228,229,230,231,232,233,234,256,257,259,265,266,269,274,275,276,279,280,281,285,286,287,288,302,303,304,305,311,351,354,359,360,361,362,363,364,365,366,370,381,382,383,389,390,391,392,393,394,408,421,426,427,435,440,448,449,450,451,452,459,460,461,464,465,470,471,472,473,474,475,476,477,478,479,480,481,482,485,486,487,507,508,509,513,521,535,537,544,545,546,561,573,574,575,576,577,578,579,580,581,582,616,617,636,637,638,641,647,648,671,672,673,683,692,693,701,716,724,746,750,751,752,753,754,755,756,757,758,759,760,764,765,766,767,768,769,770,771,772,780,781,782,791,794,802,803,804,805,828,829,830,831,832,833,834,835,836,843,846,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1018,1034,1035,1052,1053,1057,1058,1059,1060,1078,1095,1097,1098,1099,1100,1101,1102,1105,1110,1126,1128,1129,1134,1135,1136,1137,1138],"  v":[2,3,4,5,17,18,38,41,42,43,44,45,66,67,68,69,96,143,144,188,189,190,191,192,193,194,227,228,257,263,264,282,283,284,302,303,304,305,312,313,314,318,352,359,360,361,362,363,364,365,366,372,373,392,393,394,413,416,422,429,520,521,540,541,542,543,544,545,546,550,551,573,577,578,601,602,603,604,605,609,610,611,612,616,617,643,646,647,648,649,650,651,652,667,668,669,670,671,672,673,686,687,688,689,690,704,705,706,707,708,709,725,726,727,761,762,763,766,767,768,769,770,771,772,776,777,798,799,800,801,802,803,804,805,806,816,817,818,819,820,821,849,850,851,852,929,930,931,932,933,934,935,939,940,941,942,943,944,962,963,992,1005,1006,1007,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1039,1040,1045,1046,1047,1048,1049,1050,1051,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1103,1104,1105,1106,1107,1109,1110,1111,1128,1129]," ae":[2,3,4,5]," st":[2,3,20,66,67,68,69,93,94,95,119,120,121,122,123,124,125,126,127,276,281,285,286,287,288,383,470,507,508,509,535,537,782,791,794,828,930,941,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1012,1013,1014,1015,1035,1078,1095,1134,1135,1136,1137,1138]," vt":[2,3,66,67,68,69,188,189,190,191,263,264,302,303,304,305,352,372,373,520,521,540,541,542,543,544,545,546,601,602,616,617,686,687,688,689,690,704,705,706,707,708,709,761,762,763,776,777,821,942,943,944,992,1057,1058,1059,1060,1109,1110,1111],"aer":[2,3],"ero":[2,3],"ike":[2,3,66,67,68,69,93,94,95,285,286,287,288,766,767,768,769,770,771,772,981,982,983,984,985,986,987,988,989,990,991,1002,1003,1004,1012,1013,1014,1015,1134,1135,1136,1137,1138],"ke ":[2,3,66,67,68,69,93,94,95,145,146,147,148,285,286,287,288,664,665,666,766,767,768,769,770,771,772,1002,1003,1004,1012,1013,1014,1015,1134,1135,1136,1137,1138],"ol ":[2,3,66,67,68,69,188,189,190,191,263,264,267,302,303,304,305,352,372,373,520,521,540,541,542,543,544,545,546,547,548,549,601,602,616,617,686,687,688,689,690,704,705,706,707,708,709,761,762,763,776,777,821,942,943,944,992,1057,1058,1059,1060,1109,1110,1111],"on ":[2,3,6,104,196,197,199,247,248,249,250,251,252,253,254,255,256,270,271,272,273,274,275,276,277,278,300,337,338,339,340,341,342,343,344,345,346,347,348,349,350,465,490,551,621,646,647,648,649,650,679,680,681,682,683,697,745,746,747,748,749,804,870,871,872,873,889,890,891,892,893,894,895,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,1048,1049,1050,1051,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1103,1104,1105,1106,1107],"rik":[2,3,66,67,68,69,93,94,95,285,286,287,288,981,982,983,984,985,986,987,988,989,990,991,1002,1003,1004,1012,1013,1014,1015,1134,1135,1136,1137,1138],"ron":[2,3,267,383,464,465,889,890,891,892,893,894,895,1121,1122,1123,1124],"str":[2,3,66,67,68,69,93,94,95,257,276,281,285,286,287,288,383,470,507,508,509,540,541,542,543,544,545,546,782,794,795,796,797,930,941,957,958,959,960,961,981,982,983,984,985,986,987,988,989,990,991,992,1002,1003,1004,1012,1013,1014,1015,1035,1134,1135,1136,1137,1138],"tol":[2,3,66,67,68,69,167,168,169,170,188,189,190,191,263,264,302,303,304,305,352,372,373,520,521,540,541,542,543,544,545,546,601,602,616,617,686,687,688,689,690,704,705,706,707,708,709,761,762,763,776,777,821,942,943,944,992,1057,1058,1059,1060,1109,1110,1111],"tri":[2,3,66,67,68,69,93,94,95,257,285,286,287,288,981,982,983,984,985,986,987,988,989,990,991,992,1002,1003,1004,1012,1013,1014,1015,1042,1134,1135,1136,1137,1138],"vto":[2,3,66,67,68,69,188,189,190,191,263,264,302,303,304,305,352,372,373,520,521,540,541,542,543,544,545,546,601,602,616,617,686,687,688,689,690,704,705,706,707,708,709,761,762,763,776,777,821,942,943,944,992,1057,1058,1059,1060,1109,1110,1111],"  b":[3,9,22,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,156,168,183,230,290,296,375,422,443,449,484,517,518,523,535,536,585,591,619,620,630,631,647,685,705,814,861,865,875,890,912,1122,1135]," ba":[3,22,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,156,183,230,422,484,535,536,591,619,620,630,631],"ap ":[3,183,230],"bap":[3,183,230],"  m":[4,5,13,14,15,16,17,18,23,24,26,31,35,48,49,91,94,128,129,135,136,137,138,139,140,141,142,171,172,173,174,175,176,177,178,179,180,181,184,190,208,209,219,240,242,244,247,248,249,260,261,262,263,264,273,295,296,297,298,299,309,350,355,356,357,358,367,368,369,370,371,380,387,388,395,397,398,399,400,401,402,403,404,405,406,407,408,409,413,415,416,417,418,419,420,421,425,430,434,439,442,443,444,445,446,501,505,506,507,508,509,510,511,512,513,514,516,517,518,519,527,528,542,543,547,548,549,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,700,715,717,753,754,755,770,779,780,781,782,794,798,799,800,801,802,803,804,805,806,811,812,813,814,815,818,832,833,841,860,861,862,863,864,865,866,867,868,869,873,889,890,891,892,893,894,895,906,907,908,909,910,911,912,918,919,920,921,928,937,938,950,953,966,993,1006,1026,1029,1030,1033,1042,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075]," aa":[4,5,378,391,468,645,726,727,1101]," me":[4,5,23,24,135,136,137,138,139,140,141,142,247,248,249,355,356,357,358,367,368,369,370,371,413,517,518,527,528,542,642,643,679,680,681,682,779,780,781,782,812,813,814,815,862,863,906,907,908,909,1029,1030,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075]," ve":[4,5,38,41,42,43,44,45,96,143,144,194,227,228,257,282,283,284,312,313,314,359,360,361,362,363,364,365,366,392,393,394,413,416,422,550,551,573,577,578,603,604,605,609,610,611,612,646,647,648,649,650,651,652,667,668,669,670,671,672,673,725,726,727,766,767,768,769,770,771,772,798,799,800,801,802,803,804,805,806,816,817,818,819,820,849,850,851,852,929,930,931,932,933,934,935,939,940,941,962,963,1005,1006,1007,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1039,1040,1045,1046,1047,1048,1049,1050,1051,1054,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1103,1104,1105,1106,1107,1128,1129],"aa ":[4,5,378,391,468,645,726,727,1101],"aes":[4,5,447,448,449,450,451,452,811],"cle":[4,5,38,41,42,43,44,45,96,143,144,194,227,228,257,282,283,284,312,313,314,359,360,361,362,363,364,365,366,392,393,394,413,422,550,551,573,577,578,603,604,605,609,610,611,612,646,647,648,649,650,651,652,667,668,669,670,671,672,673,725,726,727,766,767,768,769,770,771,772,798,799,800,801,802,803,804,805,806,816,817,818,819,820,849,850,851,852,929,930,931,932,933,934,935,939,940,941,962,963,1005,1006,1007,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1039,1040,1045,1046,1047,1048,1049,1050,1051,1054,1103,1104,1105,1106,1107,1128,1129],"diu":[4,5,23,24,135,136,137,138,139,140,141,142,247,248,249,355,356,357,358,367,368,369,370,371,517,518,527,528,679,680,681,682,779,780,781,782,862,863,906,907,908,909,1029,1030,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075],"edi":[4,5,23,24,135,136,137,138,139,140,141,142,247,248,249,355,356,357,358,367,368,369,370,371,517,518,527,528,622,679,680,681,682,779,780,781,782,862,863,906,907,908,909,1029,1030,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075],"ehi":[4,5,38,41,42,43,44,45,96,143,144,194,227,228,257,282,283,284,312,313,314,359,360,361,362,363,364,365,366,392,393,394,413,422,550,551,573,577,578,603,604,605,609,610,611,612,646,647,648,649,650,651,652,667,668,669,670,671,672,673,725,726,727,766,767,768,769,770,771,772,798,799,800,801,802,803,804,805,806,816,817,818,819,820,849,850,851,852,929,930,931,932,933,934,935,939,940,941,962,963,1005,1006,1007,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1039,1040,1045,1046,1047,1048,1049,1050,1051,1054,1103,1104,1105,1106,1107,1128,1129],"esi":[4,5],"hic":[4,5,38,41,42,43,44,45,96,143,144,194,227,228,257,282,283,284,312,313,314,359,360,361,362,363,364,365,366,392,393,394,413,422,550,551,573,577,578,603,604,605,609,610,611,612,646,647,648,649,650,651,652,667,668,669,670,671,672,673,725,726,727,766,767,768,769,770,771,772,798,799,800,801,802,803,804,805,806,816,817,818,819,820,849,850,851,852,929,930,931,932,933,934,935,939,940,941,962,963,1005,1006,1007,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1039,1040,1045,1046,1047,1048,1049,1050,1051,1054,1103,1104,1105,1106,1107,1128,1129],"icl":[4,5,38,41,42,43,44,45,96,143,144,194,227,228,257,282,283,284,312,313,314,359,360,361,362,363,364,365,366,392,393,394,413,422,550,551,573,577,578,603,604,605,609,610,611,612,646,647,648,649,650,651,652,667,668,669,670,671,672,673,725,726,727,766,767,768,769,770,771,772,798,799,800,801,802,803,804,805,806,816,817,818,819,820,849,850,851,852,929,930,931,932,933,934,935,939,940,941,962,963,1005,1006,1007,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1039,1040,1045,1046,1047,1048,1049,1050,1051,1054,1103,1104,1105,1106,1107,1128,1129],"ir ":[4,5,301,380,728,729,730,731,732,733,734,735,955,956,1041],"ium":[4,5,23,24,135,136,137,138,139,140,141,142,247,248,249,355,356,357,358,367,368,369,370,371,517,518,527,528,679,680,681,682,779,780,781,782,862,863,906,907,908,909,1029,1030,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075],"le ":[4,5,38,41,42,43,44,45,96,97,98,99,100,101,128,129,143,144,177,178,179,180,181,194,227,228,249,257,282,283,284,312,313,314,359,360,361,362,363,364,365,366,392,393,394,397,398,399,400,401,402,403,404,405,406,407,408,409,413,422,505,506,507,508,509,510,511,512,513,514,519,550,551,573,577,578,603,604,605,609,610,611,612,646,647,648,649,650,651,652,655,656,657,658,659,660,661,662,663,667,668,669,670,671,672,673,717,725,726,727,753,766,767,768,769,770,771,772,794,798,799,800,801,802,803,804,805,806,811,816,817,818,819,820,849,850,851,852,889,890,891,892,893,894,895,908,923,929,930,931,932,933,934,935,937,938,939,940,941,962,963,993,1005,1006,1007,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1039,1040,1041,1042,1045,1046,1047,1048,1049,1050,1051,1054,1103,1104,1105,1106,1107,1128,1129],"med":[4,5,23,24,135,136,137,138,139,140,141,142,247,248,249,355,356,357,358,367,368,369,370,371,517,518,527,528,542,622,679,680,681,682,758,779,780,781,782,862,863,906,907,908,909,1029,1030,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075],"sir":[4,5],"um ":[4,5,23,24,135,136,137,138,139,140,141,142,247,248,249,319,320,321,322,323,355,356,357,358,367,368,369,370,371,517,518,527,528,679,680,681,682,773,774,775,779,780,781,782,862,863,906,907,908,909,1029,1030,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075],"veh":[4,5,38,41,42,43,44,45,96,143,144,194,227,228,257,282,283,284,312,313,314,359,360,361,362,363,364,365,366,392,393,394,413,422,550,551,573,577,578,603,604,605,609,610,611,612,646,647,648,649,650,651,652,667,668,669,670,671,672,673,725,726,727,766,767,768,769,770,771,772,798,799,800,801,802,803,804,805,806,816,817,818,819,820,849,850,851,852,929,930,931,932,933,934,935,939,940,941,962,963,1005,1006,1007,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1039,1040,1045,1046,1047,1048,1049,1050,1051,1054,1103,1104,1105,1106,1107,1128,1129],"  h":[5,13,14,15,16,17,18,25,26,27,28,29,44,46,47,48,49,56,67,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,128,129,131,146,149,153,155,156,157,158,159,160,161,162,186,187,195,196,197,198,199,200,201,202,203,204,205,206,207,210,213,214,215,216,217,223,224,225,226,235,236,237,238,239,240,241,242,243,244,245,246,251,252,258,268,269,270,271,272,273,274,275,276,277,278,279,280,281,300,319,320,321,322,323,333,334,335,352,355,356,359,360,361,362,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,485,486,487,493,494,495,496,497,498,499,500,501,502,503,527,528,537,559,563,564,565,566,567,568,574,575,576,590,591,592,593,594,595,596,597,598,599,600,611,618,619,620,621,622,623,624,625,627,628,629,630,631,632,633,634,635,636,637,638,642,643,655,656,657,658,659,660,669,672,676,677,678,684,685,694,695,696,697,698,699,700,701,702,703,710,711,718,719,736,737,738,739,740,741,742,743,744,750,751,752,753,754,755,756,757,758,759,760,773,774,775,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,811,822,823,824,825,826,827,828,831,847,848,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,871,874,875,876,877,878,879,880,881,882,883,884,886,906,907,908,909,910,911,912,915,928,962,963,970,971,972,973,974,975,994,995,996,997,998,999,1000,1001,1031,1032,1033,1034,1035,1036,1037,1038,1042,1043,1044,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1100,1101,1102,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1130,1131,1132,1133]," ha":[5,44,129,153,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,611,672,711,831,915],"ag ":[5,44,101,153,161,165,502,611,649,672,711,909],"hag":[5,44,153,611,672,711,831],"  t":[6,7,8,9,10,11,12,13,14,15,16,17,18,21,22,23,24,30,31,32,33,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,70,71,93,94,95,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,129,130,131,132,133,134,135,136,137,138,139,140,141,142,145,146,147,148,149,150,151,152,153,154,161,165,167,168,169,170,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,258,259,260,261,262,265,266,267,271,272,273,274,275,276,277,278,285,286,287,288,289,290,291,292,293,294,300,306,307,308,309,310,311,314,319,324,325,326,327,328,329,330,331,332,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,355,357,358,367,368,369,370,371,377,378,379,380,381,382,383,384,385,386,389,390,391,409,410,411,412,414,418,426,432,433,434,435,442,443,444,445,446,447,448,449,450,451,452,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,505,506,514,517,518,522,523,524,525,526,529,531,532,533,534,535,536,537,538,539,552,553,554,557,558,559,562,574,575,576,579,580,581,582,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,624,625,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,645,646,647,648,649,650,653,654,661,662,663,676,677,678,679,680,681,682,684,685,691,692,693,694,695,696,697,698,699,700,701,702,703,710,711,713,714,715,716,717,718,719,720,721,722,723,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,764,765,773,774,775,778,783,784,785,786,787,788,789,790,791,792,793,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,845,846,847,848,853,854,855,856,857,858,859,862,863,885,886,887,888,906,907,908,909,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,936,937,938,942,943,945,946,948,949,950,951,952,953,954,955,956,957,958,959,960,961,967,975,981,982,983,984,985,986,987,988,989,990,991,994,995,996,997,998,999,1000,1001,1002,1003,1004,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1055,1056,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1096,1100,1101,1102,1106,1117,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141]," ai":[6,691,728,729,730,731,732,733,734,735]," as":[6,7,8,9,10,11,12,38,40,41,42,130,131,132,133,134,143,144,152,153,154,260,261,262,268,269,270,312,313,314,336,453,454,455,456,457,458,459,460,461,462,467,468,469,470,472,539,557,558,609,610,611,612,703,725,772,807,808,809,810,854,855,856,857,858,859,929,930,939,940,941,968,969,995,1039,1040,1048,1049,1050,1051]," tr":[6,21,22,30,31,32,33,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,70,115,116,117,118,129,150,151,188,189,190,191,210,211,212,213,306,307,308,309,310,311,351,377,378,379,380,381,382,383,384,385,386,432,433,434,435,483,484,488,489,490,491,492,531,532,533,534,535,536,537,538,559,574,575,576,624,625,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,812,837,838,839,840,841,842,843,942,943,975,1016,1039,1040,1041,1042,1051,1096,1117],"ait":[6],"ans":[6,21,22,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,115,116,117,150,151,188,189,190,191,213,351,395,483,484,488,489,490,491,492,531,532,533,534,535,536,537,538,559,624,625,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,837,838,839,840,841,842,843,942,943,975,1041,1117],"ass":[6,7,8,9,10,11,12,38,40,41,42,130,131,132,133,134,143,144,152,153,154,260,261,262,268,269,270,312,313,314,336,396,397,398,399,400,401,402,403,404,405,406,407,408,409,453,454,455,456,457,458,459,460,461,462,467,468,469,470,472,539,557,558,609,610,611,612,703,725,772,807,808,809,810,854,855,856,857,858,859,929,930,939,940,941,968,969,995,1039,1040,1048,1049,1050,1051],"aul":[6,7,8,9,10,11,12,38,130,131,132,133,134,143,144,152,153,154,260,261,262,268,269,270,312,313,314,336,453,454,455,456,457,458,459,460,461,462,467,468,469,470,472,539,557,558,609,610,611,612,618,619,620,621,622,623,703,725,772,807,808,809,810,854,855,856,857,858,859,929,930,939,940,941,968,969,995,1039,1040,1048,1049,1050,1051],"hon":[6],"ith":[6,653,654],"lt ":[6,7,8,9,10,11,12,38,130,131,132,133,134,143,144,152,153,154,245,260,261,262,268,269,270,312,313,314,336,385,409,418,453,454,455,456,457,458,459,460,461,462,467,468,469,470,472,514,539,557,558,562,609,610,611,612,661,662,663,703,725,772,807,808,809,810,854,855,856,857,858,859,925,929,930,939,940,941,968,969,995,1039,1040,1048,1049,1050,1051],"nsp":[6,21,22,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,115,116,117,150,151,188,189,190,191,213,351,483,484,488,489,490,491,492,531,532,533,534,535,536,537,538,559,624,625,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,837,838,839,840,841,842,843,942,943,975,1041,1117],"ort":[6,21,22,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,111,115,116,117,118,150,151,167,168,169,170,187,188,189,190,191,213,217,227,228,269,309,312,313,314,351,354,359,360,361,362,363,364,365,366,389,390,391,392,393,394,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,509,531,532,533,534,535,536,537,538,559,577,578,579,580,581,582,624,625,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,671,672,673,674,764,765,766,767,768,769,770,771,772,805,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,889,890,891,892,893,894,895,936,942,943,968,969,975,1000,1041,1052,1053,1057,1058,1059,1060,1105,1117,1128,1129],"por":[6,21,22,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,111,115,116,117,118,150,151,167,168,169,170,187,188,189,190,191,213,217,227,228,269,351,354,359,360,361,362,363,364,365,366,389,390,391,392,393,394,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,509,531,532,533,534,535,536,537,538,559,577,578,579,580,581,582,624,625,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,671,672,673,764,765,766,767,768,769,770,771,772,805,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,889,890,891,892,893,894,895,936,942,943,975,1000,1041,1052,1053,1057,1058,1059,1060,1105,1117,1128,1129],"ran":[6,21,22,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,115,116,117,150,151,188,189,190,191,213,218,219,220,221,222,351,483,484,488,489,490,491,492,531,532,533,534,535,536,537,538,559,624,625,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,816,817,818,819,820,837,838,839,840,841,842,843,942,943,975,1041,1117],"rt ":[6,21,22,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,111,115,116,117,118,150,151,167,168,169,170,187,188,189,190,191,213,217,227,228,256,269,351,354,359,360,361,362,363,364,365,366,389,390,391,392,393,394,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,509,531,532,533,534,535,536,537,538,559,577,578,579,580,581,582,624,625,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,671,672,673,764,765,766,767,768,769,770,771,772,805,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,889,890,891,892,893,894,895,936,942,943,975,1000,1052,1053,1057,1058,1059,1060,1105,1117,1128,1129],"sau":[6,7,8,9,10,11,12,38,130,131,132,133,134,143,144,152,153,154,260,261,262,268,269,270,312,313,314,336,453,454,455,456,457,458,459,460,461,462,467,468,469,470,472,539,557,558,609,610,611,612,703,725,772,807,808,809,810,854,855,856,857,858,859,929,930,939,940,941,968,969,995,1039,1040,1048,1049,1050,1051],"spo":[6,21,22,40,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,69,115,116,117,150,151,188,189,190,191,213,351,483,484,488,489,490,491,492,531,532,533,534,535,536,537,538,559,624,625,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,693,837,838,839,840,841,842,843,942,943,975,1041,1117],"ssa":[6,7,8,9,10,11,12,38,41,42,130,131,132,133,134,143,144,152,153,154,260,261,262,268,269,270,312,313,314,333,334,335,336,372,373,453,454,455,456,457,458,459,460,461,462,467,468,469,470,472,539,550,551,557,558,609,610,611,612,703,725,772,807,808,809,810,854,855,856,857,858,859,929,930,931,932,933,939,940,941,968,969,995,1039,1040,1048,1049,1050,1051],"tho":[6,81,1020,1021,1022,1023],"tra":[6,21,22,30,31,32,33,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,70,115,116,117,118,129,150,151,158,188,189,190,191,204,211,213,351,377,378,379,380,381,382,383,384,385,386,432,433,434,435,483,484,488,489,490,491,492,507,508,509,531,532,533,534,535,536,537,538,559,624,625,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,748,794,837,838,839,840,841,842,843,858,926,942,943,975,1016,1039,1040,1041,1051,1072,1117],"ult":[6,7,8,9,10,11,12,38,130,131,132,133,134,143,144,152,153,154,204,208,209,260,261,262,263,264,268,269,270,312,313,314,336,386,453,454,455,456,457,458,459,460,461,462,467,468,469,470,472,539,557,558,609,610,611,612,618,619,620,621,622,623,703,725,748,772,798,799,800,801,802,803,804,805,806,807,808,809,810,854,855,856,857,858,859,926,929,930,939,940,941,968,969,995,1039,1040,1048,1049,1050,1051,1072]," aj":[7,8,9,10,11,12]," se":[7,27,71,100,154,274,366,460,701,756,757,781,802,803,846,928,929,930,989,1099]," ta":[7,8,9,10,11,12,13,14,15,16,17,18,23,24,46,47,48,49,71,93,94,95,101,102,103,104,105,106,107,108,109,110,111,112,113,114,119,120,121,122,123,124,125,126,127,130,131,132,133,134,135,136,137,138,139,140,141,142,145,146,147,148,149,152,153,154,161,165,167,168,169,170,177,178,179,180,181,182,183,184,185,186,187,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,258,259,260,261,262,265,266,267,271,272,273,274,275,276,277,278,285,286,287,288,289,290,291,292,293,294,300,319,324,325,326,327,328,329,330,331,332,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,355,357,358,367,368,369,370,371,389,390,391,410,411,412,414,426,442,443,444,445,446,447,448,449,450,451,452,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,485,486,487,493,494,495,496,497,498,499,500,501,502,503,505,506,517,518,522,523,524,525,526,529,539,552,553,554,557,558,579,580,581,582,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,642,643,645,646,647,648,649,650,653,654,676,677,678,679,680,681,682,684,685,691,692,693,694,695,696,697,698,699,700,701,702,703,710,711,717,718,719,720,721,722,723,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,764,765,773,774,775,778,783,784,785,786,787,788,789,790,791,792,793,795,796,797,807,808,809,810,811,829,830,831,832,833,834,835,836,844,845,846,847,848,853,854,855,856,857,858,859,862,863,885,886,887,888,906,907,908,909,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,936,937,938,945,946,948,949,950,951,952,953,954,955,956,957,958,959,960,961,967,981,982,983,984,985,986,987,988,989,990,991,994,995,996,997,998,999,1000,1001,1002,1003,1004,1012,1013,1014,1015,1018,1019,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1042,1052,1053,1055,1056,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1100,1101,1102,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141],"aja":[7,8,9,10,11,12,1039,1040],"ale":[7,100,274,366,460,701,756,781,802,846,989],"ank":[7,8,9,10,11,12,13,14,15,16,17,18,23,24,46,47,48,49,71,93,94,95,102,103,104,105,106,107,108,109,110,111,112,113,114,119,120,121,122,123,124,125,126,127,130,131,132,133,134,135,136,137,138,139,140,141,142,145,146,147,148,149,152,153,154,167,168,169,170,177,178,179,180,181,182,183,184,185,186,187,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,258,259,260,261,262,265,266,267,271,272,273,274,275,276,277,278,285,286,287,288,289,290,291,292,293,294,300,319,320,321,322,323,324,325,326,327,328,329,330,331,332,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,355,356,357,358,367,368,369,370,371,389,390,391,410,411,412,414,426,442,443,444,445,446,447,448,449,450,451,452,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,485,486,487,493,494,495,496,497,498,499,500,501,502,503,517,518,522,523,524,525,526,527,528,529,539,552,553,554,557,558,579,580,581,582,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,626,642,643,645,653,654,676,677,678,679,680,681,682,684,685,691,692,693,694,695,696,697,698,699,700,701,702,703,710,711,717,718,719,720,721,722,723,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,764,765,773,774,775,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,795,796,797,807,808,809,810,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,844,845,846,847,848,853,854,855,856,857,858,859,862,863,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,906,907,908,909,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,936,937,938,945,946,948,949,950,951,952,953,954,955,956,957,958,959,960,961,967,981,982,983,984,985,986,987,988,989,990,991,994,995,996,997,998,999,1000,1001,1002,1003,1004,1018,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1052,1053,1055,1056,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1100,1101,1102,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141],"ax ":[7,8,9,10,11,12],"eal":[7,20,100,119,120,121,122,123,124,125,126,127,274,366,460,535,537,701,756,781,791,802,828,846,989,991,992,1095],"ed ":[7,25,26,27,28,29,30,31,32,33,34,35,36,37,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,71,100,185,211,241,252,274,279,280,281,306,307,308,309,310,311,312,313,314,315,316,317,318,366,408,413,432,433,434,435,437,438,439,440,441,453,454,455,456,457,458,459,460,461,462,513,557,558,646,647,648,649,650,683,701,756,758,781,802,812,813,814,815,816,817,818,819,820,821,846,915,934,935,948,949,950,951,952,953,954,989,1010,1012,1013,1014,1015,1051,1097,1098,1099],"jax":[7,8,9,10,11,12],"led":[7,34,35,36,37,71,100,274,279,280,281,312,313,314,366,437,438,439,440,441,453,454,455,456,457,458,459,460,461,462,557,558,701,756,781,802,846,948,949,950,951,952,953,954,989,1012,1013,1014,1015,1097,1098,1099],"nk ":[7,8,9,10,11,12,13,14,15,16,17,18,23,24,46,47,48,49,71,93,94,95,102,103,104,105,106,107,108,109,110,111,112,113,114,119,120,121,122,123,124,125,126,127,130,131,132,133,134,135,136,137,138,139,140,141,142,145,146,147,148,149,152,153,154,167,168,169,170,177,178,179,180,181,182,183,184,185,186,187,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,258,259,260,261,262,265,266,267,271,272,273,274,275,276,277,278,285,286,287,288,289,290,291,292,293,294,300,319,320,321,322,323,324,325,326,327,328,329,330,331,332,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,355,356,357,358,367,368,369,370,371,389,390,391,410,411,412,414,426,442,443,444,445,446,447,448,449,450,451,452,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,485,486,487,493,494,495,496,497,498,499,500,501,502,503,517,518,522,523,524,525,526,527,528,529,539,552,553,554,557,558,579,580,581,582,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,642,643,645,653,654,676,677,678,679,680,681,682,684,685,691,692,693,694,695,696,697,698,699,700,701,702,703,710,711,717,718,719,720,721,722,723,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,764,765,773,774,775,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,795,796,797,807,808,809,810,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,844,845,846,847,848,853,854,855,856,857,858,859,862,863,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,906,907,908,909,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,936,937,938,945,946,948,949,950,951,952,953,954,955,956,957,958,959,960,961,967,981,982,983,984,985,986,987,988,989,990,991,994,995,996,997,998,999,1000,1001,1002,1003,1004,1018,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1052,1053,1055,1056,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1100,1101,1102,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141],"sea":[7,100,274,366,460,701,756,781,802,846,928,989],"tan":[7,8,9,10,11,12,13,14,15,16,17,18,23,24,46,47,48,49,71,93,94,95,102,103,104,105,106,107,108,109,110,111,112,113,114,119,120,121,122,123,124,125,126,127,130,131,132,133,134,135,136,137,138,139,140,141,142,145,146,147,148,149,152,153,154,167,168,169,170,177,178,179,180,181,182,183,184,185,186,187,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,258,259,260,261,262,265,266,267,271,272,273,274,275,276,277,278,285,286,287,288,289,290,291,292,293,294,300,319,320,321,322,323,324,325,326,327,328,329,330,331,332,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,355,356,357,358,367,368,369,370,371,389,390,391,410,411,412,414,426,442,443,444,445,446,447,448,449,450,451,452,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,485,486,487,493,494,495,496,497,498,499,500,501,502,503,517,518,522,523,524,525,526,527,528,529,539,552,553,554,557,558,579,580,581,582,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,642,643,645,653,654,676,677,678,679,680,681,682,684,685,691,692,693,694,695,696,697,698,699,700,701,702,703,710,711,717,718,719,720,721,722,723,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,764,765,773,774,775,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,795,796,797,807,808,809,810,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,844,845,846,847,848,853,854,855,856,857,858,859,862,863,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,906,907,908,909,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,936,937,938,945,946,948,949,950,951,952,953,954,955,956,957,958,959,960,961,967,981,982,983,984,985,986,987,988,989,990,991,994,995,996,997,998,999,1000,1001,1002,1003,1004,1018,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1052,1053,1055,1056,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1100,1101,1102,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141]," a ":[8,50,58,72,82,119,289,295,374,442,448,522,574,575,576,584,614,615,704,813,874,889,1121,1134]," b ":[9,51,59,73,83,120,290,296,375,443,449,523,585,705,814,875,890,1122,1135]," c ":[10,50,51,52,53,54,55,56,57,60,72,73,74,75,76,77,78,79,80,84,95,121,207,277,278,291,297,337,444,450,462,524,572,586,706,876,891,927,952,980,1123,1136],"  d":[11,53,61,75,85,104,122,125,145,146,147,196,215,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,292,298,445,451,464,465,552,553,587,645,707,724,728,729,730,731,732,733,734,735,744,795,796,797,877,892,957,958,959,960,961,1062,1076,1129,1137]," d ":[11,53,61,75,85,122,292,298,445,451,587,707,877,892,1137],"  p":[12,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,42,57,65,71,80,92,123,133,134,142,208,209,220,253,286,289,290,291,292,293,294,299,376,396,397,398,399,400,401,402,403,404,405,406,407,408,409,411,436,446,452,500,503,525,538,548,589,605,681,689,709,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,815,840,848,884,888,889,890,891,892,893,894,895,899,900,901,902,903,904,905,918,964,1029,1115,1124,1138]," pr":[12,42,57,65,71,80,92,123,294,299,376,446,452,525,589,709,765,784,794,795,796,797,798,799,800,801,802,803,804,805,806,815,848,884,895,918,964,1029,1124,1138],"ime":[12,57,65,80,92,123,294,299,376,446,452,525,589,709,815,884,895,928,964,1124,1138],"me ":[12,57,65,80,92,123,294,299,376,446,452,463,525,589,709,815,884,895,928,964,1124,1138],"pri":[12,57,65,80,92,123,294,299,376,446,452,525,589,709,815,884,895,964,970,971,972,973,974,975,1124,1138],"rim":[12,57,65,80,92,123,294,299,376,446,452,525,589,709,815,884,895,964,1124,1138],"  i":[13,14,15,16,38,39,46,47,90,91,110,111,126,127,148,157,158,193,235,242,243,244,245,246,259,317,321,322,327,328,329,355,361,363,364,365,366,403,419,420,421,481,482,483,484,485,486,487,497,504,505,506,507,508,509,510,511,512,513,514,558,576,577,578,581,583,600,613,614,615,617,622,624,625,629,639,640,641,642,656,657,658,680,714,725,774,788,789,790,791,793,812,813,814,815,817,824,826,827,828,837,838,839,840,841,842,843,859,860,861,864,865,867,882,899,901,910,911,912,933,936,953,969,973,1005,1006,1007,1009,1010,1011,1039,1040,1044,1052,1053,1102,1111,1114,1128,1129]," al":[13,14,15,16,17,18,703,823]," he":[13,14,15,16,17,18,46,47,48,49,93,94,95,102,103,104,105,106,107,108,109,110,111,128,129,155,156,157,158,159,160,161,162,195,196,197,198,199,200,201,202,203,204,205,206,207,213,214,215,216,217,235,236,237,238,239,240,241,242,243,244,245,246,258,268,269,270,271,272,273,274,275,276,277,278,319,320,321,322,323,352,359,360,361,362,402,410,411,412,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,485,486,487,537,559,590,591,592,593,594,595,596,597,598,599,600,624,625,627,628,629,630,631,632,633,634,635,636,637,638,642,643,655,656,657,658,659,660,684,685,694,695,696,697,698,699,700,701,702,703,710,711,718,719,736,737,738,739,740,741,742,743,773,774,775,778,783,784,785,786,787,788,789,790,791,792,793,853,962,963,970,971,972,973,974,975,994,995,996,997,998,999,1000,1001,1031,1032,1033,1034,1035,1036,1037,1038,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1117,1130,1131,1132,1133]," i ":[13,90,505,506,624,625,882]," mk":[13,14,15,16,17,18,48,49,91,171,242,355,639,640,641,642,643,860,861,864,865,910,911,912,953],"aco":[13,14,15,16,17,18,683],"ala":[13,14,15,16,17,18,66,67,68,69,724,764,765,823,854,855,856,857,858,859,860,861],"avy":[13,14,15,16,17,18,46,47,48,49,93,94,95,102,103,104,105,106,107,108,109,110,111,148,195,196,197,198,199,200,201,202,203,204,205,206,207,213,235,236,237,238,239,240,241,242,243,244,245,246,258,259,271,272,273,274,275,276,277,278,319,320,321,322,323,351,352,359,360,361,362,402,410,411,412,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,485,486,487,537,590,591,592,593,594,595,596,597,598,599,600,624,625,627,628,629,630,631,632,633,634,635,636,637,638,642,643,684,685,694,695,696,697,698,699,700,701,702,703,710,711,718,719,736,737,738,739,740,741,742,743,773,774,775,778,783,784,785,786,787,788,789,790,791,792,793,853,962,963,966,994,995,996,997,998,999,1000,1001,1031,1032,1033,1034,1035,1036,1037,1038,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1117,1130,1131,1132,1133],"cor":[13,14,15,16,17,18,256,590,591,592,593,594,595,596,597,598,599,600,635,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927],"eav":[13,14,15,16,17,18,46,47,48,49,93,94,95,102,103,104,105,106,107,108,109,110,111,148,195,196,197,198,199,200,201,202,203,204,205,206,207,213,235,236,237,238,239,240,241,242,243,244,245,246,258,259,271,272,273,274,275,276,277,278,319,320,321,322,323,351,352,359,360,361,362,402,410,411,412,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,485,486,487,537,590,591,592,593,594,595,596,597,598,599,600,624,625,627,628,629,630,631,632,633,634,635,636,637,638,642,643,684,685,694,695,696,697,698,699,700,701,702,703,710,711,718,719,736,737,738,739,740,741,742,743,773,774,775,778,783,784,785,786,787,788,789,790,791,792,793,853,962,963,966,994,995,996,997,998,999,1000,1001,1031,1032,1033,1034,1035,1036,1037,1038,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1117,1130,1131,1132,1133],"hea":[13,14,15,16,17,18,46,47,48,49,93,94,95,102,103,104,105,106,107,108,109,110,111,128,129,148,195,196,197,198,199,200,201,202,203,204,205,206,207,213,235,236,237,238,239,240,241,242,243,244,245,246,258,259,271,272,273,274,275,276,277,278,319,320,321,322,323,351,352,359,360,361,362,402,410,411,412,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,485,486,487,537,590,591,592,593,594,595,596,597,598,599,600,624,625,627,628,629,630,631,632,633,634,635,636,637,638,642,643,655,656,657,658,659,660,684,685,694,695,696,697,698,699,700,701,702,703,710,711,718,719,736,737,738,739,740,741,742,743,773,774,775,778,783,784,785,786,787,788,789,790,791,792,793,853,962,963,966,994,995,996,997,998,999,1000,1001,1031,1032,1033,1034,1035,1036,1037,1038,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1117,1130,1131,1132,1133],"lac":[13,14,15,16,17,18,66,67,68,69,116,200,499,688,916,1104],"mk ":[13,14,15,16,17,18,48,49,91,171,242,355,639,640,641,642,643,860,861,864,865,910,911,912,953],"orn":[13,14,15,16,17,18,252,667,668,669,670],"rn ":[13,14,15,16,17,18],"vy ":[13,14,15,16,17,18,46,47,48,49,93,94,95,102,103,104,105,106,107,108,109,110,111,148,195,196,197,198,199,200,201,202,203,204,205,206,207,213,235,236,237,238,239,240,241,242,243,244,245,246,258,259,271,272,273,274,275,276,277,278,319,320,321,322,323,351,352,359,360,361,362,402,410,411,412,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,485,486,487,537,590,591,592,593,594,595,596,597,598,599,600,624,625,627,628,629,630,631,632,633,634,635,636,637,638,642,643,684,685,694,695,696,697,698,699,700,701,702,703,710,711,718,719,736,737,738,739,740,741,742,743,773,774,775,778,783,784,785,786,787,788,789,790,791,792,793,853,962,963,966,994,995,996,997,998,999,1000,1001,1031,1032,1033,1034,1035,1036,1037,1038,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1117,1130,1131,1132,1133]," ii":[14,15,46,47,91,110,111,148,242,243,244,245,246,259,321,322,327,328,329,355,363,364,419,420,421,504,507,508,509,510,511,512,513,514,558,600,613,614,615,639,640,641,788,789,790,791,793,826,827,828,860,861,864,865,899,910,911,912,953],"ii ":[14,15,18,91,110,111,148,174,242,243,244,245,246,259,321,322,327,328,355,363,364,419,420,421,504,507,508,509,510,511,512,513,514,558,600,613,614,615,639,640,641,643,788,789,790,791,793,826,827,828,860,861,864,865,899,910,911,912,953],"iii":[15,322,328,329,364,510,511,512,513,514,643]," iv":[16,38,39,235,361,774,789,824,1114],"iv ":[16,38,39,235,361,774,789,824,1114]," vi":[17,18,643,1076],"vi ":[17],"vii":[18,643]," an":[19,20,21,22,629,680,691,717,901,1025]," ap":[19,353,354,423,424,425,426,427,432,433,434,435,437,438,439,440,441,515,516,618,619,620,621,622,623,644,870,871,872,873,955,956,1019,1055,1056,1108],"ana":[19,227,228,1043,1044],"apc":[19,353,354,423,424,425,426,427,432,433,434,435,437,438,439,440,441,515,516,618,619,620,621,622,623,644,870,871,872,873,955,956,1019,1055,1056,1108],"at ":[19,43,44,45,301,413,555,556,702,712,713,714,715,716,807,808,809,810,967,1045,1046,1047,1057,1058,1059,1060,1103,1104,1105,1106,1107],"nat":[19],"pc ":[19,131,133,134,146,253,353,354,411,423,424,425,426,427,432,433,434,435,436,437,438,439,440,441,500,515,516,548,595,605,618,619,620,621,622,623,644,689,840,870,871,872,873,886,899,900,901,902,903,904,905,955,956,1019,1055,1056,1108,1115]," p ":[20,681],"alt":[20,119,120,121,122,123,124,125,126,127,535,537,791,828,991,992,1095],"anh":[20,21,22],"hur":[20,21,22,40,41,42],"lth":[20,119,120,121,122,123,124,125,126,127,535,537,791,828,991,992,1095],"nhu":[20,21,22],"ste":[20,119,120,121,122,123,124,125,126,127,535,537,648,724,791,828,866,867,868,869,991,992,999,1095],"tea":[20,119,120,121,122,123,124,125,126,127,535,537,791,828,991,992,1095],"th ":[20,102,103,104,105,106,107,108,109,110,111,119,120,121,122,123,124,125,126,127,415,416,417,418,419,420,421,535,537,791,828,991,992,1095],"ur ":[20,21,22,40,41,42,392,393,394,530,531,532,533,534,535,536,537,538,993,994,995,996,997,998,999,1000,1001],"ba ":[22,156,484,535,536,619,630,631]," ar":[23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,70,71,103,177,178,179,180,181,228,235,248,304,307,315,316,317,318,361,378,417,489,534,603,604,605,661,662,663,678,683,687,718,719,720,721,722,723,774,789,816,817,818,819,820,824,855,902,914,962,963,965,1003,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1054,1065,1114],"are":[23,24,463,966],"es ":[23,24,505,506,507,508,509,510,511,512,513,514],"res":[23,24]," pl":[24,142,220,396,397,398,399,400,401,402,403,404,405,406,407,408,409,771,779,780,781,782,888,889,890,891,892,893,894,895],"asm":[24,142,220,771,888],"las":[24,113,142,168,169,201,202,206,220,396,412,456,560,648,670,673,696,771,872,888,974,986],"ma ":[24,142,220,771,807,808,809,810,888],"pla":[24,142,220,396,397,398,399,400,401,402,403,404,405,406,407,408,409,771,779,780,781,782,888,889,890,891,892,893,894,895],"sma":[24,142,220,603,604,605,606,607,608,771,779,780,781,782,888]," ho":[25,26,27,28,29,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,97,98,99,100,101,112,113,114,115,116,117,149,186,187,195,196,197,198,199,200,201,202,203,204,205,206,207,210,252,271,272,273,274,275,276,277,278,279,280,281,300,319,320,321,322,323,333,334,335,355,356,410,411,412,414,423,424,425,426,427,463,493,494,495,496,497,498,499,500,501,502,503,527,528,563,564,565,566,567,568,618,619,620,621,622,623,624,625,627,628,629,630,631,632,633,634,635,636,637,638,676,677,678,750,751,752,753,754,755,756,757,758,759,760,779,780,781,782,822,823,824,825,826,827,828,847,848,853,854,855,856,857,858,859,862,863,866,867,868,869,874,875,876,877,878,879,880,881,882,883,884,906,907,908,909,1043,1044,1100,1101,1102,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127]," lr":[25,30,34,68,99,132,141,159,262,308,368,379,393,405,424,428,429,433,438,458,469,479,480,569,570,571,572,657,660,699,712,713,714,715,716,719,732,742,850,917,987,1056,1096,1120]," pe":[25,26,27,28,29,30,31,32,33,34,35,36,37,399,538,750,751,752,753,754,755,756,757,758,759,760,761,762,763],"arm":[25,26,27,28,29,30,31,32,33,34,35,36,37,103,248,304,307,315,316,317,318,417,489,678,683,687,758,816,817,818,819,820,855,902,914,1003,1065],"el ":[25,26,27,28,29,30,31,32,33,34,35,36,37,46,47,48,49,304,333,334,335,401,540,541,542,543,544,545,546,584,585,586,587,588,589,844,845,846,847,848,1025],"ers":[25,26,27,28,29,30,31,32,33,34,35,36,37,128,129,334,565,655,656,657,658,659,660],"hov":[25,26,27,28,29,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,97,98,99,100,101,112,113,114,115,116,117,149,186,187,195,196,197,198,199,200,201,202,203,204,205,206,207,210,271,272,273,274,275,276,277,278,279,280,281,300,319,320,321,322,323,333,334,335,355,356,410,411,412,414,423,424,425,426,427,463,493,494,495,496,497,498,499,500,501,502,503,527,528,563,564,565,566,567,568,618,619,620,621,622,623,624,625,627,628,629,630,631,632,633,634,635,636,637,638,676,677,678,750,751,752,753,754,755,756,757,758,759,760,779,780,781,782,822,823,824,825,826,827,828,853,854,855,856,857,858,859,862,863,866,867,868,869,874,875,876,877,878,879,880,881,882,883,884,906,907,908,909,1043,1044,1100,1101,1102,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127],"lrm":[25,30,34,68,132,141,159,262,308,368,379,393,405,424,428,429,431,433,438,458,469,479,480,569,570,571,572,657,660,699,719,732,740,742,775,850,917,987,1056,1096,1120],"mor":[25,26,27,28,29,30,31,32,33,34,35,36,37,103,248,260,261,262,304,307,309,315,316,317,318,417,489,667,668,669,670,671,672,673,674,678,683,687,816,817,818,819,820,855,902,914,1000,1003,1065],"nel":[25,26,27,28,29,30,31,32,33,34,35,36,37],"nne":[25,26,27,28,29,30,31,32,33,34,35,36,37],"onn":[25,26,27,28,29,30,31,32,33,34,35,36,37,41,42,333,334,335,550,551,931,932,933],"ore":[25,26,27,28,29,30,31,32,33,34,35,36,37,152,153,154,315,316,317,318,590,591,592,593,594,595,596,597,598,599,600,683,816,817,818,819,820,1000],"ove":[25,26,27,28,29,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,96,97,98,99,100,101,112,113,114,115,116,117,149,186,187,195,196,197,198,199,200,201,202,203,204,205,206,207,210,271,272,273,274,275,276,277,278,279,280,281,300,319,320,321,322,323,333,334,335,355,356,410,411,412,414,422,423,424,425,426,427,463,493,494,495,496,497,498,499,500,501,502,503,527,528,563,564,565,566,567,568,618,619,620,621,622,623,624,625,627,628,629,630,631,632,633,634,635,636,637,638,676,677,678,750,751,752,753,754,755,756,757,758,759,760,779,780,781,782,822,823,824,825,826,827,828,853,854,855,856,857,858,859,862,863,866,867,868,869,874,875,876,877,878,879,880,881,882,883,884,906,907,908,909,1043,1044,1100,1101,1102,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127],"per":[25,26,27,28,29,30,31,32,33,34,35,36,37,94,148,259,351,384,421,538,723,761,762,763,837,838,839,840,841,842,843,918,919,965,966,1024,1025,1026,1027,1028],"red":[25,26,27,28,29,30,31,32,33,34,35,36,37,315,316,317,318,683,795,796,797,816,817,818,819,820,821],"rm ":[25,28,30,32,34,36,68,117,132,141,159,160,164,181,233,240,262,275,308,311,368,370,379,393,396,397,398,399,400,401,402,403,404,405,406,407,408,409,424,427,428,429,431,433,435,438,440,458,461,469,482,546,561,569,570,571,572,657,660,675,699,719,732,740,742,755,775,850,852,863,889,890,891,892,893,894,895,917,921,924,951,956,976,977,978,979,980,987,990,998,1033,1056,1096,1120],"rmo":[25,26,27,28,29,30,31,32,33,34,35,36,37,103,248,304,307,315,316,317,318,417,489,678,683,687,816,817,818,819,820,855,902,914,1003,1065],"rso":[25,26,27,28,29,30,31,32,33,34,35,36,37],"son":[25,26,27,28,29,30,31,32,33,34,35,36,37,271,272,273,274,275,276,277,278],"ver":[25,26,27,28,29,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,96,97,98,99,100,101,112,113,114,115,116,117,149,186,187,195,196,197,198,199,200,201,202,203,204,205,206,207,210,212,271,272,273,274,275,276,277,278,279,280,281,300,319,320,321,322,323,333,334,335,355,356,410,411,412,414,416,422,423,424,425,426,427,463,493,494,495,496,497,498,499,500,501,502,503,527,528,563,564,565,566,567,568,618,619,620,621,622,623,624,625,627,628,629,630,631,632,633,634,635,636,637,638,647,676,677,678,750,751,752,753,754,755,756,757,758,759,760,779,780,781,782,822,823,824,825,826,827,828,853,854,855,856,857,858,859,862,863,866,867,868,869,874,875,876,877,878,879,880,881,882,883,884,906,907,908,909,1043,1044,1100,1101,1102,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127]," mg":[26,31,35,180,369,425,434,439,501,623,818,832,841,950],"mg ":[26,31,35,180,369,425,434,439,501,623,818,832,841,950],"ens":[27,145,146,147,238,301,552,553,645,712,724,728,729,730,731,732,733,734,735,744,757,1076,1099],"nso":[27,757,1099],"ors":[27,757,1099],"rs ":[27,128,129,609,610,611,612,655,656,657,658,659,660,757,804,1099],"sen":[27,757,1099],"sor":[27,522,523,524,525,526,757,968,969,1099]," sr":[28,32,36,117,160,164,181,233,234,275,311,370,427,435,440,461,482,546,561,637,638,716,852,924,951,956,976,977,978,979,980,990,998,1126],"srm":[28,32,36,117,160,164,181,233,234,275,311,370,427,435,440,461,482,546,561,637,638,716,852,924,951,956,976,977,978,979,980,990,998,1126],"ack":[30,31,32,33,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,116,129,155,156,157,158,159,160,161,162,211,432,433,434,435,515,516,520,521,563,564,565,566,567,568,584,585,586,587,588,589,601,602,704,705,706,707,708,709,712,713,714,715,716,761,762,763,776,777,821,944,1051,1058,1087,1088,1089,1090,1091,1092,1093,1094,1112,1113,1114,1115,1116],"cke":[30,31,32,33,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,211,432,433,434,435,1051,1112,1113,1114,1115,1116],"ked":[30,31,32,33,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,211,432,433,434,435,1051],"rac":[30,31,32,33,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,129,211,432,433,434,435,549,597,733,734,772,825,827,862,863,864,865,922,1050,1051,1071,1116],"  w":[34,35,36,37,81,301,304,312,313,314,436,437,438,439,440,441,453,454,455,456,457,458,459,460,461,462,557,558,571,777,804,806,948,949,950,951,952,953,954,979,982,1001,1004,1008,1009,1010,1011,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1133]," wh":[34,35,36,37,312,313,314,437,438,439,440,441,453,454,455,456,457,458,459,460,461,462,557,558,948,949,950,951,952,953,954,1097,1098,1099,1100,1101,1102],"eel":[34,35,36,37,312,313,314,437,438,439,440,441,453,454,455,456,457,458,459,460,461,462,557,558,948,949,950,951,952,953,954,1097,1098,1099],"ele":[34,35,36,37,312,313,314,437,438,439,440,441,453,454,455,456,457,458,459,460,461,462,557,558,948,949,950,951,952,953,954,1097,1098,1099],"hee":[34,35,36,37,312,313,314,437,438,439,440,441,453,454,455,456,457,458,459,460,461,462,557,558,948,949,950,951,952,953,954,1097,1098,1099],"whe":[34,35,36,37,312,313,314,437,438,439,440,441,453,454,455,456,457,458,459,460,461,462,557,558,948,949,950,951,952,953,954,1097,1098,1099],"ow ":[38,39,214,215,216,217,228,235,361,774,789,824,1112,1113,1114,1115,1116],"row":[38,39,128,129,214,215,216,217,228,235,361,774,789,798,799,800,801,802,803,804,805,806,824,1114],"rro":[38,39,228,235,351,361,402,774,789,824,1114]," sp":[40,69,185,408,513,693,843,970,971,972,973,974,975,1010,1110],"art":[40,70,71,81,128,129,177,178,179,180,181,229,230,231,232,233,234,378,534,603,604,605,616,617,655,656,657,658,659,660,661,662,663,718,719,720,721,722,723,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,962,963,965,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1054],"ery":[40,70,71,96,177,178,179,180,181,378,422,534,538,603,604,605,661,662,663,718,719,720,721,722,723,962,963,965,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1054],"ill":[40,70,71,177,178,179,180,181,271,272,273,274,275,276,277,278,378,491,534,603,604,605,661,662,663,717,718,719,720,721,722,723,937,938,962,963,965,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1054],"ler":[40,70,71,118,177,178,179,180,181,377,378,379,380,381,382,383,384,385,386,492,534,603,604,605,661,662,663,718,719,720,721,722,723,798,799,800,801,802,803,804,805,806,962,963,965,1016,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1054,1134,1135,1136,1137,1138],"lle":[40,70,71,171,172,173,174,175,176,177,178,179,180,181,337,338,339,340,341,342,343,344,345,346,347,348,349,350,378,534,603,604,605,647,661,662,663,718,719,720,721,722,723,937,938,962,963,965,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1054],"ott":[40,69,693],"pot":[40,69,693],"rti":[40,70,71,177,178,179,180,181,378,534,603,604,605,661,662,663,718,719,720,721,722,723,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,962,963,965,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1054],"ry ":[40,70,71,96,155,156,157,158,159,160,161,162,177,178,179,180,181,222,324,325,326,327,328,329,330,331,332,359,360,361,362,363,364,365,366,378,422,466,481,482,483,484,534,538,577,578,603,604,605,617,629,630,641,661,662,663,680,718,719,720,721,722,723,725,837,838,839,840,841,842,843,901,936,962,963,965,1005,1006,1007,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1039,1040,1052,1053,1054,1128,1129],"shu":[40,41,42,942,943],"ssh":[40,41,42],"ter":[40,69,128,129,155,156,157,158,159,160,161,162,214,215,216,217,229,230,231,232,233,234,266,268,269,270,317,471,472,473,474,475,476,477,478,479,480,559,622,648,650,655,656,657,658,659,660,693,798,799,800,801,802,803,804,805,806,817,866,867,868,869,928,933,969,970,971,972,973,974,975,1087,1088,1089,1090,1091,1092,1093,1094,1095,1108,1111],"til":[40,70,71,177,178,179,180,181,378,534,603,604,605,661,662,663,718,719,720,721,722,723,962,963,965,1017,1020,1021,1022,1023,1024,1025,1026,1027,1028,1054],"tte":[40,69,693,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075],"  f":[41,42,55,63,77,87,105,197,198,199,222,284,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,354,359,360,361,362,390,391,392,393,394,400,401,402,485,486,487,490,496,551,621,626,630,631,636,671,672,673,697,725,816,817,818,819,820,829,830,831,832,833,834,835,836,879,889,890,891,892,893,894,895,932,964,1005,1006,1007,1013,1039,1040,1041,1134,1135,1136,1137,1138],"  r":[41,42,96,109,119,120,121,122,123,147,151,162,209,221,226,241,249,254,270,310,331,333,334,335,346,394,412,422,526,549,550,551,566,567,597,690,733,734,743,772,801,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,845,846,847,848,849,850,851,852,868,922,923,931,932,933,1014,1041,1050,1071,1077,1116,1125]," fa":[41,42,300,392,393,394,630,1134,1135,1136,1137,1138]," re":[41,42,96,109,209,241,270,333,334,335,394,412,422,550,551,743,821,822,823,824,825,826,827,828,868,931,932,933,1041],"ais":[41,42,333,334,335,550,551,931,932,933],"anc":[41,42,333,334,335,488,489,490,491,492,550,551,646,647,648,649,650,731,931,932,933,934,935],"ast":[41,42,168,258,259,392,393,394,648,866,867,868,869,1134,1135,1136,1137,1138],"ce ":[41,42,162,193,333,334,335,488,489,490,491,492,497,550,551,576,656,657,658,714,731,931,932,933,966,1009,1010,1011,1040],"con":[41,42,154,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,267,270,300,333,334,335,550,551,683,931,932,933],"eco":[41,42,96,154,270,333,334,335,422,550,551,931,932,933],"fas":[41,42,392,393,394,1134,1135,1136,1137,1138],"iss":[41,42,177,178,179,180,181,197,333,334,335,397,398,399,400,401,402,403,404,405,406,407,408,409,505,506,507,508,509,510,511,512,513,514,519,550,551,717,753,770,908,931,932,933,937,938,993],"nai":[41,42,227,228,333,334,335,550,551,931,932,933],"nce":[41,42,162,333,334,335,488,489,490,491,492,550,551,646,647,648,649,650,731,931,932,933,934,935],"nna":[41,42,333,334,335,550,551,866,867,868,869,931,932,933],"rec":[41,42,96,270,333,334,335,422,550,551,931,932,933,966],"san":[41,42,333,334,335,550,551,648,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,931,932,933],"st ":[41,42,168,392,393,394,517,518,712,1134,1135,1136,1137,1138],"oto":[42,167,168,169,170,765,784,848,918,964,1029],"pro":[42,71,765,784,798,799,800,801,802,803,804,805,806,848,918,964,1029],"rot":[42,119,120,121,122,123,351,765,784,848,849,850,851,852,885,886,887,888,918,964,1029],"to ":[42,776,777]," at":[43,44,45,155,156,157,158,159,160,161,162,515,516,520,521,563,564,565,566,567,568,584,585,586,587,588,589,601,602,610,704,705,706,707,708,709,761,762,763,776,777,821,944,1006,1058,1087,1088,1089,1090,1091,1092,1093,1094,1141]," co":[43,44,45,124,166,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,266,267,301,324,325,326,327,328,329,330,331,332,413,555,556,625,650,667,668,669,670,730,731,794,811,812,964,967,1016,1042,1045,1046,1047,1057,1058,1059,1060,1103,1104,1105,1106,1107],"ath":[43,44,45],"bat":[43,44,45,96,301,413,422,555,556,967,1045,1046,1047,1057,1058,1059,1060,1103,1104,1105,1106,1107],"com":[43,44,45,124,166,189,192,193,194,266,301,324,325,326,327,328,329,330,331,332,413,555,556,625,650,667,668,669,670,730,731,794,811,964,967,1016,1042,1045,1046,1047,1057,1058,1059,1060,1103,1104,1105,1106,1107],"ena":[43,44,45],"hen":[43,44,45],"mba":[43,44,45,168,301,413,555,556,967,1045,1046,1047,1057,1058,1059,1060,1103,1104,1105,1106,1107],"na ":[43,44,45,112,113,114,289,290,291,292,293,294,1043,1044],"omb":[43,44,45,168,301,413,555,556,967,1045,1046,1047,1057,1058,1059,1060,1103,1104,1105,1106,1107],"the":[43,44,45,591]," xr":[45,288],"xr ":[45,288]," ax":[46,47,48,49],"axe":[46,47,48,49],"ic ":[46,47,507,508,509,620,794],"iic":[46,47],"xel":[46,47,48,49]," xl":[47,114,170,373,553,582,598,612,735,749,905],"xl ":[47,114,170,373,553,582,598,612,735,749,905,1107],"  1":[48,212,332,338,339,340,341,342,343,344,684,849,850,851,852,1027,1030,1036,1037,1041,1063,1087]," 1 ":[48,849,850,851,852,1027],"adg":[50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65],"bad":[50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65],"dge":[50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65],"ger":[50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,171,172,173,174,175,176,555,556,816,817,818,819,820,1029,1030],"  e":[54,62,76,86,139,179,217,232,272,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,334,429,477,493,494,495,496,497,498,499,500,501,502,503,564,565,588,599,602,635,640,654,686,687,688,689,690,708,740,775,796,800,836,838,878,893,1059,1127]," e ":[54,62,76,86,293,588,708,878,893]," f ":[55,63,77,87,879,894]," h ":[56,79,89,574,575,576,881,1087,1088,1089,1090,1091,1092,1093],"  g":[64,78,88,218,219,220,221,222,239,261,264,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,415,416,417,418,419,420,421,442,443,444,445,446,453,454,455,456,457,458,459,460,461,462,486,521,530,579,580,581,582,648,698,712,741,787,790,845,880,887,898,997,1000,1069,1073,1112,1113,1114,1115,1116]," g ":[64,78,88,880],"bal":[66,67,68,69,70,71,591]," hy":[67,319],"bri":[67,319,333,334,335],"hyb":[67,319],"id ":[67,319],"rid":[67,319],"ybr":[67,319],"ail":[70,118,377,378,379,380,381,382,383,384,385,386,492,1016],"all":[70,71,171,172,173,174,175,176,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,442,443,444,445,446,591,703],"ile":[70,118,128,129,177,178,179,180,181,377,378,379,380,381,382,383,384,385,386,397,398,399,400,401,402,403,404,405,406,407,408,409,492,505,506,507,508,509,510,511,512,513,514,519,655,656,657,658,659,660,661,662,663,717,753,770,794,811,889,890,891,892,893,894,895,908,937,938,993,1016,1042],"ist":[70,71,591],"lis":[70,71,235,236,237,238,239,240,241,242,243,244,245,246,398,591],"lli":[70,71,591],"rai":[70,118,162,377,378,379,380,381,382,383,384,385,386,492,798,799,800,801,802,803,804,805,806,1016],"sta":[70,71,258,259,591,667,668,669,670,1078],"ta ":[70,71,106,107,498,591,763,1019,1053],"elf":[71],"ell":[71,112,113,114,137,236,350,401,455,476,494,729,739,996,1026,1066,1112,1113,1114,1115,1116],"lf ":[71,129],"ope":[71],"pel":[71],"rop":[71],"sel":[71,304],"aft":[72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,333,334,335,463,563,564,565,566,567,568,691,866,867,868,869,968,969,1043,1044],"and":[72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,166,189,192,193,194,324,325,326,327,328,329,330,331,332,416,625,648,667,668,669,670,730,731,794,811,934,935,945,946,964,1016,1042],"ban":[72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,336,967,1045,1046,1047,1048,1049,1050,1051],"cra":[72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,213,333,334,335,463,563,564,565,566,567,568,691,866,867,868,869,968,969,1043,1044],"dit":[72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92],"erc":[72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,333,334,335,463,563,564,565,566,567,568,866,867,868,869,1043,1044],"ft ":[72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,333,334,335,463,563,564,565,566,567,568,691,866,867,868,869,944,968,969,1008,1009,1010,1011,1043,1044],"it ":[72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,109,289,290,291,292,293,294,651,652,743,859,1005,1006,1007,1041],"ndi":[72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92],"raf":[72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,151,333,334,335,463,563,564,565,566,567,568,691,801,866,867,868,869,968,969,1043,1044],"rcr":[72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,333,334,335,463,563,564,565,566,567,568,691,866,867,868,869,1043,1044]," wa":[81,804,1087,1088,1089,1090,1091,1092,1093,1094,1095],"hog":[81],"og ":[81,135,136,137,138,139,140,141,142],"rth":[81],"war":[81,143,144,804,1087,1088,1089,1090,1091,1092,1093,1094,1095],"ard":[93,94,95,115,116,117,149,150,151,915],"bar":[93,94,95],"che":[93,94,95,138,169,182,183,184,185,495,519,579,580,581,582,696,993],"dic":[93,94,95,317,817,867,933,969,973,1111],"he ":[93,94,95,579,580,581,582,591],"ich":[93,94,95],"rdi":[93,94,95,150,151,317,817,867,933,969,973,1111]," mi":[94,177,178,179,180,181,397,398,399,400,401,402,403,404,405,406,407,408,409,505,506,507,508,509,510,511,512,513,514,519,646,647,648,649,650,651,652,653,654,717,753,770,908,918,919,937,938,993],"eep":[94,918,919],"epe":[94,918,919],"esw":[94,918,919],"ine":[94,154,282,283,284,761,762,763,885,886,887,888,918,919,999],"min":[94,124,125,399,646,647,648,649,650,918,919],"nes":[94,918,919],"swe":[94,918,919],"wee":[94,918,919],"att":[96,155,156,157,158,159,160,161,162,422,515,516,520,521,563,564,565,566,567,568,584,585,586,587,588,589,601,602,704,705,706,707,708,709,745,746,747,748,749,761,762,763,776,777,821,944,1058,1087,1088,1089,1090,1091,1092,1093,1094],"ch ":[96,422,466],"cov":[96,422],"ech":[96,413,422,812,813,814,815],"eme":[96,422,463],"lem":[96,422],"mec":[96,413,422,812,813,814,815],"tle":[96,422],"ttl":[96,422]," be":[97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,517,518]," sc":[97,98,99,100,101,163,164,165,166,214,215,216,217,229,230,231,232,233,234,256,265,266,302,303,304,305,381,426,448,449,450,451,452,459,464,465,544,573,616,617,683,692,693,750,751,752,753,754,755,756,757,758,759,760,780,849,850,851,852,853,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,934,935,948,949,950,951,952,953,954,970,971,972,973,974,975,1008,1009,1010,1011,1060,1097,1098,1099,1100,1101,1102],"agl":[97,98,99,100,101],"bea":[97,98,99,100,101],"cou":[97,98,99,100,101,163,164,165,166,214,215,216,217,229,230,231,232,233,234,302,303,304,305,426,448,449,450,451,452,459,464,465,544,573,616,617,683,692,693,750,751,752,753,754,755,756,757,758,759,760,780,849,850,851,852,853,934,935,948,949,950,951,952,953,954,970,971,972,973,974,975,1008,1009,1010,1011,1060,1097,1098,1099,1100,1101,1102],"eag":[97,98,99,100,101,1078],"gle":[97,98,99,100,101],"out":[97,98,99,100,101,163,164,165,166,214,215,216,217,229,230,231,232,233,234,302,303,304,305,426,448,449,450,451,452,459,464,465,544,573,616,617,683,692,693,750,751,752,753,754,755,756,757,758,759,760,780,849,850,851,852,853,934,935,948,949,950,951,952,953,954,970,971,972,973,974,975,1008,1009,1010,1011,1060,1097,1098,1099,1100,1101,1102],"sco":[97,98,99,100,101,163,164,165,166,214,215,216,217,229,230,231,232,233,234,256,302,303,304,305,426,448,449,450,451,452,459,464,465,544,573,616,617,635,683,692,693,750,751,752,753,754,755,756,757,758,759,760,780,849,850,851,852,853,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,934,935,948,949,950,951,952,953,954,970,971,972,973,974,975,1008,1009,1010,1011,1060,1097,1098,1099,1100,1101,1102],"ut ":[97,98,99,100,101,163,164,165,166,214,215,216,217,229,230,231,232,233,234,302,303,304,305,426,448,449,450,451,452,459,464,465,544,573,616,617,683,692,693,750,751,752,753,754,755,756,757,758,759,760,780,849,850,851,852,853,934,935,948,949,950,951,952,953,954,970,971,972,973,974,975,1008,1009,1010,1011,1060,1097,1098,1099,1100,1101,1102]," c3":[98,216,231,313,325,326,388,511,580,593,594,632,633,738,752,903,907,949,971,972,978,1022,1032,1046,1119],"3i ":[98,972,1022,1119],"c3i":[98,972,1022,1119],"lrr":[99],"rp ":[99],"rrp":[99],"tag":[101,161,165,502,649,909],"beh":[102,103,104,105,106,107,108,109,110,111],"ehe":[102,103,104,105,106,107,108,109,110,111],"emo":[102,103,104,105,106,107,108,109,110,111,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255],"hem":[102,103,104,105,106,107,108,109,110,111,138,169,495,696],"mot":[102,103,104,105,106,107,108,109,110,111,415,416,417,418,419,420,421],"oth":[102,103,104,105,106,107,108,109,110,111,415,416,417,418,419,420,421,897],"or ":[103,158,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,248,258,259,304,307,317,374,375,376,417,442,443,444,445,446,489,678,687,795,796,797,811,817,822,823,824,825,826,827,828,855,867,902,914,933,969,973,1003,1020,1021,1022,1023,1057,1058,1059,1060,1065,1087,1088,1089,1090,1091,1092,1093,1094,1095,1111]," da":[104,196,223,224,225,226,227,228,229,230,231,232,233,234],"avi":[104,196],"dav":[104,196],"ion":[104,196,197,199,256,490,551,621,646,647,648,649,650,697,804,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927],"vio":[104,196]," fl":[105,198,284,306,307,308,309,310,311,316,400,496,626,830,932,1013],"ame":[105,198,284,316,372,373,400,496,830,932,1012,1013,1014,1015,1098],"fla":[105,198,284,306,307,308,309,310,311,316,400,496,626,830,932,1013],"lam":[105,198,284,316,400,496,559,830,932,1013],"mer":[105,198,284,316,372,373,400,496,642,643,830,932,947,1012,1013,1014,1015,1098],"  k":[106,107,212,223,224,491,498,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,763,821,853,993,1053,1079,1080,1081,1082,1083,1084,1085],"  u":[106,201,204,205,206,336,360,386,473,506,530,531,532,533,534,535,536,537,538,570,578,592,628,630,631,677,695,727,748,751,758,799,858,911,926,967,977,983,984,1041,1045,1046,1047,1048,1049,1050,1051,1072]," ku":[106,107,498,557,558,763,1053]," up":[106,201,205,206,360,473,506,532,570,592,628,630,631,677,695,727,751,799,911,977,983,984],"ade":[106,162,201,205,206,360,473,506,532,570,592,628,630,631,677,686,687,688,689,690,695,727,751,799,911,977,983,984],"de ":[106,163,164,165,166,201,205,206,360,473,506,532,570,592,628,630,631,677,686,687,688,689,690,695,727,751,799,911,977,983,984],"gra":[106,201,205,206,360,473,506,532,570,592,628,630,631,677,695,727,751,799,911,977,983,984],"ita":[106,107,498,763,906,907,908,909,910,911,912,1053],"kur":[106,107,498,763,1053],"pgr":[106,201,205,206,360,473,506,532,570,592,628,630,631,677,695,727,751,799,911,977,983,984],"rad":[106,201,205,206,360,473,506,532,570,592,628,630,631,677,695,727,751,799,911,977,983,984],"rit":[106,107,498,763,803,859,928,1053],"upg":[106,201,205,206,360,473,506,532,570,592,628,630,631,677,695,727,751,799,911,977,983,984],"uri":[106,107,498,704,705,706,707,708,709,747,763,803,1053]," li":[108,154,182,183,184,185,203,212,256,263,264,302,303,304,305,337,338,339,340,341,342,343,344,345,346,347,348,349,350,362,398,471,472,473,474,475,476,477,478,479,480,493,494,495,496,497,498,499,500,501,502,503,522,523,524,525,526,561,562,563,564,565,566,567,568,579,580,581,582,601,602,605,653,654,689,698,741,787,840,885,886,887,888,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,945,946,981,982,983,984,985,986,987,988,989,990,991,1068,1069,1132,1139,1140,1141],"ao ":[108,203,1068,1132],"iao":[108,203,1068,1132],"lia":[108,203,1068,1132],"efi":[109,743],"fit":[109,743],"ref":[109,743,868]," su":[111,118,148,167,168,169,170,187,227,228,259,269,351,354,359,360,361,362,363,364,365,366,389,390,391,392,393,394,471,472,473,474,475,476,477,478,479,480,481,482,485,486,487,509,577,578,579,580,581,582,636,641,671,672,673,764,765,766,767,768,769,770,771,772,804,805,829,830,831,832,833,834,835,836,889,890,891,892,893,894,895,936,943,966,1000,1052,1053,1057,1058,1059,1060,1105,1128,1129],"ppo":[111,118,167,168,169,170,187,227,228,269,354,359,360,361,362,363,364,365,366,389,390,391,392,393,394,471,472,473,474,475,476,477,478,479,480,481,482,485,486,487,509,577,578,579,580,581,582,636,641,671,672,673,764,765,766,767,768,769,770,771,772,805,829,830,831,832,833,834,835,836,889,890,891,892,893,894,895,936,943,1000,1017,1052,1053,1057,1058,1059,1060,1105,1128,1129],"sup":[111,118,148,167,168,169,170,187,227,228,259,269,351,354,359,360,361,362,363,364,365,366,389,390,391,392,393,394,471,472,473,474,475,476,477,478,479,480,481,482,485,486,487,509,577,578,579,580,581,582,636,641,671,672,673,764,765,766,767,768,769,770,771,772,805,829,830,831,832,833,834,835,836,889,890,891,892,893,894,895,936,943,966,1000,1052,1053,1057,1058,1059,1060,1105,1128,1129],"upp":[111,118,167,168,169,170,187,227,228,269,354,359,360,361,362,363,364,365,366,389,390,391,392,393,394,471,472,473,474,475,476,477,478,479,480,481,482,485,486,487,509,577,578,579,580,581,582,636,641,671,672,673,764,765,766,767,768,769,770,771,772,805,829,830,831,832,833,834,835,836,889,890,891,892,893,894,895,936,943,1000,1052,1053,1057,1058,1059,1060,1105,1128,1129],"bel":[112,113,114],"llo":[112,113,114,1112,1113,1114,1115,1116],"lon":[112,113,114,661,662,663],"ona":[112,113,114,268,269,270,289,290,291,292,293,294]," la":[113,168,169,200,201,202,206,396,412,456,499,519,559,560,670,673,688,696,731,872,916,974,986,993,1104],"ase":[113,168,169,178,201,202,206,304,396,412,413,456,560,670,673,696,872,974,986],"ser":[113,168,169,201,202,206,256,396,397,398,399,400,401,402,403,404,405,406,407,408,409,412,456,560,670,673,696,872,974,986]," bl":[115,116,117],"bli":[115,116,117,363,364,365,366,367,368,369,370,371],"izz":[115,116,117],"liz":[115,116,117],"rd ":[115,116,117,149],"zar":[115,116,117,149],"zza":[115,116,117,149],"bla":[116,648],"ck ":[116,129,155,156,157,158,159,160,161,162,210,211,212,306,307,308,309,310,311,515,516,520,521,563,564,565,566,567,568,574,575,576,584,585,586,587,588,589,601,602,704,705,706,707,708,709,761,762,763,776,777,812,821,944,1058,1087,1088,1089,1090,1091,1092,1093,1094]," bo":[118,119,120,121,122,123,124,125,126,127,168],"bok":[118],"kku":[118],"kus":[118],"okk":[118],"su ":[118],"usu":[118]," ro":[119,120,121,122,123,147,221,254,331,567,690,834,842,844,845,846,847,848,849,850,851,852,1077,1125],"bol":[119,120,121,122,123,124,125,126,127,245,314,385,409,418,514,562,925],"la ":[119,120,121,122,123,124,125,126,127,717,718,719,720,721,722,723],"lla":[119,120,121,122,123,124,125,126,127,336,717,718,719,720,721,722,723],"oll":[119,120,121,122,123,124,125,126,127,792,793],"ots":[119,120,121,122,123],"ts ":[119,120,121,122,123],"inu":[124,125],"mmi":[124],"nus":[124,125,126],"omm":[124,166,189,192,193,194,324,325,326,327,328,329,330,331,332,625,667,668,669,670,730,731,794,811,844,845,846,847,848,964,1016,1042],"us ":[124,125,126,127,130,131,132,133,134,295,296,297,298,299,355,356,447,448,449,450,451,452,475,644,750,751,752,753,754,755,756,757,758,759,760]," do":[125,268,269,270,1062],"dom":[125],"omi":[125]," in":[126,127,157,158,317,363,364,365,366,403,481,482,483,484,577,578,617,622,629,641,680,725,817,837,838,839,840,841,842,843,867,901,933,936,969,973,1005,1006,1007,1039,1040,1044,1052,1053,1111,1128,1129],"ern":[126],"fer":[126,302,303,304,305,402],"inf":[126,157,158,241,363,364,365,366,481,482,483,484,577,578,617,629,641,680,725,837,838,839,840,841,842,843,901,936,1005,1006,1007,1039,1040,1052,1053,1128,1129],"nfe":[126],"rnu":[126],"ctu":[127],"ict":[127,317,817,867,933,969,973,1111],"inv":[127],"nvi":[127],"tus":[127,130,131,132,133,134,447,448,449,450,451,452],"vic":[127]," br":[128,129,130,131,132,133,134]," mo":[128,129,260,261,262,309,415,416,417,418,419,420,421,442,443,444,445,446,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,794,811,889,890,891,892,893,894,895,1042],"adq":[128,129,655,656,657,658,659,660],"bil":[128,129,655,656,657,658,659,660,661,662,663,794,811,889,890,891,892,893,894,895,1042],"bro":[128,129],"dqu":[128,129,655,656,657,658,659,660],"ead":[128,129,655,656,657,658,659,660],"ing":[128,129,266,279,280,281,282,283,284,398,465,563,564,565,566,567,568,650,667,668,669,670,725,816,817,818,819,820,1005,1006,1007,1039,1040],"mob":[128,129,655,656,657,658,659,660,661,662,663,794,811,889,890,891,892,893,894,895,1042],"ng ":[128,129,266,282,283,284,398,416,563,564,565,566,567,568,650,661,662,663,725,816,817,818,819,820,1005,1006,1007,1019,1039,1040],"nin":[128,129,465,563,564,565,566,567,568,667,668,669,670],"obi":[128,129,655,656,657,658,659,660,661,662,663,794,811,889,890,891,892,893,894,895,1042],"own":[128,129],"qua":[128,129,655,656,657,658,659,660,733,811],"rte":[128,129,229,230,231,232,233,234,387,388,616,617,655,656,657,658,659,660,968,969],"uar":[128,129,655,656,657,658,659,660],"wni":[128,129],"alf":[129],"hal":[129,167,168,169,170,171,172,173,174,175,176,764,765],"bru":[130,131,132,133,134],"rut":[130,131,132,133,134],"utu":[130,131,132,133,134]," hp":[131,146,595,669,886],"hpp":[131,146,595,886],"ppc":[131,133,134,146,253,411,436,500,548,595,605,689,840,886,899,900,901,902,903,904,905,1115]," pp":[133,134,253,411,436,500,548,605,689,840,899,900,901,902,903,904,905,1115]," bu":[135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,647],"bul":[135,136,137,138,139,140,141,142,143,144,647],"dog":[135,136,137,138,139,140,141,142],"ldo":[135,136,137,138,139,140,141,142],"lld":[135,136,137,138,139,140,141,142],"ull":[135,136,137,138,139,140,141,142,374,375,376,647,744],"ac2":[136,737,1064],"c2 ":[136,737,1064]," ce":[137,163,164,165,166,236,401,455,476,494,729,739,996,1066],"cel":[137,236,401,455,476,494,729,739,996,1066],"ll ":[137,139,236,272,350,401,442,443,444,445,446,455,476,477,494,654,656,659,703,729,739,744,996,1026,1066]," ch":[138,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,495,696],"al ":[138,144,147,150,151,169,177,178,179,180,181,191,221,254,330,331,338,339,340,341,342,343,344,345,346,347,348,349,487,495,505,506,556,567,646,647,648,649,650,690,696,797,811,834,842,935,938,1007,1042,1047,1077,1125,1129],"cal":[138,169,495,505,506,646,647,648,649,650,696,811,1042],"emi":[138,169,495,696],"ica":[138,169,495,505,506,646,647,648,649,650,696,811,1042],"mic":[138,169,495,696]," er":[139,179,272,286,334,477,564,565,654,838],"erl":[139,272,477,654,1012,1013,1014,1015],"rll":[139,272,477,654],"ark":[143,144,603,604,605,606,607,608],"lwa":[143,144],"rk ":[143,144],"ulw":[143,144],"  o":[144,191,330,374,375,376,487,488,489,490,491,492,556,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,797,935,938,1007,1047,1121,1122,1123,1124]," or":[144,191,330,487,488,489,490,491,492,556,710,711,797,935,938,1007,1047],"gin":[144,191,282,283,284,330,353,354,487,556,797,935,938,1007,1047],"igi":[144,191,330,487,556,797,935,938,1007,1047],"ina":[144,150,151,191,330,403,487,556,797,935,938,1007,1044,1047],"nal":[144,150,151,191,330,487,556,797,935,938,1007,1047],"ori":[144,191,330,487,522,523,524,525,526,556,794,797,935,938,1007,1047,1062],"rig":[144,191,330,487,556,671,672,673,797,935,938,1007,1047]," de":[145,146,147,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,552,553,645,724,728,729,730,731,732,733,734,735,744,795,796,797,957,958,959,960,961,1062,1076],"bur":[145,146,147,148],"def":[145,146,147,238,552,553,645,724,728,729,730,731,732,733,734,735,744,1076],"efe":[145,146,147,238,552,553,645,724,728,729,730,731,732,733,734,735,744,1076],"fen":[145,146,147,238,301,552,553,645,724,728,729,730,731,732,733,734,735,744,1076],"nse":[145,146,147,395,552,553,645,724,728,729,730,731,732,733,734,735,744,1076],"rke":[145,146,147,148],"se ":[145,146,147,178,208,209,263,264,269,286,395,503,519,552,553,645,724,728,729,730,731,732,733,734,735,744,759,993,1076],"urk":[145,146,147,148],"oya":[147,221,254,331,567,690,834,842,1077,1125],"roy":[147,221,254,331,567,690,795,796,797,834,842,957,958,959,960,961,1077,1125],"yal":[147,221,254,331,567,690,834,842,1077,1125],"erh":[148,259,351,966,1108],"rhe":[148,259,351,966],"upe":[148,259,351,966],"buz":[149],"uzz":[149],"din":[150,151,279,280,281,692,693,724,854,855,856,857,858,859,860,861]," ra":[151,162,549,597,733,734,772,801,816,817,818,819,820,825,827,922,1050,1071,1116],"af ":[151,801],"arn":[152,153,154,530,531,532,533,534,535,536,537,538],"ivo":[152,153,154],"niv":[152,153,154],"re ":[152,153,154,354,359,360,361,362,390,391,412,485,486,487,590,591,592,593,594,595,596,597,598,599,600,636,671,672,673,829,830,831,832,833,834,835,836,889,890,891,892,893,894,895,1000,1110],"rni":[152,153,154,667,668,669,670],"vor":[152,153,154],"lin":[154,167,168,169,170,363,364,365,366,367,368,369,370,371,885,886,887,888],"nd ":[154,189,192,193,194,324,325,326,327,328,329,330,331,332,442,443,444,445,446,625,667,668,669,670,730,731,794,811,849,850,851,852,1008,1009,1010,1011,1016,1042,1100,1101,1102],"ne ":[154,213,267,312,313,314,464,465,761,762,763,885,886,887,888,1012,1013,1014,1015,1042,1121,1122,1123,1124],"ond":[154,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209],"sec":[154,803],"alr":[155,156,157,158,159,160,161,162,466],"ava":[155,156,157,158,159,160,161,162,466,642,643,866,867,868,869],"cav":[155,156,157,158,159,160,161,162,466],"cop":[155,156,157,158,159,160,161,162,214,215,216,217,268,269,270,559,970,971,972,973,974,975,1087,1088,1089,1090,1091,1092,1093,1094,1095],"eli":[155,156,157,158,159,160,161,162,214,215,216,217,268,269,270,559,796,970,971,972,973,974,975,1062,1087,1088,1089,1090,1091,1092,1093,1094,1095],"hel":[155,156,157,158,159,160,161,162,214,215,216,217,268,269,270,559,970,971,972,973,974,975,1087,1088,1089,1090,1091,1092,1093,1094,1095],"ico":[155,156,157,158,159,160,161,162,214,215,216,217,268,269,270,559,590,591,592,593,594,595,596,597,598,599,600,970,971,972,973,974,975,1087,1088,1089,1090,1091,1092,1093,1094,1095],"lic":[155,156,157,158,159,160,161,162,214,215,216,217,268,269,270,559,970,971,972,973,974,975,1087,1088,1089,1090,1091,1092,1093,1094,1095],"lry":[155,156,157,158,159,160,161,162,466],"opt":[155,156,157,158,159,160,161,162,214,215,216,217,268,269,270,559,970,971,972,973,974,975,1087,1088,1089,1090,1091,1092,1093,1094,1095],"pte":[155,156,157,158,159,160,161,162,214,215,216,217,268,269,270,559,970,971,972,973,974,975,1087,1088,1089,1090,1091,1092,1093,1094,1095],"tac":[155,156,157,158,159,160,161,162,505,506,515,516,520,521,563,564,565,566,567,568,584,585,586,587,588,589,601,602,646,647,648,649,650,704,705,706,707,708,709,761,762,763,776,777,811,821,944,1042,1058,1087,1088,1089,1090,1091,1092,1093,1094],"tta":[155,156,157,158,159,160,161,162,515,516,520,521,563,564,565,566,567,568,584,585,586,587,588,589,601,602,704,705,706,707,708,709,761,762,763,776,777,821,944,1058,1087,1088,1089,1090,1091,1092,1093,1094],"val":[155,156,157,158,159,160,161,162,182,183,184,185,466,1054],"ant":[157,210,211,212,336,363,364,365,366,429,481,482,483,484,577,578,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,617,629,641,680,691,717,725,812,837,838,839,840,841,842,843,901,936,1005,1006,1007,1039,1040,1052,1053,1128,1129],"fan":[157,363,364,365,366,481,482,483,484,577,578,617,629,641,680,725,837,838,839,840,841,842,843,901,936,1005,1006,1007,1039,1040,1043,1044,1052,1053,1128,1129],"nfa":[157,363,364,365,366,481,482,483,484,577,578,617,629,641,680,725,837,838,839,840,841,842,843,901,936,1005,1006,1007,1039,1040,1052,1053,1128,1129],"ntr":[157,267,363,364,365,366,481,482,483,484,577,578,617,629,641,680,725,837,838,839,840,841,842,843,901,936,1005,1006,1007,1039,1040,1052,1053,1128,1129],"try":[157,363,364,365,366,481,482,483,484,577,578,617,629,641,680,725,837,838,839,840,841,842,843,901,936,1005,1006,1007,1039,1040,1052,1053,1128,1129],"ato":[158,258,259,795,796,797,822,823,824,825,826,827,828],"fil":[158],"ilt":[158,889,890,891,892,893,894,895],"ltr":[158,204,386,748,858,889,890,891,892,893,894,895,926,1072],"nfi":[158],"rat":[158,507,508,509,712,713,714,715,716,794],"tor":[158,258,259,317,374,375,376,442,443,444,445,446,630,794,795,796,797,811,817,822,823,824,825,826,827,828,867,933,969,973,1057,1058,1059,1060,1111],"ain":[162,579,580,581,582,779,780,781,782,798,799,800,801,802,803,804,805,806],"cad":[162],"den":[162,613,614,615,915,939,940,941],"enc":[162],"in ":[162,167,168,169,170,186,187,363,364,365,366,367,368,369,370,371,554,579,580,581,582,692,693,724,798,799,800,801,802,803,804,805,806,854,855,856,857,858,859,860,861],"ar ":[163,164,165,166,229,230,231,232,233,234,268,269,270,279,280,281,309,315,316,317,318,485,486,487,493,494,495,496,497,498,499,500,501,502,503,555,556,667,668,669,670,674,831,906,907,908,909,910,911,912,967,1008,1009,1010,1011,1076,1078],"cen":[163,164,165,166,862,863,864,865],"ede":[163,164,165,166,542,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075],"ent":[163,164,165,166],"ipe":[163,164,165,166,421,965],"nti":[163,164,165,166,590,591,592,593,594,595,596,597,598,599,600,601,602,629,680,691,717,901],"ped":[163,164,165,166],"tip":[163,164,165,166,263,264],"do ":[166,1018],"man":[166,189,192,193,194,324,325,326,327,328,329,330,331,332,390,391,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,625,667,668,669,670,730,731,779,780,781,782,794,811,964,1016,1042],"mma":[166,189,192,193,194,324,325,326,327,328,329,330,331,332,625,667,668,669,670,730,731,794,811,964,1016,1042],"ndo":[166,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209],"alc":[167,168,169,170,300],"cha":[167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,413,812,813,814,815],"chi":[167,168,169,170,390,391,885,886,887,888,889,890,891,892,893,894,895],"hiu":[167,168,169,170],"hto":[167,168,169,170],"iuh":[167,168,169,170],"lch":[167,168,169,170],"oli":[167,168,169,170,235,236,237,238,239,240,241,242,243,244,245,246],"tot":[167,168,169,170,765,784,848,918,964,1029],"uht":[167,168,169,170],"bas":[168,620],"bom":[168]," mb":[171,172,173,174,175,176,295,296,297,298,299,387,388,395,547,548,549,606,607,608,613,614,615,664,665,666,966]," xv":[171,176],"bt ":[171,172,173,174,175,176,295,296,297,298,299,387,388,395,547,548,549,606,607,608,613,614,615,664,665,666,966],"eng":[171,172,173,174,175,176,282,283,284],"len":[171,172,173,174,175,176],"mbt":[171,172,173,174,175,176,295,296,297,298,299,387,388,395,547,548,549,606,607,608,613,614,615,664,665,666,966],"nge":[171,172,173,174,175,176,816,817,818,819,820,1025],"xv ":[171]," xi":[173,174,175],"xi ":[173],"xii":[174],"ivs":[175],"vs ":[175],"xiv":[175],"vc ":[176],"xvc":[176],"apa":[177,178,179,180,181],"hap":[177,178,179,180,181],"mis":[177,178,179,180,181,397,398,399,400,401,402,403,404,405,406,407,408,409,505,506,507,508,509,510,511,512,513,514,519,522,523,524,525,526,717,753,770,908,937,938,993],"par":[177,178,179,180,181,466,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744],"ral":[177,178,179,180,181],"rra":[177,178,179,180,181,798,799,800,801,802,803,804,805,806],"sil":[177,178,179,180,181,397,398,399,400,401,402,403,404,405,406,407,408,409,505,506,507,508,509,510,511,512,513,514,519,647,717,753,770,908,937,938,993],"ssi":[177,178,179,180,181,197,397,398,399,400,401,402,403,404,405,406,407,408,409,505,506,507,508,509,510,511,512,513,514,519,717,753,770,804,908,937,938,993],"cas":[178],"erm":[179,303,564,622,838],"ml ":[179,184,219,244,273,407,420,430,512,516,543,564,700,715,754,833,838,920],"rml":[179,564,838],"ali":[182,183,184,185,301,1054],"eva":[182,183,184,185,258,259,542],"ght":[182,183,184,185,256,263,264,302,303,304,305,337,338,339,340,341,342,343,344,345,346,347,348,349,350,362,471,472,473,474,475,476,477,478,479,480,493,494,495,496,497,498,499,500,501,502,503,522,523,524,525,526,561,562,563,564,565,566,567,568,579,580,581,582,601,602,605,653,654,686,687,688,689,690,698,725,741,787,816,817,818,819,820,840,887,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,945,946,981,982,983,984,985,986,987,988,989,990,991,1005,1006,1007,1039,1040,1062,1069,1139,1140,1141],"hev":[182,183,184,185],"ht ":[182,183,184,185,256,263,264,302,303,304,305,337,338,339,340,341,342,343,344,345,346,347,348,349,350,362,471,472,473,474,475,476,477,478,479,480,493,494,495,496,497,498,499,500,501,502,503,522,523,524,525,526,561,562,579,580,581,582,601,602,605,653,654,689,698,741,787,840,887,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,945,946,981,982,983,984,985,986,987,988,989,990,991,1062,1069,1139,1140,1141],"igh":[182,183,184,185,256,263,264,302,303,304,305,337,338,339,340,341,342,343,344,345,346,347,348,349,350,362,471,472,473,474,475,476,477,478,479,480,493,494,495,496,497,498,499,500,501,502,503,522,523,524,525,526,561,562,563,564,565,566,567,568,579,580,581,582,601,602,605,653,654,686,687,688,689,690,698,725,741,787,816,817,818,819,820,840,887,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,945,946,981,982,983,984,985,986,987,988,989,990,991,1005,1006,1007,1039,1040,1062,1069,1139,1140,1141],"lie":[182,183,184,185],"lig":[182,183,184,185,256,263,264,302,303,304,305,337,338,339,340,341,342,343,344,345,346,347,348,349,350,362,471,472,473,474,475,476,477,478,479,480,493,494,495,496,497,498,499,500,501,502,503,522,523,524,525,526,561,562,563,564,565,566,567,568,579,580,581,582,601,602,605,653,654,689,698,741,787,840,887,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,945,946,981,982,983,984,985,986,987,988,989,990,991,1062,1069,1139,1140,1141]," mm":[184,244,273,407,420,430,512,516,700,754],"mml":[184,244,273,407,420,430,512,516,700,754],"eed":[185,408,513,1010],"pee":[185,408,513,1010],"spe":[185,408,513,703,712,1010,1110]," ci":[186,187,667,668,669,670],"ciz":[186,187],"izi":[186,187],"zin":[186,187],"bra":[188,189,190,191],"cob":[188,189,190,191],"obr":[188,189,190,191],"ra ":[188,189,190,191,204,386,483,484,748,858,926,934,935,1072,1098]," ma":[190,350,406,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,651,652,866,867,868,869,873,928,1006,1026],"ash":[190,651,652,873,931,932,933,1109,1110,1111],"mas":[190,651,652,866,867,868,869,873,931,932,933,1006],"sh ":[190,377,651,652,873,931,932,933]," va":[192,193,194,429,1054,1055,1056],"an ":[192,193,194,237,260,261,262,336,390,391,406,541,558,573,603,604,605,606,607,608,634,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,747,768,779,780,781,782,794,823,856,897,967,1002,1003,1004,1023,1039,1040,1045,1046,1047,1048,1049,1050,1051],"van":[192,193,194,646,647,648,649,650,866,867,868,869,934,935,1005,1006,1007]," ic":[193,497,576,656,657,658,714,812,813,814,815,1009,1010,1011,1040],"ice":[193,497,576,656,657,658,714,1009,1010,1011,1040],"  q":[194,733,811]," q ":[194],"dor":[195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,1062]," fi":[197,354,359,360,361,362,390,391,485,486,487,631,636,671,672,673,725,816,817,818,819,820,829,830,831,832,833,834,835,836,889,890,891,892,893,894,895,964,1005,1006,1007,1039,1040,1041],"fis":[197],"sio":[197,199,490,551,621,697,804]," fu":[199,222,319,320,321,322,323,324,325,326,327,328,329,330,331,332,401,490,551,621,697],"fus":[199,490,551,621,697],"usi":[199,490,551,621,697]," ul":[204,386,748,858,926,1072]," mu":[208,209,263,264,676,677,678,798,799,800,801,802,803,804,805,806]," pu":[208,209,286,289,290,291,292,293,294,503,759,807,808,809,810],"lti":[208,209,263,264,387,388,618,619,620,621,622,623,798,799,800,801,802,803,804,805,806],"mul":[208,209,263,264,798,799,800,801,802,803,804,805,806],"ose":[208,209,263,264,269],"pos":[208,209,263,264],"pur":[208,209,263,264,289,290,291,292,293,294],"rpo":[208,209,263,264],"ti ":[208,209,629,680,691,717,798,799,800,801,802,803,804,805,806,901],"urp":[208,209,263,264],"act":[209,394,505,506,630,646,647,648,649,650,811,1042],"cti":[209,394,505,506,646,647,648,649,650,811,868,1042],"eac":[209,394],"ive":[209,238,357,358,394,868],"rea":[209,276,281,394,470,782,930,941,1035],"tiv":[209,394,868],"ve ":[209,238,357,358,394,868],"coo":[210,211,212,812],"lan":[210,211,212,237,336,541,626,634,731,764,765,768,812,823,856,1012,1013,1014,1015,1023],"nt ":[210,211,212,336,429,812,970,971,972,973,974,975],"ola":[210,211,212,812],"ool":[210,211,212,812],"ruc":[210,211,212,306,307,308,309,310,311,574,575,576,812],"tru":[210,211,212,306,307,308,309,310,311,574,575,576,812],"uck":[210,211,212,306,307,308,309,310,311,574,575,576,812,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086]," 13":[212]," k ":[212,223,491],"135":[212],"35 ":[212],"ave":[212],"esa":[212],"fes":[212],"ife":[212],"lif":[212],"sav":[212,866,867,868,869]," cr":[213,214,215,216,217,519,968,969,993],"ane":[213,1012,1013,1014,1015],"cro":[214,215,216,217]," dr":[215,267,271,272,273,274,275,276,277,278,464,465],"ago":[215],"dra":[215,483,484,934,935],"fly":[215],"gon":[215],"ly ":[215],"nfl":[215],"onf":[215],"rag":[215],"c3 ":[216,231,511,580,685,738,752,861,865,907,912,971,978,1032,1046]," ex":[217],"exp":[217],"xpo":[217]," cy":[218,219,220,221,222]," gu":[218,219,220,221,222,264,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,415,416,417,418,419,420,421,453,454,455,456,457,458,459,460,461,462,530,1112,1113,1114,1115,1116],"ano":[218,219,220,221,222],"cyr":[218,219,220,221,222],"gun":[218,219,220,221,222,264,377,378,379,380,381,382,383,384,385,386,415,416,417,418,419,420,421,453,454,455,456,457,458,459,460,461,462,530,1112,1113,1114,1115,1116],"hip":[218,219,220,221,222,264,415,416,417,418,419,420,421,466,530,1112,1113,1114,1115,1116],"ip ":[218,219,220,221,222,264,415,416,417,418,419,420,421,530,1112,1113,1114,1115,1116],"no ":[218,219,220,221,222,583,829,830,831,832,833,834,835,836],"nsh":[218,219,220,221,222,264,415,416,417,418,419,420,421,530,1112,1113,1114,1115,1116],"shi":[218,219,220,221,222,264,415,416,417,418,419,420,421,521,530,641,937,938,1112,1113,1114,1115,1116],"uns":[218,219,220,221,222,264,415,416,417,418,419,420,421,530,1112,1113,1114,1115,1116],"yra":[218,219,220,221,222]," ml":[219,543,715,833,920],"fur":[222,324,325,326,327,328,329,330,331,332],"ury":[222,324,325,326,327,328,329,330,331,332],"  6":[223,224,225,226]," 67":[223,224,225,226]," hq":[223,224,225,226,463,794,811,871,1042],"67 ":[223,224,225,226],"aim":[223,224,225,226],"dai":[223,224,225,226],"hq ":[223,224,225,226,463,794,811,871,1042],"imy":[223,224,225,226],"myo":[223,224,225,226],"yo ":[223,224,225,226,285,286,287,288]," k2":[224],"k2 ":[224],"  n":[225,431,683,684,685,686,687,688,689,690,691,988,1070]," nc":[225],"nc ":[225]," r ":[226,526],"ai ":[227,228],"dan":[227,228],"dar":[229,230,231,232,233,234,1076]," ec":[232,599,602,640,686,687,688,689,690,800,836,1127],"cm ":[232,602,640,686,687,688,689,690,800],"ecm":[232,640,686,687,688,689,690,800],"m2 ":[234,637,665,716,962,963,1126],"rm2":[234,637,716,1126],"dem":[235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255],"her":[235,236,237,238,239,240,241,242,243,244,245,246,519,538,936,993],"ish":[235,236,237,238,239,240,241,242,243,244,245,246,485,486,487],"mol":[235,236,237,238,239,240,241,242,243,244,245,246,664,665,666],"she":[235,236,237,238,239,240,241,242,243,244,245,246,936]," cl":[237,269,541,634,768,856,1023],"cla":[237,541,634,768,856,1023],"nsi":[238],"siv":[238]," ga":[239,261,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,362,486,521,579,580,581,582,648,698,741,787,790,845,887,898,997,1069],"aus":[239,261,362,486,521,648,698,741,787,790,845,887,898,997,1069],"gau":[239,261,362,486,521,579,580,581,582,648,698,741,787,790,845,887,898,997,1069],"ss ":[239,261,362,486,521,648,698,741,787,790,845,887,898,997,1069],"uss":[239,261,362,486,521,648,698,741,787,790,845,887,898,997,1069]," mr":[240,675,755,863,921,1033],"mrm":[240,675,755,863,921,1033],"ced":[241,646,647,648,649,650,934,935],"ein":[241,999],"for":[241,312,313,314,396,397,398,399,400,401,402,403,404,405,406,407,408,409,889,890,891,892,893,894,895],"nfo":[241],"orc":[241],"rce":[241],"rei":[241]," th":[245,314,384,385,409,418,514,562,591,723,925,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028],"der":[245,314,385,409,418,514,562,925,964],"erb":[245,314,385,409,418,514,562,925],"hun":[245,314,385,409,418,471,472,473,474,475,476,477,478,479,480,514,562,925,928,942,943],"nde":[245,314,385,409,418,514,562,925,964],"olt":[245,314,385,409,418,514,562,664,665,666,925],"rbo":[245,314,385,409,418,514,562,925],"thu":[245,314,384,385,409,418,514,562,723,925,1024,1025,1026,1027,1028],"und":[245,314,385,409,418,442,443,444,445,446,514,562,849,850,851,852,925],"mon":[247,248,249,250,251,252,253,254,255,374,375,376,442,443,444,445,446,583,725]," ri":[249,837,838,839,840,841,842,843,923],"fle":[249,868,923],"ifl":[249,923],"rif":[249,923,936]," hg":[251],"gr ":[251,1055,1056],"hgr":[251],"hor":[252,1020,1021,1022,1023],"ned":[252,915],"rne":[252]," cx":[255,332,568],"cx ":[255,332,568],"des":[256,257,795,796,797,957,958,959,960,961],"ert":[256,320,321,322,323,356,527,528,779,780,781,782,822,823,824,825,826,827,828,874,875,876,877,878,879,880,881,882,883,884,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127],"ese":[256],"orp":[256,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927],"pio":[256,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927],"rpi":[256,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927]," si":[257,382,647,1018],"ege":[257,382,1018],"est":[257,447,448,449,450,451,452,540,541,542,543,544,545,546,795,796,797,811,957,958,959,960,961,1018],"ge ":[257,301,382,1018],"ieg":[257,382,1018],"sie":[257,382,1018],"dev":[258,259,542],"tat":[258,259,681],"vas":[258,259]," di":[260,261,262,263,264,265,266,267],"di ":[260,261,262,263,264,265,266,944],"gan":[260,261,262],"org":[260,261,262],"rga":[260,261,262],"ipu":[263,264],"chm":[265,266],"hmi":[265,266],"itt":[265,266],"mit":[265,266,651,652,653,654,906,907,908,909,910,911,912],"sch":[265,266,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905],"tt ":[265,266],"arg":[266,305,650,762,856,1009,1055,1056],"eti":[266,650],"get":[266,650],"mpu":[266,650],"omp":[266,625,650,668,730],"put":[266,650],"rge":[266,650],"tar":[266,309,485,486,487,650,667,668,669,670,674,906,907,908,909,910,911,912,1078],"tin":[266,650,725,816,817,818,819,820,1005,1006,1007,1039,1040],"ute":[266,650],"dig":[267],"dro":[267,464,465,1121,1122,1123,1124],"ggs":[267],"gs ":[267],"igg":[267,353,354],"one":[267,464,465,1121,1122,1123,1124],"ont":[267,694,695,696,697,698,699,700,701,702,703],"rol":[267],"tro":[267,383,795,796,797,889,890,891,892,893,894,895,957,958,959,960,961,975,1096],"don":[268,269,270,679,680,681,682],"nar":[268,269,270,403,684,685,758,988,1044],"clo":[269],"los":[269,958],"dri":[271,272,273,274,275,276,277,278],"lls":[271,272,273,274,275,276,277,278],"lso":[271,272,273,274,275,276,277,278],"ril":[271,272,273,274,275,276,277,278],"ak ":[276,281,470,782,930,941,1035],"eak":[276,281,470,782,930,941,1035],"tre":[276,281,470,540,541,542,543,544,545,546,782,930,941,1035,1110]," el":[279,280,281,740,775,796]," sl":[279,280,281,545,835,869,955,956,1012,1013,1014,1015],"eld":[279,280,281,631,964,1041],"gar":[279,280,281,351,352,493,494,495,496,497,498,499,500,501,502,503,831],"ldi":[279,280,281],"nga":[279,280,281,527,528,529],"sle":[279,280,281,955,956,1012,1013,1014,1015]," hm":[280]," hu":[280,467,468,469,470,471,472,473,474,475,476,477,478,479,480,744,928],"hmm":[280],"hum":[280,384,723,1024,1025,1026,1027,1028],"hv ":[280,784,785],"mho":[280],"mhv":[280],"mmh":[280],"ov ":[280,530,531,532,533,534,535,536,537,538,1130,1131,1132,1133],"umh":[280]," en":[282,283,284,285,286,287,288,429],"eer":[282,283,284,676,677,678],"eri":[282,283,284,538,936],"nee":[282,283,284],"ngi":[282,283,284],"rin":[282,283,284,761,762,763,970,971,972,973,974,975],"eny":[285,286,287,288],"nyo":[285,286,287,288],"lse":[286,503,759],"pul":[286,503,759],"uls":[286,503,759]," sh":[287,521,641,931,932,933,934,935,936,937,938,939,940,941,942,943],"ef ":[287],"hol":[287,383],"lef":[287],"ole":[287],"sho":[287,939,940,941]," ep":[289,290,291,292,293,294],"epo":[289,290,291,292,293,294],"pon":[289,290,291,292,293,294,436,1096],"rsu":[289,290,291,292,293,294],"sui":[289,290,291,292,293,294],"uit":[289,290,291,292,293,294,467,468,469,470],"urs":[289,290,291,292,293,294]," eu":[295,296,297,298,299],"eur":[295,296,297,298,299,993,994,995,996,997,998,999,1000,1001],"rus":[295,296,297,298,299],"uru":[295,296,297,298,299],"fal":[300],"lco":[300]," fe":[301,302,303,304,305,402]," wi":[301,304,1008,1009,1010,1011,1103,1104,1105,1106,1107,1108],"ige":[301,1029,1030],"lir":[301],"nsa":[301],"sal":[301,854,855,856,857,858,859,860,861],"wig":[301],"err":[302,303,304,305,402,798,799,800,801,802,803,804,805,806],"et ":[302,303,304,305,647,929,930,982,1112,1113,1114,1115,1116,1129],"ret":[302,303,304,305,1129],"rre":[302,303,304,305,1129],"mi ":[303,684,685,1038],"rmi":[303,679,680,681,682]," we":[304,436,982,1096],"eas":[304],"ild":[304,885,886,887,888],"ld ":[304,383,631,964,1041],"wea":[304,436,1096],"wil":[304],"go ":[305,762,856,1009],"rgo":[305,762,856,1009],"atb":[306,307,308,309,310,311],"bed":[306,307,308,309,310,311],"lat":[306,307,308,309,310,311,396,397,398,399,400,401,402,403,404,405,406,407,408,409,822,823,824,825,826,827,828,889,890,891,892,893,894,895],"tbe":[306,307,308,309,310,311],"rta":[309,320,321,322,323,356,527,528,674,779,780,781,782,822,823,824,825,826,827,828,874,875,876,877,878,879,880,881,882,883,884,1041,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127]," rl":[310,346,566,851,1014],"rl ":[310,346,566,851,1014]," fo":[312,313,314,315,316,317,318],"rtu":[312,313,314],"tun":[312,313,314,849,850,851,852],"une":[312,313,314,1042],"3m ":[313,325,388,593,632,903,949],"c3m":[313,325,388,593,632,903,949],"fox":[315,316,317,318],"ox ":[315,316,317,318],"cto":[317,630,817,867,933,969,973,1057,1058,1059,1060,1111],"erd":[317,817,867,933,969,973,1111],"int":[317,622,776,777,817,867,933,969,970,971,972,973,974,975,1108,1111],"nte":[317,471,472,473,474,475,476,477,478,479,480,584,585,586,587,588,589,622,817,867,928,933,969,973,1108,1111]," vs":[318],"sp ":[318],"vsp":[318],"cru":[319,320,321,322,323,519,993],"ful":[319,320,321,322,323],"lcr":[319,320,321,322,323],"rum":[319,320,321,322,323],"ulc":[319,320,321,322,323],"3s ":[326,594,633],"c3s":[326,594,633],"iim":[329],"im ":[329,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641]," 17":[332],"17 ":[332],"abr":[333,334,335],"gab":[333,334,335],"iel":[333,334,335,631,964,1041],"rsl":[334,565],"sl ":[334,545,565,835,869]," td":[335],"df ":[335],"tdf":[335]," ur":[336,530,531,532,533,534,535,536,537,538,967,1045,1046,1047,1048,1049,1050,1051],"gal":[336,337,338,339,340,341,342,343,344,345,346,347,348,349,350],"rba":[336,967,1045,1046,1047,1048,1049,1050,1051],"urb":[336,967,1045,1046,1047,1048,1049,1050,1051],"eon":[337,338,339,340,341,342,343,344,345,346,347,348,349,350],"leo":[337,338,339,340,341,342,343,344,345,346,347,348,349,350]," 10":[338,339,340,341,342,343,344,1041,1063,1087],"00 ":[338,345,346,349,517,1041,1079],"100":[338,1041,1079],"02 ":[339],"102":[339],"03 ":[340],"103":[340],"04 ":[341],"104":[341],"05 ":[342,807],"105":[342],"06 ":[343],"106":[343,344],"06m":[344],"6m ":[344]," 20":[345,346,347,348],"200":[345,346,347],"00r":[347],"0r ":[347],"01 ":[348,518],"201":[348],"  3":[349,360,473,506,532,554,568,570,592,628,677,695,727,751,799,911,977,983,984]," 30":[349,360,473,506,532,570,592,628,677,695,751,977,983,984],"300":[349],"axw":[350,1026],"max":[350,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,1026],"wel":[350,1026],"xwe":[350,1026],"ot ":[351],"aru":[352,684,685],"da ":[352,792,793,849,850,851,852,945,946,1006],"rud":[352],"uda":[352]," gi":[353,354,1000],"ggi":[353,354],"gig":[353,354],"ins":[353,354,779,780,781,782,1103,1104,1105,1106,1107],"ns ":[353,354,436,1096],"fir":[354,359,360,361,362,390,391,485,486,487,636,671,672,673,829,830,831,832,833,834,835,836,889,890,891,892,893,894,895],"ire":[354,359,360,361,362,390,391,485,486,487,636,671,672,673,829,830,831,832,833,834,835,836,889,890,891,892,893,894,895]," gl":[355,356,357,358,359,360,361,362],"adi":[355,356,717,718,719,720,721,722,723,724,854,855,856,857,858,859,860,861,944],"gla":[355,356,357,358],"ius":[355,356],"lad":[355,356,724,854,855,856,857,858,859,860,861],"aiv":[357,358],"lai":[357,358,779,780,781,782]," mf":[358],"fb ":[358],"mfb":[358],"glo":[359,360,361,362],"lor":[359,360,361,362],"ory":[359,360,361,362,630,1139,1140,1141],"090":[360],"309":[360],"90 ":[360,1085]," go":[363,364,365,366,367,368,369,370,371,372,373],"gob":[363,364,365,366,367,368,369,370,371],"obl":[363,364,365,366,367,368,369,370,371],"gos":[372,373],"oss":[372,373],"sam":[372,373]," om":[374,375,376,1121,1122,1123,1124],"gul":[374,375,376,822,823,824,825,826,827,828],"imo":[374,375,376],"ito":[374,375,376,442,443,444,445,446],"llt":[374,375,376],"lto":[374,375,376],"mni":[374,375,376,1121,1122,1123,1124],"nim":[374,375,376],"nit":[374,375,376,442,443,444,445,446,1041],"omn":[374,375,376,1121,1122,1123,1124],"oni":[374,375,376,442,443,444,445,446,725],"opp":[374,375,376],"ppr":[374,375,376],"pr ":[374,375,376],"top":[374,375,376]," am":[377,474,475,508,575,644,721,985,1113,1140],"amb":[377],"bus":[377],"mbu":[377],"un ":[377,378,379,380,381,382,383,384,385,386,453,454,455,456,457,458,459,460,461,462,942,943],"ush":[377],"aaa":[378,391,468,1101]," mj":[380],"jol":[380],"lni":[380],"mjo":[380],"nir":[380,955,956],"oln":[380],"sc ":[381],"gho":[383],"ngh":[383],"old":[383],"ong":[383,661,662,663],"mpe":[384,723,1024,1025,1026,1027,1028],"ump":[384,447,529,723,1024,1025,1026,1027,1028],"elt":[387,388],"gur":[387,388,389],"tel":[387,388,958],"tie":[387,388,618,619,620,621,622,623],"urt":[387,388],"il ":[389],"rzi":[389],"urz":[389],"zil":[389,467,468,469,470],"ach":[390,391],"hac":[390,391],"him":[390,391],"ima":[390,391],"adu":[392,393,394],"dur":[392,393,394],"had":[392,393,394,686,687,688,689,690],"han":[395,413,558,812,813,814,815,934,935,1019,1045,1046,1047],"ara":[396,397,398,399,400,401,402,403,404,405,406,407,408,409,862,863,864,865],"atf":[396,397,398,399,400,401,402,403,404,405,406,407,408,409,889,890,891,892,893,894,895],"har":[396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,915],"orm":[396,397,398,399,400,401,402,403,404,405,406,407,408,409,889,890,891,892,893,894,895],"ras":[396,397,398,399,400,401,402,403,404,405,406,407,408,409,653,654],"sse":[396,397,398,399,400,401,402,403,404,405,406,407,408,409],"tfo":[396,397,398,399,400,401,402,403,404,405,406,407,408,409,889,890,891,892,893,894,895]," le":[398,1078],"api":[398],"eap":[398,436,1096],"isa":[398,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744],"lea":[398,1078],"pin":[398,776,777],"sa ":[398],"egg":[399],"ggy":[399],"gy ":[399],"ini":[399,646,647,648,649,650],"ni ":[399,725],"peg":[399,750,751,752,753,754,755,756,757,758,759,760],"fue":[401],"uel":[401],"ro ":[402,710,711],"arc":[403,466,988,1044],"rc ":[403,988,1044]," lf":[404],"fe ":[404],"lfe":[404],"ari":[406,429,928],"ian":[406,429,747,794,897,1002,1003,1004],"mar":[406,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,928],"ria":[406,429,747,794],"ani":[413,812,813,814,815],"ek ":[413,896,897,898,899,900,901,902,903,904,905,968,969],"has":[413],"ize":[413,812,813,814,815],"niz":[413,812,813,814,815],"sek":[413,929,930],"zed":[413,812,813,814,815],"  4":[414]," 4 ":[414]," lt":[414,661,662,663,722,963],"awk":[414,415,416,417,418,419,420,421,1108],"haw":[414,415,416,417,418,419,420,421,1108],"ltv":[414],"tv ":[414],"wk ":[414,415,416,417,418,419,420,421,1108],"dlu":[416],"erw":[416],"lun":[416],"ndl":[416],"rwa":[416],"ung":[416],"wan":[416]," sn":[421,965],"nip":[421,965],"sni":[421,965],"en ":[429,613,614,615,616,617,862,863,864,865,939,940,941],"var":[429,1055,1056]," nl":[431],"nlr":[431],"apo":[436,1096],"ons":[436,1096]," wo":[441,571,777,806,979,1001,1004,1133],"ob ":[441,571,661,662,663,777,806,979,1001,1004,1133],"wob":[441,571,777,806,979,1001,1004,1133]," gr":[442,443,444,445,446],"dal":[442,443,444,445,446],"eim":[442,443,444,445,446],"gro":[442,443,444,445,446],"hei":[442,443,444,445,446],"imd":[442,443,444,445,446],"mda":[442,443,444,445,446],"oun":[442,443,444,445,446],"rou":[442,443,444,445,446],"  j":[447,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,529,849,850,851,852,883,1041,1112,1113,1114,1115,1116]," ju":[447,529],"eph":[447,448,449,450,451,452,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129],"hae":[447,448,449,450,451,452],"hep":[447,448,449,450,451,452],"jum":[447,529],"mp ":[447,529,946,1106],"pha":[447,448,449,450,451,452,764,765,874,875,876,877,878,879,880,881,882,883,884],"stu":[447,448,449,450,451,452,993,994,995,996,997,998,999,1000,1001,1018],"etz":[453,454,455,456,457,458,459,460,461,462],"het":[453,454,455,456,457,458,459,460,461,462],"tze":[453,454,455,456,457,458,459,460,461,462,847,848],"zer":[453,454,455,456,457,458,459,460,461,462,504,847,848],"10 ":[454,479,812,813,814,815,1063,1087],"ac1":[454],"c10":[454],"exa":[463],"hex":[463],"rem":[463],"xar":[463]," hi":[464,465,466],"hi ":[464,465,521,644,645]," cu":[465],"cun":[465],"gto":[465],"ngt":[465],"nni":[465],"ton":[465,745,746,747,748,749,1103,1104,1105,1106,1107],"unn":[465],"ipp":[466,837,838,839,840,841,842,843],"ppa":[466],"rch":[466],"cht":[467,468,469,470],"ey ":[467,468,469,470,559],"htl":[467,468,469,470],"hue":[467,468,469,470],"hui":[467,468,469,470],"ilo":[467,468,469,470,641],"itz":[467,468,469,470,847,848],"li ":[467,468,469,470,1054],"lop":[467,468,469,470],"och":[467,468,469,470],"opo":[467,468,469,470],"poc":[467,468,469,470],"tli":[467,468,469,470],"tzi":[467,468,469,470],"uey":[467,468,469,470],"unt":[471,472,473,474,475,476,477,478,479,480,928],"054":[473,977],"305":[473,532,570,592,628,695,751,977,983],"54 ":[473,977],"amm":[474,508,985,1113,1140],"mmo":[474,508,985,1113,1140],"mo ":[474,508,985,1113,1140],"amp":[475,559,644],"bio":[475,644],"hib":[475,644],"ibi":[475,644],"iou":[475,644],"mph":[475,644],"ous":[475,517,518,644],"phi":[475,644]," lp":[478],"lpl":[478],"pl ":[478,843],"m10":[479],"rm1":[479,480],"15 ":[480],"m15":[480]," ig":[481,482],"gni":[481,482],"ign":[481,482],"is ":[481,482,601,602,704,705,706,707,708,709,1062],"nis":[481,482],"ind":[483,484,1008,1009,1010,1011,1100,1101,1102],"ndr":[483,484,934,935]," is":[485,486,487],"hta":[485,486,487],"sht":[485,486,487]," 27":[488,489,490,491,492]," j ":[488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,849,850,851,852,883],"27 ":[488,489,490,491,492],"dna":[488,489,490,491,492],"nan":[488,489,490,491,492],"ord":[488,489,490,491,492],"rdn":[488,489,490,491,492]," ki":[491,547,548,549,550,551,821],"joy":[491],"kil":[491],"ljo":[491],"llj":[491],"oy ":[491]," ed":[493,494,495,496,497,498,499,500,501,502,503],"dga":[493,494,495,496,497,498,499,500,501,502,503],"edg":[493,494,495,496,497,498,499,500,501,502,503]," ja":[504,1112,1113,1114,1115,1116],"agd":[504],"anz":[504],"dpa":[504],"gdp":[504],"jag":[504],"nze":[504],"pan":[504,625,668,730]," je":[505,506,507,508,509,510,511,512,513,514],"jes":[505,506,507,508,509,510,511,512,513,514],"tic":[505,506,590,591,592,593,594,595,596,597,598,599,600,646,647,648,649,650,811,1042],"082":[506],"308":[506,677],"82 ":[506],"ate":[507,508,509,622,681,794],"egi":[507,508,509,794],"gic":[507,508,509,794],"teg":[507,508,509,794]," ji":[515,516,1041],"2a1":[515,516],"a1 ":[515,516],"i2a":[515,516],"ji2":[515,516]," jo":[517,518],"700":[517],"be7":[517,518],"e70":[517,518],"jou":[517,518],"ust":[517,518],"701":[518]," ka":[519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,853,993],"alk":[519,993],"aun":[519,993],"ise":[519,993],"kal":[519,993],"ki ":[519,993],"lau":[519,993],"lki":[519,993],"nch":[519,993],"rui":[519,993],"uis":[519,993],"unc":[519,993],"aki":[520,521],"ama":[520,521,931,932,933],"iri":[520,521],"kam":[520,521,522,523,524,525,526,684,685],"kir":[520,521],"mak":[520,521,1016],"ri ":[520,521,522,523,524,525,526],"ami":[522,523,524,525,526,684,685],"iso":[522,523,524,525,526],"ang":[527,528,529,816,817,818,819,820,1019,1025],"ga ":[527,528,529],"kan":[527,528,529,945,946],"kar":[530,531,532,533,534,535,536,537,538,967],"nov":[530,531,532,533,534,535,536,537,538],"rno":[530,531,532,533,534,535,536,537,538],"055":[532,570,592],"55 ":[532,570,592],"iph":[538],"phe":[538],"rip":[538,837,838,839,840,841,842,843]," ke":[539,540,541,542,543,544,545,546],"els":[539],"kel":[539],"lsw":[539],"swa":[539],"wa ":[539,1031,1032,1033,1034,1035,1036,1037,1038],"kes":[540,541,542,543,544,545,546],"rel":[540,541,542,543,544,545,546],"vac":[542],"inn":[547,548,549],"kin":[547,548,549],"nno":[547,548,549],"nol":[547,548,549],"ite":[550,551,796,821],"kit":[550,551,821],"te ":[550,551,622,681,796,821,885,886,887,888,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075]," ko":[552,553,554],"kok":[552,553],"kou":[552,553],"oko":[552,553],"ou ":[552,553]," 3 ":[554,568]," kr":[554,555,556],"kor":[554],"krv":[554],"orv":[554],"rv ":[554],"rvi":[554],"vin":[554],"kru":[555,556],"rug":[555,556],"uge":[555,556],"ku ":[557,558,853,1016]," if":[558,581,583,859,1102]," tu":[558,720,721,722,723,1043,1044,1045,1046,1047,1129],"fv ":[558,581,583,1102],"ifv":[558,581,583,1102],"rha":[558,1045,1046,1047,1108],"tur":[558,993,994,995,996,997,998,999,1000,1001,1045,1046,1047,1129],"urh":[558,1045,1046,1047],"mpr":[559],"pre":[559,795,796,797],"rey":[559],"htn":[563,564,565,566,567,568],"tni":[563,564,565,566,567,568]," lu":[573,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086],"dua":[573,1129],"lud":[573],"uan":[573],"udu":[573]," m ":[574,575,576]," s ":[574,575,576,1095],"ams":[575,721],"ms ":[575,721],"agi":[577,578],"gi ":[577,578],"mag":[577,578]," uc":[578],"csv":[578],"sv ":[578],"ucs":[578],"auc":[579,580,581,582],"mai":[579,580,581,582],"uch":[579,580,581,582],"amo":[583],"mam":[583],"ono":[583],"euf":[584,585,586,587,588,589],"fel":[584,585,586,587,588,589],"ffe":[584,585,586,587,588,589],"teu":[584,585,586,587,588,589],"uff":[584,585,586,587,588,589],"ec ":[599,836,1127],"tis":[601,602,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744],"ccm":[602],"ecc":[602],"ksm":[603,604,605,606,607,608],"rks":[603,604,605,606,607,608]," m1":[606,607,608,664],"m1 ":[606,664,957,958],"1a ":[607,959],"m1a":[607,959],"1j ":[608],"m1j":[608],"ars":[609,610,611,612,613,614,615,804],"atm":[610,1006,1141],"tm ":[610,1006,1141],"rsd":[613,614,615],"sde":[613,614,615],"ten":[616,617,1016],"mau":[618,619,620,621,622,623],"asi":[620],"sic":[620],"dia":[622],"iat":[622],"rme":[622,758],"axi":[624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641],"xim":[624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641],"any":[625,668,730],"mpa":[625,668,730],"ny ":[625,668,730],"ker":[626,948,949,950,951,952,953,954,981,982,983,984,985,986,987,988,989,990,991],"nke":[626],"052":[628],"52 ":[628],"fac":[630],"fie":[631,964,1041]," es":[635],"esc":[635],"m4 ":[638],"rm4":[638],"hil":[641,885,886,887,888,889,890,891,892,893,894,895,937,938],"loh":[641],"oh ":[641]," ix":[642],"erk":[642,643],"ix ":[642,992],"kav":[642,643],"rka":[642,643],"va ":[642,643]," mh":[644,645],"mhi":[644,645]," ad":[646,647,648,649,650,792,793,934,935],"adv":[646,647,648,649,650,934,935],"dva":[646,647,648,649,650,934,935],"nio":[646,647,648,649,650],"ilv":[647],"let":[647],"lve":[647]," sa":[648,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873],"dbl":[648],"ndb":[648]," 23":[651],"23 ":[651]," 24":[652],"24 ":[652],"as ":[653,654],"hra":[653,654],"thr":[653,654]," ll":[656,659]," 25":[661,662]," lo":[661,662,663,897]," to":[661,662,663,1031,1032,1033,1034,1035,1036,1037,1038],"25 ":[661],"om ":[661,662,663],"tom":[661,662,663],"25f":[662],"5f ":[662],"  9":[663,1093,1094,1095]," 95":[663],"95 ":[663],"ltk":[664,665,666],"tke":[664,665,666]," m2":[665]," m3":[666],"m3 ":[666,961],"cit":[667,668,669,670],"gst":[667,668,669,670],"ity":[667,668,669,670,803],"ngs":[667,668,669,670],"ty ":[667,668,669,670,803],"hpg":[669],"pg ":[669],"gu ":[671,672,673],"igu":[671,672,673],"orr":[671,672,673],"ete":[676,677,678],"ket":[676,677,678,1112,1113,1114,1115,1116],"mus":[676,677,678],"ske":[676,677,678],"tee":[676,677,678],"usk":[676,677,678],"080":[677],"80 ":[677]," my":[679,680,681,682],"ido":[679,680,681,682],"mid":[679,680,681,682],"myr":[679,680,681,682],"yrm":[679,680,681,682]," ty":[682,1048,1049,1050,1051,1052,1053],"pe ":[682,765,784,848,918,964,1029],"typ":[682,765,784,848,918,964,1029,1048,1049,1050,1051],"ype":[682,765,784,848,918,964,1029]," na":[683,684,685,988],"nac":[683]," 1c":[684]," nk":[684,685],"1c ":[684],"ruk":[684,685],"uka":[684,685]," bc":[685,861,865,912],"bc3":[685,861,865,912]," ni":[686,687,688,689,690],"hts":[686,687,688,689,690],"nig":[686,687,688,689,690],"sha":[686,687,688,689,690,931,932,933,934,935,1109,1110,1111],"tsh":[686,687,688,689,690]," nu":[691],"air":[691,728,729,730,731,732,733,734,735,1041],"ber":[691],"eru":[691],"irc":[691],"nub":[691],"ru ":[691],"ube":[691,720,721,722,723]," od":[692,693],"odi":[692,693]," on":[694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709],"nto":[694,695,696,697,698,699,700,701,702,703,776,777,1005,1006,1007],"os ":[694,695,696,697,698,699,700,701,702,703,958,1128,1129],"tos":[694,695,696,697,698,699,700,701,702,703],"053":[695,983],"53 ":[695,983],"eat":[702],"asp":[703],"ct ":[703],"ect":[703,868,1057,1058,1059,1060,1110],"pec":[703,1110],"nur":[704,705,706,707,708,709],"onu":[704,705,706,707,708,709],"ris":[704,705,706,707,708,709,1062],"oro":[710,711]," ge":[712]," pa":[712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,748,749,807,808,809,810],"ckr":[712,713,714,715,716],"esp":[712],"ges":[712],"kra":[712,713,714,715,716],"lrp":[712,713,714,715,716],"nst":[712,1103,1104,1105,1106,1107],"pac":[712,713,714,715,716],"pen":[712],"pv ":[712,713,714,715,716],"rpv":[712,713,714,715,716]," pk":[713,714,715,716]," t5":[713,714,715,716],"kr ":[713,714,715,716],"pkr":[713,714,715,716],"t5 ":[713,714,715,716],"dil":[717,718,719,720,721,722,723],"pad":[717,718,719,720,721,722,723],"be ":[720,721,722,723],"tub":[720,721,722,723],"ltc":[722,963],"tc ":[722,963,1070]," sy":[724],"em ":[724],"pal":[724,725],"sys":[724],"tem":[724],"yst":[724],"alm":[725],"fig":[725,816,817,818,819,820,1005,1006,1007,1039,1040],"hti":[725,816,817,818,819,820,1005,1006,1007,1039,1040],"lmo":[725,1000]," 31":[727,799,911],"134":[727],"313":[727,911],"34 ":[727]," qu":[733,811],"ad ":[733],"uad":[733],"elr":[740,775],"hul":[744],"pat":[745,746,747,748,749,807,808,809,810],"tto":[745,746,747,748,749]," sb":[746],"sb ":[746],"aur":[747],"tau":[747],"asu":[750,751,752,753,754,755,756,757,758,759,760],"ega":[750,751,752,753,754,755,756,757,758,759,760],"gas":[750,751,752,753,754,755,756,757,758,759,760],"sus":[750,751,752,753,754,755,756,757,758,759,760],"058":[751],"58 ":[751]," un":[758,1041],"una":[758],"egr":[761,762,763],"ere":[761,762,763],"gri":[761,762,763],"reg":[761,762,763,822,823,824,825,826,827,828]," ph":[764,765],"anx":[764,765],"nx ":[764,765],"oty":[765,784,848,918,964,1029]," pi":[766,767,768,769,770,771,772,773,774,775,776,777,778],"pik":[766,767,768,769,770,771,772],"ac5":[767],"c5 ":[767],"ilu":[773,774,775],"lum":[773,774,775],"pil":[773,774,775],"iu ":[778],"ixi":[778],"pix":[778],"xiu":[778],"nsm":[779,780,781,782]," po":[783,784,785,786,787,788,789,790,791,792,793],"po ":[783,784,785,786,787,788,789,790,791,1017]," hv":[784,785],"ada":[792,793,1006],"llu":[792,793],"lux":[792,793],"pol":[792,793],"ux ":[792,793],"aet":[794],"eto":[794],"pra":[794],"rae":[794],"dat":[795,796,797],"eda":[795,796,797],"oye":[795,796,797,957,958,959,960,961],"yer":[795,796,797,957,958,959,960,961],"lit":[796]," te":[798,799,800,801,802,803,804,805,806,958,1016,1017,1018],"owl":[798,799,800,801,802,803,804,805,806],"wle":[798,799,800,801,802,803,804,805,806],"140":[799],"314":[799],"40 ":[799],"cur":[803],"ecu":[803],"cce":[804],"ces":[804],"ess":[804],"suc":[804],"ucc":[804],"  0":[807,808,809,810]," 00":[807,808,809,810],"005":[807,808],"pum":[807,808,809,810],"uma":[807,808,809,810],"05b":[808],"5b ":[808],"007":[809],"07 ":[809],"008":[810],"08 ":[810],"sto":[811,1103,1104,1105,1106,1107],"uae":[811]," r1":[812,813,814,815],"cv ":[812,813,814,815,860,861,864,865,910,911,912],"icv":[812,813,814,815],"r10":[812,813,814,815]," vv":[816,817,818,819,820],"v1 ":[816,817,818],"vv1":[816,817,818],"v2 ":[819],"vv2":[819,820],"22 ":[820],"v22":[820],"egu":[822,823,824,825,826,827,828],"ula":[822,823,824,825,826,827,828]," rh":[829,830,831,832,833,834,835,836],"hin":[829,830,831,832,833,834,835,836],"ino":[829,830,831,832,833,834,835,836],"rhi":[829,830,831,832,833,834,835,836],"aga":[831],"ppe":[837,838,839,840,841,842,843],"spl":[843],"mel":[844,845,846,847,848],"mme":[844,845,846,847,848,947],"rom":[844,845,846,847,848],"how":[847,848],"owi":[847,848],"wit":[847,848]," 11":[849,850,851,852]," rn":[849,850,851,852],"11 ":[849,850,851,852],"nda":[849,850,851,852,945,946],"otu":[849,850,851,852],"rnd":[849,850,851,852],"aba":[853],"aku":[853,1016,1086],"aze":[853],"bak":[853],"kaz":[853],"sab":[853],"ze ":[853],"fri":[859],"ifr":[859]," hc":[860,861,864,865,910,911,912],"hcv":[860,861,864,865,910,911,912],"ace":[862,863,864,865],"sar":[862,863,864,865],"ah ":[866,867,868,869],"ann":[866,867,868,869],"nah":[866,867,868,869],"efl":[868],"lec":[868],"axo":[870,871,872,873],"sax":[870,871,872,873],"xon":[870,871,872,873],"aph":[874,875,876,877,878,879,880,881,882,883,884],"cap":[874,875,876,877,878,879,880,881,882,883,884],"ha ":[874,875,876,877,878,879,880,881,882,883,884,1109,1110,1111],"sca":[874,875,876,877,878,879,880,881,882,883,884],"dkr":[885,886,887,888],"kro":[885,886,887,888],"ldk":[885,886,887,888],"ote":[885,886,887,888],"chr":[896,897,898,899,900,901,902,903,904,905],"hre":[896,897,898,899,900,901,902,903,904,905],"rek":[896,897,898,899,900,901,902,903,904,905],"hia":[897],"lot":[897],"thi":[897],"cim":[906,907,908,909,910,911,912],"imi":[906,907,908,909,910,911,912],"sci":[906,907,908,909,910,911,912],"136":[911],"36 ":[911],"ene":[915],"rde":[915],"ea ":[928],"iti":[928],"tim":[928],"ekh":[929,930],"hme":[929,930],"khm":[929,930],"met":[929,930],"ham":[931,932,933],"ff ":[936],"iff":[936],"agh":[937,938],"ela":[937,938],"gh ":[937,938],"lag":[937,938],"lel":[937,938],"hod":[939,940,941],"ode":[939,940,941]," sk":[944,945,946,947,948,949,950,951,952,953,954]," sw":[944,1008,1009,1010,1011],"ift":[944,1008,1009,1010,1011],"kad":[944],"ska":[944,945,946],"swi":[944,1008,1009,1010,1011],"wif":[944,1008,1009,1010,1011]," ts":[946,1106],"emp":[946,1106],"sem":[946,1106],"tse":[946,1106],"imm":[947],"kim":[947],"ski":[947],"kul":[948,949,950,951,952,953,954],"lke":[948,949,950,951,952,953,954],"sku":[948,949,950,951,952,953,954],"ulk":[948,949,950,951,952,953,954],"  5":[954]," 5 ":[954],"eip":[955,956],"ipn":[955,956],"lei":[955,956],"pni":[955,956]," sm":[957,958,959,960,961,962,963,964],"sm ":[957,958,959,960,961],"sm1":[957,958,959,960],"elo":[958],"1b ":[960],"m1b":[960],"sm3":[961],"sm2":[962,963],"m5 ":[964],"sm5":[964]," so":[966,967,968,969],"ece":[966],"oar":[966],"soa":[966],"oka":[967],"sok":[967],"tek":[968,969],"spr":[970,971,972,973,974,975],"oop":[975,1096],"op ":[975,1096],"roo":[975,1096],"wet":[982],"061":[984],"306":[984],"61 ":[984],"rix":[992],"feu":[993,994,995,996,997,998,999,1000,1001],"mfe":[993,994,995,996,997,998,999,1000,1001],"rmf":[993,994,995,996,997,998,999,1000,1001],"urm":[993,994,995,996,997,998,999,1000,1001],"ner":[999,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086],"tei":[999],"gil":[1000],"ilm":[1000],"gia":[1002,1003,1004],"sty":[1002,1003,1004],"tyg":[1002,1003,1004],"ygi":[1002,1003,1004]," sv":[1005,1006,1007],"ovi":[1005,1006,1007],"sva":[1005,1006,1007],"tov":[1005,1006,1007],"vit":[1005,1006,1007],"asa":[1006],"sad":[1006],"win":[1008,1009,1010,1011,1100,1101,1102,1103,1104,1105,1106,1107,1108],"rla":[1012,1013,1014,1015],"tam":[1012,1013,1014,1015],"enm":[1016],"nma":[1016],"epp":[1017],"tep":[1017],"tes":[1018],"tud":[1018],"udo":[1018],"tha":[1019],"gel":[1025],"av ":[1027,1028],"tav":[1027,1028]," ti":[1029,1030],"tig":[1029,1030]," 12":[1030]," t ":[1030],"12 ":[1030],"awa":[1031,1032,1033,1034,1035,1036,1037,1038],"gaw":[1031,1032,1033,1034,1035,1036,1037,1038],"kug":[1031,1032,1033,1034,1035,1036,1037,1038],"oku":[1031,1032,1033,1034,1035,1036,1037,1038],"tok":[1031,1032,1033,1034,1035,1036,1037,1038],"uga":[1031,1032,1033,1034,1035,1036,1037,1038]," sd":[1034],"d2 ":[1034],"sd2":[1034]," 15":[1036,1037]," tk":[1036,1037],"150":[1036],"50 ":[1036],"kg ":[1036,1037],"tkg":[1036,1037],"151":[1037],"51 ":[1037],"  y":[1038,1086,1109,1110,1111,1112,1113,1114,1115,1116]," yu":[1038],"umi":[1038],"yum":[1038],"jan":[1039,1040],"raj":[1039,1040],"abl":[1041],"ble":[1041,1134,1135,1136,1137,1138],"epa":[1041],"ji ":[1041],"pai":[1041],"rep":[1041],"tab":[1041],"uni":[1041],"bun":[1042],"ibu":[1042],"rib":[1042],"tuf":[1043,1044],"ufa":[1043,1044],"hoo":[1048,1049,1050,1051],"oon":[1048,1049,1050,1051],"pho":[1048,1049,1050,1051],"yph":[1048,1049,1050,1051],"tyr":[1052,1053],"yr ":[1052,1053,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127],"rgr":[1055,1056],"vec":[1057,1058,1059,1060]," ew":[1059],"ew ":[1059],"det":[1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075],"ett":[1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075],"ved":[1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075],"del":[1062]," ne":[1070],"etc":[1070],"net":[1070]," g7":[1073]," v ":[1073],"7x ":[1073],"g7x":[1073]," v7":[1074],"v7 ":[1074]," v9":[1075],"v9 ":[1075],"ida":[1076],"vid":[1076]," vo":[1077,1078,1079,1080,1081,1082,1083,1084,1085,1086],"ckn":[1077,1078,1079,1080,1081,1082,1083,1084,1085,1086],"kne":[1077,1078,1079,1080,1081,1082,1083,1084,1085,1086],"luc":[1077,1078,1079,1080,1081,1082,1083,1084,1085,1086],"von":[1077,1078,1079,1080,1081,1082,1083,1084,1085,1086],"agu":[1078],"gue":[1078],"ue ":[1078]," k1":[1079]," vn":[1079,1080,1081,1082,1083,1084,1085,1086],"k10":[1079],"nl ":[1079,1080,1081,1082,1083,1084,1085,1086],"vnl":[1079,1080,1081,1082,1083,1084,1085,1086]," k6":[1080,1081],"5n ":[1080,1083,1084],"65n":[1080],"k65":[1080,1081],"5w ":[1081],"65w":[1081]," k7":[1082,1083],"70 ":[1082],"k70":[1082],"75n":[1083],"k75":[1083]," k8":[1084],"85n":[1084],"k85":[1084]," k9":[1085],"k90":[1085]," x7":[1086]," ya":[1086,1109,1110,1111],"71 ":[1086],"kuz":[1086],"uza":[1086],"x71":[1086],"yak":[1086],"za ":[1086],"ior":[1087,1088,1089,1090,1091,1092,1093,1094,1095],"rio":[1087,1088,1089,1090,1091,1092,1093,1094,1095],"  7":[1088,1089,1090,1091]," 7 ":[1088]," 7a":[1089],"7a ":[1089]," 7c":[1090],"7c ":[1090]," 7f":[1091],"7f ":[1091],"  8":[1092]," 8 ":[1092]," 9 ":[1093,1094,1095]," hx":[1094],"hx ":[1094],"cam":[1098],"era":[1098],"hir":[1100,1101,1102],"irl":[1100,1101,1102],"lwi":[1100,1101,1102],"rlw":[1100,1101,1102],"whi":[1100,1101,1102]," xx":[1107],"xxl":[1107],"yas":[1109,1110,1111],"ctr":[1110]," ye":[1112,1113,1114,1115,1116],"jac":[1112,1113,1114,1115,1116],"low":[1112,1113,1114,1115,1116],"yel":[1112,1113,1114,1115,1116],"  z":[1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141]," za":[1117],"ahn":[1117],"hn ":[1117],"zah":[1117]," ze":[1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129],"hyr":[1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129],"phy":[1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129],"zep":[1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129],"idr":[1121,1122,1123,1124],"nid":[1121,1122,1123,1124],"ros":[1128,1129],"yro":[1128,1129]," du":[1129],"ual":[1129],"urr":[1129]," zh":[1130,1131,1132,1133],"huk":[1130,1131,1132,1133],"kov":[1130,1131,1132,1133],"uko":[1130,1131,1132,1133],"zhu":[1130,1131,1132,1133]," zi":[1134,1135,1136,1137,1138],"ibl":[1134,1135,1136,1137,1138],"zib":[1134,1135,1136,1137,1138]," zo":[1139,1140,1141],"rya":[1139,1140,1141],"ya ":[1139,1140,1141],"zor":[1139,1140,1141]}}});
@@ -0,0 +1,2 @@
+// Auto-generated list of unit shards
+const unitManifest = {"default":"vehicle","shards":{"vehicle":{"file":"units/vehicle.93a0ae8e1b87.js","units":1142},"protomech":{"file":"units/protomech.94f5dc75eb1f.js","units":86},"battlearmor":{"file":"units/battlearmor.3f5ec6fd2b4e.js","units":1188}}};
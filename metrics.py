@@ -0,0 +1,178 @@
+import functools
+import os
+import threading
+import time
+
+
+# Set BFS_PROFILE=1 to time the functions wrapped with @timed. When it is off
+# the decorator returns the function unchanged, so the hook costs nothing.
+PROFILE_ENABLED = os.environ.get('BFS_PROFILE', '') not in ('', '0')
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _format_labels(names, values):
+    if not names:
+        return ''
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+class Counter:
+    """A monotonically increasing value per label set."""
+
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for label_values, value in sorted(values.items()):
+            yield self.name, _format_labels(self.labels, label_values), value
+
+
+class Histogram:
+    """Cumulative bucket counts, sum and count per label set, as Prometheus expects."""
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self._lock:
+            entry = self._values.get(label_values)
+            if entry is None:
+                entry = self._values[label_values] = [[0] * len(self.buckets), 0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][index] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def samples(self):
+        with self._lock:
+            values = {key: ([*counts], total, count) for key, (counts, total, count) in self._values.items()}
+        for label_values, (counts, total, count) in sorted(values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield (f'{self.name}_bucket',
+                       _format_labels(self.labels + ('le',), label_values + (repr(float(bound)),)), cumulative)
+            yield f'{self.name}_bucket', _format_labels(self.labels + ('le',), label_values + ('+Inf',)), count
+            yield f'{self.name}_sum', _format_labels(self.labels, label_values), total
+            yield f'{self.name}_count', _format_labels(self.labels, label_values), count
+
+
+class Gauge:
+    """A value read from a callback at scrape time."""
+
+    kind = 'gauge'
+
+    def __init__(self, name, documentation, read_value):
+        self.name = name
+        self.documentation = documentation
+        self.read_value = read_value
+
+    def samples(self):
+        value = self.read_value()
+        if value is not None:
+            yield self.name, '', value
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        """Returns every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self.metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for name, labels, value in metric.samples():
+                lines.append(f'{name}{labels} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+def resident_memory_bytes():
+    """
+    Returns the current resident set size. Linux reads /proc; elsewhere the
+    peak RSS from getrusage is the closest available figure, and None is
+    returned where neither exists.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == 'Darwin' else peak * 1024
+
+
+REGISTRY = Registry()
+REQUEST_LATENCY = REGISTRY.register(Histogram(
+    'http_request_duration_seconds', 'Time spent handling a request.', ('route', 'method', 'status')))
+RESPONSE_BYTES = REGISTRY.register(Counter(
+    'http_response_bytes_total', 'Bytes sent in response bodies (after compression).', ('route',)))
+CATALOG_LOAD = REGISTRY.register(Histogram(
+    'catalog_load_duration_seconds', 'Time spent building the unit catalog or card manifest.', ('source', 'reason')))
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    'cache_requests_total', 'Cache lookups by cache and result (hit or miss).', ('cache', 'result')))
+FUNCTION_LATENCY = REGISTRY.register(Histogram(
+    'function_duration_seconds', 'Time spent in hot functions (only with BFS_PROFILE=1).', ('function',)))
+REGISTRY.register(Gauge(
+    'process_resident_memory_bytes', 'Resident memory of this process.', resident_memory_bytes))
+
+
+def timed(name):
+    """
+    Decorates a hot function to record its duration in function_duration_seconds
+    when profiling is enabled.
+
+    Args:
+        name (str): The function label.
+
+    Returns:
+        callable: The decorator.
+    """
+    def decorator(function):
+        if not PROFILE_ENABLED:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                FUNCTION_LATENCY.observe(time.perf_counter() - start, name)
+        return wrapper
+    return decorator
@@ -0,0 +1,151 @@
+import numpy as np
+
+from metrics import timed
+
+
+# Objective name -> the catalog columns summed into each unit's value
+OBJECTIVES = {
+    'durability': ['Armor', 'Structure'],
+    'short_damage': ['Short'],
+    'medium_damage': ['Medium'],
+    'long_damage': ['Long'],
+    'damage': ['Short', 'Medium', 'Long'],
+    'count': [],
+}
+MAX_BUDGET = 1000
+MAX_RESULTS = 20
+MAX_COPIES = 4
+
+
+def objective_values(catalog, objective, row_ids):
+    """
+    Returns the value each unit contributes to the objective.
+
+    Args:
+        catalog (UnitCatalog): The catalog.
+        objective (str): A key of OBJECTIVES.
+        row_ids (ndarray): The candidate rows.
+
+    Returns:
+        ndarray: One float per row; missing stats count as 0.
+    """
+    columns = OBJECTIVES[objective]
+    if not columns:
+        return np.ones(len(row_ids))
+    return np.nansum([catalog.columns[column][row_ids] for column in columns], axis=0)
+
+
+def prune_candidates(row_ids, costs, values, budget, results):
+    """
+    Drops units that cannot appear in any of the best forces. A force holds at most
+    budget // cost units of a given cost, so among units of equal cost only the
+    best (budget // cost) + results - 1 can matter; any other could be swapped for
+    a better unused one in at least `results` different ways.
+
+    Returns:
+        tuple: The surviving (row_ids, costs, values).
+    """
+    keep = (costs > 0) & (costs <= budget) & (values > 0)
+    row_ids, costs, values = row_ids[keep], costs[keep], values[keep]
+    # Stable sort by cost, then by descending value within each cost
+    order = np.lexsort((-values, costs))
+    row_ids, costs, values = row_ids[order], costs[order], values[order]
+    starts = np.searchsorted(costs, costs, side='left')
+    rank = np.arange(len(costs)) - starts
+    limit = budget // costs + results - 1
+    keep = rank < limit
+    return row_ids[keep], costs[keep], values[keep]
+
+
+def best_forces(costs, values, budget, results, copies):
+    """
+    Solves the bounded knapsack for the `results` best selections. dp[c] holds the
+    best values found with a total cost of exactly c; each unit is folded in with
+    one vectorized merge over all costs, and the merge choices are kept for
+    backtracking.
+
+    Args:
+        costs (ndarray): Integer PV cost of each unit.
+        values (ndarray): Objective value of each unit.
+        budget (int): The PV cap.
+        results (int): How many selections to return.
+        copies (int): How many copies of one unit a force may hold.
+
+    Returns:
+        list: (value, cost, {unit index: copies}) tuples, best first.
+    """
+    dp = np.full((budget + 1, results), -np.inf)
+    dp[0, 0] = 0.0
+    choices = []
+    for cost, value in zip(costs.tolist(), values.tolist()):
+        stacked = np.full((budget + 1, (copies + 1) * results), -np.inf)
+        stacked[:, :results] = dp
+        for count in range(1, copies + 1):
+            shift = count * cost
+            if shift > budget:
+                break
+            stacked[shift:, count * results:(count + 1) * results] = dp[:-shift] + count * value
+        choice = np.argsort(-stacked, axis=1, kind='stable')[:, :results]
+        dp = np.take_along_axis(stacked, choice, axis=1)
+        choices.append(choice.astype(np.int16))
+
+    flat = np.argsort(-dp, axis=None, kind='stable')
+    selections = []
+    for position in flat[:results]:
+        total_cost, rank = divmod(int(position), results)
+        total_value = dp[total_cost, rank]
+        if not np.isfinite(total_value) or total_value <= 0:
+            break
+        picked, cost_left = {}, total_cost
+        for item in range(len(choices) - 1, -1, -1):
+            count, rank = divmod(int(choices[item][cost_left, rank]), results)
+            if count:
+                picked[item] = count
+                cost_left -= count * int(costs[item])
+        selections.append((float(total_value), total_cost, picked))
+    return selections
+
+
+@timed('optimize_force')
+def optimize_force(catalog, budget, objective='durability', results=5, copies=1,
+                   pv_column='RegPV', **filters):
+    """
+    Finds the best forces that fit a PV budget.
+
+    Args:
+        catalog (UnitCatalog): The catalog to build from.
+        budget (int): The PV cap.
+        objective (str): A key of OBJECTIVES.
+        results (int): How many forces to return.
+        copies (int): How many copies of one unit a force may hold.
+        pv_column (str): A catalog PV column: RegPV, VetPV or Skill0PV-Skill7PV.
+        **filters: Passed to UnitCatalog.select() (unit_type, roles, era, faction, ...).
+
+    Returns:
+        dict: The forces, best first, and the number of candidate units searched.
+
+    Raises:
+        ValueError: If an argument is out of range.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f'Unknown objective {objective}; use one of {", ".join(OBJECTIVES)}')
+    if not 0 < budget <= MAX_BUDGET:
+        raise ValueError(f'budget must be between 1 and {MAX_BUDGET}')
+    if not 0 < results <= MAX_RESULTS:
+        raise ValueError(f'results must be between 1 and {MAX_RESULTS}')
+    if not 0 < copies <= MAX_COPIES:
+        raise ValueError(f'copies must be between 1 and {MAX_COPIES}')
+
+    row_ids = catalog.select(pv_column=pv_column, **filters)
+    pv = catalog.columns[pv_column][row_ids]
+    row_ids, pv = row_ids[~np.isnan(pv)], pv[~np.isnan(pv)]
+    costs = np.ceil(pv).astype(np.int64)
+    values = objective_values(catalog, objective, row_ids)
+    row_ids, costs, values = prune_candidates(row_ids, costs, values, budget, results)
+
+    forces = []
+    for value, cost, picked in best_forces(costs, values, budget, results, copies):
+        units = [{'FullName': catalog.records[row_ids[item]]['FullName'],
+                  'PV': int(costs[item]), 'count': count} for item, count in sorted(picked.items())]
+        forces.append({'value': value, 'total_pv': cost, 'units': units})
+    return {'objective': objective, 'budget': budget, 'candidates': len(row_ids), 'forces': forces}
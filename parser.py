@@ -5,6 +5,20 @@ import csv
 import math
 import unicodedata
 
+from unit_records import UnitTable
+
+
+# The parsed fields main() writes to parsed_data_InfBAProto.csv; the rest of a
+# unit's .blk fields are dropped once it is parsed
+WEAPON_SLOTS = 7
+WEAPON_SLOT_FIELDS = [[f'WepName{slot}', f'Shots{slot}', f'Dam{slot}', f'Range{slot}', f'CombDam{slot}']
+                      for slot in range(1, WEAPON_SLOTS + 1)]
+UNIT_FIELDS = ['UnitType', 'FullName', 'Armor', 'ArmorIcons', 'Structure', 'StructureIcons', 'Movement', 'TMM',
+               'BasePV', 'RegPV', 'VetPV', 'RegSkill', 'VetSkill', 'SpecialRules', 'Name', 'Model'] + \
+    [field for fields in WEAPON_SLOT_FIELDS for field in fields]
+# Few units fill more than the first weapon slot, so the others are stored out of line
+SPARSE_FIELDS = [field for fields in WEAPON_SLOT_FIELDS[1:] for field in fields]
+
 
 def parse_weaponType_data(file_path):  # Parses things like LRMWeapon.java
     """
@@ -48,13 +62,14 @@ def parse_weapon_data(file_path, weaponTypes_list):  # Parses things like ISLRM2
 
     Args:
         file_path (str): The path to the file containing the weapon data.
+        weaponTypes_list (list): The weapon type dictionaries the weapon may inherit ranges from.
 
     Returns:
-        dict: A dictionary containing the weapon type and range attributes.
+        dict: The weapon's attributes, with every name unit files may use for it
+            under 'aliases', or an empty dictionary if the file names no weapon.
     """
     weapon = {}
     nameList = []
-    weaponsList = []
     weapon['displayName'] = ''
     weapon['extends'] = ''
     weapon['extendedBy'] = ''
@@ -65,7 +80,7 @@ def parse_weapon_data(file_path, weaponTypes_list):  # Parses things like ISLRM2
             weapon_text = f.read()
     except FileNotFoundError:
         print(f"Error: File not found at {file_path}")
-        return weaponType  # Return an empty dictionary if file not found
+        return {}  # Return an empty dictionary if file not found
 
     lines = weapon_text.split('\n')
 
@@ -99,12 +114,12 @@ def parse_weapon_data(file_path, weaponTypes_list):  # Parses things like ISLRM2
         elif 'addLookupName(' in line:
             line = (line[len("addLookupName("):-2].strip('"'))
             nameList.append(line)
+        elif 'setInternalName(name);' in line:
+            nameList.append(weapon['displayName'])
         elif 'setInternalName(' in line:
             line = (line[len("setInternalName("):-2].strip('"'))
             nameList.append(line)
-        elif 'setInternalName(name);' in line:
-            nameList.append(weapon['displayName'])
-        elif 'shortname =' in line:
+        elif 'shortName =' in line:
             line = line.split('=')[1].strip()[1:-2]
             nameList.append(line)
 
@@ -143,15 +158,12 @@ def parse_weapon_data(file_path, weaponTypes_list):  # Parses things like ISLRM2
     elif weapon.get('displayName') == 'Magshot':
         weapon['displayName'] = "Magshot Gauss Rifle"
 
-    for name in nameList:
-        weapon['name'] = name
-        weaponsList.append(weapon.copy())
-        weapon['name'] = weapon.get('extends')
-        weaponsList.append(weapon.copy())
-        weapon['name'] = weapon.get('displayName')
-        weaponsList.append(weapon.copy())
-
-    return weaponsList
+    if not nameList:
+        return {}
+    # The class name and display name are looked up too, as well as every lookup, internal and short name
+    weapon['aliases'] = list(dict.fromkeys(
+        name for name in nameList + [weapon['extends'], weapon['displayName']] if name))
+    return weapon
 
 
 def strip_accents(s):
@@ -159,13 +171,64 @@ def strip_accents(s):
                    if unicodedata.category(c) != 'Mn')
 
 
-def parse_blk(file_path, weapons_list):
+def weapon_key(name):
+    return name.replace('"', '').lower()
+
+
+class WeaponRegistry:
+    """
+    Every parsed weapon once, by id (its class name), and an alias table from
+    each of its names to that id. Built once and shared by every unit file.
+    """
+
+    def __init__(self):
+        self.weapons = {}
+        self.aliases = {}
+
+    def add(self, weapon):
+        """
+        Registers a weapon from parse_weapon_data. A name already taken by an
+        earlier weapon keeps pointing at that one.
+
+        Args:
+            weapon (dict): The weapon; it is given an 'id'.
+
+        Returns:
+            str: The weapon's id.
+        """
+        weapon_id = class_name = weapon['extends'] or weapon['displayName']
+        number = 1
+        while weapon_id in self.weapons:  # The same class name in another package
+            number += 1
+            weapon_id = f'{class_name}#{number}'
+        weapon['id'] = weapon_id
+        self.weapons[weapon_id] = weapon
+        for alias in weapon['aliases']:
+            self.aliases.setdefault(weapon_key(alias), weapon_id)
+        return weapon_id
+
+    def find(self, item):
+        """
+        Looks up the weapon an equipment name refers to. Case is ignored on both
+        sides; quotes are stripped from the registered aliases only.
+
+        Args:
+            item (str): An equipment name from a unit file.
+
+        Returns:
+            dict: The first weapon registered under that name, or None.
+        """
+        weapon_id = self.aliases.get(item.lower())
+        return self.weapons[weapon_id] if weapon_id is not None else None
+
+
+def parse_blk(file_path, weapons):
     """
     Parses a BLK file and stores the data in a Python dictionary.
 
     Args:
         file_path (str): The path to the BLK file.
-        weapons_list (list): A list of all possible weapon names.
+        weapons (WeaponRegistry): Every known weapon.
 
     Returns:
         dict: A dictionary containing the parsed data.
@@ -304,8 +367,7 @@ def parse_blk(file_path, weapons_list):
         else:
             equipment_counts[item] = {"count": 1}
 
-        weapon_data = next(
-            (weapon for weapon in weapons_list if weapon['name'].replace('"', '').lower() == item.lower() or weapon.get('extends', '').replace('"', '').lower() == item.lower()), None)
+        weapon_data = weapons.find(item)
         if weapon_data:
             equipment_counts[item]["Range"] = str(weapon_data.get('shortRange', None)) + "/" + str(
                 weapon_data.get('mediumRange', None)) + "/" + str(weapon_data.get('longRange', None))
@@ -473,8 +535,7 @@ def parse_blk(file_path, weapons_list):
         if details.get('Range') is None:
             continue
         else:
-            weapon_data = next((weapon for weapon in weapons_list if weapon['name'].replace(
-                '"', '').lower() == equipment.lower()), None)
+            weapon_data = weapons.find(equipment)
             data[f'WepName{csvCount}'] = weapon_data.get('displayName', equipment.lstrip('IS').lstrip('Clan').lstrip(
                 'Inner Sphere')) if weapon_data else equipment.lstrip('IS').lstrip('Clan').lstrip('Inner Sphere')
             # handle AMS
@@ -730,8 +791,8 @@ def parse_blk(file_path, weapons_list):
 def main():
     fileroot = 'D:\\Games\\Downloads\\mekhq-windows-0.49.19.1\\MMSource\\megamek-master'
     weaponTypes_list = []  # Initialize an empty list to store weaponType dictionaries
-    asset_List = []
-    weapons_list = []  # Initialize an empty list to store weapon dictionaries
+    asset_List = UnitTable(UNIT_FIELDS, SPARSE_FIELDS)
+    weapons = WeaponRegistry()
     os.chdir(fileroot+'\\megamek\\src\\megamek\\common\\weapons')
     for root, dirs, files in os.walk(os.getcwd()):
         for filename in files:
@@ -748,19 +809,18 @@ def main():
                 weapon_data = parse_weapon_data(
                     os.path.join(root, filename), weaponTypes_list)
                 if weapon_data:  # Check if the returned dictionary is not empty
-                    for weapon in weapon_data:
-                        weapons_list.append(weapon)
+                    weapons.add(weapon_data)
     weaponDx_file_path = os.path.join(fileroot, 'Python', 'weaponDx.txt')
     with open(weaponDx_file_path, mode='w', encoding='utf-8') as weaponDx_file:
-        # Write the list of weapon dictionaries to the file.
-        pprint.pprint(weapons_list, stream=weaponDx_file)
+        # Write the list of weapon dictionaries, one per weapon class, to the file.
+        pprint.pprint(list(weapons.weapons.values()), stream=weaponDx_file)
     # os.chdir(fileroot+'\\megamek\\data\\mekfiles\\vehicles\\')
     # root = os.getcwd()
     # for root, dirs, files in os.walk(os.getcwd()):
     #     for filename in files:
     #         if filename.endswith(".blk"):
     #             asset = parse_blk(
-    #                 os.path.join(root, filename), weapons_list)
+    #                 os.path.join(root, filename), weapons)
     #         if asset:  # Check if the returned dictionary is not empty
     #             asset_List.append(asset)
     os.chdir(fileroot+'\\megamek\\data\\mekfiles\\battlearmor\\')
@@ -769,7 +829,7 @@ def main():
         for filename in files:
             if filename.endswith(".blk"):
                 asset = parse_blk(
-                    os.path.join(root, filename), weapons_list)
+                    os.path.join(root, filename), weapons)
             if asset:  # Check if the returned dictionary is not empty
                 asset_List.append(asset)
     # os.chdir(fileroot+'\\megamek\\data\\mekfiles\\infantry\\')
@@ -778,7 +838,7 @@ def main():
     #     for filename in files:
     #         if filename.endswith(".blk"):
     #             asset = parse_blk(
-    #                 os.path.join(root, filename), weapons_list)
+    #                 os.path.join(root, filename), weapons)
     #         if asset:  # Check if the returned dictionary is not empty
     #             asset_List.append(asset)
     os.chdir(fileroot+'\\megamek\\data\\mekfiles\\protomeks\\')
@@ -787,7 +847,7 @@ def main():
         for filename in files:
             if filename.endswith(".blk"):
                 asset = parse_blk(
-                    os.path.join(root, filename), weapons_list)
+                    os.path.join(root, filename), weapons)
             if asset:  # Check if the returned dictionary is not empty
                 asset_List.append(asset)
     # pprint.pp(asset_List)  # print the list of asset dictionaries.
@@ -805,8 +865,6 @@ def main():
 
         for asset in asset_List:
             # Write each asset's data to the CSV
-            equipment_list = list(asset.get('Equipment', {}).items())[
-                :7]  # Get the first 7 equipment entries
             csv_writer.writerow([
                 0,
                 asset.get('UnitType'),
@@ -0,0 +1,212 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import zipfile
+
+from PIL import Image, ImageDraw, ImageFont
+
+from metrics import CACHE_REQUESTS, timed
+from parser import strip_accents
+
+
+PRINT_CACHE_DIR = '.print_cache'
+PRINT_FORMATS = {'pdf': 'application/pdf', 'png': 'application/zip'}
+
+# Letter paper at 150 DPI. Cards are printed at 2.5in x 3.5in (rotated to
+# portrait) in a 3x3 grid, the same layout as printForce() in js/script.js.
+DPI = 150
+PAGE_SIZE = (int(8.5 * DPI), int(11 * DPI))
+CARD_SIZE = (int(2.5 * DPI), int(3.5 * DPI))
+GRID_COLUMNS = 3
+GRID_ROWS = 3
+MAX_FORCE_SIZE = 200
+# Least recently used documents are deleted once the cache grows past this
+PRINT_CACHE_MAX_BYTES = 512 * 2 ** 20
+
+
+def force_cache_key(force, catalog_version, card_digests):
+    """
+    Hashes everything that affects the rendered sheets.
+
+    Args:
+        force (list): The resolved force as (FullName, skill label, PV) tuples.
+        catalog_version (str): The catalog content hash.
+        card_digests (list): The content hash of each unit's card (None if missing).
+
+    Returns:
+        str: A hex digest identifying the output.
+    """
+    key = json.dumps([force, catalog_version, card_digests], sort_keys=True)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def _font(size):
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:  # Pillow < 10.1 only has the fixed-size bitmap font
+        return ImageFont.load_default()
+
+
+def _card_image(card_path, label):
+    if card_path is None:
+        # No card on file: print a blank card with the unit name instead
+        image = Image.new('RGB', CARD_SIZE, 'white')
+        draw = ImageDraw.Draw(image)
+        draw.rectangle([0, 0, CARD_SIZE[0] - 1, CARD_SIZE[1] - 1], outline='black')
+        draw.text((10, 10), strip_accents(label), fill='black', font=_font(16))
+        return image
+    with Image.open(card_path) as card:
+        card = card.convert('RGB')
+        if card.width > card.height:
+            card = card.rotate(90, expand=True)
+        return card.resize(CARD_SIZE, Image.LANCZOS)
+
+
+def render_card_pages(cards):
+    """
+    Lays the cards out nine to a page.
+
+    Args:
+        cards (list): (card_path or None, FullName) tuples in force order.
+
+    Returns:
+        list: One PIL image per page.
+    """
+    pages = []
+    per_page = GRID_COLUMNS * GRID_ROWS
+    margin_x = (PAGE_SIZE[0] - GRID_COLUMNS * CARD_SIZE[0]) // 2
+    margin_y = (PAGE_SIZE[1] - GRID_ROWS * CARD_SIZE[1]) // 2
+    for start in range(0, len(cards), per_page):
+        page = Image.new('RGB', PAGE_SIZE, 'white')
+        for index, (card_path, label) in enumerate(cards[start:start + per_page]):
+            row, col = divmod(index, GRID_COLUMNS)
+            page.paste(_card_image(card_path, label),
+                       (margin_x + col * CARD_SIZE[0], margin_y + row * CARD_SIZE[1]))
+        pages.append(page)
+    return pages
+
+
+def render_force_list_page(force):
+    """
+    Draws the force list: one line per unit with its skill and PV, then the total.
+
+    Args:
+        force (list): (FullName, skill label, PV) tuples.
+
+    Returns:
+        list: The force list pages.
+    """
+    title_font, font = _font(36), _font(24)
+    line_height = 40
+    margin = DPI // 2
+    lines_per_page = (PAGE_SIZE[1] - 3 * margin) // line_height - 1
+    total = sum(pv for _, _, pv in force)
+    # The default font has no accented glyphs
+    lines = [f"{strip_accents(name)}  -  {skill}  -  {pv} PV" for name, skill, pv in force]
+    lines.append(f"Total: {total} PV")
+    pages = []
+    for start in range(0, len(lines), lines_per_page):
+        page = Image.new('RGB', PAGE_SIZE, 'white')
+        draw = ImageDraw.Draw(page)
+        draw.text((margin, margin), 'Force List', fill='black', font=title_font)
+        for index, line in enumerate(lines[start:start + lines_per_page]):
+            draw.text((margin, 2 * margin + index * line_height), line, fill='black', font=font)
+        pages.append(page)
+    return pages
+
+
+@timed('render_force')
+def render_force(force, cards, fmt):
+    """
+    Renders the card sheets and force list for a force.
+
+    Args:
+        force (list): (FullName, skill label, PV) tuples.
+        cards (list): (card_path or None, FullName) tuples in the same order.
+        fmt (str): 'pdf' for one PDF, 'png' for a zip with one PNG per page.
+
+    Returns:
+        bytes: The rendered document.
+    """
+    pages = render_card_pages(cards) + render_force_list_page(force)
+    output = io.BytesIO()
+    if fmt == 'pdf':
+        pages[0].save(output, 'PDF', save_all=True, append_images=pages[1:], resolution=DPI)
+    else:
+        with zipfile.ZipFile(output, 'w', zipfile.ZIP_STORED) as archive:
+            for number, page in enumerate(pages, start=1):
+                page_bytes = io.BytesIO()
+                page.save(page_bytes, 'PNG', optimize=True)
+                archive.writestr(f'page-{number:03d}.png', page_bytes.getvalue())
+    return output.getvalue()
+
+
+def prune_print_cache(cache_dir=PRINT_CACHE_DIR, max_bytes=PRINT_CACHE_MAX_BYTES):
+    """
+    Deletes the least recently used documents until the cache fits in max_bytes.
+    cached_render touches a document on every hit, so its mtime is its last use.
+
+    Args:
+        cache_dir (str): The print cache directory.
+        max_bytes (int): The size the cache may grow to.
+
+    Returns:
+        list: The deleted paths.
+    """
+    documents = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and not entry.name.endswith('.tmp'):  # Skip renders still being written
+            stat = entry.stat()
+            documents.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in documents)
+    deleted = []
+    for _, size, path in sorted(documents):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:  # Another worker pruned it first
+            pass
+        total -= size
+        deleted.append(path)
+    return deleted
+
+
+def cached_render(force, cards, fmt, cache_key, cache_dir=PRINT_CACHE_DIR, max_bytes=PRINT_CACHE_MAX_BYTES):
+    """
+    Returns the path of the rendered document, rendering it only on a cache miss.
+
+    Args:
+        force (list): (FullName, skill label, PV) tuples.
+        cards (list): (card_path or None, FullName) tuples.
+        fmt (str): A key of PRINT_FORMATS.
+        cache_key (str): The force_cache_key() for this force.
+        cache_dir (str): The print cache directory.
+        max_bytes (int): The size the print cache is pruned to after a render.
+
+    Returns:
+        str: The path to the cached document.
+    """
+    extension = 'pdf' if fmt == 'pdf' else 'zip'
+    path = os.path.join(cache_dir, f'{cache_key}.{extension}')
+    try:
+        os.utime(path)  # Marks it recently used for prune_print_cache
+        CACHE_REQUESTS.inc('print_sheet', 'hit')
+        return path
+    except FileNotFoundError:
+        pass
+    CACHE_REQUESTS.inc('print_sheet', 'miss')
+    os.makedirs(cache_dir, exist_ok=True)
+    # A unique temporary name, so threads rendering the same force never share one
+    fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(render_force(force, cards, fmt))
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    prune_print_cache(cache_dir, max_bytes)
+    return path
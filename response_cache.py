@@ -0,0 +1,121 @@
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+
+from metrics import CACHE_REQUESTS
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; without it clients get gzip
+    brotli = None
+
+
+class EncodedPayload:
+    """
+    A serialized response body with its strong ETag and compressed encodings.
+    gzip is computed up front; brotli is slower, so it is computed on first use.
+    """
+
+    def __init__(self, body, mimetype='application/json', headers=None):
+        self.body = body
+        self.mimetype = mimetype
+        self.headers = headers or {}
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        self.encodings = {'identity': body, 'gzip': gzip.compress(body, compresslevel=6)}
+        self._lock = threading.Lock()
+
+    def etag_for(self, encoding):
+        # Each encoding is a different byte sequence, so it gets its own strong ETag
+        return self.etag if encoding == 'identity' else f'{self.etag}-{encoding}'
+
+    def matches(self, if_none_match):
+        """Returns True if the If-None-Match header names any encoding of this payload."""
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(','):
+            tag = tag.strip()
+            if tag == '*':
+                return True
+            if tag.startswith('W/'):
+                tag = tag[2:]
+            if tag.strip('"').split('-')[0] == self.etag:
+                return True
+        return False
+
+    @property
+    def size(self):
+        """The bytes held by every encoding computed so far."""
+        return sum(len(body) for body in self.encodings.values())
+
+    def encoded(self, encoding):
+        if encoding == 'br' and 'br' not in self.encodings:
+            with self._lock:
+                if 'br' not in self.encodings:
+                    self.encodings['br'] = brotli.compress(self.body, quality=5)
+        return self.encodings[encoding]
+
+
+def choose_encoding(accept_encoding):
+    """
+    Picks the best encoding the client accepts, preferring brotli over gzip.
+
+    Args:
+        accept_encoding: The request's Accept-Encoding header (a werkzeug MIMEAccept-like object).
+
+    Returns:
+        str: 'br', 'gzip' or 'identity'.
+    """
+    if brotli is not None and accept_encoding['br']:
+        return 'br'
+    if accept_encoding['gzip']:
+        return 'gzip'
+    return 'identity'
+
+
+class ResponseCache:
+    """
+    A small thread-safe LRU of EncodedPayloads, bounded by entry count and by
+    the bytes the bodies hold. Keys should include the catalog version so a
+    reloaded catalog never serves stale bodies.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=64 * 2 ** 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key, build_payload):
+        """
+        Returns the cached payload for key, building and caching it on a miss.
+
+        Args:
+            key: A hashable cache key.
+            build_payload (callable): Returns a new EncodedPayload.
+
+        Returns:
+            EncodedPayload: The cached payload.
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                CACHE_REQUESTS.inc('response', 'hit')
+                return payload
+        CACHE_REQUESTS.inc('response', 'miss')
+        # Build outside the lock; two threads racing on a miss just build it twice
+        payload = build_payload()
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            # The newest entry is always kept, even when it alone is over max_bytes
+            total = sum(entry.size for entry in self._entries.values())
+            while len(self._entries) > 1 and (len(self._entries) > self.max_entries or total > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                total -= evicted.size
+        return payload
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
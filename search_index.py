@@ -0,0 +1,117 @@
+import re
+
+import numpy as np
+
+from metrics import timed
+from parser import strip_accents
+
+
+SEARCH_FIELDS = ['Name', 'Class', 'Model', 'FullName']
+NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]+')
+
+
+def fold(text):
+    """
+    Folds text for matching: accents stripped, lower-cased, punctuation collapsed
+    to single spaces. js/script.js folds queries the same way.
+    """
+    return NON_ALPHANUMERIC.sub(' ', strip_accents(text).lower()).strip()
+
+
+def trigrams(folded):
+    """
+    Returns the set of trigrams of each word, padded so word starts weigh more.
+
+    Args:
+        folded (str): Text already passed through fold().
+
+    Returns:
+        set: The trigrams.
+    """
+    grams = set()
+    for word in folded.split():
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class SearchIndex:
+    """
+    An in-memory trigram inverted index over unit names. Postings are NumPy
+    arrays of document ids, so scoring a query is one bincount.
+    """
+
+    def __init__(self, texts, postings, sizes):
+        self.texts = texts
+        self.postings = postings
+        self.sizes = sizes
+
+    @timed('SearchIndex.search')
+    def search(self, query, limit=20, candidates=None):
+        """
+        Ranks documents by trigram Jaccard similarity, with a bonus when the
+        folded query is a substring of the document.
+
+        Args:
+            query (str): The search text.
+            limit (int): The maximum number of results.
+            candidates (ndarray): Optional boolean mask restricting the documents.
+
+        Returns:
+            list: (document id, score) tuples, best first.
+        """
+        folded = fold(query)
+        grams = trigrams(folded)
+        hits = [self.postings[gram] for gram in grams if gram in self.postings]
+        if not hits:
+            return []
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.texts)).astype(float)
+        scores = shared / (len(grams) + self.sizes - shared)
+        if candidates is not None:
+            scores[~candidates] = 0
+        matched = np.flatnonzero(scores > 0)
+        # Only documents holding every query trigram can contain the query
+        for doc_id in matched[shared[matched] == len(grams)]:
+            if folded in self.texts[doc_id]:
+                scores[doc_id] += 1
+        top = matched[np.argsort(-scores[matched], kind='stable')][:limit]
+        return [(int(doc_id), float(scores[doc_id])) for doc_id in top]
+
+    def to_json(self):
+        # Postings as plain lists for the static site's copy of the index
+        return {
+            'texts': self.texts,
+            'sizes': self.sizes.tolist(),
+            'postings': {gram: ids.tolist() for gram, ids in self.postings.items()},
+        }
+
+
+def build_search_index(records, fields=SEARCH_FIELDS):
+    """
+    Builds the trigram index with one document per unit.
+
+    Args:
+        records (list): The unit dictionaries; document ids are their positions.
+        fields (list): The name fields to index.
+
+    Returns:
+        SearchIndex: The index.
+    """
+    texts, sizes, postings = [], [], {}
+    for doc_id, record in enumerate(records):
+        values = []
+        for field in fields:
+            value = record.get(field)
+            if isinstance(value, str) and value:
+                folded = fold(value)
+                if folded not in values:
+                    values.append(folded)
+        text = ' '.join(values)
+        grams = trigrams(text)
+        texts.append(text)
+        sizes.append(len(grams))
+        # Sorted so the exported index is byte-identical from run to run
+        for gram in sorted(grams):
+            postings.setdefault(gram, []).append(doc_id)
+    postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+    return SearchIndex(texts, postings, np.array(sizes, dtype=float))
@@ -0,0 +1,133 @@
+// Global variables
+let unitData = [];
+let unitsByName = new Map();
+let selectedUnits = [];
+let totalPoints = 0;
+
+// Initialize the application
+document.addEventListener('DOMContentLoaded', function() {
+    // Load unit data
+    fetch('/get_units')
+        .then(response => response.json())
+        .then(data => {
+            unitData = data;
+            unitsByName = new Map(unitData.map(unit => [unit.Name, unit]));
+            populateUnitSelect();
+        })
+        .catch(error => console.error('Error loading units:', error));
+
+    // Add event listeners
+    document.getElementById('addUnit').addEventListener('click', addUnitToForce);
+    document.getElementById('printForce').addEventListener('click', printForce);
+});
+
+// Populate the unit select dropdown
+function populateUnitSelect() {
+    const select = document.getElementById('unitSelect');
+    select.innerHTML = '<option value="">Choose a unit...</option>';
+    
+    unitData.forEach(unit => {
+        const option = document.createElement('option');
+        option.value = unit.Name;
+        option.textContent = `${unit.Name} (PV: ${unit.RegPV}/${unit.VetPV})`;
+        select.appendChild(option);
+    });
+}
+
+// Add a unit to the force
+function addUnitToForce() {
+    const unitName = document.getElementById('unitSelect').value;
+    if (!unitName) return;
+
+    // regular/veteran use the unit's own RegPV/VetPV; 0-7 use the precomputed Skill<n>PV
+    const skill = document.getElementById('skillLevel').value;
+    const unit = unitsByName.get(unitName);
+    
+    if (unit) {
+        const points = skill === 'regular' ? unit.RegPV : skill === 'veteran' ? unit.VetPV : unit[`Skill${skill}PV`];
+        const unitEntry = {
+            name: unitName,
+            points: points,
+            skill: skill,
+            skillLabel: skill === 'regular' || skill === 'veteran' ? skill[0].toUpperCase() + skill.slice(1) : `Skill ${skill}`,
+            cardPath: `/card/${unitName}`
+        };
+        
+        selectedUnits.push(unitEntry);
+        totalPoints += points;
+        
+        updateForceDisplay();
+        loadUnitCard(unitName);
+    }
+}
+
+// Update the force list display
+function updateForceDisplay() {
+    const forceList = document.getElementById('forceList');
+    const totalPointsElement = document.getElementById('totalPoints');
+    
+    forceList.innerHTML = '';
+    totalPointsElement.textContent = totalPoints;
+    
+    selectedUnits.forEach((unit, index) => {
+        const unitElement = document.createElement('div');
+        unitElement.className = 'force-list-item';
+        unitElement.innerHTML = `
+            <span>${unit.name} (${unit.skillLabel}) - ${unit.points} PV</span>
+            <button class="btn btn-danger btn-sm" onclick="removeUnit(${index})">Remove</button>
+        `;
+        forceList.appendChild(unitElement);
+    });
+}
+
+// Remove a unit from the force
+function removeUnit(index) {
+    totalPoints -= selectedUnits[index].points;
+    selectedUnits.splice(index, 1);
+    updateForceDisplay();
+    updateCardsDisplay();
+}
+
+// Load a unit card
+function loadUnitCard(unitName) {
+    fetch(`/get_card/${unitName}`)
+        .then(response => response.json())
+        .then(data => {
+            if (data.exists) {
+                const cardsContainer = document.getElementById('unitCards');
+                const cardElement = document.createElement('div');
+                cardElement.className = 'col-md-4 unit-card';
+                cardElement.innerHTML = `<img src="${data.url}" alt="${unitName}" class="img-fluid">`;
+                cardsContainer.appendChild(cardElement);
+            }
+        })
+        .catch(error => console.error('Error loading card:', error));
+}
+
+// Update the cards display
+function updateCardsDisplay() {
+    const cardsContainer = document.getElementById('unitCards');
+    cardsContainer.innerHTML = '';
+    
+    selectedUnits.forEach(unit => {
+        loadUnitCard(unit.name);
+    });
+}
+
+// Print the force
+function printForce() {
+    // The server composes the card sheets and force list into a single PDF
+    fetch('/print_force', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+            units: selectedUnits.map(unit => ({ FullName: unit.name, skill: unit.skill }))
+        })
+    })
+        .then(response => {
+            if (!response.ok) throw new Error(`Print failed with status ${response.status}`);
+            return response.blob();
+        })
+        .then(blob => window.open(URL.createObjectURL(blob), '_blank'))
+        .catch(error => console.error('Error printing force:', error));
+}
\ No newline at end of file
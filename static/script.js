@@ -1,5 +1,6 @@
 // Global variables
 let unitData = [];
+let unitsByName = new Map();
 let selectedUnits = [];
 let totalPoints = 0;
 
@@ -10,6 +11,7 @@ document.addEventListener('DOMContentLoaded', function() {
         .then(response => response.json())
         .then(data => {
             unitData = data;
+            unitsByName = new Map(unitData.map(unit => [unit.Name, unit]));
             populateUnitSelect();
         })
         .catch(error => console.error('Error loading units:', error));
@@ -37,16 +39,18 @@ function addUnitToForce() {
     const unitName = document.getElementById('unitSelect').value;
     if (!unitName) return;
 
-    const isVeteran = document.getElementById('veteran').checked;
-    const unit = unitData.find(u => u.Name === unitName);
+    // regular/veteran use the unit's own RegPV/VetPV; 0-7 use the precomputed Skill<n>PV
+    const skill = document.getElementById('skillLevel').value;
+    const unit = unitsByName.get(unitName);
     
     if (unit) {
-        const points = isVeteran ? unit.VetPV : unit.RegPV;
+        const points = skill === 'regular' ? unit.RegPV : skill === 'veteran' ? unit.VetPV : unit[`Skill${skill}PV`];
         const unitEntry = {
             name: unitName,
             points: points,
-            isVeteran: isVeteran,
-            cardPath: `/Cards/${unitName}.gif`
+            skill: skill,
+            skillLabel: skill === 'regular' || skill === 'veteran' ? skill[0].toUpperCase() + skill.slice(1) : `Skill ${skill}`,
+            cardPath: `/card/${unitName}`
         };
         
         selectedUnits.push(unitEntry);
@@ -69,7 +73,7 @@ function updateForceDisplay() {
         const unitElement = document.createElement('div');
         unitElement.className = 'force-list-item';
         unitElement.innerHTML = `
-            <span>${unit.name} (${unit.isVeteran ? 'Veteran' : 'Regular'}) - ${unit.points} PV</span>
+            <span>${unit.name} (${unit.skillLabel}) - ${unit.points} PV</span>
             <button class="btn btn-danger btn-sm" onclick="removeUnit(${index})">Remove</button>
         `;
         forceList.appendChild(unitElement);
@@ -93,7 +97,7 @@ function loadUnitCard(unitName) {
                 const cardsContainer = document.getElementById('unitCards');
                 const cardElement = document.createElement('div');
                 cardElement.className = 'col-md-4 unit-card';
-                cardElement.innerHTML = `<img src="${data.path}" alt="${unitName}" class="img-fluid">`;
+                cardElement.innerHTML = `<img src="${data.url}" alt="${unitName}" class="img-fluid">`;
                 cardsContainer.appendChild(cardElement);
             }
         })
@@ -112,36 +116,18 @@ function updateCardsDisplay() {
 
 // Print the force
 function printForce() {
-    const printWindow = window.open('', '_blank');
-    printWindow.document.write(`
-        <html>
-        <head>
-            <title>BattleTech Force Printout</title>
-            <style>
-                body { font-family: Arial, sans-serif; }
-                .print-card { page-break-inside: avoid; margin-bottom: 1rem; }
-                .force-summary { margin-bottom: 2rem; }
-            </style>
-        </head>
-        <body>
-            <div class="force-summary">
-                <h1>BattleTech Force</h1>
-                <p>Total Points: ${totalPoints}</p>
-                <h2>Units:</h2>
-                <ul>
-                    ${selectedUnits.map(unit => 
-                        `<li>${unit.name} (${unit.isVeteran ? 'Veteran' : 'Regular'}) - ${unit.points} PV</li>`
-                    ).join('')}
-                </ul>
-            </div>
-            <div id="cards">
-                ${selectedUnits.map(unit => 
-                    `<div class="print-card"><img src="${unit.cardPath}" alt="${unit.name}" style="max-width: 100%;"></div>`
-                ).join('')}
-            </div>
-        </body>
-        </html>
-    `);
-    printWindow.document.close();
-    printWindow.print();
-} 
\ No newline at end of file
+    // The server composes the card sheets and force list into a single PDF
+    fetch('/print_force', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+            units: selectedUnits.map(unit => ({ FullName: unit.name, skill: unit.skill }))
+        })
+    })
+        .then(response => {
+            if (!response.ok) throw new Error(`Print failed with status ${response.status}`);
+            return response.blob();
+        })
+        .then(blob => window.open(URL.createObjectURL(blob), '_blank'))
+        .catch(error => console.error('Error printing force:', error));
+}
\ No newline at end of file
@@ -0,0 +1,144 @@
+import argparse
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+from cards import CARDS_DIR, build_card_manifest
+from metrics import CACHE_REQUESTS, timed
+
+
+DERIVATIVE_CACHE_DIR = '.card_cache'
+
+# Requested widths are rounded up to one of these so the disk cache stays bounded.
+# Cards are 1050x750, so 350 matches the 3.5in preview at 100 DPI.
+DERIVATIVE_WIDTHS = [175, 350, 525, 700, 1050]
+DERIVATIVE_FORMATS = {'webp': 'image/webp', 'png': 'image/png'}
+
+
+def snap_width(width):
+    """
+    Rounds a requested width up to the nearest supported derivative width.
+
+    Args:
+        width (int): The requested width in pixels.
+
+    Returns:
+        int: A width from DERIVATIVE_WIDTHS.
+    """
+    for allowed in DERIVATIVE_WIDTHS:
+        if width <= allowed:
+            return allowed
+    return DERIVATIVE_WIDTHS[-1]
+
+
+def derivative_path(entry, width, fmt, cache_dir=DERIVATIVE_CACHE_DIR):
+    # Keyed on the source hash, so an updated card never reuses an old derivative
+    return os.path.join(cache_dir, f'{entry.digest}-{width}.{fmt}')
+
+
+@timed('render_derivative')
+def render_derivative(source_path, dest_path, width, fmt):
+    """
+    Resizes a card to the given width and re-encodes it.
+
+    Args:
+        source_path (str): The original GIF.
+        dest_path (str): Where to write the derivative.
+        width (int): The target width in pixels; the aspect ratio is kept.
+        fmt (str): 'webp' or 'png'.
+
+    Returns:
+        str: dest_path.
+    """
+    with Image.open(source_path) as image:
+        image = image.convert('RGB')
+        if image.width > width:
+            height = round(image.height * width / image.width)
+            image = image.resize((width, height), Image.LANCZOS)
+        # Write to a temporary file first so readers never see a partial file. The
+        # name is unique, so threads rendering the same derivative never share it.
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(dest_path) or '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                if fmt == 'webp':
+                    image.save(f, 'WEBP', quality=85, method=4)
+                else:
+                    image.save(f, 'PNG', optimize=True)
+            os.replace(temp_path, dest_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    return dest_path
+
+
+def ensure_derivative(entry, width, fmt, cache_dir=DERIVATIVE_CACHE_DIR):
+    """
+    Returns the path of a card derivative, rendering it if it is not cached yet.
+
+    Args:
+        entry (CardEntry): The card from the manifest.
+        width (int): A width from DERIVATIVE_WIDTHS.
+        fmt (str): A key of DERIVATIVE_FORMATS.
+        cache_dir (str): The derivative cache directory.
+
+    Returns:
+        str: The path to the cached derivative.
+    """
+    path = derivative_path(entry, width, fmt, cache_dir)
+    if os.path.exists(path):
+        CACHE_REQUESTS.inc('card_derivative', 'hit')
+        return path
+    CACHE_REQUESTS.inc('card_derivative', 'miss')
+    os.makedirs(cache_dir, exist_ok=True)
+    render_derivative(entry.path, path, width, fmt)
+    return path
+
+
+def _prewarm_one(job):
+    source_path, dest_path, width, fmt = job
+    render_derivative(source_path, dest_path, width, fmt)
+    return dest_path
+
+
+def prewarm(cards_dir=CARDS_DIR, widths=(350,), formats=('webp',),
+            cache_dir=DERIVATIVE_CACHE_DIR, workers=None):
+    """
+    Renders every missing derivative for the cards directory in a process pool.
+
+    Args:
+        cards_dir (str): The directory holding the card GIFs.
+        widths (list): The derivative widths to render.
+        formats (list): The derivative formats to render.
+        cache_dir (str): The derivative cache directory.
+        workers (int): Number of worker processes; defaults to the CPU count.
+
+    Returns:
+        int: The number of derivatives rendered.
+    """
+    manifest = build_card_manifest(cards_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+    jobs = []
+    for entry in manifest.entries.values():
+        for width in widths:
+            for fmt in formats:
+                path = derivative_path(entry, snap_width(width), fmt, cache_dir)
+                if not os.path.exists(path):
+                    jobs.append((entry.path, path, snap_width(width), fmt))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(_prewarm_one, jobs, chunksize=16):
+            pass
+    return len(jobs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Pre-render resized card derivatives.')
+    parser.add_argument('--width', type=int, action='append', help='Derivative width (repeatable, default 350)')
+    parser.add_argument('--format', choices=sorted(DERIVATIVE_FORMATS), action='append',
+                        help='Derivative format (repeatable, default webp)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    rendered = prewarm(widths=args.width or [350], formats=args.format or ['webp'], workers=args.workers)
+    print(f"Rendered {rendered} card derivatives into {DERIVATIVE_CACHE_DIR}")
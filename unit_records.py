@@ -0,0 +1,133 @@
+from collections.abc import Mapping
+
+
+# Marks a field a unit does not have at all, as opposed to one holding None or NaN
+ABSENT = object()
+
+
+def is_missing(value):
+    """Returns True for the values a sparse column leaves out: absent, None or NaN."""
+    return value is ABSENT or value is None or (isinstance(value, float) and value != value)
+
+
+class UnitRow(Mapping):
+    """
+    A read-only view of one unit in a UnitTable. It behaves like the unit's
+    dictionary (get, [], keys, dict(row)) but holds only the table and a row
+    number, so a catalog of views costs two slots per unit.
+    """
+
+    __slots__ = ('table', 'row')
+
+    def __init__(self, table, row):
+        self.table = table
+        self.row = row
+
+    def __getitem__(self, field):
+        value = self.table.value(self.row, field)
+        if value is ABSENT:
+            raise KeyError(field)
+        return value
+
+    def __iter__(self):
+        return (field for field in self.table.fields if self.table.value(self.row, field) is not ABSENT)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f'UnitRow({dict(self)!r})'
+
+
+class UnitTable:
+    """
+    Units stored column by column instead of as one dictionary per unit. Dense
+    fields are a list per field; sparse ones (era availability, special
+    abilities, extra weapon slots), which most units leave empty, are a
+    {row: value} dict per field holding only the rows that have a value.
+    Indexing the table gives UnitRow views.
+    """
+
+    def __init__(self, fields, sparse_fields=(), fill=ABSENT):
+        """
+        Args:
+            fields (list): Every field, in order.
+            sparse_fields: The fields to store out of line.
+            fill: What a sparse field reads as for rows without a value: ABSENT
+                leaves the field out of the row, NaN keeps it as a NaN like a
+                DataFrame record would.
+        """
+        self.fields = list(fields)
+        sparse_fields = set(sparse_fields)
+        self.fill = fill
+        self._dense = {field: [] for field in self.fields if field not in sparse_fields}
+        self._sparse = {field: {} for field in self.fields if field in sparse_fields}
+        self._length = 0
+
+    @classmethod
+    def from_columns(cls, columns, sparse_fields=(), fill=ABSENT):
+        """
+        Builds a table from whole columns without creating a dictionary per unit.
+
+        Args:
+            columns (dict): Field -> list of values, every list the same length.
+            sparse_fields: The fields to store out of line; their missing values are dropped.
+            fill: See __init__.
+
+        Returns:
+            UnitTable: The table.
+        """
+        table = cls(columns, sparse_fields, fill)
+        for field, values in columns.items():
+            if field in table._sparse:
+                table._sparse[field] = {row: value for row, value in enumerate(values) if not is_missing(value)}
+            else:
+                table._dense[field] = list(values)
+            table._length = len(values)
+        return table
+
+    def append(self, unit):
+        """
+        Adds a unit. Keys of the unit that are not table fields are dropped, and
+        so are missing values of sparse fields, as in from_columns().
+
+        Args:
+            unit (dict): The unit's fields.
+        """
+        row = self._length
+        for field, values in self._dense.items():
+            values.append(unit.get(field, ABSENT))
+        for field, values in self._sparse.items():
+            value = unit.get(field, ABSENT)
+            if not is_missing(value):
+                values[row] = value
+        self._length += 1
+
+    def value(self, row, field):
+        """Returns a field of a row, or ABSENT if the row does not have it."""
+        values = self._dense.get(field)
+        if values is not None:
+            return values[row]
+        values = self._sparse.get(field)
+        if values is None:
+            return ABSENT
+        return values.get(row, self.fill)
+
+    def column(self, field):
+        """Returns every row's value of a field as a list, with ABSENT where a row has none."""
+        if field in self._dense:
+            return list(self._dense[field])
+        values = self._sparse.get(field, {})
+        return [values.get(row, self.fill) for row in range(self._length)]
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, row):
+        if not -self._length <= row < self._length:
+            raise IndexError(row)
+        return UnitRow(self, row % self._length)
+
+    def __iter__(self):
+        for row in range(self._length):
+            yield UnitRow(self, row)
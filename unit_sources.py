@@ -0,0 +1,184 @@
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from catalog import CATALOG_CSV, CATALOG_STORE, VEHICLES_CSV, write_catalog_store
+from catalog_build import build_catalog, prepare_unit_frame
+from parser import strip_accents
+
+
+# Every CSV the catalog is built from, in priority order: when a unit appears
+# in more than one source the first one wins. Enrichment sources carry no PV;
+# they only fill fields the priced sources leave empty for the same unit.
+UNIT_SOURCES = [
+    {'path': VEHICLES_CSV, 'unit_type': 'Vehicle'},
+    {'path': 'MULOutput - Protomechs.csv', 'unit_type': 'Protomech'},
+    {'path': 'Battle Armor_unit_list_2025-04-03 10-26-42.csv', 'unit_type': 'BattleArmor',
+     'rename': {'Move': 'ASMove'}},
+    {'path': 'parsed_data_InfBAProto.csv', 'enrich_only': True,
+     'rename': {'unitType': 'UnitType', 'name': 'Name', 'model': 'Model', 'Movement': 'CBTMove'},
+     # parser.py writes 0 for PVs and skills it cannot read from the unit files, and
+     # always 0 for Common, which only the MUL exports fill in
+     'drop': ['Common', 'BasePV', 'RegPV', 'VetPV', 'RegSkill', 'VetSkill']},
+]
+
+# UnitType spelling (lower-cased) -> unit type select value in index.html
+UNIT_TYPE_KEYS = {
+    'vehicle': 'vehicle',
+    'tank': 'vehicle',
+    'supporttank': 'vehicle',
+    'largesupporttank': 'vehicle',
+    'vtol': 'vehicle',
+    'supportvtol': 'vehicle',
+    'fixedwingsupport': 'vehicle',
+    'naval': 'vehicle',
+    'protomech': 'protomech',
+    'proto-mech': 'protomech',
+    'battlearmor': 'battlearmor',
+    'battle armor': 'battlearmor',
+    'infantry': 'infantry',
+    'emplacement': 'emplacement',
+    'gun emplacement': 'emplacement',
+    'gunemplacement': 'emplacement',
+}
+
+# Unit type select value -> the UnitType written to the catalog
+UNIT_TYPE_LABELS = {
+    'vehicle': 'Vehicle',
+    'protomech': 'Protomech',
+    'battlearmor': 'BattleArmor',
+    'infantry': 'Infantry',
+    'emplacement': 'Emplacement',
+}
+
+NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_unit_type(value):
+    """Maps any UnitType spelling to its catalog label; unknown types are kept as they are."""
+    key = UNIT_TYPE_KEYS.get(str(value).strip().lower())
+    return UNIT_TYPE_LABELS[key] if key else value
+
+
+def name_key(full_name):
+    """
+    Normalizes a FullName for matching across sources, which differ in accents,
+    case, spacing and punctuation ("[David](Sqd4)" vs "[David] (Sqd4)").
+    """
+    if not isinstance(full_name, str):
+        return None
+    return NON_ALPHANUMERIC.sub('', strip_accents(full_name).lower()) or None
+
+
+def read_source(source):
+    """
+    Reads one source CSV and normalizes its column names and UnitType.
+
+    Args:
+        source (dict): An entry of UNIT_SOURCES.
+
+    Returns:
+        DataFrame: The units, or None if the file does not exist.
+    """
+    if not os.path.exists(source['path']):
+        return None
+    df = pd.read_csv(source['path'])
+    # Columns with a blank header are empty spacer columns in the MUL exports
+    df = df.drop(columns=[column for column in df.columns if str(column).startswith('Unnamed:')])
+    df = df.drop(columns=source.get('drop', []), errors='ignore').rename(columns=source.get('rename', {}))
+    if 'FullName' not in df.columns:
+        df['FullName'] = df['Name']
+    if 'UnitType' not in df.columns:
+        df['UnitType'] = source.get('unit_type')
+    elif source.get('unit_type'):
+        df['UnitType'] = df['UnitType'].fillna(source['unit_type'])
+    df['UnitType'] = df['UnitType'].map(normalize_unit_type)
+    return df
+
+
+def merge_sources(sources=UNIT_SOURCES):
+    """
+    Merges the sources into one frame, one row per unit. Units are matched by
+    MULId and by normalized FullName through a hash index of both keys.
+
+    Args:
+        sources (list): Source entries, in priority order.
+
+    Returns:
+        tuple: (DataFrame of units, {source path: (rows read, rows kept or enriched)}).
+    """
+    index = {}
+    stats = {}
+    merged = pd.DataFrame()
+    for source in sources:
+        df = read_source(source)
+        if df is None:
+            print(f"Warning: {source['path']} not found!")
+            continue
+        mul_ids = pd.to_numeric(df['MULId'], errors='coerce') if 'MULId' in df.columns else pd.Series(np.nan, index=df.index)
+        keys = [(('MULId', int(mul_id)) if mul_id == mul_id else None, ('FullName', name_key(full_name)))
+                for mul_id, full_name in zip(mul_ids, df['FullName'])]
+        if source.get('enrich_only'):
+            # Fill the empty fields of units already merged; unmatched rows have no PV and are skipped
+            targets = {}
+            for row, (mul_key, full_name_key) in enumerate(keys):
+                target = index.get(mul_key, index.get(full_name_key))
+                if target is not None and target not in targets:
+                    targets[target] = row
+            enrichment = df.iloc[list(targets.values())].set_axis(list(targets.keys()))
+            for column in enrichment.columns:
+                values = enrichment[column].dropna()
+                if column not in merged.columns:
+                    merged[column] = values  # Aligned on the row index, empty elsewhere
+                    continue
+                values = values[merged.loc[values.index, column].isna().to_numpy()]
+                if len(values):
+                    merged.loc[values.index, column] = values
+            stats[source['path']] = (len(df), len(targets))
+            continue
+        kept = []
+        offset = len(merged)
+        for row, (mul_key, full_name_key) in enumerate(keys):
+            if index.get(mul_key) is not None or index.get(full_name_key) is not None:
+                continue  # Already supplied by an earlier source
+            position = offset + len(kept)
+            for key in (mul_key, full_name_key):
+                if key is not None and key[1] is not None:
+                    index[key] = position
+            kept.append(row)
+        merged = pd.concat([merged, df.iloc[kept]], ignore_index=True)
+        stats[source['path']] = (len(df), len(kept))
+    # UnitType first, as the front end has always had it
+    merged = merged[['UnitType'] + [column for column in merged.columns if column != 'UnitType']]
+    return prepare_unit_frame(merged), stats
+
+
+def write_unit_catalog(path=CATALOG_CSV, sources=UNIT_SOURCES, store_dir=CATALOG_STORE):
+    """
+    Builds the merged catalog file that convert_csv_to_js.py loads, and the
+    binary copy of it that app.py loads.
+
+    Args:
+        path (str): Where to write the CSV.
+        sources (list): Source entries, in priority order.
+        store_dir (str): Where to write the binary catalog; None to skip it.
+
+    Returns:
+        DataFrame: The merged units.
+    """
+    df, stats = merge_sources(sources)
+    for source_path, (read, used) in stats.items():
+        print(f"{source_path}: {used} of {read} rows used")
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    df.to_csv(temp_path, index=False)
+    os.replace(temp_path, path)  # The app watches this file, so never expose a partial write
+    if store_dir:
+        write_catalog_store(build_catalog([path]), store_dir)
+    return df
+
+
+if __name__ == "__main__":
+    units = write_unit_catalog()
+    print(f"Wrote {len(units)} units to {CATALOG_CSV}")